@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+App Style Module
+================
+This module applies the qt_material theme of the application. Building the theme
+renders a Jinja template and regenerates about a hundred SVG icons on every call, which
+is the larger part of the startup time. The rendered stylesheet is therefore saved
+under ~/Documents/ImmuniSweep/Cache, keyed by theme and by the installed qt_material
+package, and later starts apply the saved stylesheet directly without importing
+qt_material at all.
+
+Functions:
+    apply_cached_stylesheet: Apply a qt_material theme, building it only when not cached.
+"""
+
+import importlib.util
+import json
+import os
+
+from PyQt5.QtCore import QDir
+from PyQt5.QtGui import QColor, QFontDatabase, QGuiApplication, QPalette
+
+
+def cache_path(theme: str) -> str:
+    """
+    Parameters:
+        theme (str): qt_material theme file, e.g. 'dark_cyan.xml'.
+
+    Returns:
+        str: Path of the cached stylesheet for the installed qt_material package.
+    """
+    # Identify the install by its modification time; importlib.metadata would cost more than the cache saves
+    spec = importlib.util.find_spec('qt_material')
+    version = os.stat(spec.origin).st_mtime_ns if spec is not None else 0
+    name = f'{os.path.splitext(theme)[0]}-{version}.qss'
+    return os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "Cache", name)
+
+
+def apply_cached_stylesheet(app, theme: str = 'dark_cyan.xml'):
+    """
+    Apply a qt_material theme to the application. The first call per theme builds it with
+    qt_material and saves the result; later calls load the saved stylesheet.
+
+    Parameters:
+        app (QApplication): The application.
+        theme (str): qt_material theme file.
+    """
+    path = cache_path(theme)
+    if not _apply_saved(app, path):
+        _build(app, theme, path)
+
+
+def _apply_saved(app, path: str) -> bool:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            header = json.loads(file.readline()[2:-3])   # /* {...} */
+            stylesheet = file.read()
+    except (OSError, ValueError):
+        return False
+    spec = importlib.util.find_spec('qt_material')
+    if spec is None or not os.path.isdir(header['icons']):
+        return False
+    package = os.path.dirname(spec.origin)
+    app.setStyle('Fusion')
+    fonts = os.path.join(package, 'fonts', 'roboto')
+    for font in os.listdir(fonts):
+        if font.endswith('.ttf'):
+            QFontDatabase.addApplicationFont(os.path.join(fonts, font))
+    QDir.addSearchPath('icon', header['icons'])
+    QDir.addSearchPath('qt_material', os.path.join(package, 'resources'))
+    palette = QGuiApplication.palette()
+    palette.setColor(QPalette.ColorRole.Text, QColor(header['text']))
+    QGuiApplication.setPalette(palette)
+    app.setStyleSheet(stylesheet)
+    return True
+
+
+def _build(app, theme: str, path: str):
+    from qt_material import apply_stylesheet
+    from qt_material.resources import RESOURCES_PATH
+
+    # One icon directory per theme, so a cached stylesheet never points at another theme's icons
+    parent = os.path.splitext(theme)[0]
+    apply_stylesheet(app, theme=theme, parent=parent)
+    header = {'icons': os.path.join(RESOURCES_PATH, parent),
+              'text': QGuiApplication.palette().color(QPalette.ColorRole.Text).name(QColor.HexArgb)}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(f'/* {json.dumps(header)} */\n')
+            file.write(app.styleSheet())
+        print(f'Stylesheet cached to {path}')
+    except OSError as e:
+        print(f'Unable to cache stylesheet: {str(e)}')
@@ -6,6 +6,10 @@ Classes:
     EquipmentLimits: Manages frequency and power limits for antennas and amplifiers.
     PIDGainsPopUp: A dialog for setting PID controller gains.
     MainWindow: The main application window for the field intensity controller.
+
+Only the selection dialog is built at startup: each test window's module (and with it
+matplotlib/pyqtgraph, numpy, serial and the instrument drivers) is imported when that
+test is selected, and the theme comes from the stylesheet cache in AppStyle.
 """
 
 from PyQt5.QtWidgets import (
@@ -14,24 +18,26 @@ from PyQt5.QtWidgets import (
 )
 
 
-from qt_material import apply_stylesheet
-
-from RadiatedImmunity import RadiatedImmunity
-#from ConductedImmunity import ConductedImmunity
-from ConductedImmunityCalibration import ConductedImmunityCalibration
+from AppStyle import apply_cached_stylesheet
 
+import importlib
 import os
 import sys
-import numpy as np
-from datetime import datetime
 
 import signal
-from PyQt5.QtCore import QResource
 
 CURRENT_DIR = os.path.curdir
 RADIATED_IMMUNITY = 'Radiated Immunity'
 CONDUCTED_IMMUNITY = 'Conducted Immunity'
 CONDUCTED_IMMUNITY_CALIBRATION = 'Conducted Immunity Calibration'
+THEME = 'dark_cyan.xml'
+
+# Test window per selection, as (module, class); modules are imported on selection
+TEST_WINDOWS = {
+    RADIATED_IMMUNITY: ('RadiatedImmunity', 'RadiatedImmunity'),
+    CONDUCTED_IMMUNITY: ('ConductedImmunity', 'ConductedImmunity'),
+    CONDUCTED_IMMUNITY_CALIBRATION: ('ConductedImmunityCalibration', 'ConductedImmunityCalibration'),
+}
 
 try:
     # Include in try/except block if you're also targeting Mac/Linux
@@ -63,6 +69,7 @@ class TestSelectionDialog(QDialog):
         self.conducted_cal_button.clicked.connect(self.openConductedImmunityCalibration)
         layout.addWidget(self.radiated_button)
         layout.addWidget(self.conducted_button)
+        layout.addWidget(self.conducted_cal_button)
 
         self.setLayout(layout)
         
@@ -77,27 +84,52 @@ class TestSelectionDialog(QDialog):
     def openConductedImmunityCalibration(self):
         self.selected_test = CONDUCTED_IMMUNITY_CALIBRATION
         self.accept()
+
+
+def create_application(argv: list) -> QApplication:
+    """
+    Create the application and apply the theme once; windows created later inherit it.
+
+    Parameters:
+        argv (list): Command line arguments.
+
+    Returns:
+        QApplication: The application.
+    """
+    app = QApplication(argv)
+    apply_cached_stylesheet(app, THEME)
+    return app
+
+
+def create_test_window(test: str) -> QMainWindow | None:
+    """
+    Import the module of a test and create its window.
+
+    Parameters:
+        test (str): One of the TEST_WINDOWS keys.
+
+    Returns:
+        QMainWindow or None: The window, or None for an unknown test.
+    """
+    if test not in TEST_WINDOWS:
+        return None
+    module_name, class_name = TEST_WINDOWS[test]
+    return getattr(importlib.import_module(module_name), class_name)()
+
         
 if __name__ == '__main__':
 
-    app = QApplication(sys.argv)
+    app = create_application(sys.argv)
     #app.setWindowIcon(QtGui.QIcon(':/icons/field_controller.ico'))
 
     # Show the splash/selection dialog.
     
     selection_dialog = TestSelectionDialog()
-    apply_stylesheet(app, theme='dark_cyan.xml')
     if selection_dialog.exec_() == QDialog.Accepted:
-        if selection_dialog.selected_test == RADIATED_IMMUNITY:
-            window = RadiatedImmunity()
-        #elif selection_dialog.selected_test == CONDUCTED_IMMUNITY:
-        #    window = ConductedImmunity()
-        elif selection_dialog.selected_test == CONDUCTED_IMMUNITY_CALIBRATION:
-            window = ConductedImmunityCalibration()
-        else:
+        window = create_test_window(selection_dialog.selected_test)
+        if window is None:
             print("No valid test selected. Exiting.")
             sys.exit(0)
-        apply_stylesheet(app, theme='dark_cyan.xml')
         window.show()
     else:
         # The dialog was cancelled or closed without selection.
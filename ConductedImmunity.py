@@ -1,6 +1,152 @@
 from PyQt5.QtWidgets import *
+from PyQt5.QtCore import pyqtSignal
+
+import threading
+
+from ConductedImmunityController import ConductedImmunityController
+from SpectrumAnalyzer import HPE4440A
+from SignalGenerator import HPE4421B
+from SCPIClient import SCPIError
+
+class ConductedImmunity(QMainWindow):
+    instrumentsConnected = pyqtSignal(bool, str)
 
-class ConductedImmunity(QMainWindow, Ui_MainWindow):
     def __init__(self, *args, **kwargs):
         super(ConductedImmunity, self).__init__(*args, **kwargs)
-        self.setWindowTitle('Conducted Immunity')
\ No newline at end of file
+        self.setWindowTitle('Conducted Immunity')
+        self.analyzer_address = "192.168.100.90"
+        self.generator_port = "COM5"
+        self.setupUi()
+
+        self.signal_generator = HPE4421B(self.generator_port)
+        self.signal_generator.error.connect(self.on_controller_error)
+        self.controller = ConductedImmunityController(self.signal_generator)
+        self.controller.stepStarted.connect(self.on_controller_stepStarted)
+        self.controller.testStatus.connect(self.on_controller_testStatus)
+        self.controller.testCompleted.connect(self.on_controller_testCompleted)
+        self.controller.levelDeviation.connect(self.on_controller_levelDeviation)
+        self.controller.error.connect(self.on_controller_error)
+        self.instrumentsConnected.connect(self.on_instrumentsConnected)
+
+        self.loadCal_pushButton.clicked.connect(self.load_calibration)
+        self.start_pushButton.clicked.connect(self.start_test)
+
+    def setupUi(self):
+        central = QWidget(self)
+        form = QFormLayout()
+        self.calibration_label = QLabel('No calibration loaded')
+        self.loadCal_pushButton = QPushButton('Load Calibration...')
+        self.dwell_spinBox = QDoubleSpinBox()
+        self.dwell_spinBox.setRange(0.0, 600.0)
+        self.dwell_spinBox.setValue(0.5)
+        self.dwell_spinBox.setSuffix(' s')
+        self.offset_spinBox = QDoubleSpinBox()
+        self.offset_spinBox.setRange(-40.0, 20.0)
+        self.offset_spinBox.setSuffix(' dB')
+        self.modDepth_spinBox = QDoubleSpinBox()
+        self.modDepth_spinBox.setRange(0.0, 100.0)
+        self.modDepth_spinBox.setValue(80.0)
+        self.modDepth_spinBox.setSuffix(' %')
+        self.verify_spinBox = QSpinBox()
+        self.verify_spinBox.setRange(0, 1000)
+        self.verify_spinBox.setValue(10)
+        self.verify_spinBox.setSpecialValueText('Off')
+        self.freq_label = QLabel('-')
+        self.power_label = QLabel('-')
+        self.start_pushButton = QPushButton('Start Test')
+        form.addRow(self.loadCal_pushButton, self.calibration_label)
+        form.addRow('Dwell:', self.dwell_spinBox)
+        form.addRow('Level Offset:', self.offset_spinBox)
+        form.addRow('AM Depth (1 kHz):', self.modDepth_spinBox)
+        form.addRow('Verify Every n Steps:', self.verify_spinBox)
+        form.addRow('Frequency:', self.freq_label)
+        form.addRow('Power:', self.power_label)
+        form.addRow(self.start_pushButton)
+        central.setLayout(form)
+        self.setCentralWidget(central)
+        self.statusbar = self.statusBar()
+
+    def load_calibration(self):
+        path, _ = QFileDialog.getOpenFileName(self, 'Load Calibration', '', 'CSV Files (*.csv)')
+        if not path:
+            return
+        try:
+            table = self.controller.loadCalibration(path)
+        except (OSError, ValueError, IndexError, StopIteration) as e:
+            self.statusbar.showMessage(f'Unable to load calibration: {str(e)}')
+            return
+        self.calibration_label.setText(f'{len(table)} points, {table.target_level:.1f} dBµV')
+
+    def connect_instruments(self):
+        """
+        Open the instruments on a worker thread, so the window stays responsive while the
+        analyzer connection times out; instrumentsConnected reports the result.
+        """
+        self.start_pushButton.setEnabled(False)
+        self.statusbar.showMessage('Connecting to instruments...')
+        threading.Thread(target=self.connect_instruments_worker, daemon=True).start()
+
+    def connect_instruments_worker(self):
+        if not self.signal_generator.is_running:
+            self.signal_generator.connect_to_instrument()
+            if not self.signal_generator.is_running:
+                self.instrumentsConnected.emit(False, f'Signal generator not found on {self.generator_port}')
+                return
+        message = ''
+        if self.controller.verify_every and self.controller.spectrum_analyzer is None:
+            try:
+                spectrum_analyzer = HPE4440A(self.analyzer_address)
+                spectrum_analyzer.set_units('DBUV')
+                self.controller.spectrum_analyzer = spectrum_analyzer
+            except SCPIError as e:
+                # Run without level verification rather than not at all
+                message = f'Spectrum analyzer not found, levels will not be verified: {str(e)}'
+        self.instrumentsConnected.emit(True, message)
+
+    def on_instrumentsConnected(self, connected: bool, message: str):
+        self.start_pushButton.setEnabled(True)
+        self.statusbar.showMessage(message)
+        if not connected:
+            return
+        self.start_pushButton.setText('Stop Test')
+        self.controller.startTest()
+
+    def start_test(self):
+        if self.controller.is_testing:
+            self.controller.stopTest()
+            self.start_pushButton.setText('Start Test')
+            return
+        if self.controller.table is None:
+            self.statusbar.showMessage('Load a calibration before starting the test')
+            return
+        self.controller.dwell_time = self.dwell_spinBox.value()
+        self.controller.level_offset = self.offset_spinBox.value()
+        self.controller.am_depth = self.modDepth_spinBox.value()
+        self.controller.verify_every = self.verify_spinBox.value()
+        self.connect_instruments()
+
+    def on_controller_stepStarted(self, frequency: float, power: float):
+        self.freq_label.setText(f'{frequency / 1e6:.4f} MHz')
+        self.power_label.setText(f'{power:.2f} dBm')
+
+    def on_controller_testStatus(self, percent: float):
+        self.statusbar.showMessage(f'Testing... {percent:.0f} %')
+
+    def on_controller_testCompleted(self, path: str):
+        self.start_pushButton.setText('Start Test')
+        self.statusbar.showMessage(f'Results saved to {path}')
+
+    def on_controller_levelDeviation(self, message: str):
+        print("Level Deviation: " + message)
+
+    def on_controller_error(self, message: str):
+        print("Conducted Immunity Error: " + message)
+        self.start_pushButton.setText('Start Test')
+        self.statusbar.showMessage(message)
+
+    def closeEvent(self, event):
+        self.controller.stopTest()
+        if self.signal_generator.is_running:
+            self.signal_generator.stop_thread()
+        if self.controller.spectrum_analyzer is not None:
+            self.controller.spectrum_analyzer.close()
@@ -3,60 +3,338 @@ Conducted Immunity Calibration Controller
 ===========================================
 This module implements a controller for conducting immunity calibration using
 an Agilent E4440A Series Spectrum Analyzer and an Agilent E4421B Series Signal Generator.
-The calibration covers a frequency range of 150 kHz to 80 MHz.
+The calibration covers a frequency range of 150 kHz to 80 MHz in 1 % logarithmic
+steps. At every step the generator power is levelled until the analyzer reads the
+target voltage, and the result is stored in a calibration table.
+
+Generator and analyzer I/O are overlapped: as soon as the analyzer sweep for a
+point has completed, the generator is already sent the setting for the next point
+on its serial thread while the analyzer reading is fetched over the LAN. By default
+the analyzer measures each point in zero span with the average detector, which
+takes a few milliseconds instead of a full swept span.
 
 Devices:
     - Spectrum Analyzer: Agilent E4440A Series
     - Signal Generator: Agilent E4421B Series
+
+Classes:
+    CalibrationStopped: Raised inside the levelling loop when the calibration is stopped.
+    CalibrationTable: Levelled generator power per frequency, stored as CSV.
+    ConductedImmunityCalController: Runs the levelling sweep on a worker thread.
 """
 
+import concurrent.futures
+import csv
+import math
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from SCPIClient import SCPIError
+
+
+def log_steps(start: float, stop: float, step: float = 0.01) -> list[float]:
+    """
+    Return frequencies from start to stop where each is the previous one times (1 + step).
+
+    Parameters:
+        start (float): Start frequency in Hz.
+        stop (float): Stop frequency in Hz, always included as the last point.
+        step (float): Relative step size, 0.01 for 1 % steps.
+
+    Returns:
+        list: The frequencies in Hz.
+    """
+    count = int(math.floor(math.log(stop / start) / math.log1p(step)))
+    frequencies = [start * (1.0 + step) ** i for i in range(count + 1)]
+    if frequencies[-1] < stop:
+        frequencies.append(stop)
+    return frequencies
+
+
+def volts_to_dbuv(volts: float) -> float:
+    """
+    Convert a voltage in V to dBµV.
+    """
+    return 20.0 * math.log10(volts * 1e6)
+
+
+class CalibrationStopped(Exception):
+    """
+    Raised inside the levelling loop when the calibration is stopped, so the worker ends
+    without finishing the current point.
+    """
+
+
+class CalibrationTable:
+    """
+    Levelled generator power per calibration frequency.
+
+    Attributes:
+        frequencies (np.ndarray): Calibration frequencies in Hz, ascending.
+        powers (np.ndarray): Generator power in dBm that produced the target level.
+        levels (np.ndarray): Level measured at that power in dBµV.
+        target_level (float): The target level in dBµV.
+    """
+
+    HEADER = ['Frequency (Hz)', 'Power (dBm)', 'Level (dBuV)']
+
+    def __init__(self, target_level: float, frequencies=(), powers=(), levels=()):
+        self.target_level = target_level
+        self.frequencies = np.asarray(frequencies, dtype=float)
+        self.powers = np.asarray(powers, dtype=float)
+        self.levels = np.asarray(levels, dtype=float)
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def power_at(self, frequency: float) -> float:
+        """
+        Interpolate the levelled power at a frequency on a logarithmic frequency axis.
+
+        Parameters:
+            frequency (float): Frequency in Hz.
+
+        Returns:
+            float: Generator power in dBm.
+        """
+        return float(np.interp(np.log(frequency), np.log(self.frequencies), self.powers))
+
+    def save(self, path: str):
+        """
+        Write the table to a CSV file. The target level is stored in the first row.
+
+        Parameters:
+            path (str): Destination file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['Target (dBuV)', f'{self.target_level:.3f}'])
+            writer.writerow(self.HEADER)
+            for frequency, power, level in zip(self.frequencies, self.powers, self.levels):
+                writer.writerow([f'{frequency:.1f}', f'{power:.3f}', f'{level:.3f}'])
+
+    @classmethod
+    def load(cls, path: str) -> 'CalibrationTable':
+        """
+        Read a table written by save().
+
+        Parameters:
+            path (str): CSV file.
+
+        Returns:
+            CalibrationTable: The loaded table.
+        """
+        with open(path, 'r', newline='') as file:
+            reader = csv.reader(file)
+            target_level = float(next(reader)[1])
+            next(reader)
+            rows = np.array([[float(value) for value in row] for row in reader if row], dtype=float).reshape(-1, 3)
+        return cls(target_level, rows[:, 0], rows[:, 1], rows[:, 2])
+
 
-class ConductedImmunityCalController:
+class ConductedImmunityCalController(QObject):
     """
     Controller class for managing the conducted immunity calibration process.
     """
-    
+
+    pointCalibrated = pyqtSignal(float, float, float)
+    calibrationStatus = pyqtSignal(float)
+    calibrationCompleted = pyqtSignal(str)
+    error = pyqtSignal(str)
+
     def __init__(self, spectrum_analyzer, signal_generator):
         """
         Initialize the calibration controller with a spectrum analyzer and signal generator.
-        
+
         Parameters:
             spectrum_analyzer: An instance of the Agilent E4440A Series Spectrum Analyzer.
             signal_generator: An instance of the Agilent E4421B Series Signal Generator.
         """
+        super().__init__()
         self.spectrum_analyzer = spectrum_analyzer
         self.signal_generator = signal_generator
-        
-        # Connect the calibration start button to the startCalibration method.
-        self.conducted_immunity.start_cal_button.clicked.connect(self.startCalibration)
-        
+
+        # Calibration parameters
+        self.start_freq = 150e3                          # Start frequency in Hz
+        self.stop_freq = 80e6                            # Stop frequency in Hz
+        self.step = 0.01                                 # Relative frequency step
+        self.target_level = volts_to_dbuv(10.0 / 6.0)    # 10 V EMF into the 150 Ω/50 Ω adapter, in dBµV
+        self.tolerance = 0.5                             # Levelling tolerance in dB
+        self.max_iterations = 5                          # Levelling attempts per frequency
+        self.start_power = -20.0                         # First generator power in dBm
+        self.max_power = 10.0                            # Generator power limit in dBm
+        self.min_power = -135.0                          # Generator power floor in dBm
+        self.zero_span = True                            # Measure in zero span rather than with a peak marker
+        self.span = 100e3                                # Analyzer span around each frequency when not in zero span
+        self.sweep_timeout = 5.0                         # Analyzer sweep timeout in seconds
+
+        self.is_calibrating = False
+        self.calibration_thread = None
+        self.table = None
+
     def startCalibration(self):
         """
-        Executes the calibration process by:
-            - Configuring the devices with the correct frequency and power settings.
-            - Starting the devices to perform the calibration.
-            - Stopping the devices after calibration.
-            - Saving the acquired data.
-            - Closing the calibration interface.
-        """
-        # Set up the spectrum analyzer configuration.
-        self.spectrum_analyzer.setCenterFrequency(150e3)
-        self.spectrum_analyzer.setSpan(80e6)
-        self.signal_generator.setFrequency(150e3)
-        self.signal_generator.setPower(-20)
-        self.spectrum_analyzer.start()
-        self.signal_generator.start()
-        self.spectrum_analyzer.stop()
-        self.signal_generator.stop()
-        self.spectrum_analyzer.saveData()
-        self.signal_generator.saveData()
-        self.conducted_immunity.close()
-        
-    def run(self):
-        """
-        Launch the calibration interface.
-
-        This method displays the conducted immunity calibration GUI, allowing the user to
-        initiate and monitor the calibration process.
-        """
-        self.conducted_immunity.show()
\ No newline at end of file
+        Start the calibration sweep on a worker thread.
+        """
+        if self.is_calibrating:
+            return
+        if self.calibration_thread is not None and self.calibration_thread.is_alive():
+            self.error.emit('The previous calibration is still stopping')
+            return
+        self.is_calibrating = True
+        self.calibration_thread = threading.Thread(target=self.calibrate, daemon=True)
+        self.calibration_thread.start()
+
+    def stopCalibration(self, wait: bool = True):
+        """
+        Stop the calibration sweep at the next levelling iteration. The worker then switches RF off.
+
+        Parameters:
+            wait (bool): Wait for the worker to finish. The GUI passes False so it never blocks.
+        """
+        self.is_calibrating = False
+        if wait and self.calibration_thread is not None and self.calibration_thread is not threading.current_thread():
+            self.calibration_thread.join()
+
+    def calibrate(self) -> CalibrationTable | None:
+        """
+        Level every calibration frequency and save the resulting table.
+
+        Returns:
+            CalibrationTable or None: The table, or None if the calibration was stopped or failed.
+        """
+        frequencies = log_steps(self.start_freq, self.stop_freq, self.step)
+        powers, levels = [], []
+        analyzer = self.spectrum_analyzer
+        generator = self.signal_generator
+        rf_on = False
+        try:
+            analyzer.set_units('DBUV')
+            self.tune_analyzer(frequencies[0], self.span)
+            generator.set_rf_out(True, readback=False)
+            rf_on = True
+            generator.set_frequency(frequencies[0])
+            power = self.clamp(self.start_power)
+            generator.set_power(power)
+            started = time.perf_counter()
+            for index, frequency in enumerate(frequencies):
+                if not self.is_calibrating:
+                    return None
+                next_frequency = frequencies[index + 1] if index + 1 < len(frequencies) else None
+                power, level = self.level_point(frequency, power, next_frequency)
+                powers.append(power)
+                levels.append(level)
+                self.pointCalibrated.emit(frequency, power, level)
+                self.calibrationStatus.emit(100.0 * (index + 1) / len(frequencies))
+            generator.set_rf_out(False, readback=False).result(self.sweep_timeout)
+            rf_on = False
+            print(f'Calibrated {len(frequencies)} points in {time.perf_counter() - started:.1f} s, generator {generator.stats}')
+        except (CalibrationStopped, concurrent.futures.CancelledError):
+            # Stopped, or the generator thread was stopped under the worker when the window closed
+            return None
+        except (SCPIError, OSError, ValueError) as e:
+            self.error.emit(f'Calibration failed: {str(e)}')
+            return None
+        finally:
+            self.is_calibrating = False
+            # Stopped or failed with RF on: switch it off without masking the original error
+            if rf_on:
+                try:
+                    generator.set_rf_out(False, readback=False)
+                except (SCPIError, OSError) as e:
+                    print(f'Unable to switch RF off: {str(e)}')
+        self.table = CalibrationTable(self.target_level, frequencies, powers, levels)
+        path = self.default_table_path()
+        self.table.save(path)
+        self.calibrationCompleted.emit(path)
+        return self.table
+
+    def level_point(self, frequency: float, power: float, next_frequency: float | None) -> tuple[float, float]:
+        """
+        Level one frequency. The generator must already be set to frequency and power.
+
+        After each analyzer sweep the generator is speculatively moved to the next frequency
+        with the current power, which is the best guess because neighbouring points are only
+        1 % apart. If the reading turns out to be outside the tolerance, the generator is
+        moved back and the point is measured again.
+
+        Parameters:
+            frequency (float): Frequency being levelled in Hz.
+            power (float): Power the generator is set to in dBm.
+            next_frequency (float or None): The following calibration frequency, if any.
+
+        Returns:
+            tuple: (power in dBm, measured level in dBµV) of the last measurement.
+
+        Raises:
+            CalibrationStopped: If the calibration is stopped.
+        """
+        analyzer = self.spectrum_analyzer
+        generator = self.signal_generator
+        level = float('nan')
+        for iteration in range(self.max_iterations):
+            if not self.is_calibrating:
+                raise CalibrationStopped()
+            # Wait for the generator to settle before measuring
+            generator.sync().result(self.sweep_timeout)
+            analyzer.single_sweep(self.sweep_timeout)
+            # The stimulus is no longer needed: queue the next point on the serial thread
+            # and tune the analyzer while the reading is fetched over the LAN
+            if next_frequency is not None:
+                generator.set_frequency(next_frequency)
+            level = analyzer.read_average() if self.zero_span else analyzer.read_peak()
+            error = self.target_level - level
+            converged = abs(error) <= self.tolerance
+            corrected = self.clamp(power + error)
+            if converged or corrected == power or iteration == self.max_iterations - 1:
+                if next_frequency is not None:
+                    self.tune_analyzer(next_frequency)
+                    # Carry the residual error over as the first guess for the next point
+                    generator.set_power(corrected)
+                if not converged:
+                    print(f'Unable to level {frequency / 1e6:.4f} MHz: {level:.2f} dBµV at {power:.2f} dBm')
+                return power, level
+            # Misprediction: return the generator to this frequency at the corrected power
+            power = corrected
+            generator.set_frequency(frequency)
+            generator.set_power(power)
+        return power, level
+
+    def tune_analyzer(self, frequency: float, span: float | None = None):
+        """
+        Tune the analyzer to a calibration frequency, in zero span if enabled.
+
+        Parameters:
+            frequency (float): Frequency in Hz.
+            span (float or None): Span in Hz for swept measurements; None keeps the current span.
+        """
+        if self.zero_span:
+            self.spectrum_analyzer.configure_zero_span(frequency, self.tolerance)
+        else:
+            self.spectrum_analyzer.set_center_frequency(frequency, span)
+
+    def clamp(self, power: float) -> float:
+        """
+        Limit a generator power to the configured range.
+
+        Parameters:
+            power (float): Power in dBm.
+
+        Returns:
+            float: The clamped power in dBm.
+        """
+        return min(max(power, self.min_power), self.max_power)
+
+    def default_table_path(self) -> str:
+        """
+        Returns:
+            str: A timestamped CSV path in ~/Documents/ImmuniSweep/Calibrations.
+        """
+        directory = os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "Calibrations")
+        return os.path.join(directory, f"conducted_cal_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv")
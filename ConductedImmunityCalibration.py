@@ -1,26 +1,99 @@
 from PyQt5.QtWidgets import *
+from PyQt5.QtCore import pyqtSignal
+
+import threading
 
 from ConductedCalibrationWindow import Ui_MainWindow
+from ConductedImmunityCalController import ConductedImmunityCalController
 from SpectrumAnalyzer import HPE4440A
 from SignalGenerator import HPE4421B
+from SCPIClient import SCPIError
 
 class ConductedImmunityCalibration(QMainWindow, Ui_MainWindow):
+    instrumentsConnected = pyqtSignal(bool, str)
+
     def __init__(self, *args, **kwargs):
         super(ConductedImmunityCalibration, self).__init__(*args, **kwargs)
+        self.setupUi(self)
         self.setWindowTitle('Conducted Immunity Calibration')
-        self.start_cal_button = QPushButton("Start Calibration")
-        self.start_cal_button.clicked.connect(self.start_calibration)
-        self.spectrum_analyzer = HPE4440A("192.168.100.90")
-        self.signal_generator = HPE4421B("COM5")
-        
+        self.analyzer_address = "192.168.100.90"
+        self.generator_port = "COM5"
+        self.spectrum_analyzer = None
+        self.signal_generator = HPE4421B(self.generator_port)
+        self.signal_generator.error.connect(self.on_calController_error)
+        self.cal_controller = None
+        self.instrumentsConnected.connect(self.on_instrumentsConnected)
+        self.startCal_pushButton.clicked.connect(self.start_calibration)
 
-    def start_calibration(self):
+    def connect_instruments(self):
+        """
+        Open the instruments on a worker thread, so the window stays responsive while the
+        analyzer connection times out; instrumentsConnected reports the result.
+        """
+        self.startCal_pushButton.setEnabled(False)
+        self.statusbar.showMessage('Connecting to instruments...')
+        threading.Thread(target=self.connect_instruments_worker, daemon=True).start()
+
+    def connect_instruments_worker(self):
+        if self.spectrum_analyzer is None:
+            try:
+                self.spectrum_analyzer = HPE4440A(self.analyzer_address)
+            except SCPIError as e:
+                self.instrumentsConnected.emit(False, f'Spectrum analyzer not found at {self.analyzer_address}: {str(e)}')
+                return
+        if not self.signal_generator.is_running:
+            self.signal_generator.connect_to_instrument()
+            if not self.signal_generator.is_running:
+                self.instrumentsConnected.emit(False, f'Signal generator not found on {self.generator_port}')
+                return
+        self.instrumentsConnected.emit(True, '')
+
+    def on_instrumentsConnected(self, connected: bool, message: str):
+        self.startCal_pushButton.setEnabled(True)
+        if not connected:
+            self.statusbar.showMessage(message)
+            return
+        if self.cal_controller is None:
+            self.cal_controller = ConductedImmunityCalController(self.spectrum_analyzer, self.signal_generator)
+            self.cal_controller.pointCalibrated.connect(self.on_calController_pointCalibrated)
+            self.cal_controller.calibrationStatus.connect(self.on_calController_calibrationStatus)
+            self.cal_controller.calibrationCompleted.connect(self.on_calController_calibrationCompleted)
+            self.cal_controller.error.connect(self.on_calController_error)
         print("Starting calibration...")
-        print("Setting spectrum analyzer window to 100 kHz - 100 MHz")
-        self.spectrum_analyzer.set_window(100e3, 100e6)
-        self.spectrum_analyzer.set_units("V")
-        self.spectrum_analyzer.set_frequency(150e3)
-        self.signal_generator.set_frequency(150e3)
-        self.signal_generator.set_power(-6)
-        #TODO: Set to DC Coupling
-        #TODO: Set to reference level of 5V
\ No newline at end of file
+        self.startCal_pushButton.setText('Stop Calibration')
+        self.cal_controller.startCalibration()
+
+    def start_calibration(self):
+        if self.cal_controller is not None and self.cal_controller.is_calibrating:
+            # The worker stops at its next levelling iteration and switches RF off itself
+            self.cal_controller.stopCalibration(wait=False)
+            self.startCal_pushButton.setText('Start Calibration')
+            return
+        self.connect_instruments()
+
+    def on_calController_pointCalibrated(self, frequency: float, power: float, level: float):
+        self.freq_lcdNumber.display(f'{frequency / 1e6:.3f}')
+        self.power_lcdNumber.display(f'{power:.2f}')
+        self.voltage_lcdNumber.display(f'{level:.2f}')
+
+    def on_calController_calibrationStatus(self, percent: float):
+        self.statusbar.showMessage(f'Calibrating... {percent:.0f} %')
+
+    def on_calController_calibrationCompleted(self, path: str):
+        self.startCal_pushButton.setText('Start Calibration')
+        self.statusbar.showMessage(f'Calibration saved to {path}')
+
+    def on_calController_error(self, message: str):
+        print("Calibration Error: " + message)
+        self.startCal_pushButton.setText('Start Calibration')
+        self.statusbar.showMessage(message)
+
+    def closeEvent(self, event):
+        if self.cal_controller is not None:
+            self.cal_controller.stopCalibration(wait=False)
+        if self.signal_generator.is_running:
+            # Queued ahead of the stop, so RF is off even if the worker is still in an analyzer call
+            self.signal_generator.set_rf_out(False, readback=False)
+            self.signal_generator.stop_thread()
+        if self.spectrum_analyzer is not None:
+            self.spectrum_analyzer.close()
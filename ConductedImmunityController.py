@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Conducted Immunity Controller Module
+====================================
+This module defines the ConductedImmunityController class, which runs a conducted
+immunity test by replaying a calibration table recorded by the
+ConductedImmunityCalController. At each frequency the HPE4421B generator is set to the
+calibrated power, AM modulation is applied, and the step dwells on the EUT. No
+levelling loop runs during the test, so the run time is set by the dwell time rather
+than by measurements.
+
+The level can optionally be verified with the HPE4440A analyzer at every n-th step.
+The zero-span measurement runs inside the dwell, so it costs no extra time. Every
+step is appended to a CSV results file as soon as it completes.
+
+Dependencies:
+    - PyQt5 for signals and QObject.
+    - HPE4421B (SignalGenerator), HPE4440A (SpectrumAnalyzer), CalibrationTable.
+"""
+
+import csv
+import math
+import os
+import threading
+import time
+from datetime import datetime
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from ConductedImmunityCalController import CalibrationTable
+from SCPIClient import SCPIError
+
+
+class ConductedImmunityController(QObject):
+    """
+    ConductedImmunityController replays a calibration table on a worker thread and streams
+    per-step results to disk.
+    """
+
+    stepStarted = pyqtSignal(float, float)
+    stepCompleted = pyqtSignal(float, float, float)
+    testStatus = pyqtSignal(float)
+    testCompleted = pyqtSignal(str)
+    levelDeviation = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    RESULTS_HEADER = ['Time (s)', 'Frequency (Hz)', 'Power (dBm)', 'Measured (dBuV)', 'Deviation (dB)']
+
+    def __init__(self, signal_generator, spectrum_analyzer=None):
+        """
+        Initialize the controller.
+
+        Parameters:
+            signal_generator (HPE4421B): The signal generator instance.
+            spectrum_analyzer (HPE4440A or None): Analyzer used for sampled level checks, if any.
+        """
+        super().__init__()
+        self.signal_generator = signal_generator
+        self.spectrum_analyzer = spectrum_analyzer
+        self.table = None
+
+        # Test parameters
+        self.dwell_time = 0.5       # Dwell time per step in seconds
+        self.level_offset = 0.0     # Test level relative to the calibrated level in dB
+        self.am_depth = 80.0        # AM depth in percent
+        self.am_frequency = 1000.0  # AM frequency in Hz
+        self.verify_every = 10      # Verify the level at every n-th step; 0 disables verification
+        self.tolerance = 1.0        # Allowed deviation of verified levels in dB
+        self.max_power = 10.0       # Generator power limit in dBm
+        self.settle_timeout = 5.0   # Time allowed for the generator to apply a step in seconds
+
+        self.is_testing = False
+        self.test_thread = None
+        self.stop_event = threading.Event()
+        self.results_path = None
+
+    def loadCalibration(self, path: str) -> CalibrationTable:
+        """
+        Load the calibration table to replay.
+
+        Parameters:
+            path (str): CSV file written by the calibration controller.
+
+        Returns:
+            CalibrationTable: The loaded table.
+        """
+        self.table = CalibrationTable.load(path)
+        return self.table
+
+    def expectedLevel(self, rbw: float | None = None) -> float:
+        """
+        Level the analyzer should read during the test. The average detector averages power,
+        so AM raises the reading above the calibrated carrier by 10*log10(1 + m^2 / 2).
+        The RBW filter attenuates the sidebands at +-am_frequency by 3.01 * (2 * fm / RBW)^2 dB.
+
+        Parameters:
+            rbw (float, optional): Resolution bandwidth of the measurement in Hz. Defaults to
+                None, which counts the full sideband power.
+
+        Returns:
+            float: The expected level in dBµV.
+        """
+        m = self.am_depth / 100.0
+        sidebands = m * m / 2.0
+        if rbw:
+            sidebands *= 10.0 ** (-0.301 * (2.0 * self.am_frequency / rbw) ** 2)
+        return self.table.target_level + self.level_offset + 10.0 * math.log10(1.0 + sidebands)
+
+    def startTest(self):
+        """
+        Start the test on a worker thread.
+        """
+        if self.is_testing:
+            return
+        if self.table is None or not len(self.table):
+            self.error.emit('No calibration table loaded')
+            return
+        self.is_testing = True
+        self.stop_event.clear()
+        self.test_thread = threading.Thread(target=self.run_test, daemon=True)
+        self.test_thread.start()
+
+    def stopTest(self):
+        """
+        Abort the test, ending the current dwell early, and wait for the worker.
+        """
+        self.is_testing = False
+        self.stop_event.set()
+        if self.test_thread is not None and self.test_thread is not threading.current_thread():
+            self.test_thread.join()
+
+    def run_test(self) -> str | None:
+        """
+        Replay the calibration table once.
+
+        Returns:
+            str or None: Path of the results file, or None if the test failed.
+        """
+        generator = self.signal_generator
+        frequencies = self.table.frequencies
+        self.results_path = self.default_results_path()
+        os.makedirs(os.path.dirname(self.results_path), exist_ok=True)
+        started = time.perf_counter()
+        output_on = False
+        try:
+            with open(self.results_path, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(self.RESULTS_HEADER)
+                generator.set_power(self.power_for(0))
+                generator.set_frequency(frequencies[0])
+                generator.set_am(True, self.am_depth, self.am_frequency)
+                generator.set_rf_out(True, readback=False)
+                output_on = True
+                for index, frequency in enumerate(frequencies):
+                    if not self.is_testing:
+                        break
+                    power = self.power_for(index)
+                    generator.set_frequency(frequency)
+                    generator.set_power(power)
+                    generator.sync().result(self.settle_timeout)
+                    dwell_end = time.perf_counter() + self.dwell_time
+                    self.stepStarted.emit(frequency, power)
+                    measured = self.verify(index, frequency)
+                    # Dwell for whatever time the verification left over
+                    self.stop_event.wait(max(0.0, dwell_end - time.perf_counter()))
+                    deviation = measured - self.expectedLevel(self.verifyRBW(frequency)) if not math.isnan(measured) else float('nan')
+                    writer.writerow([f'{time.perf_counter() - started:.3f}', f'{frequency:.1f}', f'{power:.3f}',
+                                     '' if math.isnan(measured) else f'{measured:.3f}',
+                                     '' if math.isnan(deviation) else f'{deviation:.3f}'])
+                    file.flush()
+                    self.stepCompleted.emit(frequency, power, measured)
+                    self.testStatus.emit(100.0 * (index + 1) / len(frequencies))
+                generator.set_rf_out(False, readback=False)
+                generator.set_am(False).result(self.settle_timeout)
+                output_on = False
+        except (SCPIError, OSError) as e:
+            self.error.emit(f'Conducted immunity test failed: {str(e)}')
+            return None
+        finally:
+            self.is_testing = False
+            # A failed test must not leave the EUT exposed
+            if output_on:
+                try:
+                    generator.set_rf_out(False, readback=False)
+                    generator.set_am(False)
+                except (SCPIError, OSError) as e:
+                    print(f'Unable to switch RF and AM off: {str(e)}')
+        print(f'Conducted immunity test finished in {time.perf_counter() - started:.1f} s')
+        self.testCompleted.emit(self.results_path)
+        return self.results_path
+
+    def power_for(self, index: int) -> float:
+        """
+        Generator power for a step of the table, including the level offset.
+
+        Parameters:
+            index (int): Index into the calibration table.
+
+        Returns:
+            float: Power in dBm, limited to max_power.
+        """
+        return min(self.table.powers[index] + self.level_offset, self.max_power)
+
+    def verify(self, index: int, frequency: float) -> float:
+        """
+        Measure the injected level if this step is one of the sampled points.
+
+        Parameters:
+            index (int): Step index.
+            frequency (float): Step frequency in Hz.
+
+        Returns:
+            float: The measured level in dBµV, or NaN if the step is not verified.
+        """
+        if self.spectrum_analyzer is None or self.verify_every <= 0 or index % self.verify_every:
+            return float('nan')
+        measured = self.spectrum_analyzer.measure_zero_span(frequency, am_frequency=self.am_frequency)
+        expected = self.expectedLevel(self.verifyRBW(frequency))
+        if abs(measured - expected) > self.tolerance:
+            self.levelDeviation.emit(f'Level at {frequency / 1e6:.4f} MHz is {measured:.2f} dBµV, expected {expected:.2f} dBµV')
+        return measured
+
+    def verifyRBW(self, frequency: float) -> float:
+        """
+        Parameters:
+            frequency (float): Step frequency in Hz.
+
+        Returns:
+            float: The RBW in Hz the analyzer uses to verify this step, wide enough for the AM sidebands.
+        """
+        return self.spectrum_analyzer.select_zero_span_settings(frequency, am_frequency=self.am_frequency)[0]
+
+    def default_results_path(self) -> str:
+        """
+        Returns:
+            str: A timestamped CSV path in ~/Documents/ImmuniSweep/ConductedImmunity.
+        """
+        directory = os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "ConductedImmunity")
+        return os.path.join(directory, f"conducted_run_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv")
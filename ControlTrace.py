@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Control Trace Module
+====================
+This module records how the FieldController's leveling loop converged at every sweep
+step: the power command, field reading and time of every iteration, and per step the
+frequency, iteration count, duration and exit reason. The records go into
+preallocated NumPy arrays that grow by doubling, so recording costs no allocation per
+iteration, and the whole trace is saved as one compressed .npz file next to the sweep
+data.
+
+Classes:
+    ExitReason: Why the leveling loop of a step ended.
+    ControlTrace: Per-iteration and per-step arrays with save/load and a summary.
+    SlowestStepsWidget: Table of the steps that took the most iterations.
+"""
+
+from enum import Enum
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+
+
+class ExitReason(Enum):
+    CONVERGED = 0
+    HIGH_FIELD = 1
+    POWER_LIMIT = 2
+    BELOW_TARGET = 3
+    STOPPED = 4
+
+
+class ControlTrace:
+    """
+    Leveling trace of one sweep.
+
+    Iteration arrays (one entry per probe reading):
+        iteration_step (int32): Index of the step the reading belongs to.
+        iteration_time (float64): Seconds since the start of the trace.
+        iteration_power (float32): Generator power at the reading in dBm.
+        iteration_field (float32): Composite field reading in V/m.
+
+    Step arrays (one entry per sweep step):
+        step_frequency (float64): Frequency in MHz.
+        step_start (int32): Index of the first iteration of the step.
+        step_iterations (int32): Number of iterations.
+        step_duration (float32): Leveling time in seconds.
+        step_exit (int8): ExitReason value.
+    """
+
+    ITERATION_FIELDS = {'iteration_step': np.int32, 'iteration_time': np.float64,
+                        'iteration_power': np.float32, 'iteration_field': np.float32}
+    STEP_FIELDS = {'step_frequency': np.float64, 'step_start': np.int32, 'step_iterations': np.int32,
+                   'step_duration': np.float32, 'step_exit': np.int8}
+
+    def __init__(self, step_capacity: int = 1024, iteration_capacity: int = 16384):
+        """
+        Initialize an empty trace.
+
+        Parameters:
+            step_capacity (int): Steps to preallocate.
+            iteration_capacity (int): Iterations to preallocate.
+        """
+        for name, dtype in self.ITERATION_FIELDS.items():
+            setattr(self, name, np.zeros(iteration_capacity, dtype=dtype))
+        for name, dtype in self.STEP_FIELDS.items():
+            setattr(self, name, np.zeros(step_capacity, dtype=dtype))
+        self.target_field = 0.0
+        self.clear()
+
+    def clear(self, target_field: float = 0.0, start_time: float = 0.0):
+        """
+        Empty the trace, keeping the allocated arrays.
+
+        Parameters:
+            target_field (float): Target field of the sweep in V/m, stored with the trace.
+            start_time (float): Clock time that iteration times are relative to.
+        """
+        self.target_field = target_field
+        self.start_time = start_time
+        self.step_count = 0
+        self.iteration_count = 0
+        self.step_open = False
+
+    def _grow(self, fields: dict, needed: int):
+        for name in fields:
+            array = getattr(self, name)
+            if needed > len(array):
+                grown = np.zeros(max(needed, 2 * len(array)), dtype=array.dtype)
+                grown[:len(array)] = array
+                setattr(self, name, grown)
+
+    def beginStep(self, frequency: float):
+        """
+        Start recording a sweep step.
+
+        Parameters:
+            frequency (float): Frequency in MHz.
+        """
+        self._grow(self.STEP_FIELDS, self.step_count + 1)
+        index = self.step_count
+        self.step_frequency[index] = frequency
+        self.step_start[index] = self.iteration_count
+        self.step_iterations[index] = 0
+        self.step_duration[index] = 0.0
+        self.step_exit[index] = ExitReason.STOPPED.value
+        self.step_count += 1
+        self.step_open = True
+
+    def record(self, time: float, power: float, field: float):
+        """
+        Record one leveling iteration of the current step.
+
+        Parameters:
+            time (float): Clock time of the reading in seconds.
+            power (float): Generator power in dBm.
+            field (float): Composite field in V/m.
+        """
+        if not self.step_open:
+            return
+        self._grow(self.ITERATION_FIELDS, self.iteration_count + 1)
+        index = self.iteration_count
+        self.iteration_step[index] = self.step_count - 1
+        self.iteration_time[index] = time - self.start_time
+        self.iteration_power[index] = power
+        self.iteration_field[index] = field
+        self.iteration_count += 1
+        self.step_iterations[self.step_count - 1] += 1
+
+    def endStep(self, reason: ExitReason, time: float):
+        """
+        Close the current step.
+
+        Parameters:
+            reason (ExitReason): Why the leveling loop ended.
+            time (float): Clock time in seconds.
+        """
+        if not self.step_open:
+            return
+        index = self.step_count - 1
+        self.step_exit[index] = reason.value
+        start = self.step_start[index]
+        if self.step_iterations[index]:
+            self.step_duration[index] = time - self.start_time - self.iteration_time[start]
+        self.step_open = False
+
+    def stepResult(self, step: int | None = None) -> tuple[float | None, int, int]:
+        """
+        Parameters:
+            step (int or None): Step index; None for the latest step.
+
+        Returns:
+            tuple: (generator power in dBm at the step's last reading, or None if there
+            was none; iteration count; ExitReason value).
+        """
+        step = self.step_count - 1 if step is None else step
+        if step < 0:
+            return None, 0, ExitReason.STOPPED.value
+        iterations = int(self.step_iterations[step])
+        power = float(self.iteration_power[self.step_start[step] + iterations - 1]) if iterations else None
+        return power, iterations, int(self.step_exit[step])
+
+    def steps(self) -> dict:
+        """
+        Returns:
+            dict: The filled part of every step array, by name.
+        """
+        return {name: getattr(self, name)[:self.step_count] for name in self.STEP_FIELDS}
+
+    def iterations(self, step: int | None = None) -> dict:
+        """
+        Parameters:
+            step (int or None): Only the iterations of this step, or all of them if None.
+
+        Returns:
+            dict: The filled part of every iteration array, by name.
+        """
+        if step is None:
+            start, stop = 0, self.iteration_count
+        else:
+            start = int(self.step_start[step])
+            stop = start + int(self.step_iterations[step])
+        return {name: getattr(self, name)[start:stop] for name in self.ITERATION_FIELDS}
+
+    def slowest(self, count: int = 10) -> np.ndarray:
+        """
+        Parameters:
+            count (int): Number of steps.
+
+        Returns:
+            np.ndarray: Indices of the steps with the most iterations, slowest first.
+        """
+        iterations = self.step_iterations[:self.step_count]
+        return np.argsort(-iterations, kind='stable')[:count]
+
+    def summary(self, count: int = 5) -> str:
+        """
+        Parameters:
+            count (int): Number of slowest steps to list.
+
+        Returns:
+            str: Iteration statistics, exit reasons and the slowest steps.
+        """
+        if not self.step_count:
+            return 'No steps recorded'
+        iterations = self.step_iterations[:self.step_count]
+        exits = np.bincount(self.step_exit[:self.step_count], minlength=len(ExitReason))
+        lines = [f'{self.step_count} steps, {self.iteration_count} iterations, mean {iterations.mean():.1f} '
+                 f'p95 {np.percentile(iterations, 95):.0f} max {iterations.max()}; '
+                 + ', '.join(f'{reason.name.lower()} {exits[reason.value]}' for reason in ExitReason if exits[reason.value])]
+        for step in self.slowest(count):
+            lines.append(f'  {self.step_frequency[step]:.3f} MHz: {self.step_iterations[step]} iterations in '
+                         f'{self.step_duration[step]:.2f} s, {ExitReason(int(self.step_exit[step])).name.lower()}')
+        return '\n'.join(lines)
+
+    def save(self, path: str):
+        """
+        Save the filled part of the trace as a compressed .npz file.
+
+        Parameters:
+            path (str): Destination file.
+        """
+        np.savez_compressed(path, target_field=np.float64(self.target_field), **self.steps(), **self.iterations())
+
+    @classmethod
+    def load(cls, path: str) -> 'ControlTrace':
+        """
+        Load a trace written by save().
+
+        Parameters:
+            path (str): .npz file.
+
+        Returns:
+            ControlTrace: The trace.
+        """
+        with np.load(path) as data:
+            trace = cls(max(1, len(data['step_frequency'])), max(1, len(data['iteration_time'])))
+            for name in list(cls.STEP_FIELDS) + list(cls.ITERATION_FIELDS):
+                getattr(trace, name)[:len(data[name])] = data[name]
+            trace.target_field = float(data['target_field'])
+            trace.step_count = len(data['step_frequency'])
+            trace.iteration_count = len(data['iteration_time'])
+        return trace
+
+
+class SlowestStepsWidget(QWidget):
+    """
+    Lists the sweep steps that needed the most leveling iterations.
+    """
+
+    HEADER = ['Frequency (MHz)', 'Iterations', 'Time (s)', 'Exit', 'First Power (dBm)', 'Last Power (dBm)', 'Last Field (V/m)']
+
+    def __init__(self, trace: ControlTrace, count: int = 20):
+        """
+        Initialize the widget.
+
+        Parameters:
+            trace (ControlTrace): The sweep trace.
+            count (int): Number of steps to list.
+        """
+        super().__init__()
+        self.setWindowTitle('Slowest Steps')
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(trace.summary(0)))
+        steps = trace.slowest(count)
+        self.table = QTableWidget(len(steps), len(self.HEADER))
+        self.table.setHorizontalHeaderLabels(self.HEADER)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        for row, step in enumerate(steps):
+            iterations = trace.iterations(step)
+            powers, fields = iterations['iteration_power'], iterations['iteration_field']
+            values = [f'{trace.step_frequency[step]:.3f}', str(trace.step_iterations[step]), f'{trace.step_duration[step]:.2f}',
+                      ExitReason(int(trace.step_exit[step])).name.lower().replace('_', ' '),
+                      f'{powers[0]:.2f}' if len(powers) else '', f'{powers[-1]:.2f}' if len(powers) else '',
+                      f'{fields[-1]:.2f}' if len(fields) else '']
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+        self.resize(720, 480)
@@ -6,7 +6,40 @@ This module defines the EquipmentLimits class which is used to manage equipment
 limits such as frequency ranges for the antenna and amplifier, along with the maximum
 power limit. The class provides methods to set and retrieve these limits, making it
 useful in systems where equipment operating parameters must be validated.
+
+The specifications of the supported amplifiers and antennas are kept in one table each,
+AMPLIFIERS and ANTENNAS, keyed by the names shown in the UI. The UI and sweep recipes
+look equipment up there instead of repeating the values.
+
+Classes:
+    EquipmentLimits: Frequency and power limits of the selected amplifier and antenna.
 """
+
+# Frequencies in MHz, gain in dB, max_power (highest generator power into the amplifier) in dBm
+AMPLIFIERS = {
+    'AR 25A250AMB': {'min_freq': 1.0, 'max_freq': 300.0, 'gain': 45.0, 'max_power': 0.0,
+                     'stats': 'Min Freq: 1 MHz\nMax Freq: 300 MHz\nPower In: 0 dBm'},
+    'IFI SMX25': {'min_freq': 300.0, 'max_freq': 1000.0, 'gain': 45.0, 'max_power': 0.0,
+                  'stats': 'Min Freq: 300 MHz\nMax Freq: 1000 MHz\nPower In: 0 dBm'},
+    'IFI S3110': {'min_freq': 800.0, 'max_freq': 3000.0, 'gain': 45.0, 'max_power': 0.0,
+                  'stats': 'Min Freq: 800 MHz\nMax Freq: 3000 MHz\nPower In: 0 dBm'},
+    'MC ZVE8G': {'min_freq': 2000.0, 'max_freq': 8000.0, 'gain': 45.0, 'max_power': 0.0,
+                 'stats': 'Min Freq: 2000 MHz\nMax Freq: 8000 MHz\nPower In: 0 dBm'},
+    'Generic': {'min_freq': 700.0, 'max_freq': 3500.0, 'gain': 20.0, 'max_power': 10.0,
+                'stats': 'Min Freq: 700 MHz\nMax Freq: 3500 MHz\nPower In: 10 dBm'},
+}
+
+# Frequencies in MHz, gain as a linear factor
+ANTENNAS = {
+    'ETS 3143B': {'min_freq': 30.0, 'max_freq': 3000.0, 'gain': 5.0,
+                  'stats': 'Min Freq: 30 MHz\nMax Freq: 3000 MHz'},
+    'EMCO 3155': {'min_freq': 1000.0, 'max_freq': 18000.0, 'gain': 5.0,
+                  'stats': 'Min Freq: 1 GHz\nMax Freq: 18 GHz'},
+    'TekBox TBMA4': {'min_freq': 1000.0, 'max_freq': 6000.0, 'gain': 9.0,
+                     'stats': 'Min Freq: 1 GHz\nMax Freq: 6 GHz'},
+}
+
+
 class EquipmentLimits():
     """
     EquipmentLimits class manages frequency and power limits for equipment components.
@@ -106,4 +139,78 @@ class EquipmentLimits():
         Returns:
             float: The maximum power value.
         """
-        return self.max_power
\ No newline at end of file
+        return self.max_power
+
+    def setAmplifier(self, name: str) -> dict:
+        """
+        Apply the frequency range and power limit of an amplifier from AMPLIFIERS.
+
+        Parameters:
+            name (str): Amplifier name as shown in the UI.
+
+        Returns:
+            dict: The amplifier's specification.
+
+        Raises:
+            KeyError: If the amplifier is not in AMPLIFIERS.
+        """
+        spec = AMPLIFIERS[name]
+        self.amp_min_freq = spec['min_freq']
+        self.amp_max_freq = spec['max_freq']
+        self.max_power = spec['max_power']
+        return spec
+
+    def setAntenna(self, name: str) -> dict:
+        """
+        Apply the frequency range of an antenna from ANTENNAS.
+
+        Parameters:
+            name (str): Antenna name as shown in the UI.
+
+        Returns:
+            dict: The antenna's specification.
+
+        Raises:
+            KeyError: If the antenna is not in ANTENNAS.
+        """
+        spec = ANTENNAS[name]
+        self.ant_min_freq = spec['min_freq']
+        self.ant_max_freq = spec['max_freq']
+        return spec
+
+    @classmethod
+    def forSetup(cls, amplifier: str, antenna: str) -> 'EquipmentLimits':
+        """
+        Create the limits of an amplifier and antenna combination.
+
+        Parameters:
+            amplifier (str): Amplifier name.
+            antenna (str): Antenna name.
+
+        Returns:
+            EquipmentLimits: The combined limits.
+
+        Raises:
+            KeyError: If either is not in the equipment tables.
+        """
+        limits = cls(0.1, 0.1, 6000.0, 6000.0, 15.0)
+        limits.setAmplifier(amplifier)
+        limits.setAntenna(antenna)
+        return limits
+
+    def checkFrequencies(self, start_freq: float, stop_freq: float) -> str | None:
+        """
+        Check a frequency range against the limits.
+
+        Parameters:
+            start_freq (float): Start frequency in MHz.
+            stop_freq (float): Stop frequency in MHz.
+
+        Returns:
+            str or None: Why the range is invalid, or None if it is valid.
+        """
+        if min(start_freq, stop_freq) < self.getMinFrequency():
+            return 'Frequency Too Low'
+        if max(start_freq, stop_freq) > self.getMaxFrequency():
+            return 'Frequency Too High'
+        return None
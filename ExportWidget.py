@@ -4,7 +4,8 @@ Export Widget Module
 ====================
 This module defines the ExportWidget class, which provides a simple GUI for exporting
 field sweep data to CSV or DOCX files. The widget allows the user to input evaluation
-and criteria data, then save the sweep data using the chosen format.
+and criteria data, then save the sweep data using the chosen format. The control trace
+of the sweep is saved next to the exported file and its slowest steps can be viewed.
 
 Dependencies:
     - csv: For writing CSV files.
@@ -20,6 +21,8 @@ from docx import Document
 from datetime import datetime
 from PyQt5.QtWidgets import QPushButton, QFileDialog, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QLineEdit, QMessageBox
 
+from ControlTrace import ControlTrace, SlowestStepsWidget
+
 class ExportWidget(QWidget):
     """
     ExportWidget provides an interface to export field sweep data to CSV or DOCX format.
@@ -28,16 +31,18 @@ class ExportWidget(QWidget):
     save the data or cancel the export.
     """
     
-    def __init__(self, field_strengths = []):
+    def __init__(self, field_strengths = [], trace: ControlTrace | None = None):
         """
         Initialize the ExportWidget with the given field strength data.
         
         Parameters:
             field_strengths (list, optional): A list of tuples containing field data,
                 typically in the form (frequency, field). Defaults to an empty list.
+            trace (ControlTrace, optional): Leveling trace of the sweep.
         """
         super().__init__()
         self.field_levels = field_strengths if field_strengths is not None else []
+        self.trace = trace
         
         # Create UI elements
         self.evaluation_label = QLabel("Evaluation:", self)
@@ -47,6 +52,8 @@ class ExportWidget(QWidget):
         self.csv_button = QPushButton("Save to CSV")
         self.docx_button = QPushButton("Save to DOCX")
         self.cancel_button = QPushButton("Cancel")
+        self.trace_button = QPushButton("Slowest Steps...")
+        self.trace_button.setEnabled(trace is not None)
         self.label = QLabel("Test Complete. Export sweep data?")
         
         # Set tooltips for buttons
@@ -57,6 +64,7 @@ class ExportWidget(QWidget):
         self.csv_button.clicked.connect(self.save_csv)
         self.docx_button.clicked.connect(self.save_docx)
         self.cancel_button.clicked.connect(self.close)
+        self.trace_button.clicked.connect(self.show_slowest_steps)
 
         # Set up layout for the widget
         layout = QVBoxLayout()
@@ -68,6 +76,7 @@ class ExportWidget(QWidget):
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.csv_button)
         button_layout.addWidget(self.docx_button)
+        button_layout.addWidget(self.trace_button)
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
         self.setLayout(layout)
@@ -97,6 +106,7 @@ class ExportWidget(QWidget):
                     self.criteria_input.text(),
                     file_name
                 )
+                self.save_trace(file_name)
                 QMessageBox.information(self, "Success", f"Data saved to {file_name}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
@@ -112,11 +122,29 @@ class ExportWidget(QWidget):
         if file_name:
             try:
                 self.save_to_docx(self.field_levels, self.evaluation_input.text(), self.criteria_input.text(), file_name)
+                self.save_trace(file_name)
                 QMessageBox.information(self, "Success", f"Text saved to {file_name}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
         self.close()
 
+    def show_slowest_steps(self):
+        """
+        Show the sweep steps that needed the most leveling iterations.
+        """
+        self.slowest_steps_widget = SlowestStepsWidget(self.trace)
+        self.slowest_steps_widget.show()
+
+    def save_trace(self, file_name: str):
+        """
+        Save the control trace next to an exported file, e.g. sweep.csv -> sweep_trace.npz.
+        
+        Parameters:
+            file_name (str): The exported data file.
+        """
+        if self.trace is not None:
+            self.trace.save(os.path.splitext(file_name)[0] + '_trace.npz')
+
     def save_to_csv(self, field_levels, evaluation, criteria, filename=f"output_powers_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.csv"):
         """
         Save the field data to a CSV file.
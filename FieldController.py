@@ -17,7 +17,10 @@ from PyQt5.QtCore import QObject, pyqtSignal
 from FieldProbe import ETSLindgrenHI6006
 from SignalGenerator import AgilentN5181A, Frequency, Time
 from PID import PIDController as PID
-from time import sleep
+from SetupModel import SetupModel
+from SweepRecipe import SweepPlan
+from ControlTrace import ControlTrace, ExitReason
+from time import sleep, monotonic
 import math
 import os
 from datetime import datetime
@@ -71,11 +74,18 @@ class FieldController(QObject):
         self.threshold = 1.5        # Threshold for field level
         self.base_power = -30       # Base power level in dBm
         self.current_power = -30    # Current power level in dBm
+        self.max_power = 10.0       # Generator power limit in dBm (EquipmentLimits.max_power)
+        self.min_power = -60.0      # Lowest power the PID may command in dBm
+        self.settle_time = 0.2      # Wait after a power change for the probe to follow, in seconds
+        self.setup_model = None     # Predicts the starting power per frequency when set
+        self.model_residual = 0.0   # Levelled minus predicted power at the last converged step in dB
         self.start_freq = 1000.0    # Start frequency in MHz
         self.current_freq = 1000.0  # Current frequency in MHz
         self.stop_freq = 2000.0     # Stop frequency in MHz
         self.dwell_time_ms = 500    # Dwell time in milliseconds
         self.sweep_term = 0.01      # Sweep term for frequency steps
+        self.plan = None            # Compiled SweepPlan the sweep steps through, if loaded
+        self.plan_index = 0         # Step of the plan being measured
         
         # Initial field probe parameters
         self.current_field_level = 0.0
@@ -83,9 +93,16 @@ class FieldController(QObject):
         self.current_y = 0.0
         self.current_z = 0.0
         
+        # Blocking delay used by the sweep; replaceable so a simulated plant can run on a virtual clock
+        self.sleep = sleep
+        self.clock = monotonic
+        
         # Set up logging
         self.log_file_path = self.setup_logging_directory()
         
+        # Per-step record of the leveling loop, saved next to the log when the sweep completes
+        self.trace = ControlTrace()
+        
     def setup_logging_directory(self) -> str:
         """
         Create and return the logging directory path with a log file for current session.
@@ -99,6 +116,22 @@ class FieldController(QObject):
         log_file = os.path.join(log_dir, f"log_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt")
         return log_file
     
+    def save_trace(self) -> str | None:
+        """
+        Save the control trace of the sweep next to the session log and print the slowest steps.
+
+        Returns:
+            str or None: Path of the .npz file, or None if it could not be written.
+        """
+        print(self.trace.summary())
+        path = os.path.join(os.path.dirname(self.log_file_path), f"trace_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.npz")
+        try:
+            self.trace.save(path)
+        except OSError as e:
+            print(f"Unable to save control trace: {str(e)}")
+            return None
+        return path
+        
     def log_warning(self, frequency: float, warning: str):
         """
         Log a warning message to the log file and record the missed frequency.
@@ -121,12 +154,23 @@ class FieldController(QObject):
         self.sweeping_missed = False
         self.missed_frequencies = []
         self.current_freq = self.start_freq
+        self.plan_index = 0
+        if self.plan is not None:
+            # A re-sweep of missed frequencies narrows the range; restore the planned one
+            self.start_freq = self.current_freq = self.plan.frequencies[0]
+            self.stop_freq = self.plan.frequencies[-1]
+        self.model_residual = 0.0
+        self.trace.clear(self.target_field, self.clock())
+        if not self.use_stepper:
+            self.setTargetField(self.target_field)
+            self.pid_controller.setOutputLimits(self.min_power, self.max_power)
+            self.pid_controller.reset(self.base_power)
         
         # Initialize the signal generator to base power and enable RF output and modulation
         self.signal_generator.setPower(self.base_power)
         self.signal_generator.setRFOut(True)
         self.signal_generator.setModulationState(True)
-        sleep(1.0) # Allow power to stabilize
+        self.sleep(1.0) # Allow power to stabilize
         print(f"Starting sweep from {self.start_freq} to {self.stop_freq} with a step term of {self.sweep_term}")
         self.step_sweep()
 
@@ -149,7 +193,7 @@ class FieldController(QObject):
         self.signal_generator.setPower(self.base_power)
         self.signal_generator.setRFOut(True)
         self.signal_generator.setModulationState(True)
-        sleep(0.5) # Wait for power to stabilize
+        self.sleep(0.5) # Wait for power to stabilize
         print(f"Sweeping back through from {self.start_freq} to {self.stop_freq} with a step term of {self.sweep_term}")
         self.step_sweep()
 
@@ -162,11 +206,17 @@ class FieldController(QObject):
             - Advance to the next frequency or end the sweep if completed.
         """
         if self.current_freq <= self.stop_freq and self.is_sweeping:
-            # Set frequency and reset power to base level
-            self.signal_generator.setPower(self.base_power)
+            # Set frequency and starting power: the setup model's prediction if there is one; otherwise the
+            # stepper restarts from base power while the PID carries the last levelled power over
+            predicted_power = self.predictPower(self.current_freq)
+            if predicted_power is not None:
+                self.signal_generator.setPower(predicted_power)
+            elif self.use_stepper:
+                self.signal_generator.setPower(self.base_power)
             self.signal_generator.setFrequency(self.current_freq, Frequency.MHz.value)
             print(f"Current Frequency: {self.current_freq}, Current Power: {self.current_power}")
-            sleep(0.1) # Allow stabilization
+            # Allow stabilization; a predicted power jump needs the probe to catch up
+            self.sleep(0.1 if predicted_power is None else self.settle_time)
             
             # Emit UI updates for frequency and sweep progress
             self.frequencyUpdated.emit(self.current_freq)
@@ -175,6 +225,9 @@ class FieldController(QObject):
             # Adjust power to approach the target field level
             print(f"Adjusting power to target level at {self.current_freq} MHz")
             self.adjust_power_to_target_level()
+            if predicted_power is not None and self.target_field < self.current_field_level < self.target_field * self.threshold:
+                # Carry the model error over: neighbouring frequencies share most of it
+                self.model_residual += self.current_power - predicted_power
             
             # Emit UI updates for power and field measurements
             self.powerUpdated.emit(self.current_power)
@@ -191,6 +244,13 @@ class FieldController(QObject):
                     self.is_sweeping = False
                     return
                 self.current_freq = self.missed_frequencies.pop(0)
+            elif self.plan is not None:
+                self.plan_index += 1
+                if self.plan_index < self.plan.step_count:
+                    self.current_freq = self.plan.frequencies[self.plan_index]
+                else:
+                    print("Last planned step measured; stopping sweep")
+                    self.is_sweeping = False
             else:
                 self.current_freq = self.current_freq + (self.current_freq * self.sweep_term)
                 print("Power adjusted. Moving to next frequency step: ", self.current_freq)
@@ -211,6 +271,7 @@ class FieldController(QObject):
             self.signal_generator.setModulationState(False)
             self.frequencyUpdated.emit(self.current_freq)
             self.sweepStatus.emit(100.0)
+            self.save_trace()
             
     def stop_sweep(self):
         """
@@ -224,7 +285,7 @@ class FieldController(QObject):
         self.signal_generator.setModulationState(False)
         self.signal_generator.setPower(self.base_power)
         if not self.use_stepper:
-            self.pid_controller.clear()
+            self.pid_controller.reset(self.base_power)
             
     def setTargetField(self, target_field: float):
         """
@@ -235,7 +296,98 @@ class FieldController(QObject):
         """
         self.target_field = target_field
         if not self.use_stepper:
-            self.pid_controller.setTargetValue(target_field)
+            # Aim for the middle of the acceptance window (target to target * threshold) in dB
+            self.pid_controller.setTargetValue(self.field_to_db(target_field * math.sqrt(self.threshold)))
+            
+    def setPIDController(self, pid_controller: PID | None):
+        """
+        Switch between PID mode and stepper mode, e.g. once tuned gains are available.
+
+        Parameters:
+            pid_controller (PID or None): The controller to use, or None for stepper mode.
+        """
+        self.use_stepper = pid_controller is None
+        if pid_controller is not None:
+            self.pid_controller = pid_controller
+            self.setTargetField(self.target_field)
+            self.pid_controller.setOutputLimits(self.min_power, self.max_power)
+            
+    def setSetupModel(self, setup_model: SetupModel | None):
+        """
+        Start each step at the power the setup model predicts for the target field, so leveling
+        only corrects the residual. None restores the base power start.
+
+        Parameters:
+            setup_model (SetupModel or None): The model of amplifier, cables and antenna.
+        """
+        self.setup_model = setup_model
+        self.model_residual = 0.0
+        
+    def predictPower(self, frequency: float) -> float | None:
+        """
+        Predict the power that puts the field in the middle of the acceptance window, corrected
+        by the residual of the last converged step.
+
+        Parameters:
+            frequency (float): Frequency in MHz.
+
+        Returns:
+            float or None: Power in dBm within the power limits, or None without a setup model.
+        """
+        index = self.plan.index.get(frequency) if self.plan is not None else None
+        if index is not None and self.plan.unit_power is not None:
+            # Precompiled power for 1 V/m, scaled to the target as power goes with the field squared
+            predicted = float(self.plan.unit_power[index]) + self.field_to_db(self.target_field * math.sqrt(self.threshold))
+        elif self.setup_model is None:
+            return None
+        else:
+            predicted = self.setup_model.powerFor(frequency, self.target_field * math.sqrt(self.threshold))
+        return min(max(predicted + self.model_residual, self.min_power), self.max_power)
+        
+    def setMaxPower(self, max_power: float):
+        """
+        Set the highest generator power the controller may command, e.g. EquipmentLimits.max_power.
+
+        Parameters:
+            max_power (float): Power limit in dBm.
+        """
+        self.max_power = max_power
+        if not self.use_stepper:
+            self.pid_controller.setOutputLimits(self.min_power, max_power)
+
+    def loadPlan(self, plan: SweepPlan):
+        """
+        Sweep through a compiled SweepPlan: its frequencies, dwell, power limit, target and
+        setup model are applied, and each step's starting power is looked up from the plan
+        instead of being interpolated. Setting the start or stop frequency or the sweep term
+        drops the plan again.
+
+        Parameters:
+            plan (SweepPlan): The compiled plan of a validated recipe.
+        """
+        recipe = plan.recipe
+        self.setStartFrequency(plan.frequencies[0])
+        self.setStopFrequency(plan.frequencies[-1])
+        self.setSweepTerm(recipe.term)
+        self.setDwellTime(recipe.dwell, Time.Second.value)
+        self.setMaxPower(recipe.max_power)
+        self.setTargetField(recipe.target)
+        self.setSetupModel(plan.setup_model)
+        self.plan = plan
+        print(f"Loaded sweep plan {recipe.name}: {plan.step_count} steps")
+            
+    def field_to_db(self, field: float) -> float:
+        """
+        Convert a field strength to dB(V/m). The PID works in dB so that its error maps
+        directly onto generator dBm, independent of the target level.
+
+        Parameters:
+            field (float): Field strength in V/m.
+
+        Returns:
+            float: Field strength in dB(V/m), floored at -60 dB for zero readings.
+        """
+        return 20.0 * math.log10(max(field, 0.001))
             
     def getTargetField(self) -> float:
         """
@@ -255,6 +407,7 @@ class FieldController(QObject):
         """
         print(f"Setting start frequency to: {start_freq}")
         self.start_freq = start_freq
+        self.plan = None
         
     def getStartFrequency(self) -> float:
         """
@@ -273,6 +426,7 @@ class FieldController(QObject):
             stop_freq (float): The stop frequency (MHz).
         """
         self.stop_freq = stop_freq
+        self.plan = None
         
     def getStopFrequency(self) -> float:
         """
@@ -307,6 +461,7 @@ class FieldController(QObject):
             sweep_term (float): The relative increase factor for each frequency step.
         """
         self.sweep_term = sweep_term
+        self.plan = None
         
     def log_percentage(self, curr_val, min_val, max_val):
         """
@@ -330,6 +485,8 @@ class FieldController(QObject):
         Returns:
             int: The total number of frequency steps.
         """
+        if self.plan is not None:
+            return self.plan.step_count
         steps = math.log(self.stop_freq / self.start_freq) / math.log(1.0 + self.sweep_term)
         step_count = int(math.ceil(steps))
         return step_count
@@ -352,47 +509,61 @@ class FieldController(QObject):
         a warning is logged and the sweep is aborted.
         """
         power_limit_exceeded = False
+        last_control_time = None
+        exit_reason = ExitReason.CONVERGED
+        self.trace.beginStep(self.current_freq)
+        if not self.use_stepper:
+            # Carry the levelled power of the previous frequency over as the integrator state
+            self.pid_controller.setFrequency(self.current_freq)
+            self.pid_controller.reset(self.signal_generator.getPower())
         while True:
-            sleep(0.005) # Small delay for stabilization (play with this value)
+            self.sleep(0.005) # Small delay for stabilization (play with this value)
             # Blocking call to read the current field level and vector components
             current_field_level, x, y, z = self.field_probe.readCurrentField()
             self.current_field_level = current_field_level
             self.current_x = x
             self.current_y = y
             self.current_z = z
-            
-            print(f"Current Field Level: {current_field_level} V/m")
+            # The power this reading was taken at; steps that converge on the first reading never set it below
+            self.current_power = self.signal_generator.getPower()
+            self.trace.record(self.clock(), self.current_power, current_field_level)
             
             # Check if field level is within acceptable threshold
             if (current_field_level > self.target_field) and (current_field_level < (self.target_field * self.threshold)):
-                print(f"Field level within threshold: {current_field_level}")
                 break
             
             # If field level is excessively high, log warning and break out
             if current_field_level > (self.target_field * 2.0):
+                exit_reason = ExitReason.HIGH_FIELD
                 warning_message = f'Field level exceeded 2x target level: {current_field_level} V/m \n At frequency: {self.current_freq} MHz \n And power: {self.current_power} dBm'
                 self.log_warning(self.current_freq, warning_message)
                 break
             
-            # Update current power from signal generator
-            self.current_power = self.signal_generator.getPower()
-            
             if not self.use_stepper:
-                # Use PID controller to calculate adjustment
-                pid_output = self.pid_controller.calculate(current_field_level)
-                self.signal_generator.setPower(pid_output + self.current_power)
+                # Already measured at the power limit: the target cannot be reached here
+                if self.current_power >= self.max_power and current_field_level < self.target_field:
+                    exit_reason = ExitReason.BELOW_TARGET
+                    warning_message = f'Field level below target level at power limit: {current_field_level} V/m, \n at frequency: {self.current_freq} MHz, \n and power: {self.current_power} dBm'
+                    self.log_warning(self.current_freq, warning_message)
+                    break
+                # PID output is the absolute power in dBm, limited to the equipment maximum
+                now = self.clock()
+                dt = 0.0 if last_control_time is None else now - last_control_time
+                last_control_time = now
+                pid_output = self.pid_controller.calculate(self.field_to_db(current_field_level), dt)
+                self.current_power = self.signal_generator.setPower(pid_output)
+                self.sleep(self.settle_time)
             else:
                 # Stepper mode: incrementally adjust power
                 if current_field_level < self.target_field:
                     self.current_power += 0.1
                 elif current_field_level > (self.target_field * self.threshold):
                     self.current_power -= 1
-                    
-                print(f"Setting power to: {self.current_power}")
                 
                 # Check for power limit and potential hardware issues
-                if self.current_power > 10.0:
+                if self.current_power > self.max_power:
                     if current_field_level <= 0.5:
+                        exit_reason = ExitReason.POWER_LIMIT
                         if not power_limit_exceeded:
                             power_limit_exceeded = True
                             warning_message = f'Power limit exceeded: {self.current_power} dBm at frequency: {self.current_freq} MHz and field level: {current_field_level} V/m. \nAborting sweep. Please check hardware connection.'
@@ -402,12 +573,16 @@ class FieldController(QObject):
                         self.stop_sweep()
                         break
                     else:
+                        exit_reason = ExitReason.BELOW_TARGET
                         warning_message = f'Field level below target level: {current_field_level} V/m, \n at frequency: {self.current_freq} MHz, \n and power: {self.current_power} dBm'
                         self.log_warning(self.current_freq, warning_message)
                         self.current_power = self.base_power
                         self.signal_generator.setPower(self.current_power)
                         # Move to the next frequency step
                         break
-                # Update power setting and log the change
+                # Update power setting
                 self.current_power = self.signal_generator.setPower(self.current_power)
-                print(f"Power set to: {self.current_power}")
\ No newline at end of file
+        self.current_power = self.signal_generator.getPower()
+        self.trace.endStep(exit_reason, self.clock())
+        iterations = self.trace.step_iterations[self.trace.step_count - 1]
+        print(f"Leveling at {self.current_freq} MHz ended after {iterations} iterations: {exit_reason.name.lower()}")
\ No newline at end of file
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Headless Sweep Module
+=====================
+This module runs radiated immunity sweeps without the UI, e.g. overnight campaigns on
+a rack PC without a display. Recipes (see SweepRecipe) are run back to back on a
+QCoreApplication event loop with one FieldController and one connection to each
+instrument for the whole campaign. Every completed step is appended to a CSV file per
+recipe and to the campaign's SweepStore file (campaign.sweep) as it happens, so an
+interrupted campaign keeps everything measured so far.
+
+    python HeadlessSweep.py recipes/low.json recipes/high.json --generator 192.168.100.79 --probe COM7
+    python HeadlessSweep.py recipes/low.json --simulate
+
+Classes:
+    SweepResultWriter: Streams the steps of one sweep to CSV.
+    HeadlessSweepRunner: Runs a list of recipes through a FieldController.
+Functions:
+    connect_instruments: Detect and connect the signal generator and field probe.
+    simulated_instruments: Simulated generator and probe from PlantSimulator.
+"""
+
+import argparse
+import csv
+import os
+import re
+import signal
+import sys
+from datetime import datetime
+from time import monotonic
+
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
+
+from FieldController import FieldController
+from PID import PIDController
+from PIDAutoTune import PIDGainStore
+from SignalGenerator import Modulation
+from SweepRecipe import SweepRecipe
+from SweepStore import SweepStore
+
+
+class SweepResultWriter:
+    """
+    Appends one CSV row per completed sweep step and flushes it immediately.
+    """
+
+    HEADER = ['Time', 'Frequency (MHz)', 'Power (dBm)', 'Composite (V/m)', 'X (V/m)', 'Y (V/m)', 'Z (V/m)', 'Target (V/m)']
+
+    def __init__(self, path: str):
+        """
+        Create the file and write the header.
+
+        Parameters:
+            path (str): CSV file to create.
+        """
+        self.path = path
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.HEADER)
+        self.file.flush()
+        self.rows = 0
+
+    def write(self, frequency: float, power: float, composite: float, x: float, y: float, z: float, target: float):
+        """
+        Append one step.
+        """
+        self.writer.writerow([datetime.now().isoformat(timespec='milliseconds'), f'{frequency:.6f}', f'{power:.3f}',
+                              f'{composite:.4f}', f'{x:.4f}', f'{y:.4f}', f'{z:.4f}', f'{target:g}'])
+        self.file.flush()
+        self.rows += 1
+
+    def close(self):
+        self.file.close()
+
+
+class HeadlessSweepRunner(QObject):
+    """
+    Runs recipes one after the other. The FieldController is driven as in the UI: each
+    startDwell schedules the next step on the event loop, so probe and generator signals
+    keep being delivered while a sweep runs.
+    """
+
+    recipeStarted = pyqtSignal(str)
+    recipeCompleted = pyqtSignal(str, str)
+    campaignCompleted = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, signal_generator, field_probe, output_dir: str, realtime: bool = True):
+        """
+        Initialize the runner.
+
+        Parameters:
+            signal_generator: Connected AgilentN5181A (or SimulatedSignalGenerator).
+            field_probe: Started ETSLindgrenHI6006 (or SimulatedFieldProbe).
+            output_dir (str): Directory for the campaign's result files.
+            realtime (bool): Wait for dwell times on the event loop; False uses the
+                controller's sleep, e.g. a simulated clock.
+        """
+        super().__init__()
+        self.signal_generator = signal_generator
+        self.field_probe = field_probe
+        self.output_dir = output_dir
+        self.realtime = realtime
+        self.gain_store = PIDGainStore()
+        self.pid_controller = PIDController(0.5, 5.0, 0.0)
+        self.controller = FieldController(signal_generator, field_probe, None)
+        self.controller.fieldUpdated.connect(self.on_fieldUpdated)
+        self.controller.powerUpdated.connect(self.on_powerUpdated)
+        self.controller.sweepStatus.connect(self.on_sweepStatus)
+        self.controller.sweepCompleted.connect(self.on_sweepCompleted)
+        self.controller.startDwell.connect(self.on_startDwell)
+        self.controller.highFieldDetected.connect(self.error.emit)
+        self.controller.powerLimitExceeded.connect(self.error.emit)
+        self.recipes = []
+        self.index = -1
+        self.recipe = None
+        self.writer = None
+        self.power = 0.0
+        self.retried = False
+        self.results = []
+        self.last_status = -10.0
+        self.store = None
+        # Pending re-sweep of missed frequencies; stop() cancels it
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self.retry_missed)
+
+    def run(self, recipes: list[SweepRecipe]):
+        """
+        Start the campaign; campaignCompleted is emitted after the last recipe.
+
+        Parameters:
+            recipes (list): The recipes, in run order.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.recipes = list(recipes)
+        self.index = -1
+        self.results = []
+        self.store = SweepStore(os.path.join(self.output_dir, 'campaign.sweep'), info={'recipes': len(self.recipes)})
+        QTimer.singleShot(0, self.start_next)
+
+    def stop(self):
+        """
+        Abort the running sweep and the rest of the campaign.
+        """
+        self.recipes = self.recipes[:self.index + 1]
+        self.retry_timer.stop()
+        self.controller.stop_sweep()
+        self.finish_recipe(aborted=True)
+
+    def apply_recipe(self, recipe: SweepRecipe):
+        """
+        Configure the controller with the recipe's compiled plan and the generator's modulation.
+
+        Parameters:
+            recipe (SweepRecipe): The recipe.
+        """
+        controller = self.controller
+        plan = recipe.plan()
+        if plan.unreachable:
+            print(f'  The setup model predicts more than {recipe.max_power:g} dBm for {recipe.target:g} V/m at '
+                  f'{len(plan.unreachable)} frequencies from {plan.unreachable[0]:g} MHz')
+        if recipe.pid == 'tuned':
+            schedule = self.gain_store.get(recipe.setupName())
+        elif recipe.pid is None or recipe.pid == 'stepper':
+            schedule = None
+        else:
+            schedule = False
+            self.pid_controller.setGainSchedule(None)
+            self.pid_controller.setGains(*recipe.pid)
+            controller.setPIDController(self.pid_controller)
+        if schedule is None:
+            controller.setPIDController(None)
+        elif schedule is not False:
+            self.pid_controller.setGainSchedule(schedule)
+            self.pid_controller.setGains(*schedule.default)
+            controller.setPIDController(self.pid_controller)
+        self.pid_controller.clock = controller.clock
+        # Frequencies, limits, target and the predicted power of every step come precompiled
+        controller.loadPlan(plan)
+        modulation = recipe.modulation
+        self.signal_generator.setModulationType(Modulation.AM)
+        self.signal_generator.setAMType(True)
+        self.signal_generator.setAMLinearDepth(float(modulation['depth']))
+        self.signal_generator.setAMFrequency(float(modulation['frequency']))
+        # The controller turns modulation on for the sweep; without AM that leaves a CW carrier
+        self.signal_generator.setAMState(bool(modulation['enabled']))
+
+    def start_next(self):
+        self.index += 1
+        if self.index >= len(self.recipes):
+            self.store.close()
+            self.campaignCompleted.emit(self.results)
+            return
+        self.recipe = self.recipes[self.index]
+        name = re.sub(r'[^\w.-]+', '_', self.recipe.name).strip('_')
+        path = os.path.join(self.output_dir, f'{self.index + 1:02d}_{name}.csv')
+        try:
+            self.writer = SweepResultWriter(path)
+            self.apply_recipe(self.recipe)
+            self.store.beginSweep(self.recipe.to_dict())
+        except (OSError, ValueError, TypeError) as e:
+            self.error.emit(f'{self.recipe.name}: {str(e)}')
+            self.results.append((self.recipe.name, None, []))
+            QTimer.singleShot(0, self.start_next)
+            return
+        self.retried = False
+        self.last_status = -10.0
+        print(f'[{self.index + 1}/{len(self.recipes)}] {self.recipe.name}: {self.recipe.start:g}-{self.recipe.stop:g} MHz '
+              f'at {self.recipe.target:g} V/m, {self.controller.getStepCount()} steps')
+        self.recipeStarted.emit(self.recipe.name)
+        self.controller.start_sweep()
+
+    def on_startDwell(self, dwell_ms: int):
+        if self.realtime:
+            QTimer.singleShot(dwell_ms, self.step)
+        else:
+            self.controller.sleep(dwell_ms / 1000.0)
+            QTimer.singleShot(0, self.step)
+
+    def step(self):
+        if self.recipe is not None:
+            self.controller.step_sweep()
+
+    def on_powerUpdated(self, power: float):
+        self.power = power
+
+    def on_fieldUpdated(self, composite: float, x: float, y: float, z: float):
+        if self.writer is not None:
+            frequency = self.controller.current_freq
+            target = self.controller.getTargetField()
+            # The power the field was measured at, as logged by the leveling loop
+            power, iterations, status = self.controller.trace.stepResult()
+            power = self.power if power is None else power
+            self.writer.write(frequency, power, composite, x, y, z, target)
+            self.store.append(frequency, power, composite, x, y, z, target, iterations, status)
+
+    def on_sweepStatus(self, percent: float):
+        if percent >= self.last_status + 10.0:
+            self.last_status = percent - percent % 10.0
+            print(f'  {percent:.0f} %')
+
+    def on_sweepCompleted(self, missed: list):
+        # Emitted from inside step_sweep before the controller resets its state, so continue from the event loop
+        if missed and self.recipe.retry_missed and not self.retried:
+            self.retried = True
+            print(f'  {len(missed)} frequencies missed the target; sweeping them again')
+            self.store.beginSweep({'name': self.recipe.name, 'retry_missed': True})
+            self.retry_timer.start(0)
+        else:
+            QTimer.singleShot(0, self.finish_recipe)
+
+    def retry_missed(self):
+        if self.recipe is not None:
+            self.controller.sweep_missed_frequencies()
+
+    def finish_recipe(self, aborted: bool = False):
+        if self.recipe is None:
+            return
+        missed = list(self.controller.missed_frequencies)
+        path = self.writer.path
+        self.writer.close()
+        self.writer = None
+        try:
+            self.controller.trace.save(os.path.splitext(path)[0] + '_trace.npz')
+        except OSError as e:
+            self.error.emit(f'Unable to save control trace: {str(e)}')
+        print(f'  {"aborted" if aborted else "done"}: {self.controller.trace.step_count} steps, '
+              f'{len(missed)} missed -> {path}')
+        self.results.append((self.recipe.name, path, missed))
+        self.recipeCompleted.emit(self.recipe.name, path)
+        self.recipe = None
+        QTimer.singleShot(0, self.start_next)
+
+
+def connect_instruments(generator_ip: str, probe_port: str, timeout: float = 30.0):
+    """
+    Detect and connect the signal generator and start the field probe.
+
+    Parameters:
+        generator_ip (str): Generator address; its /24 subnet is searched if it moved.
+        probe_port (str): Serial port of the field probe.
+        timeout (float): Seconds to search for the generator.
+
+    Returns:
+        tuple: (AgilentN5181A, ETSLindgrenHI6006).
+
+    Raises:
+        RuntimeError: If an instrument cannot be reached.
+    """
+    import concurrent.futures
+    from FieldProbe import ETSLindgrenHI6006
+    from SignalGenerator import AgilentN5181A
+
+    generator = AgilentN5181A(generator_ip)
+    generator.detect()
+    try:
+        found = generator.detect_future.result(timeout)
+    except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+        found = None
+    generator.stopDetection()
+    if found is None:
+        raise RuntimeError(f'Signal generator not found at {generator_ip} within {timeout:g} s')
+    generator.connect()
+    if not generator.is_running:
+        raise RuntimeError(f'Unable to connect to the signal generator at {generator.ip_address}')
+    generator.setRFOut(False)
+    generator.setModulationState(False)
+    generator.setPower(-30.0)
+    probe = ETSLindgrenHI6006(probe_port)
+    probe.start()
+    if not probe.is_running:
+        generator.stop()
+        raise RuntimeError(f'Unable to open the field probe on {probe_port}')
+    return generator, probe
+
+
+def simulated_instruments(controller_options: dict):
+    """
+    Build a simulated generator and probe on a virtual clock.
+
+    Parameters:
+        controller_options (dict): Filled with the 'sleep' and 'clock' the controller must use.
+
+    Returns:
+        tuple: (SimulatedSignalGenerator, SimulatedFieldProbe).
+    """
+    from PlantSimulator import PlantModel, SimulatedFieldProbe, SimulatedSignalGenerator, VirtualClock
+
+    clock = VirtualClock()
+    generator = SimulatedSignalGenerator(clock)
+    probe = SimulatedFieldProbe(clock, PlantModel(), generator)
+    controller_options['sleep'] = clock.sleep
+    controller_options['clock'] = clock.time
+    return generator, probe
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Run radiated immunity sweep recipes without the UI')
+    parser.add_argument('recipes', nargs='+', help='Recipe JSON or TOML files, run in order')
+    parser.add_argument('--generator', default='192.168.100.79', help='Signal generator IP address')
+    parser.add_argument('--probe', default='COM7', help='Field probe serial port')
+    parser.add_argument('--output', default=os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "Campaigns"),
+                        help='Directory for the campaign folder')
+    parser.add_argument('--simulate', action='store_true', help='Run against the simulated plant of PlantSimulator')
+    args = parser.parse_args()
+
+    recipes = []
+    for path in args.recipes:
+        try:
+            recipes.extend(SweepRecipe.load(path))
+        except (OSError, ValueError) as e:
+            print(f'Invalid recipe file {path}: {str(e)}')
+            return 2
+
+    app = QCoreApplication(sys.argv)
+    controller_options = {}
+    try:
+        if args.simulate:
+            generator, probe = simulated_instruments(controller_options)
+        else:
+            generator, probe = connect_instruments(args.generator, args.probe)
+    except RuntimeError as e:
+        print(str(e))
+        return 2
+
+    output_dir = os.path.join(args.output, datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
+    runner = HeadlessSweepRunner(generator, probe, output_dir, realtime=not args.simulate)
+    for name, value in controller_options.items():
+        setattr(runner.controller, name, value)
+    runner.error.connect(lambda message: print(f'  Warning: {message}'))
+    results = []
+
+    def on_campaign_completed(campaign: list):
+        results.extend(campaign)
+        app.quit()
+
+    runner.campaignCompleted.connect(on_campaign_completed)
+    # Python only handles Ctrl+C between Qt events; a periodic no-op timer provides them
+    signal.signal(signal.SIGINT, lambda *args: runner.stop())
+    interrupt_timer = QTimer()
+    interrupt_timer.timeout.connect(lambda: None)
+    interrupt_timer.start(250)
+
+    started = monotonic()
+    runner.run(recipes)
+    app.exec_()
+    if not args.simulate:
+        # Whatever was pending when the campaign ended, leave the generator off
+        generator.setRFOut(False)
+        generator.setModulationState(False)
+        generator.stop()
+        probe.stop()
+    print(f'Campaign finished in {monotonic() - started:.0f} s: {output_dir}')
+    failed = [name for name, path, missed in results if path is None or missed]
+    for name, path, missed in results:
+        print(f'  {name}: {"failed" if path is None else f"{len(missed)} missed"}')
+    return 1 if failed or len(results) < len(recipes) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Icon Cache Module
+=================
+This module serves the status and device images of the UI from the compiled Qt
+resource bundle (registered on first use by ResourceLoader). Each image is decoded once
+per process, and each scaled size is produced once and kept, so setting a status icon
+costs a dictionary lookup instead of disk I/O and image scaling on the GUI thread.
+
+Classes:
+    IconCache: Process-wide cache of decoded and scaled pixmaps.
+"""
+
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+
+from ResourceLoader import register_resources
+
+
+class IconCache:
+    """
+    Process-wide pixmap cache. Images are looked up as :/icons/<name> and, if they are
+    not in the bundle, as files next to this module.
+    """
+
+    PREFIX = ':/icons/'
+    originals = {}
+    scaled = {}
+
+    @classmethod
+    def original(cls, name: str) -> QPixmap:
+        """
+        Parameters:
+            name (str): Image file name, e.g. 'broadcast-on.png'.
+
+        Returns:
+            QPixmap: The unscaled image; a null pixmap if it cannot be found.
+        """
+        pixmap = cls.originals.get(name)
+        if pixmap is None:
+            register_resources()
+            pixmap = QPixmap(cls.PREFIX + name)
+            if pixmap.isNull():
+                print(f'Icon {name} not in resources; loading from file')
+                pixmap = QPixmap(os.path.join(os.path.dirname(os.path.abspath(__file__)), name))
+            cls.originals[name] = pixmap
+        return pixmap
+
+    @classmethod
+    def pixmap(cls, name: str, width: int, height: int) -> QPixmap:
+        """
+        The image scaled to fit a box, keeping its aspect ratio.
+
+        Parameters:
+            name (str): Image file name.
+            width (int): Box width in pixels.
+            height (int): Box height in pixels.
+
+        Returns:
+            QPixmap: The scaled image.
+        """
+        key = (name, width, height)
+        pixmap = cls.scaled.get(key)
+        if pixmap is None:
+            pixmap = cls.original(name).scaled(width, height, Qt.KeepAspectRatio, Qt.FastTransformation)
+            cls.scaled[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def clear(cls):
+        """
+        Drop every cached pixmap.
+        """
+        cls.originals.clear()
+        cls.scaled.clear()
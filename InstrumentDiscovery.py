@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Instrument Discovery Module
+===========================
+This module finds SCPI instruments on the LAN by opening TCP connections to the
+SCPI socket port and asking each responder for its identity (*IDN?). Hosts are
+probed concurrently on the shared asyncio loop and the whole scan is bounded in
+time, so a changed IP address no longer means retrying one dead address forever.
+Unlike ICMP ping this needs no raw-socket privileges.
+
+The last address an instrument answered on is remembered, so the next startup can
+try it first and skip the scan.
+
+Classes:
+    DiscoveredInstrument: Address and identity of a responding instrument.
+    DiscoveryCache: Persistent store of the last good address per model.
+Functions:
+    expand_hosts: Expand host names, addresses and subnets into a host list.
+    probe_host: Ask a single host for its identity.
+    discover: Probe many hosts in parallel within a time bound.
+    discover_instrument: Find one instrument model, trying the cached address first.
+"""
+
+import asyncio
+import ipaddress
+import json
+import os
+
+from SCPIClient import AsyncSCPIClient, SCPIError
+
+SCPI_PORT = 5025
+
+
+class DiscoveredInstrument:
+    """
+    Address and identity of an instrument that answered *IDN?.
+
+    Attributes:
+        host (str): IP address or host name.
+        port (int): SCPI socket port.
+        identity (str): The raw *IDN? reply.
+    """
+
+    def __init__(self, host: str, port: int, identity: str):
+        self.host = host
+        self.port = port
+        self.identity = identity
+
+    @property
+    def manufacturer(self) -> str:
+        """
+        Returns:
+            str: The manufacturer field of the identity string.
+        """
+        return self._field(0)
+
+    @property
+    def model(self) -> str:
+        """
+        Returns:
+            str: The model field of the identity string.
+        """
+        return self._field(1)
+
+    def _field(self, index: int) -> str:
+        fields = self.identity.split(',')
+        return fields[index].strip() if len(fields) > index else ''
+
+    def __repr__(self):
+        return f'DiscoveredInstrument({self.host}:{self.port}, {self.identity!r})'
+
+
+class DiscoveryCache:
+    """
+    Persistent store of the last address each instrument model answered on.
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        Initialize the cache.
+
+        Parameters:
+            path (str or None): JSON file to use. Defaults to ~/Documents/ImmuniSweep/instruments.json.
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "instruments.json")
+        self.path = path
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, model: str) -> tuple[str, int] | None:
+        """
+        Return the last good address of a model.
+
+        Parameters:
+            model (str): Model name, e.g. 'N5181A'.
+
+        Returns:
+            tuple or None: (host, port), or None if the model was never found.
+        """
+        entry = self._load().get(model)
+        if not entry:
+            return None
+        return entry['host'], int(entry['port'])
+
+    def put(self, model: str, instrument: DiscoveredInstrument):
+        """
+        Remember the address a model answered on.
+
+        Parameters:
+            model (str): Model name used as the key.
+            instrument (DiscoveredInstrument): The instrument that answered.
+        """
+        entries = self._load()
+        entries[model] = {'host': instrument.host, 'port': instrument.port, 'identity': instrument.identity}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as file:
+                json.dump(entries, file, indent=2)
+        except OSError as e:
+            print(f'Unable to save instrument cache: {str(e)}')
+
+
+def expand_hosts(hosts) -> list[str]:
+    """
+    Expand a host specification into a list of unique hosts, keeping the given order.
+
+    Parameters:
+        hosts (str or iterable): Host names, IP addresses or subnets such as '192.168.100.0/24'.
+
+    Returns:
+        list: The individual hosts to probe.
+    """
+    if isinstance(hosts, str):
+        hosts = [hosts]
+    expanded = []
+    seen = set()
+    for entry in hosts:
+        entry = entry.strip()
+        if '/' in entry:
+            candidates = [str(address) for address in ipaddress.ip_network(entry, strict=False).hosts()]
+        else:
+            candidates = [entry]
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                expanded.append(candidate)
+    return expanded
+
+
+async def probe_host(host: str, port: int = SCPI_PORT, timeout: float = 0.5) -> DiscoveredInstrument | None:
+    """
+    Connect to a host's SCPI port and read its identity.
+
+    Parameters:
+        host (str): Host to probe.
+        port (int): SCPI socket port.
+        timeout (float): Connect and reply timeout in seconds.
+
+    Returns:
+        DiscoveredInstrument or None: The instrument, or None if nothing answered.
+    """
+    client = AsyncSCPIClient(host, port, timeout, reconnect_attempts=1)
+    try:
+        identity = await client.query('*IDN?')
+        return DiscoveredInstrument(host, port, identity) if identity else None
+    except SCPIError:
+        return None
+    finally:
+        await client.close()
+
+
+async def discover(hosts, ports=(SCPI_PORT,), timeout: float = 0.5, total_timeout: float = 3.0,
+                   concurrency: int = 64) -> list[DiscoveredInstrument]:
+    """
+    Probe every host and port in parallel and return all instruments that answered.
+
+    Parameters:
+        hosts (str or iterable): Hosts or subnets, see expand_hosts.
+        ports (iterable): SCPI ports to try on each host.
+        timeout (float): Per-host connect and reply timeout in seconds.
+        total_timeout (float): Upper bound for the whole scan in seconds.
+        concurrency (int): Maximum number of simultaneous connection attempts.
+
+    Returns:
+        list: The responding instruments, in the order of the host list.
+    """
+    targets = [(host, port) for host in expand_hosts(hosts) for port in ports]
+    if not targets:
+        return []
+    limit = asyncio.Semaphore(concurrency)
+
+    async def bounded(host, port):
+        async with limit:
+            return await probe_host(host, port, timeout)
+
+    tasks = [asyncio.ensure_future(bounded(host, port)) for host, port in targets]
+    done, pending = await asyncio.wait(tasks, timeout=total_timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    return [task.result() for task in tasks if task in done and not task.cancelled() and task.exception() is None and task.result() is not None]
+
+
+async def discover_instrument(model: str, hosts, ports=(SCPI_PORT,), timeout: float = 0.5, total_timeout: float = 3.0,
+                              cache: DiscoveryCache | None = None) -> DiscoveredInstrument | None:
+    """
+    Find an instrument of the given model, trying its last good address before scanning.
+
+    Parameters:
+        model (str): Model name to look for in the identity string, e.g. 'N5181A'.
+        hosts (str or iterable): Hosts or subnets to scan if the cached address fails.
+        ports (iterable): SCPI ports to try.
+        timeout (float): Per-host timeout in seconds.
+        total_timeout (float): Upper bound for the scan in seconds.
+        cache (DiscoveryCache or None): Address cache. Defaults to the user cache file.
+
+    Returns:
+        DiscoveredInstrument or None: The instrument, or None if it was not found.
+    """
+    cache = cache if cache is not None else DiscoveryCache()
+    last = cache.get(model)
+    if last is not None:
+        instrument = await probe_host(last[0], last[1], timeout)
+        if instrument is not None and model in instrument.identity:
+            return instrument
+    for instrument in await discover(hosts, ports, timeout, total_timeout):
+        if model in instrument.identity:
+            cache.put(model, instrument)
+            return instrument
+    return None
@@ -1,66 +1,158 @@
+"""
+Live Plot Module
+================
+This module provides the matplotlib versions of the live sweep plots. Figures are
+created directly with Figure() instead of through pyplot, so nothing but the canvas
+keeps them alive, and release() frees them when the plot is discarded.
+
+Updates are blitted: the axes, labels and legend are drawn once into a cached
+background, and each update restores that background and redraws only the data lines.
+A full redraw happens only when the axis limits or the canvas size change. Plots given
+a RefreshScheduler from LivePlotGraph are blitted at most once per frame.
+
+RadiatedImmunity uses these plots when the matplotlib backend is selected in its menu,
+and releases them when the backend is switched or the window closes.
+
+Classes:
+    BlitCanvas: Qt canvas that redraws only its animated artists.
+    FrequencyPlot: Frequency versus elapsed time.
+    PowerPlot: Setpoint and composite/x/y/z field versus frequency.
+"""
+
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
-class FrequencyPlot(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        # Create a Figure and Canvas
-        plt.ion()
-        self.fig, self.ax = plt.subplots()
+
+class BlitCanvas(FigureCanvas):
+    """
+    Figure canvas with one axes whose animated artists are blitted over a cached
+    background.
+    """
+
+    def __init__(self, parent=None, width=5, height=4, dpi=100, scheduler=None):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        self.ax = self.fig.add_subplot()
         super().__init__(self.fig)
         self.setParent(parent)
-        
+        self.scheduler = scheduler
+        self.animated = []
+        self.background = None
+        self.draw_cid = self.mpl_connect('draw_event', self.on_draw)
+
+    def animate(self, *artists):
+        """
+        Exclude artists from the background; they are drawn on every blit.
+        """
+        for artist in artists:
+            artist.set_animated(True)
+            self.animated.append(artist)
+
+    def on_draw(self, event):
+        # A full draw just happened: cache it without the animated artists, then draw them on top
+        self.background = self.copy_from_bbox(self.fig.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        for artist in self.animated:
+            self.ax.draw_artist(artist)
+
+    def redraw_full(self):
+        """
+        Redraw everything and cache a new background, e.g. after the axis limits changed.
+        """
+        self.background = None
+        self.draw_idle()
+
+    def blit_update(self):
+        """
+        Redraw only the animated artists over the cached background.
+        """
+        if self.background is None or self.background.get_extents() != tuple(int(v) for v in self.fig.bbox.extents):
+            self.redraw_full()
+            return
+        self.restore_region(self.background)
+        self.draw_animated()
+        self.blit(self.fig.bbox)
+
+    def request_redraw(self):
+        if self.scheduler is None:
+            self.blit_update()
+        else:
+            self.scheduler.markDirty(self)
+
+    def redraw(self):
+        self.blit_update()
+
+    def resizeEvent(self, event):
+        self.background = None
+        super().resizeEvent(event)
+
+    def release(self):
+        """
+        Free the figure; the plot cannot be used afterwards.
+        """
+        if self.scheduler is not None:
+            self.scheduler.discard(self)
+        self.mpl_disconnect(self.draw_cid)
+        self.background = None
+        self.animated.clear()
+        self.fig.clear()
+        self.setParent(None)
+        self.deleteLater()
+
+
+class FrequencyPlot(BlitCanvas):
+    def __init__(self, parent=None, width=5, height=4, dpi=100, scheduler=None):
+        super().__init__(parent, width, height, dpi, scheduler)
+
         # Data to plot
         self.x_data = []
         self.y_data = []
-        
+
         self.line, = self.ax.plot(self.x_data, self.y_data, '-g')
-        
+        self.animate(self.line)
+
         self.ax.set_xlabel('Time (s)')
         self.ax.set_ylabel('Frequency (MHz)')
         self.ax.set_title('Frequency Sweep')
-        
+
 
     def init_plot(self, x_min: float = 0.0, x_max: float = 100.0, y_min: float = 0.0, y_max: float = 500.0):
         print("Initializing plot: x_min = {}, x_max = {}, y_min = {}, y_max = {}".format(x_min, x_max, y_min, y_max))
         self.ax.set_xlim(x_min, x_max)
         self.ax.set_ylim(y_min, y_max)
         self.line.set_data(self.x_data, self.y_data)
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw_idle()
+        self.redraw_full()
         return self.line,
 
     def update_plot(self, time: float, freq: float):
-        #print("Updating plot: x = {}, y = {}".format(x, y))
         self.x_data.append(time)
         self.y_data.append(freq)
-        if (time > self.ax.get_xlim()[1]):
-            self.ax.set_xlim(self.x_data[0], self.x_data[-1] + 0.1)
         self.line.set_data(self.x_data, self.y_data)
-        self.ax.relim()
-        self.ax.autoscale_view()
-
-        self.draw_idle()
+        # Extend the time axis by a quarter at a time; only then is the background redrawn
+        x_min, x_max = self.ax.get_xlim()
+        if time > x_max:
+            self.ax.set_xlim(x_min, x_min + 1.25 * (time - x_min))
+            self.redraw_full()
+        else:
+            self.request_redraw()
         return self.line,
-    
+
+    def sample_count(self) -> int:
+        return len(self.x_data)
+
     def clear_plot(self):
         print("Clearing plot")
         self.x_data.clear()
         self.y_data.clear()
         self.line.set_data(self.x_data, self.y_data)
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw_idle()
+        self.blit_update()
         return self.line,
-    
-class PowerPlot(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        # Create a Figure and Canvas
-        plt.ion()
-        self.fig, self.ax = plt.subplots()
-        super().__init__(self.fig)
-        self.setParent(parent)
-        
+
+class PowerPlot(BlitCanvas):
+    def __init__(self, parent=None, width=5, height=4, dpi=100, scheduler=None):
+        super().__init__(parent, width, height, dpi, scheduler)
+
         # Data to plot
         self.freq_data = []
         self.setpoint_data = []
@@ -68,33 +160,30 @@ class PowerPlot(FigureCanvas):
         self.x_data = []
         self.y_data = []
         self.z_data = []
-        
+
         self.line1, = self.ax.plot(self.freq_data, self.setpoint_data, '-b', label='Setpoint')
         self.line2, = self.ax.plot(self.freq_data, self.composite_data, '-r', label='Composite')
         self.line3, = self.ax.plot(self.freq_data, self.x_data, '-g', label='X')
         self.line4, = self.ax.plot(self.freq_data, self.y_data, '-c', label='Y')
         self.line5, = self.ax.plot(self.freq_data, self.z_data, '-y', label='Z')
-        
+        self.animate(self.line1, self.line2, self.line3, self.line4, self.line5)
+
         self.ax.set_xlim(0, 10)
         self.ax.set_ylim(0, 10)
-        self.ax.relim()
-        self.ax.autoscale_view()
         self.ax.set_xlabel('Frequency (MHz)')
         self.ax.set_ylabel('E-Field (V/m)')
         self.ax.set_title('Field Strength')
         self.ax.legend()
-        self.draw_idle()
-        
+        self.redraw_full()
+
 
     def rescale_plot(self, x_min: float = 0.0, x_max: float = 10.0, y_min: float = 0.0, y_max: float = 10.0):
         print("Rescaling plot: x_min = {}, x_max = {}, y_min = {}, y_max = {}".format(x_min, x_max, y_min, y_max))
         self.ax.set_xlim(x_min, x_max)
         self.ax.set_ylim(y_min, y_max)
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw_idle()
+        self.redraw_full()
         return self.line1, self.line2, self.line3, self.line4, self.line5
-    
+
     def clear_plot(self):
         print("Clearing plot")
         self.freq_data.clear()
@@ -103,40 +192,24 @@ class PowerPlot(FigureCanvas):
         self.x_data.clear()
         self.y_data.clear()
         self.z_data.clear()
-        
-        #self.ax.set_xlim(0, self.ax.get_xlim()[1] - self.ax.get_xlim()[0])
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw_idle()
+        self.set_line_data()
+        self.blit_update()
         return self.line1, self.line2, self.line3, self.line4, self.line5
 
+    def set_line_data(self):
+        self.line1.set_data(self.freq_data, self.setpoint_data)
+        self.line2.set_data(self.freq_data, self.composite_data)
+        self.line3.set_data(self.freq_data, self.x_data)
+        self.line4.set_data(self.freq_data, self.y_data)
+        self.line5.set_data(self.freq_data, self.z_data)
+
     def update_plot(self, freq: float, setpoint: float, composite: float, x: float, y: float, z: float):
-        print("Updating plot: freq = {}, setpoint = {}, composite = {}, x = {}, y = {}, z = {}".format(freq, setpoint, composite, x, y, z))
         self.freq_data.append(freq)
         self.setpoint_data.append(setpoint)
         self.composite_data.append(composite)
         self.x_data.append(x)
         self.y_data.append(y)
         self.z_data.append(z)
-        '''
-        if (freq > self.ax.get_xlim()[1]):
-            self.freq_data.pop(0)
-            self.setpoint_data.pop(0)
-            self.composite_data.pop(0)
-            self.x_data.pop(0)
-            self.y_data.pop(0)
-            self.z_data.pop(0)
-            self.ax.set_xlim(self.freq_data[0], self.freq_data[-1] + 0.1)
-        '''    
-        self.line1.set_data(self.freq_data, self.setpoint_data)
-        self.line2.set_data(self.freq_data, self.composite_data)
-        self.line3.set_data(self.freq_data, self.x_data)
-        self.line4.set_data(self.freq_data, self.y_data)
-        self.line5.set_data(self.freq_data, self.z_data)
-        
-        self.ax.relim()
-        self.ax.autoscale_view()
-
-        self.draw_idle()
-        
-        return self.line1, self.line2, self.line3, self.line4, self.line5
\ No newline at end of file
+        self.set_line_data()
+        self.request_redraw()
+        return self.line1, self.line2, self.line3, self.line4, self.line5
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Live Plot Graph Module
+======================
+This module is a pyqtgraph backend for the live sweep plots, with the same interface as
+the matplotlib plots in LivePlot. Data is kept in growable preallocated NumPy buffers
+instead of Python lists, and the lines are handed views of those buffers, so an update
+copies no history. The axis ranges are fixed from the frequency plan rather than
+recomputed from the data, and pyqtgraph repaints only the plot item, so a long sweep
+plots as smoothly as a short one.
+
+The buffers keep every sample, but the lines draw a min/max decimated view of about
+two points per screen pixel. Complete buckets are reduced once as samples arrive, and
+merged pairwise when their number doubles, so the per-update cost does not grow with
+the sweep length. A zoomed view is decimated from the full-resolution samples in range.
+
+Plots given a RefreshScheduler do not redraw on every update: they are marked dirty,
+and the scheduler redraws each dirty plot once at the next frame, so a burst of
+telemetry costs one repaint and an idle plot costs none.
+
+Classes:
+    PlotBuffer: Growable preallocated columns of float samples.
+    MinMaxDecimator: Incremental min/max decimation of one buffer column.
+    RefreshScheduler: Coalesces plot redraws to at most one per frame.
+    FrequencyPlot: Frequency versus elapsed time.
+    PowerPlot: Setpoint and composite/x/y/z field versus frequency.
+"""
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QObject, QTimer
+
+
+class PlotBuffer:
+    """
+    Columns of float samples in one preallocated array that doubles when full.
+
+    Attributes:
+        data (np.ndarray): columns x capacity array; only the first count samples are valid.
+        count (int): Number of samples.
+    """
+
+    def __init__(self, columns: int, capacity: int = 1024):
+        """
+        Initialize an empty buffer.
+
+        Parameters:
+            columns (int): Number of values per sample.
+            capacity (int): Samples to preallocate.
+        """
+        self.data = np.zeros((columns, capacity))
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, *values: float):
+        """
+        Append one sample, growing the buffer if it is full.
+
+        Parameters:
+            *values (float): One value per column.
+        """
+        if self.count == self.data.shape[1]:
+            grown = np.zeros((self.data.shape[0], 2 * self.data.shape[1]))
+            grown[:, :self.count] = self.data[:, :self.count]
+            self.data = grown
+        self.data[:, self.count] = values
+        self.count += 1
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        Parameters:
+            index (int): Column index.
+
+        Returns:
+            np.ndarray: A view of the valid samples of the column.
+        """
+        return self.data[index, :self.count]
+
+    def clear(self):
+        """
+        Drop all samples, keeping the allocation.
+        """
+        self.count = 0
+
+
+class MinMaxDecimator:
+    """
+    Min/max decimation of a y column against an x column of a PlotBuffer. Each bucket of
+    consecutive samples is drawn as its minimum and maximum in sample order, so peaks
+    survive at any zoom level.
+    """
+
+    def __init__(self, buffer: PlotBuffer, x_column: int, y_column: int, buckets: int = 1000):
+        """
+        Initialize the decimator.
+
+        Parameters:
+            buffer (PlotBuffer): The full-resolution samples.
+            x_column (int): Column of the x values.
+            y_column (int): Column of the y values.
+            buckets (int): Bucket count to aim for, about the plot width in pixels.
+        """
+        self.buffer = buffer
+        self.x_column = x_column
+        self.y_column = y_column
+        self.buckets = buckets
+        self.clear()
+
+    def clear(self):
+        """
+        Forget all buckets, e.g. after the buffer was cleared.
+        """
+        # Sample indices of each complete bucket's minimum and maximum
+        self.bucket_min = np.zeros(0, dtype=np.int64)
+        self.bucket_max = np.zeros(0, dtype=np.int64)
+        self.bucket_size = 1
+        self.x_monotonic = True
+        self.checked = 0
+
+    def setBuckets(self, buckets: int):
+        """
+        Change the bucket count, e.g. when the plot is resized.
+
+        Parameters:
+            buckets (int): Bucket count to aim for.
+        """
+        buckets = max(buckets, 16)
+        if buckets != self.buckets:
+            self.buckets = buckets
+            self.clear()
+
+    def update(self):
+        """
+        Reduce the samples appended since the last call into complete buckets.
+        """
+        count = len(self.buffer)
+        if count < self.checked:
+            self.clear()
+        x = self.buffer.column(self.x_column)
+        if self.x_monotonic and count > self.checked:
+            start = max(self.checked - 1, 0)
+            self.x_monotonic = bool(np.all(np.diff(x[start:count]) >= 0.0))
+        self.checked = count
+        y = self.buffer.column(self.y_column)
+        while True:
+            size, done = self.bucket_size, len(self.bucket_min)
+            full = count // size
+            if full > done:
+                segment = y[done * size:full * size].reshape(-1, size)
+                offsets = np.arange(done, full) * size
+                self.bucket_min = np.concatenate((self.bucket_min, offsets + np.argmin(segment, axis=1)))
+                self.bucket_max = np.concatenate((self.bucket_max, offsets + np.argmax(segment, axis=1)))
+            if len(self.bucket_min) <= 2 * self.buckets:
+                return
+            # Too many buckets: merge pairs and double the bucket size. An odd last bucket
+            # drops back into the incomplete tail and is reduced again on the next pass.
+            pairs = len(self.bucket_min) // 2
+            a_min, b_min = self.bucket_min[0:2 * pairs:2], self.bucket_min[1:2 * pairs:2]
+            a_max, b_max = self.bucket_max[0:2 * pairs:2], self.bucket_max[1:2 * pairs:2]
+            self.bucket_min = np.where(y[a_min] <= y[b_min], a_min, b_min)
+            self.bucket_max = np.where(y[a_max] >= y[b_max], a_max, b_max)
+            self.bucket_size = 2 * size
+
+    def view(self, x_range: tuple[float, float] | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The decimated samples to draw.
+
+        Parameters:
+            x_range (tuple or None): Visible x range when zoomed in; None for all samples.
+
+        Returns:
+            tuple: (x, y) arrays of at most about 4 * buckets points.
+        """
+        self.update()
+        count = len(self.buffer)
+        x = self.buffer.column(self.x_column)
+        y = self.buffer.column(self.y_column)
+        if x_range is not None and self.x_monotonic and count:
+            # Zoomed: decimate the samples in range afresh, one sample beyond each edge
+            start = max(int(np.searchsorted(x, x_range[0])) - 1, 0)
+            stop = min(int(np.searchsorted(x, x_range[1], side='right')) + 1, count)
+            if stop - start <= 2 * self.buckets:
+                return x[start:stop], y[start:stop]
+            size = -(-(stop - start) // self.buckets)
+            full = (stop - start) // size
+            segment = y[start:start + full * size].reshape(-1, size)
+            offsets = start + np.arange(full) * size
+            indices = self._interleave(offsets + np.argmin(segment, axis=1), offsets + np.argmax(segment, axis=1))
+            tail = np.arange(start + full * size, stop)
+            indices = self._with_last(np.concatenate((indices, tail)), stop - 1)
+            return x[indices], y[indices]
+        if count <= 2 * self.buckets:
+            return x, y
+        indices = self._interleave(self.bucket_min, self.bucket_max)
+        # The incomplete last bucket is drawn as is; it holds fewer than bucket_size samples
+        indices = np.concatenate((indices, np.arange(len(self.bucket_min) * self.bucket_size, count)))
+        # With no incomplete bucket the newest sample may be neither minimum nor maximum; keep the tip live
+        indices = self._with_last(indices, count - 1)
+        return x[indices], y[indices]
+
+    @staticmethod
+    def _interleave(minima: np.ndarray, maxima: np.ndarray) -> np.ndarray:
+        indices = np.empty(2 * len(minima), dtype=np.int64)
+        indices[0::2] = np.minimum(minima, maxima)
+        indices[1::2] = np.maximum(minima, maxima)
+        return indices
+
+    @staticmethod
+    def _with_last(indices: np.ndarray, last: int) -> np.ndarray:
+        # Indices are in sample order, so the last sample is either the final index or missing
+        if len(indices) and indices[-1] == last:
+            return indices
+        return np.append(indices, last)
+
+
+class RefreshScheduler(QObject):
+    """
+    Redraws plots that were marked dirty, at most once per frame each. The timer only runs
+    while something is dirty.
+    """
+
+    def __init__(self, frame_ms: int = 16, parent=None):
+        """
+        Initialize the scheduler.
+
+        Parameters:
+            frame_ms (int): Frame interval in milliseconds.
+            parent (QObject): Parent object.
+        """
+        super().__init__(parent)
+        self.dirty = []
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(frame_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def markDirty(self, plot):
+        """
+        Schedule a redraw of a plot for the next frame.
+
+        Parameters:
+            plot: A plot with a redraw() method.
+        """
+        if plot not in self.dirty:
+            self.dirty.append(plot)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def discard(self, plot):
+        """
+        Drop a pending redraw, e.g. of a plot being released.
+
+        Parameters:
+            plot: A plot previously marked dirty.
+        """
+        if plot in self.dirty:
+            self.dirty.remove(plot)
+
+    def flush(self):
+        """
+        Redraw every dirty plot now.
+        """
+        dirty, self.dirty = self.dirty, []
+        for plot in dirty:
+            plot.redraw()
+
+
+class FrequencyPlot(pg.PlotWidget):
+    """
+    Frequency versus elapsed sweep time.
+    """
+
+    def __init__(self, parent=None, width=5, height=4, dpi=100, scheduler: RefreshScheduler | None = None):
+        super().__init__(parent)
+        self.resize(int(width * dpi), int(height * dpi))
+        self.scheduler = scheduler
+        self.buffer = PlotBuffer(2)
+        self.plotItem.setTitle('Frequency Sweep')
+        self.plotItem.setLabel('bottom', 'Time (s)')
+        self.plotItem.setLabel('left', 'Frequency (MHz)')
+        self.plotItem.disableAutoRange()
+        self.plotItem.setMouseEnabled(x=True, y=False)
+        self.line = self.plotItem.plot(pen=pg.mkPen('g'))
+        self.decimator = MinMaxDecimator(self.buffer, 0, 1)
+        self.zoomed = False
+        self.plotItem.getViewBox().sigRangeChangedManually.connect(self.on_range_changed_manually)
+
+    def on_range_changed_manually(self, *args):
+        self.zoomed = True
+        self.redraw()
+
+    def init_plot(self, x_min: float = 0.0, x_max: float = 100.0, y_min: float = 0.0, y_max: float = 500.0):
+        self.zoomed = False
+        self.plotItem.setXRange(x_min, x_max, padding=0.0)
+        self.plotItem.setYRange(y_min, y_max, padding=0.02)
+        self.redraw()
+        return self.line,
+
+    def update_plot(self, time: float, freq: float):
+        self.buffer.append(time, freq)
+        # Extend the time axis by a quarter at a time instead of following every sample
+        x_min, x_max = self.plotItem.viewRange()[0]
+        if time > x_max:
+            self.plotItem.setXRange(x_min, x_min + 1.25 * (time - x_min), padding=0.0)
+        self.request_redraw()
+        return self.line,
+
+    def sample_count(self) -> int:
+        return len(self.buffer)
+
+    def clear_plot(self):
+        self.buffer.clear()
+        self.decimator.clear()
+        self.redraw()
+        return self.line,
+
+    def request_redraw(self):
+        if self.scheduler is None:
+            self.redraw()
+        else:
+            self.scheduler.markDirty(self)
+
+    def redraw(self):
+        self.decimator.setBuckets(self.width())
+        x, y = self.decimator.view(self.plotItem.viewRange()[0] if self.zoomed else None)
+        self.line.setData(x, y, skipFiniteCheck=True)
+
+    def release(self):
+        """
+        Detach the plot and schedule it for deletion; the plot cannot be used afterwards.
+        """
+        if self.scheduler is not None:
+            self.scheduler.discard(self)
+        self.setParent(None)
+        self.deleteLater()
+
+
+class PowerPlot(pg.PlotWidget):
+    """
+    Setpoint and measured field versus frequency.
+    """
+
+    SERIES = (('Setpoint', 'b'), ('Composite', 'r'), ('X', 'g'), ('Y', 'c'), ('Z', 'y'))
+
+    def __init__(self, parent=None, width=5, height=4, dpi=100, scheduler: RefreshScheduler | None = None):
+        super().__init__(parent)
+        self.resize(int(width * dpi), int(height * dpi))
+        self.scheduler = scheduler
+        # Columns: frequency, then one per series
+        self.buffer = PlotBuffer(1 + len(self.SERIES))
+        self.plotItem.setTitle('Field Strength')
+        self.plotItem.setLabel('bottom', 'Frequency (MHz)')
+        self.plotItem.setLabel('left', 'E-Field (V/m)')
+        self.plotItem.disableAutoRange()
+        self.plotItem.addLegend()
+        self.lines = [self.plotItem.plot(pen=pg.mkPen(color), name=name) for name, color in self.SERIES]
+        self.line1, self.line2, self.line3, self.line4, self.line5 = self.lines
+        self.decimators = [MinMaxDecimator(self.buffer, 0, index + 1) for index in range(len(self.SERIES))]
+        self.zoomed = False
+        self.plotItem.getViewBox().sigRangeChangedManually.connect(self.on_range_changed_manually)
+        self.rescale_plot()
+
+    def on_range_changed_manually(self, *args):
+        self.zoomed = True
+        self.redraw()
+
+    def rescale_plot(self, x_min: float = 0.0, x_max: float = 10.0, y_min: float = 0.0, y_max: float = 10.0):
+        self.zoomed = False
+        self.plotItem.setXRange(x_min, x_max, padding=0.0)
+        self.plotItem.setYRange(y_min, y_max, padding=0.0)
+        return tuple(self.lines)
+
+    def clear_plot(self):
+        self.buffer.clear()
+        for decimator in self.decimators:
+            decimator.clear()
+        self.redraw()
+        return tuple(self.lines)
+
+    def update_plot(self, freq: float, setpoint: float, composite: float, x: float, y: float, z: float):
+        self.buffer.append(freq, setpoint, composite, x, y, z)
+        self.request_redraw()
+        return tuple(self.lines)
+
+    def request_redraw(self):
+        if self.scheduler is None:
+            self.redraw()
+        else:
+            self.scheduler.markDirty(self)
+
+    def redraw(self):
+        x_range = self.plotItem.viewRange()[0] if self.zoomed else None
+        for line, decimator in zip(self.lines, self.decimators):
+            decimator.setBuckets(self.width())
+            line.setData(*decimator.view(x_range), skipFiniteCheck=True)
+
+    def release(self):
+        """
+        Detach the plot and schedule it for deletion; the plot cannot be used afterwards.
+        """
+        if self.scheduler is not None:
+            self.scheduler.discard(self)
+        self.setParent(None)
+        self.deleteLater()
@@ -1,37 +1,202 @@
+#!/usr/bin/env python3
+"""
+PID Module
+==========
+This module defines a time-aware PID controller for closed-loop power control and a
+gain schedule that selects gains per frequency band.
+
+The controller integrates and differentiates over the elapsed time between calls,
+so its gains do not depend on the loop rate. The integrator and the output are limited
+(conditional integration stops wind-up while the output is saturated), the derivative
+acts on the filtered measurement, and the integrator can be preset so the controller
+picks up where the previous frequency left off.
+
+Classes:
+    GainSchedule: Kp/Ki/Kd per frequency band.
+    PIDController: Time-aware PID with anti-windup, output limits and derivative filter.
+"""
+
+import math
+import time
+
+
+class GainSchedule:
+    """
+    PID gains per frequency band, e.g. one band per amplifier/antenna combination.
+
+    Attributes:
+        bands (list): (min_freq, max_freq, Kp, Ki, Kd) tuples, frequencies in MHz.
+        default (tuple): (Kp, Ki, Kd) used outside every band.
+    """
+
+    def __init__(self, default: tuple[float, float, float], bands=()):
+        """
+        Initialize the schedule.
+
+        Parameters:
+            default (tuple): (Kp, Ki, Kd) used where no band applies.
+            bands (iterable): (min_freq, max_freq, Kp, Ki, Kd) tuples.
+        """
+        self.default = tuple(default)
+        self.bands = sorted(tuple(band) for band in bands)
+
+    def addBand(self, min_freq: float, max_freq: float, Kp: float, Ki: float, Kd: float):
+        """
+        Add or replace the gains of a band.
+
+        Parameters:
+            min_freq (float): Lower band edge in MHz.
+            max_freq (float): Upper band edge in MHz.
+            Kp (float): Proportional gain.
+            Ki (float): Integral gain in 1/s.
+            Kd (float): Derivative gain in s.
+        """
+        self.bands = sorted([band for band in self.bands if band[:2] != (min_freq, max_freq)] + [(min_freq, max_freq, Kp, Ki, Kd)])
+
+    def gains(self, frequency: float) -> tuple[float, float, float]:
+        """
+        Gains for a frequency. Where bands overlap the first matching band wins.
+
+        Parameters:
+            frequency (float): Frequency in MHz.
+
+        Returns:
+            tuple: (Kp, Ki, Kd).
+        """
+        for min_freq, max_freq, Kp, Ki, Kd in self.bands:
+            if min_freq <= frequency <= max_freq:
+                return Kp, Ki, Kd
+        return self.default
+
+
 class PIDController():
-    
-    def __init__(self, Kp, Ki, Kd):
+
+    def __init__(self, Kp, Ki, Kd, output_limits=(-math.inf, math.inf), derivative_filter: float = 0.05, clock=time.monotonic):
+        """
+        Initialize the controller.
+
+        Parameters:
+            Kp (float): Proportional gain.
+            Ki (float): Integral gain in 1/s.
+            Kd (float): Derivative gain in s.
+            output_limits (tuple): (low, high) bounds of the output and the integrator.
+            derivative_filter (float): Time constant of the derivative low-pass filter in seconds.
+            clock (callable): Time source used when calculate() is not given dt.
+        """
         self.Kp = Kp
         self.Ki = Ki
         self.Kd = Kd
-        self.prev_error = 0.0
-        self.integral = 0.0
+        self.output_limits = tuple(output_limits)
+        self.derivative_filter = derivative_filter
+        self.clock = clock
+        self.schedule = None
         self.desired_field = 1.0
         self.current_field = 0.0
-    
+        self.integral = self._clamp(0.0)
+        self.clear()
+
     def setGains(self, Kp: float, Ki: float, Kd: float):
         print(f"PID gains set to: Kp = {Kp}, Ki = {Ki}, Kd = {Kd}")
         self.Kp = Kp
         self.Ki = Ki
         self.Kd = Kd
-    
+
+    def setGainSchedule(self, schedule: GainSchedule | None):
+        """
+        Select gains per frequency band from now on; None keeps the current gains fixed.
+
+        Parameters:
+            schedule (GainSchedule or None): The schedule.
+        """
+        self.schedule = schedule
+
+    def setFrequency(self, frequency: float):
+        """
+        Switch to the scheduled gains for a frequency. The integrator is kept, so the
+        change is bumpless.
+
+        Parameters:
+            frequency (float): Frequency in MHz.
+        """
+        if self.schedule is not None:
+            self.Kp, self.Ki, self.Kd = self.schedule.gains(frequency)
+
+    def setOutputLimits(self, low: float, high: float):
+        """
+        Limit the output and the integrator.
+
+        Parameters:
+            low (float): Lowest output.
+            high (float): Highest output.
+        """
+        self.output_limits = (low, high)
+        self.integral = self._clamp(self.integral)
+
     def setTargetValue(self, setpoint: float):
         self.desired_field = setpoint
-        print(f"Desired floor at: {setpoint}, Target field at: {self.desired_field}")
-        
+
     def getTargetValue(self) -> float:
         return self.desired_field
-    
-    def calculate(self, current_field: float) -> float:
+
+    def _clamp(self, value: float) -> float:
+        low, high = self.output_limits
+        return min(max(value, low), high)
+
+    def calculate(self, current_field: float, dt: float | None = None) -> float:
+        """
+        Compute the controller output for a new measurement.
+
+        Parameters:
+            current_field (float): The measured value.
+            dt (float or None): Seconds since the previous call. Measured with the clock if None.
+
+        Returns:
+            float: The output, within the output limits.
+        """
+        now = self.clock()
+        if dt is None:
+            dt = 0.0 if self.last_time is None else now - self.last_time
+        self.last_time = now
+        self.current_field = current_field
         error = self.desired_field - current_field
-        self.integral += error
-        derivative = error - self.prev_error
-        output = (self.Kp * error) + (self.Ki * self.integral) + (self.Kd * derivative)
+
+        # Derivative on the low-pass filtered measurement avoids kicks on setpoint changes
+        if self.filtered_measurement is None or dt <= 0.0:
+            self.filtered_measurement = current_field
+            derivative = 0.0
+        else:
+            alpha = dt / (self.derivative_filter + dt)
+            previous = self.filtered_measurement
+            self.filtered_measurement += alpha * (current_field - previous)
+            derivative = -(self.filtered_measurement - previous) / dt
+
+        integral = self._clamp(self.integral + self.Ki * error * dt)
+        output = self.Kp * error + integral + self.Kd * derivative
+        clamped = self._clamp(output)
+        # Conditional integration: hold the integrator while the output saturates in the direction of the error
+        if clamped == output or (output > clamped) != (error > 0.0):
+            self.integral = integral
         self.prev_error = error
-        print(f"Current Field: {current_field}, Error: {error}, Integral: {self.integral}, Derivative: {derivative}, Output: {output}")
-        return output
-    
+        return clamped
+
+    def reset(self, output: float = 0.0):
+        """
+        Clear the history and preset the integrator so the next output starts at a value,
+        e.g. the power that levelled the previous frequency.
+
+        Parameters:
+            output (float): The output to start from.
+        """
+        self.clear()
+        self.integral = self._clamp(output)
+
     def clear(self):
+        """
+        Clear the history. The integrator holds the absolute output (the generator power), so
+        it is kept, within the output limits, rather than zeroed; use reset() to preset it.
+        """
         self.measured_value = 0.0
         self.prev_error = 0.0
-        self.integral = 0.0
\ No newline at end of file
+        self.integral = self._clamp(self.integral)
+        self.filtered_measurement = None
+        self.last_time = None
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+PID Auto-Tune Module
+====================
+This module measures the leveling plant (generator → amplifier → antenna → field probe)
+and computes PID gains for the FieldController from the measurement, so operators no
+longer have to guess Kp/Ki/Kd.
+
+At each tuning frequency the generator is first stepped from a low power towards the
+target field. The step response is fitted with a first-order-plus-dead-time model
+(gain K in dB/dB, time constant tau and dead time theta) for IMC tuning. For
+Ziegler-Nichols tuning a relay experiment follows: the power is switched between two
+levels around the target whenever the field crosses it, and the ultimate gain and
+period are taken from the resulting oscillation. Both experiments work in dB, like
+the FieldController's PID mode.
+
+A few frequencies are measured per band and the most conservative gains of the band
+are kept. The resulting GainSchedule is stored per amplifier/antenna setup in
+~/Documents/ImmuniSweep/pid_gains.json.
+
+Classes:
+    TuningStopped: Raised inside an experiment when tuning is stopped.
+    StepResponse: First-order-plus-dead-time fit of a power step.
+    PIDGainStore: Persistent gain schedules per equipment setup.
+    PIDAutoTuner: Runs the experiments on a worker thread and builds a GainSchedule.
+Functions:
+    fit_step_response: Fit a step response with the two-point (28 %/63 %) method.
+    imc_gains: PI gains from a step response fit.
+    ziegler_nichols_gains: PID gains from the ultimate gain and period.
+"""
+
+import json
+import math
+import os
+import threading
+from time import sleep, monotonic
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from PID import GainSchedule
+from SCPIClient import SCPIError
+from SignalGenerator import Frequency
+
+
+class TuningStopped(Exception):
+    """
+    Raised inside an experiment when tuning is stopped, so the worker ends without
+    waiting for the experiment to finish.
+    """
+
+
+class StepResponse:
+    """
+    First-order-plus-dead-time model of a power step.
+
+    Attributes:
+        gain (float): Field change per power change in dB/dB.
+        time_constant (float): Time constant tau in seconds.
+        dead_time (float): Dead time theta in seconds.
+    """
+
+    def __init__(self, gain: float, time_constant: float, dead_time: float):
+        self.gain = gain
+        self.time_constant = time_constant
+        self.dead_time = dead_time
+
+    def __repr__(self):
+        return f'StepResponse(K={self.gain:.3f}, tau={self.time_constant:.3f} s, theta={self.dead_time:.3f} s)'
+
+
+def fit_step_response(times, values, step_size: float) -> StepResponse:
+    """
+    Fit a step response with the two-point method: tau = 1.5 * (t63 - t28) and
+    theta = t63 - tau.
+
+    Parameters:
+        times (array-like): Sample times in seconds, relative to the step.
+        values (array-like): Measured field in dB(V/m); the first sample is taken before the step responds.
+        step_size (float): Power step in dB.
+
+    Returns:
+        StepResponse: The fitted model.
+
+    Raises:
+        ValueError: If the field did not follow the step.
+    """
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    initial = values[0]
+    final = float(np.mean(values[-max(1, len(values) // 4):]))
+    change = final - initial
+    if step_size == 0.0 or change / step_size <= 0.0:
+        raise ValueError('The field did not follow the power step')
+    # Crossings of 28.3 % and 63.2 % of the change, interpolated between samples
+    progress = (values - initial) / change
+    crossings = []
+    for fraction in (0.283, 0.632):
+        index = int(np.argmax(progress >= fraction))
+        if index == 0:
+            crossings.append(times[0])
+            continue
+        p0, p1 = progress[index - 1], progress[index]
+        t0, t1 = times[index - 1], times[index]
+        crossings.append(t0 + (fraction - p0) / (p1 - p0) * (t1 - t0))
+    time_constant = 1.5 * (crossings[1] - crossings[0])
+    dead_time = max(crossings[1] - time_constant, 0.0)
+    return StepResponse(change / step_size, time_constant, dead_time)
+
+
+def imc_gains(response: StepResponse, closed_loop_time: float | None = None) -> tuple[float, float, float]:
+    """
+    PI gains by internal model control (lambda tuning) for a first-order-plus-dead-time
+    plant: Kp = tau / (K * (lambda + theta)), Ki = Kp / tau.
+
+    Parameters:
+        response (StepResponse): The plant model.
+        closed_loop_time (float or None): Desired closed-loop time constant lambda in seconds.
+            Defaults to the dead time, a common robust choice.
+
+    Returns:
+        tuple: (Kp, Ki, Kd).
+    """
+    theta = max(response.dead_time, 1e-3)
+    lam = theta if closed_loop_time is None else closed_loop_time
+    Ki = 1.0 / (response.gain * (lam + theta))
+    return Ki * response.time_constant, Ki, 0.0
+
+
+def ziegler_nichols_gains(ultimate_gain: float, ultimate_period: float, rule: str = 'pid') -> tuple[float, float, float]:
+    """
+    Gains from the ultimate gain Ku and period Pu of a relay experiment.
+
+    Parameters:
+        ultimate_gain (float): Ku.
+        ultimate_period (float): Pu in seconds.
+        rule (str): 'pid' (classic), 'pi', or 'no-overshoot'.
+
+    Returns:
+        tuple: (Kp, Ki, Kd), Ki in 1/s and Kd in s.
+    """
+    Ku, Pu = ultimate_gain, ultimate_period
+    if rule == 'pi':
+        return 0.45 * Ku, 0.54 * Ku / Pu, 0.0
+    if rule == 'no-overshoot':
+        return 0.2 * Ku, 0.4 * Ku / Pu, 0.2 * Ku * Pu / 15.0
+    if rule == 'pid':
+        return 0.6 * Ku, 1.2 * Ku / Pu, 0.075 * Ku * Pu
+    raise ValueError(f'Unknown Ziegler-Nichols rule: {rule}')
+
+
+class PIDGainStore:
+    """
+    Persistent gain schedules, one per amplifier/antenna setup.
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        Initialize the store.
+
+        Parameters:
+            path (str or None): JSON file to use. Defaults to ~/Documents/ImmuniSweep/pid_gains.json.
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "pid_gains.json")
+        self.path = path
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, setup: str) -> GainSchedule | None:
+        """
+        Return the stored schedule of a setup.
+
+        Parameters:
+            setup (str): Setup name, e.g. 'AR 25A250AMB / ETS 3143B'.
+
+        Returns:
+            GainSchedule or None: The schedule, or None if the setup was never tuned.
+        """
+        entry = self._load().get(setup)
+        if not entry:
+            return None
+        return GainSchedule(entry['default'], entry['bands'])
+
+    def put(self, setup: str, schedule: GainSchedule):
+        """
+        Store the schedule of a setup, replacing any previous one.
+
+        Parameters:
+            setup (str): Setup name used as the key.
+            schedule (GainSchedule): The tuned schedule.
+        """
+        entries = self._load()
+        entries[setup] = {'default': list(schedule.default), 'bands': [list(band) for band in schedule.bands]}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as file:
+                json.dump(entries, file, indent=2)
+        except OSError as e:
+            print(f'Unable to save PID gains: {str(e)}')
+
+
+class PIDAutoTuner(QObject):
+    """
+    PIDAutoTuner runs step or relay experiments across a frequency range on a worker
+    thread and emits the resulting GainSchedule.
+    """
+
+    pointTuned = pyqtSignal(float, float, float, float)
+    tuningStatus = pyqtSignal(float)
+    tuningCompleted = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, signal_generator, field_probe):
+        """
+        Initialize the tuner.
+
+        Parameters:
+            signal_generator (AgilentN5181A): The signal generator instance.
+            field_probe (ETSLindgrenHI6006): The field probe instance.
+        """
+        super().__init__()
+        self.signal_generator = signal_generator
+        self.field_probe = field_probe
+
+        # Experiment parameters
+        self.method = 'imc'           # 'imc' (step response) or 'ziegler-nichols' (relay)
+        self.rule = 'pi'              # Ziegler-Nichols rule, see ziegler_nichols_gains()
+        self.target_field = 1.0       # Field the experiments are run at in V/m
+        self.threshold = 1.5          # FieldController acceptance window, target to target * threshold
+        self.start_power = -30.0      # Power before the step in dBm
+        self.max_power = 10.0         # Generator power limit in dBm
+        self.max_step = 20.0          # Largest power step in dB
+        self.step_margin = 3.0        # The step aims this far below the setpoint in dB
+        self.relay_amplitude = 2.0    # Relay power swing around the bias in dB
+        self.relay_hysteresis = 0.3   # Relay hysteresis in dB, above the probe noise
+        self.relay_cycles = 4         # Oscillation periods averaged by the relay experiment
+        self.sample_period = 0.02     # Time between probe reads in seconds
+        self.baseline_time = 0.5      # Reading time before the step in seconds
+        self.step_time = 1.5          # Reading time after the step in seconds
+        self.relay_timeout = 10.0     # Longest relay experiment in seconds
+
+        # Replaceable so a simulated plant can run on a virtual clock
+        self.sleep = sleep
+        self.clock = monotonic
+
+        self.is_tuning = False
+        self.tuning_thread = None
+
+    def setpoint(self) -> float:
+        """
+        Returns:
+            float: The experiment setpoint in dB(V/m), the middle of the acceptance window.
+        """
+        return 20.0 * math.log10(self.target_field * math.sqrt(self.threshold))
+
+    def read_db(self) -> float:
+        """
+        Returns:
+            float: The composite field in dB(V/m), floored at -60 dB.
+        """
+        field = self.field_probe.readCurrentField()[0]
+        return 20.0 * math.log10(max(field, 0.001))
+
+    def record(self, duration: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Read the probe every sample_period for a while.
+
+        Parameters:
+            duration (float): Recording time in seconds.
+
+        Returns:
+            tuple: (times relative to the start in seconds, field in dB(V/m)).
+        """
+        start = self.clock()
+        times, values = [], []
+        while True:
+            if not self.is_tuning:
+                raise TuningStopped()
+            now = self.clock() - start
+            if now > duration:
+                break
+            times.append(now)
+            values.append(self.read_db())
+            self.sleep(self.sample_period)
+        return np.array(times), np.array(values)
+
+    def step_test(self, frequency: float) -> tuple[StepResponse, float]:
+        """
+        Step the generator from start_power towards the setpoint and fit the response.
+
+        Parameters:
+            frequency (float): Frequency in MHz.
+
+        Returns:
+            tuple: (StepResponse, power in dBm that approximately produces the setpoint).
+        """
+        generator = self.signal_generator
+        generator.setFrequency(frequency, Frequency.MHz.value)
+        generator.setPower(self.start_power)
+        _, baseline = self.record(self.baseline_time)
+        initial = float(np.mean(baseline[len(baseline) // 2:]))
+        step = min(self.setpoint() - self.step_margin - initial, self.max_step, self.max_power - self.start_power)
+        if step <= 0.0:
+            raise ValueError(f'Field at {frequency} MHz is above the setpoint at {self.start_power} dBm')
+        generator.setPower(self.start_power + step)
+        times, values = self.record(self.step_time)
+        response = fit_step_response(np.r_[0.0, times], np.r_[initial, values], step)
+        final = float(np.mean(values[-max(1, len(values) // 4):]))
+        bias = self.start_power + step + (self.setpoint() - final) / response.gain
+        return response, min(bias, self.max_power - self.relay_amplitude)
+
+    def relay_test(self, bias: float) -> tuple[float, float]:
+        """
+        Switch the power between bias +/- relay_amplitude whenever the field crosses the
+        setpoint (with hysteresis) and measure the oscillation.
+
+        Parameters:
+            bias (float): Center power in dBm, near the power that produces the setpoint.
+
+        Returns:
+            tuple: (ultimate gain Ku, ultimate period Pu in seconds).
+
+        Raises:
+            ValueError: If no steady oscillation developed in time.
+        """
+        generator = self.signal_generator
+        setpoint = self.setpoint()
+        d, h = self.relay_amplitude, self.relay_hysteresis
+        high = True
+        generator.setPower(bias + d)
+        start = self.clock()
+        switches, maxima, minima = [], [], []
+        extreme = setpoint
+        while len(switches) < 2 * self.relay_cycles + 3:
+            if not self.is_tuning:
+                raise TuningStopped()
+            now = self.clock() - start
+            if now > self.relay_timeout:
+                raise ValueError('Relay experiment did not oscillate')
+            value = self.read_db()
+            # The field keeps moving for a dead time after each switch; track the turning point
+            extreme = min(extreme, value) if high else max(extreme, value)
+            if high and value > setpoint + h or not high and value < setpoint - h:
+                (minima if high else maxima).append(extreme)
+                high = not high
+                generator.setPower(bias + d if high else bias - d)
+                switches.append(now)
+                extreme = value
+            self.sleep(self.sample_period)
+        # Skip the transient before the first full cycle
+        period = float(np.mean(np.diff(switches[2::2])))
+        a = (float(np.mean(maxima[1:])) - float(np.mean(minima[1:]))) / 2.0
+        if a <= h:
+            raise ValueError('Relay oscillation is within the hysteresis')
+        return 4.0 * d / (math.pi * math.sqrt(a * a - h * h)), period
+
+    def tune_frequency(self, frequency: float) -> tuple[float, float, float]:
+        """
+        Run the experiment at one frequency.
+
+        Parameters:
+            frequency (float): Frequency in MHz.
+
+        Returns:
+            tuple: (Kp, Ki, Kd).
+        """
+        response, bias = self.step_test(frequency)
+        if self.method == 'ziegler-nichols':
+            gains = ziegler_nichols_gains(*self.relay_test(bias), self.rule)
+        else:
+            gains = imc_gains(response)
+        gains = tuple(float(gain) for gain in gains)
+        print(f'Tuned {frequency:.2f} MHz: {response}, gains {gains}')
+        self.signal_generator.setPower(self.start_power)
+        return gains
+
+    def startTuning(self, min_freq: float, max_freq: float, bands: int = 3, points_per_band: int = 3):
+        """
+        Start tuning on a worker thread. See tune().
+        """
+        if self.is_tuning or self.tuning_thread is not None and self.tuning_thread.is_alive():
+            return
+        if self.signal_generator is None or not self.signal_generator.is_running:
+            self.error.emit('PID auto-tune needs the signal generator; connect it first')
+            return
+        if self.field_probe is None or not self.field_probe.is_running:
+            self.error.emit('PID auto-tune needs the field probe; connect it first')
+            return
+        self.is_tuning = True
+        self.tuning_thread = threading.Thread(target=self.tune, args=(min_freq, max_freq, bands, points_per_band), daemon=True)
+        self.tuning_thread.start()
+
+    def stopTuning(self, wait: bool = True):
+        """
+        Stop tuning at the next probe reading. The worker then switches RF off.
+
+        Parameters:
+            wait (bool): Wait for the worker to finish. The GUI passes False so it never blocks.
+        """
+        self.is_tuning = False
+        if wait and self.tuning_thread is not None and self.tuning_thread is not threading.current_thread():
+            self.tuning_thread.join()
+
+    def tune(self, min_freq: float, max_freq: float, bands: int = 3, points_per_band: int = 3) -> GainSchedule | None:
+        """
+        Split the range into logarithmic bands, measure a few frequencies per band and keep
+        the smallest gains of each band, so the band is stable wherever the plant gain peaks.
+
+        Parameters:
+            min_freq (float): Lowest frequency in MHz.
+            max_freq (float): Highest frequency in MHz.
+            bands (int): Number of bands.
+            points_per_band (int): Frequencies measured per band.
+
+        Returns:
+            GainSchedule or None: The schedule, or None if tuning was stopped or failed.
+        """
+        # startTuning has already set the flag for its worker, and a stop may have cleared it since
+        if threading.current_thread() is not self.tuning_thread:
+            self.is_tuning = True
+        edges = np.geomspace(min_freq, max_freq, bands + 1)
+        band_gains = []
+        generator = self.signal_generator
+        try:
+            generator.setPower(self.start_power)
+            generator.setRFOut(True)
+            for band in range(bands):
+                # Points spread inside the band, away from the edges
+                positions = (np.arange(points_per_band) + 0.5) / points_per_band
+                frequencies = edges[band] * (edges[band + 1] / edges[band]) ** positions
+                gains = []
+                for index, frequency in enumerate(frequencies):
+                    if not self.is_tuning:
+                        return None
+                    gains.append(self.tune_frequency(float(frequency)))
+                    self.pointTuned.emit(float(frequency), *gains[-1])
+                    self.tuningStatus.emit(100.0 * (band * points_per_band + index + 1) / (bands * points_per_band))
+                band_gains.append(tuple(float(gain) for gain in np.min(gains, axis=0)))
+        except TuningStopped:
+            return None
+        except (ValueError, SCPIError, OSError) as e:
+            self.error.emit(f'PID auto-tune failed: {str(e)}')
+            return None
+        finally:
+            try:
+                generator.setRFOut(False)
+            except (SCPIError, OSError) as e:
+                print(f'Unable to switch RF off: {str(e)}')
+            self.is_tuning = False
+        schedule = GainSchedule(tuple(float(gain) for gain in np.min(band_gains, axis=0)),
+                                [(float(edges[band]), float(edges[band + 1]), *band_gains[band]) for band in range(bands)])
+        self.tuningCompleted.emit(schedule)
+        return schedule
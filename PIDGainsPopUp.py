@@ -1,5 +1,7 @@
 
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QDoubleSpinBox, QLabel, QDialogButtonBox
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QDoubleSpinBox, QLabel, QDialogButtonBox, QPushButton, QComboBox
+
+from PIDAutoTune import PIDAutoTuner
 
 class PIDGainsPopUp(QDialog):
     def __init__(self, main_window):
@@ -10,16 +12,21 @@ class PIDGainsPopUp(QDialog):
         layout = QVBoxLayout()
 
         self.spinbox_Kp = QDoubleSpinBox()
+        self.spinbox_Kp.setDecimals(4)  # Tuned gains can be a few hundredths
         self.label_Kp = QLabel("Proportional Gain")
         self.spinbox_Kp.setValue(self.main_window.pid_controller.Kp)
 
         self.spinbox_Ki = QDoubleSpinBox()
+        self.spinbox_Ki.setDecimals(4)  # Tuned gains can be a few hundredths
         self.label_Ki = QLabel("Integral Gain")
         self.spinbox_Ki.setValue(self.main_window.pid_controller.Ki)
 
         self.spinbox_Kd = QDoubleSpinBox()
+        self.spinbox_Kd.setDecimals(4)  # Tuned gains can be a few hundredths
         self.label_Kd = QLabel("Derivative Gain")
         self.spinbox_Kd.setValue(self.main_window.pid_controller.Kd)
+        # Gains in effect; OK replaces them (and any gain schedule) only if they were edited
+        self.applied_gains = self.gains()
 
         layout.addWidget(self.label_Kp)
         layout.addWidget(self.spinbox_Kp)
@@ -30,6 +37,21 @@ class PIDGainsPopUp(QDialog):
         layout.addWidget(self.label_Kd)
         layout.addWidget(self.spinbox_Kd)
 
+        # Auto-tune measures the selected amplifier/antenna setup and stores the gains for it
+        self.comboBox_method = QComboBox()
+        self.comboBox_method.addItems(['imc', 'ziegler-nichols'])
+        self.pushButton_autoTune = QPushButton("Auto-Tune")
+        self.pushButton_autoTune.pressed.connect(self.on_pushButton_autoTune_pressed)
+        self.label_status = QLabel(f"Setup: {self.main_window.setupName()}")
+        layout.addWidget(self.comboBox_method)
+        layout.addWidget(self.pushButton_autoTune)
+        layout.addWidget(self.label_status)
+
+        self.tuner = PIDAutoTuner(self.main_window.signal_generator, self.main_window.field_probe)
+        self.tuner.tuningStatus.connect(self.on_tuner_tuningStatus)
+        self.tuner.tuningCompleted.connect(self.on_tuner_tuningCompleted)
+        self.tuner.error.connect(self.on_tuner_error)
+
         # Add dialog buttons (OK and Cancel)
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.button_box.accepted.connect(self.save_values)
@@ -39,9 +61,54 @@ class PIDGainsPopUp(QDialog):
 
         self.setLayout(layout)
         
+    def gains(self) -> tuple:
+        return (self.spinbox_Kp.value(), self.spinbox_Ki.value(), self.spinbox_Kd.value())
+        
     def save_values(self):
-        # Save the values of the spin boxes to the main window's PID controller gains
-        self.main_window.pid_controller.setGains(self.spinbox_Kp.value(), self.spinbox_Ki.value(), self.spinbox_Kd.value())
+        # Manually edited gains replace the gain schedule and switch the field controller to the PID
+        if self.gains() != self.applied_gains:
+            pid_controller = self.main_window.pid_controller
+            pid_controller.setGainSchedule(None)
+            pid_controller.setGains(*self.gains())
+            self.main_window.field_controller.setPIDController(pid_controller)
 
         # Close the dialog
-        self.accept()
\ No newline at end of file
+        self.accept()
+
+    def on_pushButton_autoTune_pressed(self):
+        if self.main_window.sweep_in_progress:
+            self.label_status.setText("Stop the sweep before auto-tuning")
+            return
+        limits = self.main_window.equipment_limits
+        self.tuner.method = self.comboBox_method.currentText()
+        self.tuner.target_field = self.main_window.field_controller.getTargetField()
+        self.tuner.threshold = self.main_window.field_controller.threshold
+        self.tuner.max_power = limits.getMaxPower()
+        self.pushButton_autoTune.setEnabled(False)
+        self.button_box.setEnabled(False)
+        self.tuner.startTuning(limits.getMinFrequency(), limits.getMaxFrequency())
+
+    def on_tuner_tuningStatus(self, percent: float):
+        self.label_status.setText(f"Tuning... {percent:.0f} %")
+
+    def on_tuner_tuningCompleted(self, schedule):
+        self.main_window.gain_store.put(self.main_window.setupName(), schedule)
+        self.main_window.applyGainSchedule(schedule)
+        Kp, Ki, Kd = schedule.default
+        self.spinbox_Kp.setValue(Kp)
+        self.spinbox_Ki.setValue(Ki)
+        self.spinbox_Kd.setValue(Kd)
+        self.applied_gains = self.gains()
+        self.label_status.setText(f"Gains saved for {self.main_window.setupName()}")
+        self.pushButton_autoTune.setEnabled(True)
+        self.button_box.setEnabled(True)
+
+    def on_tuner_error(self, message: str):
+        self.label_status.setText(message)
+        self.pushButton_autoTune.setEnabled(True)
+        self.button_box.setEnabled(True)
+
+    def reject(self):
+        # Do not block the GUI; the worker stops at its next reading and switches RF off itself
+        self.tuner.stopTuning(wait=False)
+        super().reject()
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Plant Simulator Module
+======================
+This module simulates the radiated-immunity chain so that FieldController leveling
+can be tuned and benchmarked without chamber time. The chain is modelled as:
+
+    generator power (dBm) -> amplifier gain with soft compression -> antenna gain
+    versus frequency -> field at distance -> probe noise, quantization and latency
+
+The frequency-dependent gains are tabulated once with NumPy over a dense logarithmic
+grid, and the field for many frequency/power pairs is evaluated in one vectorized
+call. The real FieldController runs against a simulated generator and probe that
+share a virtual clock. Its sleeps advance the clock instead of blocking, so a sweep of
+thousands of frequencies runs far faster than real time, while the reported sweep
+time is what the chamber would take.
+
+Classes:
+    VirtualClock: Simulated time shared by the plant, generator, probe and controller.
+    PlantModel: Vectorized amplifier, antenna and propagation model.
+    SimulatedSignalGenerator: Stand-in for AgilentN5181A with command latency and settling.
+    SimulatedFieldProbe: Stand-in for ETSLindgrenHI6006 with noise, quantization and latency.
+    SweepReport: Per-frequency leveling metrics and their summary.
+Functions:
+    simulate_sweep: Run a FieldController sweep against the simulated plant.
+    simulate_autotune: Run the PID auto-tune experiments against the simulated plant.
+
+Usage:
+    python PlantSimulator.py --start 80 --stop 6000 --term 0.001 --target 3
+    python PlantSimulator.py --start 80 --stop 6000 --term 0.001 --target 3 --autotune imc
+"""
+
+import argparse
+import bisect
+import contextlib
+import io
+import math
+import time
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from FieldController import FieldController
+from PID import PIDController, GainSchedule
+from PIDAutoTune import PIDAutoTuner
+from SetupModel import SetupModel, FrequencyTable
+
+
+class VirtualClock:
+    """
+    Simulated time in seconds. sleep() advances it immediately.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def sleep(self, seconds: float):
+        """
+        Advance the clock.
+
+        Parameters:
+            seconds (float): Time to advance in seconds.
+        """
+        self.now += max(0.0, seconds)
+
+    def time(self) -> float:
+        """
+        Returns:
+            float: The current simulated time in seconds.
+        """
+        return self.now
+
+
+class PlantModel:
+    """
+    Vectorized model of amplifier, antenna and propagation.
+
+    Gains are tabulated over a logarithmic frequency grid with a random but repeatable
+    ripple, so the plant has the kind of structure a real chamber shows.
+    """
+
+    def __init__(self, min_freq: float = 1.0, max_freq: float = 6000.0, amplifier_gain: float = 45.0,
+                 saturation_power: float = 44.0, compression_smoothness: float = 2.0, antenna_gain: float = 5.0,
+                 distance: float = 3.0, ripple: float = 1.5, points: int = 4096, seed: int = 0):
+        """
+        Initialize the plant.
+
+        Parameters:
+            min_freq (float): Lowest modelled frequency in MHz.
+            max_freq (float): Highest modelled frequency in MHz.
+            amplifier_gain (float): Small-signal amplifier gain in dB.
+            saturation_power (float): Amplifier saturated output power in dBm.
+            compression_smoothness (float): Rapp smoothness factor; larger is a harder limit.
+            antenna_gain (float): Nominal antenna gain (linear), as used by RadiatedImmunity.
+            distance (float): Antenna to probe distance in meters.
+            ripple (float): Peak gain ripple across frequency in dB.
+            points (int): Number of grid points for the gain tables.
+            seed (int): Seed for the ripple shape.
+        """
+        rng = np.random.default_rng(seed)
+        self.log_freqs = np.linspace(math.log(min_freq), math.log(max_freq), points)
+        # Smooth ripple: a few random sinusoids over log-frequency
+        phases = rng.uniform(0.0, 2.0 * math.pi, 4)
+        cycles = rng.uniform(2.0, 12.0, 4)
+        span = self.log_freqs[-1] - self.log_freqs[0]
+        position = (self.log_freqs - self.log_freqs[0]) / span
+        shape = np.sum(np.sin(2.0 * math.pi * cycles[:, None] * position[None, :] + phases[:, None]), axis=0)
+        shape /= np.max(np.abs(shape))
+        self.amplifier_gain_db = amplifier_gain + 0.5 * ripple * shape
+        self.antenna_gain = antenna_gain * 10.0 ** (0.5 * ripple * np.roll(shape, points // 3) / 10.0)
+        self.nominal_amplifier_gain = amplifier_gain
+        self.nominal_antenna_gain = antenna_gain
+        self.saturation_watts = 10.0 ** ((saturation_power - 30.0) / 10.0)
+        self.smoothness = compression_smoothness
+        self.distance = distance
+
+    def field(self, freq_mhz, power_dbm):
+        """
+        Field strength for generator settings. Accepts scalars or arrays of equal shape.
+
+        Parameters:
+            freq_mhz (float or np.ndarray): Frequency in MHz.
+            power_dbm (float or np.ndarray): Generator output power in dBm.
+
+        Returns:
+            float or np.ndarray: Field strength in V/m.
+        """
+        log_freq = np.log(freq_mhz)
+        gain_db = np.interp(log_freq, self.log_freqs, self.amplifier_gain_db)
+        antenna_gain = np.interp(log_freq, self.log_freqs, self.antenna_gain)
+        linear_watts = 10.0 ** ((np.asarray(power_dbm) + gain_db - 30.0) / 10.0)
+        # Rapp model of amplifier compression towards the saturated output power
+        watts = linear_watts / (1.0 + (linear_watts / self.saturation_watts) ** self.smoothness) ** (1.0 / self.smoothness)
+        return np.sqrt(30.0 * watts * antenna_gain) / self.distance
+
+    def power_for_field(self, freq_mhz, field):
+        """
+        Generator power that produces a field in the linear region, ignoring compression.
+
+        Parameters:
+            freq_mhz (float or np.ndarray): Frequency in MHz.
+            field (float or np.ndarray): Field strength in V/m.
+
+        Returns:
+            float or np.ndarray: Generator power in dBm.
+        """
+        log_freq = np.log(freq_mhz)
+        gain_db = np.interp(log_freq, self.log_freqs, self.amplifier_gain_db)
+        antenna_gain = np.interp(log_freq, self.log_freqs, self.antenna_gain)
+        watts = (np.asarray(field) * self.distance) ** 2 / (30.0 * antenna_gain)
+        return 10.0 * np.log10(watts * 1000.0) - gain_db
+
+
+    def setupModel(self, tables: bool = True) -> SetupModel:
+        """
+        A SetupModel of this plant, as the FieldController would be given.
+
+        Parameters:
+            tables (bool): Use the exact gain tables (as from measured data), or only the nominal scalars.
+
+        Returns:
+            SetupModel: The model. It ignores compression.
+        """
+        model = SetupModel(self.nominal_amplifier_gain, self.nominal_antenna_gain, 0.0, self.distance)
+        if tables:
+            frequencies = np.exp(self.log_freqs)
+            gain_dbi = 10.0 * np.log10(self.antenna_gain)
+            model.amplifier_gain = FrequencyTable(frequencies, self.amplifier_gain_db)
+            model.antenna_factor = FrequencyTable(frequencies, 20.0 * np.log10(frequencies) - gain_dbi - 29.77)
+        return model
+
+
+class SimulatedSignalGenerator(QObject):
+    """
+    Stand-in for AgilentN5181A. Power and frequency changes take effect after a settling
+    time, and every blocking call costs the command round-trip latency.
+    """
+
+    error = pyqtSignal(str)
+
+    def __init__(self, clock: VirtualClock, command_latency: float = 0.004, settling_time: float = 0.005):
+        """
+        Initialize the generator.
+
+        Parameters:
+            clock (VirtualClock): The shared simulated clock.
+            command_latency (float): Time a blocking setPower call takes in seconds.
+            settling_time (float): Time until a new setting reaches the output in seconds.
+        """
+        super().__init__()
+        self.clock = clock
+        self.command_latency = command_latency
+        self.settling_time = settling_time
+        self.power = -135.0
+        self.frequency = 1000.0
+        self.rf_on = False
+        self.max_power = 10.0
+        # (time applied, frequency in MHz, power in dBm, RF on)
+        self.history_times = [0.0]
+        self.history = [(self.frequency, self.power, False)]
+        self.commands = 0
+
+    def _apply(self):
+        self.commands += 1
+        self.clock.sleep(self.command_latency)
+        self.history_times.append(self.clock.now + self.settling_time)
+        self.history.append((self.frequency, self.power, self.rf_on))
+
+    def state_at(self, t: float) -> tuple[float, float, bool]:
+        """
+        Output state at a simulated time.
+
+        Parameters:
+            t (float): Simulated time in seconds.
+
+        Returns:
+            tuple: (frequency in MHz, power in dBm, RF on).
+        """
+        return self.history[max(0, bisect.bisect_right(self.history_times, t) - 1)]
+
+    def setPower(self, pow: float) -> float:
+        if pow > self.max_power:
+            pow = self.max_power
+            self.error.emit("Power above amplifier maximum input.")
+        self.power = round(float(pow), 3)
+        self._apply()
+        return self.power
+
+    def getPower(self) -> float:
+        return float(self.power)
+
+    def setFrequency(self, freq: float, unit: str = 'MHz'):
+        scale = {'Hz': 1e-6, 'kHz': 1e-3, 'MHz': 1.0, 'GHz': 1e3}[unit]
+        self.frequency = float(freq) * scale
+        self._apply()
+
+    def getFrequency(self) -> float:
+        return float(self.frequency)
+
+    def setRFOut(self, on: bool):
+        self.rf_on = on
+        self._apply()
+
+    def setModulationState(self, on: bool):
+        self.clock.sleep(self.command_latency)
+
+    # Modulation settings do not affect the simulated field; they only cost a command
+    def setModulationType(self, mod):
+        self.clock.sleep(self.command_latency)
+
+    def setAMType(self, linear: bool):
+        self.clock.sleep(self.command_latency)
+
+    def setAMLinearDepth(self, percent: float):
+        self.clock.sleep(self.command_latency)
+
+    def setAMFrequency(self, freq: float):
+        self.clock.sleep(self.command_latency)
+
+    def setAMState(self, on: bool):
+        self.clock.sleep(self.command_latency)
+
+
+class SimulatedFieldProbe(QObject):
+    """
+    Stand-in for ETSLindgrenHI6006. The probe publishes a new reading every
+    sample_interval, measured latency seconds earlier, with multiplicative noise and
+    quantized to the probe display resolution. readCurrentField() returns the latest
+    published reading, like the cached value of the real driver.
+    """
+
+    fieldIntensityReceived = pyqtSignal(float, float, float, float)
+
+    def __init__(self, clock: VirtualClock, plant: PlantModel, generator: SimulatedSignalGenerator,
+                 sample_interval: float = 0.05, latency: float = 0.1, noise: float = 0.02,
+                 resolution: float = 0.01, seed: int = 1):
+        """
+        Initialize the probe.
+
+        Parameters:
+            clock (VirtualClock): The shared simulated clock.
+            plant (PlantModel): The plant model.
+            generator (SimulatedSignalGenerator): The generator whose output is measured.
+            sample_interval (float): Time between probe readings in seconds.
+            latency (float): Age of a reading when it is published in seconds.
+            noise (float): Relative standard deviation of the reading.
+            resolution (float): Quantization step in V/m.
+            seed (int): Noise seed.
+        """
+        super().__init__()
+        self.clock = clock
+        self.plant = plant
+        self.generator = generator
+        self.sample_interval = sample_interval
+        self.latency = latency
+        self.noise = noise
+        self.resolution = resolution
+        self.rng = np.random.default_rng(seed)
+        self.sample_index = None
+        self.reading = (0.0, 0.0, 0.0, 0.0)
+        self.reads = []
+
+    def readCurrentField(self):
+        """
+        Returns:
+            tuple: The latest composite field and x, y, z components in V/m.
+        """
+        index = math.floor(self.clock.now / self.sample_interval)
+        if index != self.sample_index:
+            self.sample_index = index
+            frequency, power, rf_on = self.generator.state_at(index * self.sample_interval - self.latency)
+            field = float(self.plant.field(frequency, power)) if rf_on else 0.0
+            field *= 1.0 + self.noise * self.rng.standard_normal()
+            composite = max(0.0, round(field / self.resolution) * self.resolution)
+            # Split evenly across the axes; only the composite is used for leveling
+            axis = round(composite / math.sqrt(3.0) / self.resolution) * self.resolution
+            self.reading = (composite, axis, axis, axis)
+        self.reads.append((self.generator.frequency, self.reading[0]))
+        return self.reading
+
+
+class SweepReport:
+    """
+    Leveling metrics of a simulated sweep.
+
+    Attributes:
+        frequencies (np.ndarray): Swept frequencies in MHz.
+        iterations (np.ndarray): Probe reads needed at each frequency.
+        overshoot (np.ndarray): Highest reading above the target, relative to the target.
+        final_field (np.ndarray): Last reading at each frequency in V/m.
+        converged (np.ndarray): True where the final reading was inside the target window.
+        sweep_time (float): Simulated sweep duration in seconds.
+        wall_time (float): Real time the simulation took in seconds.
+        trace (ControlTrace or None): The FieldController's control trace of the sweep.
+    """
+
+    def __init__(self, target: float, threshold: float, reads: list, sweep_time: float, wall_time: float, trace=None):
+        self.trace = trace
+        frequencies = np.array([read[0] for read in reads])
+        fields = np.array([read[1] for read in reads])
+        # Consecutive reads at the same frequency belong to one leveling step
+        starts = np.flatnonzero(np.r_[True, frequencies[1:] != frequencies[:-1]])
+        self.frequencies = frequencies[starts]
+        self.iterations = np.diff(np.r_[starts, len(reads)])
+        self.overshoot = np.maximum(np.maximum.reduceat(fields, starts) / target - 1.0, 0.0)
+        self.final_field = fields[np.r_[starts[1:], len(reads)] - 1]
+        self.converged = (self.final_field > target) & (self.final_field < target * threshold)
+        self.sweep_time = sweep_time
+        self.wall_time = wall_time
+
+    def summary(self) -> str:
+        """
+        Returns:
+            str: A one-paragraph summary for comparing control strategies.
+        """
+        return (f'{len(self.frequencies)} frequencies, iterations mean {self.iterations.mean():.1f} '
+                f'p95 {np.percentile(self.iterations, 95):.0f} max {self.iterations.max()}, '
+                f'overshoot mean {100 * self.overshoot.mean():.1f} % max {100 * self.overshoot.max():.1f} %, '
+                f'converged {100 * self.converged.mean():.1f} %, '
+                f'sweep time {self.sweep_time:.1f} s simulated in {self.wall_time:.2f} s '
+                f'({self.sweep_time / max(self.wall_time, 1e-9):.0f}x real time)')
+
+
+def simulate_sweep(start: float, stop: float, sweep_term: float = 0.01, target: float = 1.0,
+                   pid_controller: PIDController | None = None, plant: PlantModel | None = None,
+                   dwell_time_ms: int = 0, quiet: bool = True, setup_model: SetupModel | None = None,
+                   **probe_options) -> SweepReport:
+    """
+    Run a complete FieldController sweep against the simulated plant.
+
+    Parameters:
+        start (float): Start frequency in MHz.
+        stop (float): Stop frequency in MHz.
+        sweep_term (float): Relative frequency step.
+        target (float): Target field in V/m.
+        pid_controller (PIDController or None): Controller gains to use; None selects stepper mode.
+        plant (PlantModel or None): Plant to use. Defaults to PlantModel().
+        dwell_time_ms (int): Dwell per frequency in milliseconds, added to the sweep time.
+        quiet (bool): Suppress the controller's console output.
+        setup_model (SetupModel or None): Model used to predict the starting power per step.
+        **probe_options: Extra SimulatedFieldProbe options such as latency or noise.
+
+    Returns:
+        SweepReport: Metrics of the sweep.
+    """
+    clock = VirtualClock()
+    plant = plant if plant is not None else PlantModel()
+    generator = SimulatedSignalGenerator(clock)
+    probe = SimulatedFieldProbe(clock, plant, generator, **probe_options)
+    wall_start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+        controller = FieldController(generator, probe, pid_controller)
+        controller.sleep = clock.sleep
+        controller.clock = clock.time
+        if pid_controller is not None:
+            pid_controller.clock = clock.time
+        controller.startDwell.connect(lambda ms: clock.sleep(ms / 1000.0))
+        controller.setStartFrequency(start)
+        controller.setStopFrequency(stop)
+        controller.setSweepTerm(sweep_term)
+        controller.setTargetField(target)
+        controller.dwell_time_ms = dwell_time_ms
+        controller.setSetupModel(setup_model)
+        controller.start_sweep()
+        while controller.is_sweeping:
+            controller.step_sweep()
+    return SweepReport(target, controller.threshold, probe.reads, clock.now, time.perf_counter() - wall_start, controller.trace)
+
+
+def simulate_autotune(start: float, stop: float, target: float = 1.0, method: str = 'imc',
+                      plant: PlantModel | None = None, quiet: bool = True, **probe_options) -> GainSchedule | None:
+    """
+    Run PIDAutoTuner against the simulated plant.
+
+    Parameters:
+        start (float): Lowest frequency in MHz.
+        stop (float): Highest frequency in MHz.
+        target (float): Field the experiments are run at in V/m.
+        method (str): 'imc' or 'ziegler-nichols'.
+        plant (PlantModel or None): Plant to use. Defaults to PlantModel().
+        quiet (bool): Suppress the tuner's console output.
+        **probe_options: Extra SimulatedFieldProbe options such as latency or noise.
+
+    Returns:
+        GainSchedule or None: The tuned schedule, or None if tuning failed.
+    """
+    clock = VirtualClock()
+    plant = plant if plant is not None else PlantModel()
+    generator = SimulatedSignalGenerator(clock)
+    probe = SimulatedFieldProbe(clock, plant, generator, **probe_options)
+    with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+        tuner = PIDAutoTuner(generator, probe)
+        tuner.sleep = clock.sleep
+        tuner.clock = clock.time
+        tuner.method = method
+        tuner.target_field = target
+        tuner.error.connect(print)
+        schedule = tuner.tune(start, stop)
+    print(f'Auto-tune took {clock.now:.1f} s simulated')
+    return schedule
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark FieldController leveling against a simulated plant')
+    parser.add_argument('--start', type=float, default=80.0, help='Start frequency in MHz')
+    parser.add_argument('--stop', type=float, default=1000.0, help='Stop frequency in MHz')
+    parser.add_argument('--term', type=float, default=0.01, help='Relative frequency step')
+    parser.add_argument('--target', type=float, default=1.0, help='Target field in V/m')
+    parser.add_argument('--latency', type=float, default=0.1, help='Probe latency in seconds')
+    parser.add_argument('--noise', type=float, default=0.02, help='Relative probe noise')
+    parser.add_argument('--pid', type=float, nargs=3, metavar=('KP', 'KI', 'KD'), help='Use PID mode with these gains')
+    parser.add_argument('--model', choices=('nominal', 'tables'), help='Predict the starting power from a setup model')
+    parser.add_argument('--autotune', choices=('imc', 'ziegler-nichols'), help='Use PID mode with auto-tuned gains')
+    args = parser.parse_args()
+
+    pid = PIDController(*args.pid) if args.pid else None
+    if args.autotune:
+        schedule = simulate_autotune(args.start, args.stop, args.target, args.autotune, quiet=False, latency=args.latency, noise=args.noise)
+        if schedule is None:
+            raise SystemExit(1)
+        print(f'Gains: default {schedule.default}, bands {schedule.bands}')
+        pid = PIDController(*schedule.default)
+        pid.setGainSchedule(schedule)
+    setup_model = PlantModel().setupModel(args.model == 'tables') if args.model else None
+    report = simulate_sweep(args.start, args.stop, args.term, args.target, pid, setup_model=setup_model,
+                            latency=args.latency, noise=args.noise)
+    print(f'{"PID" if pid else "Stepper"}: {report.summary()}')
+    print(report.trace.summary())
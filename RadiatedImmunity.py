@@ -9,24 +9,36 @@ from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 
-from qt_material import apply_stylesheet
-
 from MainWindow import Ui_MainWindow
 from SignalGenerator import AgilentN5181A, Time, Frequency
 from FieldProbe import ETSLindgrenHI6006
 from FieldController import FieldController
-from LivePlot import FrequencyPlot, PowerPlot
+from LivePlotGraph import RefreshScheduler
 from PID import PIDController
-from EquipmentLimits import EquipmentLimits
+from PIDAutoTune import PIDGainStore
+from PIDGainsPopUp import PIDGainsPopUp
+from SetupModel import SetupModel
+from EquipmentLimits import AMPLIFIERS, ANTENNAS, EquipmentLimits
+from SweepRecipe import SweepRecipe
+from SweepStore import SweepStore
 from ExportWidget import ExportWidget
+from IconCache import IconCache
 
+import importlib
+import os
 import sys
 import math
 import time
+from datetime import datetime
 import numpy as np
 
 class RadiatedImmunity(QMainWindow, Ui_MainWindow):
     
+    # kHz per unit of the AM frequency spin box
+    MOD_FREQ_KHZ = {Frequency.Hz.value: 0.001, Frequency.kHz.value: 1.0, Frequency.MHz.value: 1000.0}
+    # Live plot module per backend; matplotlib is only imported when it is selected
+    PLOT_BACKENDS = {'pyqtgraph': 'LivePlotGraph', 'matplotlib': 'LivePlot'}
+    
     def __init__(self, *args, **kwargs):
         super(RadiatedImmunity, self).__init__(*args, **kwargs)
         self.setupUi(self)
@@ -90,14 +102,19 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.antenna_gain = 10.0
         self.amplifier_gain = 40.0
         self.distance = 0.1
+        self.setup_model = SetupModel(self.amplifier_gain, self.antenna_gain, 0.0, self.distance)
         self.start_freq = 300.0
         self.stop_freq = 1000.0
         self.dwell_time = 0.5
         self.sweep_term = 0.01
         self.equipment_limits = EquipmentLimits(0.1, 0.1, 6000.0, 6000.0, 15.0)
+        self.settings_problem = None
+        self.recipe_directory = os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "Recipes")
         self.sweep_start_time = time.time()
         self.power_start_time = time.time()
-        self.field_data = []
+        self.sweep_store = None     # SweepStore of the current run
+        self.mod_freq_unit = Frequency.kHz.value  # Unit of spinBox_modFreq; the generator and recipes use kHz
+        self.sweep_directory = os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "Sweeps")
         
         self.single_alert_window = None
         
@@ -165,22 +182,22 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         
         # Closed-Loop Power Control
         self.pid_controller = PIDController(0.6, 0.0, 0.3) # Good @ 4 V/m with horn
+        self.gain_store = PIDGainStore()
+        self.menubar.addAction('PID Gains...', lambda: PIDGainsPopUp(self).exec_())
+        self.menubar.addAction('Load Recipe...', self.on_loadRecipe_triggered)
+        self.menubar.addAction('Save Recipe...', self.on_saveRecipe_triggered)
         
-        # Initiate Plots
+        # Initiate Plots: new telemetry marks them dirty and they are redrawn once per frame
+        self.plot_scheduler = RefreshScheduler(parent=self)
         self.sweep_plot_widget = QWidget(self)
-        self.sweep_plot = FrequencyPlot(self.sweep_plot_widget, width=4, height=3, dpi=100)
-        self.gridLayout_frequencyPlot.addWidget(self.sweep_plot)
-        
         self.power_plot_widget = QWidget(self)
-        self.field_plot = PowerPlot(self.power_plot_widget, width=4, height=3, dpi=100)
-        self.gridLayout_powerPlot.addWidget(self.field_plot)
-        
-        # Plot timers
-        self.sweep_timer = QTimer(self)
-        self.sweep_timer.timeout.connect(self.update_sweep_plot)
-        
-        self.field_timer = QTimer(self)
-        self.field_timer.timeout.connect(self.update_field_data_plot)
+        self.sweep_plot = None
+        self.field_plot = None
+        self.plot_backend = 'pyqtgraph'
+        self.createPlots()
+        self.action_matplotlibPlots = self.menubar.addAction('Matplotlib Plots')
+        self.action_matplotlibPlots.setCheckable(True)
+        self.action_matplotlibPlots.toggled.connect(self.on_matplotlibPlots_toggled)
 
         self.doubleSpinBox_sweepTerm.setValue(self.sweep_term)
         self.spinBox_startFreq.setValue(self.start_freq)
@@ -189,21 +206,16 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.comboBox_antenna.setCurrentIndex(0)
         self.label_validSettings.setText('Please Select Antenna and Amplifier')
         self.label_validSettings.setStyleSheet('color: red')
+        self.settings_problem = 'Please Select Antenna and Amplifier'
         
         # Other UI Setup
         self.pushButton_pauseSweep.setEnabled(False)
-        pixmap = QPixmap('broadcast-off.png')
-        scaledPixmap = pixmap.scaled(64, 64, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_rfOutState.setPixmap(scaledPixmap)
-        pixmap = QPixmap('thermometer.png')
-        scaledPixmap = pixmap.scaled(48, 48, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_temperatureTitle.setPixmap(scaledPixmap)
-        pixmap = QPixmap('battery.png')
-        scaledPixmap = pixmap.scaled(48, 48, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_chargeTitle.setPixmap(scaledPixmap)
-        mod_pixmap = QPixmap('modulation-off.png')
-        scaled_mod_pixmap = mod_pixmap.scaled(64, 64, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_modulationState.setPixmap(scaled_mod_pixmap)
+        self.pushButton_rfOn.setText('RF Off')
+        self.label_rfOutState.setPixmap(IconCache.pixmap('broadcast-off.png', 64, 64))
+        self.label_temperatureTitle.setPixmap(IconCache.pixmap('thermometer.png', 48, 48))
+        self.label_chargeTitle.setPixmap(IconCache.pixmap('battery.png', 48, 48))
+        self.pushButton_modulationOn.setText('Modulation Off')
+        self.label_modulationState.setPixmap(IconCache.pixmap('modulation-off.png', 64, 64))
         
         self.startDeviceDetection()
         
@@ -229,67 +241,59 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         
     def on_comboBox_amplifier_activated(self, amplifier: str):
         print(f"Amplifier Selected: {amplifier}")
-        if amplifier == 'AR 25A250AMB':
-            self.equipment_limits.setMaxPower(0.0)
-            self.equipment_limits.setAmplifierMinFrequency(1.0)
-            self.equipment_limits.setAmplifierMaxFrequency(300.0)
-            self.amplifier_gain = 45.0
-            self.label_amplifierStats.setText('Min Freq: 1 MHz\nMax Freq: 300 MHz\nPower In: 0 dBm')
-        elif amplifier == 'IFI SMX25':
-            self.equipment_limits.setMaxPower(0.0)
-            self.equipment_limits.setAmplifierMinFrequency(300.0)
-            self.equipment_limits.setAmplifierMaxFrequency(1000.0)
-            self.amplifier_gain = 45.0
-            self.label_amplifierStats.setText('Min Freq: 300 MHz\nMax Freq: 1000 MHz\nPower In: 0 dBm')
-        elif amplifier == 'IFI S3110':
-            self.equipment_limits.setMaxPower(0.0)
-            self.equipment_limits.setAmplifierMinFrequency(800.0)
-            self.equipment_limits.setAmplifierMaxFrequency(3000.0)
-            self.amplifier_gain = 45.0
-            self.label_amplifierStats.setText('Min Freq: 800 MHz\nMax Freq: 3000 MHz\nPower In: 0 dBm')
-        elif amplifier == 'MC ZVE8G':
-            self.equipment_limits.setMaxPower(0.0)
-            self.equipment_limits.setAmplifierMinFrequency(2000.0)
-            self.equipment_limits.setAmplifierMaxFrequency(8000.0)
-            self.amplifier_gain = 45.0
-            self.label_amplifierStats.setText('Min Freq: 2000 MHz\nMax Freq: 8000 MHz\nPower In: 0 dBm')
-        elif amplifier == 'Generic':
-            self.equipment_limits.setMaxPower(10.0)
-            self.equipment_limits.setAmplifierMinFrequency(700.0)
-            self.equipment_limits.setAmplifierMaxFrequency(3500.0)
-            self.amplifier_gain = 20.0
-            self.label_amplifierStats.setText('Min Freq: 700 MHz\nMax Freq: 3500 MHz\nPower In: 10 dBm')
-        elif amplifier == '--Please Select--':
-            self.pushButton_startSweep.setEnabled(False)
-            self.pushButton_rfOn.setEnabled(False)
-            self.pushButton_modulationOn.setEnabled(False)
+        if amplifier not in AMPLIFIERS:
+            self.disableOutputControls()
             return
+        spec = self.equipment_limits.setAmplifier(amplifier)
+        self.amplifier_gain = spec['gain']
+        self.label_amplifierStats.setText(spec['stats'])
+        self.field_controller.setMaxPower(self.equipment_limits.getMaxPower())
+        self.loadTunedGains()
+        self.updateSetupModel()
         self.applyFrequencyLimits(self.spinBox_startFreq.value(), self.spinBox_stopFreq.value())
         
-            
     def on_comboBox_antenna_activated(self, antenna: str):
         print(f"Antenna Selected: {antenna}")
-        if antenna == 'ETS 3143B':
-            self.equipment_limits.setAntennaMinFrequency(30.0)
-            self.equipment_limits.setAntennaMaxFrequency(3000.0)
-            self.antenna_gain = 5.0
-            self.label_antennaStats.setText('Min Freq: 30 MHz\nMax Freq: 3000 MHz')
-        elif antenna == 'EMCO 3155':
-            self.equipment_limits.setAntennaMinFrequency(1000.0)
-            self.equipment_limits.setAntennaMaxFrequency(18000.0)
-            self.antenna_gain = 5.0
-            self.label_antennaStats.setText('Min Freq: 1 GHz\nMax Freq: 18 GHz')
-        elif antenna == 'TekBox TBMA4':
-            self.equipment_limits.setAntennaMinFrequency(1000.0)
-            self.equipment_limits.setAntennaMaxFrequency(6000.0)
-            self.antenna_gain = 9.0
-            self.label_antennaStats.setText('Min Freq: 1 GHz\nMax Freq: 6 GHz')
-        elif antenna == '--Please Select--':
-            self.pushButton_startSweep.setEnabled(False)
-            self.pushButton_rfOn.setEnabled(False)
-            self.pushButton_modulationOn.setEnabled(False)
+        if antenna not in ANTENNAS:
+            self.disableOutputControls()
             return
+        spec = self.equipment_limits.setAntenna(antenna)
+        self.antenna_gain = spec['gain']
+        self.label_antennaStats.setText(spec['stats'])
+        self.loadTunedGains()
+        self.updateSetupModel()
         self.applyFrequencyLimits(self.spinBox_startFreq.value(), self.spinBox_stopFreq.value())
+        
+    def disableOutputControls(self):
+        self.settings_problem = 'Please Select Antenna and Amplifier'
+        self.pushButton_startSweep.setEnabled(False)
+        self.pushButton_rfOn.setEnabled(False)
+        self.pushButton_modulationOn.setEnabled(False)
+        
+    def setupName(self) -> str:
+        return f'{self.comboBox_amplifier.currentText()} / {self.comboBox_antenna.currentText()}'
+    
+    def updateSetupModel(self):
+        # Scalars from the selection, replaced by measured tables where ~/Documents/ImmuniSweep/Setup has them
+        self.setup_model.amplifier_gain_db = self.amplifier_gain
+        self.setup_model.antenna_gain_linear = self.antenna_gain
+        self.setup_model.distance = self.distance
+        self.setup_model.loadTables(self.comboBox_amplifier.currentText(), self.comboBox_antenna.currentText())
+        self.field_controller.setSetupModel(self.setup_model)
+    
+    def loadTunedGains(self):
+        # Level with the PID when the selected setup has been auto-tuned, otherwise with the stepper
+        schedule = self.gain_store.get(self.setupName())
+        if schedule is None:
+            self.pid_controller.setGainSchedule(None)
+            self.field_controller.setPIDController(None)
+        else:
+            self.applyGainSchedule(schedule)
+            
+    def applyGainSchedule(self, schedule):
+        self.pid_controller.setGainSchedule(schedule)
+        self.pid_controller.setGains(*schedule.default)
+        self.field_controller.setPIDController(self.pid_controller)
                 
     def on_spinBox_targetStrength_valueChanged(self, target):
         print(f"Spin box value changed: {target}")
@@ -319,29 +323,17 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.pushButton_pauseSweep.setEnabled(not enabled)
         
     def applyFrequencyLimits(self, start_freq: float, stop_freq: float) -> bool:
-        print(f"Start Frequency: {start_freq}, Stop Frequency: {stop_freq}, Min: {self.equipment_limits.getMinFrequency()}, Max: {self.equipment_limits.getMaxFrequency()}")
-        if start_freq < self.equipment_limits.getMinFrequency() or stop_freq < self.equipment_limits.getMinFrequency():
-            self.label_validSettings.setText('Invalid Setting: Frequency Too Low')
-            self.label_validSettings.setStyleSheet('color: red')
-            self.pushButton_startSweep.setEnabled(False)
-            self.pushButton_rfOn.setEnabled(False)
-            self.pushButton_modulationOn.setEnabled(False)
-            valid = False
-        elif start_freq > self.equipment_limits.getMaxFrequency() or stop_freq > self.equipment_limits.getMaxFrequency():
-            self.label_validSettings.setText('Invalid Setting: Frequency Too High')
-            self.label_validSettings.setStyleSheet('color: red')
-            self.pushButton_startSweep.setEnabled(False)
-            self.pushButton_rfOn.setEnabled(False)
-            self.pushButton_modulationOn.setEnabled(False)
-            valid = False
-        else:
-            self.label_validSettings.setText('Valid Settings')
-            self.label_validSettings.setStyleSheet('color: green')
-            self.pushButton_startSweep.setEnabled(True)
-            self.pushButton_rfOn.setEnabled(True)
-            self.pushButton_modulationOn.setEnabled(True)
-            valid = True
-        return valid
+        # Runs on every spin box change: compare against the selected limits and touch the widgets only when the verdict changes
+        reason = self.equipment_limits.checkFrequencies(start_freq, stop_freq)
+        problem = None if reason is None else f'Invalid Setting: {reason}'
+        if problem != self.settings_problem:
+            self.settings_problem = problem
+            self.label_validSettings.setText(problem or 'Valid Settings')
+            self.label_validSettings.setStyleSheet('color: red' if problem else 'color: green')
+            self.pushButton_startSweep.setEnabled(problem is None)
+            self.pushButton_rfOn.setEnabled(problem is None)
+            self.pushButton_modulationOn.setEnabled(problem is None)
+        return problem is None
     
     @pyqtSlot(str)            
     def on_fieldController_highFieldDetected(self, message: str):
@@ -368,7 +360,7 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
             self.field_controller.setStopFrequency(float(freq))
             self.field_controller.setStartFrequency(self.spinBox_startFreq.value())
             self.stop_freq = float(freq)
-            self.start_freq = self.spinBox_stopFreq.value()
+            self.start_freq = self.spinBox_startFreq.value()
             self.reset_sweep_plot_view()
 
     def on_spinBox_dwell_valueChanged(self, time: float):
@@ -389,26 +381,150 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.field_controller.setSweepTerm(float(term))
         self.reset_sweep_plot_view()
     
+    def createPlots(self):
+        """
+        Create the live plots with the selected backend, releasing the current ones.
+        """
+        plots = importlib.import_module(self.PLOT_BACKENDS[self.plot_backend])
+        self.releasePlots()
+        self.sweep_plot = plots.FrequencyPlot(self.sweep_plot_widget, width=4, height=3, dpi=100, scheduler=self.plot_scheduler)
+        self.gridLayout_frequencyPlot.addWidget(self.sweep_plot)
+        self.field_plot = plots.PowerPlot(self.power_plot_widget, width=4, height=3, dpi=100, scheduler=self.plot_scheduler)
+        self.gridLayout_powerPlot.addWidget(self.field_plot)
+
+    def releasePlots(self):
+        for plot, layout in ((self.sweep_plot, self.gridLayout_frequencyPlot), (self.field_plot, self.gridLayout_powerPlot)):
+            if plot is not None:
+                layout.removeWidget(plot)
+                plot.release()
+        self.sweep_plot = None
+        self.field_plot = None
+
+    def on_matplotlibPlots_toggled(self, checked: bool):
+        backend = 'matplotlib' if checked else 'pyqtgraph'
+        if backend == self.plot_backend:
+            return
+        if self.sweep_in_progress:
+            # The plots hold the running sweep; keep the current backend
+            self.action_matplotlibPlots.blockSignals(True)
+            self.action_matplotlibPlots.setChecked(not checked)
+            self.action_matplotlibPlots.blockSignals(False)
+            self.statusbar.showMessage('Stop the sweep before changing the plot backend')
+            return
+        print(f'Plot backend: {backend}')
+        self.plot_backend = backend
+        self.createPlots()
+        self.reset_sweep_plot_view()
+
     def reset_sweep_plot_view(self):
         self.sweep_plot.init_plot(0.0, self.field_controller.getSweepTime(), self.field_controller.getStartFrequency(), self.field_controller.getStopFrequency())
         self.field_plot.rescale_plot(self.field_controller.getStartFrequency(), self.field_controller.getStopFrequency(), 0.0, (self.field_controller.getTargetField() * 3.0))
     
+    def currentRecipe(self) -> SweepRecipe:
+        """
+        The sweep settings of the UI as a recipe.
+
+        Raises:
+            ValueError: If the settings are invalid for the selected equipment.
+        """
+        dwell = self.spinBox_dwell.value()
+        unit = self.comboBox_dwellUnit.currentText()
+        if unit == Time.Millisecond.value:
+            dwell /= 1000.0
+        elif unit == Time.Microsecond.value:
+            dwell /= 1000000.0
+        return SweepRecipe(amplifier=self.comboBox_amplifier.currentText(), antenna=self.comboBox_antenna.currentText(),
+                           start=self.spinBox_startFreq.value(), stop=self.spinBox_stopFreq.value(),
+                           term=self.doubleSpinBox_sweepTerm.value(), target=self.spinBox_targetStrength.value(),
+                           dwell=dwell, distance=self.distance, amplifier_gain=self.amplifier_gain,
+                           antenna_gain=self.antenna_gain,
+                           modulation={'enabled': self.modulation_on, 'depth': self.spinBox_modDepth.value(),
+                                       'frequency': self.modFrequencyKHz(self.spinBox_modFreq.value())})
+    
+    def applyRecipe(self, recipe: SweepRecipe):
+        # Set the widgets; their handlers apply the values as if entered by hand
+        self.comboBox_amplifier.setCurrentText(recipe.amplifier)
+        self.comboBox_antenna.setCurrentText(recipe.antenna)
+        self.doubleSpinBox_sweepTerm.setValue(recipe.term)
+        self.spinBox_startFreq.setValue(recipe.start)
+        self.spinBox_stopFreq.setValue(recipe.stop)
+        self.spinBox_targetStrength.setValue(recipe.target)
+        self.comboBox_dwellUnit.setCurrentText(Time.Second.value)
+        self.spinBox_dwell.setValue(recipe.dwell)
+        self.spinBox_modDepth.setValue(recipe.modulation['depth'])
+        freq, unit = self.applyModFrequencyUnits(recipe.modulation['frequency'], Frequency.kHz.value)
+        # Change unit and value silently, then apply once: the same number in another unit emits nothing
+        self.spinBox_modFreq.blockSignals(True)
+        self.setModFrequencyUnit(unit)
+        self.spinBox_modFreq.setValue(freq)
+        self.spinBox_modFreq.blockSignals(False)
+        self.spinBox_modFreq_valueChanged(self.spinBox_modFreq.value())
+        
+    def on_loadRecipe_triggered(self):
+        path, _ = QFileDialog.getOpenFileName(self, 'Load Sweep Recipe', self.recipe_directory, 'Sweep Recipes (*.json *.toml)')
+        if not path:
+            return
+        try:
+            recipes = SweepRecipe.load(path)
+        except (OSError, ValueError) as e:
+            self.displayAlert(f'Invalid recipe file: {str(e)}')
+            return
+        if len(recipes) > 1:
+            self.displayAlert(f'{len(recipes)} recipes in file; loading the first. Run all of them with HeadlessSweep.py.')
+        self.applyRecipe(recipes[0])
+        
+    def on_saveRecipe_triggered(self):
+        try:
+            recipe = self.currentRecipe()
+        except ValueError as e:
+            self.displayAlert(f'Invalid sweep settings: {str(e)}')
+            return
+        os.makedirs(self.recipe_directory, exist_ok=True)
+        path, _ = QFileDialog.getSaveFileName(self, 'Save Sweep Recipe', self.recipe_directory, 'Sweep Recipes (*.json)')
+        if path:
+            SweepRecipe.save(path, [recipe])
+    
     def on_pushButton_startSweep_pressed(self):
+        # Validated once and compiled (or taken from the plan cache); the sweep then only looks steps up
+        try:
+            recipe = self.currentRecipe()
+            plan = recipe.plan()
+        except ValueError as e:
+            self.displayAlert(f'Invalid sweep settings: {str(e)}')
+            return
+        if not self.openSweepStore(recipe):
+            return
+        self.field_controller.loadPlan(plan)
         self.sweep_plot.clear_plot()
         self.field_plot.clear_plot()
-        self.field_data = []
         self.sweep_start_time = time.time()
         self.sweep_in_progress = True
-        self.sweep_timer.start(100)
-        self.field_timer.start(500)
         self.toggleSweepUI(enabled=False)
         self.field_controller.start_sweep()
     
+    def openSweepStore(self, recipe: SweepRecipe) -> bool:
+        # Every step of this run, retries included, is appended to one store file instead of being kept in RAM
+        if self.sweep_store is not None:
+            self.sweep_store.close()
+            self.sweep_store = None
+        path = os.path.join(self.sweep_directory, f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.sweep")
+        try:
+            os.makedirs(self.sweep_directory, exist_ok=True)
+            self.sweep_store = SweepStore(path, info={'test': 'Radiated Immunity'})
+            self.sweep_store.beginSweep(recipe.to_dict())
+        except (OSError, ValueError) as e:
+            self.displayAlert(f'Unable to create the sweep data file {path}: {str(e)}')
+            return False
+        print(f"Recording sweep to {path}")
+        return True
+    
     def on_pushButton_pauseSweep_pressed(self):
         self.field_controller.stop_sweep()
     
     def complete_sweep(self):    
-        self.sweep_timer.stop()
+        # Close the last step of the frequency plot at the end time
+        self.update_sweep_plot(self.output_frequency)
+        self.sweep_in_progress = False
         self.toggleSweepUI(enabled=True)
         
     def spinBox_modDepth_valueChanged(self, percent: float):
@@ -439,7 +555,18 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
             unit = Frequency.kHz.value
         return float(freq), str(unit)
     
+    def modFrequencyKHz(self, freq: float) -> float:
+        # Convert a spinBox_modFreq value from its displayed unit to kHz
+        return freq * self.MOD_FREQ_KHZ[self.mod_freq_unit]
+    
+    def setModFrequencyUnit(self, unit: str):
+        # Show the AM frequency in another unit, with the spin box range of that unit from applyModFrequencyUnits
+        self.mod_freq_unit = unit
+        self.label_modFreq.setText(f'AM Frequency ({unit})')
+        self.spinBox_modFreq.setMaximum({Frequency.Hz.value: 1000.0, Frequency.MHz.value: 20.0}.get(unit, 10000.0))
+    
     def spinBox_modFreq_valueChanged(self, freq: float):
+        freq = self.modFrequencyKHz(freq)
         if freq > 20000.0 or freq < 0.0001:
             self.label_validSettings.setText('Invalid AM Frequency Setting')
             self.label_validSettings.setStyleSheet('color: red')
@@ -485,9 +612,7 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
     @pyqtSlot(str, str, str, str)
     def on_fieldProbe_identityReceived(self, model: str, revision: str, serial: str, calibration: str):
         self.pushButton_detectFieldProbe.hide()
-        pixmap = QPixmap('HI-6006.png')
-        scaledPixmap = pixmap.scaled(275, 128, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_fieldProbe.setPixmap(scaledPixmap)
+        self.label_fieldProbe.setPixmap(IconCache.pixmap('HI-6006.png', 275, 128))
         self.label_fieldProbeName.setText('ETS Lindgren ' + model + ' Serial: ' + serial)
 
     @pyqtSlot(float, float, float, float)
@@ -496,11 +621,7 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.updateFieldStrengthUI(composite, x, y, z)
             
     def calculatePowerOut(self) -> float:
-        power_watts = (math.pow(self.pid_controller.getTargetValue(), 2) * math.pow(self.distance, 2)) / (30.0 * self.antenna_gain)
-        power_dbm = 10 * math.log10(power_watts * 1000)
-        power_dbm -= self.amplifier_gain
-        #print(f"Power in dBm: {power_dbm}")
-        return power_dbm
+        return self.setup_model.powerFor(self.output_frequency, self.target_field_strength)
     
     def updateFieldStrengthUI(self, composite: float, x: float, y: float, z: float):
         self.lcdNumber_avgStrength.display(composite)
@@ -517,10 +638,12 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.x_field = x
         self.y_field = y
         self.z_field = z
-        current_field = (self.output_frequency, self.measured_field_strength)
-        self.field_data.append(current_field)
-        
-    def update_field_data_plot(self):
+        if self.sweep_store is not None:
+            # Record the power the field was measured at, as logged by the leveling loop
+            power, iterations, status = self.field_controller.trace.stepResult()
+            self.sweep_store.append(self.output_frequency, self.output_power if power is None else power, composite, x, y, z,
+                                    self.field_controller.getTargetField(), iterations, status)
+        # Emitted once per completed step, so every step adds exactly one point
         self.field_plot.update_plot(self.output_frequency, setpoint = self.field_controller.getTargetField(), composite=self.measured_field_strength, x=self.x_field, y=self.y_field, z=self.z_field)
     
     def on_fieldProbe_batteryReceived(self, level: int):
@@ -543,18 +666,16 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.displaySingleAlert("Probe Connection:" + message)
     
     def on_sigGen_rfOutSet(self, on: bool):
-        if on:
-            #self.field_plot.clear_plot()
-            pixmap = QPixmap('broadcast-on.png')
-            self.power_start_time = time.time()
-            #self.field_timer.start(100)  # Update every 100 ms
-            self.pushButton_rfOn.setText('RF On')
-        else:
-            pixmap = QPixmap('broadcast-off.png')
-            self.field_timer.stop()
-            self.pushButton_rfOn.setText('RF Off')
-        scaledPixmap = pixmap.scaled(64, 64, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_rfOutState.setPixmap(scaledPixmap)
+        # The generator poll repeats the state; only a change swaps the icon and resets the PID
+        if on != self.output_on:
+            if on:
+                self.power_start_time = time.time()
+                self.pushButton_rfOn.setText('RF On')
+            else:
+                self.pushButton_rfOn.setText('RF Off')
+            self.label_rfOutState.setPixmap(IconCache.pixmap('broadcast-on.png' if on else 'broadcast-off.png', 64, 64))
+            # The power is unchanged by an RF toggle: restart the PID from it
+            self.field_controller.pid_controller.reset(self.output_power)
         self.output_on = on
         if self.comboBox_amplifier.currentIndex() == 0 or self.comboBox_antenna.currentIndex() == 0:
             self.pushButton_startSweep.setEnabled(False)
@@ -562,7 +683,6 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
             self.pushButton_modulationOn.setEnabled(False)
             self.label_validSettings.setText('Please Select Antenna and Amplifier')
             self.label_validSettings.setStyleSheet('color: red')
-        self.field_controller.pid_controller.clear()
     
     def on_sigGen_instrumentDetected(self, detected: bool):
         if detected:
@@ -581,9 +701,7 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         model = identity[1]
         serial = identity[2]
         self.label_sigGenName.setText(company + ' ' + model + ' Serial: ' + serial)
-        pixmap = QPixmap('AgilentN5181A.png')
-        scaledPixmap = pixmap.scaled(275, 128, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_sigGen.setPixmap(scaledPixmap)
+        self.label_sigGen.setPixmap(IconCache.pixmap('AgilentN5181A.png', 275, 128))
         # Initialize sig gen to match UI
         self.signal_generator.setRFOut(False)
         self.signal_generator.setModulationState(False)
@@ -592,13 +710,17 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         
     def on_fieldController_frequencySet(self, frequency: float):
         print("Frequency Set: " + str(frequency))
+        previous_frequency = self.output_frequency
         self.output_frequency = frequency
         self.lcdNumber_freqOut.display(round(frequency, 9))
-        #self.sweep_plot.update_plot(time.time() - self.sweep_start_time, frequency)
+        if self.sweep_in_progress:
+            self.update_sweep_plot(previous_frequency)
         
-    def update_sweep_plot(self):
+    def update_sweep_plot(self, previous_frequency: float):
+        # Plot a step: hold the previous frequency up to now, then jump to the new one
         t = time.time() - self.sweep_start_time
-        #print("Elapsed Time: " + str(t) + " Current Frequency: " + str(self.output_frequency))
+        if self.sweep_plot.sample_count():
+            self.sweep_plot.update_plot(t, previous_frequency)
         self.sweep_plot.update_plot(t, self.output_frequency)
     
     def on_fieldController_powerUpdated(self, power: float):
@@ -625,36 +747,36 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         print("Button Clicked: " + str(button.text()))
         if button.text() == '&Yes':
             self.sweep_in_progress = True
-            self.sweep_timer.start(100)
-            self.field_timer.start(500)
             self.toggleSweepUI(enabled=False)
+            if self.sweep_store is not None:
+                self.sweep_store.beginSweep({'retry_missed': True})
             self.field_controller.sweep_missed_frequencies()
         else:
             self.export_field_data()
         self.alert_window = None
         
     def export_field_data(self):
-        self.export_widget = ExportWidget(self.field_data)
+        field_data = []
+        if self.sweep_store is not None:
+            _, records = SweepStore.read(self.sweep_store.path)
+            field_data = list(zip(records['frequency'].tolist(), records['composite'].tolist()))
+        self.export_widget = ExportWidget(field_data, self.field_controller.trace)
         self.export_widget.show()
         
     def on_fieldController_sweepStatus(self, percent: float):
         self.lcdNumber_sweepProgress.display(percent)
         
     def on_sigGen_modStateSet(self, on: bool):
+        if on == self.modulation_on:
+            return
         print("Modulation State Set: " + str(on))
-        if on:
-            self.pushButton_modulationOn.setText('Modulation On')
-            mod_pixmap = QPixmap('modulation-on.png')
-        else:
-            self.pushButton_modulationOn.setText('Modulation Off')
-            mod_pixmap = QPixmap('modulation-off.png')
-        scaled_mod_pixmap = mod_pixmap.scaled(64, 64, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
-        self.label_modulationState.setPixmap(scaled_mod_pixmap)
+        self.pushButton_modulationOn.setText('Modulation On' if on else 'Modulation Off')
+        self.label_modulationState.setPixmap(IconCache.pixmap('modulation-on.png' if on else 'modulation-off.png', 64, 64))
         self.modulation_on = on
     
     def on_sigGen_modFrequencySet(self, modType: int, frequency: float):
         self.spinBox_modFreq.valueChanged.disconnect()
-        self.spinBox_modFreq.setValue(frequency)
+        self.spinBox_modFreq.setValue(frequency / self.MOD_FREQ_KHZ[self.mod_freq_unit])
         self.spinBox_modFreq.valueChanged[float].connect(self.spinBox_modFreq_valueChanged)
     
     def on_sigGen_modDepthSet(self, depth: float):
@@ -674,6 +796,9 @@ class RadiatedImmunity(QMainWindow, Ui_MainWindow):
         self.displaySingleAlert(message)
     
     def closeEvent(self, event):
+        if self.sweep_store is not None:
+            self.sweep_store.close()
+        self.releasePlots()
         self.field_probe.stop()
         self.signal_generator.stop()
         self.field_controller_thread.quit()
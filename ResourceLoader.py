@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Resource Loader Module
+======================
+This module registers the UI images (the :/icons resources listed in Resources.qrc)
+with Qt on first use. The preferred source is the binary bundle Resources.rcc, which
+QResource.registerResource memory-maps, so images are paged in only when they are
+decoded and Python never holds the bytes. Only when the .rcc file is missing or cannot
+be registered is the generated Python module Resources imported instead.
+
+pyrcc5 only writes Python modules, so the .rcc bundle is produced from the generated
+module. After changing Resources.qrc:
+
+    pyrcc5 -o Resources.py Resources.qrc
+    python ResourceLoader.py
+
+Functions:
+    register_resources: Register the resources once, from the .rcc file if possible.
+    write_rcc: Write the binary bundle from the generated Python module.
+"""
+
+import os
+import struct
+
+from PyQt5.QtCore import QResource
+
+RCC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Resources.rcc')
+
+registered_from = None
+
+
+def register_resources() -> str | None:
+    """
+    Register the resources, if not done yet.
+
+    Returns:
+        str or None: What they were registered from: the .rcc path, 'Resources' for the
+        Python module, or None if neither is available.
+    """
+    global registered_from
+    if registered_from is not None:
+        return registered_from
+    if os.path.isfile(RCC_PATH) and QResource.registerResource(RCC_PATH):
+        registered_from = RCC_PATH
+        return registered_from
+    print(f'Unable to register {RCC_PATH}; importing the Resources module')
+    try:
+        import Resources  # Registers its embedded data on import
+    except ImportError as e:
+        print(f'No UI resources available: {str(e)}')
+        return None
+    registered_from = 'Resources'
+    return registered_from
+
+
+def write_rcc(path: str = RCC_PATH) -> int:
+    """
+    Write the resources of the generated Resources module as a binary .rcc bundle: the
+    'qres' header, then the file data, names and tree exactly as pyrcc5 emitted them.
+
+    Parameters:
+        path (str): Destination file.
+
+    Returns:
+        int: Size of the written file in bytes.
+    """
+    import Resources
+    header_size = 20
+    data_offset = header_size
+    name_offset = data_offset + len(Resources.qt_resource_data)
+    tree_offset = name_offset + len(Resources.qt_resource_name)
+    with open(path, 'wb') as file:
+        file.write(b'qres')
+        file.write(struct.pack('>IIII', Resources.rcc_version, tree_offset, data_offset, name_offset))
+        file.write(Resources.qt_resource_data)
+        file.write(Resources.qt_resource_name)
+        file.write(Resources.qt_resource_struct)
+    return tree_offset + len(Resources.qt_resource_struct)
+
+
+if __name__ == '__main__':
+    size = write_rcc()
+    print(f'Wrote {size} bytes to {RCC_PATH}')
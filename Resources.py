@@ -2,2374 +2,13 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x1f\x6a\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x00\x00\x01\x00\
-\x01\x00\x00\xff\xdb\x00\x84\x00\x0a\x07\x08\x15\x15\x15\x18\x15\
-\x15\x15\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x1c\x1a\x18\x18\
-\x19\x18\x18\x18\x19\x1a\x18\x18\x18\x1a\x1c\x21\x2e\x25\x1c\x21\
-\x2b\x21\x1a\x18\x26\x3a\x27\x2b\x2f\x31\x35\x35\x35\x1a\x24\x3e\
-\x40\x3b\x34\x3f\x2e\x34\x35\x31\x01\x0c\x0c\x0c\x10\x0f\x10\x1a\
-\x12\x12\x1a\x34\x21\x23\x21\x3f\x34\x3f\x34\x31\x3f\x34\x34\x31\
-\x3a\x34\x31\x40\x34\x36\x35\x3f\x31\x36\x34\x31\x35\x31\x34\x31\
-\x34\x31\x34\x34\x34\x34\x34\x34\x34\x34\x3f\x34\x31\x31\x31\x31\
-\x31\x34\x34\x34\x31\x34\x34\x34\x34\xff\xc0\x00\x11\x08\x00\x7b\
-\x01\x99\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\xff\xc4\x00\x1b\
-\x00\x00\x01\x05\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x02\x03\x05\x06\x04\x07\xff\xc4\x00\x4c\x10\x00\x02\
-\x00\x04\x02\x03\x0b\x08\x06\x06\x0a\x03\x01\x01\x00\x00\x01\x02\
-\x00\x03\x11\x12\x04\x21\x05\x31\x51\x06\x13\x14\x15\x22\x41\x61\
-\x71\x91\x92\xd1\x16\x32\x52\x53\x54\x81\xa1\xd2\x42\x93\xa2\xb1\
-\xc1\xe2\x07\x23\x62\x63\xd3\xf0\x17\x34\x43\x73\x82\x94\xa3\xb2\
-\xe1\xe3\x44\x64\x72\xc2\x33\xff\xc4\x00\x19\x01\x01\x01\x01\x01\
-\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\
-\x04\x05\xff\xc4\x00\x24\x11\x01\x00\x02\x01\x03\x04\x02\x03\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x01\x11\x02\x03\x21\x51\x12\x13\
-\x31\x41\x91\xa1\x04\x61\x71\x22\xff\xda\x00\x0c\x03\x01\x00\x02\
-\x11\x03\x11\x00\x3f\x00\xf6\x68\x20\x82\x00\x82\x08\x20\x08\x23\
-\x97\x1b\x8e\x97\x28\x55\xd8\x0d\x83\x59\x3d\x43\x9e\x33\x1a\x4b\
-\x74\x0e\xf5\x54\xe4\x2e\xdf\xa4\x7a\xcf\x37\xbb\xb6\x03\x43\x8c\
-\xd2\xd2\x65\x9b\x59\xb3\xd8\x01\x62\x3a\xe9\xaa\x20\xf2\x86\x46\
-\xd6\xee\x98\xc6\x5d\x05\xd1\x2d\x5b\x54\xd3\xd2\x0f\xd3\x23\xad\
-\x5b\xc2\x24\xe3\xbc\x3f\xac\x1d\x8d\xe1\x18\x6b\xa0\xba\x16\x8d\
-\xcf\x1d\x61\xfd\x60\xec\x6f\x08\x5e\x39\x91\xeb\x07\x61\xf0\x8c\
-\x35\x60\xac\x2c\x6e\x78\xe2\x47\xac\x5f\x8f\x84\x2f\x1b\xc8\xf5\
-\x8b\xf1\x8c\x2d\x60\xb8\x42\xc6\xeb\x8d\xe4\x7a\xc5\x85\xe3\x69\
-\x1e\xb5\x3b\x63\x09\x70\x85\xb8\x42\xc6\xeb\x8d\xa4\x7a\xd4\xed\
-\x85\xe3\x59\x1e\xb5\x3b\x44\x61\x2e\x10\x5c\x21\x63\x77\xc6\x92\
-\x3d\x6a\x77\x84\x1c\x69\x23\xd6\xa7\x78\x46\x12\xe8\x2e\x85\x8d\
-\xdf\x1a\x48\xf5\xa9\xde\x10\x71\xa4\x8f\x5a\x9d\xe1\x18\x3a\xc1\
-\x58\x58\xde\x71\xa4\x8f\x5a\x9d\xe1\x07\x1a\x48\xf5\xa9\xde\x11\
-\x82\xba\x0b\xa1\x63\x7b\xc6\x92\x3d\x6a\x77\x84\x1c\x6b\x23\xd6\
-\xa7\x78\x46\x0a\xf8\x4b\xa1\x63\x7d\xc6\xb2\x3d\x6a\x76\x88\x4e\
-\x36\x91\xeb\x53\xb6\x30\x57\x42\x56\x16\x37\xdc\x6d\x23\xd6\xa7\
-\x6c\x27\x1b\xc8\xf5\xa9\xdb\x18\x2a\xc2\x56\x16\x37\xbc\x73\x23\
-\xd6\xac\x1c\x73\x23\xd6\xaf\xc7\xc2\x30\x55\x82\xb0\xb1\xbc\xe3\
-\xac\x3f\xad\x5f\x8f\x84\x27\x1d\x61\xfd\x60\xec\x3e\x11\x83\xac\
-\x25\x61\x63\x79\xc7\xb8\x7f\x58\x3b\x1b\xc2\x0e\x3d\xc3\xfa\xc1\
-\xd8\xde\x11\x83\xac\x25\x61\x63\x79\xc7\xd8\x7f\x5a\x3b\xad\xe1\
-\x07\x1f\xe1\xfd\x67\xd9\x7f\x96\x30\x75\x84\xac\x2c\x6f\x3c\xa0\
-\xc3\xfa\xcf\xb2\xff\x00\x2c\x27\x94\x38\x6f\x59\xf6\x5f\xe5\x8c\
-\x24\x25\x60\x37\x7e\x50\xe1\xbd\x67\xd9\x7f\x96\x13\xca\x2c\x37\
-\xac\x3d\xc7\xf0\x8c\x24\x10\x46\xe1\xf7\x4d\x87\x1a\x99\x8f\x52\
-\x9f\xc6\x90\xcf\x2a\x64\x6c\x7e\xe8\xf1\x8c\x4c\x10\x1e\x85\x80\
-\xd3\x12\x67\x1a\x23\x72\xb6\x30\xa1\x3d\x5b\x7d\xd1\x65\x1e\x56\
-\x1a\x99\x8c\xa3\x41\xa2\xf7\x4e\xc9\x45\x9d\x57\x5f\x48\x79\xc3\
-\xaf\xd2\xfb\xfa\xe2\xab\x69\x04\x73\xe1\x71\x49\x31\x6e\x46\x0c\
-\x0f\x38\xfb\x88\xe6\x3d\x11\xd1\x00\x41\x04\x10\x04\x10\x41\x00\
-\x41\x04\x31\xf5\x1e\xa3\x01\xcf\x37\x1b\x2d\x4d\x19\xc0\x3b\x35\
-\xf6\xd2\x2a\x34\x8e\x9b\x7c\xd6\x4a\xff\x00\x8c\x95\xfb\x2a\x4f\
-\xdf\xd9\x14\x5a\x6f\x4b\xbc\x92\x02\xa1\x62\xc8\xe5\x72\x34\x67\
-\x52\x81\x25\xd6\x94\x05\xcb\x9a\x57\xd1\x31\x2e\x85\xc5\xcd\x9a\
-\x85\xe6\xa5\x86\xa2\x82\x85\x4d\x0a\x21\x35\x0c\x01\xc9\x8b\x8f\
-\xf0\xc1\x5c\x93\x65\x4d\x62\x59\xb9\x44\xeb\x25\x94\x9f\xbe\x1b\
-\xc1\x5f\xd1\x1d\xe5\xf1\x8b\xef\xe7\x9a\x1a\xe4\xff\x00\x34\xd8\
-\x62\x0a\x3e\x08\xfb\x07\x79\x7c\x60\xe0\x8f\xb0\x77\x97\xc6\x25\
-\xc3\xe9\xc2\xf3\x19\x12\x5b\xf2\x6e\x04\x95\x03\x96\xb4\x65\x53\
-\x97\x26\xe4\x65\x61\x5e\x66\x00\x8a\xd4\x0e\x83\x8d\x9d\x4a\xef\
-\x07\xaa\xe5\xae\xae\xaa\x40\xa7\x17\x04\x7d\x83\xbc\xbe\x30\x70\
-\x47\xd8\x3b\xcb\xe3\x16\x58\x6c\x54\xc6\x6a\x34\xb2\x83\xd2\x2c\
-\xa7\xb0\x01\xf7\xd2\x29\xe5\x6e\x82\x63\x02\x69\x2e\xa1\x19\xa8\
-\x1d\x5b\xcd\x49\x8c\x49\x35\xc8\x55\x3e\x0d\xcf\x01\x3f\x05\x7d\
-\x83\xbc\xbe\x30\x70\x57\xd8\x3b\xcb\xe3\x13\x60\x74\xc1\x77\x08\
-\xec\x82\xaa\x33\x57\x96\x79\x6c\xd4\x44\xa0\x24\x93\x40\x61\xf8\
-\x9d\x36\x8b\x6d\x85\x66\x5c\x68\x68\xf2\xd0\x8c\xc0\xad\xad\x42\
-\x75\xf3\x40\x73\x70\x37\xd8\x3b\xc3\xc6\x0e\x06\xfb\x07\x78\x78\
-\xc4\xa9\xa7\xd4\xf3\x01\x9a\x8c\xe6\x49\x19\x16\xa1\x6a\x16\xae\
-\x59\x9d\x59\xd2\x3a\xb4\x66\x93\xdf\xab\x95\xa5\x40\xad\x1e\x5b\
-\xeb\xaf\xa0\x4e\xce\x7a\x40\x70\x70\x37\xd8\x3b\xc2\x0e\x06\xfb\
-\x07\x68\x8b\xdb\x8e\xdf\xba\x16\xe3\xb7\xee\x81\x4a\x1e\x06\xfb\
-\x07\x68\x83\x81\xbe\xc1\xda\x22\xfa\xe3\xb7\xee\x82\xe3\xb7\xee\
-\x81\x4a\x1e\x06\xfb\x07\x68\x83\x81\xbe\xc1\xde\x11\x7d\x71\xdb\
-\xf7\x42\xdc\x76\xc0\xa5\x07\x03\x7d\x83\xbc\x21\x38\x1b\xec\x1d\
-\xa2\x34\x17\x1d\xb0\x5c\x76\xc0\xa6\x7f\x81\xbe\xc1\xde\x10\x70\
-\x37\xe8\xef\x08\xd0\x5c\x76\xc1\x53\xb6\x05\x33\xfc\x0d\xfa\x3b\
-\xc2\x0e\x06\xfd\x1d\xa2\x34\x15\x3b\x60\x42\x49\x39\xfd\xdb\x07\
-\x8c\x0a\x67\xf8\x1b\xf4\x76\x88\x38\x1b\xf4\x76\x88\xd2\x53\xae\
-\x0a\x75\xc1\x19\xae\x04\xfb\x07\x68\x83\x81\x3e\xc1\xda\x23\x49\
-\x48\x5a\x40\x66\xb8\x13\xec\x1d\xa2\x0e\x04\xfd\x1d\xb1\xa5\xa4\
-\x47\x36\x62\xa8\xa9\x34\xe6\xe7\xfc\x20\x33\xbc\x09\xfa\x3b\x61\
-\x38\x13\xf4\x76\xc6\x92\x5b\x86\x15\x04\xd3\xdf\xcc\x69\xcf\x0e\
-\x80\xcc\xf0\x27\xe8\xed\x83\x80\xbf\x47\x6c\x69\xcc\x27\xbe\x03\
-\x33\xc0\x5f\xa3\xb7\xfe\x20\xe0\x0f\xd1\xdb\x17\x4f\x8d\xa1\xa5\
-\x3e\xd2\xf8\xc2\x0c\x77\xec\xfd\xb5\x8a\x29\x78\x0b\xf4\x76\xc1\
-\xc0\x5f\xa3\xb7\xfe\x22\xe7\x87\xf4\x0e\xfa\xc3\x66\xe9\x12\x05\
-\x42\x06\x3b\x2f\x41\xf1\x80\xa7\xe0\x2f\xd1\xdb\xff\x00\x10\x70\
-\x17\xe8\xf8\xf8\x45\xa4\xad\x28\xc4\x8a\xcb\xb7\x56\x77\xa1\xd7\
-\xaf\xb3\xc6\x26\x38\xef\xd9\x1d\xf5\x80\xa4\xe0\x2f\xd1\xf1\xf0\
-\x83\x80\xbf\x47\xc7\xc2\x2e\xf8\x77\x40\xef\xac\x1c\x3b\xf6\x47\
-\x7d\x60\x29\x38\x0b\xf4\x7c\x7c\x21\x38\x13\x74\x7c\x7c\x23\x4b\
-\x86\x9b\x78\x39\x52\x9b\x08\x3f\x74\x4f\x64\x06\x67\x08\x93\xa5\
-\x35\xe8\xd6\x9e\x7a\x56\x84\x6c\x22\x94\x22\x35\x58\x1d\x3e\x0a\
-\xfe\xb9\x6c\x61\xce\xa1\x99\x4f\x50\xa5\x47\x56\x7d\x71\x19\x10\
-\x53\xf9\xca\x02\xd2\x46\x94\x94\xe6\x8a\xd9\x9d\x40\x82\xb5\xea\
-\xa8\xce\x3b\xa3\x3b\xa8\x82\x36\xec\x1e\x11\xa2\x80\x20\x82\x08\
-\x02\x19\x33\x51\xea\x3f\x74\x3e\x18\xfa\x8f\x51\x80\xcb\x91\xf8\
-\xfd\xf1\x8e\xfd\x21\x69\xf9\xf8\x41\x20\xc8\x65\x5b\xd9\xc3\x5c\
-\x81\xc1\xb4\x25\x35\xea\xd6\x63\x65\xff\x00\x31\x8c\xfd\x21\xe8\
-\x09\xf8\xb1\x20\x48\x45\x6b\x0b\x96\x2c\xc1\x40\xa8\x4a\x6b\x39\
-\xd6\x87\x9b\x9a\x0a\xd1\xee\x7f\x14\xd3\x70\xd2\x26\xb9\x05\x9e\
-\x52\x3b\x10\x28\x0b\x32\x82\x68\x06\xa8\xb0\x61\xab\xf9\xe6\x31\
-\x5d\xb9\xec\x2b\x4a\xc3\x48\x96\xe2\x8e\x92\x91\x18\x03\x5a\x32\
-\xa8\x04\x54\x6b\x8b\x03\xcd\xd7\xf8\x18\x0e\x59\xf8\xa9\x48\xc5\
-\x19\x80\x6a\x06\x20\x16\x26\x86\xa1\x58\x81\xb6\xd2\x01\x3e\x89\
-\xd9\x0c\xe3\x09\x5b\x4f\xdb\xf0\x87\xe8\xac\x0c\xb9\xf8\xcc\x48\
-\x9a\x81\x80\xc3\xe1\x28\x0d\x72\xac\xcc\x51\x34\xa7\x4a\xaf\x64\
-\x5f\x0d\xce\xe1\xab\x76\xf2\xb7\x54\x1a\xd5\x89\xaa\xdd\x69\xd7\
-\xcd\x73\x76\x98\x94\x8c\xbb\xe9\xec\x32\x92\xad\x39\x15\x86\xb0\
-\x59\x81\x1d\x60\xc4\x1c\x71\x81\xd7\x7c\x9a\xfb\xb9\xf2\x3f\x0a\
-\xc4\xba\x43\x46\x4b\x9c\x66\x5f\x25\x50\xca\x2b\x2e\x59\x51\x30\
-\x01\x29\x66\x3a\x0b\xc2\xb0\xbc\xd8\xa8\x46\xc1\x31\x4d\x48\x34\
-\x1c\x18\x2d\x01\x2d\xdd\x15\xa4\x10\x18\xf2\x97\xf5\xe0\x82\x66\
-\x2a\x19\x77\x17\xa0\x2a\xa4\xb9\x34\xcc\x73\x01\x1d\x71\x8d\x3a\
-\xde\xef\xf8\xc4\xce\x57\xb5\x3a\x4e\x95\xc0\x1a\x72\xe4\x64\x55\
-\x86\xac\x8a\x90\x54\x8c\xb9\x88\x1d\x90\x2e\x95\xc0\x03\x50\xf2\
-\x01\xcb\x3c\xb9\xb5\x73\x47\x10\xd0\x52\xeb\x4d\xe4\x8c\xd4\x6a\
-\x9f\x90\x64\xb9\xfe\x9f\xf6\x47\x59\xe7\xd5\x91\x89\x71\x3b\x9e\
-\x94\xbb\xdd\x25\x35\x1d\x24\x97\x63\xbf\xd1\x43\xb3\x89\x93\x7c\
-\xfc\x95\x02\xa1\xb4\xea\xbc\x54\xea\x8b\x5a\x5c\xcf\xc2\x5e\x7c\
-\x43\xa4\x69\x8c\x07\xa7\x27\x6f\x36\xbd\xba\xa1\xf2\xf4\xf6\x09\
-\x6b\x6c\xc9\x4b\x5d\x76\xe5\x5a\x6d\xa0\x8e\x2c\x36\xe7\xa5\xb4\
-\xb7\x67\x92\xd2\xd8\x6f\x7a\xc4\xfa\x21\x67\x75\x60\xca\x5e\xad\
-\xc9\x44\x6e\x6a\x6f\x82\xb9\x52\x3a\x30\x7b\x9d\x92\x65\xb3\xb6\
-\x1a\x63\xb2\xb2\x8d\xed\x1e\x6a\x32\x92\xcc\x0a\x1b\x98\xdc\x54\
-\x05\x37\x64\x0d\xdc\xc2\x15\xa5\xcc\xfc\x17\x9f\x11\xf2\xed\x93\
-\xa7\x30\xee\x68\x93\x15\xc8\xcc\x85\xb9\x88\x1b\x72\x11\x2f\x1a\
-\x4a\xf4\x8e\xaa\xf9\xaf\xab\x6e\xa8\x9f\x43\xee\x6f\x0c\x0a\xb6\
-\xf0\xcb\x55\x62\x52\x63\x3b\xd0\xa3\x25\xa7\x95\xd6\xd9\x8c\x8f\
-\x4c\x5d\xf1\x1e\x1e\xdb\x77\xa5\xb6\x80\x05\x15\x00\x00\x4b\x50\
-\x00\x72\xcd\x98\xe5\xb6\x39\xe5\x11\x7b\x78\x6f\x19\x9a\xdd\x96\
-\x99\xa7\xf0\xca\x6d\x69\xa8\xa7\x63\x5c\x0f\x61\x10\xdf\x28\xf0\
-\xbe\xb9\x3b\x4c\x3e\x7e\x8e\x95\x39\xa5\x4b\x99\x29\x6c\x46\x9b\
-\x2d\x6c\x59\x88\x6c\x57\x9e\x11\x43\x2b\x64\x14\x24\xad\x75\x04\
-\xcc\xca\x95\x11\x5f\xa2\xb7\x3b\x25\xe6\x22\xbc\x96\xb5\x82\xd4\
-\x8d\xfd\x3c\xe9\x6e\xee\xd5\x67\x34\xb1\xd5\x52\x9b\x5b\x3c\xc8\
-\x8d\xe3\x1a\x75\xfe\xae\xd9\x99\xca\xf6\xa7\x6f\x94\x98\x5f\x5c\
-\x9d\xa6\x1f\x2f\x4f\x61\x9b\x25\x98\xad\xb6\xdb\x8f\xdc\x21\xb8\
-\x8d\xcd\x61\x96\x78\x94\x30\x53\x99\x09\x50\x66\x89\xb3\x2d\x17\
-\x52\xa4\x82\x75\x0a\xe7\x9f\x31\xca\x2c\x65\x6e\x5f\x0d\x2e\x7a\
-\x2a\x2b\xa8\x79\x53\x59\xa9\x32\x66\x65\x5e\x48\x5c\xee\xfd\xb6\
-\xed\x8b\x31\xa7\x5b\x4c\xfc\x25\xe7\xc4\x38\x86\x99\x90\x6b\x47\
-\x19\x64\x72\x7c\x8d\x2b\x43\x97\x54\x3b\x8d\xe4\x7a\x7f\x09\x9e\
-\x11\xdd\xa4\x37\x29\x21\xbf\xb0\x69\xa0\x86\x2d\x59\xcc\x0d\x40\
-\xe4\x8a\x13\x9d\x6a\xc3\x5e\x59\x7b\xab\xe6\x68\x2c\x2c\xa6\x04\
-\xe1\xdd\x28\x2f\x66\x38\x86\x16\x72\x8a\xdc\xd4\x63\x51\x90\x35\
-\x15\x39\xea\xd7\x18\xac\x7f\x6d\x5e\x7f\xa3\xb8\xe2\x47\x3b\x81\
-\x52\x06\x77\x81\x9e\xac\xc8\xa0\x8e\xfa\x1d\x9f\x13\xe3\x1c\x38\
-\xe9\x52\x84\xac\x48\x54\x6b\xc6\x1a\x71\x52\xf3\x4b\xf2\x59\x08\
-\x56\x55\x63\x54\x2c\xad\xac\x80\x45\x48\xe7\x31\xd3\x8c\x24\x4b\
-\x73\x46\xad\x8d\xa8\x9a\xd6\xd3\xaa\x87\x6c\x66\x6b\xd3\x58\xdf\
-\xb2\x0c\x52\x56\x85\xd2\xbb\x2f\xcf\xef\x8e\xa4\x14\xfe\x7a\xa3\
-\x19\x83\x79\x41\x10\x1d\xef\x24\x40\x41\xb3\xd1\x19\x11\x1a\xcd\
-\x18\xac\x25\x4a\x0d\x5b\x84\xb4\xba\xba\xee\x08\xb5\xaf\x4d\x62\
-\x29\xb8\x85\x2f\x35\x12\xeb\x43\x4b\x9a\x41\x20\x10\x1d\x4c\xa0\
-\x86\x84\x50\x90\x19\xcd\x0c\x76\x62\x65\xa2\xb2\x58\xaa\xa4\x96\
-\xad\xb4\x15\x50\xba\xcd\x35\xd1\xac\xed\xe9\x8e\x4c\x6c\xf5\x53\
-\x6b\x80\x40\x47\x98\x49\x52\xf4\x54\x28\xa6\x8a\x35\x9a\xba\xfc\
-\x63\xa0\xe1\xf7\xb2\x05\x12\x8d\x51\x55\x16\xe6\x05\x68\x76\xe5\
-\x5e\xce\x98\xa2\x0d\x15\x87\x0f\x57\x72\x8c\xa4\xcd\x5b\x59\x54\
-\xb0\x75\x9f\x30\x54\xb1\xce\x81\x42\xa8\x1d\x10\xd9\xb4\xe4\xae\
-\x56\x19\xec\x87\x65\x03\xb8\x55\xea\xb8\x2a\xd3\x66\x50\xb8\x65\
-\x13\x58\xf2\x50\x1e\x53\x55\x92\xea\xaa\xbb\xcb\x06\xed\xa6\xca\
-\xd3\x61\x10\xe9\xb3\x28\xa1\x4a\x83\x57\x64\xa5\x2a\xbc\x82\xf7\
-\x10\x29\x9f\x25\x18\x81\xd4\x3a\x60\x87\xb6\x15\x52\x5a\x56\xcd\
-\xf0\x19\x60\xba\x2a\xad\xc4\xba\x87\xa0\x1c\xc5\x6e\xf8\xc6\x73\
-\x74\x93\x9c\x4d\xb5\x6b\x40\x88\x68\x14\x38\x15\x67\xa9\xa1\x61\
-\xb0\x0c\xba\x23\x41\x2e\x5d\xa8\x93\x42\xa5\xaf\x66\xa5\xb5\xc5\
-\xe4\x05\xf8\xb0\xa8\xeb\x8e\x7c\x66\x20\x5e\x50\xd8\x2d\x0a\x6e\
-\x7a\x66\x5c\xb5\x14\x74\xf2\x3e\x30\x15\xba\x0d\xdc\x2c\xce\x55\
-\xc6\xc5\x60\x28\x16\x84\xdf\x68\xb4\x13\x9e\x5f\x08\xe9\xc3\x2a\
-\x1b\x18\x58\x50\xa0\x24\x90\x0b\x16\x36\x15\x62\xc7\xa2\xea\xf5\
-\xc7\x5c\xb9\xd6\x07\xb8\x28\x0a\xa1\xc9\x41\x40\x41\xba\xb9\x6d\
-\xe4\xfc\x7a\x22\x91\x34\xb3\x90\x1f\x83\xa0\xa8\xb8\xe4\x48\x15\
-\xcc\xd5\xad\xf8\xc3\xc9\xe0\xfd\x39\x3d\xc4\xb9\x39\xb7\x29\x0b\
-\x65\x42\x59\xc0\x42\x05\x1f\x22\x6d\x2f\xaf\xa6\x17\x41\x39\xbd\
-\x41\x60\x49\xa9\x6a\x00\xb4\x5b\x75\x10\x09\xd4\x6d\xcf\x6c\x5a\
-\x36\x2e\xfd\xed\x42\x8f\xd6\x21\x99\xca\xcc\x05\x5b\x39\xb9\xcd\
-\x66\x2f\xc6\x17\x0d\x3d\x6e\x2a\x19\x09\xad\xad\x65\x01\x56\xa1\
-\x60\x18\x02\x69\x50\x0e\xba\x40\x60\x74\xae\x38\x26\x22\x72\xba\
-\x2b\xf2\x80\x5b\x89\x16\xad\x88\x45\xb4\x3a\xaa\x49\xeb\x26\x3a\
-\xb4\x06\x20\xb2\xe2\x0a\x64\x02\x02\xa0\x1a\x80\xd5\x63\x41\xd3\
-\xe6\xfc\x23\xa3\x19\xa4\x4e\xf9\x31\x46\xf6\xa1\x1a\xda\xb9\x35\
-\x63\x68\x63\x40\xaa\x7d\x2a\x7b\xa2\x7c\x06\x90\xaa\xcd\x2d\x61\
-\xb1\x2f\x25\x09\x2b\x42\x6b\xce\x06\x7c\x98\xa8\x86\x44\xa4\x21\
-\x58\x4c\x42\xa4\x29\xa1\x59\x66\xa2\x83\x2b\xa9\x53\x5d\xba\xe1\
-\x67\x3d\x56\x58\xa8\x08\xd3\x1c\x02\x68\x56\xdb\x26\x99\x75\xae\
-\x44\x64\x84\x57\x60\x89\xa5\x3b\xb1\xa5\x00\x34\xa9\xaa\x31\x5e\
-\x6a\x80\xd7\x50\xeb\xf8\x43\xa7\x62\x8d\xa9\xc9\xa9\x76\x65\xa7\
-\x9d\x42\x8a\xec\xd4\x19\x5d\x9a\x50\x0c\xb5\x88\x08\x82\x22\x20\
-\xa1\x46\x7b\xd2\x8c\x02\x2b\x66\xeb\x97\x27\xb3\xaa\x13\x13\x2c\
-\x3b\xb8\x67\x55\x2a\x12\xdb\x82\x37\x24\xdd\xa8\x36\xd3\x76\xad\
-\x83\x64\x49\x2a\x6b\x5a\x1c\x80\x05\xca\xa5\x4a\x14\x6e\x53\x05\
-\xae\x64\xed\xaf\xba\x0c\x4e\x28\xdc\x40\x19\x29\x00\x9b\x19\xcd\
-\xc4\x57\x52\xea\x14\x2b\x9f\x4f\x35\x20\x1f\x28\x20\x98\x2c\x0a\
-\x05\x8e\x58\x25\x00\xad\xc9\x61\x34\xff\x00\x1d\x3d\xf1\xc5\x83\
-\x96\x8c\xa8\xee\xc8\x49\x54\x2e\x19\x65\x93\x75\xa2\xf0\x58\x8a\
-\xd6\xea\xc7\x7e\x1e\x61\xa8\x0d\x4e\x52\x97\x14\x52\x84\x52\xda\
-\x86\x56\x35\x07\x94\x3e\x31\xc4\xb8\xc7\x60\xad\x6e\x4c\xaa\xc3\
-\xf5\x6e\xe0\x06\x50\xc2\xac\x0e\x64\x02\x2b\x41\xae\x03\x49\xb9\
-\xaa\x58\xf6\xd2\xd0\xec\x16\x9a\xa9\x53\x50\x3a\x2b\x58\xbb\x8c\
-\xfe\x8e\xc5\x32\xcb\x26\x82\xf3\x30\x20\x1f\x46\xb7\x11\x77\x74\
-\x16\xa7\xba\xbc\xf0\x2e\x98\x7c\xc9\x56\xe4\xa9\x76\x53\x29\xd3\
-\x25\x5b\x88\xbc\x92\xa0\xd0\x76\xc4\x55\x6e\xec\xa7\x85\x9a\x81\
-\xd4\x32\xd8\x4a\x82\x48\x17\x16\xe5\x11\x4e\x7a\x05\xed\x88\x37\
-\x27\x39\x5b\x13\x44\x5b\x45\x8d\x75\x09\x20\x8a\x8c\xcf\xbe\x91\
-\xa5\xc7\xe2\x98\x3d\x8a\x14\xda\xaa\xcc\x4a\x97\xf3\xcb\x85\x01\
-\x41\x1e\x83\x57\xdd\x0b\x82\x9c\xf7\xaa\xb0\x4a\x3a\xb1\x05\x54\
-\xa1\x05\x4a\xe4\x54\x93\xac\x13\xb2\x94\xe9\xcb\x1d\x33\xd5\x76\
-\xcf\x4e\xf7\x6b\x16\xe6\xeb\xfc\x0c\x68\xa3\x3a\xe6\x94\xeb\xfc\
-\x0c\x5f\x4a\x98\x18\x06\x53\x50\x40\x20\x8d\x44\x11\x50\x63\x6d\
-\x24\x82\x08\x20\x08\x6b\xea\x3d\x46\x1d\x0d\x7d\x47\xaa\x03\x33\
-\x1c\x78\x94\x9c\x49\xb1\xd1\x56\x82\x9c\x9a\xbd\xd5\x6b\xb3\x26\
-\xda\x52\xda\x72\x4e\xa3\xb7\x2e\xc8\x22\xc0\x83\x0a\x1e\xd1\x7f\
-\x9d\xee\xf8\xd3\x2e\xc8\x95\xb9\xba\xff\x00\x03\x0e\x86\x9e\x6e\
-\xbf\xc0\xc2\x46\x67\x1b\xa2\x24\xe2\x31\xb3\x37\xd6\x75\xb6\x4e\
-\x19\x56\xc3\x2c\x79\xef\x8a\xab\x35\xe3\x50\xb4\x0c\xbd\x28\x8e\
-\x6e\xe5\x70\xa6\x59\x64\x79\xe1\x81\x1c\x97\xde\x81\xa1\xcc\xd0\
-\x2a\x12\x48\x19\x75\x91\x52\x33\x8d\x7e\xe7\x7f\xac\x62\x3f\xba\
-\xc3\x7f\xbb\x11\x1a\x48\xd4\x6a\xe7\x8c\x54\x4e\xcc\xce\x11\x33\
-\x73\x0f\x26\x9b\xb9\x99\x01\x88\x57\x99\x68\x6a\x03\x45\x3c\x9b\
-\x98\x56\x82\x5f\x30\x0a\xdd\x3b\xe5\x07\x9a\x6a\xb3\xf7\x2d\x20\
-\x3d\xa1\xe6\x15\xca\xa7\x90\xd6\xd5\x80\x39\x84\xa3\x50\x55\xf2\
-\xd7\xe6\xeb\xce\x3d\x62\x08\xd7\x7f\x53\x94\xed\xe3\xc3\xc9\x66\
-\x6e\x66\x48\x26\x8d\x33\x25\x56\xfa\x07\x94\x55\x49\x5a\x84\xa1\
-\xa1\x66\xee\x11\xad\x85\x24\x1b\x95\xc3\xdc\x83\x7c\x99\x46\x32\
-\xee\x3f\xab\xe4\xdc\x10\x93\x5b\x28\x3c\xe7\xd7\xe6\xd8\x6b\xe7\
-\x0a\x7a\xb4\x10\xef\xea\x72\x76\xf1\x79\x34\x9d\xcc\xc8\x24\x06\
-\x33\x45\x48\x15\xba\x5a\xd0\x92\x95\xfe\xcd\xa8\x00\x66\xcc\xd0\
-\x1b\x32\xd7\x48\xb9\xf2\x0f\x03\xed\x4f\xdf\x91\xf2\x47\xa0\x41\
-\x0e\xf6\xa7\x27\x6f\x1e\x1e\x7f\xe4\x1e\x07\xda\x9f\xbf\x23\xe4\
-\x84\xf2\x0b\x03\xed\x4f\xdf\x91\xf2\x47\xa1\x41\x13\xbd\xa9\xca\
-\x76\xf1\xe1\xe6\x78\x7d\xc8\x60\x9b\x5c\xdc\x42\x6a\xad\xed\x87\
-\x00\x56\x9f\xb1\xd3\xf0\x30\xc6\xdc\x9e\x0a\x8d\xcb\xc4\x9b\x69\
-\x41\x59\x15\x6c\xe9\xc9\xe4\x7b\xe3\xd3\xa0\x87\x7b\x3e\x57\xb7\
-\x8f\x0f\x2d\x5d\xcb\x60\x89\xa5\xd8\xae\xdc\x37\xe2\xbf\xcf\xc6\
-\x2e\x34\x06\xe7\xa4\xc9\x9e\xa7\x0f\x3e\x68\x2f\x22\x61\x6f\xff\
-\x00\x81\x65\x0a\xf2\x68\x08\xde\xc8\x15\xb8\xeb\xcf\x2e\xb8\xdd\
-\x45\x4e\x39\x5c\xe2\x25\x58\xca\xa7\x79\xc4\x54\xb2\x97\x1e\x7e\
-\x1f\x98\x32\xc4\x9d\x5c\xe6\x2a\x67\x65\x8c\x31\x89\xb8\x84\xfc\
-\x02\x67\xb5\x4e\xee\xe1\xff\x00\x85\x19\xd9\xda\x77\x0e\x18\x83\
-\x8e\x76\xe5\x58\x0a\x9c\x1b\x54\x83\x4f\x42\xa3\x95\xc9\xa6\xda\
-\x6d\x8b\xdc\x41\x9e\x80\x13\x31\x0d\x4d\x39\x32\x1d\x8e\xa2\x6a\
-\x40\x99\xab\x28\xa1\x1a\x33\x0e\x68\xc2\x56\x18\x9b\xa8\x0f\x03\
-\x2a\x43\x12\x1a\xea\x33\x83\x9b\x50\xd7\x68\xaf\x35\x63\x0d\x17\
-\x4c\x33\x34\x8c\x48\xdf\x27\x9d\xed\x26\xa9\xb9\x70\xf6\x9b\x72\
-\x0b\x55\x4b\xa8\xc3\x65\x0e\x5c\xc4\x44\xb8\x99\xa5\x51\xdc\x11\
-\x55\x46\x61\x97\x38\x52\x76\xc3\x34\xa4\xe2\x70\xf8\x8b\x5d\x3c\
-\xc7\x69\x80\x48\x64\x2d\xa8\x37\x28\xbd\x09\xcf\x5e\x71\x26\x31\
-\xd6\xc7\x66\x4a\xa8\x56\x2c\x32\xcd\x40\x24\x8d\x7b\x20\xac\xf6\
-\x1a\x6c\xc6\x54\x26\x7c\xda\x95\x52\x4d\x53\x59\x02\xa6\x96\xd2\
-\x34\x58\x09\xa5\xe5\xcb\x76\xd6\xe8\x8c\x7a\xd9\x54\x9f\xbe\x33\
-\x12\x56\xaa\xa4\x49\x5c\xd4\x51\x78\x44\xfc\xb2\xc8\x56\x9f\x84\
-\x6a\x70\x8e\x19\x11\x94\x51\x59\x15\x94\x6c\x52\x14\x81\xd9\x48\
-\x21\x26\xad\x1d\x5d\x5d\x55\xc2\xba\x0b\x85\xc0\xab\x94\x66\x14\
-\x0c\x0d\x6a\x8a\x6b\x5d\xbb\x61\xe2\x63\x3b\x0b\xdd\x09\x50\xd4\
-\x0a\xa5\x35\xd0\x16\x35\x76\xad\x35\x7f\x8b\xaa\x21\x9f\x41\x31\
-\x4b\x09\x96\x19\x53\x50\xb4\xb5\x76\x65\x66\x69\x4c\x32\x40\x48\
-\xa8\x46\xce\x94\xcb\xa6\x3a\xa7\xe2\x43\xba\x5a\x1e\x80\x39\x25\
-\x92\x62\x0c\xed\x00\x72\xd4\x56\xba\xf2\xf4\x60\x39\xf0\xd3\x19\
-\x16\xc4\x98\x85\x43\x39\x17\x21\x62\x2e\x76\x62\xb5\x57\x03\x22\
-\x48\xd5\xcc\x2b\x9c\x23\x26\x4a\xd7\x8a\xab\x97\x0e\x47\x26\xe7\
-\x66\xa8\xa5\x75\x1b\xd8\x52\xb5\xcc\x66\x61\xfa\x32\x72\xa0\xe5\
-\x6f\xb7\x50\xa1\x5d\xee\x63\x26\x4e\xe6\xf0\x55\x08\x37\x5d\x5a\
-\xd4\xf3\x6a\xce\x21\xcf\x90\xc4\x3d\xbb\xf4\xd7\x34\x56\x2e\x12\
-\x61\x9d\x63\x59\x42\xd5\xfd\x62\x1a\x52\xa3\x9c\x64\x60\x27\x79\
-\xec\xf4\x57\x74\x22\xe0\x68\xa8\x54\x92\xbc\xa0\x2a\x5c\xf3\x80\
-\x75\x73\x47\x1e\x35\x51\x5c\xb1\x98\x8a\x59\x56\xaa\xe2\xef\x30\
-\xb5\xac\x05\xc0\x8f\x38\x8f\x70\xd8\x63\xb9\xa6\xa9\x96\x92\xd3\
-\x7c\x36\x94\x17\x3a\x4c\x53\x44\xa1\x25\x99\xd4\x0a\x90\xb4\xe9\
-\x26\x33\x9b\xa0\xc2\xcd\x69\xb7\x22\x39\x16\xa6\x6b\xbe\x8c\x81\
-\x7a\x8a\xcb\x04\xd4\x54\x1a\x1d\x75\x80\xb6\xc3\xa2\x38\x7e\x5a\
-\xbd\xca\x11\xac\xc8\x05\xe5\x73\x54\x9a\x9b\x8f\x3f\x30\x8a\x34\
-\xd0\x52\xe8\x29\x89\x04\x50\x67\x68\xcc\x6d\xad\xd4\xf7\xd2\x91\
-\xdb\x86\x90\xec\x93\xa8\xac\xa5\xa5\x84\x4b\x94\xa1\x2d\x47\xe6\
-\x60\x0f\xd2\x5c\xf5\x67\xd1\x13\xa6\x2d\xae\x53\x64\xc0\x96\x66\
-\xbb\xcc\xda\xdd\x55\xa6\x76\x52\x94\xb8\x40\x4b\x89\x90\x89\xbd\
-\xb0\x75\x42\x88\xc8\xb7\x51\x81\x56\x0a\x48\xa5\x45\x4f\x21\x4d\
-\x41\xe6\x87\x61\x08\x66\xae\xf8\x8e\x40\x24\x05\x16\xe7\xaa\xe3\
-\xca\x35\xc8\xd3\xdf\x15\x3a\x6f\x09\x30\xac\x90\x11\x9a\xd9\x65\
-\x1a\xd0\xed\x46\xac\x93\x9e\xf7\xca\x19\x23\x66\x39\xc0\xdb\x0f\
-\xdc\xf6\x1e\x62\xbf\x2d\x5c\x00\x18\xd5\xc4\xca\xe7\x41\x4a\xcc\
-\x00\x9d\xb4\x1a\xa9\x14\x67\x74\xae\x0a\x41\x9c\xec\xd3\xc2\x33\
-\x30\x25\x49\x5c\x8d\xa0\x75\x8a\x80\x0f\xbe\x3b\x74\x46\x0e\x50\
-\x49\xa1\x1e\xf0\xeb\x6b\x1a\x8c\x85\x46\x59\x6a\xf3\x8c\x70\x63\
-\x53\x12\x93\xa6\xd8\x8f\x6b\x3d\x41\x09\x70\x3c\x85\x1a\xe8\x69\
-\xaa\x9e\xe8\xe9\xc0\x61\x67\x3c\xac\x4d\xea\x43\xbc\xab\x56\xa2\
-\xd3\x50\x08\x19\x65\x4d\x62\x08\x9a\x4c\xa5\x52\x1d\x5d\x49\xa7\
-\x9f\x66\x6c\x36\x92\x0d\x0d\x75\xc4\xb3\xe4\x21\x44\xe5\xea\x24\
-\xa9\x34\x21\xef\x47\x56\x04\x7d\x2a\x86\x63\x96\xce\x88\x92\x4b\
-\xa8\x25\x82\xcd\x05\xa9\x50\x52\x69\x03\x9e\x9e\x6d\x06\xbe\x68\
-\x86\x6c\x86\xa4\xab\x91\x88\x05\xef\x0a\x09\x2a\x1d\x1c\x0c\x97\
-\x3e\x7b\x72\xdb\x00\xdc\x34\x84\x51\x60\x65\x0b\x7a\xb5\xaa\xb6\
-\xd5\x81\x04\x66\x49\xe7\x55\xec\x89\xa6\xd1\x5d\x88\x70\x0b\x5a\
-\x59\x4a\xdd\xa8\x50\x1c\xb5\x54\x0f\xb3\xd7\x0d\x59\x59\x5a\x82\
-\x69\x25\xd0\x9b\xc4\xda\x00\x8e\x18\x90\x5c\x50\x64\x0e\xad\x79\
-\x42\x3e\x1f\x96\xf7\x89\x99\xb8\x65\x29\xbe\x6a\xb1\x14\x8a\xa7\
-\x4a\x9c\x8e\xde\x98\x0e\x9c\x12\x07\x7f\x3c\x33\x52\x94\xa5\xb4\
-\x0c\x6b\x5a\x6b\xce\xdf\xb3\x1c\x89\x3e\x4c\xb0\x10\x62\xf0\xfc\
-\x80\x12\x85\x81\x20\x2e\x54\x24\x36\xbc\xa3\xb7\x45\x48\x3b\xe0\
-\xb4\x38\x0a\x8c\x01\x7b\xea\x59\x89\x3a\xdf\x94\x69\x4f\xb5\x18\
-\xb6\xd1\x1a\x42\xc1\x2c\xe1\xd8\xa8\x0a\x2b\x62\xdd\xc9\xa6\xa7\
-\x02\xbf\x1e\x73\xb6\x2c\x44\x4b\x19\xe5\x38\xf8\x8b\x7a\x0e\x1a\
-\x4c\xb5\x91\x79\x9c\x96\xde\x26\x09\x95\x05\x2a\x5f\x2c\xf5\x10\
-\x49\xb6\x9a\xf3\xd7\x58\x51\x8c\x92\xfc\x83\x88\x96\x43\xf2\x28\
-\x32\x26\xec\xad\x04\xb9\xcc\xd6\x9a\xb9\xe2\xb3\x0d\xa3\xa7\xa6\
-\x02\x4a\x32\x35\xea\xe5\xdd\x06\x6d\x42\xee\xc3\x2d\xa2\xe5\x34\
-\xe8\x8e\x73\x86\x9a\xe6\xd1\x2a\x60\x37\x52\xa5\x02\xaa\xd6\x99\
-\xb5\x14\x67\x43\x58\x94\xdc\x4e\xcb\xed\x2a\x64\xab\x86\x99\x35\
-\x10\xb2\x81\x6b\xf3\x84\x2d\x46\x51\x70\x23\xcf\x61\x5e\x98\x7e\
-\x88\x69\x2c\xf5\x49\xa8\xe5\x43\x64\x9c\xd7\x5b\x56\x20\xb1\x3f\
-\x44\x0f\x7c\x55\x69\xc9\x13\x46\x21\x9d\x51\xd9\x1a\x4a\x25\x51\
-\x6e\xcd\x5e\x61\x60\x76\x64\xc3\xf9\xac\x4b\xb9\xec\x3b\xef\xb7\
-\x94\x74\x5b\x08\xab\x8a\x54\xb3\x29\xcb\x21\x95\x04\x4a\x8f\x2a\
-\xd3\x4d\xe6\xf7\xff\x00\xb4\xc5\xee\x15\x68\x8a\x36\x2a\x8f\x80\
-\x8a\x19\x9c\xde\xff\x00\xf6\x98\xd0\x4a\x19\x0e\xa1\xf7\x40\x49\
-\x04\x10\x40\x10\xd6\xd5\x0e\x84\x30\x19\x88\x20\x86\x2c\xd5\x2c\
-\x54\x30\x2c\xa0\x12\xb5\xcc\x06\xad\x09\x1c\xd5\xa1\xec\x8a\xa7\
-\xc3\x4e\xb1\xef\xfb\x8c\x24\x89\xc8\xea\x1d\x19\x5d\x4d\x68\xca\
-\x43\x29\xa1\xa1\xa1\x1a\xf3\x06\x14\xeb\x1d\x7f\x81\x80\x97\x73\
-\xbf\xd6\x71\x1f\xdd\x61\xbf\xdf\x89\x8d\x2c\x66\x77\x3b\xfd\x6b\
-\x11\xfd\xce\x1b\xfd\xf8\x98\xd3\x44\x41\x04\x10\x40\x10\x41\x04\
-\x01\x04\x10\x40\x10\x41\x04\x01\x04\x10\x40\x11\x4f\xa4\x99\x84\
-\xf9\x6c\xa5\x45\x24\x62\x09\x2c\x09\x14\x0f\x87\x27\x57\x54\x5c\
-\x45\x46\x35\x9f\x84\x4b\xb1\x51\x8e\xf3\x36\xa1\xd8\xa0\xa1\x79\
-\x3a\x88\x46\xae\xa8\x08\xc6\x93\x63\x5f\xd6\x49\xa8\x5b\x88\xb5\
-\xee\x03\xff\x00\x9d\x71\xcd\x3e\x72\xcc\xa9\x66\x90\xd5\x0a\x84\
-\xfe\xb2\x84\x31\xaa\xae\x46\x86\xa7\xfe\x62\xd3\x7c\xc4\xfa\x99\
-\x3f\x5c\xff\x00\xc2\x8e\x6c\x4e\x1e\x73\xd6\xe9\x52\xb3\x0a\x0d\
-\x27\xb8\xf3\x49\x23\xfb\x1c\xb5\x98\x0a\x5d\x31\x6b\x49\x9c\x54\
-\xc9\x2c\x25\xaa\x35\xb7\xdc\x10\x90\x00\x35\x34\x1e\x6e\x55\xd9\
-\x13\x63\x55\x0a\x3a\x97\xb5\x4a\x30\x26\xa3\x25\x20\x82\x73\xe8\
-\x86\xe9\xec\x34\xc5\xc2\x4c\x5d\xed\x15\x6d\x0b\x51\x39\xda\x81\
-\xa6\x29\x26\xd3\x2c\x06\x3d\x24\xed\xcf\x33\x0e\xc7\xca\x66\x94\
-\xe8\xa0\x16\x64\x74\x19\xd3\x32\xa4\x0e\x6e\x98\x2b\x35\x29\xd4\
-\x28\xa4\xd6\xa0\x51\x43\xc1\xa7\x6a\xa6\xbf\x3a\x35\x58\x64\x55\
-\x44\x55\xf3\x55\x02\xaf\x4a\x80\x00\x3d\x91\x9d\x95\x26\x68\x00\
-\x6f\x2f\x50\x00\xf3\xa5\xeb\x03\x57\x9f\x1a\x1c\x1c\xab\x11\x10\
-\x9a\x94\x45\x52\x76\x95\x55\x15\xf8\x41\x0d\x9e\xef\x7d\xa8\xb7\
-\x1b\x19\xc2\xd4\x29\x24\x3c\xb5\xf3\x98\x50\x00\x1d\x8f\xb8\x47\
-\x4e\x26\x5d\x8e\x80\x31\x21\x83\xd6\xb4\xfa\x36\x50\x8a\x01\xb4\
-\xf6\x88\xaf\xd2\x78\xa9\x48\x55\x9d\x8a\x9a\x10\x19\x5d\x90\xd1\
-\x88\xa8\x2c\x18\x64\x48\x5c\xb6\x81\xb2\x1b\x82\xc6\x4b\x77\x16\
-\xb3\xb3\x58\xf6\x96\x76\x7e\x48\x64\xbe\x84\xb1\x03\x32\x9f\x0d\
-\x90\x16\x58\x19\x37\xa2\xb9\x66\x17\x54\xd0\x59\x40\x09\x34\x19\
-\xa9\x39\x0a\x08\xe6\x47\x25\x91\x2b\xe7\x4d\x9a\x84\xe5\x5a\x4b\
-\xdf\x68\x75\x52\xa7\x7b\x15\xcb\x9c\xc5\x6f\x1a\xe1\xd0\x95\x13\
-\x19\x68\x49\xb4\x4d\x75\x19\x9a\x92\x16\xf1\x91\x26\xba\xa9\x9c\
-\x76\x87\x94\x51\x0d\x48\x50\x59\x95\xae\x65\x60\xca\x1d\x9d\x8b\
-\x83\x75\x68\x1e\xa6\xb9\xe7\xae\xb9\x87\x6e\x22\x51\x45\x46\xb8\
-\xd4\xba\xa9\x5e\x49\x1c\xaa\x8c\x88\x50\x72\xd7\xee\x81\xa3\x9a\
-\x5b\xcb\x62\xb4\x7b\xce\x4e\xa0\xcd\x77\xd6\x08\x0c\x14\xb9\xa8\
-\xe5\x52\xbc\xc5\x84\x33\x48\xcf\x2a\x02\xaf\x9c\xc6\x82\x0a\x7b\
-\xce\xcc\xaa\x8b\x98\x6b\x03\x9a\xbb\x76\x43\x96\x5b\xfa\x2b\xd5\
-\x58\x9e\x4a\x24\xb5\x08\x0f\x59\x3a\xc9\xda\x4c\x48\x0c\x07\x20\
-\x7a\x10\xac\x2d\x27\x55\x79\xfa\xa2\x71\x1d\x0e\xa1\xd4\xab\x6a\
-\x3d\xa3\xa4\x47\x16\x19\x8e\x6a\xda\xd4\xd2\x02\x6b\x60\x02\x16\
-\x90\xb0\x09\x48\x29\x0b\x04\x02\x52\x0a\x42\xc1\x00\x94\x82\x90\
-\xb0\x40\x34\xc5\x7b\x4d\xde\xdc\x86\x2e\xf7\xb1\x65\x01\x01\x54\
-\x0a\xaa\x0a\xd5\x47\x41\x3c\xaa\x9c\xcf\x44\x58\x11\x19\xcd\x33\
-\x3d\x84\xc2\x88\x45\xec\x28\x8a\x49\x00\x9b\x46\x54\x1a\xf3\x23\
-\x56\xdf\x7c\x70\xd7\xd6\x9d\x3c\x62\x62\x2e\x66\x6a\x9b\xc3\x1e\
-\xa9\xf3\x4e\xf9\x9a\x4d\x08\x2b\x57\x52\x54\xd0\x84\x62\x47\x35\
-\x47\x24\x83\x4c\xb6\x83\x96\xba\xc4\xd8\x1c\x50\x3c\x8e\x59\x28\
-\x28\x59\x96\xdb\x8a\xe5\x5c\x80\x15\x3a\xf2\x14\xea\xca\x30\x58\
-\x0c\x76\x27\x84\xef\x53\x2f\x66\x0e\x50\xab\x30\x40\x0e\xaa\x2a\
-\x8f\xff\x00\x47\xae\x34\xd8\x59\xcc\xb8\x8d\xe9\xef\x0c\xb6\xb5\
-\x18\xe6\x55\xaa\x05\x69\x91\xcd\x48\xa8\xcb\x56\xaa\xd0\x67\x3d\
-\x6c\xf0\x88\x99\xc7\x69\x98\xf7\xe2\xd6\x30\xc6\x66\x62\x25\xa4\
-\x2a\x58\x80\x39\xcd\x3b\x41\x11\xa1\x51\x40\x04\x51\x61\xc7\x2d\
-\x3f\xfa\x11\x7f\x1e\x97\x21\x04\x10\x40\x10\x86\x16\x12\x03\x31\
-\x1c\x72\x59\x9d\x85\x1d\x10\xb9\x6b\x54\xa3\x33\x15\x47\x64\x04\
-\xb0\x70\x33\x2a\x48\x1d\x3c\xf1\xc5\x8e\xdd\x24\xa9\x58\xa9\x78\
-\x46\x0f\x7c\xd0\x0a\x90\xa0\xa0\xad\xc0\x02\x6b\x5c\xed\x3a\x81\
-\xa4\x5a\xc8\x93\x65\x2d\xb4\xda\x58\xa9\x65\x25\x85\xcc\xcd\xac\
-\x30\xd4\x59\xa9\xb2\xb0\x51\x86\x35\x5d\x6a\x47\x24\xab\x28\x2a\
-\x19\x59\x55\xc1\x0a\x49\x23\xce\xf8\x44\x8d\xcd\xd7\xf8\x18\x11\
-\x29\xb3\x9b\x25\x14\x50\x02\x85\x01\x47\x30\xa0\x10\x1d\x63\xaf\
-\xf0\x30\x11\xe8\x59\xe1\x31\x58\x8a\x8d\x72\x70\xbc\xea\x3e\x9e\
-\x2b\xd2\x61\x1a\x0e\x1e\x36\x1e\xf4\xbf\x9a\x33\x38\xbd\x1a\x93\
-\x48\x2e\x88\xf4\xc8\x5e\x8a\xd4\x1b\x05\xc2\x39\xbc\x9e\xc3\x7b\
-\x3c\x8f\xaa\x97\xe1\x04\x6b\xf8\x78\xf4\x4f\x7a\x5f\xcf\x0b\xc3\
-\x87\xa2\x7b\xd2\xfe\x78\xc7\x79\x3d\x86\xf6\x79\x1f\x55\x2f\xc2\
-\x0f\x27\x70\xde\xcf\x23\xea\xa5\xf8\x40\x6c\x78\x70\xf4\x4f\x7a\
-\x5f\xcf\x09\xc3\x87\xa2\x7b\xd2\xfe\x78\xc7\xf9\x39\x86\xf6\x79\
-\x1f\x55\x2f\xe5\x85\xf2\x73\x0d\xec\xf2\x3e\xa9\x3c\x20\x35\xfc\
-\x38\x7a\x27\xbd\x2f\xe7\x83\x87\x0f\x44\xf7\xa5\xfc\xf1\x91\xf2\
-\x77\x0d\xec\xf2\x3e\xaa\x5f\x84\x1e\x4e\x61\xbd\x9e\x47\xd5\x4b\
-\xf0\x80\xd7\x70\xf1\xe8\xb7\x7a\x5f\xcf\x07\x0f\x1e\x8b\x77\xa5\
-\xfc\xf1\x90\xf2\x6f\x0d\xec\xd8\x7f\xaa\x97\xf2\xc1\xe4\xd6\x17\
-\xd9\xb0\xff\x00\x55\x2f\xe5\x80\xd7\x70\xef\xd8\x6e\xf4\xaf\x9e\
-\x0e\x1d\xfb\x0d\xde\x95\xf3\xc6\x43\xc9\x8c\x2f\xb3\x61\xfe\xa6\
-\x5f\xcb\x0b\xe4\xce\x17\xd9\xb0\xff\x00\x52\x9f\x2c\x06\xbb\x86\
-\xfe\xc3\x77\xa5\x7c\xf1\x55\x8f\xd2\xc2\x5c\xe4\x73\x2d\xc8\xde\
-\xdd\x68\xa6\x55\x73\x64\x3c\xf3\x07\xa3\x14\xc3\x73\x18\x5f\x66\
-\xc3\xfd\x4c\xbf\x96\x14\x6e\x6b\x0a\x35\x61\xb0\xff\x00\x55\x2f\
-\xe5\x84\x4c\x7b\x26\x26\xb6\x2c\xcd\xd4\x61\x26\x86\x73\x87\xc4\
-\x1a\x82\xcd\x42\x8a\x79\x08\x2a\x32\x9a\x3e\x8d\x32\xe7\xca\x1f\
-\x88\xd3\xb8\x46\x77\x2d\x87\x9e\x59\x08\xbc\x87\x40\x2a\xe7\x20\
-\x69\x38\x06\xf3\xaa\x35\xd2\xb9\x52\x1b\xe4\xee\x1b\xd9\xe4\x7d\
-\x52\x7c\xb0\x79\x39\x86\xf6\x69\x1f\x54\x9f\x2c\x6a\xf1\xe3\xed\
-\x9a\xcb\x9f\xa4\x3a\x63\x15\x21\xa4\x3a\xaa\x4c\x96\xfc\x9b\x37\
-\xc7\x0d\x73\x17\x50\x40\x2b\x31\x81\x34\x27\x26\xd7\xcd\x5a\x1a\
-\x76\xe9\x5a\x89\x13\x48\xbc\x30\x96\xf4\xa5\xd5\xba\xc3\x4a\x53\
-\xa6\x23\x93\xa0\x70\xe8\x43\x24\x89\x2a\xc0\xd4\x32\xcb\x40\x41\
-\x19\x82\x08\x15\x06\x2c\x42\xb6\xde\xd1\x19\x99\x8f\x4d\x63\x75\
-\xbb\x16\xa3\x0d\x68\xa8\x93\x92\xfe\xef\x55\x23\x61\x83\x0d\x62\
-\x5f\xe7\x58\xb7\x57\x5d\xd6\x8a\xd7\xdf\x58\x94\x2f\x40\xec\x87\
-\xc4\x55\x5e\x96\xc0\x3b\x95\x64\x0a\x68\x08\x21\x8d\x39\xc1\x04\
-\x72\x4f\x4c\x73\xe8\xad\x1c\xea\xea\xec\x11\x56\xc7\x01\x54\x92\
-\x6a\xe5\x08\xa8\xb4\x01\x40\x87\xb7\xa2\x2f\x22\x3c\x34\x85\x44\
-\x54\x5a\xda\xa0\x01\x73\x33\xb5\x06\xd6\x62\x49\xeb\x26\x2a\x28\
-\x17\x43\xcc\x19\x5b\x2c\x80\x48\x0c\x58\xd6\x80\x9b\x7e\x86\xba\
-\x52\x2c\x65\x60\x5d\x51\x00\x20\x32\x97\x63\x43\xab\x7c\x57\x06\
-\xd2\x54\x82\x57\x7c\xa8\xaa\xd0\xdb\xab\x38\xb2\x85\x80\xe1\xc2\
-\x61\x5d\x15\x55\xd8\xbd\x2c\x05\xdd\x94\xb5\x10\x56\xa2\xd4\x5c\
-\xd9\x82\x93\x53\xcd\x1c\xb8\xe3\x49\xc8\x4e\xa0\xc2\x2e\x23\x83\
-\x49\x61\x6f\x15\x10\x58\x76\x39\x50\xb9\x9c\xf3\xae\x5d\x90\xdc\
-\x30\x36\xe7\xd3\x4e\xae\x68\xe2\xc2\x63\x96\x96\xcc\x21\x58\x7d\
-\x23\x40\x0f\xbf\x98\xc5\x8d\x7a\x62\x29\xc0\xc7\x24\xbf\x3d\x8f\
-\x4f\xdc\x21\xef\x88\x1a\x90\xd4\xea\xa8\xd4\x3c\x61\xf2\x25\xd0\
-\x45\x49\x3e\x08\x74\x24\x02\x41\x0b\x09\x00\x41\x04\x2c\x02\x41\
-\x0b\x1c\x1a\x5f\x16\xd2\x92\xf5\x17\x1a\xd2\x94\x27\x98\xec\xf7\
-\x46\x35\x33\x8c\x31\x9c\xa7\xc4\x2e\x38\xce\x53\x50\xeb\x9c\xf4\
-\x11\xe6\x5b\xab\x98\xed\x89\x46\x56\x2b\x42\x52\xe1\xf4\x77\xc0\
-\x80\x13\xd0\x4a\x85\xaf\xed\xc6\x8f\x11\xa6\xa7\xea\xb1\x28\x75\
-\x64\xe4\xe6\x0d\xb7\x00\x39\x39\xeb\xd9\x19\xbc\x60\x9b\x31\x81\
-\xb5\x6a\xf9\x10\x55\xed\xe6\x19\xd5\x75\x6b\xd7\xd1\xb6\x3c\x39\
-\xfe\x5e\x19\x54\xe3\xea\x7d\xbd\x18\x69\x4c\x5c\x4f\xb6\x6f\x74\
-\xba\x2a\x72\x13\x37\x12\xac\xed\x34\x2e\xf6\xe2\xea\x20\x19\x1a\
-\x01\x91\x27\x23\x95\x79\xeb\x4a\xd6\x35\x9b\x97\xc1\x4e\x13\x56\
-\x6c\xe7\x0e\xd6\x22\x02\x09\x6a\x8f\x38\xd4\xf3\xd0\xd4\x57\xae\
-\x2c\x30\xf8\x1a\xa2\xa4\xce\x5d\xa3\x20\x79\x4a\xa7\x9c\x2d\x79\
-\xab\x16\x7a\x3b\x0b\x57\x1c\xc1\x73\xfc\x00\x8e\x59\xfe\x76\x3a\
-\xb9\x46\x9e\x11\x37\x33\x04\x68\xf4\xc4\xcc\xfa\x68\xf4\x7b\x72\
-\xd7\xaf\xf1\x11\xa3\x8c\x4e\xe5\x74\xf6\x1f\x17\x31\x84\x86\x2c\
-\x65\x30\x57\xaa\x95\xd6\x4d\x18\x57\x58\x36\x9e\xc8\xdb\x47\xd6\
-\x79\x44\x10\x41\x00\x41\x04\x10\x15\x8f\xa2\x25\x96\x0c\x47\x28\
-\x56\x84\x80\x48\xae\xc3\xcd\x09\x37\x47\xa2\x8a\x96\x31\x66\x62\
-\x9f\x48\xa3\xb7\x9a\x20\x33\x9b\xa7\xd3\x89\x84\x97\x7a\xcb\x33\
-\x39\x61\x4a\xdf\x65\x01\xae\x75\xb4\xf3\x80\x3d\xf1\x94\x3f\xa4\
-\xa1\xec\x7f\xeb\x7f\xd7\x17\xfb\xa0\xd0\x53\x67\x23\x25\x35\xd0\
-\xd6\x95\xcc\x10\x7f\x08\xc5\x4c\xdc\x96\x28\x12\x04\x86\x60\x0e\
-\x44\x15\x00\xf4\xe6\x61\x05\xad\xff\x00\xa4\xcf\xfd\x3f\xf5\xbf\
-\xeb\x83\xfa\x4c\xff\x00\xd3\xff\x00\x5b\xfe\xb8\xa6\xf2\x4f\x17\
-\xec\xcf\xda\x9f\x34\x27\x92\x98\xbf\x66\x7f\xb3\xe3\x0a\x4b\x5d\
-\x8f\xd2\x60\xe7\xc1\x9f\xae\xff\x00\xae\x27\xc0\xfe\x90\xf7\xc7\
-\x54\xe0\xb6\xd6\xbc\xad\xf6\xb4\x0a\xa5\x89\xa6\xf6\x36\x46\x74\
-\x6e\x5b\x15\xec\xcf\xf6\x7c\x62\xdb\x43\xee\x43\x10\x18\x3b\xa5\
-\x99\x30\xb4\xf9\xd9\xe5\x9f\x36\xaa\xf6\xc2\x60\xb6\x8d\x37\x58\
-\x0f\xf6\x07\xbf\xf9\x61\xc3\x74\xff\x00\xb8\x3d\xff\x00\xcb\x10\
-\xa6\xe7\x9c\x7d\x18\x94\x68\x07\xf4\x62\x26\xe9\x06\xe9\xbf\x72\
-\x7b\xff\x00\x96\x14\x6e\x93\xf7\x3f\x6f\xf2\xc3\x06\x82\x7f\x46\
-\x17\x88\xdf\xd1\x82\xee\x93\xca\x2f\xdc\xfd\xbf\xcb\x0a\x37\x41\
-\xfb\xaf\xb7\xf9\x62\x31\xa1\x1f\xd1\x85\xe2\x67\xf4\x60\x6e\x97\
-\xca\x0f\xdd\x7d\xbf\xcb\x07\x1f\xfe\xeb\xed\xfe\x58\x8f\x89\xe6\
-\x7a\x30\x71\x3c\xcf\x46\x0b\xba\x4e\x3f\xfd\xd7\xdb\xfc\xb0\x71\
-\xf7\xee\xbe\xdf\xe5\x88\xf8\x9e\x67\xa3\x07\x13\xcc\xf4\x60\x25\
-\xe3\xef\xdd\x7d\xaf\xcb\x07\x1f\x7e\xeb\xed\x7e\x58\x8b\x89\xe6\
-\x7a\x30\x71\x3c\xcf\x46\x02\x5e\x3e\x3e\xaf\xed\xfe\x58\x4e\x3e\
-\x3e\xac\x77\xbf\x2c\x47\xc4\xf3\x3d\x18\x38\x9e\x67\xa3\x01\x2f\
-\x1f\x1f\x56\x3b\xff\x00\x96\x10\xe9\xd3\xea\xc7\x7c\xf8\x44\x7c\
-\x4f\x33\xd1\x83\x89\xe6\x7a\x30\x0f\xe3\xd3\xea\xc7\x7c\xf8\x41\
-\xc7\x87\xd5\x8e\xf9\xf0\x86\x71\x3c\xcf\x46\x0e\x27\x99\xe8\xc0\
-\x3f\x8f\x4f\xab\x1d\xf3\xe1\x01\xd3\xa7\xd5\xfd\xb3\xe1\x0c\xe2\
-\x79\x9e\x8c\x1c\x4f\x33\xd1\x80\x7f\x1f\x1f\x56\x3b\xe7\xc2\x10\
-\xe9\xd3\xea\xc7\x7c\xf8\x43\x78\x9e\x67\xa3\x07\x13\xcc\xf4\x60\
-\x23\x99\xa4\xd5\xb5\xc9\x1d\xf6\xf0\x88\x97\x19\x2c\x7f\xe3\xaf\
-\x7d\xbc\x23\xa7\x89\xe6\x7a\x30\x71\x3b\xfa\x30\x37\x09\xa7\x29\
-\xaa\x48\x1f\xe3\x3e\x10\xbe\x50\x37\xaa\x1d\xf3\xe1\x09\xc4\xf3\
-\x3d\x18\x69\xd0\xef\xe8\xc0\xdc\xe3\xba\x03\xea\xc7\x7c\xf8\x43\
-\x4e\xe8\xcf\xab\x1d\xf3\xe1\x11\xb6\x87\x99\xe8\x98\x63\x68\x59\
-\x9e\x89\x82\x6e\x94\xee\x98\xfa\xa1\xdf\x3e\x10\xd6\xdd\x41\x1f\
-\xd9\x0e\xf9\xf0\x88\x4e\x82\x99\xe8\x98\x89\xf4\x04\xc3\xf4\x4c\
-\x13\x74\xfe\x56\x9c\xff\x00\x54\x2a\x15\x88\x17\x91\x52\xaa\x48\
-\x1a\xb2\xad\x29\x19\xf1\xfa\x4e\x7f\x62\x5f\xaf\x6f\xe1\xc5\x83\
-\x6e\x7a\x68\x35\x0a\x63\x31\x8b\xdc\xbe\x26\x59\x03\x7a\x77\x07\
-\x51\x45\x66\xd5\xb6\x83\x23\x05\x8b\xf6\xb8\xfe\x93\x9b\xd8\x97\
-\xfc\xc3\x7f\x0a\x10\xfe\x93\x5b\xd8\x87\xf9\x86\xfe\x14\x50\xf1\
-\x06\x27\xd9\xa7\x7d\x5b\xf8\x44\x89\xb9\x9c\x51\xff\x00\xc6\x9b\
-\xef\x46\x1f\x78\x82\xae\xbf\xa4\xc6\xf6\x25\xff\x00\x30\xdf\xc2\
-\x84\xfe\x92\x8f\xb0\x8f\xf3\x0d\xfc\x28\xaa\x5d\xc9\xe2\xfd\x9a\
-\x67\x74\xc7\x66\x03\x71\x38\x97\x6a\x34\xb2\x8a\x28\x49\x7c\xaa\
-\x2b\xa8\x6d\x30\xe9\x85\xb7\xa8\xe8\xb2\xb3\x51\x1d\x81\x46\x64\
-\x56\x2b\x5b\xad\x24\x02\x56\xb4\x15\xa5\x69\x58\xb3\x1a\x35\x76\
-\x98\xa7\xc0\x68\xf9\x8b\x48\xd0\x48\x04\x0c\xe1\x50\x39\x34\x76\
-\x85\x93\x21\x99\xa5\xa2\xa1\x62\x59\xad\x01\x6e\x63\xad\x9a\x9a\
-\xcc\x59\xc1\x04\x54\x10\x41\x04\x01\x04\x10\x40\x10\x94\x85\x82\
-\x01\x96\x08\x37\xb1\xb2\x1f\x04\x03\x37\xb1\xb2\x0d\xec\x6c\x87\
-\xc1\x00\xcd\xec\x6c\x82\xc1\xb2\x1f\x04\x03\x6c\x10\x58\x21\xd0\
-\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\x10\x58\x21\xd0\x40\x36\xc1\
-\x05\x82\x1d\x04\x03\x6c\x10\x58\x21\xd0\x40\x36\xc1\x05\x82\x1d\
-\x04\x03\x6c\x10\x58\x21\xd0\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\
-\x10\x58\x21\xd0\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\x10\x58\x21\
-\xd0\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\x10\x9b\xd8\x87\xc1\x00\
-\xcd\xec\x6c\x83\x7b\x1b\x21\xf0\x40\x33\x7b\x1b\x20\xde\xc6\xc8\
-\x7c\x10\x11\x6f\x2b\xb2\x0d\xe5\x76\x44\xb0\x40\x30\x4b\x1b\x21\
-\x6c\x10\xe8\x20\x1b\x60\x82\x82\x1d\x04\x02\x52\x16\x08\x20\x08\
-\x20\x82\x00\x82\x08\x20\x3f\xff\xd9\
-\x00\x00\x73\xd3\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x79\x9c\xd4\x75\xfd\x07\xf0\xd7\xfb\x33\
-\x33\x2c\x37\x1e\x5c\xa9\xc8\xc2\x22\xa7\x22\x8a\x56\x26\xac\x9b\
-\x57\xa2\x02\x6a\x8d\x1c\x6a\x9a\xc2\x9a\x99\x25\xc8\x61\xfd\x2a\
-\xa7\x4b\xe5\x50\x52\x33\x13\x41\x2d\x0f\xc0\x4d\x53\x48\x2d\x4b\
-\x5b\x51\x33\x2d\xc8\x83\x53\x51\x01\xf1\x40\x50\x11\x84\x65\x77\
-\x67\xbe\xef\xdf\x1f\xec\xe2\xee\x1c\xb0\xc7\xec\xbc\x3e\x0b\xef\
-\xe7\xe3\xd1\xa3\x4c\x76\xde\xaf\x5d\x66\xe7\xf3\xf9\x7e\x4e\xc0\
-\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
-\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
-\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
-\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
-\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
-\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
-\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
-\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
-\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
-\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
-\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
-\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
-\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
-\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
-\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
-\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
-\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
-\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
-\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
-\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
-\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
-\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
-\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
-\x31\xc6\x18\x63\xf6\x1d\x23\xc6\xcc\xbc\x78\xe4\xa8\x99\x3f\x63\
-\xe7\x30\xc6\x18\x93\x5e\xdf\xc2\x71\xd7\xf5\x3f\x69\xdc\x77\xd8\
-\x39\x9a\x8b\x10\x3b\x40\x73\x30\x62\xd4\xf4\x28\x80\x3f\x40\x70\
-\x4a\xdf\x23\x4f\x6f\xb5\x7a\xd9\xdf\xff\xc1\xce\x64\x8c\x31\xe6\
-\x0b\xfd\x0b\x8b\x63\x00\x62\x80\x0c\xef\x7c\xf8\xb1\x6f\x6f\x5a\
-\xbf\xf4\x35\x72\x24\xef\x59\x07\x60\x2f\x86\x8f\x99\xfe\x4d\x81\
-\xcc\x03\x10\xae\xfa\xbf\x86\x58\x27\xc0\x18\x63\xfc\xd1\xbf\xb0\
-\x38\xa6\xd0\xeb\xaa\xfe\x51\x20\x32\xb2\x63\xf7\xe3\xd6\x6c\x5e\
-\xb7\xe4\x75\x6a\x30\xcf\x59\x07\x60\x0f\x46\x8e\x9e\x71\x2e\x20\
-\xf3\x01\x44\x92\xfe\x95\x75\x02\x8c\x31\xc6\x03\x49\x8d\x7f\x35\
-\x27\xc0\x39\x9d\xba\x1f\xbb\x7a\xf3\xba\xa5\xcb\x29\xc1\x9a\x01\
-\xeb\x00\x64\x30\x7c\xd4\xf4\xb3\x21\x52\x02\xa0\x45\x86\x3f\x32\
-\xa4\xcf\x91\xa7\xcb\xea\x65\x7f\x2f\xcd\x61\x2c\x63\x8c\x31\x55\
-\x32\x34\xfe\xd5\x1c\x20\x23\x3a\x76\x1b\xfc\xca\xe6\xf5\x4b\xdf\
-\xc8\x69\xb0\x66\xc2\x3a\x00\x69\x9c\x33\x7a\x46\x11\x44\x1e\x03\
-\x90\xb7\x97\x3f\x5a\x64\x23\x01\xc6\x18\x93\x7b\x7b\x69\xfc\xab\
-\x85\x44\x70\x6e\xc7\xc3\x07\x3f\xbf\x79\xfd\xd2\x75\x39\x09\xd6\
-\x8c\x58\x07\x20\xc9\xd9\xa3\x6e\x3a\x1a\xd0\xbf\x42\xd0\xb6\x8e\
-\x5f\x62\xd3\x01\xc6\x18\x93\x43\x75\x6c\xfc\xab\x45\x44\x70\x5e\
-\xc7\x6e\xc7\xfe\x7d\xf3\xfa\xa5\x1f\x34\x69\xb0\x66\xc6\x3a\x00\
-\x35\x9c\x3d\x76\xfa\x11\x0e\xfa\x0c\x44\x3a\xd6\xf3\x4b\xad\x13\
-\x60\x8c\x31\x39\x50\xcf\xc6\xbf\x5a\x9e\x88\x9c\xd7\xb5\xfb\xb1\
-\x7f\xf9\x68\xdd\xd2\xcd\x4d\x12\xac\x19\xb2\x0e\x40\x95\xf3\x2e\
-\x98\x76\x18\x02\x57\x0a\xc8\xa1\x0d\x7c\x09\xeb\x04\x18\x63\x4c\
-\x13\x6a\x60\xe3\x5f\xad\x75\x00\x19\xd9\xb1\xc7\x97\xff\xbc\x79\
-\xed\x7f\xb7\x64\x35\x58\x33\x65\x1d\x00\x00\xe7\x7e\xfb\xfa\x83\
-\x13\x89\xf0\xb3\x00\x0a\x1a\xf9\x52\xb6\x30\xd0\x18\x63\x9a\x40\
-\x23\x1b\x7f\x00\x80\x00\xed\x9d\xea\x19\x07\xf7\x3a\x61\xfe\xe6\
-\x77\xfe\x53\x96\xad\x6c\xcd\xd5\x7e\xdf\x01\x88\x46\x6f\x6e\x55\
-\xa9\xf2\x04\x80\x63\xb2\xf4\x92\xb6\x30\xd0\x18\x63\xb2\x28\x1b\
-\x8d\x7f\x0d\x1d\x25\x48\x14\x75\xef\x78\xdc\x83\x1f\x7c\xb0\xa4\
-\x32\x4b\xaf\xd9\x2c\xed\xd7\x1d\x80\x58\x2c\xe6\x36\x7c\x12\x9e\
-\x0f\xe0\x1b\x59\x7e\x69\x9b\x0e\x30\xc6\x98\x2c\xc8\x72\xe3\x5f\
-\xed\xd0\x78\x0b\x1d\xb8\xe9\xcb\x05\x0f\x61\xc5\x0a\xcd\xf2\x6b\
-\x37\x1b\xfb\x75\x07\xa0\x43\x97\xb3\x6f\x81\xe0\x92\x26\x7a\x79\
-\xeb\x04\x18\x63\x4c\x23\x34\x51\xe3\x5f\x45\xfa\x74\xdc\xde\xb2\
-\xcb\xe6\x75\x4b\xff\xd2\x34\xaf\xef\xbf\xfd\xb6\x03\x30\x62\xcc\
-\x8c\x1f\x01\xf8\x71\x13\x97\xb1\x4e\x80\x31\xc6\x34\x40\xd3\x36\
-\xfe\xbb\x08\x70\x5c\xa7\xfc\xe3\xca\x36\xaf\x5b\xf2\x42\x53\xd6\
-\xf1\xd5\x7e\xd9\x01\x18\x39\x7a\xfa\x28\x40\x7e\x07\x40\x72\x50\
-\xce\x16\x06\x1a\x63\x4c\x3d\xe4\xa2\xf1\xaf\xe1\xd4\xce\xf9\xc7\
-\xad\xd8\xb4\x6e\xc9\x8a\x1c\xd5\xf3\xc6\x7e\xd7\x01\x38\x67\xec\
-\xcc\xc1\xaa\x78\x14\x99\x8f\xf8\x6d\x0a\xb6\x30\xd0\x18\x63\xea\
-\x20\xc7\x8d\x3f\xb0\xeb\x41\xf0\xec\xce\xdd\x8e\xfb\xc7\xa6\xf5\
-\x4b\xde\xcb\x61\x5d\xba\xfd\xaa\x03\x30\x62\xf4\xb4\x43\x54\xe5\
-\x19\x00\x07\x13\xca\xdb\x74\x80\x31\xc6\xec\x01\xa1\xf1\xaf\x16\
-\x81\xe8\xd9\x5d\xbb\x1f\xfd\xd0\x47\xeb\x5e\xd9\x4a\xa8\x4f\xb1\
-\xdf\x74\x00\xa2\xd1\xdb\xdb\x26\x5c\xfc\x69\x00\x47\x10\x63\x58\
-\x27\xc0\x18\x63\xd2\x20\x36\xfe\x55\xa4\xad\xc2\x7d\xbd\x4b\x8f\
-\xaf\x3e\xb0\x69\xed\x7f\x2a\x78\x39\x72\xc7\xb1\x03\xe4\x42\x2c\
-\x16\x73\xe5\xa1\xed\x0f\x00\x38\x9a\x9d\x45\x81\xa9\x23\x46\xcf\
-\x88\xb1\x73\x18\x63\x8c\x2f\xf8\x8d\xff\x6e\x83\x82\xa0\xf2\x7e\
-\x20\xb6\x5f\xb4\x8d\xfb\xc5\x08\x40\xfb\xae\x67\xfd\x1a\x90\x71\
-\xec\x1c\x35\xd8\x9a\x00\x63\x8c\x81\x57\x8d\x7f\xb5\xbe\x9d\xba\
-\x6f\x0d\x6f\x5e\xb7\xf4\x19\x76\x90\xa6\xb6\xcf\x77\x00\x46\x8e\
-\x9e\x71\x2e\x80\xdb\x90\x9b\x15\xff\xf5\x61\xd3\x01\xc6\x98\xfd\
-\x9a\x87\x8d\x7f\x15\x19\xda\xb9\xfb\xe0\x95\x9b\xd6\x2d\x5d\xce\
-\x4e\xd2\x94\x7c\x6b\x14\xb3\x6a\xe4\x05\x37\x1f\xa5\x89\xc4\xbf\
-\x80\x3a\x5f\xed\x9b\x63\xba\x51\xc5\x1d\xb9\x68\xde\x24\xbb\x9d\
-\xca\x18\xb3\x5f\xe9\x5d\x54\xdc\x31\x14\xe8\x32\x00\x5d\xd8\x59\
-\x32\xf8\x1c\x2e\x38\x61\x65\xe9\xdc\x65\xec\x20\x4d\x65\x9f\x9d\
-\xe7\x38\x6b\xec\x0d\x07\x6a\x22\xf1\x08\x7c\x6d\xfc\x15\x5b\x80\
-\xd0\x30\x6b\xfc\x8d\x31\xfb\xa3\x37\x4a\x67\x6f\x56\xc8\x69\x80\
-\x7e\xcc\xce\x92\x41\x5b\x04\x6e\x51\xdf\x53\xae\x64\xec\x1a\xcb\
-\x89\x7d\xb2\x03\x10\x8d\x3e\x14\x0a\x07\xe1\xf9\x00\x7a\xb1\xb3\
-\x64\xb0\x15\x12\x9c\xb6\x70\xfe\x35\xff\x63\x07\x31\xc6\x18\x96\
-\x55\x8b\x67\xbf\xee\x44\x86\x01\xf0\x75\xeb\x5d\x3e\x2a\xca\xf7\
-\xd9\x45\x81\xfb\xe4\x37\xb5\x33\xbc\xee\xe7\x0a\x9c\xce\xce\x91\
-\xc1\x0e\x15\x1d\xb1\x70\xfe\xd4\xff\xb2\x83\x18\x63\x0c\xdb\xf2\
-\x67\xef\xfa\x8f\x02\xc3\x00\x7c\xce\xce\x92\x8e\x88\x9c\xd1\xbf\
-\xf0\xfd\x9f\xb1\x73\x34\x85\x7d\x6e\x0d\xc0\xd9\xa3\x6f\x3a\xc5\
-\x21\xf8\x1b\xfc\x5c\xe0\x58\xa1\x2a\xe7\x2c\x5a\x30\xe9\x49\x76\
-\x10\x63\x8c\xf1\x49\xbf\xa2\xf1\xa7\x22\xc0\x22\x00\x2d\xd9\x59\
-\xd2\x08\x54\x71\xe6\xaa\xe7\xee\xfa\x1b\x3b\x48\x36\xed\x53\x1d\
-\x80\x91\xa3\x6f\xea\xa6\x08\x96\x02\xe8\xc8\xce\x92\x46\x42\x20\
-\xa3\x1f\x9b\x3f\xe9\x4f\xec\x20\xc6\x18\xe3\xa3\xfe\x43\xc7\x8d\
-\x54\x91\x12\x00\x11\x76\x96\x34\x3e\x41\x38\x38\x76\xe5\x33\x73\
-\xd7\xb1\x83\x64\xcb\x3e\x33\x05\x50\x5c\x7c\x67\x44\x11\xcc\x83\
-\x9f\x8d\x7f\xa0\x22\x17\x59\xe3\x6f\x8c\x31\x99\xad\x78\x6e\xce\
-\x63\x4e\x75\x2c\x80\x04\x3b\x4b\x1a\x07\x21\xee\xe6\x0f\x18\x10\
-\xcd\xe5\x3d\x32\x4d\x6a\x9f\xe9\x00\x7c\xf8\xd9\xd6\xe9\x00\x4e\
-\x64\xe7\x48\x43\x01\x1d\xbf\x68\xde\xa4\x79\xec\x20\xc6\x18\xe3\
-\xbb\xe5\xcf\xcd\xf9\x13\x54\xbe\x0b\x40\xd9\x59\xd2\xf8\xaa\x1e\
-\xdc\xe1\x7a\x76\x88\x6c\xf1\x71\x9e\xbc\xde\x46\x8e\x99\x31\x1c\
-\xc0\x6f\xe0\xe1\x94\x86\x0a\x26\x2e\x9a\x3f\xe5\x0e\x76\x0e\x63\
-\x8c\x69\x2e\x36\xaf\x5f\xb2\xb4\x63\xf7\xe3\x3e\x17\x2f\x17\x73\
-\xcb\x09\x9d\xba\x1f\xfb\x9f\xcd\xeb\x96\xbe\xc9\x4e\xd2\x58\xde\
-\x35\x98\xf5\x75\x76\xf4\xe6\x43\x5d\x28\xf1\x0a\x7c\x1c\xfa\x17\
-\xbd\x65\xe1\xbc\x29\x57\xb3\x63\x18\x63\x4c\x73\xd4\x77\xe8\xf8\
-\x5b\x45\x70\x15\x3b\x47\x1a\x9b\xa0\x72\xf4\xca\xe7\x66\x7f\xc0\
-\x0e\xd2\x18\xcd\x7a\x0a\x20\x16\x8b\xb9\x50\x28\xfe\x07\xf8\xd8\
-\xf8\x03\x8f\xe7\xc5\xf3\xaf\x61\x87\x30\xc6\x98\xe6\x6a\x55\xd7\
-\x2d\x13\x00\x3c\xc6\xce\x91\x46\x27\x40\x1f\x6c\xee\xe7\x03\x34\
-\xeb\xf0\x4b\x56\xb5\xbe\x56\x21\xa7\xb0\x73\xa4\xb1\x74\x67\x04\
-\xa3\x4a\x4a\xce\xf7\x71\x21\x8b\x31\xc6\x34\x0f\x25\x25\x89\xd6\
-\xdb\x65\x2c\x80\x97\xd9\x51\x52\x08\x8a\xfa\x0d\xdd\xd0\xac\x1f\
-\xf2\x9a\xed\x14\xc0\xf0\x51\x33\x8f\x17\xd1\x17\xe0\xdf\x76\x91\
-\xf7\xc2\xa1\xe0\xab\x8f\x3c\x30\x75\x03\x3b\x88\x31\xc6\xec\x0b\
-\xfa\x0d\x2d\xfe\x12\x44\xff\x0d\xe0\x70\x76\x96\x24\x95\x12\xc8\
-\xd0\x15\xcf\xcf\x7e\x89\x1d\xa4\x21\x9a\x65\x07\xe0\xf4\x8b\x66\
-\xb4\x69\x59\x89\xff\x01\x38\x82\x9d\x25\xc9\x56\x08\x86\x2e\x9c\
-\x37\xf9\x35\x76\x10\x63\x8c\xd9\x97\xf4\x3f\x71\xfc\x00\x0d\xe1\
-\x79\x00\x07\xb0\xb3\xd4\xa2\x78\xcb\x85\x22\x83\x96\x97\xfe\xce\
-\xcb\x93\x0c\xf7\xa4\x59\x4e\x01\xb4\xac\xd4\x99\xf0\xaf\xf1\xaf\
-\x84\xc8\xb7\xac\xf1\x37\xc6\x98\xec\x5b\xf1\xc2\x5d\xcb\x55\x31\
-\x1a\x40\x9c\x9d\xa5\x16\x41\x81\x06\x95\x37\xb0\x63\x34\x44\xb3\
-\xdb\x06\x38\x62\xcc\xcc\xd3\xe0\xe5\x96\x3f\xf9\xfe\xc2\xf9\x93\
-\x1e\x62\xa7\x30\xc6\x98\x7d\xd5\xe6\xf5\x4b\xdf\xea\xd4\xfd\xd8\
-\xf7\x01\x19\xc1\xce\x92\xe4\xf8\xce\xf9\x83\x5f\xde\xb4\x6e\xe9\
-\x1a\x76\x90\xfa\x68\x56\x1d\x80\xb3\xc6\xde\x70\xa0\x53\xf7\x37\
-\x00\xed\xd9\x59\x6a\x12\xe8\xf5\x0b\xe7\x4f\x9e\xce\xce\x61\x8c\
-\x31\xfb\xba\xcd\xeb\x96\xfe\xaf\x53\xf7\xc1\xad\x00\x0c\x61\x67\
-\xa9\x41\x14\x38\xe9\xb0\x1e\x03\xef\xf9\x70\xed\x2b\x3b\xd9\x61\
-\xea\xaa\x59\x4d\x01\xb8\x20\xfc\x5b\x00\x87\xb2\x73\xd4\x26\x7f\
-\x39\xa6\xef\x8e\x9f\xb2\x53\x18\x63\xcc\xfe\x62\xe5\xe2\x43\x7f\
-\x0c\xe0\x09\x76\x8e\x9a\x04\x38\xac\x5c\x5b\xdc\xc6\xce\x51\x1f\
-\x9e\x0d\xa3\x67\x36\x72\xf4\x8c\x73\x15\x78\x84\x9d\x23\xc9\x1a\
-\xd7\x32\x7c\xfc\xa3\xf7\x4e\xd8\xc2\x0e\x62\x8c\x31\xfb\x93\xa3\
-\x86\x5c\x71\x60\xc2\x25\xfe\xab\xd0\x9e\xec\x2c\xb5\xa8\x9c\xbb\
-\xf2\xb9\xd9\x8f\xb2\x63\xd4\x45\xb3\xe8\x00\x9c\x73\xc9\xac\x03\
-\x82\x9d\xf1\x65\xf0\xeb\xe9\xbf\x0c\x70\x27\x2e\x9c\x7f\xcd\xff\
-\xd8\x41\x8c\x31\x66\x7f\xd4\x67\xe8\xb8\x81\x4e\xe4\x45\x00\xad\
-\xd9\x59\xbe\xa0\x1f\x86\x83\x48\xff\xd7\x9f\xbf\xe3\x53\x76\x92\
-\xbd\x69\x16\x53\x00\x41\x79\xfc\x16\xf8\xd5\xf8\x03\x22\x57\x58\
-\xe3\x6f\x8c\x31\x3c\xab\x9f\x9b\xf3\x9a\x00\xc5\xec\x1c\xb5\x49\
-\xd7\x4a\x49\xdc\xc4\x4e\x51\x17\xde\x2f\x02\x1c\x79\xfe\x8c\x53\
-\x21\x98\x09\x8f\x46\x2b\x44\xe5\xb6\x85\xf3\x27\xdd\xc8\xce\x61\
-\x8c\x31\xfb\xbb\x4d\xeb\x96\xbe\xde\xe9\xf0\x63\xbb\x40\xe4\x78\
-\x76\x96\x6a\x22\x38\xa6\xe3\xe1\x83\xff\xbd\x79\xfd\xd2\xb7\xd8\
-\x59\xf6\xc4\xeb\x11\x80\x61\x17\xdc\xda\x5e\x1d\xe6\xc2\xa3\xc6\
-\x1f\xd0\x7f\xb7\x08\x3e\x9f\xc4\x4e\x61\x8c\x31\x66\x97\xd6\x3b\
-\xdc\x0f\x05\x78\x81\x9d\xa3\x26\x01\xee\xec\x73\xe2\xa5\xed\xd8\
-\x39\xf6\xc4\xeb\x0e\x40\x24\x51\x71\x3d\xfc\x3a\xfa\xf1\x43\x40\
-\xbf\x59\x52\x12\xab\x60\x07\x31\xc6\x18\xb3\xcb\x92\x25\xb3\x2b\
-\x2b\x9c\x8e\x56\xe0\x23\x76\x96\xdd\x04\xdd\x5d\x28\xf4\x4b\x76\
-\x8c\x3d\xf1\xb6\x03\x30\x62\xf4\xb4\xe3\x00\xfd\x2e\x3b\x47\x0d\
-\x71\x15\x1d\xbd\x70\xfe\xd4\xf7\xd9\x41\xea\xe3\xec\xd1\x37\xf9\
-\x78\x59\x92\x31\xc6\x73\xfd\x87\x5e\xde\xac\x3e\x3b\xd6\x94\xce\
-\xd9\xa0\x22\xbe\x9d\x14\x78\xd5\x80\xa1\x97\x7d\x99\x1d\x22\x13\
-\x2f\xd7\x00\x44\xa3\x0f\x85\x12\x6e\xeb\x22\x00\x87\xb0\xb3\xec\
-\x26\x32\x65\xd1\xbc\xc9\xf3\xd8\x31\xea\x63\xc4\xe8\x19\x3f\x15\
-\xe8\x3d\x7d\x8f\x3c\xbd\xd5\xea\x65\x7f\xff\x07\x3b\x8f\x31\xa6\
-\x79\xe8\x5f\x58\x1c\x53\xd1\xbb\x3b\x1d\x7e\x5c\xb0\x79\xfd\x92\
-\xc5\xec\x3c\x75\xf5\xf1\xba\x25\x6b\x3b\x75\x1f\x5c\x01\xe0\x54\
-\x76\x96\x2a\x12\x88\x0c\xda\xfc\xe5\x82\xbb\xb1\x62\x85\xb2\xc3\
-\x24\xf3\x72\x04\x60\x67\x78\xdd\x55\x00\x8e\x61\xe7\xf8\x82\xfe\
-\x7d\xe1\xbc\x6b\x6e\x66\xa7\xa8\x8f\x91\xa3\x67\xfc\x00\xc0\x2f\
-\x00\x40\x81\xa9\x23\x47\xcf\xb0\x45\x8b\xc6\x98\xbd\xea\x5f\x58\
-\x1c\x53\xe8\x75\x00\x00\xd1\x5f\xf4\x1b\x3a\x6e\x32\x39\x52\xbd\
-\xac\x5c\x7c\xd7\x74\x00\x4f\xb2\x73\x54\x13\xe0\xf8\x7e\x1b\x3b\
-\xf8\x34\x9a\xbd\x9b\x77\x1d\x80\xf3\x2e\x9c\xf5\x25\x51\xc4\xd8\
-\x39\x6a\xd8\x1c\x0e\x47\x2e\xde\x75\xd2\x63\xf3\x30\x72\xd4\x8c\
-\xef\xe8\xae\xfb\x12\x76\xb3\x4e\x80\x31\x66\x6f\x6a\x35\xfe\xd5\
-\x44\xa6\xf5\x1f\x3a\xde\xcb\x06\x2c\x03\x4d\x84\x43\xe3\x01\xfd\
-\x98\x1d\xe4\x0b\x72\x7d\xef\x93\xbf\xeb\xd7\x56\x76\x78\xd8\x01\
-\x88\xc7\xe3\xb7\x02\xe8\xc0\xce\x51\x4d\x45\xc6\x3f\x72\xff\x84\
-\x0f\xd8\x39\xea\x6a\xc4\x98\x19\x17\xaa\x60\x0e\xd2\xec\x9c\xb0\
-\x4e\x80\x31\x26\x93\xb4\x8d\xff\x2e\xa2\x82\xdb\xfb\x17\x8e\xbf\
-\x20\xe7\xa1\x1a\xe8\x8d\x67\x7e\xff\x9e\x53\xf8\xd4\x69\x69\x1f\
-\x4a\x24\x66\xb2\x43\x24\xf3\x6a\x0d\xc0\xf0\x31\x33\x4e\x16\x60\
-\x1a\x3b\x47\x35\x55\x9d\xb3\x68\xfe\xe4\x19\xec\x1c\x75\x35\x7c\
-\xcc\xcc\x73\x44\xf1\x00\xf6\xfc\xf7\x3a\xc4\xd6\x04\x18\x63\x6a\
-\xda\x43\xe3\x5f\x4d\x00\x8c\xec\xdc\x7d\xf0\xaa\x4d\xeb\x96\x2e\
-\xcf\x55\xae\xc6\xd8\xb4\x7e\xe9\x8a\xce\xf9\x83\xf3\x01\x0c\x62\
-\x67\xa9\x72\x64\xc7\x1e\xc7\x3e\xbb\x79\xed\xd2\xb5\xec\x20\xd5\
-\xbc\x19\x01\x28\x2a\x8a\x85\x25\xd0\xdf\xec\xfd\x4f\xe6\xcc\x5b\
-\x52\xa6\x13\xd9\x21\xea\x6a\xc4\x98\x99\xa7\x89\xea\x7c\x00\xe1\
-\xbd\xfd\x59\x1b\x09\x30\xc6\x54\xab\x43\xe3\x5f\x2d\xa4\xc0\x7d\
-\xfd\x0a\xc7\x9d\xd9\xe4\xa1\xb2\x24\x9c\xb7\xf3\xfb\x00\xde\x64\
-\xe7\xa8\x26\x2a\xbf\x2d\x2a\x8a\xed\xf5\x33\x3a\x57\xbc\xe9\x00\
-\xb4\xfb\x52\x9b\xef\x43\xe4\x28\x76\x8e\x2a\x71\x55\x77\xe1\xc2\
-\x85\x53\xb7\xb1\x83\xd4\xc5\xf0\x31\x33\x87\x40\xf5\x31\x00\x79\
-\x75\xfd\x1a\x05\xa6\x8e\x18\x3d\x23\xd6\x74\xa9\x8c\x31\xbe\xab\
-\x47\xe3\x5f\xad\x05\x20\x25\x7d\x0b\xc7\x7f\xad\xc9\x42\x65\xd1\
-\x6b\x4f\xdd\xb7\xdd\x09\x2e\x00\x50\xc9\xce\x02\x00\x50\x0c\xd8\
-\x18\x6c\xb8\x9c\x1d\xa3\x9a\x17\x53\x00\xe7\x5e\x34\xa3\xb3\xc6\
-\xf1\x27\x08\x5a\xb2\xb3\x54\x89\x2d\x5a\x30\xe9\x41\x76\x88\xba\
-\x38\x6b\xec\xac\x9e\x4e\x83\xbf\xa3\x61\xeb\x26\x8a\x6c\x3a\xc0\
-\x98\xfd\x53\x03\x1a\xff\x6a\x11\x81\x9e\xd3\xb1\xdb\xe0\x47\x37\
-\xaf\x5f\xea\xd1\x42\xbb\xf4\x36\xad\x5b\xfa\x7e\xe7\xc3\x07\x87\
-\x21\x38\x89\x9d\x65\x17\x39\xe1\xa0\x1e\xc7\xcd\xfd\x78\xed\x92\
-\x1d\xec\x24\x5e\x8c\x00\xc4\x2b\xf4\xd7\x10\x1c\xc0\xce\x51\xe5\
-\x5f\x79\x89\xee\xd7\xb3\x43\xd4\xc5\xb9\xdf\xbe\xfe\xe0\x50\x10\
-\x7f\x12\x40\xa7\x86\xbe\x86\x4d\x07\x18\xb3\xff\x69\x44\xe3\x5f\
-\x45\x0e\x16\xc1\x13\xbd\x86\x7e\xa7\xc1\x9f\x3d\xb9\xd4\x39\x74\
-\xe8\x2f\x01\xfc\x9b\x9d\xa3\xca\x81\xa1\x44\xf0\x0b\x76\x08\xc0\
-\x83\x33\xf6\xcf\x1e\x75\xd3\xd1\x4e\x82\xa5\xf0\xa1\x33\x22\xd8\
-\x96\x90\xf0\xa0\xc7\x1f\x9c\xf0\x36\x3b\xca\xde\x44\xa3\xb1\x16\
-\xe5\xe1\xb6\x7f\x85\xea\xd7\xb3\xf1\x7a\x02\x4c\x7b\x6c\xfe\xe4\
-\x6b\xb3\xf1\x5a\xc6\x18\x7f\x35\xbe\xf1\xaf\x41\xf1\x7c\x65\xdb\
-\x96\xa7\xae\x79\xf2\xb6\xf2\xac\xbc\x5e\x13\x1a\x50\x74\x59\xaf\
-\x20\x70\xff\x03\xd0\x96\x9d\x05\x40\x02\x2e\x18\xb4\xb2\x74\xee\
-\x32\x66\x08\x7a\xa3\x1b\x92\x60\xba\x0f\x39\x00\x00\x01\x7e\xdc\
-\x1c\x1a\x7f\x40\xa5\x3c\xd4\x66\x6e\xb6\x1a\x7f\xc0\x46\x02\x8c\
-\xd9\x1f\x64\xb5\xf1\x07\x00\xc1\x90\xc8\xf6\x9d\x7f\x84\x07\x0f\
-\x93\x7b\xb3\xbc\x74\xee\x1a\xa8\xfe\x94\x9d\xa3\x4a\x08\x81\xa3\
-\xef\x78\xa3\xae\x01\x18\x79\xfe\xcc\x6f\xa8\x20\x7b\x6f\xc6\x46\
-\x50\xc8\xcb\x2d\x83\xee\x57\xac\x58\x51\xe2\xfd\x81\x3f\x23\x46\
-\xb7\xbd\x1e\xc0\x95\x4d\xf0\xd2\xb6\x45\xd0\x98\x7d\x54\xd6\x1b\
-\xff\x2f\x0c\xe8\xd4\x7d\x70\x68\xf3\xba\xa5\xff\x6c\x82\xd7\xce\
-\xaa\xcd\xeb\x47\xbc\xdc\xa9\xfb\xd6\xd3\x01\xe9\xc6\xce\x02\xe0\
-\x88\x4e\xf9\xc7\xfe\x6b\xf3\xba\xa5\xb4\x87\x4e\xda\x93\x77\x2c\
-\x16\x73\xea\xf4\x06\x56\xfd\x24\xf1\x90\x0b\x2e\x2f\x29\x39\x3f\
-\xc1\x0e\xb2\x37\x23\x46\x4f\xbf\x14\xc0\x8f\x9a\xea\xf5\x6d\x24\
-\xc0\x98\x7d\x4f\x13\x36\xfe\xd5\x7e\xd2\x3c\x4e\x0b\x8c\x05\xc1\
-\xae\x03\x82\xbc\xd8\x15\xa0\x90\x19\x40\x8c\xd6\x0e\xd3\x46\x00\
-\xda\x75\x3d\xf3\x62\x81\x78\xf1\x86\x51\xc1\x0d\x0b\xe7\x4d\xf1\
-\x7e\xd5\xff\xd9\xa3\x6f\x3a\x45\x80\xf9\x68\xfa\xbf\xb7\x21\x7d\
-\x8e\x3c\x5d\x56\x2f\xfb\x7b\x69\x13\xd7\x31\xc6\x34\xb1\x1c\x34\
-\xfe\xbb\x08\xbe\xd1\xa5\xfb\xb1\x2f\x6c\x5a\xb7\xf4\x9d\x26\xaf\
-\xd5\x08\x1f\xaf\x5f\xba\xb1\x53\xf7\xc1\x6d\x00\x0c\x61\x67\x11\
-\xa0\x6b\xa7\xfc\x6d\x6f\x6d\x5e\xb7\xf4\x35\x46\x7d\x4a\xcf\x23\
-\x1a\xbd\xb9\x95\x40\x7c\xb9\x27\xf9\x8d\x6d\x79\xdb\x7f\xc5\x0e\
-\xb1\x37\xc3\xa3\x37\x1e\xee\x10\xcc\x03\x10\xc9\x51\xc9\xeb\x6c\
-\x24\xc0\x98\xe6\x2d\x67\x8d\xff\x2e\x91\x00\x52\xd2\xa7\x70\x5c\
-\x8f\x1c\xd5\x6b\xb0\x6d\x95\x6d\x7f\x0e\xc5\x5b\xec\x1c\x00\x00\
-\xc5\xaf\xf2\x8b\x2e\xa1\x6c\x81\xa7\x74\x00\xca\xc3\xc1\xf7\x00\
-\x1c\xc6\xa8\x9d\x44\x03\xb8\xef\x95\xde\x1b\xdb\xc9\x0e\xb2\x27\
-\xc3\x86\xdd\x9a\x27\xa1\xd0\x9f\xd0\x88\xed\x7e\x0d\x61\xd3\x01\
-\xc6\x34\x5f\x39\x6e\xfc\xab\x1d\xe4\xe0\x1e\x3e\xec\x84\x09\xad\
-\x72\x5c\xb7\x5e\x36\xbc\x38\xab\x4c\x43\x3a\x0e\x80\x0f\x6b\xbe\
-\x0e\x6f\x15\x44\x28\x87\x03\xe5\xbc\x03\x10\x8d\xde\xde\x16\xaa\
-\x53\x72\x5d\x37\x83\xbb\xff\x32\xff\x9a\xa7\xd9\x21\xf6\x26\xdc\
-\x7e\xe7\x6f\x01\x1c\xcf\xa8\x6d\x9d\x00\x63\x9a\x1f\x52\xe3\x5f\
-\x45\x8f\x69\x1f\xd9\xee\xd3\xb1\xee\x69\xad\x2a\x9d\x53\x0a\xe0\
-\x3e\x76\x8e\x2a\xff\xd7\xe7\xc4\x4b\xdb\xe5\xba\x68\xce\x3b\x00\
-\x15\xae\x6c\x22\x80\xce\xb9\xae\x9b\x4a\x37\x26\x5c\xdc\xfb\x7b\
-\xae\x87\x8f\x9e\x79\x91\x88\x8c\x63\x66\xb0\x4e\x80\x31\xcd\x07\
-\xb7\xf1\xdf\x45\xa1\xc5\xfd\x0a\xc7\x5d\xc6\xcc\x50\x17\x1a\x69\
-\x31\x51\x81\x8f\xd8\x39\x00\x74\x12\x17\xfa\x7e\xae\x8b\xe6\x74\
-\xef\xe6\x59\x63\x6f\x38\x30\x14\x84\xdf\x02\x70\x60\x2e\xeb\xa6\
-\xa3\x82\x51\x8b\xe6\x4d\x7e\x88\x9d\x63\x4f\xce\x19\x3b\x7d\x50\
-\x10\xc8\xbf\x00\x78\x31\x9c\x66\x87\x05\x19\xe3\x37\x1f\x1a\xff\
-\x1a\x76\x06\xce\x0d\x5d\x5d\x7a\xe7\x7f\xd9\x41\xf6\xa4\xff\xd0\
-\x71\x17\xaa\x88\x0f\x23\x01\x5b\xc2\x41\xb8\xe7\xeb\xcf\xdf\xf1\
-\x69\xae\x0a\xe6\x74\x04\x20\x94\x88\x5c\x0b\x0f\x1a\x7f\x08\xfe\
-\xe1\x7b\xe3\x1f\x8d\xde\x7c\x50\x10\xc8\x23\xf0\xa4\xf1\x07\x6c\
-\x24\xc0\x18\x9f\x79\xd6\xf8\x03\x40\x4b\x17\x04\x0f\xf7\x2e\x2a\
-\xee\xc8\x0e\xb2\x27\x2b\x9e\x9b\x73\x3f\x14\xa5\xec\x1c\x00\x0e\
-\x88\xbb\xca\x6b\x72\x59\x30\x67\x1d\x80\x73\x2f\x9a\xd1\x19\xa2\
-\x39\x1f\xe2\x48\x23\x21\x2e\xe4\xf5\x35\xbf\xd1\xe8\x43\xa1\x8a\
-\x50\x62\x1e\x00\xef\x56\xd3\x2a\x30\x75\xc4\xa8\xe9\x57\xb0\x73\
-\x18\x63\xbe\xd0\xef\xa4\xe2\x2b\x3c\x6b\xfc\xab\x1d\xee\x12\xc1\
-\x7d\xcc\xbd\xee\x75\x21\x12\x4c\x04\x10\xb0\x73\x00\xf2\x83\xbe\
-\xa7\x5c\x79\x70\xae\xaa\xe5\xec\x2f\x25\xa8\xc4\x44\x00\xad\x73\
-\x55\x2f\x33\xbd\xeb\xb1\x07\x26\xbe\xce\x4e\xb1\x27\x15\x6e\xdd\
-\xb5\x0a\x9c\xce\xce\x91\xc1\xaa\x50\x0b\x79\x98\x1d\xc2\x18\xf3\
-\x85\x48\xa5\x7b\x58\x80\x55\xec\x1c\xe9\x88\xc8\x19\x7d\x87\xbe\
-\x37\x95\x9d\x63\x4f\x56\x2c\x9e\xfb\x3f\x00\xf7\xb2\x73\x00\x68\
-\x27\x95\x15\x57\xe7\xaa\x58\x4e\x3a\x00\xd1\xe8\xcd\x07\xa9\xe0\
-\x7b\xb9\xa8\xb5\x47\x82\x6d\xf1\x04\x7e\xce\x8e\xb1\x27\xe7\x8c\
-\x9d\x39\x58\x05\x3f\x63\xe7\xc8\x60\x7d\xdc\xc9\x19\x7f\xbe\x6f\
-\xb2\x0f\x8b\x66\x8c\x31\x55\x5e\xfb\xd7\xef\x3f\x8a\x87\x43\xa7\
-\x0a\xc4\xcb\xbb\x4c\x44\xf0\x8b\x01\x43\x2f\xfb\x32\x3b\xc7\x9e\
-\x84\x22\xfa\x63\x00\x5b\xd9\x39\x00\xfc\xe0\xa8\x21\x57\xe4\x64\
-\xaa\x3c\x27\x1d\x80\xf2\x50\xe2\x6a\x28\x72\xbe\xc5\x21\x45\x80\
-\x5f\x3e\x51\x32\xe5\x43\x76\x8c\x4c\x86\x0f\x8f\xb5\x0e\x54\x1f\
-\x00\xd0\x82\x9d\x25\x8d\xf7\x34\x81\xa2\x27\x1e\x9c\xb4\x8e\x1d\
-\xc4\x18\x93\xea\x8d\x67\x7e\xff\x9e\x04\xf8\x3a\x14\x3e\xfe\x8e\
-\x86\x03\x71\x0f\x0c\x28\xfa\x9e\x0f\x37\xf1\xa5\xb5\xec\xe9\x39\
-\x1b\x01\x99\xce\xce\x01\xa0\x7d\x5c\x12\x39\x99\x2e\x6f\xf2\x0e\
-\xc0\xb0\x0b\x6e\x6d\x0f\xc0\x87\xb9\xff\x77\x2a\xb7\xe6\xdd\xca\
-\x0e\xb1\x27\xd2\xa6\xf5\x2c\x28\xfa\xb0\x73\xa4\xb1\x29\xa4\xc1\
-\x69\x8b\x4a\x26\x7b\x7d\xc4\xa7\x31\xfb\xbb\xe5\xcf\xcf\x5e\x0f\
-\x71\xa7\x01\xea\xe3\x83\x4e\xaf\x20\x51\xe1\x43\x03\x9b\x51\x99\
-\xab\xb8\x09\xc0\x5a\x76\x0e\x88\x5e\x9d\x8b\x73\x01\x9a\xbc\x03\
-\xd0\x22\x5e\x7e\x15\x3c\x58\xf9\x2f\x90\x29\x4f\x3e\xf9\x03\x6f\
-\xef\xac\x1e\x3e\x6a\xe6\x30\x40\xc6\xb3\x73\xa4\x50\x6c\x51\xd5\
-\x33\xfe\xbc\x60\xea\x4a\x76\x14\x63\xcc\xde\xad\x5c\x7c\xe7\x9b\
-\x81\xe2\x1b\x00\x3e\x61\x67\x49\x21\x72\x45\xdf\x93\x2e\x1b\xce\
-\x8e\x91\xc9\xda\xd2\x7b\x77\x42\x9b\xee\xb2\xb5\x7a\x38\x48\x42\
-\xe1\xa6\xb8\xf1\xb5\x96\x26\x3d\x07\xa0\xe8\x92\x58\xcb\xf6\x3b\
-\xdb\xbc\x03\xa0\x6b\x53\xd6\xa9\x83\x7f\x2d\x9c\x3f\x69\x08\x20\
-\x3e\x1c\xfb\x98\x62\xc4\x98\xdf\x74\x81\x56\xbe\x8e\x1c\x1f\xf5\
-\x5b\x07\x9f\x3b\x17\x9c\xf2\xe8\x83\x53\x5f\x66\x07\x31\xc6\xd4\
-\x4f\xff\x21\xc5\x5f\x51\xa7\x4f\x03\x68\xc3\xce\x52\x93\x02\x1f\
-\x85\x23\x3a\x70\xd7\x90\xbb\x97\xa4\xdf\xd0\xf1\x8b\x21\xdc\xcb\
-\x82\x14\xf8\x68\xa7\xab\xec\xbe\xb6\xf4\xde\x26\x3b\xaa\xbe\x49\
-\x47\x00\xda\x97\xb5\xfe\x0e\xf8\x8d\x7f\x00\x04\x3f\xf4\xb5\xf1\
-\x07\x54\xa0\xf1\x39\xf0\xaf\xf1\x4f\xa8\xe2\x42\x6b\xfc\x8d\x69\
-\x9e\x56\x3c\x3f\xfb\x25\xa8\x8c\x02\xe0\xd5\x35\xe7\x02\x74\x0e\
-\x2a\xe5\x0f\xc8\xf1\x41\x74\xf5\xa0\x80\xfc\x10\xe4\x6d\x81\x02\
-\x74\x6e\xa9\x91\x8b\x9a\xb2\x46\x93\x5d\x2b\x1b\x8b\xc5\xdc\x07\
-\x1f\xb7\x78\x00\x40\xce\xf6\x34\x66\xf0\xc7\x85\xf3\xa7\xfc\x8e\
-\x9c\x21\xa3\xe1\x63\xda\x7d\x4f\xa0\x13\xd8\x39\x52\x28\x7e\xb8\
-\x68\xc1\x64\x1f\x4e\xc7\x32\xc6\x34\xd0\xe6\xf5\x4b\xde\xec\xd4\
-\x7d\xf0\x67\x00\xce\x60\x67\x49\xd2\xab\x53\xfe\x71\x1b\x37\xaf\
-\x5b\xe2\xe5\x29\x81\x9b\xd7\x2f\xf9\xa0\x63\xf7\xc1\xbd\x05\x18\
-\xc8\xcc\x21\x22\xbd\x37\xaf\x1b\xfe\x3b\xa0\xb4\x49\x1e\x60\x9b\
-\x6c\x04\x60\xc9\xea\xd6\xe7\x02\x38\xa2\xa9\x5e\xbf\x8e\x2a\x13\
-\x2e\xfc\x0b\x72\x86\x8c\x86\x47\x6f\x3c\x5c\x54\xa7\xb1\x73\x24\
-\x53\xe8\xac\x85\x0b\x26\xff\x96\x9d\xc3\x18\xd3\x78\x2b\x17\xdf\
-\x75\x8b\x42\xfd\x5b\x00\xad\x3a\xc3\xe7\xab\x83\xc3\x61\xb9\x0e\
-\x40\x9c\x1a\x42\xb5\x4f\xff\xa1\x1b\x9a\x6c\xcd\x44\x93\x75\x00\
-\x9c\x4a\x4e\x8f\x34\xcc\xe0\xde\xc7\x1f\x9c\xe0\xe5\xbe\x58\x00\
-\x90\x90\xbb\x0d\x80\x6f\xdb\x62\x1e\x6f\x99\xc8\xf7\xfe\x92\x24\
-\x63\x4c\xdd\xad\x5a\x7c\xd8\x04\x08\x1e\x65\xe7\x48\xd2\xc6\x41\
-\x6e\x67\x87\xc8\x64\xd9\x33\xb3\xdf\x12\xc1\xfd\xec\x1c\x2a\xd2\
-\x64\x8b\x12\x9b\xa4\x03\x30\x7c\xcc\xcc\x21\x0a\x9c\xd0\x14\xaf\
-\x5d\x0f\x15\x71\x27\xbf\x26\x67\xc8\x68\xc4\xa8\x19\xa3\x01\x19\
-\xc1\xce\x91\x64\xc9\xce\x08\x46\x95\x94\x9c\xef\xd5\x9c\xa1\x31\
-\xa6\xb1\x62\xc1\xb6\x8a\xb6\x63\x01\xbc\xc4\x4e\x92\x64\x58\xff\
-\x93\x8a\xa3\xec\x10\x99\xc4\x13\x89\x5f\x02\xa8\x24\xc7\xf8\x4a\
-\xdf\x93\x2e\x6f\x92\xf6\xb4\x49\x3a\x00\x02\xfc\xa0\x29\x5e\xb7\
-\x7e\xf4\x6e\x5f\x0f\xad\x39\x6b\xec\x0d\x07\x42\xd4\xb7\xfb\xb2\
-\xd7\xc7\x13\x7a\xf6\x53\xf7\x4d\xde\xce\x0e\x62\x8c\xc9\xbe\x0d\
-\x2f\xce\x2a\x83\xca\xb9\x0a\x6c\x60\x67\xa9\x49\x35\xb8\x35\x57\
-\x27\xdf\xd5\xd7\x1b\xcf\xdf\xfd\x36\x80\x3f\xb2\x73\x48\x10\x5c\
-\xd5\x14\xaf\x9b\xf5\x0e\xc0\x88\xd1\xd3\x0e\x81\xea\x39\xd9\x7e\
-\xdd\x7a\xaa\x70\x48\x78\x37\xb7\x5e\x2d\x14\x44\x66\x02\xd2\x85\
-\x9d\xa3\x86\x72\x55\xf9\x96\xcf\xa7\x24\x1a\x63\x1a\x6f\xe5\x73\
-\xb3\x3f\x08\x69\xf0\x4d\x00\x1e\x9d\x89\x22\x5d\x13\x2e\xe1\xef\
-\x2d\xa3\xe1\xe0\x97\x00\x2a\xa8\x19\x04\xdf\xea\x55\x34\xee\xb0\
-\x6c\xbf\x6c\xd6\x3b\x00\x02\xb9\x12\x40\x24\xdb\xaf\x5b\xcf\x14\
-\x77\x3d\x3a\xff\x47\x6b\xb9\x19\xd2\x1b\x3e\x66\xfa\x49\x80\x7e\
-\x87\x9d\xa3\x26\x11\xf9\xfe\xa2\x05\x93\xfe\xc3\xce\x61\x8c\x69\
-\x7a\xcb\x9f\x9b\xfb\x32\x44\xbc\xda\x79\xa4\xd0\xf1\x03\x0a\xc7\
-\x9d\xcc\xce\x91\xce\xca\x67\xe6\xae\x83\xe2\x0f\xe4\x18\x91\x48\
-\x20\x97\x67\xfb\x45\xb3\xda\x01\x18\x36\xec\xd6\x3c\x85\x8c\xcb\
-\xe6\x6b\x36\x40\x79\x38\xe4\x67\x6f\x72\xd8\xb0\x5b\xf3\xa0\x72\
-\x07\x3c\xda\xff\x2a\xc0\x7d\x8f\xcd\x9b\x34\x87\x9d\xc3\x18\x93\
-\x3b\x2b\x9f\x9d\x7d\x87\xaa\xdc\xc3\xce\x51\x83\x04\x90\x3b\xf2\
-\x8b\x2e\x69\xc9\x0e\x92\x8e\x53\xf9\x15\xd8\xa3\x00\xc0\xe5\xd9\
-\xfe\xf9\x64\xb5\x03\xd0\xa2\x7d\xf9\x58\x00\x9d\xb3\xf9\x9a\xf5\
-\x25\x2a\xb3\x1f\x79\x60\xaa\x57\x73\x5c\xd5\x22\x1d\x76\xfe\x44\
-\x80\x7e\xec\x1c\x35\x2c\xf9\xac\xe5\xf6\x62\x76\x08\x63\x4c\xee\
-\x7d\x1e\x6f\x73\x25\x80\x57\xd8\x39\x6a\xe8\xdd\x3a\x68\x71\x2d\
-\x3b\x44\x3a\xcb\x9f\x9f\xbd\x5e\x01\x76\x87\xa9\x53\xcb\x44\x64\
-\x74\x36\x5f\x30\xab\x1d\x00\x15\x5c\x91\xcd\xd7\x6b\x80\x9d\x2a\
-\x7e\x3e\xfd\x0f\x8f\xce\xe8\x01\xc8\x24\x76\x8e\x6a\x0a\x7c\xa2\
-\x09\x44\x4b\xef\x8d\x35\xd9\x31\x93\xc6\x18\x7f\x6d\x78\x71\x56\
-\x19\xc2\xc1\x39\x80\x7e\xcc\xce\x52\x4d\xa1\x53\xfb\x16\x7d\x37\
-\x9f\x9d\x23\x9d\x30\xe2\xbf\x06\x7b\xed\x84\xe0\x7b\xd9\x7c\xb9\
-\xac\x75\x00\x86\x8f\x9a\x7e\x2c\x80\xe3\xb3\xf5\x7a\x0d\x21\x2a\
-\x77\x2d\x9c\x3f\xf5\x7d\x66\x86\x4c\x24\x2c\xd3\x00\xf8\x32\xbc\
-\x15\x40\x75\x8c\xdd\xee\x67\xcc\xfe\x6d\xe5\x33\x73\xd7\x01\xf8\
-\x36\xc8\xc7\xde\xd6\xd0\x52\x34\x71\x03\x3b\x44\x3a\xcb\x16\xdf\
-\xf3\x2e\xc8\xa3\x00\x02\x1c\xdf\xbf\xf0\xb2\x63\xb2\xf5\x7a\x59\
-\xeb\x00\x88\x20\xeb\x0b\x14\xea\x29\x21\x08\x6e\x21\x67\x48\xeb\
-\xec\x31\x33\x4e\x80\xea\xb7\xd8\x39\x6a\x98\xb6\x68\xc1\x94\xa7\
-\xd8\x21\x8c\x31\x7c\x2b\x17\xcf\x79\x42\xa0\xb3\xd8\x39\x76\x53\
-\x8c\x1a\x50\x54\x4c\xbd\x88\x27\x33\x77\x33\xc8\x9d\x25\xd5\xec\
-\xdd\x1a\x9b\x95\x0e\x40\x34\x7a\x7b\x5b\x40\xb2\x3a\x37\x51\x5f\
-\xa2\x78\xf4\xd1\x05\x53\xde\x62\x66\x48\x27\x16\x8b\x39\xa7\xb8\
-\x05\xfe\x2c\xfc\x5b\x9a\x97\xd8\x1e\x63\x87\x30\xc6\xf8\xa3\xa2\
-\x4d\xab\xff\x83\x3f\xeb\x01\x24\x08\x74\x26\xfc\xf9\xcc\xdc\x6d\
-\xe5\xe2\x3b\xdf\x54\xe0\x2f\xd4\x10\x22\x17\xf6\x39\xf1\xd2\x76\
-\xd9\x78\xa9\xac\x74\x00\x2a\xc2\x3b\x2e\x00\xd0\x3e\x1b\xaf\xd5\
-\x50\xaa\x1e\xf5\x60\x6b\x58\xba\xba\xed\x45\x20\x4f\x8d\xd4\xb0\
-\x33\xa1\xb8\xb8\xa4\x24\xc6\x5e\xcd\x6a\x8c\xf1\xc8\x9a\x27\x6f\
-\x2b\x77\xea\x2e\x00\x50\xc6\xce\x52\xe5\x2b\xfd\x0b\xc7\x8f\x65\
-\x87\x48\xcb\xd1\xdb\x9a\x76\xce\x85\x47\x65\xe3\x85\xb2\xd2\x01\
-\x50\x05\x7b\x25\xf9\x7f\x16\x3e\x34\xe5\x05\x72\x86\x14\xd1\xe8\
-\xcd\xad\xa0\xfa\x4b\x76\x8e\xdd\x54\x27\x3e\xbe\x60\xf2\x32\x76\
-\x0c\x63\x8c\x7f\x96\x3f\x77\xe7\x0a\x11\xf1\x66\x15\xbe\x02\xd3\
-\x06\x9e\x7e\x51\x1b\x76\x8e\x64\xab\x4a\xe7\x94\x02\x58\xca\xcc\
-\xa0\xa2\x59\x69\x73\x1b\xdd\x01\x18\x79\xc1\xcd\x47\x01\x38\x36\
-\x0b\x59\x1a\x4e\x71\x33\xb5\x7e\x06\x3b\xc3\xf1\x6b\x01\x74\x63\
-\xe7\x00\x00\x28\xfe\xb6\x70\xc1\xe4\xdf\xb3\x63\x18\x63\xfc\xb5\
-\xe2\xd9\xd9\xb7\x01\x78\x9c\x9d\xa3\xca\xa1\x15\xe5\x2d\x7d\xb8\
-\x54\x2e\x85\x90\x47\x9c\x05\x38\xbe\xcf\xd0\x71\x8d\xbe\xaa\xb8\
-\xd1\x1d\x00\x8d\x27\x2e\x6d\xec\x6b\x34\xd2\x7b\x5d\x3b\xb4\x7f\
-\x98\x9c\x21\xc5\x79\x17\x4c\x3b\x4c\xd4\x9b\x6d\x7f\x1f\xc1\x45\
-\x2e\x06\xa4\x49\xee\x94\xce\xb6\x58\x2c\xd6\x64\xb7\x54\x1a\xc3\
-\xd1\x6c\xde\xd3\xea\x5c\x64\x1c\x80\xcd\xec\x20\x00\x20\x8a\x29\
-\x7d\x4e\xbc\xf4\x10\x76\x8e\x64\xad\x76\xb8\x05\xec\x3b\x15\x44\
-\xe4\xa2\xc6\xbe\x46\xa3\xde\x94\x45\x45\xb1\x30\x04\xd4\xc5\x7f\
-\x50\xdc\x32\x7b\xf6\xe5\xec\xdb\x9a\x52\x54\xc6\xdd\x4f\x00\xb4\
-\x66\xe7\x00\x76\x4d\xd1\x2c\x9c\x77\xf5\x46\x76\x8e\xba\x88\xc5\
-\x62\x6e\xc9\xaa\x36\xf7\x8d\x1c\x3d\xc3\xcb\xf3\x1c\x8c\xa9\xaf\
-\x7e\x85\xe3\xa7\xf6\x2f\x7c\xef\x21\x44\xa3\x21\x76\x96\xba\x58\
-\x5e\xfa\xbb\x0f\x15\xca\xde\xd5\x55\xad\x8d\x0b\x85\xfe\x8f\x1d\
-\x22\xd9\x92\x25\xb3\x2b\xa1\xf8\x1d\x33\x83\x00\x17\x15\x15\xc5\
-\xc2\x8d\x79\x8d\x46\x75\x00\x3a\x7c\xa9\xcd\x30\x00\x5d\x1b\xf3\
-\x1a\x8d\xb4\x3d\x2f\x08\xcd\x25\xd6\x4f\x6b\x78\xf4\xc6\xc3\x45\
-\xe0\xc7\x79\xff\x22\x25\x8b\x16\x4c\x7e\x8c\x1d\xa3\x6e\x54\x96\
-\xae\x6a\x7d\x87\x00\x63\x15\x98\x6a\x9d\x00\xd3\xdc\xf5\x2b\x1c\
-\x3f\x15\xc0\x8d\x0a\x7c\xb3\xdf\xc6\x0e\x73\x9b\xcb\x48\xc0\xaa\
-\xc5\x73\x1e\x01\xf0\x67\x76\x8e\x2a\xe3\x7c\x3c\x1c\x28\xa2\xe1\
-\xdf\x03\xf8\x9c\x18\xa1\xcb\x47\xfa\xde\x69\x8d\x79\x81\xc6\xbd\
-\x19\x03\x5c\xdc\xa8\xaf\x6f\x24\x05\xe6\x96\x94\x4c\xfc\x84\x99\
-\x21\x2d\xe7\x7e\x0a\xa0\x05\x3b\x06\x80\xcf\x82\xb8\xf3\xea\xd2\
-\x8f\x3d\x19\x39\x7a\xe6\x74\x40\x76\x2f\x6e\xb1\x4e\x80\x69\xce\
-\xaa\x1b\xff\x2f\xfe\x1f\xb9\xb8\x7f\xe1\x7b\x5e\x9e\x55\x92\x96\
-\xca\x95\x00\xb6\xb0\x63\x00\x68\x21\x41\x62\x2a\x3b\x44\xb2\xd7\
-\x9f\xbf\xe3\x53\x90\xaf\x0a\x56\x95\x46\xb5\xc1\x0d\xee\x00\x44\
-\xa3\x37\x1f\xa4\x82\xb3\x1b\x53\xbc\x91\x54\x12\xa1\xdb\x88\xf5\
-\xd3\x3a\x73\xec\xcc\xee\x22\xf2\x6d\x76\x8e\x2a\x93\xff\x52\x32\
-\xf1\x3d\x76\x88\xba\x18\x39\x7a\xfa\xaf\x15\x48\x59\x33\x61\x9d\
-\x00\xd3\x1c\xa5\x36\xfe\xbb\x28\xf0\xfd\x7e\x85\xe3\xfd\xd9\x19\
-\xb4\x07\x2b\x9f\x9b\xfd\x01\x04\xbe\x0c\xbf\x5f\xd6\xa7\x70\x5c\
-\x0f\x76\x88\x64\x1a\xe0\x16\x00\xc4\xb5\x55\x3a\x72\x50\xd1\x25\
-\x07\x34\xf4\xab\x1b\xdc\x01\x28\x0f\x05\xdf\x02\x90\xd7\xd0\xaf\
-\xcf\x82\x7f\x2e\x2c\x99\xb8\x86\x58\x3f\xad\x70\x80\x9f\xc1\x87\
-\xa7\x7f\xc1\xe2\x85\xf3\x9b\xc7\x2d\x7f\xc3\x47\xcf\x98\xaa\x90\
-\x1f\x67\xfa\xf7\x0a\x4c\x1d\x31\x7a\x46\x2c\x87\x91\x8c\x69\xb0\
-\xbe\x85\xe3\xae\x43\x9a\xc6\xbf\x86\x9f\xf4\x1b\x3a\x6e\x72\xae\
-\xf2\x34\xc6\xca\x67\x0f\xfd\x3d\x14\xcf\xb3\x73\x00\x88\x84\xe0\
-\xbc\xd9\xa2\x58\x6d\xd5\xf3\x77\xbd\x01\x60\x31\x31\x42\xcb\x8a\
-\x20\x72\x5e\x43\xbf\xb8\x11\x53\x00\x9a\x95\x83\x08\x1a\x4a\x00\
-\xef\xe6\xfe\xcf\x19\x35\xbd\x00\xd0\x46\xaf\xcc\xcc\x82\xf2\x50\
-\x10\x7c\xb7\x39\xac\xfa\x1f\x3e\x66\xc6\xf9\x02\xd4\xe5\xec\xef\
-\xeb\x6c\x24\xc0\xf8\xae\x5f\xe1\xf8\xa9\x02\x89\xed\xf5\x0f\x8a\
-\x4c\xeb\x5f\x38\xfe\x82\xa6\x4f\xd4\x58\xb1\x20\x08\x12\xe3\xc0\
-\xbe\x04\x07\x80\x42\xbf\xe3\xe3\x28\x00\x84\xdb\x16\x29\xd0\xe0\
-\xb6\xb8\x41\x1d\x80\x33\xa3\xd3\xbb\x02\x38\xa9\xa1\x45\x1b\x4d\
-\xb1\x25\xd8\xbe\xfd\x51\x5a\xfd\x0c\x54\xdc\x4f\x00\x44\xd8\x39\
-\x00\xf9\xd5\x9f\x17\x4c\x5d\xc9\x4e\xb1\x37\xc3\xc7\xcc\x1c\x22\
-\x8a\x3f\xa0\x8e\x47\x7e\xda\x74\x80\xf1\x59\xa6\x61\xff\x0c\x44\
-\x81\x39\x7d\x86\x5e\x76\x62\x53\x66\xca\x86\xd5\x2f\xdc\xbd\x1a\
-\xa2\xd3\xd9\x39\x00\x44\x9c\x20\xe3\x48\x21\xcb\xb6\x8a\xb6\x7f\
-\x02\x77\xad\xc4\x29\x47\x9e\x32\xae\x4b\x43\xbe\xb0\x41\x1d\x80\
-\x48\x48\xce\x07\xc0\xdb\xd2\x22\xb8\x7f\xd1\xa2\xd8\x0e\x5a\xfd\
-\x34\xce\x1e\x3b\xfd\x08\x85\x5e\xc8\xce\x01\x60\x4d\x5e\xe2\x73\
-\x1f\x7e\x59\xf7\xe8\xac\xb1\xb3\x7a\x8a\xea\x23\xa8\xe7\x0d\x89\
-\xd6\x09\x30\x3e\xaa\x67\xe3\x5f\xad\xa5\x13\x79\xac\xef\x90\xf1\
-\xbd\x9b\x22\x53\x36\x95\x49\xfc\x7a\x00\xfc\xdb\x43\x55\x2e\xee\
-\x3d\xe4\xd2\x9e\xec\x18\x35\x6d\x78\x71\x56\x19\x80\xf9\xc4\x08\
-\xa1\x44\x5c\xbe\xd9\x90\x2f\x6c\xe8\x14\x00\x77\xef\x3f\xdc\xdd\
-\xdc\xfa\xa9\x24\x81\x29\x00\x1a\xb5\x27\x33\x2b\x39\x80\x29\xbe\
-\x9f\xf5\x7f\xee\xb7\xaf\x3f\x38\x14\xc4\x9f\x04\xd0\xa9\x21\x5f\
-\x6f\x9d\x00\xe3\x93\x06\x36\xfe\x55\xe4\x60\x11\x3c\xd1\x6b\xe8\
-\x77\x1a\xf4\xbb\x90\x2b\x6b\x4b\xef\xdd\x29\x22\x3e\xac\xc4\x8f\
-\x38\x17\x9a\xc2\x0e\x91\xcc\x09\xb8\x6d\x92\x36\x6c\x4a\xbe\xde\
-\xb7\x2d\x0d\x8f\xde\x78\xb8\x84\x42\x6b\x1b\xf2\xb5\x59\xb2\x74\
-\xe1\xfc\xc9\x83\x49\xb5\xd3\x1a\x16\xbd\xbe\x53\x24\x14\x59\x8f\
-\x7a\x3e\xcd\x66\x9b\x02\xa5\x8b\xe6\x4f\xfe\x3a\x33\xc3\xde\x14\
-\x17\xdf\x19\xf9\x70\xeb\xd6\xa7\x01\x0c\xcd\xc2\xcb\xfd\x7c\xe1\
-\xfc\xc9\xb1\x2c\xbc\x8e\x31\x0d\xd2\xb7\x70\xdc\x75\x75\x9a\xf3\
-\xdf\xbb\x67\x5b\x6f\x97\xd3\x96\x2c\x99\xed\xdd\xa1\x66\x35\xf5\
-\x2b\x1c\xbf\x18\xd9\xf9\xdd\x6d\x8c\xb2\x84\x93\xc3\xdf\x28\x9d\
-\xed\xc5\x69\x85\xd5\xfa\x15\x8e\x7f\x15\x40\xa3\x8f\xe7\x6d\xa0\
-\x20\x11\x0e\x1d\xfe\xc6\x33\xbf\xaf\xd7\xae\xaf\xfa\x8f\x00\x84\
-\x43\xe7\x81\x78\x4d\xa3\x8a\x78\xb7\xf8\x2f\x12\x8a\x5c\x09\x72\
-\xe3\x0f\x20\x08\x39\x6f\x8e\x1e\xce\xe8\x83\xad\x5b\x67\x22\x7b\
-\x1f\x20\xb6\x30\xd0\xd0\xd4\x79\xc1\x5f\xdd\x9c\xb4\xa3\xad\x4e\
-\xcb\xd2\x6b\x35\x19\x41\xf0\x43\x00\x01\x39\x46\xab\x50\xa0\xdf\
-\x25\x67\x48\x87\x39\x0a\xe0\x42\xf1\xf8\x39\xf5\xfe\xa2\xfa\x7e\
-\x81\x00\xe7\xd6\xf7\x6b\xb2\x68\x67\x20\x95\xf3\x88\xf5\x53\x0c\
-\x1b\x76\x6b\x1e\x00\x1f\x8e\xcd\xbc\xe7\xd1\x07\x27\x2d\x61\x87\
-\xd8\x93\xe1\x63\x66\x8e\x11\xe0\x07\xd9\x7c\x4d\x9b\x0e\x30\x0c\
-\xfd\x0b\x8b\x63\x68\xf0\xb0\x7f\x06\x8a\x09\xfd\x4e\x1a\xef\xc3\
-\x2e\xa2\x8c\x56\x2c\x9e\xfb\x3f\x00\xf7\xb3\x73\x28\x70\x55\x7e\
-\xd1\x25\xec\x87\xae\x5a\x34\xd2\xe2\x7e\x70\x77\x4b\xd4\xbb\x6d\
-\xae\x57\x07\x60\xf8\x98\x99\x1d\xa1\xf8\x5a\x7d\x8b\x64\x8d\xe8\
-\xc3\x8f\x3f\xf8\xa3\x4f\x69\xf5\xd3\x88\x74\xd8\x79\x01\xb8\xc7\
-\x21\x03\xc0\xe7\xe1\x70\xf8\xa7\xe4\x0c\x7b\x34\xf2\x82\x9b\x8f\
-\x12\xd5\xbb\x9a\xe2\xb5\xad\x13\x60\x72\xa9\x7f\x61\x71\x4c\xa1\
-\xd7\x35\xc9\x8b\x2b\xee\xe8\x7f\xe2\xf8\x01\x4d\xf2\xda\x59\x92\
-\x08\x87\x7e\x0c\x60\x3b\x33\x83\x00\x9d\x5b\x26\x22\xe4\xb5\x68\
-\xb5\xad\x7a\xfa\xf6\x8f\x01\x10\x8f\x5d\x97\x93\x7a\x17\x15\x77\
-\xac\xcf\x57\xd4\xab\x03\x20\x1a\x8c\x00\x71\xa1\x9b\x42\x3c\x5b\
-\xfc\xa7\x02\xc5\xd5\xf4\x14\xd0\x1b\x1e\xb9\x7f\xc2\x07\xec\x1c\
-\x99\x8c\x18\x31\xad\x9d\x26\x12\x0f\x01\x68\xb2\xbb\xbd\xad\x13\
-\x60\x72\xa1\x49\x1b\xff\x5d\xda\x68\x08\x7f\xee\x79\x6a\x71\x87\
-\x26\xac\xd1\x28\x6f\x3c\xf3\xfb\xf7\x14\x3a\x83\x9d\x03\x8e\xff\
-\xd9\x9b\x4c\x95\x3a\x0d\x10\x76\x01\xce\xaa\xcf\x17\xd4\x73\x0a\
-\x40\x1a\x7c\xe2\x50\x16\x7c\x38\xb8\xcf\xf6\x52\x62\xfd\x14\x23\
-\xc6\xdc\x74\x2a\x44\x8e\xe2\xa6\xd0\x8d\xd8\xbe\xe3\x37\xdc\x0c\
-\x7b\x26\xad\xdc\x3d\x00\xfa\x36\x75\x1d\x3b\x31\xd0\x34\xa5\xbe\
-\x85\xe3\xae\x6b\xe2\xc6\xbf\xda\x11\x79\x15\x4d\x33\x5a\x96\x2d\
-\x2d\x5a\x96\xcf\x54\xe0\x23\x66\x06\x51\x1c\xdd\x7f\xe8\xe5\xa7\
-\x30\x33\x24\x5b\xd5\x75\xcb\x3f\x98\x3f\x17\x81\xd6\x6b\x1a\xa0\
-\xce\x1d\x80\xd3\x2f\x9a\xd1\x06\x00\xf1\x87\x2d\x0f\xc7\x62\x31\
-\xf6\xe2\x93\xda\x54\xe9\x17\xed\x08\xdc\x34\xdf\xce\x44\xa8\x69\
-\xc4\xe8\xe9\x97\xaa\xa0\x41\x7b\x54\x1b\xc8\x16\x06\x9a\xac\xeb\
-\x5f\x58\x1c\xcb\xe2\x82\xbf\xba\x88\xf6\x2d\x2c\xa6\x5e\xb6\xb6\
-\x27\xaf\x3d\x75\xdf\x76\x11\xb9\x89\x9d\x43\x25\xa0\x7f\x06\xd7\
-\x52\x52\x92\x70\x10\xe6\x21\x75\xa7\x0f\x1e\x5c\x5c\xe7\x6b\xe8\
-\xeb\xdc\x01\xc8\xab\xc0\xa9\x60\xae\x74\x0f\xf0\x10\xad\x76\x1a\
-\xc3\xc7\xcc\xec\x0b\xe0\x0c\x72\x8c\x0f\x5a\x24\xdc\xef\xc9\x19\
-\x32\x3a\x6b\xec\xac\x9e\x10\xc9\xf9\xe8\x84\x4d\x07\x98\x6c\xca\
-\xc1\xb0\x7f\x5a\x02\xfd\x6d\xbf\xc2\xcb\x8f\xc8\x75\xdd\xba\x8a\
-\xe4\x95\xdd\xce\x1e\x05\x00\x70\x66\x9f\x13\x2f\xed\x43\xce\x50\
-\x8b\x3a\x2d\x21\x96\x6f\xb5\xbd\x95\x9e\x5c\xd7\x3f\x5c\x9f\x29\
-\x80\x61\x0d\x08\x93\x25\xba\x31\x4f\x0f\x7f\x81\x57\x3f\x95\x40\
-\xc7\x83\xb8\x1d\x12\x00\xa0\x32\xad\xa4\x64\x62\x19\x35\x43\x06\
-\x45\x45\xb1\x70\x38\x88\xdf\x0f\x45\x3b\x46\x7d\xeb\x04\x98\x6c\
-\x60\x35\xfe\x55\xda\x02\xc1\xbd\x88\x46\x79\xa7\xae\xee\xc1\x6b\
-\x4f\xdd\xb7\xdd\x01\xec\xb5\x00\xe2\xc2\xe1\xcb\xc8\x19\x6a\x59\
-\xd9\x69\xcb\x3f\xa9\xd3\x00\xae\xee\x6d\x75\x9d\x3b\x00\x4e\x78\
-\x4f\xbb\xa2\xf2\x70\x49\xc9\xf9\x09\x56\xfd\x64\xd1\x68\xac\x05\
-\x14\xec\x28\x69\x1f\x02\x00\x00\x20\x00\x49\x44\x41\x54\x63\x7f\
-\x3f\xc8\x0b\xdc\x6c\x72\x86\x8c\xda\x77\x6d\xf3\x13\x05\x4e\x60\
-\x66\xb0\x4e\x80\x69\x0c\x72\xe3\x5f\xed\x6b\xfd\x3e\x3c\xd0\xbb\
-\xf3\xef\xab\x6d\xad\x6c\x7b\x3b\x80\xf7\xa9\x21\x54\xbf\x3d\x78\
-\x70\xb1\x07\x77\xb0\x54\x29\x29\x49\x88\x32\x77\x03\xe0\xec\xba\
-\xfe\xc1\x3a\x75\x00\x46\x8c\x99\x31\x50\x81\xee\x0d\xcf\xd3\x38\
-\xaa\xc1\x9f\x58\xb5\xd3\xd9\x19\x6e\x3d\x1c\x40\x67\x66\x06\x15\
-\xbd\xc1\xd7\xa7\xff\x11\xa3\xa7\x1d\x07\xf8\x71\x8f\xb8\x2d\x0c\
-\x34\x0d\x91\xc3\x05\x7f\x7b\x27\xfa\xb3\xbe\x43\xc6\x79\x75\xfa\
-\x69\xb5\x0d\x2f\xce\x2a\x53\x01\x7b\x2d\x40\x97\x1d\xad\xeb\xb7\
-\xfa\xbd\xa9\xa9\x08\xb3\xcd\x3a\x7c\xc0\xd0\xcb\xfb\xd7\xe5\x0f\
-\xd6\xa9\x03\x20\x81\x9e\xd9\xb8\x3c\x8d\xb2\x69\xeb\x47\x65\xcf\
-\x11\xeb\xa7\x0a\xe4\x52\x72\x82\xf7\xb6\xe5\xed\xf0\x72\x95\x70\
-\x51\x51\x2c\x0c\xb8\x3b\xe1\xc1\xbd\x08\x35\xd8\xc2\x40\x53\x67\
-\x84\x05\x7f\x7b\x13\x16\x27\x77\x7b\xf5\x94\x5b\xc3\xe7\x15\x6d\
-\xef\x00\xc0\xdd\x86\xec\xd4\xab\x69\x80\xae\xee\x90\x67\x00\x6c\
-\x62\xd5\x57\x09\xea\xd4\x66\xd7\xa9\x03\xa0\x22\xb4\xe1\x7f\x55\
-\x3c\x52\x5a\x1a\x8b\xb3\xea\x27\x3b\x3b\x7a\xf3\xa1\x22\xf8\x06\
-\x35\x84\xc8\xac\xd2\x7b\x63\x3b\xa9\x19\x32\x68\xff\xa5\xd6\x13\
-\x01\x1c\xcb\xce\x91\xc6\x31\xbb\x3a\x27\xc6\x64\x56\x54\x14\x0b\
-\x2b\x94\x3a\x75\x95\xc1\xc0\xb2\x36\xfa\x43\x76\x88\x74\x36\xbc\
-\x38\xab\x4c\x21\xb7\x52\x43\x28\xce\xe8\x73\xe2\xa5\x87\x50\x33\
-\xd4\x50\xd5\x66\x2d\x24\x46\xc8\x4e\x07\xa0\x6a\xfb\xdf\x57\x1b\
-\x1d\xa7\x81\x54\x1c\x73\x45\x65\x0a\x17\x0a\xbe\x03\xee\x55\xc8\
-\xdb\xf2\xe2\xf1\x39\xb4\xfa\x7b\x70\xce\xe8\x1b\xf2\xa1\xf2\x33\
-\x76\x8e\x34\xfe\xd5\x22\xd1\xfa\x9b\x3e\x75\x24\x8d\x9f\x4a\x4b\
-\x63\xf1\x6d\x95\x6d\xcf\x01\xf0\x2c\x3b\x4b\x32\x05\x7e\x7e\xe4\
-\xc9\xc5\x05\xec\x1c\xe9\x44\x82\xd0\x9d\x00\x3e\x27\x46\x08\x4b\
-\x28\xfc\x6d\x62\xfd\x14\xce\x39\xda\x34\x80\x02\x27\x0e\x3c\xfd\
-\xa2\xbd\x1e\xbc\xb6\xd7\x0e\x40\x5e\x85\x14\x02\xc8\xcb\x4a\xaa\
-\xfa\xdb\xfc\xf9\x87\xdb\x3c\xfa\x45\x54\x01\xf4\x12\x6a\x84\x00\
-\x73\x4b\x4a\xae\xfd\x8c\x9a\x21\x83\x00\xa1\xd9\x68\xc2\xd3\xfe\
-\x1a\x42\x21\x2f\x63\x47\x70\x46\x49\xc9\x95\xcc\x0f\x27\xd3\x8c\
-\x6c\x78\x71\x56\x59\x65\x79\xcb\x11\x0a\xfc\x87\x9d\x25\x49\xeb\
-\x20\xae\xb7\xb3\x43\xa4\xf3\xfa\xf3\x77\x7c\x2a\xc0\xbd\xcc\x0c\
-\x0e\xe0\xef\xcc\xaa\xa1\xe5\x36\x7d\x1a\xc0\x27\xa4\xf2\x2d\x2a\
-\xcb\xf3\xf6\x7a\x6c\xff\x5e\x3b\x00\x82\x80\x76\xf8\x8f\x0a\x16\
-\xf9\xf4\xd4\x36\x7c\xcc\xcc\xaf\x03\x60\xf6\xc0\x13\x0e\xfa\x5b\
-\x62\xfd\x8c\x86\x8f\x9e\x79\x11\x20\xa7\xb1\x73\xd4\xa2\xfa\x7a\
-\xe0\x2a\xcf\x58\xb8\x70\xea\x36\x76\x14\xd3\xbc\xac\x79\xe9\xb6\
-\xad\x88\xb4\x18\x06\xc8\x32\x76\x96\x9a\x14\xf8\x46\xdf\xc2\xe2\
-\xb1\xec\x1c\xe9\x24\xa0\x37\x03\xa0\xed\xd6\x52\x68\xcf\x7e\x85\
-\x97\xb3\xaf\x2a\xde\x6d\xc9\x92\xd9\x95\x50\x3c\x4e\x0b\x10\xc8\
-\xa9\x7b\xfb\x23\x7b\x5f\x03\x20\x7b\x7f\x91\xa6\xe2\x54\xff\xc6\
-\xaa\x9d\x8e\x53\x5c\x42\x8e\xf0\xd8\xa3\x0b\xa6\xbc\x45\xce\x90\
-\x22\x1a\xbd\xbd\xad\x40\x7d\x5b\x64\xf7\x81\x06\xc1\xd9\xbe\x5d\
-\x1e\x65\x9a\x8f\x55\x4f\xdf\xfe\x71\x22\xec\xce\x50\x60\x03\x3b\
-\x4b\x4d\x02\x9d\x5e\x97\xe1\xdd\x5c\x5b\xbd\x78\xce\x3b\x00\xfe\
-\xc2\xcc\xa0\x4a\x1e\xa1\x4d\x22\xd0\xa7\x68\xc5\xdd\xde\x4f\xee\
-\xdd\x63\x07\xe0\xdc\x6f\x5f\x7f\x30\x00\xd6\x59\xf7\x41\x45\x22\
-\xfe\x0c\xa9\x76\x8a\x61\xc3\x6e\xcd\x53\x60\x04\x35\x44\xa0\x37\
-\x53\xeb\x67\xb0\x33\xbc\xe3\x5a\x00\xde\x2c\xc0\x01\xb0\xc3\xb9\
-\xe0\x9c\x45\x25\xd7\xae\x67\x07\xf1\x89\x5e\xd5\x2b\x4f\xa7\x1c\
-\x73\x88\x4e\x38\xaa\xa7\x5e\x73\x54\x5f\xbd\xe6\xa8\xc1\xda\xbb\
-\xe7\xf1\x9a\x9f\xdf\x57\x7b\xf7\xee\xa9\x7d\xfa\x1c\xa2\xbd\x7a\
-\xb1\xa6\xfb\xbc\xf4\xc6\x33\xbf\x7f\x4f\x54\x46\x82\x3b\xbf\x9d\
-\xec\xd0\xf8\xce\x56\x93\xd9\x21\xd2\x73\xd4\xcf\x28\x11\x3d\x77\
-\xc0\x80\x68\x0b\x66\x86\x9a\x2a\x90\xf8\x1b\x00\xce\x11\xf6\x8a\
-\x63\xf6\x76\x3b\xe0\x1e\xe7\x4b\x86\x8f\x99\x71\xbe\x28\x16\x64\
-\x37\x55\xdd\x28\xe4\xe5\x45\xf3\x27\x7d\x85\x51\x3b\x9d\x91\x63\
-\x66\x0c\x57\xa5\xae\xea\xfc\xef\xc2\xf9\x93\x8f\x27\xd6\x4f\xeb\
-\xbc\x0b\xa6\x1d\x16\x4f\xb8\xd5\x00\xea\x7c\xfe\x74\x13\x4b\xa8\
-\xe2\x9b\x8b\x16\x4c\x66\x1e\xc4\x41\xa1\x31\x38\x6c\x3f\xb2\x07\
-\x2a\x43\x47\x43\xd0\x1f\x40\x4f\x00\xf9\x50\x39\x1c\xa2\x5d\x00\
-\xb4\x4d\xf9\xa2\x85\x69\xdb\xb5\x6d\x00\x36\x02\x58\x0f\x91\xb5\
-\x50\x7d\x07\xc0\x72\x88\xbc\x86\x35\x6b\xde\x16\x40\x9b\xf0\xdb\
-\xf0\x52\xbf\xc2\x71\x67\x02\xb2\x10\xcc\x05\xc0\xb5\x95\xb9\x40\
-\xfa\x2e\x7f\x7e\xb6\x77\x9d\xdc\x7e\x85\xe3\x5f\x02\xf0\x65\x56\
-\x7d\xe7\xdc\xb0\xe5\xa5\x77\xfe\x95\x55\x3f\x59\xbf\xc2\xf1\x4b\
-\x40\xda\x19\xa5\x8a\x6f\xad\x7a\xee\xae\x87\x33\xfd\xfb\x3d\x6e\
-\x8b\x12\x95\x42\xd6\xef\xba\xc0\xaf\xe1\x7f\xd5\x9c\x5e\x68\x93\
-\x4a\xc4\xcb\xb9\xff\xca\x84\x9b\x26\xfe\x34\xfe\x50\xc1\xa4\x45\
-\xf3\xf7\x8f\xc6\x5f\x8b\x07\xb7\x46\x9b\xca\x42\x88\x7c\x0d\x8a\
-\x13\xf1\x19\xbe\x0c\xa0\x6d\x4a\xb7\x5e\xea\xfd\x3b\xdc\xae\xea\
-\x3f\xbd\xa0\x35\xbe\x56\x15\x28\x28\xd8\xa6\xc0\xcb\x10\x79\x01\
-\xc0\x0b\xd8\xb1\xe3\x79\x79\xff\x7d\x6f\x2f\xa3\xca\x96\x95\x8b\
-\xe7\x3c\xd1\xb7\xb0\x78\xaa\x40\x67\xb2\xb3\x54\x69\x15\x84\xf0\
-\x6b\x00\x17\xb1\x83\x24\x53\xc5\x1d\x22\xbc\x0e\x40\x10\x04\x51\
-\x00\xde\x74\x00\x04\xfa\x94\x42\x28\x1d\x00\x11\x19\x02\x20\x63\
-\x07\x60\x2f\x6b\x00\x74\x48\x96\xf3\xd4\x5d\xe0\x4f\x07\xa0\xb8\
-\xf8\xce\x08\xb8\xc3\xff\x5b\xf5\xf3\xcf\xbd\xda\x0e\x09\x00\x23\
-\x47\xcf\xf8\x8a\x00\x63\xd8\x39\xbe\xa0\xf3\x16\xcd\x9b\xec\xf5\
-\xd5\xc8\x8d\xa5\xd7\x1c\xd3\x5d\x27\x0e\xba\x5a\x27\x1c\xfd\x37\
-\xb4\x89\x7f\x0c\xc8\x93\x50\xfc\x14\xc0\xc9\x48\xf7\x84\x9f\x7d\
-\xed\x00\x9c\x02\xd5\x9f\x41\xf5\x6f\x68\xd5\xea\x63\x2d\x28\xf8\
-\xab\xf6\xec\xf9\x43\x2d\x28\xe8\x96\x83\xfa\x34\xab\x16\xcf\xbe\
-\x09\xf0\xe8\x52\x32\xd5\x0b\x06\x0c\xbd\x8c\xd6\xd0\x66\xd2\xa2\
-\xd5\xce\x12\x00\x5b\x89\x11\xbc\x9a\x06\x08\x1c\x78\x6d\x99\xe8\
-\x1e\x17\x45\x66\xec\x00\x44\xa3\x37\x76\x00\x70\x64\xd6\x03\xd5\
-\xcd\xd6\xae\x07\x74\x78\x99\x54\x3b\xc5\x87\x5b\xb7\x9e\x0e\xe0\
-\x40\x56\x7d\x55\xcc\xf3\xf1\xca\xdf\x00\xb8\x11\xbe\x6c\xbb\x51\
-\x7d\x7d\x67\x44\xc6\xb3\x63\x34\x05\xbd\xea\x98\x4e\x55\x8d\xfe\
-\x8b\x08\x82\x77\xa0\x3a\x0b\xc0\xe9\x60\xde\xce\xf9\x85\x96\x00\
-\xbe\x51\x75\xeb\xe3\x3a\x2d\x28\x78\x41\x0b\x0a\x7e\xa0\xbd\x7b\
-\xef\x71\xee\xb1\xb9\x72\x2e\x72\x19\x04\xcb\xd9\x39\xaa\x48\x42\
-\xdc\x0d\xec\x10\xc9\x5e\x7b\xea\xbe\xed\x20\x4d\x1d\x57\x39\x30\
-\x71\xf0\x81\x45\xc4\xfa\xb5\x84\x36\x7d\xf6\x2f\xec\x9a\x56\xcb\
-\x3d\xc5\xa0\x3e\x27\x5e\x9a\xf1\x42\xb6\x8c\x1d\x80\x8a\x88\x3b\
-\x11\xbc\xf9\xae\x7f\xcc\x9e\x7d\x79\x25\xa9\x76\x0a\x81\x7c\x8b\
-\x9c\x60\x2e\xb7\x7e\xaa\xe1\x63\x66\x9c\x2c\x40\x11\x3b\x07\x00\
-\x40\xb0\x4d\x9d\x3b\xff\xa9\xfb\x26\x6f\x67\x47\xc9\x26\x9d\x78\
-\xf4\xd7\x75\xc2\xd1\x0b\x10\x0e\x36\x54\x35\xfa\x5f\x85\x2f\x1d\
-\xae\xf4\x04\xc0\xd7\x00\xdc\x82\x44\x62\x83\x16\x14\xcc\xd3\x5e\
-\xbd\x8a\xc8\x99\xb2\x6a\x79\xe9\xef\x3e\xd7\x04\xce\x03\xe0\xc5\
-\x59\x1c\x02\x9c\xdc\x77\xe8\xf8\x93\xd8\x39\x52\x84\xf4\x6e\x66\
-\x79\x91\x20\xca\xac\x5f\xd3\xf2\xe5\x25\x15\x02\x2d\x25\x95\x0f\
-\x49\x28\x9c\xf1\x64\xcb\x8c\x1d\x80\x40\x1d\x71\x3f\xa5\x78\x35\
-\xfc\x1f\x40\x79\xc3\xff\xaa\xaf\x2f\x5a\x30\xc9\xb7\x03\x49\x20\
-\x8a\x18\x3b\xc3\x6e\x81\x5e\xb6\x68\xde\xa4\x55\xec\x18\xd9\xa0\
-\x80\xe8\x84\x81\xc3\x75\xc2\xd1\x2f\x42\xf1\x0c\x80\xf3\x01\x78\
-\x33\x9c\x59\x0f\x79\x00\x46\x43\xf5\x9f\x5a\x50\xb0\x54\x7b\xf5\
-\x8a\xaa\xdf\x9d\x97\x3a\x5b\xf5\xfc\x5d\x6f\xa8\xe8\x15\xec\x1c\
-\xd5\x04\x1e\xfd\x2e\x56\x59\x59\x3a\xe7\xdf\x00\x5e\xa3\x05\x50\
-\x9c\xeb\xd3\xd1\xdf\x0a\xde\x34\x80\x48\x90\x71\x2a\x3f\x63\x07\
-\x40\x94\x37\xff\xef\x50\xc9\xdb\x3b\x99\xe4\x83\xcf\xb6\x9d\x2a\
-\xc0\x41\xac\xfa\x22\xe2\xdd\xb1\xbf\x23\xc6\xcc\x3c\x0d\x80\x17\
-\x07\x6e\x08\xe4\xde\x85\x0b\xa6\x78\xb7\x3e\xa2\xbe\x34\x06\xa7\
-\x13\x06\x0e\xc7\x84\x41\xff\xa9\x5a\x6d\x4e\x3b\x7e\xbb\x09\x1c\
-\x03\xd5\x87\x50\x50\xf0\xaa\x16\x14\x7c\x5b\xfd\x59\x49\xdf\x60\
-\xab\x9e\x9d\x33\x4f\x81\x07\xd8\x39\x00\x00\x82\xa2\xbe\x45\xe3\
-\x8a\xd8\x31\x92\xa9\xe0\x0f\xbc\xea\x72\xf0\x46\xbc\x57\xc4\xab\
-\x5f\x9b\x73\xc4\x35\x6d\x81\x64\xfc\xac\x4e\xdb\x01\xa8\xea\x39\
-\xb1\x2e\x74\x79\xe3\xd1\xf9\x3f\x5a\x4b\xaa\x9d\x42\x24\x60\x2e\
-\xfe\x2b\x77\x2d\x2a\xfd\xf8\x90\xa9\x49\xf5\xa7\xec\x08\x55\xde\
-\xa9\x08\xb5\xf0\xf2\x82\x94\xfa\xd0\x89\x83\xa2\xf8\xec\xe8\x95\
-\xbb\x1a\x7e\xf5\xf2\xda\xd7\x2c\x39\x0a\xc0\x1f\x50\x50\xb0\x5c\
-\x7b\xf6\x3c\x8f\x1d\xa6\xb1\x2a\x5a\xc8\x95\x00\xd6\xb2\x73\x00\
-\x80\x0b\xe4\x57\xec\x0c\xc9\xe2\x41\xfc\x3e\x00\x15\xb4\x00\x81\
-\x9c\x43\xab\x9d\x64\x79\xe9\xdc\x35\x02\x79\x9b\x52\x5c\x70\x1c\
-\xa2\xd1\xb4\x9d\xee\xb4\x1d\x80\x76\x5d\x5a\x0f\x04\x6f\x6b\x97\
-\x47\x67\xff\x03\x80\x30\x6f\xfe\x5b\xf4\xe7\x3f\xfe\xf8\x63\x62\
-\xfd\x14\x1e\x3d\xfd\x27\x10\xe8\x45\x4f\x3e\xf0\x03\xe6\x6a\xe3\
-\x46\xd1\xc9\x47\x16\xe8\x84\x41\x4f\x40\xf5\x21\x00\xbd\xd9\x79\
-\x72\xa8\x0f\x44\x1e\xd6\x82\x82\xa7\x35\x3f\xbf\x2f\x3b\x4c\x43\
-\xbd\xfd\x8f\xd9\x9f\x89\xe8\xb7\x41\x3c\xfe\xb6\x9a\x02\x27\xf6\
-\x39\xa9\xf8\xeb\xec\x1c\x35\xad\x79\xee\x9e\x4d\x00\xf1\x28\x5c\
-\x28\xf7\xd6\xd6\x64\xa2\x8b\x49\x95\xdb\xf6\xdd\x78\x60\xff\x74\
-\xff\x22\x6d\x07\x40\xc4\xd1\xb6\x96\x88\xe2\x45\x56\xed\x64\xe7\
-\x8e\xba\xa9\x37\x80\x1e\xac\xfa\x02\x61\xae\xa4\x4d\x4f\x03\x3f\
-\x4e\x20\x53\xfd\xcd\xc2\x87\xa6\xbc\xc0\x8e\xd1\x10\x1a\xcb\x6f\
-\xa9\x13\x07\xc5\x10\x0f\x2d\x03\x74\x18\x3b\x0f\xd1\xc9\x08\x85\
-\x5e\xd5\x5e\xbd\x6e\xd4\xfc\x7c\x1f\x76\x34\xd4\xdb\x8a\x67\xe7\
-\x3c\x07\xc8\x6d\xec\x1c\x00\xe0\x54\x27\xb1\x33\xa4\x50\xea\xb6\
-\xc9\x5e\x3e\xdd\x9e\x18\x40\x69\x6d\x9b\x28\xd2\x1e\xaa\x97\x69\
-\x0d\x00\xed\xc4\xb9\xc0\x89\x37\x1d\x80\xb8\x4b\x30\x7b\x90\x3b\
-\xca\x22\xfa\x24\xb1\x7e\x8a\xe1\x63\x6e\x1c\x00\xf0\xee\x86\xa8\
-\x26\xc0\xba\xbc\xa0\x4d\x8c\x9d\xa3\x21\x74\xc2\x31\xa7\x62\xcb\
-\x01\xcb\xa0\x7a\x1d\xfc\xd8\xc6\xc7\xd6\x02\xaa\x53\x11\x0a\xbd\
-\xae\x05\x05\x5e\x3d\xc1\xd6\x55\xeb\xed\xf8\x3f\x00\xef\xb0\x73\
-\x00\x18\x76\x64\xe1\xb8\x7e\xec\x10\x35\x45\x5a\xed\x5c\x04\x80\
-\xb6\x85\x39\x91\xc0\xe9\xac\xda\xc9\x44\xf4\x5f\xbc\xda\xe9\xdb\
-\xf4\xf4\x23\x00\x50\xd6\x08\xc0\xa7\x8b\xe6\x5d\xb3\x9a\x54\x3b\
-\x85\x28\x71\xf8\x5f\xe4\x71\xdf\xb6\xb5\x89\x86\x26\xc0\x83\x95\
-\xdc\x81\x6a\x71\x73\xbb\xde\x57\xa3\xd1\x90\x4e\x1c\x14\x03\x82\
-\xbf\x41\xd4\x9b\xa7\x12\x8f\xf4\x02\xf0\xb4\xf6\xea\x75\x63\x73\
-\x5b\x24\xb8\x64\xc9\xec\x1d\x22\xb8\x92\x9d\x03\x80\xc4\x21\x5e\
-\xad\x89\x79\xed\xa9\xfb\xb6\x83\xb8\x02\x1e\xea\xcf\x34\xc0\xca\
-\xd2\x6e\x2b\x00\x50\x2e\x27\x0b\x44\xeb\x36\x02\x10\x8d\xde\xde\
-\x56\x01\x4a\x2f\x52\x15\x2f\x36\xe4\xdc\xd2\xa6\x10\x8d\xc6\x5a\
-\x00\xa0\xed\xaf\x55\xe8\x9f\x58\xb5\xd3\x19\x16\xbd\xbe\x13\x00\
-\xfa\x35\xa4\x02\xdc\xb7\x68\xc1\x14\x6f\x76\x89\xd4\x85\x4e\x1a\
-\xd8\x19\x87\xbe\xf1\x64\xd5\x53\xff\xde\x6f\xe0\xdc\x7f\x09\x54\
-\xa7\xa2\xa0\xe0\x69\xed\xd3\xc7\xa7\xcb\xa5\xf6\x6a\xc5\xb3\x77\
-\x3d\x09\xc1\x7c\x76\x0e\x01\x2e\x3e\xf2\x94\x71\x5d\xd8\x39\x6a\
-\x52\x51\xe6\x2e\x9d\x93\x07\x0f\x2e\x8e\x10\xeb\xd7\x10\x0b\x00\
-\x50\xb6\x74\x8b\x62\xc0\xe0\xc1\xc5\x29\xeb\xfa\x52\x3e\x8c\xca\
-\x65\xfb\xd1\x20\xf5\xc0\x45\xfc\x19\xfe\xdf\x19\x6e\x33\x04\xb9\
-\x39\x5a\x35\x9d\x1d\x2d\xe3\xad\x9f\x20\xd5\x4e\x2b\x12\x8a\x7c\
-\x0f\x40\x2b\x6a\x08\xc1\xb6\xca\x84\x4e\xa1\x66\xa8\x27\xbd\x7a\
-\xe0\xc9\x48\xc8\xab\x10\x9c\xc6\xce\xd2\x8c\x9c\x84\x78\xfc\x15\
-\x2d\x28\x38\x83\x1d\xa4\x3e\x42\x61\xbd\x1a\xdc\x23\x70\x01\xa0\
-\x65\xa2\xc2\x15\x93\x33\xd4\x12\x92\x16\x8b\x00\x94\x91\xca\xb7\
-\xdb\xd1\x46\x32\x1e\x84\x93\x6b\x02\x5a\x1b\x17\x2e\x6b\x95\x7a\
-\xb3\x6f\x4a\x07\x40\x1c\x06\xe5\x26\x4f\x2a\x25\xce\x91\x24\x73\
-\xca\x9b\x3b\x12\xc5\x93\x3e\x0d\x71\x57\x6d\x0b\xbd\x9c\x9d\x43\
-\x15\xbf\x7e\xa2\x64\xca\x87\xec\x1c\x75\xa5\x13\x8e\xbe\x16\x22\
-\x7f\x07\xd0\x95\x9d\xa5\x19\xea\x04\xe0\x71\x2d\x28\xf0\x6f\x61\
-\x5b\x06\xcb\x9e\x9e\xb3\x11\x90\xe9\xec\x1c\x10\xbd\xc2\xa7\x43\
-\x70\x96\x97\xfe\xee\x73\x00\xc4\x51\xbb\x84\x37\xeb\x00\x02\x80\
-\xd7\xc6\xa5\x69\xdb\x53\x3a\x00\x0a\x39\x3a\x37\x69\x52\x24\xe2\
-\x2e\xef\xbf\xa4\xda\x29\x54\x41\x9b\x3b\x0a\x9c\x64\xbc\xbd\x89\
-\xa1\x5d\x97\x36\x67\x01\xf8\x12\x39\xc6\x3b\xdb\x5a\x6e\xbf\x85\
-\x9c\xa1\x4e\xaa\x4e\xf3\x9b\x0e\xe0\x06\xd8\x90\x7f\x63\x38\x00\
-\x33\xb4\xa0\xe0\x16\x6d\x26\x3f\xc7\x32\x57\x71\x13\x14\xeb\xc8\
-\x31\xbe\xf4\xa1\xbe\xeb\xd5\xee\x12\x01\x78\xd3\x00\x22\xde\x8c\
-\x24\xc5\xcb\xf3\xfe\x0d\xd2\xb6\x51\xd5\x20\xa5\x6d\x4f\xf7\x4b\
-\xc5\x19\x01\x50\xbc\xee\xcb\x9e\xee\x73\xbf\x7d\xfd\xc1\x10\xb0\
-\x3a\x42\xf1\x50\x5e\xc8\xab\xd5\xff\x00\x2e\x63\x07\x10\xc8\x94\
-\xd2\x7b\x63\x3b\xd9\x39\xf6\x46\x63\x45\x61\x4c\x3c\x7a\x0e\x20\
-\x7e\x6c\x97\xdc\x37\xfc\x00\x3d\x7b\xfe\x41\x07\x0f\xf6\x64\x2e\
-\x37\xb3\xb5\xa5\xf7\xee\x54\xa7\x3f\x62\xe7\x10\xb8\x4b\xd9\x19\
-\x6a\x0a\x05\xe1\x27\xc0\x3a\x2f\x41\x71\xcc\x51\x43\xae\xa0\x5d\
-\xe6\x56\xd3\x9a\x97\x6e\xdb\x0a\x60\x05\xa5\xb8\xa4\x3e\xdc\xd7\
-\xea\x00\x44\xa3\x0f\x85\x00\x0c\xc8\x59\xa0\x9a\xc4\x9f\xfd\xff\
-\xf1\xf2\xf0\x09\xe0\xad\x76\x7f\xe9\xd1\x7b\x27\x6c\x21\xd5\x4e\
-\x31\x62\xf4\xb4\x43\x44\x40\x7d\x9a\x50\xc8\xcb\x8f\xcd\xbf\xc6\
-\xab\x51\x91\x74\x74\xd2\xc0\x36\xf8\x6c\xcb\x42\x28\xbc\xfa\xf0\
-\xdd\x27\x88\x5c\x88\x2d\x5b\x9e\xd0\x3e\x7d\x32\xde\x6c\xe6\x8b\
-\x55\xcf\xce\x99\x0f\xc1\x12\x6a\x08\xc5\x59\x03\x8a\xbe\xe7\xcd\
-\xd4\xd3\xeb\xcf\xdf\xf1\x29\x00\xd6\x08\xaf\x4b\x84\xe2\xde\x1c\
-\xad\x4d\x5c\x07\x70\x34\x10\xab\xd5\xe6\xd7\xfa\x87\xb8\x7b\xa7\
-\x37\x58\x27\x00\x8a\xbc\x44\xa9\x9b\x86\x13\x30\x17\x8d\x78\x73\
-\x11\x12\x00\x40\xdc\xc5\x00\xa8\xf3\x89\x22\xc1\x75\xbe\xec\x0e\
-\xc9\x44\x27\x0d\x6c\x83\x84\x3c\xb5\x9f\x1f\xec\xd3\xd4\x4e\x45\
-\x3c\xfe\xa4\x0e\x1c\xd8\x86\x1d\x64\x2f\x54\x13\xf4\x0b\x7a\x22\
-\x41\xa2\xe2\x22\x72\x86\x5a\x44\x79\x9f\x6d\x0a\xf5\x66\x21\x20\
-\x24\xf8\x37\xa9\x72\x9b\x7e\x85\x1f\xd4\xda\x82\x5c\xab\x03\x90\
-\x80\x1c\x99\xdb\x3c\x5f\x08\x02\x79\x85\x55\x3b\x99\x8a\xa3\xbd\
-\x59\x9c\x0b\x3c\xea\x00\xa8\x40\xf1\x1d\x72\x88\xff\x2e\x9c\x37\
-\xd9\xa3\x9f\x49\x2a\x2d\x1e\x1c\x41\xc2\x95\x60\xd7\x55\xb8\xa6\
-\x69\x9d\x88\xed\xdb\x1f\xd5\x01\x03\xbc\xbe\x21\x71\xd5\xf3\x77\
-\xfd\x05\xc0\xcb\xd4\x10\x22\xe3\xe0\xc1\xb9\x1d\xd5\x02\x21\x3e\
-\xdc\x04\xfe\xec\x04\x08\x12\xcc\x5b\x12\xb5\xd6\x08\x7f\xad\x0e\
-\x80\xc0\xb1\x4e\x91\x8a\x27\xb6\x46\xbc\xb8\xce\x35\x1a\x7d\x28\
-\x04\x55\xd6\x49\x88\x9f\x46\x2a\x7b\x70\x87\x0e\x6b\x38\x7b\xcc\
-\xcc\xaf\x02\x38\x82\x99\x41\x55\xff\xcf\xe7\xa7\x7f\x05\x04\x6d\
-\x2a\xef\xb2\x27\xff\x9c\x3a\x15\xe5\xe5\xf7\xf8\xbf\x30\x50\x7f\
-\x4e\x0e\xd0\xbb\x4f\xd1\xe5\xde\x5c\x2e\xb5\xaa\xcb\x96\x97\x40\
-\x3a\x08\x07\x82\xaf\x64\xba\x10\x27\xd7\x3e\x4f\xb4\x5b\x01\xd6\
-\x42\x40\x68\xad\x36\xbe\xd6\x2f\x90\x3a\xe5\x1c\x00\x04\xbc\xf9\
-\xe4\x93\x3f\x28\x67\xd4\x4e\x56\x1e\x7a\x77\x20\x48\xfb\xff\x15\
-\xf2\x54\x49\xc9\xf9\xf4\x8b\x45\xaa\xb9\x40\xbf\x49\x8e\xf0\x92\
-\xf7\x87\xfe\x5c\x7d\xf4\x4c\x40\x2e\x66\xc7\xd8\xef\xa8\x8e\x45\
-\x41\x81\xd7\xbb\x42\x56\x2e\x9e\xf3\x04\xa0\xd4\x9d\x4d\x2e\x11\
-\x44\x99\xf5\x6b\x29\x29\x49\x00\xf2\x4f\x52\xf5\x76\x03\x3e\x38\
-\x88\x36\xc2\x5d\xd3\x86\x17\x67\x95\x01\x78\x8b\x51\x5b\x92\x0e\
-\xf9\xab\xdd\x83\x56\xa4\xbd\x31\xa8\xa9\x09\xf0\x3a\xa3\x6e\x3a\
-\x82\x04\x6d\x18\xd7\x29\xf1\xce\xe8\x14\x2a\x22\xf2\x2d\x6e\x04\
-\xbd\x89\x5a\x7f\x2f\x76\xed\xf3\xc7\x44\x76\x8e\xfd\xd8\xf7\x7d\
-\x3f\x27\x40\x05\x37\x53\x03\x08\xa2\xf0\x68\x1a\x40\x85\x37\xc5\
-\xa9\x12\x78\x33\x0d\x00\xc8\x32\x4e\xd9\x0c\x23\x00\xb1\x58\xcc\
-\x81\x34\xdc\x2b\x2a\xcb\x19\x75\xd3\x51\x08\x6f\xb5\xa8\xb8\x7f\
-\xd0\x6a\x27\x19\x39\x7a\xe6\x97\x15\xe8\xce\xaa\x2f\xc0\xba\xad\
-\x1b\x77\xfc\x99\x55\x7f\x6f\xf4\xea\x81\x27\x03\xf0\xee\x0e\xf6\
-\xfd\xd0\x34\xed\xd1\xc3\xdb\x53\x16\xbb\xca\x61\x25\x00\xd6\x13\
-\x23\xf4\xe8\x37\xb4\xf8\x18\x62\xfd\x5a\x54\xf1\x77\x5a\x6d\xee\
-\xe2\xee\x5a\x78\x0f\xbd\xd2\x17\x35\x3a\x84\xbb\x3b\x00\xaf\xac\
-\x6c\xdd\x03\xac\xa3\x5e\x45\xbd\x19\x01\x00\x94\x32\x02\x20\xc0\
-\xba\xc7\xe6\x5f\xf3\x2e\xa3\x76\x06\xd4\xa7\x7f\x55\xdc\x5a\x5a\
-\x1a\x8b\x33\x33\x64\xa2\x3f\x3c\xb2\x0b\x44\x1e\x40\x33\xbb\xb4\
-\x66\x1f\xe5\xe0\xdc\xfd\xbe\xde\x1d\x50\x5a\x1a\x8b\x43\xf5\xb7\
-\xcc\x0c\x22\xfe\x4c\x03\xac\x5e\x3c\xe7\x1d\x00\xef\x91\xca\xfb\
-\xb3\x48\x57\xc0\x7a\xe8\x6d\x3b\x60\x48\x71\xb7\xea\x7f\xd8\xdd\
-\x01\x48\xc0\xf5\xe6\xe4\x01\x12\x4e\x39\xc3\x21\x49\x86\x8f\x99\
-\xd9\x11\x90\x9e\x8c\xda\x01\x84\xb5\x35\x24\x2d\x05\x98\xf3\xff\
-\x9f\xe7\x05\x89\xb9\xc4\xfa\x19\x69\x0c\x0e\x2e\xf4\x00\xec\x78\
-\x5f\x9f\x74\x46\x3c\xfe\xa0\xaf\xb7\x08\xe6\x85\xe2\x77\x01\xa0\
-\x1d\xed\xad\x20\x4f\xe5\x25\x51\xde\x99\x2f\x05\x7d\x4f\xb9\xf2\
-\x60\x52\xed\x5a\xe2\xc2\x9b\xf6\x0e\x42\x41\x9f\xea\xff\xbd\xbb\
-\x03\x20\xa0\x5d\x51\x5a\xd6\xaa\x32\xff\x6d\x52\xed\x5a\x24\x91\
-\x48\xb9\x2c\x21\x57\x1c\xfc\xb9\x07\xe1\xac\x51\x33\x8e\x04\xd0\
-\x83\x55\x5f\x55\xe7\x97\x94\x5c\xfb\x19\xab\xfe\x1e\x6d\x19\xf8\
-\x0b\x00\xa7\xb0\x63\x98\x14\x27\xa1\x57\xaf\x9f\xb2\x43\xa4\xf3\
-\x4a\xe9\xbd\x5b\x00\x3c\x44\x8c\xd0\xab\x77\x51\x71\x5f\x62\xfd\
-\x64\xac\x0e\x80\xa0\xa2\xc2\x8b\x85\x80\x87\xe0\x90\x35\x00\x28\
-\x27\x9b\x8a\xba\xdd\x0f\xb9\x35\x17\x01\xb2\x3a\x00\xcb\x7d\x59\
-\xf9\xae\x21\xde\x39\x08\x8a\xc0\x9b\x0e\x40\xc8\x09\xf9\x0e\xed\
-\x90\x9f\x4f\xff\x13\x8e\x39\x15\x22\xf4\x63\x5e\x4d\x06\xaa\x3f\
-\xd5\x82\x82\xaf\xb3\x63\xa4\x13\x68\x70\x37\xb3\x7e\x98\x78\xb9\
-\x59\x32\x21\x5e\xfa\x26\xa2\x5e\x74\x00\xaa\xa6\x37\x29\x5b\xdf\
-\x55\x35\xb5\x03\xa0\xa4\x0e\x80\xb0\x56\x43\xa6\x21\x0a\xd6\x9b\
-\xa3\x2c\x2f\x51\xc6\x3b\x1c\x22\x99\x06\xcc\x0e\xc0\xaa\x45\x0b\
-\xae\xf1\x6a\x3a\x04\x00\xf4\xaa\x5e\x79\x40\x70\x3b\xbc\xdf\x7b\
-\xbe\x5f\x73\x00\xee\xd1\x01\x03\x58\xd7\x78\x67\xb4\xfa\xb9\xb9\
-\x2f\x00\x58\xc9\xaa\xaf\xaa\xe4\x4e\xfd\x17\x2a\x5b\xb5\xfa\x1f\
-\x48\x4f\xbf\x50\xd2\x51\xf7\xe9\x08\xa7\xed\x13\xf9\xa2\xad\xff\
-\x62\x0a\x40\x58\x73\xdf\x81\x37\x3b\x00\xc0\x3a\x09\x51\xf0\x9f\
-\x92\x92\x58\x05\xa5\x76\x92\x68\xf4\xe6\x56\x80\x0c\xa1\x05\x50\
-\xdc\x45\xab\xbd\x27\xe1\x36\x3f\x06\x40\x5b\x27\x63\xea\xac\x3b\
-\x76\xee\x8c\xb1\x43\xa4\xa5\x7a\x0f\xb1\x7a\x51\xaf\x61\x57\xe5\
-\x11\xeb\xef\xb6\xe6\xc9\xdb\xca\x01\x2c\xe5\x54\x17\xda\x34\x6f\
-\x0a\xe5\xac\x7d\xab\xf9\xb0\x5f\xd5\x01\x50\x01\x94\x33\xe7\x2b\
-\x78\x87\x52\x37\x85\x0a\xed\x1c\x04\xf5\xe7\x22\xa4\x0a\x09\x0a\
-\xc1\xda\x0d\x02\x24\xe2\x81\x3e\x48\xaa\x9d\x91\x4e\x38\xb6\x17\
-\x80\x29\xec\x1c\xa6\xce\xae\xd6\x23\x8e\xe0\xdc\x6a\xba\x07\x41\
-\x10\x3c\x00\x20\x20\x95\x6f\x1d\x29\xdb\x39\x94\x54\x3b\x85\x02\
-\x9c\x69\x00\xc1\x51\xf0\xe6\x5c\x04\x5d\x4b\x2a\x5c\xbb\x03\x70\
-\x66\x74\x46\x17\x90\x2e\x01\x12\x55\xf6\xdd\xd9\x00\x80\xe1\xd1\
-\x69\xdd\x20\x38\x80\x53\x5d\xa8\xa7\x85\xd5\x14\x38\xde\xf0\xbf\
-\x02\xcf\x3d\x51\x32\xe5\x43\x56\xfd\xcc\xe2\xb7\x00\x68\xc9\x4e\
-\x61\xea\x2c\x84\x20\xf8\xad\x7a\xf3\x41\xbf\xcb\xea\x17\xee\x7e\
-\x1f\xc0\x0b\xb4\x00\x2a\xde\xac\x03\x70\xc0\x7f\x48\xa5\x3b\x1c\
-\x59\xf8\x9d\xc3\x48\xb5\x6b\x91\xc0\xad\x25\x95\x6e\xd7\xbb\xa8\
-\xb8\x23\x50\xd5\x01\x68\x11\xd1\xc3\x49\x41\xa0\x12\x5a\xcb\xaa\
-\x5d\x93\x84\x42\xb4\xa1\x21\x4d\x24\xbc\x39\x07\x41\x20\x27\xf1\
-\x8a\x4b\x09\xad\x76\x06\x3a\x71\x50\x14\x90\x33\xd9\x39\x4c\xbd\
-\x9d\x88\x5e\xbd\xd8\x47\x59\xa7\x10\x05\xef\x3d\xae\xca\xfb\xdd\
-\x4e\x22\xea\x68\x6b\xbf\xd4\xb5\xf0\x62\x1d\x80\x84\xc3\xb4\x87\
-\xdf\x08\xf4\x30\xa0\xaa\x03\x10\x24\x42\xac\x1e\xd1\xf6\x45\xf3\
-\x26\x6d\x26\xd5\xae\x45\x41\x5b\x00\xb8\x33\x0f\x3d\xd6\x90\x6a\
-\xd7\x72\xfa\x45\x33\xda\x00\x18\x48\x2a\x1f\x88\x26\x1e\x25\xd5\
-\x4e\x4b\xa3\xd1\x10\x54\xed\xb4\xbf\xe6\x4a\xf5\x7a\x2d\x2a\xa2\
-\x5e\x65\x9d\x4c\x42\x91\x12\xf0\xa6\x01\x8e\x19\x3c\xb8\x98\x73\
-\xdd\x7b\x92\x4e\xa1\x2f\xbd\x01\x80\x72\xff\x4b\x40\xdc\xee\x5d\
-\xd3\xf2\xd2\xdf\x6d\x04\x50\xc6\xa8\x9d\xd0\xa0\x1b\x50\xd5\x01\
-\x10\x51\x4e\x07\x40\xe0\xc5\xf0\x3f\x00\x38\xd0\x56\x87\xae\xf0\
-\x65\x1b\x64\x5e\x5c\x8f\x03\xc0\xfa\xc0\x7c\x61\xe1\xfc\xa9\xef\
-\x93\x6a\xa7\x77\xd8\xea\x28\x6c\xe1\x5f\x73\x76\x04\xde\x7d\xf7\
-\x42\x76\x88\x9a\x96\x97\xfe\xee\x43\xe1\xed\x83\x8f\xec\x6c\x87\
-\x63\x49\xb5\x6b\x29\x2d\x8d\xc5\x55\x38\xdb\xe0\x20\xde\xec\x04\
-\x50\x88\x50\x8e\x89\x16\x84\xbe\x18\x01\x50\x95\x43\x19\x21\x34\
-\xc0\x5a\x46\xdd\x74\x14\xa0\xec\x82\x80\xc0\x9b\x6d\x90\x50\x9c\
-\xc8\x2a\x2d\xaa\x4f\xb0\x6a\xa7\xb3\x6b\xfe\xd8\xd9\x9e\xff\xe6\
-\x4e\xf5\x67\x3a\x78\x70\x84\x1d\xa3\x26\x05\xfe\xca\xaa\x1d\xa8\
-\x3f\xc7\xe1\x3a\x55\xd6\x0e\x30\xda\x21\x67\x29\x48\x6b\xe0\x34\
-\x40\x8d\x0e\x00\x69\x04\x40\x3c\x1a\x01\x00\x90\x4f\xa9\x1a\xf8\
-\xd3\x01\x10\x38\xda\x65\x19\x2a\x21\x8f\x6e\x42\x04\x30\x61\xd0\
-\x08\x40\x59\xd3\x21\x26\x5b\x44\x7a\xe0\xd3\x4f\xbd\x39\x0b\x1f\
-\x00\x9c\x80\xf8\x5e\x57\x6f\x2e\xc4\x09\x94\x75\x06\x8c\xe4\x73\
-\xea\xa6\x12\xc8\x5a\x4e\x5d\xad\x31\x05\x00\x70\x46\x00\xe0\x47\
-\x07\x20\x1a\x8d\xb5\x00\xf0\x25\x4a\x71\xe7\xcb\x45\x48\x2a\x80\
-\x7e\x85\x54\x7b\xe3\xc2\xf9\x13\x5f\xe1\xd4\xce\x24\x98\xca\x4e\
-\x60\xb2\xc4\xb9\x29\x3e\xed\x08\x58\xfe\xec\xa1\x4b\x00\x70\xd6\
-\x3e\xa9\x3f\x37\xe2\xc1\x05\xac\x87\x9f\x43\x07\x0f\x2e\xf6\x63\
-\x54\x48\x02\x4a\x1b\x28\x52\x63\x04\x00\xc2\xb9\xd8\x44\xd4\x8f\
-\x0e\x40\xa5\x6b\xdd\x0d\xa4\x13\xde\xc2\xbe\x5c\x84\x14\x9d\xd6\
-\x0d\x40\x27\x4e\x75\xf9\x3b\x20\xca\xa9\x9d\x4a\x27\x1e\xfd\x75\
-\x40\xfc\xf9\xa0\x34\x8d\xa3\x7a\x34\x7a\xf5\xf2\x66\x05\x3c\x10\
-\x0b\x20\x60\x5d\xfd\xdd\xa5\xf7\xc9\xdf\xa5\x3c\xf0\x25\x53\xda\
-\x08\x00\x42\xdb\xdb\x39\x2f\x7e\x06\x50\xe1\x4c\x01\x00\x5d\x80\
-\xea\x46\x4f\xd1\x99\x13\x82\xb6\x0f\xb2\x96\x84\x13\xd6\xbd\xf7\
-\xdb\x1f\x79\x60\xea\x06\x52\xed\x5a\x5c\xc4\xd1\xce\xc8\x16\xc5\
-\x33\xac\xda\x69\x29\xbe\xcb\x8e\x60\xb2\x6e\x3c\x3b\x40\x2d\x81\
-\x3c\xcd\x2a\x1d\x09\xd4\x8b\x55\xf0\xab\x17\xcf\x59\x0b\xd6\x91\
-\xc0\x88\xe7\x73\xea\xd6\x96\xd0\x60\x2d\xa9\x74\x27\x00\x70\xc5\
-\xc5\x77\x46\x00\xce\x01\x38\x1a\xc8\xbb\x8c\xba\xc9\x44\x35\x9f\
-\x53\xd8\x8f\x11\x10\x00\x08\x02\xde\x11\x99\x0e\x8e\x77\x38\x4a\
-\x12\xbd\x66\x70\x47\x00\x23\xd9\x39\x4c\x96\xa9\x7e\x53\x7b\xf7\
-\xee\xc8\x8e\x51\x4d\x02\xa5\x9d\xfe\x99\x08\xd4\x9f\x55\xf0\x00\
-\xa7\x0d\x48\x48\x3e\xa5\x6e\x92\x88\x04\x94\x5d\x00\x00\x0e\x46\
-\x34\x1a\x72\xef\x7f\xba\xbd\x33\x48\xf3\x63\xad\xb0\x75\x13\xa3\
-\x6e\x32\x15\x70\x46\x00\x3c\x99\x02\x01\x00\xe1\x9d\x83\xf0\xf1\
-\x9f\x17\x4c\x7c\x93\x54\x3b\x95\x26\x2e\x04\xe0\xc5\x99\xe9\x26\
-\xab\xf2\x90\x48\x8c\x66\x87\xa8\xb6\xe2\x85\xbb\x56\x00\xf8\x84\
-\x51\xdb\x79\x72\x23\x5e\x95\xb5\x94\xaa\xa2\xac\x51\xdf\x5a\x76\
-\xb6\x69\xfb\x11\xa9\xb4\x3b\xf2\x93\x0e\x1d\x9d\x0b\x29\x65\xf8\
-\x1f\xc0\x56\x5f\x2e\xc0\x11\x65\x4d\x01\xf8\x71\x0c\x72\x15\xd6\
-\x08\xc0\xbf\x7d\x9a\xff\x87\xaa\x37\x8d\x84\xc9\x3a\x9f\xfe\x6e\
-\x55\x55\x5f\x26\x15\xf6\xa7\x03\x20\xa4\xcf\x40\x75\x5e\x74\x00\
-\xaa\x2e\x46\xda\xce\xa8\x9d\x48\x68\x27\xa7\x9a\x60\x2d\xfc\xa2\
-\xf4\x7e\x33\xc8\x67\x14\xf5\x65\x11\x64\x51\x51\x2c\x0c\xa0\x2f\
-\xa7\xba\x78\x73\xf5\xaf\x4e\x3c\xb2\x1b\x80\x2f\xb3\x73\x98\x26\
-\xf3\x35\xed\xd9\x93\x76\xec\x79\x0a\x27\xa4\x69\x00\xe9\x0f\xc4\
-\xfc\xb8\xd6\x9a\xb4\x08\xce\x09\x69\xda\x37\xbd\x8f\x19\x45\x5d\
-\x20\x9d\x1d\x9c\x3b\x98\x51\x1c\x50\xca\x37\x9d\x01\x65\x0b\xa0\
-\x92\xf6\x80\x26\x6b\xdf\xa9\x7d\x3e\x68\xc3\xde\xfa\x3f\x4e\xdd\
-\x74\xc2\xdf\x84\x47\xdb\xc5\x4c\xd6\x09\x44\x3c\x5a\xdf\x11\xb0\
-\xde\xfb\xad\xfb\x16\x7d\xe8\x45\x47\x48\x94\x76\x23\x1e\x67\xdb\
-\x77\x7a\x9c\x87\x61\xc5\x41\x4e\x14\x1d\x18\xb5\x85\xd4\xeb\xc9\
-\x80\xd2\x09\x0a\x9c\x1f\x23\x00\x41\x88\x37\x1f\xe6\xd3\x45\x48\
-\x08\xd4\x2e\xfd\xd9\xf7\x9d\xc1\x0e\x50\x8d\xb8\x0d\x0e\x48\x24\
-\xbc\x18\x02\x97\x10\x67\x27\x98\x92\x3e\xf3\xd3\xe3\x3c\x0c\x07\
-\x70\x07\x38\xd1\x80\xb3\x03\xc0\x93\x11\x80\x58\x2c\xe6\x40\xda\
-\x05\xe1\x94\x73\x08\x44\x32\x41\x90\x4f\x2a\xfd\xd9\xa2\x92\xa9\
-\x5e\xec\x04\xd1\x49\x03\xdb\x40\xe0\xcd\x7d\xe9\xa6\xc9\x7c\x5d\
-\x0f\x3b\xac\x15\x3b\x04\xb0\x7b\x1b\xdc\x56\x4a\x71\x91\x7c\x4a\
-\xdd\x24\xe5\xa0\x6d\x83\x3b\x10\xde\x8c\xf6\x09\xa5\x2d\x14\xd1\
-\x03\x5c\xe0\x1c\x65\x04\x80\xf5\x4d\x27\x5b\xbe\xbc\xfd\x01\x00\
-\x42\x84\xd2\x41\x5e\xa2\xc7\x46\x42\xdd\x14\x02\xd2\x2e\x08\x60\
-\x99\x37\x0b\x00\x2b\x65\x08\x80\x96\xec\x18\xa6\xc9\xb5\x42\x8b\
-\x16\xb4\x3b\x2f\x92\x28\x80\x15\x94\xca\x9e\xac\x82\x3f\x0c\x87\
-\x7d\x88\x5d\x3f\x87\x5c\x0b\x0f\x2a\xba\x84\xd4\xf6\x25\x51\xce\
-\xc3\xb0\x02\x1d\x9c\xa8\xb2\x7e\x08\x5e\x74\x00\xca\x22\x71\xca\
-\x50\x90\x02\x5b\x7c\xb9\x05\x10\xac\x6d\x90\xac\x0f\xbf\x74\x1c\
-\x86\xb0\x23\x98\x9c\xf1\xa5\x03\x00\x00\x9c\x0b\x71\x02\xc9\xa7\
-\xd4\x4d\x52\x5a\x1a\x8b\x83\x34\x0a\x12\x77\x2d\xfc\x98\x06\x10\
-\xd2\x08\x00\x70\x80\x03\x94\x32\xfc\x2d\xac\x85\x0f\x49\x24\x11\
-\xa2\xbc\x09\xbc\x5a\x03\xa1\x9c\x0e\x80\xa8\xbe\xcd\xa8\x9b\x81\
-\x4f\x8d\x82\x69\x4a\xce\x79\xf4\x77\x2d\xef\x70\xca\xfa\x31\x02\
-\x00\x00\x42\x1a\x0d\xd6\x84\x1e\xc4\xa8\x9b\x42\x39\x3b\xe2\x54\
-\xd1\xc1\x01\xae\x1d\xa5\xb8\x78\xd2\x01\x90\xc0\x76\x41\x00\x94\
-\xdb\x20\x03\xe7\xbc\x58\x03\xa1\x31\x38\x00\xc7\xb3\x73\x98\x1c\
-\x51\xfd\x8a\x2f\x97\x03\x09\x38\xab\xe0\x05\xe8\xc6\xa8\x9b\x4e\
-\xc0\xfa\x2c\x14\xd6\x0e\xb8\x24\x12\x70\x3a\x40\x82\x0e\x4e\x10\
-\x50\x16\xc4\x88\xa8\x1f\x1d\x00\x55\xce\x14\x00\xa9\xd7\x97\x01\
-\xe5\x2c\x08\x25\x7d\xf8\xa5\xf8\x64\x50\x01\x80\xb6\xec\x18\x26\
-\x67\xda\xa3\x4f\x9f\x7c\x76\x08\x00\x10\xc7\xd9\x07\x0f\xc0\x9b\
-\x63\x91\x1d\x69\x34\x58\x03\xd6\xc3\x5f\x6d\x1a\x70\xda\x02\x01\
-\x5a\x39\x40\x5a\x53\x8a\x07\xb2\x83\x51\x37\x05\xa9\x17\xe8\xc4\
-\x8f\x29\x80\xaa\xbb\x20\x28\xa3\x40\xbe\xec\x82\x40\x38\x18\xc8\
-\x8e\x60\x72\x2c\x91\xf0\xe2\xef\x9c\xb8\x0a\xbe\x03\xa2\x51\xc6\
-\xe2\xe7\x34\x58\x23\x00\xe2\x45\x07\xc0\x89\x2b\xa3\x14\x56\xb4\
-\x72\x0a\x50\x3a\x00\x0a\xe7\xc5\x31\xc0\x81\x90\xb6\x41\x7a\x32\
-\x02\xb2\xa9\x6c\x2b\x6b\x3b\x4c\xfc\xd8\xbe\x65\x1f\x12\xea\xa6\
-\x0a\xa4\x3f\x3b\x82\xc9\x39\x2f\x2e\xc4\x59\x53\x7a\xd8\xfb\x00\
-\x18\x8b\x81\x5d\xef\x4d\x07\x1e\x48\xa8\x9b\x22\x50\xce\x1a\x80\
-\x40\x03\x2f\xbe\x7f\x09\x69\x39\xa7\x30\x5a\x3b\x00\x94\x29\x00\
-\x45\xdc\x8b\x0e\x80\x53\xe1\x9c\x80\x47\x7a\xd3\xa7\xa8\xa0\x0d\
-\x83\x7d\x12\x8b\xc5\x02\x52\xed\xda\x04\x3d\xd8\x11\x4c\x8e\xb1\
-\x6e\x00\x4d\x11\x0b\x00\x7c\xca\xa8\xec\xe2\x9e\x2c\x82\x13\xce\
-\x08\x80\x13\xd2\x67\x7f\xb2\x44\x82\xd5\x16\xb6\xa2\x75\x00\x24\
-\x14\xe1\xf4\x7a\x92\x04\xd0\x16\x8c\xba\x02\xf9\x9c\x51\x37\x59\
-\xdc\x71\x76\x41\xc0\x93\x5d\x20\x55\xf2\xd9\x01\x4c\xce\xf9\xd4\
-\xe9\xe3\xfc\x2e\x84\xfc\x58\x04\xe7\x20\x94\xcb\x70\xa0\x9c\xcf\
-\xfe\x14\x21\xda\x68\x38\xaf\x03\x10\x04\x41\x25\xa3\x6e\x32\x81\
-\x23\xbd\x09\x02\x3f\x46\x40\xa0\xac\x61\x30\x9f\x3a\x00\xde\x6c\
-\x89\x32\x39\x93\xcf\x0e\xf0\x05\xce\x13\xb0\x04\x9e\x8c\x00\x28\
-\x28\x0f\x83\x81\x8a\x17\x1d\x00\x09\x38\x53\x00\x8a\x5d\x53\x00\
-\x11\x46\x71\xc4\x49\xf3\x1e\x29\x38\xbd\x40\x85\x78\xd1\x01\x80\
-\x2a\x65\x0d\x08\xa0\x9b\x39\x75\xd3\x62\x5d\x89\x6d\x78\x48\xb7\
-\xa0\xa6\x41\x3a\x08\xc6\x91\x76\x80\xa5\x10\xd2\x67\xa1\xc0\x8b\
-\x0e\x00\xc2\x9c\x11\x00\x01\xc2\x0e\x9c\x63\x70\xa1\x08\xf9\xd1\
-\x00\x82\xf4\x26\x60\xbd\xe9\x93\xa8\x08\xa7\x03\x28\xd8\x46\xa9\
-\x9b\x44\xaf\xea\x95\x07\xdb\x02\xb8\x3f\xea\xa0\x03\x06\x78\xd1\
-\x00\x88\x2a\xe5\x24\x3c\xf5\x65\x0e\x5c\x48\xa3\xa1\x9e\x8c\x00\
-\x20\x5e\xc9\x6a\x0b\x42\xb4\x0e\x40\x02\x3b\xbd\x68\x00\x79\x23\
-\x00\xf0\xe2\xfb\x57\x25\x5d\x03\xac\xce\x8f\x11\xa0\x56\xed\xbc\
-\x98\x07\x35\x04\xdb\xb7\xfb\x31\x04\x4e\x7b\x02\xf6\x63\x0e\x3c\
-\x20\x7d\x16\x38\x09\xbc\xe8\x00\xb9\x78\x1e\xeb\xb3\x90\xd7\x01\
-\x68\xeb\xc9\x36\x40\xa1\xf5\x02\xfd\x58\x03\x20\xb4\x85\x30\x7e\
-\x7c\xff\xa8\xe4\x9c\x83\x61\x3c\x90\x97\xe7\xc5\x10\x78\x40\x9a\
-\x03\x87\xb2\xd6\x3f\xd5\x16\x52\xce\x67\x41\x20\x7e\x8c\x00\xb8\
-\x16\xb4\x87\x61\xde\x14\x00\xd0\xc2\x8b\x06\x20\x20\x4d\x01\x38\
-\x5f\xd6\x00\x90\x16\x41\x7a\xb3\x06\xc2\xf9\xf1\x14\x64\x08\xca\
-\xcb\xbd\x78\x02\x84\x92\x46\x03\x85\x34\xfa\x97\x8c\x35\x02\xa2\
-\x7e\xac\x01\x08\x6d\xa3\xb5\x85\x21\x07\xc0\x71\x6a\x1f\xe6\x45\
-\x03\x20\xac\x35\x00\x09\x4f\x1a\x40\xd2\x14\x88\xf3\x64\x0a\x04\
-\x09\xeb\x00\xec\xb7\xbc\x99\x03\x67\x8d\x00\xf8\xf1\xde\x4f\x90\
-\x46\x40\x1c\xfc\xe8\x00\x2d\xe9\xf9\x29\x75\x0a\xc0\x18\x63\x8c\
-\x31\xfb\x19\x07\x80\x74\x1a\xdb\x06\x2f\x7a\x9f\xb4\xc5\x78\x21\
-\x3f\x7a\xdf\x20\x0d\xc5\xb3\xa6\x5e\x52\x84\x7c\x19\x89\x31\x39\
-\xa7\x9e\x6c\x45\x66\x2d\xc4\xf5\x64\x27\x52\x88\x34\x15\x11\x80\
-\x34\xf2\x92\x64\xf0\xdb\x07\xb2\x46\x22\x12\x0e\x9c\x73\xa8\x01\
-\x54\x78\xd1\x00\xb0\x86\xa2\x59\x27\x10\xa6\xe2\x2c\xc0\x11\x5f\
-\xbe\xff\xc0\x8f\x0f\x41\x43\x90\x47\x5b\x7d\x5d\x1b\x6b\x3f\x3a\
-\x6b\xf1\x61\x32\xd6\x54\x84\xf8\x31\x0d\x99\x68\x47\x6b\x0b\x79\
-\x1d\x80\xcf\x11\x78\xd1\x00\xa8\x28\xe9\x4d\xe0\xc7\x0a\x5c\xa5\
-\x3d\x05\xf8\xf1\xfd\x43\x49\xc7\x90\x1a\xbe\xf2\x72\xce\x2d\x6c\
-\x49\x1c\x6b\x31\x1e\x6b\xff\x7d\x12\xd6\x79\x04\x4e\x59\x9f\xfd\
-\xb5\x05\x15\x2d\x59\x9f\x85\x71\x5a\x07\x20\x04\xda\x37\x9d\x84\
-\xd3\x00\xd2\x16\x1f\x26\x11\xd6\x02\x24\x4f\xf6\xe0\xe2\x80\x9d\
-\x1f\x03\x50\x76\x0c\x93\x73\x8a\x83\x0f\xf6\xe3\x42\x2e\xd6\x13\
-\xb0\x7a\x32\xfa\x45\x3a\x8f\x80\x75\xfe\x40\xb2\x20\x4c\xdb\x8d\
-\xc2\x1b\x01\x10\x24\xbc\x68\x00\xc1\x5a\x03\xe0\xc9\x0a\x5c\x51\
-\xe5\xdc\xc9\xa0\xae\x03\xa5\x6e\x12\x89\x2d\xaf\x00\xe0\xc5\xc5\
-\x4c\x26\xa7\x3e\x93\x25\x4b\xbc\xb8\x8f\x44\x21\x94\x2b\xc9\xc5\
-\x9b\x35\x10\xa4\xd1\x40\xda\xe8\x6f\x92\x70\x84\x3a\x05\xc0\xf9\
-\x21\x84\x3d\xd9\x82\x43\x1b\x01\xf0\xa3\x03\x00\x91\x1d\x9c\xc2\
-\x9e\x5c\x44\x02\x00\x2a\x1f\xb1\x23\x98\x9c\xdb\xc4\x0e\xf0\x05\
-\xce\x85\x5c\x01\x9c\x17\x53\x20\xb4\xf3\x08\x58\xe7\x2f\x24\x8b\
-\xd3\xa6\xc3\x2b\x1d\x80\x9d\x8c\xca\xce\x39\xce\x19\xf4\x49\x94\
-\x76\x22\x9d\x1f\x73\xe0\x9a\x50\xce\xad\x7c\x02\x7f\x8e\xe0\x15\
-\x5d\xcf\x8e\x60\x72\x6e\x1d\x3b\xc0\x17\xa4\x23\xa5\x6c\x28\xd8\
-\xaf\xa7\x40\x9c\x27\x23\x00\xea\x68\x0f\xc3\x65\x0e\x00\xa5\x17\
-\xa8\x89\x4a\x2f\x46\x00\x58\x27\xf2\x29\xd4\x8b\x0b\x68\x34\xe4\
-\x38\x1f\x02\xea\x53\x07\x00\xef\xb0\x23\x98\x9c\xf3\xe9\xef\x9c\
-\xf3\xbb\x10\x84\xbc\xe8\x00\x04\xd0\x36\x94\xc2\x9e\x6c\x83\x44\
-\x82\x36\x02\x50\xe6\xa0\xa0\x0c\x01\x0b\xc2\x7e\x3c\x01\x93\x46\
-\x40\x20\xea\x45\x03\x18\x0e\x93\x46\x00\x80\x03\x63\xb1\x98\x1f\
-\x07\x51\xa9\x57\x8d\x81\xc9\x05\x11\x3f\xfe\xce\xa3\xd1\x10\x00\
-\xca\x7a\x98\x84\xd3\x4f\x19\x75\x53\xa8\x50\x3e\x0b\x03\x5f\xd6\
-\x40\x84\x42\xac\x6d\x90\x3b\x9c\x08\x67\x04\x40\xbc\xd9\x06\x88\
-\x2d\xa4\xc2\x5e\x74\x00\x3e\x7d\x77\xfb\x27\xe0\xac\x82\x0f\x2d\
-\x5d\xd5\xaa\x2b\xa1\x6e\x3a\xcb\xd9\x01\x4c\xce\x2d\x63\x07\x00\
-\x80\x23\x37\xb6\x3d\x04\x9c\xfb\x58\x82\x37\x4a\x0f\x61\x75\xfe\
-\x6b\x11\x80\x32\x05\xe2\x54\xbc\xf8\xfe\x35\x41\x9a\x02\x08\x50\
-\xe6\x00\xa5\x8c\x00\xa8\x53\x3f\x6e\x61\x53\x61\x0d\x83\x79\xd1\
-\x01\x28\x2d\x8d\xc5\x01\x50\xee\x23\x17\x84\xf3\x19\x75\x53\x84\
-\x13\xaf\xb1\x23\x98\x1c\x4b\xf8\xf1\x77\xae\x2e\xd2\x9d\x54\x7a\
-\x0b\x10\x23\x9d\x02\x9b\x84\xb4\x1e\x28\x10\xda\x67\x7f\x2d\x81\
-\x06\x9c\x5b\x29\x05\x65\x4e\x49\x2b\x41\x55\xc5\x8b\x55\xe0\xce\
-\x71\x16\xc2\x28\xfc\x18\x01\xa8\xb2\x99\x53\x36\xc8\xe7\xd4\x4d\
-\x32\x63\xd9\xdb\x00\xb6\xb1\x63\x98\x9c\xf9\x0c\xef\xbc\xe3\xc5\
-\xc2\x4f\x0d\x94\xd5\x01\xf0\xa2\xf1\x03\xc0\x5b\x10\xac\xea\xc5\
-\xcf\x40\x1c\x67\x47\x94\x02\x65\x4e\xa1\x94\xa7\x3f\x04\x9e\x34\
-\x80\x01\xa7\x17\x28\xf0\x63\x0d\x40\x95\x0d\x94\xaa\xaa\x87\x53\
-\xea\x26\x91\x5d\x53\x20\x2f\xb3\x73\x98\x1c\x51\x7d\x49\x3c\x39\
-\xfc\x49\x21\xf9\xa4\xca\x5e\x74\x80\x00\xd0\x16\x04\xd3\x16\x40\
-\x27\x51\xe1\xec\x02\x11\x60\x8b\x73\x4a\x9a\x03\xf7\x64\x11\x9c\
-\x26\x68\x2b\x61\xbd\x18\x01\xa9\xb2\x96\x51\x54\x45\x7a\x32\xea\
-\x66\xf0\x02\x3b\x80\xc9\x19\x8f\xfe\xae\xb5\x07\xa5\xaa\x3a\x7f\
-\x3a\x00\xac\xcf\xc2\x20\xe1\x45\x07\x80\xf5\x30\xac\xd0\x2d\x4e\
-\x05\x9f\x31\x8a\x03\x7e\x4c\x01\x24\x22\xe5\xac\x37\xc1\x01\x45\
-\x45\xb1\x30\xa9\x76\x2d\x2a\xca\xda\x13\x3d\x80\x54\x37\x1d\x8f\
-\x1a\x05\xd3\xa4\x44\x9e\x67\x47\xa8\xe1\x48\x4a\x55\xa7\x6b\x29\
-\x75\x93\x0c\x1e\x5c\x1c\x01\xd0\x8e\x51\xbb\xb2\x85\xf3\x62\x11\
-\xa0\x08\x67\x0a\x40\x04\x9f\x39\x05\xa9\x03\xe0\xc9\x08\xc0\xf1\
-\xbd\xcb\x3f\x03\xe7\x38\x64\x69\xdf\xb5\x55\x67\x42\xdd\x14\xa2\
-\xa4\x43\x51\x04\x47\x01\x2a\x94\xda\x29\x5a\x3f\x07\xd2\x99\x18\
-\x26\xa7\xca\x50\x5e\xfe\x22\x3b\x44\x15\x01\xd0\x9f\x52\x58\xfd\
-\xe8\x00\x7c\xd6\x2e\xe8\x82\x5d\x3f\x87\x5c\x8b\xbf\xfd\x8f\xd9\
-\x9c\xe9\xef\x54\x9c\x11\x00\x75\x9f\x39\x47\xdb\x06\xe7\x47\x07\
-\x20\x16\x8b\x05\x00\x28\xfb\x61\x03\x71\xac\x05\x40\xb5\x04\x08\
-\x71\x3a\x00\x8a\x76\x67\x8e\xbd\xc9\x8f\x75\x00\xb3\x5e\x2c\x83\
-\x60\x31\x3b\x87\x69\x72\xcf\xc8\x86\x0d\x5e\x74\xf4\xfa\x14\x8e\
-\xcb\x07\xe9\xe9\x57\x55\xbc\x38\x09\xb1\x85\x82\x33\x05\x02\xb0\
-\xb6\x3f\xa7\x50\x52\x07\x40\x10\x6c\x71\x1a\xd0\xa6\x00\xbc\xe8\
-\x00\x00\x00\x84\xb3\x22\x56\x20\xf9\x8c\xba\xc9\xc2\x9a\x58\xcb\
-\xaa\x1d\x4a\x04\x47\xb1\x6a\xa7\x50\x7d\x92\x1d\xc1\x34\xb9\xbf\
-\xb2\x03\x54\x13\x51\xce\xf0\x3f\x00\x89\x04\x6b\x59\xb5\x6b\x09\
-\x40\x79\x08\x12\xdb\x05\x01\x55\xd9\xe2\xe0\x58\x7b\x21\xfd\x58\
-\x03\x00\x00\xaa\xf8\x80\x51\xd7\x05\x81\x17\x23\x00\x5b\x36\xee\
-\x58\x07\xd2\x89\x88\x22\x72\x0c\xa3\x6e\x5a\x12\x3c\x02\x4f\x9e\
-\x0a\x4c\x93\x08\x10\x0a\xfd\x99\x1d\xe2\x0b\x8e\xf5\xde\xdf\xb1\
-\xf2\x99\x6e\xef\x92\x6a\xd7\xa2\x22\xf9\x94\xba\xe0\x7c\xe6\xa7\
-\x23\x0a\xca\x65\x50\x21\xd1\x4f\x9d\x93\x80\x73\x2b\x96\x27\x6b\
-\x00\x00\x40\x48\x17\x83\xa8\x70\x7a\xbf\xc9\x4a\x4b\x63\x71\x28\
-\x56\x91\xca\x9f\x40\xaa\x9b\x42\x6e\x5e\xf6\x2e\x00\x5f\xe6\x87\
-\x4d\xb6\xa9\x3e\x2f\x6f\xbc\xf1\x1e\x3b\x46\x35\xa7\xf8\x1a\xa3\
-\xae\x02\xcb\xfd\x39\x04\x88\x74\x0e\x82\x27\x53\x20\x55\x28\xdb\
-\x00\x35\x21\x1b\x5d\x10\x28\xe7\x2a\x54\x45\xbb\x68\x34\xe6\xc5\
-\x71\xc0\x20\x6d\x83\x03\xc4\x8b\x0e\x00\x00\x40\x48\x47\xa3\x2a\
-\x4e\xf0\xe6\x4e\x00\x00\x10\x5d\xc0\x8e\x60\x9a\x88\x73\x1e\xfd\
-\xdd\xc6\x9c\x02\x5f\xa6\x94\x56\xf1\xe2\x18\x64\x00\x40\x20\xf9\
-\x94\xba\x12\x78\xd1\x01\xc8\x2f\xba\xa4\x25\x00\xca\xa9\xb8\x15\
-\x2e\xfe\x91\xeb\xda\xfe\x80\x4d\x20\x0d\x7b\x96\xa1\x7d\x27\x46\
-\xdd\x64\xac\x55\xf0\x0a\xe4\x33\xea\xa6\xa3\xac\xb3\xd1\x05\x07\
-\x2c\x59\xdd\xb6\x37\xa5\x76\x3a\xe5\x15\x0f\x00\xf0\xe3\x92\x10\
-\x93\x4d\x3b\xb1\x73\xe7\x7c\x76\x88\x6a\x7d\x0b\xdf\x1f\x00\x70\
-\x86\x7e\x21\x1e\xdd\x7d\x41\x1b\x05\x75\x6b\x39\x75\x6b\x6b\x1b\
-\x08\xab\x0d\x0c\xd6\x74\xfd\xfc\x13\x37\x7b\xf6\xe5\x95\x4a\x5a\
-\x05\x2f\x4e\xbb\x31\xea\x26\x53\xe5\x2c\x88\x11\xa0\xbb\x2f\xdb\
-\xe0\x9c\xd3\xd7\x59\xb5\x45\x03\xca\x50\x68\x3a\x72\xfb\x4b\x96\
-\x20\x89\x00\x00\x20\x00\x49\x44\x41\x54\xaa\x8f\x01\x78\x34\x4f\
-\x6c\xb2\x42\xe4\x61\xd9\xb0\xc1\x8b\x7d\xdf\x00\x00\xd1\xaf\xd2\
-\x6a\xab\x7a\x32\x02\x10\x73\x00\x38\xbb\x80\x9c\x1f\x23\x00\xac\
-\xbb\x20\x14\xd8\x8c\x92\x92\x84\x03\x00\x01\x28\xd3\x00\xe2\xc9\
-\x59\xf0\x89\x70\x0b\xd6\x9b\xa1\xf5\x79\x17\x4c\x3f\x94\x54\xbb\
-\x96\xa0\x32\xe0\x7d\x28\x08\x4e\xa6\xd5\x4e\x47\xe5\x4e\x76\x04\
-\x93\x65\x22\xb3\xd9\x11\x6a\x12\x95\x53\x58\xb5\x83\x48\xc8\x8b\
-\x0e\x40\x9f\xc2\x0d\xdd\x01\x70\x6e\xc2\x43\x78\x2d\xa7\x6e\x6d\
-\xac\xbb\x20\x04\xf2\x11\x00\x54\xcf\xbd\x6e\xe4\x84\xd0\x7c\x46\
-\xdd\x64\x87\xb6\x6d\xfd\x2e\x38\x87\x01\xa1\x32\x1e\xf2\x62\x1b\
-\xdc\xa2\x92\x6b\xd7\x03\x4a\x79\x1f\x40\xe5\x1b\x3e\xad\x03\x90\
-\xdf\xbc\x52\x0a\xe0\x5f\xec\x1c\x26\x6b\x96\xc8\x9b\x6f\x7a\x74\
-\xc6\x43\xcc\x01\xca\xea\xf4\x6e\x7c\xe3\x99\xdf\x7b\xb1\x10\x32\
-\x0c\x61\x7d\xf6\x25\xba\xa2\x2b\xe7\xfe\x93\x64\xa4\x45\x90\x0a\
-\xad\xd1\x01\x10\xa5\xfc\x30\x54\xc4\x8b\x43\x60\x66\xcf\xbe\xbc\
-\x12\xa4\x6d\x21\x02\xde\x5e\xe0\x34\x5e\x22\xd5\xed\xb8\x64\x65\
-\xeb\x41\xa4\xda\x19\xe8\x8d\xec\x04\x26\x6b\x66\xb0\x03\xd4\x34\
-\x60\xe8\xbb\xc7\x01\x20\xcd\xfd\x8a\x37\x47\x5e\x2b\xeb\x1c\x04\
-\xc5\x86\xaa\x6b\xd0\xe9\x94\xb4\x08\x52\xa0\xef\x02\x55\x1d\x00\
-\x51\x61\xf5\x86\xf2\x49\x75\xd3\x59\x4b\xa9\xea\x48\x67\x81\xa7\
-\x21\xca\xdb\x02\x27\x4e\xbe\xc1\xaa\x9d\xd6\xac\xd7\xfe\x02\x60\
-\x29\x3b\x86\x69\xb4\xb7\xd0\xad\xdb\xc3\xec\x10\x35\x05\xe2\x4e\
-\x67\xd5\x16\xa8\x3f\xdb\x5c\x95\x74\x17\x88\xb0\x76\x7d\xa5\xc1\
-\xdb\x0a\xbe\x01\xa8\xea\x00\x04\xa2\x9c\x21\x21\x4f\xf6\xc1\x03\
-\x00\x04\x6f\x53\xea\x2a\xbc\x98\x02\x00\x80\xc0\x11\xf7\xc0\x2b\
-\xce\xa4\xd5\x4e\xa3\xea\xba\xd8\x69\xec\x1c\xa6\xd1\x7e\x21\xa5\
-\xa5\x5e\x3c\xed\xd5\x30\x8c\x55\x58\x9c\xfc\x9b\x55\x3b\x99\x42\
-\x28\x0f\x3f\x22\x78\x87\x51\x37\x83\x7c\x46\xd1\xea\x87\xfe\xaa\
-\x79\x57\xc7\x39\x15\x4a\xfd\x19\x01\x50\xc5\x0a\x52\xe9\x7e\xd1\
-\xe8\x43\x21\x52\xed\x5a\x5a\xc6\xc3\x2f\x03\xa8\x24\x95\xff\xda\
-\x88\xd1\xd3\x0e\x21\xd5\x4e\xaf\xc3\xab\x7f\x02\x68\xef\x0b\xd3\
-\x78\x6f\xa0\x5b\xb7\x07\xd9\x21\x6a\xea\x7d\xf2\x77\x0f\x05\xc0\
-\xda\x01\x50\xbe\x1d\x15\xff\x25\xd5\xae\xa5\xea\x26\xd4\x3e\x94\
-\xe2\xea\xcd\x36\x48\x01\x40\xd9\x09\xa7\x90\x9a\x53\x00\x09\xd6\
-\x14\x40\xeb\x61\xd1\xeb\xbd\x38\x0b\x80\xb8\x0d\xae\x65\x39\xde\
-\xe9\x45\xaa\x5d\x4b\x49\xc9\xc4\x32\x00\xaf\x91\xca\x3b\xa8\x3b\
-\x8f\x54\x3b\x2d\x89\x21\x80\xe2\xa7\xec\x1c\xa6\x81\x44\x26\xfb\
-\xf6\xf4\x1f\x8a\x27\xbe\x85\x2f\x16\x5f\xe7\xda\xff\xd6\x96\xde\
-\x4b\x39\xf2\x3b\xd9\xa6\xc4\x07\xbd\x41\xda\x01\x20\xce\x79\xb1\
-\x0b\x62\x40\xd1\xf7\xba\x00\x68\xc5\xa8\xed\x6a\x8e\x00\xc4\x13\
-\xb4\x35\x00\x88\x84\x42\x7e\x4c\x03\x04\x21\xde\x3e\xf8\x90\x1f\
-\x3b\x01\x00\x00\x82\x67\x89\xb5\xbf\x45\xab\x9d\x81\xfc\xe6\xd5\
-\x47\x00\x3c\xce\xce\x61\xea\xed\x49\x59\xb3\x66\x21\x3b\x44\x0a\
-\x25\xbe\xc7\xd5\x9f\xdb\x2e\x55\x02\xda\xda\xa7\x72\x24\xbc\xe8\
-\x00\x68\x3c\x4e\x6b\xfb\x12\x79\xe1\x2f\x3a\x00\x4f\x94\x4c\xde\
-\x08\x60\x07\x23\x88\x8a\x1f\xc7\xe1\x3e\x36\x7f\xe2\x06\x28\xe7\
-\x6a\x64\x55\x1c\xcf\xa8\x9b\x8e\x06\xfa\x37\x62\xf9\x21\x67\x46\
-\xa7\x77\x25\xd6\x4f\x2f\x9c\xf8\x21\x48\x97\x25\x99\x06\x29\x43\
-\x38\x7c\x25\x3b\x44\xb2\x3e\x27\x5e\x7a\x08\x84\x73\xfe\x3f\x00\
-\x38\xa1\xfe\x6e\x27\x51\xce\x31\xc8\xc0\xa7\x6b\x4a\xe7\x78\xb1\
-\x05\x50\x1d\xed\x1c\x9c\xad\xab\x9e\xbe\xfd\x63\x60\xf7\x50\x94\
-\xa8\x80\xb3\x08\x4e\x02\xe9\xc9\xa8\x9b\x4a\x14\x42\x9a\xef\x15\
-\xf5\xe6\x24\xbc\x6d\xad\x76\x2c\x06\xc0\xba\x2f\x3d\x14\x0e\xbb\
-\x0b\x48\xb5\x33\x92\x19\xcb\xde\x82\xda\xb6\xc0\x66\xe4\xd7\xb2\
-\x7a\xb5\x4f\x0b\xbd\x00\x00\x2e\x14\xba\x08\xbc\xe1\xff\xed\xe5\
-\x6d\x5a\xf9\xb3\x05\x10\xb4\x8e\x90\x17\x4f\xff\x00\xa0\x70\x3d\
-\x38\x95\xe5\xad\xea\xff\xb5\xfb\xcd\xa8\x50\x4e\x07\x40\xa4\x3f\
-\xa3\x6e\x3a\xaa\x60\x4d\x03\x1c\xe7\xcb\xc5\x48\xa5\xf7\xc6\x76\
-\x0a\xf0\x1c\x2f\x81\x8e\xf7\xe5\x78\xe4\x5a\x12\x3b\x6e\x04\xb0\
-\x9a\x1d\xc3\xec\xd5\x9b\x10\x99\xc9\x0e\x91\xc1\xc5\xc4\xda\xa5\
-\x6b\x9e\xbc\xcd\x8b\x3b\x2e\x7a\x0d\xbb\x2a\x0f\x90\x63\x29\xc5\
-\xbd\x39\x06\x19\x10\xe1\x6c\x83\x54\xd1\x74\x1d\x00\xbc\x95\xfe\
-\x8f\x37\x71\x18\xa8\x37\xf3\xdf\xc2\xeb\x1d\xb6\xac\x8c\xb4\xf2\
-\xe6\x20\x1c\x55\xf0\x86\x0a\x15\x7d\xce\x1e\x33\x93\x77\x4e\x7a\
-\x06\x72\xdb\x9a\x72\x08\xae\x00\xe0\xc7\x35\xaa\x26\x9d\x04\x44\
-\xc6\xcb\x9a\x35\x5e\x34\x74\x35\x0d\x28\x2a\x1e\x02\xa0\x1f\xab\
-\xbe\x30\x7f\xa7\x93\x84\xb7\xef\x1c\x0c\xd6\x11\xc0\xce\x9f\x9b\
-\x10\x59\x6d\x9f\x04\x5f\x8c\xf6\xef\xee\x00\x88\x0a\x67\x1f\x3c\
-\xd0\xdf\x97\x6d\x70\x8e\x75\x25\x2e\x80\x20\x11\x3a\x81\x55\x3b\
-\x99\xba\x04\xf5\xc3\xc2\x29\x2e\x63\xd6\xcf\x44\x6e\x7e\xf5\x9f\
-\x00\x7e\xc5\xce\x61\x32\xfa\xb9\xac\x59\xc3\x5b\xc4\xba\x07\x89\
-\x04\x2e\xa5\xd6\x0f\x12\x4f\x31\xeb\xd7\xe4\x78\xc3\xff\x80\xfa\
-\xb1\x03\xa0\xa8\x28\x16\x16\x45\x5f\x46\x6d\x75\x69\x46\x00\xe0\
-\x74\x0d\x23\x0c\x80\x56\x71\xf7\x6e\x01\xa9\x76\x2d\xd2\xa2\x92\
-\xb6\x13\x40\x05\xde\x74\x00\x16\xcd\xbb\x76\x39\x48\x53\x42\x55\
-\x46\x9d\x73\xc9\xac\x03\x88\xf5\x33\xeb\xf0\xea\xcf\x01\xfd\x07\
-\x3b\x86\x49\xf1\x4f\xbc\xf5\xd6\xf5\xec\x10\xe9\x0c\x2a\xba\xe4\
-\x00\x11\x8d\x12\x23\xbc\xb9\xfa\x85\xbb\x7d\x9a\xbe\x62\x8d\xf0\
-\xa9\xab\x8c\x7b\xd1\x01\x78\x1f\xef\xf7\x02\x6b\x1b\xa4\x48\xea\
-\x08\x40\x42\x22\x6f\x30\xc2\x00\x40\xc2\x93\xf3\xf0\xff\xfc\xc7\
-\x1f\x7f\x0c\x80\xd2\x11\x12\xf8\xb3\x10\x10\x00\xa0\xee\x4f\xc4\
-\xea\x6d\x83\xb2\xf8\x78\x62\xfd\x8c\x24\x86\x00\x41\x70\x21\x48\
-\x77\x47\x98\xb4\x36\x22\x1e\xbf\x40\x48\x17\x7a\xed\x4d\x79\x10\
-\xb9\x1c\x40\x5b\x56\x7d\x55\x29\x61\xd5\x4e\x47\x79\x1d\x80\x37\
-\x97\xbf\x38\xd7\x8b\x2b\xa1\xc3\xc4\x13\x60\x43\x41\x7c\x77\x67\
-\x70\x77\x07\xe0\xf8\xde\x9f\xad\x05\x69\x2b\xa0\xc0\xa3\xf3\xf0\
-\x41\x3b\x0e\xb7\xdb\xf0\xe8\x8d\x5e\x5c\x8e\x04\x00\x90\x04\xf7\
-\x43\x43\xf0\xc3\xe2\xe2\x3b\x23\xd4\x0c\x19\xc8\x2d\xcb\x36\x42\
-\x70\x01\x3c\x6d\x70\xf6\x33\x01\x54\x2f\x94\x75\xeb\xbc\xec\x90\
-\x0d\x1e\x5c\x1c\x01\x84\xba\x25\x31\x14\x52\x6f\x3a\x00\x7d\x0a\
-\xc7\xf5\x00\xc0\xba\x02\xdd\x9b\x63\x90\x11\xd0\x1e\x7a\x3f\x5f\
-\xb6\xf8\x9e\xdd\xdb\x20\x77\x77\x00\x62\xb1\x58\x00\xe0\x4d\x46\
-\x22\xf5\xe8\x42\x1c\x55\xde\x65\x19\x12\x72\xa7\xb2\x6a\x27\x5b\
-\x38\x7f\xea\x7f\xc9\xd3\x00\x87\x7e\xf8\xd9\xd6\x6f\x12\xeb\xef\
-\x91\xdc\xfc\xea\x3f\xa1\x7a\x2d\x3b\xc7\x7e\x4f\xf5\x1a\x79\xfb\
-\x6d\x6f\xa7\x64\xca\x5a\x07\xa3\x00\xa5\x1c\xf7\x0a\x00\x02\x79\
-\x7b\x79\xe9\x5d\xaf\xb0\xea\x27\x0b\x81\x77\x11\x92\x8a\xfa\xb3\
-\x0d\x52\x38\xf7\x20\x28\xb0\x72\xd7\x7f\xed\x52\x7b\x4f\xaa\x60\
-\x65\xae\x03\x01\x80\xaa\x1f\x53\x00\x00\xe0\x42\xc4\x0b\x71\xe0\
-\xd7\x8d\x78\x02\x79\x84\x1c\x60\x22\xb5\xfe\x5e\xc8\x6f\x5e\x9b\
-\xe9\xf1\x96\xb3\x7d\x9f\xc8\x8d\xf2\xf6\xdb\xbf\x61\xc7\xd8\x03\
-\x51\x91\x09\xdc\x08\xc1\x43\xdc\xfa\xb5\x29\x94\xf7\x19\xa7\xce\
-\x9f\x9b\x10\x59\x3b\x00\x50\xbb\x8d\xaf\xd5\x01\x90\x40\x28\x1d\
-\x00\x01\x8e\x28\xba\x24\xd6\x92\x51\x3b\x59\xa4\x32\xff\x75\x00\
-\x5b\x49\xe5\x4f\xf3\x65\x47\x44\x15\xe6\x3a\x00\x00\x38\x7e\xf8\
-\xa8\x99\xb4\x9b\xd3\xea\xe4\xe6\x57\xa6\x00\xb8\x87\x1d\x63\xbf\
-\xa3\x7a\x3f\xd6\xac\xf9\x31\x3b\xc6\x9e\xf4\x3d\xe9\xb2\xb3\x01\
-\x70\xf6\xbb\x57\x51\x75\xde\x0c\xff\x57\x5d\x00\x74\x32\xa9\xfc\
-\xd6\x55\x5d\x3e\xf5\xe2\x62\xaf\xc3\x4e\x98\xd0\x0a\x00\xe5\x00\
-\x3c\x85\x64\xee\x00\x28\x02\x4a\x07\x00\x40\xf8\x80\x8a\xd6\x94\
-\x2d\x11\xc9\x4a\x4a\xce\x4f\x00\x60\xdd\x98\x75\x60\x45\x68\xdd\
-\x71\xa4\xda\x29\x1e\x9b\x3f\xf9\x25\x00\xab\x98\x19\x44\xf4\x97\
-\x5e\x1e\x0c\x54\x45\x00\xc5\xf6\xf0\xe5\x80\x3e\xc1\xce\xb2\x1f\
-\x79\x1c\x87\x1f\xfe\x1d\xa9\x31\x94\xe9\x25\x75\xdc\x8b\xa4\x44\
-\x56\xaf\x7c\x6e\xf6\xff\xa8\x19\x6a\xf8\x20\xf1\xee\x57\x00\x74\
-\x20\x95\xff\x37\x4a\x4a\xbc\x58\xb3\xd3\x36\xb4\xad\x3f\x00\xca\
-\x83\x9e\xd3\x20\x73\x07\x20\x04\xde\x29\x49\x81\xba\xa3\x59\xb5\
-\x53\xe9\xbf\x78\xa5\x3d\x9b\x06\x50\xfd\x03\x39\xc2\xe0\x11\xa3\
-\x67\x9e\x49\xce\xb0\x47\x32\x7b\x49\x25\x42\x38\x1f\x80\x37\x73\
-\x8c\xfb\xb0\xe7\x51\x56\x76\xbe\x6f\xb7\xfc\x25\xeb\x3f\x74\xdc\
-\x48\x01\xf7\x8e\x0f\x51\x9d\x03\x8f\x3a\x49\xce\xf1\x3e\xdb\x04\
-\xe2\xcd\xf0\xbf\x0b\x61\x20\xab\xb6\x84\xb4\xd6\x55\xc8\xb5\x3a\
-\x00\xe1\xa0\xc7\x1b\x20\xed\x04\x80\x06\xde\x9c\xfe\x26\x8e\xb7\
-\x0e\x40\x85\x38\x47\x96\x46\x28\x12\xf9\x03\x00\xf6\x87\x6d\xcc\
-\xe7\x51\x00\x00\x90\x99\xaf\x6d\xc7\xf6\xf0\xe9\xb0\x9b\x03\x9b\
-\x8e\xc8\x5f\x50\x56\xf6\x0d\x79\xff\x7d\xce\x67\x54\xdd\x89\x8a\
-\xbb\x8e\x9c\xa1\xd2\x45\xf4\x3e\x72\x86\xda\x54\x68\x0b\x00\x03\
-\xe2\xe2\xee\x64\x1a\x08\xeb\xcc\x97\x6d\xcb\x4b\xe7\xd6\x3a\xf1\
-\xb7\x56\x07\xa0\x6a\xf8\x9b\x74\x18\x8e\x78\xb3\x0f\xbe\x45\x65\
-\xf8\xdf\xe0\xf5\x9c\xbf\x72\xd6\xd8\x1b\x0e\x24\xd5\x4e\xf1\xc8\
-\xfd\x13\x3e\x50\xc5\x93\xe4\x18\xc7\x8d\x18\x35\x73\x14\x39\xc3\
-\x5e\xc9\xec\x25\x3b\xb0\xa1\xf7\x48\x00\x73\xd9\x59\xf6\x41\xf7\
-\xa1\x43\x87\xf3\x9a\x41\xe3\x8f\x7e\x27\x8d\xbf\x10\xd0\x63\xc8\
-\x31\xfe\xb2\xec\xe9\x39\x1b\xc9\x19\x76\x1b\x70\xc2\x65\x07\x01\
-\x60\x4d\x6f\x06\x2d\x43\x95\x2f\x91\x6a\xa7\x72\x9c\x93\x10\x05\
-\x78\x0d\x49\xed\x5a\xca\xcd\x54\xaa\x60\x6d\x19\x39\x32\x1a\xbd\
-\x91\x35\x3f\x54\x4b\x49\xc9\xc4\x4f\x00\xb0\xe6\xce\x42\xe1\x20\
-\xec\xdb\xc2\x37\x7e\x83\x26\x98\x31\x7c\x78\xac\x35\x3b\xc6\xde\
-\x48\x49\x49\x02\xb3\x5e\x1d\x0f\x60\x1a\x3b\xcb\x3e\xe4\x56\xbc\
-\xf5\xd6\xc5\xb2\x64\x49\x25\x3b\xc8\xde\x1c\x76\xc2\x84\x56\x50\
-\xfe\x71\xd1\x1a\xe0\x6e\x76\x86\x9a\x34\x2c\x67\x82\x34\xef\xad\
-\xc0\x92\x57\x4a\xef\xa5\x5c\xf5\x9e\x6c\x50\xd1\x25\x07\x40\x39\
-\x77\x42\x28\x24\xa5\x6d\x4f\xe9\x00\x08\xf4\xd5\xdc\xc4\x49\xe1\
-\x2a\x24\x44\x9d\x33\xab\x49\x45\x68\x67\x67\x2b\xf0\x2d\x56\xed\
-\x74\xb6\x6d\xdc\xfe\x38\x80\x0f\xc9\x31\x0e\x73\xad\xdb\x90\xb7\
-\x54\xd5\x8d\x00\x2a\xb3\x5e\xbd\x16\xaa\x93\x61\x97\x07\x35\x46\
-\x02\xaa\x13\xe4\xad\xb7\x7e\xe8\xfd\x82\xbf\x2a\x6d\x23\xdb\xa6\
-\x00\x60\x1f\xe8\xf5\x7e\xd7\xf0\xa1\x7f\x25\x67\xa8\x4d\x70\x3e\
-\xaf\xb4\x3f\x17\x21\x55\x22\xef\xab\x20\x5d\x09\xad\x92\xda\xb6\
-\xa7\x76\x00\x24\xc4\xea\x00\x40\x9d\x3f\xe7\xe1\x87\x54\x99\x6f\
-\x9a\x61\xc3\x2e\xb8\xb5\x3d\xb1\x7e\x2d\xa5\xa5\xb1\xb8\xa8\xdc\
-\xc1\xce\xa1\x0e\x53\xcf\xbb\x70\xd6\x97\xd8\x39\xea\x6a\xd7\x39\
-\x01\x38\x15\x76\x6c\x70\x43\x7c\x04\x91\x33\x3d\xdf\xe7\x5f\x4b\
-\xef\x93\xbf\x7b\xa8\x40\x26\xb3\x73\x00\xb8\xa3\xb4\x34\xc6\x5e\
-\xb7\xb3\x5b\x9f\x13\x2f\x6d\xa7\x90\xd3\x58\xf5\x9d\x13\x6f\x3a\
-\x00\x9a\x08\x68\x6d\x5c\x28\x08\xf6\xde\x01\x28\x8b\x04\xaf\x82\
-\x77\xc4\xa9\x37\x1d\x80\x48\x62\xfb\xff\xb7\x77\xe7\xe1\x51\x96\
-\xe7\x1a\xc0\xef\xe7\x9b\x84\x1d\xad\x75\x97\x56\x3d\x1e\x4b\x02\
-\x41\x5a\xa5\x9e\x6a\x59\x4c\xb1\xa0\xa8\x80\x4b\x23\x8b\x5a\x2c\
-\x4b\xb0\x5a\x3d\x2e\x04\xac\xad\x75\xec\xa2\x05\x22\xa0\x1e\x44\
-\x12\x54\x5c\x80\x40\x6c\x85\x44\xa4\x82\x4b\x48\x40\x6b\xcf\x41\
-\x45\xc9\x6a\x40\x71\xc7\xa5\x22\x4b\x80\x64\xe6\x7b\xce\x1f\x80\
-\x86\x64\x12\xb2\xcc\xcc\xf3\x06\xee\xdf\x75\xf5\x1f\x4d\xbe\xf7\
-\x6e\x4c\xe6\x7d\xbe\x77\x7d\x05\xc0\x0e\xa3\xe6\x3b\x24\x86\xf6\
-\x38\xb5\xf2\xbd\xda\xaf\x9e\x03\x60\x97\x69\x08\x45\xd7\x50\xa8\
-\xe6\x3e\xd3\x0c\xcd\x24\x33\xd6\xbf\x8c\x80\xfe\x08\x80\x33\xb7\
-\xb1\xb5\x01\x2f\x23\x14\xfa\x91\x54\x56\xb6\xa9\x9f\x99\x17\x0e\
-\xcf\x02\xd0\xd9\x38\x46\x55\xd8\x93\x87\x8d\x33\x1c\x20\x10\x08\
-\x0c\x03\x60\x75\xce\xcb\xf6\x0e\xdb\xe1\xcc\xfc\xbf\x8a\xd9\x3d\
-\x08\xa1\x0e\x55\x81\x7a\xbb\xfc\xea\x15\x00\x2b\x9f\xcc\xd8\x09\
-\xa0\xb8\xee\x3f\x8f\x0b\xc5\xb9\xc1\x60\xd0\x64\x78\xa4\xae\xdc\
-\xdc\x60\x35\x20\x05\x56\xed\x8b\x63\xd3\x00\x2b\x72\xef\xf8\x5c\
-\x55\x17\x58\xe7\x00\x64\xd4\xf0\x51\xd3\x87\x5a\xa7\x68\x0e\xc9\
-\x7c\xeb\x33\xcc\x5c\x7f\x21\x04\xb7\x83\xf7\x07\x34\x26\x0c\x91\
-\xbb\xb1\x71\xe3\x20\x57\xcf\xf6\x6f\x48\x8f\x01\xe3\x2f\x12\x75\
-\xe2\x6f\xf6\x89\x8a\x82\xac\x2f\xac\x43\xd4\xa6\x80\xdd\x4d\x88\
-\x82\x17\xd7\xad\xcb\x72\x64\xed\x48\xd0\x03\xf0\x13\x9b\xb6\xe5\
-\xed\x75\xeb\xb2\xea\x2d\xa0\x8d\xd8\xd9\xaa\xea\xbf\x62\x1f\x28\
-\x02\xc1\x77\xde\x28\xee\xe2\xc4\x81\x40\x00\x00\xc3\x69\x00\x15\
-\x0c\x49\x4b\x9b\x6d\x76\x83\x58\x44\x9e\x3f\x0b\x0e\xcc\xc5\xaa\
-\xe2\x7f\x9c\xfb\xd9\x1c\x84\x00\x2a\x33\xd6\x4f\x85\x60\x10\x80\
-\x77\xad\xf3\x38\xa8\x02\x9e\x37\x50\x2a\x2b\x83\xae\xde\xea\xd7\
-\x90\xde\x83\xaf\xe9\x0c\xc8\x6c\xeb\x1c\x00\x34\x00\x7d\xc0\x3a\
-\x44\x6d\x49\x7d\xc7\x76\x05\x60\xb6\xfd\x4f\x7c\x77\xe6\xff\x93\
-\xfa\x7f\xd8\x0b\x46\x07\x21\x29\x22\xf7\xe9\x11\x0b\x00\x11\xef\
-\x7f\x63\x1b\xa7\x61\x7e\x40\x9d\x99\x06\xf0\x03\xa6\xeb\x00\x3a\
-\xed\x4e\xa8\x72\x6a\x1a\x20\x7f\xd1\xed\xc5\x50\x27\x86\xb2\x4f\
-\xde\x1d\xd8\xf9\x47\xeb\x10\x2d\x21\x33\xd6\xbf\x0c\x74\x4a\xc1\
-\xde\x5d\x02\x6d\xaa\xa3\x8b\x91\x5d\x10\xb9\x1b\x22\xbd\xe5\x9d\
-\x77\x0a\xad\xc3\xb4\x44\xf5\xee\xf6\xf7\x00\x38\xd5\x3a\x07\x04\
-\xcb\x37\x14\xce\xb3\x3a\xcd\x35\x22\x09\x24\x0c\x05\xd0\xd1\xaa\
-\xfd\x90\x86\x5d\xf8\xbc\x02\x00\x04\x0c\xb7\xba\x7b\x40\xd3\x0b\
-\x00\xcf\xf3\x6d\x46\x00\x00\x88\x43\xeb\x00\x9e\x5d\x38\xf9\x1d\
-\xcb\x1b\xf1\x3c\xdf\x6e\xe5\x6c\x83\x3c\x71\x62\x0e\x5e\x20\x37\
-\x0d\x1f\x39\xad\xbf\x75\x8e\x96\x90\x99\xaf\xee\xda\xbb\x4b\x20\
-\x70\x06\xc4\x9d\x37\x94\xb8\x13\x79\x16\x09\x09\x29\x52\x59\x19\
-\x94\xca\xca\x3d\xd6\x71\x5a\x22\xb9\xff\x84\xf3\x04\xf2\x1b\xeb\
-\x1c\x00\xa0\xa2\x4e\xfc\x6d\xd6\x26\xa2\x76\xc3\xff\xc0\x3b\x15\
-\x6b\x1e\xb5\xbc\xd1\xf4\x00\x2a\x86\x7d\x5b\x38\xf2\x3a\x88\x88\
-\x05\xc0\xd6\x8f\xab\x36\xc0\xea\x44\x40\x60\x80\x51\xbb\x0d\xb0\
-\x5b\x41\xaa\x82\x4b\x86\x8e\xca\x3c\xc6\xaa\xfd\x48\xf2\x16\x4d\
-\x5a\x05\xa0\xc8\x3a\x07\x80\x80\x42\x16\xb8\x74\x68\x52\x73\xc9\
-\xac\xd7\x4b\x65\xc6\xfa\x0b\xa1\x9a\x06\xa0\xc2\x3a\x4f\xdc\x88\
-\x94\x41\x64\xb8\x54\x56\x0e\x95\xf2\xf2\x36\x3b\x1d\x72\xda\xcf\
-\xd3\x8f\x14\xe0\x71\x18\x6d\xeb\xaa\x4d\x80\xb5\x65\x05\xf3\x0a\
-\xac\x73\xd4\xd6\xfb\xa7\xd7\x1d\x07\x85\xd9\x28\xa6\x4b\xdb\xff\
-\xf6\xb1\x7a\x61\xd9\x5e\x72\xd2\xd6\x88\x77\xba\x44\xfc\xc5\xdd\
-\xb7\x85\x64\x5d\x4c\x23\x35\xec\x07\x17\x8f\x9e\x69\x72\x53\x52\
-\x24\xaa\xba\xd4\xb0\xf9\xf6\xe2\xe3\x2a\xc3\xf6\x23\x12\x1f\xae\
-\x0c\xbf\x7f\x3f\xc1\x4f\xb8\xdf\x3a\x44\x6b\xc9\xac\xb7\x9e\xc6\
-\x91\x47\xa5\x00\x18\x8b\x43\x7b\x7d\xc0\x46\x00\x63\x50\x59\xd9\
-\x4b\x2a\x2b\xf3\xac\xc3\xb4\x56\xfb\x3d\x3a\x07\x82\x53\xac\x73\
-\x00\x80\xef\xe9\xef\xad\x33\xd4\x55\x9d\xe0\x5f\x03\xa0\x9d\x55\
-\xfb\x02\x7d\xc6\xaa\xed\xba\x92\xfb\x4d\xe8\x0e\xe0\x3f\x2c\xda\
-\x16\xe0\xff\x1a\xba\x08\xa9\xb1\xca\x75\x4d\x8c\xf2\x1c\x54\xc0\
-\x0f\x9b\x2d\x1a\xa9\x6b\xfb\x96\xaa\x97\x00\x98\xad\xaa\x15\xd1\
-\xf1\x56\x6d\x37\x64\xd9\x92\x8c\x17\xe0\xc6\x28\x00\x14\xb8\x66\
-\xd8\x88\xe9\x23\xad\x73\xb4\x96\x04\x0b\x42\x32\x73\xfd\x63\x38\
-\x72\xfd\xe9\x80\x0e\x03\xdc\xd9\xba\xd4\x6a\xaa\x6f\x02\x18\x83\
-\xef\x7f\x3f\x59\x36\x6e\x7c\xa2\xad\x2d\xf2\x8b\xa4\xc7\x79\x13\
-\xae\x81\x60\x94\x75\x0e\x00\x10\xe0\x65\xd7\xde\xfe\x01\x40\xa0\
-\x63\x0d\x9b\xff\xe2\x58\xef\x7b\xce\xac\x29\xf1\x04\x76\x77\xbc\
-\x68\xc3\x9f\xd5\x0d\x16\x00\xaa\x62\xf6\x01\x2f\xea\x3b\x73\x21\
-\xce\xde\xd1\x10\x31\x7b\x5b\x51\xa0\xd7\xd0\x11\x99\xce\x9c\x90\
-\xf8\x0d\xdf\xb7\xbe\xec\xe4\x5b\x1e\xb2\x86\xa7\x65\xf6\xb4\x8e\
-\x11\x0d\x12\x84\x2f\x33\xdf\xca\x97\x99\xeb\xcf\x81\xca\xcf\x20\
-\xb2\x08\x40\x5b\x9c\x1f\xdf\x0d\x91\x05\x10\x49\x95\x4d\x9b\xce\
-\x94\x8d\x1b\x9f\x70\xfd\x06\xbf\xa6\x4a\xea\x3b\x36\x09\x8a\xff\
-\xb1\xce\xb1\x9f\xaf\xb8\xdb\x3a\x43\x5d\x3d\x52\xc7\x9f\x03\xc0\
-\xec\x6f\x52\x81\xbf\xb9\x74\x18\x92\x1a\x16\x00\xea\x69\x83\x2f\
-\xf3\x0d\x16\x00\xa1\x84\x76\x6b\x61\x54\xa9\xab\x27\xe7\xa7\xa7\
-\xcf\x4d\xb4\x68\x3b\x12\x55\x3c\x6d\x9c\x60\x9c\x6d\xfb\xf5\xe5\
-\x2d\x99\xf2\xb2\x02\x05\xd6\x39\x00\x00\x8a\xae\x1a\xc0\x92\xb6\
-\xb6\x35\xf0\x60\x64\xd6\x9b\x05\x32\xe3\xcd\xd1\xa8\xde\xd3\x0d\
-\x8a\x9b\xa0\x58\x03\xb7\x8f\x16\xf6\x01\x14\x41\xe4\x37\xa8\xa9\
-\x39\x49\x2a\x2b\xaf\x96\xca\xca\xd5\xd6\xa1\xa2\x29\xa9\xef\xd8\
-\xae\x81\x40\x60\x29\x00\x47\x4e\xea\xd4\x17\xcb\x8a\xb2\xdd\xfb\
-\x19\x2b\x4c\x3f\xb3\xc4\xb3\xfe\xcc\xfe\x56\x4a\x4a\x5a\x3b\x00\
-\xe7\x19\x35\x1f\xf2\x43\xfe\x3f\x1b\xfa\x97\x0d\x16\x00\x2b\x16\
-\xdc\xb4\x0d\x6a\x74\x33\xa0\xa2\xeb\x27\xdb\xb7\x1b\x1d\x98\x50\
-\xdf\x89\x47\x76\x7d\x41\x81\x7f\x5b\xb5\x2f\x82\x51\x2e\x5e\x84\
-\xe3\x01\xb7\xc3\x81\x73\x01\xf6\xd2\x94\x3d\x81\xaa\x27\x5c\xbf\
-\x36\xb8\x25\x64\x76\xd9\x97\x32\x6b\xfd\x83\x32\x6b\x7d\x7f\x84\
-\xf4\x14\x28\x6e\x02\x64\x05\xac\x4f\x66\xdc\xab\x0a\xc0\x73\x10\
-\xf9\x0d\x02\x81\x93\x65\xe3\xc6\x01\x52\x59\x39\x5b\xde\x7f\xff\
-\x2b\xeb\x60\x31\x20\x5e\x20\xf0\x88\x02\xae\x9c\x55\xe2\x7b\x22\
-\xbf\xb5\x0e\x51\x57\xef\xc1\xd7\x74\x86\x8a\xe5\x0e\xa6\x2f\x8e\
-\x47\xb7\x02\xc3\xf6\x0f\x10\x3a\xe6\xa8\xbe\x00\x8c\x5e\x4e\xf4\
-\xcd\xf2\xb5\x8f\x6e\x6f\xe8\xdf\x36\xbe\x7a\x55\xec\xd6\x01\xb8\
-\x34\x0d\x90\x95\x35\xb1\xc6\x33\x9c\x06\x00\x70\x84\x74\xe9\x62\
-\xb9\x9d\x26\xa2\x65\x39\x19\xaf\x41\x74\xa1\x75\x8e\x5a\x2e\x1b\
-\x36\x22\xb3\x4d\x5c\x18\xd4\x52\xf2\xe0\x5b\x1f\xca\xac\xf5\x0f\
-\xca\xcc\x37\x2f\x02\x3a\x1d\x0d\xd1\x9f\x43\x35\x08\xc5\x2a\x00\
-\xdb\xe2\x10\x61\x1b\x54\x57\x42\xf5\x2e\x00\xe7\x23\x1c\x3e\x5a\
-\x36\x6e\xbc\x58\x2a\x2b\x67\x4b\x45\xc5\x47\x71\x68\xdf\x4c\x8f\
-\xfe\xe3\x27\xc1\xf2\x54\xbb\xfa\x9e\x2a\x5e\x9d\x6d\x76\x66\x4b\
-\x43\xaa\x77\x75\x48\x83\xe5\x08\x89\xe8\x52\x97\x86\xff\x3d\x55\
-\xbb\xbe\x4c\x1a\x9f\xca\x4f\x68\xf4\x9b\x55\x0b\x21\x56\x7b\x5c\
-\xe5\x02\x00\x77\xda\xb4\x5d\x9f\x42\x9f\x06\x70\xad\x5d\x00\xbd\
-\x11\x7b\xb7\x1c\x39\xc5\x0f\x25\x4c\xf1\x02\xe1\x4b\x61\x7f\x06\
-\xfa\x5e\x82\xe9\x43\x47\x65\x6e\xca\x5f\x34\xc9\x72\xf7\x46\x5c\
-\xc8\xcc\x57\x77\x01\x78\x71\xdf\xff\xa0\x80\x60\x52\xef\x53\x11\
-\xf6\x7a\x03\x7e\x0a\xc4\xfb\x0f\xa8\x7f\x2a\x20\x27\x03\x38\x01\
-\x4d\xff\x50\xde\x86\xbd\xb7\x3f\xbe\x0f\xe0\x3d\x88\x6c\x02\x50\
-\x8c\x40\xe0\xed\xb6\xbc\x6d\xaf\x35\x7a\xf4\x4f\xbf\x18\xa2\xf7\
-\x5a\xe7\xa8\xa5\x2a\x80\x90\x73\x2b\xff\x01\x00\x82\xeb\x2d\x9b\
-\x57\xf5\x72\x2d\xdb\xaf\x4f\x06\x5b\x0d\x94\xaa\x36\x3c\xff\x0f\
-\x00\x8d\x0e\x97\x5e\xf6\xcb\x7b\x8e\x0e\x57\x27\x7e\x06\x9b\x7d\
-\xae\x7e\x4d\xb8\xe6\x84\x15\xb9\x77\x7c\x6e\xd0\x76\x3d\xe9\xe9\
-\x73\x13\x3f\xdd\xb6\x6d\x0b\x00\xb3\x7d\xe7\x02\x1d\xb0\x2c\x67\
-\xb2\x13\xab\xef\x6b\x1b\x36\x72\xfa\x1f\xe1\x50\xb1\x06\x60\x97\
-\x00\x3f\x5b\x96\x93\x71\xe8\xac\xa4\x8f\x02\x4d\xef\x93\x88\x23\
-\x77\x1f\x8d\x90\xd7\x09\xe2\x25\x40\xfc\xae\xc8\xdf\xe9\x21\x84\
-\xaf\x91\x90\x10\x42\x75\x75\x15\x8e\x3e\xfa\x4b\x59\xb7\xce\x91\
-\xb3\xd3\xdd\x90\xdc\x6f\x7c\x1f\xf1\x64\x35\x5c\x29\x72\x01\x40\
-\xe5\x0f\xa5\x45\x59\x7f\xb2\x8e\x51\x57\x72\xea\xf8\x54\xf1\xe5\
-\x65\xc3\x08\x5f\x79\x5f\x6e\x3d\xa1\xb8\x38\xb7\xda\x30\xc3\x37\
-\x7a\x9d\x3f\xfe\xf8\x70\x8d\x7c\x82\x83\xf4\xb5\x31\x12\xf6\x6a\
-\xfc\xe3\x8a\x5f\x7d\xa4\xc1\xe9\xeb\x46\x3b\xf6\x67\x9e\xb8\xe3\
-\x4b\x28\xde\x8a\x7e\xae\x26\xf1\x12\xbd\xc4\xf3\x8d\xda\xae\x27\
-\x2b\x6b\x62\x0d\x00\xd3\xbd\xcb\x0a\x71\x72\x78\x5b\x77\xee\xfc\
-\x2b\x80\x0f\xac\x73\xd4\xd2\x51\x81\x67\x2e\x1a\x9d\xe9\xc4\x1e\
-\x6d\x57\x48\xd6\xba\x1a\x99\x5e\xfc\xa9\xcc\x7c\x7b\x93\xcc\x58\
-\x5f\x21\xf7\xbd\xbd\x4e\x2a\x36\xfd\xaf\x6c\xda\x54\x21\x15\x15\
-\x9b\xe4\xbd\xf7\x3e\x65\xe7\x7f\xa0\xe4\xd4\xeb\x4e\x15\x0f\xcf\
-\xc2\xa1\xce\x5f\x81\x0f\x13\x3b\xee\x9a\x61\x9d\x23\x12\xf1\xe5\
-\x66\xe3\x08\x7f\x77\xa5\xf3\x07\x80\x70\x48\x06\xc3\xa6\xf3\x07\
-\xa0\x6f\x34\xd6\xf9\x03\x4d\x78\xb3\x17\xc1\x0b\xd1\x0b\xd4\x3c\
-\x22\xe2\xcc\x3a\x00\x00\x80\xef\x5b\x0f\xc1\x0f\xbf\x74\xc4\xb4\
-\xff\x34\xce\x50\x4f\x7e\x7e\xb0\x0a\x82\x3b\xac\x73\xd4\x71\x62\
-\xa2\xaf\xcf\xa6\xa5\xcd\xf8\xae\x75\x10\x6a\x9b\x92\xcf\xbf\xe1\
-\x68\xf1\xc3\xcb\x01\x39\xc1\x3a\x4b\x6d\xa2\xc8\x78\x6b\xe5\x93\
-\x3b\xad\x73\xd4\xd5\x63\xc0\xc4\x1f\x00\x30\xbd\xa9\xd3\xf3\x64\
-\xbe\x65\xfb\xf5\x89\xe1\x99\x36\xf2\xe2\xc1\xbe\xe2\xa0\x05\x80\
-\x8a\x1e\xf4\x21\xb1\xa2\xd0\xa1\xa9\xa9\xc1\xc6\xd7\x29\xc4\x51\
-\xde\x92\xc9\x05\x00\x2a\x0d\x23\x78\x61\x91\x9b\x0c\xdb\x6f\x50\
-\xde\xa2\x8c\xa7\xc4\xb1\x3b\xef\x15\xe8\xb5\xc7\x0b\xbf\x78\xe9\
-\xb5\x33\xbf\x63\x9d\x85\xda\x96\xd3\x7f\x72\xe3\x11\x52\xb3\xe7\
-\x1f\x30\xdc\xcb\x1e\x89\xaa\xfe\xa3\xb4\x28\x3b\xc7\x3a\x47\x64\
-\xfe\xcd\xb0\x3d\x16\xb9\xa2\xb8\x20\x6b\xad\x61\xfb\x07\xe8\xd3\
-\x27\x3d\x11\xaa\x17\x9b\x05\xf0\x0e\xfe\xf2\x7e\xf0\x02\x60\x47\
-\x55\x21\xec\x0e\x22\x39\xfa\x88\x13\xbb\xfc\xcc\xa8\xed\x08\x44\
-\x45\x31\xdf\x34\x01\x30\xce\xd5\xb7\x5a\x41\x68\x22\x00\xb7\xde\
-\x4c\x04\x3f\xf2\x77\x87\x96\x1f\x6a\x67\x04\x50\xec\xf4\xe9\x93\
-\xde\x29\xb1\xfd\xae\x7c\x40\x7e\x6c\x9d\xa5\x8e\x2a\x5f\xfd\x1b\
-\xac\x43\x44\x72\x46\xbf\x5f\x1f\x05\x60\x8c\x71\x8c\x47\xe1\xcc\
-\xb6\x64\xa0\xaa\xb3\x3f\x08\x76\x6b\xc6\x76\x6f\xdf\xd3\xe5\xa0\
-\xc5\xd0\x41\x0b\x80\xfc\xfc\x60\x95\x02\xaf\x46\x27\x53\x0b\xa8\
-\xff\x0b\xb3\xb6\x23\x08\xfb\x81\xf9\xb0\x3d\xca\xb4\xf3\x1e\x2f\
-\xec\xdc\xc1\x40\x00\xb0\x34\xe7\xb7\xef\xc1\xc1\x53\xc9\x00\xfc\
-\xb4\x3a\x50\xf5\x37\x97\x46\x93\xc8\x4d\xa9\xa9\xc1\x84\xaa\xce\
-\xfa\x0c\x20\x8e\x5d\x4a\x06\xa8\xe0\x4e\x97\x6e\xb7\xab\x2d\x1c\
-\xa8\xf9\x35\x6c\xd7\x49\x84\xfc\x70\xf8\x49\xc3\xf6\xeb\x51\xf5\
-\x0c\xfb\x2e\x5d\xfb\xe1\xab\x33\x0f\x7a\x4e\x48\x53\x87\x6b\xfe\
-\xd1\xca\x34\xad\x20\x97\xbb\xf4\xc1\xfd\x6c\xee\xad\x1f\xa9\x1a\
-\xdf\x32\x25\xb8\x25\x2d\x6d\x86\xd9\x1d\xdb\x8d\xd9\xb6\x65\xe7\
-\x4c\x00\xaf\x5b\xe7\xa8\x4b\x81\x57\x5c\xda\x1b\x4c\x6e\xda\xf7\
-\x3b\xf2\x92\x75\x8e\xba\x54\xb0\xfe\x04\xe9\xf6\x80\x75\x8e\x48\
-\x4e\x4d\xbd\xb6\x83\xaa\x98\x8e\x4c\x28\xf0\x5c\xf9\xda\x47\x3f\
-\xb6\xcc\x50\x5b\x9f\x3e\xe9\x89\x22\x3a\xdc\xaa\x7d\x85\xb7\xa2\
-\x29\x5f\xd7\xa4\x02\xc0\x0b\x04\x9e\x6b\x5d\x9c\x56\x39\xa6\xcb\
-\x09\x5d\xad\x8e\x51\x8c\x48\x20\x8f\x18\x47\x38\xb1\x3a\x10\x9e\
-\x60\x9c\x21\xa2\x82\x82\x60\xc8\xf3\x24\x1d\x80\x4b\x9d\x6d\x30\
-\x2f\x27\xc3\xc5\x91\x09\x72\x50\x69\x61\xf6\x54\x85\x06\xad\x73\
-\xd4\x52\xe3\xa9\xff\x2b\x57\x0b\xd8\x0e\x7e\xbb\x1b\x00\x9c\x64\
-\x99\xc1\x53\x7d\xd4\xb2\xfd\xba\x76\x77\x95\xf3\x01\x98\x4d\xd5\
-\x26\xc0\x6f\x52\x9f\xdd\xa4\x02\x60\xd9\x82\x5b\xdf\x16\x60\x73\
-\xeb\x22\xb5\x9c\x87\xb0\x53\xd3\x00\xdb\xb6\xec\xc8\xc3\xde\x83\
-\x52\xcc\x28\xf0\x5b\x17\x8f\x07\x06\x80\xa5\x0b\x27\xad\x13\x15\
-\x57\xf6\x28\xb3\xf3\xa7\x66\x2b\x2b\x9c\x77\x37\xf6\x1e\x75\xed\
-\x00\xb9\xbb\xa4\xf0\x91\x37\xac\x53\x44\xd2\x7b\xf0\x35\x9d\x05\
-\x9a\x61\x1c\x63\x4b\xc7\x2a\xcf\xf2\x25\xb5\x1e\xdf\xf7\x2d\x4f\
-\x8c\x7c\x77\x43\xe1\xbc\xd2\xa6\x7c\x61\x93\x57\x6c\x2a\xb4\x49\
-\x43\x0a\xb1\x21\x57\xb8\x34\x0d\x50\x50\x10\x0c\x41\x75\x81\x71\
-\x8c\x13\xd0\xa5\x73\xba\x71\x86\x06\x9d\xd9\x63\xc7\x9f\x01\x58\
-\x5f\x52\xc2\xce\x9f\x5a\xac\xb4\x30\x7b\x2a\x8c\x8b\x00\x01\xd6\
-\x96\x1e\xff\xd5\x5f\x2d\x33\x34\xa6\x66\x57\xfb\xeb\x01\x1c\x6f\
-\x1a\x42\xf1\xf8\xba\x75\x59\xce\x9c\x5f\xb1\xaf\xaf\x1a\x66\x97\
-\x40\x9a\x5c\x0c\x35\x63\xcb\x46\xc0\xb0\x00\xc0\xb1\x47\x1c\xd7\
-\xb1\xbf\x61\xfb\xf5\xf9\x9a\x0d\xe3\x15\xa7\xa2\x98\xe2\xea\x28\
-\x40\x30\x18\xf4\x35\x8c\x5f\x21\x3e\xe7\xd3\x47\x8c\xc0\xce\x9f\
-\x5a\xcb\xb8\x08\xf8\xda\xf7\x02\x57\x23\x37\xd7\x72\xd1\x71\x83\
-\x52\x52\xaf\xef\x02\x11\xeb\xb7\x7f\x5f\x15\xd6\x53\xb2\x07\xf8\
-\xd4\xff\x78\x20\x80\x63\xcc\x02\x28\x9a\xdc\x57\x37\xb9\x00\xd8\
-\x9d\xe8\xbf\x08\xc3\xdb\xc7\x44\x2c\x57\x54\xd6\x97\x97\x3b\xa5\
-\x1c\x80\xf5\xb0\xd3\x09\xd2\xa9\xf3\x75\xc6\x19\x1a\x94\x9f\x9b\
-\xf1\xae\x42\xff\xdb\xa0\x69\x76\xfe\x14\x35\x56\x45\x80\x00\x37\
-\x94\x15\x3c\xfc\x5e\xbc\xdb\x6d\x2a\xdf\xaf\xb9\x01\xc0\xb1\x96\
-\x19\x04\xba\xbc\x6c\x4d\x76\x85\x65\x86\xba\x44\xd5\xb2\xaf\xaa\
-\xea\x54\x85\x26\x1f\xc5\xdc\xe4\x02\x60\xe5\x93\x19\x3b\x01\x5d\
-\xd5\xb2\x4c\xad\xa7\xa2\x57\xa4\xa5\x2d\x09\x58\xb5\x1f\x89\x0f\
-\x6f\xa6\x75\x06\x08\x7e\xeb\xf2\x1e\xf7\xfc\x9c\xc9\xf3\x21\x12\
-\xcf\xcb\x39\xd8\xf9\x53\xd4\xc5\x7d\x61\xa0\x62\x51\x49\x61\xb6\
-\xf5\x34\x63\x83\x7a\x0f\xbe\xa6\xb3\x02\xb7\x5a\xe7\x08\x8b\x03\
-\x9f\xc1\xb5\xa5\xa5\x05\x20\xb8\xd4\x30\xc1\xf3\xeb\xd6\x65\x55\
-\x35\xf5\x8b\x9b\x75\x6a\x93\x02\xcf\x34\x3f\x4f\xb4\xc8\xf1\xbb\
-\x02\x1f\xa4\xda\xb5\x5f\xdf\xb3\x39\xb7\xbd\x08\x60\xbd\x71\x8c\
-\x63\xf6\x04\x76\x59\x9f\xbf\xdd\xb8\x9d\xe1\x71\x0a\x34\x69\x51\
-\x4a\x2b\xb1\xf3\xa7\x98\x89\xdb\xc2\x40\x91\xf2\x9a\xea\x0e\xce\
-\x8e\xec\x01\x40\x68\x77\xc7\x0c\x01\x8e\x33\x8e\xf1\x66\xf9\xea\
-\x2c\xcb\x8b\x87\xea\x49\xf9\xfc\xbb\x83\x60\x3a\x2a\xa2\xcd\xba\
-\x05\xb5\x59\x05\x40\x42\xbb\x50\x3e\x0c\xb7\x77\x09\xfc\xb1\x56\
-\x6d\x37\x44\xa1\xb3\xac\x33\x00\x3a\x65\xd8\xc8\xa9\xa6\xdb\x70\
-\x1a\x93\x97\x37\x65\xbb\x84\xfd\xcb\x10\xdb\xf5\x00\xec\xfc\x29\
-\xe6\xe2\x30\x1d\xb0\xc3\xf3\xe5\xf2\xca\xd7\x1e\xb4\x5a\x3b\x73\
-\x50\xdd\x07\x5e\xd7\x4d\xa1\x93\xac\x73\x40\xe0\xdc\x85\x48\x61\
-\xf5\x2d\x0f\x69\xab\x49\xf0\x13\xf3\x9b\xf3\x0d\xcd\x2a\x00\x9e\
-\x79\xe2\x8e\x2f\x21\x62\x76\x1d\xad\x00\x97\x5f\x3c\xfa\x5e\xb3\
-\xeb\x78\x23\xe9\x10\xae\x5a\x08\xe0\x13\xe3\x18\x5d\x54\xbc\x3f\
-\x1b\x67\x68\x54\x5e\xee\x94\x72\x81\xc6\x6a\xd7\x02\x3b\x7f\x8a\
-\x9b\x18\x16\x01\x2a\x22\x63\x8b\x8b\xe6\x96\xc4\xe0\xd9\x51\xe3\
-\x85\xc2\x53\x61\x7f\x3b\xe2\xc7\xde\x17\x5b\x17\x1b\x67\x38\x40\
-\xf2\xf9\x37\x1c\x2d\x6a\x7a\x19\x52\xc1\xdb\x6b\xe6\x7c\xd5\x9c\
-\x6f\x68\xf6\xc5\x0d\x0a\xdf\x70\x1a\x00\x1d\x12\xfc\xc0\x68\xc3\
-\xf6\xeb\xc9\xcd\x0d\x56\x03\x98\x63\x9d\x43\x14\x63\x86\x8d\x9c\
-\xea\xda\xd9\xe5\x07\x58\x96\x33\x79\xb1\x42\xa3\x3d\x67\xc7\xce\
-\x9f\xe2\x2e\x26\x45\x80\x48\x66\xc9\xea\xac\x78\xae\x97\x69\xb6\
-\x9e\xfd\xd2\x7f\x22\x80\xf9\x67\xb0\x2a\xfe\xc7\xa5\x6b\x7f\x01\
-\x40\xaa\x6b\x7e\x09\xa0\xbd\x5d\x00\x69\x76\xdf\xdc\xec\x02\xc0\
-\xd3\xc0\x52\x18\x6e\x7f\x53\x95\xf1\x56\x6d\x37\xa4\x7d\x38\x30\
-\x1b\x40\x93\x17\x5e\xc4\x88\x07\x78\xf7\x03\x6a\x74\xf7\x74\xd3\
-\x9c\x78\xc4\x91\x53\x20\x28\x8c\xd2\xe3\xd8\xf9\x93\x99\xa8\x2e\
-\x0c\x54\x14\x1c\x2f\x27\xb9\x76\xa5\x76\x5d\xa2\xa2\x99\x30\xbb\
-\xdf\xfe\x1b\x55\x68\xd7\x2e\xcb\x38\x43\x7d\xa2\xbf\x32\x6c\xdd\
-\x87\x8f\x66\xcd\xff\x03\x2d\x28\x00\x96\xe5\xdc\xf6\x01\x00\xbb\
-\x2b\x17\x05\x3f\x1a\x36\xf2\xbe\x33\xcd\xda\x8f\x20\x37\xf7\xd6\
-\x7f\x03\xfa\x94\x75\x0e\x00\x3f\x1d\x3a\x6a\xfa\xe5\xd6\x21\x1a\
-\x93\x95\x35\xb1\x26\x90\x58\x73\x39\x80\xd6\x6e\xdd\x61\xe7\x4f\
-\xe6\xa2\xb2\x30\x50\xb1\xb1\x06\xa1\x2b\x5d\x3d\xea\x77\xbf\x1e\
-\x03\xc6\x5f\x09\x41\x3f\xeb\x1c\x50\x7d\xbc\xec\xc5\xd9\x5f\x5a\
-\xc7\xa8\x2d\xa5\xff\xb8\xff\x02\x70\x86\x55\xfb\x02\xac\x2e\x2d\
-\xca\x6a\xf6\x54\x74\xcb\xee\x6e\x56\x18\xcf\xbd\xa8\x73\xb7\xe1\
-\x79\x8a\x69\x00\xcc\x4f\xa3\x12\xc5\xb4\x21\x43\x1e\xb0\x1b\x86\
-\x6a\x82\x67\x9e\xb8\xe3\xcb\xb0\x97\x30\x04\xc0\x67\x2d\x7c\x04\
-\x3b\x7f\x72\x46\xeb\xa6\x03\xf4\x4b\x88\x37\xa4\xb2\xe8\xb1\xcf\
-\xa3\x1a\x2a\xca\xbe\x77\xee\x2d\x1d\xa1\x32\xd5\x3a\x07\x80\x1a\
-\x0d\x24\x4c\xb3\x0e\x51\x57\x58\x3c\xe3\x05\xea\xd2\xa2\x3e\xb9\
-\x45\x05\x40\x8d\x5f\xb3\x18\xa6\x97\xbd\xe8\xd5\xae\x9d\x80\xb7\
-\x74\xf1\xe4\x8d\x80\x38\x70\x1d\xa5\x9c\x96\x78\xe4\x1e\x47\xce\
-\x30\x6f\xd8\xf2\x85\xb7\x6c\xf2\x3c\x7f\x28\x9a\x3f\x75\xc2\xce\
-\x9f\x9c\xd3\xc2\x22\x60\xb7\x42\x86\x95\x16\xce\x7d\x27\x16\x99\
-\xa2\xa9\x6b\xe2\xf6\xdf\x41\x70\x8a\x75\x0e\x81\x3c\xe6\xda\xe1\
-\x48\xdf\x3b\xf7\x96\x8e\x02\x8c\x30\x8c\x10\x4a\x08\x79\x2d\x5a\
-\x9b\xd7\xa2\x02\x60\x45\xee\x1d\x9f\x03\x6a\xb9\xff\xf2\x48\xe9\
-\xd4\xe5\x32\xc3\xf6\x23\x0a\x79\xf8\x23\x00\x17\x16\xa6\xdc\x31\
-\x3c\x2d\xb3\xa7\x75\x88\x83\x59\xba\x70\xca\xbf\xa0\x7a\x2d\x00\
-\xbf\x89\xdf\xc2\xce\x9f\x9c\xd5\xcc\x22\x40\x15\x32\xae\xac\x30\
-\xfb\x95\x58\x66\x8a\x86\x1e\xa9\xe3\x7a\x01\xe6\x47\xfe\x02\x40\
-\x4d\x18\xbe\x73\xf7\x22\x74\x4d\xdc\x9e\x06\xe0\x3b\x86\x11\x56\
-\xbd\xf5\xca\xc3\x2d\x1a\x4d\x6d\xd9\x14\x00\x00\x6d\xe1\x90\x43\
-\xd4\x78\x70\x6e\x1a\xe0\xb9\x85\x93\x36\xab\xea\x13\xd6\x39\x00\
-\xb4\xd3\x80\xff\x48\x30\x18\x6c\xf1\x7f\xdf\x78\xc9\x5b\x3c\x39\
-\x17\xda\xa4\x0f\x4d\x76\xfe\xe4\xbc\xa6\x2e\x0c\x54\xc1\xa4\xb2\
-\xc2\xac\x85\x71\x88\xd4\x4a\x41\x4f\x7c\xef\x61\x00\xed\xac\x93\
-\x00\x78\xa4\xbc\x70\xde\xbb\xd6\x21\x22\x30\xed\x8b\x5a\xd3\x17\
-\xb7\xb8\x83\xf0\xbd\xd0\xdf\x01\xec\x6e\xe9\xf7\xb7\x9a\x6a\xea\
-\x25\xa3\xa7\xfd\xc0\xac\xfd\x86\xf8\xfe\x9f\xe0\xc4\x28\x80\x9c\
-\xf3\x46\x79\xe7\x09\xd6\x29\x9a\x22\x6f\x71\xc6\x74\x15\xfc\xa5\
-\x91\x2f\x61\xe7\x4f\x6d\xc6\xc1\x16\x06\x8a\xe2\x8f\x65\xab\xb3\
-\x9d\x3b\xc4\x26\x92\xe4\xfe\x1f\x5f\xaf\x40\x5f\xeb\x1c\x00\xaa\
-\xd5\x0b\xb8\xb0\x06\xe1\x00\x49\x7d\xc7\x26\x01\x62\x79\x51\xdd\
-\xae\xea\x76\xcd\x5f\xfd\xbf\x5f\x8b\x0b\x80\xe5\x0b\x7f\xfb\x15\
-\x44\x9a\x75\xea\x50\x94\x89\xe7\xcb\x4d\x86\xed\x47\x94\x9f\x7b\
-\xfb\xfb\xaa\x78\xcc\x3a\x07\x00\xa8\x62\xda\x25\x69\x33\xba\x59\
-\xe7\x68\x8a\xfc\x45\x19\xbf\x17\x20\x33\xc2\xbf\x62\xe7\x4f\x6d\
-\x4e\x43\xd3\x01\xaa\x78\xb0\xa4\x28\xfb\x2e\x83\x48\xcd\x96\xd4\
-\x77\xec\x49\x22\xfa\x27\xeb\x1c\x7b\x49\xb6\x6b\x73\xff\x00\xe0\
-\x05\x02\x37\xc3\x72\x5b\xa4\x62\xe9\xa6\x17\xb2\xbe\x6e\xe9\xb7\
-\xb7\x6e\x88\x58\xf5\xf1\x56\x7d\x7f\xeb\x8d\xbd\xec\x97\xf7\x1c\
-\x6d\x9c\xa1\x1e\x4f\xbc\xbf\x00\xd8\x63\x9d\x03\xc0\x11\x01\x2f\
-\x7c\xbf\x75\x88\xa6\x5a\x96\x33\x69\x32\xa0\xb5\xf7\xf7\xb2\xf3\
-\xa7\x36\xab\x6e\x11\x20\x82\xf9\x65\x45\xd9\x16\xb7\x63\xb6\x88\
-\x97\x10\x98\x0d\xdb\xb9\xed\xfd\xf6\xd4\x78\xee\xcd\xfd\xa7\x9c\
-\x3b\xee\xbb\x00\xae\xb1\xcc\xa0\x40\xab\xfa\xe0\x56\x15\x00\xdb\
-\x3e\xdd\xf9\x3c\x80\x4f\x5b\xf3\x8c\x56\xea\x14\xaa\x4e\x74\xee\
-\x60\xa0\x7d\x67\x25\x3c\x6a\x9d\x03\x00\x54\x70\xc5\xf0\x91\xd3\
-\x9d\x5b\x30\x19\x99\xe8\x59\xc9\x55\xbf\x56\x60\x21\xd8\xf9\xd3\
-\x21\x60\x7f\x11\x20\xc0\xdf\x4a\x8e\xdb\x3a\x1e\x86\x87\xa8\x35\
-\x47\x4a\xff\xf1\xbf\x80\x9a\xde\x6a\xf7\x0d\x01\xb2\x2b\x0b\xe6\
-\x7d\x68\x9d\xa3\x2e\x3f\x31\xf0\x6b\xd8\x1e\x89\xfc\x71\xd9\x09\
-\x5b\x5f\x68\xcd\x03\x5a\x3d\x74\x31\x6c\xd4\xf4\xfb\xa0\xa6\xd7\
-\x42\x7e\xd4\x3e\xbc\xf3\xb4\x7d\x47\xf2\x3a\xe3\x92\xb4\x19\xdd\
-\xbc\x40\xb8\x1c\xf6\x67\x66\x03\xc0\xe7\xa1\xb0\xf6\x7e\x2e\x77\
-\xb2\x65\xb1\xd6\x64\xc1\x60\xd0\x0b\x06\x83\x4d\xdd\x19\x40\xd4\
-\x06\x04\x3d\xa0\x6d\xfc\x4e\x27\xf5\x1d\x7b\x92\x17\x08\xac\x07\
-\x70\x8c\x75\x16\x00\x3b\xa0\xd2\xbd\x25\x87\xdc\xc4\x52\x9f\x3e\
-\xe9\x89\x3b\x3b\xeb\x26\x01\xbe\x67\x16\x42\x31\xad\xb4\x28\x7b\
-\x4a\x6b\x1e\xd1\xea\x55\xe2\x61\xdf\x7c\xbe\xbb\x5b\x75\xa0\xf3\
-\x2f\x8c\x33\xd4\xf3\x6c\xee\xad\x1f\x89\x8a\x2b\x07\x56\x1c\x9b\
-\xe0\xc9\x7c\xd7\x8f\x09\xde\x8f\x9d\x3f\x1d\x7a\xda\xcc\xef\xb4\
-\x78\x81\x40\x36\xdc\xe8\xfc\x21\xa2\xf7\xba\xd6\xf9\x03\xc0\xce\
-\xce\x18\x6d\xda\xf9\x03\x50\x91\x56\x9f\x3e\xdb\xea\x02\x60\xf9\
-\xe2\x8c\x0d\x00\xfe\xaf\xb5\xcf\x69\x0d\x05\x6e\xb1\x6c\xbf\x21\
-\xed\x7c\x6f\xba\x00\x9b\xad\x73\x00\x00\x04\x17\x0c\x1f\x39\xfd\
-\x7a\xeb\x18\x44\xe4\xae\x1e\xfd\xc7\xff\x37\x80\x8b\xac\x73\xec\
-\x25\x1f\x74\xdc\xe1\x39\x70\xdd\x7a\x7d\x02\xbd\xd9\x38\xc2\x6b\
-\x65\x85\x59\x6f\xb7\xf6\x21\xd1\xda\x27\x6e\x7d\x31\xc3\x8f\x87\
-\x5d\x99\x39\xc0\x38\x43\x3d\xb9\xb9\xb7\xee\x52\x95\xdf\x59\xe7\
-\xd8\x4f\x21\x99\xc3\xaf\x9a\x61\x76\x5e\x35\x11\xb9\xab\x67\xdf\
-\x09\x29\x10\xb9\xc7\x3a\xc7\xb7\xfc\x8c\x75\xeb\xb2\xac\x2f\x59\
-\xab\xa7\x67\xff\x89\xe7\x03\xf8\x91\x65\x06\x89\x52\x9f\x1b\x95\
-\x02\xa0\x7d\xb8\xd3\x22\x00\xdb\xa2\xf1\xac\x96\x12\xf1\x9d\x1c\
-\x05\xc8\x5b\x7c\xdb\x42\x58\x5e\x9e\x74\xa0\x0e\x1a\x0e\x3f\x9e\
-\x96\x16\x74\xe1\x50\x0f\x22\x72\xc4\xe9\x43\x6e\x6c\xef\x27\x60\
-\x01\x80\x8e\xd6\x59\xf6\xf9\x67\x69\xe1\xbc\x25\xd6\x21\x22\x51\
-\xfb\xbe\xe6\xeb\x84\x0e\xbb\xa3\x72\x10\x5f\x54\x0a\x80\xdc\xdc\
-\x1b\x76\x00\x6a\x7a\xaa\x95\x8a\x0c\x1b\x96\x36\xe3\x74\xcb\x0c\
-\x91\x89\xaa\x7a\x93\xe0\xce\xea\xdf\x33\xf7\x78\x5d\x1c\xd9\xdb\
-\x4b\x44\x2e\x48\xdc\xb9\xe7\xaf\xa2\xf8\xa1\x75\x8e\x7d\xd4\x57\
-\xdf\xa5\xcf\xcc\x6f\x24\xf7\x9b\xd0\x1d\xc0\x10\xe3\x18\x0b\xde\
-\x5a\xf9\xe4\xce\x68\x3c\x28\x8a\x47\xc5\x06\xac\xa7\x01\x3c\x04\
-\x7c\xeb\x79\x99\x88\xf2\x17\xdf\xf6\x4f\x88\xf5\x0d\x8a\xb5\x88\
-\x4e\x1a\x3a\x22\xd3\xfa\x97\x98\x88\x1c\x90\x7c\xde\xb8\xa1\x80\
-\x3a\x73\x3e\x81\x02\x0b\xcb\x8b\x1e\x71\x65\xd4\xf4\x00\x9e\x27\
-\xb7\x21\xaa\xfd\x66\x4b\x32\x20\x3b\x6a\xcf\x8a\xd6\x83\xf2\x72\
-\x6e\x7b\x43\x21\xff\x8a\xd6\xf3\x5a\x46\xc7\x5d\x7e\xd5\x54\xd3\
-\x95\x99\x0d\x49\xf0\xfc\x0c\x34\xff\xe6\xbb\x58\xf1\x44\x74\xc1\
-\xc5\xa3\x67\x9e\x66\x1d\x84\x88\xec\xa4\xa4\x8e\x3b\x5d\xd4\x7b\
-\x02\x96\xa7\xd9\x1d\x68\x57\xc0\x97\x3b\xac\x43\x44\xd2\x63\xe0\
-\xb8\x53\x14\x7a\xad\x71\x8c\x7f\x15\x17\x64\xbf\x19\xad\x87\x45\
-\xb5\x92\x11\xc1\x43\xd1\x7c\x5e\x0b\x74\x08\x85\x03\x4e\x5e\x85\
-\xfb\xf7\x05\x53\x3e\x04\x30\xdd\x3a\x47\x2d\x47\x05\xfc\xd0\xd3\
-\x69\x69\x33\x5c\x99\xf3\x23\xa2\x38\xea\xd3\x27\xbd\x93\xef\x7b\
-\x7f\x83\x1b\xa7\xfd\xed\xa5\x72\x6f\xf1\x9a\xac\xf7\xad\x63\x44\
-\x54\xe3\xfd\x0e\xe6\x97\x22\xe9\xec\x68\x3e\x2d\xaa\x05\x40\xcd\
-\xd6\x76\x39\x80\x6e\x89\xe6\x33\x9b\x4f\x27\x5c\x3a\xf2\xde\x53\
-\x6d\x33\x44\x56\xf3\x75\xfb\x7b\x21\x28\xb1\xce\x51\xcb\x99\x7b\
-\x02\x61\xeb\xa9\x1b\x22\x32\xb0\xab\x8b\xce\x06\xd0\xdb\x3a\xc7\
-\x37\x44\xca\x6b\xba\xb4\x77\xe5\xec\x94\x03\xf4\x18\x38\xee\x14\
-\x08\xc6\x58\x66\x50\xe0\xb3\x5d\x5e\x28\xaa\x0b\x23\xa3\x5a\x00\
-\xac\x58\x71\xd3\x1e\x20\x7a\xf3\x13\x2d\xd4\xce\x47\xa0\x55\xa7\
-\x23\xc5\xca\x8a\x15\x37\xed\x11\xd5\xeb\xe0\xd6\xe2\x96\xab\x87\
-\x8d\xcc\xbc\xce\x3a\x04\x11\xc5\x4f\x72\xff\xf4\xdf\xa8\xe2\x5a\
-\xeb\x1c\xb5\xf8\x9e\x60\x7c\xe5\x8a\x07\x5d\xb8\x43\xa5\xbe\x90\
-\x77\x27\x8c\xdf\xfe\x3d\xc8\x9c\xf7\x0a\xe6\x47\xf5\x06\xde\x18\
-\x2c\x66\xd0\x39\x00\x6a\xa2\xff\xdc\xe6\x90\x71\x43\xd3\xa6\xff\
-\x87\x6d\x86\xc8\x96\xe5\x4c\x2e\x02\x30\xcf\x3a\xc7\x81\xf4\x81\
-\x61\x57\x4e\x73\xe1\xca\x4f\x22\x8a\xb1\x1e\xa9\xe3\xcf\x11\xd1\
-\xfb\xac\x73\xd4\x91\x55\x5c\x90\xb5\xc6\x3a\x44\x24\xc9\xa9\xd7\
-\x9d\x0a\xe3\x4b\x7f\x00\xd4\x84\x12\xbc\xa8\xbf\x5c\x47\xbd\x00\
-\xc8\xcb\x99\xf2\x31\x04\x7f\x8b\xf6\x73\x9b\x29\x51\x02\xea\xe4\
-\x5a\x00\x00\xf0\x3a\x24\x4c\x06\xe0\xd2\xf1\x96\x89\xf0\x64\xd1\
-\xe5\x57\xcf\x3c\xd1\x3a\x08\x11\xc5\x4e\x52\xdf\xb1\x27\xc1\x97\
-\xa7\x61\x3e\x97\x7d\x80\x8f\xf7\xb4\x13\x77\x3f\xaf\x35\x7c\x17\
-\x8c\x7f\x5e\x0a\x2c\xa9\x78\xe9\xe1\x8f\xa2\xfd\xdc\x98\x6c\x67\
-\xf0\x81\x07\x62\xf1\xdc\xe6\x91\x5f\xb9\x3a\x0a\xb0\x74\xfe\x2d\
-\x5b\xa1\xee\x6c\xbb\xd9\xe7\xfb\xa1\x50\xe8\xd9\xb4\xb4\xd9\x5d\
-\xac\x83\x10\x51\xf4\xf5\xe9\x93\xde\xc9\x0b\x04\x9e\x01\xd0\xcd\
-\x3a\x4b\x6d\xaa\xb8\xa9\x35\x77\xda\xc7\x52\x4a\xea\xb8\xd3\x55\
-\x71\xb5\x75\x0e\xcf\x97\x07\x63\xf2\xdc\x58\x3c\xf4\xd9\x45\x19\
-\xaf\x02\x78\x25\x16\xcf\x6e\x86\x44\x09\xc0\x99\x63\x78\xeb\xca\
-\x5b\x3c\x39\x17\xc0\x32\xeb\x1c\x75\x9c\xb5\xdb\xab\x5a\x9c\x96\
-\xb6\x24\x60\x1d\x84\x88\xa2\x28\x2d\x2d\xdd\x94\x3a\x78\x00\x00\
-\x13\x2c\x49\x44\x41\x54\x50\xd5\x59\x17\x02\xf8\x2f\xeb\x28\x75\
-\x3c\x57\x56\x94\x6d\x3d\x62\xdc\x20\xdf\xf7\xee\x04\x90\x60\x9b\
-\x42\x0b\x4b\xd6\x64\xbd\x16\x8b\x27\xc7\xec\x40\x03\x15\x71\x61\
-\xcb\xdb\x2f\x5d\xde\xeb\x2e\xf0\x6e\x84\x60\xbb\x75\x8e\xda\x44\
-\x70\xd1\x6e\x6f\x73\x54\xb7\x9a\x10\x91\xad\x9e\x5b\xbe\x33\x0b\
-\xc0\x70\xeb\x1c\x75\x6c\x0f\x20\xe4\xec\x02\xe4\x94\xd4\x71\xa7\
-\x03\x18\x6d\x9d\x43\xfd\xd8\xf5\xa5\x31\x2b\x00\xfa\x24\xed\xc8\
-\x83\xa0\x3c\x56\xcf\x6f\xa2\xc4\x80\x1f\xba\xdb\x38\x43\x83\x96\
-\xe5\xdc\xf6\x01\x54\x26\x5b\xe7\xa8\x4b\x04\x13\x87\x8d\xc8\x74\
-\x6d\x8a\x82\x88\x5a\x20\xf9\xbc\x09\xb7\x2a\xf0\x1b\xeb\x1c\x75\
-\x09\x24\x63\x43\xe1\x63\x1f\x58\xe7\x68\x88\xaf\xde\x9f\x60\xfe\
-\xf6\x8f\xd2\xb2\x35\xd9\xcb\x63\xf5\xf0\x98\x15\x00\xc1\x60\xd0\
-\x87\xca\x8c\x58\x3d\xbf\x19\xae\xba\x74\xf4\x54\xd7\x86\xbd\xbe\
-\x91\x97\x33\xe9\x61\x55\xe4\x5b\xe7\xa8\x47\x74\xc6\xd0\x51\x99\
-\x97\x5a\xc7\x20\xa2\x96\x4b\xee\x37\xe1\x12\x51\xb8\xb8\xb7\x7e\
-\x45\x49\x61\x96\xb3\x67\x90\xf4\x48\x1d\x7f\x0e\x14\x23\xac\x73\
-\x08\x90\x89\x18\x6e\x1b\x8f\xe9\x99\xc6\x35\x5f\xb7\x7b\x1c\xf6\
-\xab\xdd\x45\x7d\x6f\x16\xa0\xae\x1c\x75\x59\x4f\x42\x3b\x8c\xb7\
-\x3f\x40\xa9\x1e\x4f\x54\x9f\x1a\x3e\x72\xfa\x4f\xac\x83\x10\x51\
-\xf3\x25\x9f\x37\xf1\x5c\xf1\xb0\x18\x80\x6b\x6b\x7a\xb6\x24\x86\
-\x02\xd7\xc2\xad\xf3\x50\x6a\x13\xf1\x25\x13\xf6\xc7\x23\x6f\xa9\
-\xf2\x6a\x62\x7a\xc9\x5e\x4c\x0b\x80\x15\x2b\x6e\xda\x03\x41\x4c\
-\x56\x2f\x36\x87\x02\xe7\x0e\x1d\x95\x99\x66\x9d\xa3\x21\xcf\x3c\
-\x99\xf1\x19\x04\xd7\xc2\xbd\x3f\x88\xce\x0a\x3c\x3f\x74\xc4\xb4\
-\xb3\xac\x83\x10\x51\xd3\x25\xf5\x1f\xdf\x5b\xd4\x7f\x16\x40\x27\
-\xeb\x2c\x75\xa8\xfa\x18\xff\xd6\x2b\x0f\x7f\x66\x1d\xa4\x21\xc9\
-\x03\xd2\x47\x29\x60\x7f\x2e\x8a\xc8\x8c\x68\x1f\xfc\x53\x57\xcc\
-\x6f\x35\xaa\xf1\xda\xcf\x06\xf0\x55\xac\xdb\x39\x18\x51\x64\x0e\
-\x1d\x1a\x74\xed\x8f\xe1\x1b\x79\x8b\x26\xff\x03\xc0\xc3\xd6\x39\
-\x22\x38\x52\x44\xfe\x31\x3c\x2d\xb3\xa7\x75\x10\x22\x3a\xb8\xe4\
-\x7e\x13\xba\x7b\x22\x2b\x01\x7c\xd7\x3a\x4b\x7d\xf2\x50\xd9\x9a\
-\xec\x67\xad\x53\x34\xe4\x7b\xe7\xde\xd2\x51\x54\xef\xb1\xce\x01\
-\xe8\x97\x7e\x28\x34\x27\xd6\xad\xc4\xbc\x00\x58\xb1\xe0\xa6\x6d\
-\x70\xe2\x5c\x00\x7c\x5f\xba\x74\x76\x7a\x61\xdb\xb6\x0e\x3b\x6f\
-\x15\x60\x83\x75\x8e\x08\x8e\xd5\x80\xae\x74\x79\x47\x05\x11\x01\
-\x29\xfd\xd2\x4f\x16\x0f\xab\x00\x1c\x6f\x9d\x25\x82\xd2\x4e\x3b\
-\xe1\xdc\xa2\xe7\xda\xba\xb4\xdb\x91\x01\xc1\x29\xd6\x39\x00\x6f\
-\x66\xf9\xda\x47\x63\xbe\x43\x2c\x2e\xf7\x1a\xb7\x0f\x87\x67\x42\
-\xb1\x35\x1e\x6d\x35\x4a\x71\x87\xcb\xa7\xdd\x15\xcc\x0f\xee\xf6\
-\x55\xc7\x00\xa8\xb6\xce\x12\x41\xb7\x80\x1f\x7a\xf9\xa2\xd1\x99\
-\x0e\xfc\x71\x10\x51\x5d\xdd\x07\x5e\xd7\xcd\xf7\xb4\x00\xc0\xc9\
-\xd6\x59\x22\xa8\xf1\x04\x63\xd6\xad\xcb\x72\xe5\x4a\xf4\x7a\xba\
-\x0f\xbc\xae\x9b\xa8\x13\x05\xca\xd7\xed\xbd\xea\xb8\x6c\xc5\x8e\
-\x4b\x01\x90\x9b\x7b\xfb\xd7\x10\xc4\x7c\x38\xa3\x09\xba\xd4\xd4\
-\xd4\xfc\xd1\x3a\x44\x63\xf2\x17\x4f\x7e\x5d\x54\xef\xb2\xce\xd1\
-\x80\x93\x13\x7c\xfd\xc7\x65\xd7\x4c\x3f\xce\x3a\x08\x11\x7d\xab\
-\xf7\x4f\xaf\x3b\x2e\x21\x14\x7e\x01\x80\x93\xa7\x9f\x42\xe4\xf7\
-\xc5\xab\xb3\xff\xd7\x3a\x46\x63\x02\xa1\xf0\x3d\x00\x3a\x5b\xe7\
-\x10\xc8\xac\x37\x0b\xe6\xc7\xe5\x85\x39\x2e\x05\x00\x00\xa8\xc8\
-\x0c\x00\x3b\xe3\xd5\x5e\x43\x44\xe4\x57\x97\x8c\xb8\xef\x87\xd6\
-\x39\x1a\x73\x66\x8f\xaa\x69\x00\x56\x58\xe7\x68\x40\x72\xb8\x5a\
-\xaf\xb0\x0e\x41\x44\xdf\xaa\x49\xf4\xaf\x50\x20\xd9\x3a\x47\x03\
-\x96\x97\xae\x3e\x29\xd3\x3a\x44\x63\x92\xfb\x8d\xef\x03\xd8\x1f\
-\xf9\x0b\x60\x9b\xd4\x84\xe3\x36\x65\x1e\xb7\x02\x20\x7f\xd1\xa4\
-\x2f\xe0\xc6\x5a\x80\x80\x27\xbe\x0b\xe7\x13\x34\x28\x18\x0c\xfa\
-\x61\x2f\x74\x15\x80\x8d\xd6\x59\x22\x08\xe6\x2d\x9e\xec\xc2\x68\
-\x0e\x11\xed\x53\xba\x3a\x6b\x0e\x00\x17\x2f\xd4\x79\x4f\x13\xdb\
-\x8d\x01\x82\xbe\x75\x90\x46\x88\x78\x32\x13\x71\xec\x0f\x1b\x0c\
-\xa2\x98\x55\xfc\xea\x23\xff\x8e\x57\x7b\x71\xfd\x3f\xec\x75\x48\
-\x98\x06\x07\x76\x04\x00\x18\x38\x74\x54\xe6\x28\xeb\x10\x8d\x59\
-\xbe\xf0\xb7\x5f\x41\x70\x39\x00\x97\xe6\xcc\x82\x79\x39\x19\xce\
-\x9e\xac\x48\x74\x38\x2b\x2d\xcc\x9e\x0a\xb7\x8a\x80\xdd\x50\xb9\
-\xa2\xec\xc5\xd9\x5f\x5a\x07\x69\x4c\xf2\x80\xf4\x5f\x02\xe8\x6f\
-\x9d\x03\xc0\xd6\x80\x26\xcc\x8a\x67\x83\x71\x3d\x20\xa2\xec\xcd\
-\xe7\x77\x27\xf5\xba\x20\x11\xc0\xc0\x78\xb6\x1b\x89\x00\xe7\x9d\
-\xd6\xe3\x67\xf3\x2b\x4b\x5e\x74\xa9\x83\x3d\x40\xf9\x86\x55\x5b\
-\x92\x52\x2e\xd8\xbc\xaf\x10\xb0\xc6\xce\x9f\xc8\x71\x5f\x6c\x7e\
-\x7d\xed\xb1\xa7\xf4\xd9\x0d\xe0\xe7\xd6\x59\x44\x34\xbd\xb4\x30\
-\xdb\xd5\xa9\x4c\x00\x40\xf2\xf9\x37\x1c\x2d\x7e\x78\x19\x1c\x98\
-\xfb\x07\x10\x2c\x2e\x9a\xfb\x42\x3c\x1b\x8c\xfb\x90\x47\xfb\x70\
-\xc7\x59\x8e\x9c\x7a\x77\x4c\x42\x42\xe2\x54\xeb\x10\x07\x93\xb7\
-\x78\xd2\x02\x40\xad\xcf\x07\x60\xe7\x4f\xd4\x46\x38\x32\x12\xf0\
-\x50\xc9\xea\x79\x8f\x19\x67\x38\x28\x09\xd5\xcc\x02\x70\xac\x75\
-\x0e\x00\x9f\x7b\x5e\x62\xdc\x2f\x61\x8b\x7b\x01\x90\x9b\x7b\xc3\
-\x0e\x81\xe7\x44\xc7\x2b\x8a\x6b\x87\x5f\x39\xdd\xbc\x52\x3e\x98\
-\x13\x8e\x38\xf2\x26\x00\x6b\x8d\x9a\x67\xe7\x4f\xd4\xc6\x18\x17\
-\x01\xaf\xd5\x74\xee\x70\xab\x51\xdb\x4d\x96\x32\x60\xfc\x40\xa8\
-\x5e\x65\x9d\x03\x00\x44\xe4\xcf\xc5\x05\x0f\xed\x88\x77\xbb\x26\
-\x8b\x1e\xbe\xee\xb0\x63\x0e\x80\xf7\x2d\xda\xae\x43\xd4\xc3\x9c\
-\xb4\xb4\x19\x1d\xad\x83\x34\x26\x2b\x6b\x62\x8d\xc0\x1b\x05\xe0\
-\xf3\x38\x37\xcd\xce\x9f\xa8\x8d\xb2\x28\x02\x14\xf8\xac\xc6\xd3\
-\x5f\x54\xae\x78\x70\x4f\x3c\xdb\x6d\xae\x3e\x7d\xd2\x3b\x29\xbc\
-\x6c\xd8\x9f\xf7\x0f\x28\x36\x57\x77\x6a\x3f\xd7\xa2\x69\x93\x02\
-\xa0\x60\x7e\x70\xb7\x42\x7e\x6f\xd1\x76\x04\xa7\xef\x09\x84\xef\
-\xb4\x0e\x71\x30\xcb\x72\x6e\xfb\x00\xbe\x3f\x02\x40\x4d\x9c\x9a\
-\x64\xe7\x4f\xd4\xc6\x95\x16\x66\x4f\x55\x68\x30\x4e\xcd\x55\xc3\
-\xd3\x11\x95\x05\xf3\x3e\x8c\x53\x7b\x2d\x56\xd5\x05\x41\x85\x3a\
-\x71\xb2\xa9\x8a\xdc\x61\x55\x30\x99\x6d\x7b\xe8\x93\xbc\x63\x01\
-\x80\x75\x56\xed\xd7\x91\x31\x6c\xe4\x7d\x67\x5a\x87\x38\x98\xbc\
-\x25\x53\x5e\x56\x68\x7a\x1c\x9a\x62\xe7\x4f\x74\x88\x28\x2b\x9c\
-\x77\x37\x62\x3f\x12\xa0\x0a\x49\x2f\x2b\x98\x57\x10\xe3\x76\x5a\
-\x2d\xa9\xff\xf8\xde\x50\xbd\xd9\x3a\xc7\x5e\xf2\x46\x59\xe1\x49\
-\x39\x56\xad\x9b\x15\x00\xc1\x60\xd0\xf7\x80\x49\x56\xed\xd7\x91\
-\x00\xf8\x73\xd3\xd2\x96\xb8\x76\x6d\x66\x3d\xf9\x39\x93\xe7\x03\
-\xfa\xe7\x18\x36\xc1\xce\x9f\xe8\x10\x13\xeb\xe9\x00\x51\xfc\xa9\
-\xac\x30\xeb\xf1\x58\x3d\x3f\x7a\x82\x9e\x27\x32\x17\x40\xa2\x75\
-\x12\x00\x10\x95\x0c\xcb\x33\x12\x4c\x0f\x3e\x58\x9a\x93\x51\x00\
-\x77\x4e\xbc\x3b\xbb\x3a\xb0\xf9\x06\xeb\x10\x4d\x91\x97\x93\xf1\
-\x07\x01\x9e\x8c\xc1\xa3\xd9\xf9\x13\x1d\xa2\x62\x57\x04\xc8\xe2\
-\x92\xa2\xec\x60\xf4\x9f\x1b\x7d\xc9\xe7\x7d\x74\x33\x80\x73\xac\
-\x73\x00\x80\x40\xf3\x4b\x8a\xe6\xbe\x68\x99\xc1\xfe\xe4\xa3\x40\
-\x60\x0a\x80\xb0\x75\x0e\x00\x50\xe0\x2f\x97\x8e\x98\xf6\x9f\xd6\
-\x39\x0e\x4e\xb4\x5d\x78\xe7\x78\x00\x2f\x45\xf1\xa1\xec\xfc\x89\
-\x0e\x71\x31\x28\x02\x8a\x6a\x3a\xb7\x1f\x03\x40\xa3\xf8\xcc\x98\
-\xe8\x31\x60\xe2\x0f\x44\xe1\xca\x5d\x30\x21\xd1\x80\xf5\x56\x4d\
-\xfb\x02\x60\xd9\x82\x5b\xdf\x06\x34\xdb\x3a\xc7\x3e\x5d\x7c\x91\
-\x45\xe9\xe9\x73\x9d\x18\x1e\x6a\x4c\x6e\x6e\xb0\xba\x7d\x38\x90\
-\x06\x41\x79\x14\x1e\xc7\xce\x9f\xe8\x30\x11\xb5\x22\x40\xb1\xb1\
-\x46\x43\x57\xb8\xbe\xe2\x1f\x00\x52\x53\x83\x09\x80\xff\x04\xdc\
-\x38\xf0\x07\xaa\x98\x53\x5c\x34\xb7\xc4\x3a\x87\x79\x01\x00\x00\
-\xed\xc3\x09\xbf\x03\xe0\xca\x71\x91\x67\x7f\xba\x6d\xdb\x1d\xd6\
-\x21\x9a\x22\x37\xf7\xd6\x7f\x6b\x08\x43\x00\x7c\xd6\x8a\xc7\xb0\
-\xf3\x27\x3a\xcc\x44\xa1\x08\xf8\x02\xe2\x0d\xa9\x2c\x7a\x2c\xde\
-\x5b\x93\x5b\x64\x8b\xff\xd1\x5d\x70\x64\xe8\x1f\xc0\xbf\xd1\xae\
-\x9d\x13\x9f\xb9\x4e\x2c\x7a\x2b\x29\x79\x7e\x57\x52\xca\xe0\x2a\
-\x08\x2e\xb2\xce\xb2\x4f\xbf\x1f\x9c\x31\xf8\x85\x8a\x0d\xab\x9c\
-\xdf\xce\x52\x51\xb2\x6a\x6b\x72\xaf\x0b\x5f\x01\x74\x14\x9a\xbf\
-\xb0\x85\x9d\x3f\xd1\x61\xea\x8b\xcd\xaf\xaf\x3d\xe6\x94\xb3\x20\
-\x90\xd4\x66\x7e\x6b\x95\x8a\x37\xa4\xac\x70\xee\xfa\x58\xe4\x8a\
-\xb6\xa4\xfe\xe3\xfa\x8a\xc8\x23\x70\xe4\x85\x57\x20\xb7\x94\x16\
-\x3c\x5c\x64\x9d\x03\x70\xe4\x07\x02\x00\xed\xfd\x53\xe6\x00\x70\
-\xe5\x17\x2a\xc1\x53\x7d\x6a\xd8\xb0\xa9\x5d\xad\x83\x34\xc5\xb2\
-\x9c\xdb\x5e\x11\x1f\xc3\x01\xec\x6e\xc6\xb7\xb1\xf3\x27\x3a\xcc\
-\xb5\x60\x8b\x60\xb5\x08\x7e\x51\xb6\x7a\xee\xab\xb1\xca\x14\x4d\
-\x29\xa9\xd7\x77\xf1\xc4\x9b\x0f\x47\x5e\x76\x01\x79\xa3\xe4\xf8\
-\xaf\xe6\x59\xa7\xd8\xcf\x99\x02\x20\x37\xf7\xca\xb0\x8a\xfc\x06\
-\xce\x2c\x26\x91\xd3\xd0\x29\x10\xd7\x9b\x99\x5a\x63\xd9\x92\x8c\
-\x17\x54\x31\x12\x40\xa8\x09\x5f\xce\xce\x9f\x88\x00\x34\x6b\x3a\
-\x20\x2c\x22\x57\x97\xac\x76\xfb\x82\x9f\xda\x7c\xbf\x66\x36\x80\
-\xd3\xad\x73\x7c\x4b\x6e\x46\x6e\xae\x13\x8b\xde\x01\x67\xaa\xa2\
-\xbd\x2a\x36\xac\x7c\xbf\x7b\xaf\x0b\x7a\x08\xd0\xcb\x3a\xcb\x3e\
-\x67\x76\x3f\x63\xd0\x86\x8a\x0d\xab\x4a\xad\x83\x34\x45\x45\xf1\
-\xaa\xf2\xe4\x5e\x17\x94\x02\xb8\x02\x0d\x17\x77\xec\xfc\x89\xe8\
-\x00\x4d\xb8\x45\xd0\x57\xc8\x2f\x4b\x0b\xb3\x16\xc7\x33\x57\x6b\
-\xf4\x1c\x30\xe1\x4a\x00\xb1\x3c\x33\xa5\x59\x14\x58\x50\x56\x98\
-\x35\xd3\x3a\x47\x6d\xce\x8c\x00\xec\x17\x0e\xfb\x37\x43\xb1\xd5\
-\x3a\xc7\x7e\xa2\x92\x3d\x7c\xe4\x7d\xdf\xb7\xce\xd1\x54\xcb\x72\
-\x26\x3d\xad\xd0\xf1\x88\x3c\x92\xc2\xce\x9f\x88\x22\x6a\x64\x24\
-\x40\x05\x72\x7d\x59\x61\xd6\xc2\x78\x67\x6a\xa9\xee\x03\xaf\xeb\
-\xa6\xc0\x1c\xeb\x1c\xb5\x7c\xbd\xf7\xd0\x1f\xb7\x38\x57\x00\x3c\
-\x97\x3b\xf9\x53\xf5\xf4\x0f\xd6\x39\x6a\x39\x4a\x11\x7e\x04\x50\
-\xfb\x4b\x23\x9a\x28\x3f\x67\xf2\x7c\x15\xfd\xef\x3a\xff\x98\x9d\
-\x3f\x11\x35\x2a\x52\x11\x20\xc0\xe4\x92\xc2\x2c\x93\xcb\x6a\x5a\
-\x26\xe8\x79\xa1\xf0\x13\x00\xbe\x6b\x9d\x64\x3f\x51\xdc\x5e\x5a\
-\x94\xf5\x89\x75\x8e\xba\x9c\x2b\x00\x00\xa0\x43\xe8\xd4\x87\x00\
-\xfc\x9f\x75\x8e\x6f\xc9\xa0\x61\xa3\xa6\x3b\x57\xbd\x35\x26\x7f\
-\xd1\xe4\x07\x01\xec\x2f\xa4\xd8\xf9\x13\x51\x93\xd4\x29\x02\xee\
-\x2c\x29\xcc\xce\xb4\xcc\xd3\x5c\x3d\xcf\xfb\xf0\x76\x01\x06\x5a\
-\xe7\xa8\xe5\xb5\x92\xa2\x6e\x59\xd6\x21\x22\x71\xf6\xad\xf6\xd2\
-\xd1\x99\x7d\x7c\x5f\x5f\x83\x3b\xeb\x14\xc2\xaa\x7a\x51\xfe\xe2\
-\xc9\x2b\xad\x83\x34\xc7\xd0\x51\xd3\x07\xe6\x2f\xca\x88\xe6\x89\
-\x81\x44\x74\x18\x48\x19\x30\x7e\x60\x71\xe1\xbc\x36\xf5\xd9\xd1\
-\xb3\xff\xc4\xf3\x55\xfc\xe7\xe1\x50\xbf\x21\xf0\xcf\x2e\x29\x7c\
-\xe4\x0d\xeb\x20\x91\x38\x5b\x00\x00\xc0\xd0\x91\xd3\xef\x17\xe0\
-\x26\xeb\x1c\xb5\x7c\x96\x10\xf0\xfb\xfc\x7d\xc1\x14\xe7\xcf\x07\
-\x20\x22\x3a\x9c\xa4\xf4\x4b\x3f\xd9\xf7\x74\x1d\x80\x63\xac\xb3\
-\xec\x27\x8a\x19\x25\x45\xd9\xb7\x59\xe7\x68\x88\x93\x53\x00\xfb\
-\xed\x49\xc4\x1d\x80\x6e\xb2\xce\x51\xcb\x71\xa1\xb0\xf7\xf4\x90\
-\x21\x0f\xb4\xb7\x0e\x42\x44\x44\x7b\x9d\x3e\xe4\xc6\xf6\x61\x4f\
-\x9f\x86\x43\x9d\x3f\x80\xf7\x24\x90\x78\x97\x75\x88\xc6\x38\x5d\
-\x00\xac\x7c\x32\x63\xa7\x8a\x4c\x80\x33\x67\x03\x00\x00\x7e\xd2\
-\xee\x88\x3d\x33\xac\x43\x10\x11\xd1\x5e\x89\x3b\x76\x3f\x28\xc0\
-\xd9\xd6\x39\x6a\x51\x88\xa6\x17\x17\x3c\xb4\xc3\x3a\x48\x63\x5c\
-\x99\x27\x69\x50\xc5\x86\x55\xef\x76\x3f\x63\xf0\x29\x02\x9c\x69\
-\x9d\xe5\x1b\x82\xb3\x93\x53\x06\xbf\x5f\x5e\xbc\xea\x4d\xeb\x28\
-\x44\x44\x87\xb3\x1e\xe7\x4d\xb8\x06\x0e\xed\xf7\x07\x00\x28\xe6\
-\x95\x16\xce\xbb\xdf\x3a\xc6\xc1\x38\x3d\x02\xb0\x5f\x87\x50\xf8\
-\x16\x00\x1f\x59\xe7\xa8\x4d\x05\x0f\x5d\x3a\x3a\xb3\x8f\x75\x0e\
-\x22\xa2\xc3\x55\x4a\xbf\x89\x3f\x84\xc2\xb5\x2d\x8a\x9f\x24\x68\
-\xc2\x14\xeb\x10\x4d\xd1\x26\x0a\x80\xdc\xdc\xdb\xbf\xde\x77\x4c\
-\xb0\x4b\x3a\xf8\xbe\xbf\xe4\xe2\xd1\xf7\x1e\x65\x1d\x84\x88\xe8\
-\x70\x93\x72\xee\xb8\xef\xfa\x9e\xbf\x14\x40\x47\xeb\x2c\xb5\x89\
-\xea\xaf\xdf\x5e\x33\xe7\x2b\xeb\x1c\x4d\xd1\x26\x0a\x00\x00\xc8\
-\x5f\x34\x69\x29\x80\xa7\xac\x73\x1c\x48\x4e\x0b\xf8\x81\xc5\x69\
-\x69\x4b\x9c\x9f\x4a\x21\x22\x3a\x74\x04\x3d\x3f\xd1\x7b\x0a\xc0\
-\xa9\xd6\x49\x0e\xa4\x8f\x97\x14\xcd\x5b\x66\x9d\xa2\xa9\xda\x4c\
-\x01\x00\x00\x5e\x87\x84\x1b\x01\x38\xb6\x05\x4f\x06\x55\x07\x36\
-\xff\xc5\x3a\x05\x11\xd1\xe1\x22\x79\xc0\x47\x53\x01\x0c\xb1\xce\
-\x51\xc7\xfb\x7b\xda\x79\x75\x4f\x60\x75\x5a\x9b\x2a\x00\x96\xce\
-\xbf\x65\xab\x0f\xef\x5a\xb8\xb5\x2b\x00\x0a\x4c\x19\x3a\x2a\xf3\
-\x7a\xeb\x1c\x44\x44\x87\xba\x1e\xfd\xd3\xc7\x0b\x30\xc9\x3a\x47\
-\x1d\xaa\x8a\xf4\x4d\x2f\x64\x7d\x6d\x1d\xa4\x39\xda\xdc\xd0\x75\
-\xc5\x86\x95\xef\x26\xf5\x1a\x7c\x0c\x80\xff\xb2\xce\x52\x9b\x00\
-\x17\x76\x4f\x19\xf4\x7a\x45\xf1\xaa\x0a\xeb\x2c\x44\x44\x87\xa2\
-\x94\xd4\x89\x17\x2a\x74\x01\x9c\x7b\x79\x95\xfb\xcb\x8a\xb2\x67\
-\x5b\xa7\x68\x2e\xc7\x7e\x88\x4d\xa3\x3b\x77\x4e\x81\xa0\xdc\x3a\
-\x47\x1d\x01\xf1\x64\xe1\x25\x23\xee\xfb\xa1\x75\x10\x22\xa2\x43\
-\x4d\x8f\xd4\x71\xbd\x7c\xdf\xcf\x01\x90\x60\x9d\xa5\x36\x01\xca\
-\xb6\xd7\x74\xbe\xc3\x3a\x47\x4b\xb4\xc9\x02\x20\x3f\x3f\x58\xe5\
-\x89\x5c\x05\xa0\xda\x3a\xcb\x01\x14\x5d\x3d\xf1\x9f\xbb\xfc\xaa\
-\xa9\xdf\xb3\x8e\x42\x44\x74\xa8\x48\xea\x3b\xf6\x24\xf8\x81\xe7\
-\x00\x1c\x69\x9d\xa5\x8e\x1a\x51\x7f\xcc\x87\xaf\xce\xdc\x65\x1d\
-\xa4\x25\xda\x64\x01\x00\x00\x4b\x17\x4e\x5a\x07\xd1\x3b\xad\x73\
-\x44\x70\x52\x28\xec\xe5\xa5\xa5\xcd\xee\x62\x1d\x84\x88\xa8\xad\
-\x4b\xea\x3b\xb6\xab\x17\x08\x2c\x07\xf4\xfb\xd6\x59\xea\x51\x99\
-\x52\x5c\xf4\xc8\xbf\xac\x63\xb4\x54\x9b\x2d\x00\x00\xe0\xac\xa4\
-\xaa\x4c\x40\x57\x59\xe7\x88\xe0\xcc\x3d\x81\xaa\x25\xa9\xa9\x41\
-\xa7\x86\xaa\x88\x88\xda\x94\xb4\xb4\x80\x04\x02\x4f\x01\xf8\x91\
-\x75\x94\xba\x04\x78\xbe\xb4\x28\x6b\x96\x75\x8e\xd6\x68\xd3\x05\
-\x40\x30\x18\xf4\x21\xed\xae\x01\xf0\xa9\x75\x96\x08\x86\x1c\x71\
-\x42\xa7\x36\xb7\x28\x84\x88\xc8\x15\x3d\xb6\x1c\x75\xbf\x00\xc3\
-\xac\x73\xd4\xa5\xc0\x67\xe2\x25\x5e\x0b\xc7\x76\xa4\x35\x57\x9b\
-\x2e\x00\x00\x20\x6f\xd1\xcd\x5b\x00\x8c\x87\x93\xff\x21\x24\x7d\
-\xd8\xa8\x4c\x67\xaf\x82\x24\x22\x72\x55\x8f\xf3\xd2\x27\x03\x7a\
-\x83\x75\x8e\x08\x34\xe0\x79\x63\x8a\x0b\x1e\x72\xf1\xc5\xb3\x59\
-\xda\xdc\x36\xc0\x48\xca\x37\xac\x7a\x27\x29\x65\x50\x57\x88\xfc\
-\xd4\x3a\x4b\x04\x83\x92\xcf\xb8\xe0\xa3\xf2\x0d\x2b\x5f\xb7\x0e\
-\x42\x44\xd4\x16\xf4\x1c\x90\x3e\x11\xd0\x59\x00\xc4\x3a\x4b\x3d\
-\x8a\xe9\x25\x85\x59\x0f\x5b\xc7\x88\x86\x36\x3f\x02\xb0\xdf\xb6\
-\x2d\x55\xb7\x03\x28\xb2\xce\x11\x81\xa8\xea\xdc\xe1\x23\xa7\x8f\
-\xb6\x0e\x42\x44\xe4\xba\x9e\xfd\xc7\x5f\xad\xd0\x87\xe0\x62\xe7\
-\x0f\x7d\xb5\x53\x95\xfc\xde\x3a\x45\xb4\x38\xf8\x03\x6e\xb9\x8b\
-\xd2\xa6\x9d\x90\x10\x90\x37\x00\x9c\x60\x9d\x25\x82\x30\x54\x47\
-\xe5\x2d\x9e\x9c\x6b\x1d\x84\x88\xc8\x45\x3d\xfb\x8f\x1f\xae\x22\
-\x4f\xc3\xb1\xbd\xfe\xc0\xde\x79\x7f\x3f\x21\x70\x56\xc5\x4b\x0f\
-\x3b\x75\x33\x6d\x6b\x1c\x32\x23\x00\x00\xf0\x5c\xee\xe4\x4f\x55\
-\x70\x15\x80\xb0\x75\x96\x08\x02\x10\x79\x6a\xf8\xe8\x69\x17\x59\
-\x07\x21\x22\x72\x4d\x8f\xd4\x09\x3f\x57\x11\xe7\x0e\xfa\xd9\xc7\
-\x17\xd1\xab\x0f\xa5\xce\x1f\x38\x44\xd6\x00\xd4\x56\xb1\x61\xd5\
-\xbb\x49\xbd\x06\x7b\x00\x52\xad\xb3\x44\x10\x80\xca\xe5\xdd\xcf\
-\x18\xb4\xa6\x62\xc3\xaa\xcd\xd6\x61\x88\x88\x5c\x90\x3c\x60\xc2\
-\x4f\x45\xb1\x1c\x40\x27\xeb\x2c\x0d\xf8\x43\x69\xe1\xbc\xf9\xd6\
-\x21\xa2\xed\x90\x1a\x01\xd8\xef\xac\xe4\x9d\x7f\x04\xb0\xc2\x3a\
-\x47\x03\x3a\x8a\x4a\xde\xd0\x11\x99\x67\x5b\x07\x21\x22\xb2\x96\
-\x72\xde\x84\xb3\x65\xef\xe7\x75\x67\xeb\x2c\x11\x09\x9e\x2d\x2d\
-\xec\x76\x8f\x75\x8c\x58\x38\xa4\xd6\x00\xd4\x36\xe4\xaa\x07\x8e\
-\x48\x08\xef\xf9\xa7\x00\x3d\xac\xb3\x44\xa4\xd8\x0a\xf1\x06\xe6\
-\xe5\xdc\xf6\x86\x75\x14\x22\x22\x0b\xc9\x03\xd2\xcf\x10\xf8\x2f\
-\x03\x72\xb4\x75\x96\x06\x54\xb4\xf7\x6a\x7e\xf2\x66\xc1\xfc\xad\
-\xd6\x41\x62\xe1\x90\x2d\x00\x00\x60\xe8\xa8\xbf\xa6\x08\x02\xaf\
-\x42\xd1\xd5\x3a\x4b\x64\xba\x45\xc5\xeb\x95\xbf\x68\xd2\x17\xd6\
-\x49\x88\x88\xe2\xa9\x7b\x6a\xfa\x31\x01\x5f\x37\x00\x38\xde\x3a\
-\x4b\x03\xb6\x7b\xea\x9d\x53\x5c\x34\xb7\xc4\x3a\x48\xac\x1c\x92\
-\x53\x00\xfb\xe5\x2f\xba\xbd\x58\x7d\x5c\x03\x27\x0f\x09\x02\x00\
-\x99\xc3\xce\x9f\x88\x0e\x47\x15\x05\x59\x5f\x00\x98\x69\x9d\xa3\
-\x01\xea\xa9\x8e\x3d\x94\x3b\x7f\xe0\x10\x5c\x04\x58\x57\x45\xf1\
-\xaa\xf2\xa4\x5e\x83\x12\x00\x19\x60\x9d\xa5\x8e\x60\x5e\x4e\xc6\
-\xdd\xd6\x21\x88\x88\xac\x7c\xb1\xf9\xf5\xb5\xc7\x9e\xd2\x67\x37\
-\x80\x9f\x5b\x67\xa9\x4d\x14\x7f\x2a\x29\x9a\xf7\x90\x75\x8e\x58\
-\x3b\xa4\x47\x00\xf6\x3b\x2b\xb9\xea\x2e\x51\x5d\x6a\x9d\xa3\x96\
-\xbb\xd9\xf9\x13\x11\x01\xa5\x85\xd9\x53\x05\xe2\xd2\xe7\xe1\x33\
-\x25\x45\xdd\x5c\xca\x13\x33\x87\xfc\x08\x00\x00\x14\x14\x14\x68\
-\xef\x9e\x43\xf2\xc2\x9e\x0e\x06\xd0\xcd\x38\x0e\xdf\xfc\x89\x88\
-\x6a\xf9\x7c\xf3\xba\x02\x37\x46\x02\xe4\x8d\xc4\x0e\xbb\x87\x6e\
-\xd9\xf8\x40\xb5\x6d\x8e\xf8\x38\x2c\x0a\x00\x00\x28\x29\x79\x3e\
-\x94\xd4\xeb\xe7\xcb\x01\x19\x01\xe0\x08\xa3\x18\xec\xfc\x89\x88\
-\x22\x70\x60\x3a\xe0\x93\x00\x42\xe7\xbf\xfd\xd2\xe3\x87\xcd\xba\
-\xac\xc3\xa6\x00\x00\x80\xf2\x0d\x2f\x6c\xef\x9e\x32\x68\xb5\x88\
-\x5c\x0d\xa0\x5d\x9c\x9b\x67\xe7\x4f\x44\xd4\x08\xc3\x22\x60\x97\
-\xa7\xfe\x85\xc5\x45\x8f\x96\xc6\xb9\x5d\x53\x87\x55\x01\x00\x00\
-\x15\xc5\xab\x3e\x49\xee\x75\x41\x05\x80\x34\xc4\x6f\x1b\x24\xe7\
-\xfc\x89\x88\x9a\xe0\x8b\xcd\xaf\xaf\x3d\xee\x94\x1f\x0b\xe2\x77\
-\x9a\xab\xaf\xd0\x51\xa5\x45\x8f\xbc\x10\xa7\xf6\x9c\x71\xd8\x15\
-\x00\x00\x50\xbe\x61\x65\x49\x52\xca\xe0\x2a\x08\x06\xc5\xa1\x39\
-\xbe\xf9\x13\x11\x35\x43\x5c\xd7\x04\xa8\xdc\x56\x56\x94\xfd\x58\
-\xcc\xdb\x71\xd0\x61\x59\x00\x00\x40\x79\xf1\xaa\x57\x92\xce\x18\
-\x74\x14\x20\xe7\xc4\xb0\x19\x76\xfe\x44\x44\x2d\x10\xa7\xe9\x80\
-\x87\x4a\x8b\xb2\xef\x8c\xe1\xf3\x9d\x76\x58\x6c\x03\x6c\xc8\x59\
-\x49\x55\xb7\x02\x78\x3a\x46\x8f\x67\xe7\x4f\x44\xd4\x0a\xa5\x85\
-\xd9\x53\x01\xdc\x1e\xa3\xc7\xe7\x96\x16\x76\xbb\x31\x46\xcf\x6e\
-\x13\x0e\xdb\x11\x00\x60\xef\xf6\xc0\x13\x7f\xdc\x37\xbf\x7d\xa8\
-\x5d\x2a\x80\x93\xa3\xf8\x68\x76\xfe\x44\x44\x51\x10\xa3\x91\x80\
-\xa2\x5d\x5e\xcd\xe5\x5b\xdf\x9b\x55\x13\xc5\x67\xb6\x39\x87\x75\
-\x01\x00\x00\xef\xbd\x59\x10\xea\xdd\x63\xc8\xb2\x90\xa7\xc3\x04\
-\x38\x36\x0a\x8f\xe4\x82\x3f\x22\xa2\x28\x8a\xf2\xc2\xc0\x92\x04\
-\x3f\x61\x70\x45\xe1\xbc\x1d\x51\x78\x56\x9b\x76\x48\x5f\x06\xd4\
-\x1c\x97\xa4\xcd\xe8\xe6\x05\xfc\x35\x80\x9e\xda\x8a\xc7\xf0\xcd\
-\x9f\x88\x28\x46\x7a\x0c\x98\x30\x05\xc0\x5f\x5b\xfe\x04\xf9\xc0\
-\xf3\xd1\xaf\x78\x4d\xd6\xfb\x51\x0b\xd5\x86\x1d\xf6\x23\x00\xfb\
-\x55\x94\x3c\xbf\x3d\xa9\xc7\x85\xcb\xe1\xe9\x95\x00\xba\xb4\xe0\
-\x11\xec\xfc\x89\x88\x62\xa8\x95\xd3\x01\x9f\xfb\xe1\xf0\xcf\x4a\
-\xd7\xce\xdb\x14\xed\x5c\x6d\x15\x0b\x80\x5a\xca\x4b\x9e\xff\x77\
-\xd2\x19\x83\x57\x01\x18\x09\xa0\x63\x33\xbe\x95\x9d\x3f\x11\x51\
-\x1c\xb4\xb0\x08\xf8\x1a\x2a\x83\xca\xd6\xcc\xdb\x10\xab\x5c\x6d\
-\x11\x0b\x80\x3a\xca\x37\xac\xda\xf2\x83\x33\x06\x17\xca\xde\x22\
-\xa0\x29\xa7\x05\xb2\xf3\x27\x22\x8a\xa3\x66\x16\x01\xbb\x44\xf4\
-\xa2\xd2\xc2\xec\xd7\x62\x9d\xab\xad\x61\x01\x10\x41\xc5\x86\x55\
-\x1f\x26\xf7\x1e\xf4\x26\x54\xd2\xd0\xf8\xcf\x88\x0b\xfe\x88\x88\
-\x0c\x34\x71\x61\xe0\x1e\xcf\xf3\x2e\x2b\x59\x9d\xfd\x52\x9c\x62\
-\xb5\x29\x2c\x00\x1a\x50\xfe\xf6\xaa\x77\xba\x9f\x71\xc1\x06\x01\
-\xae\x40\xe4\x9f\x13\xdf\xfc\x89\x88\x0c\x1d\xe4\xc4\xc0\x1a\x0f\
-\x48\x2b\x5e\x9d\xb5\x3c\xde\xb9\xda\x0a\x16\x00\x8d\xa8\xd8\xb0\
-\xb2\x2c\x29\xe5\x82\x62\x08\xae\xc0\x81\x87\x26\xb1\xf3\x27\x22\
-\x72\x40\x03\xd3\x01\x61\x28\xae\x29\x29\xca\xfe\x9b\x55\xae\xb6\
-\x80\x05\xc0\x41\x94\x17\xaf\x2c\x4d\x4a\x19\x54\x06\x91\xcb\xb0\
-\xb7\x08\x60\xe7\x4f\x44\xe4\x90\x3a\x45\x40\x58\x80\x31\xa5\x45\
-\xd9\x8b\xac\x73\xd1\x21\x62\xd8\xa8\xcc\x31\xc3\x47\x64\xfe\xc1\
-\x3a\x07\x11\x11\x45\x96\x7c\xde\x84\x3f\x24\x0f\x48\x1f\x63\x9d\
-\x83\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x28\x8a\xfe\x1f\x8f\x09\
-\x98\xc2\xcf\xf7\xc8\xd0\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
 \x00\x00\x48\xb6\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -3536,6 +1175,3087 @@ qt_resource_data = b"\
 \x66\x66\x66\x66\x66\x66\x66\x66\x66\x66\x66\x66\x66\x56\xa1\xff\
 \x1f\x1a\x7c\xe4\x62\x18\x1e\xe0\x1f\x00\x00\x00\x00\x49\x45\x4e\
 \x44\xae\x42\x60\x82\
+\x00\x00\xc0\x61\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x99\x00\x00\x00\x7b\x08\x06\x00\x00\x00\xa6\x5e\xfd\xf3\
+\x00\x00\xc0\x28\x49\x44\x41\x54\x78\x5e\xed\x9d\x05\x80\x5d\x67\
+\x99\xf7\xdf\x71\xb7\x64\xe2\xee\x49\xdd\x5d\xa8\xd3\x16\x5a\x5a\
+\xac\xb8\x95\x5d\x60\x81\x05\xb6\x40\x91\xe5\xc3\xdd\x16\x5d\x60\
+\x29\x4e\x81\x16\xa7\xd0\x52\xf7\x96\x7a\x53\x49\xd2\xb8\xcf\x4c\
+\x92\x71\x9f\x3b\xf3\xfd\x7f\xcf\x39\xcf\xcd\xcd\x74\xe6\x9e\x24\
+\x37\xa1\xe9\xee\x9c\xf6\xe6\xcc\x3d\xf7\x9c\xf7\xbc\xf2\xbc\x8f\
+\x4b\x08\x63\xc7\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\
+\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\
+\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\
+\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\
+\xfe\x9e\x81\xbc\xfd\xfd\x82\xe7\xba\xfd\xa1\xc1\x21\x1f\x63\xe6\
+\x58\x87\xbc\x5f\xfd\x7d\x7d\xf9\xc5\xa5\x25\xa9\xe7\xba\x9f\x63\
+\xef\x1f\x9b\x81\xb1\x19\x78\xfe\xce\x40\x7f\xaa\x2f\x2f\x5f\x47\
+\x5e\x30\x34\x93\xc6\x39\x83\x43\x83\x05\x59\x46\x35\x34\x94\x0a\
+\xf9\x45\x45\x45\xdd\xcf\xdf\x91\x27\xf7\xfc\x7f\x15\x91\x49\xf5\
+\xf6\x15\x37\x37\x37\x8f\xeb\xec\xec\xac\x18\x1a\x1a\x2a\xd5\xe2\
+\x95\xe8\xef\x52\x4d\x43\x91\x3e\xf9\xf1\xe2\x43\x60\x06\xf9\xe8\
+\x9f\xa1\x92\x92\x92\xfe\xfc\xc2\x82\x01\xdd\xdb\x5b\x5c\x5c\xdc\
+\xa3\x4f\xbf\x3e\x9d\xfa\xde\x29\x98\xe9\xcf\x32\x85\xbb\x35\x77\
+\x83\x83\x83\x85\x23\xb4\x91\x26\x72\x09\xef\x50\x27\x47\x7c\x3e\
+\xdd\xe4\xc0\xc0\x00\xe3\x1b\xed\x18\xd2\x58\x3a\x92\xc1\xe0\x39\
+\xbd\x23\x3d\x17\xbb\xd3\x8b\xbc\xbc\xbc\x3d\xba\x7f\x77\xda\x7c\
+\xbe\xde\x23\x18\xcf\xeb\xef\xef\x2f\x8e\x61\x7b\xa4\x61\xe4\x09\
+\x8e\x7b\x72\x19\x5f\x2a\x95\x2a\x19\xf6\xfc\x6e\xc1\xfd\xee\xbe\
+\xb3\xa0\xa0\xa0\x37\x97\xf6\x85\xa5\x41\xe2\x7b\xda\xa7\xf4\xfd\
+\x83\x61\x08\xbc\x30\xea\xd1\xdd\xdd\x3d\x3e\xdb\xef\x82\xc7\x41\
+\xad\x41\x79\x57\x57\x57\x5d\x47\x47\x47\x49\x5b\x5b\x5b\x59\x7b\
+\x7b\x7b\xb5\x9e\xab\xe5\xba\xd6\x08\xdc\x43\x1f\x33\xfb\x09\x0c\
+\x83\x5b\xba\x2b\xca\x2a\x1b\x2a\x2a\x2a\xb6\xd5\xd5\xd5\x6d\x1b\
+\x37\x6e\xdc\xf6\xaa\xaa\xaa\x6d\xfa\xde\xb7\xbb\xf3\xf7\x7c\xb8\
+\x6f\x4f\x17\xe7\x80\x1c\x53\x7f\x77\x57\x91\x16\xb6\x7e\xed\xda\
+\xb5\x33\x56\xae\x5c\x79\x4a\x63\x63\xe3\x21\x5a\xfc\xaa\xb2\xb2\
+\xb2\xd2\xc2\xc2\xc2\x4a\x75\x9a\x8d\xe8\x8b\xcc\x02\x1b\xa1\x19\
+\xcc\x0b\x29\x01\x47\xaf\x58\x90\x5e\x80\x1d\x8e\x22\xfe\xf4\xea\
+\xb9\x7e\x08\x40\xc6\x26\x75\x22\xc5\x9c\xa5\xe7\x4d\xf7\x40\xb0\
+\xfc\x18\x3e\x9f\x83\xa5\xa5\xa5\x9d\xbc\x6b\xd8\xc4\xf1\x7e\xa4\
+\xa7\x01\xf5\xb1\x3d\xfe\xdd\x91\x67\xe6\x79\x08\xe2\x17\xf7\x97\
+\x26\x86\xb7\xcf\xef\x03\x23\xbc\xdf\xef\x1b\xca\x11\x60\xf3\x44\
+\xa4\xe8\x3b\x7d\xca\x7c\x77\x9a\x53\xd3\xef\x8e\x24\x76\x17\x96\
+\x32\x89\xc4\x88\x63\x8e\xc7\xe3\xeb\xc4\xd7\x91\xee\xcb\x76\x7d\
+\xa4\xdf\x32\xaf\xed\xee\xdf\x41\x48\x62\xa4\x79\x4f\x5f\x13\x22\
+\xc9\x3a\xee\x3e\x49\xca\xf1\x78\x86\xdf\xb7\x5b\xdf\x85\xe4\x47\
+\x92\xc4\xd3\xef\x17\x13\x05\x6c\x8f\xb4\x36\xf6\xda\x9e\x9e\x9e\
+\xe1\x4c\xce\x2e\xed\x89\x49\x01\x09\x8e\xf6\x8e\x7c\x21\xcb\xaa\
+\xf8\x77\x87\xfb\xcc\x7b\x0b\xf4\x3b\xfb\xcb\xf7\xc6\x68\xfb\x60\
+\x18\xf8\xdb\x57\x83\xa9\xde\xde\xde\x4c\x22\x36\xbc\x1f\x79\x42\
+\xdc\x30\x51\xbb\xec\xb9\x4c\x78\xd7\xfc\xb0\xaf\x33\xdf\xbf\xcb\
+\x3e\xd5\xf8\x7c\xdf\x67\xb6\x91\xfe\x5b\x44\x66\x78\xdb\xbb\xf4\
+\x41\xfd\x1b\x69\x7e\xd3\xf7\x08\x4f\xd0\x1d\xfe\x29\x16\xce\xe1\
+\xde\x32\x9d\xcb\x74\x2e\xd5\xb9\x50\xf0\x33\xd2\xfb\x1d\xb6\x07\
+\x4a\x8a\x4a\x3b\xc5\x18\xb7\x0b\x8e\x36\xcf\x98\x31\xe3\xa1\xa3\
+\x8e\x3a\xea\xa6\x05\x0b\x16\xac\x10\xde\x68\x19\x69\xd2\x9e\x8f\
+\xd7\x76\x17\x31\x1c\xb0\x63\x1b\xec\xeb\xad\x58\xbd\x7a\xf5\xc2\
+\xa7\x9f\x7e\xfa\xf4\xa6\xa6\xa6\x73\x84\xf4\x0f\x2a\x2f\x2f\xaf\
+\x12\xd1\x28\x8a\x01\xd0\x81\x70\x38\xc7\x32\x24\x22\x33\x04\x27\
+\xa2\x15\x07\xe1\x9b\x74\x23\xa0\xb0\x73\xbc\x09\x06\x85\x24\xb2\
+\x21\xd9\xa0\xf7\x0d\x47\xc0\x99\x73\x35\x24\x20\xf4\xe7\x77\xb9\
+\x1e\x7f\x19\xd4\x26\xf0\x77\xfb\xef\xbb\x20\x61\xfa\x97\x6d\xf2\
+\xd5\x5f\x07\xd8\x67\x6d\x50\xc6\xa1\x4d\x32\xd2\xfb\x77\x67\x3d\
+\xad\xbd\x11\x24\x87\x5d\x60\x26\x46\xc2\x99\xed\x65\xfe\x3e\x5c\
+\xea\xd8\x85\x80\xc6\x0f\x8d\x74\xcd\x91\xd0\x9e\x9e\xf7\x94\x18\
+\x0d\xbf\x3f\xf3\x7d\xd6\x3d\x49\x92\xa3\x8d\xcd\xae\x0b\xce\xb2\
+\xee\x21\xcd\xcf\x70\xb8\x1b\xed\xfe\x11\x09\x85\xde\x3f\x1a\x12\
+\x8c\x97\x27\x8f\xf6\x47\xe3\xc6\xf3\xd4\xbf\x6c\x04\x20\x4f\xf0\
+\x9d\xb5\x7d\x21\x3b\x10\xe8\xa8\x84\x2e\x03\x89\x67\x9d\xa7\x51\
+\x00\x2e\x2f\x83\x88\xfa\x2d\xbb\xcc\x83\xde\x9f\x6d\x7f\x85\xf8\
+\xf9\x11\x19\x20\x1a\x8c\xc7\x67\x73\x35\x42\x1f\xb4\xb9\xd2\x20\
+\x3a\xe2\xef\xa6\x01\x8b\x8e\x11\xd7\xc7\x99\x0c\xed\x13\x5f\x07\
+\x97\x5a\x1c\x3e\xb2\xee\xb5\xb6\x96\xf6\x20\x7c\xd5\x87\xf6\x44\
+\x6d\x35\xab\x9d\xc7\xa7\x4d\x9b\x76\xdd\xd1\x47\x1f\x7d\xef\xf4\
+\xe9\xd3\x9f\x4e\xda\xff\x59\x1b\x3f\x40\x7e\x7c\xde\x12\x99\x96\
+\x96\x96\x2a\x01\xd0\xe4\x5b\x6f\xfc\xfb\x0b\x85\x0a\x4e\xd2\x7c\
+\x1e\xab\xcf\x44\x7d\xe0\xbc\x76\xeb\xb0\xed\xab\x23\x6d\xb5\xd9\
+\xad\xa7\xfe\xb9\x37\x0d\x43\x72\x7b\xfc\x72\x01\xe9\x1e\x3f\xb3\
+\x27\x0f\x08\x89\xed\xc9\xed\x99\xf7\xda\xee\x1e\x36\xbe\xd1\x88\
+\xd2\xb3\x9e\x1b\xe1\xa5\xa3\xa9\xd1\xb2\xa9\xd7\x60\x32\x46\xea\
+\x7f\xfa\x99\x18\xc9\x67\x45\x74\xd9\x26\x60\x04\x24\xba\xbb\xf3\
+\x65\x1d\x4b\x20\xe2\xdc\x92\xb4\xc0\xa3\x49\x01\xd6\x8f\x78\x7c\
+\xa3\xf6\x69\x84\xf7\xef\x6e\xff\xa3\xbd\x15\x49\x82\x7b\x7d\x24\
+\x3d\x3f\x98\xa3\x35\x35\x65\x3c\xe5\xde\x1f\x49\xfd\x4b\x6a\xb9\
+\xa7\x6b\xa7\xb6\x90\xbd\x24\xf5\x7d\xb3\x08\xeb\x06\x69\x38\xee\
+\x97\x96\xe2\x96\x4b\x2e\xb9\xe4\x1a\x49\x8b\xf9\x22\x44\xd9\x54\
+\xf7\x49\xaf\x79\x4e\x7f\x4f\x02\xd0\xe7\xb4\x73\xa3\xbd\x5c\xc4\
+\xa5\xfa\x89\x27\x9e\x38\xfc\xd1\x47\x1f\x7e\x45\x79\x71\xd1\xe9\
+\xba\x6f\xba\x3e\x35\xfa\x64\xd5\xaf\x0e\x6f\xef\xf9\x40\x64\x72\
+\x5d\x80\xfd\x4d\x64\xc4\xe9\xe5\xd4\x45\x21\xe1\x9c\x9e\xcf\xf5\
+\xe1\xa4\xfe\xe7\xda\xbf\x5c\x99\x84\x5c\x9f\x4f\x9a\x9f\x24\x24\
+\x99\xf4\x7b\xae\xed\x27\x3d\x9f\x34\x7e\xd4\x11\xb9\x1c\xcf\x35\
+\x91\xc9\x93\xa0\xcb\x18\x7d\x9e\x81\x47\x54\xe0\xfa\x6c\x13\xd1\
+\x59\x25\x49\xf1\x8e\xb3\xce\x3a\xeb\x57\x52\xa5\x3d\xf1\x7c\x95\
+\x6a\x72\x5b\xa1\x5c\x56\x77\x2f\x9e\x45\xf5\xb0\x62\xc5\x8a\x25\
+\x0f\x3c\xf0\xc0\xb9\xd2\xd5\x9e\x31\x7e\x7c\xdd\x11\xa9\xde\x9e\
+\x09\x21\x6f\x28\x9b\xf1\x7b\xd4\x37\x39\x0f\x73\x20\x4b\x32\x49\
+\x48\x30\x69\x1a\x73\x7d\x3e\xa9\xfd\x24\x24\xb0\xbf\x9f\x4f\x6a\
+\x3f\xd7\xdf\x9f\xeb\xf1\xe5\x8a\xe4\x93\xc6\x9f\xd4\x7e\xd2\xef\
+\x49\xed\xe7\x3a\x7f\xd9\xdf\x2f\x7d\xf7\xf3\x9c\xc8\x94\x16\x97\
+\x19\x91\x81\x99\xe1\xe3\xe3\x85\x39\xd4\x07\xe7\xa3\xcd\x72\x26\
+\xb8\xf7\xd0\x43\x0f\xfd\xe9\x89\x27\x9e\xb8\x4c\x6a\xb5\x06\x49\
+\x39\x99\x76\xd8\xa4\x25\x78\xce\x7f\x7f\x5e\x10\x19\xbc\x34\xd6\
+\xad\x5b\x37\xe3\xd1\x47\x1f\x3d\xa6\xb5\xb5\xf5\xac\xea\xea\xea\
+\x13\xb5\x18\x93\x9b\x9a\x1a\x6a\xc7\x55\x4b\x3b\xb6\x97\x0e\x47\
+\xfb\x82\xc8\xec\x6f\x49\x21\x07\x75\x94\x01\xd7\xfe\xee\x5f\xae\
+\x9c\x7e\xae\x48\x2c\xd7\xe7\x93\x76\xe0\xfe\x45\x92\x49\x6f\xcf\
+\x5d\xdd\x94\xf4\x86\xa4\xf1\xe5\x3a\xbf\xfb\xfb\xf9\xa1\xc1\xec\
+\x92\x74\xd2\xfb\x33\x6c\x32\x49\x53\x35\xe2\xef\x49\xed\x27\x35\
+\xea\x44\xc6\x09\x0d\x67\x5f\x13\xda\x96\xd6\x26\x55\x5b\x5b\xbb\
+\x45\xe6\x81\x65\x72\xe2\xb9\xe3\xcc\x33\xcf\xbc\x16\xc7\x00\x11\
+\x9f\xe7\x56\x05\x90\x34\xb0\x8c\xdf\x0f\x68\x22\x83\x8b\xa6\xbc\
+\xbf\x26\xde\x7b\xef\xbd\x4b\x96\x2f\x5f\x7e\xb1\x26\xf9\xf8\x9a\
+\x9a\x9a\x39\xb8\x15\xea\x23\x89\xb2\x20\x14\xa0\x53\x7d\x0e\x89\
+\xcc\xfe\x96\x14\xc6\x88\x4c\x76\x68\x4e\x42\x92\x7b\xb0\x17\xf6\
+\x0b\x12\xc9\x15\x09\xe5\xfa\x7c\xd2\xf8\x93\xda\xcf\x75\x7e\x93\
+\xda\xcf\xb5\x7f\xc1\x9c\xb7\x46\x3f\x92\xde\xff\x5c\x13\x99\x20\
+\x49\x6c\x38\x23\x48\x9f\x7d\xde\xf9\x4d\x84\x26\xc8\xbd\x79\x07\
+\x1e\x68\xdb\xb6\x6d\xbb\x6b\xf1\xe2\xc5\xbf\x39\xf5\xd4\x53\x57\
+\x0a\x1f\x36\xc9\x7e\x93\x93\x8b\x7a\xd2\xfc\xef\x8b\xdf\x0f\x58\
+\x22\xb3\x79\xf3\xe6\x09\x0d\x0d\x0d\x53\x97\x2e\x5d\x7a\x9e\x28\
+\xf9\x51\xd2\x4d\x1e\x2b\xd7\xe4\x29\x3a\x97\xd5\xd7\xd7\x07\x89\
+\x8d\xa1\xa3\xa3\x2d\xe4\x63\xf9\xfb\x5f\x4c\x64\x72\x95\x44\x72\
+\x7d\x3e\x09\xc8\x92\x36\xf1\xfe\x7e\x3e\x57\x24\xb8\xbf\xfb\x97\
+\xd4\x7e\xd2\xef\xcf\xf5\xf8\x0e\xf4\xf5\x35\xa7\xae\x2c\xa1\x2e\
+\x49\xf3\x97\xab\xaa\x3c\xd7\xf9\xe9\xeb\xe9\xc7\x43\x15\x2f\x45\
+\x3b\xb3\x5f\x69\xd3\x09\x0d\xdf\x65\xf4\x0f\xf2\x12\x45\x9d\xd6\
+\xab\x7b\xb6\x08\x0f\xae\x50\x3c\xcd\xfd\xa7\x9c\x72\xca\xef\xe7\
+\xcc\x99\xb3\x61\xc2\x84\x09\xdb\x92\xe0\xe8\xb9\xfc\xfd\x80\x23\
+\x32\x12\x0b\x6b\xb7\x6e\xdd\x3a\xf1\x99\x67\x9e\x39\x78\xe3\xc6\
+\x8d\x17\x4c\x9c\x38\xf1\xf8\x1d\x3b\x76\x4c\x13\x35\xaf\xab\xac\
+\xac\x24\xb8\x0c\xdf\x7f\x5b\x84\xb2\xb2\x92\x30\xd8\x0f\x21\xdf\
+\x3b\x0f\x91\xb4\xe1\x3f\x87\x15\xd8\xdf\x92\x4c\xae\xea\xa8\xfd\
+\xdd\xbf\xfd\x4d\xc4\x92\x96\x26\x09\x89\xec\xef\xe7\x93\xda\xcf\
+\xf5\xf7\x5c\x91\x58\xd2\xfb\x93\xda\x4f\xfa\x3d\xa9\xfd\x5c\xd7\
+\x27\xfb\xfb\x41\xca\xff\x3b\x88\x0c\xf1\x36\xbe\x57\x33\x6d\x34\
+\xe0\xbb\xd8\x19\x20\x28\x16\x30\x28\x2e\x2a\x88\xc9\xc6\xd5\x79\
+\x8b\x42\x37\x1e\x5f\xb4\x68\xd1\xef\x64\xab\x79\x50\xe7\xf5\x07\
+\xaa\x0a\xed\x80\x21\x32\xfd\xbd\x7d\x15\x6b\xd7\xaf\x9b\xfc\xe4\
+\xd2\x27\x0e\xde\xb8\x79\xd3\x0b\x0b\xf2\xf2\x0f\xa9\xac\xae\x9a\
+\x57\x54\x50\x58\x27\x6e\xa3\x6c\x50\xe1\x24\x7d\x03\xfd\x26\xb4\
+\xe4\xc9\xf5\x7f\xa0\xaf\x3f\xf4\xf4\x76\x85\xca\xca\x72\xc1\x79\
+\x8e\x6e\x92\x9a\x05\xda\x85\xab\xd9\xd3\x73\x61\x7e\xc1\x5e\x3d\
+\xb7\xbb\xef\x61\x9c\xd9\xfa\x95\xb4\xc9\xf7\x37\x11\x88\x83\xd1\
+\x92\xba\xb1\xdf\x7e\xcf\x95\x08\xe7\x8a\x44\xf7\xdb\xc0\xe2\x86\
+\xf7\x77\xff\x92\xda\xdf\xbf\x44\x22\x79\xf6\x92\x0c\xff\x79\x16\
+\x63\x3d\xfa\x91\xd4\xff\xe7\x5a\x92\x49\xf5\x0f\xa6\x25\x19\x97\
+\x62\xa4\x16\x0b\x7c\x80\x6d\x34\x36\x1c\xfc\xe6\x04\x47\x4e\x4f\
+\xfc\xd6\x2f\x69\xa6\x51\x66\x83\x15\xfa\xfb\xde\x79\xf3\xe6\x5d\
+\x77\xf2\xc9\x27\xaf\x9b\x34\x69\xd2\xa6\xe4\x59\xfd\xe7\xde\xf1\
+\x9c\x13\x99\xa1\xc1\x54\xfe\xa6\x4d\x1b\x27\x3f\xf1\xd8\xe3\x73\
+\x37\x6d\xdd\x72\xa1\x42\x1b\x8f\x2b\x2a\x2d\x59\x38\x34\x90\xaa\
+\xeb\x56\xa0\x65\x71\x41\x21\x6a\xcb\x40\xc8\xe3\x48\x67\x45\xeb\
+\x6b\x05\xf6\x4e\x92\xb1\xc5\x8b\xe9\xd3\x68\xed\x27\x5d\x2f\x14\
+\x27\x95\xad\x7f\x49\xcf\x13\x0a\x9a\xcb\xf3\xe8\x94\xb3\x91\xd8\
+\xa4\x4d\xb6\xbf\xc1\x2d\x57\x49\x4a\xea\xd1\xac\x5d\x4c\xb2\x59\
+\x25\xfd\x9e\x34\xfe\x24\x22\x96\xeb\x06\x02\x99\xec\xcf\x03\xc4\
+\x94\x13\x12\x3e\xc0\xe3\x5c\x92\xa2\x16\x92\x88\xe8\xfe\xfe\x3d\
+\xd7\xb5\x4d\x82\x7f\xed\xef\x56\x31\x7a\x5b\x44\x6c\x1e\x15\x21\
+\xba\xef\xf0\xc3\x0f\xbf\xf1\x8c\x33\xce\x58\x47\x70\x67\xae\xef\
+\xde\x57\xcf\xe7\xba\x47\x72\xea\x87\x92\x57\xe6\xdf\x79\xdb\x2d\
+\x87\x4a\x1d\x76\x8c\x3e\x17\x69\x43\x1f\x2a\x63\xd6\x78\x05\x24\
+\x55\x69\x72\x49\x39\x91\x7d\x83\xa8\xf7\x29\x7c\xcc\xf7\x72\x14\
+\x26\x15\xe9\x0d\x16\xb3\xbf\x97\x47\xae\x48\x2c\x69\x8c\x59\x11\
+\x04\xc4\x57\xba\xdc\x6c\xe3\x4f\x42\x32\x7b\x39\xec\xdd\x7e\x2c\
+\x57\x24\x9a\x24\x29\x25\xb5\x9f\x84\x44\x92\x06\x92\x34\x7f\x7b\
+\x69\x0e\x4c\xbf\x36\xd7\xfe\x25\xf5\x3f\x69\x7e\x92\x98\x90\x5c\
+\xfb\x97\xf4\xbc\x12\x73\x64\x1d\x42\x12\x92\x4d\x1a\x7f\xd2\xfe\
+\x4c\xea\x5f\x52\xfb\xb9\x3e\x9f\x6b\xfb\xd8\xa7\xe5\xe2\xdc\x2b\
+\xaf\xdb\xed\x32\x23\xac\xd1\x78\x1f\x98\x3c\x79\xf2\x1f\x95\x9e\
+\x66\xb9\xdc\x9e\x9b\xf4\xfd\x39\x77\x77\xde\x4b\xf4\x9c\x34\x35\
+\xd9\x7f\x27\x33\xf2\x13\x8f\x3d\x36\xf7\xae\xbb\xee\xba\xb0\xb0\
+\x30\xff\x78\x11\x97\x23\xf4\xc4\x54\x51\xdf\x2a\x79\x4b\x14\x80\
+\x58\xd8\x1c\x78\x55\x88\xe0\x8c\xda\x18\x12\x40\x7f\x02\xa7\x9b\
+\xd4\xd3\x5c\x89\x4c\xae\x9c\x7a\xd2\x26\x48\x22\x32\x7d\x09\x9c\
+\xf0\xfe\xde\x04\x89\xf3\x9b\x63\xc6\x81\x44\x49\x22\xa1\xfd\xa4\
+\xe7\x93\xfa\xbf\xbf\xe7\x6f\x7f\xab\x33\x93\xda\x4f\x1a\x5f\xd2\
+\xef\xb9\xce\x5f\x7f\x7f\x76\x4f\xdc\x24\x26\x23\xa9\x7f\x49\x44\
+\x2a\x89\xc8\x26\xbd\x3f\xe9\xf9\xa4\xf9\x49\xfa\x3d\x69\xfd\xc0\
+\x3f\xa8\xcf\xe8\xa7\xd4\x67\xad\xf2\xc6\xdd\x26\x86\x7d\xa9\x12\
+\x6e\x5e\x2f\x57\xe7\x3b\x2e\xbc\xf0\xc2\x65\xd8\xb0\x15\x5b\x93\
+\x03\x2b\x9d\xd4\xcb\xec\xbf\xff\x53\x89\x0c\xc4\x65\x7b\x63\xe3\
+\xd4\xfb\xef\xbf\x7f\xde\x96\x2d\x5b\x5e\xac\x81\x9f\x25\xd5\xe2\
+\x0c\x01\x4a\xb5\x3e\xc5\xee\x55\xe1\x13\xcb\x39\xdb\x22\x43\x64\
+\x2c\x5a\x36\x87\x39\x28\xc8\xe5\x61\xbd\x37\x09\x08\x92\xba\x96\
+\x0b\x90\x32\x7e\x38\xed\x6c\x43\x48\xda\x64\x49\xfd\xcb\xf5\xf7\
+\xa4\x4d\x9a\xd4\x7e\x12\x27\x9e\xd4\x7e\x2e\xf3\x4b\xdf\xf6\xf7\
+\xfc\xe5\x0a\x3f\x49\xf3\x97\xd4\xff\x24\x24\x9d\xeb\xfc\x25\xf5\
+\xaf\xb8\x38\x7b\x1c\x35\x8c\x66\xb6\x23\xa9\xff\x49\x92\x68\xd2\
+\xf3\xb9\xbe\x3f\x69\xfc\x49\xbf\x27\x31\xa1\xec\x0f\x5f\x63\xec\
+\x37\x22\x3a\x7d\xfa\xde\xaa\x71\xad\xd2\xb3\x37\xcb\x13\xed\xd1\
+\x57\xbc\xe2\x15\x0f\x4a\xaa\x59\xff\x5c\x65\x0c\xf8\xa7\x10\x19\
+\xd4\x62\xcd\xdb\xb6\x4d\x13\x71\x59\xbc\x7e\xfd\xfa\x33\xa5\x12\
+\x5b\x22\xb7\xbc\x43\x44\x61\x27\xf5\xf6\x76\x57\xba\xc1\xcb\xa3\
+\x5e\x99\x78\x80\x83\x4f\x36\x75\x92\xd9\x32\x44\xc9\x73\xa1\x13\
+\xcf\x35\x91\x49\x02\xf2\x24\x49\x06\x20\xcb\x36\xfe\x24\x24\x9c\
+\x04\xe4\xb9\xfe\x9e\x84\xe4\x92\xda\x4f\x92\x14\x93\xda\x4f\x7a\
+\x3e\xe9\xfd\xfb\x7b\xfe\x72\x95\xb4\x92\xfa\x9f\x44\xc4\x92\x88\
+\x48\x2e\xf0\x99\xd4\x37\x7e\x4f\x92\x64\xdc\xf0\x3d\x5a\x5b\x49\
+\xfd\x4f\x62\x52\x92\x9e\x4f\x42\xf2\x49\xcf\xef\xce\x1c\x64\xbb\
+\x27\x09\x7e\x65\x8b\x09\xd2\xfe\x18\x1e\x04\x57\xd2\x1f\xb4\x3f\
+\xfa\x74\x68\xed\xb7\xca\x1b\xed\xa9\x4d\x9b\x36\x3d\x20\x87\x80\
+\x87\x2e\xbe\xf8\xe2\x27\x15\x63\xb3\xf1\x9f\x4d\x6c\xf6\x39\x91\
+\x19\xec\xb3\xd4\xe7\xf9\x4a\xff\x3a\x24\x36\x5f\x46\x93\x54\x89\
+\xd4\x62\xa7\x3f\xf6\xd8\x63\x2f\xd5\xf5\xf9\x22\x30\x33\xc5\x1d\
+\xd4\x8a\xc0\xd4\x68\x01\x0b\x08\xa8\x74\x3f\x71\x26\xdb\x09\x8d\
+\x2f\x5e\xd2\x26\xcf\x2f\x2a\xdc\x6b\x22\x93\xab\xaa\x8c\xfe\x26\
+\x6d\xe2\x24\x20\x4b\xda\x44\x49\xcf\x27\x8d\x3f\xd7\xfe\x25\xbd\
+\x3f\xe9\xf7\xfd\x8d\xa4\x92\xda\x4f\x82\x9f\xa4\xfe\xef\xef\xf9\
+\x4b\x22\x92\x49\xfd\x4b\xfa\x1d\x04\x94\x95\x51\xd9\x35\xcb\xf4\
+\xb3\x6e\x4d\x9a\xdf\xa4\xf7\x27\xcd\x9f\x4a\x3e\x65\x6d\x22\x69\
+\x7e\x92\x90\x7c\xd2\xfa\x27\x8d\x2f\x57\x49\x28\x69\x7e\x92\x7e\
+\x4f\xea\x1f\xaa\x30\xf0\x27\x84\x05\x5c\xc2\xfd\x5c\x03\x8f\x6a\
+\xee\x55\x93\xb1\xaf\x5d\x0c\xfd\x16\x5d\x7f\x52\x73\xf9\x0f\x11\
+\x9b\x87\xe5\xee\x4c\xfd\x9a\x8d\xfa\xad\x52\xf3\x57\x88\xb4\xa6\
+\x73\x4a\x6d\xf4\x29\x4c\x64\xbb\xda\xdb\xa7\xde\x28\xfb\x84\xc8\
+\x20\xa9\x74\x77\x74\x4c\x54\x5d\x84\x49\xfa\x4c\x15\x45\x2d\x57\
+\x47\x07\xb4\xc0\x85\xf2\xed\x5e\x22\xb5\xd8\x61\x1a\xe4\x51\x44\
+\xef\xeb\x52\xb9\x74\x87\x05\x00\x87\x0c\x56\xa1\xa2\xa2\xcc\x10\
+\x35\x1f\xa7\xda\x70\x1f\x50\x65\xce\x4a\x21\x93\x7d\x1d\x2c\x93\
+\xf9\xde\x1f\xb9\x18\xfd\xf7\xfe\xad\x3b\x9f\x4c\xda\x24\x49\xef\
+\xe8\x4f\x48\x43\x9b\xc4\xc9\x25\xb5\x9f\xeb\xef\x49\x9b\x34\xa9\
+\xfd\x24\x75\x45\x12\x12\x49\x42\x72\x49\xef\x4f\x9a\xbf\x5c\xa4\
+\x68\xde\x9d\x84\x44\x92\xfa\x97\xf4\x7b\x92\xa4\x94\xf4\xfe\x5c\
+\xe1\x33\x89\x13\x1f\x18\xc8\xee\x19\x9a\x04\x3f\x49\xe3\x4b\xfa\
+\x3d\x69\xfc\x48\x0a\xd9\x8e\xa4\xe7\x93\xd6\x27\xe9\xf7\x24\x22\
+\x2b\x5c\x6a\x36\x19\x08\x0b\x52\x97\xa9\xcf\x45\x68\x18\x37\x6b\
+\xc7\xfc\x0b\x86\x29\x29\xd2\xa6\xbd\xb2\x5d\xb8\x78\x93\x7e\x6f\
+\x54\x3c\x62\xb7\x6c\x37\xf9\x72\x12\xe8\xd4\xbd\x7d\xba\xaf\x43\
+\xd9\x54\xb6\xea\xfb\x23\x53\xa6\x4c\xd9\x42\x2a\x1b\x7d\xdf\x27\
+\x05\x0f\x73\x26\x32\xdd\xed\x1d\xf5\xdb\xb7\x6f\x5f\x8c\x8d\x45\
+\x9d\x3e\x5c\x03\xaa\xd7\x60\x8a\xf5\x51\xbf\xf3\x29\xe4\x53\xad\
+\x6b\xd5\x1a\x70\x99\x8b\x9e\x3e\x78\x28\x6f\x77\x77\x67\x3a\x0b\
+\x29\x08\x23\xd6\x2b\x9a\x9e\x91\x4f\x22\x90\xe6\x98\xaa\xfb\xb9\
+\x26\x32\x49\x9b\x28\x09\x08\x87\xd2\xe5\x2e\x46\xbe\x33\x49\xdc\
+\x4f\x6a\x3f\xd7\xdf\x93\x36\x79\x52\xfb\x49\x44\x22\x09\x09\x26\
+\x6d\xd2\xa4\xf7\x27\xcd\x5f\xae\x44\x26\xa9\xfd\xa4\xfe\x25\xfd\
+\x9e\x84\x04\x73\xfd\x3d\xe9\xfd\x49\xeb\x97\x97\xb7\xd7\xa5\x22\
+\xec\xd5\x49\xeb\x9f\xf4\xfe\xa4\xf1\x27\x31\x31\x49\xcf\x27\xcd\
+\x4f\xd2\xef\x49\x4c\x16\xfb\x4b\xd2\x87\x11\x18\xee\xa5\x3f\x6e\
+\x66\x80\x89\x97\xc4\x62\xd7\xc0\xa3\x31\xc1\x11\x3d\xea\x19\x40\
+\x72\xd1\x33\x14\x6d\x24\x65\x4d\x3f\x35\x6d\x74\x7f\xa7\x70\xf9\
+\x4a\x49\x34\xf7\x49\xad\x76\x9d\x24\x9e\x65\xb9\x56\x56\x65\x7c\
+\x23\x95\x06\x4e\x1a\x77\xfa\x77\xe5\xd1\xa9\x52\x74\xfe\x42\xb9\
+\xcf\xbd\x6d\xfc\xf8\xf1\x27\x69\x43\x4f\xd4\x19\x62\x92\xcf\x80\
+\x89\x50\x85\xd2\x32\x11\x44\xaa\x72\x8d\x09\x20\x4d\x82\x4f\x46\
+\x4f\x4f\x45\xd6\xf7\x71\x3f\x80\x02\x30\x81\x30\x10\x0b\xf5\x3e\
+\x6b\x17\x2e\x83\x76\x50\x09\x70\x8d\x89\x16\xf5\x0d\x4c\x9c\xa8\
+\x71\x10\xb5\x36\x89\x88\x67\x78\xb7\xab\xa6\xa0\xfa\xfc\xcd\x99\
+\xbe\x38\x20\x7a\xa4\xad\x07\x3e\x01\x60\x52\xef\x05\xa5\xb8\x09\
+\xb3\x66\xcd\x0a\xab\x56\xad\xb2\x77\xb0\xa8\x8c\x87\xdf\xb8\x97\
+\x85\x54\x76\x02\xfb\x4d\xe3\xb7\x76\x1d\x38\x18\x3b\x7f\x73\xa6\
+\x1f\xe2\x24\xac\x4f\x8c\x8b\xf7\xf1\x8c\xa4\xbf\xa0\xcc\x06\xf6\
+\x1c\xd7\xb8\x47\x8b\x6d\x52\x9c\xab\x12\x9d\xe8\xd2\x16\x63\xa4\
+\x6f\xb4\x99\xc4\x69\x27\x6d\xb2\xdd\x5e\xec\xbd\xbc\x71\x7f\x23\
+\xd1\xa4\x6e\xe5\x8a\x04\x7c\x9d\xe0\x16\x99\x4b\x60\x8d\x35\x00\
+\x6e\x3a\xba\xbb\x82\x5c\x21\x93\xba\x90\xf5\xf7\x24\x22\x98\xeb\
+\xfa\xb9\xce\x9e\x76\x80\x3b\x87\x5f\xce\xae\xc3\x67\x2f\x01\x7b\
+\x1c\x8c\x8f\x67\xfc\xde\xa4\xf9\x73\x26\x30\xf3\xbe\xcc\xbf\x93\
+\xd6\x3f\x95\x42\xab\xbe\xab\x26\x83\x7e\x78\x1b\xce\xa4\x64\xce\
+\x43\xe6\xdf\x49\xfd\xcb\xdc\x27\xcc\xb5\x33\xb8\x5c\xf7\x54\x2e\
+\x5c\xe3\xbb\x98\x64\xdb\xdb\x8c\x9f\x3d\xcd\x5c\x80\x43\xfc\xf0\
+\x77\x65\xbe\x33\x89\x08\x25\x31\x59\xcc\xbb\x33\xd7\xf4\x87\xb6\
+\x33\xdb\x4f\x22\xa2\xfe\xfe\x91\xfa\x26\xa9\x64\x24\xd8\xdb\x45\
+\x7f\xea\x81\x9f\xdc\x28\xdc\x35\x28\x82\x53\xaf\x3f\x27\xaa\x2f\
+\x9b\x84\x83\x1a\xf4\xf7\x96\x9c\x00\x3c\x57\x22\xa3\xe7\xa9\x63\
+\x7d\xa2\x36\xdc\x51\x9a\x8c\xe9\x42\xa2\x45\x20\x7b\x36\x26\x0b\
+\xa4\x9c\x3a\x36\x61\x71\x2a\x04\xfb\x9b\xcd\xea\x48\x96\xeb\xa4\
+\x86\xc9\x76\x38\x05\xf6\xc5\x62\x52\xfd\xc3\xa2\x80\x9c\x79\xa7\
+\xea\x2d\x58\xdb\x10\x17\xda\x57\xbd\x99\xa0\xdc\x3e\x41\x46\x2f\
+\x43\xd4\x99\x69\xb4\x79\x1e\x24\x41\x1f\x01\x58\x47\xe0\xb1\x1e\
+\x33\x72\x26\x88\x45\x4e\x39\x2a\xd8\x38\x1e\x7e\xf8\xe1\x70\xf0\
+\xc1\x07\x1b\x41\xe0\x7e\x80\x90\xfe\x03\x04\xbc\x4f\xba\x4e\xfb\
+\xdb\x89\x1d\xf7\xd0\x36\xcf\xb2\x90\x00\x2e\xbf\x43\xdc\xf8\x70\
+\x8d\xe7\xe9\x0b\x7d\x87\x30\x42\x58\x54\x0d\xcf\xee\x03\xd8\x21\
+\x62\x70\x23\xdc\xcf\x7d\xb4\x41\x1f\x21\xde\x4e\x7c\x93\x36\x71\
+\xae\x00\x92\xeb\xf3\x49\x9c\x58\xae\xed\x27\x3d\x9f\x84\x84\x92\
+\x9e\x67\xde\x7d\xe3\x3b\x5c\x38\x62\x2d\x50\x94\xd5\x40\x82\xe3\
+\x45\x52\xfb\x49\x44\x24\xe9\xf7\xa4\xf6\x61\x6c\x18\x03\x30\xc5\
+\xc7\x23\xc9\x19\x93\xa7\x67\x72\xa6\x88\x77\xb1\x2f\x80\x5d\x8f\
+\x36\xcf\x15\xbe\x92\x88\xa8\xab\xcb\x9c\xd0\x0c\x47\xe8\x99\x48\
+\xd6\xe7\x62\x34\x82\x33\xd2\x5c\x38\xae\x70\x8d\x41\xa6\x2a\xc9\
+\x99\x4a\x9e\x63\x5e\xa6\x4e\x9d\x1a\xa4\x91\x09\x52\x15\x59\x53\
+\x49\x7d\xdf\x9d\x7b\x92\xd6\xcf\x19\x49\xee\xa3\x6f\x8e\x8b\xe8\
+\x8f\x33\x9c\x49\x6b\xcc\xef\xfe\xbc\x9f\xfd\x5a\x92\xa6\x84\xb1\
+\x9a\xf3\x50\x24\xed\xe4\xeb\x9d\xf5\xfa\x7b\x50\xb8\xe7\x50\xf5\
+\xed\xf6\xdd\x79\x77\xd2\x3d\x39\xa9\xcb\x24\xc9\x2c\x5c\xbd\xe2\
+\x99\x0f\xa9\x43\x17\x08\x19\x4e\x64\x52\x44\x09\x8d\x23\x00\x81\
+\x02\xa0\x20\x4a\xcf\xb9\x83\x34\x00\xd2\x64\x22\xb8\x2f\x72\xbf\
+\xcb\xee\xa2\xe8\x93\x35\x9a\x24\xa3\xec\x45\xc6\x6d\x80\xa8\x95\
+\x50\xd3\x10\x31\x88\x9a\x03\x80\x01\x59\xb3\x71\xd8\x34\x2e\x41\
+\x81\xd0\x41\x14\x9c\x49\x51\xe3\xe2\x24\xc8\xdc\x75\x9a\x6c\x3c\
+\x88\x07\x5c\x1e\xe3\xe0\x59\x49\x6d\xc6\xc5\x72\x8d\xbe\xbb\x07\
+\x9c\x4b\x1d\xbc\x03\x89\x46\x49\xeb\xac\x6d\xdf\xac\x00\x92\x4b\
+\x4e\x3c\x47\x5b\x6c\x7e\xda\xa5\xbf\x8e\x08\x98\x33\x9e\xa1\x3f\
+\x10\xb1\xb5\x6b\xd7\x9a\x34\xc3\xfb\xd8\x2c\xde\x66\xe6\x9c\x14\
+\x17\x66\x0f\x66\x4b\x02\xf2\x24\x00\xc9\xf5\xf7\x24\x20\xcf\xb5\
+\xfd\xa4\xe7\x73\x25\x32\x3e\x7f\x30\x0f\xbe\x66\xbc\x93\xbf\xbb\
+\x7b\x15\x7f\x50\x59\xb1\xd7\x8e\x27\xb4\x93\xa4\x0e\xce\x75\xfd\
+\x9c\x58\x38\x33\xe5\x52\xba\x23\x56\x57\x4f\x03\xd7\xc0\x3b\xfd\
+\x01\x06\xf9\x9b\xdf\xb2\xc5\xa9\x65\xf6\x7f\x34\x49\x26\x09\x51\
+\xe7\xe7\x47\x92\xe0\x70\x0e\x3e\x13\xc6\x7d\x8d\x47\x22\x32\x49\
+\x9c\xbe\x33\x97\xde\x3f\xb7\x5b\x00\x97\xbe\xa7\x5c\xba\x61\x9f\
+\xb1\xe7\xd8\x9f\x3e\x3f\x4e\x70\x46\x92\x14\xb8\x96\xf4\xfe\x24\
+\x49\x87\x36\x86\x4b\x72\x99\xcc\x00\x5a\x8d\x6c\x47\x26\xfc\x8c\
+\xb4\x06\x49\x92\x94\x8f\x93\x77\x66\x30\xdc\xdd\x62\xc0\xef\x14\
+\xee\xf9\xa4\xd4\x66\x77\x27\xed\xb1\xa4\xdf\x73\x93\xf5\x55\xe2\
+\x5c\x03\xab\x11\x22\xaf\x00\x98\x44\x74\x82\xbc\xc8\xd2\x08\x18\
+\xc9\x82\x45\x53\x5e\x9d\x70\xf7\xdd\x77\x87\x77\xbd\xeb\x5d\x86\
+\xf4\x99\x38\x57\x23\x95\x96\x46\xb9\x79\x46\x3b\xb8\x2f\x53\x12\
+\x19\x2e\xc9\x28\xc7\x59\x98\x3f\x7f\xbe\x21\x60\xee\x23\x02\x16\
+\x44\x0f\x10\x71\xdd\x25\x0a\x90\x04\xf7\x38\x30\x43\xfc\x00\xa6\
+\xe2\xd2\x92\x34\xf7\xc0\x24\x3b\xe7\xc6\x06\xe3\x59\x79\xc6\x19\
+\xd1\xa0\x1f\x0f\x3d\xf4\x50\x50\x7e\xa0\x70\xc3\x0d\x37\x84\x97\
+\xbf\xfc\xe5\xe1\xda\x6b\xaf\x0d\x88\xa4\x10\x19\xa5\x73\x48\x7b\
+\x77\xcc\x9e\x3d\xdb\x88\xa9\x13\x0d\xda\x44\x6a\xa2\x6f\xbe\xe9\
+\x21\xc4\xae\x4f\x75\x89\x88\x3e\xb9\x7a\x83\x7e\xce\x9d\x3b\x37\
+\x4d\xac\x19\x1b\x63\x77\xe9\x10\xa4\xc0\x73\x10\xd9\x6c\x47\xae\
+\x48\x2a\x09\x80\x92\x7e\xcf\x15\xc9\x27\xb5\xbf\xbf\x7f\x77\x49\
+\xda\x3d\x78\x18\x8f\x23\x28\x32\x2d\x98\x47\x4f\x0e\x9d\x48\x42\
+\xc2\x39\x34\x6d\x8f\xba\xc4\xeb\xb0\xed\x92\x77\xa6\xcd\x73\xb8\
+\xed\x93\xfd\x09\xac\xb9\x6a\x30\x97\x3e\x24\xc1\x1f\x7b\x83\x3e\
+\x39\xc2\xce\x44\xba\xbc\x97\x3d\x91\x8d\xc8\x24\x65\xcc\xc8\x84\
+\xbf\xe1\x44\xca\x11\x30\x73\xc4\x98\xd1\x52\x20\xcd\x80\x2b\x7c\
+\x0e\x46\x42\xe2\xa3\x11\xd4\x91\xe6\x29\x89\x89\x70\x22\xe8\xeb\
+\xe3\x44\x89\x33\x0c\x69\xd2\xfc\xf9\xef\x3e\x6f\xde\x37\xbf\x9e\
+\xe4\xbd\x0a\x0e\x74\x49\x86\xfe\xc7\xcc\x86\x1e\x2b\xae\xd6\xfa\
+\x97\xab\x3d\x35\x95\x5b\x5e\x8b\x5c\x89\x4c\xbe\x16\xa8\x5c\x1c\
+\x7e\x1e\x08\x0f\xae\xe7\x97\xbf\xfc\x65\xb8\xfc\xf2\xcb\x0d\xc9\
+\x7e\xe9\x4b\x5f\x32\x2e\xfc\x75\xaf\x7b\x5d\xb8\xe9\xa6\x9b\xec\
+\xcc\x24\x38\x32\xc5\xb6\xa0\x38\x99\x44\x18\x1e\xbe\xa8\x99\x5c\
+\x0f\x40\x8a\x4a\x8b\x43\x45\xcd\x82\x2a\x67\x86\x2b\xaf\xbc\xd2\
+\xa4\x98\x3f\xfd\xe9\x4f\x46\x78\x5c\x8a\x70\xae\x1a\xc0\xf4\x0d\
+\x04\xa2\xa0\x3f\xfc\x06\x51\x84\x10\xc1\xbd\x28\x78\x29\xc8\xf0\
+\x15\x6e\xbf\xfd\xf6\xb0\x66\xcd\x1a\x23\x3e\x8c\x89\x05\x41\xca\
+\xe1\x5e\x54\x72\x1c\x2e\x69\xfc\xe3\x1f\xff\x30\x69\x6a\xc9\x92\
+\x25\xd6\x3e\x80\x42\xbb\x6c\x62\x16\x0f\xc2\xf2\xc8\x23\x8f\xa4\
+\xd5\x6c\x10\x26\x00\x1a\xa9\x85\x33\xcf\x40\x18\x79\xcf\x35\xd7\
+\x5c\x13\xde\xf0\x86\x37\x84\x3f\xff\xf9\xcf\x46\x6c\xa6\x4d\x9b\
+\x66\x7d\x73\x69\x06\xdb\x0f\xaa\xc2\xe6\xed\x3b\x0e\x68\x22\x93\
+\xb8\xb8\x07\xf8\x0d\x6c\x56\xdf\xf8\xbe\x96\xc0\xb9\x6d\x62\x39\
+\x5d\x24\x21\x81\xa4\xe1\x25\x3d\x9f\xf4\x7b\x52\xfb\xae\x1e\x72\
+\x0e\xde\xb9\x64\xf6\x85\x4b\xed\xc0\x26\xcc\x9f\xef\x33\x97\x5e\
+\x18\x77\xae\xea\xce\x24\x49\xb6\xbd\xdd\x92\x3d\xda\xbe\xca\x44\
+\x76\x6e\x2f\x51\xb1\x42\x1b\xe2\x68\xaa\xb2\x24\x22\xed\xb6\x50\
+\x57\x8d\xc3\xc4\xc1\x14\x36\x35\x35\xd9\x3e\x63\x8c\x10\x16\x70\
+\x02\xd7\xd9\xf7\x1e\x41\x0f\x73\x09\x1e\xf1\x63\x24\x69\x26\x49\
+\x9d\x98\x24\xe9\xf8\xf3\xcc\x13\x78\x04\xdc\xe3\x04\x2e\x69\x6d\
+\x33\x7f\x1f\x0e\x27\xc3\x89\xcd\x68\x6d\xb9\x17\x9a\xff\x1e\xab\
+\x10\xb1\xa9\x57\x10\x66\xc2\xd4\xeb\x93\x0b\x1f\x95\x9b\xe1\x5f\
+\x2f\x2f\x10\x77\xde\x23\x24\x3f\xc8\x20\xb1\x87\xdc\x7c\xf3\xcd\
+\xe1\xc3\x1f\xfe\xb0\x01\x0e\x00\x72\xf6\xd9\x67\x1b\xb2\x3e\xe2\
+\x88\x23\x0c\x29\xa2\xda\x02\x49\x83\x70\x79\x46\x11\xff\x59\xe7\
+\xd2\x45\x59\xda\x03\xa0\x58\x94\x4c\xbd\xe5\x8c\x69\xd3\xc3\x89\
+\x92\x2e\xfe\x7e\xfd\xf5\x26\x69\xa0\x9a\x03\xd9\x03\x38\xae\xbe\
+\x02\x21\xb3\x89\x5c\xf4\x45\xe2\x82\x6b\x01\xa8\x0e\x3a\xe4\x60\
+\xeb\x27\xc0\x84\x6a\x0a\xc4\x8f\xed\x85\xbf\x15\x2d\x6b\x7d\x76\
+\x9b\x0b\xed\x40\xc4\xa0\xfe\xcb\x96\x2d\x33\x03\x3c\x6d\x41\x24\
+\x00\x5a\x05\x9b\xda\xdf\x10\x02\x57\x35\xd0\x5f\xfa\xe1\x36\x15\
+\x24\x3b\x88\x16\x00\xce\x75\x7e\x7f\xf0\xc1\x07\xad\x3f\x6c\x68\
+\xa4\x20\xda\x47\x22\x84\x60\x3d\xf5\xd4\x53\xe1\xf1\xc7\x1f\xb7\
+\xfb\x50\x31\xbe\xe6\x35\xaf\x31\x75\x20\x73\x47\x9f\x95\xa5\xfa\
+\x80\x26\x32\x49\x48\x66\x4f\x36\xd2\xde\xdc\x9b\x2b\x92\x66\xed\
+\x69\xc3\x3d\x77\xdc\xd1\xc2\x38\x50\xfd\x97\x14\x0c\x9b\xd4\xe7\
+\xa4\xfe\x25\xfd\x9e\xd4\xbe\xf7\x37\x93\x53\x76\x26\x0d\x42\xc3\
+\xfe\x62\x6c\x6e\x7b\x72\xa4\xed\xce\x2a\x49\xed\x27\xfd\x9e\xd4\
+\x7f\xf6\x8d\xa7\x90\xf2\x77\x7a\x5f\x7d\xef\x64\xb6\x31\x9c\xd8\
+\x24\x21\x79\xb7\x37\xb9\xc4\xc3\xde\x84\xa1\x73\x15\x3e\xbf\x83\
+\x17\x9c\x51\x65\x6f\xc2\x74\x82\xa7\xd8\xef\xbe\xee\xa3\x11\x9a\
+\x24\xf8\x4e\x22\x82\xb4\xcb\x1a\xb8\x74\xcc\xbb\x21\xf2\xac\x11\
+\xcf\x26\xb5\x3f\xbc\x5f\xcc\x8f\x4b\x35\xfc\x96\xe4\x18\xe4\xed\
+\xf3\x9c\x6b\x4b\x74\x56\xde\x61\xfd\x93\x97\x07\x72\xc9\xc9\xa4\
+\x42\x1f\x72\x95\x64\x0a\x36\x6c\xd8\x50\xa5\xce\x28\xa8\xb2\x28\
+\xa8\x06\x8c\xd2\xef\xf7\x84\xdf\xfc\xe6\x37\x86\x40\xdf\xf9\xce\
+\x77\x86\x3f\xfc\xe1\x0f\xa6\x5e\x82\x2b\x70\x07\x00\x00\x9a\x41\
+\xf1\x29\x2e\x4e\xee\x82\xab\xcb\xdc\xbb\x8c\xb3\x7b\x76\x7d\xe4\
+\x23\x1f\x09\xdf\xf8\xca\x57\xc3\xbf\x5e\xfe\xd6\xf0\x81\x0f\x7c\
+\x20\xfc\xf5\xaf\x7f\x0d\xf7\xdf\x73\xaf\x49\x01\x87\x1e\x74\x70\
+\x38\xf2\xb0\xc3\x4d\x42\xe0\x19\xce\x2c\xc0\xb4\xc9\x53\x22\x7d\
+\xac\xfa\x8a\x24\x23\xbd\xa3\x71\x0f\xdc\x03\x10\xd2\x4f\x88\x04\
+\x48\xfd\xf8\xe3\x8f\x37\xa3\x3e\xd7\x38\xe8\x0b\x12\xd3\x4b\x5f\
+\xfa\x52\x03\xcc\x17\xbc\xe0\x05\x46\x5c\x69\x17\x2e\xc9\xd5\x66\
+\x10\x2e\x24\x10\xd4\x6d\xb4\x0b\x61\x80\xd8\xbe\xf6\xb5\xaf\xb5\
+\xb6\x21\x1c\xb4\xab\xf9\xb3\x77\x5f\x7a\xe9\xa5\x46\x08\xdd\x1d\
+\xf1\xd8\x63\x8f\x35\x42\xf9\xee\x77\xbf\x3b\x7d\x8d\xf7\xf1\x0c\
+\xc4\x91\x36\x4c\x5a\x52\xa9\x81\x6c\x6e\xd8\x49\xe2\x7a\x12\x92\
+\xc8\xf5\xf7\xdd\xd1\x09\xe7\xfa\x8e\x6c\xcf\xe7\xba\x43\x4a\x8b\
+\x34\xcf\x25\xa5\x81\x73\x65\x99\x74\xf5\x29\x39\x65\xe8\x6c\xb6\
+\x33\x49\x32\xed\x3d\x5d\x39\x75\x3f\x09\x09\xe7\xd4\xb8\x1e\x06\
+\x4e\x40\x94\x6e\x48\x76\x4e\x1e\x6e\x1d\x98\x05\x3e\xf8\xdb\x90\
+\x41\xbc\x2f\xdd\x76\x99\x89\xac\xf6\xb6\x1f\x49\xeb\xaf\xfc\x5a\
+\x69\xc7\x98\xb8\x30\x97\xe1\x05\xf7\xfe\x72\x49\x60\x34\x49\x26\
+\xa9\x5f\x4e\x84\x9c\xb0\xba\x03\x84\xab\xe8\x20\x26\xa8\xa0\xe9\
+\x87\xdf\xcb\xbe\x62\xbf\xb3\xd7\x60\x1a\x47\x23\x30\x8e\x0f\xb2\
+\xf5\x21\x49\x5d\xec\x0c\x8c\x1b\xf9\xd9\xff\xe0\x52\x27\x8e\x49\
+\x36\xb1\xcc\xf9\x19\xe9\x5d\x49\xc1\xb8\x6e\x42\x60\xec\xcc\x79\
+\x6c\x47\x56\x53\x43\x05\xfa\x3b\xbb\x2d\x23\x69\xf2\xe3\xdf\x93\
+\x31\x7c\xf6\x86\xf2\x35\x09\x85\xe2\x04\x0a\xdc\x6b\xe5\x37\xbf\
+\xfe\x8d\x71\xfb\xa8\xc7\x3e\xfb\xd9\xcf\x9a\xed\x82\x85\x04\x61\
+\xc2\x3d\x30\x79\x0c\x84\x01\xc1\xcd\xef\x89\x77\x99\x4b\x32\x2e\
+\x5a\xf3\x1d\x62\x52\x50\x98\x17\xd6\x6c\xdc\x10\xa6\xcf\x9e\x1e\
+\xde\xf9\x9e\x77\x1a\x81\xeb\xe8\xe9\x08\xb3\xe6\xcd\xb2\xf7\xb9\
+\x0b\xb3\x2f\x58\x69\x4f\x69\xe4\x4a\x0d\x97\x2a\xc3\x79\xda\xcb\
+\xa4\x28\x2f\x54\xd6\x55\x59\xa2\x82\x9e\x54\x4f\xd8\xd8\xb0\x31\
+\xdc\x78\xdb\x8d\x46\x08\x94\x92\x21\x5c\xf5\x3f\x57\x85\x37\xbe\
+\xf1\x8d\x61\x7b\x4b\xb3\xf5\xfd\xd6\x3b\x6e\x0f\x4d\xcd\x3b\x6c\
+\x13\x03\x94\x48\x3e\x5d\x7d\xbd\xe1\x81\x07\x1e\xb0\xcd\xfd\xb1\
+\x8f\x7d\x2c\x3c\xb1\xec\x69\xeb\xcf\xca\xb5\x6b\xc2\xcd\xb7\xdf\
+\x16\x9e\x7e\xfa\x69\x53\x7d\xb1\xd9\x21\x60\xeb\x24\xd9\x30\x9e\
+\xa6\x1d\xdb\x4d\x95\x86\x73\x84\xab\x0d\xdc\x76\xe5\x73\x06\x42\
+\xe0\xfd\xd8\x76\x98\xbf\x8e\xd6\x96\x50\x28\xe0\x88\xa4\x59\x71\
+\x22\x9c\xd2\x55\x02\xa3\x20\x55\x6c\x36\x51\x96\xe6\x38\xe8\x4d\
+\x65\x11\xa2\x62\x6d\xd1\x33\x61\x88\x8c\x09\x71\x40\x6b\x5c\x32\
+\x61\x30\x5d\x3a\x21\x7a\x26\x93\x88\xe5\x0d\xab\x42\x48\xdb\xdc\
+\x1f\x95\x34\x90\x2f\x7e\xba\x24\x83\xb8\x64\x3d\x5b\x84\xce\xdd\
+\xfa\x11\xf5\xc0\xce\xf1\xfd\xb4\x3d\xbc\xbd\xdd\x84\xdb\xf8\x36\
+\xbd\x37\x5b\xc1\x3a\xf5\x75\x77\x88\x6c\xb6\x52\x0b\x7d\xdd\x72\
+\x2b\xd7\x18\x59\x2f\x95\x9e\x30\x78\xea\xe9\x97\x4b\x3a\x75\x7e\
+\x44\x64\xdc\x26\xe3\x3a\x85\x3d\x3d\xef\x0e\xa7\xbb\x67\x73\xb2\
+\xeb\xdd\x99\x1e\x54\xee\x1d\xc7\x3b\x9d\xc3\xad\xac\xae\x09\xc5\
+\xaa\xd5\x54\x5e\x19\x39\x97\x00\xab\x51\x14\x7e\xe4\x91\x99\x69\
+\xb8\xde\x49\xb0\x33\x03\x28\xb3\x07\x43\x67\x1f\x5f\xbe\x9c\x69\
+\x36\xd8\xfe\xe9\xee\x66\x6e\x71\x96\x21\x80\x10\x82\x87\x47\x25\
+\x92\x56\x04\xbb\x51\x3c\x4d\x04\x41\x91\x89\x20\x82\x28\x9e\xcb\
+\x80\xac\xe1\x90\x96\xbe\x1f\x07\x03\x7f\x6e\x68\x88\x40\x45\x9c\
+\x0d\xb0\xf7\x16\x9a\xc6\x00\xcf\xdd\xae\x2e\xdc\xd4\x0b\xb4\x97\
+\xdb\x25\xdd\x8c\x33\x46\x90\x7e\x78\xfb\xdc\xcf\x7b\xfd\xcc\x75\
+\xef\xdf\x30\x08\x4f\xf7\x23\xca\x32\xfd\xac\x1d\x90\xfe\xdd\x55\
+\xb0\xcc\xb3\xbb\x4d\x43\x18\xd8\xfb\xbb\xc3\x80\xa8\xa6\xa6\x5a\
+\xf7\x7a\x25\xd8\xb6\x34\xb6\x7c\xce\x51\x76\xfa\x9d\x9a\x22\xf0\
+\x03\x73\xa6\xf9\xd3\xd9\xad\x2c\x2e\xc1\xba\x6a\x9f\x77\x0a\x66\
+\x90\x64\x06\xc9\x00\x90\x0b\xec\xf9\xb3\x39\x11\x19\x01\x61\xa1\
+\x26\xa9\x58\x36\x99\x42\xf4\x89\x7c\x98\x34\xa4\x16\xd4\x64\x0e\
+\xe0\x18\xc7\x21\x34\x4c\x1c\xd7\xa0\x9e\x9c\x23\xa0\x1e\x32\x75\
+\x14\x54\xd8\x8d\xe8\xfc\xe6\x13\x0d\x97\x55\x5c\x5c\x20\x2e\x03\
+\x62\x80\x68\x89\x6b\x61\xb4\x68\x3c\x5f\x53\x5f\xab\x73\x41\xf8\
+\xcc\xe7\x3f\x15\xa6\xce\x9c\x6e\x7d\xe0\x5d\x70\xfb\x5d\x7d\x3d\
+\xf2\x1e\xcb\x0b\x3d\x78\xb0\x69\x7e\xbb\xfb\xe3\xd2\x01\xba\xd6\
+\x37\x28\x17\x63\xda\x15\x91\x61\x41\xf2\x85\x49\xf2\x05\xd4\xf9\
+\x82\xa9\x02\xfd\x9e\x32\x40\x1c\x08\xa7\x9c\x77\x62\xe8\xee\x3a\
+\x2a\x74\xb6\x75\x84\x37\xbf\xfd\x4d\xa1\xaf\x7b\x20\x54\xd7\x56\
+\x85\x07\x1f\x79\x38\xbc\xf8\xa2\x8b\xc2\xfa\xad\x9b\xc3\x91\xc7\
+\x1e\x6e\xb1\x34\x47\xd6\x1c\x2b\x44\xd4\x17\x66\x2d\x99\x17\x7e\
+\xfa\xd3\x9f\x86\x37\x6e\xbb\x3c\x14\x56\xcb\xe0\x2f\x71\x1c\x67\
+\x84\xd6\xb6\xd6\x70\xd4\x29\xc7\x19\xd1\x33\xf5\xe2\xec\x69\xa1\
+\xa0\x28\x3f\x34\x0a\xc8\x39\x2e\xbe\xe4\x22\x3b\x03\xf4\xfc\x0e\
+\x27\x85\x1a\x0d\x04\x07\x81\x46\x62\x2a\x2a\x91\xfb\x75\x65\x99\
+\x7d\x1f\x10\xb2\x2e\x2b\xc7\x41\xa1\xcf\x00\xa8\x20\x4f\xae\xd1\
+\x3d\x7d\xa1\xab\x53\xd9\xab\x8b\x4a\x4d\xe5\x37\x24\xce\xdb\x6a\
+\xce\xe8\xde\xbc\x7c\x8d\x49\xd0\x25\x47\x56\x2b\xa4\x33\x14\x8a\
+\xb5\xa1\x28\x17\x20\x57\xee\xc2\x21\x1b\xf7\x60\x9e\xec\x47\x22\
+\xb0\xfd\x03\x94\x7b\x8d\x75\xf5\x46\x0c\x20\x36\x54\x21\x94\x04\
+\x6a\x67\x6d\x36\x68\x54\x01\x40\xcd\x77\x88\x07\x14\x87\xfa\x3a\
+\xd1\xef\x20\xe7\xf6\x2e\x71\xd1\xca\x4a\x00\x31\x28\x2c\x29\x0e\
+\x65\xc5\x52\x05\x88\x12\xf5\x08\x79\xf7\xea\x53\xa6\x7e\x96\x48\
+\x4a\x00\xd1\x30\x66\x60\x01\x15\xa5\xab\x13\xb3\x71\x62\xb4\x99\
+\x52\x5f\x71\x1e\x01\x26\x40\x8a\xdc\xcf\x19\xa2\x4f\x29\x14\x38\
+\x43\x3b\x46\x29\xd1\x6b\x52\xae\xfa\x47\x51\x3c\xd5\x36\x0a\x83\
+\x9a\x2f\x6c\x2d\x10\x60\x85\x7b\x85\x41\x85\x8f\xf4\xa7\x06\x42\
+\xed\xf8\x71\x76\xbd\xa4\x5c\x30\xcc\x7c\xea\xef\x02\xa5\x34\xe2\
+\xbd\x65\x52\x71\xf4\x08\xa6\xdb\x05\xab\x33\xc4\x40\xdc\x7d\xef\
+\xbd\xa1\x0d\xc6\x4a\xd2\x6b\xb3\xe0\xb0\x5b\x63\xe2\x77\x89\xfb\
+\x61\x96\xbc\x20\x17\x1f\x74\x90\xfd\x3e\x4e\xcc\x42\x33\x8c\x82\
+\xe0\x18\xc7\x18\xdf\xe8\xec\x0f\xd6\x1c\x02\xc6\x5e\x38\xf3\xcc\
+\x33\x0d\x9e\x81\x6d\x60\x87\xb1\xa1\x66\x82\x61\x61\x4f\x01\x0b\
+\x3e\x4e\x57\xc1\x9e\x7f\xfe\xf9\x76\x0f\x7b\x01\x38\x72\x4f\xc6\
+\xd5\xab\xd7\xda\xfd\x5c\x2f\xd5\x58\xd6\x6f\x6e\x0a\xe3\xc6\xd7\
+\x87\x87\x1e\x59\x6a\xcc\xcb\xe1\x87\x1f\x1a\x3a\x3b\x3a\x43\x67\
+\x57\x4f\xa8\x1f\x5f\xa7\x10\x80\x0d\x61\xc5\xf2\xe5\x52\x31\x35\
+\x9b\x04\xc7\x7b\x9a\x5b\x14\x4f\x52\x5e\x11\xaa\x6a\xaa\xc3\x71\
+\x27\x9c\x1c\xba\x81\xb9\xae\x4e\xdb\xfb\x38\xf9\xfc\xe4\x27\x3f\
+\x31\x4d\x03\x6a\x29\xb7\xfd\xb0\xae\x5c\xa3\xbf\x27\x9c\x70\x82\
+\xed\x17\xd6\x79\x47\x73\xab\x8d\xb5\xba\xba\x36\xfc\xfa\x37\xd7\
+\x4a\x05\x5d\xa7\x71\x56\x48\x15\xdc\xa0\xfe\x8c\x53\xbb\x51\xe5\
+\xdb\x49\x93\xa6\x48\xda\x98\x27\x44\x3c\x3e\xcc\x9a\x39\x53\x6a\
+\xe4\x65\xc2\x17\x13\xc3\x43\x0f\x3f\x6e\xfb\xb4\xa9\x69\xbb\x7e\
+\xab\xb1\xf5\x00\x8e\x39\x63\xef\x95\xed\x3a\x9c\x76\xda\x29\xda\
+\x47\xad\x7a\x07\x41\x8b\x45\x22\xb0\xbd\xe1\xba\xbf\x5e\x67\x0c\
+\x2e\x44\x85\xf7\xad\x5d\xbb\x5e\xfd\xa9\x17\x1c\x0e\xd8\xf7\x89\
+\x13\x27\x87\x23\x8f\x3c\x5c\x8c\xe3\x36\xf5\xa9\xca\xfa\x75\xfb\
+\xed\xb7\x8a\x81\x5e\x19\x55\xe4\x8d\x89\x5f\x6f\x2f\xb6\xa4\x5e\
+\xeb\x17\x44\xea\x82\x0b\x5e\x64\x44\xb2\xbd\xbd\x53\x8c\xf5\x64\
+\xc3\x6f\x77\xde\x79\xbb\xcc\x03\x2d\xba\xd6\x1a\xe3\x2d\xf2\x8c\
+\xf5\x5b\x3b\x85\xea\x2b\x70\x0f\xb3\xcc\x1e\x60\xbf\xb3\xee\xcc\
+\x15\x26\x85\x4c\xc7\x87\xe1\x08\x9f\x7d\x58\x18\x4a\xc2\xe6\x86\
+\xad\xa1\x46\xcc\xf1\xb8\x49\x75\xe1\xb3\x5f\xfe\x74\xd8\xb0\x79\
+\xb5\xb8\x3b\xc1\x7e\xb5\xe6\x5b\x52\x78\x43\x43\x53\x28\x2f\x2a\
+\x0f\xd5\x15\xe3\xc3\xf8\xaa\x09\xe1\xed\x97\xbf\x23\xf4\x09\x47\
+\x98\x67\x6b\x85\x48\x00\x8c\x67\xac\x36\x05\x4e\x80\xaf\xd8\xb5\
+\xf9\xb9\x95\x64\xf0\x3a\x10\xe7\x0e\x7b\x51\xa0\x49\x1a\x51\x2b\
+\x11\xa9\xc3\x2c\x33\x68\x44\x10\x64\xc3\x80\x68\x80\xfc\x98\x3c\
+\x00\x16\xb7\x60\x06\x04\x40\x32\x68\x9e\x71\xb7\x3d\x36\xdb\x48\
+\x87\xbf\x0e\x24\xd6\xa4\x09\x66\x32\x4f\x3d\xfd\x94\xb0\x71\xf3\
+\x86\xb4\x5a\x0b\x00\xde\xbc\x75\x53\xba\xad\x91\x29\x32\xc8\x30\
+\x8a\x38\x36\xaa\x1f\x50\x81\x08\x7a\x0a\x20\x80\x91\xf8\x78\xe4\
+\x11\x47\x87\x01\x01\x44\x4f\x57\x6f\x28\x2f\xa9\x0c\x7d\xda\x50\
+\x7d\xdd\xa9\x30\x77\xd6\xdc\x30\xa1\x7e\x4a\x38\xa1\x58\x8e\x05\
+\xa5\x45\xa1\x7d\x5e\xbb\x21\x00\x36\x1a\x1b\xbd\xae\xaa\x2e\xcc\
+\x9c\x3a\x33\x9c\x77\xd6\x79\x36\x5e\x90\x04\xe3\xa3\x5f\x1c\x70\
+\x78\x10\xd5\xe6\xa9\x33\x8c\x3b\x46\x02\x00\x81\x11\x7b\x81\x1a\
+\xcf\xbf\x97\x0b\x48\x18\x67\x97\x0c\xa4\x20\xeb\x1a\x71\x9c\xed\
+\x42\xce\x5d\xc6\xc1\xe5\x85\xce\x9e\xc8\x71\xa2\x08\xc8\xd6\x66\
+\xcc\x17\xe7\x55\x51\xa1\x00\x56\x01\xa0\xab\x49\x8c\x5b\x81\x78\
+\x0c\xc2\x98\xc8\x0e\x24\xc2\x86\x34\x11\x71\x99\x0a\x8c\xd5\xf5\
+\xa1\x01\x11\x1f\xd4\x27\x22\x36\x45\x1a\x53\xa9\x10\x4a\x5e\x7e\
+\x99\x71\x75\xf4\x85\xf6\x20\x32\x11\x17\x14\x71\x45\xf4\x2b\xa5\
+\x14\x75\x43\xc6\x16\x41\x71\x22\x4e\xc9\x3e\xf1\xbc\x96\x94\xc8\
+\x83\xcf\x38\x40\x8c\xb7\xba\x5f\xef\x19\x10\xf1\x02\xe9\x44\x2a\
+\x27\x05\xc8\xe9\xba\xe8\xbb\x11\xfb\x02\xb5\xd5\xd1\xd6\x12\x52\
+\x92\xee\x00\x78\xfe\x1e\xfd\x18\x0c\xb5\xda\x5c\x2d\x22\xde\x2d\
+\x2d\x6d\x76\x1b\xdc\xa0\x71\x81\x22\x10\x10\xdc\x74\x30\xdd\x28\
+\x44\xc6\x6b\xf1\xb8\xfa\xd6\xd5\x2a\x7e\x76\x83\xb1\x1b\xf9\xfd\
+\x7e\x08\x0d\x90\x63\x9e\x49\x5a\x77\xfa\x5b\x29\x5b\x1a\x8e\x22\
+\xc0\x01\x31\x5a\x10\x05\x36\x2f\xea\x18\xe0\x1c\x24\x7e\xdd\x75\
+\xd7\x85\xad\x42\xb0\xb4\x0f\x71\x4a\xf5\x0f\x84\x5f\xfd\xea\x57\
+\xe1\xcd\x6f\x7e\xb3\xed\x03\x27\x94\x6c\x74\x77\x93\xff\xf9\xcf\
+\x7f\x1e\x2e\xbb\xec\x32\xdb\x23\x1c\xb4\x8f\xfd\xef\xd5\xaf\x7e\
+\xb5\xbd\x1f\xdb\x01\xbf\xb1\x9f\xb0\x29\xb0\x6f\x90\x8a\x51\x03\
+\xb3\xe7\x90\xb0\x99\x4b\xec\xa5\x48\xca\xcc\x91\x21\x2f\x21\xd8\
+\x3a\x71\xf2\xfd\x42\x84\x7d\x92\x22\x9e\x7a\x7a\x99\xf5\x91\x31\
+\xd3\x97\xf6\xce\x8e\x70\xfb\xad\x77\x84\x53\x4e\x3d\x49\xea\xc2\
+\x42\x83\xe3\x02\x11\x57\xce\x6b\x57\xaf\x14\x11\x9d\x19\xfe\xf2\
+\x97\xbf\x84\x63\x8f\x3b\x21\x1d\x5c\xcc\x58\xe2\xd4\xf2\x66\x87\
+\x85\xb9\x62\xfc\xa8\x8f\xdd\xc1\x05\x87\x19\xd4\xca\xcc\x49\x45\
+\x05\x73\x14\xc2\xb7\xbe\xf5\xad\x70\x90\x88\xaf\xc7\x87\x41\x74\
+\x40\xb8\x84\x26\xd0\x06\x6d\xde\x7a\xeb\xed\x41\xa9\xeb\x05\x93\
+\xdd\x66\xb7\x5c\xbe\xfc\x19\xb3\x4b\x5e\x72\xc9\x25\x11\xac\x08\
+\xb7\x80\x6b\x50\x73\x33\x7f\x30\x2a\xc4\xc9\x2d\x5d\xfa\x64\x50\
+\x7d\x15\x5b\x0b\x08\xef\x2d\xb7\xdc\x12\x5e\xf2\x92\x97\x78\x04\
+\xbc\xed\xcd\x73\xce\x39\xcf\xbe\x1b\xf1\xd5\xf8\x59\x27\x9c\x70\
+\x98\x07\xe6\x8f\x3e\x42\x60\x20\x06\x2a\x7b\x1c\x66\x8a\xd0\xd1\
+\x16\x1a\x1a\xc6\xe1\x5e\x72\x77\xdc\x71\x47\x38\xe9\xa4\x93\x6c\
+\x8d\x20\x7c\x4f\x3e\xf9\xa4\xda\x59\x68\x6d\x02\x0f\xce\x34\x45\
+\x39\xc7\x42\xd8\xa6\x36\x9e\x7c\x72\xa9\x8d\x11\x95\x3a\x73\xe4\
+\xce\x16\xd9\x08\x8c\xe3\xac\x42\xd9\x64\x19\x6f\x57\x5f\x67\xb8\
+\xf7\xfe\x7b\xc2\xd6\x6d\x0a\x1c\x5f\x38\x53\x9a\x18\x31\x2a\xaa\
+\x1c\x1c\x4a\x04\x7f\xd3\xc7\x85\xb2\xc2\x8a\xd0\xd9\xdc\x6b\x38\
+\x72\xe9\x93\x4f\x84\x69\x93\xa6\xef\x22\xa5\x8e\xb0\xc7\x22\x4e\
+\x6b\x1f\x1c\x39\x49\x32\x7a\x3f\xfb\x0c\xac\x92\xee\xcc\x70\x7a\
+\xc3\xc2\xb1\xe9\xd9\x30\x2c\xe0\xf7\xbe\xf7\x3d\x03\x0c\x77\xe9\
+\x65\x81\x5f\xff\xfa\xd7\x9b\x0a\x29\xd3\x6b\xcc\x0d\xe7\x00\x9a\
+\x23\x80\xcc\xf1\xfa\xb5\x39\x73\xe4\xe6\xab\xd4\x34\x91\x4b\x72\
+\xa5\xdd\xcb\xa6\xa3\x5d\x44\xe1\x34\x27\x3b\xd2\x2c\x0a\x63\x54\
+\x8a\x8b\x2f\x90\x7d\x8b\x0a\x9b\x86\x98\x06\x55\xc7\x46\x65\x9e\
+\xbb\xfb\xba\xad\xcf\x95\x79\xca\x9d\x56\x22\xae\x5d\xc8\xb4\xb8\
+\x50\xee\xce\x05\xfd\xa1\xb8\x46\x6c\x82\x70\xfb\x84\x8a\x71\xa1\
+\x44\xdc\xc8\xf6\xd6\xed\x61\x42\x59\x5d\xa4\x6a\x18\x52\x4d\x6e\
+\x61\xcc\x17\x1c\x73\x4a\x68\xd9\xb8\xcd\xae\x97\xea\x1d\x65\xb5\
+\x22\x3e\x55\x11\xa7\x6d\x1e\x6a\xfd\xe2\xe4\x77\x88\xbb\xd5\xfd\
+\x35\xb5\xea\xb7\xf0\x74\x8f\xd4\x31\x92\x37\x42\x75\xcd\x78\x53\
+\x73\xf1\xbd\x3f\xa5\x28\x73\x11\x9f\x9a\x3a\x65\x0a\x90\x9a\x66\
+\x40\x1c\x77\xaf\x10\x53\x7e\xa1\xda\xac\xa0\xad\x48\x3a\xc3\x95\
+\x9b\x52\xb4\x85\x92\xce\x50\x51\x45\xdf\x64\x33\x10\xd7\x2a\x8d\
+\xa6\x56\x48\x63\xe8\x8b\x24\x40\xdc\xb6\x21\x32\xfd\x3d\xbd\xe2\
+\x4e\xd5\x5f\xec\x63\xb6\x92\x92\xe0\xf4\x5f\xbf\x88\x00\x1c\x1d\
+\xe3\x19\x5f\x26\x64\x04\x51\x61\x91\x8d\xd0\x44\x67\x2b\x1f\xcd\
+\x55\xcd\x9d\x49\x2e\xae\x72\x33\x64\x1e\xa9\xe1\x38\xa2\x88\x66\
+\xd4\x93\xea\x93\xde\x61\x62\xbc\x24\x17\x0d\x2a\x48\xcb\xa9\x7e\
+\x8b\xd0\x89\x13\xe5\x30\x35\xaa\xe2\x4e\x2c\xda\xbc\x24\x22\xd6\
+\x25\xda\x98\xa3\x1d\x29\xc6\x4c\xb0\xa1\xe6\xb4\x6e\x42\xc4\xad\
+\x23\xb9\x99\xdb\xbb\x24\xd4\x22\xbd\x77\xf8\x46\x1d\x5e\x09\x15\
+\x29\x85\xc3\xe1\x69\xf8\x39\x13\xfe\x86\xc3\x36\xf0\xda\x2b\x86\
+\x80\xf5\x44\xfa\x04\xd6\xee\xb9\xe7\x1e\x43\x44\x20\x7d\xd4\xc5\
+\xdf\xf8\xc6\x37\x6c\x5c\x86\xbc\xb5\x0f\x40\xf2\x20\x29\x6c\x79\
+\x0d\x42\x30\x20\x15\x9c\x3b\x78\x16\x44\x0b\x51\xc0\x6e\x07\x12\
+\x05\x51\x82\xa0\x79\xaf\xab\x9d\x38\x2f\x97\x64\x81\x83\x08\x08\
+\xf0\xcb\x5f\xfe\x72\x78\xe5\x2b\x5f\x69\xed\x73\x9f\xbb\xc9\xe3\
+\x95\x88\x0d\x90\x6b\x20\x37\x10\x11\xfb\xce\x1d\x67\x68\xbb\x4e\
+\x2a\xa2\x1d\xad\x6d\xa1\x45\x1f\x9e\xf3\x0c\x1a\x8c\x0b\xc6\x04\
+\x27\x15\xfa\x45\x9f\x7b\x44\x70\x40\xe2\xf7\xdd\x7b\x8f\xa9\x8e\
+\x7b\x55\x07\xa6\x5b\xf0\xc3\xde\xf6\x60\x61\x08\x1e\x63\x43\xe2\
+\xbe\x5e\x8e\x38\x20\xf5\x63\x8e\x39\xc6\xfa\xcb\xdf\xee\xb0\x82\
+\x3a\x1d\x2f\x2e\x10\x71\x69\x69\xbf\x11\x83\xa5\x4b\x97\x86\x17\
+\xbf\xf8\xc5\x36\x5e\x24\x2f\xda\xe2\xfd\xac\xa5\xdb\x0d\x32\xfb\
+\xcf\x9a\x41\x50\x99\xbf\x7b\x25\x39\x82\xcc\xd9\xf7\x7c\x47\x4a\
+\x62\x9f\x61\x37\x65\x5c\x78\x6a\x42\xac\x78\x1f\x4c\x1e\xed\x32\
+\x2f\x10\x48\x10\x3a\xb8\xe2\x82\x0b\x2e\x30\x82\xc1\x78\x20\xa2\
+\xbc\x93\x77\x43\x48\x9c\x78\x33\x77\xd8\x9d\x71\xd4\x81\x98\xf0\
+\x8e\x57\xbd\xea\x55\x69\xd5\x16\xdf\xe9\x07\x92\x27\xcf\xb8\x13\
+\x12\x6b\x05\x5c\xb8\x81\x9f\xf9\xe5\x5d\x73\xe6\xcc\x32\x62\x85\
+\xb4\xc8\xd8\xe8\x23\x6d\xb8\xbd\xcc\xd5\xe5\xd9\xf0\x7c\x47\x6f\
+\x87\xf6\x0a\x1c\x5a\x2a\xac\x58\xbb\x2c\xd4\x4d\xac\x09\x27\x9c\
+\x7a\x42\xe8\x1e\x50\xd0\xfb\x40\xb7\xb5\x55\x51\x5a\x15\xf2\x53\
+\x45\x61\xc3\xaa\x4d\xa1\x69\xe3\x8e\xb0\xad\xb5\x41\x12\xe7\x1c\
+\xd3\x76\xf4\x09\x0f\x65\x39\x0e\x08\x22\x83\x07\x82\x29\x65\x33\
+\x09\x41\xe6\xdf\x2c\xa2\xfb\xe1\xb3\x68\x77\xde\x79\x67\x58\xb9\
+\x6a\xa5\x8d\xab\x18\x35\x89\x10\x27\xdc\x09\x1b\xc2\xef\x75\x97\
+\x5f\x0f\x10\xf2\x49\xc8\x44\x00\x7e\xcd\x62\x45\x84\xd4\xdd\x68\
+\xc8\xe2\xb2\x60\x78\x7d\x01\xac\xd9\x74\xf2\xa4\xf9\xdf\xbe\xad\
+\x41\x0b\x80\xca\xa8\x28\x14\x8b\x7b\x2f\xd1\x22\x1b\xd1\xe9\x2f\
+\x0e\xa9\xde\xc1\xd0\xae\x45\x28\x12\x71\x01\x89\x4b\x8f\x24\x4e\
+\x5c\xaa\x3c\x39\x2b\xa8\x64\xb4\x36\x69\x8d\xb8\x7f\xe9\xad\x85\
+\x84\x4b\x44\xd0\xd0\xe2\xf5\x4b\xc2\x60\x9c\xf5\xb5\x75\x26\xee\
+\x96\x94\x49\x25\x28\x8e\x1a\x49\xa3\x58\xd2\xd1\xa0\x90\xb7\x58\
+\x79\x7b\xa6\xaf\xab\x3b\x14\x88\x48\x95\xc6\xd5\x01\xd1\xf3\x73\
+\xf0\xdd\x10\x4b\x2f\x12\x46\x2a\xf4\x48\xf4\xf6\xb9\xb0\xc0\x50\
+\xe9\xcc\x07\x25\x6d\xe9\x1f\x11\x8c\x1a\xa9\xb6\xe4\x21\x24\x2f\
+\xbd\x7c\x9c\x0f\xd4\xe6\x80\x08\x4f\xa9\x90\x6c\x45\x99\x54\x41\
+\x41\x6d\x48\x12\x83\x24\x44\x6a\x33\x10\xbf\xb2\xae\x42\x16\xf4\
+\x4f\x6f\xbf\x88\x38\xa4\x4d\xfd\x47\xdd\x05\xe1\xe0\x3e\xb4\x46\
+\x58\x3c\x7a\x23\xbd\x40\x2c\xbd\xe8\xbe\xb8\x1c\x6f\x64\xd6\xe1\
+\x7e\x88\x89\xeb\xe5\x23\x75\xda\xae\xdf\x51\xc3\x49\x95\xa7\xeb\
+\x83\x42\x4c\x10\xc5\xd4\x60\xaf\xe9\xdb\x51\x37\xf5\x0d\x90\x4a\
+\x27\x22\x68\xac\x25\x48\xd6\xed\x68\xcc\x9f\x7b\x04\x8e\xb4\x11\
+\x52\x5a\xa7\x01\xd5\x48\xef\x16\xd1\x05\x29\x31\x37\xfd\xb1\xea\
+\xb5\xaa\x42\x19\x13\x6a\x4b\x43\x63\xd3\xd6\x61\x36\xa5\xa8\x25\
+\xb7\x33\xa1\xf6\x4a\x89\xf0\xb9\x01\xd5\xd5\x3b\xee\xed\x93\x19\
+\x27\xe3\x70\x0e\x92\x70\x03\xb2\x13\x31\x60\x8d\xbe\x62\xbf\x03\
+\xc9\x82\xb0\xf1\x52\xa4\x1d\x98\x2b\x90\x36\xe3\x02\xce\x41\x52\
+\x20\xb2\x75\xba\xd7\xb3\x55\x80\x5c\xb0\xe5\x41\x7c\x20\x30\x20\
+\x28\xf6\x03\x5c\x32\x2a\x28\xb8\x69\xde\xc5\x3c\xe1\x45\xf9\x96\
+\xb7\xbc\xc5\xb8\x5f\xa4\x02\x90\x1a\x5c\x37\xf7\x40\x50\x68\xdb\
+\x6c\x8e\x6a\xc7\xb5\x03\x20\x7f\xfa\xc1\xef\xec\x15\x90\x61\x91\
+\x6a\xb9\x54\xc8\x26\x03\x91\x89\x1c\x49\x22\x35\x2e\x7a\x7d\xf6\
+\x60\x5b\x4b\x6b\x38\xf4\xf0\xc3\x0c\x51\x75\x40\x8c\xa4\x26\xbb\
+\xe5\x96\x5b\xa5\x7e\x3a\xcd\xa4\x70\xfa\x42\xfb\xb4\xeb\x2e\xf6\
+\x10\x0c\x08\x08\x63\x67\x2f\x42\x3c\x90\x26\xf8\x0e\x21\x86\x10\
+\x30\x17\x8c\x8f\x39\xdb\xb8\xa9\xc1\xe6\x8c\xeb\x78\x6c\xd2\x4f\
+\xfe\xa6\x1f\xb4\xc5\x3d\xee\x59\xea\xc9\x72\x59\x67\xc6\xc0\x87\
+\x77\x79\xea\x2a\xae\xbb\xfb\x2f\x7f\x43\x28\x3c\x98\x99\x36\x78\
+\x67\xa6\x81\x1b\x58\x63\x7d\x41\xee\xfc\xc6\x3b\xf9\xee\xfd\xe4\
+\x79\xda\x63\xde\xe9\x1b\x63\xe0\xf9\xa3\x8f\x3e\xda\xd6\x80\xf9\
+\x85\xa0\xb9\xfa\x1b\xf8\xa5\xef\xf4\x07\x18\xf1\xe0\x6e\x42\x1a\
+\x90\xe4\x3c\x30\xdc\x83\xb7\x9d\x19\xf6\x70\x0a\x1f\x13\xf3\x43\
+\x3f\x5c\x65\x3a\x1a\x11\x40\x05\x8e\x7a\xbb\x47\x7b\xaa\xa0\x2c\
+\x2f\x6c\x6a\xdc\x20\x82\x93\x17\xd6\x6d\x5c\x19\x5a\x3a\x65\x9e\
+\xa8\x2c\x49\x07\xd7\x0e\xf5\xc9\x13\x72\x48\xf6\xe9\xca\xa2\xd0\
+\x25\x02\x34\x58\x28\x46\x57\x12\x6c\x96\x42\x29\x07\x8c\x24\x63\
+\x1d\xc9\xe4\xf0\x86\x73\x7b\x16\x19\x2d\x40\x64\x83\x31\xa9\x00\
+\x8d\x67\x58\x66\x11\xe0\x14\x00\x58\x36\xad\xa7\x4b\x71\xef\x16\
+\x17\x1b\xb3\x49\x32\xdd\x18\x66\xf5\x1f\x6d\x01\xec\xb4\x03\x70\
+\xb2\x31\x5d\xf7\x3c\xda\x22\x15\x08\xb9\xe4\xa5\xba\x23\x63\xf5\
+\x40\x41\xe8\xe9\x90\xb7\x59\xb7\x10\x3c\x86\x99\x7c\xd9\x6a\xf2\
+\x4b\x84\x64\xb1\x5d\x28\x95\xb6\xd4\x50\x3d\x44\xc5\x4a\x88\x49\
+\x15\x4b\x4d\x35\xd8\x1d\x2a\xf2\x2b\xc4\x05\x6d\x0b\xb5\x55\xd5\
+\xd2\xad\xef\x48\x27\xa6\x33\x62\x29\x89\x08\x40\xe9\xec\xee\x48\
+\xbb\x5e\x3b\x47\xca\x75\x77\xcf\xec\xef\x54\xfa\x08\x49\x2c\xfc\
+\xe6\xc1\x57\x5d\x71\xa1\x26\x77\x90\xe8\xd1\x66\x72\x5d\xbb\x23\
+\x53\x43\xca\x22\x7a\xbd\x85\x65\x52\x83\x29\x1d\x48\xb1\xd4\x36\
+\x52\xdb\xf5\x6b\x3c\xed\xd2\xa9\x97\x4b\xa2\x29\x2e\x43\xb2\x91\
+\x01\x57\x48\x98\xa3\x48\x63\x50\x7c\x71\x64\x5c\xe5\xbb\x90\x3c\
+\xef\x1e\x94\x4d\xa7\x57\x5c\x69\x3f\xaa\x2c\x11\x8d\xfc\x02\x11\
+\xd5\xa2\x32\x9d\x65\xeb\x30\xb5\x17\x92\x4b\x4c\x6c\x8c\x3c\xf1\
+\x3c\x2a\x32\xe4\x2e\x49\x0d\xb1\x3a\x6c\x57\x69\x26\x9a\x75\xf3\
+\x92\x49\xa1\x7a\xd4\xdd\x43\xc4\x0b\xc9\xfe\x26\x9b\x10\x5e\x85\
+\xfd\x83\xc5\xa1\x43\x36\x9b\xaa\x2a\xe9\xd2\x45\x68\xba\x64\xcf\
+\x09\xbd\x1a\x93\x24\xae\x3a\x49\x69\xdd\x7a\x77\x49\xac\x76\x1b\
+\x91\xc8\xe8\x62\x57\x57\x7f\xe8\x90\x34\x91\x97\xd7\x13\x6a\xb4\
+\x0e\x25\xea\x37\xef\xdc\xd2\xb4\xcd\xd6\xb5\x4c\xf6\x9a\x48\x7e\
+\xdb\xe9\xf8\x60\xd2\x58\x44\x23\x45\xd8\xc4\xc9\xc5\xf1\x2e\xee\
+\x5d\xe4\x4e\x2c\xac\x49\xe6\x7c\x67\xc2\xb6\x4b\xdd\xac\xb5\xdb\
+\x1b\xb9\xe6\xc4\x01\x38\x7c\xeb\x5b\xdf\x6a\xb0\xc8\x1e\x80\x60\
+\x42\x7c\xfc\x77\x10\x2b\x48\x07\x84\x03\x71\x02\x7e\x91\x60\x50\
+\xb5\xb8\x6b\x31\x48\x90\x3e\x39\x21\xf2\xf7\xb3\x7f\x22\x3b\x46\
+\xb5\xa9\xd9\x20\x5c\x20\x42\xb7\x77\xc2\xbd\x23\x11\x80\x20\x9d\
+\x13\x77\x9b\x27\x2a\x2c\xfa\x00\xc2\xac\x95\x1d\xa1\x1f\xf8\x56\
+\xbf\xe9\x23\x92\x41\x67\x9b\xd4\xa3\xb2\x49\xb4\x69\x5f\x21\xc5\
+\xb1\x5f\x3b\x60\xe4\x04\x2b\x13\x26\x4f\x0a\x47\x1c\x79\x64\xa4\
+\x4a\xd5\xdc\xa4\x04\xe3\xcc\x35\x48\xd2\xf7\x2f\xef\x63\xce\x90\
+\x18\xb8\x07\xe7\x16\xfe\x66\xac\x20\x6f\xee\xe7\x77\xe6\xcd\x13\
+\x38\x32\x76\xe6\x06\x24\x0d\xd2\x06\x21\x03\xdf\x5c\x67\x9e\xdc\
+\x33\x94\xdf\x33\x55\xea\x5c\x87\xd0\x62\xe3\x39\xf5\xd4\x53\xed\
+\x37\xfa\x8c\xa7\x18\x63\x62\x6e\xb9\x27\x92\xe6\xb5\x97\x35\x6f\
+\xfc\xce\x9c\xd2\x36\x73\xc1\x1c\x81\x97\xf0\xdc\xe4\x1e\xd6\x9e\
+\x7b\x18\x0f\x8c\xaa\x13\x6f\xdf\xaf\xf4\x93\xbf\x91\x44\x68\x3b\
+\x53\xad\xc9\x3c\xb8\x67\x98\xe3\x38\xa4\x26\xee\xc7\x4e\xcd\x7b\
+\x58\x27\xb7\xb9\xd2\x2f\xfa\x99\x19\x96\xe1\xc4\x89\xb3\xe7\x58\
+\x1c\x0d\x7f\xb1\xff\x0a\x4a\xf3\x42\xb7\x98\xd0\x72\x31\x94\xdb\
+\x9a\xb7\x84\xb2\x9a\x92\xf0\xd8\x13\x8f\x8a\xc8\xc8\xb6\x23\x7c\
+\x60\x21\x15\x1d\xca\xf1\x28\x4d\x79\x71\x9e\xb4\x1f\x05\x55\xda\
+\xd3\x2a\x05\xa0\x6c\xfe\x15\x62\x2a\xb0\xcd\x8c\xe2\x7c\x73\xe0\
+\x10\x19\xa7\x30\xa3\x49\x32\x3e\xe9\x00\x0d\x80\x65\xde\x39\x71\
+\x5a\x6a\x4f\x18\xc9\x3d\x00\x08\x8b\xc6\xa2\xbb\x4d\xc6\x23\xe6\
+\x7d\x92\x47\x92\x64\x58\xbc\x4d\x5b\x36\xd9\xf3\x87\x1c\x72\x88\
+\x79\xb6\xb1\xc9\x9c\x83\xcc\x96\x96\x01\x0e\x1e\x4e\xa0\xa4\x8c\
+\x7c\x62\x95\xb2\x59\x93\x53\xac\x50\x62\xa6\xe6\x57\x04\x06\x35\
+\x4f\xeb\xf6\x16\x89\x9e\x85\xa1\x4c\x44\xa7\x5f\x5c\x77\xa1\xd4\
+\x3e\x7d\x92\x0c\xba\x24\x29\xb4\x8a\x13\x28\x14\x82\x2c\xaa\x1b\
+\x17\x5a\x05\x90\x79\xa5\x65\xe2\x14\x94\x42\x46\x00\xe2\x5c\x14\
+\x40\x9b\x4f\x62\xbe\x58\x02\xc0\x1a\x9d\x4f\x90\x26\x9c\xa3\x36\
+\x61\xa7\x6c\x2d\xda\xe7\x76\x14\xe8\x1a\x07\x16\x0c\xe3\xaa\x24\
+\xe9\xa5\x74\x3f\x1a\x28\x90\xb2\xbb\x18\xa2\x06\xe4\x7b\x4a\xde\
+\x70\x85\x25\x42\xac\xe2\xe8\xcb\x44\x54\x4a\x8b\x24\xd1\x48\x35\
+\x96\x42\x05\x25\x51\x19\x9d\x6c\x91\x24\x86\x3c\x61\x55\x20\xc6\
+\xdc\x36\x51\xa2\xa1\x1b\x93\x3a\x2b\x85\xa1\x1b\x17\x68\xa9\xae\
+\x50\xbd\x95\x15\x80\x3c\x64\xd8\xd6\x3c\x0c\x0e\xc9\x40\x2f\xc7\
+\x80\x56\x39\x3c\x40\x4a\x22\x59\x05\xec\x0c\xc1\x8a\x88\x8b\xc8\
+\x95\x00\x14\x83\xbd\x7b\x1b\xc5\x12\x4d\x86\x90\x5d\x35\x09\x1b\
+\x94\xe6\x79\x48\x29\x84\xc4\x71\x0d\xaa\xcf\x83\x83\x2a\x46\x27\
+\x49\x2c\x05\x77\x2f\xc3\x67\x45\x45\x5d\x18\x94\xd4\x56\x5a\x22\
+\x0e\x50\x93\xd1\x9f\x27\x09\xaf\xaa\x5e\xd6\x22\xd9\xf3\x34\x07\
+\xa3\x79\x7f\x99\x14\x22\xc6\xa0\xa2\x4c\xea\x00\xf5\xad\x1c\x95\
+\xa9\x36\x4e\xaa\x79\x3b\x33\x18\xc6\x8f\xab\x0b\xcd\xdb\x9a\x4c\
+\x52\x33\x56\xc1\x9c\x17\xf8\xcb\x74\x7d\x46\x26\x4b\xb5\xf6\x26\
+\xc5\xc6\xf9\xe1\x98\x77\x77\x58\x31\xb5\x5b\x9c\xbd\x96\xb3\x23\
+\xf9\x4c\xbb\x0d\xf7\x78\x30\x2f\xc4\x00\xa4\x0c\x22\x02\x41\x99\
+\x07\xa0\xa4\x00\x47\x98\x20\x55\x0f\x7c\xe4\x5a\x99\x38\x61\xf7\
+\xb2\x04\x29\x9d\x73\xce\x39\x86\xe4\xe0\xe6\x3d\x17\x1e\x84\xc4\
+\x9f\xf7\x7d\xe0\xb6\x0d\xde\x83\xe4\x03\xac\xad\x5c\xb9\x32\x2d\
+\x01\xb9\x23\x4d\x26\x77\x0e\x02\x04\x91\xb2\x1f\x70\xab\x47\xf2\
+\x80\x99\x53\xb1\xda\x70\xf8\x51\x47\x9b\x04\xb9\x45\xfb\x68\xc1\
+\xdc\x39\x52\x6b\x09\x81\x6a\xad\x9c\x53\x47\x72\x69\x93\xe1\x9f\
+\x7e\x9c\x7a\xea\xe9\xe9\x3c\x7b\x33\x66\x4b\xe5\x22\xd8\x41\x0d\
+\xc6\x78\x69\xdb\xf7\x3b\x2a\x40\xde\x03\xd7\xcf\xb8\x20\x60\x4e\
+\x3c\xd9\xff\x6e\x17\xda\xb4\xb9\xd1\x9e\x41\xa5\x86\x5a\x8e\x7b\
+\xdc\x16\x45\x9f\x3d\xed\x12\x7f\x33\x1e\xb7\xef\x42\x98\x99\x4b\
+\x97\x06\x58\x1b\x27\xd6\x5c\x77\xe2\xc1\xd9\x99\x4f\x8f\x3f\xa1\
+\x7d\x53\xad\x0a\x16\x3c\x17\x21\xed\xb3\x3e\xb4\xef\xaa\x2e\x9e\
+\xa5\x2d\x3e\x10\x6d\xde\xef\xaa\x3b\x27\x5a\xee\xe0\x40\x7b\x3c\
+\x07\x0c\x78\xd2\x4b\xb7\x4d\xf1\x0c\xe3\xe5\x79\xde\xc1\x78\x7d\
+\x9e\xa6\x6a\x0d\x57\xad\x7a\x26\x1d\x27\xe3\x04\x9b\xbe\xed\x4e\
+\x8c\x0c\x9e\xb5\x25\x22\x26\x38\xd3\x44\xde\xb3\x83\x51\x5e\xc6\
+\xf2\xa2\xd0\xd6\xd5\x26\x1b\x9a\x98\x4c\x69\x48\x08\x47\x64\xfd\
+\xac\x9a\xae\xee\x07\x27\x54\x56\x95\x87\x1d\x22\x32\xa3\x1c\x07\
+\x0c\x91\xb1\xfe\x65\x93\x64\x7c\x51\xdc\x53\x86\x05\x6b\xd2\xc6\
+\x2f\x17\x37\xc4\x84\x02\x00\x9e\x30\xd3\xc5\x4c\x00\x96\xc5\x76\
+\x60\x19\x2e\x1d\xf9\x3b\xb9\xce\x26\xae\xa9\xa9\x35\xa4\x72\x8f\
+\xe2\x63\x10\xcd\xd9\xb8\xee\xcd\xc2\x42\x8f\x76\x60\xb0\x2e\xa9\
+\x94\x4f\xbc\x54\x5c\x5d\x3d\xf2\x2e\x12\xa5\x57\x36\x05\x43\xdc\
+\x42\x01\xe2\xc0\x25\x5d\x88\xbb\xc7\x98\x50\x22\x89\xa0\xa7\x97\
+\x84\x9e\x8a\xe0\x97\xb4\xd0\xdf\xd7\x65\x04\x27\xd5\x3b\x20\xc4\
+\x56\xf1\xac\x4c\xcb\x00\x93\xc7\xe7\x18\xd7\xc7\x02\x0b\xc9\x03\
+\x8c\x4e\x2c\x55\x0f\x21\x74\xb7\xb6\x8b\xc3\x88\x9c\x0f\x5c\x25\
+\xe6\x08\xcd\xbf\x67\x72\x34\x8e\x38\x00\xc0\x2e\x49\x32\x55\xf5\
+\x53\x0d\x85\xf6\x76\xc9\x71\xa2\x6b\x87\xbc\xb5\x52\x92\xac\xa4\
+\xee\x93\x5b\x54\x57\xdb\x0e\x79\x4b\x29\x6b\x33\xd9\x9c\xa5\x5a\
+\x6b\x6b\x93\x21\x50\x92\x41\xb5\x10\x38\xe7\x96\xf6\x96\x90\x57\
+\x26\x07\x00\x53\xa5\x49\x05\xa7\x8f\x34\xf8\x32\xb3\x28\xbb\x74\
+\xa1\x10\xbe\x08\x6d\xff\x40\xe4\x45\x16\xd9\x32\x44\x4c\x20\x32\
+\x79\x11\x81\x91\x4e\x51\xd7\x25\x45\xb8\x94\x90\x56\x9b\xf9\x8c\
+\x53\xa5\x4f\x5c\x6b\x7f\xb7\x3e\xb8\xa7\x8a\x20\x49\x47\x67\xae\
+\xa4\x6a\x63\x08\xc9\xc5\x88\x59\x61\x68\xdc\xda\x10\x66\xcc\x9a\
+\x69\x9e\x66\x18\x9c\x51\x77\x91\x1b\x6c\x00\x57\xe1\xf8\xfd\xc3\
+\xcf\xf4\x07\xfb\x13\x84\x05\x24\x38\x28\x89\xad\x0a\x9b\x8e\x6c\
+\x74\x75\x52\x59\x9c\x74\xc2\x71\x52\x5b\x56\x47\xea\x40\xa4\x2f\
+\xbd\x16\xe9\x15\xf2\x92\xb6\xcd\xc8\xe3\x6d\x40\xcc\x42\xa6\x5b\
+\xaf\xab\xcc\x32\xd7\x6f\xb8\x34\xed\x84\xa6\xb1\xb1\xc1\x10\x36\
+\xeb\x0a\xe7\x0c\xcc\x82\x30\x51\xc1\xf0\x8c\x7b\x08\x62\x13\x01\
+\xa1\xc1\xc5\x7a\xc0\x6d\x67\x5c\xab\x04\x35\x97\x23\x49\x7e\x07\
+\xe1\xb3\x17\x3c\x68\xd0\x18\x95\x98\xc8\x71\x46\xf2\x07\xce\x61\
+\xb0\xb8\x97\xbe\xf3\x71\xef\x4e\xd4\xc5\x20\x1a\xf7\xd4\x73\x42\
+\x47\x1f\xe9\x17\x9e\x9f\x1e\x10\x5d\x5c\x52\x16\xea\xeb\x6a\xad\
+\x1d\x3c\xff\x16\x4a\x0a\x60\x7d\x3a\x3b\x22\x7b\x0b\x6a\x35\xa4\
+\xab\x16\xc1\x29\x6a\x34\xbc\xec\xfa\xb1\x9d\x11\x3b\xa4\xfd\xeb\
+\xf9\xfc\x58\x71\x90\x2c\x84\x0f\x82\x82\x11\x9f\x36\xcd\x59\x20\
+\x46\xe8\xe6\x4d\x26\x89\xce\xed\x3f\x8c\x8b\x36\x98\x3f\xce\x3e\
+\xa7\xe0\x0a\xdf\x33\xc0\x39\x7f\xc3\x70\x22\x3d\xb8\x23\x11\xcf\
+\x42\x60\x90\x74\x78\xde\xd4\x7b\xda\x73\xbc\x8b\x77\x42\x9c\xf8\
+\x8e\x64\x84\xba\xca\x3d\x5b\x5d\x25\xc5\xf3\xb4\x07\xfe\xa1\x7d\
+\xcf\xea\xee\x6a\x53\xda\xa3\xbf\x9e\xa5\x9d\xfb\xc0\x4b\x6e\xf7\
+\x41\x82\x32\x1b\x6c\x9c\x92\x86\x33\xd7\x58\x5b\x27\x0e\x8c\x07\
+\x8d\x0a\x76\x1c\xc6\xec\x2e\xe4\xde\x17\xe6\x8c\xf9\xa0\x8f\x30\
+\xc8\x3e\x36\x73\x88\x89\x25\x9c\x51\x91\x57\xfc\xc3\x90\xa8\x46\
+\x55\x45\xb5\x70\x58\xbb\x3c\x17\x67\x4a\x8a\x79\x44\x38\x4d\xda\
+\x08\x69\x5c\xfa\x24\xc1\xa4\xe4\x55\xa6\xad\x26\xf5\xbc\x54\xdf\
+\x5d\xd2\x24\x0c\xb4\x85\x71\x72\x4a\xea\xed\x96\x04\x1e\x22\x67\
+\x99\x2c\x44\xc6\xf5\xe0\x49\xdd\xc8\xfa\x7b\xae\x86\xff\x74\xe3\
+\xa3\x11\x1a\xd3\x93\xc7\x9b\x84\x49\x64\xe1\xaa\xa5\xd6\x48\xbb\
+\x32\x6b\xd3\x7b\xfc\x0c\x93\xcf\xe4\x72\xbf\x27\x23\xf4\x76\x47\
+\x52\x99\xc1\xe2\x77\x74\x74\x99\x77\x19\xc7\x65\x97\xbd\x36\x5c\
+\x75\xd5\xf7\xd3\xb9\x87\x9c\x6b\x1c\x6d\x06\x30\x1c\xd7\x89\xf3\
+\x7c\xe6\xc1\x47\xc3\xed\x77\xdc\x2f\xcf\x0b\x21\xe9\xf2\xfa\x50\
+\x59\x33\x51\xea\x1b\x95\x14\xe8\x50\x4a\xf7\xca\x1a\xd3\xd9\x63\
+\xb8\xee\xee\x69\x13\xf5\x2f\x93\xfa\x40\xae\x85\xe2\x14\xe8\x67\
+\x97\xbc\xce\x0a\xb4\xa2\xf5\x75\xf5\xa1\x71\x7b\xa3\x79\x5d\x55\
+\xc9\xc5\x19\x6f\xad\x01\xa9\x87\x38\x17\x22\x5d\x88\x20\xe0\x54\
+\x50\x8a\xb1\x4d\x88\x7f\x40\xc4\xa9\x48\xd2\x07\xc6\xf8\x32\x21\
+\x3a\x14\x3a\xb8\x5c\x22\x65\x44\xf9\xdc\xa2\xef\x38\x33\x74\x74\
+\xc0\xfd\x50\xf9\x8e\x7c\x46\x00\x36\xe2\x7e\x64\x20\x34\x95\x8e\
+\x56\xb1\xab\xa3\x59\xb6\xbf\xf6\x70\xd4\xa1\x0b\xc2\x0b\xcf\x3d\
+\x35\x4c\x9d\x5c\x1b\xda\x76\x6c\x0d\x9b\xa4\x7a\x00\xb1\x40\x64\
+\x36\x6c\x50\x8a\x0c\x39\x1a\xcc\x98\x3e\xc3\xce\x03\x9b\xf2\xc3\
+\x84\x59\x13\xc3\x86\x86\x2d\x61\xd9\xf2\x75\x61\xc5\xca\x8d\x62\
+\x00\x24\x4a\x0f\xc9\xf5\xb1\xa2\x5e\xde\x6e\xa8\xb1\xd4\x47\x27\
+\x1e\x31\x81\x31\xe2\x02\x91\x31\xf2\x16\xa9\xe2\x76\xc6\xc7\xe0\
+\xca\xec\xdf\xe5\x46\x2a\x84\x8f\xd7\x5e\x89\x24\x98\xda\xf1\xb5\
+\x61\xda\x94\x89\x52\xbb\x8c\x97\x97\x5c\x94\xca\xa7\x5f\xba\xe2\
+\x0d\xeb\x64\x5b\x78\x66\x6d\xa8\x9d\x32\x53\x0e\x12\xb5\xd6\xd7\
+\x56\xd9\xae\x3a\xb5\x29\x2a\x44\x6c\x38\x3c\xaf\x45\xe6\x19\x15\
+\xd8\x00\xd2\xa5\x90\x23\xc8\xb2\x40\xb9\x04\x6b\xc5\x70\xac\x6c\
+\xdc\x1a\x9e\x5c\xfa\x44\xd8\x22\x83\xea\x5b\x2f\x7f\x4b\x44\x58\
+\xcc\x21\x21\xea\x2b\x47\x24\xdd\xe4\x9b\xcd\xa0\x4d\xea\x06\x08\
+\x04\x48\x09\xb8\x04\x59\xc2\x79\x72\x46\xa5\x32\x12\x81\xb1\x3e\
+\x09\x56\x3d\xeb\x37\xcf\x2d\x5c\xb8\xd0\xbc\xa6\x90\xa6\x1d\x7e\
+\x5d\xe5\xc9\x5a\x41\x70\xf0\x5a\xc2\x53\xcc\x02\x20\x45\x30\x2c\
+\x35\x90\x88\x0f\x44\x03\xa4\xe5\x41\x88\x10\x1b\x90\x25\xc4\x09\
+\x4f\xb1\x17\xbe\xf0\x85\xe9\xe8\x73\x90\x2a\x29\x93\x4e\x3f\xfd\
+\x74\x23\x02\x6e\x77\x00\x99\x81\x04\xc9\x16\x41\xdf\xe9\xb7\x7b\
+\xa4\x31\xd7\x20\x52\xc6\x09\xd2\xe5\x7d\xb4\x63\xdc\xb5\x98\x8d\
+\xed\x42\xa0\xab\x56\xae\x30\x42\xb2\x65\xcb\x56\x43\xae\x87\x1d\
+\x76\x58\xf8\xfd\xef\x7f\x6f\x25\x2e\x5c\xdd\x6d\x92\xad\x54\x9b\
+\x83\x82\xeb\xbb\xef\xb9\xcf\xa4\x0f\xde\xe3\x41\x84\xcc\xc1\xef\
+\x7e\xf7\xbb\xf0\xa2\x17\xbd\x28\x6d\x4f\xc1\x9e\x01\x82\x85\x98\
+\xf2\xc1\x31\x82\x67\x40\xdc\xcd\xcd\xd1\x9c\x13\xb8\x6c\xea\xba\
+\xd8\xae\xe1\x8c\xa7\x07\x41\xd3\x4f\x6c\x4f\xce\xac\x31\x0e\x10\
+\x38\xa9\xab\x78\xb7\x4b\x00\x6e\xaf\xe1\x7e\x88\xf1\x8d\x37\xde\
+\x18\xde\xf4\xa6\x37\xd9\x3c\x40\xf4\x30\xb4\x83\xf0\xf1\x02\x64\
+\x4e\x78\xce\xed\x65\x8c\xd9\x19\x54\x0f\x50\xf5\xf4\xff\x10\xa4\
+\xab\xaf\xbe\xda\x88\x08\x84\x95\x3e\x03\x23\xcc\x8b\xab\x35\xef\
+\xbb\xef\x3e\x93\x2c\x19\x2b\xb0\x04\x7c\xf0\x3e\x8c\xfe\xec\x41\
+\x5f\x13\x60\x22\xca\x56\x2f\x27\x1d\x31\x9a\x10\x19\xbc\x11\xe9\
+\x3b\x38\x8b\xb6\x69\xc3\xe3\x02\x47\xa5\x02\xda\x0c\xbd\x22\x24\
+\x65\x55\xca\xde\x2f\xdb\xe4\x21\x0b\x0f\x09\xf7\xdd\x75\x77\xe8\
+\x6e\x13\x33\x2b\xdb\x4c\x69\xb9\x9c\x92\x84\xd3\x58\xab\x0a\x69\
+\x09\xf2\x55\xb4\xb8\x4c\x1e\xb2\x8b\xe6\x2e\x10\x63\x26\xb5\x59\
+\x8f\x98\x17\xf3\xdd\x1a\xf1\xd8\xc5\xa1\x2b\x17\x2a\xb3\xd7\xde\
+\x03\xb8\x30\x6b\xa1\x4f\xd9\xb8\x76\xdd\x37\x35\x31\x87\xbb\xee\
+\xda\x55\x61\xae\x77\xa5\x73\x4c\x1a\x08\x19\x71\x96\xfc\x65\x88\
+\xf6\x2e\x12\x03\x34\xe4\x3b\xf3\x94\xf8\xbe\xf0\x2c\x1c\x13\xee\
+\x6e\xcc\xa6\x3e\x8a\x6d\x19\x00\xaa\x45\xe2\xea\x3b\x7a\x7e\xd4\
+\x0e\x00\x05\x6d\xe3\xd6\x89\x31\x10\x40\x07\x30\xf0\x6e\x61\x43\
+\x01\xb4\xc4\xae\x7c\xf3\x9b\xdf\x0c\x5f\xf9\xca\x57\xec\x9e\x33\
+\xcf\x3d\x3f\x7c\xed\xdb\x3f\x0c\x3f\xfa\xe9\x2f\xc2\x77\xbf\xf7\
+\x73\x11\x9a\x07\xc3\xcc\x39\x07\xc9\xe3\x46\xd9\x68\x8b\x2a\xf5\
+\x6e\xa4\x1b\x71\x05\x32\xd8\x13\x6f\x53\x5d\x23\xf1\x5d\x41\x9e\
+\xad\x6d\xb2\x23\x4d\x1a\x27\x0e\x65\x95\x80\xb2\x32\xd4\x8c\x1b\
+\x6f\x36\x9b\x16\xf9\xc1\xd7\x48\x5d\x26\x2f\x81\xd0\x26\xbf\xfc\
+\x89\x53\x26\xd9\x79\xea\x8c\x69\x61\x9d\xe2\x13\xb8\x5e\x2e\x64\
+\xc8\xf7\xe5\xf2\xf3\xaf\x14\x97\x0d\xda\xcb\x97\x4b\xf1\x56\xc5\
+\x05\xcc\x9b\x3f\x37\x6c\xde\xb4\x45\x71\x0b\x72\x63\x94\x4a\xae\
+\x53\x7e\xf7\x25\x22\x26\xb5\xf2\xff\x6f\xd7\xe6\x86\xfd\xae\x95\
+\xbf\x7e\x83\x90\x28\x0a\xac\xc9\xe3\x65\x24\x6f\xde\x1a\x0a\x25\
+\xb5\xd4\x8f\xab\x52\x7f\xb7\xc9\x35\x51\x9e\x31\xed\x0d\x32\xd4\
+\x36\x84\xc3\x0f\x59\x14\x6e\xbe\xe1\x7a\x8b\xdd\xf8\xef\xef\x7c\
+\x3f\x7c\xfe\x73\x5f\x0e\xa7\x9e\x72\x66\xd8\xb4\xb1\x51\x86\xcc\
+\x95\xa6\x67\xff\xe5\x1f\xae\x0e\xdf\xfb\xd1\x55\x61\xe1\xa2\xc3\
+\xc3\xfb\x3f\xf8\xf1\xd0\xda\x2e\xd7\xda\xca\x09\x0a\x0e\x15\xf0\
+\xca\x33\xae\x40\x9c\xd0\x56\x21\x3c\xa4\x8c\xad\x0a\x4e\x25\x66\
+\xa9\x7e\x42\xad\xfa\x49\xf6\x81\x29\xda\xf4\x45\x61\x47\x8b\xea\
+\x06\x29\x6e\xa2\x4f\x9e\x5a\x38\x2b\x94\x56\x94\x4b\xdf\x5b\x16\
+\x56\xad\x5d\x15\x16\xce\x9f\x17\xd6\x6f\x5a\x2b\x6e\x4b\x44\x51\
+\xf6\xa9\xb3\xcf\x3c\x4d\x41\xb2\x33\x35\x0f\xb2\x71\xf5\xb6\x0b\
+\xd8\x95\x0d\xbb\xa3\xdd\x10\x29\x6b\xc8\x66\xc4\x00\x0e\x1c\x81\
+\x9c\x70\x4f\x25\x28\x0e\xb8\x00\x49\x3b\x87\xcf\xda\x9e\x76\xd2\
+\xf1\xa1\xb2\x44\x46\x60\x49\x3e\xb5\xd5\x55\x8a\x37\x52\xd6\x6d\
+\x49\xc8\x3f\xfb\xb1\xd6\xf4\x07\xdf\x0e\x2f\xbb\xf4\x15\xe1\xab\
+\x5f\xf9\x72\xe8\x94\xbd\xac\x54\x84\xa8\x57\xdc\x5e\xb1\xa4\xd2\
+\x32\xe9\xaf\x2b\xf5\x79\x66\xe5\xea\xf0\xce\xf7\xbe\x27\xbc\xe6\
+\xb5\xaf\xb7\xf7\xb9\x6a\x06\x66\x07\x24\x81\x44\x70\xd6\x59\x67\
+\x19\x0c\x41\x08\x40\xe0\xc0\x2b\x1f\xfa\x0a\x02\x21\xfe\x82\xc3\
+\x13\x11\xc2\xed\xa2\xee\x02\xc9\x79\x2c\x98\x33\x5a\x10\x1e\x88\
+\x90\x23\x7c\x0c\xff\x86\xe8\xd5\xff\xbf\xff\xfd\xef\xb6\x07\x68\
+\x17\xb8\x87\xf8\xb0\x47\xcc\x8d\x5e\x76\x10\xe0\x97\x3d\x01\x52\
+\xc4\x66\x01\x62\x82\x73\x66\x1f\x80\xac\x5d\xba\x61\x8e\x68\xc7\
+\x33\x91\xf3\x2e\xf7\x56\xa2\x5d\xfa\x46\x7f\xdc\xa6\x43\xbb\x8d\
+\x82\xa7\xca\xf2\xaa\x70\xe4\xd1\x47\xd9\xfb\x18\x3f\xf3\xe1\x6e\
+\xe6\xc4\xf0\x70\x0d\x24\x49\x5b\x25\x9a\x3b\xa4\xf7\xf2\xf2\x52\
+\x43\xf4\x10\x02\x97\xd4\x78\x3f\xc4\x02\x82\xc7\xbb\xfd\xba\xbb\
+\xf7\x43\x94\x4d\x6a\x8a\xe7\x78\xf5\x9a\x0d\x69\x09\xd0\x39\x7d\
+\xde\x0d\xe1\x64\xce\x19\x97\x7b\xa3\x32\xdf\xec\x7d\x6c\x2e\xc0\
+\x06\xaa\xaa\xc8\xc3\x2f\x72\x87\xf7\xb1\x02\x23\x7c\x77\x3b\x18\
+\x44\xc5\x63\xf3\x1c\xef\xf0\x3c\x44\x85\x7e\x78\x86\x0f\x1f\x37\
+\xef\x66\xae\xdc\x79\xc2\xa5\x54\xd6\x04\x9b\x93\x97\x33\x71\xa7\
+\x14\x18\x02\xde\xe9\xc4\x8e\x7e\xf3\xb7\x33\x0c\x91\xbb\x72\xa4\
+\x06\xf4\x52\x20\x91\x44\x37\xce\xb4\x0c\x7d\x8a\xe7\xe3\x5e\x60\
+\x1f\x22\xc6\x3b\x80\x27\xcf\xf6\xee\x31\x64\xac\x3d\xe3\x70\xbb\
+\x0e\xeb\x4c\xac\x19\x0e\x00\xa5\xd2\xb0\xe4\x49\x05\xbd\x7e\xf3\
+\x3a\x73\xae\x29\xd2\xbe\x82\x10\x03\xab\x96\x49\x5e\xaa\x67\x18\
+\xd3\xda\xca\x3a\xa1\x11\xc5\xda\x49\xc5\x3c\x20\xc6\x17\x8f\x5a\
+\x63\x12\x63\xdc\x4a\x3f\x78\xbf\xd6\x6d\x95\xae\x7d\x56\xd2\xf2\
+\x2f\x35\xfe\xac\x2e\x68\x49\x04\x68\xbf\x13\x19\x00\xc0\x45\x51\
+\x26\x8b\x34\x29\xe8\x6b\x59\x50\x80\xe6\xc9\xa7\x9e\x0c\xbf\xbd\
+\xf6\xb7\x36\xb9\xee\x55\xe6\xc6\x44\x08\x8b\x6f\xde\xd1\x88\x4c\
+\x95\xa4\x98\x6e\x2d\x22\x9b\x9b\xec\x02\x3f\xfa\xd1\x8f\x4c\x8d\
+\x40\x1c\x01\x40\xc2\x62\xbb\xe7\x19\x3a\x69\xb8\x3f\x38\x3d\x00\
+\x7d\xee\xbc\x25\x61\xd5\x86\x06\x3d\x77\xa1\x71\xca\x9f\xfe\xdc\
+\x2f\xc2\xaf\xaf\xbd\x4e\xc8\x64\x86\x8c\xe6\x10\x0b\xa9\x04\xb4\
+\x18\x00\x79\xb1\x74\xf7\xa8\xcb\x6a\x6a\xcb\x84\xd0\x2a\xc2\x8a\
+\x67\x9e\x52\x30\x9d\xf2\x9a\xf5\xc1\x31\xc8\x2e\x12\x1b\x77\x59\
+\x54\x80\xd1\x7d\xf2\x01\x64\x77\x6f\x65\x43\x00\x18\xb4\x07\xc2\
+\xa2\xe8\x55\x51\xa5\x5c\x55\x4d\x62\x29\xb7\x4d\x65\x7a\x72\x11\
+\x65\xda\x61\x43\x62\x38\x64\x0e\xd8\x6c\x9e\xd4\xcf\xdb\x98\x3d\
+\x75\x62\x68\x58\xb3\x3c\xcc\x9f\x35\x49\x08\x76\xbd\x00\xa9\x37\
+\xbc\xea\x95\x17\x85\x25\x0b\x67\x85\xcd\xeb\x9e\x09\x17\x9c\x7f\
+\x56\xe8\x12\xc7\xb4\x55\xef\x9b\x3d\x73\x4e\xb8\xf1\xef\xb7\x84\
+\xb3\xcf\x12\x47\xdc\x3b\xa4\x40\xbe\x67\x4c\xf2\x9a\x30\xad\x2e\
+\x4c\x97\x2b\xe5\xe1\x87\x1f\xad\xc0\xc9\x10\xbe\xf0\xa5\xff\x56\
+\x3c\xc5\xbd\x92\xc6\x14\x08\xda\x26\x87\x04\x49\x69\x65\x72\x63\
+\xde\xd2\xa8\x36\x74\x5f\x9e\x64\xef\x5e\x11\x0b\x2a\x0c\x34\xb7\
+\x52\x0f\x47\x84\x4e\xed\x81\xb4\xe8\x63\x14\x31\x8d\x81\xb6\xd3\
+\x10\x68\xaf\xd4\x8a\xfc\x8d\xde\x18\xdb\x4d\x57\x77\x5b\x38\xfe\
+\x84\x63\x4c\x4a\x1b\x90\x6f\xff\x84\xba\xd2\xb0\xf2\x99\x27\x4d\
+\x0a\x70\xcf\x2c\x88\x0c\x06\x57\xd4\x4e\x6c\x4c\xda\x71\x17\x4f\
+\xbc\xa9\xf8\xce\xda\xce\x9c\xae\xb3\x20\xb8\x4a\x44\x6d\x5b\x53\
+\x83\x11\xb6\x46\xc5\x4d\xfd\xfa\xe7\xff\x63\xb2\xd7\xb1\xc7\x9c\
+\x10\xfe\xe7\xbf\xbf\xa3\xc0\x4f\x79\xe7\x49\x29\x8d\x3a\xad\x14\
+\x0f\xbf\x38\xf8\xf2\xd6\x5b\x6f\x0d\x9b\x9b\x1a\xc3\xcb\x5e\xfe\
+\xca\x28\xa2\x3f\x2e\x82\xc7\x5a\x7a\xbd\x21\xb8\xd7\xf7\xbc\xe7\
+\x3d\x69\x29\x23\x33\x48\x32\xaa\xf7\xd3\x91\x46\xf4\x7c\x67\x63\
+\x83\xf8\xdd\x76\x00\x01\x60\xad\x79\x8e\x7d\x00\x92\xa4\x7d\x63\
+\xc6\x34\x06\xb3\x53\x20\x0f\x0a\x29\x02\xab\xac\xad\x1b\xac\xf9\
+\xce\x75\xe0\x16\x89\xc1\x91\x0d\x88\xde\x63\x6a\x68\xd7\x91\x2b\
+\xf7\x83\x50\x81\x23\xe6\x92\xfd\xe5\x63\xf2\xbd\x40\x5b\xdc\x03\
+\x92\xe3\xda\x04\x21\x3a\x2f\x63\xc0\x73\x55\x92\xdc\xbb\x14\x7b\
+\xe5\x41\xcd\xee\xe9\x66\xc5\xf8\xe4\xb4\xd1\x25\x47\x09\xfe\xe6\
+\x60\x0c\x5d\x8a\xa3\x72\xa4\xce\xbb\x3c\x64\xc1\xe3\xe1\xf8\xce\
+\xfe\x73\x86\xd1\x3d\xba\x20\xc2\x66\x8f\x6a\xef\x36\xc9\x80\xbe\
+\xbb\x93\x02\xf7\xf3\x1b\xcf\x70\x3f\x04\x9f\x83\xfe\xd2\x6f\xec\
+\x3c\x8c\xcf\x8d\xe3\x20\x5e\x57\xc9\xb9\xf3\x06\x7d\x02\x67\x40\
+\x30\x08\x5a\x85\xf8\xb1\x8f\xe8\x23\x7b\x8b\xc3\xcb\x90\xb8\x4a\
+\xcc\x24\x5c\x3d\xe3\x1a\x10\xc6\x00\x91\x64\xff\x5a\xdc\x90\xfa\
+\xec\xfb\x14\x26\x07\x42\xef\xeb\xe0\x89\x75\xfd\x1e\xf6\x00\x6d\
+\xb1\x96\x38\x66\x30\xef\xcc\x85\x13\x8e\xc8\xde\x23\x29\x48\xfd\
+\x63\x2f\x98\x8d\x4e\xd7\xdc\x8d\xd9\x6d\x3c\x8c\x9d\x39\x60\x2f\
+\xb8\xca\xcd\x99\x1a\x08\x4c\x65\x59\x24\xb1\xf6\x2a\xe4\xa2\xa9\
+\x69\x4b\x98\x36\x6b\xaa\xce\xda\x0b\xb2\xb7\xd4\x28\x58\xb6\x58\
+\xcc\x15\x7b\x07\x82\x52\x29\x06\xb8\x6d\x47\xbb\xf0\xd3\x54\xf9\
+\xba\x44\x19\x57\xa2\x20\x94\x88\x81\x77\x98\x65\x1d\x04\xc3\x6b\
+\xf4\xfd\x33\xda\x87\x3f\x56\xfb\xd1\x84\xed\xe5\xb1\x2f\xd4\x65\
+\xae\xc1\x18\xb1\x0b\x00\x02\x0b\x03\x80\x80\x3c\x11\xd5\x19\x1c\
+\x9b\xcf\xd2\xca\x08\x31\x38\x95\x67\x43\x71\xaf\xe7\x25\xf3\x05\
+\xcf\x36\x36\x74\x92\x78\x4b\xf1\x41\x75\x76\xe6\x99\x67\xdb\xf3\
+\x4b\x96\x1c\x6c\xc0\xcd\x86\x76\xff\x74\x6f\xe7\xe4\x93\x4f\xb5\
+\x3f\xf9\xfd\xc4\xe3\x8f\x31\xef\x8b\xb5\x52\xd9\x5c\xf9\xae\xd7\
+\x84\x57\x5e\x7c\xb6\xf4\xcf\xf2\xde\x91\xfb\x72\xab\x36\x40\xad\
+\x80\x0c\x62\xb2\x7c\xc5\xd3\xe1\xb8\xe3\x0e\x92\x0a\xa6\x51\x5c\
+\xfc\xc6\x30\x7f\xc1\xeb\x2d\xd2\xb9\xa6\x7e\x72\xb8\xeb\x9e\x07\
+\x0c\x38\x00\x02\x38\x38\x00\x9b\x8d\x88\x9a\x01\x20\x65\x0e\x18\
+\x23\x00\x49\xde\xb3\xe3\x8e\x3b\xce\xfa\x74\xaf\xc4\xeb\x83\x0e\
+\x3d\x24\xcc\x9c\x5d\xab\xb2\x01\x37\x86\xf3\xcf\x3f\x47\x5c\xea\
+\x26\xdb\x30\x5e\xc4\x6c\xf1\xe2\xd7\x1a\x10\x41\x6c\x40\xc4\x00\
+\x2f\xc8\x00\xf5\xc2\x0e\xa5\xa2\x21\x29\x4c\x59\xa9\x2a\x78\xca\
+\x55\x7a\xfb\xf6\x2d\x12\x97\x6f\x0d\x27\x9f\x70\x62\xa8\x3f\xe7\
+\x6c\x19\xf6\xc5\x21\x4d\xcb\x53\x0e\xb7\xc3\x64\xaf\xe9\x31\xef\
+\x25\x62\x70\xd0\x1e\x2d\x39\x78\xb1\xde\x83\x94\xd9\x13\x9e\x5e\
+\xb6\x34\x74\x36\x6d\x0e\xe3\xeb\x26\x87\x57\x5c\x70\x4a\x78\xf5\
+\x4b\xce\x97\x9a\x70\xbc\x38\x6c\x71\x44\xc5\xd2\xcb\x3f\xbd\x5c\
+\x06\xdf\x23\xa5\x26\x1c\x0c\x3f\xf9\xd1\xff\x84\x37\xbe\xfe\x75\
+\x32\xb2\x17\x8b\xd0\xae\x09\xe3\x27\xcf\xd4\xfc\x28\x73\x80\x04\
+\xad\xc6\x46\x6a\x05\x15\x68\x9c\x78\x3a\x91\x9c\x8f\x4a\xa6\xaa\
+\x40\x28\x28\xeb\x93\x6d\x05\xc2\xf4\x3f\xff\xf3\x83\xf0\x2f\x97\
+\xbf\xcc\xec\x33\xa2\x3b\x32\xf1\xc8\x3b\xb0\xef\xfc\xb4\x67\x1d\
+\x9b\xed\x7d\x6f\x7a\x55\xda\x7d\xd5\x5c\xd4\x41\xc4\x31\xe1\x65\
+\xc3\x31\x17\xa6\x4f\x57\x10\x26\x7e\x6e\xc5\x82\xa1\x21\x49\x51\
+\xed\x22\xa8\x87\x1e\x7c\x90\x45\xfa\xb7\x8b\x62\x4e\x9f\x36\xd5\
+\xe6\xde\x12\x1d\x6a\x23\x97\xa8\x03\x55\xe2\xc2\x53\xba\x17\xc9\
+\xe6\x09\x31\x38\xcb\xe4\x4e\x0f\x22\x70\xcf\x3e\x60\x90\xb9\x77\
+\xa3\xb2\x57\x43\x75\x7b\x01\xfd\x70\x6f\x27\xe7\xa0\xb9\x9f\xbf\
+\x59\x6b\x24\x08\xfa\xcb\x38\xdc\x75\x19\xc2\xc2\x6f\xbc\xc7\x5d\
+\xb4\x0d\xd9\xc4\xce\x30\x44\xce\x83\xb0\xb9\x9f\xb6\xdd\x83\xca\
+\x53\xbf\xf0\x4e\x7e\x67\xf3\xc3\xcd\x7a\xb0\x21\xef\xe5\xba\xc7\
+\xc6\x78\x26\x74\xde\xef\x15\x5a\x5d\xed\x03\x02\x73\x06\x86\x6b\
+\x6e\x33\xec\x96\xb4\x8c\x4d\xa6\x53\x73\x49\x44\x7c\xa7\x16\x92\
+\xfb\xe8\xab\x07\x10\xd2\x0f\x54\x8a\x11\xb1\x18\x08\x9b\x64\x3f\
+\x03\x46\xc7\xa9\xdf\xec\x35\x57\x37\xb9\x77\x95\x4b\x60\x6e\x54\
+\xe7\xdd\xdc\x0f\x0e\x70\x7b\x97\xbb\xab\x43\x34\x5c\x72\xe1\x9a\
+\x13\x4c\xb7\x43\xba\xa4\xe2\x46\x7b\xcf\x78\xee\x6e\xbf\xec\x29\
+\xde\xcf\x1e\x61\xee\x20\xf0\xbc\xd7\x8d\xfb\x68\x31\x20\x2e\x7c\
+\xe8\x3f\xef\x67\x7c\x3e\xcf\x4e\x7c\x99\x13\x97\x50\xe8\x13\x04\
+\x9a\x79\xe7\x79\xda\x74\x95\xbf\xbb\x40\x43\xb8\x20\xfc\xee\x1c\
+\x02\x3e\x71\x6f\x58\xdf\xef\x99\x8e\x03\xb4\xc1\x3b\x9d\xe0\x82\
+\x23\x20\x2e\xbc\xd7\x5d\xf8\xb9\xe6\xaa\x59\xd6\xc7\xe1\x8a\xbe\
+\xd3\x67\xc7\x0b\x5e\x8a\xa0\xb6\xba\x2e\x6c\x6f\x52\x98\x84\xec\
+\x63\x55\x55\x95\x61\xf2\xc4\x69\x92\x57\xa4\x3a\x96\x6d\x39\xd5\
+\x25\xc6\xa5\x30\x15\x36\xaf\x59\x6f\xcc\x5f\x7f\x11\x2a\x4e\xd9\
+\xcd\xa4\x02\x2f\x96\x5e\x79\xd9\xb2\xe5\x62\xc6\x67\x87\x2e\xd9\
+\x4b\xd3\x06\x4a\x8d\x21\xc3\xa9\x25\x4f\xe3\x2f\xd0\x98\xc4\x6d\
+\x87\xe6\xbd\xa4\x2f\xf6\xd8\xbe\x20\x32\x59\xdf\xcf\xe4\x30\xf9\
+\xbe\x91\xa1\xc8\x0e\x7c\x4e\x04\xdc\xa5\xd0\x39\x0c\x77\x25\xf4\
+\x00\xb4\x6c\x2f\x30\xb7\x67\xb3\x69\x44\x44\x83\x85\xe5\x1a\xc0\
+\xe8\x36\x1e\xe7\xf6\xb8\xc7\xeb\xce\x98\x37\x09\x41\x94\x35\x15\
+\xe1\x3b\x5f\xff\xbc\xa4\x9a\x85\xe1\xb3\x9f\xbc\x32\xfc\xfc\x57\
+\xbf\x15\x40\x0d\x85\xb3\x5f\x78\x41\x38\xe9\xe4\xd3\xc3\x45\x17\
+\x5d\x1c\x3e\x76\xe5\x15\x86\xd4\xab\x0a\xcf\x0a\xdf\xf8\xaf\xaf\
+\x29\xda\x7f\x66\xa8\x56\x0a\x98\x73\xce\x3b\x2b\xfc\xfc\xd7\x7f\
+\x0e\x2b\x9f\x7c\x2a\xdc\xf9\xf7\x2d\xa6\xfb\x7d\xfa\xe1\x5b\x2d\
+\x76\xe1\x3f\xfe\xe3\x3f\xc2\x3d\x37\xff\xca\x54\x83\xbf\xfa\xd5\
+\xd5\xe2\xb6\x49\x1b\xf3\x3a\x33\xa2\x3e\x36\xd8\x60\x2a\x0f\x36\
+\xc7\x6d\xab\xff\x91\x26\xb2\x5f\xfb\xd8\x75\xe1\x07\x3f\xf8\xba\
+\x00\x6f\xc8\x92\x8b\x02\x5c\x47\xcf\x7d\x87\xfd\x8d\x8b\xe6\xcc\
+\xaa\x0b\xc3\xe9\xa7\x1c\x29\x1b\x90\x54\x85\x00\xc4\x2c\xb9\xa0\
+\xea\x2c\x5a\x28\x17\xe4\xc1\xb0\x68\xf6\x82\xd0\xb9\x7d\xab\x0c\
+\x7b\xa4\xf4\x90\x81\x4f\x48\xa0\x79\x87\x5c\xac\xeb\xaa\x25\xe9\
+\x35\x87\x69\x71\xd5\x4d\x02\x33\x7b\x85\x38\xca\x84\xfd\x1b\x37\
+\x6f\x0a\xe7\x9c\x72\xaa\x52\x53\x34\x86\x3f\xfd\xf1\x9a\x70\xef\
+\x3f\x1e\x91\x7d\x66\x55\xb8\xf6\x0f\xd7\x28\xe5\x87\xdc\x6a\x5f\
+\xf3\x86\x70\xea\x0b\x4e\x0f\x7f\x6e\x78\x3a\xdc\x7d\xc7\x9d\xe1\
+\x92\x97\x5c\x14\x6e\xf9\xcb\xd5\xaa\x0d\xf4\xe6\x30\x6b\x92\xea\
+\xf5\xe8\xfd\x4d\x3b\xfa\x14\xfd\x5d\x1c\x16\x4e\x07\x1e\x83\xd4\
+\x89\x18\x81\x01\x58\x6c\x48\xa8\x92\xb4\x01\xfb\xf1\xe0\x52\x5f\
+\x1b\x97\x85\xe9\xe3\x24\xa1\x4a\x37\x5c\x4c\x2c\x40\xab\xa2\xf6\
+\xab\xa3\xb8\x08\x8e\x1e\x71\x9a\x04\x2d\xf6\xf5\x4a\x5d\xaa\x87\
+\x67\x8c\x9f\x64\x92\x2a\x01\xa3\x78\xe4\x81\x24\xa6\xd4\x2e\x31\
+\xaf\x99\xa1\x29\x0a\x20\xb4\x78\x1e\x32\x1e\x68\x0e\xfa\xa6\xc8\
+\x75\x3b\x4f\x69\x4f\xda\x45\x54\x3b\x2c\x4a\x1d\x4e\x7b\x7c\xad\
+\xec\x6a\x38\x11\x68\x93\x37\x0b\x99\xa2\xd2\x9b\x32\x09\xb7\x79\
+\xe9\xaa\xa5\x26\x62\x9e\xdd\x76\xc2\xdf\x20\x14\xd7\x9b\x83\xc4\
+\xdc\x15\xd8\x33\xe4\xba\xd7\x90\x1b\x8c\xdd\x4d\x19\xb8\xe3\xc0\
+\x4e\xe2\x95\x53\x41\x1c\x48\xd9\x20\x06\xee\x43\x0a\x73\x44\xd9\
+\xa5\x71\xf1\x3e\x10\x99\xc7\x4e\xf0\x37\xc4\xc6\xd5\xc7\xec\x1d\
+\xbc\xbb\x80\x23\x24\x5b\xf6\x13\xc4\x06\xee\xda\xed\x0f\xee\x2c\
+\x00\x31\xe3\x00\xb6\xa9\x7b\x04\x07\xeb\x59\x36\xe8\x2b\x30\x47\
+\x1f\x90\x02\x68\xb7\x4a\x52\xf4\xa6\xf5\xeb\x8c\x68\xb1\xf7\x80\
+\x71\xd2\xa7\x98\x5d\x54\x73\x04\xa1\x02\x96\x91\x60\x7a\x64\x28\
+\x26\xef\x34\xb9\xbc\xdc\x13\x14\xe2\x36\x5f\x88\x8a\xb1\x31\x0e\
+\x77\x6a\x81\x91\x62\xde\xbc\x86\x13\xc8\x9a\x7e\xbb\x4d\x16\x75\
+\x17\x63\x61\x9e\x99\x0b\x77\x55\x06\xb9\x33\x76\x77\x54\x00\x0f\
+\xb0\x0e\x4e\x48\x99\x3b\xfa\xea\x04\x81\xfd\xee\xa9\x75\xf8\x1b\
+\x22\x45\x1f\xb8\xdf\xd5\x44\xa8\x27\xf9\xa0\x3d\xa1\x2d\x08\x03\
+\xf3\x87\xda\x90\xf9\xe2\x5e\x0f\x99\xf0\x67\xdc\x4e\xe3\x4c\x9d\
+\x4b\x27\xdc\xcf\xda\xba\x17\x1d\x0c\x08\xef\x74\x89\x8b\xbe\xe1\
+\x1a\x9e\x29\x89\xb1\x8e\x24\x09\x66\x2c\xf4\x9b\xb9\x83\x41\xe2\
+\x20\xcd\x4c\xa9\xae\x9f\x7d\xf6\x99\x69\xc6\x22\xd3\x73\xf1\x6f\
+\x7f\xfb\xdb\x2e\xe9\x65\x5c\xed\x89\x54\xc6\xbb\x5e\x78\xee\x92\
+\xb0\x65\x60\xab\xad\x15\xcf\xc1\x68\x5f\x75\xd5\x4f\xcd\x71\x63\
+\x50\xf1\x87\xad\x9d\xb2\xfb\x48\x3d\x8c\x63\xd3\xd4\x49\x53\x15\
+\x3f\xb3\x21\xbc\xea\xb2\xd7\x85\xca\x8a\x5a\x23\x3c\xc0\x1f\xaa\
+\x7a\x4b\x39\x25\xf8\xc8\x64\xa4\xb4\x66\xba\x94\x57\xa0\x39\xd9\
+\x6b\x6d\x97\xe3\xed\x5c\x89\x4c\xa2\x9b\x1b\x48\x9d\x45\x43\x85\
+\x64\x1e\x51\x31\xf7\x05\x80\x31\xe1\x83\x62\xab\x59\x74\xd4\x23\
+\x0c\xd4\x75\xa7\x59\x29\x57\xc6\x8f\x00\x65\xfd\xc4\x09\x69\x11\
+\x18\x80\x66\x91\x9d\x6b\x73\xdd\xb2\xab\xcc\xe8\x8b\x7b\x9c\xd5\
+\x0a\xf9\x84\xa2\xbe\xf0\xf0\xa3\x77\xcb\x6d\xb9\x3d\xbc\xf5\x5f\
+\x31\xc8\xae\x0b\x8f\xc9\x18\xfc\xce\x7f\x7b\x85\x95\x01\xf8\xe2\
+\x17\x3f\x16\x5e\xf7\xea\x0b\x6d\xd3\xfe\xe8\xaa\xab\xc2\xb9\x67\
+\x1d\x11\xde\xff\xbe\xff\x08\x9f\xf9\xf4\xa7\xc3\x09\xc7\x2c\x0c\
+\xab\x97\xdd\x11\xbe\xf8\xa9\x8f\x87\xaf\x7d\xed\x6b\xe1\xc6\xbf\
+\xfc\xd0\x88\xcb\xcd\x37\x57\x87\xbf\xfd\xe1\x7b\xe1\x8a\x77\xbd\
+\xc5\x36\x41\xe3\x86\x87\x42\xfd\xe2\x83\xc2\x91\x07\x8d\x0f\x1f\
+\x7d\xff\xeb\xad\x78\x1b\xa2\xf6\x1f\x7e\xfb\xfb\xf0\xa1\xf7\xbf\
+\x5f\xf6\x93\xf6\xf0\x5f\xff\xfd\xdf\xe1\x83\x52\xcb\x94\xf7\xb6\
+\x84\x26\xe9\x55\x2f\x3b\xef\xe8\x70\xe2\x89\x27\xca\x7e\xf4\x85\
+\xf0\x85\x2b\x2f\x0f\xe7\xc8\xf0\xfb\x05\x45\x90\x9f\x7b\xca\xe2\
+\xf0\xf8\xfd\x0f\x58\x14\xf3\xf9\x17\x5d\x1a\x96\xae\xdd\x1a\xaa\
+\xc6\x4f\x90\xed\x43\x1b\xb7\x6e\x56\xd8\x21\xf5\x0f\xaa\x22\x08\
+\x4c\x47\x5b\xb7\x25\xfe\x43\x17\x48\x4c\x84\xcc\x68\x9a\x63\x54\
+\x02\x24\x00\x50\x90\xa7\x24\xb1\xc9\x4a\x0d\xf2\x8a\x57\xbc\x5a\
+\xf3\x50\x12\xee\xbb\xef\x9e\xf0\xa9\x4f\x7f\x26\xfc\xe0\x87\x57\
+\xc9\x86\xb4\x52\x22\x77\x75\x38\xf3\x8c\x23\xc3\x07\xde\xff\xb6\
+\xf0\xb9\xcf\x7d\x21\x2c\x9a\x3f\x29\x5c\xf6\xf2\xf3\xc3\xbb\xdf\
+\xf1\xae\xd0\xb4\x49\xb9\xa7\xa6\x4d\x96\xab\x6b\x47\x98\x3a\xae\
+\x30\xdc\xf0\xf7\xbf\x29\x29\xea\x2d\xfa\x9e\xb2\x8d\x86\x24\x89\
+\x2d\xa3\x8f\xb4\x37\x72\x32\xa8\x15\xe1\x30\xf7\xca\xfc\x56\x65\
+\x11\x80\x34\x12\x94\x29\xe3\x69\x8d\xae\x0b\x06\x36\xca\x3e\x32\
+\x7d\xde\xdc\xf0\x9e\xb7\xbf\x2d\x5c\x74\xc9\x4b\xc2\x21\x4b\x0e\
+\x0a\x4f\x2d\x5f\x16\xa6\x4c\x9c\x14\xaa\xc5\x69\xcf\x91\xbb\xec\
+\x7f\x7f\xfb\x9b\x96\x0d\xf9\x08\xd9\x0e\xc8\x56\xb0\x49\x88\xf6\
+\x58\x49\xa5\x3f\x52\xae\x2c\xb2\x58\xb3\xb6\xf7\xc8\x6d\xf6\x35\
+\xaf\x7e\x4d\xd8\x28\x63\xf6\xe6\x0d\xeb\x2d\x12\x1a\x85\x94\x13\
+\x31\x3c\xda\x2c\x68\x96\x00\x56\x9c\x2f\x62\x77\x52\xe0\x86\x4d\
+\xec\xf9\xc3\x3c\x2e\x82\x36\x33\x9d\x4f\xdc\xe3\xcf\x63\x1b\x3c\
+\x33\x05\x48\x04\xa4\x0a\x31\x40\xf5\x83\x8a\x04\x04\xca\x3a\x83\
+\x54\x41\x50\x20\x17\xa2\xd3\x99\x17\x43\x5c\xba\x8f\xe7\x89\xce\
+\xc7\x50\x0e\x42\x42\xd5\xeb\xea\x19\x08\x2a\x0c\xd9\x0f\x7f\xf8\
+\xc3\xf0\xaf\xff\xfa\xaf\x66\xeb\x80\x60\xd1\x27\x10\xd7\x27\x3e\
+\xf1\x09\x93\xea\xdc\xde\x09\xd2\xe7\x59\x08\x95\xab\x57\x7c\x7c\
+\xdc\x43\x20\x34\x9a\x04\x4f\xc6\x08\x01\xb6\x78\x32\x11\xde\x3a\
+\xed\x85\x7b\xb5\xfe\xaf\xba\xec\xd5\xb2\xa5\xad\x09\x13\x45\x84\
+\x99\x8f\x8f\x7f\xfc\xe3\x52\x6f\x9e\x24\x82\x33\x21\xb4\x49\xca\
+\x21\xd6\x8a\x20\x5a\x90\x6b\xa7\x6c\x69\x2f\x38\xf5\x14\xe5\x12\
+\x8b\x52\x94\xf0\x0e\xca\x94\xbb\x07\x19\x2a\x70\x9f\x3f\x88\x0e\
+\x7d\xc7\x29\x82\xfd\x07\x41\xf3\xb9\xa4\x2d\x52\xe7\xb8\x44\xe6\
+\x6a\x72\xb7\x93\xb9\x34\xca\x5c\xa2\x2a\x63\xae\x3d\x2e\x8e\x39\
+\xf7\x2c\xea\xbc\x8b\x79\x86\xb0\xba\x5d\x04\xdb\x2c\x4e\x13\x9e\
+\xd2\x85\xfb\xaf\xd2\x3e\x46\xb5\x4e\x7c\x0d\xb8\x87\xf7\xc0\x40\
+\xf8\x7c\xf3\x7e\xca\x85\x80\xcc\x39\x58\x17\x88\x33\x48\x9f\x74\
+\x34\xdc\xcf\x35\xce\xf4\xc5\xa5\x56\xee\x71\x29\xc8\xd5\x8c\xbf\
+\xfd\xed\x6f\x8d\xe0\xd2\x47\x57\xcb\x41\xec\x50\x11\xce\x90\x6d\
+\x16\x17\x66\xd6\xf1\xab\x5f\xfd\xaa\xf5\x11\xe6\x84\xf7\xa3\xa2\
+\xfd\xe0\x07\x3f\x18\x31\x93\xb1\x9a\xdd\x63\xac\x3c\x3e\xe8\xa7\
+\x3f\xff\x59\x38\xe7\xac\x73\xcd\xae\x82\x27\xe6\xe3\x8f\x3f\x66\
+\x99\x4b\x16\x2d\x5e\x20\x3b\xac\xa4\x78\xed\xf3\x3e\xed\x13\x1c\
+\x97\x3a\xda\x3a\xc3\xd9\xe7\x9f\x17\xde\xf7\xde\x0f\x84\xef\x7c\
+\xe7\x3b\x26\xed\xd7\x8c\xab\xb5\x30\x07\x61\x85\x34\x46\xe5\x5d\
+\xb1\xd6\x80\x74\x61\x25\x22\xa8\x59\x5d\xd0\x76\x07\x4f\xe7\x4a\
+\x64\x12\xdf\x01\x37\x04\xf0\xb1\xf8\x2c\x22\x00\xc0\xe2\xc2\x95\
+\xb0\x40\x00\x1d\xdc\x9e\x8b\xa3\x99\x6e\xbc\x0c\xd8\xa5\x9b\xd1\
+\x5e\xe4\x76\x1c\x77\x87\x04\xd8\x01\x56\x0e\x47\x14\x70\x1e\xae\
+\x8a\xe3\x3a\x8b\x0d\x31\x2b\x97\xf7\x45\xb7\x54\x6c\xbd\xa9\xe2\
+\xf0\x91\x8f\x7f\x26\x5c\xf2\xb2\x4b\x25\x75\x28\xee\x40\xba\xd2\
+\xa9\xb3\xa7\x28\x22\x56\xea\x32\x19\xb9\x77\xc8\xd0\x9f\x2f\x0e\
+\x19\x6f\x0d\x22\xfe\xdb\x15\x55\xdf\x2a\x6e\x99\xb4\x1c\x04\x29\
+\x76\x77\x49\x9a\x92\xbf\x7a\x6f\x8f\x54\x3b\xe2\x0a\xf8\xbb\x79\
+\x87\xf4\x9a\xf2\x32\x93\x09\x40\xc8\x4c\xea\x17\xb9\xf0\xee\x90\
+\x0d\x84\xeb\x55\x4a\x70\x39\x5e\xd9\x02\x88\x88\xc1\xbe\xd3\x2c\
+\x1d\x6a\x6b\xc3\x66\x73\x2a\x68\x93\x91\xba\xa1\x71\xb3\x5c\x49\
+\xe7\xda\xf7\x01\x65\x1c\x18\x48\x29\xba\xb9\xb3\x4d\xaa\x2e\x89\
+\x43\x7a\x07\x2e\xc1\xb5\x35\x95\x22\x6c\x5f\x08\x33\x16\x1d\x16\
+\xce\x3a\xff\x42\x71\x2a\x91\x74\x33\xce\x5c\x76\x01\x2e\xd9\x2a\
+\xf4\x9e\x96\xed\xe4\x8a\xab\xd4\xdf\xf2\x78\xd3\xf5\x2e\xe5\xa8\
+\xc2\x4f\x1e\xbf\xfa\x32\x39\x21\x6c\xd9\xb4\x55\x7a\xdc\xc5\x42\
+\x34\xd2\x83\xcb\xfe\xd4\x83\x48\xaf\xb4\x3a\xe3\xe4\xd8\xb0\x43\
+\xd9\xa6\xbb\x07\x64\x5f\x11\x21\xe9\xec\x55\x6e\x2c\x6c\x1f\x1a\
+\x43\x5b\x57\x8b\xcd\xa1\xb9\x10\x0b\x82\x84\xb6\xc3\x3f\xee\xbf\
+\x4b\x4e\x0a\xca\xb6\xa3\x44\x89\x77\xdd\x79\x5b\xf8\xbb\x1c\x0e\
+\xae\xbd\xe6\x5a\xcd\x97\xec\x3a\xf6\x66\x82\x2c\xa3\x6c\x04\x16\
+\x08\x89\xdb\x34\x11\xe3\x24\x4b\xd5\x9c\x4e\x97\xc7\xcb\x80\xfa\
+\xf6\xca\x57\xbd\x56\x12\xd4\x36\xd1\xbc\x72\xa9\x16\x1f\x0b\x4d\
+\xca\xed\xf6\xd4\xd3\x4f\x84\x0f\x7f\xe8\xa3\x22\x98\x8a\x16\x57\
+\x80\xe8\x55\x57\xfd\x28\x1c\x77\xec\x09\xe1\xb5\x6f\x7a\xbd\x45\
+\x55\x92\x1a\xe7\xba\x3f\xfd\xce\x10\x45\xad\x22\xd8\xdb\x5a\xb6\
+\xc9\x83\x51\xf1\x3e\x52\xc9\x91\x45\x19\xc4\x0b\x7c\x80\x98\x48\
+\x18\x08\x8c\x01\x8f\x24\x16\x24\x41\x65\x26\x63\xe3\xea\x30\x77\
+\x37\x77\xbd\xbf\xab\x5d\x41\x88\x2e\x89\x80\x84\xf1\xfa\x03\xa6\
+\x41\x00\xb4\x0f\x17\x7f\xc5\x15\x57\x18\x82\xc6\x73\x0d\xa3\x7d\
+\xb9\x90\x87\x67\x06\xf0\x3c\x63\xc0\x28\x36\x19\x0e\x54\xac\x10\
+\x1e\x1c\x53\x50\xa5\xe2\xfe\xeb\x06\x69\x88\x00\x29\x4c\x78\xaf\
+\xb7\x71\xdb\x6d\xb7\x99\x87\x1a\x9c\x34\xb6\x47\x2f\x06\xc8\x9a\
+\x78\x5a\x16\xbc\xaa\x48\x95\xe2\xea\x46\xfa\x87\x2d\x12\xc6\x85\
+\xfe\xd2\x8f\x75\x6b\x57\x9b\xaa\x6c\x50\xea\x43\xe6\x07\xef\x28\
+\x90\x30\x4e\x1c\x8c\xff\xb1\xc7\x1e\x11\x61\x9c\x6e\xaa\xa3\x2a\
+\x65\xb0\x28\x23\xbf\xa0\x90\x96\xc1\x99\x38\xe9\x42\x21\x37\x24\
+\x84\x83\x96\x2c\xb2\xf7\x80\xe4\xe9\x2b\xce\x37\x8c\xcf\x0d\xe9\
+\x20\x5e\xb7\xfb\xb0\xef\x41\xce\x10\x62\xec\x14\x1e\x30\x8d\x13\
+\x03\xf1\x34\xa8\x9d\xe1\xb2\x3d\x78\xd3\xd7\x01\x62\x80\x03\x88\
+\xab\xbe\x41\xc4\xbc\x9b\x77\x32\xd7\xb4\xc5\xba\xb8\xb4\x08\xde\
+\x60\xed\x68\x93\xdf\xf0\x94\x73\xa3\x3f\xf0\xc0\x3c\x91\x67\x2d\
+\x8a\x2d\x09\xe6\x42\x0c\xa3\xeb\x06\x7b\xb2\xc8\x83\x3f\xc0\x59\
+\xbc\x07\x18\x61\xee\xdc\xc6\xe4\x52\x1b\x52\x21\x1e\x65\x10\x35\
+\xfa\x48\xaa\x9a\x8b\x94\x38\x97\x3e\xc1\xd8\xe2\xd0\x82\xb3\x11\
+\xce\x13\x30\x20\x9e\xc7\x10\xb5\xea\xe2\xc5\x8b\x84\x47\x5a\x0c\
+\x1f\xba\x44\xc4\x9c\xd1\x16\x70\x40\xff\x21\xbe\xb4\xcf\x18\x3c\
+\x93\x03\xb8\x0c\xa2\xf5\x8d\x6f\x7c\x2b\x5c\xf4\xe2\x97\x84\x8a\
+\x09\x15\xf6\xbe\xeb\x6f\xbe\x31\x5c\xf6\x8a\x97\x9b\xb7\xe0\x26\
+\x39\x73\x90\x28\x94\x40\x67\x34\x01\x33\xe6\xce\x0c\x1d\x52\x21\
+\x1f\x76\xf4\xe1\x0a\xb4\x15\x73\xa1\xfd\x66\x0e\x06\xa4\x9c\x8a\
+\x89\x0c\xef\x73\xa2\xa6\x79\x2e\xd2\x1c\xd7\x6a\x1e\x99\xa0\x9d\
+\x6e\x99\x89\x18\xff\xd9\x37\xec\x77\x22\x13\x6d\xc4\xc8\x7d\x92\
+\x85\x25\xd7\x12\x0b\xc9\xc7\x23\x74\x01\x78\x57\x9d\x01\x3c\x00\
+\x83\x53\x54\x37\xfc\x8f\x36\x36\x12\xe9\xc1\xa1\x23\xc6\xe3\xde\
+\x0b\x77\x6e\xae\xb1\xb1\xca\xa3\x52\x2a\x01\x0e\x88\x8f\x1f\xcc\
+\x25\xb6\x83\xbe\x7e\xe9\x89\xe5\x49\x35\x54\x3a\x2b\x3c\xb6\xa2\
+\x25\xd4\x4d\x39\x2c\xac\x58\xdf\x19\x26\xcf\x3d\x3a\xfc\xf9\xba\
+\x3f\x19\x27\x53\x59\x3f\x27\x3c\xfc\x94\x82\xd4\x0e\x6a\x0a\x5b\
+\x77\x0c\x2a\xb8\xaf\x4d\x69\xfb\xdb\xe5\x36\x38\x4f\x9c\x82\xb8\
+\xf0\xc2\xf1\xe1\x99\x55\x8d\xe1\xe6\x5b\x1f\xb4\xf8\x83\xa5\x4f\
+\xae\x0f\xbf\xfb\xc3\xcd\x02\xee\x73\xc3\xdf\x6e\xb8\xc7\x80\xeb\
+\x7d\xef\x7b\x9f\xd0\x71\x55\xd8\xb0\xa9\x2d\xac\x5d\xaf\x32\x01\
+\x1d\x1a\x63\x4a\x48\xf4\x89\x35\xe1\xc9\x75\x4d\xa1\x50\xd9\x51\
+\x97\x6e\x50\x56\xdd\xad\x42\xde\x93\xe7\x86\x9e\x0d\x8d\xe1\xc7\
+\xbf\xf8\xa5\xa9\xa9\x4e\x3c\xff\x92\xf0\xe3\x3f\xfe\x21\xec\x18\
+\x28\x0a\x0b\x8e\x3b\x2d\x0c\xc8\xc5\xba\x68\xe2\xcc\xd0\x59\x54\
+\x15\xfe\xe5\x3f\x3e\x84\x83\x5d\x00\xe9\x94\x48\x44\x3e\xe3\xb4\
+\x17\x28\x4e\x46\x29\x3b\x9a\x21\x42\xf2\x90\xda\xa1\x82\x4c\x22\
+\x30\xee\xa5\x08\x72\x27\x3e\xc9\xf2\x32\x17\x0c\x84\x46\xbc\x60\
+\x26\x4c\x0d\xb7\x3f\xf8\x54\x78\x91\xee\x9d\x38\x67\x49\xb8\xef\
+\xf1\xe5\xe1\x9a\xeb\xff\x1e\x2e\x78\xd5\x65\x61\xbb\x10\xd3\x6d\
+\xff\xb8\x2f\x9c\xf2\xd8\xc3\xa1\x4c\xc8\xe8\x9e\x7b\xff\x11\x5e\
+\xa4\x54\x23\xcd\x0a\xe0\xaa\x10\x17\x84\xd1\xb6\x87\x78\x05\x05\
+\x3d\xce\x5b\x70\x94\x54\x1d\x6d\x61\x7c\xfd\x80\xd6\x99\xfa\x3b\
+\x32\x66\x2a\x15\x6c\x51\x71\x9d\xd9\x62\x14\x8a\x22\x60\x97\xde\
+\x3c\x25\xdd\xf4\x50\xa5\x9c\x05\xa4\xae\xb3\x0c\x05\xca\xe7\x56\
+\x29\x97\x05\x81\x71\xa1\x8c\x98\xa7\x9d\x77\x5e\x7a\x9d\x2e\x7f\
+\xe7\x15\xe2\xec\xf0\xf2\x23\x63\x6d\x51\x98\x3c\x7b\xb1\xad\xdb\
+\xd7\xbe\x7b\x99\x38\xcd\xc7\xc2\x5f\xaf\x97\x6a\xf2\xf1\x7f\x84\
+\x0f\x7c\xf0\x8a\xf0\xf4\x13\x4f\xd9\x1a\x5b\x8c\x15\x21\xa7\x42\
+\x10\xc7\x1d\x7b\x74\x98\x2b\x67\x05\xb3\xb7\x90\x12\x9d\x8c\x0d\
+\xb1\xee\xde\xe1\x92\x35\x76\xdd\x39\x67\x90\x0e\xea\x0f\x67\x7a\
+\x50\xb5\xb8\x3d\xc8\x61\x08\x98\xf4\x38\x06\x67\x60\x7c\x83\x22\
+\xb9\x82\xf8\x70\x55\xfe\xe3\x1f\xff\x18\x7e\xf6\xb3\x9f\x85\x26\
+\x71\xad\xce\xe9\x83\xcc\x40\x3c\x48\x3a\xdb\x62\xe4\x0b\xc7\xcf\
+\x7b\x3d\x55\x09\x88\xd8\x5d\x7e\x9d\xb0\xb0\x3f\x40\xd4\x10\x12\
+\x24\x1a\x10\x19\x08\x8d\xb6\xc8\x9f\xe5\xaa\x33\xfa\x06\xb2\x44\
+\xd2\xe5\xa0\x7f\x1c\x20\x5f\xda\xf2\xc2\x81\x56\xf0\x8e\x94\x37\
+\x2a\x55\x31\x59\xd9\x87\x5b\xe2\x80\x43\xee\x03\xc9\x6f\x94\x1b\
+\x33\x0c\xa0\x17\xff\x63\x5e\x99\x17\x88\x0c\xe7\x21\xad\x43\x91\
+\x90\x18\x7b\xd8\x83\x26\x39\x83\xc0\x41\x80\xee\x12\x6e\xea\xcd\
+\x58\x35\xe6\x44\x07\x29\x0c\x22\x44\xdb\xdd\x3d\x03\xe9\x82\x81\
+\xfc\xce\x7b\x40\xdc\x8c\x97\x3e\x42\xe0\x20\x8a\x10\x2a\xd4\x7d\
+\x10\x0b\xee\xe3\xbd\x5c\x23\xdb\xb4\xab\x00\x3d\xd6\x89\xf9\x04\
+\xbf\x70\xd0\x27\x90\x29\xd2\x84\xa7\xc0\xe1\x6f\x24\x06\xe6\x8a\
+\xf7\x71\xe6\x1e\xde\xe3\x09\x2a\xcd\x98\xae\x3e\x70\xd0\x7f\x1c\
+\x40\x20\xda\xdc\x8f\xca\x0c\x02\x05\x03\x01\x53\xc1\x9a\x30\xaf\
+\x10\x48\xda\x82\x00\xbb\xaa\xdf\x6d\x51\xa8\x1d\x81\x11\x88\x95\
+\xdb\xa4\xef\xbd\xf7\xee\xf0\x16\x65\x6c\xe0\x39\xe6\xcb\x19\x6f\
+\x98\x13\x88\x10\xed\xb0\x46\xcc\x03\x6e\xd0\xee\xf1\x86\x14\xf8\
+\xf6\xb7\xbf\x5d\xf6\xe2\x1a\x65\xfd\x20\x09\xa6\xf6\x97\x12\xcd\
+\x6e\x6c\xd8\x10\x16\x2c\x59\xa0\xbd\x71\x5f\x68\x10\xcc\xf5\x4b\
+\x65\xd6\xa1\xec\x1f\x30\x30\x25\x62\x90\xa5\x63\x0e\x73\x17\xcd\
+\x51\x12\xcd\x06\xe5\x04\xac\x08\x93\x26\x4c\x94\x3d\x5a\x76\x54\
+\xd2\x43\x65\x10\x98\x58\x6d\x56\xaa\xf3\x1c\x31\x31\x87\x6a\x0a\
+\xee\xdb\x0b\xda\x92\x7e\x24\x67\x22\x13\x25\x19\x89\x8e\x91\xce\
+\x70\xaa\x75\x12\xb5\xe1\x68\x37\xc8\x3d\x77\xb2\x74\x83\xdb\xa8\
+\xc1\xa2\x48\x7a\xb2\x0a\x4f\xa8\x9f\x14\x1a\x14\x9c\x89\xfa\x63\
+\xba\x6c\x1d\xe4\x09\x83\x93\xc6\x53\xa8\x52\xdc\x7a\x2b\x29\x1e\
+\xd4\xb6\x57\x93\xf0\xb3\x8f\x00\x5f\xf3\x01\x21\x8f\x0a\x73\x1d\
+\x26\x57\x17\x11\xdc\x22\x22\xe2\x78\x65\x05\x08\xf8\xde\x91\xce\
+\x9e\xa4\xb3\x30\x61\x4a\x15\xa6\x80\x24\xd9\x09\x48\xd7\xad\xdf\
+\xd6\x4b\x8d\xfd\x5d\xb9\xbc\x7e\xeb\xdb\xd7\x86\xb7\xbf\xef\x73\
+\xa1\x41\x7a\xd2\x39\x73\x26\x85\x83\x8e\xbe\x40\xc0\xd0\x12\xfe\
+\xfd\x8a\xcb\xc2\x7d\xf7\x3f\x13\x96\xaf\xdd\x10\xfe\xdf\xa7\x3f\
+\xa9\x05\xdc\x12\x9e\x58\xd5\x10\xde\xf9\xc1\xf7\x85\x2e\x61\xed\
+\xf7\x5d\xf9\xe1\xf0\x97\xeb\xee\x0a\x1f\xf9\xe4\x77\x05\x2c\x93\
+\x25\x52\xdf\x14\x2e\xff\xb7\x8f\x87\x13\x4f\x98\x1f\xae\xbf\xe1\
+\xa1\x70\xe1\xa5\x87\x84\x69\x73\x45\x90\xf4\xae\xef\xfd\xf8\x2f\
+\x42\x0c\xd7\x85\xaf\x7c\xf3\x5b\xb2\x1b\x84\xf0\xed\xef\x7e\x3f\
+\x7c\x4b\x35\x6a\x3a\xe5\xbb\xf1\xe7\x3f\xdc\x12\xbe\x7f\xf5\x75\
+\x61\x9b\x34\x49\x8b\xe4\x15\x75\x49\x81\xf2\x3a\x6d\xd9\x18\x2e\
+\xbd\xf0\xd4\x50\x3e\xf5\xa0\xb0\xe2\xe9\x15\xe1\xc8\x45\x27\x04\
+\xb4\xfe\x53\x16\x2e\x09\x6f\xff\x00\x76\x09\xb2\xb8\xb6\x87\x2b\
+\x4f\x3a\xdd\xa6\x63\x7d\x93\xd2\xc3\x57\x2b\xc9\x1f\xc9\x34\xf5\
+\xc2\x94\xb8\x76\xd1\x0e\xa9\xbd\x82\x8c\xf6\x3a\x6b\xdf\x69\x4f\
+\x9b\x47\x5c\xa5\x92\x6e\x96\xeb\xbe\xd5\xeb\x7a\xc2\x59\x17\xbd\
+\x36\xb4\xf5\x97\x87\x17\x5e\xfa\x9a\x70\xc3\x8d\xaa\x03\xf4\xb5\
+\xab\xc2\x9a\x86\x2e\x89\xdd\x47\x84\xcf\x7c\xe5\x07\xc6\x41\xbe\
+\xfd\xdf\x3f\x10\x5e\xfd\xa6\xfe\x70\xfd\x5f\x6f\x08\xdf\xfb\xf9\
+\xaf\x43\x83\xda\x23\xf5\x4c\x85\x24\x86\x66\x05\x0d\x9f\x77\x89\
+\x10\x9d\xfa\x03\x31\x61\xb0\xd0\xf4\x46\xdd\x23\xe1\x45\x08\x25\
+\x52\xd1\x95\x28\x97\x52\x69\xe5\x24\x8b\xa3\xe9\xe8\xa0\x88\x9c\
+\xf2\x8d\x49\xd4\x6b\x23\x1e\x49\xde\x7b\xac\x0b\x59\xf6\x71\x48\
+\xe0\xa8\x15\x81\x21\x9d\x1b\xc9\x2e\xc9\x8c\xb3\x49\x88\x6f\x1c\
+\xf1\x48\x22\xf4\x9b\x36\x6f\x55\x81\xba\x3f\x84\x37\xbe\xe6\x65\
+\xf6\xbe\xa5\x8f\x3d\x6e\x39\xc1\x40\xb0\x47\x1d\x71\xa4\x10\xd5\
+\x46\xe3\xee\x4c\x47\x2f\x7b\x42\xa5\x82\x6e\x41\x1a\xee\x88\x02\
+\x62\xc0\x65\x17\x8e\xf5\x71\x65\xa5\x5d\xfe\xd4\xd3\x82\x09\x19\
+\xd5\x15\x67\x03\xfc\x61\xb7\xe1\xfb\x9b\x5e\xaf\x7a\x45\x4a\xd9\
+\xd3\x25\x84\x56\x2e\xe3\xaa\x49\x70\x1a\x28\x1b\x1e\x57\x6d\x90\
+\x51\xb3\x90\x7f\xad\xa4\xf1\xd6\x38\x4d\x48\xa5\x90\x15\x2a\xb2\
+\x63\x95\x52\x05\xae\x1d\xf8\xec\xd6\x6f\x33\x85\xfc\xd6\x89\x40\
+\xb4\xc4\x6a\x15\x7e\xdb\xb4\x65\xb3\x21\x65\x10\x26\xb1\x12\xfc\
+\x0d\x17\xee\x7a\x7d\x2f\xcf\x0d\xb2\x04\xd9\xb9\x91\x1d\xe4\x4d\
+\xca\x16\xee\x45\x1a\xf0\x04\x99\x8c\xcf\x0d\xd8\x9e\xa7\x0c\x2e\
+\xd9\x24\x14\x31\x7a\xdc\x8b\xbb\x34\x6a\xe6\xa3\x94\xca\x7e\xf6\
+\x8c\xe9\xa1\x69\xbb\x98\x0d\xa9\x46\xc9\x0b\x61\xde\x69\xa4\x96\
+\xb1\x60\x68\xd6\xa8\xd8\x10\x1e\xe3\x26\x04\xd7\x1d\x08\x5a\x75\
+\xcf\x3d\x77\xdf\x95\x8e\xe7\xc0\x73\x29\x92\xfa\xa2\xb0\x03\x18\
+\xbe\x88\xf8\x28\xad\xbe\x08\xee\xd5\x57\xff\x5a\xdc\xf9\x31\x52\
+\x01\x7d\xc8\xc6\x01\xb3\x40\x96\x62\xc6\xe9\x2a\x40\xe6\x00\x64\
+\xcb\x99\xf7\xf0\x3c\xea\x37\x90\xad\xe1\x97\x38\x36\x85\xbf\x41\
+\xd4\xa8\x9c\x9c\xf0\x7a\x52\x4a\x9e\x77\x4d\x06\xfd\xf0\xc0\x48\
+\xfe\x66\xfc\x48\x04\x4e\x54\x5e\xf6\xb2\x97\xa5\x63\xa3\xdc\x73\
+\xcf\xdd\x95\x33\x19\x8f\x4c\x15\x2a\x04\x0c\x06\x01\x82\x03\x23\
+\x42\x12\x4e\x24\x86\x0d\x1b\x36\x99\x33\x0b\x9f\x66\x65\x9c\x30\
+\x09\x4b\x5e\x98\xc4\xb6\xe1\x99\x79\xc6\xd9\x67\x18\x4c\xa0\xc6\
+\xf4\x1c\x66\x3b\x64\x2f\x25\xed\x54\xa5\xdc\xef\x2d\x17\x87\x60\
+\x15\x66\xc3\x62\x99\x16\x2d\x36\xf7\xe4\xb7\xff\xeb\xdb\x6c\x3e\
+\x17\x2f\x5c\x14\x49\x59\x82\x45\x77\x6f\x66\x5d\xc9\x01\x88\x0b\
+\x3a\x36\x4a\xde\xd5\x25\x0f\xd8\xf1\xf2\x18\x9c\x3a\x8d\xbc\x8d\
+\xec\xa5\xa8\xfc\x7b\x8b\x82\x95\x8b\x8c\x81\x8a\xca\x78\x54\x57\
+\x13\xac\x1b\x65\xbd\x37\xdd\x59\x7c\x64\xd8\x84\x14\x7c\x13\xa6\
+\xc8\x03\xf3\x38\xcd\xf5\x52\x49\x51\x51\xd5\xc6\xbd\x38\x72\x21\
+\x32\x18\x86\x2c\x57\x07\x39\x72\xac\x7e\x88\x26\x8a\x81\x58\xda\
+\x7c\xa4\x0b\x79\xf0\x14\xa1\xfb\x16\xc0\x0d\xc8\xc8\x5a\x28\xd5\
+\x02\xb9\x92\x48\xc6\x58\xa0\x0f\xba\xf8\x36\x79\x76\x55\x56\xd5\
+\x2a\x35\x0b\xc1\x8e\xe2\x90\x44\x21\x48\x95\x00\x40\x77\x48\x2d\
+\x25\x0c\x63\x08\xca\x30\x89\x30\xd0\x10\x5f\x74\xb6\xc2\x57\x20\
+\x2b\x53\x23\x29\xeb\x72\xab\x8c\x7d\x7d\x45\xe1\xb2\x37\xfc\x47\
+\x58\xbf\x45\x29\xc2\xe7\x1e\xac\x4d\x2f\x63\xa5\x22\xdb\x5b\xdb\
+\xa3\xe2\x68\xa8\x76\x8a\xe4\x4b\xde\xda\xaa\x8c\x03\xaa\xc3\x42\
+\xad\x89\x95\x6b\xe4\xc6\x3b\x71\x8a\x01\xf2\xef\x6e\xfa\x84\x49\
+\x2f\x51\x14\x70\xc4\x05\x7d\xef\xaa\x9b\x6d\xd1\xa7\x2b\x80\xf1\
+\xea\xdf\xdd\x6f\x1e\x6c\x5c\xff\xdc\xb7\xae\xb6\xe9\xae\x97\x2e\
+\xbb\x53\x1b\xd7\xb9\x30\xd4\x1b\x4d\x4d\xb7\x19\x70\xc3\x39\xc2\
+\x3d\x7d\x4c\xae\xd1\x2e\x06\x63\x4c\xfc\xf6\x55\xef\xb5\xdf\xb1\
+\x25\x9d\x71\xd1\x47\x94\xc8\x51\x6e\xd6\x0a\xea\xfc\xfe\xd5\xb7\
+\xca\x60\x27\x37\x5f\xa9\xd7\x26\x8c\x9b\x60\xc1\x9c\xdf\xfa\xc1\
+\x0d\x71\x91\xaf\xfc\xf0\xf3\x3f\xde\x1f\xa7\xd8\x27\x7a\x1d\xcb\
+\x0b\x11\xf8\x19\xde\x85\xd8\x5c\x6c\xaa\x76\x06\xea\xb2\x31\xd3\
+\x87\xe6\xcc\xc0\xc9\xc3\xdd\xf5\x27\xeb\x40\xcd\x8b\x6b\xfe\x76\
+\xa7\xde\x17\x95\x38\xe8\xfb\xf5\x4d\xb1\x5a\x40\x39\x8f\x04\x80\
+\x00\xfe\x35\x7f\x7e\x54\xb6\xa3\x28\x45\xca\xf7\x7e\x71\xb3\x54\
+\x52\xa8\x0b\xe5\x7f\x5f\x88\xbb\xb5\xd2\x74\x90\x43\x4d\x92\xe1\
+\x80\xf2\x94\x89\x84\x0b\x80\x55\x2a\x5b\x6e\x92\x43\xe4\x70\x53\
+\x42\xcc\x9a\x72\xa5\x90\x69\x6f\x0c\xb3\xe4\x32\xbd\xb5\xa1\x57\
+\xb6\x16\x71\xa3\x48\x28\xca\x08\x50\x25\x29\x85\x83\x34\xff\x26\
+\xba\x1b\xa5\x8a\x94\x6a\x25\x82\x05\xd6\x02\xaf\xd3\x23\x0e\x59\
+\x6c\x12\x6b\xb1\xb2\x06\x1c\x75\xf8\x41\xe1\x94\x13\x8e\xd4\x2d\
+\xd8\x77\x8a\xc2\x45\x17\x5f\x6a\x1f\xdc\x9f\xfb\x34\x87\xc0\x1c\
+\x1f\x6c\x2f\xfd\xca\xf6\xd9\x26\x2a\xeb\xaa\x57\x36\x2d\x88\xee\
+\xa4\x93\x4e\x09\x47\x1f\x7b\xbc\x65\xb7\xee\x3c\x57\xc1\x92\x53\
+\x26\x8b\xa9\x91\xfa\x4c\x76\x24\x32\x0f\xe0\x50\x32\xb1\x5e\x31\
+\x43\xca\x4f\xa7\xda\xaf\xd6\x1e\x70\x4d\xad\x15\xca\x5e\xf7\x49\
+\x75\x59\x5a\x5f\x1e\xb6\x48\xed\x46\x7b\x8d\xf2\xf6\x83\xe0\x50\
+\x1d\xf6\x20\x49\x2c\x0b\x0f\x5a\x22\x15\xa2\xe0\x4e\xe3\xe8\xd0\
+\x3c\xb6\xc9\x86\xd1\x24\x58\x02\xa9\xb0\x4f\xa4\x47\xb5\x3e\xa1\
+\x2e\x03\xfe\x50\x33\xa1\x02\x63\xbe\x3d\xc7\x16\x9c\xb5\xc7\x61\
+\xc0\x6d\x7b\xcc\x17\xc8\xc1\x9f\x01\xc6\xdc\xb3\xc9\x8d\xd0\x20\
+\x6f\x10\x31\x67\x24\x13\x90\x1b\xc8\x09\x95\x8b\x49\x51\xe2\xc8\
+\x27\x2a\xce\x89\x0c\xda\x6d\x1a\x4f\x8f\xe6\xa9\x5b\x14\x1d\x09\
+\x66\x8a\x54\x64\xa4\x8b\x71\xef\xce\x65\x4f\x3f\x69\xeb\x43\x66\
+\x04\xe0\x18\x02\x64\xf1\x6b\x52\xb3\x11\x4c\x68\x35\x57\xe4\xe9\
+\x54\x23\xf5\x30\x6a\x64\xdc\xba\x7b\x15\xe8\x07\xec\xe0\x58\x71\
+\xe2\x89\x27\xcb\x6e\x33\x4f\x88\x6f\xb2\xd4\xc1\x52\xbd\x4a\xca\
+\xad\xd6\x9e\x77\x29\xc8\x11\x3a\x44\x83\x71\x67\xda\x54\x3d\x36\
+\xc4\xa5\x03\x8f\xea\x67\x6f\x71\x8d\x33\xcc\x05\x0c\x05\xf3\xc3\
+\x77\x1c\x25\x58\x0f\xc6\xcb\x7c\x30\x66\xf7\xbc\x73\x7b\x0f\x92\
+\x07\x76\x10\x77\xbb\xa6\xaf\xd8\x41\x3c\x35\x10\xb6\x2e\x4f\xe9\
+\xe3\x6a\x7b\x08\xb4\x67\x13\x70\xcf\x42\x10\x75\x73\x8b\x32\xbe\
+\x0b\xb9\x94\x2a\x16\x8c\x3d\x5b\x2e\xf7\x61\x8b\xbd\x11\x5e\x2c\
+\x52\xfe\xc0\x94\x52\x2f\x55\x29\x59\xeb\x13\x4f\x3f\x62\x84\xb2\
+\x5a\xcc\x59\x5b\x8f\x72\x8b\x29\x59\x25\x44\xe3\x89\x65\x4f\x86\
+\x93\xe5\x10\xc4\xfd\x94\xd6\x98\x24\xc9\x72\xbb\x54\xe8\xd3\x55\
+\x8f\x06\x17\xfd\x62\x21\xba\x79\x92\xc8\xcd\x1d\x5d\x7f\xf3\x6e\
+\x62\x61\x4a\x70\x6c\x91\x24\x52\x21\x66\x12\x54\x5c\x27\x3b\x6c\
+\x9e\x6c\x90\x37\x5c\xff\x27\x53\xc5\xc1\x6c\x97\x29\x9e\x29\x4a\
+\x87\xd3\x1d\xce\x3e\x47\x52\x9f\x54\xe0\x84\x57\x0f\x6a\xad\xa9\
+\x2b\x45\xa0\xa6\x7b\xfe\x46\x8c\x45\x94\x66\x46\x04\xb9\x44\x6b\
+\x51\x25\x29\x68\xad\x18\x8c\xe7\xdc\x85\xd9\x3a\xe5\x75\x36\x86\
+\x9f\x01\x58\x36\x49\xa1\x36\x2d\x62\x2a\xa2\x3e\x14\xb9\x4c\x5c\
+\x21\xc0\x05\x70\xc0\x11\x78\x12\xc8\x28\x28\x28\x4a\xbd\xef\x85\
+\xb1\xbc\x7d\x43\x3b\xb1\x8d\x2a\x66\x98\x4d\x05\x47\x42\xc5\x72\
+\xb2\xa5\xaa\xf8\x52\x4a\x85\xbb\xa6\xcf\x5a\xa8\x44\x96\x8a\x5d\
+\xa9\x52\x54\xb1\x8c\xdf\x87\x1e\x73\xb8\x08\x47\xb3\xd4\x28\x7d\
+\x72\x73\xdd\x16\x66\xce\x55\x44\xbf\x6c\x0d\x2d\x8a\x36\x3e\x4a\
+\xba\xfd\x56\x0c\xe4\x12\x1d\x0b\xe5\xf1\x04\x10\xcf\x91\xda\x88\
+\x33\x9c\x0f\x7d\x9f\x31\x63\x61\xe4\x12\x59\x5c\xa5\x40\xca\xc9\
+\xc6\x4d\x16\x96\xec\x90\xfd\x43\xf1\x10\xea\x48\x69\x85\x52\xcc\
+\xe8\xda\xf8\xc9\x11\x20\x14\xab\x04\x00\x9c\x9f\x97\x6d\x2e\x12\
+\xd1\xb2\x60\xc2\xe9\xf3\x6c\xbc\xb3\x17\x1c\x62\xf7\x93\x14\x72\
+\xce\xe4\x69\x8a\xb4\x7f\x46\xef\xaa\x0e\x53\x34\x16\x36\xd9\x94\
+\x74\xcc\x00\xc1\x77\x59\x3d\xc4\x8d\xd0\xf8\x9c\xec\xa4\x26\x3b\
+\xff\xda\x85\xc8\x3c\xeb\x06\x05\x71\x09\x91\x42\x24\xd8\x14\xe5\
+\x22\x9e\x70\x3d\x13\x6a\x45\xe0\x74\x66\x43\xd2\x5f\xd6\xcb\xdc\
+\x4c\xe5\xe2\xcc\x9a\x19\x57\x58\xab\x3c\x64\xb2\x15\xe5\xab\x68\
+\x19\x41\x79\xed\x1d\xf2\x14\x52\xca\x11\x72\x9f\x75\xaa\xb0\xdb\
+\xf4\xea\x28\x75\x7c\xb7\x24\xc3\x83\x14\xb7\xd3\xb1\x63\x73\xe8\
+\xef\xac\x0a\xa9\x6e\x02\x59\x95\xbe\x46\xc3\xaa\x54\xd6\x84\x68\
+\x39\xdd\xf0\xf8\xec\xb3\xe9\xd6\x75\x47\xbb\xd6\x63\xc9\xe2\x85\
+\xe9\x11\x90\x93\xcd\xf2\x47\x75\x52\x73\x88\x6a\x85\x91\xaf\xff\
+\xa9\x2f\x38\x53\xc1\xa8\xed\x8a\xbb\x92\x4d\x4b\x5c\x34\x79\xde\
+\x5c\xef\x6e\x84\x2c\x4e\x71\xc2\x79\x87\xd6\xc5\xd2\xec\x0b\xe9\
+\x83\xa0\x70\x69\x66\xbc\xac\x1d\xc8\x84\xb1\xb2\xa1\x41\x74\x56\
+\x06\x01\x4a\x17\xc7\x14\x38\xe7\xb9\xfc\x99\x15\x86\xb4\xb7\x4b\
+\x3a\x37\xd5\x92\x08\xb5\x79\x2e\xc6\x6e\xfa\x1e\x17\x32\x55\x31\
+\x3d\xd8\x81\x36\xc8\xfd\xdd\xe6\x56\xd2\x90\xc7\x4d\x70\x0f\x8c\
+\x0c\xef\xf6\x40\x43\xaf\x7e\x8a\xb1\x1b\xc4\x09\xfc\x41\x60\x40\
+\x9e\x78\x48\xa1\x52\xe2\x5e\xd6\xc8\x0d\xca\xc0\x14\x88\xd5\x6b\
+\x93\xf0\x1b\xd7\xe0\xde\x69\x83\x67\xb8\x97\xe7\x50\x43\x81\x3c\
+\x41\x2a\x68\x01\xcc\x56\xa0\xc2\x5a\x93\x26\x4f\xb5\xb5\xe6\x59\
+\x57\x13\xba\xe3\x03\xb6\x45\xe2\x8d\xcc\x99\x40\xcc\x48\x85\xb2\
+\x51\xf4\x68\xad\x27\x4e\x98\x6c\xf3\xda\xb0\xb5\x29\x92\x52\x84\
+\xc6\x16\x2c\x90\xd4\x26\xf5\x96\x45\xc4\x43\x80\xf4\x61\x4e\xd8\
+\xff\xb5\x35\x51\xbd\x17\xe6\xc9\xdd\x8e\xdd\x26\xe1\x31\x45\x3c\
+\xc7\xfd\x10\x59\xe6\x06\xa2\x48\xdf\x59\x13\xc6\xe4\x99\x00\x20\
+\x06\xa8\xad\x98\x4b\xee\xf3\x76\xe8\x3b\xf8\x06\xd5\x13\xef\xa1\
+\x1d\xd4\x4e\x5c\xc3\x36\xc2\x18\x90\x7e\x58\x13\xe6\xc1\xe7\x0e\
+\x18\x81\xc9\x64\x1c\xac\xb7\xc7\x4c\xb9\x8a\x8e\x71\xf2\x1b\x78\
+\xc1\xbc\x57\x85\x00\x70\xe0\xe0\xfd\x5c\x83\xc9\x24\x2f\x18\x85\
+\xc0\xa8\x31\x44\x7f\x70\xb0\x28\x57\x86\x0b\x77\xc3\x36\x46\x4e\
+\xf3\x4e\x52\x5a\x88\x2e\x89\x47\xf1\xa4\x44\x82\xee\x54\xec\x1c\
+\xfd\xa5\x09\x3c\x20\x57\x2e\x5f\x61\x6b\xca\x7c\x74\xc8\xde\x69\
+\xa6\x06\xc1\xab\x67\xae\xa6\xfc\x3a\x0c\x0f\x76\x18\xb2\x66\xaf\
+\x5f\xb7\xc6\x3c\x51\xc9\x15\xc8\xfc\xdb\xd8\xe4\x41\x66\x76\x43\
+\x69\x66\x70\x04\x98\x22\xa6\x83\x84\x89\xd8\x13\x7b\x25\xd5\x64\
+\x3b\x34\x5e\xdc\xcc\x9e\x53\x22\x03\x56\xd8\xe9\x9a\x30\x42\x6f\
+\xe1\x4e\xa0\xa4\x33\x94\x57\x87\x33\x1b\x84\x6b\xa4\xc5\x40\x0d\
+\xc3\x06\x45\xc7\x48\xd5\x3b\xe7\x38\xd8\x6c\xc5\xa2\xf0\x49\x45\
+\x7b\x78\x71\x3b\xc4\x43\x88\xa4\x54\x6a\xb6\xce\x1d\x8d\x61\x93\
+\xd5\x54\x90\x91\x4b\xdc\x65\x9e\x92\x5e\x22\xa5\xfc\xe9\xda\xab\
+\xc2\x02\x79\x2e\x91\xe0\xb2\x5a\x12\xcc\x53\xab\x37\x2b\x32\x5f\
+\xe9\x5d\xa0\xda\x70\x04\xa2\xf6\x0f\xdf\xf3\x98\x71\x46\x00\xce\
+\x63\xf7\x53\x75\x6f\x72\x68\x58\x17\x65\xd0\x6d\xde\x12\xb9\x46\
+\x42\x34\xd6\x89\x23\x34\xf1\x5d\x8b\xb7\x66\xf9\xea\xb4\x6d\x89\
+\xcd\x82\x6e\xb5\x51\x63\xe3\xf7\xcd\x1b\xd7\x89\x2b\x8e\x0c\x9b\
+\x56\xe4\x49\x9b\x81\xcd\x8d\x2a\x00\x0f\xa2\x27\x97\x46\xa9\x36\
+\xc6\xc9\xb6\x31\x5e\xaa\x2b\x65\x7a\x0c\x4f\x3d\xb4\xdc\x54\x13\
+\xab\x9e\x90\xea\x46\x80\xb5\x7e\x79\xa3\x6d\x8a\xd1\x8e\x88\xb8\
+\x44\x00\x3d\xda\x91\x9d\xc8\x40\xa3\xa2\x08\x76\x47\x2c\x6c\x3e\
+\xde\xed\xf6\x0b\xae\x7b\x12\x42\xd6\x83\xf9\x61\xf3\xb3\xe1\xfb\
+\x95\x84\x53\x21\x3a\x61\x83\xbc\x93\x6a\xeb\x26\x84\xf5\xab\x96\
+\x0b\x69\xe4\x4b\x85\x26\xd7\xd7\xc6\x26\x1b\xf7\x24\xd9\xdb\x6e\
+\xfe\xeb\xfd\x26\xc9\x0c\x76\x2b\x6a\x5e\x79\xd5\x3e\x7c\xc5\xc7\
+\x35\x4f\xeb\x4c\x9c\xc7\x99\x22\xdb\xc1\xe6\x77\x15\x17\xc8\x01\
+\xa6\x82\xbe\x39\xe1\x80\x8b\x83\x98\x31\x4f\xc0\x15\x88\x1e\x84\
+\x04\xe7\x8e\x3a\xc9\xe3\x5f\xdc\xa0\xef\xee\xf2\xac\x17\x6e\xac\
+\x9f\xfa\xd4\xa7\xc2\xe9\x67\xbc\x20\x1d\xf4\xeb\xb1\x14\x9e\xea\
+\x08\xaf\x2f\x3c\x9a\x3c\xf6\xc5\x09\x15\x73\xc6\x3c\xb9\xfd\xc4\
+\x33\xf7\xc2\x45\x23\x4d\x81\xc4\xe1\x96\xb9\x07\xa4\x01\x87\xec\
+\xb5\x4c\xa8\xff\xe2\x15\x4f\x99\x53\x3c\x90\x70\x53\x87\xb0\x00\
+\xfb\x20\x2a\xc6\x14\xed\x83\x62\x43\x8e\x48\x38\x5c\xa7\xdf\x30\
+\x3f\xd8\x05\x80\x27\xf7\xde\xa4\x3f\x4e\x54\x40\x2e\xa8\x0d\x5d\
+\xbd\xc4\x1a\x62\xcb\xc0\xae\x00\xa1\x62\x4e\x98\xa7\x48\xdd\x12\
+\xcd\xaf\x7b\x2e\xd1\x8e\xcf\x27\x06\xe7\x2f\x7c\xe1\x0b\x66\xf0\
+\x66\x3f\xb8\x9d\x94\xb9\xe7\x7e\x10\xdd\x99\x67\x9c\x9b\xb6\x77\
+\xd2\x57\x6c\x58\x78\xd0\x01\x47\x1e\xd7\xe1\xc1\x8d\xc0\x3e\xef\
+\x64\x5d\x98\x4f\xda\x63\xbe\x21\x00\xdc\x0f\x41\x35\xb8\x52\xff\
+\xf8\xce\x75\xe6\x80\x31\xf3\x4e\xe6\x94\xc3\x63\x60\x78\x17\x49\
+\x38\x59\x7b\x7e\x77\x87\x06\x57\xbb\xd1\x47\xf6\x1d\x05\xcb\x7c\
+\x1f\xba\xcb\x32\x0e\x13\x8c\x9d\x36\x9c\x30\x01\x5f\xf4\x0b\x38\
+\x32\x17\xdf\xd8\x13\x96\x3e\xd0\x06\x76\x11\x70\x15\x36\x50\x08\
+\x0d\xc5\x05\x5b\xda\x9a\x0d\x8f\x30\x56\x6c\x58\x73\x66\x29\xa8\
+\x5c\x92\x74\xa5\xf2\x89\x91\x9b\xf0\x90\x25\x87\x58\x0a\xa9\xd6\
+\xae\x66\x1b\x07\x73\x94\x52\xfc\x59\xa1\x3c\x83\x89\x59\xe9\x11\
+\xa3\x79\xad\xbc\x45\x17\xc8\x10\x4f\x20\x2c\xf0\xbd\x60\x7e\x7f\
+\xf8\x9a\xb2\x92\x1c\x75\xd4\x31\x61\xd2\xd4\xc8\x3e\xc7\xda\x96\
+\xca\x21\x83\xf7\x90\xc6\x6a\xe3\xc6\xcd\xc2\x9d\x4b\x34\x5f\x95\
+\x36\x8f\xa5\x72\x94\x39\xe4\x90\x43\x8d\xd0\xe3\x5d\x86\x5a\x6c\
+\xee\x1c\x85\x18\x90\x9c\x57\x04\x05\x86\xab\x9b\xc2\x8b\x6a\x03\
+\xa6\x00\x55\xa8\x66\x32\xeb\xde\x03\xb9\xa8\xbf\xfd\x7a\xf7\xe8\
+\x08\x26\xa9\x85\x24\x02\x91\xed\x79\x0d\x2c\x5f\x8b\x79\xea\xba\
+\x75\x6b\xbe\xa9\xfb\x64\x1c\x1a\x9e\x4b\x2d\xfa\x8e\xb8\x1c\x45\
+\x39\x97\x86\xe3\x8e\x3f\x2e\x7c\xec\x3f\x55\xf7\x5e\x46\xb0\x53\
+\x4e\x39\x2d\x1d\xe4\x14\x01\x48\x95\x21\x33\x10\x13\x93\xda\x23\
+\x95\x05\xc0\x5e\x2e\x11\x94\x03\x71\x90\x89\x66\x92\x69\xaf\x56\
+\x5e\x54\xd8\x00\xaa\x09\xac\x92\x11\xb9\xa5\xbd\x37\x5c\x70\xf1\
+\x4b\xc3\x5f\xfe\x7e\x87\x24\x85\x79\x0a\x32\x0a\xd2\x85\x76\x2b\
+\x05\x4a\x99\x80\xa6\x5b\x88\x5d\xc5\x95\xa4\x95\x59\xfe\xe4\x36\
+\x71\xc4\x2a\x64\x74\xf5\xdf\xac\x64\xea\xc9\xa7\x1d\x17\x9e\x5e\
+\xb1\x35\x3c\x24\x91\xfb\x0d\x6f\x7c\x51\xf8\x9f\x1f\xfc\x3e\x2c\
+\x96\x9b\x67\x2f\xd1\xcc\x7a\xff\x59\x67\x9e\xa8\x34\x2f\x21\x7c\
+\xf2\x13\x3f\x0c\x67\xc9\xb0\x4f\xa9\x64\xd2\xac\x5c\x7a\xc9\x8b\
+\xc3\xdf\xae\xbf\x29\x1c\x7a\xc4\xe1\x02\xc8\x09\x72\x55\x5e\x61\
+\xfa\xe3\x57\xbc\xe2\x15\xe6\x25\xf4\x2f\xff\xf2\x46\xb9\x99\xfe\
+\xd5\x36\xc0\xf9\xe7\x9f\x24\xc4\xd7\x6f\x9e\x22\x6f\x7b\xdb\x9b\
+\x84\x54\xfe\x62\x84\xe8\x95\xaf\x3c\x49\x95\x07\x57\x98\x57\xcf\
+\xf9\xe7\xbd\xd0\x5c\x43\xf1\x79\x3f\xf6\xf8\xc9\x12\x97\x71\x9d\
+\x24\x81\x5e\x24\xbd\x59\x91\xb0\x11\xce\xcc\x4d\xb6\x1a\xf5\xa4\
+\x74\x1e\xed\x77\x9e\xc5\xc4\x80\x61\x1e\x62\x41\xfe\x4c\xa9\x6a\
+\xa5\x7a\x8c\x2a\x55\x46\x29\xf2\x75\x0f\xb6\x1c\xfd\x86\xeb\xaf\
+\x4c\x60\x91\x4d\x4b\xf7\xf3\xac\xf6\x98\xc6\x88\xbd\x44\x55\x3b\
+\xc7\x61\x0c\x53\x9c\x8c\x0c\x47\x13\x64\x87\x21\xff\xa3\xcc\x6d\
+\x61\xb2\xfe\xa6\x48\xdf\x90\x00\xff\x17\x3f\xfc\x5e\xf8\xe8\x47\
+\xfe\x5d\x9e\x64\x7d\x2a\x36\x86\xb3\x06\x46\xe4\xd1\x21\xcd\x0d\
+\xf0\x10\x37\x90\x07\x48\x08\xa4\xcd\xc6\x62\x03\x15\xa9\xf3\x5b\
+\xe4\x99\x04\x0c\x8d\xd3\x84\x35\x0a\x21\x4f\x14\x02\x58\x29\x22\
+\xf3\xb1\x8f\x7d\x4c\xeb\xf0\x2f\xb6\xb1\x69\xc7\xe3\xa8\x3c\x78\
+\xef\xaf\x2a\xac\x05\x41\xba\x58\x2e\xd3\xee\x3e\x4f\xbb\xdc\xef\
+\xfa\x7c\xd6\x86\x5c\x5b\x4e\x84\xe9\xa9\x1b\xb0\xe1\x2a\xb9\xcf\
+\xe3\x5a\xe8\x17\xdc\x34\x44\x03\x18\xe6\xba\xab\x5a\x40\x98\xee\
+\xc6\x8f\xc7\x93\x47\x8e\x7b\xb5\x4c\xda\xa7\x8f\x3c\xe3\x06\x5e\
+\x9e\x41\xc2\xa2\x98\x17\x0c\x8c\x47\x8d\xc3\xa8\xfd\xfa\xd7\xbf\
+\xb6\xf1\xf3\x0c\xc4\x04\x24\xca\x1c\x78\xca\x7c\x9c\x50\x78\x1f\
+\x04\xca\x2a\x27\xaa\x9f\x10\x5e\x60\xd4\x93\x36\xfa\x38\x41\x6c\
+\x7c\x78\x07\xc8\x14\x82\x68\xda\x07\x21\x49\xaa\x69\x82\x84\x3d\
+\x31\x2b\xe3\xe1\x3b\x7d\xc3\x7e\x74\xc2\xf1\xa7\xa4\x0d\xe4\xb4\
+\x01\xe1\xc1\x55\x9a\xb9\x66\x9f\xb2\x9f\xdd\xe5\x97\xfd\x4c\xff\
+\xce\x93\x73\x87\xc7\xba\xe0\xdd\xc7\xdc\x83\xc0\x69\x1b\xe2\xc2\
+\xfb\x19\x17\xf3\xeb\x8c\xa6\x33\x79\x8c\x91\x7e\xf2\x1e\xee\xc1\
+\x63\xce\xa5\x1d\xe6\xc1\x55\x6f\xdc\xc7\x33\x30\x01\x56\xb7\x46\
+\x30\x02\x81\xa0\x3f\xee\x66\x4d\x1f\xe8\x1b\xcf\x79\x40\x38\x0c\
+\x20\xf3\xca\x1c\x31\x7f\xac\x27\x6b\x05\x9c\x40\xe8\xe9\x2b\xcf\
+\xf0\x99\x28\xf5\x6a\xb3\xd6\x2b\x5f\xc9\x73\x27\x2b\x28\x1b\xef\
+\xc9\x59\x33\x66\x9b\x64\x8f\x8d\x99\xf7\xaf\x12\xe1\x62\x5c\x3b\
+\xb6\x6d\xb7\xef\xc5\xda\x58\xcc\x25\x89\x5f\xc7\x2b\x43\x79\x9e\
+\xd4\xc5\x64\xdc\x98\x21\x62\x82\xaa\x76\x82\x70\x20\xf6\x97\x47\
+\x1e\x78\xd0\xd4\xa8\x94\xaf\x70\x86\x04\xfc\x50\x8c\x54\x26\x8d\
+\x01\x63\x46\x82\xdb\x2c\xdb\x24\x70\x47\xc9\xe8\xe5\xcb\x9f\x56\
+\xaa\xa4\x65\x7a\x5f\xca\x24\x1b\x88\x32\xf3\xc4\xef\x10\x3d\xf0\
+\xdd\xa0\x88\xdb\xe9\xa7\x9f\xa1\xf5\x89\xf6\x03\x8c\x1e\x73\xee\
+\x41\xa5\xc0\x1e\x63\x85\xd9\xd5\x7b\xef\xd6\xdc\xfc\xa7\x3c\xdd\
+\x6e\x33\xd3\xc8\x5e\x1e\xb9\xd8\x64\x76\xeb\x95\x70\x27\x70\x4d\
+\xeb\xd6\xad\x17\x72\xf9\xa8\xa5\x75\xa1\xe0\xd2\x2d\xb7\xdc\x96\
+\xf6\xb8\x61\xe1\x5c\x24\x8f\x08\x4a\xf4\x3d\xf3\xda\x68\x2f\xa3\
+\x2c\x31\x0b\xb6\x55\xba\xe4\x66\xa9\x64\x8e\x3b\x7a\x9e\xbc\xbf\
+\x24\x4d\x88\x5a\xd7\x88\xb0\x08\x67\x87\x19\x87\xe0\xb5\x22\xe7\
+\x00\x01\xc3\x49\x47\xd4\x2b\x96\xe2\x89\x70\xef\x4d\x7f\x0e\x6f\
+\x7a\xcb\x5b\x15\xe3\xa1\xd2\xaf\xd7\x5d\x1d\xfe\xe3\x7d\xef\x0d\
+\x6f\x7d\xd3\xbf\x86\x6f\xaa\x92\xe1\x6f\xe4\x99\x53\x22\x44\x73\
+\xb2\x0c\xb1\x1d\xdb\x64\xe8\x7f\x68\x5d\xf8\xec\xc7\xde\x12\xbe\
+\xf6\xf5\x1f\x9a\xd8\x86\xfb\xe8\x87\x3e\xf8\xae\xf0\x8b\x5f\x7e\
+\x33\x7c\xf1\x6b\x3f\x0e\xef\x7d\xef\x1b\xc3\x5f\xfe\xf8\x8f\x70\
+\xe6\xe9\x47\x87\x9f\xff\xe4\xbf\xc2\xbb\xfe\xed\xdf\x44\x60\x7e\
+\x23\xb7\x62\xd2\x6f\x48\x15\x27\x6f\xe5\x3f\xff\xe1\x2f\xe1\x73\
+\x9f\x78\x53\xf8\xc0\x87\xbe\x60\x95\x0c\xf1\x24\xaa\x10\x4e\x5e\
+\xf3\xf4\x3f\xc2\x95\xef\x79\x7d\xf8\xf5\xd5\xbf\x0d\x07\x2b\xfa\
+\xff\x2f\xbf\xfd\x9d\xea\xca\x5f\x18\xfe\x7e\xfd\x0d\xe1\xc5\x17\
+\x5f\x14\x8e\x3b\x66\xd1\xee\x11\x19\x88\x4d\x4c\x14\x32\xcf\x80\
+\xc6\x48\xd7\x9d\x25\x58\xb3\x26\xe2\xda\xe0\x69\x2a\xe5\x82\x2c\
+\x6f\xe5\xa0\x24\xae\xb2\x6f\x29\x4f\x5a\x5d\x64\xe3\x69\x50\xd2\
+\xcc\x22\xa5\xff\xef\x55\xea\xf0\xda\xfa\xda\x30\x4e\x3e\x16\x6b\
+\x56\x8b\x2b\x95\xc1\x73\x72\xbd\x72\x67\x6d\x6c\x0e\xb3\x27\x0a\
+\x21\x36\x77\x59\xda\xfc\x59\x13\x8a\x82\xfc\x3a\xa4\x4e\x94\xb1\
+\x5f\x04\x06\xc2\xa5\x7c\xa3\xa1\x68\xb0\x34\x3c\xfe\xe8\xfd\x56\
+\xcb\xa0\x50\xfa\x80\x41\xd2\xea\x40\xa9\xb2\x10\x19\x27\x10\xa4\
+\x80\x39\xe3\x8c\x33\x0c\x21\x38\x8c\x98\x17\xa1\x8c\xa3\x6c\xf8\
+\x29\x04\x9a\xa2\xd2\x8c\xbd\x06\x40\x90\x20\x2b\x90\xb8\x07\x04\
+\xbb\x9b\xbb\x7b\x87\x79\xf4\x39\x1b\xcc\xbd\x7e\xb8\xe6\x08\x8a\
+\x67\x41\x4e\xce\x49\x72\xf6\xf7\xbb\x77\x19\x6d\x7b\xea\x22\x8f\
+\x57\xb9\xfc\xf2\xcb\x0d\x51\xd1\x17\x0f\xf4\xe3\x37\xde\x41\x9b\
+\x6c\x7c\xde\x49\x5b\x48\x85\x30\x26\x20\x14\x97\x16\x32\x25\x4b\
+\xcf\x05\x06\xf1\x41\x72\x81\x41\x03\xf1\x81\xa8\x5d\xba\xf2\x58\
+\x1d\x37\x72\xbb\x8a\xd3\x33\x04\x80\xdc\xcd\xdb\x4e\x6e\xb1\x20\
+\x51\x24\x21\xa4\x14\xe6\xcd\x23\xec\x79\x06\xa4\x04\x21\xf2\x71\
+\x82\x64\xf1\xde\x02\x71\xb3\x17\xb9\xee\xaa\x2a\xf7\xce\x73\x9b\
+\x06\xbf\x23\x41\xd1\x9e\x13\x51\x77\x1b\x77\x15\xa4\xa7\x5a\x61\
+\x1e\x3c\xfa\x9d\x36\xc1\x11\x48\x14\xee\x9c\xe0\x73\xe5\x59\x17\
+\x68\x9b\xdf\x3c\x95\x3e\xf3\xe6\xb6\x03\xe2\xa3\x20\xbe\xc4\x66\
+\xd1\xa6\x05\x67\xab\x0f\xce\x2c\x80\x60\x69\x2f\xca\x33\x27\x3b\
+\x88\xf6\xb5\x7b\xac\x71\xdd\x53\x00\xf1\xb7\x7f\x67\xae\x79\x0e\
+\xa9\x0f\x26\x91\xfe\x02\x13\xa8\xa1\x78\x17\xf3\x02\x11\xc6\x31\
+\x64\xa1\x34\x31\x94\x40\x87\x89\x26\xee\xae\x45\x4e\x14\xd8\x38\
+\x01\xd3\x4a\xa9\xc8\x16\x2f\x3a\xc8\x18\xd6\xc5\xf3\x16\x59\xbf\
+\x50\x6f\x99\xdd\x49\x36\x12\x32\xc0\x0f\xca\x1e\x49\xe2\x5c\xe0\
+\xe0\xd8\x63\x8f\xd5\xef\x91\xcb\x34\x0e\x06\x30\xdd\xa6\x92\x07\
+\x26\xf5\x2e\xb3\x4f\xa9\x2d\x54\xb3\xcc\x05\x04\x1a\xf8\xa2\x6f\
+\x68\x73\x0e\x3e\xf8\x50\x83\x21\xca\x57\x94\x48\x0d\xce\x1c\x9d\
+\x70\x7c\xa4\xe6\xed\x15\x22\xc4\x3e\x83\x83\x06\x36\x31\x18\x0f\
+\x88\x0c\xc9\x77\xb3\x1c\x83\x5a\x7b\x24\x99\xbd\x26\x30\xb4\x9d\
+\x2b\x91\x49\x54\x97\x21\xc2\x02\xec\x04\x81\xf9\x84\xb0\xc9\xe0\
+\x14\x00\x16\xfc\xea\xe1\x30\xdc\x37\x9e\x05\x8d\xb8\xc8\x42\x13\
+\x7f\xb3\x97\x07\x05\x55\x46\xc6\x48\xaa\x54\x72\x74\x88\x82\x7f\
+\xff\xbb\x5f\x0d\x8b\x64\x78\x3d\x55\xaa\x8b\xab\xae\xfa\xb1\x71\
+\x4f\x73\xa6\xcf\x32\x3d\xe4\x99\xa7\x9f\xa9\x4a\x91\xad\xe1\xfb\
+\xdf\xfe\x5a\xf8\xc5\x2f\x7e\x11\x4e\x3f\xed\xc8\xb0\x60\x76\xbd\
+\xec\xc7\x6d\xb2\x45\x14\xca\x2e\x52\xa2\x5c\x60\xe3\x8d\x43\x98\
+\x35\xb5\xda\xea\x88\x57\x14\xf7\x05\xe5\x61\x0c\x93\xc6\x11\xed\
+\xdc\x1b\xda\x77\x28\xff\x53\xad\xdc\x58\xa9\x1c\xdc\x27\x6e\x55\
+\x48\xb3\xaa\x58\x48\xa3\x57\x69\x43\x64\x43\x99\x39\x51\x22\x71\
+\x97\x38\x97\x3a\xd9\x1c\x64\x84\xb7\xca\x96\xdd\xca\x15\xa5\xfe\
+\x29\xf5\x99\x52\xa9\xc8\x46\x33\xa8\x60\xb6\xf6\x1e\xb9\x1b\x6f\
+\x0c\x4b\x1f\xba\x2f\xac\x78\xea\x01\x2d\x46\x67\x58\x30\x67\x62\
+\x38\xe7\xf4\xc3\xc2\xfd\x77\xde\x10\x8e\x3f\x72\x51\xe4\x7d\xec\
+\x4b\x3c\xc2\xd9\xa4\x80\x2c\x20\xe0\xae\x89\xa3\x01\xd2\xef\x7f\
+\xf5\x13\x5b\x1b\xd6\x88\x8d\x0a\x02\x83\x43\x32\x04\xad\xc8\xfa\
+\xa5\x4b\x9f\x36\x37\x59\x36\x08\x9b\x18\xb5\x0b\xf3\x79\xdb\x4d\
+\x7f\x0c\x2d\xe2\xce\x26\xa9\x96\x0e\x71\x15\x1b\xb6\x6e\x56\x62\
+\x4d\x55\x6e\x54\x67\xda\xa5\x3b\x9e\x4c\x81\x2e\x9d\x67\x4c\x9b\
+\x62\xb1\x2b\x47\x1d\x71\x98\x24\xa2\x6a\xa9\x05\x66\x88\x88\x2a\
+\xc7\x95\x1c\x31\x7a\xc5\x11\x97\x11\xcc\x96\x55\xe1\x2a\x75\x9c\
+\xe0\x05\xd5\x2a\x48\x91\x8d\x86\xaa\x83\xe0\x58\x38\xe5\x97\x5e\
+\xfa\xd2\x70\xe5\x95\x57\xda\x77\x38\x6b\x54\x55\x6f\x7c\xe3\x1b\
+\x8d\x53\xf6\x14\x2e\x20\x46\xf7\x2c\x33\xf7\x5b\x71\x96\x20\x5d\
+\xb7\x9b\xb8\xc4\x11\x6d\xd6\x28\xfb\x2d\x30\x08\x32\x70\x44\xec\
+\x59\x23\x2c\x80\x58\x70\xcb\x87\x76\x3c\xe8\xcf\xdb\x65\x43\xc3\
+\x69\x23\x75\x71\xcd\x83\x03\xbd\x38\x1f\xcf\x7b\xcc\x0d\x30\xcf\
+\x7c\xa3\xfa\x82\x73\xe4\x1e\x9e\x41\x22\x60\x9c\x20\x65\x10\xb0\
+\x7b\x89\x79\xd9\x65\x10\x29\xfd\xe7\x1e\xf7\x44\xf3\x58\x1f\x57\
+\x07\xb1\xde\xf4\x91\x67\xe1\x4c\x7d\x1f\x82\x54\x51\x21\xb1\xe7\
+\x3c\xf6\x06\x24\x0e\xe2\xe4\xdd\x8c\x9f\x0f\x48\x8c\x31\xb8\xa1\
+\x9c\x7b\x69\x87\xbe\x23\x0d\xb8\xdb\xf2\xf6\x6d\xad\x36\x5e\xda\
+\x35\x4f\x3e\xad\x91\xcf\xad\xe7\xdd\x72\x82\xe0\xc4\x9d\xfe\x23\
+\xa1\x58\xee\xb0\xb8\xac\xb3\x97\x2c\x60\xdd\x78\x27\xc8\x1d\x98\
+\xf3\xbc\x66\xee\xf5\xe4\x92\x07\x6b\xea\x92\x23\xf7\x40\x38\x3c\
+\x6d\x8d\xdb\x0d\x23\x2f\xb7\x88\xf1\xe0\xdd\x4e\x08\x3d\x07\x58\
+\x94\xda\x25\x2a\x18\xe8\xeb\xc2\x7c\xd2\x8e\x07\x6c\xbb\xa4\xea\
+\x6e\xd8\x20\x67\xc6\x03\xf1\x47\x5d\x56\x2a\x2f\xd8\x94\x1c\x4b\
+\x06\x55\xc1\x16\xa5\x92\xa9\x2d\x35\x47\x75\xb2\x0f\x73\xcf\xb6\
+\x86\x6d\xa1\x4a\xf6\x28\xd6\xba\x23\x4e\x9a\x5a\xab\x00\x63\x8e\
+\x3e\xbc\xbc\x26\xd6\xaa\x0c\xb7\x9c\x2d\x64\x7f\x21\xb3\x82\xac\
+\xd1\x66\x52\x00\x57\x4d\x12\x01\xc1\xce\x82\x73\x00\xce\x4b\x1d\
+\x38\x5b\xc8\x26\xc8\x1a\x50\x92\xbd\x5d\x4e\x48\xe3\x34\x4f\x0e\
+\x37\x13\x27\xd5\x9b\x63\x4c\xbb\x02\x2f\xf3\xaa\x81\xef\xa8\x52\
+\x27\xce\x37\x29\x4a\xca\x9b\x8d\xb2\x27\xac\x55\xaa\x19\xe2\xcd\
+\x22\x86\x6c\xb8\x06\x2a\x8d\x29\xc0\x2a\x29\xcd\x71\x4e\xf6\x98\
+\x7d\x41\x64\xb2\x51\x41\xfb\xcd\xd3\x6a\x80\x28\x3c\x55\x06\x40\
+\x80\x6b\x1d\x1b\x14\x17\xc0\x88\x8b\x10\xf2\xd6\x22\xb8\x31\x94\
+\x92\xbd\xbb\x73\xe4\xa9\x8a\x63\xab\x0c\x6b\x04\x1c\xd5\x28\x58\
+\xb1\x58\xd4\xe0\xcc\xb3\x4f\x56\x3e\xad\x3a\xe9\x47\x55\x89\x4e\
+\xd1\xe5\x27\x9d\x70\x48\xb8\xeb\xd6\x3b\x25\x15\x1c\xa7\x7b\x8a\
+\x94\x66\xa4\x2c\x5c\xf3\xab\x9f\x49\xa4\xed\x0c\x4f\x3c\xfa\xa0\
+\x08\x45\x6b\xf8\xc3\x35\x3f\x0b\xff\xfa\x96\x57\x87\x2f\x7f\xee\
+\x53\xf2\xba\x51\xba\x7f\x2d\xe4\x0f\x44\xac\xde\x7f\xc5\x07\x15\
+\x1c\xb9\x25\xfc\xd7\x97\xbf\x68\xe9\x59\x6a\x64\xd3\x79\xf0\xbe\
+\x5b\xc3\x65\x2f\xbd\x30\xfc\xe0\x3b\x5f\x0f\x27\x1c\x7d\xb0\x72\
+\x05\x29\x85\xc3\x36\x11\x8b\x8e\x86\x70\xc4\xc1\x8b\xc2\xb7\xbe\
+\xf1\xd5\x70\x86\x52\xb5\xdc\x74\xcb\x8d\xe2\x4c\x54\x25\xb0\xe6\
+\xc5\x61\xc9\xfc\xe9\xe1\x8b\x9f\xff\x74\xb8\xe8\xfc\x73\xc3\xad\
+\xb7\x5d\x2f\xf5\x53\xaf\xec\x13\x92\x96\x8e\x3b\x2c\x3c\xbd\xf4\
+\x1f\xe1\xf8\xa3\x0f\xb2\x68\x62\xf4\xe6\x1f\xf9\xe0\xfb\x8d\xab\
+\xe9\x17\x61\x2a\xcf\x62\x93\x89\xe8\x0f\x9c\xfd\xde\x32\x1a\x79\
+\x96\x4c\x73\x96\x12\x6d\xe6\xcb\x88\x3f\x4e\xee\xc8\xb5\x15\x53\
+\xc3\x74\x49\x60\xc5\xb2\xf5\xc1\x81\x88\xb4\x84\x89\x75\x51\xb2\
+\x41\x36\x90\x52\xa4\xd9\xbd\x53\x24\xd1\xd4\x48\xc7\x36\x43\x36\
+\xaf\x4e\x21\x86\x63\xe4\xed\xd5\x45\x30\xaa\x82\xbb\xea\x34\xf7\
+\x64\x64\x46\xa5\x09\x41\x38\xe7\xcc\x57\x28\x60\x52\x2e\xe3\x29\
+\xa2\x92\x1f\x15\x81\x21\xca\x5f\x6a\x27\xa5\xb7\x40\xe7\x29\x81\
+\x68\xd4\x03\xd8\x00\x51\x33\x37\x70\x96\x20\x16\x98\x15\x24\x0c\
+\x36\x5b\xbf\xd6\x1d\x7b\x06\x84\x10\x44\xc3\x66\x06\x21\x40\x38\
+\xe0\x36\x6d\x8e\xe2\x28\x66\x8f\x73\x71\x83\x2e\xb0\x06\x72\xcb\
+\x8c\xab\x72\xbd\xb9\x47\xca\x1b\xf7\x19\xc7\x58\xb9\x7a\xc9\x03\
+\xfd\x40\xe2\xe6\x78\x12\x27\x81\x75\x43\x3a\xba\x7d\x90\x3b\xed\
+\x67\x26\x44\xa5\xff\xf4\x8f\xf6\x40\xa2\x6e\x6f\x80\xc0\x40\x4c\
+\xe8\x33\x84\x12\xa2\xe3\x65\x87\x79\x27\x08\xde\x13\x5f\x42\x94\
+\x20\x00\xbc\x3b\x33\x6d\x0b\xef\xe6\x9d\xee\x99\xe6\x36\x11\xda\
+\x45\x65\x04\x12\xe5\x3d\x48\xd0\x10\x05\xe6\xcb\xf7\x9a\xc7\xf0\
+\x80\x58\x4d\xaa\x8d\xb9\x7a\x4f\x97\x03\x71\x63\x5e\x40\x58\xf4\
+\x07\x22\x05\x3c\x60\xf7\x99\xaa\xf2\x0c\xdc\xcf\xfe\x66\x5f\xd3\
+\x07\xcf\x34\xec\xc4\x90\xf9\x62\xac\xfc\xce\xdf\x6e\xc7\x62\x6d\
+\x68\x17\x4d\x07\xe3\x72\xaf\x35\xcf\x9b\xc6\x3a\xd3\x07\xfa\xc5\
+\xf8\x40\xf0\x5c\xf3\x40\x48\xb7\x9f\x30\x66\xd4\x82\xbc\x8f\xbe\
+\xb8\xca\x1d\x62\xc0\x33\xfc\xce\x3c\x40\x08\xbd\xb4\xb3\x13\x70\
+\x7e\x67\x6e\x78\x07\xed\x79\xca\x1c\xe6\xd7\x03\x47\x21\xc8\x48\
+\x30\xf4\xdd\xed\x46\x8c\xc7\x1c\x3c\xe4\xb5\x58\x5b\x3b\xce\xd6\
+\x64\x8b\x32\xa9\xc3\xa8\xd1\x16\xf9\xf4\x7a\x44\x78\x66\xc9\x9b\
+\xf4\x19\xe5\xc7\xdb\x2c\xe9\xa3\x41\xd9\x38\x1c\x1e\xb1\xab\xa0\
+\x5e\x1b\xaf\x20\xed\xc5\x0b\x17\xc8\x09\xa9\x39\xb4\xf7\x28\x1d\
+\x96\xbc\xfa\x2a\x34\xc6\x2d\x72\x6d\x67\x1e\x91\x78\x3c\x7b\x49\
+\xa1\xa4\x13\x1c\x4e\xba\xe4\x0d\xb8\x65\x6b\xa3\x05\x90\x46\xd5\
+\x46\xb5\x1f\x05\xf3\xa5\x92\xa6\xd6\x2b\x07\x63\x8b\x02\xba\x53\
+\xa9\x4d\xa6\x0a\x5b\xa9\x4c\x1a\x91\x5d\x50\xce\x2c\xf2\xe8\x2b\
+\x50\x8d\xa8\x59\xb2\x1b\xe1\xb5\x6c\x12\x9b\xa4\x9e\x51\x0e\x90\
+\xca\xa0\x9e\x7d\xce\x89\x4c\xa2\x24\xe3\xf5\xb2\xf3\xe4\x2a\xe9\
+\x1b\x04\x8e\x08\xb1\x8d\x8d\x00\xa7\x00\x90\xbb\xe7\x05\x40\x12\
+\xb9\x9a\x26\x57\x86\xa3\x1e\x48\x9f\x28\x7e\xbe\x92\x38\x96\x54\
+\x28\x5e\x40\x9b\xf1\xaf\x7f\xfd\x8b\x79\x7c\x3c\xbd\x6c\x93\xa2\
+\xd3\x95\xaa\xfd\xcc\x53\x45\xb9\x97\x29\x8d\xfe\x74\x4b\x18\xf9\
+\xd3\x1f\x7d\x5f\xae\x81\x33\x65\x5c\x9b\x6d\x1e\x6d\x1b\x36\xac\
+\x91\x68\x3a\x23\x74\x1b\xd7\xb8\x41\x01\x7c\x4a\xc5\x2e\xa0\xe4\
+\xfb\xe4\x29\xe3\xcd\x1d\x90\x3c\x5f\x4b\x16\xcf\xb5\x33\xf1\x10\
+\x54\xb6\xec\x6c\xdf\xa1\x36\xe6\x48\x9a\xe9\x0e\x7f\xfa\xed\x35\
+\x96\x56\x3f\x52\xab\x0c\x8a\xf0\x1c\x19\xd6\xaf\x59\x11\x0e\x5e\
+\x38\xdf\x80\xf6\xa6\x1b\xae\x0b\x0d\xda\x04\x47\x1d\x7a\xb0\x1c\
+\x15\x24\xd5\x29\xa5\x3f\x0b\x7f\xf5\x2f\x7e\xa2\xa4\x94\xe3\x24\
+\x1d\x1c\x2c\x47\x81\x8d\x8a\xa1\xf9\xa3\x38\x9a\x7a\x21\x81\xa9\
+\xa1\x59\x9b\xee\xf6\xdb\x95\xa6\x85\xfa\x12\x31\xbf\x31\xd2\x99\
+\xbc\x43\x96\x7b\x28\x26\x35\xc3\xcf\xe4\xfc\xda\xe9\x10\xec\x8e\
+\xc1\xb1\x86\x4a\x52\x56\x3d\x81\xb0\xca\x86\x5c\x28\xb7\xe0\x27\
+\x9f\x7a\x2c\x4c\x9b\x3c\x25\xfc\xfd\xc6\xbf\x86\xad\x4a\x1b\x83\
+\x54\x32\x7d\xca\x54\xe3\xa4\xa8\x28\xd9\x23\x77\xcd\x55\xcf\x3c\
+\x1d\x56\xcb\x3b\x86\xfb\xe7\xcc\x9e\x1e\x5a\x1a\xc4\xed\x6a\x0d\
+\x1a\xb7\x6e\xd1\xbc\xeb\x09\x11\xa1\xf6\x0e\x79\x02\xc9\x8d\xb3\
+\x43\xe7\x1a\x05\x85\xde\x74\xe3\xf5\x16\x14\xd6\x2b\x4f\xa4\x45\
+\x4b\x16\x47\xcc\x93\x06\xd3\x2b\x35\x27\x2e\xbe\x56\xa9\x72\x94\
+\xe3\xa3\x1f\xfd\xa8\x52\xfb\x7c\xd1\xd2\xae\xb0\xa9\x31\xd6\x23\
+\x69\x11\xe4\xf8\xc9\x4f\x7e\x32\x14\x5d\x52\x6a\x1b\x1f\x02\xc3\
+\xa6\x3c\x5e\xae\xa0\x7d\x9a\x73\x10\x0e\xe5\x1c\x40\x34\x2e\xc9\
+\xf8\x2b\x5c\x95\x02\x22\xf1\x24\x84\x6e\x3b\xe1\x1a\x6b\x03\xf2\
+\x03\x5e\x5d\x75\xe6\x1e\x48\x4e\xb0\xfc\x0c\xb7\xcf\xfd\xce\x71\
+\x93\x42\x1e\xa2\x83\x5a\xca\x38\x4e\x8b\x15\x89\xaa\xbe\xd2\x0f\
+\xec\x35\xa8\xd3\x20\x9c\xc0\x3a\xed\x7c\xfb\xdb\xdf\xb6\xe0\x4a\
+\x90\x23\x7a\x7f\xaf\x51\x03\x3c\x99\x37\x96\x08\x92\xdb\x17\x78\
+\x17\xed\x61\xdf\xc3\xc9\xc0\x83\x41\x41\xc6\xce\xed\x43\x14\x68\
+\x0b\x49\xc1\x6b\xc6\xd0\x17\x5c\x76\x3d\x30\x9a\x71\x82\x0c\xdd\
+\x81\x01\xa4\x0b\x81\xf1\x36\x99\x17\x10\x32\x73\x8f\x6a\x0d\x62\
+\x49\xe0\x21\x7d\x82\x00\xf2\x2c\xce\x3b\xf3\xe6\x2e\x32\x49\xd8\
+\x3d\xa0\xf0\xe6\xc2\xbe\x02\x02\x64\x6e\x18\xa3\xa5\x9a\xc7\x60\
+\xad\x0f\xc8\x99\xb5\xe4\xbd\xee\xe9\xc7\xdf\xa4\xce\xf1\xd4\x2e\
+\x3c\x47\x7f\x3d\x9e\xc4\xed\x61\xe4\xfd\x73\xd7\x64\xda\xa5\x2d\
+\x82\x4e\x89\x59\x71\x02\xc7\xf8\x5c\xda\xe4\x4c\x4c\x10\x6a\x56\
+\x54\x8d\xcc\x2d\x84\xe6\xfb\xdf\xff\xbe\x79\x96\xf1\x37\xe3\xa4\
+\x1d\xd6\xc6\xa5\x55\x98\x5f\xe0\x86\x79\xf7\xeb\xf4\x81\xb6\x28\
+\x3d\x81\x5a\x10\x82\x6d\xee\xce\x92\x58\x2a\x14\x88\xb6\x43\xcf\
+\xdc\x70\xd3\x8d\x0a\x6c\x55\x08\x84\x5c\xd5\x6b\xe5\xfa\x5e\xa2\
+\xf9\xff\xfa\x77\xbe\x15\x7e\xa5\x2c\xf3\x7d\x92\x24\x8a\x64\xab\
+\x99\xa0\xdf\xc9\xbe\x6e\xf6\x27\xed\xcd\x12\x79\x81\x9d\x7c\xfc\
+\xb1\xe1\x3d\xef\xfe\x77\x9b\x13\x5c\x94\xf3\x35\x4f\x6f\x7a\xcb\
+\x9b\xc5\x1c\x9f\x18\x0a\xc9\x33\xa8\x67\x8d\xa1\x91\x0d\x87\xbe\
+\x62\x07\xda\xa0\x9c\x83\x44\xfc\x57\x89\x20\x8d\x57\x1f\xe8\xe7\
+\xcf\x7e\xf6\x73\x25\xda\xbd\xc6\x60\xcf\x1d\x5e\x98\x43\xd6\xd6\
+\x55\xc5\x0b\x65\xef\xc1\xc6\xe8\x12\x5b\x16\x46\x9e\x4d\x39\x80\
+\x77\xd9\xee\x30\xfb\xd9\xee\xd9\x6b\x75\x99\x3a\x59\x22\x80\x43\
+\x95\x9f\x95\x8d\xf6\x88\x63\x3a\xe1\x2e\x8b\x91\xc7\xd4\x4e\x49\
+\x25\x32\xe2\x46\x04\x13\x20\x8e\x8e\xa8\x78\x99\xab\x7b\xa2\x58\
+\x99\xe8\x70\xfd\xb0\x89\xb9\x8a\x5d\x28\x54\x9d\x84\x1e\xe5\x1e\
+\x7b\x81\xf2\xf8\x5c\xfc\x92\x97\xeb\x0e\x49\x46\x72\x57\x06\x93\
+\x45\x49\x13\xa4\x02\xa0\x4e\x3d\xff\x9d\xae\x2b\x2a\x8a\x95\x8e\
+\x25\x11\xb2\xa4\x42\xe6\x68\x86\xf5\x6c\xd7\x73\x9d\xfc\x34\xd2\
+\xcb\x62\xd8\x4f\xea\x97\xcb\x32\x31\xde\x76\xfc\xbd\x5b\xe7\x78\
+\x36\x6d\x86\x92\xde\x33\xd2\xef\xb6\xf2\x54\xb7\xb4\x43\xb0\x28\
+\x22\x13\x55\xce\xb4\x1f\x62\x29\x4b\xee\x9a\x92\x6a\xc8\x19\x56\
+\xa2\xda\x34\xef\x7a\xe7\xfb\x8c\x8b\x62\x3d\xfb\xa5\xeb\x53\xb6\
+\x9e\x34\xe7\xcc\x5a\xb3\xfe\x6e\x43\x01\x31\xbb\x3d\x00\x84\x00\
+\x12\xc0\x68\x0b\x02\x03\x09\xb8\x87\x19\x04\x05\x64\x6c\xb5\xdd\
+\xf1\xe0\x11\x82\xf2\xf4\x2d\x3c\xe7\xea\x2d\xcf\x5e\xcb\x73\x48\
+\x15\xee\x45\x95\x99\xb7\xca\xa4\x23\x32\x04\xc4\x2e\xbc\x9e\x24\
+\x11\x84\xe8\x9e\x57\xb4\xed\x31\x28\xae\x1a\xf2\xf2\x03\xa4\x73\
+\x21\xab\x05\xcf\xbb\x47\xa1\x67\x66\xe6\x39\xde\x0b\x12\xf3\x78\
+\x13\x90\x17\x7d\xc4\xe0\x4e\xbe\x2c\x8a\xa4\xd1\x07\xfa\xc6\x7d\
+\x78\x62\x41\x4c\xdf\xf6\xb6\xb7\x19\x52\xa3\xdd\x6b\xaf\xbd\xd6\
+\x9c\x01\x2c\x35\x8c\x10\x1e\x48\x9e\x31\x22\xed\xf0\x1d\xee\x1c\
+\xce\xdb\x91\x0d\xab\x03\xa2\x81\xdb\x47\xad\xc8\x78\x21\x0a\xf4\
+\x01\x26\xd0\xe3\xb9\xf0\x8e\x72\x2f\x39\xd6\xe0\x7a\x39\x46\xe0\
+\x40\x40\x9a\x1b\x90\x1b\xf3\xee\x92\x0a\x12\x20\x84\xe7\xb1\x47\
+\x9f\x34\xd5\x1b\x07\xfb\x9a\xbe\x61\xb3\x24\xd3\x05\x5c\x3d\xf7\
+\x39\xa2\xa6\xef\xac\x95\x33\x9e\xcc\x1d\xeb\x48\xdb\x20\x7b\xd4\
+\x9c\xcc\x3d\x87\x07\x8e\xf2\x1d\xe2\x87\xc7\x1a\x2a\xd3\xd8\x20\
+\x6d\x04\x8a\xfe\x61\xdf\xe4\x59\xe0\x06\xe2\x44\x5f\x5c\xb5\x45\
+\x3b\xb4\xcf\x1c\xc3\x30\xd0\x5f\x98\x01\xe6\x82\xc0\xd7\xdf\xfc\
+\xe6\x37\xe6\x39\xe8\xee\xea\x5e\xb2\x80\x77\x90\x4f\x8e\x74\x2f\
+\xf4\x99\x36\xb0\x93\x5c\x78\xe1\x85\xd6\x57\xd6\x8b\xb6\x30\xca\
+\x97\xc9\x0d\x98\x35\x3d\x5a\x01\xc0\x04\x44\x62\x5b\x9b\xa9\x12\
+\xd6\xc5\x52\x67\x0d\xca\x4b\xe6\xae\x07\x1f\x08\x17\xbd\x4a\x92\
+\xbc\x62\x58\xee\x7a\xe0\xfe\xb0\xe8\xa0\x83\x2d\x27\x1f\xb1\x59\
+\xe3\xa4\x66\xae\x57\x1c\xd8\x6a\xd5\x9a\x22\x78\xd5\x6c\x26\xca\
+\xc8\xf1\xc8\xc3\x8f\xc8\x96\x72\x52\x38\xe3\xcc\xb3\x4c\xc2\xf1\
+\x44\xa7\xe3\xb5\xbe\x30\x30\x48\x44\x87\x1d\x79\x94\x99\x1a\xce\
+\x53\xd6\xf9\x76\xa9\xd2\xd8\x53\xcc\xfd\xeb\x15\x3c\x8c\xba\x0d\
+\x5c\x0b\x3c\x41\x64\x1c\x9e\x99\x23\xd6\x98\xf9\xaa\x53\x06\x8f\
+\x81\x98\x78\x29\x17\xe6\x2e\xb6\xc6\x18\xe7\x46\xbb\x3b\x5f\x08\
+\x32\xc7\x63\xaf\x89\x8c\xe3\x7b\xc3\x50\xcf\xd1\x81\x24\x13\x57\
+\x6f\xb7\x68\xe5\x21\x51\x7d\x52\xbf\x47\xa6\x26\x97\xf2\x48\x32\
+\x02\xca\x8b\x48\x0d\x47\x9a\x60\xa9\xe7\xd8\x34\x8c\x4a\x1a\xc7\
+\x1f\x61\xbf\xdd\x3d\xf3\x24\x29\x19\xac\x85\x6c\x2e\x60\xa3\x62\
+\xf0\xcc\xf7\x7b\x3f\xf6\xec\x6c\xe3\x8e\x50\xfc\x1e\x9f\x6d\xd8\
+\xe9\xb5\x63\x9e\x22\x59\x69\x77\xcf\x36\x8f\x9a\x73\x7b\xb1\xc1\
+\x22\xf3\x1b\x91\x3b\xd6\x86\x0f\x84\xbd\x48\xfa\xdf\x3e\xa4\x06\
+\x6d\x56\xf4\xc8\x9d\xf2\x2c\xab\x90\xda\x91\x1a\x3d\xb4\xe1\x6e\
+\xd3\x74\xc5\x73\xd1\xb1\xb9\x41\x74\xa4\xcf\xf8\xd0\x87\x3e\x94\
+\x56\x2d\x91\x07\x0a\x29\xe0\x07\x3f\xf8\x81\x21\x8c\x94\xda\x24\
+\xad\x0a\x9b\xaa\x80\x78\x82\xd8\x2d\x17\xc4\xc6\x06\x03\x71\xb8\
+\xab\x2e\x6d\x7a\xe0\x19\x88\x05\x44\x83\x97\x16\x1b\x9e\x8d\xe7\
+\xc1\x81\xf4\xc3\x55\x64\x20\x73\x47\x34\xee\x4a\xeb\x9e\x6d\x6e\
+\xc3\xe1\x5e\x10\x01\x6a\x1f\x8f\xab\x21\x93\x00\x08\xc7\xd3\xc1\
+\xbb\x77\x16\x08\x0a\xc9\x0b\x9b\x24\x7d\x81\x68\xa2\x22\x03\x11\
+\x80\x44\x79\x9e\x34\x20\x20\x31\xda\x75\x35\x1a\xcf\xbb\x57\x17\
+\x48\xcf\x5c\xec\x45\x20\xfe\x5b\x89\x55\xe1\xcc\x41\xa2\xee\xe5\
+\x86\xa6\x80\xfe\x10\x1e\x00\x02\x44\x3d\xe6\x25\x99\xb9\x87\x08\
+\x7c\xf4\xf8\x20\x53\x38\x73\xde\x43\x3f\xe1\xf4\x91\x08\x99\x57\
+\x10\x12\x2a\x49\x88\x12\xfd\x84\x58\xd0\x47\x88\x90\xdb\x32\x78\
+\xfe\x96\x9b\xef\x30\xe2\x86\xf4\xc4\x7d\xae\x56\xe5\x3d\xd4\x76\
+\xf2\xba\x2b\x10\x28\xde\x45\xdf\x21\xd0\x8c\x99\x3e\xf1\x6e\xfa\
+\x0e\xa1\x03\x81\xbb\x4a\x8e\x76\xdc\xfe\xe3\x20\xca\x35\xcf\x04\
+\xc0\x3c\x81\x30\x5f\xff\xfa\xd7\x1b\x32\x85\xa8\xb2\x86\x10\x3a\
+\xfa\x07\xd1\xa5\xbf\xcc\x33\x73\xc0\x9a\xf1\x9d\xe7\x7c\xac\xcc\
+\xd3\x2d\xb7\xdc\x92\x4e\x51\x43\xfb\xff\xfe\xef\xff\x6e\x70\x63\
+\x71\x2c\x16\xf4\x18\x11\x3d\x1c\x2e\x48\xb4\x09\xf1\x01\xfe\x98\
+\xfb\x45\x0b\x16\x86\x27\x1e\x7e\x34\x4c\x52\x29\x90\x97\xbe\xa2\
+\xd8\xec\x2a\x8f\x3c\xb9\xd4\x8c\xf4\xc4\xb4\x6c\x56\x9e\xc2\xb5\
+\x5b\x36\x85\xb3\x27\x4b\x1d\x2d\xf8\xfc\xc0\xc7\xfe\xd3\xaa\xd0\
+\x1e\x72\xf2\x71\xe1\xab\xff\xf5\x0d\x39\xc7\x48\x52\x56\x0a\xa6\
+\x2d\x6a\x8b\x04\x97\xbc\xbf\x43\xf0\x4b\x06\x8a\x71\xf5\xaa\xdf\
+\x23\xe2\x08\xd3\x01\x03\xd2\x19\xa7\xa3\xd9\x28\x09\x06\xb5\x19\
+\x63\xb4\xa0\x71\xa9\x9b\x09\x1c\x66\xcd\x80\x75\x60\x38\x4a\xcc\
+\xba\xd5\x24\xac\x5a\x39\x0e\x44\x9e\x82\xd1\x7c\xb2\xa7\x20\x2e\
+\x3c\x4b\x65\x5e\x95\x63\xd4\xe8\x46\xac\x8e\x99\x89\x56\x72\xc2\
+\xf0\xb9\x12\x99\x9c\x5e\xbe\x2f\x1e\x06\xb7\xe3\xa2\x0b\x71\x51\
+\xd1\xd1\x18\xc9\x81\xea\x18\x5a\xa6\x5d\x27\xfa\xdb\x4a\x09\x67\
+\x90\xc5\x88\x50\xf1\xf4\x9e\x9f\x9d\x74\x59\x81\x16\xda\xdd\xd3\
+\x73\xdc\x9f\x6c\xea\xb0\x24\x09\x25\x92\x64\x22\xd2\xba\xa7\xed\
+\x44\x04\x25\x12\x44\xf3\x8d\x40\xef\xd9\xd9\x68\x4b\x5a\x61\xaa\
+\xf9\x36\xd5\x9d\xcb\x56\x51\x7f\xda\x65\x2f\x43\xff\x5c\xa1\xbc\
+\x64\x0a\x61\x35\x8e\x0e\x75\x23\xb9\xca\xba\xe5\x00\xd0\xd8\xd4\
+\x22\x0e\x2e\xaa\x97\xe1\xde\x52\xae\x1f\x77\x23\x34\x5c\xab\xc7\
+\x66\xb8\xbb\x2d\x9b\xc9\x8b\x4e\xb9\xea\xc4\x8b\x7c\x79\x0c\x87\
+\x73\xeb\xee\xdd\xe4\x52\xb2\xb9\xc6\xeb\x7d\xc4\x7f\xc0\x6d\x97\
+\x29\x3d\x8c\x13\x22\x88\x15\x08\xca\x63\x3c\x40\x5a\xdc\x8f\x14\
+\x03\xe2\xb1\x38\x07\xfd\xed\x2e\x9f\x6c\x60\x10\x29\xc8\x0c\xa4\
+\x8c\x2a\x89\x7e\x21\x45\x78\xbe\x2f\x10\x82\xa5\x65\xd1\x73\xf4\
+\x11\xe4\x08\xc7\xed\xd7\x20\x3c\x48\x62\xa8\x63\xe0\xcc\xdd\x43\
+\x8a\xf7\x42\x4c\x20\x6e\x6e\x67\xa2\x9f\xdc\xcb\x77\xdc\x8b\x79\
+\xb7\x3b\x0b\x80\xe4\xdd\x98\x0f\x12\xe1\x03\xa1\xe1\xec\xc6\x7f\
+\x10\x10\x6a\x27\x9e\x83\xf3\xe7\x03\xd2\xf5\xbf\x21\x8c\x10\x25\
+\xd6\xc0\xfb\xef\x12\x25\x44\x01\x7b\x11\xd2\x0d\x7f\xb3\x26\xfc\
+\x06\xd1\x30\x23\xb7\x90\x36\xc8\x1c\x64\x8f\x8a\x0a\x89\x06\x02\
+\x80\x57\x1b\x08\xd4\xa5\x24\x2f\xca\x86\xc4\xd5\x28\x1f\x77\x97\
+\x4a\xdd\x4e\xe4\x4e\x1a\x1e\xc3\xe3\xf1\x73\xac\x9f\xab\xc5\x20\
+\x46\xbc\x9f\x67\xf1\xc4\x82\x38\xf2\x9c\xdb\xae\xe8\x87\xd7\x74\
+\xa2\x5f\x1e\x0f\x03\x32\x86\x60\xf2\x61\xae\xdd\xd6\x02\x5c\x31\
+\xef\x1c\x9c\xdd\x83\x8d\xb5\x74\x67\x24\xae\xe1\xd5\xc7\x3a\x32\
+\x5f\xa4\xbe\x7a\xc9\x79\x17\x58\x92\x57\xdc\x91\x9b\x44\x80\x15\
+\xd2\x11\x8e\x3b\xf5\x04\xc1\x80\x92\xd3\xca\x6f\x1f\x18\xbf\xeb\
+\xbe\x7b\x45\x5c\x1a\xc2\x1f\x94\xa9\xbc\x57\xfd\x9a\x38\x75\x4a\
+\xe8\x56\x50\xeb\x6c\x05\x61\x36\xab\x04\x07\xa6\x84\x71\x72\x2f\
+\xa6\xcc\x05\x6a\xe5\x0d\xeb\x37\x2a\xab\xfa\x7c\x11\x87\x46\xc1\
+\xca\x33\x06\x27\x66\xe7\x21\x7e\x0d\x33\x02\xe3\x26\x6c\xc3\x32\
+\x93\x28\x8d\x90\xe2\x08\x26\x29\x8c\xe2\x19\x05\x06\x23\x6d\x31\
+\xe7\x78\x9b\x91\x75\x81\xa4\x98\xb8\x33\x13\x8f\x67\x81\xa1\x22\
+\x7e\x29\x39\x02\x0c\x49\x72\xc2\x21\xc1\x89\xe8\x08\xb8\xd8\x88\
+\x4c\xae\x9e\x65\xc6\xb0\xe5\x80\xe8\x1d\xbd\x3c\x67\x92\x0c\x48\
+\x8d\x2c\xc8\x2e\xbf\x10\x25\x1b\x91\x12\x5c\x4d\xa9\x88\x45\x42\
+\xc4\x88\xb4\x64\x52\x96\x48\x72\x71\x29\xd0\xb9\xef\xe8\xb9\xe8\
+\xd8\xc3\xb3\x73\xf3\x7b\x7a\xb6\xf4\x2f\xe8\xca\x32\xba\x38\x9a\
+\x01\x65\x54\xc3\x8a\x4f\xff\xde\x91\x99\x5d\xb5\x9d\x7b\x38\x6e\
+\xa0\x30\x7e\xc4\x85\xb5\x88\x2b\xda\x99\x61\xae\xb6\x42\xea\xaa\
+\x58\xc2\x21\xf6\x09\xef\xaf\x9f\x5f\xfd\x53\xd9\xa0\xb6\x18\xa2\
+\x9a\xac\x80\x9a\x0a\xe9\xaa\x39\xdc\xc3\xc7\xe2\x5f\x84\x30\x5d\
+\xa7\xef\xa9\xd6\x3d\x68\x8f\x7b\xd9\x60\xdc\x3f\x91\x20\x26\xa6\
+\x4f\x9b\x17\x04\xee\xd7\xf9\x8d\x03\x04\xe1\x04\xc4\x03\x2d\xdd\
+\x13\xac\x5a\x9b\xd5\x7e\x97\x8e\x1c\x44\xe4\xcf\x80\xd4\xdc\xa0\
+\xef\x65\xc0\xdd\x38\xee\x6a\x34\xdf\x37\xa8\xc9\x40\x9e\x20\x1e\
+\x77\xcb\xa5\x0f\x20\x3d\x10\x3c\xd7\x9c\x48\xb9\x14\x05\x01\xa2\
+\x3d\x2f\xae\x45\xff\x50\xcd\x90\x82\x9e\x76\x40\x8e\x1e\xf3\x41\
+\x5b\x20\x19\xe2\x41\xe8\x17\x63\x84\xc0\xc0\x9d\x23\xc1\xe1\x62\
+\xec\xc9\x65\x41\xde\x20\x23\x10\x31\x08\x18\xc4\xef\x81\x89\x1e\
+\x29\xcf\x78\x21\x86\xee\xe6\xcb\x3d\xee\x40\x40\x9f\x41\xd8\xbc\
+\x9b\xe7\xdc\x1d\x9c\xf7\x82\x78\x91\x74\x88\x1b\xc2\x9e\x01\xf1\
+\xa5\x5f\x5e\x8c\xcd\x5c\x67\x45\xa0\x99\x5b\xce\xd8\x9e\x20\xa4\
+\xcc\x23\xef\x46\x22\x83\xd8\x33\x5f\xbc\x83\xbf\x99\x17\xfa\xe3\
+\x04\xdc\xbd\xd0\x78\x3f\x6d\x83\x54\xe9\x87\xc7\x00\x31\xf7\x6e\
+\x43\x61\xce\xe8\xb7\xf7\xc3\xe3\x8c\x3c\x32\x9f\xef\xdc\xe3\x6b\
+\xce\x99\xf6\x98\x3f\x24\x11\xbe\xf3\x1e\xe6\x12\x22\xc9\x7c\xd0\
+\x2f\x88\x8e\x4b\x91\x2e\x5d\x31\x97\x5e\x7a\x99\xf7\xf1\xac\x05\
+\x6e\xcb\x9e\x38\xa8\x31\x90\x3f\x11\x2f\xd8\x6d\x0a\x6e\x9b\x2e\
+\x02\x52\x45\x92\x40\xe1\x97\x66\x11\xd0\x6a\xc5\xff\x75\x4a\x9d\
+\x35\x5e\x25\xd4\x57\xac\x5d\x17\xea\x45\xdc\x9f\x90\xdd\xaa\x84\
+\x6c\x07\xb2\x49\x0e\x89\x58\xf8\x3c\x9b\x4d\xd7\x2a\xb7\x46\xb8\
+\x89\x77\x21\xc9\xb0\xd6\xc0\xd1\x64\xb5\x4d\x5a\x2d\x3c\xcd\x60\
+\x06\x4c\x0d\x4c\xf9\x79\x39\xd5\x6c\xd7\xbb\xcb\x14\xd8\xdc\x24\
+\x55\xda\x5c\xe5\x4a\x6c\x68\x68\x52\xe2\xda\x09\x06\x4b\x48\x2c\
+\x64\x62\x7f\xe4\x91\x87\x2d\xd5\x0c\xf9\xce\x20\x2e\xa4\xb0\xa1\
+\x24\xf3\x28\x87\x2b\x47\xf6\xd6\xab\x28\xdd\x6c\x2e\x44\x66\xb4\
+\xce\xfd\xd3\xae\x83\xd8\x54\x83\x30\x14\xc8\x87\xb8\x50\x91\xeb\
+\x85\xe4\x47\x8b\xa7\x24\x85\xdd\x45\x48\x3f\xdf\x58\xed\xd8\x46\
+\x90\x26\x2c\x2e\x09\x3a\x49\xd2\xe2\xd2\x56\x6c\x1b\xd9\xdd\xb3\
+\x21\xb7\x78\xb4\x7b\x45\x27\x62\xfa\x62\x59\x28\x62\x02\xb9\xa7\
+\x67\x24\x87\xc8\xde\xb4\xe7\x67\xba\xee\x24\x6a\x6f\xc6\x1f\x05\
+\x51\x22\x47\xc5\x12\x8d\xcd\x45\x4c\x75\x94\x33\x8e\xbf\xb6\xc9\
+\xcd\x99\x62\x63\xd5\x4a\x76\x0a\xe7\x77\xcc\x51\x87\x85\xd7\xbf\
+\xee\x55\x72\x09\x8f\xf2\x95\x51\x3a\x81\xcd\xc2\x26\x82\x50\xb0\
+\xb1\x41\xbe\x10\x14\x27\x1e\x2e\x79\x70\x06\x39\x3b\x67\x6d\xd1\
+\xcc\xda\xa8\xc5\xa4\xf7\x88\xd3\xe0\x98\x41\x59\xef\xbb\x4f\x36\
+\x01\x74\xf6\x1e\xaf\xe2\x40\xe9\xb1\x2b\x5c\x07\x69\xbe\xe3\x1d\
+\xef\x08\x87\x1c\x76\xa8\x71\xf6\x6e\x34\xf6\x60\x3b\x24\x86\x8f\
+\x7c\xe4\x23\xc6\xd9\x7b\x8a\x19\x37\xa0\x7a\x00\x1b\xed\xc0\x3d\
+\x83\xd0\xa2\x78\xb0\x75\x69\x9b\x12\x08\x91\x31\xd1\x6f\x10\x35\
+\x7f\x93\x67\x0b\x49\xc2\x63\x46\x40\xce\x20\x51\x88\x09\x63\x63\
+\x2e\x40\x6a\x78\xa8\x31\x17\x20\x7e\xfa\x83\xbd\x09\xe2\x80\x9a\
+\x8b\x67\x5d\xd2\x72\x69\x82\x36\x40\x7e\x20\x71\x54\x3b\x8e\xf0\
+\xb9\x0f\x44\x83\xc4\x85\x8d\x08\x02\x07\x22\xbd\xfd\xf6\xdb\xcd\
+\xc8\x8f\xca\xcb\x55\x2c\xd8\x51\x3c\x1b\x81\xd7\x82\x41\xea\x72\
+\x07\x0a\x08\x12\x63\x74\x9b\x28\x4c\x02\x7d\x43\x3a\xe2\x6f\x8b\
+\xdd\xd0\xda\x21\xd5\x79\xaa\x1b\x24\x07\xfa\xcd\x38\xe8\x1b\x08\
+\xd3\xeb\xbf\xf0\x1c\x31\x1f\xac\x75\x94\xce\x29\x22\xbe\x6e\x9b\
+\xa3\x4d\x7e\xf3\xb1\xb9\x73\x10\x84\x9f\xb9\x45\x02\xa3\x7f\x20\
+\x63\x77\xac\x70\xe2\xcc\x99\x71\x59\x8e\x36\xb9\x67\xbb\xfb\x3b\
+\x6d\xb0\x46\xae\xfe\x63\xde\xe9\x87\x07\xdf\x72\x2f\xf3\x4b\xbf\
+\xdd\x2d\xdc\xb9\x7d\xcf\x65\x06\xb1\xa2\x4f\x55\x53\xca\x75\x9f\
+\x24\x1a\xad\x53\x81\x52\xb7\x6c\xd9\xb2\x41\xd5\x6b\xe7\x9b\xb4\
+\x50\x3b\xa0\xbc\x6a\x82\xf7\x2a\x95\xd3\x50\x7a\xbf\xd0\xdc\x28\
+\xaf\x40\x61\xf8\xed\x4a\xdc\x5a\x5c\x2a\xbb\x5f\xb7\x1c\x9c\x84\
+\x9f\x52\xf2\x0c\x03\xcd\xb3\x3e\xe3\x34\x56\xfa\xe7\x92\x2d\x1e\
+\xa6\x10\x44\xd6\xad\x46\x36\x14\x25\x13\x13\x43\xd4\xad\x5c\x7c\
+\x03\x36\xae\x43\x15\x57\x87\xc4\x44\xd5\x57\x72\xa8\x11\x90\xc9\
+\xfc\x45\x6e\xd6\x62\xd4\x44\x5c\x56\x3c\xb3\x2c\xf6\xc8\x2c\xb5\
+\x35\x22\xe1\x29\x1f\x2a\xdb\x32\x1e\x24\x9d\x51\x8e\x03\x42\x92\
+\xf9\xa7\x11\x93\xd1\x5f\x04\x8f\x2c\xef\x21\x49\x04\x4a\xcd\x68\
+\x1f\xc7\xfa\x05\x4c\x51\x3a\x94\x1c\x6c\x1e\x21\xe2\x21\x4b\xc3\
+\x13\x19\xa5\x65\xee\xd2\x85\x48\x1f\xe9\xe1\x46\x7b\x72\xce\x8c\
+\x54\x1f\x2d\x77\x5b\xd2\x75\x33\x03\x39\xb2\x8f\xff\xf6\x6b\xbb\
+\x75\xce\x55\x8e\x34\x2a\x89\x44\x18\x49\x42\x7b\x7a\xc6\xb3\x2d\
+\x6a\x21\x22\x72\xcc\x79\xe6\x1c\x12\xc1\x1c\xdd\x80\x62\x4e\x55\
+\x0e\xbb\x3b\x15\xed\x2f\xf7\x4f\xb8\x3d\x1d\x85\x8a\xd8\xef\xed\
+\x25\xff\x59\x54\x92\x81\x03\x24\xc9\x66\x67\x13\x78\x35\x48\xab\
+\x5b\x22\x03\x34\x08\x02\x37\x5c\x74\xfc\xc6\xa5\xaa\x5d\xee\x05\
+\x51\xb8\x4a\x66\xb2\x90\x19\x5c\x2e\xcf\xe0\x5a\xeb\x2a\x1d\xf7\
+\xa4\x82\x63\x84\x6b\x46\x3d\x85\x0b\xfd\x31\xc7\x1d\x9b\xae\x20\
+\xe9\x08\x1c\xa2\x02\x22\xc1\x05\x1b\x8e\xdc\x89\x8a\x7b\x3a\xb9\
+\xda\x8c\xb6\xbd\x62\x26\x04\x80\x71\x90\xee\x9f\xfe\x81\xe8\x5c\
+\x55\xe6\x89\x1e\x3d\x50\xd2\x63\x58\x40\x08\x18\x6c\x71\xd1\x76\
+\xa7\x03\x90\x32\xc6\x7c\xfa\xc2\xe1\x31\x2a\x8c\xd1\xd5\x26\x20\
+\x25\xbc\xec\x40\x92\x8c\x1f\x84\xc8\x19\x64\xcd\xb8\x21\x64\xee\
+\xf1\xe6\xb6\x28\xfa\x0a\x21\xc0\x8e\x41\x5f\xfd\x39\x10\x2e\x73\
+\xc3\x5c\x23\x39\x30\x56\xe6\x87\xdf\xdd\xbd\x17\xe4\x05\x57\xcd\
+\xf8\xf8\xdb\x09\x31\x04\xcc\x63\x7a\xe8\x27\x84\x82\xe2\x5e\x38\
+\x2c\x40\x04\x98\x43\x54\x55\xcc\x03\x6b\x02\xd2\xe4\x7e\xde\xef\
+\x69\x74\x18\x23\x84\x25\x0a\x0e\x8c\x4a\x83\xf0\x9b\xd7\xa2\x72\
+\x15\x19\xc4\xc4\xdd\xa1\x69\x8b\xdf\x61\x04\xb0\x61\xb9\x94\xeb\
+\x52\xa5\xdb\x91\xf8\x8e\x44\xe9\xeb\xc7\xda\x23\xf1\xf1\x7e\x0e\
+\xc6\xc3\x18\x21\x80\x6e\x83\x01\x66\x70\x08\x70\x77\x69\xc6\x00\
+\x0c\xc0\x94\x38\xf1\xa5\x2f\xf4\x61\x82\xdc\xff\xa9\x59\xb4\x4d\
+\x35\x90\x36\x6c\x5a\x1f\x0e\x51\x3c\x58\x4a\xe1\x18\xe5\xb2\xcb\
+\xcc\x56\xbe\xba\x0a\xec\x54\x22\x24\x85\x42\xfa\x53\x6b\xc7\x5b\
+\x12\xd2\x0a\xad\x63\x33\xe5\x63\x95\x5e\x06\xdf\xad\xe3\x4f\x3c\
+\xc1\x08\x65\x04\x97\xfd\x16\x94\x7d\xd3\xdf\x6f\x34\xa9\x1f\x6f\
+\x35\x9f\x9b\x35\x82\x7d\xfa\x86\xbd\xa6\x44\x8e\x05\xa8\x7a\xf1\
+\x93\x1a\x14\x83\x3d\x79\xca\x44\x49\x60\xe3\x2d\x61\xf0\xcd\x37\
+\xdf\x64\xf1\x3b\xb8\x3a\x03\x5f\x64\x85\xe6\x1e\x88\xce\xcc\x99\
+\x73\x4c\xfa\x49\x29\xf5\x4d\xa6\x33\x55\x7a\xf3\xed\xfc\x63\xcc\
+\x26\xc3\x5c\x40\x24\x4c\x8a\x91\x1b\x60\xa1\xf4\x8c\x85\x88\x99\
+\xae\x05\x1b\xee\xdd\x8d\x78\x02\x12\x37\x0d\x15\x37\x71\x03\x66\
+\x69\x08\x4d\xec\x10\x10\x8b\x25\x7b\x4a\x68\xb2\xa5\x45\x19\x61\
+\xf1\xd2\x97\x78\x4f\x9a\x46\x44\x3e\x07\x51\x1f\xf7\xf0\xbc\xd7\
+\xae\x17\x31\x81\xf1\x49\xb3\xb9\x88\xe7\x75\x77\xcf\x2a\x2b\x67\
+\xcf\x40\xe6\xa3\x67\xe2\x31\xf9\x3a\x88\xee\x9b\x74\x21\x11\x33\
+\x4f\xc2\x4b\x95\x44\xfb\x0a\x72\xd8\xa8\x32\x26\xc1\x61\x85\x05\
+\xaa\xc1\x40\x5e\x58\x21\x19\x8f\xec\x76\xe2\xc0\x35\x36\x36\x88\
+\xd4\x6b\x84\xa0\x76\xe1\x6f\xa4\x14\x0c\xc9\x5b\xc4\x19\xe2\x25\
+\x04\x72\x44\xe2\x00\xf1\xbc\x58\x08\x83\x4d\x0b\x72\x72\xf7\x5f\
+\xfa\x00\x72\xe3\x1d\x8e\x74\xdd\xf6\xe3\x1e\x48\x4e\x84\xf8\xce\
+\x07\x24\x83\xcb\xb4\xa7\x46\x71\xc3\x36\xe3\x74\xf5\x99\xa5\x0e\
+\x89\x0d\xe6\xa8\x59\xb0\x43\x7c\xfc\xe3\x1f\x37\xa2\x07\x07\x0c\
+\xe2\xf6\x00\x45\x4f\xc7\x0f\x32\x61\x6c\x3e\x2e\x90\xe0\x7b\xdf\
+\xfb\x5e\x7b\xc6\xe3\x74\x40\xb6\x8c\x13\x42\xf8\xdd\xef\x7e\xd7\
+\x10\xa0\x7b\x62\xbd\xfb\xdd\xef\x0e\x1f\xfe\xf0\x87\x6d\x3c\x9e\
+\x3c\x93\xfe\x70\xbf\xbb\x25\x43\xb4\xdc\x21\x01\x22\x82\xc4\x04\
+\xb2\x27\xef\x16\xdf\x39\x6e\xb8\xe1\x86\x74\x00\x23\xe3\xc0\x83\
+\x8d\xf6\x78\x0f\x5c\x2f\x59\xa1\x19\x0b\x44\xdf\x83\x16\x21\x66\
+\x8e\x7c\x21\x58\x6f\x7c\xc3\xe5\x46\x18\x5c\xa2\x82\x68\xff\x44\
+\x95\x4a\x59\x07\xd6\x08\x62\xec\xb1\x37\xbc\x13\x3b\x98\x1b\xe3\
+\x21\x38\x8c\x99\x7b\x89\xa6\xe7\x80\x78\x32\x2f\xcc\x91\x4b\x63\
+\xee\xcd\x85\xd4\xe5\x6e\xe1\xcc\x25\x86\x78\xde\x01\x11\x00\x2e\
+\x3c\x38\x95\x7b\xf8\xb0\xfe\x18\xcd\x81\x01\x88\x3a\xeb\xcb\xbb\
+\xc9\x3a\x02\x02\x47\xa2\x43\x42\xc4\x86\x41\x7b\x6e\xc3\x63\x5c\
+\xd8\x94\x20\x9a\x96\xcc\x57\xed\xf0\x0c\xce\x1c\x48\x62\x9e\x49\
+\xa2\x47\xb9\x96\x7a\xc5\x30\x81\x4f\x78\x7e\x9a\xca\x26\xd4\x13\
+\x10\x29\x8f\xb3\x7c\x21\xf5\x21\xad\xff\x3b\xde\x74\xb9\xa4\xb5\
+\x16\xd9\x26\xbb\x4d\x2d\x8b\xbe\x0a\x7c\x51\x5c\xa4\x40\x5a\xe1\
+\x2c\xf0\xd7\xb9\xe7\x9e\x6d\x95\x47\xbb\x64\x8f\xe9\x51\x0c\xda\
+\x41\x07\x1d\xa2\x44\xbe\x1d\x61\xf5\x33\x2b\xcd\x51\x86\x6c\x02\
+\x9b\xa4\x5e\xae\x97\xdd\x87\xd4\x30\x54\xbb\xad\xd3\x9c\x31\x2e\
+\xfa\x58\xae\x3d\xd5\xa2\xec\xd7\x78\xe7\xdd\x77\xdf\x83\xb1\x67\
+\x65\x54\x3f\x28\xb2\xc5\xe1\x42\x9e\xaf\xfd\x31\x45\xc4\x32\x52\
+\x87\x16\x49\xf2\x62\x1f\x24\x1c\xd2\xce\xe5\x16\xed\x6f\x7b\x25\
+\xe9\x2d\x59\x7e\x8f\x51\x32\xca\x9e\x48\x12\x88\x1c\xac\xa8\x19\
+\x9d\xf1\x3d\xc2\x9b\x23\xb8\xc8\x46\x46\xe2\xe8\x7e\x38\xe8\x61\
+\x0e\x5a\xcf\x7a\x0e\x83\x3d\xde\x5c\x4e\x10\xf8\x4e\x69\x5d\x9e\
+\x8b\x30\x9a\x9f\x77\x62\xba\x6c\xa3\x8b\x14\x4c\xff\x2b\x8e\x9c\
+\xb5\xa6\xb9\xcc\x82\xfb\xec\xed\x94\x06\xad\x35\xd7\x1f\x8a\xf6\
+\x50\xbe\x40\x3b\x4a\x2a\x85\xa8\xd2\x60\x9e\x45\x1a\x8b\x3c\x69\
+\x13\x52\x39\xd4\x5d\x91\x41\x6e\x20\x40\x8c\xab\x20\x4c\xb8\x72\
+\x74\xcf\x6c\x26\x88\x08\x1b\x06\xee\x18\x69\x06\x2e\xde\x75\xec\
+\x04\x05\x3a\xb2\x82\x7b\x37\xc0\x16\xd2\x05\xc9\xbb\xb1\xde\x23\
+\xe1\xdd\x2d\x9e\x0d\xe8\x41\x8e\x20\x1f\x10\x9b\x7b\x8f\x81\x50\
+\x41\xba\x1e\x47\x01\xa2\xf1\x64\x95\x1e\x08\xe8\x2a\x23\x9e\x85\
+\x48\xc0\x19\x73\x8d\x94\x2a\x70\xfc\x10\x17\x8f\xc4\x46\x55\xc4\
+\x7d\x56\x50\x4d\xe3\xf7\x98\x16\x90\x17\xaa\x10\x2a\x5b\xf2\x2c\
+\x7d\x63\x2e\x3c\x32\x9e\x6b\xa4\x4d\xf1\xf7\x33\x26\x08\x1e\x63\
+\xfa\xac\x4a\x71\x33\x2f\x9e\x7f\x8b\x74\x25\xe8\x7b\x29\x4d\x80\
+\x0a\x6a\xc5\xb2\xe5\x96\x0b\x0f\x8f\xa7\x7c\x4d\x72\x87\xea\xbf\
+\x20\xc1\x20\x51\xf2\x9d\xf3\x80\x10\x61\xb7\xb2\x58\x53\x72\x62\
+\xf3\xc6\x4d\xe2\xb0\x2b\xc3\xd6\xcd\x5b\xec\x39\xdc\x73\x79\xdf\
+\x87\xaf\xfc\x90\xe5\xca\xaa\x56\x65\x55\x5c\x67\x2b\xe4\x62\xcb\
+\xf3\x44\xa2\xf3\x3e\xca\x39\x50\x0a\xa1\x5f\x9e\x1c\x13\x65\x7c\
+\x3e\x48\x12\xd8\x37\xbe\xf9\x75\x0b\x42\x56\xc9\x18\x25\x81\x54\
+\x0c\x89\xbc\xa8\xf0\x30\x4c\x89\x83\x6e\x52\x04\xfc\x9a\xb5\xab\
+\x14\xa9\x3e\x5e\xa5\x03\xe4\x65\x38\x58\xae\x0a\xb2\xd5\xe1\xa5\
+\x97\x5c\x6a\x25\x3e\x4a\x14\xf3\x86\xa1\x9a\x24\x93\x54\x6d\xc4\
+\xad\xb7\x47\x06\xf4\x26\xa9\x9b\x2c\x70\x50\xfb\x3f\x5f\x78\x80\
+\x08\xfb\xfa\xf1\x75\xe1\xf5\xaf\x55\xcd\x7a\xc5\x64\x6d\xdd\xd2\
+\x18\xa6\x2b\xbe\x4c\x43\xb2\x20\x47\x8c\xde\x70\xee\x44\xb6\xf3\
+\x9d\xeb\x8d\x8a\xac\x67\x7e\x5e\xf7\xda\x57\x87\xcd\xaa\x08\x4b\
+\xd0\x35\x59\x90\x2f\xbe\xe8\x45\xca\x94\xac\x14\x3b\xba\x9f\xfb\
+\xe8\x57\xfd\xf8\x89\x56\x05\x16\x62\x40\x70\x23\x15\x55\x2f\x7b\
+\xe5\xcb\xe3\x8a\xb8\xca\x9a\x2d\x83\x3d\xc6\x76\x8a\x46\x76\xa9\
+\x26\x0c\xeb\xca\xbd\x94\x73\xb0\x68\x0c\x35\x34\x85\xb4\x30\x27\
+\x1e\xaf\x71\xe0\x4c\x12\x14\xb8\x3a\x3d\xac\x57\x16\xee\xa8\x82\
+\x27\xb5\x8e\xe4\x41\xa9\xea\xb5\xbc\x77\xf3\x86\x2d\x46\x1c\x14\
+\x62\x6f\x76\xe6\x17\x5f\x78\xbe\xad\x8d\xab\xbe\x90\x6c\x20\x74\
+\xe6\xec\xd2\xd1\xa2\xf6\xc8\xe4\x2d\x4d\x8e\xe6\x78\xeb\xd6\x06\
+\xad\x51\x6d\x38\x41\x5e\x6b\xc7\x1e\x77\x92\x1c\x11\x24\x5d\x97\
+\x8f\xb3\xaa\xb7\xcd\x3b\x1a\xc2\xe1\x47\x28\xe5\x4e\x4a\x59\x00\
+\x14\x62\x60\x6a\x44\x79\xb2\x11\x32\xd2\xa0\x39\x2d\x53\x62\xcd\
+\x51\x8e\x7d\x86\x55\xf6\x9a\xc8\xa8\xb3\x43\xe2\x1c\x9a\x84\xf4\
+\x8d\x95\x85\xd4\x98\xca\xc4\xea\xca\x64\x7e\x8f\xbc\xbf\x76\x3a\
+\xc6\x0e\xf7\x82\xb2\x3a\x8d\xcf\xf6\x8e\xa2\x3d\x3d\x57\x24\x60\
+\xb5\x3a\x27\x54\xb2\x54\x41\xa0\x1e\x19\xd8\x20\x34\xe5\x9a\x9c\
+\x4e\x22\xcc\x15\x7b\xd1\xa5\xeb\xf9\x12\x0f\xdb\xa8\x64\x67\xf8\
+\x2b\x36\x70\x08\x68\x77\x3d\xb0\xd3\x44\xc4\x25\xfd\x0b\xa2\x0d\
+\xd7\x8c\x12\x3a\x65\xdb\xfd\x73\x9a\x73\xdf\x1b\x3c\x9d\xf9\xf0\
+\x5e\xbe\x7f\x6f\x5e\xfb\xac\x39\x89\x2d\x3a\x3e\x37\x7b\x72\xde\
+\x85\x4c\x9b\x98\x98\x31\x8f\xf1\x8b\x0a\x24\xb9\x90\xb4\xcf\x00\
+\x5b\xde\x64\x8a\x98\x32\x8f\x9c\x82\xc2\x4a\x6d\xb0\xc8\xf0\x08\
+\x12\x06\xc9\x42\x0c\x3c\xc5\x09\x48\x18\xb5\x05\x9c\x2a\xc4\x85\
+\x8a\x8a\x10\x1d\xdc\x8a\x31\x40\x13\x5c\x78\xf2\xf1\x27\x84\x8b\
+\x24\xd1\xfc\x4d\x55\x22\xc9\xc8\x0b\x37\x0b\x57\x8c\x1a\x05\x8e\
+\x1b\x82\xc1\xd9\xe3\x6d\x78\x07\x08\xc1\x83\x03\xcd\xae\x13\x1b\
+\x9a\x5d\x5a\xf0\x34\x24\x10\x21\x8f\xb1\xf0\x80\x4e\x8f\xc0\x87\
+\x00\x79\x4a\x19\x57\xb1\xd1\x16\xea\x0c\x10\xbf\xab\xa3\xdc\x1b\
+\x8c\x76\x68\x83\xe7\xf9\xf0\x2e\x37\xbe\x43\x4c\x22\x7d\x79\x14\
+\xb8\x89\xb4\x00\xb1\xa5\x1d\x90\x0c\x01\x8e\xbc\xcf\xd3\xe4\xb8\
+\x33\x00\x5c\xb5\x95\x4c\x20\xd5\xbc\xe6\x90\x2a\xa3\x5d\x22\x26\
+\x29\xc1\x7f\x89\xd4\x34\xe3\xc4\x5d\xb7\x4b\xa5\x33\xa0\x52\x18\
+\xa5\x7a\x67\xcb\x0e\x79\x32\xe9\x37\x7e\xe7\x7e\xce\x7c\x7f\x46\
+\xe9\xe4\x29\xf3\x00\x27\x5d\x24\xe2\x8a\xb7\x53\x19\xde\x51\xba\
+\xbf\x4b\x7d\xb0\xd2\xc9\xa8\x7d\x08\xa6\x14\x71\xe1\xb9\x41\x8d\
+\x95\x62\x6c\xe4\xda\x62\x5c\xa4\xb2\xef\x56\x8a\x18\x04\xdb\xce\
+\x4e\xa5\x42\x11\xf1\xc9\xd3\xfe\x6b\xcd\xdf\x91\xae\x87\x44\x90\
+\x74\x85\xec\x11\x83\x12\x69\x53\x4a\xa1\x52\x41\x3e\x2e\x19\xcf\
+\x6b\x29\x2b\x9e\x81\x01\xea\x54\x5f\x29\xf3\xbb\xaa\x00\x2b\x3d\
+\xd1\x74\x30\xb7\xfa\x16\x39\x95\x54\xce\x9a\x61\x67\xbf\x6f\xaa\
+\x82\x88\x93\xfc\x2b\x17\x2e\x98\x93\xbe\xbf\xc6\xca\x46\x0c\x5a\
+\x30\xf4\x68\xcf\xd5\x90\x74\x4f\xfd\x9a\x31\x5d\xa9\xf1\xe3\xfe\
+\xcd\x98\x16\xa9\x95\xa7\x29\x48\x39\xad\x36\x71\x5b\xaf\xf0\xd2\
+\x94\x28\x63\x4c\x74\x08\xd6\x4a\x91\x5a\x85\x9f\xe8\x75\xc3\xc6\
+\xb5\x14\xb1\x0c\x7d\xf2\x06\x33\xa8\x87\xa0\x29\xb1\xef\x80\x9e\
+\xab\x23\x1b\x82\xa4\x9d\x12\x0b\xa1\x50\x05\x59\xd9\x58\x4a\x44\
+\x84\x76\x48\xda\xa3\x3c\xf9\xfc\x69\xb3\x43\x91\x42\xff\xf2\x44\
+\x2c\x52\x72\x8d\x56\x68\xb4\x02\x9f\x85\x6b\x55\x9e\x64\xea\x34\
+\x05\x22\x77\x36\x4a\x62\x28\x0a\xdb\x5a\x65\x0f\xaa\x9a\xa9\x16\
+\xea\x85\x8b\x55\xc7\xa6\x4c\xf9\xdc\x54\xc2\xa1\xa0\x40\x12\x8f\
+\xec\x30\x10\xc0\x32\x65\xa7\xa7\xd6\xd6\x38\x39\xdd\xa4\x94\x71\
+\x80\xe4\x2a\x1e\xb4\xec\xe1\x04\x82\xd1\x3c\xc1\xa2\x95\x5d\xd6\
+\xfe\xcb\x13\x61\xdc\x6b\xa2\xb3\xd7\x44\xc6\xe7\x51\x44\x25\x1d\
+\xac\x13\xc9\x34\x11\x81\xd9\xfd\xb3\xd5\x3d\xdb\xcd\xfb\x63\x37\
+\x63\x93\x66\xa2\x0f\x96\x15\xec\x2b\x29\x49\x35\xee\x9e\x6c\xca\
+\x44\x75\xab\xc0\x00\x72\xf8\xe1\xcf\x0e\xbb\x9e\xb6\x80\xc7\xd7\
+\x77\xf7\xfb\x08\x6f\xd8\xab\x4b\xbb\xfb\xbe\xe1\xf7\xed\xd5\xcb\
+\x46\x98\x13\x6b\x17\x82\xbb\x87\xe7\xd1\xde\x9f\x41\xdf\xf3\x85\
+\x6c\x06\xe5\x86\x96\xaf\xf5\x28\x2d\x03\xa1\x08\xd9\x96\x44\x69\
+\xcb\xfd\xe0\xef\xe1\xa5\x1d\x3c\xf8\xd1\x0d\xb3\xee\x0d\x84\x4a\
+\x05\xc4\x07\xb1\x29\x53\x8c\x40\x54\x3f\x66\xb6\x3d\x0f\xe2\x45\
+\xe7\x0e\x97\x9f\x69\x47\xf1\x38\x09\xce\x48\x0b\x3c\x9f\x19\xbd\
+\xef\x44\xce\x46\x2f\xc4\x00\x31\x82\xb8\xa1\xab\xa7\x6f\x9e\x7a\
+\xc6\x3d\xb9\x2c\x62\x5b\x88\xd7\xab\x2d\xba\xed\x05\x42\xe0\x2e\
+\xbd\x10\x0b\xfa\x04\x11\x71\x3b\x06\xcf\x43\x14\x68\x13\x22\x85\
+\x2a\x09\x95\x9c\xe7\x2b\x73\x47\x02\xfa\xc8\x33\x48\x70\xa8\xb9\
+\x90\x78\xdc\xe3\x0b\xd5\x8c\x27\x9e\x4d\x29\xf1\x21\x7d\xa1\xbd\
+\x1a\x11\x12\xfa\xce\x6f\x10\xea\x6d\x96\xfd\x5c\xaa\x1b\x8d\x89\
+\x3d\x91\x79\x8e\x57\x59\x1e\x49\xc4\x4d\x48\x47\x1f\x97\x0a\xf0\
+\x74\x3a\xa6\xd2\xd3\x35\xc6\xc7\xe1\xea\x4c\xc6\x52\xa0\x4f\x7e\
+\x9c\x0b\xcc\x3d\xc2\x50\x9b\x22\x4d\x21\xad\xe6\xa9\xa6\x13\xed\
+\x99\x97\x14\xc5\x05\x69\xc0\xce\xa8\x2e\x32\xbf\x73\x7d\x77\xb8\
+\x2b\x1a\x88\x4a\x67\x67\x9e\x23\xd8\x71\xf4\xf3\x5c\x9d\x99\x9c\
+\x6c\x1a\x11\xd4\xf1\x0e\xe5\x69\x54\x99\x86\xfb\x7c\x0b\x0c\xf7\
+\x91\x44\x4e\x34\x36\x26\x82\x9a\xe3\xbf\x67\xab\x4c\x4a\x67\x8b\
+\x60\x49\x8c\x74\x4b\x73\x93\x32\x67\xf4\x89\xe9\x52\xd9\x70\xa9\
+\xc1\x9e\x5c\xbd\xc5\x60\xac\xa1\x45\x2a\x4b\xed\xaf\x89\x53\x65\
+\x97\x91\x74\xb6\x65\x7d\xab\x92\xd7\x8a\xe2\x89\x40\x49\x50\x94\
+\x14\x33\xa8\x44\xb7\x9b\x54\x98\x6f\x66\x58\xb1\x7a\x7d\x98\x36\
+\x73\x81\x49\x5d\x15\x4a\xc3\xe5\x01\xef\x1e\xb4\x1c\xef\x05\xf3\
+\x2e\x23\x18\x73\x37\xd4\x6a\xe9\xf1\x8c\xf4\x47\xce\x44\x26\x6b\
+\xeb\x63\x3f\xfe\x9f\x9f\x01\x8f\x27\x71\x5b\x88\x23\x5b\x2f\x9b\
+\x0b\x12\x03\x51\x79\x54\x72\x66\x40\x9f\xab\xaf\xdc\xdb\x8c\x6c\
+\xc5\x6c\x04\x10\x20\x06\x66\xb8\x7e\xdc\x48\x87\x74\x8d\xc8\xfc\
+\x25\x32\xb6\x13\x9c\x89\x77\x59\xb1\x8c\xef\xbc\x0b\x24\xee\x71\
+\x2d\x20\x7f\xfa\x41\xbb\xa8\xd5\xf8\x1b\xa2\x80\x04\xe1\xd2\x0d\
+\xcf\x38\xf1\xa3\x5f\x20\x78\x0e\xae\xbb\xc3\x00\x9b\xda\xed\x37\
+\xde\x6f\xcf\x08\x80\xae\xdf\x03\x09\x21\x76\x9e\x3d\x98\xb6\x18\
+\x2b\x12\x16\x5e\x43\x48\x57\x7c\x78\x3f\xc1\x91\x9e\x86\x05\x3b\
+\x05\x44\xc8\x89\x0c\x12\x91\x7b\x40\x99\x17\x93\x88\x09\x84\x94\
+\x76\xac\x90\x97\xc6\xcf\x3b\x68\xdf\x89\x19\x44\x86\x78\x89\x4c\
+\x22\x3e\x1a\x20\x32\x87\x8c\x8b\x79\xf7\x38\x25\xc6\xc6\xe1\xaa\
+\x3b\x77\xcf\x76\xd7\x5a\x27\xba\x99\x76\x29\x9f\x1f\x43\x91\x5a\
+\x0f\x4f\x71\xb3\xaf\x36\x40\xae\x88\x6e\x5f\xf5\x63\x5f\xb6\x83\
+\x46\x26\x5f\x8e\x47\x6e\x62\x80\x50\xe7\x8b\x59\x4e\x89\xc0\xa0\
+\xfa\x4f\x89\x00\xd7\xd4\x57\x87\x6b\xff\xf2\xbb\xf0\xf6\xb7\xbd\
+\x33\xfc\xe9\xf7\x7f\x51\x29\x80\xfa\xb0\xe8\xc8\xa3\xe5\x06\xfd\
+\x68\xa8\x53\x69\xf5\x49\x2a\x7a\xb8\x7c\xd9\x53\x61\xda\xbc\xea\
+\xb0\xad\x6d\x8b\xf6\xd1\x56\x11\x15\xe5\xf0\x9b\x5e\x17\xfe\xfd\
+\x1d\x6f\x08\xeb\x94\xfa\xff\x86\xbf\xfe\x56\x64\x4b\x44\x48\x2e\
+\xce\xed\x9d\xcd\x61\xfe\x62\x25\x63\x6d\x6e\x50\xae\x33\x31\x7c\
+\x92\x2a\x55\xb5\xc5\x86\xe5\x1e\x9e\xb1\x2b\xfe\x00\x19\x5d\xb4\
+\xd6\xfd\x82\xc7\xbd\x96\x62\x6c\xef\xe4\x38\x69\x89\x96\xa3\x1c\
+\xdb\x1f\x7b\xfc\x79\x3e\x03\xce\x01\x7b\xae\x2c\xb8\x71\x22\xdb\
+\x51\x0f\x71\x80\xc0\x5c\x8d\xc4\xd9\x23\xc6\x5d\x75\xe5\x69\xec\
+\x3d\x21\x21\x12\x83\x27\x4d\x34\x64\x2f\x4e\xde\x53\x90\xf0\x2e\
+\xab\x00\x28\x09\x04\x75\x1a\xd2\x0c\xdf\x41\xc2\x9e\xd2\xc8\xd3\
+\xb9\x80\x40\xb1\xfd\x90\x90\x14\x9b\x82\x1b\xcc\xb9\xcf\x39\x3b\
+\x54\x5d\x18\xc3\x9d\x5b\x77\x87\x01\xfa\xe4\xea\x05\xfa\x8c\xc3\
+\x81\x07\x18\x92\xfe\xe4\x03\x1f\xf8\x40\xda\x7b\xca\x23\xd0\x21\
+\x1e\x48\x17\xe4\xff\xe2\x5d\xae\xc6\x73\x83\xb5\x17\x46\x73\x84\
+\xef\xc4\x0e\x69\xe8\x97\xbf\xfc\x65\x78\xc1\x0b\x5e\x90\x0e\x0a\
+\xc4\xd5\x98\xfc\x53\x10\x06\x2a\x83\x42\xac\xdc\x56\xc3\xfc\xa2\
+\x36\xf4\xec\xcf\x49\xe0\xe3\xce\x0f\x6e\x6b\xe2\xfd\x1e\xef\xe3\
+\xd2\x5c\xa6\xc4\x67\x92\x4c\x9c\x87\x8c\x7b\x59\x57\x77\xa8\x70\
+\x69\x91\xe7\x9d\xe0\x25\xbd\x7f\x4f\x89\x87\xdf\xbf\xa7\xcf\x25\
+\xf5\xe3\xb9\xf8\xdd\xd2\x5c\x49\xc2\x77\x8f\x4e\x93\xea\xe2\x5c\
+\x84\xa4\xba\xe2\xd8\xba\xbd\x21\x2c\x54\xd9\xf1\x2f\x7c\xe5\x8b\
+\xa1\x7e\x1a\xce\x09\x65\xe1\x21\x55\x70\x1d\x2f\x29\xa5\x4a\x15\
+\x46\x77\xa8\xf8\x53\x69\x91\xa4\x4d\xd9\x3c\x8b\xf4\x6c\xa9\x92\
+\xee\xf6\xf4\x34\x29\xd9\x6d\x55\xf8\xe0\x87\xde\x19\x2a\x0a\x2b\
+\x94\xd1\x42\xd9\xb8\x55\x10\x2d\x4f\xa5\xd1\xbb\x64\x6e\x68\x5c\
+\xb3\x3a\xcc\x9e\xbf\x50\x59\x09\x24\x05\xab\x2c\x01\x4c\x9a\x33\
+\x07\x7e\x16\x7c\xf7\x6a\x8f\x34\x0b\x0e\xb3\x97\xce\xdc\x8d\x89\
+\xcb\x95\xc8\xf0\x8a\x31\x42\xb3\x1b\x13\xfd\x7f\xfd\x16\x47\x3a\
+\x10\x04\xec\x0b\x20\x26\x08\x07\x08\xcb\xa3\xec\xf9\x0e\xd1\xf1\
+\x54\xf2\xee\x6d\x06\x67\x0f\xb2\x76\x57\x4e\x90\x3c\xb6\x0a\x93\
+\x26\x94\xd2\xdc\xb3\xfb\xd2\x16\xaa\x24\x7f\xde\x91\xa3\x23\x52\
+\x47\x4c\x3c\x07\x62\x46\x4a\xc1\x2d\x9a\x34\x20\x1e\xa7\xe2\x76\
+\x1c\xcf\x0e\xc0\x77\x4f\xf9\xcf\xdf\x96\xbe\x46\xef\x81\x00\xf1\
+\xb7\xe7\x21\xa3\xef\x20\x5c\x08\x20\x7d\xc5\x5e\xc4\x7d\xef\x7a\
+\xd7\xbb\x4c\xcd\xe5\x52\x00\x7d\x80\x70\xd0\x4f\xee\x23\x5e\x05\
+\x27\x01\xb7\xf9\x30\x16\xa4\x2c\x27\x32\x10\x49\xbc\x9f\x20\x88\
+\x2e\x2d\x61\x97\xe2\x3e\x08\xc9\xbd\x77\xde\x65\x8e\x07\x7c\xe8\
+\x1f\xb1\x2c\x10\x3d\xe2\x47\x48\x9b\x93\x25\xa2\xdb\x40\xd2\x3d\
+\xb2\xdc\x7b\x8c\x77\x40\x40\xbd\x8a\xa5\x4b\x38\x4e\x58\xe8\x7f\
+\x26\xd1\xf1\xf8\x21\xfa\x3b\xfc\xc3\x33\x3e\xee\xd1\xe0\xdf\xe7\
+\x79\xb4\xdf\x33\xe7\xcd\x90\xcd\x30\x8f\xa8\xe7\x33\xb1\xc9\x8b\
+\xa5\x18\xcc\x05\x29\x53\x23\x4a\x6d\x49\x18\x46\xac\x3f\x03\xf5\
+\x57\x28\xf6\xa5\xa8\x3c\x15\x5e\x70\xfe\xa9\xb2\x9d\xa0\x66\x2e\
+\x0e\xe3\x8b\x27\x88\x30\x14\xc8\x89\x60\x5b\x18\x57\x32\x41\xb6\
+\xcd\xc2\xb0\x61\xc5\xe3\xa1\x66\x92\xaa\xf8\xb6\x6d\x97\x83\xc1\
+\x2c\x55\xc8\xdc\x18\xea\x15\xa8\x5c\xa5\x7b\x9b\x9b\xb6\xc9\x3e\
+\xa4\x1c\x6c\x22\x28\x53\x67\xcd\x14\x71\xea\x91\xa3\x07\xf9\xf3\
+\x14\x57\x53\x24\x55\x76\x2c\xb9\x7a\xa6\x8b\xd8\xfb\xb1\x43\x7b\
+\xf5\x19\xad\x7f\x14\xd5\x9c\xc3\xb1\x2f\x88\x4c\x0e\xaf\x1f\x7b\
+\xf4\x7f\xfb\x0c\x38\xb7\xeb\xea\x28\x10\x2b\xde\x60\x20\x07\x10\
+\x3b\xc8\x0d\xc4\xc8\xe1\x31\x28\x99\x89\x2f\x3d\xc0\xcf\x63\x51\
+\x78\x86\x6b\x20\x34\xd4\x45\xb5\xf2\x7a\xe2\xb9\x43\x94\x71\xd9\
+\x82\x06\x38\x24\xd1\x90\x0d\x99\x18\x17\xb7\x57\x38\x72\x04\x81\
+\xba\xaa\x8b\x0c\xd7\xa8\xa3\x48\x2b\x03\x71\x00\x29\x82\x34\xb9\
+\x87\xbf\x79\x96\xe0\x43\x57\xb7\x45\x25\x2a\x22\xc4\xc9\x6f\x4e\
+\xac\xf8\xee\xd9\x8e\xf1\x24\x03\xb1\x7b\xf2\x4d\x88\x21\xef\xf0\
+\xbc\x52\x10\x14\x7e\x83\x50\xf2\x4e\xc6\xe0\x11\xf0\x7c\xf7\xbc\
+\x60\xdc\xcf\xdf\x48\x05\xf4\x81\xf9\xf3\xe0\x4e\xcf\x6a\x0c\xa1\
+\x22\x1e\xc6\xed\x4f\x5e\x43\xc7\x89\x1f\x73\xc6\x7c\x65\x3b\x98\
+\x17\x27\xac\xee\xa9\x86\x24\xc8\x9c\x42\x60\xe8\xbf\xab\xc7\x86\
+\xab\x32\x19\xb7\x4b\x9c\x10\x5d\xb7\x51\xb9\x9a\x8d\xb6\x5d\x0a\
+\x1c\xad\x0f\x49\x44\x22\xf3\xf7\xd1\xfe\x7e\xde\xee\x21\x73\x18\
+\xc0\xfe\x02\xf5\x8c\xe2\xf7\xd2\x41\x66\xc4\xef\xe9\x3a\x73\x4f\
+\x49\x92\x16\xa9\xb7\x26\x4d\x9a\x10\xfe\xf8\xc7\x6b\xc3\xa2\xf9\
+\x4b\xe4\x0d\x97\x0a\x73\xa6\x2c\x0e\x77\xdc\x74\x8b\x98\x89\x63\
+\xc3\xec\x49\xb3\xc3\xa3\x2b\xee\x0c\x0b\x0e\x9e\x21\xe9\x56\x69\
+\x71\xfa\xf3\x45\x4c\x26\xc9\xc9\xa0\xd3\x5c\xa1\x27\x4e\x52\x1c\
+\x59\x41\x5f\xb8\xe1\xc6\x3f\x84\x37\x5e\xfe\xd6\x30\x7b\xda\x9c\
+\xb0\x62\xe5\xaa\x50\x22\xaf\x34\x57\x69\x33\x8f\xce\x28\xe8\xbd\
+\x2d\x62\x06\x57\xea\xbb\x94\x72\xb9\x1d\xb9\x10\x19\xd7\xd3\xe5\
+\xa4\xaf\xcb\xad\xfb\x63\x4f\x1f\xe8\x33\xe0\xea\x17\x37\xa6\x83\
+\xc8\x40\x62\x10\x0a\xa2\xdf\xe1\xda\x89\x5d\x80\x63\x07\x61\x81\
+\x40\xbd\x8c\xaf\x17\x27\x23\x3e\x02\x15\x11\x2a\x29\xf2\x66\x61\
+\x28\x27\xcd\x0a\x5e\x64\x78\x5e\xd1\x36\xee\x9f\x78\x76\x81\xc4\
+\x5d\xad\x45\xbb\x9e\xb9\xd8\x6d\x04\xee\x60\xc0\x66\x7a\x5c\xf1\
+\x1f\x9f\xff\xfc\xe7\xc3\xac\x39\xaa\xcb\x1e\x97\x32\x06\x41\x3a\
+\x41\xe2\x59\x6a\xd5\x20\x19\x70\x38\x52\xe5\x7d\x3c\xef\x3a\x6c\
+\xcf\x44\x80\x64\x01\xd1\xe0\x3e\x12\x2d\xd2\x6f\xc6\xea\xaa\x35\
+\xde\xcd\x33\x6e\x03\xe2\x3a\xf7\x42\x70\x18\x37\x73\xe2\xb6\x2b\
+\xe6\xc2\x4b\x0d\xb8\xb4\x01\xe2\xe7\x70\xd5\x1f\xf7\x7a\x10\x9f\
+\xdb\xaa\xf0\x00\xa3\xdf\x20\x7c\xcf\xc5\x95\x04\x23\xfe\x2e\x4f\
+\xaf\xc2\x1c\xd0\x1f\xda\xf6\x20\x57\xde\x65\xee\xe7\xc3\x24\x09\
+\xde\xe5\xf3\x02\x11\xf4\x14\x35\xae\x26\x4c\x7a\xf7\xde\xfc\x9e\
+\x44\x98\xf6\xa6\xcd\xe7\xea\x19\x9c\x73\xe5\x22\x21\x0b\xbb\xd2\
+\xdc\x58\xcc\x19\xea\x33\x9c\x01\xe4\xb0\x21\x22\x33\xa8\xb4\x33\
+\xe3\x05\x17\x73\xa7\x57\x2a\xae\xe9\x8f\xaa\x7f\x75\x43\x58\xfd\
+\xd4\xdd\xe1\x8c\xd3\xce\x0b\x4f\x3e\xb4\x31\x1c\xb6\xf0\x84\xf0\
+\xe3\xef\x7c\x23\xcc\x58\x54\x1b\xb6\xb6\xae\x0e\x0f\x3d\x70\xab\
+\x32\xd3\xf7\xa9\x96\xd6\x21\x61\xc5\xd2\x5f\x85\x4b\x2f\x7c\x6d\
+\x78\xf8\x81\xdb\xc4\x48\xa8\xd4\x44\x51\x2a\x9c\x7a\xd6\x89\x61\
+\xc3\xea\xa7\xc4\x58\x4d\x0f\x65\xaa\xc5\x45\xc1\x45\x8b\x63\x33\
+\xaf\xc2\xc8\x41\x05\x78\x14\xfc\xb4\x68\x0d\x9f\xd2\xf5\xe7\x9c\
+\xc8\x40\x60\xc6\x88\xcc\x73\x05\xa1\xcf\x83\xf7\x7a\xd4\x3a\xc0\
+\xeb\xc8\xcb\x5c\x6e\x85\xb0\x40\xca\xa4\x18\xe1\x80\x68\x10\x84\
+\x09\xd7\x8e\xfd\x01\x2e\x1c\x82\xf1\xfb\xdf\xff\xde\x8c\xfa\x9e\
+\x5a\x06\x44\x0b\x91\x21\x51\x23\xcf\x82\xd4\x50\x59\x91\x62\x9f\
+\x48\xfb\xaf\x7f\xfd\xeb\x86\x60\x41\xd0\xee\x69\xe6\x31\x31\x48\
+\x14\x4e\x64\x68\xef\x77\xbf\xfb\x9d\x05\xdd\x11\xf1\xef\x92\x05\
+\xcf\xba\x34\x43\x3c\x0e\x1f\xcf\x98\xcc\xbb\x9d\xa0\x78\x5d\x17\
+\xda\xf6\x60\x4d\x8f\x90\x47\x92\x41\x02\xf0\xe2\x5e\x10\x40\x9e\
+\x43\x4d\x08\x51\x25\x00\xd0\x6b\x98\x44\x31\x13\x6d\xf6\xbb\xab\
+\xe1\xfc\xfd\x6c\x7a\x8f\x8e\x07\x11\x38\xa1\xf4\x62\x62\x9c\x85\
+\x21\x4c\xea\xf0\x8c\x09\xfd\xa4\x82\x97\xf7\x1d\x73\x47\x3b\xbc\
+\x27\xdb\x41\xdf\x9d\x68\x73\x1f\xf1\x47\x38\x55\xb8\xb4\xe6\x9e\
+\x67\xee\x2d\xe6\x88\xc8\xd5\x79\x8c\x93\x39\xe0\x7e\xc6\x8b\x9a\
+\x8e\x35\x47\xb2\x1b\xee\x2d\x38\x52\x3f\x76\x97\x60\x8c\x64\x8b\
+\xd9\xdd\x67\x0f\xd8\x6d\x22\xbb\x4b\x4a\x81\xe4\x26\xc5\xa8\xf0\
+\x21\x39\x31\x06\x87\x88\x05\x52\x76\x72\xd5\x2b\x27\x6f\x7c\x95\
+\x5c\xc3\xd7\x6f\x78\x34\x6c\xdf\xdc\x18\xce\x3a\x65\x71\x98\x56\
+\xa7\x5c\x6f\x82\xaf\x63\x8e\x58\x10\xb6\xac\x69\x09\x6b\x1e\x7f\
+\x20\xbc\xf9\xf5\xe7\x85\xae\x54\x7b\x68\xeb\x9f\x18\xee\x7e\xf8\
+\x56\x79\x5d\x9e\xaf\xaa\xb5\x9d\xe1\xd0\x05\xf3\xc2\x94\xba\x42\
+\x55\x8f\x3d\x41\x70\xa0\xb2\xd1\x93\xab\x94\x98\x56\x39\xcd\x14\
+\x0f\x55\x58\xa0\x92\x18\x79\x2a\x47\x40\xd0\x68\x1c\x08\xed\xf6\
+\x36\xed\x81\x41\xad\x6f\x87\x60\x7c\x87\xae\x45\x69\xa8\x73\x38\
+\xf6\x5a\x92\xd1\x86\x18\xd4\xa7\x59\xef\xce\x5a\x39\x0d\x60\x64\
+\x03\xc1\xa9\x02\xf4\x5e\x07\x3c\x33\x8a\x1a\x44\xe1\x91\xcb\x6c\
+\x18\x90\x90\xeb\x88\x9d\xb3\x74\xae\xd1\xb3\xf1\x7a\x9c\x81\xab\
+\x36\x98\x20\x9e\xf5\xe0\xbb\xdd\xf1\xac\xc9\x61\xde\xc6\x1e\xdd\
+\xcd\x19\x70\x43\x3b\xeb\xe2\xc9\x10\x01\x6a\x90\x1f\x69\xe4\x41\
+\x46\x1c\x04\x30\x0e\x3f\x90\x20\x20\x38\x51\x7a\xf2\x01\x8b\x93\
+\x01\xa9\x61\x47\x01\xa9\x41\x48\x40\x7e\x38\x11\xfc\xdb\xbf\xfd\
+\x5b\xe4\x6d\x46\xd5\x4d\x1d\x10\x01\x22\xba\x81\x3f\xbf\xc6\x7b\
+\x1d\xb6\x50\x6b\x71\x1d\xa2\xc2\x41\x7f\x2c\x7a\x5a\xef\x72\xc9\
+\x03\x64\x8b\x04\x05\x71\x20\x95\x3d\x44\xc4\x3d\xbc\xb8\x97\xbe\
+\xf0\x1e\x57\x63\xf1\x37\x88\x96\x77\xd0\x17\x57\x03\xf2\x1e\x9e\
+\x03\x3e\x3d\x3d\x3d\x12\x0f\x7b\x80\x36\x48\xc3\x82\x54\xe6\x9e\
+\x6a\x48\x01\xf4\x81\x77\xb8\x6b\x31\xe3\xf5\x9c\x5d\x10\x17\xc6\
+\x0e\x41\x1e\xea\x8f\x12\x70\xf2\x0e\x54\x63\x45\xb2\x13\x31\x1f\
+\x10\xb2\x4c\xaf\xbd\x4c\x24\x6d\x2a\x98\x38\x50\x15\x49\x90\xe7\
+\x58\x07\xd4\x98\xf4\xd9\x33\x20\xb8\xca\xd0\x09\x4b\x66\x1b\xcc\
+\xa5\x7b\xff\x79\xaa\x1b\xec\x42\x48\x6f\x10\x77\x08\x1d\x44\x1f\
+\x62\x07\x21\x65\x5e\xdd\xf9\xc3\x39\x67\xb7\x31\x65\x03\xa5\xff\
+\xdd\xfb\x58\x39\xfb\xf2\x09\x7e\x51\xa2\x4c\x65\xc0\xa0\xe2\xdf\
+\xd0\x20\xf5\xae\x14\xc7\xd5\x5f\x6e\x31\x4c\x8d\xeb\x36\x87\x5a\
+\xc5\x16\x09\xef\x87\x0d\xcb\xee\x0a\xf5\x65\xdd\xa1\x72\x7c\x69\
+\x68\x5c\x75\x6b\x68\xd9\xda\x13\xe6\xa9\x70\x60\x7e\xde\x0a\xb9\
+\x22\xab\xa2\x66\x75\x89\x88\xcf\x3c\xe5\x49\x5b\xad\x44\x9d\x33\
+\x14\x70\xba\x3a\x74\x97\x28\xc7\xdb\xcc\xca\xb0\x56\xd9\xa1\x8b\
+\xb5\xee\xf9\xf9\x03\xa1\xb3\x75\x7b\xa8\xae\x50\x46\xf4\xd2\x59\
+\xa1\x4d\x22\x42\xb1\x3c\x14\x7d\x4d\x62\xc9\x5b\xa9\x00\x07\x94\
+\x30\x7a\x6f\x73\x99\xec\xba\xa2\x7b\x4d\x64\xe2\x66\x2c\x24\x25\
+\x1b\x90\xb8\xbe\x8f\x8d\x81\x27\x0d\x9b\x9e\xc3\x37\x0f\x00\xcd\
+\xa6\x64\xb3\xbb\x67\x8f\xeb\xc6\xd9\x38\x6c\xe0\xb1\xe3\xf9\x3b\
+\x03\x8e\x98\x40\xc0\xfc\xed\x31\x22\x5e\xf5\xd0\xdd\x65\x47\x1b\
+\x21\xc8\xc9\x89\x12\xd2\x0f\xc4\x00\xe4\x06\x02\x66\x43\xac\x54\
+\x64\x3b\x95\x16\xb9\x0e\xe3\x81\xc1\xfd\xd3\x9f\xfb\x9c\xd9\x41\
+\x3c\x08\x13\xd8\x72\x55\x15\x67\x60\x10\x84\x07\x6c\x79\xaa\x16\
+\xe7\xd8\x39\x3b\xe3\xe2\x04\x8c\x76\x3d\xde\xc5\xa3\xf2\x69\xd3\
+\xef\xe5\x5d\x48\x2b\xf4\x87\x88\x7f\x54\x6c\x7c\x47\xc2\x42\xf5\
+\x07\x41\x81\x30\x82\x7c\x21\x0c\xa4\xa1\xc1\xb5\x1a\x62\x00\xe1\
+\xa2\xcd\xcf\x7c\xe6\x33\x06\xff\x20\x6c\xf7\x86\x03\x69\x53\xef\
+\xe4\xcd\x6f\x7e\xb3\xf5\x17\x22\xc3\x1c\x32\x5e\xd4\x71\x48\x72\
+\xa5\xca\xfd\xc6\x5c\xf0\x1b\x63\xe3\x4c\xfb\x54\x8b\x64\xcf\xf9\
+\x7e\x63\x7e\xdd\xc8\x1e\x65\xe0\x25\xed\x7b\x97\x49\x8f\x10\x73\
+\xa4\x35\xfa\xe6\x6a\x40\xee\xf7\xcc\xc5\xd9\xa0\xcf\x89\x8d\x33\
+\x81\xcc\x13\xed\x30\x0e\xc6\xef\xcc\x60\xa6\x47\x1a\xed\xb9\x5a\
+\xd0\x3d\xf9\x9e\xbf\x10\xbe\xf7\x3d\x1f\xc4\x93\xcc\x54\x65\x14\
+\xfa\x23\x2b\x46\xe4\x95\x97\x27\x62\x93\x3f\x24\x97\x72\x5d\x9a\
+\x31\x61\x8a\x11\x98\xfb\x1f\xf8\xad\x08\xd0\x4a\xd9\x5a\x14\xfb\
+\x24\x09\x68\x52\xdd\x9c\xd0\xb1\xad\x4d\x84\x66\x8d\x92\x67\xce\
+\x0e\xcb\x57\x6e\x0f\x9b\xe5\x69\x36\x58\x2c\x7b\xe0\x40\x67\x98\
+\x31\x73\x8a\x4a\xab\x2b\x13\x45\xe3\x9a\xf0\xd4\x13\xb2\xc9\x4c\
+\xa0\x32\x6d\x5b\xd8\xaa\x52\xf2\xb5\x95\x0b\x43\xa7\x72\x07\xce\
+\x9a\x3f\x49\x30\x21\x02\x93\x31\x84\x78\xbf\x82\xd3\x7b\xf4\x77\
+\xce\xa5\x97\x69\x3a\x17\x22\xe3\x6a\xb2\xac\x44\xc6\x37\x00\x9d\
+\xe7\x6f\xcf\xe9\x04\x70\xb1\xa9\xd8\x98\x6e\xc4\x85\xb3\x73\xae\
+\xc9\x45\xb8\xbd\x5f\xc2\xb1\x27\x0f\x84\x19\x60\x3d\x41\xd6\x20\
+\x34\x97\x34\x3d\xfd\xba\x1b\x94\xb3\xf5\xd3\xb3\xe7\xc2\xdd\xc3\
+\x9d\xf3\x8c\xff\x0d\xfc\xbc\xf0\xec\x73\xcc\x16\x03\x72\x03\xd1\
+\xfd\xbf\xff\xf7\xff\xac\x39\x97\x78\x81\x39\x10\xb4\x13\x37\xe0\
+\xca\x09\x1e\xd7\x3d\x05\x3e\xed\x7a\xce\x2b\xb7\x3d\x70\x06\xe1\
+\xbb\x3a\xca\xed\x4b\xdc\xeb\x31\x25\xbc\x0b\x04\xcd\x77\x24\x1e\
+\xa4\x1f\x54\x79\x10\x11\xde\xe5\xd9\x96\x91\x58\x1c\xd6\x3d\xe7\
+\x14\xf3\xc2\xdf\xb8\x3c\x47\x85\xa5\x14\x39\x1f\xa7\xb8\x77\x02\
+\x86\x07\x1c\xe3\x84\x58\xe1\xfa\xcd\x38\x51\x1f\x7e\x4e\x84\x14\
+\x42\x57\xa7\xf4\x2f\x10\x0d\x57\xa1\xb1\x87\x60\xe6\x70\x0a\xa0\
+\x7d\x54\x92\xbe\x97\x5c\x72\x40\xf2\xc1\x7b\x8c\x67\x18\x3f\x44\
+\xc1\x6d\x59\x9e\xf2\xc6\xe7\x28\x73\x1f\xfa\xdf\x99\xd7\x3c\x80\
+\xcf\x33\x27\xf0\x1c\x7d\xe0\xfd\x5e\x76\xc1\xd5\x7c\x9e\xf3\x6c\
+\x24\xd5\xd7\x81\x00\xab\xcf\x45\x1f\x8c\x4b\x37\xc3\xbf\x08\x0c\
+\x39\x62\x88\x03\x8b\xd3\x67\x15\x48\xa2\xe9\x51\x5c\x4b\xdf\xd0\
+\xb6\x30\xa1\xae\x58\x0e\x00\xaa\xd5\xd3\xde\x1d\xc6\x89\x29\x4f\
+\x75\xb5\x84\x7a\xa5\xa4\x79\x7c\xc5\xba\xf0\xfd\xab\xfe\x1e\x94\
+\x59\x26\xcc\x5e\x34\x3f\x8c\x9f\x3a\x2e\x1c\x71\xdc\xe1\xe1\xe8\
+\x63\x0e\x09\x0d\x4a\x61\x73\xc7\x2d\xf7\x84\x17\x9c\x7a\x88\x12\
+\xd3\x2e\x55\x06\x88\x21\xb5\xa3\x0c\xd0\xbd\x9d\xa1\x4c\xd9\x02\
+\x6a\xe4\x5d\xd6\xa9\xe4\xb4\x8a\xb6\xdc\x65\xe8\x5a\x1f\x72\x96\
+\x51\x5a\x78\x9f\x98\x42\x72\x21\x32\xde\x31\xb7\xcb\x8c\xe8\xca\
+\xec\xd2\x09\x80\x06\x81\x71\x2f\x23\xe7\x60\xdd\x23\xc5\x8d\xbe\
+\xae\x7a\xe0\xbb\x23\xa3\xe7\x62\xf1\xc7\xde\xb9\x6f\x66\x00\x24\
+\x0b\xf2\x04\xc9\x83\x80\x3c\x85\xbf\x73\xd6\xac\x71\xb6\x83\xdf\
+\x81\x21\x0e\x88\x8c\x7b\xbf\x80\xc8\x2c\x18\x50\x19\x70\x51\x7d\
+\x95\x0b\xb6\xf8\x8e\xba\xc8\x0f\x0f\x6a\x74\xc6\x05\x22\xe2\x79\
+\xc9\x80\x47\x8b\x86\x8f\x8d\xd9\xdc\xe3\x08\xd3\xb9\x7f\x88\x0b\
+\xc8\x97\x7b\x5d\x0a\xe0\xec\xcf\x20\xf1\x38\x27\x8f\x24\x85\x0a\
+\x0b\x84\x8f\xda\x09\xe4\xee\xea\x38\x2b\xce\xa5\xef\xee\x0e\xcd\
+\x3c\x40\xbc\x3c\x0b\xb2\x1b\xce\xe9\xb7\xab\xed\x3c\xfd\x0c\xcf\
+\x40\x9c\x50\xfd\xb9\xca\x39\xd3\x7b\x0c\x49\xc4\x55\x92\xcc\xb5\
+\xab\xf1\x28\x00\xe6\x49\x1f\x7d\xaf\x31\x46\x88\x01\xed\x21\x65\
+\xf0\x2e\x02\x43\x19\x23\xfb\xd0\x6d\x43\xb4\xef\xd2\x9e\xdb\x82\
+\xe8\x1b\xcf\x67\x12\x1a\xae\xb9\x46\xc2\x09\xb0\x4b\x61\xac\x0f\
+\xd2\x1b\x04\xd7\xb5\x11\x9e\x4d\x80\xe7\x18\xb3\x4b\x33\xfb\x06\
+\xd2\x9e\x8f\xad\x90\x03\x41\x12\xbe\xe0\x6b\x28\xaf\x57\xf3\x41\
+\x9c\x0c\x52\x0d\x12\x8d\x92\xcb\x90\xb1\x4b\xc5\xcd\xc6\xd5\x57\
+\x86\x3b\xef\x7e\x4c\x0c\x4c\x2a\x4c\x9f\x36\x31\x6c\x78\x66\x5d\
+\xa8\x2c\xaa\x08\xbf\xfc\xc5\x0d\x61\xe3\x8e\x10\x26\x4c\xaa\x0b\
+\x4b\x0e\x3b\x21\xd4\x4d\x98\x1b\xfa\x15\xd6\xb2\x61\xa3\xbc\xcb\
+\xf2\x56\x86\xc5\xf3\x16\x84\x2b\xaf\xfc\x62\xf8\xd9\x8f\xbf\xa6\
+\x0c\x01\xaa\x9a\xd9\xb9\x43\xcc\x8a\x0a\xa5\x35\x69\x3f\xaa\xf4\
+\x73\x4a\xaa\xd6\xcc\x08\x94\x8c\xf5\x00\xa7\x7b\xca\x81\x9c\x27\
+\x76\xbf\x13\x19\x90\x8a\x17\x53\x82\x6b\xf3\xc2\x54\x2e\xb2\xbb\
+\x1e\xda\x6d\x2f\xee\x2e\xca\xc8\x1c\xd0\x73\x1e\xe5\x58\x03\xcf\
+\xe9\x0c\xb8\x4b\x32\xea\xa1\xdb\x94\x05\x18\x44\xc5\xdf\x20\x26\
+\x90\x69\xb6\xc3\x11\xa4\xc7\x66\x70\xaf\xd5\xc1\x10\x82\xe4\xda\
+\xf8\x9a\xda\x74\xe9\x64\xaf\x8a\x08\xd7\x7f\xeb\xad\xb7\x5a\xd4\
+\x3b\xcf\x43\x2c\x3c\x06\x00\x0e\x1e\x44\xcb\x27\xd3\xbd\xd7\xed\
+\x05\x5c\xf7\xd8\x10\x90\x23\x29\xeb\x81\x43\x90\xb7\xbb\xe6\xd2\
+\x07\x47\xb6\xfc\x86\x1a\x0c\x44\x0d\xd1\x71\xb7\x61\xa4\x06\xaf\
+\xd3\xe2\x31\x38\xbc\x9b\xfb\xe8\x13\x04\x90\xef\x1c\xc4\xbd\xc0\
+\x80\xb9\xd7\x99\xab\x98\xe9\x8b\x13\x67\x08\x0c\x6a\x37\xf7\xce\
+\x63\x0e\x2c\x5d\x7e\x5c\xe0\xcc\x6b\xc6\x20\xd5\x41\x44\x50\xb5\
+\x21\x1d\xb9\x67\x9a\x13\x04\xfa\xe4\xc1\xac\x20\x15\xa4\x18\xd6\
+\x80\xf1\x3b\xd1\x75\xc2\xe9\xc6\xff\xd1\x08\x0c\xcf\x7b\xc2\x51\
+\xc6\xeb\xed\xb8\x6d\x0b\xfb\x0e\xaa\x3b\xde\xc9\x87\xb9\xf1\x1c\
+\x72\xbe\xe6\xcf\x7b\xe3\x7d\x2e\x3b\x4b\x6a\x31\xec\x30\x96\x98\
+\x2b\x8f\xf2\xcb\xd8\x67\x90\x68\x14\xf1\x2f\x6f\x33\x30\x7d\x61\
+\xc9\x60\x68\x6a\xdd\x12\xe6\x2e\x9e\x15\xb6\x6c\xbe\x57\x6b\xab\
+\x90\x97\xc1\x8a\xb0\x71\x45\xb3\xbc\xc8\x8a\xc2\x11\xc7\x1e\x12\
+\x3a\x07\x6a\x42\x4b\x7b\x75\x78\xea\xc1\x75\x2a\xf9\xbc\x26\x0c\
+\x15\xf5\x87\x23\x0e\x5b\xa2\xf9\x9e\x1f\xb6\x6d\x5d\xa5\x32\x12\
+\xef\x0b\x9f\xf9\xdc\x2b\xc3\x8b\x5f\xb4\x44\x36\x71\xa5\x1c\x1a\
+\x3f\x3f\xb4\xb7\xa9\x0e\x50\x9d\x08\x5b\xa9\x6c\x3f\x23\xc4\x1e\
+\xe9\x5a\x56\x0d\xd5\x9e\x0c\x3b\x57\x22\x93\xe8\x5d\x06\xc0\x7b\
+\xb6\x5c\xd7\x8d\x7b\x94\x37\x40\x8d\xaa\x01\x8f\x1b\xee\x81\xbb\
+\x62\x63\x79\xcd\x0a\xfe\x1e\x3b\x9e\xdf\x33\x00\xa2\x62\x1d\x41\
+\xc6\x20\x42\x52\xd0\x53\x28\xcc\x0f\x77\xcb\x1d\x6d\x94\x2e\xc5\
+\xf8\xef\x20\xb5\x4c\xbb\x41\xeb\xf6\x1d\xca\x22\x3c\xd1\x92\x9c\
+\x36\x0b\x09\x83\xac\x0b\x63\x89\x09\xb5\x11\x6a\x2b\x88\x05\xcf\
+\x78\x64\xba\xc7\x6e\xe0\x54\x40\x09\xe3\xf5\x1b\x37\xa4\x0d\xe1\
+\x4e\xf8\x1c\x1e\xaf\xb8\xe2\x0a\x7b\xb5\xa7\xeb\xcf\x0c\x30\x74\
+\x7b\x02\x92\x8a\xc7\xf8\xe0\xd8\x82\x71\xdf\x6b\xa9\x70\x0f\x7b\
+\x80\xb1\x73\x00\xeb\x10\x00\xda\xa1\x5f\x18\xca\x9d\x30\x40\x8c\
+\xd8\x1b\x30\x66\xfe\x1c\x73\x87\x07\x1c\x92\x0c\x63\x73\x26\x0c\
+\x02\x45\x8d\x93\x4d\xeb\xd6\x1b\xf2\xc6\xe1\x80\x36\x91\x4c\x20\
+\xb0\x18\xf2\x9d\x33\x75\x09\x84\x71\xd3\x17\x3e\x5c\xa3\xdf\xbc\
+\xc7\xfb\xee\x2a\x40\xb7\xa3\x58\xc6\xdf\xb8\x24\xf1\x48\xaa\x32\
+\x27\xfc\xf4\x91\xf9\x62\xdf\xd2\x86\xd7\x65\x61\x7c\x1e\x27\xe4\
+\xd7\x5c\x82\x71\x97\xeb\xe7\x37\x74\xe7\xda\x7b\xd2\xca\x90\x32\
+\x93\xd2\x0f\x1d\x71\xda\x40\xe1\xf6\x41\x11\x18\x79\x0e\x63\x76\
+\x6f\x68\xde\x24\xc9\x58\x1e\x80\x9b\xbb\x43\xed\x94\xc9\xa1\x4f\
+\xeb\xb1\x43\x91\xfa\x47\x1e\x7f\x71\x28\xaa\x6c\x08\x4d\x3d\xed\
+\xe1\x77\xbf\xf8\xab\x32\x2b\x4f\x0d\x53\xe7\x2c\x09\x55\x13\xa7\
+\x86\x99\x73\x26\x85\xc9\xd3\x26\x87\xc7\x97\xad\x0b\xb5\xc5\x33\
+\xc3\xba\xb5\x77\xca\x46\xf7\x86\x70\xe3\xcd\xdf\x0e\xa7\x9d\x3e\
+\xd3\xb2\x74\x1f\x77\xe8\xe4\xd0\xd8\xac\x12\xda\x53\xe6\xa6\x07\
+\x31\x4c\x92\x49\xc4\xed\xbb\x3b\xfa\x5c\x89\x8c\x31\x75\xf1\x67\
+\xc4\x77\x7a\x51\x25\x38\x19\xf2\x3a\xb1\x09\x00\x4e\x17\x9d\xe1\
+\xaa\x28\xd2\xc4\xf5\x4c\x84\x04\x50\x7a\x81\xa7\xdd\x1d\xcc\xd8\
+\x7d\x07\xde\x0c\x80\x18\x59\x57\x90\x22\x08\x38\x53\x7a\x00\x61\
+\x0e\x27\x22\xc3\x47\xe0\x04\xca\xaf\x03\x37\x20\x45\x97\x7c\xeb\
+\xf1\x86\x8a\x6d\x0c\x14\x2b\x43\xa7\xdd\xa7\xdf\x3d\x73\x33\x44\
+\xc9\x3f\x99\x92\x08\x1c\x35\x1e\x5d\xd4\x9f\x67\x33\x83\x10\x33\
+\x89\x90\xe7\x27\x73\x4f\x2f\x97\x7e\x18\x4b\xa6\xa4\xc1\x73\x20\
+\x74\xd4\x61\x70\xf0\x54\xb4\x44\xfa\xf0\x00\x4c\x57\xb3\x01\xcf\
+\x10\x0f\x6a\xc3\x7c\xea\x53\x9f\x32\x24\x8f\x14\x81\x3a\x89\xc0\
+\x51\x0e\x0a\x95\x41\x28\x20\x06\x5e\x6b\x85\x7e\xfe\xe2\x17\xbf\
+\xb0\xda\x2e\x8c\x9b\xbd\xf3\xab\x5f\xfd\x2a\x7c\xf2\x93\x9f\xb4\
+\xf3\x74\x65\x1f\xe6\x39\xa4\x21\x0e\x10\x3d\x76\x21\xdc\x92\x21\
+\xb0\x99\x48\x9d\x76\xd9\x6f\x6e\x1b\xf5\xdf\x99\x1f\x1f\x1f\xfd\
+\xf4\x20\xd3\xcc\x2c\xd1\xb6\xd1\x63\x57\xd7\xe1\x76\x1a\x8f\xb1\
+\xa0\x9d\x4c\x27\x0b\xd6\x00\xa9\xd2\xb3\x59\xfb\x3b\xe2\x88\xf2\
+\x74\xfa\x9e\x03\x0f\x6a\xff\x39\x3d\x22\x39\xe6\x90\x5c\x95\xad\
+\xa0\xa2\x2a\xc5\xaa\x86\xaa\xb9\x32\x0f\xa2\x92\x15\x91\xc1\x56\
+\x33\x7d\xee\xc4\xb0\xb1\xe9\x81\xb0\xbd\x4b\x09\x5d\x07\xdb\x43\
+\xe3\xc6\xed\x61\xd6\xa4\xe3\xc2\xea\x8d\x03\x61\xfa\xbc\x13\x42\
+\x71\xcf\x96\x70\xc6\x85\x79\x61\xc5\x2a\x31\xe4\xaa\x63\x33\x6e\
+\x86\xca\x43\x07\xd9\x21\x95\x40\xfa\xdf\xdf\xfd\x81\x90\xdf\x5e\
+\x1f\x96\x2f\xbd\x3f\x3c\xf8\x8f\x1f\x84\xc7\x9e\xea\x08\x2f\x7f\
+\xcd\x94\xb0\x72\xf9\xea\xb0\x62\xdd\x43\x61\xf6\x82\xf3\x42\x4f\
+\x7e\xbf\x60\x31\xf2\xc8\xf4\x23\xb6\xc9\xec\x13\x7b\x0c\x6d\xee\
+\x03\x22\xa3\xc2\x14\x76\x44\x29\xb0\x87\x9f\x23\x77\xce\x4e\xa9\
+\x49\xee\x08\x3f\xff\xf9\x4f\xc3\x97\xbe\xf4\x15\x6d\x36\x3c\x61\
+\xca\xac\x64\xe8\x4b\x5f\xfa\x5a\x2b\x1b\xfa\xfd\xef\xff\x8f\xd5\
+\xaa\x4e\xa5\x48\xbb\x21\xaa\xae\x8c\xa2\x94\x16\x8d\x8e\xd1\x32\
+\xac\x66\xfe\xf6\xcf\x01\x8c\xb1\xb7\xec\x3a\x03\x99\x90\xb8\x8b\
+\x51\x2e\xfe\xa1\x55\xdc\x79\x8d\xd4\xa4\xe3\x94\x52\xbd\x79\xc7\
+\xb6\xb8\xb2\x61\x54\x53\x1d\x44\x9b\xe4\xa2\x8a\x04\x02\xd2\x83\
+\x49\xc9\xb4\xeb\x81\x30\xb9\x46\x9d\x74\xea\xa7\x4f\x9e\x36\x25\
+\xf4\x0a\x6e\x4a\xca\x95\xe1\x58\x9b\x96\xfa\x27\x2b\x57\x3c\x13\
+\xce\x3a\xe3\x4c\x0b\xa2\xe6\x7e\x77\xe9\xf5\x68\x76\xd4\x39\x48\
+\xcf\x96\xbb\xac\x4b\xae\xa1\x04\x43\xea\xde\x36\x88\x98\xb2\x3b\
+\x93\xbe\x1e\xbd\xb5\x25\x9f\x24\xf5\x87\xfa\xc1\xf7\x41\xbc\xd5\
+\xf4\x0e\x90\x26\x48\x19\x95\x10\xf6\x15\x24\x18\xee\xc5\x2e\xf1\
+\xa7\x3f\xfd\xc9\x90\xbf\xdb\x90\xf0\x04\xe3\x1e\xde\xe7\xc5\xc9\
+\x40\xf8\x10\x25\x88\xd4\x9d\x77\xde\x69\x39\xc7\x20\xc6\xc4\xaa\
+\x38\xe7\x0f\x11\x74\xa7\x19\x66\x9e\xf6\x79\x2f\x2a\x68\x24\x16\
+\xea\xc4\xbc\xec\x65\x2f\x33\x02\x89\x1d\x06\x02\x46\x80\x29\x44\
+\x0a\x95\x5a\x26\x51\xf7\x52\x0a\xee\xe6\x0f\xd1\x73\xc9\xc8\xe7\
+\x86\x7b\xb8\xc6\x73\x5e\x9c\x6b\x24\x27\x1c\xbf\x46\xdf\x9c\x51\
+\x70\xdb\x8b\xa7\xde\xa1\x1d\xfa\xe0\xea\x52\x4a\x03\x18\x91\x16\
+\xb1\xe2\x20\x07\x77\xfe\x30\x55\xcd\xf3\x6d\x7f\xe1\x21\xe6\x07\
+\x65\x4e\x46\xcc\xc8\x9c\xbe\x67\x98\x06\x4a\xd7\x0b\xc5\xe1\x90\
+\xa0\x72\x68\x50\xe5\x0f\x0a\x15\x1c\xc9\xdc\x28\x69\x25\xed\x16\
+\x48\x75\xd6\xaa\x8a\x9b\x38\x77\x14\x49\xe2\x29\x2e\xad\x0f\xbf\
+\xbb\xeb\xd1\xf0\xcc\xb8\xc2\xb0\x58\xc5\xc7\xce\xbc\xf8\x9c\x50\
+\x3d\x7b\x7c\x78\x6c\xf5\x7f\x86\x9e\xc1\x55\x72\x4b\x56\xe9\x72\
+\xb9\x27\x17\x97\xc2\xbc\x15\x1b\x8c\xcc\xac\x9f\x22\x47\x80\x13\
+\xc2\x94\x19\x1d\xe1\xf7\xd7\xfd\x34\xfc\xf1\x6f\x77\x86\x17\x9f\
+\x7f\x41\xe8\x6e\x51\x7c\x8c\xe5\x49\xdb\xff\x33\x9e\x2b\x91\x91\
+\x75\xca\x88\x0c\xf9\xf6\x23\x37\xbc\x61\x67\x4b\x91\x3e\xd0\x2b\
+\x8e\xf1\x98\xb8\xae\x74\x65\xa8\xaa\xae\xb0\xa2\x3f\xd4\x7d\xff\
+\xec\x67\x3f\x6d\xc5\x88\x98\x14\x8a\x13\x51\xac\xa8\xbc\xa2\x54\
+\xb9\x77\x9a\xac\x28\x50\x9f\x8a\x21\x51\xa6\xc4\xb8\x25\xea\x80\
+\x28\x7f\x0f\xc5\x8d\x20\x3c\x2a\x69\x13\xa5\xf7\x50\x40\x11\x9b\
+\x92\x4d\xeb\x3a\x7e\x0f\x1e\xf3\x38\x88\xfd\x3f\x95\xff\xf7\xde\
+\xc0\x52\xe3\xe3\x18\x01\x40\x54\xe2\xc1\x1c\x65\x0c\x87\x44\x88\
+\xa4\x94\x02\x59\x03\x04\x9c\x29\x0f\x93\xfc\xfd\xa9\x5d\x51\x59\
+\xb9\xb3\x50\x52\x8f\xea\x8a\x94\xc8\x4f\xff\xbb\xdf\xfd\x9e\xd9\
+\x3f\xe0\x7e\x41\x4a\x20\x27\x92\x49\xbe\xfa\xd5\x97\x85\x65\xcb\
+\x9f\x31\x7b\x04\xf6\x1c\x6a\xd0\x7b\xa0\xe5\x84\xfa\x71\x92\x06\
+\x26\x87\xa5\x4f\x3c\x62\x70\x30\x79\x82\xca\x05\xab\xf8\xd4\xb6\
+\x06\x15\x9b\xd2\x8b\xf8\xf4\xab\xf4\x6d\x91\xbc\x76\xca\x94\x20\
+\x70\xa0\x2f\x65\x45\xb1\x0a\x54\xa3\xa8\x42\x1b\x17\x6f\x2d\x90\
+\xf2\xa2\xc5\x0b\x42\x89\x5c\x81\x9b\xdb\x5a\xe5\xbd\xa3\x7c\x6a\
+\xc5\xfa\x5d\x69\xd5\x9b\x76\x6c\x0f\xdf\xfc\xfa\x7f\xa9\x00\x94\
+\xf2\x95\xa9\xa6\x51\x97\x8a\x3d\x51\x77\x65\x90\xda\x38\xd4\x50\
+\x97\x87\x4e\x61\xac\xc2\x32\x76\x27\x96\x72\x90\x3e\x70\x21\xc6\
+\x46\x44\xa9\x68\x57\xd9\x01\x93\x87\x2a\xfd\x0d\x04\x80\x03\x02\
+\xc4\x58\x40\xf6\x18\xc9\x51\xb1\x01\xbf\x48\xf0\x20\x6f\x57\x79\
+\x79\x8e\x37\x10\xbf\x67\x8d\xe6\x5d\xb8\x4a\xb3\x2f\xdc\xc5\x9a\
+\xcc\x05\x3c\x53\x89\x87\x99\xd4\x72\x8b\x63\x82\xc4\xbb\x20\xa2\
+\x10\x24\x8a\x95\x15\x15\xc8\x0e\xa0\x05\xe1\xdc\xaf\x31\x99\x71\
+\x5f\xee\xb3\x45\x9a\xaf\xca\xf2\xea\xb4\x0a\x0d\x82\xd3\xb0\x65\
+\xb3\x49\x23\x48\x48\x66\x7f\xd1\x7b\x5d\x65\x98\x52\x71\x92\x22\
+\x71\xcf\xfd\x4a\x52\x6a\xce\x15\x9a\x67\xf3\x26\x14\x21\x86\x10\
+\xf2\x77\xa3\xd6\xad\x54\xcf\x92\x89\x80\xb5\xee\xa3\x7e\x8f\x60\
+\x03\x42\x54\xa4\x3c\x5c\x3c\xfb\x7c\x2d\x1d\x68\x2e\xc8\xe9\x58\
+\x45\xa5\x1b\xb2\x6c\xc6\xf2\x3c\xcc\xac\xb4\xeb\xe9\x62\x2c\x65\
+\x0c\x88\xdd\x20\x45\xff\x09\x97\x29\x10\x33\x7f\x08\x5b\x8c\xf6\
+\x91\x2a\xc4\x0e\x29\x02\x7f\x40\x9b\x87\xf8\x4c\xb2\x33\x0f\x09\
+\x6f\x96\xea\xb1\xde\x06\x05\xdd\x6e\x17\x21\x52\x8e\xbd\x15\x4b\
+\x65\x93\x59\xdc\x1a\xce\xb8\x60\x5e\xf8\xf1\x9f\x7e\x17\xe6\x2f\
+\x3c\x28\xd4\x4c\x98\xa7\x2c\xde\x65\xe1\x4f\x7f\xbe\x26\xac\xdb\
+\x28\x37\x67\x6d\xca\xdb\xea\x6e\x0b\xff\xfd\xa5\x9f\x84\x2f\x7f\
+\xe1\x7f\x04\xbf\x85\x2a\x50\xf6\x70\xd8\xd2\x12\xc2\x86\xad\xc5\
+\x61\xc5\x9a\x94\x88\xcf\x64\x11\x24\x31\x4d\x65\x62\xbe\x86\xa2\
+\x0c\x11\x5e\x2b\x49\x2a\xce\x01\xfd\xbd\xab\x57\x40\x0e\xe8\x2d\
+\x17\x22\x93\xc9\xc4\x42\x6c\xa2\x6e\x0c\x3b\xf7\x29\xeb\xa7\xc5\
+\x28\xa8\xda\x1c\xa5\x50\xcb\x94\x6e\x1a\x5d\xb9\x15\x71\x52\x09\
+\xd0\x39\x73\x67\xd9\xa6\xa2\xee\x34\x9c\xa9\x47\x83\x73\x9f\x23\
+\x9c\x9d\xed\x46\xf5\x28\x32\xbf\xbb\x5e\x7c\x24\xe3\x55\x52\xf2\
+\x3d\x47\x0c\x39\xcc\x5f\xe2\xa3\xde\xbf\xc4\x1b\xf7\xf2\x06\x90\
+\x4d\x2e\x47\x66\x1c\xc5\x9e\xb6\xc3\x86\xa1\x9e\x8f\x1d\x82\x86\
+\x98\x41\xb5\xbf\x8d\xeb\xd0\xff\x25\xd4\x8f\x89\xb1\x48\x3e\x0c\
+\x82\xe5\xfe\x0a\xd2\x21\x77\x19\x32\xa3\x72\x62\x54\x3c\xaa\x4a\
+\x45\xb2\x1a\x4d\xd5\x43\x59\x60\x38\x7e\x53\x5f\xe9\xb7\x7f\xdc\
+\x77\x97\x25\x7b\x3c\xff\xbc\xb3\xc2\xa7\x3f\xf9\x31\xd3\xfb\x5f\
+\x7e\xf9\xe5\xe1\x71\x05\x12\xde\x74\xcb\x0d\x86\xcc\x17\x2d\x58\
+\x1c\x56\xcb\x3e\x41\x1a\x8e\xa5\x8f\x3e\x66\x9c\xf8\xac\x19\xb3\
+\x0d\xb1\xf2\x9e\x5e\x21\xbe\x21\xe5\xe9\xe0\xef\x0e\xa9\xb5\xfa\
+\xd7\xa5\xc2\x35\xd7\xfc\x3a\xbc\xec\xd2\x97\x98\x6d\xc3\x83\x2a\
+\xe1\xc6\x69\x1f\xa4\x4a\x1b\x64\x73\x26\x43\x32\xf3\x54\xa3\x6c\
+\xb7\xe6\x88\xa0\x01\x14\x89\x18\xd0\x5e\x6a\x20\x2a\x1b\xed\xe9\
+\x61\xe8\x33\x76\x16\x57\xbf\x5d\x7c\xf1\xc5\x69\x03\xbc\x67\x27\
+\x40\x7d\xc4\x38\x61\x8a\xdc\x55\x99\x58\x15\xe0\x9d\xf7\xd2\x1e\
+\x84\x83\x36\x41\xf0\xa8\xd3\xb0\xe5\x90\xe3\x0c\xdb\x0c\x06\x7d\
+\xf6\x09\x84\xf8\x53\x9f\xf9\x74\xf8\xc8\x47\x3e\x22\x15\x61\xaf\
+\x49\x41\x2f\xba\xe8\xc5\x69\xc9\x8f\xf7\x51\x54\xcc\xd5\xd0\xce\
+\x78\x19\x41\x10\xe7\x56\x2c\x22\x23\xe5\x8c\xcd\x09\xea\x41\x57\
+\x8f\xf1\xdd\x1d\x17\xe8\x07\xfd\xf5\x54\x3a\x0e\xcf\x1e\x77\xe4\
+\xb5\xa0\x20\x1c\x99\xde\x67\x06\x12\x78\x4d\xf9\x47\x60\x62\x6a\
+\x32\xc0\x05\xcc\x11\xaf\xc5\x9e\xc2\xdc\x81\x75\x7f\xb4\xf7\xa2\
+\xca\xbe\x94\x55\x26\x25\x0c\x2e\xc9\xd8\x5a\xe2\xeb\xf6\x3b\xfb\
+\xc1\xa5\x06\x11\x98\x78\x0e\x86\xcc\x8b\x8c\x92\xcc\xfa\x55\x7f\
+\xd3\x1a\xb5\x7e\x07\xd5\x48\xa1\x18\x19\xf8\xf7\x1e\x55\xd0\xac\
+\x56\xa0\x25\xc1\x99\xbd\xda\x33\x5b\x37\x84\x70\xf0\xe1\x13\xc3\
+\x9f\xae\xbb\x49\x65\xcb\xe4\x0c\xd2\x1a\xe5\xb6\xfb\xce\x77\x3f\
+\x28\x26\x40\x05\xc8\xd4\xf6\x1c\x05\x5f\x6e\xd9\xdc\x11\xba\x87\
+\x9a\xc2\x17\x3e\xff\x89\x70\xfa\x0b\x4e\x94\xdd\xb2\x5f\xcc\x7d\
+\x5e\x58\xf6\x4c\x47\x38\xff\x9c\x1a\x11\x7b\xbd\x56\x0c\xa0\x31\
+\x89\x19\xeb\x14\xaf\x9b\xaf\xd2\x3e\x99\xee\x5c\x88\xcc\x6e\x75\
+\x00\xe0\x75\xa0\x65\x32\xd0\x15\xb3\xa1\x71\x3b\x65\xe3\xb8\x91\
+\x1f\xdd\xb7\x4b\x21\x6c\x6e\x77\x15\x4d\x7a\x09\x5c\x23\x8b\xc8\
+\x3b\x3c\xb5\x06\xcf\x38\x81\x49\x4a\xd0\x97\xe4\xdd\x94\xf4\xfe\
+\xe7\xfa\xf7\x24\x75\x53\x52\xff\x92\xb2\xf4\x66\x7b\x3e\x22\x32\
+\xf1\x26\x8a\x68\x4a\x94\xad\x5c\x1f\xe7\xe6\xf2\x55\xc4\x0a\x3a\
+\x44\xa6\xd7\x6e\x21\xfa\x42\x95\xa2\xed\xd3\xe6\x29\x2e\x93\x81\
+\x9e\x27\x54\xe7\x1c\x49\xe7\xdc\x17\x9c\x62\xeb\x57\x22\xc9\xe0\
+\xf2\xd7\xbf\x5a\x5c\xae\x74\xd5\x00\xbf\x6a\xa8\xbf\xe9\x4d\xaf\
+\x0b\xad\xf2\xa4\x5a\x30\x6b\x9a\x54\xae\x3f\x36\x24\x4f\x3a\x95\
+\xd3\x4e\x3f\x45\x75\xd3\xe5\xea\xae\x34\xe7\xa8\xcd\xa8\xea\x58\
+\x5b\x59\x1d\x2e\x7a\xe9\xcb\xc2\x57\x3e\xff\x85\xb0\xf4\xc9\xa7\
+\xc2\x49\xa7\x9c\xaa\xcd\x55\x15\x8a\x54\x8f\xbd\xa4\x5c\xb0\xa2\
+\x36\xab\x6b\xab\x04\x33\x79\x91\xba\x4d\x9c\x35\x4c\x4e\xa6\xc4\
+\xcb\x35\xf7\x7a\x24\x22\x1e\x7b\xa1\x1b\xb7\x41\xba\xe6\x2a\x8d\
+\x84\x0e\xcb\xa8\x31\x78\xfc\x09\x6d\xc3\x40\x01\xf3\x2e\x59\x7b\
+\x80\x25\xf7\x43\xcc\x90\xc8\xbc\xf2\xa7\x7b\x8f\x61\xf8\xc7\x40\
+\xce\x3d\xb4\xed\xc8\x1a\x22\x04\xe1\x00\x96\x51\xbd\x21\xf5\x00\
+\xaf\x3c\xcf\x99\xa2\x6d\x4b\x9f\x58\x1a\x0e\x3e\xf8\xe0\xb0\x4a\
+\x49\x10\x79\xf6\x4b\x5f\xfa\x92\xa9\xef\x90\x8c\x2c\x36\x27\x2e\
+\xce\xe6\x63\x72\x1b\x8d\x07\x47\x76\x2a\x81\x22\xc4\xc7\xb3\x17\
+\x78\x36\x69\x77\x49\xa6\x4d\xaf\xc3\x93\xe9\x7e\x9e\xe9\x00\x31\
+\x1c\x46\x22\x95\xcf\x4e\x3d\x8c\xbf\xd3\xf7\xa4\x1b\x98\x93\x02\
+\x71\x93\x60\xf7\xb9\xff\x3d\x2a\x03\x67\xa9\xfa\x77\x29\x5c\x16\
+\x13\x12\x93\x57\xa2\x42\x64\x91\x31\xc1\xe4\xfd\x48\xc6\x87\x31\
+\x21\x91\x4c\x81\xec\x30\x4a\xf1\x12\xe4\x51\x96\xa2\x19\x55\xb7\
+\x1c\xd4\xc6\x1a\x94\xbd\x26\xa5\xbd\xa1\xd0\x61\x95\x7c\xee\x51\
+\xd9\x6a\x65\xa3\xa8\x2c\x0d\x25\x68\x75\x86\xc6\x85\x3b\x6f\x7e\
+\x2c\x4c\x9e\xbd\x30\x34\x36\x6c\x57\x65\x4d\x95\x53\x4e\x75\xa9\
+\x0c\x75\x41\x78\xc3\xeb\x5e\xa2\xd2\xd6\x35\xe1\x6f\x7f\xbd\x25\
+\x3c\xfd\xe4\xda\xd0\xb2\x7d\x73\x78\x52\x36\x99\xc9\x53\x07\xc3\
+\xa4\x89\x65\x2a\x11\xdd\xa5\x4c\xce\xa8\x9e\x9b\x05\xa7\x72\x96\
+\xd1\xbe\x19\x22\x57\x5a\x7c\xc4\x04\x47\xa7\x34\xcb\x98\xf3\x34\
+\xe7\x42\x64\x98\x2b\xff\x8c\xda\x11\xb8\x20\x00\xfc\xfa\xeb\xaf\
+\x37\x35\x81\xe7\x77\x02\x70\x51\x0f\xb0\xe9\x50\x27\xe0\xda\x79\
+\xcc\x31\xc7\xa4\x0d\xba\x00\x24\x6a\x93\x24\x0f\x33\x10\x05\x9c\
+\x80\xa7\xc2\x00\xa0\x9d\xb0\xec\x8e\x8b\x6c\x92\x24\x90\xab\x8b\
+\xe5\x3e\x5c\xab\x11\xe7\x78\x77\xa4\xb5\x6c\x50\x92\x8b\x3a\x91\
+\xc5\x77\x39\x8a\x4d\x64\x68\xc5\xe5\xdb\x0c\x39\x17\x5c\xdc\xd5\
+\xad\x4a\x93\x1d\x18\x33\x8b\x54\x30\xa9\x4d\x19\x62\xab\x55\x70\
+\x4b\x22\xba\x22\x8e\x05\xf9\xa1\x6e\x72\xa4\x42\xdb\x86\x5b\xae\
+\xb8\x77\x8e\x94\xe0\xa6\xa0\x38\x02\xd1\x1a\x79\xcd\x58\xf3\x5a\
+\xdf\x7e\x55\xfb\x2b\x50\xed\xf6\xa1\x01\xbd\xb1\x44\x29\x5b\x50\
+\xd3\xe8\x37\x2a\x06\xae\x5e\xb7\x31\x4c\x57\x69\xdc\xd6\x36\x95\
+\x30\x1e\x57\x67\x5c\x63\x94\xe4\x51\xdc\xa1\x10\x33\xf0\xc8\x9a\
+\xd4\x90\xe1\x58\xd2\xb5\x33\x19\x5c\xe3\x6f\xe6\xd3\x0d\xd8\x10\
+\x08\xcf\x99\x06\x43\xe4\xee\xd0\x9e\x34\xd2\x3c\xce\xa4\x7a\x2b\
+\xd1\x7d\xc0\x2a\xd2\x09\x06\x78\x10\xb0\x97\x05\x70\xe9\x00\xc9\
+\x06\x67\x00\xe0\x8d\x76\x79\x07\xc4\x88\xba\xed\x48\x6e\x1c\xbc\
+\x9f\x7e\xb8\xbb\x34\x88\xdf\x2b\x67\xc2\x9c\xf1\x1c\xcc\x18\x84\
+\x8c\xfd\x43\xbe\xb6\x9b\x6f\xbd\xc5\x5c\xb5\x3b\xa5\xe6\xe3\x79\
+\xde\x47\xe2\xd1\x83\x16\x2f\x31\x02\x45\xd9\xe4\x4c\x49\x86\xf7\
+\x64\x32\x70\x2e\xdd\xb8\x77\x98\xe7\x3a\x73\x62\xc7\xbd\xf4\xdd\
+\x1d\x2d\x7c\x3f\x3c\xcb\x78\x9f\x11\x43\x63\xeb\x14\xe3\x28\x53\
+\x67\xc7\x55\x37\x33\xa5\x66\x53\xab\xe9\x7a\x46\x21\xf4\x9c\x91\
+\xd9\x3f\xbb\x01\x2f\x35\x1f\x81\x7a\x2c\xae\x9b\xae\xd8\x03\xe5\
+\x21\x30\x48\x30\x91\x7a\x8c\xb3\xa8\x4a\xbc\x45\xa8\x42\x4b\x71\
+\xb2\xf8\x23\x03\x7c\x94\xbb\x4c\xc1\x91\xa2\x36\x29\x6c\x34\x48\
+\xcd\x4a\xcf\xdf\xdd\xd9\xab\xac\xcb\x72\x60\x11\xdc\xcf\x98\x9a\
+\xaf\xb4\x30\x3d\x61\xf6\xd4\x59\xa2\x36\xd2\x0a\x6d\x5a\x27\xa6\
+\x4d\x19\xb0\xa5\xba\xad\x14\x13\x35\x7b\xe6\xac\x70\xfd\x5f\xff\
+\x12\xa6\x4c\x9c\x14\x36\xac\xda\x12\x06\xc8\xe0\xac\x28\xff\x1d\
+\x4d\x78\x27\xa6\xc2\x31\xa7\x4d\x0b\xdd\x1d\xca\x3c\x5e\x59\xab\
+\xcc\xce\x2a\xdc\x57\x3e\x77\x57\x89\x73\x98\x54\xb3\x2f\xe6\x34\
+\x17\x22\xe3\xef\xcf\x4a\x68\x50\x65\x7c\xeb\x5b\xdf\x0a\x2f\x7c\
+\xe1\x0b\x2d\x48\x8d\x03\x2e\x0f\xdd\xb2\x21\x92\x38\x8e\xc1\x37\
+\x1a\x04\x82\x0d\xea\xdc\x53\x12\x12\x35\x29\x49\x48\x86\xcd\xe5\
+\x7e\xfe\x99\x1e\x4b\x49\x44\x2a\x17\x75\xd1\xee\x2c\x40\xae\x44\
+\x6a\x77\xde\x91\xcb\x3d\x49\x44\x36\xb1\xed\x58\x7d\x69\xae\xfe\
+\x26\xc5\xb8\x86\x3d\x3a\xf7\x21\x97\x4b\x7d\x50\x24\x7d\x72\xb5\
+\x90\xe6\xcc\xb9\xf3\xcd\x38\x5f\x2c\xc2\x42\xe6\xbd\x8d\x4a\xe4\
+\x37\xa9\x5e\x9c\xbf\x6e\x03\x2f\x15\x8c\x9b\x24\xdf\x98\x20\xfb\
+\x88\x5c\x79\xab\x45\x14\x94\x03\x96\x0c\xfe\x52\xdf\x4b\xaf\xdc\
+\x29\x26\x45\xd5\x21\x4b\x0a\x43\xb3\x78\x0b\x05\x3c\x87\x7e\x3d\
+\xd3\xa3\x67\x01\x64\x6c\x7b\xc5\x44\xcc\x97\x29\x5f\x9e\x90\x78\
+\x89\x02\xce\x58\xff\x1e\x65\xa5\xed\x93\xcd\xa1\x40\xa9\x3a\x8a\
+\x24\x59\xe5\x8b\x53\x2c\xd4\xa6\x44\xa5\xe1\x08\x38\xd3\xb8\xed\
+\x88\xd1\xa5\x99\x4c\x57\xe0\xe1\x7f\x43\x50\x3c\x71\x26\xef\x42\
+\x45\x05\xe3\xe4\x29\x5d\xf8\x1d\x35\x18\xfb\x00\xef\x4a\x72\xb4\
+\x21\xa9\xf3\x1d\x58\x87\x10\x40\x98\x3c\x4e\x87\xfd\xc0\x75\x08\
+\x0c\x70\xfc\xe3\x1f\xff\x38\x7c\xf8\xc3\x1f\x8e\x5c\xb3\x25\x55\
+\xf0\x2e\x54\x87\x78\x97\x9d\x76\xda\x69\x46\x58\xae\xb9\xe6\x1a\
+\xb3\x87\xc0\xc0\x21\xed\xd0\xde\xa9\x27\x9f\x62\x7b\x6c\x87\xfa\
+\x92\x89\xf4\x3d\x90\xd4\xdf\xe3\xde\x7f\x9c\x21\x7a\x10\x14\x97\
+\xda\xdc\x1b\x2d\x73\xcc\xb4\x35\xfc\x7b\x66\xfb\x69\x78\xc9\x90\
+\x64\xdc\x1b\x6f\x78\x8a\x1b\x6c\x37\xf9\x52\xd9\x3d\xaf\x0f\xc5\
+\xb9\x44\x32\x5b\x24\xab\x40\x34\xa2\x63\xa7\x1a\xdb\x55\x84\x51\
+\x79\x78\x64\x9b\xe8\xfe\x02\x3d\x3b\x28\x26\xc5\x24\x57\x31\x1f\
+\x64\x64\x26\x2b\xb2\xc5\x27\x09\x96\xf2\x65\x9f\xee\x90\xba\x0c\
+\xe7\x80\x0a\x25\xb5\xdc\xda\xb0\x41\x4c\xc7\xc4\xb0\x6a\xc5\xb2\
+\x70\xf1\xcb\xdf\x15\xd6\x6d\x55\xd9\x8b\xda\xa2\xb0\xa3\xb5\x31\
+\xd4\x49\x82\x5f\xb5\xea\xe9\x70\xef\x3d\x0f\x8a\x81\x1a\x1f\xfe\
+\xfa\xe7\x7b\xc3\x09\x47\x1d\x1e\x1e\x78\xf8\x31\x69\x09\x8e\x0d\
+\xeb\x36\x34\xca\xf9\xa6\x3b\xcc\x9b\x39\x5d\x3c\x9d\xa2\xfd\xab\
+\x54\xd2\x42\xea\xb5\x22\xbd\x10\x78\xf7\x40\xe4\x0c\x49\x86\x6b\
+\x04\xb1\xe5\x9c\xd7\x6b\xaf\x57\x58\x9b\x47\x25\xc0\x45\x66\xa3\
+\xc8\xd0\x51\x0d\x03\x24\xc9\xc3\x75\x15\x29\xc5\x2b\x02\x02\xe8\
+\xee\x8e\x89\x6e\x19\x2f\x1f\x36\xa5\xeb\xc3\x89\x29\x60\xd0\x4e\
+\x6c\xb2\x01\x21\x80\x4b\x27\x78\x16\x57\x68\x5c\x42\xd9\xe4\x5e\
+\xa8\xca\x93\x23\x8e\xd6\x86\x49\x42\x59\x8e\x24\x22\x97\xb4\x41\
+\xf6\xb7\x24\x93\x44\x44\x93\xfa\x97\x34\xfe\xec\xcf\x63\xcc\x8c\
+\x97\x3e\x6d\xec\xcc\x24\x32\xf9\x42\xfc\x4a\x8c\x88\xf8\x2f\x65\
+\xf1\xca\xb5\xeb\xc2\x2d\xb7\xde\x2e\x0f\x97\x1b\x42\x97\x6c\x08\
+\xed\x5d\xbd\x61\x4b\x63\xab\x22\x95\x27\x86\x3a\x55\xf9\xeb\x95\
+\xfd\x0e\x69\x04\x8e\xaf\xb6\xba\x2e\xdc\x73\xdf\xdd\xe1\xcc\x17\
+\x9c\x25\x95\x98\xf4\xd2\x32\xdc\xaf\x59\xb7\x5a\x46\x65\xd9\x6f\
+\x26\x8c\x0b\x1b\xd7\x6f\x92\xc4\x23\x77\x4d\xa5\xdd\x98\x3a\x49\
+\xf1\x1e\x52\x99\x6d\x5a\xb7\x36\x5c\x73\xf5\xaf\x8c\xf0\x14\x15\
+\x97\x86\xde\x3e\x49\x4e\x7a\x77\x54\xb7\xa6\x3b\x9d\xb6\x05\x09\
+\xa6\xbd\x5d\x2e\xa1\xda\x60\xee\x4d\x05\x22\x74\x63\xb5\x23\x4d\
+\x4f\xbb\x02\x6c\x99\x2a\x0f\x15\x9e\x0e\xd7\x61\x1b\x33\xa3\x71\
+\xf7\x63\x34\x17\x93\x83\x34\x7e\xe9\xa5\x97\xda\x3d\xee\x69\x85\
+\xea\x8a\x34\x30\xa8\x87\x3d\x29\x26\x84\xc1\xbd\xe5\x20\x14\xb4\
+\x0d\x81\x80\x18\xb9\xa4\x03\x81\x00\x86\x89\xe5\x21\xae\x86\x72\
+\xcb\xbc\x17\x78\x7c\xf9\xcb\x5f\x6e\xf6\x19\x8c\xfc\x20\x30\x24\
+\x24\x08\x3c\x84\x8b\xe7\x0f\x3b\xec\x30\xbb\x17\xcf\xb5\x7a\x11\
+\x2b\x90\x98\xdb\x54\xdc\xab\xcf\x73\xb6\x55\xc8\x09\x87\x83\xfe\
+\xb8\x16\xc0\x55\x6b\x7e\xcd\x83\x28\xb9\xcf\x99\x26\x8f\x73\x49\
+\xc3\x77\x4c\x54\x9c\x58\x8f\x24\xc9\xb8\x6a\x37\x53\x5d\x86\xf3\
+\xc1\xf3\xf6\xa0\x7c\xb2\x14\x5a\x48\x29\xe9\xba\x30\x66\xe0\x37\
+\x25\x72\x6c\x7f\x8a\x48\x10\xf6\x1a\x08\x8b\x13\x98\x68\xcc\xba\
+\x36\x88\x07\xad\x28\x8b\xb4\x31\x79\x8a\xee\x1f\x92\xb4\x32\x24\
+\x3b\xdf\xa0\x3e\xc0\x24\x73\xb6\x43\xeb\xdb\x3f\xd0\x25\x7b\x76\
+\xbe\xd6\xbd\x2e\xdc\x76\xff\xd6\xd0\xd9\xb6\x2e\x1c\x2c\x69\x75\
+\xe5\x06\x39\xbc\x4c\x9c\x20\x87\x92\x83\xe5\xbd\xd9\x28\x47\xaa\
+\x4f\x04\x39\xe9\x86\x63\x0e\x5f\xa2\xc8\xfe\x1d\xe1\xa5\xe7\x5d\
+\x12\x5e\xfe\xe2\x73\xc3\x6d\x77\xb6\x84\xd9\xf3\x8a\xe5\xf2\x1e\
+\x05\x2f\xf7\x8b\x91\xa9\x9f\x54\x19\x7a\x32\xed\x66\x3b\xff\x36\
+\x75\x99\x8e\x9d\x7a\xb4\x1c\x16\x29\xd7\x15\x76\x22\x33\x6a\x22\
+\x35\x08\x06\x22\x7f\x95\xc4\xfc\x5b\x94\x5a\xfd\x09\xd5\xf0\x60\
+\x13\x90\x81\x17\x89\xe6\x9b\xdf\xfc\x66\x78\xef\x7b\xdf\x6b\xaa\
+\x33\x0c\xa6\x1e\xd3\xc0\x44\x78\xc9\xdd\x6c\xe3\xb3\x84\x85\xe2\
+\x92\xd9\x94\x6c\x64\xf4\xd3\x6c\x20\xdf\x4c\x49\x48\x38\x89\x88\
+\x24\xfd\x9e\xc3\xdc\xef\x93\x47\x73\xb1\xa9\xd0\x81\x5c\xd4\x65\
+\x11\x6f\x11\x6d\xa8\xd8\xbf\x6c\x98\x6e\x3a\x84\x1d\x2d\xf2\x94\
+\x52\x0c\x40\x49\x45\x49\x58\xd2\xd8\x62\x92\x4c\x81\xc4\x92\x21\
+\x71\xde\x5d\xbd\x83\xe1\x07\x3f\xbe\x3a\x54\xd4\xd4\xa9\x76\xf9\
+\xc4\x30\x77\xfe\x9c\xb0\xec\xa9\xe5\x61\xb6\x9c\x41\x4e\x39\xe9\
+\xd4\xb0\x65\x47\x73\xb8\xe2\x43\x1f\x0d\x0f\x3d\xf2\x50\xf8\xfd\
+\x6f\xff\x10\xa6\xcc\x9c\x1b\xce\x38\xfd\xcc\xb0\xf8\xa0\x45\xe1\
+\xd6\x9b\x6f\x0b\x15\x92\x58\x4e\x3b\xe5\x18\x6d\xb8\xed\xa1\xbd\
+\xa5\x35\x1c\xb4\x68\x61\x78\xcf\x7b\xaf\x08\x57\xbe\xff\xfd\x61\
+\xbc\x36\xde\xe0\x40\x9f\xd4\x02\x15\x32\x8a\x77\x1b\xac\x41\x6c\
+\x7a\x7a\x94\xd2\xa5\xad\xd9\x38\xfe\x5e\x21\x71\xcf\x84\x0c\xd2\
+\x74\xc9\xc5\xf3\x76\x81\xf4\xc9\x1d\x06\xc2\xf4\xec\x13\x1e\xd5\
+\x6e\x04\x49\xde\x58\x29\x11\x37\xb7\x5f\x78\xf0\x21\xf7\xbb\x5d\
+\x06\x24\x01\x01\x01\x61\xb0\x17\x20\x34\x0e\x9f\x9e\x6e\xc6\x6b\
+\xc2\x70\xce\x44\xe4\xfc\x8d\x43\x00\xcc\x93\xff\xc6\xf3\x7c\xc7\
+\x25\x9a\xcc\xd0\x13\x26\x4d\x34\x35\x1d\x36\x29\x67\xdc\xe8\x23\
+\xef\xc3\x06\x4a\xcc\x90\x13\x18\xae\xfb\x18\x3d\x0e\x8d\xba\xef\
+\x8c\x05\x89\x0a\xe4\xef\x31\x33\x9e\x35\x1b\x42\xca\xde\x82\x19\
+\x74\xc2\xe1\x8e\x0e\x99\x7b\x23\x53\x12\x1c\x0e\xd8\x99\x76\x20\
+\xff\xcd\xdb\xd8\x27\x9b\xe0\x39\x6b\x04\x23\x0a\x9e\x7a\x18\xeb\
+\x49\xf5\xc5\x36\x88\xcc\xf7\xa6\x22\x8b\x09\x4b\xac\x48\xb6\x6d\
+\x12\xb1\x60\x11\xa9\xc9\x93\x4a\x2c\x2f\x25\x22\x8f\x4e\x77\x48\
+\x9e\x7f\x8a\xfa\x0f\xf2\x28\xcb\x23\xdd\x8b\xfe\xc7\x8e\x49\x6a\
+\x99\x9e\xde\x56\x31\x5a\x4d\x72\x4d\xee\x97\x23\x88\x32\x96\x1f\
+\x12\xc2\x3f\xee\xbf\x26\xbc\xee\x90\xf7\x87\x93\x8e\x3d\x22\x8c\
+\x57\xc1\xb2\xf6\xf6\xce\x70\xd3\xf5\x37\x84\xf3\x54\x6f\xa9\x65\
+\x5b\x93\xa4\xe6\xc7\x82\x72\x8c\x87\xf7\xbc\xf9\xe4\x50\xa2\xf6\
+\xe7\x4f\x9f\x15\xa6\xd4\x0b\x56\xfb\x7b\x43\x4f\xbb\xd4\xbc\xb2\
+\x83\xa6\x7a\x25\x41\x95\x44\xce\x30\x7e\x64\x48\x32\xb9\x79\x14\
+\x65\xac\xc9\xbe\x20\x32\x14\xb5\x19\x95\xc8\xe0\x0d\x03\xe2\xc7\
+\x58\xcb\xdf\x00\x3e\x00\x8e\x4f\xff\x99\x67\x9e\x69\x52\x8e\xd7\
+\x28\xc7\x6b\x06\x80\x67\x83\x78\x3e\xa6\x24\xe3\xa0\xc5\x36\x68\
+\xb3\xc3\x75\xb1\x01\xe1\xde\xb0\xfd\x78\x64\x38\xbf\x67\x3b\x92\
+\x88\x48\xd2\xef\x49\xf0\xbd\xbf\x25\x99\x5c\xfb\x97\x9b\xba\x50\
+\xb6\x11\xdb\x35\x4e\x64\xdc\xe0\x0f\xc7\x86\x81\x13\x3d\xb4\xec\
+\x65\x32\xf4\xe7\x49\x7f\xbc\x4e\xc8\x71\xf5\x9a\x75\xd2\x6d\x29\
+\x06\x4a\x2e\xc4\x62\xda\x42\xad\xdc\xd5\x27\xa8\x3a\xdf\xd2\xa5\
+\x0f\x19\xf7\x55\x23\x77\xcb\xbc\xbe\xee\xd0\xb0\x71\x75\x98\xaa\
+\xeb\xf7\xde\x71\xb3\x11\xc2\x8d\x6b\x96\x9b\x97\x57\xa5\x36\xc5\
+\x56\x49\x34\x8f\x3d\x78\x4f\x38\xe8\xe0\x85\x32\x6e\x3e\x21\x2e\
+\x4f\xa9\xee\x0b\x8b\xcd\x3e\x71\xd9\x6b\x5e\x1d\x7e\xfc\xd3\x9f\
+\x84\x27\xe5\xfe\xfc\xe6\x37\xbc\xc6\x18\x97\x4e\xb9\x26\x0f\x8a\
+\x4b\x34\xb5\x5b\xa9\xea\xc5\x94\x17\x0b\x69\xd7\xc8\x96\x71\x81\
+\xd2\xec\x5f\xa7\x7b\x66\xa6\x33\x3b\x83\xfc\xdc\x81\x04\xd8\xfc\
+\xf6\xb7\xbf\x6d\xc8\x17\x02\x92\x99\x47\x0d\xf8\x1a\xc4\x5e\x9b\
+\x57\x98\xae\xa7\x02\x0c\xb2\x1e\xc0\xac\xdb\x57\x30\xf6\x83\xfc\
+\xb9\x06\xd1\x42\x6a\x07\x46\x91\x4e\xbc\xa0\x1a\xf7\xd2\x36\xbf\
+\x01\x2f\x6e\xbb\x61\x0f\x70\x8f\x97\x53\xce\xac\xdd\x82\x94\x85\
+\xe4\xe2\xea\x3a\x5c\x94\x3d\xab\x81\x25\xf5\xd4\x77\xda\x99\xa2\
+\x36\x5d\x92\x71\x63\x3f\x2b\xc6\x3e\xf3\x14\x4f\xae\x59\x80\x18\
+\xb8\xb4\x61\xe3\x8b\xe3\x5a\x3c\x9b\x75\x26\x43\x93\x96\x64\x58\
+\xdb\x91\xa4\x98\x0c\x75\x99\xef\x81\x4c\x58\x75\xe7\x86\xa4\xfd\
+\x73\xa0\xff\x8e\x7a\x58\x33\x10\x15\x18\x8b\x19\xae\x88\xc0\xc4\
+\x9e\x67\x68\xc8\x64\xc4\xe7\x60\x57\x98\x4a\xd9\xa4\x1d\xd9\xa3\
+\xf4\x4c\x01\xd1\x42\x22\x02\x78\x2a\x12\x92\x51\x68\x34\x4a\x76\
+\x19\x72\xbb\x0d\xf5\x85\x6d\xdb\xb7\x48\xd2\xaf\x0a\x65\x9b\x04\
+\xf7\x0d\xeb\xe4\x10\x93\x1f\xde\xfa\x96\x73\xc2\xc7\x3f\x79\xa3\
+\x6c\x2d\x2b\xc2\xb8\xc9\x95\x61\xfe\xcc\x13\xc2\xe4\x29\xd3\xc2\
+\xd1\x87\xcf\x0f\x3f\xbc\xea\xdb\xe1\x81\x1d\x9b\xc3\xb1\x87\x2d\
+\x08\x55\xca\x6f\xb6\xf4\x91\xbb\xc2\xb6\xcd\xe5\xe1\x84\x13\xa7\
+\x86\x86\xed\x4b\xa5\x4a\x96\xea\x4d\xda\x85\x79\xb3\xe7\xea\xe5\
+\xa4\xb5\x89\x25\xad\x58\x8a\x89\xe7\x1b\x7c\xde\x7f\x40\x48\x32\
+\x02\x94\x01\x19\x29\xfb\x04\xec\x03\x9e\xcc\x12\x84\xe0\x12\x08\
+\x9b\x0a\xa0\x05\xf9\x0f\x08\x68\xb9\x07\x44\x41\x7c\x02\x9c\x59\
+\x9e\x54\x5d\x9c\x5d\x0f\x0c\x57\x09\x47\x05\x50\xb2\xc1\x78\x9e\
+\xf6\x86\xe9\x0b\xa3\x05\x23\x2a\x56\xcf\x73\xff\x0c\xd5\xad\xe6\
+\x1e\xea\xa9\xbf\xe7\x3d\xef\x31\xf7\x57\x77\x03\xb5\xc2\x4e\x59\
+\x8e\x24\x9b\x44\x12\x91\x48\x22\x82\x49\x48\x3c\xc9\x66\x93\xf4\
+\xfe\xa4\x52\x08\x49\x92\x4e\x92\xf7\x5d\xf6\xfe\x2b\xb0\x4e\x9c\
+\x17\xdc\x1b\x46\x50\x8a\x2c\x45\xbc\x1a\x7f\x4b\x8d\x20\x4e\xae\
+\x8f\xe0\x45\xb2\xcb\x2a\xd0\x2c\xbf\x48\x2e\xcc\xa4\xfc\xd7\x39\
+\x5f\xd2\x8d\xc5\xcc\x88\xe0\x14\xc8\x7d\x9d\xe3\xeb\x1f\xbd\xef\
+\x59\x2b\xb5\xf4\xd6\xdf\xa7\xaf\xdd\xbd\xf1\x89\x70\xf7\x1f\x7f\
+\x92\xfe\xfe\xc4\x3d\x4a\x61\x22\x9d\x76\x33\xde\x61\x7a\x67\x69\
+\x49\x91\x65\x96\xcd\x17\xf6\x3f\xf6\xc8\x23\xac\x34\xb1\x21\x72\
+\x79\x1e\xb0\x95\x4c\x0d\xd4\xa1\x94\x1d\xb1\x91\x1f\x26\xe7\x98\
+\x63\x8f\x8b\xfb\xbc\x53\x15\x94\xb9\x26\x3e\x7f\x1e\x54\x99\xd9\
+\xc1\xc8\x15\x35\x52\xfd\xfa\xe1\xf0\xc0\xbb\x80\x7d\xec\x23\x04\
+\x54\x7a\x06\x01\xf6\x00\x8c\x16\x8e\x04\x1e\xb4\xe8\xd9\x9f\xbd\
+\xc0\x5b\x66\xb1\x2f\xe0\x1f\x62\xe1\xa9\x66\x5c\xf2\x74\x3b\x87\
+\x07\x53\xba\x21\x9d\xef\xb4\x57\xaa\xd8\x23\x18\x2c\xef\x8f\x13\
+\x32\xee\xa3\xfd\x3e\x25\x16\x85\xe9\x9b\x34\x35\xaa\x1f\xe3\xd2\
+\x9a\x07\x81\x62\xa3\x41\x33\xe0\xfb\xc3\x55\x89\x99\x2a\x2f\xe6\
+\xa4\xbd\x25\x72\xbb\xce\x8f\x33\x15\xf0\xbb\x65\xbc\xd6\x1a\xf3\
+\xcc\x32\x05\xa8\x9a\xfb\xb7\xa4\x21\xf7\xca\x73\x6f\x3c\x7b\x0e\
+\x77\xdf\x2c\xfb\x33\x09\xfe\x93\x88\x50\xae\xcf\x67\xdf\x9f\x52\
+\x71\x99\x9d\x45\xbd\xd0\xbc\xda\xbd\x91\x6b\xa5\x2e\x89\x70\xe8\
+\x3b\x8e\x2d\xc5\xd2\x5f\x75\x4a\xa2\xe7\x37\xf6\x8b\xe4\x45\x21\
+\x7a\x95\x8a\x90\xad\xb0\xab\x43\x86\x7f\x21\xfa\xca\x5a\xb9\xd9\
+\xf7\x6e\x97\x9d\x51\xa1\x1b\x5d\xa4\xe5\xef\x94\x5f\x80\x24\xf1\
+\x52\x1c\x2f\xda\xa5\xfa\xed\x52\xfb\xca\x79\xa7\x52\xe1\x8d\x5b\
+\xd6\x84\xcb\x5e\x3a\x2f\xfc\xed\xcf\xbf\x93\x3b\xf3\x36\xed\xa3\
+\x54\xb8\xe0\xc2\x17\x85\x1d\xdb\x57\xca\x01\x00\xd7\xfd\xd2\xd0\
+\xd5\x2c\xdb\xb6\xbc\xd6\xe6\xcf\xad\x08\x0b\x14\xb0\xd9\xa9\xaa\
+\x99\x35\x95\xa8\x84\x95\x0d\xbd\x7b\x30\x6c\x6b\x56\x7c\xd6\xa4\
+\x19\xc6\x0c\x09\x14\xd2\xd2\x35\xf8\x52\x92\x77\xaf\xe0\xac\x4d\
+\x70\x11\xe9\x52\x73\x3c\x72\x95\x64\xf0\xe3\xdf\x26\x62\x60\x64\
+\x1b\x4e\x0b\xa4\xc7\x46\x80\x78\x78\x90\x18\x99\x62\x39\x5e\xf7\
+\xba\xd7\x19\x17\x87\x7b\x25\xc4\x66\x99\xec\x27\x1f\xfa\xd0\x87\
+\x14\x94\x59\x63\x1b\x09\x15\x06\x00\xca\xa6\x1d\x9e\x4e\x64\xb4\
+\x71\x02\xa8\xbc\x93\x05\x06\xa9\xd0\x2e\xd7\xd8\x48\x10\xa2\xa4\
+\xca\x80\x49\x40\x98\xf4\x7b\x92\x24\x91\x84\xc4\x5d\xcf\x3f\xda\
+\xf8\x92\x88\x60\x92\xba\x2b\x89\x08\x26\xf5\x3f\xfb\xfb\x91\x64\
+\x60\xcd\x62\x22\xc3\x26\x33\xce\x88\x32\xbd\x94\x90\xcd\x0f\xed\
+\x40\x30\xf1\x11\x70\x4d\x0a\x78\x84\xb8\xc8\xd7\x58\xd7\x70\xce\
+\x14\xb7\xd6\xd5\x2c\xee\x6d\xef\x72\xd4\xf5\x29\xee\xa6\x59\x9e\
+\x38\x92\x51\xe4\x45\x25\x09\x48\x26\x42\xaa\xfe\x0d\x0a\x69\x6e\
+\x6f\xd8\x2a\x4e\x5d\x71\x03\xb8\x18\x6b\x73\x9b\x5c\xc5\x6b\xc5\
+\x31\xe6\x8b\x30\x21\xd5\xd0\xcf\x42\x45\xf6\xbb\x12\xc3\x11\x4a\
+\x26\x62\x49\x9a\xbf\xa4\xfd\x47\x2d\x18\x60\xfc\xb5\xaf\x7d\xad\
+\x31\x4e\x2e\x01\x24\xad\x5b\x52\xbb\xbb\xfb\xbb\x7b\x92\xb9\x14\
+\xc3\xd9\xaf\xb9\x84\x06\x73\xe7\x75\x7b\xb8\xc6\x3d\xec\x29\x34\
+\x02\xae\xa6\x1b\xed\x7d\x10\x0e\x53\x2f\x8a\x59\x30\x27\x8b\x58\
+\x6a\x2b\x94\x63\x87\xcd\x70\x46\xd6\xea\x4c\x87\x81\x0c\xe7\xc3\
+\xdd\x1d\xca\x81\x79\x5f\x24\x9a\xd8\x61\xde\x63\xe9\x83\x98\x19\
+\x62\x94\x44\x58\xf0\x4c\xc1\xb8\x2e\xa2\x52\x52\x28\x4d\x4d\x5f\
+\x47\x28\x95\x77\x64\x4a\x62\x4b\xb5\xa2\xf7\x41\xec\x83\xba\x56\
+\x9c\xdf\xad\x5a\x31\xba\x5e\xa4\xfa\x45\xe3\x4a\x05\xc3\xd8\xe8\
+\x94\xee\xa8\x58\x0c\x94\x9c\x65\xa6\x55\xcc\x08\x8d\x5b\x37\x89\
+\xf0\xe4\x85\x29\xe3\xa6\x85\x37\xbc\x72\x49\x78\xf8\xc9\x55\x61\
+\xe9\x43\x7f\x11\xb1\x5f\x16\xaa\xc6\x55\xa8\x40\x59\x08\xd3\xe4\
+\x5d\x59\x3c\x38\x35\xd4\x95\x2b\x00\xb9\x55\x7b\x40\x85\xd1\xf2\
+\x15\x33\x53\x5c\xa2\x42\x78\x43\xaa\xac\x29\xee\x28\x25\x29\x09\
+\xc2\xd8\xad\x00\xd9\xf2\xf2\xf1\x91\x4b\xbe\x04\x01\x98\x19\x9d\
+\xfb\xb5\xae\x9d\x82\x89\xad\xfb\x62\xd2\x73\x25\x32\x54\x50\x1b\
+\x14\x20\x0e\x92\xa0\x0f\x84\xee\xd1\xcd\x10\x13\x00\x14\x20\xc4\
+\x48\xc9\x77\xc4\x7e\xf4\xd2\x70\x72\x15\x02\x6c\x74\xd5\x00\xe6\
+\x6a\x19\x47\xdd\x86\x02\x20\x7a\xc2\x3e\x2f\x43\x9b\x6d\xa0\xb4\
+\x8f\x9a\x0d\x2e\xd0\x37\x12\xd2\x0d\x04\x8b\xdf\x92\x90\x78\x12\
+\x11\x49\xfa\x3d\x89\x88\x24\x95\xa0\x4d\x32\xbc\x27\xbd\x3f\x29\
+\xc1\x64\x12\x90\x24\xd9\xac\xb2\xcf\x9f\xdc\xc5\x15\x20\x96\x27\
+\x42\x93\x8e\x8b\x81\xb3\x43\xaa\xc1\x63\x06\x9d\x34\x1b\x4d\xd8\
+\x9d\xc8\xe8\xc1\x7c\x92\xfe\xe9\x6f\x39\x01\x58\xc4\xb3\x14\xcf\
+\xc5\xe2\xd6\x5c\x92\x19\xa9\xaf\xd9\xe2\x80\x06\x94\xbe\xb6\x58\
+\x71\x37\x45\x22\x36\x85\x6a\x93\x74\x44\xad\xa9\x1e\xa9\xe0\xaa\
+\xcc\x9d\x73\xc7\x76\xb9\x6a\x22\x35\xc5\x81\x82\x10\x99\x02\x89\
+\x4f\x46\x58\xe1\x36\xd5\x97\x52\xb9\x40\xfb\x31\x12\x91\x49\x9a\
+\xbf\xa4\xdf\xc9\x5a\x80\x1a\x0c\xe2\x02\x8c\x02\xe7\xcc\x39\x7d\
+\xf0\x2a\x9c\x49\x6d\xe4\xf2\x3b\xef\x61\x0e\x5d\x8a\xe0\xfd\x7c\
+\x52\xb2\xe1\xd0\x27\x18\x40\x6c\x3a\xa8\x15\xb9\xc7\x83\x40\x21\
+\xae\x9e\xd2\x27\xdb\xfb\xd9\xa3\x26\x21\x0a\x59\x01\xab\xa6\xbe\
+\xd6\xda\xb7\x75\x28\x91\xa3\xf6\x61\x41\x5c\x30\xce\x89\x5b\xe6\
+\x1c\xef\x8c\xa4\xc9\x65\x84\x07\xc2\xb3\xb1\x5d\x12\x22\x63\x6e\
+\xca\x91\x17\x19\xe7\x94\xec\x8e\x03\x82\xc9\x62\xd1\xa2\x7e\x39\
+\xa2\x54\x88\x40\xb4\xb4\x6f\x93\x6d\x44\x70\xd0\xdb\xa1\x08\xfc\
+\x87\xc3\x44\x39\xae\xf4\xa7\xb6\x8b\x56\xf5\x86\x7c\xd9\x68\x9a\
+\x1b\x94\xe8\xb5\x42\xe5\xab\xa5\xda\x2a\xe8\x97\x9a\x6c\x8b\xd4\
+\x9f\x0a\x01\xe8\x94\xb3\x4a\x71\x41\x75\xe8\x6e\x13\x73\x27\xef\
+\x96\x56\xa9\xd2\xa6\xd6\x4b\xbb\x96\xbf\x3d\x6c\x6b\x54\x69\xf1\
+\x92\x09\x61\xe2\x34\xc5\x80\x0d\x75\x87\x62\x29\xbc\x8a\x52\xcd\
+\xb6\x0f\x06\x65\xd3\x49\xe5\x35\x08\x17\xaa\xc0\x9d\xec\x93\xf9\
+\x85\x0a\xf8\x85\xb7\x92\x97\x59\x4a\xde\x9f\x55\x5a\x43\xd6\x1a\
+\xa9\x1f\x89\x53\x7b\xbe\x4b\xeb\xb4\x4d\xf0\x71\x60\x18\xfe\xb5\
+\x71\x0a\x10\xfb\x5d\xbd\x05\xd2\x73\xe3\x21\x1d\x87\x90\x9c\x7b\
+\xee\xb9\x66\xf0\x67\xc3\x01\x64\xa8\xcb\x90\x5c\x4c\x65\xa6\xef\
+\x10\x1e\x6a\x85\x98\x18\x1f\x8b\xee\x49\x1c\xb6\x83\x96\xbb\x2e\
+\xd3\x0e\xef\xf3\xfc\x4c\x7c\x77\xbd\x78\x36\x30\x4c\x42\xe2\x49\
+\x20\x9c\x44\x44\x92\x88\x50\xae\xc1\x94\x49\xcf\x27\xfd\x9e\x34\
+\xbe\xec\x9c\xbc\x72\x2f\x11\x3c\x38\x9c\xc8\xa8\x51\x22\x57\x20\
+\x24\x25\x42\xe2\x08\x37\x29\xfd\x23\x73\xa8\x7d\x48\x44\xa4\x84\
+\x16\x91\x2b\xb1\xd2\x92\x28\xc1\xc9\xe8\xdd\xc8\xd0\xed\x0f\xbf\
+\x29\x8f\xfc\x61\xc0\x9b\xb8\xb3\xfa\xda\xba\x50\x5d\x5f\x2b\xb5\
+\x40\x5b\x68\x97\x2a\x00\xa2\x53\xae\x34\x36\xf8\x1e\xf2\x56\xec\
+\x46\x18\xe9\x07\x64\xf0\xb4\x20\x38\x7c\x45\xd1\x92\x9b\x83\x64\
+\xa4\xb0\x19\x89\xc8\x24\x79\x27\x26\xcd\x1f\x30\x0e\xf3\xe5\x49\
+\x3d\x99\x2f\x88\x0d\x70\x81\x4a\xea\x9f\x71\xb8\xe1\x1f\x86\xc1\
+\xf7\xe6\x90\x52\xc2\x30\xde\xd6\x8e\x56\xdb\x8b\x10\x07\x98\x3f\
+\xf6\x13\xc8\x86\x7d\xe1\xc9\x41\xb3\xf5\xd1\x55\xd9\x79\x92\x10\
+\x3d\x01\x29\x63\x83\x58\x21\x0d\xd5\x69\x6f\x3b\xf3\x97\x29\xd5\
+\xfc\xef\x90\x64\xdc\xf1\x05\x1b\x0c\xd2\x38\xb0\x16\x1f\x78\x9e\
+\xc9\x39\x2b\x1f\x89\x45\x12\x4c\x51\x81\x60\x4f\x46\xf7\x5e\xc1\
+\xc2\x9a\x65\x0f\x85\xcd\xc5\x1d\x22\xc2\x91\x43\xc7\x9a\x55\x4d\
+\xa1\xa3\x1b\xf5\xa9\xd4\x8f\x2a\x4a\xb6\xbd\xa9\x3b\xcc\x9f\x7d\
+\x9c\xec\x8d\xeb\xa5\xd6\xec\x57\x55\x4b\x69\x85\x64\xa7\x64\x1e\
+\x37\xac\xdb\x10\xaa\x4a\x54\x3e\x65\xd3\x5a\xc1\xae\x08\x46\x59\
+\x5b\x38\xee\xd4\xf9\x21\x1f\xd5\x63\x99\xa4\x1e\x05\x5a\xe6\x89\
+\xa1\x2b\xd3\xbd\x9d\x72\xb4\xa9\xa8\x99\x18\xba\x06\x5a\x44\x9c\
+\xe4\x58\x60\xa5\x05\x54\xd7\xab\x46\x25\xb1\xeb\x26\x4a\x6d\xad\
+\xca\xc3\x4a\xf9\x5f\x22\x5b\x22\xb0\xc8\xda\x6b\xcd\xfa\xc5\xfc\
+\xb4\x6a\x2d\x77\x1c\x30\x44\x46\x2a\xb2\x16\x79\xbb\xa4\x90\x60\
+\x40\xea\x70\x2f\x88\x5c\x48\x2f\x10\x13\xbc\x73\xe8\xbc\x17\x90\
+\x72\x3f\x7d\xce\x00\xb2\xeb\xa6\x49\x9f\xe1\x05\xac\x7c\xc0\x49\
+\x08\x9a\xe5\xf4\xfa\xe2\x1e\x1b\xc3\x33\x2c\x06\x7d\x81\x00\x24\
+\xd9\x24\x72\x25\x32\x49\xed\x67\x66\x21\x18\x69\xb3\xe6\x4a\x04\
+\x92\xd4\x81\x49\xc4\x3a\x89\x48\x66\x47\x82\xc4\x30\x53\x7c\x2a\
+\x1d\x8a\x66\xd6\x18\x34\x68\x51\x90\x5d\xc4\xab\x82\xd4\x65\xca\
+\x94\x98\xae\x8d\xa6\x1c\x60\x29\x5c\x6a\x31\x2a\x43\x02\x94\x4b\
+\x8c\xf3\x68\x47\x56\x75\x9d\x36\xf6\x84\x9a\x2a\x79\x8b\x6d\xd7\
+\x3b\xfb\x14\x2b\x50\x1b\x4a\x83\xd4\xa7\x04\x26\x4a\x3d\x87\xf7\
+\x58\x95\x24\xe6\xfc\xd8\xa8\x09\x81\x63\xbd\x23\x22\xa3\x3e\xe9\
+\x83\x14\x14\xa9\xf7\xa2\xbe\x66\xaa\xca\x92\xec\x65\xbb\x43\x20\
+\x40\xb4\x6e\x8f\x60\x6f\x78\x51\x2f\x2f\xe0\xb7\x3b\x6d\xe4\x72\
+\x8f\xcf\x9f\xef\x09\xaf\x2f\x43\xca\x12\x63\x10\x94\x07\x90\x7d\
+\x87\xc7\x1a\xdf\x91\xba\x9c\x30\x42\x0c\x93\xb2\x64\x63\xc3\x06\
+\x86\x0a\xc9\x43\x26\x75\x8b\x8f\x31\xa5\x75\x86\x79\xc4\x6e\x3a\
+\x5c\x55\xc7\xbc\xb2\x06\x16\x18\xf5\x3c\x3f\xac\x74\x32\x63\xc9\
+\x50\x95\x59\x5a\x19\x09\x01\x79\x0a\x33\x29\x18\xd2\x47\xbf\x55\
+\x97\x28\x7f\x5e\x55\xa9\x54\x62\xb2\xcd\xf4\xed\x50\xfc\xcb\x86\
+\xb0\xa3\x61\x65\x98\x54\xbb\x24\x3c\x72\xdf\xdf\x65\x87\x09\x61\
+\xaa\x92\x88\x2b\x57\xab\xec\x2e\x72\x8c\x29\x3d\x3c\xac\x5e\xf9\
+\xb0\x24\x18\x82\x84\x17\x85\xe6\x96\x8d\x61\xc1\x9c\x19\xe1\xa1\
+\xcd\x8a\x1f\x5b\x30\x18\xb6\x6e\x22\x73\x84\xb4\x02\x32\x89\x8e\
+\x17\xaf\x52\x36\x4e\x04\x42\x59\x9a\x07\xc5\x70\x15\x97\xa4\x42\
+\x0d\x6b\x42\x1d\xa5\x81\xa6\x50\x94\x27\xa7\x10\x89\x36\x5d\x5a\
+\xe7\xbc\xfc\x1a\xad\xf1\x3c\x65\xbd\x98\x25\x35\x73\x5d\x98\xbf\
+\x60\x7a\x68\x6c\x6a\x31\xb8\xc7\xc3\x57\xf8\xb8\x47\x38\xa5\x43\
+\x38\xbb\x5b\xf0\xa0\xce\xe6\x7e\xe4\xaa\x2e\x63\xd3\x14\x8b\xea\
+\x15\xa0\x9e\x22\x87\xd2\x6d\xb7\xdf\xa6\x42\x4a\xf5\x56\x1e\xf6\
+\xfc\xf3\xcf\x37\xa0\x73\xaf\x1c\x27\x2c\x00\x2f\x1c\x22\xba\x48\
+\xd2\x65\x60\xa8\xf7\xec\xb2\xdc\xc3\xc6\x70\x35\x52\x92\xe1\x1c\
+\xe2\x65\x95\xb2\x41\x60\x71\xfd\x19\x80\x1a\x24\xe2\x75\x44\xb2\
+\x4d\x53\x12\x91\x49\x42\x34\x49\x44\x24\xe9\xf9\x24\x75\x55\xd2\
+\xf3\x49\x3a\xf3\x24\x22\x93\xd4\x7e\x76\xdb\x41\xc4\x9d\xb1\xc9\
+\x0a\x30\x7c\x12\x4c\x89\xc9\x33\x56\x53\xbb\x0e\x5e\x64\x25\x8d\
+\xdc\x2d\x13\x2f\x44\x87\xd8\x19\x3d\x59\x58\x5a\xa3\xf3\xe8\x52\
+\x79\x56\x49\x4a\x86\xd0\x62\xe9\xb5\x0b\xaa\x2b\x4d\x15\xd1\xd6\
+\xb2\xdd\x0c\xda\xa5\xb2\xb3\xd4\x2b\xda\xbf\x4b\x3b\xd7\xd4\x3f\
+\x71\x9c\x48\x7e\xac\x2a\xc3\x1b\x11\xa3\x2c\xfd\xeb\x97\xbe\x7c\
+\x24\xc2\x92\x34\x2f\xbb\xbb\xf5\x80\x63\x77\x59\x86\xf9\x72\xc9\
+\x88\x3d\x00\xc1\xd9\xdf\xb6\x19\x77\x59\x26\xdb\x31\xef\xf2\xf7\
+\xb3\x4e\x30\x62\x7d\xad\x91\xd1\x1f\xf7\x6e\x52\xe8\xb0\x8f\x51\
+\x9f\x41\x18\xdd\x09\x20\xdb\x58\x81\x3f\xde\x01\xb3\xc3\xc7\x4b\
+\x2e\x97\x4a\x4d\x03\x81\x62\x8d\x33\x25\x19\x87\x89\xff\x0d\x04\
+\x26\x9a\x17\xe1\x1e\x4b\x94\x19\x47\xf6\xc7\x6a\x32\xa4\x06\xf2\
+\x99\x91\x2b\xa6\x50\x41\xc0\x30\x55\x55\x52\xed\x92\x42\xa9\x58\
+\xf1\x8d\xdd\xdd\x0d\x4a\x99\xb4\x3d\x34\x6f\x5d\x17\x2e\x38\xeb\
+\xc4\xd0\xd1\xb5\x55\xd2\x4a\x47\xa8\x38\xa4\x3a\x6c\xda\xdc\x1e\
+\x06\xba\x76\x84\x97\x5d\xf2\x42\xa9\x1d\x71\x4d\xef\x94\xa6\x47\
+\x95\x60\x65\xc8\x7f\xe1\x85\x73\xc2\x60\xe7\x50\x98\x29\xa6\x7e\
+\xfe\x9c\xe9\x22\x22\xeb\x54\xb8\xaf\x2c\x74\x48\xed\x3c\x24\xc9\
+\x66\x30\xaf\x43\x49\x36\xfb\x45\x70\xe4\x38\xc0\xec\x2b\xab\x7d\
+\xb1\x18\x09\x98\xa9\x0e\x09\xef\xe5\x55\xe3\x25\x04\xcc\x91\x14\
+\xa3\x22\x7b\xfd\x8a\x37\xdb\xd0\x10\xae\xf9\xed\xb5\xc6\x60\x28\
+\xac\x64\x50\xf8\xb8\x5b\xf0\xda\xa8\x7d\x47\x00\xe1\x3e\x71\x63\
+\xce\x99\xc8\x08\x90\x52\x02\xdc\xa1\xc7\x1e\x7b\xcc\xd2\x95\x4f\
+\x9e\x34\xd9\x88\x07\x19\x73\xd1\xf3\x7a\xe4\x32\x44\x80\xeb\x7c\
+\x67\x40\x9e\x0c\x13\xa0\xe6\xf0\xf4\xeb\x4e\x2c\x38\xef\xce\x06\
+\xc4\x73\x0d\xae\x09\x40\x06\xa8\xd9\x38\x99\xc6\x4d\x97\x8e\x46\
+\xdb\x28\xb9\x12\x99\x24\xc3\x7c\x12\x32\x4a\xe2\x14\x93\x90\x5d\
+\x52\xff\x93\xde\x9f\x44\xe4\xb2\xdb\x7c\x24\x83\x48\xaf\x1b\x95\
+\x8f\x8d\x88\xcb\x90\xd5\x27\x4f\x3b\xd9\xd8\x5a\xe7\xa7\x03\x36\
+\x25\x39\xc4\xf9\xce\xf0\x88\x41\x82\xe8\x57\x49\xd8\x6c\xba\xf9\
+\x6c\x00\xca\xc6\xee\x2f\x50\x8a\x18\x65\xf3\x0e\xaa\xcb\x41\xd4\
+\x7b\x97\x98\x14\x08\x0d\xde\x39\xdd\xf2\xd2\xb1\xf9\x83\x73\xd6\
+\xe6\x1f\xd2\x86\x93\x22\xda\x24\x2f\x27\x32\x1e\xc3\xe1\xf3\x34\
+\x5c\xa2\xc9\x55\xd2\x84\x09\x62\x8e\xdd\x83\x0c\x8f\x49\x88\x0b\
+\xdf\xd9\x0b\x49\x92\x68\xd2\xfa\x25\xfd\x0e\x81\xb3\x35\x90\x64\
+\x67\x92\x4b\x2c\xb1\x41\x64\xf8\xad\x4f\x81\xa9\x1c\xf4\x83\xfd\
+\xe9\x15\x4b\x91\x68\xe8\x63\x92\xe3\x03\xcf\xb1\x07\x5b\xda\xdb\
+\xcc\xce\xe4\x5a\x0b\xbc\xcb\x80\xcd\x02\xde\x1d\xdb\x85\x5c\x5d\
+\xe6\x31\x35\x19\xca\xa5\xa4\x61\x1c\x98\xbf\x5b\xba\x18\x1d\xb1\
+\xaa\x6c\x67\x27\x23\xe7\x17\x3e\x25\xa4\xef\x97\xaf\x7e\x37\xf3\
+\x53\xdc\x19\x3a\x54\x28\xac\xb3\x75\x6b\x68\xdd\xb6\x4e\xd7\xda\
+\xc3\xf2\xa6\xa7\xc2\x12\x15\xf2\x2b\x13\xb3\xf4\xe4\x53\x1b\x43\
+\xc9\xc4\xd2\xb0\x72\x59\xa3\xb2\x5b\x34\x86\x33\xcf\x3a\x29\x3c\
+\xf0\xd0\xa3\x96\x18\xf3\xa8\x63\xe7\x59\x4e\xba\x62\x35\xbd\x46\
+\xe5\x87\x8e\x3d\xa4\x5c\xea\xe0\xf1\x61\xca\x84\xd9\xa1\x51\xf9\
+\xc9\x86\x64\x9f\x2c\xc4\xb1\x46\xf0\x4d\xba\xa6\x42\x79\x6c\x96\
+\xe1\x69\x49\x1c\x8f\x08\x1d\x0e\x2f\x45\xfa\x94\x95\xcf\x96\x93\
+\xcc\xf4\xd0\xac\x4a\x9a\x83\x85\x75\xe1\xf3\x5f\xf8\x44\xb8\xee\
+\xaf\x7f\xb0\xae\x2b\x4d\x51\xc3\x0f\x7f\xf8\xc3\xc7\xe4\x08\x72\
+\xbf\xe0\x76\x9b\x60\x65\x9f\x88\x9a\xb9\x12\x99\xa1\xce\xee\xee\
+\x1e\x36\x22\xd1\xc7\x13\x04\x98\xc5\x02\xaa\x0e\x79\xf5\xc0\x09\
+\xcd\x90\xf8\x35\x20\x40\xee\x90\xca\xa0\x9a\x1a\xef\x71\x2e\x28\
+\x92\x1f\x42\x0c\xd8\x7c\x91\xcb\x5c\x7d\xda\xa3\x0c\x40\xf4\x0a\
+\x80\xfc\x3e\x2a\x12\xb5\x68\x5b\xc5\x59\xc0\x49\x69\xa3\x14\x2a\
+\x4e\x02\xc3\x16\xb9\x13\x31\x00\x93\xf1\xb7\x5c\x29\xda\x23\x24\
+\x0a\x28\xc4\x51\xb9\xbb\x9c\xa3\xe8\xed\xd1\x8f\xa8\x0e\x79\xb6\
+\xa3\x00\x6f\xa9\x2c\x47\x92\x24\x91\x84\xe4\x93\xde\x9f\xd4\x7e\
+\x12\x11\x2c\x16\x60\x66\x3b\xa8\xab\x32\xea\x61\x9b\x2c\xb2\x77\
+\xe4\x49\x32\x21\x03\x6c\xa6\x34\xc3\x73\x44\xdd\x73\x58\xa6\x5a\
+\x73\x06\x88\x5a\x23\x2e\x80\xe7\xf0\x9c\xe1\x88\x08\xd4\xb3\xcf\
+\xf4\x6f\xa4\xeb\x56\xdf\x45\x8f\xb6\x89\x90\x74\x28\xc9\x63\x77\
+\x67\x54\x85\x91\x3c\x62\x20\x4f\xd6\x9f\x54\x1c\xc5\x45\xa5\x91\
+\x6a\x2c\x43\x55\x86\x9a\x8c\x55\xe7\x83\x9a\x87\xc3\x6c\x48\x16\
+\xb7\x10\x9d\x2d\x8b\x2e\x99\x82\x65\xbb\xf0\xef\xc3\xcf\xd1\xb8\
+\xb2\x4e\x9f\x11\x14\x77\x5f\x86\xa1\x62\x0e\xb0\x53\xb2\x2e\xa8\
+\x8a\x93\xe2\xb8\xb2\xb7\x9e\xfc\x6b\x7f\x9c\x37\x2c\x62\xbc\xb4\
+\x46\x38\x49\x88\x29\xe3\xfd\x8c\xaf\x3c\x55\x9e\xae\x48\x4b\x3f\
+\xcd\xed\x58\x59\x9f\x29\x51\xc0\x41\xc9\x82\x6c\xc7\xca\xe5\x2b\
+\x4d\xe2\xc1\xbb\x8c\xbd\xe8\x8c\x21\x59\xaa\xdd\x29\x80\x12\x1d\
+\x91\x83\xbb\x4b\xb9\x51\x00\xe0\x3e\xc1\x60\xea\xdc\x68\xbb\x9b\
+\xeb\x2c\xcf\xe8\xbb\x3f\x79\xfe\x32\xef\x18\x99\xad\x37\xc5\x5f\
+\xfa\x88\x6a\xca\x44\x70\xcc\x9b\x7b\x14\xc3\x15\x06\x95\xce\x5f\
+\x71\x5a\x75\x15\x35\x52\xe6\x4e\x0d\x33\xe6\x1f\xa3\xf8\x16\xb2\
+\x54\xf4\x09\x2f\x4e\x55\x6a\x25\x39\x48\x14\x8e\x93\x4d\xf1\x08\
+\xd9\x55\x2a\xc2\xa9\x67\x1d\xa2\x27\x29\xf6\x57\x1c\x8e\x3f\x75\
+\x4a\x28\x92\x1b\xf3\xd0\x50\x5b\x38\x65\xe6\xfc\xb0\x7e\xad\x5c\
+\xe2\x4f\x9c\xae\x84\xb1\x1d\xa1\xbf\x64\x7c\xd8\xd4\xaa\x82\x80\
+\x1d\x35\xa1\x6e\xda\x84\x7e\x25\x1d\x4a\x75\x0f\xed\x28\x2c\x28\
+\x11\xc9\x92\x64\x33\x98\x27\x02\x27\x35\x5d\xaf\x9c\x0f\xc8\x8a\
+\x3e\x50\x54\x3c\x58\x50\xb1\xb8\xa7\x77\x70\x5c\x57\x47\xc7\x40\
+\x4d\xa9\xca\xd4\x28\x39\x6b\xb7\xb4\x31\x6c\xc2\x5e\x49\xb2\xe3\
+\x74\xfe\x9b\x70\xca\xdd\x5a\xbb\xa6\x3d\x9b\x9d\xd1\xef\xce\xc9\
+\xc1\x43\x80\x52\x22\xaf\xb1\x77\x49\xf4\x7f\xdb\xe0\x40\x6a\xf6\
+\x33\xab\x56\x16\xdc\x7b\xf7\x3d\x72\xb7\x2b\x53\x24\xf6\xa9\xfd\
+\x73\xe6\xcd\xcd\x53\xbd\x08\xd1\x58\x14\xe1\x91\x2e\x9c\x72\x09\
+\xd8\x80\x05\x70\xd2\x62\xe4\x0d\x76\x75\xb4\x99\x99\x46\x44\x22\
+\x5f\x40\x5e\x28\x20\x97\xcb\xbd\x32\x90\xca\x20\xeb\x81\x99\xd6\
+\x7d\x82\x9e\x62\x82\x10\x9d\x23\xa2\x51\xac\xe0\xbd\xec\x60\x36\
+\x12\x71\x71\xb0\x13\x5f\x1b\x17\x0a\x32\xa0\xb7\x6e\x46\x84\x2d\
+\x7a\xc7\xa0\x6d\x20\x38\x3a\xf7\x74\xeb\x55\xfd\x0d\xd7\x6b\x8f\
+\x97\x5a\xb0\x4d\x91\xb6\x7e\xec\x7c\x2e\xba\x32\x12\x01\x1b\xce\
+\x29\x17\x6a\xac\x7e\x8c\x64\x17\xb0\x0d\x9c\x41\xe8\x86\xdf\x93\
+\x44\x44\x92\x54\x41\x51\x6a\xc9\xd1\x8f\x24\x49\xc9\x82\x95\x63\
+\x8f\x9a\x48\x01\x16\x1d\x9e\x02\x7e\xf8\xf3\x16\x5b\x92\x71\x78\
+\xff\x2d\x8f\x58\x8c\xdc\xf7\xe4\x0c\xac\x65\x1e\xc3\x79\xaf\x91\
+\x24\xd9\x28\x97\x54\x44\xdc\x5c\x1d\x1b\x91\xbc\x08\x29\x65\x9e\
+\x0b\xb0\x1d\x46\x8b\xb9\xcb\xd9\x90\xd7\x6e\xd8\x14\x92\xe6\x2f\
+\x89\x89\xf0\x04\x9b\x3e\xc6\x5d\xf7\x40\xd6\xa5\xb3\x1f\x4d\x52\
+\x8b\x6f\x1b\xe9\xd9\x8e\x66\x79\x1e\xc5\xf9\xd2\x98\x2b\x4f\xfd\
+\x04\xa1\xe6\xba\x13\x46\x97\x46\x32\xb5\x04\x5c\x43\x5b\xc1\x35\
+\x77\xc0\x71\x89\x8d\xef\x5c\x37\x62\x96\x05\xc4\x32\xe1\x61\xa4\
+\xfe\xf9\xfa\x0c\xff\xcd\xbf\x1b\xe3\x12\xaf\x1b\xeb\xe1\xeb\xe2\
+\xeb\xe8\xeb\x66\xc5\xd1\x50\x9b\x66\x9e\xf5\x5c\x87\x1c\x45\xa6\
+\x48\xfb\x82\x9a\x0f\x82\xdf\x29\x06\x99\x79\x80\x11\x60\x2e\x88\
+\x59\xf1\x35\xb2\xf7\x0c\xb3\xdd\xa5\xf7\x5f\xa6\xfb\xb2\xc1\x56\
+\xf4\xa1\xb8\x1d\xf6\xaf\x3c\x79\x52\x16\x90\xad\x4f\x19\x93\xf3\
+\xf3\x50\x31\xeb\xac\x6b\xc2\x9b\x91\x5a\x0b\x66\xcd\x03\x38\xcd\
+\x43\x13\xe7\xfb\x28\x57\x1d\xea\x38\xf9\x81\xd9\xef\x79\x62\x10\
+\x38\x70\x8f\x16\x41\xeb\x12\x5e\x6a\x2e\xaf\xaa\x7c\xaa\x71\x5b\
+\xd3\xd3\x7d\x03\xbd\x9d\xe5\x55\xa5\x2d\x9d\x5d\x6d\xd3\x24\x8d\
+\x14\x96\xc9\x90\xd1\xdb\xd9\x47\xb7\x49\x13\xa8\x12\x98\x45\xca\
+\x29\x5b\x32\x4e\xa1\xee\x53\x07\x87\x6a\xea\x15\x51\x35\xf1\x9e\
+\xfb\xee\xed\xf9\xe0\x07\x3f\x98\x2f\x89\xb4\x42\xae\xf6\xbf\x54\
+\x66\xef\xeb\x64\x5f\x5f\x26\x4f\xe0\xf5\xc9\xd0\xb5\x7b\x77\xe4\
+\x4a\x64\x8a\xe4\xba\xfc\x2a\x89\xcb\x6f\x15\x40\xcd\x14\xd0\xd5\
+\x8b\x73\x1b\x14\xb1\xe8\x17\x57\x29\xda\xd3\x29\xe7\x9f\x1e\xc3\
+\xd6\x02\x0a\x58\x5e\x9b\x4d\x2d\xd4\x80\x3e\x1a\xf8\x60\x6f\x5e\
+\x6a\xb0\x77\x60\xa0\xaf\x54\x40\x59\xa6\x4f\x71\x4f\x4f\x9f\x6a\
+\x2e\x55\x8f\x6f\x68\x68\xaa\x64\x41\xf1\xe1\xb7\x23\x4d\x64\x76\
+\x12\x1b\x9a\x2b\x14\x95\xcf\x45\x75\x98\x22\x93\x6f\xe6\x81\x6e\
+\x35\x26\x30\x5c\x46\xe2\x2a\x53\xda\x1a\x80\xc9\x8a\x49\x09\x1b\
+\x7a\x60\x5b\xb1\x3c\xa7\xac\x70\x1a\x40\xc1\x79\x18\x27\x6e\x06\
+\x66\x79\x34\xf9\x75\xcb\x4f\x64\xf4\x31\x3e\xc7\xef\xf5\x1e\x8c\
+\x44\x64\x76\xe9\xda\x08\xc6\xe9\x24\x24\x96\xa9\xee\x18\xa9\x7d\
+\xea\x8a\x44\x40\x3b\xb2\x24\x31\xd2\xb8\x32\xc7\x69\x44\x26\x0b\
+\xac\x25\x11\xc1\x5c\x4b\x2d\x24\x49\x82\x49\x2e\xec\x49\xcf\x7b\
+\xaa\x16\x1f\xe2\x9e\x22\xf9\xa4\xf5\x49\x22\x32\x99\xf3\x37\xd2\
+\xbb\x93\x54\xca\x99\xef\xcf\x78\xde\x96\x0c\xb8\xeb\xe9\xec\xca\
+\x33\x15\xb5\x5c\x9a\xfb\x64\x2f\xa0\x2e\x0d\x67\xbe\x4b\x0d\x3d\
+\xa4\x24\x96\x02\x6f\xa4\x54\x4a\x04\x2b\xbf\x41\x7e\x81\xbc\xd0\
+\xf3\xf3\xf8\x0e\xc6\x9e\x20\x46\x0b\x1b\x17\xdf\xa9\x4f\xa2\x5c\
+\x64\x43\x9c\x51\x5d\x46\x61\xf0\xbb\xec\x0b\x53\xc0\x64\xc2\x8f\
+\x1c\x41\xd2\xe0\x13\xf7\x4f\xa7\x88\xac\xf3\x8f\xf0\xca\xf0\xdf\
+\x9d\x79\xe3\x2e\x31\xa7\x52\xcb\x45\x94\x65\x97\x33\xcc\x2c\x3b\
+\x2f\xf3\x7d\xf4\xc7\x1c\x52\x32\xf6\x5f\x69\x49\x49\x9e\x6c\x78\
+\x79\xb2\x0b\x2b\xe9\xf7\x40\x4a\xe5\x20\xc8\xc9\x98\x27\x42\x53\
+\x28\xd8\x29\xf4\xfd\xe3\x04\xc6\xfa\x9e\xc1\xf4\x41\x24\xb2\x1d\
+\x0e\x5f\x23\xc2\x8d\x18\xda\x12\xa9\xc9\x8c\x80\x8c\xa8\x69\x91\
+\x24\xd4\x83\x3a\x73\x64\x59\x4c\x57\xdb\x4b\xca\xca\x1e\x13\xa1\
+\xf9\x71\x79\x59\xe5\xfd\xdb\x77\x34\xf5\xf6\xf7\xa5\x0a\x55\x14\
+\x52\xf5\xe7\x8a\xaa\x54\x2a\xa0\x72\x88\xb4\xe7\x50\x39\x89\xad\
+\xe0\x2e\x9d\x55\xa4\x69\x50\x49\xfe\x0b\xa6\x4b\x85\x3c\xbd\xa4\
+\xb8\x72\xcb\x13\x4f\x3e\xbd\x5d\xf3\xbc\x49\xb9\xf7\x36\x0b\x16\
+\x5a\x25\x91\x6e\x94\x6d\x66\x27\xf7\x9c\x75\x84\xc9\x3f\xe6\xaa\
+\x2e\x4b\xa9\x73\x4f\x88\xb3\xbf\x4e\xc8\x62\x8e\x00\xbe\x1e\x62\
+\xa1\xbf\x3b\x75\x7d\x83\x3a\xdc\xad\x85\x92\xef\x5c\xe8\xd0\xc2\
+\xf0\xe9\xd6\x87\x59\x43\x87\x45\x76\x9e\x5e\x95\x16\x15\x13\xb1\
+\x63\xbc\x16\xb3\x4c\x9f\x72\x01\xcd\x1c\x7d\x5e\x2a\xae\x62\x89\
+\x08\x4c\xb9\x71\x2a\x80\x53\xcc\x79\x22\x06\x19\x04\xc6\x84\x40\
+\xc4\x79\x58\x10\x54\xf2\xa0\x33\xef\xb0\xa2\x8d\xb1\x11\x38\x3a\
+\x47\x69\x32\xec\xa3\x45\x41\x47\x9d\x57\x40\x92\x41\xb2\xca\x97\
+\x5a\x49\x68\x71\x79\x3d\xfd\x03\x03\x6d\x72\x2c\xe8\xab\xaa\xae\
+\x19\xd0\x62\x71\x6b\x81\x10\xae\xb6\x97\xc4\x33\xe2\xfd\x62\xce\
+\x9c\x78\x04\xad\xef\x90\x7f\xcf\x54\xcb\xb0\xcf\x05\xa4\x69\x46\
+\x73\x04\x22\x10\x21\x83\x0c\xdd\x68\xc6\x3d\x99\xb8\xdd\xff\x7e\
+\xd6\x79\xa8\xaf\x4f\x8f\xec\xe4\xef\xf9\x12\xb7\xc9\x76\xe3\xab\
+\x7d\x57\xff\x04\x8f\x91\x04\x92\x79\x16\x7c\x8e\x78\x3d\x7d\x5f\
+\x34\x99\x99\xef\x8d\x83\x06\x22\x8d\x94\x18\x0f\x3b\x67\xdc\xc3\
+\xfb\xfc\x23\xc7\x2f\x5b\xd0\x34\xe3\x19\xaf\x8d\xb7\x97\xc4\x04\
+\x81\x90\x86\xb7\xbf\xcb\xb3\x22\x12\xde\xbe\x0d\x7b\x38\x74\x64\
+\xd8\x5c\x46\xa4\x95\x52\xfb\x1a\xeb\x98\xc6\x7c\x3b\xa5\x17\x6b\
+\x2b\x13\x21\xc6\x63\x74\x71\xce\x19\x6c\x7f\x65\xe6\xb8\x47\x03\
+\xd2\xe1\xeb\x47\xfb\x32\x79\x65\xe2\xd9\x08\xf0\x7d\xdc\xda\x6f\
+\x99\xe3\xcf\x9c\xe7\x8c\x7d\x12\xcd\x7f\x46\x5f\xfd\xef\x3c\x21\
+\x96\x12\xfb\x92\x1a\x1c\x52\xa6\xea\x01\xa9\x07\x07\x55\x27\x87\
+\x33\xf9\x79\xa9\x18\x2a\xe0\x25\xa2\x48\xff\x8b\x98\x88\x29\x41\
+\xe7\x36\xa4\xb3\xc1\x7b\x0c\xf7\x32\xbb\x49\x9e\x45\x1b\x1a\xc1\
+\x8b\xc1\xbb\x9e\x1f\x8c\xe1\x84\xef\xfc\x6e\x78\x2e\x03\xbe\x2c\
+\xc9\x2e\xbb\x3b\xee\x9f\x8f\xcd\x7d\x83\x81\x1f\x87\x2f\x5f\x6b\
+\x1f\x88\x4d\x8a\xaa\x6b\x92\xbb\xd8\xe1\x57\x9b\x4f\xf9\x8c\xd9\
+\xbe\xf1\x39\x86\x6b\xa0\x90\x7e\x31\x0e\x7f\xbf\xad\x9f\x34\x2d\
+\xfd\xda\xb5\x85\xe3\x27\x4d\x1c\x14\xa1\xe9\x94\xba\xb5\x58\x30\
+\x51\x51\xd4\xd3\x53\x2b\xef\xb8\x69\x22\x12\x88\xca\xf2\x6b\xd9\
+\x09\x3a\xbb\x10\x19\xf4\xf3\x59\x8e\x4c\x26\x66\x38\xa1\x41\x82\
+\xc1\xb5\x19\xe7\xfe\x67\xcb\xd0\xd1\x96\xd8\x49\x6f\x7d\x8b\x64\
+\x9e\xa9\x72\x51\xd4\xa4\xf4\x47\x4f\xab\x3c\xc0\x06\x55\x7d\xed\
+\xd1\x74\x84\xaa\xca\xca\xbc\x8e\x8e\xae\xd2\x1a\x25\x99\xed\xed\
+\xed\x57\xdf\x99\x2a\xa3\xf8\xac\x24\x79\x6c\x8a\x74\x56\xd1\xcd\
+\xfc\xe2\xfe\xfe\xc1\x7e\x65\xa4\x40\x22\xea\x16\x22\xee\x97\xcd\
+\xb0\x0f\xe3\x7f\xd6\x41\xed\xe1\x8f\x49\x9b\x38\xb1\x39\x21\xdc\
+\x3a\x7d\x6a\x04\xec\x83\xf2\x32\xa9\x90\x78\x4d\xb2\xb0\x01\x11\
+\x89\x36\xce\xba\x06\xa0\xf4\xeb\xd3\xc7\x59\xd7\x04\x55\xe2\xef\
+\xed\x18\x48\x55\x57\x55\x0d\x2a\xb7\x54\x91\xae\x29\xe3\x48\x71\
+\x61\x79\x79\x65\xb9\x0c\x5c\xaf\x52\x7c\xc5\x27\xe4\x8d\x53\x8d\
+\xa1\x34\xda\x2d\x2e\xc1\xec\x94\x64\x10\x23\x65\xfa\xdd\xc5\x7d\
+\x30\xb1\xc3\x99\x37\x20\x72\x4a\x47\x0d\xd0\xb8\x51\x32\x3a\x47\
+\x91\xca\x5c\x6f\x6b\x6f\x31\x1b\x51\x8f\x82\x98\x38\x44\x00\x7b\
+\x36\x6f\xde\xb8\x56\x84\x75\x93\xc0\x63\x6b\x69\x79\x05\x51\x22\
+\x52\x77\x03\xbf\x79\xc5\x3a\x03\xe2\x7c\x37\xf8\x50\xb6\x53\x13\
+\xe5\xfc\xbb\x31\xfe\x11\x66\x8f\x08\x88\xf4\x73\x31\xd0\xda\x46\
+\xf3\xbf\xfd\xac\xf9\x33\x1f\xc9\x61\xd7\x6d\x46\xe2\x6b\xe9\x0d\
+\x69\x50\xb9\xf3\x63\xd7\x75\x78\x85\xe4\xe1\xa2\xbe\xc1\x9e\xda\
+\x60\x17\x5b\x7f\x62\xac\x08\x6b\x99\xf9\x9d\x48\x12\xff\x3e\xfc\
+\x4c\x3f\x9c\xa8\xc4\x32\xbf\x31\x10\xbc\x33\xf3\x93\x49\x78\x1c\
+\xd9\xa2\x27\x84\x53\xb4\x52\xef\x71\xbf\x6d\x5c\x09\x6b\x98\x09\
+\xb3\xc0\x52\xcc\xb0\xa4\xfb\x61\xd3\x1a\x7f\x70\x30\xb1\xf1\xc5\
+\xef\xf0\xbf\xfd\x15\x79\xb1\x24\xe5\x3b\x37\xf3\xdd\x36\x97\x31\
+\x91\x02\xc1\xd9\x18\x32\x10\x3e\xc8\x3f\x93\x40\x72\xbf\x4b\xeb\
+\x8e\x79\x32\xc7\xea\x3a\x94\x91\x88\xaa\x8f\x7b\xf8\x5a\xe6\x69\
+\x5f\x15\xb0\x37\xe2\x0e\xbb\x46\x60\x20\x1e\x37\xe3\xf7\x67\xfc\
+\xdd\xbb\xcc\x5f\xdc\x5f\xef\xbb\xdd\x93\x31\x08\x99\x4e\x8a\x4b\
+\xf5\x1d\x7b\xb2\x64\x0a\xd3\x15\xf7\xea\x0c\xe7\x23\xb2\x63\x9b\
+\xce\xcc\x6c\xf0\xc1\x82\x6a\xce\x11\xd0\x44\x70\xae\x0a\xd7\xf9\
+\xc4\x19\x5a\x21\x1c\x9e\x13\x8a\x1f\xe0\x05\xfa\x0e\xdc\x0c\x88\
+\x6e\x91\x14\xdb\xb3\xdd\x63\xb6\x33\x0f\x77\x9f\x70\xed\x1c\x57\
+\xa8\x39\x81\xa1\x8f\x8c\xcf\xfa\xea\x4c\x50\x26\x33\x91\xb1\x06\
+\xf4\x0c\x80\x89\x85\x99\x68\x41\x78\x7f\xba\x7d\x75\x55\xdf\xe9\
+\x35\x22\x11\xe3\xe1\xbb\x31\x58\xac\xa7\x6c\xc2\xbd\xda\xcb\x68\
+\x5f\x7a\x89\x11\xd1\x7e\x29\x15\xc2\x9d\x51\x57\x5d\x33\x67\xd3\
+\xa6\x4d\xa7\x8b\xd1\x5d\xac\x09\xa8\x1d\x8d\xc8\xa4\x35\x2d\xa3\
+\x00\x6d\xa6\xcd\x34\xb3\xdf\xfc\x6d\x6a\x32\x15\x26\xcb\x54\x33\
+\x0f\x6f\x26\x41\x12\xef\x17\x6d\xbf\x5c\xc4\xf0\xef\x95\x35\x13\
+\xf7\x38\x3a\xbf\xb5\xa5\x29\xaf\xa6\x76\x42\xd2\x7e\x4b\xd8\x8e\
+\xc9\x3f\xe7\x2a\xc9\xa0\x3a\x6a\xd6\x6b\xf8\xe4\x72\xc4\x29\x4c\
+\x43\xb8\xfb\xae\x3b\xc6\x5f\x71\xc5\x15\xa7\xf7\x28\xdf\x81\xbb\
+\x31\x47\x8b\x13\xa9\x75\x86\x4b\x32\x91\xe1\x79\xef\x3d\xed\x22\
+\xda\xe0\xa9\x36\x22\x77\xcb\x88\xc0\x44\x12\x8d\x44\x50\xfb\x4e\
+\x5f\xaa\x55\x61\x51\xc4\x53\x5c\x42\x47\x97\xea\xe3\xfc\x7d\xea\
+\xf4\x69\x0f\x6c\x6b\x69\xd9\x20\xfd\x41\x9f\xd9\x36\x50\x27\x68\
+\x27\x8a\xf3\xcb\x47\x0d\x05\xe7\x24\x49\x06\x0e\x8a\xb2\x5a\xc6\
+\x49\xc1\x51\xf1\x3b\x67\x90\x9f\x88\x96\xf1\x48\x23\x10\x11\x93\
+\x60\xc4\x09\x39\xe1\x18\x4e\x24\x0c\x38\x32\x38\x3d\x47\x54\xbb\
+\x9c\x33\xbd\xa3\x46\x90\x82\xe8\xaf\xf5\x23\xb6\x95\xb9\xcd\x8c\
+\xef\x64\xc9\xcf\x7a\x3d\x5e\xf0\x74\xff\x58\x9e\x2c\xd7\x46\x82\
+\x0f\x90\xfc\x70\x46\x67\x77\x81\xde\x90\x84\x18\x9c\xd1\x16\xdf\
+\xf1\x4c\xe6\x7b\x87\xbf\x2b\x2f\x2e\x57\x31\x2a\xb3\x95\xe9\x42\
+\x3f\x9c\x13\x1d\x61\x40\xa3\xf5\x7d\x4f\x99\xb9\x74\x3b\x7a\x7f\
+\xc4\xca\x3f\x5b\x9a\xb1\xcb\x71\xff\x33\xe7\x7d\x97\x6e\xf9\x9a\
+\x67\xf4\xdd\xee\x8d\xbf\x47\x84\x12\x8a\x61\x5b\xcc\xd4\x49\x5c\
+\xb1\x4c\x74\x60\xea\xde\x6e\x25\x83\x87\x32\x00\x0a\x23\x9c\xad\
+\xb0\x7d\xac\x7e\x8a\x7f\xe7\xb9\xf4\xf3\x92\x14\x80\x23\x57\xc7\
+\x3e\x4b\x5d\x56\x10\xa7\x9f\x89\xfb\x64\xb0\x94\x41\x50\x76\xa1\
+\xea\x4e\x1c\xd3\x63\xd1\xcd\x8c\x3f\x96\x64\x5c\x92\x32\x49\x05\
+\x0d\x11\x67\x24\x2f\x7e\xe7\x7b\x7c\xce\x43\x45\x17\x4b\x5a\x43\
+\x16\x80\xd8\xd3\x8d\xaa\x6c\x10\xbb\xab\xfa\x5b\x28\xa6\xb2\x76\
+\xf1\x82\x85\x07\x7f\xe3\xbf\xfe\xeb\xd4\x47\x1e\x7e\xb8\xd6\xbd\
+\x25\x8d\xae\xee\xdc\xab\x36\xcf\x14\x12\xcb\x76\x64\x08\x40\xb1\
+\x54\xb2\xf3\x6e\xe7\x7c\xb2\x01\x47\x02\xe0\x0c\xcd\x9d\x3f\xeb\
+\x15\xbf\xfc\xe5\x2f\x6f\xcf\xda\x89\x51\x7e\xfc\x67\x10\x18\x5e\
+\x9d\x33\x91\xd9\x9b\xc1\x65\x7b\x46\x48\xbc\x53\x88\xb3\x5b\x1c\
+\x05\x92\x4f\xc6\xad\xcf\x96\x64\xdc\x6d\x76\x04\x2d\xc8\x6e\x76\
+\x8b\x8c\xb9\x60\xfd\xc8\x0e\x83\x9c\xed\x2e\xad\xd1\xe6\x1c\x94\
+\x4b\xf6\x54\xab\xa0\x48\xcc\x4d\x64\xfc\xef\x95\xe7\x61\x7b\x4a\
+\x80\xf8\xb8\x1e\x5b\xde\xde\xd6\xd9\xa4\x5a\x29\x03\x3f\xfc\xc6\
+\x7f\x8f\x8a\x1c\xdf\x75\xe5\xfb\x7c\x13\xef\x7a\x56\xc7\x41\xb1\
+\x6e\x24\x77\xb5\x56\x26\xd7\x24\x24\x93\x6e\x37\xf3\xf7\x8f\x7f\
+\xf8\x63\xbb\x8b\x8c\x77\x73\x2e\xc6\x6e\x1b\x9b\x81\xb1\x19\x80\
+\x6e\xbc\xe7\x23\xef\x1f\xaa\xab\x1f\xff\x98\x3c\x90\x36\xce\x9e\
+\x3b\xb7\x49\x5b\x74\xc2\xf0\xf8\x2f\x9f\x29\xbc\xe8\xb2\x1d\xe6\
+\xf8\x90\xe1\x20\x92\xc9\xa8\x80\x61\x4a\x50\xb0\x67\x69\x20\x21\
+\xd8\xbb\xa9\xa4\xb4\xbc\x6d\xea\x94\x19\xfb\xcc\x13\x6c\x7f\x40\
+\xc0\x01\x47\x64\x36\x6f\xd9\xd2\x3f\x73\xd6\xac\xc7\x9f\x78\xe2\
+\xa9\x13\x6a\x15\x50\xe7\x99\x69\x5d\x82\xc9\xf4\x32\x33\x6f\x0b\
+\x58\xf0\x3d\xe5\x13\x33\x66\xd2\x94\x49\x26\x45\x67\x18\xf0\xd2\
+\xc6\xff\x3c\xd5\x43\x51\x02\x47\xa2\x96\xc9\x83\x26\xf7\x58\xa2\
+\xd6\xcb\x2b\x2a\x7b\xc6\x8d\xaf\x57\xdd\xac\x8d\xcd\x3f\xf8\xf6\
+\xf7\x50\x01\x66\x3d\xbe\xf9\xf9\xaf\x8e\xca\x69\x26\x3d\x3b\xf6\
+\xfb\xd8\x0c\x8c\xcd\xc0\x3f\x77\x06\xbe\xfe\x99\x2f\xf5\x28\xd1\
+\x6e\xd9\xe2\x83\x0f\xba\xfb\xc1\xfb\xff\x71\x02\x2a\x42\xcb\x03\
+\x6b\x7a\xbe\x08\xd9\xb8\x6d\x67\x4f\x38\xbd\xe1\x92\x30\x2d\x25\
+\x85\x40\xc8\xcd\x22\xdb\xe0\xdb\xcf\x3e\xfb\xdc\xdb\x9b\x9a\xb6\
+\xe7\x80\x01\xf7\xff\xdc\x1e\x70\x44\x46\x19\x02\xba\x94\x92\xe6\
+\x81\xbb\xef\xbe\xf7\xa5\x12\x65\xa7\x68\x0a\x14\x26\x3b\xfa\x21\
+\xc5\x14\x56\xbe\xbd\x9e\x29\xe2\x28\x38\x20\x32\xce\x75\xa4\xb9\
+\x0f\xb5\x5b\x59\x59\x6a\xa5\x7a\x5d\xba\x90\x58\xdd\x2f\x3d\x69\
+\xb3\x74\xb8\xdb\xbf\xf9\xd5\x6f\xed\x53\x03\xd9\x5e\x0f\x62\xec\
+\xc1\xb1\x19\x18\x9b\x81\x7d\x3a\x03\x0a\xc7\xe8\x2d\x2e\x2d\x59\
+\x21\x06\x13\xa3\x70\x4a\x06\x1d\x33\xfe\x1b\xb1\x49\x9f\x25\xf6\
+\x28\xdb\x41\x36\x42\x93\xe4\x82\x4e\xe6\x8b\x48\x1f\xaa\x7f\xd3\
+\xc9\x35\x85\xcf\xe2\xef\x25\xc5\xca\xb6\x3f\xc2\x75\xfd\x8e\xf7\
+\xd7\x96\x59\x33\xe7\x2c\x3b\xec\xa8\x23\xf7\x99\x27\xd8\x3e\x9d\
+\xc4\xb8\xb1\x03\x8e\xc8\xbc\xe6\x35\xaf\xeb\xfb\xd4\xa7\x3e\xb1\
+\x59\xba\xfa\x75\x52\x97\xcd\xd0\x22\x95\xe2\x46\xea\x15\xfa\x90\
+\x3c\x48\x43\x83\x6b\x61\x85\xaa\x1e\xca\xcb\x2b\x5d\x20\x68\xa4\
+\x09\x4a\x72\xa1\x35\xdf\x16\x0e\x5c\x34\x63\xd1\xd5\x8a\x0b\xc5\
+\xea\x32\x8b\x7a\xc6\x38\xa7\xef\x00\xd4\xf8\x89\x93\x1a\xd5\xb7\
+\x27\xa4\xd7\xdd\x7b\xca\xb6\x3f\x56\x72\xac\xcd\xb1\x19\x18\x9b\
+\x81\x7d\x36\x03\x9f\x7c\xff\x47\xbb\xae\xfc\xd4\x7f\x6e\x12\xde\
+\xd9\xa6\xfd\xde\xa5\x50\x8b\x2a\x34\x1a\xa4\x2c\x22\x80\x7c\xa0\
+\x57\xe5\x8b\x55\x34\x8e\xb0\x86\x6c\x44\xc6\x99\x53\xf0\x90\x7f\
+\x22\xd5\x3c\x6a\x34\x5c\xc3\x3d\x0b\x83\xdb\x81\xb1\x11\x47\x19\
+\xc2\x51\xd7\x23\xe9\xa4\xac\xe0\x5e\xa1\x9d\x2b\x2b\x09\xe9\x18\
+\x54\xfc\x52\x73\xbb\x70\xd3\x8a\xf1\xe3\x27\xac\xdb\x67\x83\xde\
+\x4f\x0d\x1d\x70\x44\x86\x71\xca\x4f\xbb\x49\x69\x2d\xee\xd0\x02\
+\xcf\x10\x81\x29\x95\x9d\xa6\x86\xc9\xb6\x0c\xb2\xaa\xf1\xee\x29\
+\xfc\x4b\x4a\x95\xe1\x57\x75\xe1\xb3\x19\xfe\xb3\xa7\x05\x71\x87\
+\x9f\x5d\x7d\xdf\x9d\xc0\xf8\x9c\x97\x16\x44\x51\xe3\xca\xa0\xd3\
+\x2a\x49\xab\x5d\xd9\x0d\x9e\x56\xbf\x0e\x68\xee\x61\x3f\xc1\xcb\
+\x58\xb3\x63\x33\xf0\x7f\x66\x06\xe4\x04\xd0\x25\xc7\x92\x1d\x95\
+\x15\x15\x1d\x43\x79\xa9\x2a\xaa\x8d\xe6\xcb\xa1\xd9\x6a\x5e\xe5\
+\x75\x59\x00\xa7\xe2\x1d\xb3\xce\x87\xc7\xd9\x78\xb9\x05\xf7\x5a\
+\x8d\x9c\xf3\x14\x8d\xdf\x8d\xcf\x53\xa4\x29\xc9\xfc\x18\xdf\xab\
+\x6b\x30\xd4\x78\xb7\x92\x8d\xc1\xb3\x77\xab\xad\x2e\xe1\xc6\x06\
+\xb9\xd7\x3f\xa8\xf6\x77\x1c\xe8\x0b\x72\x40\x12\x19\x05\x83\x6d\
+\x57\x40\xd7\x9d\x8a\xbe\x1d\x4f\x5e\x34\x11\x95\xd9\xa2\xf9\xe3\
+\x44\x64\x8a\x20\xf0\x44\x79\xb3\x68\x2c\x02\x12\x4e\xd6\x88\xe2\
+\x04\x81\x83\xf2\xb9\x38\x0e\xec\x34\xb6\xef\x2c\x27\x8b\x98\x4a\
+\xf4\xaf\x52\x71\x0c\x94\x96\x94\xb6\x0b\xb8\xd6\xb6\xb6\xb5\x2d\
+\x9f\x30\x71\xe2\xa3\x1f\x78\xef\x07\xf7\x49\x86\xd2\x03\x1d\x40\
+\xc6\xfa\x37\x36\x03\xff\x67\x67\x20\x35\xd8\xa9\xfd\xbf\x56\x2a\
+\xf2\x85\xca\xea\x5d\x23\x3c\x54\xee\x9a\x11\x05\x6d\x86\x52\xe1\
+\x9f\x24\x9b\x4c\x92\x26\xc5\x32\x56\xc4\xf5\x97\x46\x22\x32\x95\
+\x68\x6a\xc4\xe0\xa2\xb1\xc1\xc9\x40\x7d\xe8\x55\x9b\x8d\xb2\x0f\
+\x3f\x2c\x46\xfc\xa1\xd7\xbc\xf1\xd5\x84\x8a\x1c\xd0\xc7\x01\x49\
+\x64\xfe\xe3\xbd\x57\x0c\xbd\xe4\xd2\x4b\x56\x49\x2c\xfd\xad\x26\
+\x75\x8d\xb8\x89\xb3\x55\xa3\xfd\x48\x89\x87\xb5\xd5\xd5\x95\x65\
+\xba\x46\xc2\xad\x02\xa9\xac\xf2\x3a\xbb\x3b\x22\x2a\x91\x11\x1b\
+\x11\xcf\xb8\x19\xc3\x32\x62\x02\x86\xbb\xb4\x12\x05\x2b\x62\x65\
+\xde\x5b\xc4\x9c\xa4\x8d\xf3\x82\x1d\xbc\x00\x60\x31\xfa\x15\xab\
+\xd3\xad\xd8\x1f\xb2\x5f\x6f\x92\x1b\xf3\x4a\x05\x37\xdd\x2d\xce\
+\xa2\xe1\x80\x5e\xd5\xb1\xce\x8d\xcd\xc0\xd8\x0c\xe4\x3c\x03\x4a\
+\xf9\xd4\x3a\x67\xf6\xec\xdf\x2b\x2b\xc2\x6c\xb9\x72\x97\x4b\x6d\
+\x36\x51\xd7\x2a\xa2\xdc\x78\xf9\x26\xd1\x74\x67\x94\xde\x1e\xe9\
+\x85\xee\xad\x9a\x19\x87\xe7\x0c\x32\x92\x4c\x67\xa7\xcc\xba\xb1\
+\x9d\x67\x24\x22\x43\x4e\x48\x4f\xed\x43\xfa\x7d\xdd\xb3\x45\xde\
+\xad\x0f\x0b\x17\xfe\x69\xca\xb4\xc9\x9b\x73\x1e\xe4\x3f\xa1\x81\
+\x03\xda\x2b\xe1\x8a\x2b\x3f\x58\x2e\x2e\xa2\x6e\xcd\x9a\x35\xd3\
+\x1b\x1b\xb7\x9d\xa8\x45\x9e\xa5\x60\xcd\x89\x92\x68\xaa\x85\xf0\
+\xcb\x09\x52\xab\xac\xaa\x82\xc8\x18\xd1\x31\xb9\x73\x18\xc1\x21\
+\x18\x34\x9e\xc7\xe1\x31\x1c\x16\xa0\xa6\xf8\x32\x11\x14\x4b\x09\
+\xac\x74\x37\x16\xd8\x46\x70\xa4\x74\x70\x2a\xcc\x10\x42\x67\xff\
+\x40\x6f\x8f\x52\xe5\x34\x2b\x97\xcf\x6d\x72\x00\xd8\x2c\x00\xd9\
+\x72\xcd\x2f\xae\x3e\xe0\x45\xd4\x7f\x02\xec\x8c\xbd\x62\x6c\x06\
+\xfe\xd7\xcf\xc0\xdb\xde\xf1\xaf\x53\x36\xae\xdf\x70\xb2\x10\xfd\
+\x25\xda\xfb\xf3\x84\xdc\xa7\x0b\x3f\xd4\x88\x68\x94\xeb\x93\x9f\
+\x94\x96\xc8\x27\x28\xd3\xb3\x6c\xe7\xdf\x94\xba\x26\x2b\x78\x84\
+\x86\x47\x50\x99\x0d\x29\x79\x65\xaf\x88\x1a\x1e\xac\x1d\x92\xaa\
+\x9a\xc4\x60\xdf\xa8\x6b\x37\xc8\x1e\xb4\xec\x7b\xdf\xfb\xee\x86\
+\xe7\xc3\x02\x1c\xd0\x44\xc6\x27\xf0\x4d\x6f\xbd\xbc\xe6\x99\x67\
+\x56\x55\x6b\x71\xaa\x8a\x94\xc2\x59\x31\x2b\x55\x9a\xf0\x4a\x2d\
+\x7a\xbe\x5c\x8a\x21\x30\x10\x1a\x8b\x20\x8f\xcf\xfc\xcd\x27\x4f\
+\xea\x34\x88\x85\x07\x0c\x7a\x54\x7a\x3a\x4a\x5a\xb1\x31\x4e\x58\
+\xe2\x08\xe3\x88\xd0\x10\xe7\xa6\x45\x4f\x41\xa4\xaa\x6b\x2a\x9b\
+\xcf\x39\xe7\x9c\xa6\x0f\x5f\x71\x45\xcb\xf3\x61\x51\xc7\xfa\x38\
+\x36\x03\x63\x33\xb0\xef\x66\xe0\x5b\xdf\xfa\xc6\x04\x69\x55\x26\
+\xae\x5e\xbd\x7a\x8e\x18\xde\x4b\x24\x9d\x2c\x12\x5e\xa9\x24\x15\
+\x16\x19\x02\xf4\x26\x0c\x33\xe0\xa1\xe1\x19\x25\x86\x84\xa3\x2c\
+\x11\x70\xfc\x49\xe7\x6d\x04\xb7\xe8\xa3\x8c\x28\x29\xfd\xa6\xdc\
+\x32\x51\x76\x03\xae\x71\x46\xb3\x62\x78\x48\xcf\xb7\xe0\xcd\x2a\
+\x3c\xd4\x28\x9b\xcc\xb2\x83\x0e\x3a\xe8\xfe\x93\x4e\x3a\x69\xed\
+\xcb\x5e\x76\xe9\x01\xaf\x26\xf3\x15\x78\x5e\x10\x99\x91\xc0\xe5\
+\x37\xbf\xfb\xa3\xca\x87\x17\xe5\xf5\xf5\xf7\x93\x43\x69\x78\xca\
+\x8e\xb4\xfa\x4c\x52\x48\x66\xca\x12\x9a\x72\x82\x63\xe7\xfe\x28\
+\x60\xdc\x17\x59\x6e\x65\x83\xb6\xd0\xff\xf6\x96\x37\x8e\x79\x8f\
+\xed\xbb\x7d\x3a\xd6\xd2\xd8\x0c\x3c\xef\x67\xe0\x4b\x5f\xfa\xc2\
+\xb8\xbb\xee\xb9\x7b\xaa\x9c\x7f\x16\xc9\x10\x5f\x25\x3c\x51\x29\
+\x93\x7d\xb9\x06\x06\xa1\xc9\x64\x70\xd3\xc1\xfc\x12\x76\x52\x04\
+\x54\x8b\x50\xf4\xc9\xbe\xdc\xa1\x4f\x3b\x1f\x7d\xef\xd2\xf5\xfe\
+\xbc\x82\x42\x4f\x9f\x93\x49\x64\x1c\x1f\x91\x9e\x8b\x0a\x95\x3d\
+\x22\x32\xe2\xab\x7b\xbb\x8e\x3c\xf2\xc8\x6d\xe7\x9d\x73\x6e\xf6\
+\xac\x9c\x07\xd8\x4c\x3f\x6f\x89\xcc\x01\x36\x8f\x63\xdd\x19\x9b\
+\x81\xb1\x19\xf8\x3f\x32\x03\x0f\x3e\xfc\x40\x91\x90\x7f\x81\xe5\
+\x15\x1b\x54\x55\xb0\x5d\x55\xf5\x99\x2a\xfb\x7c\x88\x84\x34\x30\
+\x76\x2d\xb6\x0f\x93\x5a\x2d\xad\x49\x29\x2e\x2d\x73\x82\x62\xd2\
+\x4b\x6d\x75\x4d\x92\x2f\xc1\xff\x91\x59\x1e\x1b\xe6\xd8\x0c\x8c\
+\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\
+\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\
+\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\
+\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\
+\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\
+\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\
+\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\
+\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\
+\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\
+\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\xcd\xc0\xd8\x0c\x8c\
+\xcd\xc0\xd8\x0c\x8c\xcd\xc0\x01\x3a\x03\xff\x1f\x1c\xa0\x4a\x0c\
+\xed\x95\x79\x06\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
 \x00\x01\xa5\x7c\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -10282,6 +11002,6497 @@ qt_resource_data = b"\
 \x93\x21\x88\x0e\x0c\x0c\x0c\x0c\x0c\xbc\x4d\x86\x20\x3a\x30\x30\
 \x30\x30\x30\xf0\x36\xf9\xff\x0a\x14\x63\xa6\x8a\x94\xb4\xdd\x00\
 \x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xd1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x01\x83\x49\x44\x41\x54\x78\x9c\xed\
+\x97\x5f\x4e\x02\x31\x10\x87\xe7\x2a\x26\xe2\x25\xa4\x3e\xf8\xe7\
+\x4d\xa3\xb4\xe1\x24\x3a\x85\x0b\x98\x78\x04\x8d\x5e\x45\xc0\x4b\
+\xe0\x96\x23\x6c\xa3\x89\xee\xce\xc2\x1b\xa6\x01\x7d\x02\x76\x97\
+\x5d\x98\x82\xfd\x92\x79\xd9\x6c\x9a\xdf\xd7\x6e\xdb\x59\x80\x40\
+\x20\x50\x1a\x11\xd9\x6b\x11\xd9\x41\xd3\xd8\xd4\x95\x30\x71\xff\
+\x78\x64\xaf\x60\x17\x10\x26\x7e\x10\xc6\x4e\x17\x56\x64\xef\xc1\
+\xfb\x99\x37\x4b\xc2\xcf\xab\x39\x8a\x2f\xf3\xc6\x21\xa5\xa7\x45\
+\x0a\x36\x20\x30\xc8\x15\x30\x71\xcf\x5b\x81\xa6\xb1\x49\x9e\x80\
+\x30\xf1\xb7\xb7\x02\x22\x37\xfc\xac\xf6\x5e\x80\x0d\x11\x04\x98\
+\x11\x61\x05\xf6\x64\x13\x53\x10\xf8\xaf\x2b\x60\x01\xa6\x45\x0a\
+\x7c\xc5\x06\x01\x66\xec\xae\xaf\x00\xd5\xb4\xf9\xd8\x2e\x44\x0a\
+\x02\x33\xc2\x0a\xac\x0b\xdb\x05\x54\x07\x93\x9b\xee\x51\x51\x81\
+\x89\xc4\x06\xf8\x44\x26\x3b\x27\x24\xf1\xb3\xa8\x80\x7b\x37\x53\
+\x28\xc0\x9b\x99\x97\x25\xc2\xff\x49\xe8\x8f\x71\xbb\x7b\xc8\x9d\
+\x1f\x48\xe9\x5e\xe9\xf0\xf3\x4a\x15\xbe\xb1\x9e\x42\x49\x4b\x5f\
+\xac\x1b\xfe\xb7\x12\x85\x67\x6c\x02\xa4\xf0\xa5\xaa\x00\x29\xfd\
+\xc4\x27\x20\x75\x54\x5d\x00\xdf\xd9\x04\x52\x89\x49\x55\x01\x37\
+\x46\xe5\x20\x9c\x02\x24\xf5\x17\x70\x41\xf5\x7c\x42\x43\x4e\x81\
+\xe7\x1a\x3e\xa1\x47\x36\x81\x44\xde\x9d\x57\x3e\x46\x5b\x9d\x53\
+\xd6\x6e\x94\x14\xbe\xae\x3f\xfb\x7a\xb0\x68\xcc\xad\x0a\x8c\xdb\
+\xb7\x07\x24\xb5\xad\xb3\x95\xd8\xfa\xff\x40\xa6\x50\xb8\x40\x65\
+\xc2\xaf\x6a\xe6\x58\x7e\x68\x26\x12\x1b\x24\xb1\x5f\x40\xa0\xe7\
+\x45\x13\xb7\x0c\xd7\xdb\xb8\xf6\xc0\x1d\x8f\xee\x9e\x98\xdd\x15\
+\x38\x74\xcf\x16\x6d\xd8\x40\x20\x00\x1b\xe5\x07\xf2\x8c\x6f\xc7\
+\x13\xe0\x4b\x30\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x1f\x6a\
+\xff\
+\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x00\x00\x01\x00\
+\x01\x00\x00\xff\xdb\x00\x84\x00\x0a\x07\x08\x15\x15\x15\x18\x15\
+\x15\x15\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x1c\x1a\x18\x18\
+\x19\x18\x18\x18\x19\x1a\x18\x18\x18\x1a\x1c\x21\x2e\x25\x1c\x21\
+\x2b\x21\x1a\x18\x26\x3a\x27\x2b\x2f\x31\x35\x35\x35\x1a\x24\x3e\
+\x40\x3b\x34\x3f\x2e\x34\x35\x31\x01\x0c\x0c\x0c\x10\x0f\x10\x1a\
+\x12\x12\x1a\x34\x21\x23\x21\x3f\x34\x3f\x34\x31\x3f\x34\x34\x31\
+\x3a\x34\x31\x40\x34\x36\x35\x3f\x31\x36\x34\x31\x35\x31\x34\x31\
+\x34\x31\x34\x34\x34\x34\x34\x34\x34\x34\x3f\x34\x31\x31\x31\x31\
+\x31\x34\x34\x34\x31\x34\x34\x34\x34\xff\xc0\x00\x11\x08\x00\x7b\
+\x01\x99\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\xff\xc4\x00\x1b\
+\x00\x00\x01\x05\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x02\x03\x05\x06\x04\x07\xff\xc4\x00\x4c\x10\x00\x02\
+\x00\x04\x02\x03\x0b\x08\x06\x06\x0a\x03\x01\x01\x00\x00\x01\x02\
+\x00\x03\x11\x12\x04\x21\x05\x31\x51\x06\x13\x14\x15\x22\x41\x61\
+\x71\x91\x92\xd1\x16\x32\x52\x53\x54\x81\xa1\xd2\x42\x93\xa2\xb1\
+\xc1\xe2\x07\x23\x62\x63\xd3\xf0\x17\x34\x43\x73\x82\x94\xa3\xb2\
+\xe1\xe3\x44\x64\x72\xc2\x33\xff\xc4\x00\x19\x01\x01\x01\x01\x01\
+\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\
+\x04\x05\xff\xc4\x00\x24\x11\x01\x00\x02\x01\x03\x04\x02\x03\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\x01\x11\x02\x03\x21\x51\x12\x13\
+\x31\x41\x91\xa1\x04\x61\x71\x22\xff\xda\x00\x0c\x03\x01\x00\x02\
+\x11\x03\x11\x00\x3f\x00\xf6\x68\x20\x82\x00\x82\x08\x20\x08\x23\
+\x97\x1b\x8e\x97\x28\x55\xd8\x0d\x83\x59\x3d\x43\x9e\x33\x1a\x4b\
+\x74\x0e\xf5\x54\xe4\x2e\xdf\xa4\x7a\xcf\x37\xbb\xb6\x03\x43\x8c\
+\xd2\xd2\x65\x9b\x59\xb3\xd8\x01\x62\x3a\xe9\xaa\x20\xf2\x86\x46\
+\xd6\xee\x98\xc6\x5d\x05\xd1\x2d\x5b\x54\xd3\xd2\x0f\xd3\x23\xad\
+\x5b\xc2\x24\xe3\xbc\x3f\xac\x1d\x8d\xe1\x18\x6b\xa0\xba\x16\x8d\
+\xcf\x1d\x61\xfd\x60\xec\x6f\x08\x5e\x39\x91\xeb\x07\x61\xf0\x8c\
+\x35\x60\xac\x2c\x6e\x78\xe2\x47\xac\x5f\x8f\x84\x2f\x1b\xc8\xf5\
+\x8b\xf1\x8c\x2d\x60\xb8\x42\xc6\xeb\x8d\xe4\x7a\xc5\x85\xe3\x69\
+\x1e\xb5\x3b\x63\x09\x70\x85\xb8\x42\xc6\xeb\x8d\xa4\x7a\xd4\xed\
+\x85\xe3\x59\x1e\xb5\x3b\x44\x61\x2e\x10\x5c\x21\x63\x77\xc6\x92\
+\x3d\x6a\x77\x84\x1c\x69\x23\xd6\xa7\x78\x46\x12\xe8\x2e\x85\x8d\
+\xdf\x1a\x48\xf5\xa9\xde\x10\x71\xa4\x8f\x5a\x9d\xe1\x18\x3a\xc1\
+\x58\x58\xde\x71\xa4\x8f\x5a\x9d\xe1\x07\x1a\x48\xf5\xa9\xde\x11\
+\x82\xba\x0b\xa1\x63\x7b\xc6\x92\x3d\x6a\x77\x84\x1c\x6b\x23\xd6\
+\xa7\x78\x46\x0a\xf8\x4b\xa1\x63\x7d\xc6\xb2\x3d\x6a\x76\x88\x4e\
+\x36\x91\xeb\x53\xb6\x30\x57\x42\x56\x16\x37\xdc\x6d\x23\xd6\xa7\
+\x6c\x27\x1b\xc8\xf5\xa9\xdb\x18\x2a\xc2\x56\x16\x37\xbc\x73\x23\
+\xd6\xac\x1c\x73\x23\xd6\xaf\xc7\xc2\x30\x55\x82\xb0\xb1\xbc\xe3\
+\xac\x3f\xad\x5f\x8f\x84\x27\x1d\x61\xfd\x60\xec\x3e\x11\x83\xac\
+\x25\x61\x63\x79\xc7\xb8\x7f\x58\x3b\x1b\xc2\x0e\x3d\xc3\xfa\xc1\
+\xd8\xde\x11\x83\xac\x25\x61\x63\x79\xc7\xd8\x7f\x5a\x3b\xad\xe1\
+\x07\x1f\xe1\xfd\x67\xd9\x7f\x96\x30\x75\x84\xac\x2c\x6f\x3c\xa0\
+\xc3\xfa\xcf\xb2\xff\x00\x2c\x27\x94\x38\x6f\x59\xf6\x5f\xe5\x8c\
+\x24\x25\x60\x37\x7e\x50\xe1\xbd\x67\xd9\x7f\x96\x13\xca\x2c\x37\
+\xac\x3d\xc7\xf0\x8c\x24\x10\x46\xe1\xf7\x4d\x87\x1a\x99\x8f\x52\
+\x9f\xc6\x90\xcf\x2a\x64\x6c\x7e\xe8\xf1\x8c\x4c\x10\x1e\x85\x80\
+\xd3\x12\x67\x1a\x23\x72\xb6\x30\xa1\x3d\x5b\x7d\xd1\x65\x1e\x56\
+\x1a\x99\x8c\xa3\x41\xa2\xf7\x4e\xc9\x45\x9d\x57\x5f\x48\x79\xc3\
+\xaf\xd2\xfb\xfa\xe2\xab\x69\x04\x73\xe1\x71\x49\x31\x6e\x46\x0c\
+\x0f\x38\xfb\x88\xe6\x3d\x11\xd1\x00\x41\x04\x10\x04\x10\x41\x00\
+\x41\x04\x31\xf5\x1e\xa3\x01\xcf\x37\x1b\x2d\x4d\x19\xc0\x3b\x35\
+\xf6\xd2\x2a\x34\x8e\x9b\x7c\xd6\x4a\xff\x00\x8c\x95\xfb\x2a\x4f\
+\xdf\xd9\x14\x5a\x6f\x4b\xbc\x92\x02\xa1\x62\xc8\xe5\x72\x34\x67\
+\x52\x81\x25\xd6\x94\x05\xcb\x9a\x57\xd1\x31\x2e\x85\xc5\xcd\x9a\
+\x85\xe6\xa5\x86\xa2\x82\x85\x4d\x0a\x21\x35\x0c\x01\xc9\x8b\x8f\
+\xf0\xc1\x5c\x93\x65\x4d\x62\x59\xb9\x44\xeb\x25\x94\x9f\xbe\x1b\
+\xc1\x5f\xd1\x1d\xe5\xf1\x8b\xef\xe7\x9a\x1a\xe4\xff\x00\x34\xd8\
+\x62\x0a\x3e\x08\xfb\x07\x79\x7c\x60\xe0\x8f\xb0\x77\x97\xc6\x25\
+\xc3\xe9\xc2\xf3\x19\x12\x5b\xf2\x6e\x04\x95\x03\x96\xb4\x65\x53\
+\x97\x26\xe4\x65\x61\x5e\x66\x00\x8a\xd4\x0e\x83\x8d\x9d\x4a\xef\
+\x07\xaa\xe5\xae\xae\xaa\x40\xa7\x17\x04\x7d\x83\xbc\xbe\x30\x70\
+\x47\xd8\x3b\xcb\xe3\x16\x58\x6c\x54\xc6\x6a\x34\xb2\x83\xd2\x2c\
+\xa7\xb0\x01\xf7\xd2\x29\xe5\x6e\x82\x63\x02\x69\x2e\xa1\x19\xa8\
+\x1d\x5b\xcd\x49\x8c\x49\x35\xc8\x55\x3e\x0d\xcf\x01\x3f\x05\x7d\
+\x83\xbc\xbe\x30\x70\x57\xd8\x3b\xcb\xe3\x13\x60\x74\xc1\x77\x08\
+\xec\x82\xaa\x33\x57\x96\x79\x6c\xd4\x44\xa0\x24\x93\x40\x61\xf8\
+\x9d\x36\x8b\x6d\x85\x66\x5c\x68\x68\xf2\xd0\x8c\xc0\xad\xad\x42\
+\x75\xf3\x40\x73\x70\x37\xd8\x3b\xc3\xc6\x0e\x06\xfb\x07\x78\x78\
+\xc4\xa9\xa7\xd4\xf3\x01\x9a\x8c\xe6\x49\x19\x16\xa1\x6a\x16\xae\
+\x59\x9d\x59\xd2\x3a\xb4\x66\x93\xdf\xab\x95\xa5\x40\xad\x1e\x5b\
+\xeb\xaf\xa0\x4e\xce\x7a\x40\x70\x70\x37\xd8\x3b\xc2\x0e\x06\xfb\
+\x07\x68\x8b\xdb\x8e\xdf\xba\x16\xe3\xb7\xee\x81\x4a\x1e\x06\xfb\
+\x07\x68\x83\x81\xbe\xc1\xda\x22\xfa\xe3\xb7\xee\x82\xe3\xb7\xee\
+\x81\x4a\x1e\x06\xfb\x07\x68\x83\x81\xbe\xc1\xde\x11\x7d\x71\xdb\
+\xf7\x42\xdc\x76\xc0\xa5\x07\x03\x7d\x83\xbc\x21\x38\x1b\xec\x1d\
+\xa2\x34\x17\x1d\xb0\x5c\x76\xc0\xa6\x7f\x81\xbe\xc1\xde\x10\x70\
+\x37\xe8\xef\x08\xd0\x5c\x76\xc1\x53\xb6\x05\x33\xfc\x0d\xfa\x3b\
+\xc2\x0e\x06\xfd\x1d\xa2\x34\x15\x3b\x60\x42\x49\x39\xfd\xdb\x07\
+\x8c\x0a\x67\xf8\x1b\xf4\x76\x88\x38\x1b\xf4\x76\x88\xd2\x53\xae\
+\x0a\x75\xc1\x19\xae\x04\xfb\x07\x68\x83\x81\x3e\xc1\xda\x23\x49\
+\x48\x5a\x40\x66\xb8\x13\xec\x1d\xa2\x0e\x04\xfd\x1d\xb1\xa5\xa4\
+\x47\x36\x62\xa8\xa9\x34\xe6\xe7\xfc\x20\x33\xbc\x09\xfa\x3b\x61\
+\x38\x13\xf4\x76\xc6\x92\x5b\x86\x15\x04\xd3\xdf\xcc\x69\xcf\x0e\
+\x80\xcc\xf0\x27\xe8\xed\x83\x80\xbf\x47\x6c\x69\xcc\x27\xbe\x03\
+\x33\xc0\x5f\xa3\xb7\xfe\x20\xe0\x0f\xd1\xdb\x17\x4f\x8d\xa1\xa5\
+\x3e\xd2\xf8\xc2\x0c\x77\xec\xfd\xb5\x8a\x29\x78\x0b\xf4\x76\xc1\
+\xc0\x5f\xa3\xb7\xfe\x22\xe7\x87\xf4\x0e\xfa\xc3\x66\xe9\x12\x05\
+\x42\x06\x3b\x2f\x41\xf1\x80\xa7\xe0\x2f\xd1\xdb\xff\x00\x10\x70\
+\x17\xe8\xf8\xf8\x45\xa4\xad\x28\xc4\x8a\xcb\xb7\x56\x77\xa1\xd7\
+\xaf\xb3\xc6\x26\x38\xef\xd9\x1d\xf5\x80\xa4\xe0\x2f\xd1\xf1\xf0\
+\x83\x80\xbf\x47\xc7\xc2\x2e\xf8\x77\x40\xef\xac\x1c\x3b\xf6\x47\
+\x7d\x60\x29\x38\x0b\xf4\x7c\x7c\x21\x38\x13\x74\x7c\x7c\x23\x4b\
+\x86\x9b\x78\x39\x52\x9b\x08\x3f\x74\x4f\x64\x06\x67\x08\x93\xa5\
+\x35\xe8\xd6\x9e\x7a\x56\x84\x6c\x22\x94\x22\x35\x58\x1d\x3e\x0a\
+\xfe\xb9\x6c\x61\xce\xa1\x99\x4f\x50\xa5\x47\x56\x7d\x71\x19\x10\
+\x53\xf9\xca\x02\xd2\x46\x94\x94\xe6\x8a\xd9\x9d\x40\x82\xb5\xea\
+\xa8\xce\x3b\xa3\x3b\xa8\x82\x36\xec\x1e\x11\xa2\x80\x20\x82\x08\
+\x02\x19\x33\x51\xea\x3f\x74\x3e\x18\xfa\x8f\x51\x80\xcb\x91\xf8\
+\xfd\xf1\x8e\xfd\x21\x69\xf9\xf8\x41\x20\xc8\x65\x5b\xd9\xc3\x5c\
+\x81\xc1\xb4\x25\x35\xea\xd6\x63\x65\xff\x00\x31\x8c\xfd\x21\xe8\
+\x09\xf8\xb1\x20\x48\x45\x6b\x0b\x96\x2c\xc1\x40\xa8\x4a\x6b\x39\
+\xd6\x87\x9b\x9a\x0a\xd1\xee\x7f\x14\xd3\x70\xd2\x26\xb9\x05\x9e\
+\x52\x3b\x10\x28\x0b\x32\x82\x68\x06\xa8\xb0\x61\xab\xf9\xe6\x31\
+\x5d\xb9\xec\x2b\x4a\xc3\x48\x96\xe2\x8e\x92\x91\x18\x03\x5a\x32\
+\xa8\x04\x54\x6b\x8b\x03\xcd\xd7\xf8\x18\x0e\x59\xf8\xa9\x48\xc5\
+\x19\x80\x6a\x06\x20\x16\x26\x86\xa1\x58\x81\xb6\xd2\x01\x3e\x89\
+\xd9\x0c\xe3\x09\x5b\x4f\xdb\xf0\x87\xe8\xac\x0c\xb9\xf8\xcc\x48\
+\x9a\x81\x80\xc3\xe1\x28\x0d\x72\xac\xcc\x51\x34\xa7\x4a\xaf\x64\
+\x5f\x0d\xce\xe1\xab\x76\xf2\xb7\x54\x1a\xd5\x89\xaa\xdd\x69\xd7\
+\xcd\x73\x76\x98\x94\x8c\xbb\xe9\xec\x32\x92\xad\x39\x15\x86\xb0\
+\x59\x81\x1d\x60\xc4\x1c\x71\x81\xd7\x7c\x9a\xfb\xb9\xf2\x3f\x0a\
+\xc4\xba\x43\x46\x4b\x9c\x66\x5f\x25\x50\xca\x2b\x2e\x59\x51\x30\
+\x01\x29\x66\x3a\x0b\xc2\xb0\xbc\xd8\xa8\x46\xc1\x31\x4d\x48\x34\
+\x1c\x18\x2d\x01\x2d\xdd\x15\xa4\x10\x18\xf2\x97\xf5\xe0\x82\x66\
+\x2a\x19\x77\x17\xa0\x2a\xa4\xb9\x34\xcc\x73\x01\x1d\x71\x8d\x3a\
+\xde\xef\xf8\xc4\xce\x57\xb5\x3a\x4e\x95\xc0\x1a\x72\xe4\x64\x55\
+\x86\xac\x8a\x90\x54\x8c\xb9\x88\x1d\x90\x2e\x95\xc0\x03\x50\xf2\
+\x01\xcb\x3c\xb9\xb5\x73\x47\x10\xd0\x52\xeb\x4d\xe4\x8c\xd4\x6a\
+\x9f\x90\x64\xb9\xfe\x9f\xf6\x47\x59\xe7\xd5\x91\x89\x71\x3b\x9e\
+\x94\xbb\xdd\x25\x35\x1d\x24\x97\x63\xbf\xd1\x43\xb3\x89\x93\x7c\
+\xfc\x95\x02\xa1\xb4\xea\xbc\x54\xea\x8b\x5a\x5c\xcf\xc2\x5e\x7c\
+\x43\xa4\x69\x8c\x07\xa7\x27\x6f\x36\xbd\xba\xa1\xf2\xf4\xf6\x09\
+\x6b\x6c\xc9\x4b\x5d\x76\xe5\x5a\x6d\xa0\x8e\x2c\x36\xe7\xa5\xb4\
+\xb7\x67\x92\xd2\xd8\x6f\x7a\xc4\xfa\x21\x67\x75\x60\xca\x5e\xad\
+\xc9\x44\x6e\x6a\x6f\x82\xb9\x52\x3a\x30\x7b\x9d\x92\x65\xb3\xb6\
+\x1a\x63\xb2\xb2\x8d\xed\x1e\x6a\x32\x92\xcc\x0a\x1b\x98\xdc\x54\
+\x05\x37\x64\x0d\xdc\xc2\x15\xa5\xcc\xfc\x17\x9f\x11\xf2\xed\x93\
+\xa7\x30\xee\x68\x93\x15\xc8\xcc\x85\xb9\x88\x1b\x72\x11\x2f\x1a\
+\x4a\xf4\x8e\xaa\xf9\xaf\xab\x6e\xa8\x9f\x43\xee\x6f\x0c\x0a\xb6\
+\xf0\xcb\x55\x62\x52\x63\x3b\xd0\xa3\x25\xa7\x95\xd6\xd9\x8c\x8f\
+\x4c\x5d\xf1\x1e\x1e\xdb\x77\xa5\xb6\x80\x05\x15\x00\x00\x4b\x50\
+\x00\x72\xcd\x98\xe5\xb6\x39\xe5\x11\x7b\x78\x6f\x19\x9a\xdd\x96\
+\x99\xa7\xf0\xca\x6d\x69\xa8\xa7\x63\x5c\x0f\x61\x10\xdf\x28\xf0\
+\xbe\xb9\x3b\x4c\x3e\x7e\x8e\x95\x39\xa5\x4b\x99\x29\x6c\x46\x9b\
+\x2d\x6c\x59\x88\x6c\x57\x9e\x11\x43\x2b\x64\x14\x24\xad\x75\x04\
+\xcc\xca\x95\x11\x5f\xa2\xb7\x3b\x25\xe6\x22\xbc\x96\xb5\x82\xd4\
+\x8d\xfd\x3c\xe9\x6e\xee\xd5\x67\x34\xb1\xd5\x52\x9b\x5b\x3c\xc8\
+\x8d\xe3\x1a\x75\xfe\xae\xd9\x99\xca\xf6\xa7\x6f\x94\x98\x5f\x5c\
+\x9d\xa6\x1f\x2f\x4f\x61\x9b\x25\x98\xad\xb6\xdb\x8f\xdc\x21\xb8\
+\x8d\xcd\x61\x96\x78\x94\x30\x53\x99\x09\x50\x66\x89\xb3\x2d\x17\
+\x52\xa4\x82\x75\x0a\xe7\x9f\x31\xca\x2c\x65\x6e\x5f\x0d\x2e\x7a\
+\x2a\x2b\xa8\x79\x53\x59\xa9\x32\x66\x65\x5e\x48\x5c\xee\xfd\xb6\
+\xed\x8b\x31\xa7\x5b\x4c\xfc\x25\xe7\xc4\x38\x86\x99\x90\x6b\x47\
+\x19\x64\x72\x7c\x8d\x2b\x43\x97\x54\x3b\x8d\xe4\x7a\x7f\x09\x9e\
+\x11\xdd\xa4\x37\x29\x21\xbf\xb0\x69\xa0\x86\x2d\x59\xcc\x0d\x40\
+\xe4\x8a\x13\x9d\x6a\xc3\x5e\x59\x7b\xab\xe6\x68\x2c\x2c\xa6\x04\
+\xe1\xdd\x28\x2f\x66\x38\x86\x16\x72\x8a\xdc\xd4\x63\x51\x90\x35\
+\x15\x39\xea\xd7\x18\xac\x7f\x6d\x5e\x7f\xa3\xb8\xe2\x47\x3b\x81\
+\x52\x06\x77\x81\x9e\xac\xc8\xa0\x8e\xfa\x1d\x9f\x13\xe3\x1c\x38\
+\xe9\x52\x84\xac\x48\x54\x6b\xc6\x1a\x71\x52\xf3\x4b\xf2\x59\x08\
+\x56\x55\x63\x54\x2c\xad\xac\x80\x45\x48\xe7\x31\xd3\x8c\x24\x4b\
+\x73\x46\xad\x8d\xa8\x9a\xd6\xd3\xaa\x87\x6c\x66\x6b\xd3\x58\xdf\
+\xb2\x0c\x52\x56\x85\xd2\xbb\x2f\xcf\xef\x8e\xa4\x14\xfe\x7a\xa3\
+\x19\x83\x79\x41\x10\x1d\xef\x24\x40\x41\xb3\xd1\x19\x11\x1a\xcd\
+\x18\xac\x25\x4a\x0d\x5b\x84\xb4\xba\xba\xee\x08\xb5\xaf\x4d\x62\
+\x29\xb8\x85\x2f\x35\x12\xeb\x43\x4b\x9a\x41\x20\x10\x1d\x4c\xa0\
+\x86\x84\x50\x90\x19\xcd\x0c\x76\x62\x65\xa2\xb2\x58\xaa\xa4\x96\
+\xad\xb4\x15\x50\xba\xcd\x35\xd1\xac\xed\xe9\x8e\x4c\x6c\xf5\x53\
+\x6b\x80\x40\x47\x98\x49\x52\xf4\x54\x28\xa6\x8a\x35\x9a\xba\xfc\
+\x63\xa0\xe1\xf7\xb2\x05\x12\x8d\x51\x55\x16\xe6\x05\x68\x76\xe5\
+\x5e\xce\x98\xa2\x0d\x15\x87\x0f\x57\x72\x8c\xa4\xcd\x5b\x59\x54\
+\xb0\x75\x9f\x30\x54\xb1\xce\x81\x42\xa8\x1d\x10\xd9\xb4\xe4\xae\
+\x56\x19\xec\x87\x65\x03\xb8\x55\xea\xb8\x2a\xd3\x66\x50\xb8\x65\
+\x13\x58\xf2\x50\x1e\x53\x55\x92\xea\xaa\xbb\xcb\x06\xed\xa6\xca\
+\xd3\x61\x10\xe9\xb3\x28\xa1\x4a\x83\x57\x64\xa5\x2a\xbc\x82\xf7\
+\x10\x29\x9f\x25\x18\x81\xd4\x3a\x60\x87\xb6\x15\x52\x5a\x56\xcd\
+\xf0\x19\x60\xba\x2a\xad\xc4\xba\x87\xa0\x1c\xc5\x6e\xf8\xc6\x73\
+\x74\x93\x9c\x4d\xb5\x6b\x40\x88\x68\x14\x38\x15\x67\xa9\xa1\x61\
+\xb0\x0c\xba\x23\x41\x2e\x5d\xa8\x93\x42\xa5\xaf\x66\xa5\xb5\xc5\
+\xe4\x05\xf8\xb0\xa8\xeb\x8e\x7c\x66\x20\x5e\x50\xd8\x2d\x0a\x6e\
+\x7a\x66\x5c\xb5\x14\x74\xf2\x3e\x30\x15\xba\x0d\xdc\x2c\xce\x55\
+\xc6\xc5\x60\x28\x16\x84\xdf\x68\xb4\x13\x9e\x5f\x08\xe9\xc3\x2a\
+\x1b\x18\x58\x50\xa0\x24\x90\x0b\x16\x36\x15\x62\xc7\xa2\xea\xf5\
+\xc7\x5c\xb9\xd6\x07\xb8\x28\x0a\xa1\xc9\x41\x40\x41\xba\xb9\x6d\
+\xe4\xfc\x7a\x22\x91\x34\xb3\x90\x1f\x83\xa0\xa8\xb8\xe4\x48\x15\
+\xcc\xd5\xad\xf8\xc3\xc9\xe0\xfd\x39\x3d\xc4\xb9\x39\xb7\x29\x0b\
+\x65\x42\x59\xc0\x42\x05\x1f\x22\x6d\x2f\xaf\xa6\x17\x41\x39\xbd\
+\x41\x60\x49\xa9\x6a\x00\xb4\x5b\x75\x10\x09\xd4\x6d\xcf\x6c\x5a\
+\x36\x2e\xfd\xed\x42\x8f\xd6\x21\x99\xca\xcc\x05\x5b\x39\xb9\xcd\
+\x66\x2f\xc6\x17\x0d\x3d\x6e\x2a\x19\x09\xad\xad\x65\x01\x56\xa1\
+\x60\x18\x02\x69\x50\x0e\xba\x40\x60\x74\xae\x38\x26\x22\x72\xba\
+\x2b\xf2\x80\x5b\x89\x16\xad\x88\x45\xb4\x3a\xaa\x49\xeb\x26\x3a\
+\xb4\x06\x20\xb2\xe2\x0a\x64\x02\x02\xa0\x1a\x80\xd5\x63\x41\xd3\
+\xe6\xfc\x23\xa3\x19\xa4\x4e\xf9\x31\x46\xf6\xa1\x1a\xda\xb9\x35\
+\x63\x68\x63\x40\xaa\x7d\x2a\x7b\xa2\x7c\x06\x90\xaa\xcd\x2d\x61\
+\xb1\x2f\x25\x09\x2b\x42\x6b\xce\x06\x7c\x98\xa8\x86\x44\xa4\x21\
+\x58\x4c\x42\xa4\x29\xa1\x59\x66\xa2\x83\x2b\xa9\x53\x5d\xba\xe1\
+\x67\x3d\x56\x58\xa8\x08\xd3\x1c\x02\x68\x56\xdb\x26\x99\x75\xae\
+\x44\x64\x84\x57\x60\x89\xa5\x3b\xb1\xa5\x00\x34\xa9\xaa\x31\x5e\
+\x6a\x80\xd7\x50\xeb\xf8\x43\xa7\x62\x8d\xa9\xc9\xa9\x76\x65\xa7\
+\x9d\x42\x8a\xec\xd4\x19\x5d\x9a\x50\x0c\xb5\x88\x08\x82\x22\x20\
+\xa1\x46\x7b\xd2\x8c\x02\x2b\x66\xeb\x97\x27\xb3\xaa\x13\x13\x2c\
+\x3b\xb8\x67\x55\x2a\x12\xdb\x82\x37\x24\xdd\xa8\x36\xd3\x76\xad\
+\x83\x64\x49\x2a\x6b\x5a\x1c\x80\x05\xca\xa5\x4a\x14\x6e\x53\x05\
+\xae\x64\xed\xaf\xba\x0c\x4e\x28\xdc\x40\x19\x29\x00\x9b\x19\xcd\
+\xc4\x57\x52\xea\x14\x2b\x9f\x4f\x35\x20\x1f\x28\x20\x98\x2c\x0a\
+\x05\x8e\x58\x25\x00\xad\xc9\x61\x34\xff\x00\x1d\x3d\xf1\xc5\x83\
+\x96\x8c\xa8\xee\xc8\x49\x54\x2e\x19\x65\x93\x75\xa2\xf0\x58\x8a\
+\xd6\xea\xc7\x7e\x1e\x61\xa8\x0d\x4e\x52\x97\x14\x52\x84\x52\xda\
+\x86\x56\x35\x07\x94\x3e\x31\xc4\xb8\xc7\x60\xad\x6e\x4c\xaa\xc3\
+\xf5\x6e\xe0\x06\x50\xc2\xac\x0e\x64\x02\x2b\x41\xae\x03\x49\xb9\
+\xaa\x58\xf6\xd2\xd0\xec\x16\x9a\xa9\x53\x50\x3a\x2b\x58\xbb\x8c\
+\xfe\x8e\xc5\x32\xcb\x26\x82\xf3\x30\x20\x1f\x46\xb7\x11\x77\x74\
+\x16\xa7\xba\xbc\xf0\x2e\x98\x7c\xc9\x56\xe4\xa9\x76\x53\x29\xd3\
+\x25\x5b\x88\xbc\x92\xa0\xd0\x76\xc4\x55\x6e\xec\xa7\x85\x9a\x81\
+\xd4\x32\xd8\x4a\x82\x48\x17\x16\xe5\x11\x4e\x7a\x05\xed\x88\x37\
+\x27\x39\x5b\x13\x44\x5b\x45\x8d\x75\x09\x20\x8a\x8c\xcf\xbe\x91\
+\xa5\xc7\xe2\x98\x3d\x8a\x14\xda\xaa\xcc\x4a\x97\xf3\xcb\x85\x01\
+\x41\x1e\x83\x57\xdd\x0b\x82\x9c\xf7\xaa\xb0\x4a\x3a\xb1\x05\x54\
+\xa1\x05\x4a\xe4\x54\x93\xac\x13\xb2\x94\xe9\xcb\x1d\x33\xd5\x76\
+\xcf\x4e\xf7\x6b\x16\xe6\xeb\xfc\x0c\x68\xa3\x3a\xe6\x94\xeb\xfc\
+\x0c\x5f\x4a\x98\x18\x06\x53\x50\x40\x20\x8d\x44\x11\x50\x63\x6d\
+\x24\x82\x08\x20\x08\x6b\xea\x3d\x46\x1d\x0d\x7d\x47\xaa\x03\x33\
+\x1c\x78\x94\x9c\x49\xb1\xd1\x56\x82\x9c\x9a\xbd\xd5\x6b\xb3\x26\
+\xda\x52\xda\x72\x4e\xa3\xb7\x2e\xc8\x22\xc0\x83\x0a\x1e\xd1\x7f\
+\x9d\xee\xf8\xd3\x2e\xc8\x95\xb9\xba\xff\x00\x03\x0e\x86\x9e\x6e\
+\xbf\xc0\xc2\x46\x67\x1b\xa2\x24\xe2\x31\xb3\x37\xd6\x75\xb6\x4e\
+\x19\x56\xc3\x2c\x79\xef\x8a\xab\x35\xe3\x50\xb4\x0c\xbd\x28\x8e\
+\x6e\xe5\x70\xa6\x59\x64\x79\xe1\x81\x1c\x97\xde\x81\xa1\xcc\xd0\
+\x2a\x12\x48\x19\x75\x91\x52\x33\x8d\x7e\xe7\x7f\xac\x62\x3f\xba\
+\xc3\x7f\xbb\x11\x1a\x48\xd4\x6a\xe7\x8c\x54\x4e\xcc\xce\x11\x33\
+\x73\x0f\x26\x9b\xb9\x99\x01\x88\x57\x99\x68\x6a\x03\x45\x3c\x9b\
+\x98\x56\x82\x5f\x30\x0a\xdd\x3b\xe5\x07\x9a\x6a\xb3\xf7\x2d\x20\
+\x3d\xa1\xe6\x15\xca\xa7\x90\xd6\xd5\x80\x39\x84\xa3\x50\x55\xf2\
+\xd7\xe6\xeb\xce\x3d\x62\x08\xd7\x7f\x53\x94\xed\xe3\xc3\xc9\x66\
+\x6e\x66\x48\x26\x8d\x33\x25\x56\xfa\x07\x94\x55\x49\x5a\x84\xa1\
+\xa1\x66\xee\x11\xad\x85\x24\x1b\x95\xc3\xdc\x83\x7c\x99\x46\x32\
+\xee\x3f\xab\xe4\xdc\x10\x93\x5b\x28\x3c\xe7\xd7\xe6\xd8\x6b\xe7\
+\x0a\x7a\xb4\x10\xef\xea\x72\x76\xf1\x79\x34\x9d\xcc\xc8\x24\x06\
+\x33\x45\x48\x15\xba\x5a\xd0\x92\x95\xfe\xcd\xa8\x00\x66\xcc\xd0\
+\x1b\x32\xd7\x48\xb9\xf2\x0f\x03\xed\x4f\xdf\x91\xf2\x47\xa0\x41\
+\x0e\xf6\xa7\x27\x6f\x1e\x1e\x7f\xe4\x1e\x07\xda\x9f\xbf\x23\xe4\
+\x84\xf2\x0b\x03\xed\x4f\xdf\x91\xf2\x47\xa1\x41\x13\xbd\xa9\xca\
+\x76\xf1\xe1\xe6\x78\x7d\xc8\x60\x9b\x5c\xdc\x42\x6a\xad\xed\x87\
+\x00\x56\x9f\xb1\xd3\xf0\x30\xc6\xdc\x9e\x0a\x8d\xcb\xc4\x9b\x69\
+\x41\x59\x15\x6c\xe9\xc9\xe4\x7b\xe3\xd3\xa0\x87\x7b\x3e\x57\xb7\
+\x8f\x0f\x2d\x5d\xcb\x60\x89\xa5\xd8\xae\xdc\x37\xe2\xbf\xcf\xc6\
+\x2e\x34\x06\xe7\xa4\xc9\x9e\xa7\x0f\x3e\x68\x2f\x22\x61\x6f\xff\
+\x00\x81\x65\x0a\xf2\x68\x08\xde\xc8\x15\xb8\xeb\xcf\x2e\xb8\xdd\
+\x45\x4e\x39\x5c\xe2\x25\x58\xca\xa7\x79\xc4\x54\xb2\x97\x1e\x7e\
+\x1f\x98\x32\xc4\x9d\x5c\xe6\x2a\x67\x65\x8c\x31\x89\xb8\x84\xfc\
+\x02\x67\xb5\x4e\xee\xe1\xff\x00\x85\x19\xd9\xda\x77\x0e\x18\x83\
+\x8e\x76\xe5\x58\x0a\x9c\x1b\x54\x83\x4f\x42\xa3\x95\xc9\xa6\xda\
+\x6d\x8b\xdc\x41\x9e\x80\x13\x31\x0d\x4d\x39\x32\x1d\x8e\xa2\x6a\
+\x40\x99\xab\x28\xa1\x1a\x33\x0e\x68\xc2\x56\x18\x9b\xa8\x0f\x03\
+\x2a\x43\x12\x1a\xea\x33\x83\x9b\x50\xd7\x68\xaf\x35\x63\x0d\x17\
+\x4c\x33\x34\x8c\x48\xdf\x27\x9d\xed\x26\xa9\xb9\x70\xf6\x9b\x72\
+\x0b\x55\x4b\xa8\xc3\x65\x0e\x5c\xc4\x44\xb8\x99\xa5\x51\xdc\x11\
+\x55\x46\x61\x97\x38\x52\x76\xc3\x34\xa4\xe2\x70\xf8\x8b\x5d\x3c\
+\xc7\x69\x80\x48\x64\x2d\xa8\x37\x28\xbd\x09\xcf\x5e\x71\x26\x31\
+\xd6\xc7\x66\x4a\xa8\x56\x2c\x32\xcd\x40\x24\x8d\x7b\x20\xac\xf6\
+\x1a\x6c\xc6\x54\x26\x7c\xda\x95\x52\x4d\x53\x59\x02\xa6\x96\xd2\
+\x34\x58\x09\xa5\xe5\xcb\x76\xd6\xe8\x8c\x7a\xd9\x54\x9f\xbe\x33\
+\x12\x56\xaa\xa4\x49\x5c\xd4\x51\x78\x44\xfc\xb2\xc8\x56\x9f\x84\
+\x6a\x70\x8e\x19\x11\x94\x51\x59\x15\x94\x6c\x52\x14\x81\xd9\x48\
+\x21\x26\xad\x1d\x5d\x5d\x55\xc2\xba\x0b\x85\xc0\xab\x94\x66\x14\
+\x0c\x0d\x6a\x8a\x6b\x5d\xbb\x61\xe2\x63\x3b\x0b\xdd\x09\x50\xd4\
+\x0a\xa5\x35\xd0\x16\x35\x76\xad\x35\x7f\x8b\xaa\x21\x9f\x41\x31\
+\x4b\x09\x96\x19\x53\x50\xb4\xb5\x76\x65\x66\x69\x4c\x32\x40\x48\
+\xa8\x46\xce\x94\xcb\xa6\x3a\xa7\xe2\x43\xba\x5a\x1e\x80\x39\x25\
+\x92\x62\x0c\xed\x00\x72\xd4\x56\xba\xf2\xf4\x60\x39\xf0\xd3\x19\
+\x16\xc4\x98\x85\x43\x39\x17\x21\x62\x2e\x76\x62\xb5\x57\x03\x22\
+\x48\xd5\xcc\x2b\x9c\x23\x26\x4a\xd7\x8a\xab\x97\x0e\x47\x26\xe7\
+\x66\xa8\xa5\x75\x1b\xd8\x52\xb5\xcc\x66\x61\xfa\x32\x72\xa0\xe5\
+\x6f\xb7\x50\xa1\x5d\xee\x63\x26\x4e\xe6\xf0\x55\x08\x37\x5d\x5a\
+\xd4\xf3\x6a\xce\x21\xcf\x90\xc4\x3d\xbb\xf4\xd7\x34\x56\x2e\x12\
+\x61\x9d\x63\x59\x42\xd5\xfd\x62\x1a\x52\xa3\x9c\x64\x60\x27\x79\
+\xec\xf4\x57\x74\x22\xe0\x68\xa8\x54\x92\xbc\xa0\x2a\x5c\xf3\x80\
+\x75\x73\x47\x1e\x35\x51\x5c\xb1\x98\x8a\x59\x56\xaa\xe2\xef\x30\
+\xb5\xac\x05\xc0\x8f\x38\x8f\x70\xd8\x63\xb9\xa6\xa9\x96\x92\xd3\
+\x7c\x36\x94\x17\x3a\x4c\x53\x44\xa1\x25\x99\xd4\x0a\x90\xb4\xe9\
+\x26\x33\x9b\xa0\xc2\xcd\x69\xb7\x22\x39\x16\xa6\x6b\xbe\x8c\x81\
+\x7a\x8a\xcb\x04\xd4\x54\x1a\x1d\x75\x80\xb6\xc3\xa2\x38\x7e\x5a\
+\xbd\xca\x11\xac\xc8\x05\xe5\x73\x54\x9a\x9b\x8f\x3f\x30\x8a\x34\
+\xd0\x52\xe8\x29\x89\x04\x50\x67\x68\xcc\x6d\xad\xd4\xf7\xd2\x91\
+\xdb\x86\x90\xec\x93\xa8\xac\xa5\xa5\x84\x4b\x94\xa1\x2d\x47\xe6\
+\x60\x0f\xd2\x5c\xf5\x67\xd1\x13\xa6\x2d\xae\x53\x64\xc0\x96\x66\
+\xbb\xcc\xda\xdd\x55\xa6\x76\x52\x94\xb8\x40\x4b\x89\x90\x89\xbd\
+\xb0\x75\x42\x88\xc8\xb7\x51\x81\x56\x0a\x48\xa5\x45\x4f\x21\x4d\
+\x41\xe6\x87\x61\x08\x66\xae\xf8\x8e\x40\x24\x05\x16\xe7\xaa\xe3\
+\xca\x35\xc8\xd3\xdf\x15\x3a\x6f\x09\x30\xac\x90\x11\x9a\xd9\x65\
+\x1a\xd0\xed\x46\xac\x93\x9e\xf7\xca\x19\x23\x66\x39\xc0\xdb\x0f\
+\xdc\xf6\x1e\x62\xbf\x2d\x5c\x00\x18\xd5\xc4\xca\xe7\x41\x4a\xcc\
+\x00\x9d\xb4\x1a\xa9\x14\x67\x74\xae\x0a\x41\x9c\xec\xd3\xc2\x33\
+\x30\x25\x49\x5c\x8d\xa0\x75\x8a\x80\x0f\xbe\x3b\x74\x46\x0e\x50\
+\x49\xa1\x1e\xf0\xeb\x6b\x1a\x8c\x85\x46\x59\x6a\xf3\x8c\x70\x63\
+\x53\x12\x93\xa6\xd8\x8f\x6b\x3d\x41\x09\x70\x3c\x85\x1a\xe8\x69\
+\xaa\x9e\xe8\xe9\xc0\x61\x67\x3c\xac\x4d\xea\x43\xbc\xab\x56\xa2\
+\xd3\x50\x08\x19\x65\x4d\x62\x08\x9a\x4c\xa5\x52\x1d\x5d\x49\xa7\
+\x9f\x66\x6c\x36\x92\x0d\x0d\x75\xc4\xb3\xe4\x21\x44\xe5\xea\x24\
+\xa9\x34\x21\xef\x47\x56\x04\x7d\x2a\x86\x63\x96\xce\x88\x92\x4b\
+\xa8\x25\x82\xcd\x05\xa9\x50\x52\x69\x03\x9e\x9e\x6d\x06\xbe\x68\
+\x86\x6c\x86\xa4\xab\x91\x88\x05\xef\x0a\x09\x2a\x1d\x1c\x0c\x97\
+\x3e\x7b\x72\xdb\x00\xdc\x34\x84\x51\x60\x65\x0b\x7a\xb5\xaa\xb6\
+\xd5\x81\x04\x66\x49\xe7\x55\xec\x89\xa6\xd1\x5d\x88\x70\x0b\x5a\
+\x59\x4a\xdd\xa8\x50\x1c\xb5\x54\x0f\xb3\xd7\x0d\x59\x59\x5a\x82\
+\x69\x25\xd0\x9b\xc4\xda\x00\x8e\x18\x90\x5c\x50\x64\x0e\xad\x79\
+\x42\x3e\x1f\x96\xf7\x89\x99\xb8\x65\x29\xbe\x6a\xb1\x14\x8a\xa7\
+\x4a\x9c\x8e\xde\x98\x0e\x9c\x12\x07\x7f\x3c\x33\x52\x94\xa5\xb4\
+\x0c\x6b\x5a\x6b\xce\xdf\xb3\x1c\x89\x3e\x4c\xb0\x10\x62\xf0\xfc\
+\x80\x12\x85\x81\x20\x2e\x54\x24\x36\xbc\xa3\xb7\x45\x48\x3b\xe0\
+\xb4\x38\x0a\x8c\x01\x7b\xea\x59\x89\x3a\xdf\x94\x69\x4f\xb5\x18\
+\xb6\xd1\x1a\x42\xc1\x2c\xe1\xd8\xa8\x0a\x2b\x62\xdd\xc9\xa6\xa7\
+\x02\xbf\x1e\x73\xb6\x2c\x44\x4b\x19\xe5\x38\xf8\x8b\x7a\x0e\x1a\
+\x4c\xb5\x91\x79\x9c\x96\xde\x26\x09\x95\x05\x2a\x5f\x2c\xf5\x10\
+\x49\xb6\x9a\xf3\xd7\x58\x51\x8c\x92\xfc\x83\x88\x96\x43\xf2\x28\
+\x32\x26\xec\xad\x04\xb9\xcc\xd6\x9a\xb9\xe2\xb3\x0d\xa3\xa7\xa6\
+\x02\x4a\x32\x35\xea\xe5\xdd\x06\x6d\x42\xee\xc3\x2d\xa2\xe5\x34\
+\xe8\x8e\x73\x86\x9a\xe6\xd1\x2a\x60\x37\x52\xa5\x02\xaa\xd6\x99\
+\xb5\x14\x67\x43\x58\x94\xdc\x4e\xcb\xed\x2a\x64\xab\x86\x99\x35\
+\x10\xb2\x81\x6b\xf3\x84\x2d\x46\x51\x70\x23\xcf\x61\x5e\x98\x7e\
+\x88\x69\x2c\xf5\x49\xa8\xe5\x43\x64\x9c\xd7\x5b\x56\x20\xb1\x3f\
+\x44\x0f\x7c\x55\x69\xc9\x13\x46\x21\x9d\x51\xd9\x1a\x4a\x25\x51\
+\x6e\xcd\x5e\x61\x60\x76\x64\xc3\xf9\xac\x4b\xb9\xec\x3b\xef\xb7\
+\x94\x74\x5b\x08\xab\x8a\x54\xb3\x29\xcb\x21\x95\x04\x4a\x8f\x2a\
+\xd3\x4d\xe6\xf7\xff\x00\xb4\xc5\xee\x15\x68\x8a\x36\x2a\x8f\x80\
+\x8a\x19\x9c\xde\xff\x00\xf6\x98\xd0\x4a\x19\x0e\xa1\xf7\x40\x49\
+\x04\x10\x40\x10\xd6\xd5\x0e\x84\x30\x19\x88\x20\x86\x2c\xd5\x2c\
+\x54\x30\x2c\xa0\x12\xb5\xcc\x06\xad\x09\x1c\xd5\xa1\xec\x8a\xa7\
+\xc3\x4e\xb1\xef\xfb\x8c\x24\x89\xc8\xea\x1d\x19\x5d\x4d\x68\xca\
+\x43\x29\xa1\xa1\xa1\x1a\xf3\x06\x14\xeb\x1d\x7f\x81\x80\x97\x73\
+\xbf\xd6\x71\x1f\xdd\x61\xbf\xdf\x89\x8d\x2c\x66\x77\x3b\xfd\x6b\
+\x11\xfd\xce\x1b\xfd\xf8\x98\xd3\x44\x41\x04\x10\x40\x10\x41\x04\
+\x01\x04\x10\x40\x10\x41\x04\x01\x04\x10\x40\x11\x4f\xa4\x99\x84\
+\xf9\x6c\xa5\x45\x24\x62\x09\x2c\x09\x14\x0f\x87\x27\x57\x54\x5c\
+\x45\x46\x35\x9f\x84\x4b\xb1\x51\x8e\xf3\x36\xa1\xd8\xa0\xa1\x79\
+\x3a\x88\x46\xae\xa8\x08\xc6\x93\x63\x5f\xd6\x49\xa8\x5b\x88\xb5\
+\xee\x03\xff\x00\x9d\x71\xcd\x3e\x72\xcc\xa9\x66\x90\xd5\x0a\x84\
+\xfe\xb2\x84\x31\xaa\xae\x46\x86\xa7\xfe\x62\xd3\x7c\xc4\xfa\x99\
+\x3f\x5c\xff\x00\xc2\x8e\x6c\x4e\x1e\x73\xd6\xe9\x52\xb3\x0a\x0d\
+\x27\xb8\xf3\x49\x23\xfb\x1c\xb5\x98\x0a\x5d\x31\x6b\x49\x9c\x54\
+\xc9\x2c\x25\xaa\x35\xb7\xdc\x10\x90\x00\x35\x34\x1e\x6e\x55\xd9\
+\x13\x63\x55\x0a\x3a\x97\xb5\x4a\x30\x26\xa3\x25\x20\x82\x73\xe8\
+\x86\xe9\xec\x34\xc5\xc2\x4c\x5d\xed\x15\x6d\x0b\x51\x39\xda\x81\
+\xa6\x29\x26\xd3\x2c\x06\x3d\x24\xed\xcf\x33\x0e\xc7\xca\x66\x94\
+\xe8\xa0\x16\x64\x74\x19\xd3\x32\xa4\x0e\x6e\x98\x2b\x35\x29\xd4\
+\x28\xa4\xd6\xa0\x51\x43\xc1\xa7\x6a\xa6\xbf\x3a\x35\x58\x64\x55\
+\x44\x55\xf3\x55\x02\xaf\x4a\x80\x00\x3d\x91\x9d\x95\x26\x68\x00\
+\x6f\x2f\x50\x00\xf3\xa5\xeb\x03\x57\x9f\x1a\x1c\x1c\xab\x11\x10\
+\x9a\x94\x45\x52\x76\x95\x55\x15\xf8\x41\x0d\x9e\xef\x7d\xa8\xb7\
+\x1b\x19\xc2\xd4\x29\x24\x3c\xb5\xf3\x98\x50\x00\x1d\x8f\xb8\x47\
+\x4e\x26\x5d\x8e\x80\x31\x21\x83\xd6\xb4\xfa\x36\x50\x8a\x01\xb4\
+\xf6\x88\xaf\xd2\x78\xa9\x48\x55\x9d\x8a\x9a\x10\x19\x5d\x90\xd1\
+\x88\xa8\x2c\x18\x64\x48\x5c\xb6\x81\xb2\x1b\x82\xc6\x4b\x77\x16\
+\xb3\xb3\x58\xf6\x96\x76\x7e\x48\x64\xbe\x84\xb1\x03\x32\x9f\x0d\
+\x90\x16\x58\x19\x37\xa2\xb9\x66\x17\x54\xd0\x59\x40\x09\x34\x19\
+\xa9\x39\x0a\x08\xe6\x47\x25\x91\x2b\xe7\x4d\x9a\x84\xe5\x5a\x4b\
+\xdf\x68\x75\x52\xa7\x7b\x15\xcb\x9c\xc5\x6f\x1a\xe1\xd0\x95\x13\
+\x19\x68\x49\xb4\x4d\x75\x19\x9a\x92\x16\xf1\x91\x26\xba\xa9\x9c\
+\x76\x87\x94\x51\x0d\x48\x50\x59\x95\xae\x65\x60\xca\x1d\x9d\x8b\
+\x83\x75\x68\x1e\xa6\xb9\xe7\xae\xb9\x87\x6e\x22\x51\x45\x46\xb8\
+\xd4\xba\xa9\x5e\x49\x1c\xaa\x8c\x88\x50\x72\xd7\xee\x81\xa3\x9a\
+\x5b\xcb\x62\xb4\x7b\xce\x4e\xa0\xcd\x77\xd6\x08\x0c\x14\xb9\xa8\
+\xe5\x52\xbc\xc5\x84\x33\x48\xcf\x2a\x02\xaf\x9c\xc6\x82\x0a\x7b\
+\xce\xcc\xaa\x8b\x98\x6b\x03\x9a\xbb\x76\x43\x96\x5b\xfa\x2b\xd5\
+\x58\x9e\x4a\x24\xb5\x08\x0f\x59\x3a\xc9\xda\x4c\x48\x0c\x07\x20\
+\x7a\x10\xac\x2d\x27\x55\x79\xfa\xa2\x71\x1d\x0e\xa1\xd4\xab\x6a\
+\x3d\xa3\xa4\x47\x16\x19\x8e\x6a\xda\xd4\xd2\x02\x6b\x60\x02\x16\
+\x90\xb0\x09\x48\x29\x0b\x04\x02\x52\x0a\x42\xc1\x00\x94\x82\x90\
+\xb0\x40\x34\xc5\x7b\x4d\xde\xdc\x86\x2e\xf7\xb1\x65\x01\x01\x54\
+\x0a\xaa\x0a\xd5\x47\x41\x3c\xaa\x9c\xcf\x44\x58\x11\x19\xcd\x33\
+\x3d\x84\xc2\x88\x45\xec\x28\x8a\x49\x00\x9b\x46\x54\x1a\xf3\x23\
+\x56\xdf\x7c\x70\xd7\xd6\x9d\x3c\x62\x62\x2e\x66\x6a\x9b\xc3\x1e\
+\xa9\xf3\x4e\xf9\x9a\x4d\x08\x2b\x57\x52\x54\xd0\x84\x62\x47\x35\
+\x47\x24\x83\x4c\xb6\x83\x96\xba\xc4\xd8\x1c\x50\x3c\x8e\x59\x28\
+\x28\x59\x96\xdb\x8a\xe5\x5c\x80\x15\x3a\xf2\x14\xea\xca\x30\x58\
+\x0c\x76\x27\x84\xef\x53\x2f\x66\x0e\x50\xab\x30\x40\x0e\xaa\x2a\
+\x8f\xff\x00\x47\xae\x34\xd8\x59\xcc\xb8\x8d\xe9\xef\x0c\xb6\xb5\
+\x18\xe6\x55\xaa\x05\x69\x91\xcd\x48\xa8\xcb\x56\xaa\xd0\x67\x3d\
+\x6c\xf0\x88\x99\xc7\x69\x98\xf7\xe2\xd6\x30\xc6\x66\x62\x25\xa4\
+\x2a\x58\x80\x39\xcd\x3b\x41\x11\xa1\x51\x40\x04\x51\x61\xc7\x2d\
+\x3f\xfa\x11\x7f\x1e\x97\x21\x04\x10\x40\x10\x86\x16\x12\x03\x31\
+\x1c\x72\x59\x9d\x85\x1d\x10\xb9\x6b\x54\xa3\x33\x15\x47\x64\x04\
+\xb0\x70\x33\x2a\x48\x1d\x3c\xf1\xc5\x8e\xdd\x24\xa9\x58\xa9\x78\
+\x46\x0f\x7c\xd0\x0a\x90\xa0\xa0\xad\xc0\x02\x6b\x5c\xed\x3a\x81\
+\xa4\x5a\xc8\x93\x65\x2d\xb4\xda\x58\xa9\x65\x25\x85\xcc\xcd\xac\
+\x30\xd4\x59\xa9\xb2\xb0\x51\x86\x35\x5d\x6a\x47\x24\xab\x28\x2a\
+\x19\x59\x55\xc1\x0a\x49\x23\xce\xf8\x44\x8d\xcd\xd7\xf8\x18\x11\
+\x29\xb3\x9b\x25\x14\x50\x02\x85\x01\x47\x30\xa0\x10\x1d\x63\xaf\
+\xf0\x30\x11\xe8\x59\xe1\x31\x58\x8a\x8d\x72\x70\xbc\xea\x3e\x9e\
+\x2b\xd2\x61\x1a\x0e\x1e\x36\x1e\xf4\xbf\x9a\x33\x38\xbd\x1a\x93\
+\x48\x2e\x88\xf4\xc8\x5e\x8a\xd4\x1b\x05\xc2\x39\xbc\x9e\xc3\x7b\
+\x3c\x8f\xaa\x97\xe1\x04\x6b\xf8\x78\xf4\x4f\x7a\x5f\xcf\x0b\xc3\
+\x87\xa2\x7b\xd2\xfe\x78\xc7\x79\x3d\x86\xf6\x79\x1f\x55\x2f\xc2\
+\x0f\x27\x70\xde\xcf\x23\xea\xa5\xf8\x40\x6c\x78\x70\xf4\x4f\x7a\
+\x5f\xcf\x09\xc3\x87\xa2\x7b\xd2\xfe\x78\xc7\xf9\x39\x86\xf6\x79\
+\x1f\x55\x2f\xe5\x85\xf2\x73\x0d\xec\xf2\x3e\xa9\x3c\x20\x35\xfc\
+\x38\x7a\x27\xbd\x2f\xe7\x83\x87\x0f\x44\xf7\xa5\xfc\xf1\x91\xf2\
+\x77\x0d\xec\xf2\x3e\xaa\x5f\x84\x1e\x4e\x61\xbd\x9e\x47\xd5\x4b\
+\xf0\x80\xd7\x70\xf1\xe8\xb7\x7a\x5f\xcf\x07\x0f\x1e\x8b\x77\xa5\
+\xfc\xf1\x90\xf2\x6f\x0d\xec\xd8\x7f\xaa\x97\xf2\xc1\xe4\xd6\x17\
+\xd9\xb0\xff\x00\x55\x2f\xe5\x80\xd7\x70\xef\xd8\x6e\xf4\xaf\x9e\
+\x0e\x1d\xfb\x0d\xde\x95\xf3\xc6\x43\xc9\x8c\x2f\xb3\x61\xfe\xa6\
+\x5f\xcb\x0b\xe4\xce\x17\xd9\xb0\xff\x00\x52\x9f\x2c\x06\xbb\x86\
+\xfe\xc3\x77\xa5\x7c\xf1\x55\x8f\xd2\xc2\x5c\xe4\x73\x2d\xc8\xde\
+\xdd\x68\xa6\x55\x73\x64\x3c\xf3\x07\xa3\x14\xc3\x73\x18\x5f\x66\
+\xc3\xfd\x4c\xbf\x96\x14\x6e\x6b\x0a\x35\x61\xb0\xff\x00\x55\x2f\
+\xe5\x84\x4c\x7b\x26\x26\xb6\x2c\xcd\xd4\x61\x26\x86\x73\x87\xc4\
+\x1a\x82\xcd\x42\x8a\x79\x08\x2a\x32\x9a\x3e\x8d\x32\xe7\xca\x1f\
+\x88\xd3\xb8\x46\x77\x2d\x87\x9e\x59\x08\xbc\x87\x40\x2a\xe7\x20\
+\x69\x38\x06\xf3\xaa\x35\xd2\xb9\x52\x1b\xe4\xee\x1b\xd9\xe4\x7d\
+\x52\x7c\xb0\x79\x39\x86\xf6\x69\x1f\x54\x9f\x2c\x6a\xf1\xe3\xed\
+\x9a\xcb\x9f\xa4\x3a\x63\x15\x21\xa4\x3a\xaa\x4c\x96\xfc\x9b\x37\
+\xc7\x0d\x73\x17\x50\x40\x2b\x31\x81\x34\x27\x26\xd7\xcd\x5a\x1a\
+\x76\xe9\x5a\x89\x13\x48\xbc\x30\x96\xf4\xa5\xd5\xba\xc3\x4a\x53\
+\xa6\x23\x93\xa0\x70\xe8\x43\x24\x89\x2a\xc0\xd4\x32\xcb\x40\x41\
+\x19\x82\x08\x15\x06\x2c\x42\xb6\xde\xd1\x19\x99\x8f\x4d\x63\x75\
+\xbb\x16\xa3\x0d\x68\xa8\x93\x92\xfe\xef\x55\x23\x61\x83\x0d\x62\
+\x5f\xe7\x58\xb7\x57\x5d\xd6\x8a\xd7\xdf\x58\x94\x2f\x40\xec\x87\
+\xc4\x55\x5e\x96\xc0\x3b\x95\x64\x0a\x68\x08\x21\x8d\x39\xc1\x04\
+\x72\x4f\x4c\x73\xe8\xad\x1c\xea\xea\xec\x11\x56\xc7\x01\x54\x92\
+\x6a\xe5\x08\xa8\xb4\x01\x40\x87\xb7\xa2\x2f\x22\x3c\x34\x85\x44\
+\x54\x5a\xda\xa0\x01\x73\x33\xb5\x06\xd6\x62\x49\xeb\x26\x2a\x28\
+\x17\x43\xcc\x19\x5b\x2c\x80\x48\x0c\x58\xd6\x80\x9b\x7e\x86\xba\
+\x52\x2c\x65\x60\x5d\x51\x00\x20\x32\x97\x63\x43\xab\x7c\x57\x06\
+\xd2\x54\x82\x57\x7c\xa8\xaa\xd0\xdb\xab\x38\xb2\x85\x80\xe1\xc2\
+\x61\x5d\x15\x55\xd8\xbd\x2c\x05\xdd\x94\xb5\x10\x56\xa2\xd4\x5c\
+\xd9\x82\x93\x53\xcd\x1c\xb8\xe3\x49\xc8\x4e\xa0\xc2\x2e\x23\x83\
+\x49\x61\x6f\x15\x10\x58\x76\x39\x50\xb9\x9c\xf3\xae\x5d\x90\xdc\
+\x30\x36\xe7\xd3\x4e\xae\x68\xe2\xc2\x63\x96\x96\xcc\x21\x58\x7d\
+\x23\x40\x0f\xbf\x98\xc5\x8d\x7a\x62\x29\xc0\xc7\x24\xbf\x3d\x8f\
+\x4f\xdc\x21\xef\x88\x1a\x90\xd4\xea\xa8\xd4\x3c\x61\xf2\x25\xd0\
+\x45\x49\x3e\x08\x74\x24\x02\x41\x0b\x09\x00\x41\x04\x2c\x02\x41\
+\x0b\x1c\x1a\x5f\x16\xd2\x92\xf5\x17\x1a\xd2\x94\x27\x98\xec\xf7\
+\x46\x35\x33\x8c\x31\x9c\xa7\xc4\x2e\x38\xce\x53\x50\xeb\x9c\xf4\
+\x11\xe6\x5b\xab\x98\xed\x89\x46\x56\x2b\x42\x52\xe1\xf4\x77\xc0\
+\x80\x13\xd0\x4a\x85\xaf\xed\xc6\x8f\x11\xa6\xa7\xea\xb1\x28\x75\
+\x64\xe4\xe6\x0d\xb7\x00\x39\x39\xeb\xd9\x19\xbc\x60\x9b\x31\x81\
+\xb5\x6a\xf9\x10\x55\xed\xe6\x19\xd5\x75\x6b\xd7\xd1\xb6\x3c\x39\
+\xfe\x5e\x19\x54\xe3\xea\x7d\xbd\x18\x69\x4c\x5c\x4f\xb6\x6f\x74\
+\xba\x2a\x72\x13\x37\x12\xac\xed\x34\x2e\xf6\xe2\xea\x20\x19\x1a\
+\x01\x91\x27\x23\x95\x79\xeb\x4a\xd6\x35\x9b\x97\xc1\x4e\x13\x56\
+\x6c\xe7\x0e\xd6\x22\x02\x09\x6a\x8f\x38\xd4\xf3\xd0\xd4\x57\xae\
+\x2c\x30\xf8\x1a\xa2\xa4\xce\x5d\xa3\x20\x79\x4a\xa7\x9c\x2d\x79\
+\xab\x16\x7a\x3b\x0b\x57\x1c\xc1\x73\xfc\x00\x8e\x59\xfe\x76\x3a\
+\xb9\x46\x9e\x11\x37\x33\x04\x68\xf4\xc4\xcc\xfa\x68\xf4\x7b\x72\
+\xd7\xaf\xf1\x11\xa3\x8c\x4e\xe5\x74\xf6\x1f\x17\x31\x84\x86\x2c\
+\x65\x30\x57\xaa\x95\xd6\x4d\x18\x57\x58\x36\x9e\xc8\xdb\x47\xd6\
+\x79\x44\x10\x41\x00\x41\x04\x10\x15\x8f\xa2\x25\x96\x0c\x47\x28\
+\x56\x84\x80\x48\xae\xc3\xcd\x09\x37\x47\xa2\x8a\x96\x31\x66\x62\
+\x9f\x48\xa3\xb7\x9a\x20\x33\x9b\xa7\xd3\x89\x84\x97\x7a\xcb\x33\
+\x39\x61\x4a\xdf\x65\x01\xae\x75\xb4\xf3\x80\x3d\xf1\x94\x3f\xa4\
+\xa1\xec\x7f\xeb\x7f\xd7\x17\xfb\xa0\xd0\x53\x67\x23\x25\x35\xd0\
+\xd6\x95\xcc\x10\x7f\x08\xc5\x4c\xdc\x96\x28\x12\x04\x86\x60\x0e\
+\x44\x15\x00\xf4\xe6\x61\x05\xad\xff\x00\xa4\xcf\xfd\x3f\xf5\xbf\
+\xeb\x83\xfa\x4c\xff\x00\xd3\xff\x00\x5b\xfe\xb8\xa6\xf2\x4f\x17\
+\xec\xcf\xda\x9f\x34\x27\x92\x98\xbf\x66\x7f\xb3\xe3\x0a\x4b\x5d\
+\x8f\xd2\x60\xe7\xc1\x9f\xae\xff\x00\xae\x27\xc0\xfe\x90\xf7\xc7\
+\x54\xe0\xb6\xd6\xbc\xad\xf6\xb4\x0a\xa5\x89\xa6\xf6\x36\x46\x74\
+\x6e\x5b\x15\xec\xcf\xf6\x7c\x62\xdb\x43\xee\x43\x10\x18\x3b\xa5\
+\x99\x30\xb4\xf9\xd9\xe5\x9f\x36\xaa\xf6\xc2\x60\xb6\x8d\x37\x58\
+\x0f\xf6\x07\xbf\xf9\x61\xc3\x74\xff\x00\xb8\x3d\xff\x00\xcb\x10\
+\xa6\xe7\x9c\x7d\x18\x94\x68\x07\xf4\x62\x26\xe9\x06\xe9\xbf\x72\
+\x7b\xff\x00\x96\x14\x6e\x93\xf7\x3f\x6f\xf2\xc3\x06\x82\x7f\x46\
+\x17\x88\xdf\xd1\x82\xee\x93\xca\x2f\xdc\xfd\xbf\xcb\x0a\x37\x41\
+\xfb\xaf\xb7\xf9\x62\x31\xa1\x1f\xd1\x85\xe2\x67\xf4\x60\x6e\x97\
+\xca\x0f\xdd\x7d\xbf\xcb\x07\x1f\xfe\xeb\xed\xfe\x58\x8f\x89\xe6\
+\x7a\x30\x71\x3c\xcf\x46\x0b\xba\x4e\x3f\xfd\xd7\xdb\xfc\xb0\x71\
+\xf7\xee\xbe\xdf\xe5\x88\xf8\x9e\x67\xa3\x07\x13\xcc\xf4\x60\x25\
+\xe3\xef\xdd\x7d\xaf\xcb\x07\x1f\x7e\xeb\xed\x7e\x58\x8b\x89\xe6\
+\x7a\x30\x71\x3c\xcf\x46\x02\x5e\x3e\x3e\xaf\xed\xfe\x58\x4e\x3e\
+\x3e\xac\x77\xbf\x2c\x47\xc4\xf3\x3d\x18\x38\x9e\x67\xa3\x01\x2f\
+\x1f\x1f\x56\x3b\xff\x00\x96\x10\xe9\xd3\xea\xc7\x7c\xf8\x44\x7c\
+\x4f\x33\xd1\x83\x89\xe6\x7a\x30\x0f\xe3\xd3\xea\xc7\x7c\xf8\x41\
+\xc7\x87\xd5\x8e\xf9\xf0\x86\x71\x3c\xcf\x46\x0e\x27\x99\xe8\xc0\
+\x3f\x8f\x4f\xab\x1d\xf3\xe1\x01\xd3\xa7\xd5\xfd\xb3\xe1\x0c\xe2\
+\x79\x9e\x8c\x1c\x4f\x33\xd1\x80\x7f\x1f\x1f\x56\x3b\xe7\xc2\x10\
+\xe9\xd3\xea\xc7\x7c\xf8\x43\x78\x9e\x67\xa3\x07\x13\xcc\xf4\x60\
+\x23\x99\xa4\xd5\xb5\xc9\x1d\xf6\xf0\x88\x97\x19\x2c\x7f\xe3\xaf\
+\x7d\xbc\x23\xa7\x89\xe6\x7a\x30\x71\x3b\xfa\x30\x37\x09\xa7\x29\
+\xaa\x48\x1f\xe3\x3e\x10\xbe\x50\x37\xaa\x1d\xf3\xe1\x09\xc4\xf3\
+\x3d\x18\x69\xd0\xef\xe8\xc0\xdc\xe3\xba\x03\xea\xc7\x7c\xf8\x43\
+\x4e\xe8\xcf\xab\x1d\xf3\xe1\x11\xb6\x87\x99\xe8\x98\x63\x68\x59\
+\x9e\x89\x82\x6e\x94\xee\x98\xfa\xa1\xdf\x3e\x10\xd6\xdd\x41\x1f\
+\xd9\x0e\xf9\xf0\x88\x4e\x82\x99\xe8\x98\x89\xf4\x04\xc3\xf4\x4c\
+\x13\x74\xfe\x56\x9c\xff\x00\x54\x2a\x15\x88\x17\x91\x52\xaa\x48\
+\x1a\xb2\xad\x29\x19\xf1\xfa\x4e\x7f\x62\x5f\xaf\x6f\xe1\xc5\x83\
+\x6e\x7a\x68\x35\x0a\x63\x31\x8b\xdc\xbe\x26\x59\x03\x7a\x77\x07\
+\x51\x45\x66\xd5\xb6\x83\x23\x05\x8b\xf6\xb8\xfe\x93\x9b\xd8\x97\
+\xfc\xc3\x7f\x0a\x10\xfe\x93\x5b\xd8\x87\xf9\x86\xfe\x14\x50\xf1\
+\x06\x27\xd9\xa7\x7d\x5b\xf8\x44\x89\xb9\x9c\x51\xff\x00\xc6\x9b\
+\xef\x46\x1f\x78\x82\xae\xbf\xa4\xc6\xf6\x25\xff\x00\x30\xdf\xc2\
+\x84\xfe\x92\x8f\xb0\x8f\xf3\x0d\xfc\x28\xaa\x5d\xc9\xe2\xfd\x9a\
+\x67\x74\xc7\x66\x03\x71\x38\x97\x6a\x34\xb2\x8a\x28\x49\x7c\xaa\
+\x2b\xa8\x6d\x30\xe9\x85\xb7\xa8\xe8\xb2\xb3\x51\x1d\x81\x46\x64\
+\x56\x2b\x5b\xad\x24\x02\x56\xb4\x15\xa5\x69\x58\xb3\x1a\x35\x76\
+\x98\xa7\xc0\x68\xf9\x8b\x48\xd0\x48\x04\x0c\xe1\x50\x39\x34\x76\
+\x85\x93\x21\x99\xa5\xa2\xa1\x62\x59\xad\x01\x6e\x63\xad\x9a\x9a\
+\xcc\x59\xc1\x04\x54\x10\x41\x04\x01\x04\x10\x40\x10\x94\x85\x82\
+\x01\x96\x08\x37\xb1\xb2\x1f\x04\x03\x37\xb1\xb2\x0d\xec\x6c\x87\
+\xc1\x00\xcd\xec\x6c\x82\xc1\xb2\x1f\x04\x03\x6c\x10\x58\x21\xd0\
+\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\x10\x58\x21\xd0\x40\x36\xc1\
+\x05\x82\x1d\x04\x03\x6c\x10\x58\x21\xd0\x40\x36\xc1\x05\x82\x1d\
+\x04\x03\x6c\x10\x58\x21\xd0\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\
+\x10\x58\x21\xd0\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\x10\x58\x21\
+\xd0\x40\x36\xc1\x05\x82\x1d\x04\x03\x6c\x10\x9b\xd8\x87\xc1\x00\
+\xcd\xec\x6c\x83\x7b\x1b\x21\xf0\x40\x33\x7b\x1b\x20\xde\xc6\xc8\
+\x7c\x10\x11\x6f\x2b\xb2\x0d\xe5\x76\x44\xb0\x40\x30\x4b\x1b\x21\
+\x6c\x10\xe8\x20\x1b\x60\x82\x82\x1d\x04\x02\x52\x16\x08\x20\x08\
+\x20\x82\x00\x82\x08\x20\x3f\xff\xd9\
+\x00\x00\x53\xce\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x7d\xfb\x00\x00\x7d\xfb\
+\x01\xb3\xee\x8d\xe0\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xec\xdd\x79\x7c\xd5\xf5\x95\x3f\xfe\xd7\x79\xdf\
+\x7b\xb3\x40\x02\x88\x80\x2b\x8b\x16\xab\x18\x12\x44\xc2\xea\x8a\
+\x63\xdb\xb1\xcb\xd4\xda\xe2\xb4\xb5\x6a\x02\x96\xae\xce\xd8\x6d\
+\x3a\xcb\xb7\x1d\xda\xce\x3c\x66\xa6\xfd\xb5\x33\x53\xa7\x1b\x23\
+\x12\xb5\x3a\x6d\x69\x6b\xa7\x76\x9f\x2a\x6d\x55\x4c\x42\x50\x49\
+\x48\xc5\x4a\x15\x70\x57\x40\x96\xb0\xe5\xde\xcf\xfb\xfc\xfe\x20\
+\x58\x54\x96\x9b\xbc\xcf\xe7\x7e\x3e\x37\x79\x3d\x1f\x8f\x3e\xfa\
+\x10\x6f\xce\xe7\x2d\x90\xdc\x73\xcf\xfb\xbc\xcf\x1b\x20\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\xa2\xf4\x92\xa4\x17\x40\x74\x2c\x0b\x16\x7c\x2f\xb3\x3e\x77\
+\xd2\x88\x9a\x7c\x66\xdf\x03\x2b\xe6\xed\x4d\x7a\x3d\x44\x44\x83\
+\x01\x13\x00\x4a\x9d\x86\xeb\x5a\x4f\x85\xc7\xbb\x14\xf2\x26\x28\
+\xce\x01\x70\xe2\x21\xff\x3a\x0f\xc8\x7a\x85\x3e\x04\x91\x9f\x6a\
+\xd5\xee\x9f\x75\x7f\x7d\x7e\x4f\x52\x6b\x25\x22\x2a\x57\x4c\x00\
+\x28\x35\xa6\x2c\xba\x7f\x62\xc6\x67\x3f\x2f\xc0\x7b\x00\xe4\x8a\
+\xfc\xb2\x1e\x00\x5f\xcf\x22\xf7\xff\x3d\xb4\xfc\xdc\x17\x63\x5c\
+\x1e\x11\xd1\xa0\xc2\x04\x80\x52\xa1\x7e\x61\xeb\x47\xa0\xf2\xaf\
+\x00\x6a\x06\x14\x40\xf0\x92\xaa\xfc\xd5\xba\xe5\xb3\xbe\x6d\xbb\
+\x32\x22\xa2\xc1\x89\x09\x00\x25\x6a\xc6\xe2\x8e\x5c\x6f\xde\x7f\
+\x0b\xd0\x66\xa3\x90\x37\x57\xe4\x32\x1f\x5c\xb3\xb4\x31\x6f\x14\
+\x8f\x88\x68\x50\x62\x02\x40\x89\x99\xb1\xb8\x23\x97\xcf\x17\xbe\
+\xa3\x90\x2b\x2c\xe3\x2a\xf0\xcb\x1e\xdd\x73\xf9\xc6\x96\xf9\xfb\
+\x2c\xe3\x12\x11\x0d\x26\x2e\xe9\x05\xd0\xd0\xd5\x9b\x8f\xbe\x69\
+\xfd\xe6\x0f\x00\x02\xbc\xa9\xd6\x0d\xfb\x9f\x05\x0b\xbe\x97\xb1\
+\x8e\x4d\x44\x34\x58\x30\x01\xa0\x44\x4c\x6d\x6e\xff\x2b\x00\x0b\
+\x63\x7b\x80\xe2\xf2\x47\x6b\x26\xfc\x5b\x6c\xf1\x89\x88\xca\x1c\
+\xb7\x00\xa8\xe4\xa6\x5d\xdb\x5e\xe7\x9d\x76\x00\xa8\x8a\xf9\x51\
+\x0a\xc5\x15\x5d\x2d\xb3\x7f\x14\xf3\x73\x88\x88\xca\x0e\x13\x00\
+\x2a\xa9\x03\x4d\x7f\xd1\x83\x00\xa6\x96\xe2\x79\x0a\x6c\x29\x44\
+\x38\x6b\xfd\xad\xb3\xb7\x96\xe2\x79\x44\x44\xe5\x82\x5b\x00\x54\
+\x52\xf9\x42\x74\x03\x4a\xf4\xe6\x0f\x00\x02\x8c\xc9\x65\xf0\xc5\
+\x52\x3d\x8f\x88\xa8\x5c\xb0\x02\x40\x25\xd3\x70\xf5\xfd\xe3\x34\
+\x9b\xdd\x00\xa0\xb6\xc4\x8f\x56\x81\x9f\xdb\xb9\x7c\x6e\x5b\x89\
+\x9f\x4b\x44\x94\x5a\xac\x00\x50\xc9\x68\x36\xfb\x09\x94\xfe\xcd\
+\x1f\x00\x44\xd5\xb1\x0a\x40\x44\x74\x08\x56\x00\xa8\x24\xea\x16\
+\xad\x1a\xed\x7c\x66\x23\x92\x49\x00\x00\x00\xe2\xe5\xd2\xce\x5b\
+\x66\xdd\x9d\xd4\xf3\x89\x88\xd2\x84\x15\x00\x2a\x09\x17\xb9\x1b\
+\x90\xe0\x9b\x3f\x00\xa8\xc3\xa7\x93\x7c\x3e\x11\x51\x9a\xb0\x02\
+\x40\xb1\x9b\x7c\x55\xeb\x88\xea\x4a\xd9\x08\xc5\x71\x49\xaf\xc5\
+\x0b\xce\xe9\xbe\x79\xf6\xda\xa4\xd7\x41\x44\x94\x34\x56\x00\x28\
+\x76\x55\x15\xae\x29\x0d\x6f\xfe\x00\x90\xf1\xb8\x3e\xe9\x35\x10\
+\x11\xa5\x01\x13\x00\x8a\x9d\xb3\xbb\xe8\x27\x98\x0a\xde\x7d\xe6\
+\xc2\xfb\x12\xdd\x8a\x20\x22\x4a\x03\x26\x00\x14\xab\xfa\x6b\x5b\
+\x67\x28\x70\x4e\xd2\xeb\x38\xc4\xf0\x9c\xcf\x2e\x48\x7a\x11\x44\
+\x44\x49\x63\x02\x40\xf1\x12\x67\xf5\xe9\xff\x5e\x40\x7e\x6c\x11\
+\x48\x44\x9a\x2c\xe2\x10\x11\x95\x33\x36\x01\x52\x6c\x26\x35\xad\
+\xac\xaa\x95\x61\x4f\x03\x18\x1d\x18\x4a\x55\x30\x2b\xca\x66\x9e\
+\xce\xe6\xa3\xc7\x00\x0c\x0f\x8c\xe7\x35\xa3\x27\xaf\xbb\x69\xce\
+\xf3\x81\x71\x88\x88\xca\x16\x2b\x00\x14\x9b\x11\x52\xfd\x56\x84\
+\xbf\xf9\x03\xc0\x8a\x75\x37\xcf\xee\x78\x64\x69\xe3\xb3\x2a\xf8\
+\x4f\x83\x78\xce\x45\xf2\x36\x83\x38\x44\x44\x65\x8b\x09\x00\xc5\
+\x46\x21\x57\x58\xc4\xf1\xde\x7d\xf5\xe5\x7f\x70\xfa\x55\x00\xf9\
+\xe0\x98\xc0\x5f\x84\xc6\x20\x22\x2a\x67\x4c\x00\x28\x16\x33\x16\
+\x77\xe4\x20\xf8\x73\x83\x50\xdd\xdd\xb7\xcc\xbc\xff\xe0\x3f\xac\
+\xbb\x69\xce\xf3\x02\xbd\x2b\x34\xa8\x00\x97\x36\x5c\xbd\x36\x74\
+\x2b\x81\x88\xa8\x6c\x31\x01\xa0\x58\xe4\xf7\xfb\x0b\x2d\xce\xfe\
+\x8b\xca\xd7\x5f\xfd\x6b\xaa\x58\x16\x1a\x17\x40\xb5\xcf\xed\x7b\
+\xa3\x41\x1c\x22\xa2\xb2\xc4\x04\x80\x62\xa1\x19\x7d\xbb\x41\x98\
+\x08\x51\xfe\xfb\xaf\xfe\xc5\xae\x49\xb3\x7f\x01\x60\x73\x68\x70\
+\xf1\xca\x6d\x00\x22\x1a\xb2\x98\x00\x50\x3c\x14\x16\x4d\x76\xbf\
+\xed\xbc\xed\xbc\x17\x5e\xf3\xab\x4b\xc4\x43\xf0\x9a\xc4\xa0\xdf\
+\x44\xde\x82\x25\xca\xef\x01\x22\x1a\x92\xf8\xc3\x8f\xcc\xd5\x2d\
+\x6c\x9b\x06\x60\x52\x68\x1c\x81\x1c\xe5\x4d\xde\xfd\x3c\x34\x3e\
+\x80\xb1\x0d\x4f\x76\x9c\x6d\x10\x87\x88\xa8\xec\x30\x01\x20\x73\
+\x02\xb9\xd4\x20\x8c\x8f\x14\x77\x1e\xe9\x5f\xee\x1d\x3e\xea\x5e\
+\x00\x3d\xe1\x4f\xd1\x0b\x82\x63\x10\x11\x95\x21\x26\x00\x64\x4e\
+\x54\x2f\x31\x88\xf2\x70\x77\xcb\xac\xe7\x8e\xf4\x6f\x37\xdc\x78\
+\xc6\x7e\x05\x56\x86\x3e\x45\xa1\xe7\x87\xc6\x20\x22\x2a\x47\x4c\
+\x00\xc8\xd4\xc5\x4b\x56\x66\x01\x04\xbf\xa9\x0a\xf0\xcb\x63\xbd\
+\xc6\x41\x2c\xb6\x01\x2e\x34\x88\x41\x44\x54\x76\x98\x00\x90\xa9\
+\xad\x9b\x87\xcd\x04\x30\x22\x34\x8e\xd7\xe8\x57\xc7\x7c\x8d\x77\
+\xc7\x7c\x4d\x11\x4e\x9d\xb2\xe8\xfe\x89\x06\x71\x88\x88\xca\x0a\
+\x13\x00\x32\x25\x0a\x83\xf2\x3f\x76\xef\xab\x1d\xf3\xc0\xb1\x5e\
+\xb4\xee\x96\xc6\x3f\x02\x38\xe2\x36\x41\xb1\xb2\x9a\xe3\x36\x00\
+\x11\x0d\x39\x4c\x00\xc8\x94\x0a\xe6\x07\x07\x11\xdc\xbb\xe1\xc6\
+\x33\xf6\x17\xf9\xea\x63\x26\x0a\xc7\xa4\x6c\x04\x24\xa2\xa1\x87\
+\x09\x00\x99\x99\x7c\xfd\x63\x95\x50\xcc\x0b\x0e\xa4\x5a\xf4\x9b\
+\xba\x88\x41\x02\x60\xd0\xb3\x40\x44\x54\x6e\x98\x00\x90\x99\xea\
+\xdd\xdb\xce\x05\x50\x1d\x1a\x47\xbc\xbb\xff\xd8\xaf\xea\x7b\x2d\
+\x8a\x4f\x16\x8e\x62\x0a\xef\x05\x20\xa2\xa1\x86\x09\x00\x99\x11\
+\xe8\x6c\x83\x30\xd1\xfe\x4c\x6f\x7b\xb1\x2f\x1e\xb6\xcb\xaf\x01\
+\xd0\x1b\xf8\x4c\x87\xec\x9e\xa9\x81\x31\x88\x88\xca\x0a\x13\x00\
+\x32\xa3\x2a\xb3\x42\x63\x08\xd0\xf5\xe8\xcd\xe7\xef\x2a\xf6\xf5\
+\x0f\xac\x98\xb7\x17\xc0\xda\xd0\xe7\xaa\xc8\xb4\xd0\x18\x44\x44\
+\xe5\x84\x09\x00\x59\x9a\x1b\x1a\x40\x55\x8a\x2e\xff\xff\x89\x3c\
+\x14\xfc\x5c\x80\x09\x00\x11\x0d\x29\x4c\x00\xc8\x44\xc3\xd5\xf7\
+\x8f\x83\xc1\xfc\x7f\x40\x57\xf5\xfb\x4b\xc4\x77\x86\x3e\xd5\x31\
+\x01\x20\xa2\x21\x86\x09\x00\x99\xd0\x6c\x26\xf8\xd3\x3f\x00\x64\
+\xe0\xfb\x9d\x00\x38\x8b\x2d\x00\x95\x69\xbc\x19\x90\x88\x86\x12\
+\xfe\xc0\x23\x13\x02\x67\xd0\x00\x28\xcf\x3c\xdc\x32\x77\x63\x7f\
+\xbf\x6a\xf7\x7e\x74\x02\xd0\xc0\x87\xd7\xd4\x3d\xf9\xc0\xe9\x81\
+\x31\x88\x88\xca\x06\x13\x00\x32\xa1\xa2\xc1\x0d\x80\xaa\x03\x3b\
+\xd3\xbf\xe1\xf6\x39\x3b\x01\x6c\x0a\x7d\x7e\x46\x1d\xb7\x01\x88\
+\x68\xc8\x60\x02\x40\x36\x14\xd3\x83\x63\xb8\xa0\xa1\x3e\xe1\xdb\
+\x00\x9e\x7d\x00\x44\x34\x74\x30\x01\xa0\x60\x75\xd7\x74\x4c\x00\
+\x30\x3a\x34\x8e\xc2\x3f\x38\xf0\x2f\xd6\xe0\x46\x40\x11\xd4\x85\
+\xc6\x20\x22\x2a\x17\x4c\x00\x28\x98\x73\xd1\xb9\x26\x81\xc4\x07\
+\x7c\x8a\x97\xf5\xa1\x8f\x57\xb8\x33\x42\x63\x10\x11\x95\x0b\x26\
+\x00\x14\x4c\x1c\xce\x09\x8e\x01\x6c\xea\x5e\x36\x6f\xdb\x80\x03\
+\xa8\x3e\x1a\xba\x06\x40\xcf\x58\xb0\xe0\x7b\x99\xf0\x38\x44\x44\
+\xe9\xc7\x04\x80\x82\xa9\x86\x27\x00\x0a\x3c\x1c\xf2\xf5\xe2\xab\
+\xd7\x23\xfc\x24\x40\xd5\x63\xc3\xc7\x8f\x0f\x8c\x41\x44\x54\x16\
+\x98\x00\x50\x30\x41\x78\x02\x00\x48\x50\x13\x5f\xe7\x6d\xd3\x76\
+\x03\x78\x26\x74\x15\x05\x27\xaf\x0f\x8d\x41\x44\x54\x0e\x98\x00\
+\x50\x90\xfa\xf7\xde\x7b\x9c\x02\x13\x42\xe3\xa8\x86\x77\xf1\x03\
+\x08\xde\x06\x10\x65\x02\x40\x44\x43\x03\x13\x00\x0a\x22\x95\x15\
+\xd3\x01\x48\x70\x1c\x27\x41\x5b\x00\x00\xa0\xa2\xc1\x8d\x80\x02\
+\x65\x23\x20\x11\x0d\x09\x4c\x00\x28\x8c\x6a\xbd\x41\x94\x9d\x5d\
+\x37\x37\x3e\x11\xbe\x16\x17\x5c\x01\xf0\x90\x33\x83\xd7\x41\x44\
+\x54\x06\x98\x00\x50\x10\x75\xe1\x67\xe7\x15\xe8\x04\x24\xb4\x81\
+\x0f\x19\x84\x9f\x04\x10\x05\xb7\x00\x88\x68\x48\x60\x02\x40\x61\
+\x54\x82\x13\x00\x11\x04\x5f\xe7\x0b\x00\x88\x10\x5e\x45\x10\x4c\
+\x9c\xd4\xb4\xb2\xca\x60\x35\x44\x44\xa9\xc6\x04\x80\x42\x9d\x1d\
+\x1a\x40\x14\xc1\x53\xfc\x00\xa0\xb0\xb7\x66\x23\x80\x28\x30\x8c\
+\x1b\x2e\xd5\xbc\x14\x88\x88\x06\x3d\x26\x00\x34\x60\xd3\xae\x59\
+\x75\x0a\x80\x51\xa1\x71\xbc\x84\xcd\x00\x38\xa8\x7b\x45\x5d\x2f\
+\x80\xa7\x43\xe3\x38\xc5\xa4\xf0\xd5\x10\x11\xa5\x1b\x13\x00\x1a\
+\xb0\x28\xeb\x2c\x66\xe7\x7b\x97\xaf\x7a\xc4\x20\xce\x41\xc1\xdb\
+\x00\x22\x6e\xa2\xc5\x42\x88\x88\xd2\x8c\x09\x00\x0d\x98\x18\xec\
+\xff\x43\xb1\xa9\x6f\x88\x8f\x0d\xd5\xe0\x04\x40\x45\x99\x00\x10\
+\xd1\xa0\xc7\x04\x80\x06\x4c\xd4\xe4\xf6\xbc\xdf\x1b\xc4\xf8\x13\
+\x09\xaf\x00\x28\x84\x09\x00\x11\x0d\x7a\x4c\x00\x68\xc0\xd4\xe0\
+\xfa\x5c\x35\x4e\x00\x14\xee\xf1\xd0\x18\xa2\xac\x00\x10\xd1\xe0\
+\xc7\x04\x80\x42\x4c\x09\x0f\x11\x3e\xbd\xef\x55\x82\x13\x00\xb0\
+\x02\x40\x44\x43\x00\x13\x00\x1a\x90\x29\x8b\x3b\x4e\x02\x30\x32\
+\x34\x8e\x33\xae\x00\x64\xa2\xc2\xa6\xf0\x28\x7a\xe2\xe4\xeb\x1f\
+\xab\x0c\x8f\x43\x44\x94\x5e\x4c\x00\x68\x40\xb2\x79\x6f\x32\x31\
+\x2f\x57\x91\xb5\x3c\x01\x80\xd7\xef\x7d\xea\x39\x00\xf9\xc0\x30\
+\xae\x6a\xe7\x8e\x53\x2d\xd6\x43\x44\x94\x56\x4c\x00\x68\x60\x6c\
+\x46\xe6\x3e\xbd\x66\x69\xe3\x0e\x83\x38\x2f\x5b\xb1\xe2\xca\x48\
+\x0c\xae\x05\x76\x2e\xe2\x36\x00\x11\x0d\x6a\x4c\x00\x68\x40\xd4\
+\xe4\xd6\x3c\x35\xfd\xf4\xff\x72\x54\x60\x73\x78\x0c\x36\x02\x12\
+\xd1\xe0\xc6\x04\x80\x06\x44\x1c\x82\x13\x00\xb1\x3e\x02\xf8\x27\
+\x4f\x86\x06\x10\x61\x23\x20\x11\x0d\x6e\x4c\x00\x68\x60\x0c\xb6\
+\x00\xbc\x48\x2c\x15\x00\x48\x78\x02\xa0\x2a\x13\x2c\x96\x42\x44\
+\x94\x56\x4c\x00\xa8\xff\x96\xa8\x03\x10\x7c\x61\x8e\x88\xc4\x54\
+\x01\xd0\xf0\x04\x00\x7a\xb2\xc5\x4a\x88\x88\xd2\x8a\x09\x00\xf5\
+\x5b\xfd\xe6\x8e\x49\x00\x82\xaf\xcc\xcd\x7a\xdb\x13\x00\x07\x89\
+\x77\xc1\x3d\x00\x02\x61\x02\x40\x44\x83\x5a\x36\xe9\x05\x50\xf9\
+\x71\xea\xcf\xf0\xe1\x61\xb6\x3d\xb4\xfc\xdc\x17\xc3\xc3\xbc\x56\
+\x04\x3c\x19\x9e\xd9\xea\x29\x06\x4b\x29\x2b\xd3\x9b\x1f\x1c\x9b\
+\x47\xe1\x12\x81\x9e\x0b\xc8\x59\x80\x8e\x84\xa0\x46\xa0\xfb\xbc\
+\x4a\x8f\x40\x36\x89\xf8\x47\x04\xe8\x38\x6e\xc2\xde\xd6\xdf\x2c\
+\x99\x5f\x48\x7a\xcd\x34\x34\x2d\x58\xf0\xbd\xcc\x1f\x6a\x27\xcc\
+\xf5\x1e\x6f\x01\x64\x3c\x44\x4e\x01\xb4\x1a\xc0\x56\x40\xb7\x41\
+\xe5\x21\x75\xf8\xdd\x94\x5d\x9b\x1e\x5a\xb1\xe2\xca\xd0\x2b\xc2\
+\x07\x2d\x49\x7a\x01\x54\x7e\xa6\x36\xb5\x5d\x2f\x82\xaf\x06\x86\
+\x69\xed\x5a\x3e\x7b\xae\xc9\x82\x5e\x65\x7a\xf3\x83\x63\x0b\xc8\
+\xbf\x10\x18\x46\x77\xe9\x9e\x61\x1b\x5b\xe6\xef\x33\x59\x54\x6a\
+\xa9\x34\x34\xad\x7e\xab\x42\x3f\x0a\xc1\x25\x28\xfe\x43\xc1\x76\
+\x40\x7f\xe2\x7d\xe6\x9b\xdd\xb7\xcc\xbc\x3f\xce\x15\x12\x1d\x54\
+\xb7\xa0\xbb\x42\x6a\x76\xfd\x95\x40\x3e\x09\xe0\x84\x22\xbe\xe4\
+\x49\x00\xff\x95\xd1\x8a\xa5\x0f\xb7\x4c\xdf\x1e\xf3\xf2\xca\x0e\
+\xb7\x00\xa8\xdf\x4c\x4e\x00\x08\x1e\xb3\x58\xcb\xe1\x3c\x34\x71\
+\xfa\x56\x84\x0f\x03\x92\x11\xd9\x61\x27\x59\xac\x27\xad\xa6\x2d\
+\x5a\x3d\xab\x7e\x61\xfb\x6a\x15\xfd\x31\x04\x6f\x44\xff\x2a\x82\
+\xa3\x00\x79\x9f\x73\xfe\xbe\xfa\xe6\xb6\xd6\x86\xa6\xb6\x0b\xe2\
+\x5a\x27\x11\x00\x34\x34\xb5\xce\x91\x9a\x9e\x75\x02\xf9\x12\x8a\
+\x7b\xf3\x07\x80\xf1\x00\xfe\x2d\x92\xde\x47\x1b\x16\xb6\xbe\x33\
+\xc6\xe5\x95\x25\x26\x00\xd4\x6f\x6a\x70\x02\x40\x21\xb1\x25\x00\
+\x58\x22\x1e\x40\x68\x05\x00\x51\xde\x0d\xce\x3e\x80\x25\xea\xea\
+\x9b\x5b\xbf\xe0\xbd\xbf\x1f\x8a\x19\x06\x11\x67\xab\xe0\x77\x0d\
+\x0b\xdb\x6e\x9d\xb1\xb8\x23\x78\x3c\x34\xd1\xab\xd5\x37\xb5\x5d\
+\xae\x22\x77\x0b\x06\xfc\xe1\x63\x9c\xaa\x7c\xbf\xa1\xa9\xed\x1b\
+\x0b\x16\x7c\x2f\x63\xba\xb8\x32\xc6\x04\x80\xfa\x4d\x0c\x12\x00\
+\xf1\x3e\xbe\x04\xe0\x80\x67\x43\x03\x38\xf1\x83\x2e\x01\x98\xbb\
+\x60\x55\x75\xc3\xa6\xb6\x15\x80\xfc\x3f\x18\xf7\x00\xa9\xe2\xea\
+\xde\x7c\xf4\x70\x5d\x53\xfb\x39\x96\x71\x69\x68\x9b\xda\xd4\x7e\
+\x05\x04\xdf\x07\x30\x2c\x34\x96\x0a\x3e\xb8\xbe\x66\xe2\x1d\x33\
+\x16\x77\xe4\x0c\x96\x56\xf6\x98\x00\x50\xbf\x4c\xbe\xfe\xb1\x4a\
+\x08\x82\xcf\xc8\xab\xc6\xb7\x05\x00\x00\x02\x3c\x17\x1e\x63\x70\
+\x1d\x05\x9c\x7c\xfd\x63\x95\x3d\xb5\x99\xbb\x14\x72\x45\x8c\x8f\
+\x99\xe4\x44\x7f\x37\xad\xb9\xed\x4d\x31\x3e\x83\x86\x88\xa9\xd7\
+\xb4\x36\x88\xe8\x2d\x00\x2c\x3f\xb5\x5f\xd9\xdb\xeb\xff\xdd\x30\
+\x5e\xd9\x62\x02\x40\xfd\x52\xd9\xb3\xf5\x75\x30\xf8\x66\xdc\x5b\
+\x88\x37\x01\x50\xd1\xe0\x0a\x80\xca\x20\x3a\x0a\xb8\x44\x5d\x75\
+\xcf\xb6\x6f\x43\xf1\x67\x25\x78\x5a\xad\x07\x7e\xcc\x24\x80\x42\
+\xd4\x7d\x78\x65\x8d\x64\xe4\x4e\x00\x35\xe6\xc1\x45\x3f\x32\x75\
+\x61\xdb\x22\xf3\xb8\x65\x86\x09\x00\xf5\x8b\x53\xb1\xb8\x04\xe8\
+\xb9\x0d\xb7\xcf\xd9\x69\x10\xe7\xc8\x7c\x78\x05\x00\x83\xa8\x02\
+\xd0\xb0\xb1\xfd\x6f\x01\xbc\xab\x84\x8f\xac\xf0\xc0\x0f\xeb\x17\
+\xb6\xc5\x72\xd2\x83\x06\x3f\xd9\x33\xec\xb3\x30\x18\x38\x76\xc4\
+\xf8\x8a\x7f\xaf\xbb\xa6\x63\x48\x4f\xfc\x64\x02\x40\xfd\x62\x71\
+\x02\x00\x88\xf7\xd3\x3f\x00\x08\x9c\x41\x02\x30\x38\x2a\x00\xd3\
+\x16\xb6\x9e\xaf\x82\xcf\x25\xf0\xe8\x61\xf0\xf8\xc1\x94\xc5\x1d\
+\x83\xfa\x34\x05\xd9\xab\x6b\x6e\x3d\x5b\x04\x37\xc4\xfc\x98\x5a\
+\xc9\x44\xff\x15\xf3\x33\x52\x8d\x09\x00\xf5\x8b\xb7\xb9\x06\x38\
+\xf6\x04\xc0\xbb\xf0\x2d\x80\xc1\x50\x01\x98\xd4\xb4\xb2\xca\x43\
+\x96\x21\xa9\xa1\x5f\x82\x93\x32\xf9\xe8\x7b\xec\xbc\xa6\xfe\xc8\
+\x40\xfe\x0d\x40\xec\x8d\x7a\x02\xbc\xad\x6e\x61\xeb\xfc\xb8\x9f\
+\x93\x56\x4c\x00\xa8\x5f\x2c\x4e\x00\x40\xf1\x07\x83\xa5\x1c\x95\
+\x45\x13\xe0\x60\xa8\x00\xd4\xa2\xfa\xef\x2d\x2e\x6e\x0a\x21\xc0\
+\xf9\xeb\x6b\x26\x7e\x22\xc9\x35\x50\xf9\x98\x7a\x4d\x6b\x83\x02\
+\x6f\x29\xd5\xf3\x44\xe5\xf3\xa5\x7a\x56\xda\x30\x01\xa0\xfe\x0a\
+\xde\x02\x88\x75\x06\x40\x9f\x8c\xf7\x06\x15\x00\x8c\x98\xd4\xb4\
+\x32\xf8\xce\x83\xa4\x4c\x6d\x6e\x1f\x0f\x91\x4f\x25\xbd\x8e\x3e\
+\x9f\xaf\x6f\xea\x38\x2b\xe9\x45\x50\xfa\x49\x46\xfe\x16\x25\x9c\
+\x52\x2b\xc0\xf9\xf5\xcd\xed\x17\x95\xea\x79\x69\xc2\x04\x80\x8a\
+\x36\xf9\xaa\xd6\x11\x10\x04\xef\xe7\x0a\x0a\xb1\x27\x00\xdb\xb1\
+\xcf\xa0\x02\x00\x0c\xf7\xb5\xe3\x2c\xe2\x24\x41\xc4\x7f\x06\x06\
+\x97\x36\x19\xa9\x54\x89\xfe\x23\xe9\x45\x50\xba\xf5\x35\xe5\x5d\
+\x59\xf2\x07\x8b\x7e\xa4\xe4\xcf\x4c\x01\x26\x00\x54\xb4\xe1\x55\
+\x99\xd7\x19\x84\xd1\x9a\xdd\xd8\x60\x10\xe7\xa8\xfa\x66\xf8\x87\
+\xcf\xfe\x76\xbe\xd8\x91\xa3\xa9\x52\xbf\x70\xf5\xe9\x50\x69\x4e\
+\x7a\x1d\x87\x12\xe0\x4d\x0d\x4d\xed\x6f\x4b\x7a\x1d\x94\x5e\x2e\
+\xeb\xaf\x85\xed\x99\xff\xe2\x28\x2e\x1f\x8a\xcd\xaa\x4c\x00\xa8\
+\x68\xea\x23\x8b\x04\xe0\x99\x07\x56\xcc\xdb\x6b\x10\xa7\x18\xc1\
+\xdb\x00\x92\xd1\x32\xad\x00\xf8\x1b\x90\xc2\xdb\x3e\x55\xf4\x5f\
+\xb0\x44\xf9\x73\x87\x0e\x43\x05\xaa\xd7\x26\xf4\xf0\x5c\xa6\xe0\
+\xdf\x9b\xd0\xb3\x13\xc3\x6f\x44\x2a\x9a\x42\xc2\xcf\xe4\x2a\xfe\
+\x68\xb0\x94\xa2\x98\x4c\x03\xf4\xe5\x97\x00\xd4\xbf\xf7\xde\xe3\
+\xa0\x48\xd5\xa7\xff\x43\xd4\xd5\x6f\x6c\xe7\xa5\x2c\xf4\x1a\xf5\
+\xcd\xab\x2f\x04\x60\xf1\x21\x63\x40\x44\xf5\xdd\x49\x3d\x3b\x29\
+\x4c\x00\xa8\x68\xa2\x38\x2d\x3c\x08\x9e\x30\x58\x4a\x51\xd4\xa0\
+\x02\x00\x95\xb2\x4b\x00\xa4\x22\x77\x0d\xe2\x98\x9e\x66\x45\xe4\
+\x6f\x93\x5e\x02\xa5\x4f\x0a\xde\x80\x1b\xa7\x5e\xdb\x91\x58\x02\
+\x92\x84\xd4\x95\x08\x53\x65\x89\xba\xa9\x9b\xdb\xcf\x15\xc5\x0c\
+\xa8\xd4\xc3\xe9\x38\xa8\x8c\x82\x68\xa4\x90\xed\xa2\xba\x59\x80\
+\xdf\x7b\x9f\xb9\x6f\xdd\x2d\x8d\x25\xfb\x64\x9b\x14\x35\x99\xca\
+\xa5\x8f\x87\xc7\x28\x92\xe0\x39\x68\x60\x0c\x87\xb2\x4b\x00\x20\
+\xd2\x64\x14\xe9\x39\x11\x7c\x1a\x5e\x8f\x53\x91\x8f\x02\x98\x6c\
+\x13\x56\xcf\x6d\x68\x6a\x9d\xd3\xd9\x32\xa7\xd5\x26\x1e\x95\xbd\
+\x25\xea\x74\x63\xfb\xdb\x93\x5e\x86\xb8\xe8\x32\x00\x43\x66\x38\
+\x10\x13\x80\xc3\x38\xa7\xa9\xf5\x8c\xc8\xc9\xf5\xd8\xb4\xfa\x9d\
+\x00\x0e\x9c\x05\x17\xc5\x81\x37\x93\x03\xff\x2f\x7d\xef\x2c\x0a\
+\x40\x5c\x84\xfa\xe6\xb6\x47\x20\x72\x2b\xf6\xed\xff\x56\xd7\x1d\
+\x17\xbc\x94\xd4\xda\x63\x25\xe1\x09\x80\xc2\x95\x2c\x01\x50\xd5\
+\x67\x25\xf4\x34\x91\x96\xd7\x16\xc0\xb4\x45\xab\xa7\x7b\xef\x2d\
+\x6e\xe3\xdb\xe1\xa1\x7f\xd6\x7d\xf3\x9c\xdf\x03\xc0\x8c\xc5\x1d\
+\xff\x9d\xcf\x17\x6e\xb3\xba\x48\xc8\x8b\x7c\x08\x00\x13\x00\x02\
+\x00\x34\x6c\x6c\x9b\xa5\x22\x29\x68\xc2\x93\x37\x60\x08\x25\x00\
+\xdc\x02\x38\x44\xdd\x35\x1d\x13\x1a\x9a\x5b\xbf\x13\x89\xac\x87\
+\xe2\xfa\x7e\x4e\x82\x9b\x02\xd5\x7f\x41\x65\xc5\xa6\xfa\x85\xed\
+\x9f\x99\x7c\xfd\x63\x95\xb1\x2d\x34\x01\x7d\x93\xdc\x26\x1a\x84\
+\x2a\x5d\x05\xc0\x62\x1c\x70\x99\x6d\x01\xf8\x28\x32\x39\x42\x25\
+\xc0\x27\xbb\x97\x1f\x78\xf3\x07\x80\x35\x4b\x1b\xf7\x44\x3d\xb5\
+\xef\x01\xb0\xca\x28\xfe\x95\x33\x16\x77\x8c\xb1\x88\x45\xe5\x4f\
+\x9d\x5c\x9e\xf4\x1a\x0e\xd0\xf9\x43\xe9\xaa\x60\x26\x00\x00\x00\
+\x95\xfa\xa6\xb6\x8f\xbb\x4c\xf4\x7b\x85\xfc\x25\xc2\x7e\x5f\x6a\
+\xa1\xfa\xf9\xea\x9e\xad\x0f\x4f\xbd\xa6\xb5\xc1\x6a\x85\x49\x7b\
+\x6c\xf8\xf8\xf1\xb0\x18\xcd\x99\xf1\xa5\xdb\x2a\x11\xff\x42\x70\
+\x08\x29\xb3\x2d\x00\x91\xbf\x30\x88\xb2\xae\x73\xe2\xac\x9b\x5f\
+\xfd\x8b\xdd\x2b\xea\x7a\xa1\x99\x45\x00\xf6\x1b\x3c\xa3\xaa\x37\
+\x1f\x2d\x34\x88\x43\x83\x81\xe2\xad\x49\x2f\xa1\x4f\x6d\xbe\x37\
+\x9a\x93\xf4\x22\x4a\x65\xc8\x27\x00\xe7\x34\x3d\x34\xaa\xbe\x79\
+\xf5\x8f\x20\xf8\x32\x80\xe1\x76\x91\xe5\x2c\xc9\x48\x6b\xc3\xc2\
+\xd6\x41\xd1\xf1\xec\xc5\x59\xdc\xca\xb5\x7b\xdd\x4d\xb3\x83\xdf\
+\x94\x8b\x95\x91\xcc\x8b\xa1\x31\x14\xe5\x53\x01\xa8\x5b\xb4\x6a\
+\x32\x80\xb3\x43\xe3\xa8\xea\x17\xb1\x44\xfc\xe1\xfe\x5d\x57\x4b\
+\xe3\x7a\x88\xfc\x73\xe8\x33\xfa\xbc\xdf\x28\x0e\x95\xb1\xbe\xf3\
+\xf7\xc1\x7f\x6f\x01\x3c\x62\x10\x03\x0a\x7d\x83\x45\x9c\x72\x30\
+\xa4\x13\x80\x69\xd7\xac\x3a\x25\x92\xde\xfb\x01\xb5\xf8\xd4\x74\
+\x38\xd5\xaa\xf2\xdd\xa9\xcd\xed\xef\x8b\x29\x7e\x29\x19\x24\x00\
+\xf2\xf8\x81\x66\x8a\xd2\x88\xbc\x6e\x09\x8f\xa2\x63\x01\x2d\xd9\
+\x58\xd2\x10\x2e\xca\x58\xfc\x3d\xde\x55\x59\x91\xfd\xc1\xd1\x5e\
+\x50\x91\x75\x5f\x06\xb0\xd5\xe0\x59\x93\xeb\x9a\xda\x2d\xfa\x15\
+\xa8\x8c\x65\xf2\xfe\xcf\x60\x30\xfa\x57\x20\x37\xc2\x62\x8b\x51\
+\xe4\xd2\xe0\x18\x65\x62\xc8\x26\x00\x0d\xd7\xb5\x9d\xe6\x5d\xe6\
+\x5e\xd8\x64\x9e\x47\x93\x11\xe8\xb2\x86\x6b\xdb\xff\x2c\xe6\xe7\
+\xc4\xcc\x60\x06\x40\x29\x4f\x00\x00\xa8\xed\x29\x18\x24\x00\xc8\
+\xd5\x2d\x7a\xe0\x38\x83\x38\xf1\x13\x18\x24\x00\xf2\xfd\x35\x4b\
+\x1b\xf7\x1c\xed\x15\x6b\x96\x36\xee\x51\xc1\xb7\xc2\x9f\x05\x38\
+\x78\x93\xa6\x42\x2a\x5f\x02\xb5\x78\xc3\x55\x0f\xfc\x44\x14\xbf\
+\x32\x88\x35\xa3\x9c\xef\x00\xe9\x8f\x21\x99\x00\x4c\x6f\x7e\x70\
+\xac\x8f\xf0\x4b\x88\xc1\xb9\xf6\xe2\x54\xa8\xd3\x1f\xd4\x37\xad\
+\xaa\x2f\xd1\xf3\x62\xe0\x2d\xb6\x00\x4a\x9a\x00\xf4\x4d\x1c\xdc\
+\x1d\x1a\x47\x44\x52\x3f\x0e\xf8\xac\x6b\xda\x8e\x07\x70\x5e\x68\
+\x1c\xd5\xe8\xd6\x62\x5e\x17\x65\x33\xff\x05\xa0\x37\xf4\x79\x10\
+\x9b\x53\x05\x54\xd6\x2c\x3e\x1c\x3d\xbc\x6e\xf9\xac\x27\xbd\x33\
+\x49\x00\x2a\x46\xa0\x7a\x48\x54\xa6\x86\x5c\x02\x30\x77\xc1\xaa\
+\xea\x02\xf2\x77\x89\xc1\xad\x76\xfd\x34\x52\x25\xf3\x83\xb9\x0b\
+\x56\x55\x97\xf8\xb9\x26\x4c\xa6\x00\x96\x38\x01\x00\x00\x01\x82\
+\xab\x00\xae\xe0\x52\xdf\xad\x9e\xcd\xc8\xa5\x08\x3f\xd6\xbb\x6d\
+\xca\xee\x27\xef\x2d\xe6\x85\x8f\x2c\x6d\x7c\x56\xa0\x77\x06\x3e\
+\x0f\x00\xea\x1a\x16\xae\x3e\xd3\x20\x4e\xea\xd5\x7d\x78\x65\x4d\
+\xfd\xc2\xd5\xa7\xd7\x5f\xdb\x3a\xa3\x6e\x61\xdb\xb4\x86\xeb\xda\
+\x4e\xab\x5b\xd0\x5d\x91\xf4\xba\x92\x34\x65\xd1\xfd\x13\x01\x9c\
+\x1a\x1a\x47\x05\x3f\x07\x80\xac\xaf\x58\x09\xe0\xb0\xfd\x2b\xfd\
+\xe1\xc5\xcd\x0a\x8d\x51\x0e\x86\xdc\x1c\x80\x9e\x9a\xec\xd7\x00\
+\x9d\x9d\xc4\xb3\x05\x38\xa3\xa7\x36\xf3\x4f\x00\xca\xf1\x6e\x74\
+\x83\x31\xc0\xa5\xdd\x02\x00\x00\x05\x5e\x44\xe0\xf1\x45\xef\x90\
+\xfa\x04\x40\x44\xcf\x0b\x1d\x7a\xa4\x2a\x2b\x57\xac\xb8\x32\x2a\
+\xf6\xf5\x5e\xdd\xf7\x44\xf4\x2f\xc3\x9e\x0a\x78\x8d\xae\x00\xf0\
+\x2f\xa1\x71\xd2\xe6\xcc\x85\xf7\xd5\x56\xa0\xe2\x9d\x0a\xbc\x49\
+\x54\xcf\xc3\x5e\x8c\x07\x3c\xe0\x04\x4e\x01\x8d\x00\x57\xd3\x13\
+\xd5\x37\xb7\x3d\x01\xd5\xfb\x44\xe4\x57\xb9\x5c\xe6\x7f\x8f\xb5\
+\x05\x33\x98\x64\xa3\xec\x2c\x93\x8b\x7f\xbd\xfe\x06\x00\x1e\x6e\
+\x99\xbe\xbd\xbe\xb9\xbd\x1b\xd0\xa0\x6a\xab\xa8\x0e\x89\x04\x60\
+\x48\x55\x00\xa6\x2e\x6c\x5b\x04\x68\xb2\x33\xd2\x15\x7f\x5d\xbf\
+\xb0\x6d\x6e\xa2\x6b\xe8\xa7\x19\x8b\x3b\x46\x02\x38\x3e\x34\x8e\
+\xb8\x4c\xe9\xa7\x25\x8a\x41\x05\x40\xc3\xff\xdb\x63\xa7\x12\x5c\
+\xfe\x87\xd3\x5f\xf7\xe7\xe5\xb5\xbb\x0b\x3f\x07\xb0\x2b\xf4\xb1\
+\x02\x93\xa3\x8b\xa9\x51\xd7\xd4\x7e\x62\x7d\x53\xfb\xbf\x57\x68\
+\xee\x19\xa8\x2e\xef\x1b\x71\x3b\xfe\x08\x2f\xcf\x00\x98\x0c\x91\
+\x26\x05\xee\xe8\xcd\x47\xcf\xd5\x37\xb5\xff\x57\xdf\xb5\xb8\x83\
+\x9e\x88\xc9\x87\xb1\xbc\x8b\xaa\x0f\x9d\x4f\xf1\x40\x68\x40\x15\
+\x30\x01\x18\x4c\xea\x16\xad\x9a\x2c\x8a\xaf\x26\xbd\x0e\x00\x19\
+\xa8\x7c\xab\x9c\x6e\x44\x2b\x44\x6a\x51\xfe\xf7\x7b\x86\x8f\xda\
+\x68\x10\xa7\x7f\x34\xfc\x24\x80\x8a\xa4\xba\x02\x50\xf7\xe1\x95\
+\x35\x80\x06\xcf\x9c\xc8\x7a\xbd\xbb\x3f\xaf\xef\xeb\xb1\xf8\x49\
+\xe8\x73\x01\x34\x9e\xb9\xf0\xbe\x5a\x83\x38\x09\x53\x99\xba\xb0\
+\xed\x83\x4e\xf4\x51\x88\xde\x80\x81\xdd\xc7\x50\x0b\xd1\x8f\xb8\
+\x4c\xf4\x87\xfa\xa6\xd6\xcf\x97\xeb\x96\x61\xb1\x3c\xc4\x22\x01\
+\x58\xdd\x79\xdb\xb4\x97\x7b\x7d\x04\x1a\x3c\xac\x4a\x80\xc9\x75\
+\x8b\x56\x8d\x0e\x8d\x93\x76\x65\xf3\x26\x14\x64\x89\x3a\xe7\x33\
+\x37\x01\x18\x96\xf4\x52\x0e\xd0\xfa\xfa\x8d\xed\x49\x5f\x7c\x51\
+\x34\xd5\xc8\x22\x01\x78\x7a\xc3\x8d\x67\x58\x0c\x90\xe9\x1f\x75\
+\xc1\x09\x80\xa4\xbc\x02\x90\xd9\x3b\x6c\x16\xc2\xb7\xf3\x9e\x7c\
+\xb8\x65\xce\x63\xfd\xfd\x22\x81\xfe\x30\xf0\xb9\x00\x90\xad\xf0\
+\xd9\x0b\x0c\xe2\x24\xa6\xee\xc3\x2b\x6b\xa6\x36\xad\x5e\x21\x8a\
+\x6f\x00\x18\x61\x10\xb2\x12\x22\x9f\xe9\xa9\xc9\xb4\xd7\x35\xb7\
+\xc6\x7d\x52\x29\x11\x33\x16\x77\xe4\x04\x38\x37\x34\x8e\x0a\x7e\
+\x73\xe8\x3f\x4b\x14\x5e\x01\x00\x20\x12\xb9\x19\x06\x71\x52\x6d\
+\x48\x24\x00\x0d\x9b\x56\x7f\x00\xc0\x45\x49\xaf\xe3\x50\x2a\x58\
+\x72\xf1\x92\x95\x65\xd2\x83\x51\x9e\x0d\x80\x00\x20\x62\x50\x01\
+\x50\x9f\xea\x0a\x80\x4a\x78\xf9\x5f\xa0\xab\x07\xf2\x75\x91\xf3\
+\xf7\x00\x28\xba\x6f\xe0\x48\x14\x72\x71\x68\x8c\xa4\xd4\x2d\x5a\
+\x35\xda\xed\x1d\x76\x8f\x88\xc6\x31\xf4\x6b\xaa\x83\xb4\xd5\x2f\
+\x5c\x7d\x59\x0c\xb1\x13\x95\xcf\xe7\xeb\x61\xf1\xa1\x4c\x5e\x39\
+\x9e\x7a\xed\xad\xb3\x1e\x83\x20\xf8\x3e\x16\xe7\x64\xd0\x9f\x04\
+\x18\xf4\x09\xc0\x59\xd7\xb4\x1d\xaf\xd0\x7f\x4a\x7a\x1d\xaf\x26\
+\xc0\x19\x5b\x36\x56\x5f\x93\xf4\x3a\x8a\xe2\xad\x86\x00\x95\x9e\
+\x8a\x86\x4f\x03\x14\x49\x75\x05\x00\xd0\x79\xc1\x11\xc4\x0d\x28\
+\x01\xe8\x5e\x36\x6f\x9b\xaa\xae\x09\x7d\xbe\x08\xe6\x87\xc6\x48\
+\xc2\x8c\xc5\x1d\xc3\x9c\xcf\xfc\x12\xc0\xcc\x18\x1f\x53\x03\xf5\
+\x3f\xae\x6f\x6a\x5b\x10\xe3\x33\x12\x90\x31\x69\xc6\x76\xbd\x85\
+\x57\xfd\xdd\x15\x15\xc5\xc3\xa1\x71\xd5\x63\x5a\x68\x8c\xb4\x1b\
+\xf4\x09\x40\xce\xc9\xe7\x00\xa4\x72\x2f\x47\x44\x3e\x59\x0e\x53\
+\xe6\x6c\xae\x01\x4e\xa6\x02\xa0\xde\x60\x0b\x00\xa9\x3f\x05\x60\
+\xf0\x83\x54\x3a\x06\xfc\xa5\x4e\xfa\xd5\x3c\x78\x04\xd3\xcf\x69\
+\x7a\x68\x94\x41\x9c\x12\x52\xc9\xe7\x0b\x37\x03\x68\x2c\xc1\xc3\
+\xb2\x10\xdc\xd6\xd0\xdc\x76\x49\x09\x9e\x55\x12\x6a\x70\x1a\x4b\
+\x80\x4d\x9d\xb7\x9d\xf7\x9a\xf1\xe2\x8a\xf0\x04\x00\x02\x56\x00\
+\xca\x59\x7d\x53\xc7\x59\x10\xfd\x40\xd2\xeb\x38\x8a\x29\x75\x0b\
+\xdb\x2e\x4e\x7a\x11\xc7\x64\x70\x0d\x70\x12\x47\x00\x01\x40\x32\
+\xe1\xa7\x00\x20\xe9\xed\x01\x98\xda\xdc\x3e\x1e\x8a\xd0\x49\x85\
+\x8a\x7d\xfb\x06\xfc\x29\x5e\xd1\xbf\xd3\x03\x47\x90\xf1\xc8\x97\
+\x55\x1f\x40\x7d\xf3\xea\x7f\xe8\xbb\x3c\xac\x54\x2a\x15\xb8\x73\
+\xda\xa2\xd5\xd3\x4b\xf8\xcc\x38\x05\x77\xda\x2b\x70\xd8\xca\x95\
+\x88\x41\x02\x00\x9c\x39\xd8\x27\x02\x0e\xea\x04\x40\x9d\xff\x47\
+\xd8\xce\x3a\xd8\x09\xe0\xd3\x00\xd6\x5a\x05\x74\x2a\x1f\xb6\x8a\
+\x15\x07\xab\x6b\x80\xa5\xc4\x63\x80\x0f\xf2\xde\x87\x27\x00\x9a\
+\xde\x0a\x80\xa8\xb7\x98\x2e\xf9\xc7\xae\x3b\x2e\x18\xf0\x9e\xe9\
+\x6e\xbf\xf7\x01\x18\x4c\x05\x54\xf1\x65\x73\xf4\xaa\xee\xda\xd5\
+\xe7\x01\xfa\xb9\x04\x1e\x3d\xc2\x7b\xfd\x49\xb9\x5f\xa5\xdc\x57\
+\xed\xb1\x18\x00\x75\xd8\x04\x40\x7d\xf4\x90\x41\xec\x6c\x8d\x1b\
+\x36\xd5\x20\x4e\x6a\x0d\xda\x04\xa0\x61\xd1\xea\xa9\xa2\x6a\x72\
+\x37\x3a\x00\x28\xb0\xc5\x79\x99\xd7\xb5\x7c\xf6\x17\x6b\x7a\xa2\
+\xb9\x00\x2c\xfe\x82\x01\xc0\xdb\xa7\x2f\xbc\xef\x64\xa3\x58\xe6\
+\xcc\xae\x01\x8e\xa2\x44\x12\x80\x4c\x21\xb2\xb8\x0f\x60\x54\x5f\
+\x22\x94\x42\x12\x9e\x00\x08\xd6\x85\x7c\xf9\xc6\x96\xf9\xfb\x60\
+\x90\x14\x2b\x24\xce\x7d\x74\x33\x33\x16\x77\xe4\x9c\xd3\x6f\x20\
+\xb1\x9f\x9f\x7a\x72\x6f\x3e\x5a\x9a\xcc\xb3\x6d\x78\xcd\xcf\x80\
+\xc1\xef\x9f\x97\xc3\x37\xaf\x1e\x3f\x69\xff\x23\x00\xf6\x85\xc6\
+\x07\x06\x77\x1f\xc0\xa0\x4d\x00\xd4\xfb\xcf\xc0\xee\xbf\x6f\x6f\
+\xc6\xb9\xb7\xac\xbd\x65\x56\x37\xd0\x77\xfe\x59\xdc\xbb\x00\xec\
+\x35\x88\x9d\x8b\x90\xbb\xca\x20\x4e\x2c\x8c\xae\x01\xde\x75\xb8\
+\x7d\xba\x52\x38\x73\xdf\xd3\x5b\x11\x3e\x1a\xd4\x6d\xa8\x99\x9c\
+\xca\x3e\x12\x88\x06\x7f\x42\x11\x95\xf0\x6b\x54\x05\xad\xc1\x31\
+\x80\xb2\x38\x76\x95\x2f\x44\x37\x84\x4e\x9a\x33\xf0\x8e\xfa\xe6\
+\xd6\x64\x87\x9a\x05\x50\x51\x8b\x37\x56\xbf\x7f\x3f\x0e\xbb\x75\
+\xf5\x9b\x25\xf3\x0b\x40\x58\x62\x0b\x00\xa2\x83\xbb\x0f\x60\x50\
+\x26\x00\xf5\x0b\x57\x9f\x0e\xc0\xee\x48\x8e\xe8\xa7\xd6\x2e\x9b\
+\xd9\x7e\xe8\x2f\x75\xdd\x3c\xf3\x71\x00\x37\x5a\x84\x57\x85\x59\
+\xa5\x22\x06\x65\xdb\x00\x08\x00\x7d\xa3\x6d\x83\x8f\x04\x15\xd4\
+\xa7\xb2\x0f\x40\x20\xc1\x09\x80\x57\x1f\x9e\x00\xf8\xf0\x04\x40\
+\x80\x31\x0d\xd7\xb5\x95\xea\x82\xae\x01\x99\x76\xcd\xaa\x53\x54\
+\xf1\x8f\x49\xaf\xe3\x00\xf9\x8f\xbe\x59\xfa\xe5\x47\x10\x3c\xb8\
+\x0a\xc0\xa3\x1b\x6e\x9f\xb3\xf3\xc8\xcf\xd0\xe0\x2a\xad\x88\x0e\
+\x96\x7e\x8b\xc3\x1a\x94\x09\x00\xe0\x6f\xc0\x81\x11\x9b\x16\x7e\
+\xd6\x75\xf3\xec\xaf\x1f\xf6\xdf\xec\xef\xfd\x57\x00\x3d\x06\xcf\
+\x68\x9c\x7a\x6d\xc7\xeb\x0c\xe2\xc4\xa0\x7c\x67\x00\x1c\x22\x7c\
+\x1c\xb0\x2b\xa4\x6e\xcf\xf5\xe2\x25\x2b\xb3\x0a\x4c\x09\x0e\xe4\
+\xc2\x2b\x00\x92\x35\x19\xbe\x02\x2d\x94\xa4\xa3\x7e\xc0\xa2\x4c\
+\xf6\x53\x00\x86\x27\xbd\x8e\x3e\x23\x72\x3e\xf3\x6f\x49\x2f\x62\
+\x80\x82\x13\x80\x23\x35\x00\x1e\x24\xde\x85\x1f\x05\x54\x99\x56\
+\x4e\x53\x5b\xfb\x6b\xd0\xfd\x87\xd5\x2d\x5a\x35\x1a\x8a\x85\x46\
+\xe1\xf6\x4a\x06\x1f\x05\xe4\xb0\xd7\xac\x74\xdd\x71\xc1\x4b\xa2\
+\xf8\xb6\xc9\x93\x5c\x21\x95\x55\x00\x85\x06\x27\x26\x49\x35\x00\
+\xbe\xfc\x7c\x83\x61\x40\x3e\x85\xd3\x00\x5f\xdc\x54\xfd\x7a\x00\
+\x95\x81\x61\x54\xab\xf6\xac\x0f\x5d\x4b\xe7\x4d\xb3\x9f\x50\x83\
+\x44\x0b\x92\xde\x04\xa0\xe1\xea\xfb\xc7\x09\xf4\xfd\x49\xaf\xe3\
+\x50\x0a\xb9\xb2\xa1\xa9\x75\x4e\xd2\xeb\xe8\x8f\xbe\x01\x68\xc1\
+\x89\xab\x1c\x23\x01\xf0\x36\x27\x01\x6a\x1a\x36\x77\x94\xfa\xe6\
+\xd8\x92\x19\x74\x09\x80\xf3\x99\x6b\x61\x96\xa1\xcb\x97\x3a\x6f\
+\x9a\xfd\xc4\xd1\x5e\xa1\x88\x0e\x5f\x1d\xe8\xef\x93\xe0\xde\x65\
+\x11\x27\x06\x06\x47\x00\x5d\xa2\x09\x80\x57\xd9\x16\x1a\x23\x8d\
+\xf7\x01\x64\xc4\xe0\xd3\x3f\xf0\x64\xf7\xd7\xe7\x5b\x54\xb1\x20\
+\x50\x8b\xb3\xd7\xa9\xed\x03\xd0\x5c\xf6\xe3\x48\xcd\x38\xf1\x97\
+\x89\x8a\x7c\xb9\x1c\xe6\x89\x1c\xd4\x97\xb8\x06\x1f\xaf\x13\xf8\
+\xa3\x26\x00\x5a\xbd\xbb\x13\x16\x57\x03\xab\x0e\xda\x3e\x80\x41\
+\x96\x00\xa8\x00\xba\xd8\x28\xd8\x53\x15\x39\x77\xcc\xf2\x5a\x57\
+\xcb\xbc\x2e\x00\xdd\xe1\x8f\xd3\xe9\x53\x16\x77\x9c\x14\x1e\xc7\
+\xdc\x60\xd8\x02\x08\xee\x01\x80\x6a\xe8\x59\xfb\x18\x98\x6c\xcf\
+\x6c\x30\x88\x01\x00\x10\x8b\xe3\xb1\x8a\x3a\x83\xa5\x98\x9b\x7c\
+\x55\xeb\x08\x28\xd2\x7a\x64\x77\x5e\xc3\xc2\xb6\x2b\x92\x5e\x44\
+\xb1\x32\x6a\xb2\xff\x5f\x18\xde\xa3\x9d\x47\x7b\x41\xf7\xd7\xe7\
+\xf7\x28\x10\x7c\x03\xe9\x60\xee\x03\x18\x54\x09\xc0\xd4\xa6\xd6\
+\x8b\x00\x39\xcb\x28\xdc\xbf\x15\x7d\x2f\xb7\x9a\x5c\x88\x22\xd9\
+\x82\x7f\x93\x41\x1c\x33\x7d\x67\x75\x83\xbb\xdf\xc5\x27\xbb\x05\
+\x00\x48\x78\x02\x20\x92\xbe\x04\xc0\x60\x44\xb3\x1a\x26\x67\x1e\
+\xe1\x7b\xae\x00\x4e\x4c\xe3\x2d\x6c\xd5\x39\xf7\x97\x00\xac\x6e\
+\x2c\xdc\x07\x60\xf7\x31\x5f\xd5\x0f\xaa\xee\xef\x2d\xe3\xc5\x4a\
+\x9c\x45\x02\xf0\x58\xdf\x6d\x94\x47\x7f\x94\xc5\x36\x80\x07\x13\
+\x80\x72\x20\x70\xd7\x19\x85\x7a\xae\xa6\x27\x5a\x56\xec\x8b\x5d\
+\x26\x73\xa7\xc5\x43\x45\xfd\x9f\x5b\xc4\xb1\x12\xe9\x7e\x8b\xc6\
+\xc4\xa8\xb0\xb7\x66\xa3\x41\x9c\x81\x53\x35\xa8\x00\x04\x4f\xdb\
+\x33\x67\x31\xa2\xd9\x29\x8e\xba\xc5\xd5\xaf\x58\x4e\x2c\x12\x00\
+\x64\xd5\xa5\xef\xf6\x3b\xd1\x45\x26\x71\x14\xcf\x0a\xfc\x79\x35\
+\x3d\xd1\x58\xa8\xfc\x87\x49\xcc\x03\x81\xcf\x6d\xb8\xb6\xfd\xcf\
+\xec\xe2\xc5\x47\x35\xfc\xea\x6a\x00\x5d\xc5\xbc\x48\xd4\xa0\x2a\
+\x25\x4c\x00\x52\x6f\xc6\xe2\x8e\x61\x10\xbc\xdd\x22\x96\x08\xbe\
+\x52\x4c\x76\x79\xd0\xda\x65\x33\x1f\x82\xc1\x0f\x52\x85\xbc\x21\
+\x55\x03\x67\x24\xbc\xc4\x2c\xc0\x53\xdd\x2b\xea\x82\xa7\xc4\x85\
+\x70\xd0\xed\xc1\x41\xd2\x58\x01\xb0\x18\xd1\x6c\xd8\xa0\x39\x7a\
+\x7c\xcf\x7a\x18\x0c\x5f\xf1\x2a\xa9\xda\x06\x98\x76\x6d\x7b\x1d\
+\x4c\xee\x5b\x80\x8a\xca\xd5\x9d\xcb\xe7\x3e\xf8\xc0\x8a\x79\x7b\
+\xbb\x5a\x66\x7d\x0c\x90\xcf\x1b\xc4\x05\x00\x78\xa7\x9f\xb2\x8a\
+\x15\x2b\x83\x23\x80\x02\x1c\xb5\xfc\x7f\x90\x77\x26\x8d\x80\x63\
+\x1b\xae\x6b\x3d\xd5\x20\x4e\xea\x0c\x9a\x04\x60\x7f\xc1\xbf\x15\
+\x40\x8d\x41\xa8\xed\x51\xd5\x9e\x6f\xf4\xfb\xab\x1c\x2c\xaa\x00\
+\xa3\x1f\xad\x19\x9f\xa6\x2e\xe8\xc1\xb0\xff\x0f\x38\x83\x2d\x80\
+\x94\xf5\x00\x98\x8d\x68\xce\x64\xcc\xfe\x7c\xfa\x86\xaf\x04\xf7\
+\x14\x08\x34\x55\x15\x00\x9f\x51\xa3\x53\x45\xd2\xd2\x79\xcb\xac\
+\xbb\x0f\xfd\x95\xae\x89\x33\x3f\x07\xc8\x6f\x4c\xa2\x03\x6f\xac\
+\x5b\xd8\x96\xea\xc9\x75\xf5\xef\xbd\xf7\x38\x00\xe3\x83\x03\x89\
+\x2f\xaa\x02\xe0\x44\x6d\xc6\xb6\x17\xdc\xa0\xac\x02\x0c\x9a\x04\
+\xc0\xa9\x37\xb9\x94\x43\xa0\xb7\x0e\xa4\x2b\x5a\x3c\x7e\x64\xf1\
+\x7c\x0f\x49\xcf\x85\x28\x06\x15\x00\x68\x0a\x12\x00\x3f\xf8\x12\
+\x00\xab\x11\xcd\xce\x67\xcc\xb6\x00\x00\x40\xa0\x7f\x08\x8d\xa1\
+\x40\x8a\x12\x00\x15\xd8\x0c\xea\x2a\xa8\x77\xff\xfc\x9a\x5f\x5d\
+\x22\xbe\xe0\xf2\x4d\xb0\x99\x2a\x2a\x0e\xfa\x11\x83\x38\xf1\xa9\
+\xac\xb4\x28\xff\xc3\xf9\xe2\x2a\x00\x9d\x37\xcd\x79\xca\xe2\x78\
+\xaa\x8a\x67\x02\x90\x56\x93\xaf\x6a\x1d\xa1\x90\x37\x5b\xc4\x8a\
+\x80\x6f\x0d\xe4\xeb\x72\x15\x99\x56\x98\x0c\x05\x92\x0b\xc3\x63\
+\x18\x91\xf0\x19\x00\x48\x41\x05\x40\x9c\x1f\x74\x4d\x80\x46\x23\
+\x9a\x7b\x1e\x5a\x7e\xee\x8b\x06\x71\x5e\xa6\x8a\xe0\x04\x00\x48\
+\x4f\x0f\xc0\xb4\x45\x1d\x33\x01\x58\x94\x7f\x57\xac\xbb\xa5\xf1\
+\xb0\x1d\xe9\x8f\x2c\x3b\x6f\x93\x40\x4d\x8e\x13\x43\xe5\x2f\x1b\
+\xae\x5e\x9b\x96\x41\x45\x87\x61\x32\x42\x79\xe7\xc3\x2d\x73\x36\
+\x15\xfb\x62\x51\x3c\x68\xf0\xcc\xb2\x9a\xb5\x50\xac\x41\x91\x00\
+\x0c\xab\x94\xcb\x61\x70\xae\x14\xc0\xbd\xdd\xcb\xe7\xfc\x7e\x20\
+\x5f\xb8\x66\x69\x63\x1e\x8a\x55\xa1\x0b\x10\xe0\xbc\xd4\x4c\x9e\
+\x32\xe8\x32\xb7\xdc\x63\x1e\xb0\xc8\x85\x27\x00\x48\x5d\x13\xa0\
+\xc5\x9f\xcd\x53\xe1\x31\x5e\xc5\xb9\x47\xc3\x83\xe8\x49\x75\x1f\
+\x5e\x69\xb1\x9d\x17\xcc\x47\xd1\x3b\x2c\xe2\x88\x97\xa3\x36\x15\
+\xe7\x72\xd9\x7f\xc5\x81\xdb\x46\x43\x8d\x40\x76\x5f\x5a\x67\x8a\
+\x40\x0c\x8e\x79\x8a\x68\xd7\x91\x86\xb3\x1d\xe1\x0b\x0c\xee\xa9\
+\x90\xb9\xa9\xf9\xb9\x6c\x68\x50\xfc\x07\xa9\xc2\xe6\x4e\x6e\xc5\
+\x37\x43\xbe\x5c\x80\xdf\x1a\xac\x62\x74\xc3\x93\x1d\x89\x7f\x02\
+\x9a\xb1\xb8\x23\x07\x09\xdf\xab\xb3\xdc\x63\x1e\x28\x97\xe9\x0d\
+\x4e\x00\x04\x18\x95\xaa\x61\x2b\x62\xf0\xa9\x54\xe4\x69\x83\x95\
+\xbc\x82\x4d\x05\x00\x22\x3d\xd5\x16\x15\x8e\x70\x22\x16\x09\xc0\
+\xc6\xce\xd3\x66\xae\x3c\xda\x0b\xd6\x2c\x6d\xdc\x22\xd0\xff\x36\
+\x78\x16\x14\xb0\x39\xb1\x10\x03\x8b\xed\x1d\xaf\x52\x54\xf9\xff\
+\x4f\x0f\xf5\x6d\xa1\xcf\x04\x30\x2a\x0d\x3f\x97\xad\x95\x7d\x02\
+\x70\xd6\x35\x6d\xc7\x03\x78\x83\x41\xa8\x6d\x7b\x6b\x47\xff\x20\
+\x24\x40\xa4\xce\x22\x01\x00\xbc\x26\xde\x07\xb0\x7f\x3f\x26\x00\
+\xc8\x86\xc6\xc9\x66\x24\xf1\x04\xa0\x6a\x97\x49\x05\x20\x3b\xf9\
+\xaa\x36\xab\x73\xe0\xc1\x14\x1a\x7e\x85\xb4\xc2\xbc\x02\x50\x99\
+\x73\x16\x09\x00\x90\x95\xc4\xef\xc6\x98\x7a\xdd\x03\x53\x60\x71\
+\x67\xbd\xe0\x87\x58\x22\xc7\x9c\x48\xa7\x92\xf9\x3a\x80\x28\xf8\
+\x79\xc0\xf9\xe7\x34\xb5\xa6\x72\x7c\xad\x4a\x78\x02\xe0\x20\x45\
+\x35\x00\x1e\x94\xf7\xd2\x06\xa0\xf8\x8a\xc1\x11\xa8\x46\xf3\x42\
+\x63\xa4\x4d\xd9\x27\x00\xb9\xac\xbe\x13\x16\xf7\xd5\x03\x3f\xda\
+\x70\xe3\x19\xfb\x83\x22\xec\x19\xb6\x1a\x40\x71\xc3\x83\x8e\x42\
+\xd5\xcf\x0a\x8d\x11\x2c\x53\xb0\xf8\x01\xbc\x73\xcd\xd2\xc6\xf0\
+\xf9\xf0\x81\xfa\x8e\x74\x86\xfd\xd9\x02\xc8\x55\x45\xe9\xd9\x06\
+\x50\x39\x25\x38\x04\xec\x13\x80\xbe\x3f\xef\xe0\xd1\xcb\x50\x93\
+\xfe\x93\x20\xae\x20\x6f\xb4\x88\x23\x8a\x9f\x16\xf3\xba\x03\x37\
+\x8c\x4a\x51\xaf\x3d\xd6\x23\x23\xe7\xde\x6d\x10\xc7\xd4\xd4\xeb\
+\x5a\x4f\x10\x20\x78\xa4\x76\xe4\xfb\x57\x01\x58\x7f\xeb\xec\xad\
+\x6a\x70\x3a\x45\x55\xce\x0b\x8d\x91\x36\x65\x9f\x00\xc0\xcb\x55\
+\x16\x61\x54\xf4\xbb\xa1\x31\xba\x57\xd4\xf5\x42\x0c\x6e\x45\x13\
+\x99\x19\x1c\x23\x7c\x11\x16\x33\x00\x12\xff\xf4\x7f\x88\xe0\x2a\
+\x80\x8b\x72\xa9\x49\x00\x04\x08\xae\x00\x38\xd8\x6f\x01\xf4\x09\
+\xee\x03\x70\x9a\x7c\x05\xc0\x8b\x58\x0c\xd6\xd9\x91\xcb\x65\xee\
+\x2d\xf6\xc5\xea\x74\xa9\xc1\x33\x01\xc5\x02\x93\x38\x86\xd4\x9b\
+\x9c\xee\xd0\xaa\x4a\x59\xd7\xdf\x2f\x72\x62\x72\x5d\xf5\xc5\xa1\
+\x31\xd2\xa6\xac\x13\x80\xba\x45\xab\x26\x43\x10\x5c\x2e\x57\x60\
+\xcb\x98\x09\x7b\xef\xb1\x58\x13\x20\x16\xdb\x00\x53\xce\x5c\x78\
+\x5f\xb2\xe5\xe6\xc1\xd2\x00\xf8\x27\xe1\xdb\x00\xce\xa7\x26\x01\
+\x50\x83\x04\x20\x8e\x2d\x80\x3e\xe1\x47\x01\x45\x27\x5b\x2c\x64\
+\xa0\x2e\x5e\xb2\x32\x2b\xc0\x45\xc1\x81\x04\xbf\x5a\xb3\xb4\x31\
+\x5f\xec\xcb\xc7\x8c\xdf\xf3\x4b\x00\xcf\x07\x3f\x17\x5a\xdf\xb0\
+\x70\x75\xf8\xf6\x85\x21\x67\x73\xbc\xf3\xc9\x35\x4b\x1b\x77\xf4\
+\xf7\x8b\x63\x9a\x71\x6d\x00\x00\x20\x00\x49\x44\x41\x54\x14\x6a\
+\xd1\x07\x30\xa1\xae\xb9\x75\x50\xf5\x01\x94\x75\x02\xe0\xa2\xec\
+\x0d\x00\x82\x1b\xb3\x04\xf2\xc3\xbe\x21\x26\xc1\xd4\x7b\x83\x8e\
+\x53\xb8\x9c\xcf\x24\x7c\x2b\x5a\x78\x05\xc0\xab\x04\x5f\xc4\x61\
+\x28\xbc\x11\xd0\xbb\x54\x24\x00\x75\x0b\xba\x2b\x00\x8c\x0d\x8d\
+\xa3\xea\x9f\x31\x58\xce\x6b\x88\x45\x23\x60\xc2\x15\x80\xad\x9b\
+\x87\xcd\x04\x30\x22\x34\x4e\xb1\xe5\xff\x83\xfa\x7e\x0e\xdd\x11\
+\xfa\x5c\x00\x50\xd5\x54\x55\x01\x4c\xe6\x3b\x08\x06\x74\x4a\x0b\
+\x51\x78\x05\x00\x00\x9c\x4a\xaa\xc6\xb5\x87\x2a\xdb\x04\xa0\xe1\
+\xba\xd6\x53\x21\x36\x13\xba\x04\xe1\xe5\xff\x83\x34\xe3\xd7\xc0\
+\xa0\xe1\x44\xc4\x25\xda\x07\x20\xa2\xe1\x15\x00\x97\xa2\x2d\x00\
+\xb5\xa8\x00\xa4\x63\x18\x90\x1f\xb1\xfd\x24\x18\x24\xbe\xea\xdc\
+\x0b\x06\xcb\x79\x2d\x09\x1f\x06\x04\xc1\xf8\xbe\x7b\xe3\x93\xa1\
+\x26\xe5\x7f\x8f\x42\xe1\xe7\xfd\xfd\x22\xe7\xdc\x6d\x06\xcf\x06\
+\xa0\xa9\x3a\x0e\x28\x06\x77\x3c\x88\xea\x80\x6e\x5e\xad\xa8\xcc\
+\x76\x02\xd8\x15\xfa\x7c\x00\xa9\xba\xb0\x2d\x54\xd9\x26\x00\x5a\
+\xc0\x17\x00\x54\x1b\x84\x7a\xee\xcc\x9e\x4d\x36\xdd\xfb\x00\xba\
+\x97\xcd\xdb\x06\x83\x2b\x28\x01\x24\x7d\x07\xb5\xc1\x27\xb0\x14\
+\x6d\x01\x88\xc5\x85\x40\xe9\x48\x00\xb2\x9a\x0d\x2f\xff\x03\xd8\
+\x57\x73\x5c\x2c\x09\x40\x24\xf2\x98\x41\x98\xec\x96\x4d\xc3\x93\
+\xbb\x1e\x5b\x2d\x4e\xe2\xc8\xc3\x9d\xb7\x9d\xd7\xef\xdf\x63\xab\
+\xbb\x45\x00\x4c\x9b\xb2\xe8\xfe\xe0\x71\xd1\x76\xc2\x47\x3c\x7b\
+\x1d\x58\x05\xa0\x6f\x1b\xa6\xe8\x5e\x8c\x23\x12\x5c\x38\x63\x71\
+\xc7\xb0\xe0\x38\x29\x51\x96\x09\xc0\xd4\xa6\x07\x2e\x86\xc8\xb5\
+\x16\xb1\x14\xf2\xdd\x15\x2b\xae\xb4\x38\x7a\xf3\xa7\x98\x22\x1d\
+\x06\x61\x4c\x46\x66\x0e\xc4\x8c\xc5\x1d\x63\x60\x50\xfe\x54\xf1\
+\x29\x4a\x00\x06\xcf\x95\xc0\x62\x71\x04\x10\xd8\x11\x7c\xea\xe5\
+\x08\xaa\xb2\x99\x8d\x16\x71\x9c\xfa\xe0\x93\x0e\x03\xb2\x44\x1d\
+\xc4\xe2\xf2\x1f\x0d\x18\x0c\x26\xff\x1b\xfe\x7c\x20\xe7\x73\x26\
+\x13\x52\x43\xf5\xfd\x4c\x19\x17\x1a\xc7\x61\x80\x5b\x00\x00\x54\
+\xc4\xa2\xcf\xab\x6a\x7f\x6f\xba\x6e\x6d\x0d\x51\x76\x09\xc0\x8c\
+\xc5\x1d\x23\x45\xdc\x4d\x30\x28\x81\x02\x00\x44\xbf\x6d\x12\xe7\
+\xd0\x90\x5e\x57\x1b\x84\x79\xfd\xe4\xeb\x1f\xab\x34\x88\xd3\x6f\
+\x85\xc8\xa0\xfc\x0f\x44\x55\x99\x8a\xa2\xc7\x75\xc6\xce\x1b\xdc\
+\x08\x98\x96\x2b\x81\xd5\x05\xff\x20\x55\x20\x9e\xf2\x3f\x80\xbe\
+\x26\xad\x7e\x37\x6a\xbd\x86\xc5\xb0\xa3\x01\xe8\x1b\xf8\x32\x32\
+\x34\x8e\xa8\xde\x3f\xd0\xaf\x55\x44\x26\x09\x00\xa0\xa9\x48\x00\
+\x7a\x23\x6f\x72\x02\x20\x57\x91\x7d\x64\xc0\x5f\xec\x71\xf7\xb1\
+\x5f\x75\x6c\xe2\xf4\x6a\x8b\x38\x69\x50\x66\x09\x80\x4a\x6f\x3e\
+\x5a\x0e\x93\xf2\x34\x00\xe0\x91\x75\x37\xcf\xb6\xf8\xb4\xfe\x0a\
+\x02\x58\x24\x00\xb9\xca\xdd\xdb\xce\x32\x88\xd3\x6f\x1a\x45\x16\
+\x09\xc0\x93\xfd\xe9\x7e\x8e\xdd\x20\xaa\x00\x28\x7c\x70\x03\xa0\
+\x00\xa6\x77\x00\x1c\xe6\x09\x9b\xc3\x43\x24\x93\x00\x58\x0d\x7c\
+\x89\x7c\x76\xc0\x15\x80\x31\x93\xf6\xdd\x07\x60\x6b\xe8\x1a\x14\
+\xb8\x64\x52\xd3\x4a\x8b\x31\xe9\x61\xeb\x50\x93\x1b\x1e\x9f\x1e\
+\xc8\x09\x80\x83\xba\x27\xcd\xec\x04\xf0\x5c\xf0\x2a\x14\x6f\xee\
+\x1b\x40\x57\xf6\xca\x2a\x01\x68\x68\x5e\xfd\x45\x00\x26\xb3\xb9\
+\x01\x40\x20\x37\x5a\xc5\x3a\x54\xae\x22\xb3\x06\x06\x13\xbd\x44\
+\xc5\xe2\xe2\x8c\x01\x3c\xd8\xa0\x03\x5b\x4c\xfa\x20\xec\x58\x24\
+\x00\x29\xe9\x01\x00\x24\x38\x01\x80\xc9\x51\xb3\xa3\x50\x0d\x4f\
+\x00\xd4\x25\xb3\x05\xa0\x62\x91\x00\x3c\xdd\x7d\x6b\xe3\x80\x7f\
+\x0f\xfa\x4e\x03\xfc\xc4\x60\x1d\xc3\x46\x60\xf8\xc5\x06\x71\x82\
+\x58\xdc\x01\x80\x01\xee\xff\xbf\x6c\x89\x78\x88\xde\x15\xbc\x0e\
+\xa0\xa2\xc2\x89\xcd\xf8\xf9\x84\x95\x49\x02\xa0\x52\xdf\xdc\xfe\
+\x39\x85\x7e\xd2\x30\xe8\xd6\x5c\xce\xdd\x62\x18\xef\x65\x6b\x96\
+\x36\xee\x81\xc1\x30\x14\xb1\xb9\x39\xab\xdf\xd4\xe0\xa2\x19\xb5\
+\x69\x62\xb2\xa3\x06\x37\x02\xa6\x26\x01\x80\xc1\xa7\x0f\x89\xb5\
+\x02\xa0\x4e\x83\xb7\x7f\x7c\x42\x15\x00\x00\x16\x27\x70\x06\x5c\
+\xfe\x3f\x48\x05\x26\xdb\x00\x5e\x90\x86\x3d\x6b\x83\x0a\x80\x84\
+\x25\x00\x00\xc4\x3b\x8b\x04\x00\x1e\xde\xa4\x07\x2d\x69\xa9\x4f\
+\x00\xea\x16\x74\x57\xd4\x37\xb7\x2f\x07\xf4\xb3\xb6\x91\xf5\x1b\
+\x7d\x6f\xd4\x71\x59\x1b\x1c\x41\x92\x6a\x04\x0c\x9f\x01\x90\xaa\
+\x13\x00\x00\xe0\x0c\xee\x03\x48\xc9\x16\x00\xa0\x06\x15\x00\x1f\
+\x5b\x0f\x00\x00\x88\x0f\xdf\x02\x10\xd5\x92\x57\x00\xfa\x6e\x21\
+\x0c\x1e\xa0\x23\x1a\xd2\x00\x78\x80\xcb\x57\xfd\x0a\xc0\xde\xe0\
+\xb5\x40\x2d\x8e\x34\x86\xb2\xd8\x02\x08\x4e\x00\x86\xef\x2e\xfc\
+\x1a\x06\xe3\xda\x45\x64\x56\x43\x53\x5b\xe2\x77\xb6\x84\x4a\x75\
+\x02\x50\xb7\x68\xd5\x68\x57\xdb\xf3\x33\x00\xd6\xd9\xd6\x36\xec\
+\xcf\x7f\xc5\x38\xe6\x2b\x49\x3f\x6f\xac\x3a\x1c\x45\x32\x5b\x00\
+\x30\x68\x02\x14\x97\xae\x2d\x80\xa8\x60\x74\x23\x60\xf2\x04\x12\
+\x3c\x4f\x5d\x55\xe2\x4d\x00\x04\x06\x5b\x00\x09\x54\x00\x76\xd7\
+\x4c\x83\xc1\xcf\xc5\x08\x2e\x38\x01\xe8\xbc\x6d\xda\x6e\x05\x7e\
+\x1d\x1a\x07\x40\xdd\xd4\xeb\x5a\x4f\x30\x88\x33\x20\x7d\x27\x00\
+\x4e\x0c\x8d\xe3\x35\xbc\x02\xf0\xc0\x8a\x79\x7b\x05\x26\xdb\x00\
+\xf0\x82\x7f\xb0\x88\x93\xa4\x94\x26\x00\x2a\x53\x9b\x5a\xaf\x76\
+\x3e\xf3\x08\x14\x71\x64\xaf\xff\xd4\x75\xc7\x05\x16\x37\xc4\x1d\
+\x99\xf7\xe1\x09\x00\x70\x4a\xdd\xa2\x55\xa3\x0d\xe2\x14\xad\xaf\
+\x61\x28\xf8\x07\xaf\x44\x3e\x55\x09\x80\x64\x4d\x6e\x04\x3c\x2e\
+\x0d\x57\x02\xab\xc1\x14\x40\x07\x8d\x75\x0b\x20\xf2\xce\xa2\x09\
+\xf0\xe4\x52\xff\x7e\x3b\xe7\xa7\x1b\x84\xc9\xef\xaf\x3d\xce\xe2\
+\xfb\x1f\x50\xfc\x9f\x41\x14\x71\x05\xcc\x37\x88\x33\x20\xbd\x79\
+\x1f\xbe\xff\x0f\xc0\xe5\xf7\x05\x27\x00\x00\x00\x75\xb7\x5b\x84\
+\x11\xe0\x4d\x53\x17\xb5\xbd\xc5\x22\x56\x52\x52\x97\x00\xd4\x35\
+\xb7\x9e\x5d\xdf\xdc\xfe\x6b\x11\xb9\x15\x06\xe7\x46\x0f\x63\x83\
+\xef\xa9\xf9\x5a\x0c\x71\x5f\x41\xb2\x30\xf9\x01\x20\x91\x94\x74\
+\x1b\x60\x44\xa6\x66\x32\x0c\xfe\x5e\xec\x2d\xc0\x62\x18\x8c\x9d\
+\xfd\xd5\x26\x57\x02\x9f\xb9\xf0\xfe\x1a\x83\x38\xa1\x82\x2b\x00\
+\x90\x98\x2b\x00\xce\xa0\x09\x10\xa8\x6c\xb8\x7a\x95\x45\xc3\x63\
+\x3f\xc8\xb9\x06\x41\x7e\x6f\x35\x63\x21\xa3\x26\x67\xd7\xa1\x0e\
+\x97\x58\xc4\x19\x08\xa3\x06\xc0\x67\xad\x3e\xb4\xe5\x2a\xdc\x2f\
+\x14\x30\xb9\xa5\x54\x22\xdc\x58\xff\xde\x7b\x53\xb2\x35\xd8\x7f\
+\xe9\x48\x00\x96\xa8\x6b\x68\x6e\xbb\xa4\xbe\xb9\xed\x87\x7d\x77\
+\x3d\xc7\xf5\x97\x55\x05\xf8\x40\xf7\x8a\xba\xde\x98\xe2\xbf\xac\
+\xf3\xa6\x39\x4f\xc1\xe0\x18\x0f\xe0\x4a\xba\x0d\xe0\xd5\x5b\xdc\
+\x23\xfe\xdc\x86\xdb\xe7\xec\x34\x88\x63\xa6\xf3\xb6\x69\xbb\x01\
+\x04\xff\xb9\x67\x0b\x55\x89\x7e\xb3\xf7\x5d\x12\x15\x3e\x1f\x22\
+\xae\x31\xc0\x7d\xa6\xf4\x6c\x7c\x06\x40\xf8\x31\xd0\xac\x2b\xe9\
+\x36\x80\x40\xc3\x2b\x00\xaa\x0f\x19\x2c\x05\x00\xb0\xf6\x96\x99\
+\xbf\x87\xe2\xd9\xe0\x40\x36\xa3\x8d\x07\xc4\x3b\x83\x0a\x80\x0c\
+\x6c\x04\xf0\xe1\xac\x59\xda\x98\x17\xe0\x3b\x26\xc1\x04\xa7\xa1\
+\xa2\xe2\xb6\xbe\xfb\x39\xca\x4e\x62\x09\x40\xfd\x7b\xef\x3d\xae\
+\x7e\xe1\xea\xcb\x1a\x9a\x5b\xff\xb3\x61\x53\xfb\xe3\x0a\xdc\x8d\
+\x03\x47\xfc\xe2\x5c\xd3\xd2\xce\xe5\xb3\x8d\x6e\xfd\x3b\x36\x41\
+\x78\x15\x40\x44\xa6\x5a\xac\xa5\xe8\xe7\x79\xbc\x3e\x38\x88\xc5\
+\x65\x30\xf1\x08\x1f\x06\x94\x8d\x12\x4d\x00\x2a\x5d\x2e\xfc\xd3\
+\x3f\x00\xf4\xf6\xc6\x9a\x00\xf4\x4d\xd7\x0c\xbf\x6e\x58\x33\x25\
+\x6b\x04\x9c\xb1\xb8\x23\x67\x71\x61\x8d\x00\x0f\x5b\xac\xa7\x2f\
+\x9a\x42\xd4\x62\x80\xcd\xe9\x0d\xd7\xb5\x26\x72\xaa\x42\x54\x82\
+\x13\x00\x31\x68\x00\x3c\x94\x66\xfc\xd7\x61\x70\x67\x0b\x00\x40\
+\xf0\x16\x37\xbc\xe7\xae\x69\xd7\xac\x4a\xe6\xd8\x6a\x80\xc3\x5e\
+\xb6\x51\xb7\xa0\xbb\x42\x6a\x77\x5d\xec\x80\xb3\xa1\x6e\x9c\x8a\
+\xf6\xfb\x4d\xd9\x89\x97\xd3\x8e\x7b\xe6\xd4\xe3\xaa\x77\x8c\xab\
+\xcc\xf5\x0e\xdf\x9f\xaf\xa8\xea\x2d\xe4\xb2\xdb\xf7\xd7\x8e\xd8\
+\xb1\xb7\x76\xe4\x8e\x7d\x15\xa3\xa0\x1e\x6a\x34\xd0\xef\x58\x46\
+\x56\xef\xda\x7e\xd3\x3b\x3f\xbf\x77\xcc\x07\xa7\xfd\x6b\x49\x1e\
+\x08\xe0\x6f\x7f\xbe\xae\xb6\x6d\x53\xd8\xfb\xf7\x29\x23\x9f\x7f\
+\xf3\xca\xb6\xd2\xad\xf9\xe3\x3f\x7e\xf4\xb2\x87\x9e\x09\x6b\x82\
+\x9e\x7e\xca\xa3\xa3\x4a\xb9\xe6\x62\xbd\xa3\x65\x67\x76\xfb\xbe\
+\xb0\x09\xc7\x7f\x73\xe1\x2d\x9f\x7e\xcb\x07\xa6\x59\x94\xb7\x07\
+\x64\xd5\xc6\xaf\x8d\xfb\x87\x5f\x7c\x24\x28\x86\x40\xf5\xee\x0f\
+\x5f\xff\x09\xf9\xe8\x34\x9b\x1f\x80\x47\xf0\xbe\xff\x79\x21\xfb\
+\xf4\x8e\xb0\x5d\xbc\x2b\x1a\xee\xfe\xe8\x3d\x6d\xd3\xce\x33\x5a\
+\xd2\x51\x3d\xf8\xf4\x97\x8e\xff\xc4\x5d\x1f\x0f\xfe\x24\xf7\x37\
+\x97\xdc\x32\xeb\xcf\x3f\x64\xf7\xf7\xff\xbf\xdb\x7f\x35\xfa\x8e\
+\x07\xc3\xef\xa0\x69\x9e\x71\xd7\x7f\x5d\xfd\xfe\x69\xeb\x0d\x96\
+\xd4\x2f\x97\xdd\xb4\x7f\xd6\xbe\x42\x58\xd1\xea\x5d\x0d\xbf\x3e\
+\xf3\x1e\xd3\x9f\x29\x1f\xc4\xc2\xef\x7e\x6e\xe3\x13\x2f\x9d\x74\
+\x9a\x49\x38\xc1\x1b\xa5\x02\x1b\xaf\xf8\xd4\xf7\x9f\x18\x3b\xfc\
+\xa5\xad\xbd\x3e\xbb\x6b\x4b\xcf\xa8\xe7\x37\xef\x38\xf1\x19\xaf\
+\x2e\xd6\xef\xb3\x23\x2e\x49\xc5\x43\xfc\x0b\xde\xa3\x5b\x77\xd7\
+\xfe\xf6\x70\x95\xef\x57\x24\x00\x0d\x57\xaf\x1d\xae\xd9\xbd\x9f\
+\x00\x7a\x3e\x06\x95\x51\x07\x56\xad\x03\xca\x93\xbc\x3a\xfc\x71\
+\xeb\xa9\x30\xe8\x27\x0b\x56\x91\xcd\xe3\xcb\x6f\xf9\xf7\x51\x63\
+\x87\x6f\xbf\xc1\x28\xe7\x2b\xca\x85\x93\x1e\x44\x68\x02\xb0\x7b\
+\x7f\xf5\xa9\xa2\xfa\x69\xa3\x25\x1d\x53\xd4\xff\x5c\xef\x35\x66\
+\x8d\x5f\xd7\x20\xaa\x89\xdd\x65\x70\x24\x27\x8f\xdc\x82\xd0\x04\
+\x60\x64\xe5\xee\xf7\x88\x26\xf2\xfd\x0c\x00\x18\x5e\x11\x7c\x2a\
+\x0c\x23\xaa\x76\x8b\x93\xc2\xdf\xc4\xfd\xbd\x70\xe6\x98\x4d\x08\
+\x4d\x00\xaa\x72\xfb\xde\x28\xaa\x6f\x34\x5a\xd2\x51\xed\xde\x1f\
+\x7e\xb7\x98\x88\xe2\xc2\x49\x6b\xde\x6b\xf9\x77\xe4\xf2\x29\xf7\
+\xc0\x22\x01\xd8\xb1\x77\xf8\xdb\x45\xf5\xed\x06\x4b\x2a\xda\x4b\
+\x7b\x47\x20\xf4\xcd\x1f\x00\x2e\x3c\xed\xc1\x37\x89\xaa\xe9\x4d\
+\x7c\x1f\x98\xb3\x02\x7f\xfb\xf3\xbf\x32\x8b\x17\x45\x99\xec\x63\
+\x5b\xc6\x9f\xf1\xd8\x96\xf1\x16\xdb\xa8\xc1\x14\x0a\xa8\x40\x04\
+\x90\x9a\x9e\xed\xf5\x0b\xdb\xbf\x22\xf9\xca\xaf\xf4\x6d\x87\x02\
+\x38\xa4\xdc\xde\x70\x5d\xdb\x69\x9a\xdd\xd7\x0a\xc8\xe7\x90\x92\
+\xe3\x4e\x56\x3e\x79\xc1\x6d\x98\x7c\xfc\x93\x25\x7f\xee\x84\x51\
+\xe1\x5b\x77\xdb\xf7\xd5\x62\xc7\xbe\xd2\xf5\x9d\x3d\x15\xf8\x03\
+\x1b\x00\xc6\x8f\x8c\x77\xc8\xdc\x40\xd5\x56\xec\x3e\xf6\x8b\x8e\
+\x61\xd7\xfe\x64\x2f\x02\xdb\xd3\x1b\x3e\xd5\xb5\xa6\x22\xce\xf1\
+\x17\x7f\x72\xfc\xf0\xf0\x1d\x97\x2d\xbb\x4b\xf7\xa3\xe8\x89\x6d\
+\xe1\x77\x2c\x9d\x5c\xfb\x22\x86\x57\xec\x33\x58\xcd\x9f\x8c\xab\
+\xd9\x86\x53\x47\x85\x7f\x4f\x75\x3f\x6f\x35\x41\xbd\x78\x1b\x0d\
+\x7e\x4f\x01\x60\xd2\x71\xcf\x98\xc4\x39\xd4\xac\xf1\xdd\x89\xbc\
+\x2f\x24\x64\x14\x54\x3f\xaf\xd9\xfd\x0f\x34\x5c\xd7\xf6\x72\xd5\
+\xc3\x01\xc0\xf4\xe6\x07\xc7\x6a\x84\x7b\x00\x94\x74\xbf\xb9\x14\
+\xae\x3e\xf7\x27\x78\xe3\xeb\x1f\x48\xe4\xd9\x13\x8f\x0b\x4f\x00\
+\x00\x60\xf3\xf6\xe0\x23\xb4\x45\xd9\xdd\x5b\x85\x6d\x7b\x82\xef\
+\x40\xc1\xa9\x69\x4d\x00\xaa\xc2\xdf\xf8\x76\xf5\x0e\x37\x58\xc9\
+\xc0\xf5\x18\x7c\x4a\x1d\x5e\x19\x5e\x45\x28\xc6\xe8\xea\xf0\x3e\
+\xd0\x2d\x3d\xa5\x4b\x00\x36\xbd\x14\xfe\x66\x35\x79\x4c\x3c\x6f\
+\x28\x33\x4e\x1e\xf0\x1d\x38\x2f\xdb\xb0\x65\x3c\xf6\x17\x4a\xdb\
+\xab\xf6\x84\xc1\xef\xe9\xf1\xc3\x76\xa0\xb6\xd2\x3e\x69\x75\xe2\
+\xb1\x68\xd6\x9d\xe6\x71\xd3\x4d\xeb\xb5\x80\xbb\xfb\x66\x33\x1c\
+\x48\x00\xf2\xc8\x2f\x03\x30\x29\xc9\x65\xc5\xe1\xad\x53\x7e\x87\
+\x85\x8d\x3f\x4e\xec\xf9\x23\x2a\x77\xe3\x38\x83\x1f\x82\x9b\xb7\
+\x97\xe6\x5a\xf4\xa7\x76\x84\x27\x1a\x4e\x14\x27\x8f\x8c\xf9\x9e\
+\x99\x01\xb2\xf8\xe4\xbb\x6b\x5f\xb2\x15\x80\xdd\xbd\xe1\xcf\xaf\
+\x89\xe1\x87\xe9\xe1\x58\x54\x00\xb6\xed\x0d\x4f\x48\x8b\xb5\xd1\
+\xe0\xcd\xea\xf4\xd1\x4f\x19\xac\xe4\xb5\xa6\x9f\x1c\x3c\x59\x1c\
+\x05\x9f\xc1\x23\x2f\x4c\x0a\x5f\x4c\x3f\x6c\x7c\x29\xbc\x2f\x6e\
+\xd2\x71\xe1\xbd\xa4\x47\x32\x77\x42\x17\xea\x4f\xdc\x10\x5b\xfc\
+\x54\x12\x9c\xd6\x9b\x8f\x6e\x02\x00\x57\x77\xed\xea\xf3\x04\x78\
+\x5b\xd2\x6b\xb2\x76\xe9\x19\x6d\xf8\xf8\x05\xdf\x86\x48\x72\xfb\
+\xb5\x00\x30\xd1\x60\x1b\x60\xf3\x4b\xa5\xa9\x00\x58\x94\xff\x4f\
+\xa8\xd9\x8a\x8a\x4c\x7a\x2e\x01\x3c\x94\x45\x02\xd0\x63\xf0\x06\
+\x1c\x62\x77\x3e\xbc\x02\x50\x93\x2b\x4d\x05\x60\x4c\x75\xf8\x8d\
+\xc0\x2f\xed\x0d\xeb\xd9\x28\x56\xa4\x0e\x4f\x6d\x0f\xff\xfb\x7f\
+\xda\x68\xfb\x52\x35\x00\xd4\x9f\x64\x33\x56\xa3\xfb\xb9\xc9\x26\
+\x71\x8a\x65\xb1\xad\x32\xc9\xa8\x92\x7a\x24\x1f\x9a\xb3\x02\x4e\
+\x7c\xac\xcf\x48\xa1\xb7\x4f\x6d\x6e\x9f\xe7\x9c\xf3\x83\xe6\x6e\
+\xe3\x83\xfe\xe2\xec\xdf\xe1\xef\xe7\xdf\x0c\x97\xf0\x9b\x3f\x00\
+\x4c\x3c\x2e\xfc\xf6\xc9\x27\x0d\x3e\x99\x17\xf5\x9c\xed\xe1\xd3\
+\x42\x2d\xf6\x2a\xe3\x62\xb2\x05\xb0\xbf\xfc\xb7\x00\x46\x54\xf5\
+\x18\xac\xe4\xd8\x46\x1b\x54\x00\x76\xee\x1b\x6e\xd2\x98\x7a\x2c\
+\x4f\xef\x38\x01\xbd\x3e\x17\x1c\x27\xae\x37\xab\xe3\x87\xed\xc0\
+\xc9\x23\xc2\x2b\x6b\xeb\x9e\x2f\x6d\x02\xb0\xe9\xa5\xf0\xea\xe5\
+\xa4\x98\x92\xaa\x83\xce\x3e\xe1\x71\xbc\x63\xea\xca\x58\x9f\x91\
+\x4e\xfa\x3e\x07\xe8\x45\x49\x2f\xc3\x8a\x88\xe2\xea\x73\x7f\x82\
+\x8f\x9d\xff\xed\xd4\x64\x74\x13\x0c\x7e\x20\x6c\x2a\x51\x05\x20\
+\xb4\x63\x1b\x48\xef\xfe\x3f\x30\x48\x9a\x00\x2d\x2a\x00\xc6\x4d\
+\x6a\x47\x72\xfc\xb0\xf0\x0a\x80\x57\x87\x1d\x7b\x6b\x0d\x56\x73\
+\x74\x16\xdf\x63\xb9\x4c\x01\x27\x8f\x88\x6f\xbc\x82\x45\x15\xa0\
+\xfb\xf9\xd3\xa1\x25\x9a\xae\xbc\x75\xcf\x48\xec\x34\x48\x98\xe3\
+\x68\x00\x7c\xb5\xf7\xcf\xbc\xd3\x24\xc1\x2a\x27\x02\x5c\xec\x00\
+\x49\xfe\x9c\x9e\x81\xaa\xdc\x7e\x7c\xf6\xd2\xa5\x58\x34\xf3\x7f\
+\x13\x2f\xfb\x1f\xca\x62\x0b\xe0\xd9\x5d\x63\xd1\x1b\x85\x7f\x3a\
+\x39\x96\x27\x77\x86\xff\x10\x4c\xeb\x09\x00\x00\x26\x8d\x44\x89\
+\x57\x00\x7a\x0d\x12\x80\x12\xf5\x00\xd4\x56\xee\x31\xd9\x0e\xda\
+\x56\x82\x6d\x80\x4d\xdb\xc3\x4b\xd5\xa7\x8e\x7c\x1e\x59\x17\x19\
+\xac\xe6\xf0\xea\x4f\x08\xbf\x5e\x63\xe7\xfe\xe1\xd8\x5c\xa2\x8a\
+\xe2\xe3\xdb\x6c\xe6\xe2\x58\x35\x53\x1f\x4d\x55\x6e\x3f\xfe\x6e\
+\xfe\xcd\xc8\x65\x0a\xb1\x3f\x2b\x45\x4e\x75\xb0\x9a\x86\x94\xa0\
+\x09\xa3\x9e\xc5\xd7\xde\xfe\xaf\x98\x7f\x7a\x47\xd2\x4b\x79\x0d\
+\x8b\xbf\xbc\x5e\xc5\x64\x7f\xfe\x58\x2c\x9e\x71\xea\xc8\x58\x07\
+\xcc\x05\xa9\xad\x34\xa8\x00\x24\xdc\x03\x50\x4e\xc7\x00\x01\x9b\
+\x2a\xc0\x4b\x25\xa8\x00\x6c\xb4\x28\x55\x1b\x24\xfb\x47\x63\xd5\
+\x07\xb0\xae\x44\x7d\x00\x1b\x0d\x12\x80\xe3\x87\xed\xc0\x08\x83\
+\xef\xdb\x62\xd4\x9f\xb8\x01\x1f\x3b\xff\xdb\x25\x79\x56\x5a\x38\
+\x00\xf1\xb4\xad\x96\x80\x13\x8f\xbf\x6c\xf8\x15\x6e\x7a\xe7\x17\
+\xf0\xba\xe3\xd3\xf9\x9f\x31\x66\xd8\x76\x93\x73\xc1\x9b\x0d\x7e\
+\x40\x1d\xcd\xb6\x3d\x23\xd1\x63\x50\xde\x4e\xf3\x16\x40\x8d\xc1\
+\xf1\xb7\x9e\xc4\x4f\x01\x94\xcf\x31\x40\x00\x38\x7e\x58\x78\x1f\
+\x40\x29\x1a\x01\x2d\x8e\x00\x4e\x1a\x1d\x5f\xb7\x3a\x00\x4c\x18\
+\xf9\x1c\x46\x1a\xf4\x6f\xac\x7b\xae\x34\xf3\x00\x2c\x4e\x55\x4c\
+\x8c\x79\xff\xff\xd5\xde\x7c\xd6\xfd\xb8\xb2\xc1\xe2\x02\xc6\xb2\
+\xf0\xa4\x53\xd1\xb2\xec\x7e\x38\x63\xcc\x66\x7c\xf5\xed\x5f\xc2\
+\x87\xe6\xae\x40\x45\x36\x9d\x5d\xe7\xc0\x81\xbe\x84\xf1\x23\x0d\
+\x4e\x02\xc4\x5c\xb6\xb3\x68\xd6\xa9\x70\x79\x9c\x58\x6b\x72\xc9\
+\x56\x2c\x6a\x07\xc1\x29\x00\x8b\x2d\x00\x8b\x5e\x88\x62\x8d\x1e\
+\x16\x7e\x0c\x36\xee\x04\xc0\xab\x98\xf4\x00\xc4\xdd\xad\x2e\xa2\
+\x26\x55\x80\x47\x5e\x38\xdd\x60\x35\xc7\x66\xb1\x05\x70\xda\xa8\
+\xd2\x26\x00\x00\xf0\xc1\x39\xdf\xc7\x3b\xeb\x2d\xae\x5f\x48\x39\
+\x95\x95\xce\x79\xdc\x96\xf4\x3a\xfa\xe3\xf8\x61\x3b\xf0\x37\x17\
+\xb5\xe0\x5b\x57\xfc\x33\xa6\x9e\x50\x1e\xe7\x37\x27\x8e\x36\x48\
+\x00\x62\x1e\x06\x64\x91\xad\x9f\x34\x62\x4b\x2a\x4e\x5e\x1c\x49\
+\x6d\x55\xf8\x1b\x5f\xc1\x67\xb0\x27\x1f\x5e\x86\x1f\x28\x8b\x0a\
+\x80\x45\x25\xa4\x58\xa3\x2d\xb6\x00\xf6\xc4\x9b\x00\xbc\xd0\x33\
+\xda\xa4\xc7\xc6\xa2\xdf\xe7\x58\x2c\x7e\xe6\x6d\xde\x7e\x42\xec\
+\x7f\x87\xbd\x8a\x49\x02\x10\xf7\x09\x80\xc3\x71\xe2\x71\xfd\xbc\
+\xef\xe0\xfd\x33\xef\x4c\x55\x3f\x99\x31\x15\x89\x6e\x73\x9d\x2d\
+\x73\x5a\x01\xa4\x7e\x1c\xd2\xc9\x23\x5e\xc4\x0d\xe7\xdf\x81\xff\
+\x79\xcf\xdf\xe1\xcd\x67\xdd\x9f\x9a\x2e\xff\x62\x4c\x1c\x15\x7e\
+\x14\x70\xd3\xb6\x78\xb7\x00\x36\x19\x24\x18\x69\x3e\x02\x08\x00\
+\xd5\xd9\xfd\xc8\x18\xfc\xbd\xb1\xd8\x2a\x19\x28\x93\x41\x40\x65\
+\x56\x01\x88\xbb\x09\xf0\xa9\x1d\xe1\xc7\x5f\x4b\x35\x00\xab\xee\
+\x84\xc7\x83\x63\x78\x75\xf8\xc3\x8b\x13\x0c\x56\x73\x64\x4f\xed\
+\x38\xd1\x64\xea\xe0\xeb\x62\x1a\xac\x54\x8c\xab\xce\xfd\x19\x3e\
+\xf7\x86\x6f\x62\x54\xf5\xae\xc4\xd6\x10\xa3\x1f\x74\x2e\x9f\xdb\
+\x96\x05\x80\x7c\x84\xf7\xe7\x32\x68\x00\x50\xfa\x61\xd1\x47\xe1\
+\x44\x31\xf3\xd4\x75\xb8\xec\xcc\x55\xb8\xe0\xf4\x07\x4d\x7e\x78\
+\x27\xc1\xe2\x18\xcb\xe6\x1d\x27\xc2\xab\x8b\x2d\xf1\xb1\x98\xd8\
+\x35\x3e\xc5\x0d\x80\xc0\x81\x12\x6a\x4d\xe5\x9e\xe0\xbb\x15\x76\
+\xed\x1f\x86\x71\x35\xdb\x8c\x56\x55\x3c\xaf\x0e\x7b\xf2\xe1\x17\
+\xab\xc4\x31\x56\xf5\x48\x46\x55\x85\x27\x00\xdb\x63\x6e\x02\xb4\
+\x48\x00\x4a\x35\x00\xeb\xf5\x63\x36\x23\x23\x3e\x78\x36\xc2\xfa\
+\x17\x4f\xc3\x39\x27\xc7\x77\x6b\xf7\x86\xad\xe1\x87\xcb\x9c\x78\
+\x9c\x1e\x73\x5f\xc5\xb1\x5c\x78\xda\x83\x68\x38\xe9\x31\x7c\xf5\
+\xbe\xf7\xe0\x9e\x3f\xce\x4c\x74\x2d\x86\x36\x78\x17\x7d\x00\xe8\
+\xbb\x0d\x70\xfd\xad\xb3\xb7\xd6\x5d\xd3\x71\x89\xcb\x44\x3f\x02\
+\x30\x3d\xc9\x95\x65\x5d\x84\xfa\x13\x37\x60\xf6\x84\x4e\x5c\x3a\
+\xb9\x1d\x63\x0c\x86\x89\x24\x6d\xc2\xc8\xf0\x0a\xc0\xfe\x42\x05\
+\x9e\xef\x19\x8d\x93\x62\xda\x63\xb7\xe8\x82\x4e\x73\x03\xe0\x41\
+\x26\x09\x40\x42\xf7\x01\xec\xe9\xad\x32\x39\xc3\x5d\x63\x70\xa3\
+\x60\xb1\x46\x1b\x7c\x7a\x8a\x7b\x0b\xe0\x49\x83\x04\xa0\x54\xd5\
+\xaf\xca\x6c\x2f\x4e\x3f\xfe\x69\x3c\xb6\x65\x7c\x50\x9c\xf5\x2f\
+\x4e\xb2\x59\xd0\x11\xfc\x71\x6b\xd8\xfa\x80\x03\x5b\x8a\x55\xb9\
+\xfd\x06\xab\x09\x33\xaa\x6a\x17\x3e\x7b\xe9\x52\x2c\x68\xf8\x3f\
+\xac\xe8\x7c\x03\x7e\xfb\xf8\x8c\x92\x0c\xa7\x8a\x87\x3c\xa8\xc0\
+\xe5\xdd\xcb\xe6\x6d\x03\x0e\xb9\x0e\xb8\xfb\xd6\xc6\xcd\x93\x9a\
+\x56\xce\xab\x95\x61\x7f\xa5\xc0\xa7\x04\x18\x53\x8a\xe5\xd4\x56\
+\xee\xc1\x99\x63\x37\xe2\xcc\xb1\x9b\x70\xf6\xb8\xc7\x71\xce\xc9\
+\xeb\xcd\x6f\xd3\x4a\xda\x49\x23\x5f\x44\x2e\x53\x40\x3e\xca\x1e\
+\xfb\xc5\x47\xb1\x79\xfb\x49\xb1\x24\x00\x3b\xf6\xd5\x98\x7c\xca\
+\x4a\xfb\x16\x00\x60\xd3\x00\x97\xd4\x49\x80\x1e\x83\x7d\xdb\xac\
+\x8b\x50\x99\x7d\xcd\xb5\xe0\xb1\x19\x35\x2c\x3c\x01\x88\xfb\x3e\
+\x80\x72\x1b\x80\x35\x65\xdc\x13\xe1\x09\xc0\x0b\xa7\x1d\xfb\x45\
+\x01\xfe\x68\x50\x01\x48\xdb\x4d\x7d\x53\xc6\x3d\x81\xcf\x5e\xba\
+\x14\xcf\xef\x3a\x1e\xbf\x7a\x6c\x2e\x1e\xd8\x5c\x8f\x3f\xbc\x38\
+\x11\x05\x9f\x49\x7a\x69\xc5\x78\x51\x04\x5f\xda\xe9\x77\xdf\xb8\
+\xb1\x65\xfe\xcb\x6f\xb0\xaf\x78\x47\xea\xfb\x17\x5f\x5c\xb0\xe0\
+\x7b\x5f\x5e\x3f\x62\xd2\x79\x50\x5f\x0f\xc5\x89\x10\xe9\x77\x87\
+\x8c\x13\x2f\x13\x47\x3d\x7b\xca\xf1\xc3\x77\x8c\xab\xca\xf4\x0e\
+\x1f\x5e\xb1\xb7\x90\xc9\x44\xd1\xf0\xdc\xde\xde\xe3\xaa\x77\xed\
+\x19\x3f\xea\xb9\x1d\xaf\x1b\xf3\xcc\xce\x93\x6a\x5f\x78\xcd\xc7\
+\x11\x45\x69\x26\x55\x95\x8a\x13\xc5\x88\xca\x3d\x8b\xb6\xee\x19\
+\x11\x94\x54\xdd\xfb\xc4\xf4\x7b\x66\x4d\x58\xb7\xda\x6a\x5d\x07\
+\xb5\x6e\x6e\x38\x15\xc0\x55\xa1\x71\x46\x54\xef\xfe\x9a\x8a\x94\
+\x66\xce\xec\x00\xed\x8b\x2a\xaf\x04\x10\xf4\xd3\xaf\xfb\x85\xd3\
+\x7e\x76\xde\xe9\x0f\x77\x19\x2d\xa9\x68\x4f\xbc\x74\xca\x58\x00\
+\x0b\x43\x62\x64\x9c\xdf\xa7\x22\xff\x69\xb4\xa4\x63\x53\x37\x0a\
+\xc0\x07\x42\x42\x6c\xdb\x5b\xeb\x55\x32\x5f\x02\xe2\xd9\xfe\x7a\
+\xe4\xc5\xd3\x16\x03\x38\x2e\x24\x86\xf7\xf2\x6b\x15\x59\x63\xb4\
+\xa4\xa3\x1a\x96\xdb\xd3\x00\xe0\xb2\x90\x18\xcf\xed\x3a\x1e\x4f\
+\xef\x38\xf1\xc6\x93\x47\x3d\x1f\xcb\x7e\x50\xd7\x73\x67\x7c\x04\
+\x40\x50\xa9\xad\x22\x53\xb8\x57\x45\x56\x19\x2d\xc9\xcc\xb8\x11\
+\xdb\xf0\xbe\x19\x3f\xc5\xfb\x66\xfc\x14\x3d\xbd\x55\xd9\x35\x4f\
+\xd6\x8f\xdd\xb8\x6d\xdc\xa8\x2d\x7b\x46\xd7\xf4\x46\xb9\xec\xee\
+\xde\xaa\xec\xbe\x42\x65\xcf\x96\x9e\x51\xcf\x3f\xb9\xf3\x84\x67\
+\xbd\xba\x64\x3a\x09\x55\xf3\x10\x3c\x27\x5e\x3a\xcf\xdc\xbd\x69\
+\xd5\x8a\x15\x57\xbe\x66\x4a\xd5\xe0\x7a\xa7\x4d\xb1\x86\xe6\xd6\
+\x1f\x28\xe4\x8a\xa0\x20\xa2\xff\xdd\x75\xf3\x9c\xc5\x46\x4b\x7a\
+\x59\x7d\x73\xdb\x07\x00\x7c\x33\x28\x88\xe0\xa5\xae\x9b\x67\x8f\
+\xb6\x59\x51\x7c\xa6\x2e\x6c\xff\x1f\x51\x7d\x77\x50\x10\xc5\x27\
+\xba\x5a\x66\x7f\xc5\x68\x49\x45\x6b\x68\x6a\xbb\x40\x05\xbf\x0b\
+\x0c\xf3\x64\xd7\xf2\xd9\xf1\x76\x80\x1d\xa2\xee\xc3\x2b\x6b\xdc\
+\xde\xf0\x32\x40\x3e\xc2\x98\xf5\xb7\xce\xde\x6a\xb1\xa6\x43\x5d\
+\xbc\x64\x65\x76\xeb\xa6\x61\x7b\x00\x04\x1d\x03\x70\xc0\x9f\xaf\
+\x5d\x3e\xfb\x97\x46\xcb\x3a\xaa\x86\x45\xab\xa7\xaa\xf7\xe1\x09\
+\xa8\xea\x5b\xba\x5a\xe6\xfc\xcc\x60\x49\xaf\x30\xbd\xf9\xc1\xb1\
+\x05\xe4\x83\x1b\x82\x44\xe5\x2f\x3a\x5b\x66\xdd\x65\xb1\x26\x3a\
+\xbc\x72\xdd\xc8\x28\x3b\x5e\x64\x7d\x68\x0c\x55\x99\x62\xb1\x96\
+\xd7\xc4\x85\x41\x5c\xc5\x3a\x83\xa5\xc4\x4f\xf5\xa5\xe0\x18\xa2\
+\x41\x9f\x16\x07\xca\x0b\x2c\x6a\xe1\x25\xad\xd0\x74\x7f\x7d\x7e\
+\x0f\x80\xe0\x4f\x99\x99\x8c\x86\x6f\xd4\x1f\xc6\xf6\x8d\xd5\xa7\
+\x21\xf0\xcd\x1f\x00\x34\x83\xf8\x3a\xea\x5e\xa5\x73\x7c\xe3\xef\
+\x01\x04\x77\x57\x2a\x24\x96\xae\xb6\xbc\xf6\x9e\x63\x11\x27\xf2\
+\x6e\xad\x45\x1c\x3a\x32\x26\x00\xa5\xe2\x35\x38\x01\x10\x20\x96\
+\x04\x40\x80\xb3\x83\x63\x28\xba\x2d\xd6\x12\x3b\x41\x78\x02\xa0\
+\x2e\x91\x04\xc0\x01\x16\xed\xf0\xa5\x3b\x03\x78\x90\x22\x7c\x83\
+\x5c\x10\x4b\x02\x10\x01\x67\x18\x84\xd9\x7f\xe6\x8e\x4d\x9b\x0d\
+\xe2\x14\x67\x89\x78\x40\x1e\x0c\x0d\x23\x40\x3c\x6d\xed\xce\x35\
+\x18\x44\xd9\xde\x7d\xeb\x8c\x74\x35\x01\x0c\x42\x4c\x00\x4a\x44\
+\xe1\x82\x13\x00\x00\xc7\x37\x5c\x7d\x7f\x0c\x97\x02\x68\x70\x02\
+\xa0\x52\x26\x09\x80\x45\x05\x00\x3a\x2a\x3c\xc6\x80\x18\x1c\x3f\
+\x48\xa0\x47\x43\x10\x5c\x0e\xce\xf8\x78\x12\x00\xb1\x49\x00\xfe\
+\x78\xb8\xfd\xd5\x78\x69\x7b\x70\x08\x89\x27\x01\x10\xd5\x73\x83\
+\x83\x28\x3a\x81\xc1\x3b\x85\x27\x2d\x98\x00\x94\xc8\xfe\xbc\x7f\
+\x14\x06\x17\x2f\x69\x45\xee\x2c\x83\xe5\xbc\x6c\xf2\x55\xad\x23\
+\x00\x04\x8f\x01\xf4\xa2\xe5\x91\x00\x88\x58\x6c\x01\x24\xd3\xeb\
+\x20\x1a\x76\x7e\x11\x80\x42\x13\x98\x6a\x22\x16\x2d\xf2\xb1\x24\
+\x00\xde\xe1\xf5\x06\x61\x1e\x35\x88\xd1\x2f\xaa\xd2\x66\x10\x66\
+\xdc\x94\x45\xf7\x4f\x34\x88\xf3\x0a\x6a\x50\x59\x10\xd1\x87\x2d\
+\xd6\x42\x47\xc7\x04\xa0\x44\x36\xdc\x3e\x67\x27\x20\xc1\xb3\x42\
+\x55\xc3\x3f\xad\x1f\xaa\xba\x52\xea\x60\xd0\x0c\x9a\xc9\x47\xe5\
+\x91\x00\x78\x83\x04\x00\x92\x4c\x05\x40\x25\xbc\x02\x20\x52\xf2\
+\x2d\x00\x85\x86\x4f\x88\x12\x17\x4f\x05\xc0\x8b\xc5\xd5\x78\x36\
+\xd7\xf4\xf5\x83\xcb\xfa\xf0\x0a\x00\x80\x9c\xcf\x98\x56\x01\xce\
+\x69\x7a\x68\x94\x00\x06\xbf\xa7\x52\xf2\x53\x36\x43\x11\x13\x80\
+\x92\x0a\xef\x03\x80\x8a\x69\x05\x40\x54\x2c\x1a\x76\x5e\xec\xbc\
+\xed\xbc\x74\x8f\x01\xec\xe3\x44\x0d\x26\x4b\x25\xd3\x04\x08\x18\
+\x24\x00\xaa\x49\x1c\xd3\x0c\xae\x00\x28\xe2\x69\x02\x84\xc1\x16\
+\x80\x24\x90\x00\x74\xde\x34\xe7\x29\x40\x82\x47\x8c\x5a\x37\x02\
+\x7a\xe9\x3d\x17\x06\x1f\x28\x22\x15\x36\x00\x96\x00\x13\x80\x12\
+\x52\x31\x68\x04\x14\x9d\x6a\xb1\x96\x83\x3c\x0c\xf6\xeb\x20\xe5\
+\xf1\xe9\x1f\x40\xa4\x62\x30\xc3\x57\x12\x49\x00\xd4\x60\x0b\x40\
+\x80\x24\xb6\x00\xc2\x93\x43\xb5\xdf\x02\x98\x7c\xfd\x63\x95\x10\
+\x04\x1f\x89\x54\x27\x25\x3b\x01\xf0\x0a\x12\xde\x07\x60\xdd\x08\
+\xa8\x22\xb3\x0c\xc2\x44\x55\x15\xae\x6c\x7e\xa6\x94\x33\x26\x00\
+\xa5\xe4\xc3\x8f\x02\x42\x61\xd1\x61\xfb\x32\x01\xa6\x05\x07\x29\
+\x97\x13\x00\x00\x72\x88\x2c\x66\x4b\x27\x92\x00\x88\x87\xc1\x08\
+\x42\x2d\xfd\x29\x00\x83\x0a\x40\x1c\xa7\x00\x86\xef\x7c\x69\x32\
+\x80\xe0\x31\x6e\x3e\x2a\xdd\x11\xc0\x43\xa9\x86\x27\x00\x0a\xcc\
+\xc0\x12\xc3\xb9\xb6\xaa\x33\x0c\x82\x3c\xb6\x66\x69\x63\xe9\x2e\
+\xac\x18\xc2\x98\x00\x94\x90\xb3\xe9\x94\x1f\x5b\xd7\xd4\x6e\x72\
+\x37\xf0\xc5\x4b\x56\x66\x01\xd4\x07\x07\x72\xbe\x33\x7c\x35\xa5\
+\x91\xa9\xc8\x19\xf4\x00\xa0\xa2\xe1\xea\xb5\x25\xbf\x10\xc0\x3b\
+\x8b\x1e\x00\x97\xc0\x31\xc0\x28\x95\x4d\x80\x5e\xd4\xe2\x04\xc0\
+\xce\xee\x96\x59\xe1\x97\x7d\x0c\x80\xf3\xce\xa2\x0f\x60\x44\xfd\
+\xc6\x35\x16\x8d\x90\x07\x35\x86\x06\x50\x71\x6c\x00\x2c\x11\x26\
+\x00\x25\x94\xcb\x65\x4c\xde\x28\x05\x3e\xfc\x4d\x1b\xc0\xd6\x8d\
+\x95\x53\x00\x04\x0f\x98\xf7\xde\x3d\x64\xb0\x9c\x92\x58\xb3\x74\
+\xc6\x4e\x00\x85\xd0\x38\x22\xbb\x4b\xde\x08\xe8\x34\x7c\x0b\x20\
+\x89\x1e\x00\x15\x83\x2d\x00\xe0\x04\xc0\xe0\x26\xa4\x57\x3a\x33\
+\x38\x82\x94\x7e\xff\xff\xa0\x5c\xa5\xeb\x80\xc1\x7c\x64\x45\xc1\
+\x64\x1b\x60\x7a\xf3\x83\x63\x01\x4c\x0a\x8d\x23\x06\x95\x0d\x2a\
+\x0e\x13\x80\x12\x5a\xb3\xb4\x71\x0b\x14\xc1\x27\x01\x8c\x06\x6d\
+\x40\x5c\xc6\xe2\xe6\xc7\x32\xdb\xaf\x13\x05\xb0\x23\x34\x8a\xe6\
+\x72\x49\x6c\x03\x58\x9c\x02\x28\x79\x02\x10\x45\x26\xc7\x00\x2b\
+\xea\xdf\x7b\x9f\x69\xd2\x65\x32\x03\x40\x93\x29\xff\x03\xc0\x9a\
+\xa5\x8d\x3b\x20\xd8\x10\x1a\x47\x9c\x4d\x23\x60\x41\x7b\x4d\xe2\
+\x38\x51\xf3\xfb\x4e\xe8\xf0\x98\x00\x94\x5e\xf0\xf1\x16\x51\x35\
+\xa9\x00\xa8\xc2\xe2\x04\xc0\xfa\x32\xdc\xaf\x0b\xdf\x06\x88\x7c\
+\xc9\x13\x00\x0d\xbc\x5c\x05\x00\x44\x7d\xc9\x13\x80\xf5\xb7\xce\
+\xda\x06\x20\x1f\x1c\xa8\xa2\xda\x74\x1b\x40\xc5\x62\x06\x80\x24\
+\x56\x01\x00\x00\x78\x84\xbf\x59\xaa\x4d\x23\xa0\xd1\x89\x82\x48\
+\xf3\xd5\x65\x53\x51\x2c\x77\x4c\x00\x4a\x4c\x44\x0c\xb6\x01\xc4\
+\x24\x01\x80\x45\x03\x20\x50\x8e\xc7\x75\xc2\x13\x00\x57\xfa\x04\
+\x00\x30\x68\x02\x54\x97\xc0\x31\x40\x51\x40\x5e\x0c\x0f\xe3\xad\
+\xfb\x00\x82\x13\x00\x4d\xe0\x08\xe0\xa1\x04\x26\x9f\x96\xcf\x99\
+\xb1\xb8\x23\xf8\x3e\x04\x11\x84\x9f\x00\x50\x74\x77\xde\x36\x2d\
+\x89\x46\xd5\x21\x89\x09\x40\xc9\xa9\xc1\xa5\x39\x5a\x57\xb7\xa0\
+\xbb\x22\x3c\x4e\x78\x05\x40\x04\xe5\xd7\xb0\xa3\x65\x7b\x1f\x40\
+\xf0\x16\x80\xb8\xd2\x57\x00\x00\x40\x0c\x86\x01\xa9\xe1\x49\x80\
+\x19\x8b\x3b\x46\xc2\xa0\xb1\xd0\x21\x4a\x34\x01\x88\x34\xd3\x61\
+\x10\xa6\x2a\x9f\xcf\x87\x7d\xa8\x38\x70\x92\x60\x5e\xe8\x42\x04\
+\x06\x15\x0d\x2a\x1a\x13\x80\x12\x13\xe7\x2c\x1a\x01\x2b\x33\x35\
+\x3b\x83\xe6\x01\xf4\x8d\x00\x0d\x1e\x69\xeb\x7d\xf9\x8d\xec\x14\
+\x29\xdb\x1b\x01\x0d\x7a\x00\x32\x89\x7c\xba\x52\x0d\xbf\x0f\x00\
+\xde\x6e\x18\xd0\xbe\x5e\x6f\xd2\xf9\x1e\x39\x4d\x34\x01\xa8\xaa\
+\x94\x87\x60\xd0\xd4\xea\xc5\x05\x7d\x7a\xaf\xdb\xdc\x5e\x0f\x20\
+\xb8\x47\x43\x85\x09\x40\x29\x31\x01\x28\xb1\x1d\x51\xcf\x23\x30\
+\xf8\x86\x55\xcd\x04\x9d\xb7\xcd\x46\x59\x8b\x06\x40\xe4\xa4\xa2\
+\xec\x12\x00\x68\xf8\x38\x60\x4d\xa6\x02\x10\xde\x03\x10\x45\xc9\
+\x54\x00\x5c\xba\x66\x01\x38\x83\x3b\x00\x14\xd8\xd2\xbd\x6c\x9e\
+\xc1\x60\xa9\x81\xeb\xeb\xbf\x09\x6f\xc2\x55\xcc\x0d\xf9\x72\x07\
+\x3d\x3f\x78\x0d\x00\xbc\xcd\x1d\x07\x54\x24\x26\x00\x25\xb6\xb1\
+\x65\xfe\x3e\xc0\xa0\x73\x58\x02\x07\x6e\x88\x58\x24\x00\x4f\x3d\
+\xb4\xfc\xdc\xf0\xbd\xdd\x12\x53\x18\x8c\x03\x2e\x75\x05\xe0\x40\
+\x89\x35\xf8\xc8\xe6\xfe\x8a\x6c\x22\x09\x00\x34\x5d\x17\x02\x09\
+\xc2\x67\x00\x24\x31\x02\xf8\x70\x44\x61\xb1\x0d\x10\x94\x00\x28\
+\x9c\x45\x02\xb0\xf3\xec\xdd\x1b\x79\x07\x40\x09\x31\x01\x48\x80\
+\x40\xc3\xff\x92\x4b\xe0\xc0\x0d\xd1\xe0\x86\x1d\xa3\x1b\xc9\x4a\
+\xcf\xe2\x46\x40\x2d\x6d\x02\x70\xe6\xe6\xfb\x87\xc3\x60\xc6\xba\
+\x2f\xec\x4b\x26\x01\x90\xf0\x1e\x00\x07\x98\x0c\xc0\x02\x00\xd5\
+\xf2\x6f\x00\x3c\xc8\xa2\x6c\x2e\xc0\xe4\x90\xab\xc6\x45\xf5\x82\
+\xd0\x35\x28\xf0\x40\xe9\xaf\x55\x1e\xda\x98\x00\x24\xc2\xe0\xa6\
+\x2b\x45\xfd\xe4\xeb\x1f\xab\x1c\xe0\x17\x0b\x80\xd9\xa1\x4b\x70\
+\x4e\xcb\x33\x01\x30\xd8\x02\x80\x96\xf6\x3e\x80\xac\xaf\xb0\x98\
+\x3c\xa8\x8f\x4e\x38\x2f\x91\x1e\x00\xaf\x06\x37\x61\x0a\x4e\xb2\
+\x58\x0b\x00\xc0\xe0\x08\xa0\xb3\xa8\xe4\x19\x10\x78\x8b\x7d\x73\
+\xd1\x6c\x66\x40\x55\x80\x86\xeb\xda\x4e\x03\x70\x4a\xf0\x02\x44\
+\xee\x0f\x8d\x41\xfd\xc3\x04\x20\x09\x6a\x71\x14\x10\x15\x55\xbb\
+\xb7\x0d\xa8\x73\x77\xea\x75\xad\x67\x41\x0d\xe6\xd9\x7b\xb4\x06\
+\xc7\x48\x80\x88\x37\x68\x02\x2c\xed\x7d\x00\xa2\xce\x22\x01\xd8\
+\x83\x25\x12\x3c\x39\x6e\x20\x54\xfc\xd3\xe1\x41\xc2\xdf\x64\x0e\
+\x89\x15\x9c\x00\x78\x49\x78\x06\x40\x9f\x5c\x2e\xd7\x05\x20\x7c\
+\x16\x87\xc8\xc0\xb6\x01\x3c\x82\x3f\xfd\x1f\x08\xe3\xef\xb3\x88\
+\x43\xc5\x63\x02\x90\x80\x7c\x85\xb3\xd8\xb3\x83\xd3\x81\x0d\xde\
+\x90\x48\xe6\x18\x3c\xbe\x90\xab\xc8\xac\x31\x88\x53\x7a\xde\x59\
+\xdc\x07\x50\xda\x51\xc0\x5a\xb0\x48\x00\x92\x29\xff\x03\xc8\x16\
+\x24\x3c\x01\x00\xc6\x59\x9c\x57\x9f\xb2\xb8\xe3\x24\x00\xb5\xa1\
+\x71\x32\x29\x49\x00\xd6\x2c\x6d\xcc\xc3\xe2\xf8\x9c\x0e\xec\x18\
+\x9f\xda\x34\x00\xe6\xab\xb2\xd9\xf2\xac\x28\x96\x31\x26\x00\x09\
+\x78\x64\x69\xe3\xb3\x00\x9e\x0a\x8d\xa3\xaa\xe7\x0d\xec\x2b\x9d\
+\x41\x02\x20\x9d\x65\x38\x01\xf0\x00\x17\x19\x6c\x01\x94\xb8\x02\
+\x90\x35\xb8\x08\x08\x48\x6c\xc0\x8a\x6a\x95\x45\x02\xe0\xf6\xed\
+\x0b\xdf\x06\xc8\x16\xb4\xce\x60\x2d\x5a\xa8\xec\x49\x45\x02\x00\
+\x00\x50\x7d\xc0\x20\x4a\xe3\x80\xe6\x8b\xa8\x5c\x68\xf0\xec\x07\
+\xcb\xf6\xe7\x49\x19\x63\x02\x90\x9c\xf0\xc6\x1d\xc1\x00\x33\x6f\
+\x0d\x1e\xd8\xa1\x28\xd3\xfd\x7f\x00\xc8\x18\x54\x00\x4a\xbc\x05\
+\xa0\xde\xe2\x22\xa0\xe4\x2a\x00\x7d\xd3\xdd\x82\x4f\x5f\xb8\x6c\
+\x14\xbc\x0d\xa0\xaa\x67\x87\xc6\x10\x60\x73\xf7\xd7\xe7\x27\xf6\
+\xfb\xf9\x6a\x02\xb7\xca\x20\x4c\x75\xa6\x66\x67\xbf\x4e\x07\xf5\
+\xed\xff\x87\x5f\xaa\x04\xfc\xd6\x20\x06\xf5\x13\x13\x80\x84\xa8\
+\xc1\x08\x4f\x05\x26\xd6\x5d\xd3\x31\xa1\x3f\x5f\x33\x63\x71\xc7\
+\x18\x00\xc1\x9f\x80\x9c\x94\xe7\xfe\x3f\x00\xb8\x42\x85\xc5\x16\
+\x40\xd5\xdc\x05\xab\xaa\x0d\xe2\x14\x45\x60\x71\x15\x70\x72\x09\
+\x40\x9f\x67\x42\x03\x08\xf4\x64\x83\x18\xc1\x09\x80\x42\x7f\x1f\
+\x1a\xc3\x52\x46\xb2\xad\x00\x34\x38\x50\x7f\xfb\x00\x0a\x72\x59\
+\xf0\x33\x01\x40\xdc\xff\x99\xc4\xa1\x7e\x61\x02\x90\x10\xa3\xbb\
+\xbc\xe1\x5c\xd4\xaf\x2a\xc0\xfe\x5e\x7f\x21\x0c\x8e\x93\x39\x6f\
+\x52\x72\x4c\xc4\xc3\x93\xce\xd9\x09\x20\xf8\xb8\xd1\xbe\xda\x12\
+\xde\x07\xe0\x0c\x12\x80\x04\x2b\x00\x07\x84\xf7\x01\x78\x75\x16\
+\x8d\x80\x16\x15\x80\x54\x25\x00\x0f\x2d\x3f\xf7\x45\x45\xf8\xcd\
+\x80\x0a\xe9\x5f\x75\x50\xd4\x22\x01\xd8\xbb\xcb\xf7\xb0\x01\x30\
+\x01\x4c\x00\x12\xb2\xa7\xe0\x57\xc3\xe0\x4d\x48\xfb\xb9\x0d\xe0\
+\xc4\x5f\x14\xfa\x4c\x40\x9e\x79\xb8\x65\x4e\x7a\xf6\x3f\xfb\x6b\
+\x89\x78\x08\x76\x86\x86\xf1\x51\x45\xc9\x12\x00\x85\x06\x37\xad\
+\x89\x68\xb2\x09\x80\x86\x9f\x04\x10\xa8\x45\x02\x10\x5c\x01\x53\
+\x8b\xe9\x7b\xc6\x04\x08\xdf\x06\x50\x5c\xd4\x77\x4c\xf8\x98\x26\
+\x35\xad\xac\x52\xe0\x92\xe0\x67\x42\xee\xeb\x1b\x90\x46\x25\xc6\
+\x04\x20\x21\x1b\x6e\x9f\xb3\x13\x06\x17\xe9\x08\xfa\x77\x04\x47\
+\x21\x06\x09\x80\xbf\x27\x3c\x46\xc2\x14\xe1\x23\x5c\x33\xa5\xbc\
+\x11\x30\xbc\x02\xa0\x16\x47\xc5\x42\x9e\x2f\x26\x27\x01\x4e\x0d\
+\xf9\xe2\xba\xa6\xf6\x13\x61\x70\x07\x86\x28\x1e\x09\x8d\x11\x03\
+\x8b\xaa\xdc\xb8\x69\xd7\xae\x2e\xaa\x42\x32\x52\x86\x5d\x04\x83\
+\x1b\x2a\x45\x94\xe5\xff\x84\x30\x01\x48\x92\x97\x7b\x0d\xa2\x9c\
+\x5d\xec\x04\xaf\xe9\xcd\x0f\x8e\x05\x10\x7c\x95\xb0\x2a\x56\x86\
+\xc6\x48\x81\x2d\xa1\x01\xd4\x97\xf0\x3e\x00\x83\x26\x40\x51\x49\
+\xb4\x02\xe0\x0c\xb6\x00\x44\x74\x62\xc8\xd7\x67\x34\xfc\xd3\x3f\
+\x00\xdd\x93\x4f\xd7\x16\x00\x00\x68\x64\xb3\x2d\xe7\x9d\xce\x2f\
+\xe6\x75\x11\x6c\xf6\xff\x45\xdc\xaf\x2d\xe2\x50\xff\x31\x01\x48\
+\x90\x02\x16\x09\x80\x43\x36\x5b\xd4\x37\x62\x1e\x85\x37\xc1\xe0\
+\xcf\xdc\x65\x65\x30\x24\x00\x5b\x83\x23\xb8\xd2\x8d\x03\x76\x22\
+\xe1\xa7\x00\x44\x93\xbd\x67\x5d\xa2\xe0\x04\x40\x55\x26\x85\x7c\
+\xbd\x97\xf0\x06\x40\x00\x4f\x6d\xb8\x7d\x4e\xf0\x16\x92\xb5\x75\
+\xa7\xcf\x5e\x07\x60\x87\x41\xa8\x22\xcb\xfa\xfa\x66\x83\x67\x3d\
+\xb7\x76\x59\x63\xf9\x5d\x28\x36\x48\x30\x01\x48\x50\x4e\xb2\xf7\
+\xc2\xa0\x73\x57\x81\xb7\x16\xf3\x3a\xb1\xf9\x86\xdd\xd8\x79\xd3\
+\xec\x27\x0c\xe2\x24\x4a\x24\x3c\x01\xf0\x90\xb1\x16\x6b\x29\x8a\
+\x86\x57\x00\x14\x2e\xd1\x04\x40\x23\x93\x2d\x80\x93\x06\x3e\x02\
+\x1b\x70\xc0\xb4\xd0\x05\x68\xca\x1a\x00\x5f\x76\x60\xca\xe3\x6f\
+\x0c\x22\x5d\xb4\x60\xc1\xf7\x32\x47\x7b\xc1\x39\x4d\xad\x67\x08\
+\x10\x7c\xa1\x12\x20\x3f\x06\x24\xfc\xf4\x02\x0d\x08\x13\x80\x04\
+\xf5\xdd\xa4\x67\xd1\x4c\xf4\xc6\x63\x0d\xf0\xe8\xfb\x86\x7e\x63\
+\xf8\xa3\x06\xc5\xa7\x7f\xa8\x86\x6f\x01\x88\xf7\x63\x2c\xd6\x52\
+\x0c\x15\x83\x39\x00\x48\xb6\x02\x50\xa8\xcc\x06\x1f\x03\x04\xe0\
+\x86\xef\xd8\x36\xe0\x6d\x00\x75\x38\x27\x74\x01\x69\x3b\x01\xf0\
+\x2a\x16\xe5\xf4\xd1\xeb\x6b\x27\x1e\xf5\xb2\x30\x0f\x59\x60\xf0\
+\x1c\x40\xe4\x47\x26\x71\x68\x40\x98\x00\x24\x4c\x20\xbf\x30\x08\
+\x33\x22\x33\x6c\xf7\x51\x9b\x01\x1f\xa9\x99\x34\x1b\xc0\xf1\xc1\
+\x4f\x12\xdc\x1d\x1c\x23\x05\xc4\x60\x0b\x40\x4a\x59\x01\x30\xd8\
+\x02\x48\xba\x07\xe0\x91\x93\x67\x3c\x0f\x20\x1f\x1a\x27\xca\xea\
+\xa4\x81\x7c\xdd\xc5\x4b\x56\x66\x61\xd0\x03\x90\xea\x04\x40\x33\
+\x36\xfb\xe9\x7a\xf4\x6a\xa1\x0a\xde\x6b\xf0\x94\x9d\x7b\x87\x8f\
+\x2a\xff\x86\xe2\x32\xc6\x04\x20\x69\x1e\x16\x09\x00\x54\x8e\xb9\
+\x0d\x70\xa5\xc1\x63\xa2\x7c\x41\x4d\xd6\x9b\x34\x6f\xb0\x05\xa0\
+\x82\x92\x55\x00\x2c\xb6\x00\x12\xef\x01\x58\x22\x1e\x1a\x3e\x02\
+\x5b\x80\x49\x03\xf9\xba\x2d\x8f\x57\x9f\x0d\xa0\x2a\xf4\xf9\x1e\
+\x92\xda\x04\xa0\xab\xa5\x71\x3d\x80\x27\x83\x03\xc9\x91\x1b\xfc\
+\xea\x16\xb6\x4d\x83\xc1\x51\x4a\x00\x3f\xdd\x70\xe3\x19\xfb\x0d\
+\xe2\xd0\x00\x31\x01\x48\x58\xb4\x67\xf8\xbd\xb0\xb8\xa4\x45\xf4\
+\xf2\x23\x9e\xdf\x5d\xa2\x4e\x80\xe0\x92\x9d\x00\xbf\x5b\x7f\xeb\
+\xec\xf0\xe6\xb9\x14\x70\xaa\xe1\x5b\x00\xa2\xa5\x4b\x00\x60\xd0\
+\x04\x98\xf0\x16\x00\x00\xc0\xe1\xf1\xd0\x10\xa2\x6e\xd2\x80\xbe\
+\x30\xe3\x1a\x42\x9f\x0d\x00\x59\xcd\xa5\x36\x01\x00\x00\xa8\x86\
+\x57\xe9\x14\xe7\xf6\x5d\x9a\xf4\x1a\x4e\x71\x6d\x70\x7c\x00\x0a\
+\xf9\x5f\x8b\x38\x34\x70\x4c\x00\x12\xd6\xbd\xa2\xae\x17\x10\x8b\
+\x32\xd8\xa4\xfa\xe6\xd5\x87\xbd\x94\xa3\x6e\x73\xdb\x45\x30\x18\
+\xa1\x0a\xd5\x41\xf3\x0d\x1b\x59\x54\x00\x4a\xb9\x05\x00\x84\x37\
+\x01\x4a\x26\xf1\x04\x40\x15\xc1\x0d\xa4\x8a\x81\x6d\x01\x38\x78\
+\x8b\xfd\xff\x4d\x0f\xb7\x4c\x0f\xbe\xd3\x20\x56\xce\xe4\x58\x9d\
+\xe4\x7a\xfd\x3b\x5e\xfd\x8b\x33\x16\x77\x0c\x83\xa0\xc9\x20\x7e\
+\x8f\x56\xef\xfe\xa9\x41\x1c\x0a\xc0\x04\x20\x05\x54\xf4\xc7\x36\
+\x81\x7c\xd3\xe1\x7e\x39\xe3\xe5\x2a\x93\xf8\x59\xb1\x59\x67\x0a\
+\x38\xef\x83\x2b\x00\xd0\x12\x6e\x01\x18\x24\x00\xe2\x7d\xd2\x77\
+\x01\x00\xd0\xe0\x0a\x00\x06\xd8\x7d\xae\x22\xc1\x09\x80\x0a\x1e\
+\x0a\x8d\x11\x37\xef\x71\x37\x0c\x4e\x17\x79\xd1\xf7\xbc\xfa\xd7\
+\x7a\x7b\xfd\x55\x26\x37\x61\xaa\x7e\x3f\x4d\x97\x29\x0d\x55\x4c\
+\x00\x52\x40\x25\xba\x13\x40\x6f\x70\x20\x91\x77\xbf\x7a\x28\xd0\
+\x8c\xc5\x1d\x63\x8c\x1a\x76\xd6\x0e\x86\xe3\x7f\x07\x65\x9d\xb7\
+\xd8\xca\x18\x75\xf1\x92\x95\x59\x83\x38\xc7\xa4\x06\x09\x00\xc4\
+\x27\x5e\x01\x00\x9c\x45\x02\x70\x66\xb1\xe3\x6a\xff\x44\x05\x1a\
+\x7e\x02\x00\x90\x07\xc3\x63\xc4\xab\xbb\x65\xd6\x73\x80\xac\x0b\
+\x8d\x23\xc0\xbc\xa9\xcd\xed\xe3\x0f\xfe\xf3\x82\x05\xdf\xcb\x40\
+\xf4\x63\xa1\x71\x01\x00\x19\xb7\xdc\x24\x0e\x05\x61\x02\x90\x02\
+\xdd\xcb\xe6\x6d\x83\xcd\xf1\x9d\x2a\xcd\x64\x3e\x7a\xe8\x2f\xf4\
+\xe6\xfd\x07\x01\x18\xdc\x5a\x37\xb8\xf6\xeb\x76\x0d\x3f\xc1\x22\
+\x01\x70\x5b\x9e\xaa\x0e\x3f\x59\x51\x04\x31\x49\x00\xb2\x89\x27\
+\x00\x19\x27\x16\x49\x64\xed\xb4\x6b\x1e\xe8\xd7\x96\xd6\x39\x4d\
+\x6d\x93\x61\x70\x0a\x46\x45\x53\x9f\x00\x1c\xa0\x3f\x37\x08\xe2\
+\x44\xf5\xe5\x0f\x0f\x8f\xd6\x4c\x6c\x06\x30\xc5\x20\xee\x1d\xc2\
+\x7c\x0b\x00\x00\x13\x43\x49\x44\x41\x54\x1f\xbb\x96\xcd\xb4\x18\
+\x82\x46\x81\x98\x00\xa4\x84\x08\xbe\x6b\x14\xe8\x86\x69\xd7\xac\
+\x3a\x05\x00\xea\x3e\xbc\xb2\x06\xd0\x8f\x18\x44\xd5\x8c\xfa\x6f\
+\x1b\xc4\x49\x8d\xbe\xee\xe3\x5d\xa1\x71\x32\x79\x17\xfb\x36\x40\
+\x5f\x95\x21\xb8\x7b\x5d\x0a\xf9\xc4\x4b\xae\x05\xe4\x83\x6f\xac\
+\x03\x00\x95\xec\x59\xfd\x79\xbd\x77\xfd\xbc\xe6\xf6\x08\x72\x9a\
+\x4f\xfd\x16\x00\x00\x08\xfc\x0f\x8d\x02\x7d\x78\xc6\xe2\x8e\xdc\
+\xe4\xab\x5a\x47\x28\xb0\xc4\x24\x26\xa4\x85\xc3\x7f\xd2\x81\x09\
+\x40\x4a\xe4\xb2\x99\xff\x05\xb0\xd7\x20\x54\xad\xcf\x64\x6e\x04\
+\x54\x32\x7b\xab\x97\x00\x38\xd1\x20\xe6\x7d\x65\x7d\xfb\xdf\x91\
+\x85\x4f\x03\x74\xf1\xf7\x01\x6c\xdf\x38\xca\xe0\x04\x00\x20\xae\
+\x3a\xf1\x0a\x40\x5f\xb5\xeb\x85\xe0\x40\x82\x33\xfb\xf5\x7a\x0f\
+\x8b\x04\xe0\xb9\x87\x6e\x3e\xdf\x62\x98\x51\xec\x3a\x97\xcf\x69\
+\x87\xc5\x71\x40\x60\x42\x6f\xc1\x5f\x59\x5d\x29\x37\x01\xb0\xb8\
+\x89\x31\x2f\x19\xdf\x62\x10\x87\x0c\x30\x01\x48\x89\x35\x4b\x1b\
+\x77\x00\xf2\x1d\xa3\x70\xef\xa8\x6f\x6e\xbf\x5d\x21\x7f\x6d\x12\
+\x4d\xe4\x66\x93\x38\xe9\x13\x7e\x14\x10\x3e\xf6\x93\x00\xea\xf7\
+\x06\xdf\x04\x08\x00\x99\x8a\x28\xf1\x04\xa0\x4f\xf0\x4d\x7a\xea\
+\xb4\x5f\x15\x00\x15\x93\x04\xa0\xcd\x20\x46\x89\x88\x0a\xf4\x4e\
+\x93\x50\xaa\x5f\x87\x86\x1f\x23\x06\x00\x11\x7c\xa7\xf3\xa6\x39\
+\xc1\xb3\x20\xc8\x06\x13\x80\x14\xf1\x8a\x6f\x18\x86\x7b\x0f\x00\
+\x8b\x06\xb5\x1e\x5f\xb5\xfb\xfb\x06\x71\x52\x47\x2d\x2a\x00\x22\
+\xb1\x57\x00\xbc\xab\xa8\x35\x08\xd3\xbb\x66\x69\x63\xf0\x14\x3e\
+\x23\xeb\x83\x23\xf8\xe2\x2b\x00\x67\x2e\xbc\xaf\x16\xc0\xd4\xe0\
+\x67\x02\xab\x0c\x62\x94\x90\xde\x61\x14\x68\x84\x51\x1c\x44\x5e\
+\xbe\x62\x15\x8b\xc2\x31\x01\x48\x91\xee\x96\x59\xab\x01\x74\x24\
+\xbd\x8e\x57\xf9\xde\x60\x3d\xae\x23\xd0\x17\x83\x63\x68\xfc\x09\
+\x00\xb4\x60\x51\x01\x48\xcd\x9f\xa1\xa8\x06\x57\x00\x20\xc5\x37\
+\xa3\x55\x46\x15\xb3\x00\x1c\xf5\x72\x9b\xa2\x38\x69\x0d\x8e\x51\
+\x42\x9d\xcb\xe7\xb6\x21\x55\x63\x8b\xf5\xe7\xdd\x2d\xb3\x78\xf3\
+\x5f\x8a\x30\x01\x48\x1b\x91\xaf\x25\xbd\x84\x43\xa8\xc0\xa7\x69\
+\x3d\xb6\x44\x82\xf7\xa2\x4b\xb1\x05\x00\xe7\x2c\x7a\x00\xd2\x52\
+\xfe\x87\x77\xe1\x5b\x00\x00\xc6\x4f\x6f\x7e\xb0\xa8\xdf\x7b\x75\
+\x26\xe5\xff\x7c\x45\xc6\xa5\x2d\x39\x3f\x26\x11\xb4\x24\xbd\x86\
+\x83\x54\xf5\x8b\x49\xaf\x81\x5e\x89\x09\x40\xca\x54\x64\xdd\xed\
+\x00\xfe\x98\xf4\x3a\x00\x00\x8a\x9f\x75\x2e\x9f\x5b\x26\xc7\x9e\
+\x06\xc0\x87\x37\xa3\x29\xe2\xaf\x00\xa8\x2b\xff\x9b\x00\x0f\x95\
+\x29\x78\x8b\x1b\x30\x51\xd0\xde\x99\xc5\xbd\x52\xe7\x1b\x3c\x6e\
+\xed\x9a\xa5\x8d\x7b\x0c\xe2\x94\x54\xe4\xe5\x36\x58\xcc\x18\x09\
+\x77\xcf\xba\x96\xb9\xbf\x49\x7a\x11\xf4\x4a\x4c\x00\x52\x66\xcd\
+\xd2\xc6\xbc\x42\x96\x24\xbd\x0e\x00\x10\xf1\x5f\x48\x7a\x0d\xb1\
+\x72\xf2\x7c\x70\x8c\x52\x4c\x03\xf4\x06\xf7\x00\x88\xa4\x26\x01\
+\x58\x7b\xeb\xbc\xa7\x01\x04\xff\xde\x2b\xe4\x98\x09\xc0\x81\xa3\
+\xb0\x38\x3f\xf4\x59\x50\xb9\x2f\x38\x46\x02\xba\x5b\x66\x3d\x07\
+\x35\xeb\x05\x18\xa8\x02\x34\xba\x21\xe1\x35\xd0\x61\x30\x01\x48\
+\xa1\x75\x13\x67\xde\x01\x45\x67\xa2\x8b\x50\xfc\xaa\x6f\x0f\x71\
+\xf0\xf2\xde\xe2\x38\x5a\xec\x5b\x00\x0e\x1a\xde\x04\xa8\xe9\xe9\
+\x01\x38\x20\x7c\xa0\x8e\x00\xc7\x4c\x00\x32\xfb\xaa\x2e\x01\x50\
+\x11\xfa\x2c\x15\x83\x0b\x76\x12\x22\x99\xcc\x97\x61\x30\x1a\x38\
+\xc0\x37\xbb\x5a\xe6\x75\x25\xf8\x7c\x3a\x02\x26\x00\x69\xb4\x44\
+\x3c\xa0\x7f\x97\xe4\x12\x9c\xd3\xc1\xfd\xe9\x1f\x80\xba\xf0\x1e\
+\x00\xa0\x04\x15\x00\xd5\xe0\x26\x40\x31\x18\x7a\x64\x49\x2d\x46\
+\xea\x0a\x1a\x8f\xf5\x12\x0f\x79\x53\xf0\x73\x80\x7c\x5e\xf2\xbf\
+\x35\x88\x93\x88\xce\x65\x33\xd7\x01\xb0\x98\x0c\x38\x10\x5b\xbd\
+\x8b\xfe\x31\xa1\x67\xd3\x31\x30\x01\x48\xa9\xae\x96\x39\x3f\x13\
+\xc1\x6d\x89\x3c\x5c\xb0\x62\xed\xcd\x73\xca\xb2\xe4\xd9\x1f\x5a\
+\xc8\x58\x24\x00\xf1\x37\x01\x4a\xf8\x16\x80\x2a\x76\x58\x2c\xc5\
+\x8a\x13\xb5\x98\xa8\x77\x42\xdd\x35\x1d\x13\x8e\xf6\x02\x51\xf9\
+\xf3\xd0\x87\x88\x68\xfb\xa3\x37\x9f\x9f\xaa\x04\xaa\xbf\x34\xd2\
+\xbf\x03\x10\x25\xf0\xe4\x4f\xf5\x0d\x7f\xa2\x14\x62\x02\x90\x62\
+\x91\x44\x37\x40\xf1\x6c\x89\x1f\xbb\x4b\x9c\x7e\xbc\xc4\xcf\x4c\
+\xc4\x6e\xb7\xcb\x22\x01\xa8\xaa\x7f\xef\xbd\xe1\xb7\xa3\x1d\x85\
+\x6a\x78\x13\xa0\x3a\x4d\x57\x02\xe0\x75\x8d\x45\x1c\xc9\xf8\x23\
+\x76\xf8\x4f\xbb\xa6\xed\xf5\x00\x4e\x0f\x7d\x86\xaa\x2b\xdb\xf2\
+\xff\x41\xeb\x6e\x9d\xd3\x09\xe0\x96\x52\x3e\x53\xa0\x3f\xec\x5a\
+\x3e\x87\x97\xfe\xa4\x18\x13\x80\x14\xeb\x5e\x36\x6f\x9b\x66\xf0\
+\x7e\x00\xbe\x54\xcf\x14\xe0\xe3\x43\x65\x52\xd7\xc6\x96\xf9\xfb\
+\x80\xf0\x4f\xc6\xbe\x32\x77\x92\xc1\x72\x8e\xcc\xa0\x02\xe0\xd4\
+\xa5\x2a\x01\x78\xb8\x65\xee\x46\x00\x4f\x87\x47\xd2\x4b\x8f\xf4\
+\x6f\xa2\xac\xbc\x2d\x3c\x3e\xe0\xc4\xff\x9f\x45\x9c\xa4\x15\x72\
+\x99\xff\x07\x83\xe1\x57\x45\xda\xa0\xfb\xf3\xd7\x95\xe8\x59\x34\
+\x40\x4c\x00\x52\x6e\xdd\xb2\xd9\x3f\x15\x2d\xd9\x27\xf2\x3b\x3b\
+\x97\xcf\xbe\xa9\x44\xcf\x4a\x05\x35\x98\x4b\x9f\xf1\x2e\xd6\x04\
+\x40\x04\x23\x43\x63\xa8\x60\xa7\xc5\x5a\x8c\x05\xef\xab\x3b\xe0\
+\x0d\x47\xfa\x77\xa2\x7a\x55\x68\x7c\x00\x2f\xbc\x7e\xd7\xe6\x07\
+\x0c\xe2\x24\xee\x91\xa5\x8d\xcf\x0a\xf4\x83\x25\x78\xd4\x4e\xe7\
+\xe5\xf2\xae\x3b\x2e\x78\xa9\x04\xcf\xa2\x00\x4c\x00\xca\x40\x67\
+\xcb\x9c\xff\x04\xf0\xef\xb1\x3e\x44\xd1\xe9\xab\xf7\x5c\x13\xeb\
+\x33\x52\xc8\x89\x06\x27\x00\xde\x21\xde\x0a\x80\x22\x78\x8b\x41\
+\x52\xd6\x03\x00\x00\x10\x0d\x4e\x00\x14\x98\xd8\xb0\x68\xf5\x6b\
+\xc6\xfc\x4e\xbb\xb6\xbd\x0e\xc0\xf4\xd0\xf8\xa2\xb8\x6b\xc5\x8a\
+\x2b\x13\xd8\x3b\x8f\x47\xe7\xf2\x39\xdf\x17\xc5\xb2\x18\x1f\xb1\
+\xdb\x89\xbe\x65\xed\x2d\xb3\x4c\x66\x3d\x50\xbc\x98\x00\x94\x89\
+\xae\x89\xb3\x3e\x09\xe0\x5b\x31\x85\xdf\x20\x59\x7d\xcb\x60\x1d\
+\xf9\x7b\x34\xaa\xe1\x27\x01\x9c\x68\xac\x09\x80\x07\x46\x85\xc6\
+\x48\x63\x05\xc0\x15\xe4\x37\x16\x71\x34\x8a\xae\x7c\xf5\xaf\x79\
+\x67\xf3\x49\xd7\x0b\x7e\x64\x11\x27\x4d\x72\x15\x99\x0f\x01\x6a\
+\x7f\x2a\x40\xf0\x12\x9c\xbc\x79\x28\x34\x10\x0f\x16\x4c\x00\xca\
+\xc5\x12\xf1\x5d\xcb\x67\x7f\x10\xc0\xa7\x01\x14\x0c\x23\x77\x2b\
+\xe4\x92\xa1\xb2\xef\x7f\x18\x06\xd3\x00\x4d\xae\x5c\x3e\x22\xb1\
+\x48\x00\x34\x5d\x4d\x80\x00\xb0\xf6\xd6\xd9\x7f\xb0\x68\x72\x55\
+\x91\x77\x03\x2a\x07\xff\xb9\xaf\x29\xb3\x29\x34\x2e\x80\x9e\x1e\
+\xdd\xf3\x6b\x83\x38\xa9\xb2\x66\x69\x63\xbe\x22\x97\x7d\x17\x60\
+\x93\x80\xf5\x79\xd4\xab\x9e\xdf\xb5\x6c\xd6\xef\x0c\x63\x52\xcc\
+\x98\x00\x94\x99\xae\xe5\xb3\xbf\xa8\x90\x8b\x00\x84\x97\xd8\x04\
+\x2b\x7a\x25\x3f\x77\xdd\xf2\x59\x16\xf7\x86\x97\x29\x93\x69\x80\
+\xf1\x6e\x01\x18\x24\x00\x2e\x8d\x5b\x00\x00\x04\xf8\x99\x41\x8c\
+\x33\xea\x9b\xda\x2e\x3b\xf8\xcf\x5a\x55\xf1\x49\x00\x16\xf7\x27\
+\xdc\xd5\xd7\x28\x3a\xe8\xac\x59\xda\xb8\xa7\x22\xe7\xde\x08\x95\
+\xff\x08\x0c\xe5\x45\xf1\x4d\x29\x54\xcd\xe8\x5e\x3e\x27\x45\x17\
+\x0f\x51\x31\x98\x00\x94\xa1\x75\xcb\x67\xad\xaa\xc8\x65\xa6\x03\
+\xf8\x20\x80\xc7\x07\x10\xe2\x51\x15\x5c\xd1\x75\xf3\xec\x2b\xcb\
+\xfd\x7c\x73\x30\x31\x98\x06\x08\x49\x7d\x02\xe0\x7d\xfa\x2a\x00\
+\x80\x65\x89\x5d\x3e\x0d\xa8\x34\x2c\x5c\x7d\xa6\x28\x3e\x61\x12\
+\xd1\x4b\x9c\x7b\xe5\x89\x5b\xb3\xb4\x31\xdf\xd5\x32\xeb\x63\xa2\
+\x72\x19\x80\xfe\xce\x65\xf0\x00\x7e\x26\xf0\x33\x3b\x5b\x66\x7f\
+\xa8\xf3\xb6\x69\xa9\x19\x35\x4d\xc5\xb3\xb8\x2f\x9e\x12\xd0\x77\
+\xb7\xfb\xb7\xb0\x44\xff\xbb\x61\x53\xfb\xc5\xaa\x72\x05\x44\x2f\
+\x02\x70\x16\x0e\xff\xe7\xfa\x3c\x80\xbb\x45\xfc\x77\x3b\x27\xcc\
+\xf9\xc9\x81\x69\x83\xa4\x90\x67\xe4\xd8\x2f\x3b\x56\x94\xd8\x12\
+\x80\x8b\x97\xac\xcc\x6e\xdd\x84\xe0\x49\x80\x51\x2e\x4a\x65\x02\
+\xd0\xa3\x7b\x7e\x5d\x2b\xc3\x7a\x10\xfa\x89\x5d\x70\x61\xc3\xc2\
+\xf6\x4f\x2a\x70\x1d\x80\xca\xe0\x85\x29\x9e\xe8\x3c\x6d\xe6\xca\
+\xe0\x38\x65\xa0\xb3\x65\xd6\x2f\x00\xfd\x65\x43\xd3\xea\xb7\xaa\
+\xe8\xe5\x50\x5c\x06\x39\x6c\x55\x6b\x2f\x80\x87\x05\xf8\x69\xe4\
+\xa2\xef\x76\x2f\x9b\xb7\xa1\xd4\x6b\x25\x5b\x4c\x00\xca\xdd\x12\
+\xf1\x9d\xc0\x3d\x38\xf0\x3f\xd4\x2d\xe8\xae\xc8\x56\xf7\x4c\x8a\
+\xb2\x18\xa1\xd0\xda\xac\x64\xb6\x6b\x6f\xef\xd3\x9d\xb7\x9d\x67\
+\x31\xf4\x66\xd0\x71\xea\x9f\xd1\xf0\x42\x58\x6c\x09\xc0\xae\x67\
+\x6a\x47\x01\x51\x70\x8e\x52\x19\x0d\x4b\x65\x02\xb0\xb1\x65\xfe\
+\xbe\xfa\xe6\xb6\x5f\x00\x78\x57\x68\x2c\x55\xd8\x5d\x37\xeb\x64\
+\xf9\xd0\x4a\x92\x45\x3b\x5b\x70\x17\x80\xbb\x00\x60\xc6\xe2\x8e\
+\x31\xfb\xf2\x85\x71\x0e\x6e\x2c\xbc\xef\xc9\x88\x6e\x7d\x78\xd2\
+\x9c\xcd\x43\xeb\xf7\x64\xf0\x63\x02\x30\xc8\x74\xaf\xa8\xeb\x05\
+\xf0\x87\xa4\xd7\x51\x2e\xa2\x28\xf7\xac\xcb\x04\x9f\xf2\x1a\xd1\
+\x70\xf5\xda\xe1\x71\x94\x41\xf7\x45\xbd\xa3\x1c\x32\xa1\x61\xf4\
+\xe1\x49\xe7\xa4\xee\x14\xc0\x41\x0a\xf9\xbe\x40\x83\x13\x00\x43\
+\x05\x71\x7e\x48\x4f\xb0\x5b\xb3\xb4\x71\x0b\x80\x2d\x49\xaf\x83\
+\xe2\xc5\x1e\x00\x1a\xd2\xaa\xaa\xf0\x2c\x0c\x26\x2d\x46\x15\xbb\
+\xe3\xa9\x02\x44\x59\x8b\x31\xc3\xbb\xd2\xfc\xc9\x4d\x7b\x86\xdf\
+\x09\x83\xd3\x18\x86\x6e\x1f\xc2\xa7\x62\x68\x08\x61\x02\x40\x43\
+\x5a\x5f\x2f\x45\xf0\x27\x9d\x4c\x94\x89\x25\x01\x10\xf8\xe0\x06\
+\x40\x18\x8c\x3b\x8e\x53\xf7\x8a\xba\x5e\x08\xd2\xf2\x89\xdb\x3b\
+\x2f\x5f\x4a\x7a\x11\x44\xa5\xc0\x04\x80\x86\x3c\x01\x9e\x09\x8d\
+\xe1\x5d\x3c\x27\x01\x04\x32\xe8\x13\x00\x00\x10\x87\x6f\xa1\x84\
+\x77\x5e\x1c\xc5\xf7\x39\xc5\x8e\x86\x0a\x26\x00\x34\xe4\xa9\x41\
+\x02\xe0\xbc\x8f\x27\x01\x30\xb8\x07\x40\x24\x9d\x47\x00\x0f\xd5\
+\x79\xd3\xec\x27\x14\xf8\x69\xc2\xcb\x88\x34\xd2\x7f\x4e\x78\x0d\
+\x44\x25\xc3\x04\x80\x86\x3c\x8b\x04\x40\x63\xaa\x00\x40\xc2\xef\
+\x01\x50\x95\xd4\x27\x00\x00\x20\x1a\xfd\x03\x12\xac\x02\x08\xf4\
+\x6b\x7d\xd7\xe6\x12\x0d\x09\x4c\x00\x68\xc8\x13\xd5\xf0\x71\xb4\
+\x31\x4d\x03\xb4\xb9\x07\x40\x52\x7b\x02\xe0\x50\x5d\x2d\xf3\xba\
+\x14\xf8\x76\x42\x8f\x7f\x7a\x4f\x2f\x3e\x93\xd0\xb3\x89\x12\xc1\
+\x04\x80\x86\x3c\x75\x12\x5c\x01\x90\x98\xa6\x01\x0a\x74\x6c\x70\
+\x8c\x14\xde\x03\x70\x24\x91\x2b\x7c\x16\xc0\xfe\x52\x3f\x57\x44\
+\xff\x7a\xc3\xed\x73\xca\x22\x51\x22\xb2\xc2\x04\x80\x86\x3c\x07\
+\x1f\x9c\x00\xc4\x37\x0d\x50\x82\x13\x00\x94\x41\x13\xe0\x41\x8f\
+\x2c\x3b\x6f\x93\x8a\xfc\x43\x29\x9f\x29\x8a\x65\x9d\x37\xcf\xf9\
+\x41\x29\x9f\x49\x94\x06\x4c\x00\x68\xc8\xf3\x70\x06\x09\x00\x4e\
+\x35\x88\xf1\x5a\x8a\x71\x06\x51\xb6\x1a\xc4\x28\x99\x75\x37\xcf\
+\xfc\x0a\x20\x3f\x2e\xd1\xe3\x56\xed\xa9\x1d\xfd\x91\x12\x3d\x8b\
+\x28\x55\x98\x00\xd0\x90\x97\x43\xde\x22\x01\x18\x35\xf9\xaa\xd6\
+\x11\x06\x71\x5e\x49\x30\x26\x34\x84\xaa\x96\xd9\x44\x37\xd1\x8a\
+\x9c\x5b\x04\x20\xee\x61\x3c\x9b\x35\xa3\x57\x6c\xb8\xf1\x8c\x92\
+\x6f\x39\x10\xa5\x01\x13\x00\x1a\xf2\x1e\x9a\x70\xde\x73\x30\xd8\
+\x77\x1e\x56\x95\x99\x60\xb0\x9c\x57\x52\x9c\x10\x1c\x43\x24\x4d\
+\x53\xf6\x8a\xb2\x66\x69\xe3\x16\x68\xf4\x66\xc4\x57\xbd\xd8\x9c\
+\x51\xbd\x74\xdd\x4d\x73\xc2\xaf\x83\x26\x2a\x53\x4c\x00\x88\x0e\
+\x8c\xc9\x7d\x32\x34\x8c\x46\x91\x69\x02\x50\xb7\xa0\xbb\x02\x40\
+\x70\x55\x41\xa4\xbc\xb6\x00\x0e\xea\x6a\x99\xd7\x05\x8d\xe6\xc3\
+\xe0\xcf\xe6\x55\xda\x5c\x14\xcd\x7b\xb8\x65\xce\x63\xc6\x71\x89\
+\xca\x0a\x13\x00\x22\x00\x10\x6c\x0a\x0d\xa1\x4e\x4c\x13\x80\x8a\
+\xda\x97\xc6\x00\x08\xbe\x09\xd0\x4b\xf4\xa2\xc1\x72\x12\xd1\xd5\
+\x32\xaf\xab\x90\xcb\xcc\x56\xe0\x97\x06\xe1\x0a\x00\xbe\xb8\xb7\
+\x66\xf4\x45\x6b\x6f\x9d\xf7\xb4\x41\x3c\xa2\xb2\xc6\xdb\x00\x89\
+\x00\x40\xc3\x13\x00\x00\xe3\x0d\x62\xbc\xac\x17\xb9\xb1\x16\x19\
+\x7a\x55\xa6\xa2\x6c\x13\x00\x00\x78\x64\x69\xe3\xb3\x80\x5e\x56\
+\xdf\xd4\xfe\x1e\x08\xbe\x00\xe0\xf4\x7e\x86\x50\x00\x3f\x86\x46\
+\x9f\xe9\x6a\x99\xd7\x15\xc3\x12\x89\xca\x12\x2b\x00\x44\x00\x00\
+\x0d\x4e\x00\x44\xd5\xb4\x02\x20\x5e\x2d\x4e\x00\xf4\xae\x59\x3a\
+\x63\x10\x9c\x6f\x17\xed\x6a\x99\x7d\xc7\x59\x3d\x9b\x5e\xaf\xc0\
+\xdb\xa0\xb8\x1d\xc0\xd1\xf6\xef\x0b\x00\x1e\x00\xf4\x1f\x21\x6e\
+\x72\xd7\xf2\xd9\x97\xf3\xcd\x9f\xe8\x95\x58\x01\x20\x02\x20\x90\
+\x4d\x1a\x1a\x44\x6d\xb7\x00\xc4\x64\x06\x80\x6c\x01\x24\xf8\x3f\
+\x2d\x2d\x56\xac\xb8\x32\x02\xf0\x93\xbe\xff\x61\xea\x75\xad\x27\
+\x64\x3c\xce\xf0\xc8\xd4\x42\xa3\x0a\x48\x66\x37\xbc\x3c\xe5\x77\
+\x57\x3f\xde\xbd\xa2\xae\x37\xd9\xd5\x12\xa5\x1b\x13\x00\x22\x00\
+\x5e\xfd\x26\x91\xe0\x82\x98\xe9\x16\x80\x38\x1d\xa7\x1a\xda\x02\
+\xa0\x65\x5d\xfe\x3f\x96\xbe\x2e\x7e\x76\xf2\x13\x0d\x00\xb7\x00\
+\x88\x00\xb8\xac\x0b\xef\x01\x10\x8c\xbf\x78\xc9\x4a\xb3\xa4\xda\
+\xab\x04\xcf\x00\x18\xec\x09\x00\x11\x0d\x1c\x13\x00\x22\x00\x39\
+\x97\x79\x0a\x40\x14\x18\x26\xbb\x75\x73\x8d\xe5\x36\x40\xf0\x0c\
+\x00\x45\xf8\x3d\x07\x44\x34\x38\x31\x01\x20\x02\xb0\x66\x69\x63\
+\x1e\x40\xf8\xad\x80\x3e\x7a\x9d\xc1\x72\x00\x00\xf2\xff\xb7\x77\
+\x77\x31\x76\x55\x65\x18\x80\xbf\xb5\x4f\xa7\x28\xd6\x7f\x2f\x48\
+\xd0\x00\xd1\x14\xcc\xd4\x52\x6c\x0b\x23\xa0\xa1\xf1\xc2\xc4\x0b\
+\x23\x09\x25\x6a\x4c\x6d\x0a\xc1\xe8\xa5\x89\x5e\x10\x8d\x35\x1a\
+\x2f\xb9\x34\x86\x9f\x76\x20\x9a\xa8\x8d\x46\x03\xd1\x08\x46\x4c\
+\x84\x62\x0b\x15\x4a\x3b\x80\x8d\x40\x81\xf0\x63\x24\xa8\xfc\x15\
+\x99\x9e\xfd\x79\xc1\x10\x86\x3a\x33\x9d\x99\xb5\xa7\x43\xcf\x79\
+\x9e\xbb\xce\x39\xfb\x5d\xeb\xe6\xa4\x6f\xf6\x5a\x7b\xed\x88\xea\
+\x3d\x00\x4d\x14\x8f\xbb\x01\x33\x52\x00\x60\x4a\x46\x1c\xae\x0e\
+\x69\x4a\x67\x05\x20\x22\x4e\xab\x0d\x68\x3b\x78\xd5\x31\x30\x98\
+\x14\x00\x98\x52\x22\x0f\xd7\x66\x34\xd9\x61\x01\xc8\xa8\x5e\x4e\
+\x68\x9a\xb4\x04\x00\xcc\x48\x01\x80\x37\x74\x70\x34\x6c\xbb\xd0\
+\x43\x6a\x66\x34\xba\x79\x62\x65\x94\x0e\xde\x03\xd0\x86\x25\x00\
+\x60\x46\x0a\x00\x4c\x29\x19\x87\x6a\x33\x32\xba\xb9\x03\x50\x4e\
+\x3d\xf2\xa1\xe8\xe0\xf7\xd9\x96\x46\x01\x00\x66\xa4\x00\xc0\xeb\
+\x4a\x56\x17\x80\x88\xe8\xa4\x00\x64\xef\x68\x17\x4f\x13\xb4\xa7\
+\x8c\x34\xcf\x74\x90\x03\x0c\x20\x05\x00\xa6\xf4\xdf\xfe\xca\xa1\
+\x78\xed\xdc\xf8\x1a\xab\x46\xb7\xee\xad\xde\xbc\xd7\xeb\xe6\x54\
+\xc1\x7f\x4e\x3d\xdd\x00\xf0\x7f\x14\x00\x98\x32\xf1\xa3\x4d\x2f\
+\x46\x44\xf5\xa6\xb9\x12\xfd\x73\x6a\x33\xb2\x74\x52\x00\x6c\x00\
+\x04\x66\xa5\x00\xc0\x9b\x94\xfa\x8d\x80\x4d\x53\x5d\x00\x22\xda\
+\xea\x63\x85\x33\xcb\x23\xf5\xf3\x00\x06\x95\x02\x00\x6f\x92\x7f\
+\xab\x4d\x68\x32\x3f\x5a\x3d\x8b\x4e\x96\x00\x52\x01\x00\x66\xa5\
+\x00\xc0\x34\x59\xea\xef\x00\x64\x34\xd5\x05\xa0\x44\xfd\x19\x00\
+\xd1\x84\x02\x00\xcc\x4a\x01\x80\x69\x9a\xb6\xfe\x51\xc0\x88\xec\
+\x60\x09\xa0\x8b\x37\x0b\xba\x03\x00\xcc\x4e\x01\x80\x69\x4a\x5b\
+\xbf\x04\x10\x11\x1f\x3c\x7b\xdb\x1d\xef\x5c\xec\xc5\xe7\x6c\xd9\
+\xf3\xfe\x88\x58\x55\x3b\x89\x2c\xad\x02\x00\xcc\x4a\x01\x80\x69\
+\x56\x1f\x79\xec\xe1\x88\x38\x52\x19\x53\x46\x62\xe4\xec\xc5\x5e\
+\x7c\xca\x48\xd3\xc5\x13\x00\xfd\x78\xfe\xdd\x8f\x77\x90\x03\x0c\
+\x28\x05\x00\xa6\xd9\xb5\xeb\xf2\x7e\x44\x4c\xd4\xe6\x94\x28\x6b\
+\x16\x7b\x6d\xdb\x6f\xcf\xa8\x1d\x3f\x22\x9e\x98\xd8\x35\xfa\x6a\
+\x07\x39\xc0\x80\x52\x00\xe0\x18\x19\x71\x5f\x75\x46\xc6\xba\x45\
+\x5f\xdc\x94\xfa\x3d\x04\x25\x1e\xae\xce\x00\x06\x9a\x02\x00\xc7\
+\x28\x11\xfb\xeb\x33\xf2\xe3\x8b\xbe\x38\x63\x75\xf5\xf8\x6d\x17\
+\x2f\x36\x02\x06\x99\x02\x00\xc7\x28\x59\x5f\x00\x22\xe2\xbc\xd8\
+\x9e\x8b\xfc\x7d\xd5\x9f\x23\x10\x51\x0e\xd4\x67\x00\x83\x4c\x01\
+\x80\x63\xbc\x3c\x99\xfb\xa3\x83\x77\x02\xac\x3b\xbc\x67\x71\x2f\
+\x06\x2a\xb1\xe8\x0d\x84\x6f\x48\x05\x00\x98\x93\x02\x00\xc7\xf8\
+\xfb\x4f\xc7\x9e\x8f\x88\x47\x6b\x73\x8e\x96\x66\xc1\xcb\x00\xa3\
+\x5b\xf7\x9e\x16\x19\xef\xad\x1d\xbb\xdf\xeb\x57\x6f\x64\x04\x06\
+\x9b\x02\x00\x33\x28\x91\xd5\x1b\x01\x4b\xc9\xf3\x16\x3e\x6e\xfd\
+\x8b\x84\x22\xe2\xc9\x89\x1b\x2e\x7c\xae\x83\x1c\x60\x80\x29\x00\
+\x30\x83\xec\x60\x23\x60\x44\x6c\x58\xe8\x05\xa5\x34\x0b\x2e\x0d\
+\xc7\xca\x88\x83\xb5\x19\xc0\xe0\x53\x00\x60\x06\xd9\x94\x7d\xf5\
+\x21\x31\xb6\xfe\xaa\x7b\x46\x16\x72\x49\x29\x51\x5d\x00\x1a\x1b\
+\x00\x81\x79\x50\x00\x60\x06\x19\xfd\xbb\x22\xa2\xad\x8c\x79\xc7\
+\xd1\xfe\xc2\x96\x01\x32\x63\xf1\x8f\x0f\xbe\x91\xe2\x0e\x00\x70\
+\x5c\x0a\x00\xcc\x60\x6a\x0d\xfd\x81\xda\x9c\x7e\xdb\xff\xd4\x7c\
+\xbf\xbb\xfe\xaa\x7b\x4e\x8d\x88\xea\x3d\x00\x6d\xaf\xdd\x5b\x9b\
+\x01\x0c\x3e\x05\x00\x66\x91\x11\x7f\xae\xcd\x28\xd1\x7c\x72\xbe\
+\xdf\x9d\x7c\xf5\xe8\xda\x88\xe8\x55\x0e\xf9\xdc\xc1\xeb\xc7\x1e\
+\xaa\xcc\x00\x86\x80\x02\x00\xb3\x28\x19\x77\xd4\xa7\xe4\xc5\xf3\
+\x3d\x10\xa8\x2d\x71\x71\xed\x68\x25\x62\x77\x44\xa9\x3d\xc3\x00\
+\x18\x02\x0a\x00\xcc\x22\x4b\xa9\xbe\x03\x10\x11\xef\x1b\x3d\x7c\
+\xf7\xda\xf9\x7c\xb1\x64\xb9\xa4\x76\xb0\x36\x72\x77\x6d\x06\x30\
+\x1c\x14\x00\x98\xc5\xc1\x9d\xe7\x3f\x51\x22\x1e\xab\xcd\x69\x4a\
+\xfb\xb9\xe3\x7d\x67\xf3\xe6\x5f\xf4\xa2\xc4\x45\xd5\x63\x65\xe9\
+\xe0\xae\x05\x30\x0c\x14\x00\x98\x43\x76\xb0\x0c\x50\xa2\x5c\x7a\
+\xbc\xef\x1c\x7a\xd7\x59\xeb\x23\xe2\x3d\x95\x43\x4d\x8e\xac\xec\
+\xd5\x3f\xbe\x08\x0c\x05\x05\x00\xe6\x50\x4a\xfc\xa9\x36\x23\x23\
+\xd6\xad\xbd\x72\xcf\x59\x73\x7d\xa7\xdf\xf6\x3f\x5d\x3b\x4e\x44\
+\xec\xdb\x77\xed\x86\x97\x3b\xc8\x01\x86\x80\x02\x00\x73\x68\x7b\
+\x79\x73\xd4\x9f\x07\x10\xd9\x8f\xcf\xcf\xf5\x79\x13\xe5\xf2\xda\
+\x31\x22\xf3\xb6\xea\x0c\x60\x68\x28\x00\x30\x87\x83\xd7\x8f\xfd\
+\x23\x22\xee\xee\x20\xea\xb2\xd9\x3e\x38\x77\xcb\x9e\xd5\x19\xb1\
+\xae\x76\x80\xa6\xd7\xbb\xa5\x36\x03\x18\x1e\x0a\x00\x1c\x47\x46\
+\xfe\xa6\x83\x98\x0b\xd7\x5e\x71\xf7\x9a\x99\x3e\x68\x7b\xf9\x85\
+\xfa\xf8\xf2\xd4\xfe\x1b\x36\x74\x51\x54\x80\x21\xa1\x00\xc0\x71\
+\x64\x44\x17\x05\x20\xda\xec\x7f\xed\xd8\xbf\x5d\xb2\xfd\xf6\x15\
+\x11\x65\x4b\x07\xf1\xb7\x78\xfe\x1f\x58\x08\x05\x00\x8e\x63\x62\
+\xe7\xd8\x03\x51\xe2\x50\x6d\x4e\xc9\xb2\xed\xdc\x2d\xbb\x4f\x9f\
+\xfe\xb7\x67\x1f\x3f\xf5\x2b\x11\xf1\xe1\xda\xec\xc8\xb6\x93\x92\
+\x02\x0c\x0f\x05\x00\xe6\xa1\x64\xde\xdc\x41\xcc\xdb\xda\x15\xcd\
+\x77\x5f\xff\xc7\xe8\xe6\x89\x95\x25\xe3\xdb\x1d\xe4\xbe\xf4\x42\
+\x1c\xf9\x63\x07\x39\xc0\x10\x51\x00\x60\x1e\xda\x68\x7e\xd5\x49\
+\x50\x96\x2b\xd7\x6c\xbd\xeb\x92\x88\x88\xde\xaa\x97\xb6\x47\xc4\
+\x99\xd5\x99\x25\x7e\x7b\x78\x7c\xd3\x2b\xd5\x39\xc0\x50\x29\xcb\
+\x3d\x01\x38\x39\x64\xf9\xd8\xb6\xbd\x0f\x45\xc6\xea\xea\xa4\x88\
+\x67\x4b\xc4\x8e\x88\xf8\x66\x74\xf1\x1b\x2c\xcd\x67\x0f\xec\xd8\
+\xf8\xbb\xea\x1c\x60\xa8\xb8\x03\x00\xf3\x52\x32\x33\xc7\x3b\x49\
+\x8a\xf8\x40\x44\x7c\x2b\xba\x29\xe0\x4f\x9e\xf3\xc2\xa3\xb7\x76\
+\x90\x03\x0c\x19\x05\x00\xe6\xa9\x3f\xb2\x62\x3c\x22\x26\x97\x7b\
+\x1e\xd3\x65\xc6\x75\xbb\x76\x5d\xde\x5f\xee\x79\x00\x27\x1f\x05\
+\x00\xe6\xe9\xc1\x6b\x37\x3c\x1d\x91\x3f\x5f\xee\x79\x4c\xf3\xdf\
+\x58\x91\x3f\x5e\xee\x49\x00\x27\x27\x05\x00\x16\xa0\x69\x7a\xd7\
+\x2c\xf7\x1c\x5e\x57\x32\x7e\x32\x75\x52\x21\xc0\x82\x29\x00\xb0\
+\x00\xfb\x6f\xd8\x78\x6f\x64\xbc\x15\xd6\xdc\x27\xb3\x69\x7e\xb8\
+\xdc\x93\x00\x4e\x5e\x0a\x00\x2c\x54\xe6\xd5\x11\xb1\xac\xa7\xee\
+\x65\xc9\xeb\x0e\xec\xd8\xf8\xc8\x72\xce\x01\x38\xb9\x29\x00\xb0\
+\x40\x07\x6e\x1c\xdb\x97\x59\xba\x39\x17\x60\x71\xfe\x93\x6d\xf3\
+\xfd\x65\x1c\x1f\x18\x00\x0a\x00\x2c\x42\xb6\xcd\x37\x22\xe2\xc5\
+\xe5\x18\xbb\x64\xb9\x7a\x62\xfc\xfc\x67\x96\x63\x6c\x60\x70\x28\
+\x00\xb0\x08\x13\x37\x6d\x78\x3c\x23\xbf\x77\xa2\xc7\x2d\x25\xef\
+\xbc\xff\xcc\x8d\x76\xfe\x03\xd5\x14\x00\x58\xa4\x83\x67\x5c\x70\
+\x4d\x44\xfe\xe1\x84\x0d\x58\xe2\x5f\x4d\x9b\x5f\x8e\xed\xa5\x3d\
+\x61\x63\x02\x03\x4b\x01\x80\xc5\xda\x5e\xda\xa3\x23\x2b\xb6\x44\
+\xc4\x89\xb8\x1d\x3f\xd9\x64\x7c\xf1\xbe\xf1\x4f\x1c\x3e\x01\x63\
+\x01\x43\x40\x01\x80\x0a\x0f\x5e\xbb\xe1\xe9\xec\xe7\x67\x22\xe2\
+\xdf\x4b\x38\x4c\x46\xe4\x57\xf7\xef\xbc\xe0\xf7\x4b\x38\x06\x30\
+\x64\x14\x00\xa8\x74\xf0\xa6\xb1\xfb\x33\xdb\x4b\x23\xe2\x85\x25\
+\x88\x9f\x8c\xc8\x2b\x0e\xec\x1c\xdb\xb9\x04\xd9\xc0\x10\xf3\x36\
+\x40\xe8\xc8\xe8\xd6\xbd\xeb\x9a\x92\xb7\x44\xc4\xe9\x5d\xe4\x65\
+\xc4\xb3\x91\xf9\xa5\x83\xe3\x63\xb7\x75\x91\x07\x30\x9d\x3b\x00\
+\xd0\x91\x89\xf1\xf3\xef\x5b\x39\xd2\x5b\x97\xa5\xfc\xac\x3a\xac\
+\xc4\xaf\xa3\x97\x6b\xfc\xe7\x0f\x2c\x15\x77\x00\x60\x09\x8c\x6e\
+\xfb\xcb\xa6\x5e\x96\xef\x64\xc4\xa6\x05\x5c\xd6\x46\x89\x5b\xdb\
+\x7e\xf3\x83\x89\x1b\x37\xde\xb9\x64\x93\x03\x08\x05\x00\x96\xd4\
+\xe8\x15\xbb\x3f\xd2\xe4\x8a\xcb\x4a\xe6\x45\x19\xb1\x36\x5e\x5b\
+\x1e\xe8\x4d\x7d\xfc\x52\x94\x78\x32\xa3\xfc\x35\xda\xdc\x3d\xd2\
+\x4c\xfe\xf2\xde\x1d\x17\x3f\xb5\x8c\xd3\x05\x00\x96\xca\xe8\xd7\
+\x6f\x5f\xb5\xfe\xaa\x7b\x46\x96\x7b\x1e\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xbc\x55\xfd\x0f\xed\x72\xc6\x68\x5f\x0d\x95\
+\x39\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x46\x74\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x7d\xfb\x00\x00\x7d\xfb\
+\x01\xb3\xee\x8d\xe0\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x7d\x9c\x64\x55\x75\x2f\xfc\xdf\xda\x55\
+\xdd\x3d\xcc\x30\x6f\x3d\x75\xce\xa9\xe9\x69\x61\x94\x01\xd4\x11\
+\x41\x41\x44\x14\x84\xa0\x5e\x83\x2f\x51\xf4\xf1\x25\x6f\x26\x1a\
+\x73\x63\x8c\x89\x79\x8c\xaf\x31\xb9\x79\xee\xc7\x9b\x98\x44\x13\
+\x6f\xd4\x5c\x1f\x5f\x12\x8d\xc4\x44\xbd\xe2\x6b\x44\x0c\x7a\x51\
+\x83\x42\x54\x10\x65\x04\x22\xe0\x20\x3d\x3d\x75\x4e\xd5\xf4\xcc\
+\xc0\xcc\x30\xd3\x55\x75\xd6\xfd\x63\x6a\x48\x33\x74\x4f\x57\xd5\
+\x5e\x75\xce\xa9\xea\xdf\xf7\x2f\xe9\xae\x5a\x7b\xdb\xd3\x5d\xb5\
+\x6a\xed\xb5\xf7\x06\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xbc\x54\x2a\x95\xb5\
+\x00\xca\x79\xcf\x83\x88\x68\x54\x48\xde\x13\x20\x3a\xde\xa6\x4d\
+\x9b\xb6\x94\xcb\xe5\x17\xab\xea\xa5\x00\xce\x03\x10\x00\x18\xef\
+\x7c\xfb\x10\x80\xdb\x55\xf5\x66\x11\xf9\x97\xf1\xf1\xf1\xaf\xcc\
+\xcc\xcc\x3c\x90\xdb\x64\x89\x88\x86\x14\x13\x00\x2a\x8c\x4a\xa5\
+\x72\x86\x73\xee\x4f\x00\xbc\x18\xc0\x58\x97\x4f\xdb\xa7\xaa\xef\
+\x9b\x98\x98\xf8\xeb\x99\x99\x99\xb9\xc1\xcd\x8e\x88\x68\xb4\x30\
+\x01\xa0\x22\x28\x85\x61\xf8\x06\x00\x7f\x02\xe0\xa4\x3e\x63\x24\
+\x22\xf2\xbb\x71\x1c\x7f\xd2\x6e\x5a\x44\x44\xa3\xab\x94\xf7\x04\
+\x68\x65\xdb\xb6\x6d\xdb\xc4\xd8\xd8\xd8\x95\x00\x5e\x8f\xee\x3f\
+\xf5\x2f\x66\x0d\x80\x17\xaf\x59\xb3\x66\xea\xe0\xc1\x83\xd7\x00\
+\x48\x4d\x26\x48\x44\x34\xa2\x58\x01\xa0\xdc\x04\x41\x70\xb2\x88\
+\x5c\x03\xe0\x42\xe3\xd0\x9f\x4f\x92\xe4\xff\x01\xd0\x34\x8e\x4b\
+\x44\x34\x32\x5c\xde\x13\xa0\x15\xab\xec\x9c\xfb\x24\xec\xdf\xfc\
+\x01\xe0\x17\x82\x20\xf8\x38\xf8\xfb\x4d\x44\xb4\x24\x2e\x01\x50\
+\x2e\xa2\x28\x7a\x8f\xaa\xfe\xf2\xa0\xe2\x8b\xc8\xe3\xd6\xac\x59\
+\x83\x83\x07\x0f\x5e\x37\xa8\x31\x88\x88\x86\x19\x97\x00\x28\x73\
+\x95\x4a\xe5\x39\xce\xb9\x2f\x62\xf0\xbf\x7f\x29\x80\xcb\x93\x24\
+\xb9\x66\xc0\xe3\x10\x11\x0d\x1d\x26\x00\x94\xa9\xa9\xa9\xa9\x4a\
+\xab\xd5\xba\x15\x40\x94\xd1\x90\x33\xad\x56\x6b\xfb\xdc\xdc\xdc\
+\x7d\x19\x8d\x47\x44\x34\x14\xb8\x46\x4a\x99\x6a\xb5\x5a\xff\x1d\
+\xd9\xbd\xf9\x03\xc0\x74\xb9\x5c\x7e\x67\x86\xe3\x11\x11\x0d\x05\
+\x56\x00\x28\x33\xd5\x6a\x75\x7b\x9a\xa6\x3f\x40\xf6\x47\xfa\xb6\
+\x45\xe4\x9c\x38\x8e\x6f\xcd\x78\x5c\x22\xa2\xc2\x62\x05\x80\x32\
+\x93\xa6\xe9\x5f\x22\x9f\xf3\xfc\x4b\x00\x58\x05\x20\x22\x5a\x80\
+\x15\x00\xca\x44\xa5\x52\x39\xcf\x39\xf7\xdd\x3c\xe7\x20\x22\x4f\
+\x89\xe3\xf8\x86\x3c\xe7\x40\x44\x54\x14\xac\x00\x50\x26\x9c\x73\
+\x7f\x94\xf7\x1c\x54\xf5\x4d\x79\xcf\x81\x88\xa8\x28\x58\x01\xa0\
+\x81\xeb\x5c\xf2\x73\x3b\xf2\xff\x7d\x4b\xd3\x34\x7d\x6c\xa3\xd1\
+\xb8\x23\xe7\x79\x10\x11\xe5\x8e\x15\x00\x1a\x38\x11\x79\x0d\xf2\
+\x7f\xf3\x07\x00\x27\x22\xbf\x95\xf7\x24\x88\x88\x8a\xa0\x08\x2f\
+\xca\x34\xc2\xa6\xa7\xa7\x4f\x9a\x9f\x9f\x9f\x01\x30\x99\xf7\x5c\
+\x3a\xf6\x95\xcb\xe5\x2d\xb3\xb3\xb3\x87\xf2\x9e\x08\x11\x51\x9e\
+\x58\x01\xa0\x81\x9a\x9f\x9f\x7f\x31\x8a\xf3\xe6\x0f\x00\x1b\x5a\
+\xad\xd6\x0b\xf3\x9e\x04\x11\x51\xde\x98\x00\xd0\xa0\x59\x9d\xf7\
+\x3f\x03\xe0\x6a\xa3\x58\x2f\x31\x8a\x43\x44\x34\xb4\xb8\x04\x40\
+\x03\x53\xa9\x54\x36\x3b\xe7\xee\x85\xcd\xa5\x53\xbf\xdd\x6e\xb7\
+\xbf\x50\x2a\x95\xee\x00\xb0\xc6\x33\xd6\xe1\x34\x4d\xc3\x46\xa3\
+\x71\xbf\xc1\xbc\x88\x88\x86\x12\x2b\x00\x34\x30\xa5\x52\xe9\x65\
+\xb0\x79\xf3\xbf\x27\x08\x82\x8f\xec\xd9\xb3\x67\x97\x88\xbc\xcf\
+\x20\xde\xaa\x52\xa9\x74\xb9\x41\x1c\x22\xa2\xa1\xc5\x04\x80\x06\
+\x46\x55\xad\xd6\xda\xdf\xb7\x63\xc7\x8e\x79\x00\x68\xb7\xdb\xff\
+\x13\x40\xcb\x20\xe6\x8b\x0c\x62\x10\x11\x0d\x2d\x26\x00\x34\x10\
+\x51\x14\x85\x00\x2e\x34\x08\xd5\x52\xd5\x2b\x8f\xfd\x47\xa3\xd1\
+\xd8\x0d\xe0\x4b\xbe\x41\x55\xf5\x39\x53\x53\x53\xab\x7d\xe3\x10\
+\x11\x0d\x2b\x26\x00\x34\x28\xcf\x87\x4d\xf9\xff\xcb\xf5\x7a\xbd\
+\xb6\xf0\x0b\xaa\xfa\x21\x83\xb8\xab\xdb\xed\xf6\x33\x0d\xe2\x10\
+\x11\x0d\x25\x26\x00\x34\x10\xaa\x6a\xb5\xc6\xfe\xd1\xe3\xbf\x50\
+\xaf\xd7\xaf\x51\xd5\x7b\x7d\x03\xa7\x69\xfa\x3c\xdf\x18\x44\x44\
+\xc3\x8a\x09\x00\x0d\x42\x49\x44\x2e\x31\x88\xb3\x27\x08\x82\x7f\
+\x59\xe4\xeb\x6d\xe7\xdc\xe7\x7c\x83\x8b\xc8\xd3\x7d\x63\x10\x11\
+\x0d\x2b\x26\x00\x64\x2e\x8a\xa2\x27\xa9\xea\x46\x83\x50\x9f\x39\
+\xd6\xfc\x77\x3c\x55\x5d\x2c\x31\xe8\xd5\xb6\xa9\xa9\xa9\x53\x0c\
+\xe2\x10\x11\x0d\x1d\x26\x00\x34\x08\xcf\xb0\x08\x22\x22\x4b\xbe\
+\xc9\xaf\x5b\xb7\xee\x3a\x00\x07\x7c\xc7\x68\xb5\x5a\x17\xfb\xc6\
+\x20\x22\x1a\x46\x4c\x00\xc8\x5c\x9a\xa6\x97\x19\x84\x39\x92\xa6\
+\xe9\xd7\x97\xfa\xe6\x9d\x77\xde\x79\x04\xc0\xd7\x7c\x07\x51\x55\
+\x2e\x03\x10\xd1\x8a\xc4\x04\x80\x4c\x4d\x4d\x4d\xad\x16\x91\xa7\
+\x18\x84\xba\xae\x5e\xaf\x2f\xf7\x09\xdf\xfb\x68\x60\x11\xb9\xd4\
+\x37\x06\x11\xd1\x30\x62\x02\x40\xa6\x9a\xcd\xe6\xc5\x00\x26\x7c\
+\xe3\x74\xb3\xc6\x5f\x2a\x95\xbe\xe9\x3b\x0e\x80\xd3\xd8\x07\x40\
+\x44\x2b\x11\x13\x00\x32\x25\x22\x16\xe5\x7f\x88\xc8\x97\x97\x7b\
+\xcc\xee\xdd\xbb\x6f\x07\xd0\xf0\x1d\x8b\x7d\x00\x44\xb4\x12\x31\
+\x01\x20\x6b\xde\x6f\xa6\x22\x72\x7b\x92\x24\x77\x75\xf1\x50\x05\
+\x70\xbd\xef\x78\x00\x2e\x30\x88\x41\x44\x34\x54\x98\x00\x90\x99\
+\xad\x5b\xb7\xae\x02\x70\x8e\x6f\x9c\x34\x4d\xbf\xd2\xc3\xc3\x2d\
+\x12\x80\x27\x1a\xc4\x20\x22\x1a\x2a\x4c\x00\xc8\xcc\xc1\x83\x07\
+\xcf\x03\x30\xee\x1b\x47\x44\x7a\x59\xdb\xff\x37\xdf\xf1\x00\x9c\
+\x0d\x9b\x63\x8b\x89\x88\x86\x06\x13\x00\x32\x23\x22\x4f\xb6\x88\
+\xa3\xaa\xdf\xe9\xf6\xb1\xeb\xd6\xad\xbb\x09\xc0\xa2\x87\x05\xf5\
+\x60\x75\xb5\x5a\x3d\xd3\x33\x06\x11\xd1\x50\x61\x02\x40\x96\x2c\
+\xb6\xff\xdd\x79\xfc\xe5\x3f\x27\x7c\xf0\xd1\xf3\x00\x6e\xf3\x1d\
+\x34\x4d\x53\x2e\x03\x10\xd1\x8a\xc2\x04\x80\x2c\x59\x34\xd3\x7d\
+\xbb\x8f\xe7\xdc\x6c\x30\x2e\x13\x00\x22\x5a\x51\x98\x00\x90\x89\
+\xc9\xc9\xc9\x47\x00\xd8\x62\x10\xaa\xe7\x04\x40\x55\xbd\x13\x00\
+\x11\x61\x02\x40\x44\x2b\x0a\x13\x00\x32\x51\x2a\x95\x4c\xb6\xd2\
+\x89\x48\x2e\x15\x00\x55\x7d\x02\xf8\xf7\x40\x44\x2b\x08\x5f\xf0\
+\xc8\x84\x51\x03\xe0\xfe\x38\x8e\x77\xf4\xfa\xa4\x76\xbb\x7d\x0b\
+\x8e\x9e\x09\xe0\x63\x5d\x10\x04\x8f\xf2\x8c\x41\x44\x34\x34\x98\
+\x00\x90\x09\x55\x3d\xc3\x20\xcc\x0d\x00\xd2\x5e\x9f\x34\x37\x37\
+\x77\x1f\x80\xbb\x7d\x07\x77\xce\x6d\xf7\x8d\x41\x44\x34\x2c\x98\
+\x00\x90\x09\x11\x09\x0d\xc2\xf4\x53\xfe\x3f\xa6\xe7\xca\xc1\xf1\
+\xd2\x34\x7d\xb4\x6f\x0c\x22\xa2\x61\xc1\x04\x80\xac\xec\xf3\x0d\
+\x20\x22\x7d\x9f\xea\x27\x22\xde\x5b\x01\x9d\x73\x3c\x0b\x80\x88\
+\x56\x0c\x26\x00\x64\x42\x44\xee\xf0\x0c\x71\x24\x4d\xd3\x1b\xfb\
+\x7d\x72\x9a\xa6\xde\x09\x80\xaa\x3e\xc6\x37\x06\x11\xd1\xb0\x60\
+\x02\x40\x26\x54\xf5\x4b\x3e\xcf\x17\x91\x6b\xeb\xf5\xfa\x81\x7e\
+\x9f\x5f\x2a\x95\x7e\xec\x33\x7e\x07\x97\x00\x88\x68\xc5\x60\x02\
+\x40\x26\x92\x24\xf9\x1a\xfc\xb6\xe3\xbd\xc7\x67\xfc\x76\xbb\x7d\
+\x1b\xfc\x77\x02\x6c\x08\xc3\x30\xf2\x8c\x41\x44\x34\x14\x98\x00\
+\x90\x95\x54\x55\x5f\x0f\xa0\xd5\xeb\x13\x45\xe4\x53\x71\x1c\x5f\
+\xeb\x33\x78\xbd\x5e\x3f\xa0\xaa\x33\x3e\x31\x00\xc0\x39\xc7\x65\
+\x00\x22\x5a\x11\x98\x00\x90\x99\x7a\xbd\xfe\x4d\x11\x79\x2d\x7a\
+\xdb\xca\x77\x23\x80\x57\x5a\x8c\x6f\xd1\x08\xc8\x9d\x00\x44\xb4\
+\x52\x30\x01\x20\x53\x71\x1c\x7f\x50\x44\xae\x00\x90\x2c\xf3\x50\
+\x05\xf0\xd1\xf1\xf1\xf1\x4b\xe3\x38\x3e\x68\x34\xfc\x5d\xbe\x01\
+\x54\x95\x09\x00\x11\xad\x08\x4c\x00\xc8\x5c\x1c\xc7\x9f\x6f\xb5\
+\x5a\xa7\xab\xea\x5b\x45\xe4\xfb\x78\xe8\xda\x7c\x1d\xc0\x47\xd3\
+\x34\x3d\x3f\x49\x92\x5f\x9f\x99\x99\x79\xc0\x70\xe8\x9f\xfa\x06\
+\x10\x11\x6e\x05\x24\xa2\x15\x41\xf2\x9e\x00\xad\x08\xe5\x4d\x9b\
+\x36\x45\xce\xb9\xfd\x3e\x9d\xfe\xcb\x09\x82\xe0\xc5\x22\xf2\x69\
+\xcf\x30\x3f\x49\x92\xc4\xe2\x54\x43\x22\xa2\x42\x2b\xe7\x3d\x01\
+\x5a\x11\x5a\x7b\xf6\xec\xd9\x35\xe8\x41\x54\xf5\xa7\x22\xde\x39\
+\xed\xa9\x38\x5a\x19\xeb\xf9\x48\x62\x22\xa2\x61\xc2\x25\x00\x1a\
+\x19\xab\x56\xad\xf2\x5e\x02\x00\x30\x3e\x39\x39\x39\x65\x10\x87\
+\x88\xa8\xd0\x98\x00\xd0\xc8\x98\x99\x99\x99\x83\xc1\x91\xc4\xa5\
+\x52\x69\xab\xff\x6c\x88\x88\x8a\x8d\x09\x00\x8d\x9a\x9d\xbe\x01\
+\x44\xe4\x91\x06\xf3\x20\x22\x2a\x34\x26\x00\x34\x6a\x2c\x96\x01\
+\x98\x00\x10\xd1\xc8\x63\x02\x40\xa3\x86\x09\x00\x11\x51\x17\x98\
+\x00\xd0\x48\x51\x55\x8b\xb3\x00\x98\x00\x10\xd1\xc8\x63\x02\x40\
+\xa3\xe6\x6e\xdf\x00\xaa\xca\x04\x80\x88\x46\x1e\x13\x00\x1a\x29\
+\xe5\x72\xd9\x62\x09\x60\x0b\x80\x31\x83\x38\x44\x44\x85\xc5\x04\
+\x80\x46\x4a\xa9\x54\xda\x09\xff\x6b\x81\x4b\x61\x18\x9e\x62\x30\
+\x1d\x22\xa2\xc2\x62\x02\x40\x23\xa5\x73\xb7\x40\xcd\x37\x8e\x73\
+\x8e\x09\x00\x11\x8d\x34\x26\x00\x34\x8a\xbc\x97\x01\xd2\x34\xdd\
+\x62\x31\x11\x22\xa2\xa2\x62\x02\x40\xa3\xc8\x3b\x01\x50\xd5\x69\
+\x8b\x89\x10\x11\x15\x15\x13\x00\x1a\x39\x22\x32\xe3\x1b\xc3\x39\
+\xc7\x0a\x00\x11\x8d\x34\x26\x00\x34\x8a\x76\xfb\x06\x50\x55\x26\
+\x00\x44\x34\xd2\x98\x00\xd0\xc8\x49\xd3\x74\xd6\x37\x06\x97\x00\
+\x88\x68\xd4\x95\xf3\x9e\x00\x91\x35\x11\xf1\x4e\x00\x44\x64\xc5\
+\x55\x00\xa2\x28\x0a\xd3\x34\xbd\x44\x44\xce\x03\x70\xba\x88\x6c\
+\x04\x70\xb2\xaa\x1e\x14\x91\x03\xaa\xba\x53\x55\xef\x28\x95\x4a\
+\xdf\xa9\xd5\x6a\x37\x03\x68\xe5\x3c\x65\x5a\xb9\x5c\x18\x86\x17\
+\xa8\xea\xe5\x22\x72\x2a\x80\xcd\x00\x56\xab\xea\x1e\x11\x99\x13\
+\x91\x9b\xdb\xed\xf6\x37\x1b\x8d\xc6\x2d\x00\xda\x39\xcf\xb5\xb0\
+\x24\xef\x09\x10\x59\x8b\xa2\xe8\x91\xaa\xea\x7b\x22\x60\x3b\x49\
+\x92\x55\x18\xfd\x37\x39\x89\xa2\xe8\x79\xaa\xfa\x5a\x00\x97\x01\
+\x28\x75\xf9\xbc\x39\x55\xbd\xca\x39\xf7\x91\x38\x8e\x6f\x18\xe0\
+\xfc\x88\x16\x1a\x8b\xa2\xe8\x77\x54\xf5\x4d\x00\xaa\x5d\x3c\xfe\
+\x67\x00\xde\xd7\x6c\x36\x3f\xb8\x77\xef\xde\xfd\x03\x9e\xdb\xd0\
+\x61\x02\x40\x23\x67\xeb\xd6\xad\xab\x0e\x1d\x3a\x74\x08\x9e\xbf\
+\xdf\xad\x56\xeb\x94\xb9\xb9\xb9\x7b\x8d\xa6\x55\x38\xd5\x6a\xf5\
+\x7c\x55\xfd\x5b\x55\x3d\xd7\x33\xd4\xb7\x00\xbc\x39\x49\x92\xef\
+\x58\xcc\x8b\x68\x31\x51\x14\x3d\x59\x55\xff\x01\xc0\x19\x7d\x3c\
+\x3d\x06\xf0\x9a\x24\x49\x3e\x6b\x3c\xad\xa1\xc6\x1e\x00\x1a\x39\
+\x3b\x77\xee\x3c\x0c\x60\xaf\x6f\x9c\x72\xb9\x3c\xaa\x7d\x00\xa5\
+\x30\x0c\xff\x24\x4d\xd3\xef\x18\xbc\xf9\x03\xc0\x45\x00\xae\x0f\
+\x82\xe0\xc3\x41\x10\x9c\x6c\x10\x8f\xe8\x21\xa2\x28\x7a\xbe\xaa\
+\x7e\x1d\xfd\xbd\xf9\x03\x40\x04\xe0\xaa\x30\x0c\xdf\x0f\xbe\xef\
+\x3d\x88\x3f\x08\x1a\x55\x16\x8d\x80\x23\xd7\x07\xb0\x75\xeb\xd6\
+\x55\x61\x18\xfe\x6f\x00\xff\x0d\xb6\x7f\xff\x22\x22\xaf\x12\x91\
+\x9b\xab\xd5\xea\x76\xc3\xb8\xb4\xc2\x85\x61\xf8\x42\x55\xbd\x0a\
+\xc0\x6a\x83\x70\xbf\x1d\x04\xc1\x27\xc0\xfe\x37\x00\x4c\x00\x68\
+\x74\x79\x27\x00\x23\x78\x16\x40\xf9\xd0\xa1\x43\x9f\x05\xf0\x82\
+\x01\x8e\xb1\x2d\x4d\xd3\xeb\xab\xd5\xea\xa5\x03\x1c\x83\x56\x88\
+\x28\x8a\x1e\x07\xe0\x1f\xd0\x7d\x6f\xca\xb2\x44\xe4\xa5\x51\x14\
+\xfd\xb5\x55\xbc\x61\xc6\x04\x80\x46\x15\x2b\x00\xc7\xe9\x94\x3f\
+\x9f\x9d\xc1\x50\xeb\xd3\x34\xfd\x42\xb5\x5a\x3d\x3f\x83\xb1\x68\
+\x44\x05\x41\x70\xb2\xaa\x7e\x0e\x80\xf9\xb2\x92\xaa\xfe\x4e\x10\
+\x04\xbf\x6e\x1d\x77\xd8\x30\x01\xa0\x91\xa4\xaa\xde\x09\x00\x8e\
+\xae\x1b\x8e\x84\x30\x0c\xdf\x08\xe0\x37\x33\x1c\xf2\xe4\x34\x4d\
+\xff\x65\xd3\xa6\x4d\x8f\xce\x70\x4c\x1a\x21\xce\xb9\xb7\x03\x38\
+\x6d\x50\xf1\x45\xe4\x7f\x4e\x4e\x4e\x3e\x62\x50\xf1\x87\x01\x13\
+\x00\xb2\xe0\xc2\x30\x3c\x2d\x8a\xa2\xcb\xaa\xd5\xea\xf9\x61\x18\
+\x16\xe1\x8d\x93\x09\x40\x47\xa5\x52\x39\x0f\xc0\x9f\xe5\x31\xb4\
+\x73\xee\xab\x05\xf9\x7d\xa0\x21\xb2\x79\xf3\xe6\xc7\xa8\xea\xef\
+\x0f\x78\x98\xb5\xe5\x72\xf9\x7d\x03\x1e\xa3\xd0\x98\x00\x50\xdf\
+\x2a\x95\xca\xe6\x20\x08\xfe\x3a\x0c\xc3\x1a\x80\x3b\x55\xf5\xda\
+\x34\x4d\x6f\x04\x50\x0b\x82\xe0\xc7\x51\x14\xfd\xde\xd4\xd4\x94\
+\x45\xe3\x4e\xcf\x2c\x0e\x03\x42\x77\xfb\x8c\x8b\x6e\xcc\x39\xf7\
+\x61\x18\xae\xa1\xf6\x42\x44\x1e\x01\xe0\x83\x79\x8c\x4d\xc3\xab\
+\xd5\x6a\xfd\x39\x80\xf1\x0c\x86\x7a\x7e\xb5\x5a\xbd\x24\x83\x71\
+\x0a\x89\x09\x00\xf5\x25\x8a\xa2\x97\x39\xe7\x6e\x13\x91\xd7\x03\
+\x08\x8e\xff\xbe\x88\x3c\x46\x55\xdf\xd3\x6a\xb5\x6e\x0e\x82\xe0\
+\x9c\xac\xe7\x67\x94\x00\x0c\xfd\x27\xd7\x28\x8a\xde\x04\xe0\xec\
+\x9c\xa7\xf1\xfc\x20\x08\x5e\x99\xf3\x1c\x68\x48\x44\x51\x74\x96\
+\x88\x3c\x37\xab\xf1\xd2\x34\xfd\xef\x59\x8d\x55\x34\x4c\x00\xa8\
+\x67\x51\x14\xbd\x5a\x55\xff\x11\xc0\xfa\x2e\x1e\x7e\x86\x88\x5c\
+\x97\x75\x12\xd0\x6c\x36\x2d\x12\x80\x00\x43\xfc\x37\xb2\x69\xd3\
+\xa6\x2d\xaa\xfa\xf6\xbc\xe7\x01\x00\x22\xf2\x9e\x28\x8a\x1e\x99\
+\xf7\x3c\xa8\xf8\x54\xf5\x2d\xc8\xf6\x90\xba\x8b\x82\x20\xb8\x38\
+\xc3\xf1\x0a\x63\x68\x5f\xdc\x28\x1f\x95\x4a\xe5\x89\xaa\xfa\x3e\
+\xf4\xf6\xbb\xb3\x5e\x44\x3e\x9f\xe5\x21\x31\x73\x73\x73\x35\x00\
+\xa9\x67\x98\x52\x14\x45\x15\x8b\xf9\xe4\xa1\x5c\x2e\xbf\x19\xc0\
+\xaa\xbc\xe7\xd1\xb1\x56\x55\xff\x2a\xef\x49\x50\xb1\x75\x9a\xf2\
+\x5e\x92\xf5\xb8\xce\xb9\xd7\x66\x3d\x66\x11\x30\x01\xa0\x9e\x88\
+\xc8\xbb\xd0\xdf\xda\xdc\x29\x00\xde\x6c\x3c\x9d\x13\x69\x02\x68\
+\x18\xc4\x19\xca\x65\x80\x4a\xa5\x32\xa5\xaa\xaf\xce\x7b\x1e\xc7\
+\x79\x41\x18\x86\x17\xe6\x3d\x09\x2a\xae\xb1\xb1\xb1\x57\x20\x87\
+\x43\x7a\x54\xf5\x85\x95\x4a\x65\x73\xd6\xe3\xe6\x8d\x09\x00\x75\
+\xad\xb3\x36\xd7\xf7\x01\x2f\x22\xf2\x2a\x64\xfb\xc7\x5d\x33\x88\
+\x31\x94\x09\x80\x88\xbc\x09\xc5\xf9\xf4\xbf\xd0\x3b\xf3\x9e\x00\
+\x15\x96\xa8\xea\x2b\x72\x1a\x7b\xcc\x39\xf7\xf2\x9c\xc6\xce\x0d\
+\x13\x00\xea\x5a\x9a\xa6\xbe\xa7\xbb\x6d\x0e\x82\xe0\x2c\x93\xc9\
+\x74\x27\xf1\x0d\xa0\xaa\x43\xb7\x13\xa0\x52\xa9\xac\xed\x24\x5b\
+\x45\x74\x51\x14\x45\x99\x35\x78\xd1\xf0\x08\x82\xe0\x69\x00\xb6\
+\xe5\x35\xbe\xaa\xbe\x2c\xaf\xb1\xf3\xc2\x04\x80\xba\x26\x22\x4f\
+\xf4\x8d\xe1\x9c\x7b\x8c\xc5\x5c\xba\x54\x37\x88\x31\x74\x15\x80\
+\x52\xa9\xf4\x52\x0c\xe0\xf4\x34\x2b\xaa\xfa\xd6\xbc\xe7\x40\xc5\
+\x23\x22\xbf\x98\xf3\xf8\x4f\x0a\xc3\x70\x60\x07\x0f\x15\x11\x2f\
+\x44\x38\x31\x57\xa9\x54\x9e\xe8\x9c\x3b\x17\xc0\x59\x22\x12\xaa\
+\xea\x06\x00\x07\x55\xb5\x01\x20\x76\xce\xed\x50\xd5\xaf\x27\x49\
+\x12\xe7\x3c\xd7\x2c\x78\x77\x71\xab\x6a\x66\xfb\xd1\x55\x35\x11\
+\xf1\x6e\x26\x1e\xba\x04\x40\x55\xad\x3e\xfd\x37\x3a\xf7\xae\xaf\
+\x05\xf0\x07\x9d\x3d\xfd\x16\x2e\xac\x54\x2a\xe7\x36\x1a\x8d\xef\
+\x1b\xc5\xa3\xe1\xe7\x00\x3c\x3f\xef\x49\xa8\xea\xcf\x03\x58\x31\
+\x87\x03\x31\x01\x58\x44\x10\x04\xa7\x3b\xe7\x7e\x57\x55\xaf\x00\
+\x30\x75\xec\xeb\xaa\xfa\xe0\x63\x8e\xbd\xb1\x74\xbe\xa6\x61\x18\
+\xfe\x48\x44\xfe\x0e\xc0\x87\xe3\x38\x3e\x98\xed\x8c\x33\xf3\x28\
+\x83\x18\x07\x0c\x62\x74\xc5\x39\x57\x5f\xf8\x6f\xd6\xa7\xa1\x4a\
+\x00\xa2\x28\x7a\x9c\xaa\x5e\x60\x10\xea\x80\x88\x5c\x9a\x24\xc9\
+\xad\x00\xb0\x71\xe3\xc6\x8f\x95\xcb\xe5\x2b\xad\xf6\x67\x3b\xe7\
+\x5e\x07\xe0\xd7\x2c\x62\xd1\xf0\x8b\xa2\xe8\x7c\x55\x9d\x5a\xfe\
+\x91\x83\x25\x22\xcf\xc4\x0a\x4a\x00\xb8\x04\xb0\xc0\xe6\xcd\x9b\
+\x4f\x8d\xa2\xe8\x93\x22\x72\xbb\xaa\xfe\x0e\x16\xbc\xf9\x2f\x43\
+\x00\x3c\x5e\x55\xdf\xa3\xaa\xf7\x44\x51\xf4\x36\x00\x63\x83\x9b\
+\x69\xf6\xb6\x6e\xdd\xba\x0a\xdd\xff\x3c\x96\x94\xa6\xe9\x3d\x06\
+\xd3\xe9\xd6\x8a\x5b\x02\x50\xd5\x5f\x31\x0a\xf5\x07\x71\x1c\xdf\
+\x7a\xec\x3f\xf6\xee\xdd\xbb\x7f\x62\x62\xe2\x25\x00\x6e\x34\x8a\
+\xff\xd2\x6a\xb5\xfa\xb0\x03\xa4\x68\xc5\x1a\xe4\x0d\x95\xbd\xb8\
+\x04\x23\xf6\xda\x7d\x22\x4c\x00\x8e\x92\x30\x0c\xdf\xd0\x6e\xb7\
+\x77\xa8\xea\x4b\xe0\xf7\x73\xd9\xa4\xaa\xff\x23\x08\x82\xeb\x2b\
+\x95\xca\x99\x56\x13\xcc\xdb\x81\x03\x07\x4e\x85\xc1\xef\x4b\xab\
+\xd5\xba\xdb\x60\x3a\x5d\x51\x55\xef\x26\x40\x00\xa1\x41\x8c\x2c\
+\x59\xbc\x90\xee\x48\x92\xe4\xc3\xc7\x7f\x71\x66\x66\xe6\x01\x11\
+\x79\x39\x80\x07\x0c\xc6\x58\xd5\x6e\xb7\x79\x3a\x20\x01\x00\x54\
+\xb5\x28\x8d\xa1\xeb\x82\x20\x78\x72\xde\x93\xc8\xca\x8a\x4f\x00\
+\xd6\xaf\x5f\xbf\x31\x08\x82\x2f\x00\x78\x17\x80\x35\x56\x71\x45\
+\xe4\x49\xce\xb9\x9b\x46\xa5\xe3\x59\x44\x2c\xca\xff\x73\xfb\xf6\
+\xed\xdb\x67\x10\xa7\x5b\xde\x15\x00\x55\x1d\x9a\x83\x80\xaa\xd5\
+\xea\x63\x01\x9c\xe1\x1b\x47\x55\xff\x12\x40\x7b\xb1\xef\xc5\x71\
+\xfc\x53\x11\xf9\x53\xdf\x31\x00\x40\x44\x56\x5c\xd7\x35\x3d\x5c\
+\x67\xff\xfd\x63\x7d\xe3\x88\xc8\xed\x06\xd3\x39\xb6\x0c\xb0\x22\
+\xac\xe8\x04\x60\x72\x72\x72\x7a\x7c\x7c\xfc\xfa\x01\x9e\x3b\xbd\
+\x5a\x55\x3f\x13\x86\xe1\x8b\x06\x14\x3f\x4b\xde\x09\x80\x88\x64\
+\xf6\xe9\x1f\xb0\xa9\x00\x88\xc8\xd0\x94\xa9\x55\xd5\xe2\xd3\xff\
+\x9e\x89\x89\x89\x4f\x9d\xe8\x01\xa5\x52\xe9\xaf\x60\x73\xc8\xd2\
+\x39\xbc\x2e\x98\x9c\x73\x97\xc1\xe0\xe8\x5f\x55\x7d\x2f\x80\x9f\
+\xfa\xcf\x08\x4c\x00\x46\x5d\x14\x45\x8f\x2a\x97\xcb\xdf\x12\x91\
+\x41\x6f\x4b\x1b\x07\xf0\xcf\x51\x14\xe5\xde\xe1\xea\xc3\xa8\x02\
+\x60\xf1\xc7\xd9\xb5\x66\xb3\x69\xd1\x03\xb0\x2a\xcb\x23\x8c\x7d\
+\xa8\xea\x2f\x18\x84\xf9\xd4\xcc\xcc\xcc\x09\x4b\xfc\xb3\xb3\xb3\
+\x87\x60\xd4\x28\xd5\xd9\xb2\x48\x2b\xdb\x65\x16\x41\xca\xe5\xf2\
+\x97\x00\x7c\xd5\x20\xd4\xb9\xdb\xb6\x6d\x9b\x30\x88\x53\x78\x2b\
+\x32\x01\x88\xa2\x28\x54\xd5\x6b\x00\x6c\xcd\x68\xc8\xb2\xaa\x7e\
+\x7c\xc8\x7b\x02\x2c\x2e\x72\xc9\xb4\x02\xb0\x6f\xdf\xbe\xfd\x00\
+\xe6\x7d\xe3\x94\x4a\xa5\xc2\x2f\x03\x6c\xd9\xb2\x65\x13\x80\xf3\
+\x7c\xe3\x38\xe7\x3e\xdd\xcd\xe3\xca\xe5\xf2\xfb\x61\xf0\xb3\x55\
+\x55\x26\x00\x2b\x9c\xaa\x5a\x24\x00\xb7\xcc\xce\xce\xfe\x0c\x36\
+\x09\xc0\xf8\xfd\xf7\xdf\x9f\xf9\x0d\xa6\x79\x58\x71\x09\xc0\xd4\
+\xd4\xd4\xea\x34\x4d\xbf\x84\xec\x4f\x9c\x5a\xe7\x9c\xbb\x6a\x58\
+\x3e\x4d\x2e\xc2\xa2\x02\x90\x69\x02\x00\x40\x61\xb3\x13\xa0\xf0\
+\xcb\x00\xcd\x66\xf3\x62\xf8\xff\x3d\x37\x6a\xb5\xda\x37\xbb\x79\
+\xe0\xec\xec\x6c\x03\xc0\x97\x3c\xc7\x83\x88\x3c\xa6\xd3\xbb\x30\
+\xf2\xb6\x6f\xdf\x3e\x5e\xa9\x54\x36\x47\x51\xf4\xb8\x4a\xa5\x72\
+\x66\x67\x17\x44\x66\xe7\x62\x14\xd1\xd4\xd4\xd4\x29\x16\xe7\x4b\
+\x88\xc8\xd5\x00\x30\x3f\x3f\xff\x75\xf8\x5f\x02\x86\x34\x4d\xcf\
+\xf7\x8d\x31\x0c\x56\xdc\x39\x00\xad\x56\xeb\x6f\x45\xe4\x49\x39\
+\x0d\xff\x58\xe7\xdc\x9f\x01\x78\x5d\x4e\xe3\xfb\x18\xc6\x04\x00\
+\x38\x9a\x00\x6c\xf1\x09\xd0\x6e\xb7\x0b\x5f\x01\x10\x91\x4b\x7c\
+\xcf\x3c\x50\xd5\x6b\xb1\x44\xf3\xdf\x12\x63\xfe\x43\xe7\xac\x0c\
+\x2f\x69\x9a\x3e\x1b\xc0\x8f\x7d\xe3\x14\xcd\xf4\xf4\xf4\x49\xf3\
+\xf3\xf3\x57\x00\x78\x06\x80\xa7\xd6\xeb\xf5\xd3\x9d\x73\x50\x55\
+\x38\xe7\x90\xa6\x29\xc2\x30\x4c\x01\xec\x00\xf0\x2d\x55\xbd\x6e\
+\xfd\xfa\xf5\x5f\xb8\xf3\xce\x3b\x8f\xe4\x3b\xf3\xec\x34\x9b\xcd\
+\x27\x1b\x1c\xd6\x05\x55\xbd\x0e\x00\xf6\xed\xdb\xb7\x2f\x0c\xc3\
+\x1f\x03\x78\x9c\x4f\x3c\x11\x59\x11\x09\xc0\x8a\xaa\x00\x44\x51\
+\xf4\x6a\x00\x79\x5d\x36\x01\x00\x50\xd5\xd7\x54\xab\xd5\xbc\x12\
+\x90\xbe\x4c\x4d\x4d\x55\x70\xf4\x34\x38\x2f\xaa\x9a\x69\x0f\x40\
+\x87\x45\x23\x60\xe1\x13\x00\x55\xbd\xc4\x20\xcc\xbf\xf6\xf2\xe0\
+\x4a\xa5\x72\x35\x00\x8b\x5d\x1d\xff\xc5\x20\x46\x61\x4c\x4d\x4d\
+\x55\xc2\x30\xfc\x8b\xf9\xf9\xf9\x19\x00\x57\xe2\xe8\x81\x47\xa7\
+\x2f\xf1\x70\x07\xe0\x2c\x00\xbf\x2d\x22\x9f\xba\xef\xbe\xfb\x66\
+\xc2\x30\x7c\xd7\xa6\x4d\x9b\xbc\x92\xd6\x61\x21\x22\x16\x5b\xee\
+\x9a\xaa\x7a\xfd\x82\xff\xfe\xb6\x41\x4c\x26\x00\xa3\x24\x08\x82\
+\xd3\x55\xf5\x3d\x79\xcf\x03\x40\x29\x4d\xd3\x0f\x60\x88\x4a\x7f\
+\x69\x9a\x5a\x7c\xfa\x6f\x25\x49\xf2\x33\x83\x38\xbd\x1a\xf9\x25\
+\x80\x4e\x82\xe6\x7d\xc9\x92\x73\xee\xba\x5e\x1e\xbf\x63\xc7\x8e\
+\x79\x00\x57\xfb\x8e\x0b\xe0\xe2\xe9\xe9\xe9\x93\x0c\xe2\xe4\x4d\
+\xc2\x30\xfc\xd5\x56\xab\x75\x1b\x80\x37\x02\x98\xec\x23\x46\x05\
+\xc0\x1b\x4a\xa5\xd2\xed\x41\x10\xbc\x79\xfb\xf6\xed\xfd\x5c\xbd\
+\x3d\x4c\x2c\x12\x80\xef\xd7\xeb\xf5\x07\x4f\x18\x55\xd5\xef\x18\
+\xc4\x3c\x7d\xfd\xfa\xf5\x1b\x0d\xe2\x14\xda\x4a\x49\x00\x9c\x88\
+\x7c\x04\xc0\xea\xbc\x27\xd2\xf1\xc4\x30\x0c\x73\xbd\xf8\xa2\x17\
+\xaa\x6a\x91\x00\xdc\x0b\xa0\x69\x10\xa7\x57\x23\x5f\x01\x68\xb7\
+\xdb\x4f\x81\xff\x36\xaa\x46\x1c\xc7\x3d\x57\x68\x44\xe4\x0b\x9e\
+\xe3\x02\xc0\xaa\x23\x47\x8e\x3c\xdd\x20\x4e\x6e\xb6\x6d\xdb\x36\
+\x11\x86\xe1\x95\x00\x3e\x86\xa3\x6f\xe2\xbe\x4e\x16\x91\x77\xd6\
+\xeb\xf5\x7f\x8f\xa2\xc8\xe2\xef\xaf\x88\xca\x00\xbc\x2f\x18\x13\
+\x91\xeb\x16\xfe\xb7\x51\x02\x20\x13\x13\x13\xde\x4d\xb5\x45\xb7\
+\x22\x12\x80\x20\x08\x5e\x03\xe0\xa2\xbc\xe7\x71\x9c\xb7\x63\x48\
+\xaa\x00\x69\x9a\x0e\xdd\x0e\x80\x63\x54\x75\xe4\x0f\x03\x52\x55\
+\x8b\x25\xa5\xef\xe2\x68\xd3\x64\x4f\xe6\xe7\xe7\xaf\x06\xd0\xf2\
+\x1d\x5c\x44\x9e\xe5\x1b\x23\x2f\xd3\xd3\xd3\x93\xf7\xdd\x77\xdf\
+\xd7\x00\x0c\x22\xa9\x3f\x5b\x55\xbf\x1b\x86\xe1\xd0\xfe\x7c\x96\
+\xd2\xb9\x1a\xdc\xe2\x43\xd9\xc2\xf2\x3f\x1a\x8d\xc6\x7f\xc0\x66\
+\x69\xea\x6c\x83\x18\x85\x36\xf2\x09\xc0\xf4\xf4\xf4\xa4\x88\xfc\
+\x7f\x79\xcf\x63\x11\x67\x0c\x51\x15\x60\x58\x1b\x00\xe1\x9c\x1b\
+\xf9\x25\x00\x18\x6c\xff\x43\x9f\x67\xfc\xef\xdd\xbb\x77\x3f\x80\
+\xef\xf9\x0e\x2e\x22\x45\x4b\xd0\xbb\xd2\x69\xf4\xfb\x02\x80\xa7\
+\x0e\x70\x98\x49\x00\x5f\x8a\xa2\xc8\xe2\x9c\x87\xc2\x10\x11\x8b\
+\x4b\xab\xa0\xaa\xdf\x7d\xf8\x97\xf4\x07\x06\xa1\x47\x7e\x2b\xe0\
+\xc8\x27\x00\xf3\xf3\xf3\xef\x00\xb0\x29\xef\x79\x2c\xe1\x2d\x30\
+\x38\x01\x6b\xd0\x2c\x0e\x01\xca\xa9\x01\x10\x30\x58\x02\x80\x4d\
+\x49\x77\x90\xce\xf5\x0d\xb0\xc8\x8b\x68\x2f\xcf\xfd\x9a\xc1\xf8\
+\x67\x47\x51\x64\x76\x14\x77\x46\x4a\x47\x8e\x1c\xf9\x24\x06\xfb\
+\xe6\x7f\xcc\x98\xaa\x7e\xaa\x52\xa9\x3c\x27\x83\xb1\xb2\x62\xd1\
+\x68\xf7\xb3\x25\xae\x62\xb7\x48\x00\x58\x01\x18\x66\x9d\xfd\xc5\
+\xbf\x99\xf7\x3c\x4e\xe0\xb1\xd5\x6a\x75\x18\xd6\x3e\xbd\x13\x00\
+\xe7\x5c\x2e\x15\x80\x34\x4d\xe7\x7c\x63\x14\xb9\x07\x60\x6a\x6a\
+\xea\x14\x18\x5c\x58\x54\x2a\x95\xfa\x4e\x00\x4a\xa5\x92\x77\x02\
+\x00\x60\x6c\xd8\xb6\x5e\x45\x51\xf4\x56\x11\x79\x5e\x86\x43\x8e\
+\x3b\xe7\x3e\x1d\x04\xc1\x13\x32\x1c\x73\x60\x54\xd5\xa2\x01\x70\
+\xd1\xdf\x5b\x11\xb9\xd9\x20\xf6\xa3\x3b\xb7\xa0\x8e\xac\x91\x4e\
+\x00\x54\xf5\xbf\xc1\x76\x9d\xfd\x7e\x55\x7d\x8b\x88\x78\x97\x3c\
+\x8f\x51\xd5\xd7\x58\xc5\x1a\x90\x31\x00\xd3\xbe\x41\xb2\xbe\x07\
+\xe0\x98\x72\xb9\xbc\xc7\x37\x86\xaa\x16\x76\x09\xa0\xd5\x6a\x59\
+\x94\xff\x77\xd6\x6a\xb5\xbe\x97\x4a\xca\xe5\xf2\x0d\x30\x68\xf0\
+\x54\xd5\x2c\x3e\x49\x9b\x88\xa2\xe8\x82\xce\xeb\x4b\xd6\x4e\x12\
+\x91\xab\x3a\x27\x3f\x0e\xad\x0d\x1b\x36\x6c\x10\x11\xef\x93\x51\
+\x97\xaa\x5c\x19\x25\x00\xe5\x03\x07\x0e\x6c\x37\x88\x53\x58\x23\
+\x9b\x00\x44\x51\x74\x96\xaa\xbe\xd8\x30\x64\x43\x44\x2e\xac\xd7\
+\xeb\x7f\x8e\xa3\x77\x46\x9b\xdc\x8b\xae\xaa\x2f\x0c\x82\xa0\x6a\
+\x11\x6b\x10\xc2\x30\x3c\x05\x06\x07\x46\x39\xe7\x72\x59\x02\x68\
+\xb7\xdb\xde\x15\x00\x00\x1b\x50\xdc\xbf\x15\xef\xed\x7f\x22\xb2\
+\xc3\xe7\xf9\x9d\xbb\x03\x6e\xf5\x9d\x87\xaa\x5e\xe8\x1b\x23\x0b\
+\xdb\xb7\x6f\x1f\x57\xd5\x8f\x21\xbf\x83\xd4\xb6\x36\x9b\xcd\x2b\
+\x31\x04\xcb\x87\x4b\x99\x98\x98\x38\x17\x06\x7f\x53\xce\xb9\x45\
+\x13\x80\x38\x8e\x6f\x07\x70\xd8\x37\x7e\xa9\x54\x1a\xe9\x3e\x80\
+\xa2\xbe\xa8\x79\x53\xd5\x3f\x86\xdd\xff\xbf\x07\x9c\x73\xcf\x89\
+\xe3\xf8\x56\x00\x88\xe3\xf8\x20\x80\x5f\x02\x70\xc8\x20\xf6\x98\
+\x73\xae\xc8\xd7\xa2\x5a\x34\x00\xde\xd7\x39\x3a\x36\x73\x49\x92\
+\xcc\xa1\x8f\xee\xf6\xe3\x94\xd6\xaf\x5f\xbf\xde\x62\x3e\xd6\x44\
+\xc4\xfb\x18\x5d\x55\xbd\xcd\x60\x2a\xff\x6e\x10\xe3\xc9\x18\x82\
+\x37\xb5\x7a\xbd\xfe\x7a\x18\x5c\xbb\xec\xe9\xd9\x51\x14\xbd\x2a\
+\xe7\x39\xf8\x78\xbc\x41\x8c\x74\x7e\x7e\xfe\xfb\x4b\x7c\xaf\x29\
+\x22\xde\x49\x29\x46\xbc\x0f\x60\x24\x13\x80\x30\x0c\x4f\x03\xf0\
+\x42\xab\x78\xaa\xfa\xc6\x5a\xad\xf6\x90\x17\xb8\x24\x49\xee\xb2\
+\x3a\x58\x48\x55\x0b\x9b\x00\x88\xc8\xd0\x6e\x01\xec\x68\x02\xb8\
+\xdf\x37\xc8\xaa\x55\xab\x0a\x79\x28\x88\xaa\x16\xe2\x1e\x75\x55\
+\xb5\x48\x00\x26\xab\xd5\xea\xa9\x06\x71\x06\xa6\x73\x77\xfd\xdb\
+\xf3\x9e\x07\x00\xa8\xea\xbb\x26\x27\x27\xbd\x97\xe7\xf2\xa0\xaa\
+\xde\x09\x80\x88\xfc\x47\x67\x17\xca\xa2\xd2\x34\xf5\x6e\x04\x54\
+\xd5\x91\xe8\xb7\x58\xca\x48\x26\x00\x00\x7e\x1f\x46\x6b\xff\x22\
+\xf2\xe5\x7a\xbd\xfe\xb7\x8b\x7d\x6f\x7e\x7e\xfe\x5d\xb0\xa9\x02\
+\x9c\x5f\xd4\xc3\x3e\x54\xf5\x34\x83\x30\x79\x26\x00\x00\xe0\xbd\
+\x0c\xd0\x6e\xb7\xfb\x39\xd5\x6d\xd0\xca\x30\xf8\x24\x6a\x51\x01\
+\x70\xce\x59\x24\x00\x48\xd3\xb4\xd0\x2f\xb8\xa5\x52\xe9\xad\x30\
+\x38\x16\xdb\xc8\xfa\x72\xb9\x5c\x84\xd3\x4d\xfb\xe1\x9d\x00\x2c\
+\xb7\x73\xc5\xa8\x0f\xe0\x6c\x8c\xee\xfb\xe4\xe8\xfd\x1f\xeb\x34\
+\xc7\xfc\xba\x51\xb8\x07\x44\xe4\xb5\x58\xa2\x84\xbc\x7f\xff\xfe\
+\xbd\x22\xf2\x49\x83\x71\x24\x4d\xd3\xa2\x5e\x8b\x6a\x91\x98\xe4\
+\xb5\x05\x10\x00\x20\x22\xde\x8d\x80\xce\xb9\xc2\x55\x00\x36\x6d\
+\xda\xb4\x0d\x80\xf7\x51\xb1\x47\x8e\x1c\xf1\x4e\x00\xe2\x38\xbe\
+\x0d\x06\x95\x16\x00\x85\x4d\x00\x82\x20\xa8\xaa\xea\x6f\xe4\x3d\
+\x8f\xe3\x5c\x11\x86\xe1\xd0\x34\x4f\x76\x94\x01\x58\x2c\x5d\x2d\
+\xd7\x8c\x6d\xb1\x15\x70\x6d\xa5\x52\xc9\xfa\xe6\xd8\xcc\x8c\x5c\
+\x02\xd0\x6c\x36\x7f\x0d\x76\x47\xfe\xfe\x45\xad\x56\xdb\xb9\xcc\
+\x63\x3e\x68\x31\x90\x88\x3c\xdf\x22\xce\x00\x58\x54\x00\xee\x32\
+\x88\xd1\x37\x55\xb5\xd8\x0a\x58\xb8\x0a\x40\xa9\x54\xb2\xb8\x46\
+\xb7\xb6\x7f\xff\xfe\xbd\x06\x71\xda\xaa\xba\xd4\x7a\x6c\xd7\x8a\
+\x5c\x72\x15\x91\x37\x00\x28\xda\x9d\x05\x02\xe0\xdd\x18\x82\xde\
+\x89\x63\xaa\xd5\xea\x19\x00\xbc\xb7\xd7\x89\xc8\x09\x2b\x00\xaa\
+\xfa\x43\x18\x5c\x0d\x5c\x2a\x95\x0a\xfb\x3b\xe9\x6b\xd4\x12\x00\
+\x81\xd1\xbe\x7f\x55\xbd\xb7\x5c\x2e\xff\xc5\x72\x8f\x8b\xe3\xf8\
+\x06\x00\x3f\x34\x18\xf2\xfc\xce\xfd\xe0\x45\x33\xb4\xa7\x00\x1e\
+\xa3\xaa\x16\x5b\x01\x0b\x57\x01\x50\xd5\xa5\x6e\x98\xeb\x25\x86\
+\xf7\xfa\xff\x31\x22\xe2\xbd\x0c\x20\x22\x85\x7c\xb1\xed\x1c\x52\
+\xf4\xea\xbc\xe7\xb1\x84\x27\x87\x61\x38\x34\xa7\x04\x5a\xac\xff\
+\x03\x68\x8f\x8f\x8f\x9f\xf0\x13\x7e\xe7\x82\x20\x8b\x0f\x1f\x85\
+\xfc\x9d\xb4\x30\x52\x09\x40\x14\x45\x97\xc2\xae\x3b\xf7\xcf\x67\
+\x67\x67\xbb\x5a\xdf\x57\xd5\x7f\x32\x18\xcf\xa5\x69\xfa\xf3\x06\
+\x71\xcc\x74\x6e\x99\xf3\xee\x7e\x57\xd5\x5c\x13\x00\x11\x19\xc9\
+\x0a\x80\xc5\x09\x8d\x22\xf2\x13\x8b\xb9\x74\x58\x24\xc2\x5b\xa6\
+\xa7\xa7\x0b\xf7\xb3\x06\xf0\x72\x18\xfc\x2d\x74\x1c\x86\xc1\x16\
+\xb5\x85\x54\xf5\x6d\x96\xf1\x06\xcc\xa2\x01\xf0\x27\x9d\xed\xa7\
+\xcb\xb9\xc5\x77\xac\x22\x57\xa5\x7c\x8d\x54\x02\x60\xb8\x3e\x57\
+\x5b\xb3\x66\xcd\x47\xba\x7d\x70\x9a\xa6\x9f\xb3\x18\x54\x55\x2f\
+\xb7\x88\x63\xa5\xdd\x6e\x5b\x94\xff\xdb\xf5\x7a\x7d\xa7\x41\x9c\
+\xbe\x59\x2c\x01\x14\xb1\x02\x00\x83\xe5\x19\x11\xb9\xc7\x62\x22\
+\x00\xa0\xaa\x5e\xe7\x09\x1c\x33\x3f\x3f\xff\x18\x8b\x38\xc6\x7e\
+\xcb\x28\x4e\xcd\x39\x77\xde\xf8\xf8\xf8\xa4\x88\xbc\x13\xfe\x5b\
+\x54\x01\x00\x22\xf2\xa4\x21\xba\x30\xc8\xa2\x02\xf0\xa3\x6e\x1e\
+\x24\x22\xbc\x13\xe0\x04\x46\x26\x01\xe8\x94\xe8\xac\xd6\xd1\xdf\
+\xbd\x73\xe7\xce\xae\x33\xf4\x3d\x7b\xf6\xdc\x0e\xe0\x0e\xdf\x41\
+\x45\xe4\x32\x14\xeb\xdf\x64\x98\xaf\x01\x7e\x90\x73\xce\x7b\x09\
+\xa0\x88\x15\x00\x18\x24\x00\xaa\xba\xd3\x60\x1e\x00\x80\x89\x89\
+\x89\x3b\x00\xb4\x7d\xe3\x88\x48\xa1\x12\x80\x20\x08\xce\x51\x55\
+\xef\xfb\x16\x00\x40\x55\x7f\xbd\x56\xab\xed\x98\x99\x99\x79\x20\
+\x8e\xe3\xb7\x8a\xc8\x1f\x59\xc4\xed\x78\xb3\x61\xac\x81\x49\xd3\
+\xd4\x62\x07\x40\x57\x09\x00\x0c\x2a\x00\x00\xc2\x4d\x9b\x36\x6d\
+\x31\x88\x53\x38\x45\x7a\xb3\xf1\xf5\x3c\x00\xde\x97\x89\x88\xc8\
+\x5e\x55\xfd\x40\x1f\x4f\xfd\xbc\xef\xd8\x00\x2a\x61\x18\x7a\x9f\
+\xec\x66\x68\xe8\x1b\x00\x81\xd1\xac\x00\x6c\xdf\xbe\x7d\x1c\xc0\
+\x23\x7c\xe3\xa8\xaa\x59\x05\xa0\x53\x92\xf5\x5e\xee\x51\xd5\x42\
+\x25\x00\x22\xf2\x72\xa3\x50\x9f\xa8\xd7\xeb\x5f\x59\xf8\x85\x38\
+\x8e\xff\x54\x55\xff\x8f\x51\xfc\x4b\xab\xd5\x6a\xa1\x8f\xae\x5d\
+\xbf\x7e\xfd\x46\x11\xf1\xfe\xbd\x15\x91\xae\x96\x9b\x9a\xcd\xa6\
+\x45\x05\x00\xe5\x72\x79\x24\x97\x01\x46\x26\x01\x50\x55\xab\x6d\
+\x74\x1f\xef\x34\x8f\xf4\x3a\xfe\x17\x2d\x06\x17\x91\x4b\x2d\xe2\
+\x18\x19\xfa\x06\x40\x00\x48\xd3\x74\xe4\x2a\x00\x49\x92\x9c\x0a\
+\x83\xb3\x2e\xda\xed\xf6\x4e\xff\xd9\x3c\xc4\x8f\x0d\x62\x14\x29\
+\x01\x10\x00\x16\x07\x75\xa5\xaa\xfa\x27\x8b\x7c\x5d\x3b\xf7\x81\
+\x1c\x31\x18\x43\xd2\x34\x2d\xf4\xdd\x22\xe3\xe3\xe3\x56\x1f\x70\
+\xba\x4a\x00\xe6\xe6\xe6\x66\x00\x78\x9f\x42\xaa\xaa\x4f\xf4\x8d\
+\x51\x44\x23\x91\x00\x6c\xdc\xb8\x71\x3d\x00\x93\x06\x3a\x11\xf9\
+\xff\xfb\x79\x5e\xbd\x5e\xbf\x11\x40\xcf\x89\xc3\xf1\x54\xb5\x30\
+\x09\x80\xc5\x21\x40\xaa\x9a\x7b\x05\xc0\x39\x37\x72\x15\x00\x11\
+\xd9\x6a\x10\x66\x7e\x6e\x6e\x6e\xd6\x20\xce\x83\x44\x64\xa4\x12\
+\x80\x30\x0c\x2f\x04\x70\x8a\x41\xa8\x2f\xd6\xeb\xf5\x45\x1b\x2e\
+\x1b\x8d\xc6\x1d\x22\xf2\xd7\x06\x63\x00\xc0\xaf\x56\x2a\x95\xa2\
+\x1c\x54\xb4\x18\x8b\xf5\xff\xfb\xe3\x38\xde\xd9\xc3\xe3\xfb\xbe\
+\xe9\x72\x81\x0b\x0c\x62\x14\xce\x48\x24\x00\xe5\x72\xf9\x05\x00\
+\x26\x0c\x42\x7d\xab\x56\xab\xf5\xfb\x02\xd6\x04\xf0\x6f\xbe\x13\
+\x10\x91\x8b\x50\x9c\x3d\xbd\xa3\x70\x0a\xa0\x49\x05\x00\x40\xa1\
+\x2a\x00\xaa\xea\x5d\x46\xc5\xd1\xfe\x0c\xef\x7d\xd2\x0b\x19\x35\
+\x02\x9e\x32\x3d\x3d\x5d\x94\xfd\xf6\x26\xdb\xeb\x44\xe4\x6f\x96\
+\xf9\xfe\x5f\xc1\xe6\x54\xd1\xb5\xa5\x52\xe9\x25\x06\x71\x06\x42\
+\x44\x2c\x96\x28\x7e\x84\xde\x9a\x27\x2d\x4e\xa9\x7c\x0a\x46\xe4\
+\xfd\x72\xa1\x91\xf8\x3f\x64\xb5\x46\x27\x22\xfd\xac\xfd\x2f\xe4\
+\xbd\x96\xa7\xaa\x1b\x2b\x95\x4a\xde\x17\x8d\xa0\x73\x0f\xf6\x66\
+\xdf\x38\x45\xa8\x00\x8c\x8f\x8f\x5b\xdc\x08\x58\xa8\x04\xc0\x62\
+\x1d\x15\xc0\x4e\x83\x18\x0f\xa1\xaa\x16\x15\x00\xd7\x6a\xb5\x2c\
+\xee\xa0\xb0\x60\xd1\x58\xbc\x3b\x8e\xe3\x6f\x9c\xe8\x01\xb5\x5a\
+\xad\x2e\x22\x1f\x36\x18\x0b\xaa\xfa\xab\x16\x71\x06\xc4\xe2\xf0\
+\xaa\x9e\xb6\x9b\xaa\xea\x0d\x06\x63\x6e\x88\xa2\xc8\x62\xee\x85\
+\x32\xf4\x09\x40\x67\xaf\xfa\xcf\xf9\xc6\x11\x91\xbd\x6b\xd7\xae\
+\xfd\x8c\x4f\x8c\x34\x4d\xbf\xee\x3b\x0f\x00\x70\xce\x9d\x6f\x11\
+\xc7\xc7\xe1\xc3\x87\x1f\x05\x83\xdf\x8f\x56\xab\x95\x7b\x05\x60\
+\x76\x76\x76\x2f\xfc\x3f\xe9\xae\xde\xb6\x6d\x9b\x45\x95\xc9\x8a\
+\x45\x57\xf2\xbd\x06\x31\x1e\x62\x62\x62\xe2\x76\x18\x54\x15\x54\
+\x35\xf7\xe3\x57\x83\x20\xd8\x06\xc0\xe2\xce\xfa\x4f\xa2\x8b\xdd\
+\x11\xa5\x52\xe9\xdd\x00\x5a\xbe\xe3\x01\xb8\x28\x8a\xa2\xa2\x24\
+\x50\xc7\xb3\x78\x13\xed\x76\x07\x00\x00\x60\x7c\x7c\xfc\xbb\xb0\
+\xd9\x6e\x39\x14\xd7\x55\xf7\x62\xe8\x13\x80\x56\xab\xf5\x62\x00\
+\x63\x06\xa1\x3e\x7b\xe7\x9d\x77\x7a\x35\xe2\x34\x1a\x8d\x9b\x01\
+\x2c\x79\x3b\x55\xb7\x44\xe4\x49\xbe\x31\x7c\xa9\xaa\x45\x03\xe0\
+\xdc\xbe\x7d\xfb\xf6\x19\xc4\xf1\xd5\x86\xc1\x39\xf5\xfb\xf6\xed\
+\x2b\x52\x15\xc0\xfb\x16\x38\x55\x35\x5d\xff\x07\x1e\xdc\x09\x60\
+\x11\xd7\x62\xf9\xc9\x97\xc9\xb9\x1c\x22\xf2\xa9\x6e\x1e\x37\x3b\
+\x3b\xfb\x33\x00\x5f\xb6\x18\x52\x55\x7f\xd9\x20\x8e\xa9\x28\x8a\
+\x42\x00\x15\xdf\x38\x3d\x6c\x01\x04\x00\xec\xda\xb5\x6b\x0f\x80\
+\x3b\x0d\xc6\x65\x02\x50\x40\x26\xbf\xe8\xaa\xda\xd5\x1f\xe9\x32\
+\xda\x00\x6e\x34\x98\x4b\xee\x09\x00\x6c\xf6\x98\xe7\x5e\xfe\x5f\
+\xc0\xfb\xbc\xfb\x72\xb9\x5c\xa4\x46\x40\x8b\x6b\x60\x77\x1b\xc4\
+\x78\x18\x11\xf1\xfe\x77\x37\xba\x85\xd2\x8b\x88\x5c\x62\x10\x26\
+\x49\x92\xa4\xeb\xd7\x04\x11\xe9\xfa\x00\xb2\x65\xbc\xc8\x28\x8e\
+\x19\x11\xb1\xf8\xf4\xaf\xcd\x66\xb3\xa7\x04\xa0\xc3\xfb\x75\x19\
+\x40\x61\x1a\xb4\xad\x0c\x75\x02\x50\xa9\x54\xce\x84\x4d\x59\xa6\
+\x91\x24\x89\x49\xf9\x1e\xc0\x77\x0c\x62\x9c\xd3\xd9\xe7\x9d\xa7\
+\x91\xd8\x02\xb8\x80\x77\x02\x50\xa4\x2b\x81\x45\xc4\x3b\x01\x10\
+\x11\xf3\x0a\x40\x87\xc5\xbf\x7b\xde\x09\x80\x00\xb8\xc8\x20\xce\
+\x35\xe8\x61\x49\x24\x8e\xe3\x2f\xc3\x26\x31\x3b\xbb\x68\xcb\x00\
+\x69\x9a\x5a\xdc\x00\x38\xd3\x4f\x55\x51\x55\x2d\x1a\x01\x4f\xd9\
+\xbc\x79\x73\x61\x76\xa8\x58\x18\xea\x04\xc0\x39\xf7\x7a\xd8\x74\
+\xcc\x5f\x05\xa3\xd3\xea\x8c\x1a\x4e\x56\xc5\x71\x9c\xf7\x81\x40\
+\xde\x2f\xc0\xce\xb9\x91\x4a\x00\x8a\x72\x25\xf0\xd6\xad\x5b\x57\
+\x19\x6d\x4b\x1c\x48\x05\x00\x36\x87\x3f\xe5\x9a\x00\x44\x51\xb4\
+\x1d\x06\xe5\x6a\x11\xe9\xb5\xa4\xdf\x02\xf0\x71\xdf\x71\x3b\x8a\
+\x76\x41\x90\x77\x02\xe0\xb1\xcd\xd4\x7b\x87\x16\x00\xa4\x69\xfa\
+\x6c\x8b\x38\x45\x31\xb4\x09\xc0\xd4\xd4\xd4\x29\x00\x7e\xcd\x22\
+\x56\xb7\x6b\x74\xdd\x98\x9f\x9f\xbf\x11\x06\x0d\x27\x79\x37\x02\
+\xa6\x69\x6a\x51\x01\x28\xd2\x12\x80\x77\x2f\x42\x9a\xa6\x85\xa8\
+\x00\xdc\x77\xdf\x7d\x26\xb7\x46\x3a\xe7\x8a\x9c\x00\x9c\x82\x1c\
+\xb7\xc3\xa6\x69\xfa\x74\x8b\x30\xe5\x72\xf9\x5f\xfb\x18\xfb\x93\
+\x06\x63\x03\xc0\x0b\x8c\xe2\x98\x50\x55\x8b\x2d\x80\x7d\x25\x00\
+\xf5\x7a\xfd\x16\x00\x75\xdf\xc1\x55\x95\x09\x40\x11\xb4\x5a\xad\
+\x77\xc0\xe0\x4e\x69\x00\x71\x1c\xc7\xd7\x19\xc4\x01\x00\xec\xdf\
+\xbf\x7f\xaf\xc5\x15\xab\x39\x37\x02\x3a\x11\xf1\x2e\x1f\x8a\x48\
+\x61\x2a\x00\xaa\x3a\x32\x15\x00\xe7\x5c\x68\x10\x46\x4f\x3e\xf9\
+\xe4\x41\xf5\x00\x58\xfc\xbb\x4f\x44\x51\x94\xdb\xf5\xd8\xce\x39\
+\x8b\x04\xe0\xd6\x4e\x03\x5a\x4f\x1a\x8d\xc6\x4d\x30\x48\xa2\x54\
+\xf5\x69\x9d\x5d\x52\x85\x60\xd1\x03\x20\x22\xfd\x9e\x33\x91\x02\
+\xb8\xd6\x77\x7c\x00\x17\x4f\x4d\x4d\xad\x36\x88\x53\x08\x43\x99\
+\x00\x44\x51\xf4\x73\x30\x6a\xfe\x13\x91\xae\xb6\xe8\xf4\x18\xf3\
+\x7b\xbe\x31\x54\x35\xb7\x0a\xc0\xe4\xe4\xe4\x16\x18\x24\x57\xce\
+\xb9\xc2\x54\x00\x44\xc4\x3b\x01\x50\xd5\x42\x54\x00\x44\xc4\xe2\
+\x8d\x71\xce\x77\xd7\xcb\x52\x4a\xa5\x92\xc9\xbf\x7b\xbb\xdd\xb6\
+\x38\xeb\xa0\x1f\xa2\xaa\x17\x7b\x07\x11\x39\xe1\xde\xff\x65\x9e\
+\xfb\x69\xdf\xf1\x01\x94\x9a\xcd\xe6\x73\x0d\xe2\x78\xeb\x24\x22\
+\xde\x89\xab\xcf\x39\x13\xaa\xda\x73\x35\x66\x11\xab\x5a\xad\xd6\
+\x7f\x31\x88\x53\x08\x43\x97\x00\x6c\xd8\xb0\x61\x83\xaa\x7e\x18\
+\x46\xe5\x41\x11\xb9\xd2\x22\xce\x71\x31\x6f\x36\x08\xf3\xe8\xbc\
+\x4e\x43\x73\xce\x59\x94\xff\x8f\xcc\xce\xce\xee\x32\x88\x63\x42\
+\x44\xbc\x97\x00\x44\xa4\x10\x15\x00\xa3\x04\x60\x50\xe5\xff\x63\
+\xdb\xae\xbc\x7f\xde\xa5\x52\xc9\x62\xa7\x43\xcf\x36\x6d\xda\x74\
+\x26\x80\xc8\x37\x4e\x9a\xa6\xdf\xec\xf7\xb9\xed\x76\xdb\x22\x01\
+\x80\x88\xce\x83\xd5\x06\x00\x00\x20\x00\x49\x44\x41\x54\x14\xa2\
+\x0f\xa0\xd9\x6c\x9a\x1c\xa2\x33\x3f\x3f\x7f\x5b\xbf\xcf\x6d\xb7\
+\xdb\x16\x09\x00\x00\xfc\x8a\x51\x9c\xdc\x0d\x5b\x02\x20\xe3\xe3\
+\xe3\x1f\x03\x60\xd2\xdd\x2a\x22\xb7\xd7\x6a\x35\x8b\x73\xa2\x8f\
+\x8f\x6b\x71\x03\x55\xe9\xf0\xe1\xc3\xb9\x74\x9c\x8a\x88\x45\x03\
+\xd6\x3d\x30\xae\xac\xf8\xb0\x58\x02\x28\x4a\x05\x00\x80\x45\x02\
+\x50\x33\x88\x71\x22\x3f\xf5\x0d\x90\xa6\x69\x2e\x15\x80\x72\xb9\
+\xec\xfd\xe9\x1f\x00\x44\xe4\x5b\xfd\x3e\xb7\xb3\x0c\x30\x63\x30\
+\x8d\x67\x15\xe1\x58\x65\xa3\x2d\x80\xbb\x7c\xce\x15\xe9\x5c\x0c\
+\x64\x71\x52\xe5\x73\xa6\xa7\xa7\x8b\xf2\x5a\xe0\x65\xa8\x12\x80\
+\x30\x0c\xdf\x05\x9b\xa3\x39\x01\x00\x69\x9a\xbe\xcf\x2a\xd6\x42\
+\x87\x0f\x1f\xbe\x19\x36\x8d\x80\x8f\x33\x98\x4e\x3f\x46\xe2\x1a\
+\xe0\x85\x2c\x96\x00\x00\x14\xa2\x02\x00\x83\x4f\xa7\x00\x12\x83\
+\x18\x27\xe2\x7d\xcd\xb0\xd1\x71\xc7\x3d\x53\xd5\xf3\x0c\xc2\xdc\
+\x93\x24\x49\xec\x39\x8f\xaf\x2c\xff\xa8\x65\xad\x9e\x9f\x9f\x7f\
+\x9a\x41\x1c\x2f\x46\x09\x80\xf7\x3d\x13\x46\xcb\x00\xe3\xf3\xf3\
+\xf3\x56\xb7\xcf\xe6\x6a\x58\x12\x00\x09\x82\xe0\x1d\x00\xfe\x5f\
+\xc3\x98\x73\xce\xb9\x8f\x1a\xc6\x7b\x50\x27\x4b\xfd\x99\x41\xa8\
+\xbc\xb6\x02\x8e\xda\x19\x00\x48\xd3\xd4\x22\x01\x28\x44\xd6\x2f\
+\x22\x16\xdb\xd3\x2c\x2e\x48\x3a\x51\x7c\x8b\x63\x86\x73\x59\x02\
+\x10\x11\x8b\xab\x5f\xbd\xfb\x80\x44\xe4\x6a\x83\x79\x40\x44\x2e\
+\xb3\x88\xe3\x43\x55\x2d\xce\x00\xe8\xbb\xfc\xbf\xc0\x35\x06\x31\
+\x00\xe0\x15\x46\x71\x72\x55\xf8\x04\x60\xfb\xf6\xed\xe3\x61\x18\
+\x7e\x4c\x44\xfe\xd0\x32\xae\xaa\x7e\x20\x8e\xe3\x83\x96\x31\x8f\
+\x63\xb1\x0c\x90\x4b\x05\x40\x44\xbc\x13\x00\x8b\xd3\xe0\x2c\x39\
+\xe7\x2c\x8e\x24\x2e\x44\x05\x20\x4d\x53\xef\x25\x00\x55\xf5\xde\
+\x12\xb5\x4c\x7c\x8b\x04\x20\x8f\x0a\xc0\x98\xaa\x7a\xff\xdd\xa9\
+\xaa\xf7\xd2\x62\xab\xd5\xba\x16\x06\xe7\x93\xa4\x69\xea\x7d\x57\
+\x8a\x01\xef\x04\xc0\x39\xe7\x5d\xbe\x0f\xc3\xf0\x6b\x30\xe8\x4f\
+\x01\xf0\xe4\x20\x08\x72\xaf\xac\xf8\x2a\x74\x02\xb0\x65\xcb\x96\
+\x4d\x49\x92\x7c\x05\xc6\x4d\x17\x22\xb2\x77\x62\x62\xe2\xdd\x96\
+\x31\x17\x61\x91\x00\xe4\x55\x01\x18\x89\x6b\x80\x17\x6a\xb7\xdb\
+\xa3\x54\x01\xb0\xd8\x06\xd8\x30\x88\xb1\x24\x11\xb1\xa8\x80\x65\
+\x9e\x00\x04\x41\xb0\x1d\x06\x57\x8b\x3b\xe7\xbc\x2b\x00\x73\x73\
+\x73\xf7\x89\xc8\xb7\x7d\xe3\x88\xc8\x13\xd7\xaf\x5f\x9f\x5b\xf2\
+\xda\x19\xdb\xe2\x66\x51\xef\x25\x80\x1d\x3b\x76\xcc\x03\xf8\x9c\
+\x6f\x1c\x00\xb0\xfe\x50\x9a\x87\xa2\x26\x00\x12\x04\xc1\x2b\x9a\
+\xcd\xe6\x6d\x22\x62\x7e\xfe\xb2\xaa\xbe\x63\x66\x66\xc6\xe2\x8a\
+\xd8\x13\xb1\x48\x00\xb6\x64\xfd\x87\xbb\x61\xc3\x86\x0d\x00\x36\
+\x19\x84\x2a\x54\x02\x50\x2a\x95\x2c\x12\x80\x0d\xc8\xf1\x70\x9a\
+\x05\x86\xa1\x02\x60\x91\x00\x4c\x21\xfb\xd7\x28\x8b\xf2\xbf\x1e\
+\x39\x72\xe4\xfb\x06\x71\x90\xa6\xa9\xc5\x32\x40\x69\x62\x62\xc2\
+\xe2\x5c\x83\xbe\x4c\x4c\x4c\x58\xed\x00\xf0\x4e\x00\x00\xb3\x7b\
+\x5f\x00\xe0\xd9\x41\x10\x98\x5c\x18\x95\x97\xc2\x25\x00\xd5\x6a\
+\x75\x7b\x10\x04\x5f\x17\x91\x8f\xc2\xa6\xdb\xf9\x78\x77\xad\x5b\
+\xb7\xee\xfd\x03\x88\xfb\x10\xce\x39\x8b\x04\x00\xe3\xe3\xe3\x99\
+\x2e\x03\x94\xcb\x65\x8b\xf5\x7f\x45\xc1\x12\x80\x4a\xa5\x62\x51\
+\xf6\x2b\x6f\xdc\xb8\x71\x9d\x41\x1c\x5f\xde\x7f\x17\xa5\x52\x69\
+\xa0\x15\x80\x56\xab\x65\xb1\x04\x30\x5e\xa9\x54\x2c\x1a\x1e\xbb\
+\x66\xb4\xfe\xff\x13\xab\x5b\x30\x45\xc4\xa2\x11\x30\xd7\x3e\x80\
+\x22\xec\x00\x58\xa8\x5e\xaf\x5f\x0b\xa3\x5d\x30\x22\xf2\xde\xce\
+\x87\xa6\xa1\x54\x94\x04\xc0\x45\x51\x74\x59\x18\x86\x9f\x4b\xd3\
+\xf4\x87\x46\xb7\x70\x2d\x46\x45\xe4\xbf\x0e\xea\x00\x94\x85\x6a\
+\xb5\xda\x3d\x16\x9d\xe7\x22\x92\xe9\x32\x80\xd1\x16\xc0\x78\xc0\
+\xfd\x15\x3d\xeb\x94\xfe\xbc\xe7\x34\x31\x31\x91\x6b\x1f\x40\x67\
+\x4b\xd7\x5a\x83\x50\x03\xad\x00\xcc\xcd\xcd\xed\x86\xc1\xfa\x75\
+\xb9\x5c\xce\xba\x11\xd0\x22\x01\x30\xdb\x5a\x9c\x24\xc9\x0f\x61\
+\x70\xbd\xb2\xaa\xe6\xd6\x07\x60\x71\x09\x10\x6c\xb6\xef\x1d\xd3\
+\x14\x91\xbf\x37\x8a\xf5\xa8\xb1\xb1\xb1\x8f\xc3\xe6\x4a\xfa\xcc\
+\xe5\x96\x00\x4c\x4f\x4f\x4f\x06\x41\x70\x79\x14\x45\x7f\x13\x86\
+\xe1\xdd\xaa\x7a\x2d\x8e\x5e\x5e\x31\xc8\x39\x7d\x28\x8e\xe3\xaf\
+\x0d\x30\xfe\x42\x9a\xa6\xe9\x2d\x06\x71\xb2\x6e\x04\x1c\xb5\x3b\
+\x00\x16\xf2\x4e\xc8\x5a\xad\x56\xae\x7d\x00\x16\x0d\x80\x9d\x38\
+\x03\xad\x00\xe0\xe8\x19\x10\xde\x6f\x5c\x19\x9f\x05\x50\x02\x70\
+\xb6\x6f\x10\x11\xb1\x3c\x5b\x44\x8d\xaa\x00\x8f\xa9\x54\x2a\xde\
+\xeb\xf0\xfd\x10\x11\xef\x3b\x00\x44\xc4\x62\x07\xc0\x42\x1f\x46\
+\x0f\xb7\x34\x9e\x88\x88\x3c\x37\x0c\xc3\x2f\x56\x2a\x95\x29\x8b\
+\x78\x59\x5a\x74\x3d\x73\xfb\xf6\xed\xe3\xf5\x7a\xfd\x92\x4e\xe9\
+\x26\x84\xc1\x9b\xb2\xaa\xae\x03\x70\x12\x8e\x5e\xf2\xf1\x48\x18\
+\x1d\xe6\xd3\xa3\xff\x25\x22\xf7\x65\x35\x98\xaa\xfe\x3c\x80\xc7\
+\x7b\x86\xb9\xdb\xe8\x58\xd0\x6e\x3d\x43\x55\xcf\xf5\x8c\x71\x87\
+\x88\x98\x34\xda\x58\x52\xd5\xdf\x80\x7f\x7f\xc3\x27\x8c\xb6\xb8\
+\xf5\x2b\x50\xd5\x57\x1a\xc4\x79\xb7\x88\xb4\x0c\xe2\x2c\x49\x55\
+\x7f\x15\xfe\xcd\x5f\xd7\x18\x1d\xac\xb5\xac\xce\x6b\xd4\x6b\x7c\
+\xe3\x74\xfe\x5e\xcd\x96\xc0\x54\xf5\x1c\x00\xde\xc7\xcf\x5a\xcf\
+\xab\x5b\xaa\xfa\x6a\xf8\x37\xd0\x7e\xdd\x38\xb1\x82\xaa\xbe\x0a\
+\x06\x37\x3e\x2e\x70\x08\x47\xb7\x19\xde\x25\x22\x45\x38\x04\x2d\
+\x05\x10\xab\xea\x8f\x93\x24\xb9\x0e\x8b\x54\xe4\x1e\x92\x00\x44\
+\x51\xb4\x46\x55\xdf\x00\xe0\xf7\x71\xb4\xe1\x89\x88\x88\x88\x86\
+\x58\x67\x39\xfa\xaf\x4a\xa5\xd2\x5f\xcd\xce\xce\x1e\x7a\xf0\xeb\
+\xc7\xfe\x47\x14\x45\x8f\x54\xd5\x2f\x20\xa7\xbd\xe7\x44\x44\x44\
+\x34\x50\x3f\x74\xce\xfd\x42\xad\x56\xdb\x09\x74\x12\x80\x2d\x5b\
+\xb6\x6c\x6a\x36\x9b\x37\xc2\x66\xff\x37\x11\x11\x11\x15\xd3\x4e\
+\xe7\xdc\xf9\xb5\x5a\xad\xee\x00\x60\x7e\x7e\xfe\xef\xc1\x37\x7f\
+\x22\x22\xa2\x51\xb7\x35\x4d\xd3\x0f\x00\x80\x84\x61\xf8\x54\x00\
+\xff\x96\xf3\x84\x88\x88\x88\x28\x23\x22\x72\x81\xc3\x08\xdd\x6d\
+\x4c\x44\x44\x44\x5d\xf9\x65\x27\x22\xb9\x1d\x11\x49\x44\x44\x44\
+\xd9\x53\xd5\x4b\x9d\xaa\xe6\x72\xe5\x26\x11\x11\x11\xe5\x66\xda\
+\xe1\xe8\xb9\xed\x44\x44\x44\xb4\x72\xa8\x53\xd5\x99\xbc\x67\x41\
+\x44\x44\x44\x99\xba\xd7\x89\xc8\xd7\xf3\x9e\x05\x11\x11\x11\x65\
+\x47\x55\xbf\xe6\x44\xe4\xca\xbc\x27\x42\x44\x44\x44\x99\x51\x55\
+\xfd\x47\x17\xc7\xf1\x0d\x00\x3e\x9b\xf7\x6c\x88\x88\x88\x68\xf0\
+\x54\xf5\x53\x8d\x46\xe3\x7b\x0e\x00\xc6\xc7\xc7\x7f\x03\xc0\x9d\
+\x39\xcf\x89\x88\x88\x88\x06\xeb\xa7\xe3\xe3\xe3\xaf\x05\x3a\xd7\
+\xfc\xce\xcc\xcc\xcc\xb5\xdb\xed\x4b\x44\xe4\x7b\xf9\xce\x8b\x88\
+\x88\x88\x06\xe4\x07\xa5\x52\xe9\xd2\x5d\xbb\x76\xed\x01\x3a\x09\
+\x00\x00\xec\xd9\xb3\x67\xd7\x49\x27\x9d\x74\x11\x80\x37\x03\x68\
+\xe4\x35\x3b\x22\x22\x22\x32\x95\x00\x78\xe3\xba\x75\xeb\x2e\xd8\
+\xbd\x7b\xf7\x3d\xc7\xbe\x28\x4b\x3c\xb8\x14\x04\xc1\x53\x01\x9c\
+\x05\xa0\xea\x9c\x1b\xcb\x62\x86\xa3\x4c\x55\x5f\x01\xa0\xea\x19\
+\xe3\x3a\xe7\xdc\x8d\x46\x53\x5a\x18\xf7\x14\x00\x2f\x37\x88\xf3\
+\x1e\xe7\xdc\x11\x83\x29\x0d\x8c\xaa\xbe\x04\xc0\x23\x7d\x62\x88\
+\xc8\xbf\x00\xb8\xd5\x66\x46\xdd\x53\xd5\x2a\x80\x57\x78\x86\x39\
+\x24\x22\xef\xb5\x98\x4f\x37\x54\x75\x2d\x80\xdf\x36\x08\xf5\x2e\
+\x11\x69\x1b\xc4\x79\x18\x55\xfd\x6d\x00\x6b\x3d\x63\x7c\xd1\x39\
+\xf7\x63\xa3\x29\x2d\x37\xd6\x36\x00\x2f\x32\x88\xf3\x61\xe7\xdc\
+\x1e\x83\x29\x2d\x16\xfb\xf7\x00\xac\xf2\x8c\x31\x90\xd7\xbb\x95\
+\x22\x4d\xd3\x26\x80\x1a\x80\x5b\xea\xf5\xfa\x77\x00\x3c\xec\xef\
+\x67\xa9\x04\x80\x8c\x85\x61\x78\x15\x80\x17\x7a\x86\xf9\xdb\x24\
+\x49\x5e\x6b\x31\x9f\x85\x82\x20\x78\xa5\x88\x7c\xc4\x27\x86\x88\
+\xec\x8d\xe3\x78\xd2\x6a\x4e\x83\x12\x86\xe1\xa7\x01\xbc\xd8\x27\
+\x86\xaa\xfe\x4e\xbd\x5e\x7f\xbf\xd1\x94\xba\x16\x04\xc1\xd3\x44\
+\xe4\x5b\x9e\x61\x7e\x96\x24\xc9\xa9\x26\x13\xea\x42\x10\x04\x27\
+\x8b\xc8\xfd\xbe\x71\x44\x24\x8a\xe3\x38\xb1\x98\xd3\x71\xca\x61\
+\x18\x1e\x02\xe0\xf5\x21\x27\x4d\xd3\x4b\x1a\x8d\xc6\x37\x8c\xe6\
+\x74\x42\x95\x4a\xe5\x0c\xe7\xdc\x1d\xbe\x71\x44\xe4\x05\x71\x1c\
+\x7f\xde\x62\x4e\x0b\x4d\x4d\x4d\x55\x5a\xad\x56\xdd\x20\xd4\x15\
+\x49\x92\xb0\x41\x7d\x80\xdc\xf2\x0f\x21\x0b\xaa\x7a\x9b\x6f\x0c\
+\x11\xd9\x6e\x31\x97\x45\x9c\xe5\x1b\x40\x55\x33\xff\x44\xdc\xa7\
+\xbd\xbe\x01\x9c\x73\x1b\x2c\x26\xd2\x87\x93\x0d\x62\x1c\x30\x88\
+\xd1\xb5\x7a\xbd\x7e\x00\xc0\x21\x83\x50\x91\x41\x8c\x87\x09\x82\
+\x60\x2b\x3c\xdf\xfc\x3b\x7e\x62\x10\xa3\x2b\x8d\x46\xe3\x27\x22\
+\xe2\xfd\x7b\x9c\xa6\xe9\x93\x2c\xe6\x73\xbc\x66\xb3\x79\x9e\x45\
+\x1c\xe7\xdc\xcd\x16\x71\x68\x69\x4c\x00\x32\x22\x22\xde\x09\x80\
+\xaa\x0e\x24\x01\x10\x11\xef\x04\x00\x39\x94\xc4\xfb\x21\x22\x73\
+\xbe\x31\x54\x75\xa3\xc5\x5c\x7a\x25\x22\x6b\x7c\x63\xa8\xea\x41\
+\x8b\xb9\xf4\xc8\xe2\xd3\xe0\x40\x12\x00\x00\xa7\x1b\xc4\x38\xd0\
+\x68\x34\x76\x1b\xc4\xe9\x96\xaa\xea\xf7\x7d\x83\x88\x88\xc9\x1b\
+\xf5\xf1\x9c\x73\x4f\x34\x08\xb3\xaf\x56\xab\xdd\xb3\xfc\xc3\xc8\
+\x07\x13\x80\x8c\xa4\x69\x7a\xbb\x41\x98\x4a\x18\x86\x83\x78\x21\
+\x5c\x31\x09\x40\x9a\xa6\xde\x9f\x9c\x54\x35\xaf\x0a\x80\x77\x02\
+\x80\x8c\x2b\x00\x00\xa0\xaa\xde\xa5\x7b\x55\x2d\x72\x02\x70\x27\
+\x32\xbe\x53\x45\x44\xbe\x6b\x10\xe6\x3c\x0c\x60\x19\x58\x55\xbd\
+\x13\x0b\x11\xb9\x05\xbc\xa7\x66\xe0\x98\x00\x64\x44\x44\x6e\x87\
+\xc1\x2f\xb4\xf5\x32\x40\xa5\x52\xd9\x0c\x20\xf4\x8d\xa3\xaa\x3f\
+\x32\x98\xce\xc0\x39\xe7\xbc\x2b\x00\x22\x92\x4b\x05\x00\x43\xb8\
+\x04\xd0\x11\x1b\xc4\x18\x48\x02\xe0\x9c\xf3\x4e\x00\x44\x24\xb3\
+\xf2\xff\x31\xaa\xfa\xef\x06\x61\x36\x45\x51\xe4\xd5\x10\xbb\x18\
+\x8b\x04\x40\x55\x6f\xb2\x98\x0b\x9d\x18\x13\x80\x8c\xd4\xeb\xf5\
+\x03\x16\x17\x2f\xa5\x69\x6a\x9a\x00\x38\xe7\x1e\x67\x11\x67\x62\
+\x62\x62\x87\x45\x9c\x41\x33\xaa\x00\xe4\x95\x00\x78\x57\x00\x44\
+\x24\xf3\x04\xc0\x39\x67\xd1\xbc\x37\x90\x04\xa0\xd3\x51\xef\x25\
+\x4d\xd3\xcc\x13\x80\x76\xbb\x6d\x51\x01\x00\x00\xd3\x3e\x80\x28\
+\x8a\x42\x11\x79\x84\x6f\x1c\x55\xbd\xc5\x62\x3e\x74\x62\x4c\x00\
+\x32\x64\xd1\x07\x30\x80\x46\xc0\xc7\x1b\xc4\xd8\x35\x33\x33\xe3\
+\xfd\xc9\x3a\x0b\x46\x15\x80\xa1\x5d\x02\xc8\xa9\x07\xa0\xb0\x15\
+\x00\xd8\x2c\x01\x64\x9e\x00\xec\xd9\xb3\x67\x17\x80\x59\xdf\x38\
+\x16\x9f\xd6\x17\x4a\xd3\xf4\x5c\x8b\x38\x22\xc2\x06\xc0\x0c\x30\
+\x01\xc8\x50\x67\x19\xc0\x57\x11\x13\x80\xa1\x28\xff\x03\x36\x15\
+\x00\x00\x43\xbb\x04\x60\xb1\x25\xaf\x0f\x85\xac\x00\x6c\xdf\xbe\
+\x7d\x1c\x80\xf7\x96\x48\x11\xf9\x0f\x83\xe9\xf4\xc3\x7b\x19\x40\
+\x44\x4c\x2b\x00\x46\x8d\x85\x47\x92\x24\xf1\xfe\xb0\x44\xcb\x63\
+\x02\x90\x21\x8b\xad\x80\x00\x1e\x6b\x10\x63\x21\x8b\x06\xc0\xa1\
+\x28\xff\x03\x40\xb9\x5c\xb6\xa8\x54\xb0\x02\xd0\x9b\x42\x56\x00\
+\x6a\xb5\xda\xa3\x00\x94\x7d\xe3\x88\x48\x2e\xf7\xa8\x58\x34\x02\
+\xaa\xea\x13\x61\xfb\x3e\xe0\xbd\x03\x40\x44\x6e\x05\xd0\x34\x98\
+\x0b\x2d\x83\x09\x40\x86\xd2\x34\xb5\x48\x00\x26\x3b\x8d\x7b\x16\
+\xca\x00\x1e\xe3\x1b\x64\x88\xce\x00\xc0\x91\x23\x47\x2c\x2a\x00\
+\xeb\x00\x94\x0c\xe2\xf4\x8a\x4d\x80\x86\xca\xe5\xf2\x19\x06\x61\
+\xf6\x0d\xe8\x80\xa2\x65\xa9\xaa\x45\x1f\xc0\xda\x6a\xb5\xea\xfd\
+\x1a\xb0\x80\x77\x05\x20\x4d\xd3\x1f\x58\x4c\x84\x96\xc7\x04\x20\
+\x43\xce\x39\x8b\x25\x00\x94\x4a\x25\x93\x65\x80\x6a\xb5\x7a\x26\
+\x3c\x8f\xeb\x04\x86\x67\x07\x00\x00\xcc\xcd\xcd\xdd\x0f\xa0\xe5\
+\x19\xc6\xad\x5f\xbf\x7e\x9d\xc5\x7c\x7a\x34\xac\x09\x80\xc5\x1b\
+\x64\x08\xe3\xd7\x2b\x55\x3d\xd3\x20\x46\xe6\xeb\xff\xc7\x1c\x39\
+\x72\xe4\x7b\x30\xd8\x59\xd4\x6e\xb7\x4d\xfa\x00\x3a\x5b\x94\xa7\
+\x7d\xe3\x88\x08\x77\x00\x64\x84\x09\x40\x86\x92\x24\x89\x01\x58\
+\x9c\xbd\x6d\x92\x00\xa8\xaa\xc5\x0e\x80\xf6\xf8\xf8\xf8\x30\xad\
+\xd7\x29\x0c\x4e\x03\x5c\xb5\x6a\x55\x1e\x7d\x00\x43\x79\x0e\x00\
+\x6c\x12\x80\xf2\xd4\xd4\x94\xf5\x51\xd3\x43\xb9\x05\xf0\x98\xfd\
+\xfb\xf7\xef\x05\x70\x97\x6f\x1c\xab\x3e\x00\x55\x35\x69\x00\x04\
+\xc0\x1d\x00\x19\x61\x02\x90\x3d\x8b\x5f\x6e\x8b\xc6\x3d\xa4\x69\
+\x6a\xb1\xfe\x7f\xf7\xec\xec\xac\xc5\x51\xaf\x59\xf2\x4e\x00\xda\
+\xed\xf6\xb0\x26\x00\x99\xf7\x00\xc4\x71\xdc\xc0\x22\x17\x91\xf4\
+\x2a\x4d\x53\xef\xf3\x2a\x16\x12\x11\x8b\x25\x80\xdc\x12\x00\x00\
+\x50\x55\x8b\x2b\xdc\x4d\x12\x00\xa3\x06\xc0\xe6\xf8\xf8\x38\x2b\
+\x00\x19\x61\x02\x90\x3d\xef\x04\x40\x55\x9f\x60\x31\x11\xd8\x24\
+\x12\x3f\x34\x88\x91\x35\xef\x46\xc0\x52\xa9\x94\x47\x23\xe0\xb0\
+\x2e\x01\xa4\x28\xe0\x71\xc0\xaa\xea\x9d\x00\xe4\xb8\x03\xe0\xd8\
+\xf8\x16\x7d\x00\x67\x77\x76\x44\xf8\xce\xe5\xc9\x06\x73\xb9\x79\
+\x66\x66\xe6\x01\x83\x38\xd4\x05\x26\x00\x19\x33\x3a\xe0\x62\xfb\
+\xb6\x6d\xdb\x26\x7c\x83\x88\x88\x45\xc9\xce\xe2\x44\xb2\xac\x59\
+\x5c\xa4\x92\x47\x05\x60\x58\x13\x00\xc0\x60\x19\xc0\xf2\x38\xe0\
+\x4a\xa5\xb2\x16\x9e\xd7\x73\x03\xf9\x2e\x01\x00\x66\x8d\x80\x13\
+\x71\x1c\xfb\x56\x03\x45\x55\x2f\xf0\x9d\x88\xaa\x7e\xdb\x37\x06\
+\x75\x8f\x09\x40\xf6\x2c\x3e\x31\x8f\xef\xdf\xbf\xdf\x6b\x3b\x60\
+\xa5\x52\x99\x02\x30\xe5\x3b\x11\x11\xb1\x28\x41\x66\xcd\xbb\x02\
+\x90\xd3\x8d\x80\xc3\xda\x03\x00\x14\xef\x2c\x80\xd3\x61\x70\x0e\
+\xfe\xe1\xc3\x87\x73\x4d\x00\x00\xdc\x0c\x83\xe5\x15\xe7\xdc\xf9\
+\x3e\xcf\xaf\x56\xab\x8f\x05\xe0\xdd\xa3\xe1\x9c\xbb\xc1\x37\x06\
+\x75\x8f\x09\x40\xc6\xc2\x30\xdc\x01\x60\xde\x20\x94\xd7\x32\x80\
+\xef\x1f\x7c\x47\xda\x6c\x36\x87\x2e\x01\x18\xe2\x1b\x01\x87\xb9\
+\x02\x50\xa8\xad\x80\xa5\x52\xc9\x7b\x07\x00\x80\x64\xdf\xbe\x7d\
+\xfb\x0c\xe2\xf4\xad\x73\xdd\xb2\x45\x13\xee\x53\x7c\x9e\x9c\xa6\
+\xe9\xd3\x0c\xe6\x80\x66\xb3\x79\xbd\x45\x1c\xea\x0e\x13\x80\x8c\
+\xed\xd8\xb1\x63\x1e\xc0\x1d\xbe\x71\x9c\x73\x5e\x09\x80\xd1\x11\
+\xa0\xb7\xcf\xcd\xcd\xdd\x67\x10\x27\x53\xaa\xea\xbd\x04\x90\xc3\
+\x85\x40\x02\xe0\x24\xdf\x20\x39\x1d\x04\x04\x14\x2c\x01\x50\xd5\
+\xa1\x3c\x02\x78\x09\x16\x49\xf8\x85\x9e\xcf\xf7\x4a\x20\x3a\x66\
+\xe6\xe6\xe6\xbc\xef\x4b\xa1\xee\x31\x01\xc8\x87\x45\x23\xa0\xd7\
+\x89\x5b\x46\x1d\xbb\x56\x17\x92\x64\x4a\x44\x2c\x2e\x04\xb2\xde\
+\x92\x76\x42\x51\x14\xad\x86\xcd\xdf\x6b\x2e\x15\x00\x8b\x2b\x81\
+\x61\xbb\x04\x30\xf4\x3b\x00\x16\xb0\xf8\x3b\x3c\xcd\xf3\xaa\xf1\
+\xa7\xfa\x4e\x40\x44\xbe\xe3\x1b\x83\x7a\xc3\x04\x20\x1f\x16\x8d\
+\x80\x4f\x00\x30\xd6\xe7\x73\x05\x06\x27\x76\x19\x35\x20\x65\x4e\
+\x55\x2d\x2e\x04\xca\x34\x01\x80\xcd\xfa\xbf\x36\x1a\x8d\x5c\x2a\
+\x00\x22\xb2\xdb\x37\x86\xaa\x7a\xf7\xac\x2c\x88\x65\xb1\x03\xa0\
+\x10\x09\x80\x73\xce\xea\xef\xb0\xaf\x4f\xf1\x41\x10\x54\x01\x78\
+\xdf\xaa\x08\x80\x0d\x80\x19\x63\x02\x90\x0f\x8b\x04\xe0\xa4\x4a\
+\xa5\x72\x76\x3f\x4f\x0c\x82\xe0\x34\x00\x9b\x7c\x27\x50\x2a\x95\
+\x86\x71\x07\x80\x55\x05\xc0\xfb\xe7\xd7\x23\x8b\xf5\xff\x43\x38\
+\xba\x25\x2f\x73\x22\xb2\xcb\x20\xcc\x16\x83\x18\x00\x00\x11\xf1\
+\x5e\x02\x48\xd3\x34\xd7\x2d\x80\xc7\x6c\xda\xb4\xe9\x16\x00\x87\
+\x0d\x42\xf5\xb5\x0c\xe0\x9c\xbb\xd4\x60\x6c\x00\x60\x05\x20\x63\
+\x4c\x00\x72\x20\x22\x26\x27\x5d\x89\x48\xbf\xdb\x6e\xbc\xcb\x75\
+\x00\x8e\x74\x5e\x78\x86\x8e\x45\x05\x00\x06\x1d\xcf\x3d\x1a\xe6\
+\x1d\x00\x68\xb5\x5a\x16\x09\x40\x60\xb1\x5f\xbd\x53\xea\xf6\xde\
+\xc5\x51\x94\x0a\x40\xa7\xaf\x28\xb7\x3e\x00\x55\xb5\x48\x00\x1e\
+\xa8\x54\x2a\xbc\x02\x38\x63\x4c\x00\x72\xd0\xb9\x3c\xc4\xfb\x2e\
+\xef\x7e\x13\x00\x11\xb1\x48\x00\x6e\xe9\xbc\xf0\x0c\x1d\xe7\xdc\
+\xd0\x55\x00\x54\xd5\xa2\x02\x90\x57\x03\xa0\x55\x05\x40\xe6\xe6\
+\xe6\xbc\x2f\xc2\x72\xce\x59\xdc\xa8\xa9\x79\xdd\x02\xb8\x04\x8b\
+\x4f\xcf\xe7\xf6\x99\x60\xfd\x9c\xc1\xd8\xdf\x1f\xd6\xd7\x93\x61\
+\xc6\x04\x20\x3f\x16\xe5\xf3\xbe\x12\x00\x55\xf5\xde\xb2\x23\x22\
+\x43\x59\xfe\x07\x80\x76\xbb\x3d\x74\x3d\x00\x22\x32\xd4\x15\x80\
+\x46\xa3\x71\x3f\x00\xef\x1d\x23\xed\x76\xdb\x7b\x19\xa0\xdd\x6e\
+\x5b\x24\x00\xf7\xc4\x71\x9c\x5b\x42\xb5\x08\x8b\xf5\xf3\x55\x8d\
+\x46\xa3\xa7\xe6\xe2\xa9\xa9\xa9\x53\x00\x9c\xe6\x3b\xb0\xaa\x7e\
+\xd3\x37\x06\xf5\x8e\x09\x40\x4e\x54\xd5\xe2\xc0\x8b\x47\x55\xab\
+\xd5\xa0\x97\x27\x6c\xd9\xb2\x65\x93\x88\x3c\xda\x77\xe0\x61\x6d\
+\x00\x04\x80\xf5\xeb\xd7\x5b\x5c\x09\xbc\x66\xeb\xd6\xad\xde\x37\
+\x29\x76\xcb\xa8\x02\x90\x5b\x02\x00\x00\x22\xe2\x5d\xf5\x52\x55\
+\xef\x04\x40\x44\xbc\x13\x00\x11\xf9\xb1\x6f\x0c\x63\x26\xeb\xe7\
+\xaa\xda\xd3\x32\x40\xb3\xd9\xb4\xf8\xf4\x8f\x52\xa9\x74\xad\x45\
+\x1c\xea\x0d\x13\x80\x9c\x94\x4a\xa5\x1b\x0d\xc2\x48\xbb\xdd\x7e\
+\x7a\x2f\x4f\x68\xb5\x5a\x17\xc2\xe0\x04\xb4\x34\x4d\x2d\xe6\x9f\
+\x8b\x3b\xef\xbc\xf3\x08\x0c\xca\xe1\x07\x0e\x1c\xc8\xb2\x0a\x30\
+\xd4\x15\x00\x00\x50\x55\xef\x65\x00\xe7\x9c\x45\x02\xe0\x7d\x9b\
+\xa6\xaa\x16\x2a\x01\xe8\xdc\x34\x7a\xb7\x41\xa8\x9e\x12\x00\x11\
+\xb9\xcc\x60\xcc\x43\x27\x9f\x7c\x32\x77\x00\xe4\x80\x09\x40\x4e\
+\xda\xed\xf6\xf7\x60\x70\x84\xa7\x88\xf4\xd4\x80\xa3\xaa\x3d\x25\
+\x0c\x4b\xa8\x35\x1a\x8d\x42\x74\x40\x7b\xf0\xae\x02\x94\x4a\xa5\
+\x2c\x13\x80\xa1\xee\x01\xe8\xf0\x4e\x00\x2c\x2a\x00\xaa\xea\x5d\
+\x01\x28\x5a\x02\xd0\x61\xf1\x26\x7a\x31\xba\xff\x80\x50\x02\xf0\
+\xf3\x06\x63\x7e\xab\x93\x94\x53\xc6\x98\x00\xe4\xa4\x73\x84\xe7\
+\x8f\x7c\xe3\x88\x48\xaf\x25\xb8\x67\xfa\x8e\xa9\xaa\xd7\x01\x50\
+\xdf\x38\x39\xb3\xb8\x12\x38\xcb\x46\xc0\xa1\x4f\x00\x2c\x1a\x01\
+\x55\x75\xda\xe7\xf9\x51\x14\x85\x00\x7a\x5a\x36\x5b\x8c\x73\xae\
+\x88\x09\x80\xc5\x32\x40\x10\x45\xd1\xe3\xba\x7a\x60\x10\x3c\x05\
+\x06\xdb\x89\x01\xb0\xfc\x9f\x13\x26\x00\x39\x12\x11\xef\xc6\x17\
+\x55\x7d\x74\xe7\x62\x9f\x65\x75\x0e\xec\xf0\xbd\xf5\x0b\x22\x72\
+\x9d\x6f\x8c\xbc\x59\xdc\x07\xe0\x9c\x1b\xb6\x0a\x40\xae\x4b\x00\
+\x69\x9a\x7a\x27\x00\x22\x72\xaa\xe7\xf3\x4d\x76\x00\xb4\xdb\xed\
+\xc2\x25\x00\xaa\x6a\xd2\x07\x90\xa6\x69\x57\x55\x45\x11\x79\x9e\
+\xc5\x78\x00\xbe\x6a\x14\x87\x7a\xc4\x04\x20\x47\x9d\x4f\xd2\xde\
+\xba\x3d\x88\x43\x44\x9e\x09\x9b\xf5\xff\xeb\x7c\x63\xe4\xcd\xe8\
+\x3e\x00\x56\x00\x7a\x60\xb4\x15\x70\xab\xcf\x93\xdb\xed\xb6\xf7\
+\xfa\x3f\x80\x7b\x3b\xbb\x1a\x0a\xa5\x5e\xaf\xff\x10\x80\xf7\xbc\
+\x7a\x58\x56\x7c\xae\xef\x58\x00\xee\x49\x92\xc4\xe2\x86\x54\xea\
+\x03\x13\x80\x1c\x8d\x8d\x8d\x7d\x13\x06\x27\xb3\xf5\xd0\x88\xe3\
+\x5d\xfe\x07\xb0\xbb\xd1\x68\x78\x5f\x66\x94\x37\xa3\x1b\x01\x87\
+\xad\x02\x90\x6b\x02\xe0\x9c\xb3\x48\x00\xaa\x3e\xbb\x2f\x44\xa4\
+\xaf\xd3\x33\x8f\x53\xb8\x4f\xff\x1d\x6d\x55\xfd\x86\x6f\x10\x11\
+\x79\x3a\x8e\xae\xef\x2f\x29\x0c\xc3\xd3\x00\x58\x54\x53\xbe\x64\
+\x10\x83\xfa\xc4\x04\x20\x47\xbb\x76\xed\xda\x03\x83\x3e\x00\x55\
+\x7d\x2e\x96\xf9\x83\xed\x7c\xff\x59\xbe\x63\x61\x44\xca\x75\x16\
+\x15\x00\xd8\xac\x7f\x76\x6b\xe8\x13\x00\xa3\xd3\x00\xe5\xc0\x81\
+\x03\x3e\xcb\x00\xa3\x9c\x00\xc0\x39\xe7\xbd\x9e\xae\xaa\x1b\xc3\
+\x30\x7c\xf2\x89\x1e\x23\x22\x2f\xf3\x1d\xa7\xe3\x8b\x46\x71\xa8\
+\x0f\x4c\x00\x72\xa6\xaa\xff\xc7\x20\x4c\x50\xad\x56\x2f\x3e\xd1\
+\x03\x2a\x95\xca\xd3\x60\x70\x9b\x9a\x88\x5c\xed\x1b\xa3\x08\x56\
+\x68\x05\x20\xd7\x1e\x80\x46\xa3\x11\x03\x68\xf9\xc6\x11\x91\x47\
+\xf6\xf9\xd4\x12\x6c\x7a\x60\x0a\x9b\x00\x88\x88\x49\x43\x9d\xaa\
+\x5e\xbe\xcc\x43\x7e\xd9\x60\x98\xfb\xd7\xad\x5b\x77\x9d\x41\x1c\
+\xea\x13\x13\x80\x9c\x89\xc8\x97\x2d\xe2\xa8\xea\x15\x27\xfa\x7e\
+\xa9\x54\x7a\x91\xc1\x30\xad\xc3\x87\x0f\x8f\x4a\x05\xc0\xe2\x34\
+\xc0\xa1\xaa\x00\xa8\x6a\xde\xdb\x00\xdb\x30\xd8\x0a\x28\x22\x5b\
+\xfb\x79\x5e\xb5\x5a\x3d\x13\xc0\x49\xbe\xe3\x17\x74\x0b\x20\x00\
+\xa0\x56\xab\xfd\x18\x36\xc7\x8c\x2f\x99\x00\x54\x2a\x95\xf3\x54\
+\xd5\xe2\x30\xb1\x2f\x73\xfb\x5f\xbe\x98\x00\xe4\x2c\x08\x82\x6f\
+\xc0\xa0\x71\x47\x55\x5f\x88\xa5\x1b\xfc\xdc\x72\x09\x42\x97\x6e\
+\xdc\xbf\x7f\xbf\x45\xe9\xbc\x08\xea\xbe\x01\x32\x3e\x0e\x78\xe8\
+\x97\x00\x00\x40\x55\xbd\x0f\xab\xe9\x37\x01\x50\xd5\x73\x7c\xc7\
+\x06\x80\x66\xb3\x59\xd8\x04\x00\x47\xb7\xe7\x7e\xcd\x20\xce\x39\
+\x4b\xed\x2e\x12\x11\x8b\x4f\xff\x70\xce\xfd\x93\x45\x1c\xea\x1f\
+\x13\x80\x9c\x75\x2e\xc0\xf8\x57\x83\x50\x5b\xc2\x30\x5c\xf4\x14\
+\xaf\x20\x08\x2e\x84\xc1\x55\xaa\x56\xd5\x8a\x22\x48\xd3\xb4\xe1\
+\x1b\x23\xe3\x0b\x81\x46\x22\x01\x70\xce\xfd\xd4\x37\x46\x9a\xa6\
+\x5b\xfb\x79\x9e\xaa\x5a\xac\xff\xef\xdc\xbb\x77\xef\x7e\x83\x38\
+\x83\x64\xb1\x0c\x20\x22\xf2\xc2\xe3\xbf\x38\x3d\x3d\x7d\x92\x88\
+\xfc\xa2\x41\xf0\xbd\x6b\xd7\xae\xfd\x8a\x6f\x1c\xf2\xc3\x04\xa0\
+\x00\x54\xd5\xaa\x13\xf6\x37\x16\xfb\xa2\x88\xbc\xda\x22\x78\xab\
+\xd5\xba\xca\x22\x4e\x11\x94\xcb\x65\xef\x04\x00\xc3\xd7\x04\x98\
+\x6b\x0f\x40\x87\x77\x05\xc0\x39\xb7\xad\xcf\xa7\x5a\x54\x00\x0a\
+\x7f\x65\x6d\x9a\xa6\xd7\xc2\xe0\xa0\x2e\x11\x79\xf9\xf1\x5f\x3b\
+\x72\xe4\xc8\xab\x60\x70\x90\x52\x9a\xa6\x57\xb1\xfc\x9f\x3f\x26\
+\x00\x05\x50\x2a\x95\xbe\x04\x83\xe6\x28\x00\x2f\xd9\xb2\x65\xcb\
+\x43\xde\x94\x3a\x97\x05\xbd\xd4\x20\xf6\x8f\xf6\xec\xd9\x73\xbb\
+\x41\x9c\x42\xb0\xa8\x00\xe0\x68\x02\xe0\x7d\xae\x42\x97\x46\xa1\
+\x07\x00\x30\x48\x00\x54\xf5\x4c\xf4\xf7\x73\xf7\x4e\x00\x44\xe4\
+\x26\xdf\x18\x83\xd6\x68\x34\x66\x01\xdc\x66\x10\xea\xc2\xce\x6d\
+\x7f\xc7\x8c\x89\xc8\x1f\x18\xc4\x65\xf9\xbf\x20\x98\x00\x14\x40\
+\xad\x56\xab\x8b\x88\x45\x73\xdd\xea\xf9\xf9\xf9\xd7\x2f\xfc\x82\
+\xaa\xbe\x1a\xc0\x84\x41\xec\x4f\x1b\xc4\x28\x8c\x24\x49\xf6\xc0\
+\xff\x53\xd2\xf8\xfa\xf5\xeb\x37\x58\xcc\xa7\x0b\x23\xb1\x04\x00\
+\xc0\x7b\x09\x00\xc0\xc9\x93\x93\x93\x3d\x1d\x09\x1c\x45\xd1\xa3\
+\x00\x84\xbe\x03\xa7\x69\x5a\xf8\x04\xa0\xc3\x62\xb7\x8e\x34\x9b\
+\xcd\x07\xab\x00\x41\x10\xfc\x22\x00\xaf\x93\x18\x3b\xee\x8e\xe3\
+\xd8\x62\xf7\x13\x79\x62\x02\x50\x10\xaa\xfa\x09\x8b\x38\x22\xf2\
+\xbb\x95\x4a\x65\x33\x00\x4c\x4d\x4d\xad\x56\xd5\xd7\x5a\xc4\x6d\
+\xb7\xdb\x23\x95\x00\xe0\x68\xc5\xc5\xbb\xa1\x71\x6c\x6c\xcc\xfb\
+\x4d\xa5\x0b\x65\x00\xde\x57\x0f\xab\x6a\xee\x4b\x00\xa5\x52\xe9\
+\x4e\x8b\x38\x63\x63\x63\x67\xf6\xf2\x78\x55\x7d\x8a\xc5\xb8\xaa\
+\x5a\xf8\x25\x80\x0e\xab\xe5\xba\xd7\x02\x18\xab\x54\x2a\x6b\x45\
+\xe4\x1d\x16\x01\x55\xf5\x83\x30\x38\x00\x8d\xfc\x31\x01\x28\x08\
+\x11\xf9\x1c\x6c\x3e\xa1\xad\x73\xce\xbd\x17\x80\xb4\x5a\xad\x37\
+\x02\xe8\xea\x9e\x80\x13\x11\x91\xef\x8f\x52\xf9\x7f\x01\xef\x65\
+\x00\x11\xf1\x5e\x0f\x5d\xce\xc6\x8d\x1b\x2d\xae\x02\x46\xbb\xdd\
+\xce\xbd\x02\x30\x3b\x3b\xdb\x80\xc1\xcf\x3d\x4d\xd3\x5e\xb7\xa1\
+\x59\x24\x00\xbb\x1b\x8d\xc6\x6e\x83\x38\x03\x97\x24\xc9\x0d\xb0\
+\xd9\x0e\xf8\x88\x30\x0c\x5f\xe2\x9c\xfb\x1b\x00\x5e\x17\x31\x75\
+\x1c\x29\x95\x4a\x7f\x67\x10\x87\x0c\x30\x01\x28\x88\x38\x8e\x0f\
+\xc2\x2e\x6b\x7f\x51\x18\x86\x1f\x05\xf0\x56\x8b\x60\xaa\xfa\x11\
+\x8b\x38\x05\x64\x91\x00\x0c\xbc\x02\xe0\x9c\xb3\x28\xff\x63\xdf\
+\xbe\x7d\xb9\x27\x00\x1d\xde\xeb\xd3\x22\x92\x47\x02\x70\xa3\x41\
+\x8c\xac\xa4\x00\x3e\x6b\x14\xeb\xfd\x00\x7e\xcd\x28\xd6\x67\x6a\
+\xb5\x9a\xf7\x16\x5c\xb2\xc1\x04\xa0\x40\x9c\x73\xef\x33\x0c\xf7\
+\xab\xb0\x59\xfb\x3f\xd4\x6c\x36\x4d\x96\x27\x0a\xc8\xe2\x85\x68\
+\xe0\x15\x00\x11\xb1\x48\x00\xe6\x01\x34\x0d\xe2\x58\xb0\x68\x50\
+\xeb\x7a\x09\x20\x8a\xa2\x35\x00\x1e\x6f\x30\xa6\xc9\x6d\x7b\x19\
+\xb2\xfa\xbb\x5d\x6f\x14\x07\xce\xb9\xf7\x58\xc5\x22\x7f\x4c\x00\
+\x0a\xa4\x56\xab\xfd\x3b\x80\x1b\xf2\x9e\xc7\x71\x3e\x3d\x04\xfb\
+\x9e\xfb\xa2\xaa\x16\x3b\x01\xb2\xe8\x01\x18\x95\x2d\x80\x00\x00\
+\x11\xb1\x58\x4e\x7a\x4c\x0f\xe3\x3d\x09\x47\xfb\x28\xbc\x58\x5d\
+\xb7\x9b\x95\x24\x49\xbe\x0d\xa0\x48\x17\x77\x5d\x5d\xab\xd5\xbe\
+\x9b\xf7\x24\xe8\x3f\x31\x01\x28\x18\x11\xf9\x9b\xbc\xe7\xb0\x90\
+\x73\xee\xfd\x79\xcf\x61\x50\x9c\x73\x43\xb1\x04\x80\xd1\xd9\x02\
+\x08\x00\x48\xd3\xd4\xa2\x02\xb0\x25\x0c\xc3\xae\xee\xb6\x68\xb7\
+\xdb\x16\xe5\xff\xe6\xc4\xc4\xc4\xf7\x0c\xe2\x64\x4a\x55\x3f\x9a\
+\xf7\x1c\x16\x30\x69\x22\x24\x3b\x4c\x00\x0a\x26\x8e\xe3\xff\x0d\
+\x60\x67\xde\xf3\xe8\xb8\x76\x94\x33\x76\x55\xf5\x5e\x02\x48\xd3\
+\x74\xe0\x4b\x00\x30\x48\x00\x9c\x73\x85\x49\x00\xda\xed\xf6\x0e\
+\x8b\x38\x9d\x4f\xf6\xdd\x3c\xae\xdb\xfb\xed\x97\xa4\xaa\x3f\x98\
+\x99\x99\x79\xc0\x37\x4e\xd6\x54\xf5\x1f\x50\x8c\xa5\x9f\xaf\x75\
+\x2a\x12\x54\x20\x4c\x00\x8a\xa7\x09\xe0\x8f\xf3\x9e\x04\x00\x88\
+\xc8\x9f\xe5\x3d\x87\x41\x1a\x96\x25\x80\x52\xa9\x34\x2a\x67\x00\
+\x00\x00\xe6\xe6\xe6\xee\x85\x41\xff\x85\xaa\x9e\xb7\xdc\x63\xa6\
+\xa6\xa6\x56\x03\xb8\xc8\x77\x2c\x11\xf9\x37\xdf\x18\x79\xe8\x1c\
+\x0a\xf4\xcf\x39\x4f\xa3\xad\xaa\x6f\xcc\x79\x0e\xb4\x08\x26\x00\
+\x05\x94\x24\xc9\x3f\x02\xb8\x25\xe7\x69\xdc\x10\xc7\xf1\xd7\x73\
+\x9e\xc3\x40\x59\x24\x00\x5c\x02\xe8\x9b\xf7\x81\x3a\xdd\x54\x00\
+\x9a\xcd\xe6\x25\x30\x38\x43\x21\x4d\x53\x8b\x0b\x76\xf2\xf2\xee\
+\x9c\xc7\xff\x60\xbd\x5e\x1f\x96\xf3\x13\x56\x14\x26\x00\xc5\x94\
+\xaa\xea\x5b\x72\x1c\x5f\x01\x98\x1c\xf9\x59\x64\xe5\x72\x39\x31\
+\x08\x33\x14\x4b\x00\xaa\x7a\x9f\xc5\x44\xac\x58\x1c\xa9\xab\xaa\
+\xcb\x26\x00\xce\xb9\x67\xfb\x8e\x83\xa3\x55\xb9\x6f\x1a\xc4\xc9\
+\x45\x92\x24\xb7\x00\xb8\x26\xa7\xe1\xf7\x8c\x8f\x8f\xbf\x3d\xa7\
+\xb1\x69\x19\x4c\x00\x0a\xaa\x5e\xaf\x7f\x05\x40\x5e\xe7\x65\xff\
+\x53\x92\x24\xd7\xe7\x34\x76\x66\x9c\x73\xb1\x41\x98\x4d\x00\x4a\
+\x06\x71\x4e\xc4\x3b\x01\x10\x91\x42\xed\xe4\x48\xd3\xd4\xe2\x13\
+\x61\x50\xad\x56\xb7\x9e\xe8\x01\xaa\x6a\x91\x00\xdc\xd8\x68\x34\
+\xbc\xaf\xec\xce\x93\xaa\xbe\x15\xf9\x9c\xbe\xf7\xfa\x99\x99\x99\
+\xb9\x1c\xc6\xa5\x2e\x30\x01\x28\xb0\x23\x47\x8e\xbc\x16\xc0\xae\
+\x8c\x87\x3d\xd0\x6a\xb5\xde\x9c\xf1\x98\xb9\x58\xbd\x7a\x75\x0c\
+\xff\xfb\x00\x4a\xd5\x6a\x75\xd2\x62\x3e\x27\x60\xd1\x03\x50\xa8\
+\x04\xc0\x39\xf7\x7d\x8b\x38\xaa\x7a\xc1\x52\xdf\x0b\xc3\xf0\x34\
+\x00\xa7\x1b\x0c\x33\xcc\xe5\x7f\x00\x40\xa7\x04\xff\xf1\x8c\x87\
+\xfd\x68\x92\x24\x57\x66\x3c\x26\xf5\x80\x09\x40\x81\xed\xdf\xbf\
+\x7f\x2f\x80\x57\xc2\xe0\x6a\xcf\x6e\xa9\xea\xeb\xe6\xe6\xe6\x66\
+\xb2\x1a\x2f\x4f\x9d\xeb\x48\x2d\xde\x18\x07\xdd\x07\x30\x72\x15\
+\x80\x38\x8e\xef\x06\xe0\x7d\xac\x6e\x9a\xa6\xcf\x58\xea\x7b\x22\
+\xf2\x5c\xdf\xf8\x1d\x16\x17\x75\xe5\x2e\x4d\xd3\xb7\x89\x88\xf7\
+\xfd\x17\xdd\x50\xd5\xdb\x44\xe4\x77\xb2\x18\x8b\xfa\xc7\x04\xa0\
+\xe0\x92\x24\xf9\x2a\x80\xac\x3a\x68\x3f\x51\xaf\xd7\x3f\x9a\xd1\
+\x58\x85\x20\x22\x35\x83\x30\x03\x4d\x00\x54\xd5\xfb\x24\xb6\x34\
+\x4d\x0b\xd5\x03\x00\x00\xaa\xfa\x0d\xdf\x18\x22\xf2\xcc\xa5\xbe\
+\x97\xa6\xe9\x2f\xf9\xc6\x07\x10\x77\xce\xd5\x1f\x7a\x9d\x1d\x01\
+\xaf\xc9\x60\xa8\x7a\x9a\xa6\x57\x74\x8e\x37\xa7\x02\x63\x02\x30\
+\x04\x92\x24\x79\x37\x80\xbf\x18\xf0\x30\xb7\xb4\x5a\xad\x2c\x5e\
+\x1c\x8a\xc6\xbb\x0f\xa0\xdd\x6e\x0f\xb4\x11\x50\x55\xbd\xaf\x1c\
+\x2e\x5a\x05\x00\x00\x44\xc4\x3b\x01\x00\x70\x4a\x14\x45\x67\x1d\
+\xff\xc5\x4a\xa5\x72\x66\xb7\xe7\x04\x2c\xe3\x0b\x18\xa1\x9b\xeb\
+\xe2\x38\xfe\x24\x80\x8f\x0e\x70\x88\x7d\xaa\xfa\xac\x11\xbd\x3c\
+\x6c\xe4\x30\x01\x18\x12\x49\x92\xbc\x45\x44\xde\x3b\xa0\xf0\x77\
+\x88\xc8\xb3\xe6\xe6\xe6\x0a\xf7\x29\x31\x03\x16\x8d\x80\x03\xad\
+\x00\x88\x88\x77\x02\x00\xa0\x70\xff\xb6\xed\x76\xfb\x3a\x8b\x38\
+\x69\x9a\xbe\xf4\xf8\xaf\x89\xc8\x6f\x59\xc4\x56\xd5\xcf\x59\xc4\
+\x29\x92\x20\x08\xfe\x2b\x06\xb0\xac\xd1\x59\x5e\xb8\xbc\x5e\xaf\
+\xff\xc0\x3a\x36\x0d\x06\x13\x80\xe1\xa1\x71\x1c\xff\xae\xaa\xbe\
+\x0a\xc0\x61\xc3\xb8\x3f\x6a\xb5\x5a\xcf\x88\xe3\xd8\x62\x4b\xdc\
+\x30\xf2\x5e\x02\xc8\xe0\x2c\x80\x91\xac\x00\xec\xd9\xb3\xe7\x0e\
+\xd8\xfc\xfc\x5f\x86\x05\xaf\x65\x93\x93\x93\xeb\x44\xe4\x95\xbe\
+\x71\x01\xdc\xb7\x7e\xfd\xfa\xa1\x6f\x00\x3c\xde\x8e\x1d\x3b\xe6\
+\x45\xe4\x0a\xd8\x6e\x6d\xbc\x09\xc0\xb9\x49\x92\x0c\xd5\x7d\x09\
+\x2b\x1d\x13\x80\x21\x53\xaf\xd7\xff\x2e\x4d\xd3\x8b\x00\x58\x1c\
+\xa7\xfa\xb1\x72\xb9\x7c\xc1\x4a\x69\xfa\x5b\x82\x77\x05\x40\x55\
+\xa7\x2c\x26\x72\x82\xf8\xde\x09\x40\x9a\xa6\x85\x4b\x00\x00\xa8\
+\x88\x5c\x6d\x10\xe7\xb4\x28\x8a\x2e\x3f\xf6\x1f\xe5\x72\xf9\x0d\
+\x00\xd6\x19\xc4\xfd\x42\xa7\x51\x74\xe4\xc4\x71\x7c\x30\x49\x92\
+\x67\x18\xdc\x3d\xd2\x12\x91\xf7\xad\x5e\xbd\xfa\xa9\x71\x1c\xff\
+\xd4\x64\x72\x94\x19\x26\x00\x43\xa8\xd1\x68\x7c\x2f\x49\x92\x73\
+\x70\xb4\xa1\xe7\xae\x3e\x42\xdc\x22\x22\xcf\x4b\x92\xe4\xd7\x66\
+\x67\x67\x0f\x19\x4f\x6f\xd8\x78\x27\x00\x22\x32\xd0\x04\xc0\x62\
+\x09\xa0\x88\x15\x80\x0e\x93\x12\xbb\xaa\xbe\x19\x80\x74\xb6\xfe\
+\xbd\xc9\x22\xa6\x73\xee\xef\x2c\xe2\x14\x58\x33\x8e\xe3\xdf\x53\
+\xd5\xcb\x01\xf4\x5a\xb6\x57\x55\xfd\x64\x9a\xa6\xdb\xe3\x38\x7e\
+\xdd\xce\x9d\x3b\x2d\xab\x92\x94\x11\xc9\x7b\x02\xe4\xad\x54\xad\
+\x56\x2f\x56\xd5\x2b\x54\xf5\x12\x1c\xbd\x26\x75\xb1\x83\x69\x66\
+\x55\xf5\x6a\xe7\xdc\xe7\xe3\x38\xfe\x12\x32\xdc\x5a\x58\x64\x51\
+\x14\x3d\x57\x55\xbf\xe8\x19\xe6\x87\x49\x92\x9c\x6d\x32\xa1\x87\
+\x2b\x87\x61\x38\x0f\xcf\xbf\xd5\x52\xa9\xb4\x75\xf7\xee\xdd\xf7\
+\x18\xcd\xc9\xcc\xf4\xf4\xf4\x49\xf3\xf3\xf3\x75\x00\x6b\x0c\xc2\
+\xbd\x49\x55\x7f\x5d\x44\xba\xbe\x2a\xf8\x04\xee\x4a\x92\xe4\x74\
+\xac\x9c\xbf\x13\x89\xa2\xe8\x79\x00\x5e\xa0\xaa\x3f\x0f\xa0\xba\
+\xc8\x63\x8e\x00\xf8\x2e\x80\xaf\xaa\xea\x3f\xd7\xeb\xf5\x9f\x64\
+\x3a\x43\x32\xc7\x04\x60\xc4\x6c\xdf\xbe\x7d\x3c\x8e\xe3\x47\x02\
+\x58\x0b\x60\x4d\xb9\x5c\xae\x97\xcb\xe5\x1a\x4f\xe3\x5a\x5c\xa5\
+\x52\x39\xcf\x39\xe7\x7b\xe3\xe1\x9e\x24\x49\x2a\x26\x13\x3a\xce\
+\x96\x2d\x5b\x36\x35\x9b\x4d\xef\x3b\x0b\xe6\xe7\xe7\x37\xee\xdb\
+\xb7\x6f\x9f\xc5\x9c\xac\x85\x61\xf8\x19\x00\x57\xe4\x3d\x8f\x85\
+\x44\xe4\x0f\xe3\x38\xfe\xd3\xbc\xe7\x91\x97\xa9\xa9\xa9\x4a\x9a\
+\xa6\x21\x80\xb0\xd5\x6a\x1d\x28\x95\x4a\x7b\xe2\x38\xfe\x19\x80\
+\x76\xde\x73\x23\x3b\x4c\x00\x68\x45\x9b\x9c\x9c\x7c\x44\xb9\x5c\
+\xfe\x99\x67\x18\x5d\xbd\x7a\xf5\xea\x41\x94\x41\x3b\x25\xed\x3b\
+\x3d\xc3\x68\x92\x24\x65\x14\x74\x3b\x5b\x14\x45\x2f\x57\xd5\x4f\
+\xe4\x3d\x8f\x05\x9a\xed\x76\xfb\x91\x7b\xf6\xec\xc9\xfa\x14\x4e\
+\xa2\x4c\xb1\x07\x80\x56\xb4\xc9\xc9\xc9\x04\xfe\x65\x5e\x79\xe0\
+\x81\x07\x06\xd2\x07\x90\xa6\xa9\xc5\x16\xc0\xfb\x51\xd0\x37\x7f\
+\x00\x58\xbb\x76\xed\x55\x00\x2c\xae\x66\xb6\xf2\x8f\x7c\xf3\xa7\
+\x95\x80\x09\x00\xad\x68\x9d\x2e\xef\x3d\xbe\x71\xd2\x34\xdd\x62\
+\x30\x9d\x87\x71\xce\x79\xdf\x33\xa0\xaa\x45\x6d\x00\x04\xf0\xe0\
+\xbf\xc1\xdf\xe7\x3d\x8f\x8e\x76\x9a\xa6\xef\xcc\x7b\x12\x44\x59\
+\x60\x02\x40\x04\x78\x6f\x83\x74\xce\x0d\xa4\x02\x30\xaa\xa7\x00\
+\x1e\x4f\x44\x3e\x80\x02\x54\x29\x54\xf5\xd3\x8d\x46\xe3\x8e\xbc\
+\xe7\x41\x94\x05\x26\x00\xb4\xe2\x89\x88\x77\xb9\x57\x55\x07\x55\
+\x01\xf0\xbe\x07\x00\x05\xbb\x09\x70\x31\x71\x1c\xdf\x6d\x74\x26\
+\x80\x8f\xb6\x73\xee\x7f\xe4\x3c\x07\xa2\xcc\x30\x01\xa0\x15\x4f\
+\x55\x2d\xd6\x7b\x07\x55\x01\xd8\xe8\x1b\x63\x18\x2a\x00\x00\xa0\
+\xaa\x6f\x43\x8e\x55\x00\x55\x7d\x6f\x1c\xc7\xb7\xe6\x35\x3e\x51\
+\xd6\x98\x00\x10\x01\x85\xad\x00\x8c\xea\x4d\x80\x8b\x49\x92\xe4\
+\x87\x00\xf2\xda\x0d\x30\xa3\xaa\x7f\x9c\xd3\xd8\x44\xb9\x60\x02\
+\x40\x2b\x9e\xc5\x12\x80\x88\x0c\x24\x01\xb0\xb8\x67\x60\x58\x2a\
+\x00\x00\xe0\x9c\xfb\x23\x1c\x3d\x70\x26\x6b\xbf\xdb\x68\x34\xee\
+\xcf\x61\x5c\xa2\xdc\x30\x01\xa0\x15\x4f\x55\x2d\xee\x42\x18\xd4\
+\x71\xc0\x16\x07\x0c\x0d\x4d\x02\x50\xab\xd5\x76\x02\xf8\xa3\x8c\
+\x87\xfd\x50\x92\x24\x9f\xcd\x78\x4c\xa2\xdc\x31\x01\xa0\x15\xcf\
+\xa2\x02\x00\x60\x0b\x06\x73\xb0\x56\x64\x10\xc3\x7b\x9b\x63\x96\
+\x92\x24\x79\x97\xc1\xf1\xcc\xdd\xba\x7e\xdd\xba\x75\xaf\xcb\x68\
+\x2c\xa2\x42\x61\x02\x40\x2b\xde\xe1\xc3\x87\x2d\x12\x80\x55\x5b\
+\xb6\x6c\xf1\xde\xb3\xbf\x08\xef\x0a\x80\xaa\x16\xe9\x90\x9d\x6e\
+\x68\xa9\x54\x7a\x15\x80\xd9\x01\x8f\x73\x8f\x88\x5c\x31\xaa\x37\
+\xfe\x11\x2d\x87\x09\x00\xad\x78\xfb\xf7\xef\xdf\x0b\xe0\xa0\x6f\
+\x9c\x56\xab\x35\x88\x65\x00\xef\x1e\x00\xe7\x5c\x62\x31\x91\x2c\
+\xd5\x6a\xb5\xba\x88\x3c\x1b\x83\xab\x5e\xdc\xa3\xaa\xcf\x88\xe3\
+\x78\xe8\x7e\x36\x44\x56\x98\x00\x10\x1d\xe5\xfd\x69\x73\x00\xa7\
+\x01\x8e\x01\xf0\xde\x05\xa0\xaa\x43\xb5\x04\x70\x4c\x1c\xc7\x3f\
+\x02\x70\x19\x0c\x0e\x6a\x3a\xce\x0d\x69\x9a\x5e\x58\xaf\xd7\x7d\
+\xef\x58\x20\x1a\x6a\x4c\x00\x88\x60\x73\x16\x80\x73\xce\x34\x01\
+\xa8\x54\x2a\x01\x0c\xfa\x0a\x54\xb5\x6e\x30\x9d\x5c\x24\x49\x72\
+\x4b\x9a\xa6\xe7\x03\xf8\xaa\x41\xb8\x96\x88\xbc\x73\xdd\xba\x75\
+\x97\x34\x1a\x8d\x41\x2f\x2f\x10\x15\x1e\x13\x00\x22\x00\x22\xe2\
+\x7b\x23\x20\xd2\x34\xdd\x6a\x30\x95\x07\x39\xe7\x02\x8b\x38\xad\
+\x56\x6b\x68\x13\x00\x00\x68\x34\x1a\xbb\x93\x24\x79\x36\x80\x5f\
+\x01\xf0\xd3\x3e\x42\x28\x80\xcf\x89\xc8\x13\xe2\x38\x7e\x2b\xd7\
+\xfc\x89\x8e\x2a\xe7\x3d\x01\xa2\x82\xe8\xe7\x8d\xe5\x21\x44\x64\
+\xab\xff\x34\x1e\x12\x2f\x50\xf5\xbd\xa8\x10\xf3\x7b\xf7\xee\x1d\
+\x8a\x83\x80\x96\xa1\x49\x92\x5c\x09\xe0\x9f\xa2\x28\xba\x5c\x55\
+\x5f\x0a\xe0\x99\x58\xba\x47\xa2\x05\xe0\xdf\x01\x5c\x23\x22\x1f\
+\x8f\xe3\xd8\xfb\xdf\x97\x68\xd4\x30\x01\x20\x02\xa0\xaa\x3f\x15\
+\xf1\xae\xb6\x6f\x35\x98\xca\x42\xde\x0d\x80\x38\x7a\xcd\xae\x77\
+\x16\x51\x20\xed\x38\x8e\xbf\x08\xe0\x8b\x00\x10\x04\x41\x15\xc0\
+\x36\x00\x6b\x9d\x73\xe3\x00\x0e\xb6\x5a\xad\x99\x3d\x7b\xf6\xdc\
+\x05\xa0\x99\xe3\x3c\x89\x0a\x8f\x09\x00\x11\x00\x55\xdd\xe9\x9b\
+\x00\xa8\xea\xa9\x46\xd3\x39\xc6\x22\x01\x18\xea\xf2\xff\x72\xea\
+\xf5\x7a\x0d\x40\x2d\xef\x79\x10\x0d\x23\xf6\x00\x10\x01\x18\x1f\
+\x1f\xb7\x58\x02\x98\xda\xbe\x7d\xfb\xb8\xc5\x7c\x00\x20\x4d\x53\
+\x8b\x53\x00\x47\x3a\x01\x20\xa2\xfe\x31\x01\x20\x02\x30\x3b\x3b\
+\xbb\x0b\xc0\xbc\x67\x98\x52\xbd\x5e\x7f\x84\xc5\x7c\x00\x9b\x7b\
+\x00\x30\xf8\xc3\x74\x88\x68\x48\x31\x01\x20\x3a\xaa\x0d\xe0\x5e\
+\xdf\x20\xc6\x8d\x80\x16\x17\x01\x59\x9c\x72\x48\x44\x23\x88\x09\
+\x00\xd1\x7f\xb2\xe8\x14\xdf\x6a\x10\xe3\x18\xef\x7b\x00\xd2\x34\
+\xdd\x6d\x31\x11\x22\x1a\x3d\x4c\x00\x88\x3a\x54\x75\xa7\x41\x98\
+\xd3\x0c\x62\x1c\xe3\xdd\x54\xc8\x0a\x00\x11\x2d\x85\x09\x00\x51\
+\x87\x73\xce\xbb\x02\xa0\xaa\xa7\x5b\xcc\xa5\xd3\x4c\xe8\x5d\x01\
+\x10\x11\xf6\x00\x10\xd1\xa2\x98\x00\x10\xfd\x27\x8b\x25\x00\x93\
+\x04\xa0\xd3\x4c\xe8\xfd\xf7\xd9\x6c\x36\x59\x01\x20\xa2\x45\x31\
+\x01\x20\xea\x10\x91\xbb\x0c\xc2\x6c\x83\xc1\xf9\xfd\xce\x39\x8b\
+\xdd\x04\xe9\xdc\xdc\x1c\xf7\xc8\x13\xd1\xa2\x98\x00\x10\x75\xcc\
+\xcf\xcf\xdf\x6e\x10\x66\x4d\xa5\x52\xd9\xec\x1b\xa4\xdd\x6e\x5b\
+\x1c\x2a\x54\x07\x4f\xc3\x23\xa2\x25\x30\x01\x20\xea\x98\x9b\x9b\
+\xbb\x0f\x06\xfb\xe6\xcb\xe5\xf2\x19\xbe\x31\x8c\x2a\x00\x5c\xff\
+\x27\xa2\x25\x31\x01\x20\x5a\x40\x55\xef\x30\x88\xe1\xdd\x07\xa0\
+\xaa\xa7\xf8\xc6\x00\x70\xb7\x41\x0c\x22\x1a\x51\x4c\x00\x88\x16\
+\x10\x91\xdb\x7c\x63\xa8\xaa\x77\x05\x00\x80\x45\x05\x80\x37\xe0\
+\x11\xd1\x92\x98\x00\x10\x2d\x60\x51\x01\x10\x91\xc7\x1a\xcc\xc3\
+\xa2\x07\xc0\xa2\xa9\x91\x88\x46\x14\x13\x00\xa2\x05\x44\xc4\xbb\
+\x11\x50\x55\xb7\x1b\xcc\xc3\xa2\x02\xc0\x25\x00\x22\x5a\x12\x13\
+\x00\xa2\x05\xca\xe5\xb2\xc5\x4e\x80\x53\x26\x27\x27\xd7\xf5\xfb\
+\xe4\x2d\x5b\xb6\x6c\x02\x70\xb2\xef\x24\x54\x95\x09\x00\x11\x2d\
+\x89\x09\x00\xd1\x02\xb3\xb3\xb3\xf7\x02\x38\xe0\x19\x46\xc6\xc6\
+\xc6\x1e\xd3\xef\x93\xe7\xe7\xe7\x2d\x1a\x00\xdb\x61\x18\xfe\xcc\
+\x20\x0e\x11\x8d\x28\x26\x00\x44\x0f\xa5\x00\xfe\xc3\x20\xce\xe3\
+\xfa\x7d\xa2\x88\x58\xac\xff\xdf\xbb\x63\xc7\x0e\xdf\xeb\x8d\x89\
+\x68\x84\x31\x01\x20\x7a\xb8\x1d\xbe\x01\xd2\x34\xed\x3b\x01\x00\
+\x60\xb1\x8b\x80\xe5\x7f\x22\x3a\x21\x26\x00\x44\xc7\x11\x91\x9b\
+\x0c\x62\xf4\xdd\x08\x28\x22\x8f\xf6\x1d\x1f\x36\x55\x0c\x22\x1a\
+\x61\x4c\x00\x88\x8e\x93\xa6\xa9\x77\x02\x00\xe0\x5c\xf4\x79\x27\
+\x80\xaa\x5a\x24\x00\x3f\x32\x88\x41\x44\x23\x8c\x09\x00\xd1\xc3\
+\xdd\x04\x20\xf5\x8c\x31\x19\x45\xd1\x23\xfb\x7c\xee\x99\x9e\x63\
+\x43\x55\x99\x00\x10\xd1\x09\x31\x01\x20\x3a\x4e\xbd\x5e\x3f\x00\
+\xe0\x27\x06\xa1\x9e\xd4\xeb\x13\xc2\x30\x8c\x00\x4c\xfa\x0e\x3c\
+\x31\x31\xe1\xdd\xc7\x40\x44\xa3\x8d\x09\x00\xd1\xe2\xbc\x97\x01\
+\x54\xf5\xbc\x5e\x9f\xe3\x9c\xeb\x7b\xfb\xe0\x02\xbb\x66\x49\xef\
+\xb9\x54\x00\x00\x05\xe9\x49\x44\x41\x54\x66\x66\xe6\x0c\xe2\x10\
+\xd1\x08\x63\x02\x40\xb4\xb8\x5c\x12\x00\x55\x7d\x82\xef\xb8\xe0\
+\xfa\x3f\x11\x75\x81\x09\x00\xd1\x22\x8c\x76\x02\x9c\x8b\x1e\xff\
+\xc6\x8c\x12\x80\x5b\x0d\x62\x10\xd1\x88\x63\x02\x40\xb4\x88\x23\
+\x47\x8e\xdc\x84\xa3\x87\x02\xf9\x58\x1b\x86\xe1\x59\x3d\x3e\xc7\
+\x3b\x01\x50\x55\x26\x00\x44\xb4\x2c\x26\x00\x44\x8b\xd8\xb7\x6f\
+\xdf\x3e\x11\xb1\xb8\x19\xf0\xd2\x6e\x1f\x3b\x3d\x3d\x7d\x12\x00\
+\xef\x2d\x80\xa5\x52\xe9\xbb\xbe\x31\x88\x68\xf4\x31\x01\x20\x5a\
+\x82\xaa\x5e\x67\x10\xa3\xeb\x04\xa0\xd9\x6c\x3e\x1e\x40\xd9\x73\
+\xc8\xb9\x5a\xad\x76\x9b\x67\x0c\x22\x5a\x01\x98\x00\x10\x2d\x41\
+\x44\xbe\x69\x10\xe6\x62\x00\xa5\x6e\x1e\xa8\xaa\x4f\xf3\x1d\x4c\
+\x55\xbf\x0d\xff\xa5\x0b\x22\x5a\x01\x98\x00\x10\x2d\xa1\xdd\x6e\
+\x5f\x67\x10\x66\x43\xa5\x52\x39\xbb\x9b\x07\xaa\xea\x25\x06\xe3\
+\x5d\x6f\x10\x83\x88\x56\x00\x26\x00\x44\x4b\x68\x34\x1a\xbb\x01\
+\x58\xf4\x01\x3c\xb3\x8b\x87\x95\x44\xe4\x22\xdf\xb1\x00\x7c\xdb\
+\x20\x06\x11\xad\x00\x4c\x00\x88\x4e\xec\x1b\xbe\x01\x44\xe4\x8a\
+\xe5\x1e\x53\xad\x56\x9f\x08\x60\xbd\xe7\x50\xcd\xb1\xb1\xb1\xef\
+\x79\xc6\x20\xa2\x15\x82\x09\x00\xd1\x09\x88\xc8\x75\x06\x61\x9e\
+\xb4\x79\xf3\xe6\x53\x4f\xf4\x80\x76\xbb\x7d\x99\xc1\x38\xdf\x9f\
+\x9d\x9d\x3d\x64\x10\x87\x88\x56\x00\x26\x00\x44\x27\xd0\x6e\xb7\
+\xbf\x01\xff\xa6\x3a\x69\xb7\xdb\x2f\x3e\xd1\x03\x9c\x73\x27\xfc\
+\x7e\x37\x54\xf5\x6b\xbe\x31\x88\x68\xe5\x60\x02\x40\x74\x02\x8d\
+\x46\x63\xd6\xe2\x54\x40\x00\x4b\xbe\xc1\x87\x61\x78\x9a\xaa\x9e\
+\xeb\x3b\x40\xa9\x54\xfa\xbc\x6f\x0c\x22\x5a\x39\x98\x00\x10\x2d\
+\x23\x4d\xd3\xcf\x18\x84\xb9\x20\x08\x82\x73\x16\xfb\x86\x88\xbc\
+\xdc\x20\xfe\x6c\xad\x56\xe3\xfa\x3f\x11\x75\x8d\x09\x00\xd1\x32\
+\x54\xf5\x2a\x8b\x38\x22\xf2\x86\x45\xbe\x5c\x56\xd5\x57\x18\x84\
+\xff\x12\xb8\xff\x9f\x88\x7a\xc0\x04\x80\x68\x19\x8d\x46\xe3\x0e\
+\xd8\x5c\xb0\xf3\xb2\xe3\x9b\x01\x83\x20\xf8\x65\x00\xdb\x7c\x03\
+\xab\x2a\xcb\xff\x44\xd4\x13\x26\x00\x44\xdd\xb1\xa8\x02\x94\xdb\
+\xed\xf6\x5b\x16\xfc\xf7\x98\x88\xfc\x91\x41\xdc\x83\x6b\xd6\xac\
+\xf9\xba\x41\x1c\x22\x5a\x41\x98\x00\x10\x75\xc7\xa2\x0f\x00\x00\
+\x7e\x33\x08\x82\xa7\x01\x40\x10\x04\x7f\x0c\xe0\x51\xbe\x01\x45\
+\xe4\xcb\x3b\x77\xee\x3c\xec\x3d\x33\x22\x5a\x51\x24\xef\x09\x10\
+\x0d\x8b\x28\x8a\x6e\x53\x55\xef\xdb\xfa\x00\xc4\xaa\xfa\x61\x11\
+\x79\x1b\x0c\xfe\x06\x55\xf5\xf2\x7a\xbd\x7e\xb5\xc1\xbc\x88\x68\
+\x05\xe9\xea\x92\x12\x22\x02\xd6\xac\x59\xb3\x0a\xc0\xb3\x0c\x42\
+\x9d\x2c\x22\x17\xc3\x26\x01\xdf\x55\xaf\xd7\x5f\x07\x36\x00\x12\
+\x51\x8f\xb8\x04\x40\xd4\xa5\x72\xb9\xfc\x31\x00\x47\xf2\x9e\xc7\
+\x71\x3e\x04\xa0\x9d\xf7\x24\x88\x68\xf8\x30\x01\x20\xea\xd2\xec\
+\xec\x6c\x03\xc0\x27\xf3\x9e\xc7\x02\x87\x45\xe4\x7f\xe5\x3d\x09\
+\x22\x1a\x4e\x4c\x00\x88\x7a\x20\x22\x7f\x89\x82\x94\xdb\x55\xf5\
+\x1f\xe3\x38\x4e\xf2\x9e\x07\x11\x0d\x27\x26\x00\x44\x3d\x88\xe3\
+\xf8\x56\x55\xfd\x97\xbc\xe7\x01\xa0\xe9\x9c\xfb\xd3\xbc\x27\x41\
+\x44\xc3\x8b\x09\x00\x51\x8f\x44\xe4\xed\x00\xd2\x9c\xa7\xf1\xa1\
+\x38\x8e\xef\xce\x79\x0e\x44\x34\xc4\xb8\x0b\x80\xa8\x47\x07\x0f\
+\x1e\x8c\xd7\xac\x59\x73\x06\x80\xc7\xe7\x34\x85\xfd\xaa\xfa\x92\
+\x43\x87\x0e\x1d\xc8\x69\x7c\x22\x1a\x01\xac\x00\x10\xf5\xa1\x5c\
+\x2e\xbf\x0d\xc0\xfd\x79\x8c\xad\xaa\x7f\x58\xaf\xd7\x6b\x79\x8c\
+\x4d\x44\xa3\x83\x15\x00\xa2\x3e\xdc\x7f\xff\xfd\xfb\x57\xaf\x5e\
+\x7d\xbf\x88\x5c\x9e\xf1\xd0\xd7\xd7\xeb\xf5\xd7\xa2\x20\x8d\x88\
+\x44\x34\xbc\x98\x00\x10\xf5\xe9\xd0\xa1\x43\xdf\x5b\xb3\x66\xcd\
+\xd3\x60\x70\x9c\x6f\x97\xf6\xb4\x5a\xad\x67\x3e\xf0\xc0\x03\xfb\
+\x33\x1a\x8f\x88\x46\x18\x97\x00\x88\xfa\x97\x8a\xc8\x2f\x02\x98\
+\xc9\x60\xac\x26\x80\x5f\x9a\x9b\x9b\xbb\x37\x83\xb1\x88\x68\x05\
+\x60\x02\x40\xe4\x21\x8e\xe3\x24\x4d\xd3\x5f\x00\x30\xc8\x4f\xe5\
+\x0a\xe0\x55\x49\x92\x5c\x33\xc0\x31\x88\x68\x85\x61\x02\x40\xe4\
+\xa9\xd1\x68\xdc\x04\xe0\x39\x18\x4c\x53\x60\x53\x55\x5f\x95\x24\
+\xc9\xc7\x07\x10\x9b\x88\x56\x30\xde\x06\x48\x64\x24\x8a\xa2\xb3\
+\x54\xf5\x8b\x00\x4e\x35\x0a\xd9\x00\xf0\x8b\x49\x92\xfc\xab\x51\
+\x3c\x22\xa2\x07\xb1\x02\x40\x64\x24\x8e\xe3\x1f\x8d\x8d\x8d\x9d\
+\x0b\xe0\x4a\x83\x70\x9f\x03\xf0\x38\xbe\xf9\x13\xd1\xa0\xb0\x02\
+\x40\x34\x00\x95\x4a\xe5\xe9\xce\xb9\x3f\x04\xf0\xcc\x1e\x9e\x96\
+\x02\xf8\x2a\x80\x77\x24\x49\x72\xfd\x60\x66\x46\x44\x74\x14\x13\
+\x00\xa2\x01\x8a\xa2\xe8\x51\xaa\xfa\x22\x55\xbd\x48\x44\xce\x02\
+\xb0\x05\xc0\x58\xe7\xdb\x07\x01\xec\x52\xd5\x9b\x00\x7c\x5b\x55\
+\x3f\xd3\x68\x34\x66\x73\x9b\x2c\x11\x11\x11\x0d\xce\xf4\xf4\xf4\
+\x49\xf8\xcf\x24\x80\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xe8\x38\xff\x17\xb1\
+\x56\x10\x61\xa7\x27\xaf\xa3\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x61\xb2\
+\x00\
+\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00\x20\x00\x9c\x61\x00\
+\x00\x16\x00\x00\x00\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0d\x49\x48\x44\x52\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
+\x00\x00\x5c\x72\xa8\x66\x00\x00\x61\x63\x49\x44\x41\x54\x78\xda\
+\xed\xbd\x75\x9c\x1b\x57\x9a\xef\xfd\x3d\xa7\x24\x35\xbb\xbb\xcd\
+\xcc\x0c\xb1\xe3\x38\x4e\xe2\xf0\x04\x27\x34\xc1\x0d\x4d\x32\x61\
+\x8e\x93\xcc\xec\xee\x67\xf7\x9d\x7d\x3f\x77\xef\xdd\x77\xef\xee\
+\xdd\xbb\x33\x61\x66\x66\x26\x87\x26\xcc\x76\x62\x8a\x99\x99\xdb\
+\x6e\xbb\x51\x55\xe7\xbc\x7f\x9c\x92\x54\x92\x4a\x6a\x95\x63\x68\
+\xd9\xf5\xf8\x53\x56\x17\x88\xf5\xfc\xce\xf3\xfc\x1e\x12\xb2\xc7\
+\x38\x4d\x28\xa1\x84\xb2\x5f\x8a\x0c\x3f\x82\x50\x42\x09\x01\x20\
+\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\
+\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\
+\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\
+\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\
+\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\
+\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\
+\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\
+\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\
+\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\
+\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\
+\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\
+\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\
+\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\
+\x01\x20\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\
+\x42\x00\x08\x25\x94\x50\xf6\x23\x89\xec\xf7\x9f\x80\x0e\x74\x78\
+\xb7\x8b\x10\x7b\xf1\xa3\xd0\xec\x03\xb2\xf7\xde\x84\xd8\x9b\x5f\
+\x5e\x7b\x01\x00\x21\xc1\xf7\x63\x10\x69\x37\xbe\xe7\x7c\xcf\x8b\
+\x3c\xbb\x01\xce\xa5\x1d\xca\xf1\x3d\x89\x3c\xe7\xda\x54\x4e\x91\
+\xf7\xae\x39\x5e\x4b\xf6\x1b\xb0\x6d\x68\x69\xde\xf3\x3f\x62\xcb\
+\x12\x94\x96\x49\x0a\x7d\x17\x02\xd8\x99\x77\xbc\x6b\xaf\x15\x01\
+\xce\xec\xde\xe7\x17\x02\x1a\x9b\x9a\xb1\x6d\x67\xff\x06\x80\xca\
+\x4a\xa8\xaa\xd6\x48\xa1\x11\x16\x48\x99\x7b\x13\x99\xc7\xb2\xae\
+\xd7\xfe\xd7\x5a\xfe\xd7\xe4\xbe\x56\xb7\xfd\xdc\x19\x8f\x9d\x7d\
+\x5e\xfb\xbf\x87\xb6\x5e\x8b\x10\x08\x24\x60\x21\x84\x04\x24\x02\
+\xcb\x3d\x66\xfe\x46\x48\x04\x12\x29\x2d\xde\x7e\xad\x91\x57\x9f\
+\x6f\xdc\xa3\x3f\x02\xa5\x34\x03\x06\x96\xf2\x4f\x7f\x1e\x42\x75\
+\x87\x18\x5a\x1b\x20\x30\x2b\x9a\x44\x20\xdc\x1f\x7b\xe2\x6f\xf7\
+\xbc\xf7\xef\x02\xaf\x35\xd7\x79\x8f\x27\x40\x27\xf5\x77\xce\xe7\
+\xf0\xbb\x56\xa4\xce\x7b\x9f\x5f\x64\x1e\xcb\xf9\xfa\x76\xfe\x5a\
+\x84\x79\x7d\x96\x8c\xb0\x78\xd9\x2a\xfe\xe1\x7f\xdd\xc1\xba\x0d\
+\x9b\x8a\xca\x12\xd8\xe5\x00\xd0\xdc\x04\x35\x1d\x35\x65\xe5\x46\
+\x99\x2c\x09\x96\xe5\xfe\x9d\x50\x16\x4b\xa7\x8e\x49\xcf\xb9\xb4\
+\x7d\xed\xb9\x1e\xff\xeb\xa5\x4e\x7f\xec\xac\xf3\xe6\x71\xd2\xf7\
+\xfd\xae\xd7\xfe\xe7\xd3\xf6\xb5\xef\xf9\xf4\xc7\xca\x78\x3d\x52\
+\xa4\x7e\x38\x2e\x10\x18\xe5\xb7\x0c\x20\x24\x36\x61\xb6\xa6\x06\
+\xc9\xd3\x75\xdb\x29\x2d\xd3\x34\x37\xed\xb9\x1f\x51\xac\x44\xd0\
+\xdc\xd2\x4a\x45\x85\x64\xe2\xa1\x35\x28\xc7\xab\x0c\x09\xa0\xf2\
+\xde\x8a\x8c\x7d\xe9\x01\x00\xff\xeb\x92\xc7\x84\xcf\x7d\xc9\x71\
+\x5f\x91\x71\x5f\x72\xdc\x57\x64\xdf\x37\xdf\xe3\xb5\xf5\x5e\xb2\
+\x8f\xf9\x5d\x93\x78\x1e\x0b\xdb\xb6\x79\xea\xe5\x77\x58\xb7\x71\
+\x73\xd1\xb9\x01\xbb\x1c\x00\xe2\x71\xa8\xdb\x2c\x28\x2d\xd3\x48\
+\xf7\xf7\x23\x24\xe6\xef\xc4\xbe\xfb\x77\xe2\xbc\xf4\xee\x7b\x6e\
+\xbd\x5b\xc2\xc4\x16\xc2\x7f\x83\x94\x09\x9f\xdc\x17\x3a\xcd\x34\
+\x17\xbe\x6e\x48\x21\xe6\xb6\xce\xba\x4c\x7b\x0f\x69\x92\x0e\xb4\
+\x4e\x5c\xae\x41\x39\x89\x15\xde\xa3\xec\x3e\xca\x0f\x92\x88\x65\
+\xb1\x70\x5e\x9c\xc5\x0b\x5b\xa9\xec\x90\x02\xd3\xdd\x2d\xd2\x82\
+\xaa\x0e\x9a\xd6\xb8\xcd\x97\x5f\x6e\x64\xc2\xc1\xb5\xee\x0f\x5d\
+\xbb\xb7\x78\x3e\x43\x9d\x7e\xdc\xbc\xf1\xd4\x31\xe1\xbd\x46\xbb\
+\xca\xe2\xdd\xd7\xee\xca\x99\x79\x4c\x64\xec\x6b\x57\xb1\x53\xfb\
+\xa0\x32\x1e\x4f\x79\xc0\x27\x71\x1f\xe5\x51\xd2\x8c\x6b\x12\xf7\
+\x15\x2a\x2f\xf8\xf8\x83\x8a\xff\x35\xc6\x6a\x83\x67\x5f\x7b\x8f\
+\x27\x5f\x7a\xc7\x7c\xe9\x45\x06\x00\xbb\x25\x0a\xb0\x63\xbb\xa0\
+\x7e\xab\x30\x2b\x66\x96\xd9\xae\x7d\x4c\xfd\x74\x13\x5c\xb8\xa6\
+\xb4\xd7\x0c\xb7\xda\x30\xfd\x2d\xab\x40\xd7\xc2\xca\x78\x4c\xef\
+\x7d\x7c\x5f\x97\xce\xe1\x9e\x78\x1f\x33\xfd\xf5\x1a\x1e\x24\x7d\
+\xf5\xf2\xdb\xf7\xba\x04\x5a\x49\xa6\xfe\xd0\x4c\x73\xb3\xa2\xa4\
+\x04\x3a\xd4\x68\x22\xd1\xdd\xff\x03\xa8\xaa\xd2\x94\x97\x43\x2c\
+\x0a\x33\xa6\xd7\xb1\x71\x63\x33\x42\x68\xb4\xab\x78\x1a\x05\x5a\
+\x99\x5b\x12\xc7\x53\xfb\x09\x45\x03\x85\xd6\xfe\xd7\xa4\xef\x2b\
+\x17\x2c\xf3\x5f\xa3\x5d\x14\x4d\xde\x27\xf9\x5c\x3a\xe3\x3e\xda\
+\x7d\x5e\xe5\x79\xcd\xda\xe7\x3e\xda\xf7\x9a\xf4\x7d\xcf\xfd\x74\
+\xdb\xd7\x48\x29\x98\x35\x77\x21\xff\xfb\xce\xc7\x69\x6c\x6c\x2a\
+\x4a\x12\x70\xb7\x85\x01\x37\x6f\x12\x34\x35\x65\xfa\xd4\xda\x5f\
+\x99\x33\x14\xdb\xca\xe9\x63\x07\x57\xca\x7c\x7e\xbb\xf0\x80\x91\
+\x95\x87\x0f\xc8\x54\xee\xa4\xe9\x9f\x71\xbd\x95\xf4\xfb\x65\x6a\
+\x95\x17\x56\x8a\x03\x70\x7d\xff\x84\xdf\x9f\x00\x03\x29\x24\x5b\
+\xeb\x34\x33\x7e\x6e\x22\x1a\x85\x48\x04\xca\xca\xa1\xa6\x56\xef\
+\xd6\x05\xa5\xbc\x02\xaa\x6b\x21\x12\x35\x6e\xc0\x86\x0d\x4d\xcc\
+\x9a\x55\x87\x90\xe9\x3f\x74\x9d\x57\x21\x94\x47\x31\x5c\xd3\xa7\
+\x00\x45\x4b\x80\x85\x17\x44\xb2\xae\x71\xc1\x22\x6d\x3f\x17\x18\
+\xe8\xf4\x6b\xb2\xc1\xc0\xab\xd8\x99\xd7\x28\x5f\x30\xf2\x3e\x57\
+\xe6\x35\x08\xcd\xb6\xed\xdb\xf9\xb7\xdb\x1f\x65\xc1\xa2\xe5\x48\
+\x59\x9c\x11\xf5\xdd\xf6\xaa\xe3\xad\xb0\x7e\xad\xc0\x71\x52\x4a\
+\xdb\x16\x29\xb8\x33\x8a\x2d\x7c\x56\x70\xcb\x8f\xb0\xcb\x5a\xf9\
+\xb5\xff\xca\x9f\xc3\xca\xb0\x72\x12\x84\x3a\xf9\x18\xc2\x43\xfa\
+\x79\x57\x78\x92\x8a\x6f\xfe\x36\xe6\x65\xca\x1d\x90\xd2\x62\xe1\
+\xfc\x56\xd6\xad\x6d\x25\x56\xa2\x89\x46\x35\xd1\x88\xa6\xba\x46\
+\xd3\xa1\x7a\xf7\x44\x04\xa2\x31\xe8\xd4\x45\xa5\x9e\x2f\xaa\xd1\
+\xda\xe1\xc7\x1f\x37\xd1\xda\x6a\x67\x2b\x76\x4e\x85\xd0\x6d\x5a\
+\x06\xb9\x94\x48\xeb\x7c\xf7\xf1\x82\x4f\x1e\x6b\xc2\xab\xb0\x3a\
+\x8f\x35\xe1\x05\x90\x2c\x50\xd1\x3e\x60\x90\x0e\x7a\xe9\x60\x65\
+\xb6\xc7\x5f\x78\x87\x37\xa7\x7c\x81\x28\x52\xe5\xdf\xad\x00\x20\
+\x04\xec\xa8\x17\x6c\x5c\x2f\xda\x64\xdc\x13\x8a\xed\xaf\xcc\x19\
+\xee\x43\xa6\x32\x67\xad\xd2\x3a\x4f\x54\xa1\x70\x37\x24\x09\x10\
+\x3e\x4a\x6f\x65\x80\x51\xca\x12\x10\xbe\x2b\xbc\x48\x23\xcb\x32\
+\xf6\x91\x38\xb6\xe4\xa7\xa9\x8d\x28\xa5\x8c\x05\x10\x4d\xac\xca\
+\xd0\xa5\x9b\xa6\xb4\x6c\xd7\xc6\xe8\x85\x80\xce\x5d\x35\x95\x55\
+\xc6\xda\x48\x3d\x9f\x60\xc1\xfc\x6d\xac\x5d\xdb\xe8\x5a\x01\x85\
+\x98\xe4\x3e\x8a\xb6\x97\x4c\x72\xed\xb1\x40\xf0\xb3\x26\xbc\xf7\
+\xd1\xca\x47\xb1\x7d\xc0\x40\x67\x03\x88\x94\xf0\xdd\xb4\xd9\xfc\
+\xe5\xfe\xe7\x69\x6d\x8d\x17\x9b\xdb\xbf\x67\x00\x20\x21\x1b\xd6\
+\x09\xea\xb7\xa6\xb3\xe6\xb9\x14\xaf\x60\x3f\x3e\xdf\xca\x9f\xe7\
+\xf1\x85\xe5\x59\xb1\xb3\x94\xb9\xc0\x95\x3f\x0f\x18\x89\xb4\xb0\
+\x5e\x3a\xe9\x47\xda\x7e\xca\x2a\x90\xc2\x62\xd3\x46\x87\xf9\xf3\
+\x9a\x88\xc6\x04\xd1\x28\xc9\x2d\x12\x81\xb2\x0a\xe8\xde\x53\x13\
+\xd9\x85\x74\x6d\x4d\x47\x4d\xc7\xce\xe6\x31\xbd\xcf\x17\x8b\x41\
+\x7d\x7d\x2b\xb3\x66\xd6\x65\x28\x42\x3e\x93\x5c\xfb\x80\xc1\xaf\
+\x35\xc9\xfd\xf9\x81\xbc\xd6\x44\xde\xfb\xe4\xb8\x46\xfb\x03\x58\
+\x3e\x0b\x44\x08\xd8\xb8\xb9\x8e\xff\xf5\x97\x27\x58\xb5\x7a\x43\
+\xd1\x9a\xfe\x7b\x0c\x00\xec\x38\xac\x5a\x2e\x68\x6d\x49\x57\xf0\
+\xfd\x9d\xf4\x4b\x80\x85\x94\x16\xf3\xe7\x36\xb3\xad\x2e\x4e\x2c\
+\x96\x5a\x8d\x93\x5b\x04\x6a\x3b\x69\xba\x74\xfb\xf5\x26\x80\xd6\
+\x86\x5b\xe8\xd9\x5b\x53\x52\xe2\xf3\x5c\x51\xf3\xde\xa6\x4f\xdf\
+\x4c\x53\x53\x9c\xe0\x26\x79\x86\x92\x07\x30\xc9\x69\xe3\x9a\x7c\
+\x26\x79\x96\x65\xa0\xdb\xb0\x26\xf2\x71\x13\x99\x96\x82\x07\xa8\
+\x40\xe3\x28\x87\xfb\x1e\x7f\x83\x4f\xbe\x98\x86\xb4\x8a\x3f\x93\
+\x7e\xb7\xbf\x03\x21\x4c\x54\x60\xd5\x0a\xf3\x54\x7e\xc9\x33\xfb\
+\x1b\xe9\xe7\x35\xff\x5b\x5b\x61\xe6\x8c\x1d\x20\x75\xda\x6a\x9c\
+\xb6\xc5\xa0\x47\x6f\xc3\x07\xfc\x1a\x57\x20\x12\x81\xde\xfd\x14\
+\x15\xae\xe9\xef\xf7\x5c\xb1\x12\x58\xb1\x72\x07\x2b\x57\xee\x40\
+\x4a\xbd\xc7\x4c\xf2\x6c\x52\xb0\x70\x93\x1c\xdf\x88\x44\x81\xd6\
+\x84\xf6\xdc\xa7\x0d\x6b\x42\x4a\xc1\x27\x5f\x4e\xe3\xbe\xc7\xdf\
+\xc0\x51\xaa\xe8\x95\x7f\x8f\x00\x40\x42\xd6\xaf\x11\x6c\x5a\x2f\
+\xb0\xd2\x14\x69\xff\x23\xfd\xbc\x79\x00\x52\x5a\xac\x5f\x1b\x67\
+\xc5\xf2\x26\x77\xf5\xd7\xfe\x5b\x44\x53\x5e\xa1\xe9\x37\x50\x13\
+\x2b\xd9\xf9\xef\xa0\x5b\x4f\x4d\x97\xae\xe6\xf1\x72\x3d\x57\x34\
+\x0a\x2d\x2d\xad\xcc\x9e\xbd\x05\xa5\x0b\x31\xaf\xf7\xae\x49\xae\
+\x73\x90\x92\x29\x0b\x44\xe5\xbc\x46\x67\x80\x45\xee\x88\x84\x42\
+\x48\xc1\xca\xd5\xeb\xf9\xb7\xff\x7e\x86\x4d\x9b\xb6\x21\x8b\xd9\
+\xf1\xdf\x1b\x00\x60\xdb\xb0\x74\x91\xa4\xb1\xc1\x55\xac\xfd\x94\
+\xf4\xc3\x0b\x16\xc2\x62\xde\xdc\x46\x1a\x1b\x6d\x62\x31\x72\x5b\
+\x00\xae\x2b\xd0\xb1\xb3\xa6\x4f\x7f\x15\x98\x74\xd2\x1a\xaa\x6b\
+\x34\xfd\x06\x2a\xa2\x25\xf9\x9f\x27\xf1\x5c\x73\xe7\xd6\xb1\x63\
+\x47\x2b\x08\x4d\xbb\x34\xc9\x69\x8b\xc9\xf7\x5a\x20\x39\xac\x09\
+\xdf\x5c\x02\xff\x28\x46\x6b\x6b\x2b\xb7\x3f\xf0\x2a\xdf\x4f\x9b\
+\xbb\x4f\x98\xfe\x7b\x1c\x00\x8c\x2b\x00\x8b\x17\x48\x94\xda\x5f\
+\x49\x3f\x2b\x2d\x1d\xb8\xa9\x51\x33\x6f\xde\x76\x77\x45\xa6\xcd\
+\x2d\x1a\x83\xbe\xfd\x35\x9d\xbb\x06\x73\x05\x62\x25\x30\x68\x98\
+\xa6\xa2\x32\x9d\xf5\xcf\xb5\xc5\x4a\x04\x1b\x36\x36\xb2\x7c\xf9\
+\xf6\x64\x96\x5d\xbb\x33\xc9\x73\x28\x6c\xde\xc4\x22\x3f\x6b\x82\
+\xb6\xad\x09\x69\x09\xde\xfa\xe0\x5b\x9e\x7c\xe1\xa3\x7d\x46\xf1\
+\x13\xb2\x47\xcb\x81\x85\x80\x75\xab\x05\x9d\xbb\x0a\x06\x0d\xd3\
+\xd9\xfe\xf4\x3e\x4f\xfa\xa5\x5c\x02\x29\x25\x6b\x56\x37\xb1\x7e\
+\x5d\x13\xb1\x92\xc2\x97\xf4\x68\x14\x86\x8e\xd0\xec\xd8\x2e\x68\
+\x6c\x28\x2c\xf3\xb4\xff\x20\x45\xd7\xee\xc1\xc8\x03\xa5\x1c\xe6\
+\xcc\xd9\xcc\x88\x91\x35\xee\x6b\x07\x9d\x4c\x11\x56\xc9\xf5\x43\
+\xa3\x11\x5a\xa1\x85\xf9\x4c\xb4\x9b\xaa\xab\x51\xd9\xf7\x31\x59\
+\xbf\xc9\x63\x99\xd7\x68\x37\x9d\x57\x6b\x99\x05\x3c\x59\xd7\x20\
+\x11\x5a\xbb\x16\x4a\xe2\xb1\xa4\xff\x7d\xb4\x76\xb3\x1b\x55\xda\
+\x6b\xc4\x4d\x1d\xf6\x26\x31\x69\xe1\xbd\x46\x21\xa5\x64\xc1\xa2\
+\x95\xfc\xc7\xed\x2f\x51\xbf\xbd\xb1\xe8\x59\xff\xbd\x0a\x00\x00\
+\x8e\x03\x0b\xe7\x4a\x3a\x77\xd1\x74\xee\xa6\x73\xe4\x08\xec\x9b\
+\xa4\x9f\xd7\x25\xd0\x5a\xb2\x60\x7e\x3d\xb6\xe3\x10\x8d\x42\xe1\
+\x25\xa8\x9a\x8e\x5d\x34\x43\x46\xc0\xec\x9f\x8d\x35\x95\xf3\x4a\
+\x0d\xdd\x7a\x68\x06\x0e\xd5\x44\x63\x1a\x74\xe1\x40\xa3\x34\x2c\
+\x5d\xba\x8d\xad\x5b\x9b\xe9\x58\x5b\x66\x94\x88\xfc\x4a\x94\xae\
+\xfc\xd2\x7f\x3f\xa9\xb4\x2a\x05\x20\x7e\x60\xa0\x8d\xab\x63\x30\
+\x43\x7a\x56\xef\x0c\xc0\xc8\x02\x1f\x95\x71\x1f\x17\x0c\xb4\xf9\
+\xde\x32\xaf\x49\xdf\x07\xb4\x4c\xbd\x3e\x61\xd1\xd0\xd8\xc4\xff\
+\xb9\xeb\x55\x66\xcf\x5d\xb6\xcf\x29\xff\x5e\x01\x00\x21\xa0\xb1\
+\x01\xe6\xce\x92\x1c\xda\xd1\xa1\xac\x6c\xd7\x90\x7e\x56\x24\xb3\
+\x82\x2f\xbb\x9a\xb0\xcd\x0a\xbf\xc4\x73\xe4\xa9\x26\x4c\xf9\xfd\
+\xb9\x57\x78\x21\xf2\x54\xfd\xb9\xb7\xdb\xeb\x15\x4b\x97\x6e\x27\
+\x1a\xd5\x6e\x0e\x79\x80\x15\x5a\xc0\x80\x41\x8a\xad\x5b\x04\xcb\
+\x97\x08\x5f\x2b\x40\x6b\x93\xea\x3b\x72\xac\xa2\xa2\x22\xe1\x32\
+\x04\xb3\x02\xea\xb7\x37\xb3\x7c\x59\x3d\x9d\x3b\x97\xa1\x55\xa2\
+\xe0\x06\xd2\x8b\x76\x3c\xfb\x22\xbb\xb8\x27\x59\xd8\x03\xa9\xfb\
+\x08\xbf\x02\x20\x91\xf1\xd8\x22\xbd\x90\x2b\xed\x1a\xd2\x8b\x86\
+\x20\x59\x88\xe4\x9a\x18\x2e\x60\x65\x80\x81\xd6\x20\x72\x58\x13\
+\x5e\x00\xd3\xca\x7c\x87\x42\xf3\xc2\xeb\x5f\xf2\xca\x5b\x5f\xbb\
+\xdf\xf5\xbe\x27\x7b\xa5\x23\x90\x10\xb0\x6e\x8d\x60\xf1\x7c\xc9\
+\x98\xf1\x2a\xc9\xa8\xef\x14\xe9\x67\x41\x6b\x2b\x34\x6c\x11\x9e\
+\xfb\x98\x42\x0d\x91\xb9\x92\x5b\x99\x40\x23\xda\xae\x4d\x48\xb3\
+\x42\x44\x86\xdf\x9f\xaa\x59\xf7\xfe\x30\x85\x48\x54\xa2\x79\x8f\
+\x93\x3c\x2e\x85\x66\xf5\xea\x1d\x6c\xdd\xd6\x4c\x34\x26\xd8\x29\
+\x3e\x39\x0a\xa3\xc6\x29\xb6\xd5\x49\xb6\xd6\x65\x83\x80\x65\xc1\
+\x88\x31\xae\xe9\xbf\x93\xa1\x43\xa5\x15\xb3\x66\x6f\xa2\x43\x55\
+\x25\x42\xca\x1c\xb5\xf9\xde\x6a\x39\x6f\xcd\x7f\x8e\xeb\x74\x02\
+\x38\x33\x7b\x00\xa4\x57\xde\x25\x8f\x09\xe1\x7f\x3c\xf3\x36\xf1\
+\x9c\x5a\x50\x51\x5e\x42\x8f\xee\x35\xee\x77\xa4\xd3\x57\x79\xef\
+\x0a\x8f\x9f\x3b\x42\xb2\xca\x6f\xfa\xac\x25\xfc\xf7\xdd\x6f\xd0\
+\xdc\xdc\xba\x4f\xae\xfe\x00\x42\xf6\x18\xb7\x57\x7a\x28\x69\x0d\
+\xa5\x65\x70\xd4\xf1\x0e\xbd\xfb\x19\x57\xc0\x5b\x4f\xef\x5f\x9b\
+\xaf\xb3\x6a\xfe\xad\x88\x29\x3f\x7e\xf9\xe9\x08\x9b\x36\x08\xa4\
+\x5b\x02\x9c\x50\x3a\xef\x1f\x6d\xed\xa7\x56\x92\xdc\xfb\xd9\xbd\
+\x70\x44\xd6\xb9\xec\xbf\x71\xeb\xe0\x13\xef\x5d\x50\x5a\xe6\x30\
+\xfe\xd0\x56\xaa\x3a\xec\x7c\x9a\xaf\x10\xb0\x7c\x89\xe0\xbb\x2f\
+\x2d\xec\x78\xfa\x67\xdb\x7f\x90\xe6\x90\x23\x8d\x7b\xf1\x6b\x72\
+\x07\xe6\xcc\xb0\x58\xb5\x3c\xe6\x7e\x0e\xb9\xa0\x4a\xe4\x38\x1a\
+\xe4\xfa\xc2\xaf\xcd\xd5\x8d\x48\x03\x96\x94\xfc\xfd\x6d\xc7\x72\
+\xe9\x85\x07\xa7\x1a\x9b\xe4\xed\x0b\x90\x5d\xeb\x2f\x85\xa4\xbe\
+\xbe\x99\x6b\x6f\x7b\x98\xb7\xdf\x9f\xba\x4f\xb1\xfe\x99\xb2\xd7\
+\x7a\x02\x0a\x61\xea\xdd\x67\x4c\x93\x74\xee\xea\x50\xd9\xc1\xf4\
+\x0f\x08\x4a\xfa\x09\x61\xf2\xe5\x27\x4e\x72\x78\xf5\xb9\x08\x76\
+\x7c\x4f\xc7\x67\x75\x8e\xbf\xdb\xbe\x5b\x79\x85\x64\xe2\x91\x8a\
+\x88\xc5\xce\xad\xd2\x02\x06\x0c\xd1\x6c\xde\xa8\x98\x3b\xd3\xf4\
+\x62\xd3\xda\x54\x11\x8e\x3b\x58\x51\x5e\xfe\x2b\xc0\x45\x9a\x0c\
+\xce\x39\xb3\x04\xcd\x4d\xbf\x26\xdf\x7d\xcf\xad\x2f\xda\xd1\x9c\
+\x78\xc2\x30\x4e\xfb\xed\x08\x4f\x74\x21\xc5\x05\x24\xb9\x88\x1c\
+\xa4\xa0\xd7\x52\x78\xec\xd9\x4f\x99\xf2\xf1\xf4\x7d\x5a\xf9\xf7\
+\x2a\x00\x24\x40\x60\xc3\x5a\xc1\xec\xe9\x92\x43\x8f\x72\x3c\xae\
+\x40\x30\xd2\x4f\x4a\x98\x30\x49\xb1\x7c\xa9\xc3\x77\x5f\x58\xc5\
+\x51\x9c\x21\x60\xf1\x42\x49\x8f\xde\x9a\x21\x23\xd5\xce\x29\xaa\
+\xdb\x7f\x62\xdc\xc1\x8a\xcd\x1b\x05\xeb\xd6\x08\x62\x31\x38\x70\
+\xa2\xa2\x4b\xf7\x5f\xf7\x98\x3b\xb6\x0b\x66\x4c\x95\xb4\x34\x9b\
+\xcf\xf7\x57\xbd\xd1\x3d\x20\x4a\x69\xfa\xf6\xab\xe5\x1f\xfe\x78\
+\x34\x1d\x3b\x96\xa1\x9c\x44\xe3\x0f\x0f\xc1\xe7\x21\x13\xfd\x49\
+\x41\x90\x56\x84\xaf\xbe\x9d\xcf\x3d\x0f\x7f\x40\xdc\x76\x90\x72\
+\xdf\x48\xf8\xc9\x25\x7b\x1f\xde\x34\xcc\x9b\x2d\x59\xb1\x54\x66\
+\xaf\xfa\x05\x66\xfa\x09\x09\x25\xa5\x9a\x93\xce\x30\xee\x44\xb1\
+\x64\x69\xda\x71\x98\x3e\x55\x52\xbf\xd5\x28\x6e\x34\xd2\x76\x92\
+\x4e\x66\x8a\x70\x24\x62\x8a\x7b\x0e\x3e\xdc\xa1\xac\x1c\x86\x8e\
+\x54\x0c\x19\xa9\x4c\xaa\x6f\xd0\xc7\x8b\x98\xc7\x94\x12\x66\x4f\
+\x97\x6c\x58\x27\x8a\x02\x4c\xb5\x86\x92\x92\x08\x37\x5d\x7f\x18\
+\xe3\xc6\xf6\xc0\xb1\x9d\x36\x13\x8b\xf0\x49\x53\x16\x12\xd6\x6f\
+\xd8\xca\x7f\xfc\xe5\x4d\xd6\xad\xab\xdb\xe7\x95\x1f\xc0\x12\x55\
+\xdd\xff\x75\xaf\xbe\x02\x01\x8e\x0d\xdb\xea\x04\x7d\x07\x6a\x2a\
+\x2b\xd3\x09\xbe\xec\x3e\x7b\xfe\xfd\x03\xa5\x84\x0e\xd5\xa6\x93\
+\xce\x9c\x99\x16\xf1\x78\xfb\xef\xce\x64\xdc\x20\x53\x28\x35\x70\
+\xb0\x4e\x2a\x5f\xe2\xbd\x17\xb4\xb9\x9f\x47\x75\x2d\x54\x75\x80\
+\xa1\xa3\x4c\x99\xaf\x14\x20\x23\xc1\x1e\x47\x46\x0c\xa0\x2c\x5e\
+\x20\x99\xfa\x8d\x55\x34\x40\xaa\xb5\xe6\xac\xdf\x8d\xe4\xb6\xc9\
+\x87\x13\x8d\x58\x9e\xcf\x37\xd1\xd4\xd3\x4b\xc6\x66\xec\x8b\xc4\
+\xbe\xc0\x71\x14\xb7\xdf\x3b\x85\x17\x5f\xfb\x1e\xb1\x1f\x28\x7f\
+\xfb\x00\x00\x57\x11\x1a\x76\x98\xe6\x21\xfd\x07\x99\xac\xb8\x5c\
+\xa4\x9f\x17\x00\x12\x00\x91\x38\x27\x24\xf4\xe8\xa5\x69\x6c\x10\
+\x2c\x5e\x20\x8b\x62\xf5\x12\x02\xb6\x6e\x11\x54\x54\x41\xef\xbe\
+\x3a\xad\x91\x6a\xa1\x5b\x22\x0c\xda\xb5\xbb\xa6\xbc\xc2\x28\x7f\
+\x22\x2c\x5a\xf0\x26\x8d\xf2\x6f\xad\x13\x7c\x3a\xc5\x62\xc7\xf6\
+\xe2\x58\xfd\x95\xd2\x0c\x1b\xda\x99\xff\xfc\xff\x4e\xa0\x47\xb7\
+\x2a\x37\xe3\xd0\x8d\xbf\xa4\x85\x11\x13\x60\x90\xfa\xdf\x1b\x42\
+\xb4\x2c\xc9\x07\x9f\xcc\xe6\xdf\xfe\xcf\x9b\x34\x37\xc7\x8b\xb2\
+\xbd\xd7\xce\x48\xbb\x19\x0c\x22\x84\x71\x05\xfa\xf4\xd3\x8c\x9d\
+\xa0\x10\x42\xa7\x25\xe5\x14\x94\xe9\x27\x4c\x2a\xeb\xc9\x67\x3a\
+\x2c\x5b\x24\x98\x3f\x47\x52\x0c\xd1\x1b\xc7\x81\x69\xdf\x4a\x7a\
+\xf7\xd5\xf4\xea\x6b\x5c\x98\x9d\xc9\xf7\x4f\xdc\x27\x68\x6f\xca\
+\xc4\xf5\xf1\x38\xfc\xf8\xb5\x64\xf3\xc6\xe2\x31\xfd\x2b\x2a\x62\
+\xdc\x3a\xf9\x50\x86\x0c\xae\xc5\x51\x0e\x78\xc3\x7a\x5a\xa2\x45\
+\x3a\xc1\x47\x46\x82\x50\xa2\x99\xe9\xf2\x15\x1b\xf9\x3f\xb7\xbf\
+\x4b\x5d\x5d\xc3\x3e\x4f\xfc\x79\xa5\x5d\xbd\x53\x3b\x0e\xdf\x7d\
+\x29\xd9\xb8\x41\x60\x45\x08\x9e\xe9\xe7\x5a\x7f\x9d\xbb\x68\xce\
+\xbe\xd8\xa1\xba\x46\x17\xc5\xb4\x1b\x21\x60\xdb\x56\xc1\x37\x9f\
+\x99\xf2\xe0\x58\x2c\x7f\xc5\x9e\x6f\x15\x5f\xcc\xff\xef\x36\xb7\
+\x88\xb9\x3e\x1a\xd3\xcc\x9d\x25\x99\x37\xbb\x38\x2c\x27\x17\x02\
+\x38\xff\xbc\x91\x9c\x7a\xca\xe0\x64\xe5\x62\xee\xca\xc1\x1c\x05\
+\x4d\x42\xd3\xd2\xd2\xca\x1d\xf7\x7d\xcc\x4f\xd3\x57\xec\x57\xca\
+\xdf\xee\x00\x40\x08\xa8\xdb\x24\xf8\xe6\x53\x49\xbc\x35\xa3\x81\
+\x48\x80\xf2\x5e\x04\x8c\x3e\x50\x71\xf2\x99\x4e\x51\x58\x00\x60\
+\x5e\xfb\xd2\x45\x92\x9f\xbf\x97\x58\x2e\x19\x17\x98\xc4\xdb\xc9\
+\x2d\x16\x83\x8d\xeb\x04\xdf\x7d\x2e\xb1\xed\xe2\xf8\xbc\x94\xa3\
+\x19\x37\xae\x3b\x37\x5c\x37\x9e\x58\x4c\xa2\x7d\x4a\x84\x0b\xa9\
+\x1c\x94\x02\xde\x7c\x77\x3a\x2f\xbc\xf2\x43\x51\xb7\xf6\xda\x27\
+\x00\x00\x8c\x42\x2f\x98\x23\x99\x3e\xd5\xca\x33\xc5\x27\x77\x15\
+\xa0\xe5\xba\x02\x96\xa5\x39\xf9\x0c\x87\x71\x13\x54\xd1\x90\x59\
+\x4a\xc1\x0f\x5f\x5b\xac\x58\x22\xfd\xbb\x03\xed\xea\xcd\x05\x9a\
+\x78\x1c\x3e\xff\xc8\x62\xcb\xe6\x62\x31\xfd\x35\xb5\x1d\x4b\xf9\
+\xd3\xad\x07\xd3\xbb\x77\x15\x4a\x39\xf9\xdb\x89\x69\xff\x2a\x40\
+\x29\x61\xee\x82\xb5\xfc\xe5\xae\x8f\x68\x68\x68\xdd\x6f\xfc\x7e\
+\xaf\xb4\xcb\xe1\xa0\x8e\x03\xdf\x7e\x26\xe9\x37\x40\x31\x70\x88\
+\xc9\xec\x0b\x54\xde\x6b\x99\xde\x6d\xd5\xb5\x9a\xf3\x2f\xb7\x59\
+\xb9\x3c\xca\xc6\x75\x26\x35\xb8\x3d\x4b\xa2\x64\xfa\x6f\x53\x2c\
+\x7a\xf6\xd1\x54\xd7\x6a\x53\xf5\xba\x3b\x7e\x97\xa9\xe0\x38\xd3\
+\xfe\x66\xb1\x60\x27\xf8\x92\x4c\xf7\xaa\xad\xb9\x8f\xbb\xee\x73\
+\x12\xfc\xe1\x92\x51\x1c\x7d\x74\x1f\x1c\xc7\x71\x33\xfb\xda\x48\
+\xef\x4d\xf2\x01\xca\x7d\x0c\x8b\x1d\x0d\x4d\xfc\xe5\xce\x8f\x99\
+\xbf\x70\x7d\xa0\x54\x5f\xad\x7f\xad\x6b\x69\x48\x97\xf6\xd0\x54\
+\xa4\x5d\x02\x40\xc2\x27\xfe\x74\x8a\x45\xf7\x9e\x36\x55\xd5\x3b\
+\x57\xde\x0b\x30\x7c\x94\xe2\xec\x8b\x6c\x1e\xbd\x27\x8a\x53\x04\
+\xe6\xad\x94\x26\xbd\xf7\xab\xbf\x49\x4e\x3b\xd7\x21\x12\x73\x15\
+\x6d\x57\xff\x56\xb4\x79\xae\x85\xf3\x04\x5f\x7d\x2a\x03\x13\x8f\
+\x09\x0b\x22\xf3\x31\x75\x2e\xb0\xc1\xe7\x9c\x36\x8d\x62\x82\x58\
+\x68\xca\xd1\x1c\x79\x64\x2f\xae\xb8\x7c\x34\x96\x4c\x28\xa3\x99\
+\xf8\x93\x2a\x3d\xf6\xab\x36\x4c\x54\x0e\xa6\xca\x93\x9f\x7f\x79\
+\x1a\x6f\xbf\x37\x3b\x70\xa1\x4f\xe7\x4e\x55\x94\x96\x46\x3d\x6f\
+\x48\xf8\xa0\x5d\x2a\xd6\x90\x75\x4e\x08\x94\xa3\x58\xbf\x69\x0b\
+\x8e\xb3\x77\x87\x89\xb6\xdb\xf1\xe0\x52\xc2\xa2\xf9\x92\x6f\x3f\
+\xb7\x38\xe9\x77\x4e\xe0\xf2\x5e\x2f\x50\x9c\x70\xba\xc3\xbc\x5f\
+\x24\x9f\x7d\x60\x15\x0d\x27\xf0\xfd\x57\x16\x83\x86\x29\xc6\x4f\
+\x54\xa8\xc4\x6f\x7a\x57\x81\x80\x36\x9f\x4b\xfd\x56\xc1\x47\x6f\
+\x5b\xc9\x29\x4e\x85\xde\x37\x56\x02\x63\x0e\x52\x54\xd7\x98\x88\
+\x85\x76\xfb\x7a\x6a\x6d\x94\x39\xf1\xb7\x56\xa6\xac\x38\x71\x3e\
+\xf5\xb7\x40\x6b\x68\x6c\x10\x2c\x5b\x2c\x50\xad\x05\x2a\xbf\xd2\
+\x74\xef\x51\xce\x1f\x6f\x1b\x4f\xe7\x2e\xa5\x28\x27\xc1\xfa\x93\
+\xec\x21\xe0\xdb\x87\x20\xf9\xd2\x4d\x0f\x01\x19\x81\x9f\x7e\x5a\
+\xc9\xdd\xf7\x7f\x41\x4b\xab\x5d\x70\xc2\x8f\x72\x14\xa3\x47\xf5\
+\xe2\xf6\xff\x3c\x9f\x6e\x5d\x6b\x4d\x61\x13\x11\x52\xa5\xe1\x11\
+\x4f\x63\x98\x88\x67\x2c\x5c\xfa\xf1\x88\x15\xe5\x8d\xf7\x3f\xe7\
+\x9f\xfe\xfd\x4e\x6c\xc7\x61\x6f\xda\x01\xed\x16\x00\xc0\xfc\x68\
+\xbe\xf9\xdc\x62\xe0\x50\xc5\xe8\x71\x8a\xc4\xac\xca\x20\x3d\xfd\
+\x84\x80\x8a\x4a\xb8\xf8\x2a\x9b\x25\x0b\x24\x2b\x96\x8a\x76\x0f\
+\x02\x42\x40\x53\x23\x7c\xf0\x56\x84\x7e\x03\xe3\x74\xeb\xe1\x66\
+\x37\xee\x8a\x5f\x8a\x1b\xf2\x53\x0a\xbe\xf8\xd8\x62\xd1\xfc\x80\
+\xa6\xbf\x80\x01\x43\x14\xbd\x7a\x2b\x13\x58\xf3\x00\x80\xf2\xde\
+\x7a\x94\x5f\x65\x81\x81\xc6\x8e\x0b\x56\x2d\x37\x03\x64\x0a\x95\
+\x68\x54\x72\xf5\xd5\xa3\x99\x70\x70\x57\x63\xfa\xa7\x85\xf4\xda\
+\xe8\x43\x90\xe8\xed\x27\x04\x5b\xb6\x34\xf0\x5f\xb7\x7f\xca\xca\
+\x95\x75\x05\xb3\xfe\x5a\x6b\x3a\x74\x28\xe3\xef\x6f\x3d\x8e\x43\
+\x0e\xee\x87\x56\xd2\x55\x78\xcf\x96\xdc\xb7\x7c\x8e\x25\xb6\x28\
+\xcb\x56\xae\xe3\xe9\x57\xde\xa6\xa9\xb9\x79\xaf\x57\x19\xb6\x6b\
+\x55\x48\xf8\xc4\x1f\xbc\x65\xb1\xb5\x2e\x4f\x68\x30\x5f\x4f\x3f\
+\xcb\xe8\xcd\xc0\x21\x9a\xdf\x5f\x1d\xa7\xac\x9c\xa2\x08\x0d\x4a\
+\x09\xab\x97\x0b\x3e\x7c\xdb\x64\xe4\xed\xca\xa8\x40\xac\xc4\xf4\
+\x63\xf8\xf2\x13\x2b\xd0\x67\xa1\xb5\x49\x36\x1a\x34\x4c\xb9\x7c\
+\x8a\x4e\x1f\xde\x2a\x52\xdf\x1b\x7e\x43\x5d\x3d\xb7\x1b\x37\xc0\
+\x96\x4d\x01\x1a\x94\x38\x9a\xe3\x8f\xef\xc3\x85\x17\x0c\x01\x5f\
+\xc2\x2f\xdf\xcc\xc1\x14\xfb\xaf\xb4\xe2\xf1\xa7\x7e\xe0\x6f\x9f\
+\x2d\x0a\x1c\xf2\xbb\xf8\xc2\x83\xf8\xed\x89\xc3\x89\xdb\x71\x1c\
+\x65\x67\x6c\x71\x1c\x27\x6e\x6e\xbd\xc7\x93\xc7\xe2\x28\x1d\xa7\
+\xb1\x79\x07\xff\x7e\xe7\xa3\x4c\x9d\x31\xa7\x5d\x94\x18\xb7\x7b\
+\x83\x58\x4a\x58\xb6\x58\xf2\xc9\xfb\x46\x11\x02\xf7\xf4\x4b\xb4\
+\xf0\x12\x9a\x63\x4f\x76\x38\xe9\x0c\x7b\x4f\x16\xa8\xfd\x6a\x00\
+\xfc\xe1\x6b\x8b\xa9\xdf\x58\xa6\x56\x20\x56\x58\x4f\xbf\x7c\xac\
+\x7f\xac\xc4\x94\x4f\xbf\xf3\x4a\x84\x86\x1d\x85\xfb\xfd\x5a\x43\
+\x79\xb9\x69\x30\x52\x5a\xe6\x4e\x71\x76\x3f\xd7\xb4\x49\xcd\x32\
+\x7d\x6a\xb3\xcc\x9c\x08\x2d\x61\xc7\x0e\xc1\x9a\x95\xd2\x10\x9c\
+\x85\x28\xbf\xd2\xf4\x1f\x50\xc5\x2d\xb7\x8c\xa1\x43\x75\xc4\x13\
+\xf2\xf3\x19\x26\xa2\x7d\xfa\x11\x26\x86\x79\x5a\xf0\xd5\x37\x4b\
+\x79\xf8\xb1\x1f\x02\xb5\xf5\x56\x8e\xe2\xe0\x09\x7d\xb8\xe1\x9a\
+\x43\x89\x44\x35\x1a\x1b\x8d\x83\xd6\x8e\xb9\xf5\x6e\x79\x8e\x09\
+\xa1\x79\xf1\xcd\x8f\x78\xee\xd5\x29\xed\x26\xe2\x50\x34\x59\x0f\
+\xdf\x7d\x6e\x31\x63\xaa\x4c\x5a\x01\x22\x40\xfb\x30\xcb\x8d\x0a\
+\x94\x96\xc1\xef\xaf\xb1\x19\x3e\x46\xa1\x9c\x22\x78\xd3\x02\x5a\
+\x5b\xe0\x9d\xd7\x2c\x56\xaf\x10\xc4\x4a\x7e\xc5\xca\xef\x86\xfc\
+\xb4\x86\xf7\x5e\xb7\x58\xb6\x38\x98\x2b\x24\x25\x0c\x1b\xa5\xe8\
+\xdc\x55\xfb\x8c\x69\xd7\x59\xe3\xda\x13\xa5\xda\x99\xca\x6f\xdb\
+\xb0\x72\x99\xa0\xa5\x99\x82\x5c\x1a\xad\xa1\xb4\xd4\xe2\x86\x1b\
+\x46\x32\x6a\x64\x0d\x8e\xa3\xb2\x26\x12\xb5\xd5\x85\xd8\x14\xfa\
+\x68\xd6\xae\xad\xe7\xff\xfe\xf5\x0b\x36\x6e\xdc\x51\x30\x03\xaf\
+\xb5\xa6\x73\xe7\x0a\xfe\xe1\xb6\x23\xe8\xd1\xa3\x02\x47\xd9\x3e\
+\xca\x6d\x67\x2b\x3d\xe9\xc7\xa5\xd4\xcc\x98\xb3\x90\xff\xbc\xeb\
+\x69\x1a\x9b\x9a\x43\x00\x08\xba\x12\x36\x35\xc1\x7b\xaf\x46\x58\
+\xbf\x56\x10\x89\xec\x5c\x4f\x3f\x30\xf9\xf6\x57\xde\xec\xd0\xa1\
+\xa6\x78\x5c\x81\xf5\x6b\x04\x6f\xbc\x60\xd1\xda\xe2\x66\xed\x45\
+\x52\x03\x3d\x0b\xda\xdc\x6c\xbf\x58\x4c\xf3\xe3\x37\x92\xaf\x3f\
+\xb5\x02\xbd\x06\xad\xa1\x77\x3f\xcd\xc0\x61\xca\x7f\xa5\xf7\x28\
+\xbb\x14\x64\x81\x41\xe2\x1c\x02\xd6\xae\x12\xd4\x05\xc8\x37\xd0\
+\x5a\x73\xc6\x19\x7d\xf9\xdd\xef\xfa\xba\xd9\x7e\xd9\xb3\x08\xf2\
+\x0f\x2d\x35\xfb\xf1\xb8\xc3\x03\x0f\xff\xc0\xf7\x3f\xae\x0a\x64\
+\xfa\x4b\x29\xb8\xe2\xf2\x03\x39\xe2\x88\xde\x38\x8e\x8d\xd6\x0e\
+\x90\xb1\xe9\xdc\xfb\x66\xe5\x57\x6c\xab\xaf\xe7\x7f\xdf\xfe\x34\
+\x0b\x16\xad\x6c\x57\xdd\x85\x8a\xc6\x02\x90\x12\x56\xad\x10\xbc\
+\xfb\xaa\x45\x6b\x32\x4b\x30\xd8\x20\x0f\x29\x01\x2d\x98\x74\x34\
+\x9c\x7d\xa1\x2e\x9a\xcc\x2f\x29\x61\xda\x77\x16\x9f\x7e\x10\x31\
+\x7d\xfb\x77\xc2\x15\x88\x95\xc0\x9a\x55\x82\x37\x9e\x8f\xd0\xdc\
+\x14\xcc\xf4\xef\x50\xad\x19\x7d\xa0\xa2\xa4\xc4\x5f\xb1\x8d\xa9\
+\xaf\x73\xba\x01\x89\xd5\x7f\xdb\x16\xc1\xea\x95\x85\xff\xe4\x94\
+\xa3\x19\x31\xb2\x86\x1b\x6e\x1c\x4e\x69\x99\x9b\xed\xa7\x73\xcd\
+\x02\xc8\x98\x4f\xa0\x75\x9a\xe9\xff\xe1\xc7\x8b\x78\xe6\xf9\x19\
+\x04\xf1\xff\x94\xa3\x39\xfa\xa8\xbe\x5c\x76\xe9\x68\x37\xcc\x68\
+\x1b\xa5\xf6\x33\xf3\xb3\xcc\x7e\xb3\xfa\x27\x40\xe0\x89\x17\x3e\
+\xe0\xad\x29\xdf\x22\xda\x59\xaa\x71\x51\x25\x3e\x4b\x09\x3f\x7c\
+\x65\xf1\xed\x67\x56\xb2\x04\xd8\x8f\xf4\xcb\x37\xc8\x03\x24\x91\
+\x88\xc5\x05\x97\x0b\xc6\x1f\x22\x8a\xc3\x15\xc0\x24\x47\xbd\xfd\
+\xb2\x49\xd8\x29\x29\xf1\x98\xf5\x85\x6c\x31\xc3\xb6\xbf\xfa\x4c\
+\x84\x55\x2b\x82\x99\xfe\x91\x08\x8c\x3e\x50\xd3\xb1\x93\x51\x1c\
+\x91\x67\x85\xcf\xc5\x07\x48\x69\x5c\x99\xa5\x8b\x4d\xe9\x73\xa1\
+\xc0\x53\xd5\x21\xca\xe4\xc9\xc3\x18\x30\xb0\x02\xa5\x54\x96\x9f\
+\xdf\xd6\xc4\x1f\xb4\xf9\xfe\x97\x2c\xad\xe3\xaf\x77\x7c\x4b\xfd\
+\xb6\x96\x82\x4d\x6f\xa5\x34\xbd\x7a\x57\xf2\xc7\x5b\x0f\xa2\x63\
+\xc7\x18\x4a\xb7\x61\xe6\xe7\xf0\xfd\xa5\xa5\xf9\x6e\xda\x5c\xee\
+\x78\xe0\x0d\x5a\xe3\x36\xed\x6d\xcd\x29\xba\xca\x87\x78\x2b\xbc\
+\xfd\x8a\xc5\xb2\xc5\x32\xcb\x15\x10\x6d\xb4\x16\x4f\x34\xf4\xd4\
+\x4a\xd2\xa5\xab\xc5\x35\x93\x2d\x3a\x77\x13\x05\x93\x51\x7b\x53\
+\x84\x80\xcd\x1b\x04\x2f\x3c\x1e\x61\x47\xbd\xe1\x03\x22\xb1\xc2\
+\xb6\x68\x0c\x3e\x9d\x62\xf1\xed\x17\xc1\xf2\x20\xb4\x86\x81\x43\
+\x14\x03\x06\x2b\x7f\xa2\xcf\xcf\xe4\x97\x3a\xeb\x1c\xc0\x8a\xa5\
+\x92\x6d\x75\xc1\x52\x8d\xcf\xbf\xa0\x2f\xc7\x9f\xd0\xdd\xed\xee\
+\x93\x31\x70\x44\xb7\x31\x66\xcc\x2d\xf4\x69\x6a\x6a\xe5\xee\x7b\
+\x7f\x60\xf6\x2f\x1b\x90\x96\x28\xf8\x7d\xc7\x62\x16\xd7\x5d\x3b\
+\x9a\x03\x0f\xec\x84\xed\x9a\xfe\x85\x92\x7d\xda\x63\xfa\x6f\xd8\
+\x54\xc7\xbf\xff\xe5\x25\x56\xad\xde\xd4\x2e\x1b\x8c\x14\x1d\x00\
+\x08\x09\xeb\xd7\x0a\x5e\x7d\x26\x42\x63\x43\xae\x89\xc3\x6d\x0c\
+\xf2\x10\x12\xe5\x48\xc6\x1f\x1c\xe1\xe2\xcb\xa3\x58\xed\x3a\x1b\
+\xc2\xf3\x65\x59\xa6\x87\xe2\x5b\x2f\x5b\x08\x89\xeb\xe3\xe7\x27\
+\xff\x4a\x4a\x34\x8b\xe6\x09\x5e\x79\x26\x12\x28\xe6\xae\x35\x74\
+\xea\xa2\x39\xe0\x20\xf3\x1c\x64\x99\xfc\xf9\x98\x7f\x9d\x66\xfa\
+\x6f\x5c\x2f\x58\xbd\x22\x58\xc8\xef\xa0\x09\xb5\x5c\x79\xf5\x40\
+\x22\x51\xd0\xbe\xa3\xc3\xdb\x1e\x33\x26\x84\xe6\x8d\xb7\x16\xf0\
+\xfa\x1b\xf3\x03\x91\x6e\x5a\x6b\x4e\x3e\xb9\x0f\xe7\x9d\x37\x10\
+\x45\x1e\x92\x2f\x27\x08\x18\x57\xc1\x56\x71\x1e\x7c\xfc\x03\x3e\
+\xfd\x72\x76\xbb\xad\x32\x2c\xca\xda\x47\x29\xe1\xa7\xef\x25\x1f\
+\xbd\x13\x49\x35\x12\x0d\x3c\xc8\x43\x22\x84\xc5\xd9\x17\x96\x70\
+\xe4\xb1\xd1\xa2\x71\x05\xb4\x36\x16\xd0\xcf\x3f\x08\x77\xc4\x77\
+\xee\x52\xdf\x58\x4c\xd3\xb0\x43\xf0\xf4\x43\x11\x36\xac\x0d\x9e\
+\xed\x77\xe0\xc1\x8a\x0e\x35\x3a\xa5\xfc\x5e\xc5\xcf\xe1\xe7\x67\
+\x5a\x0a\x8d\x8d\xb0\x78\xbe\x20\x1e\x0f\x00\x3c\x9d\x4b\x98\x7c\
+\xeb\x60\xba\xf7\x28\x41\xa9\x3c\x04\x9f\xf6\x1f\x21\x06\xa6\xd5\
+\xfc\x9c\x39\x9b\xb8\xfb\x9e\x69\x34\x35\xd9\x05\x5b\x1e\x4a\x69\
+\x06\x0d\xaa\xe2\xe6\x9b\x47\x50\x51\x29\x5d\xd2\x4f\x91\x20\xf7\
+\x74\x1a\x01\x68\x67\x13\x80\x1e\xd3\xff\xd3\x2f\x67\xf3\xe0\xe3\
+\x9f\xb8\xef\xa1\x9d\xea\x52\x31\x02\x00\xa4\x7c\xe2\x5f\x66\x7a\
+\x5c\x81\x40\xd3\x7b\x2d\xd0\x92\xea\x6a\x8b\x6b\x26\x97\xd3\xbb\
+\x5f\x71\xb4\xc0\x12\x02\xea\xeb\x04\x4f\xde\x1f\x65\xe3\x86\xfc\
+\xa1\x41\x69\xc1\x5b\x2f\x99\x3c\x02\x19\x84\xf8\x17\x30\x7c\xb4\
+\xa2\xdf\x20\x95\x33\x9e\xef\xe7\x0e\x78\x8f\x49\x61\x0a\x99\x96\
+\x2c\x90\xd4\x6f\x2b\xdc\xf4\x97\x12\x2e\xbd\xac\x0f\x87\x4d\xea\
+\x88\xe3\x64\x2a\xb6\xcf\x08\x72\x9d\x6d\x19\x08\xa1\xa9\xaf\x6f\
+\xe1\x8e\xbb\xa6\xb2\x64\xc9\xd6\x82\x4d\x6f\x93\xeb\x10\xe1\xc6\
+\x9b\x86\x31\x74\x58\xa5\x61\xfd\x33\x2c\x00\xda\x34\xfd\x6d\xa4\
+\x54\xac\x58\xb5\x89\xff\xf8\xeb\xdb\x6c\xde\xbc\xbd\x5d\x57\x19\
+\x16\x2d\x00\x08\x61\x32\xc9\x9e\x7f\x34\x42\xdd\x16\x33\x76\x5c\
+\xec\xc4\xf4\x5e\xa5\x24\x23\x47\xc7\xb8\xe2\xba\x0a\x4a\x4a\x44\
+\x71\x84\x06\x2d\x93\xc9\xf7\xfc\xa3\x51\x94\x6d\x61\x59\x16\x96\
+\x4c\xdf\xa2\x51\x8b\x9f\xbf\x8f\xf0\xca\x33\x91\x40\xc0\xa6\x35\
+\x74\xef\xa5\x19\x7b\x90\x63\x3e\x53\xf2\x28\xbd\xc8\xe3\x0e\x48\
+\x13\x75\x58\xbd\xa2\x70\xe5\x57\x8e\xe6\x88\xa3\x3a\x71\xf1\x25\
+\xbd\xcd\x7c\x07\x9d\x7b\xb8\xa7\x37\xc6\x9f\x3d\x06\x5c\xf3\xfc\
+\x0b\xf3\xf8\xe0\xc3\x65\x05\xfb\xfd\xe6\xbd\x6b\xce\x3c\xab\x27\
+\xa7\x9c\xd6\x2d\x45\xfa\x15\x9a\xec\x93\xd8\x84\xa2\xa5\xb5\x95\
+\xbb\x1f\xf8\x98\x1f\xa7\x2d\x6d\xf7\x0d\x46\x8a\xba\xfd\x89\xb4\
+\x60\xd6\xcf\x92\x37\x5e\xb0\xd0\x5a\x67\xb9\x00\x85\x4e\xef\xd5\
+\xda\xe2\xd4\x33\x2b\x39\xe9\xb4\xf2\xa2\x00\x80\x84\xbc\xfb\x9a\
+\xc5\xa7\x53\xa2\x58\x32\x8a\x10\xee\x86\xd9\xdf\xb8\x2e\xca\x23\
+\x77\x45\xa9\xdb\x24\x82\x65\xfb\x55\xc0\xc1\x93\x1c\x2a\xab\x5c\
+\xa0\xf5\x90\x7a\x6d\x9a\xfc\x9e\xe3\xf5\xdb\x04\x0b\xe7\x9a\x3e\
+\x8f\x05\x29\xbf\xd2\xf4\xec\x5d\xca\xcd\xb7\xf4\xa7\xb6\x63\xc4\
+\xd3\xe1\x27\xf7\x44\xe1\xcc\x51\xe5\xc6\xf4\xd7\x4c\x9d\xba\x8e\
+\x87\x1e\x9e\x45\x3c\x1e\x24\xdb\x4f\x33\x7a\x4c\x07\xae\xb9\xbe\
+\x3f\xb1\x12\x50\xba\x2d\x5f\xdf\xf6\x05\x05\x29\x15\xef\x7e\x30\
+\x93\x67\x5f\xfc\xbe\x38\x74\xa8\x98\x01\x20\xf1\xa3\x7d\xf7\x55\
+\x8b\x1f\xbf\xb6\x4c\x33\x51\x2b\xf8\xf4\x5e\xb4\xa4\xbc\xcc\xe2\
+\xea\x1b\x6a\x18\x32\x2c\x56\x34\xae\x40\x63\x03\x3c\x7e\x9f\x64\
+\xd9\xa2\x28\x11\x19\x43\x12\x43\x8a\x18\x8e\x1d\xe3\xb9\x47\x2d\
+\x66\xfe\x44\x20\xd3\x5f\x4a\x38\xe0\x20\xd3\x5a\xdd\x28\xbf\x4f\
+\xa6\x9f\xf4\x71\x07\x64\xba\x35\x60\xdb\x30\xff\x17\x59\x70\x63\
+\x51\xc3\xba\x4b\xae\xba\xa6\x0f\x63\xc7\x55\xa5\x9b\xfe\xda\x9f\
+\xe0\xf3\x6b\xf7\x2d\x04\x6c\xda\xd4\xc4\xed\x77\x4c\x67\xed\x9a\
+\x86\x40\xa6\x7f\x75\x4d\x94\x9b\x6e\xe9\x47\x9f\xbe\x31\x1c\xc7\
+\x90\x78\x49\x3f\x3f\xc3\xff\xcf\xb5\xfa\x4b\xa1\x58\xb0\x68\x3d\
+\xff\x7d\xc7\x27\x6c\xdf\xd1\x52\x14\x0d\x46\x8a\x1e\x00\x84\x80\
+\xed\xf5\x82\xa7\x1e\x88\xb0\x6e\xb5\xc9\x12\xdc\x99\xe9\xbd\x5a\
+\x49\x06\x0e\x2a\xe5\xba\x9b\x3b\x51\x59\x29\x8b\x26\x4b\x70\xc9\
+\x42\xcd\xe3\xf7\x6a\x9a\x1a\xa3\x48\x11\x25\x62\x45\xf9\xe2\x63\
+\xc9\x9b\x2f\x05\x43\x31\xad\xa0\xdf\x40\xcd\x01\xe3\x95\x2f\x99\
+\x27\x84\xf6\xcf\xf2\xf3\x01\x82\x65\x8b\x25\x6b\x57\x05\xcb\xf6\
+\x3b\xe1\xe4\x4e\x9c\x7d\x6e\x57\xcf\x2a\xef\x21\xf8\x74\x3a\xc1\
+\x97\x2b\xd7\xdf\x71\x1c\x9e\x78\x62\x2e\x5f\x7f\xbd\x36\x90\xe9\
+\x2f\x04\x9c\x7f\x51\x57\x8e\x3e\xb6\x3a\xa9\xfc\x7e\xab\x3e\x64\
+\x90\x80\x9e\x6b\x10\x0e\x0d\x8d\x4d\xdc\x7e\xf7\xe7\xcc\x99\xb7\
+\xbe\x68\x66\x0a\xec\x13\x1d\x10\xa5\x84\x79\xbf\x48\x9e\x7d\x24\
+\x42\xbc\x55\x20\x85\x1f\xe9\x97\x9a\xde\x9b\xcb\x25\x50\x4a\x72\
+\xdc\x89\x1d\x38\xeb\xbc\x9a\xa2\x02\xc0\x8f\xa7\x38\xbc\xf7\x9a\
+\x26\x62\xc5\x58\xb1\xd4\xe2\x91\x7b\x6c\x76\x6c\x0f\x98\xed\x57\
+\x63\x66\x09\x96\x95\xbb\x8f\x2b\xfd\x98\x7f\x9d\x33\x11\x28\xe1\
+\x76\x6d\xde\x24\x58\x30\x47\x16\x6c\x45\x29\xa5\x19\x38\xa8\x8c\
+\x1b\x6e\xee\x4d\x45\xa5\x48\xe6\xf1\x67\x65\xf9\xe9\xdc\xa1\xc0\
+\x44\xb6\xdf\x17\x5f\xae\xe5\xc9\x27\x17\xa0\x54\xb0\x6c\xbf\x09\
+\x13\x2b\xb9\xf4\x8a\xae\x48\x4b\xe5\xf7\xf5\xb5\xe3\x4b\x0a\x82\
+\x83\x10\x0e\x2f\xbf\x3e\x8b\x37\xdf\xfe\xa5\xa8\x5a\x8b\xed\x33\
+\x2d\x50\x85\x80\x29\x6f\x46\xf8\xe4\xbd\xa8\x01\x80\x1c\xa4\x9f\
+\x10\x39\x5c\x02\xf7\xfa\x58\xcc\xe2\xf2\xab\xbb\x32\xf6\xc0\x72\
+\x94\xd3\xfe\xcd\x00\xe1\x16\x0c\x3d\xf9\x70\x0b\x53\xbf\x83\x27\
+\x1e\x8c\xb3\x60\x6e\xb0\x66\xa8\x56\x04\x0e\x9e\xa4\xe8\xd1\x2b\
+\x3d\xdb\x4f\xe6\x61\xf9\xfd\x12\x81\x5a\x5a\xe0\x97\xe9\x92\xa6\
+\x46\x0a\x36\xfd\xcb\xcb\x2d\xae\xbb\xa9\x27\x43\x86\x96\xba\x15\
+\x7a\xd9\x84\x9f\xd7\xcf\xf7\xcb\xfa\x93\xd2\x4c\x5b\xbe\xe3\x8e\
+\x59\xd4\x6d\x29\xdc\xf4\xd6\x0a\xba\x74\x8b\x72\xe3\xad\x5d\xe9\
+\xd2\x55\xa2\x32\x0b\x7d\xfc\xe2\xff\x3e\x96\x81\x94\x8a\x19\xb3\
+\xd6\x72\xf7\x7d\xdf\xd1\xdc\x6c\x17\x55\x73\xd1\x7d\x0a\x00\x9a\
+\x1a\xe1\x89\xfb\x2c\x16\x2f\xb0\x90\x32\x37\xe9\x87\x9f\x4b\xe0\
+\x71\x05\x7a\xf6\x2a\xe5\xc6\x5b\x7a\x52\xdb\x29\x5a\x34\xae\xc0\
+\x9a\x55\x8a\x7f\xfd\xc7\xed\x7c\xf0\x76\x4b\xe0\x99\x00\x43\x47\
+\x28\x46\x8d\x53\x6d\x92\x7b\x5e\x2b\x40\xfa\x14\xfa\x2c\x9c\x23\
+\x59\xbf\x36\x18\xe9\x78\xc6\x59\x9d\x38\xf9\x94\xda\x64\xbc\x5f\
+\xe7\xa8\xe7\xcf\x59\xe3\x2f\x34\x2d\xad\x36\x0f\x3e\x38\x8f\xe9\
+\x3f\x6f\x09\x64\xfa\x5b\x11\xf8\xfd\xe5\xb5\x4c\x98\x58\x6a\xb2\
+\xfd\x08\x56\xde\x9b\x30\xfd\xeb\xb6\x36\xf2\xd7\x3b\xbe\x63\xf9\
+\xb2\xad\x45\x37\x4e\x6c\x9f\x6a\x82\x2e\x25\x2c\x5b\x02\x8f\xdd\
+\x2b\x68\xdc\xe1\x63\x05\x24\xf7\x73\xbb\x04\x60\xa1\x1c\xc9\xe1\
+\x47\xd4\x70\xf1\x25\xdd\x8a\xa6\x85\x98\x10\xb0\x6a\x85\x43\x73\
+\x93\x0e\xa4\x80\x9d\xba\x68\x26\x1d\xa3\x28\x29\x25\x2d\xe1\x27\
+\x27\xf3\x9f\x20\x05\x3d\xe7\x2c\x09\xeb\x56\x09\x16\xcc\x2d\x9c\
+\x3b\x31\xac\x7b\x19\x57\x5d\xd7\x95\x92\x12\x92\xf1\xfc\xc2\xe7\
+\xf9\xb9\x85\x3e\x02\x3e\xf8\x60\x35\xaf\xbc\xbc\x3c\xd0\xe7\xa5\
+\x1c\x38\xf2\x98\x72\xce\xbb\xb0\x12\x84\xc7\xb7\xd7\x19\xe4\x5f\
+\x56\xb5\x5f\x8a\x23\x48\xdc\x3e\xf3\xdc\x6c\x3e\xfe\x24\x58\xc8\
+\x31\x04\x80\xdd\xf5\x86\x04\x7c\xf6\xa1\xe6\x9d\x57\x75\xba\x9f\
+\x2f\x72\x44\x04\x32\x5c\x82\xc4\xdf\x96\x65\xf1\xfb\x3f\xf4\xe2\
+\xb0\xc3\x6b\x8a\xc2\x15\x80\xd4\x4a\x5c\x98\xf6\x9b\x79\x00\x87\
+\x1f\xa3\xe8\xd2\x4d\x27\x3f\xbb\xdc\x89\x3d\x99\x80\xa0\x93\xd6\
+\x42\x43\x03\xcc\xfc\xc9\x4c\x12\x2e\xd4\xf4\xaf\xae\x89\x70\xc3\
+\x2d\xdd\xe8\xdd\x37\x8a\xa3\xda\x6e\xe6\x91\x66\x19\xb8\xa4\xa0\
+\x94\x9a\x45\x8b\xeb\xb9\xfb\xae\xf9\xec\xd8\x11\x0f\x90\xed\x07\
+\xbd\xfb\x5a\x5c\x3b\xb9\x8a\x0e\x35\xa0\x54\x06\xbb\x5f\x40\xec\
+\x1f\xd7\xf4\xff\xfe\x87\x35\x3c\xfc\xc8\x2c\x6c\xbb\x48\x7a\xcf\
+\xef\xeb\x00\x80\x80\xd6\x56\x78\xea\x61\x87\xd9\xd3\x35\x96\x25\
+\x7d\x49\xbf\x54\x84\x20\xdb\x25\x40\x58\x68\x2d\xe9\xdc\xb9\x84\
+\xc9\xb7\x0e\xa0\x7b\xcf\xd2\x40\xc4\x52\x31\x88\x06\xc6\x8c\x57\
+\x0c\x1f\x93\x68\x93\x1d\x20\xd6\x9f\xac\xf2\xd3\x28\x6d\xfc\xfe\
+\x8d\xeb\x0b\x37\xfd\x85\x80\xbf\xbb\xa8\x96\x23\x8f\xa9\x74\xc1\
+\x35\x7f\x33\x0f\x3f\xcb\x40\xa0\x69\x68\xb4\xb9\xef\x9e\x05\x2c\
+\x98\x5f\x1f\x28\xe4\x57\x52\x02\x97\x5d\x57\xce\x88\x31\x96\x27\
+\xdb\x2f\xa0\xe9\x2f\x15\xeb\x37\xec\xe0\xaf\xb7\x4f\x67\xc3\xfa\
+\xc6\xa2\x9d\x24\xbc\x4f\xce\x41\x92\x12\xd6\xad\xd6\x3c\x74\x57\
+\x9c\xad\x5b\x52\x51\x01\x3f\xd2\x2f\xcb\x25\x10\x29\x5e\x40\x39\
+\x92\x03\xc7\xd7\x72\xd5\xd5\xfd\x88\x46\xf7\x9d\x8f\x4a\x2b\xe8\
+\xd9\x47\x33\xe9\x18\x87\x68\xcc\x9f\xd9\x97\x85\xb8\x03\x6e\x0b\
+\xf3\x85\xf3\x64\xa0\x6c\xbf\x09\x87\x94\x73\xc9\x15\x1d\xb1\x22\
+\xa4\x99\xf7\x39\xdb\x7c\xf9\x84\xfe\x10\x8a\x37\x5e\x5b\xc5\xbb\
+\xef\xac\x0d\x58\xe8\x03\x27\x9c\x12\xe3\xd4\x33\xa3\xe9\x4a\xae\
+\x0b\x29\xf1\x4d\x55\x05\xda\x76\x9c\xc7\x1e\x9b\xc7\x77\xdf\xad\
+\x2f\x4a\xd3\x7f\x9f\x06\x00\x30\x09\x30\xdf\x7d\x15\xe7\xa5\x67\
+\x5a\xd1\x3a\x3d\x14\xe8\x25\xfd\x72\x25\x09\x79\xf7\xcf\x3b\xbf\
+\x2f\x27\x9c\xd8\xad\x68\x5c\x81\xb6\x14\xa0\xac\x02\x8e\x3e\xc1\
+\xa1\x36\x59\xe3\xaf\x73\xb2\xfc\x7e\xab\xbf\x14\xe6\xf3\xdd\x5a\
+\x27\x98\xfe\xa3\x2c\xb8\xca\xd0\xb0\xee\x11\x6e\xb8\xa5\x13\x9d\
+\xbb\x5a\x1e\xe2\x2f\xbb\xd4\x37\xdf\x3c\x3f\x69\xc1\xec\x59\xdb\
+\x78\xf0\x81\x25\xb4\xb4\x38\x81\x4c\xff\xc1\x43\x05\x57\xdc\x10\
+\xa1\xb4\x4c\x65\xd7\xf8\x17\xd2\xe8\xc3\x35\xfd\x3f\xfb\x6c\x2d\
+\xcf\x3e\xbb\xa4\xa8\x32\x47\xf7\x2b\x00\x48\x7c\xe1\x2f\x3c\xd5\
+\xc4\x0f\xdf\xd8\x58\x96\x4c\x45\x04\x32\x48\x3f\x3f\x97\x40\x78\
+\x0a\x86\x3a\x54\xc5\xb8\x79\xf2\x30\x06\x0c\xaa\x2c\x7a\x57\x40\
+\x08\x93\xea\x3b\x64\x84\xc7\xf4\x2f\xd4\xe4\xf7\xec\xdb\x36\x4c\
+\xff\x51\x06\x6a\xef\x65\x58\xf7\x1a\x0e\x9a\x58\xea\xd6\xf8\xeb\
+\x9c\xdd\x7b\x53\x1d\x7e\xd3\xaf\x11\x42\xb3\x6d\x6b\x2b\x77\xdf\
+\xb9\x98\x95\xcb\x1b\x03\x99\xfe\x15\x95\x70\xc5\x4d\x16\xfd\x07\
+\x69\x33\x4e\x2c\x50\x7b\x2f\x03\x16\x42\x2a\x56\xac\xd8\xce\x5d\
+\x77\xcc\x67\x6b\x5d\x6b\xd1\xcf\x13\xdc\xa7\x01\xc0\x14\x0c\x29\
+\x1e\xb8\x73\x07\x1b\xd6\x6a\x13\x1a\xcc\x41\xfa\xf9\xb9\x04\xb8\
+\x2e\x81\x52\x92\x11\x23\x6a\xb9\xf1\xc6\xe1\x94\x95\x45\x8a\x16\
+\xf5\x95\x82\x01\x83\x15\x87\x1d\xed\x16\xfa\xe4\xa8\xe1\xf7\x4b\
+\xef\xcd\x3c\xb6\x70\x8e\x64\xf1\x82\x20\xa6\x3f\x1c\x79\x6c\x39\
+\xe7\x5d\x58\x95\xec\xd9\x9f\xb7\x99\x47\x92\x14\xcc\x00\x08\xad\
+\x78\xfe\xb9\x55\x7c\xf6\xe9\xe6\xc0\xa6\xf7\x69\xe7\x68\x8e\x39\
+\x51\xe1\x78\x6a\xf6\x7d\xcd\xfc\x1c\xbe\x3f\xc2\xa1\xa5\x25\xce\
+\x83\x0f\x2c\x61\xe6\xcc\x6d\x45\x6d\xfa\xef\x17\x00\x00\xc6\x54\
+\x9d\x3e\xad\x85\x27\x1f\xd9\x8e\x6d\x8b\x9c\xa4\x5f\x5b\x49\x43\
+\x5a\x0b\x4e\x3f\xbd\x1f\x67\x9e\xd9\xcf\x25\xaa\x8a\x4b\x12\xd9\
+\x7e\xc7\x9d\xe2\xd0\xa1\x3a\x05\x90\xe9\xcc\xbf\xce\xdd\xd2\xdb\
+\xbd\xb5\x2c\xd8\xb4\x41\xf0\xf3\x0f\xb2\xe0\x51\x6b\x86\x75\x8f\
+\x70\xdd\xe4\x6a\x3a\xd4\x88\x64\xa1\x4f\xbe\x66\x1e\xe9\xa4\x60\
+\xaa\xd0\xe7\x87\xef\xb7\xf2\xc4\x63\x2b\xb1\xed\x20\xd9\x7e\x30\
+\x6a\xac\xe2\xe2\xab\x1c\xa2\xd1\x02\x4c\xfd\x1c\x04\xa0\x10\x8a\
+\xf7\xdf\x5b\xc7\x1b\xaf\xad\xdd\x67\x26\x09\xef\x37\xc3\xd0\x5f\
+\x7b\x69\x3b\x9f\x7e\xd4\x98\x74\x05\xfc\x48\x3f\xff\xa4\x21\x17\
+\x30\xb4\xa4\xac\x34\xca\x0d\x37\x8c\x66\xf4\xa8\x8e\x45\xc7\x07\
+\x48\x0b\x8e\xf8\x8d\x62\xc0\x60\x33\xd8\x52\xe6\xf4\xf3\xb5\xbf\
+\xef\xef\x5e\xdb\xd2\x6c\x66\x15\x14\x5a\xe3\x6f\x58\x77\xc1\x15\
+\xd7\x55\x31\x72\x74\x24\x55\xe8\xa3\xfd\x57\x7d\x5f\x30\xd0\x0a\
+\x21\x35\x1b\x36\x34\x73\xf7\x9d\xcb\xd9\xb8\xbe\xb5\xe0\xfc\x0c\
+\xad\xa1\xba\xa3\xe6\x8a\x9b\x6c\xba\xf7\xb4\x71\x94\xb3\x13\xed\
+\xbd\x6c\x84\x54\x2c\x98\xbf\x9d\xfb\xef\x59\x49\x63\xa3\x13\x02\
+\x40\x31\x89\x99\x30\xa4\x78\xe0\xee\xcd\x2c\x5f\x62\x63\xc9\x84\
+\x15\xd0\x76\xa5\xa0\x17\x1c\x94\x92\x0c\x18\x50\xcd\x2d\xb7\x8e\
+\xa3\x43\x75\xac\x68\x5c\x01\xa5\x60\xc4\x18\xc5\xa1\x47\x38\x79\
+\x95\xdb\xdb\xcc\xc3\xd7\x0d\x00\x66\x4f\x97\x2c\x5f\x1c\x2c\xdb\
+\xef\xc4\x53\x4b\x39\xf5\xcc\x52\x94\xce\x28\xe3\xd5\x6d\x34\xf5\
+\xf4\x1c\xb3\x6d\xc5\x93\x8f\xae\xe1\xc7\xef\xb7\x05\x2e\xf4\x39\
+\xf3\x7c\x87\x83\x0e\x75\x88\xdb\xda\x8d\xe1\xdb\xd9\x8d\x3d\xfc\
+\xfa\xfb\x27\x5c\x05\xa1\xd8\xd1\xd0\xca\xfd\xf7\xac\x66\xf1\xa2\
+\xe2\x0d\xf9\xed\xb7\x00\x00\x66\xc5\x9b\x3f\xb7\x85\x87\xee\xdb\
+\x44\x73\x13\x48\xe1\x4f\xfa\xf9\xb9\x04\xe9\xbd\x04\x05\x27\x1c\
+\xd7\x8f\x8b\x2e\x1c\x5e\x14\xef\x5b\x6b\xe8\xdc\x55\x73\xe2\x69\
+\x0e\xe5\x95\x6e\x83\x0f\x19\xa0\xb1\x87\x67\x1e\xe3\xea\x95\x82\
+\x9f\x7f\xb0\x02\x14\xfa\xc0\xe0\x61\x11\xae\xba\xb1\xdc\x1d\xc9\
+\x96\x3e\xd0\x23\xd5\xcc\x23\x9b\x04\xf4\xba\x07\xd2\xd2\x7c\xfe\
+\xb7\x3a\x5e\x7c\x6e\x7d\x20\xd0\x55\x0e\x1c\x38\x51\xf1\xbb\x0b\
+\xec\xe4\x7e\x62\xaa\x90\xce\x6c\xe3\x45\x36\x29\x68\x8a\x7d\x4c\
+\x3b\xb0\x37\x5e\xd9\xcc\x47\x53\xb6\x16\x55\xa1\x4f\x08\x00\x19\
+\x22\x04\xbc\xf7\x76\x1d\xef\xbe\xb5\x15\x99\x66\x05\xa4\x93\x7e\
+\x99\x2e\x41\x7a\x84\xc0\x22\x1a\x8d\x70\xcd\xd5\xe3\x38\x64\x62\
+\x8f\x76\xef\x0a\x44\xa3\x70\xdc\x29\xa6\xc6\x5f\xeb\x20\x8d\x3d\
+\xd2\x1b\x7b\x36\xec\x80\x6f\x3f\xb7\x68\xd8\x5e\x78\xb6\x5f\x45\
+\xa5\xe0\xea\x9b\xca\xe8\x3f\xc8\x72\x0b\x7d\xf2\x37\xf3\xf0\x23\
+\x05\xa5\x84\x95\x2b\x9a\xb9\xef\xae\xd5\x6c\xdb\x5a\x78\xa1\x8d\
+\x56\xd0\xb9\x9b\xe6\xe2\xab\x6c\x3a\x54\x9b\xa8\x85\xe3\x98\x2d\
+\xd9\xec\x43\xa7\x67\xf6\xe1\x73\x4c\x58\x0e\x33\xa7\x37\xf0\xd8\
+\x43\x1b\x69\x6d\x2d\x9e\x59\x12\x21\x00\xe4\x00\x80\xe6\x66\xc5\
+\x43\xf7\xaf\x65\xee\x9c\x26\x2c\xcb\x0a\x54\x29\xe8\x2d\x18\xea\
+\xd1\xbd\x8a\x3f\xdd\x76\x08\x5d\xba\x94\xbb\xa6\x6d\xfb\x13\xad\
+\xcc\x0a\x38\xe1\x50\x9f\x90\x9f\x2c\x24\xd9\xc7\xb4\x58\xd3\xda\
+\x0c\x26\x59\xb5\x5c\xb8\x43\x41\x0b\x93\x33\xce\x8d\x71\xec\x89\
+\x51\x9f\x42\x1f\xff\x5c\x7f\x9d\x91\xf5\x27\x84\xa6\xb9\xc5\xe1\
+\xe1\x07\xd6\x32\x7b\x56\x63\xb0\x42\x9f\x28\x9c\x79\x81\xc3\xb0\
+\x51\x8a\x78\x1c\x1c\xc7\x4c\x32\x56\x4e\x62\x8a\xb1\xca\x59\xe2\
+\x9b\x56\xe8\xb3\xa5\x95\xfb\xee\xda\xc4\x9a\x55\x76\xd1\xd4\x85\
+\x84\x00\x90\xef\x0d\x4b\xc1\xf2\xa5\xcd\xdc\x7b\xe7\x2a\xb6\x6f\
+\x53\x08\xe1\x4f\xfa\xa5\xb9\x04\x69\x49\x44\x89\x5e\x82\x82\xc3\
+\x27\xf5\xe5\xaa\x2b\xc6\x13\x69\x87\x7d\xdf\x94\x82\x9e\x7d\x35\
+\x27\x9e\x61\x53\x52\xaa\xdb\x6e\xe9\x2d\xfd\xc1\x41\x5a\x9a\x25\
+\x0b\x04\x33\xa6\x06\x29\xf4\x81\x31\xe3\x2c\x2e\xbd\xaa\x84\x68\
+\x54\x7b\x6a\xfc\x33\x5d\x00\x0f\x09\xa8\xb3\xb3\xfe\x84\xd0\x4c\
+\x79\xb7\x8e\xb7\x5f\xaf\x0b\xb4\xf2\x2a\x65\x72\x1d\x7e\x73\xb2\
+\x6d\x56\x7c\x77\x73\x1c\x91\xb2\x02\x94\x6e\xb3\xee\x5f\x69\x9b\
+\x17\x9f\xa9\xe7\x9b\x2f\x9a\x82\x35\x55\x0d\x01\xa0\x9d\xbf\x69\
+\x4b\xf0\xe9\x27\x5b\x78\xf9\x85\xf5\x79\x48\xbf\x6c\x97\x20\x33\
+\x42\x20\x85\xc5\x65\x97\x1e\xc8\xb1\x47\x0f\x68\x57\xae\x80\xd6\
+\x50\x56\x0e\xbf\x3d\xd3\xa6\x7b\x0f\xb3\xae\xb6\xd5\xd2\xdb\xcf\
+\x1d\x90\x96\x19\xe7\xf5\xd5\xa7\x16\xcd\x01\x6a\xfc\x6b\x3a\x0a\
+\xae\x99\x1c\xa3\x7b\x2f\xcc\xea\xaf\xdb\x4a\xef\x4d\xb0\xfd\xa9\
+\x6b\xa4\xd4\x2c\x98\xdf\xc4\x43\xf7\x6e\xa0\xb1\x51\x05\xca\xf6\
+\xeb\xd1\x4b\x73\xf6\x45\x36\xa5\x65\x29\xb3\xdf\x51\x09\xc5\x37\
+\xd3\xa0\x1c\x95\x02\x01\x48\xcd\xfc\x4b\x65\xfb\x39\xfc\xf0\x4d\
+\x33\xcf\x3d\xd9\x50\x14\x2d\xe2\x42\x00\x08\x28\xf1\xb8\xe2\xb1\
+\x47\x56\x32\xed\xc7\x7a\xac\x48\x6e\xd2\x2f\x5f\xd2\x90\xd6\x92\
+\x8e\xb5\x15\xfc\xfd\x6d\x47\xd1\xa7\x4f\x75\xbb\xca\x12\x9c\x74\
+\xb4\xc3\xd8\x09\x0a\x4d\x22\x9e\xaf\xf3\xb6\xf3\xf2\x73\x07\x1c\
+\x07\xbe\xf9\xdc\x62\xdd\xea\xc2\x4d\x7f\x21\xe1\xef\x2e\xb1\x38\
+\xe4\x08\xe1\xc9\xf6\xcb\xd5\xcc\x23\x1b\x0c\xb4\x56\x08\xa1\xd8\
+\xb1\xc3\xe6\x81\x7b\x36\xb2\x64\x51\x4b\xa0\x90\x5f\x49\x09\x9c\
+\x7e\x9e\x43\x9f\x7e\xda\x35\xfd\x53\x16\x80\x4a\x80\x81\x6b\x09\
+\x78\x49\x41\x6f\xbb\x2f\x21\x1d\xd6\xaf\x8b\xf3\xc0\x9d\x8d\x6c\
+\xd9\xa4\xf6\x39\xbf\x3f\x04\x00\x8c\x2b\xb0\x7e\x5d\x33\x77\xdd\
+\xb9\x98\x4d\x1b\x6d\xa4\xc8\x95\x16\x9c\x38\xe6\xed\x25\x98\x72\
+\x09\x94\x23\x18\x3f\xae\x37\x37\x5d\x7f\x04\x25\x25\x7b\x3f\x4b\
+\x50\x29\x18\x38\x54\x71\xc2\xe9\x0e\xd1\x68\x9e\x18\xbf\xcc\xdf\
+\xf5\x47\x4a\x98\x33\x53\x32\xeb\xe7\x60\xd9\x7e\x13\x27\x49\xfe\
+\xee\x12\x0b\x29\xb5\x4f\x67\x9f\x1c\x24\xa0\x4f\x3d\xc0\x1b\xaf\
+\x6c\xe5\x93\x0f\xb6\x07\xf3\xbb\x35\x1c\x72\xa4\xc3\xc4\x23\x1c\
+\x6c\x47\xa4\x94\x3e\xb9\xfa\xa7\x38\x80\x14\x18\x64\x93\x82\xf1\
+\xb8\xc3\xd3\x8f\xb6\x30\x7d\x9a\xbd\xcf\x9a\xfe\xfb\x3d\x00\x80\
+\x71\x05\xbe\xfd\x66\x33\x4f\x3e\xb1\x0c\xa5\x72\xa5\x05\x4b\x9f\
+\xf6\xe2\xe9\x2e\x01\x5a\x72\xc1\x79\xe3\x39\xfd\x94\x51\x7b\x35\
+\x4b\xd0\x0c\xd4\x84\x33\xce\x73\xe8\xd4\xc5\xd3\xde\xcb\xaf\x8e\
+\x3f\x8f\x3b\x60\x59\xb0\x61\x9d\xe0\xab\x4f\xac\x82\x0b\x7d\x94\
+\x82\xae\x3d\xe0\xea\xc9\x82\xda\xce\xda\x25\x46\x33\x08\xbe\x8c\
+\x0e\xbf\x7e\xb9\xfe\xd2\xd2\xcc\xfc\xb9\x89\xc7\x1f\xaa\xa3\xb5\
+\x55\x17\xdc\xdf\x40\x29\xe8\xdd\x5f\x73\xf2\x99\x26\xcd\xd9\xb1\
+\xc1\x51\x22\x83\x03\xf0\x6e\xfe\xa4\xa0\x90\x0e\x5f\x7c\x62\xf3\
+\xc6\x8b\x36\xfb\x83\xec\xd7\x00\x90\x50\x9a\x67\x9f\x5e\xca\x17\
+\x9f\x6f\x24\x62\x45\x20\x07\xe9\x97\x2f\x69\x48\x23\xa9\xaa\x28\
+\xe3\x4f\x93\x8f\x63\xd8\x90\xae\x7b\xcd\x15\x90\x12\x7e\xf3\x5b\
+\x87\x91\x63\x95\x09\xf9\x89\x02\x98\xff\x1c\x93\x7c\xbf\xf8\xc8\
+\x62\x53\x80\x1a\xff\x68\x14\x7e\x7f\x95\xe0\x80\xf1\x78\x6a\xfc\
+\x73\x37\xf3\xf0\x5a\x01\xde\x42\x9f\xba\x2d\x36\xf7\xdd\xb9\x85\
+\xb5\xab\xed\x40\xa6\x7f\x79\x39\xfc\xf6\x2c\x9b\xce\x5d\x74\x32\
+\xe4\x67\x14\x5f\xa4\x29\xbe\xca\x43\x0a\x0a\xe9\xb0\x62\x99\xc3\
+\x23\x77\xab\x40\x4d\x55\x43\x00\x28\x62\x11\x02\xea\xb6\xb4\x72\
+\xe7\x1d\x73\x58\xb5\xaa\x09\xcb\x8a\xf8\x93\x7e\x22\x23\x2f\x20\
+\xc3\x2a\x50\x0a\x86\x0f\xed\xc1\x9f\x6e\x39\x81\x8a\x8a\x92\x3d\
+\x6e\x09\x28\x05\x23\xc7\x2a\x8e\x3f\x35\xa3\xd0\x47\xfa\xc4\xfa\
+\x73\x0c\xfb\x48\x80\xc3\x4f\x3f\x58\xcc\x99\x29\x0b\xf6\xfb\x95\
+\x03\x47\x1d\xaf\x39\xfd\xbc\xdc\xf5\xfb\x6d\x75\xf8\x05\x85\x52\
+\x8a\x17\x9e\xae\xe7\xdb\xaf\x82\xb1\xee\x42\xc0\xa1\x47\x3b\x8c\
+\x3a\x40\x61\xdb\xa9\x55\x3d\x45\xfe\xa5\x56\x7b\x47\xf9\x93\x82\
+\x4a\x41\x63\xa3\xe6\xc9\xfb\x05\x0b\xe6\xb2\x4f\x86\xfc\x42\x00\
+\xc8\xf5\x21\x58\x82\x19\x33\x36\xf3\xe0\x03\x73\xdd\x64\x8f\x7c\
+\x95\x82\x7e\xbd\x04\xcd\xbe\xd6\x82\xdf\x9d\x72\x20\x17\x9e\x3b\
+\x71\x8f\x72\x01\x89\xde\x7e\x67\x5d\xe0\xd0\xa1\x3a\xbd\xb3\x6f\
+\x6e\xe2\x4f\x67\x31\xff\xd2\x82\x95\xcb\x05\x5f\x7e\x22\x03\x4c\
+\xf4\x81\xbe\x03\x34\x57\xdc\xa4\xa8\xac\x54\xae\xf5\xe3\xdf\xba\
+\x3b\x2d\x14\xa8\xd3\xaf\x91\x96\xe6\xfb\x6f\x9a\x78\xfe\xa9\xed\
+\x81\x58\x77\xa5\xa0\xff\x20\xcd\x91\xc7\x29\x10\xfe\x2b\xbd\xca\
+\x20\xfe\x94\x8f\x5b\xa0\x34\x7c\xf8\x96\xc5\x87\x6f\x5b\xfb\xc5\
+\xca\x1f\x02\x40\x96\x08\x5e\x7e\x65\x09\xef\xbf\xb7\x12\x4b\x44\
+\x3c\x69\xc1\xfe\x2e\x81\x5f\x84\x00\x2d\x29\x2d\x89\x71\xeb\x0d\
+\x27\x72\xd0\xb8\x7e\x2e\x0b\xbe\xfb\x25\x12\x81\x53\xce\x32\x35\
+\xfe\x9a\xc2\x4d\xfe\xcc\x31\xde\x8d\x0d\xf0\xc9\x7b\x16\x5b\xb7\
+\x14\x5e\xe8\x53\x5a\x06\x7f\xb8\xde\x61\xc8\xf0\x84\xf2\xe7\x6f\
+\xe6\xe1\x97\xeb\x2f\xa5\x66\xfd\x5a\x9b\x07\xee\xda\x1e\x88\x75\
+\xd7\x1a\x2a\x3b\xc0\x71\xbf\x75\xa8\xea\xa0\xb1\x6d\xe1\xb3\xfa\
+\x7b\x00\x21\x6b\xf5\xc7\x9d\x0a\x6d\x66\x19\x3c\xfd\x50\x94\xe6\
+\xe6\xfd\xc3\xf4\x0f\x01\x20\x53\xfd\x05\x34\x34\xc4\xb9\xeb\xee\
+\x19\x2c\x5c\xb8\xcd\x2d\x18\xb2\x7c\x49\x3f\xff\xca\x41\xd7\x15\
+\xd0\x82\x7e\x7d\xbb\xf0\x4f\x7f\x3c\x83\xda\xda\xca\xdd\xee\x0a\
+\x28\x05\x13\x0e\x53\x1c\x73\x92\x93\x3b\xbd\xb7\x80\x9c\x7f\x30\
+\xa9\xbe\x0b\xe7\xca\x40\xbe\xf7\x89\xa7\xdb\x9c\x70\x9a\x8d\xd2\
+\xaa\xcd\x66\x1e\xfe\xa4\xa0\x26\x1e\x57\x3c\xf5\x48\x03\xd3\xa7\
+\xb5\x06\x1e\x65\x76\xe8\x91\x0e\xfd\x06\x2b\xec\xb8\x8f\x5f\x9f\
+\xa9\xf8\x4e\x36\x29\xa8\x14\xd4\x6f\x83\xa7\x1e\x88\xb0\x6a\xb9\
+\xd8\x6f\x4c\xff\x10\x00\x7c\x7f\x50\x82\x05\x0b\xea\xb8\xeb\xee\
+\x9f\x69\x6c\x74\xdc\xd9\x02\x6d\x55\x0a\x66\xbb\x04\xca\x11\x9c\
+\x70\xcc\x01\x5c\x75\xe9\xb1\xbb\xb5\x78\x44\xb9\xbd\xfd\xce\xbe\
+\x38\x4e\x79\x85\xfb\x1e\xf2\xc5\xfa\xa5\x7f\x54\xc0\xb2\x60\xe1\
+\x3c\xc9\x57\x9f\x06\x2b\xf4\x19\x3a\x42\x71\xc9\x35\x36\xb1\x12\
+\x9f\x31\xdd\x3a\x7b\x8c\x97\xf6\xcd\xf5\x57\x7c\xf6\x71\x0b\xaf\
+\xbf\xd4\x14\xf8\xbd\x0f\x1c\xaa\x38\xe8\x10\x07\xad\xd2\x13\x7e\
+\x94\xeb\xf3\xa7\xad\xf6\x39\x48\x41\xc7\x81\xf7\x5f\x8f\xf0\xed\
+\x17\xd6\x7e\xa7\xfc\x21\x00\xf8\x88\x10\x82\x77\xde\x5b\xcc\xcb\
+\xaf\x2e\x48\x9f\x31\x98\x23\x0f\x20\x57\xd2\x50\x24\x12\xe1\x86\
+\x2b\x4f\xe6\xa8\x49\x23\x77\x8b\x2b\xa0\x35\x94\x96\xc2\x59\x17\
+\xda\xf4\x1b\x68\x56\x53\x21\x0b\xf1\xfd\xd3\x8f\x59\x12\xb6\xd6\
+\x19\xff\x77\x47\x7d\xe1\xd9\x7e\x95\x55\x9a\xcb\x6e\xb0\xe9\xd5\
+\x57\xbb\x7c\x81\x8f\xa9\xaf\xf3\x64\xfd\xb9\xa6\xff\xf2\xa5\x36\
+\x0f\xdd\xdd\xc8\x8e\xed\xc1\xe6\x19\x54\xd7\x6a\x0e\x3f\xd6\xcc\
+\x33\xb0\x6d\x4f\x8c\xdf\x1b\xe6\xf3\xae\xf6\x3e\xa4\x20\x1a\x7e\
+\x99\x21\x79\xed\x39\xab\xe0\xe6\x26\x21\x00\xec\xf3\x00\x00\x2d\
+\x2d\x0e\xf7\xde\x3f\x95\x19\x33\x36\x12\xb1\x2c\x5f\xd2\x4f\xe4\
+\x4d\x1a\xb2\xd0\x4a\xd0\xbd\x5b\x47\xfe\xfc\xa7\x73\xe9\xd1\xbd\
+\xe3\xae\x0f\x0d\x6a\x38\xf2\x78\x87\xc3\x8f\x75\x92\xaf\x5b\x64\
+\xd6\xf1\xcb\x36\xca\x7c\x85\x51\x88\x4f\x3f\xb0\x58\xba\x28\x98\
+\xf9\x7b\xda\xb9\x0e\x87\x1d\xed\xe0\x38\x46\x21\x8d\xa7\xe3\x35\
+\xfd\xfd\x0a\x7f\x52\x60\x20\x84\xa6\xa9\x49\xf1\xd8\xfd\xcd\xc1\
+\x47\x99\x59\x66\x94\x59\xb7\x1e\x29\xbf\xbf\xcd\x30\x5f\xe6\xa6\
+\x60\xcb\x66\xc1\x0b\x8f\x47\xd8\xbc\x51\xec\x57\x7e\x7f\x08\x00\
+\x6d\x7d\x28\x52\xb0\x72\x45\x3d\x7f\xb9\xfd\x5b\xea\xea\x5a\x4d\
+\xef\x00\x0a\xab\x14\xf4\xba\x04\x8e\x03\x93\x0e\x19\xc9\xe4\x6b\
+\x4f\x27\x1a\xdd\x75\x29\x65\xc6\xfc\x35\xf9\xee\x25\xa5\x2e\x70\
+\xc9\xc2\x7a\xf9\x79\xdd\x01\xcb\x82\x59\x3f\x49\xbe\xfb\xa2\xf0\
+\xd7\xa6\x1c\x33\x4f\xe0\xbc\x4b\x6c\x2c\xcb\x54\x1c\x6a\xed\xb9\
+\xf5\x65\xfb\xb3\x49\x40\x21\x14\x53\xde\x8e\xf3\xc1\xdb\xf1\x40\
+\xca\xa7\x35\x0c\x1e\xa6\x18\x3e\x5a\x79\xcc\xfe\x1c\xe4\x9f\xca\
+\x4d\xfe\xd9\x71\xc1\x7b\xaf\x59\xcc\xfa\x49\xee\x97\xa6\x7f\x08\
+\x00\x6d\x7d\x30\x96\xe0\x6f\x9f\x2d\xe1\xc9\x67\x7e\x46\x6b\x99\
+\xac\x1a\xf4\x9f\x29\x98\xdb\x25\x90\x58\x5c\x71\xf1\x49\x9c\x72\
+\xfc\xc1\xbb\xc4\x15\x30\xe6\x37\x9c\x7f\x99\x4d\x8f\xde\x1a\xb4\
+\x4f\x09\x6f\x1b\x2d\xbd\x13\x00\xb0\x61\x9d\x60\xca\x1b\x91\x40\
+\xc3\x3c\x6b\x3b\x6b\x2e\xbd\xd6\xa6\x53\x17\x9d\x0c\x9f\x69\x95\
+\xba\xd5\x5a\x67\xc7\xf8\x33\x48\x41\x29\x35\xf3\xe6\x38\x3c\x7e\
+\x7f\x6b\x20\xd6\x5d\x6b\xa8\xed\xa8\x19\x7f\xa8\xc2\x8a\x90\x33\
+\xcb\xaf\x2d\x2b\x40\x6b\x98\x3e\x55\xf2\xd1\x3b\xc5\xdb\xe0\x35\
+\x04\x80\x3d\x20\xb6\xad\x78\xf8\xd1\x1f\xf9\xe6\xbb\x15\x9e\x04\
+\xa1\xdc\x79\x00\x7e\x2e\x81\xd6\x92\xda\xea\x0e\xfc\xf9\x8f\x17\
+\x31\x70\x40\x4f\xb7\x36\x7e\xe7\x45\x08\x38\xe9\x0c\x9b\x83\x27\
+\x39\x29\xe5\xcf\x4a\xf6\xd1\x79\xcb\x7d\xa5\x84\x78\x1c\x3e\x78\
+\xd3\x62\xf5\x8a\xc2\x4d\x7f\x29\x4d\x8d\xfd\xd8\x83\x4c\xc2\x4d\
+\xc2\xf4\xcf\xde\xfc\xf8\x00\xb3\x2f\x84\x66\xfb\x76\xcd\x23\x77\
+\xdb\xac\x5c\xa6\x03\xad\xbe\xd1\x28\x8c\x9b\xa8\xa8\xa9\xd5\x38\
+\x76\x66\x9e\xbf\x48\x07\x03\xe5\x4f\x0a\x6a\x6d\x80\xef\x8d\xe7\
+\x23\x6c\xaf\xdf\xbf\x42\x7e\x21\x00\x04\xfd\x70\xa4\x60\xc3\x86\
+\xed\xfc\xd7\x5f\x3f\x65\xdd\xba\x1d\xe9\x5d\x84\x0a\x6a\x2f\x9e\
+\x28\x18\x82\x71\x63\x86\xf0\x8f\x37\x5f\x40\x59\xe9\xce\x67\x09\
+\x2a\x65\xba\xdb\x9e\x79\x81\x43\x24\x8a\x19\xe6\x99\xb3\xb1\x87\
+\xf6\x0f\xfd\x49\xa3\xc8\x3f\x7c\x6d\xf1\xe3\xb7\x56\xa0\x6c\xbf\
+\x09\x87\x29\x4e\x3d\xc7\x70\x0e\x5a\x8b\x74\xd3\x3f\x63\xcb\x15\
+\xfa\xd3\x68\xde\x78\xd1\xe1\xcb\xbf\xa9\x40\x21\x3f\xad\x61\xd0\
+\x30\x45\xbf\x01\x1a\xdb\xc9\x53\xe5\xa7\x72\x25\xfb\x18\x10\x68\
+\x69\x81\x29\x6f\x58\x2c\x59\xb8\xff\x85\xfc\x42\x00\xd8\x99\x0f\
+\xc8\x92\x7c\xf7\xc3\x72\x1e\x78\xf8\x1b\x1c\x5b\x10\x91\x51\x2c\
+\x2b\x8a\x25\x7d\x36\xf7\x78\xc4\xdd\x92\xc7\xac\x28\x16\x51\x2e\
+\x39\xf7\x24\x2e\x3c\xfb\x84\x9d\x7a\x1d\x5a\x43\x6d\x27\xcd\xc5\
+\x57\xdb\x74\xee\xea\x19\xe6\x29\xda\x9e\xe2\x93\x59\xe8\xb3\x72\
+\x99\xe0\xfd\xd7\x2d\xe2\x2d\x85\x03\x4f\xb7\x9e\x9a\x0b\xaf\xb4\
+\xa9\xea\xa0\x71\x5c\xa5\x57\xca\x80\x40\xb6\x1b\x90\x00\x81\xf4\
+\x5c\x7f\x29\x15\x33\xa6\x2a\x9e\x7d\xd4\x74\xe9\x09\xf2\xde\x3b\
+\x75\xd1\x8c\x38\xc0\x64\xfb\x29\x5b\xf8\xa7\xf5\xb6\x91\xfb\xaf\
+\x15\xfc\xf4\xbd\xe4\x9b\xcf\xf7\xf1\x12\xbf\x00\x12\x09\x3f\x82\
+\x42\x7e\x80\x9a\xa7\x9e\xff\x9e\x03\x0e\xe8\xc8\xd8\xb1\x3d\x50\
+\x8e\x30\xe3\xc6\xb4\x04\x6d\xaa\x01\x4d\x7f\x00\xf7\x6f\x9d\xea\
+\x17\x80\x4e\xa4\x09\x4b\x2c\x11\xe1\xe8\x23\x86\xf1\xce\x47\x5f\
+\xb1\x71\xd3\xb6\x40\x39\x02\xd2\x82\xb3\x5c\xf3\x3b\x51\xe8\x83\
+\x04\xa1\x30\x96\x00\x24\x2d\x02\x94\x59\xe5\x95\x32\x17\x7a\x8f\
+\x35\x34\xc0\x5b\x2f\x47\xd8\xb0\xae\xf0\x15\x30\x16\x83\xb3\x2f\
+\xb6\x19\x3a\x42\xe1\xd8\xe6\x39\xb4\x32\xcf\xaf\xb5\x00\xa5\xcd\
+\xdb\x34\x94\x44\xaa\xd7\xa7\x04\x84\x46\x60\xb2\xfb\xb6\x6c\x94\
+\x3c\x7c\x27\x6c\x5c\x47\xa0\xd5\x3f\x56\x62\xea\x1c\xca\xcb\x4d\
+\x95\x1f\x11\xc0\x11\xee\x63\xbb\xe0\xe6\x1e\xc2\x31\x07\x84\x63\
+\x2c\x20\xc7\x31\x9f\x8b\xd4\xb0\x66\x95\x64\xca\x9b\x11\xd3\x14\
+\x36\x5c\xfa\x42\x00\x28\x5c\x04\xd1\x92\x26\x3e\xf9\xe1\x35\x7e\
+\x9c\x2f\xb1\xe3\x1e\xd2\xc9\xf6\x66\x99\x09\xcf\x7e\xc6\x39\x37\
+\x56\xbd\x65\x93\x64\xeb\x36\x3b\x90\xf2\x2b\x07\x0e\x3b\x52\x71\
+\xda\x79\xa6\x3e\x5d\x39\x29\xdf\x35\x13\x08\x24\xa0\xd2\xce\x69\
+\x84\x4a\x9c\x30\x55\x7e\x33\xa6\x16\xce\x7c\x2b\x05\x87\x1d\xed\
+\xf0\x9b\x93\x1d\x94\x72\x1f\x53\x91\x52\x78\x05\x48\x81\x76\xc3\
+\x9c\x89\xe3\xca\x3c\xb5\xd9\x11\xa0\x95\xe6\xc5\xa7\x04\x53\xbf\
+\x23\x70\x8d\xfd\x80\xc1\x8a\xae\xdd\x4d\x95\x9f\x65\xa5\x00\x4f\
+\x08\xa3\xef\xc9\x92\xe1\x1c\xc7\x85\x80\xa6\x38\x7c\xf4\x8e\xc5\
+\xba\x55\xa1\xe9\x1f\x02\x40\x00\xd1\x1a\x4a\x4a\x4d\x8f\xb9\xea\
+\x5a\xb7\xcb\x8c\x36\xbe\x66\xe6\x66\x3b\xa9\x1a\xf4\xac\x4d\x41\
+\xc3\x0e\xc1\x8a\xe5\x82\x78\x5c\x04\x6a\x71\xd5\xbd\xb7\xe6\xd2\
+\x6b\xe3\x54\xd7\x98\xa4\x17\xe1\x59\xe9\x13\x8f\x23\x05\xa8\x8c\
+\x63\xa9\x5b\x8d\x94\x82\x39\xbf\x48\xa6\xbc\x69\xc2\x93\x85\x3c\
+\xbf\x52\xd0\xa7\xbf\xe6\xbc\x4b\x4c\xb8\x51\x29\xf3\x3c\x48\x63\
+\xee\x4b\x8f\xa2\x27\x6f\x95\xeb\x57\x4a\x92\x0c\xbb\x65\x69\xbe\
+\xfe\x54\xf0\xea\xb3\x32\x65\xbd\x14\xf8\xd9\x77\xee\xaa\xcd\x30\
+\x13\x95\x02\x3e\xe1\x24\x56\x7b\x61\xb8\x8e\xac\xe3\x26\xa1\x2b\
+\x61\x05\x28\x05\xd3\xbe\x95\xcc\x9c\x26\x03\x35\x35\x0d\x01\x20\
+\x14\x84\x80\xd1\xe3\x14\x03\x86\x68\x94\x72\x57\x20\x70\x6d\x5d\
+\x92\x66\xaf\x06\x2c\x9d\x71\xce\xab\x4c\x0e\xac\x5f\x23\x68\x6a\
+\x0c\x36\x54\x23\x56\x02\x17\x5e\x6e\x33\x6c\xb4\x42\x39\xee\x7d\
+\x3d\x26\xbf\x31\xf5\x49\x77\x07\x12\x40\xe0\xde\x5a\x16\x6c\xdd\
+\x02\xaf\x3f\x67\x51\xb7\xb9\xb0\x15\x50\x6b\x28\x2b\x83\x73\x2e\
+\xb6\xe9\xdd\xdf\x84\xfc\xa4\xf4\xac\xec\x1e\x33\x3f\x69\x05\xb8\
+\x1a\xaf\x3d\xe7\x65\x04\xd6\xac\x12\x3c\x7a\xb7\xc5\xb6\xba\x00\
+\xab\xbf\x0b\xbc\x83\x87\x69\xa2\x51\x52\xd5\x89\x9e\x55\xde\x60\
+\x80\x20\x61\x65\x64\xb9\x03\x08\xa4\xd4\xac\x5a\x2e\xf8\xe2\x63\
+\x2b\x09\x9e\xa1\x84\x00\x50\xd8\x6f\xd0\x5d\x01\x27\x1c\x66\x58\
+\x77\x3b\xee\xba\xfc\x5a\xa3\x2d\x61\x14\x5f\x9b\x00\xa0\x41\x80\
+\x04\x22\xa4\xce\x69\xf7\x07\xbf\x6e\x93\x60\xf3\x26\x11\x38\xe9\
+\xe5\x98\x13\x1d\x4e\xfe\x9d\xed\xfe\xb8\xb5\x71\x1d\x24\x48\x95\
+\x61\xea\x93\xdb\x1d\x50\x0e\x4c\x79\xd3\xd4\xf8\x07\x31\x7f\x8f\
+\x3a\xd1\xe1\xd0\xa3\x9c\xa4\xc5\x90\x58\xd1\x13\x8d\x7d\xb2\xfd\
+\x7e\xe3\x6c\x27\xac\x00\xed\x8e\x12\x7b\xe6\xe1\x88\x79\xee\x20\
+\x35\xfe\x12\xfa\xf6\x57\x74\xa8\x31\xac\xbf\x45\x6a\xb5\x4f\x9a\
+\xf7\x19\xab\x7d\x8a\x03\x48\x1c\x87\x1d\x3b\x04\x9f\x7d\x60\xb1\
+\x65\x73\x68\xfa\x87\x00\x10\x44\xf9\x35\x54\x54\xc1\x11\xc7\x99\
+\x61\x9a\xf1\xb8\xff\xea\x8f\x95\x52\xf4\x94\xd2\x6b\x2c\x2d\x5c\
+\x40\x80\x1d\xf5\x82\x55\xcb\x65\x9a\xef\xde\x96\x98\x49\xbe\x9a\
+\x3f\x5c\x67\x0a\x7d\x6c\x27\x35\xc5\x57\xb9\xcb\x9d\xc8\x61\xf2\
+\x7b\xdd\x01\x2b\x02\x3f\xff\x20\xf9\xf8\xdd\x48\xc1\xe6\xb7\x99\
+\xe8\xa3\x38\xe3\x3c\x9b\x48\xc4\x5d\xe1\x85\xfb\xb6\x3d\x04\xa0\
+\xd2\x2e\x10\x49\xcf\xad\x36\x2b\xb2\xd6\xe6\x3e\x9f\x7d\x60\xf1\
+\xfe\xeb\x91\xc0\x9f\x7d\xa7\x2e\x9a\xee\xbd\x0c\x98\x08\xc7\x67\
+\xb5\x77\xb2\x57\x7b\x3f\x52\xf0\xa7\xef\x24\x8b\xe6\xef\xdf\xd9\
+\x7e\x21\x00\xec\x84\x48\x09\x13\x8f\x70\xe8\x3f\xc8\x98\xbf\x56\
+\x9a\x82\xa7\x5b\x01\x56\x26\x20\x90\x5a\x2d\xe3\x71\x58\xb6\x58\
+\x14\x9c\x6d\x97\x50\x80\xf2\x0a\xb8\xec\x86\x38\x03\x06\xeb\x94\
+\xe9\x9a\x5c\xe1\x35\x48\x91\x65\xf2\x27\xdd\x81\x84\x39\x6c\xc1\
+\x86\xb5\x82\x57\x9e\x36\x49\x2f\x85\x9a\xfe\x95\x55\x70\xf6\xc5\
+\x0e\x5d\xba\xe9\xe4\xea\x2f\x7d\xfc\xfe\xa4\x15\xe0\xb5\x06\xb4\
+\x51\x46\x21\x34\xcb\x16\x09\x9e\x7c\x30\x4a\x63\x43\x00\xd6\xdd\
+\xed\x31\xd0\xbb\x9f\x49\x12\x4a\x16\xe9\x24\x95\xde\x5d\xed\xdd\
+\x63\xc9\x73\xa4\x93\x7f\x52\xc2\x8a\x25\x82\xa9\xdf\x5a\x29\xf2\
+\x32\x94\x10\x00\x0a\x11\xa5\x60\xf8\x68\xc5\xc4\xc3\x4d\x7b\x2d\
+\xad\x05\xda\x72\x15\x3d\xcd\x0a\xd0\xc9\x73\x49\x70\x48\x00\x82\
+\x65\x96\xc0\x35\x2b\x05\x9b\x36\x04\x2f\x36\x39\xf5\x6c\x9b\x63\
+\x4f\x76\x4c\x83\x8f\x36\x4c\xfe\xac\x73\xd2\x28\x68\x6b\x2b\xbc\
+\xf1\x42\x24\xd0\x0a\x28\x84\x19\x25\x76\xc0\xf8\x54\xc8\x2f\x01\
+\x0c\x28\x8f\x15\xe0\x75\x07\x48\xf7\xfb\x85\x05\x0d\x0d\x82\xa7\
+\x1f\x8a\xb2\x2c\x60\x91\x91\x90\xa6\xaf\x7f\x59\x99\x01\xbe\x48\
+\x24\xb5\xda\x67\x32\xfb\xc2\x87\x14\x44\x68\x84\x5b\xe3\xff\x4d\
+\x62\x94\x59\xb8\xfa\x87\x00\x50\xa8\x68\x0d\x1d\x3b\x6b\x8e\xfb\
+\xad\x43\x45\xa5\xf1\xfb\x2d\x57\x99\x13\x0a\xee\x35\xf9\xad\x84\
+\xad\x9b\x00\x87\x84\xdf\x2f\x60\xf3\x46\x58\xba\x48\x06\x5a\x81\
+\x94\x03\xa3\xc6\x69\x7e\x7f\xb5\x22\x56\x02\xca\xb3\xfa\xa7\x9b\
+\xfc\x1a\x29\x04\x0a\x72\xba\x03\xdf\x7d\x6e\xf1\xd9\x87\x01\x0a\
+\x7d\xdc\x4c\xc3\x13\x4f\x37\xcd\x45\x94\x16\x48\x2f\xb1\x97\xa1\
+\xe8\xb8\x16\x87\xf4\xb8\x03\xda\x05\x87\x0f\xdf\xb2\xf8\xfc\x43\
+\x8b\x40\x83\x74\x35\xd4\x74\xd2\xd4\x74\xd4\x38\x8e\x31\xf7\x1d\
+\xcf\x2a\x9f\x54\x7c\x04\x8e\xd0\x3e\xc7\x8d\x85\x60\x6b\xcd\xf4\
+\x1f\x2d\xd6\xac\x14\xa1\xf2\x87\x00\x10\xf0\x03\x89\xc0\xb1\x27\
+\x39\xf4\x19\x60\x56\x20\x99\x5c\xdd\x35\x56\x62\x36\x9d\x37\x02\
+\x90\x83\x14\x6c\x69\x86\xf9\xbf\x48\x9a\x9b\x08\x58\xe7\x0e\x57\
+\x4d\x56\xf4\xe8\x6d\xf2\x07\x84\x34\x2b\x9a\x1f\xcb\x9f\x8c\xf1\
+\x67\x24\x02\x49\x60\xf9\x12\xc1\xcb\x4f\x99\x42\x9f\x42\x4d\xff\
+\xda\x8e\x9a\xdf\x9d\x6f\xfa\x0a\x2a\x95\x48\xf8\xf1\x10\x7b\x99\
+\x7e\xbf\x1f\x29\x28\xcc\xfb\x7e\xf1\x89\x08\xad\xad\x04\xea\x2e\
+\x54\x5a\xaa\xe9\xdc\xd5\xf0\x07\x5e\xd6\x3f\x71\x9b\xf2\xf7\x73\
+\x1f\x17\x12\x56\x2c\x95\xcc\x99\x11\x2c\xe4\x18\x02\x40\x28\x68\
+\x05\xe3\x0e\x55\x1c\x3c\xc9\x4c\xa5\xb5\x12\x35\x3e\x19\xbe\xbd\
+\xf6\x10\x7f\x56\x06\x20\x24\x48\xc1\x45\xf3\x24\x1b\xd7\x07\x33\
+\xfd\x85\x80\x73\x2e\xd6\x1c\x7a\xa4\x49\x69\x35\x2d\xc7\x4d\x01\
+\x4d\xe2\x7c\xb6\xc9\x9f\xce\x07\x48\x01\x4d\x0d\xf0\xd2\x93\x11\
+\x56\x2c\x2b\xdc\xfc\xb6\x2c\x38\xe1\x74\xd3\x57\xd0\x71\x3c\x6e\
+\x87\x04\xe9\x82\x40\x16\xfb\x9f\x16\x06\x34\x8f\x53\xbf\x55\xf0\
+\xcc\x43\x11\xd6\xad\x11\x01\x0b\x7d\x24\x3d\x7b\x47\xa8\xa8\x50\
+\x58\x16\x19\x9b\x4e\xfd\x2d\xdd\x7d\xf7\xfb\x89\xc8\xd4\xdf\x96\
+\x05\xdb\xb7\x29\x7e\xfe\xde\xe4\xfc\x87\xca\x1f\x02\x40\xc1\xa2\
+\x14\xf4\xec\xad\x39\xe9\x77\x36\x65\x15\x10\x6f\xc5\xc7\xb7\xd7\
+\xe0\xb1\x02\xfc\x48\x41\x04\xac\x5a\x2e\x58\x3c\x5f\x9a\x0b\x82\
+\x4c\xd5\x39\x02\xce\xff\x83\xc0\x92\x12\xe5\xe6\xd2\x8b\xe4\xf2\
+\x6e\xca\x7c\xfd\x4d\x7e\xd7\x1d\x90\x20\x34\x7c\xf2\xbe\xc5\xd7\
+\x9f\x16\x6e\x7e\x2b\x05\xe3\x0e\x56\x1c\x79\x9c\x93\x2a\x8f\xcd\
+\x22\xf8\x32\xe2\xfc\x9e\xf3\x09\x6b\xc0\x51\xf0\xee\xab\x16\x3f\
+\x7e\x1b\x8c\x75\xd7\x5a\x53\xdd\xa1\x92\x3f\x4f\xbe\x92\xe1\x43\
+\x7a\xa1\xb4\xed\x9a\x3b\x0a\x21\x9c\xe4\xdf\x08\xd3\x47\x00\xe1\
+\x64\xef\x0b\x85\x65\x69\x66\xcc\x5c\xcb\x27\xef\x4c\x01\x1a\x0b\
+\xff\xf0\x43\x00\xd8\xbf\x25\xd1\xdd\xf6\x94\xb3\x6d\x7a\xf5\xd1\
+\x6e\xc8\xcf\x63\xee\xa7\x01\x81\xce\x4d\x0a\x0a\xcd\x8e\x3a\xc1\
+\xcc\x9f\x64\xa0\x15\x48\x29\xe8\xda\x1d\xae\x99\x2c\xe9\xd4\x05\
+\x1c\xdb\x28\xbe\x76\x69\x7f\x81\x32\x9a\xed\x93\xfb\xef\x65\xfe\
+\x2d\x09\x73\x67\x49\x5e\x79\xba\x70\xf3\x5b\x2b\xe8\xda\x5d\x73\
+\xea\xd9\x36\x65\xe5\x29\x9f\x3e\xa9\xe8\x1e\x85\x57\x78\xdc\x00\
+\x52\xb7\x89\xb2\xe4\x99\xd3\x24\x6f\xbe\x68\x05\x0a\x77\x82\xf1\
+\xdb\x37\x6d\xde\xc6\x97\xdf\xcc\xe3\xfc\x33\x4e\xa4\xb4\x24\x82\
+\xf2\x8c\xeb\x26\x73\x82\x6f\xc6\x20\xcf\xe4\x75\xda\x61\x60\x9f\
+\xfe\xcc\x9e\xbd\x85\xbb\x1f\xf8\x3c\xfc\x61\x17\x20\x21\x45\xe2\
+\xca\xe1\xc7\x3a\x4c\x38\x4c\x25\x43\x5e\xd2\xd2\x48\x8b\xe4\x96\
+\x30\x31\x93\x26\xa8\xe7\x9c\xb9\xde\x28\xc2\xac\x9f\x64\x60\xd6\
+\x3f\x1a\x85\x8b\xaf\x8c\x30\x76\x82\xe5\x66\xfb\x25\x14\xdf\x75\
+\xaa\xdd\x2d\x5f\xe5\x9f\xb4\x34\xdb\xeb\xe1\xd9\x87\x23\xac\x0f\
+\x60\x7e\x47\x63\x70\xe2\xe9\x0e\xbd\xfb\xeb\x64\xc5\x9c\x4a\x56\
+\xfb\x91\xaa\xf6\xd3\xb9\x4b\x80\x01\x36\x6d\x10\x3c\xff\x68\x84\
+\xba\x2d\x3b\xdf\x5e\xeb\xf9\xd7\x3f\xe6\xa9\x97\xa6\xe0\x10\xc7\
+\x71\x52\x9b\xed\xc4\xb1\x55\x1c\x47\xb9\xc7\x94\x67\xdf\x73\xdc\
+\x56\x71\x64\x44\x73\xdd\xd5\x93\x38\xec\x90\xfe\x7b\xac\x2d\x7b\
+\x08\x00\x45\x2c\x4a\xc1\xa0\xa1\x9a\x53\xcf\x71\x88\x95\xa4\x5a\
+\x65\x19\x65\xd7\x49\xa5\xf7\x82\x81\x51\x7a\xed\x01\x04\x43\x1e\
+\x2e\x5d\x24\x59\x38\x57\x06\x52\x00\xe5\xc0\x91\xc7\x59\x9c\x79\
+\xbe\x65\xcc\xfd\xc4\xaa\xef\x52\xff\x89\x63\x09\x30\x48\xab\xef\
+\xf7\x34\xfb\x00\x78\xe7\x95\x08\x3f\x7e\x53\x78\xc6\x9d\x56\x70\
+\xd0\xa1\x0e\x07\x4f\x32\x85\x3e\x2a\x57\x83\x0f\xaf\xc2\x2b\x0f\
+\x08\xb8\xc7\xed\x38\xbc\xf5\x52\xf0\x4c\x43\xaf\x08\x21\x68\x6e\
+\x6e\xe1\xbf\xee\x79\x81\x9f\x67\x2e\x70\xc9\x57\x95\x3e\x43\xc0\
+\x6d\x3d\x9e\x6a\x36\xe2\x6e\x3a\x75\x8d\x52\x0e\xdd\xba\x55\xf2\
+\x8f\x7f\x3c\x86\xae\xdd\xaa\xda\xd5\xc4\xe6\x10\x00\xda\x99\x98\
+\x61\x9a\x9a\x73\x7e\x6f\xd3\xad\xbb\x4e\x2a\xbf\x77\x55\x4f\x5a\
+\x00\x59\x56\x80\xe7\x5c\x04\xea\xb6\x08\xa6\x7d\x27\x03\xd5\xb9\
+\x9b\x62\x1b\xc9\xd5\x37\xc5\xa8\xaa\x92\x68\x2d\x3c\x20\x20\x52\
+\xac\x5f\x42\xf9\x31\xd6\x41\xa6\x15\x10\xb1\x60\xc6\x54\xd3\xdd\
+\x36\x48\x5b\xef\x9e\x7d\xb5\x99\x22\x1c\x4b\x57\xe8\x34\xa5\xcf\
+\x38\xa6\x5c\x10\x48\x80\x05\x02\xa6\x7e\x6b\xed\x92\xf6\x5a\x52\
+\x4a\x96\x2e\x5b\xcb\xbf\xff\xf5\x39\xb6\x6c\xdd\x66\xfc\x7b\xd2\
+\x27\xf7\x92\x70\x09\x50\xae\xd9\xaf\x3c\xfb\x66\x73\x1c\x9b\xc3\
+\x0e\xed\xcb\xb5\x57\x4e\x24\x12\x09\x8d\xdc\x10\x00\x72\x88\x10\
+\x70\xd2\xef\x1c\xc6\x1d\xec\x78\x4c\xff\x0c\x06\x5a\x6a\x5f\x40\
+\x90\x09\x0b\x21\x62\xb2\xd5\x7e\xfc\x5a\xb2\x65\x53\xb0\x42\x9f\
+\xd2\x52\xb8\xe2\xfa\x18\xc3\x46\x5a\xc9\xe9\xc4\xc6\xf4\xf7\xb8\
+\x00\x42\x24\xf7\x13\xe7\xd2\x4d\x7f\xd8\xb4\x51\xf0\xc4\xfd\x51\
+\xea\x36\x15\x3e\xd1\xa7\xac\xcc\x98\xfe\x89\x6c\xbf\xcc\x15\x3f\
+\xad\xc9\x87\xf6\xb3\x0e\xcc\x13\xad\x5b\x25\x78\xf9\x29\x6b\x97\
+\x0d\xd3\x94\x96\xe4\xbd\x8f\xa7\xf2\xe8\x33\x1f\xb8\x63\xbb\xd3\
+\x57\xf8\x94\xa2\x3b\xee\xbe\x07\x0c\x3c\x7c\x81\x40\x71\xe9\xc5\
+\xe3\x38\xee\xd8\x81\xee\xb0\xd2\x50\x42\x00\xf0\x88\x52\x70\xc0\
+\x78\xc5\x69\xe7\x38\x44\xa3\x29\x93\x3e\x4d\xd9\x93\x80\x90\x19\
+\x86\xf2\x9c\x93\x9a\x5f\x66\x48\x16\xcc\x91\x81\x0b\x7d\x4e\x3e\
+\x3d\xc6\xc9\xa7\x97\xa4\x02\xe8\x69\x26\xbf\xff\x6d\xca\x45\x70\
+\x09\x39\x07\x5e\x7e\x2a\xc2\xcc\x69\xc1\x8a\x6d\x26\x1e\xe1\x30\
+\x7a\x9c\xca\xf6\xfb\x0b\x71\x03\xdc\x64\xa0\x96\x66\xc1\xeb\x2f\
+\x44\x58\xba\x68\xd7\xe6\xda\xdb\xb6\xc3\xdd\x0f\xbf\xcd\x57\xdf\
+\xff\xe2\xd6\x5f\xa4\xaf\xf0\x99\x2e\x41\x36\x38\x28\x94\x76\xa8\
+\xa9\x8d\xf1\xa7\xdb\x26\xd1\xb7\x6f\x75\xe8\x0a\x84\x00\xe0\x51\
+\x3e\x05\x9d\xbb\x68\x2e\xba\xca\xa6\x53\x67\x33\x50\xc3\xac\xea\
+\x3a\x65\xe6\x7b\x36\x5f\x52\xd0\xf5\xfb\xd7\xad\x11\x7c\xff\x65\
+\xe1\xc3\x34\x13\xe0\x33\x74\x84\xc5\x15\xd7\x97\x53\x56\x96\x69\
+\xfa\x7b\x4d\xfe\x54\xff\xc1\xb4\x7d\xf7\x5a\xcb\x82\x6f\x3e\xb3\
+\x78\xfb\xe5\x48\xa0\xe7\xee\x3f\x48\x73\xf4\x89\xca\x65\xf4\x85\
+\xbf\xa2\xab\x5c\x1c\x00\x24\x74\xe9\xdb\xcf\x2d\xbe\xfa\xdb\xae\
+\x6f\xaf\x25\xa5\x60\xdd\xba\x3a\xfe\xf7\x5f\x5e\x61\xed\xfa\xcd\
+\x08\xa9\x33\xcc\xff\x74\x97\x40\xe7\x70\x09\x6c\xc7\xe1\x80\x03\
+\xba\x70\xe3\x0d\x07\x51\x52\x62\xed\xf7\x1d\x80\x43\x00\x70\xc5\
+\x8a\xc2\x39\xbf\x77\x18\x73\xa0\x4a\x86\xcf\x92\xca\xee\x63\x05\
+\x64\x92\x82\x52\x1a\xbf\xbf\xa5\x19\xbe\xf8\xd8\x62\x6b\x5d\x30\
+\xd3\xbf\xb2\x4a\x70\xcd\xcd\x15\xf4\x1b\x18\x41\x69\xcf\xaa\xee\
+\xf1\xf5\xc9\x8a\x00\x78\xcf\x09\x2c\x69\x2a\x0c\x1f\xbf\xb7\xf0\
+\xee\xb6\x89\x42\x9f\xe3\x4f\x75\xa8\xae\x31\xd9\x7d\x46\xb9\x85\
+\xaf\xf2\x67\xb9\x01\xee\x71\x01\x2c\x5f\x2a\x78\xe3\x45\x8b\x96\
+\xdd\x34\x4c\x53\x5a\x92\x2f\xbf\x9d\xcb\x7d\x8f\x4c\xc1\xb6\x6d\
+\x72\x91\x7e\x29\xab\xc0\x71\xc7\x8e\xa7\xbb\x04\x5a\x3b\x9c\x7b\
+\xf6\x50\x4e\x3f\x75\xf0\x1e\x1f\xd9\x1e\x02\x40\x3b\x14\xa5\x60\
+\xd2\xd1\x0e\xa7\x9e\x63\x67\xfb\xf6\xde\x2c\x33\x2b\x03\x14\x64\
+\xfa\xea\x2f\x05\xfc\xf8\x8d\xc5\xa2\x79\xc1\xcd\xdf\xb3\xfe\xae\
+\x9c\x63\x8e\x2f\x45\x39\xe9\x0c\x7f\x9a\xc2\xfb\x9a\xfe\x09\xf3\
+\x5f\xd2\xd2\x2c\x79\xea\xc1\x08\xf3\xe7\x04\x28\xf4\x91\xa6\xbd\
+\xd7\xa0\x61\x26\xdb\x2f\x5d\xd1\x45\x96\xc2\xe7\xb2\x02\x1a\x1b\
+\xe0\x8d\xe7\x23\xac\xdd\xcd\xed\xb5\xb4\xd6\x3c\xfa\xf4\x67\x7c\
+\xf8\xe9\x0c\xa4\xa5\x73\x92\x7e\x7e\x11\x82\x04\x38\x28\xe5\x50\
+\x5e\x6e\x31\xf9\xe6\x03\x19\x36\xac\x36\x74\x05\xf6\x67\x00\x50\
+\xca\x94\x99\x5e\x76\x83\x4d\x87\x6a\x9d\xb1\xba\x7b\x2d\x00\x9d\
+\xc1\x01\xa4\x5b\x01\x91\xa8\x09\xf9\x7d\xf3\x99\x0c\x36\xcb\xde\
+\x81\x71\x07\xc5\xb8\xf4\xaa\x4a\xa2\x51\xcf\x8a\x2e\x32\xc3\x7d\
+\x12\xd2\x88\xbf\x44\x08\xd0\x5c\x23\x85\xe0\xa3\x77\x2d\x3e\x78\
+\xcb\x0a\x94\x6c\x34\x78\x98\xe2\x90\x23\xdd\xb6\xde\xca\x9f\xd8\
+\xcb\xe5\xf3\x7b\xb7\xcf\x3f\xb2\xf8\xe9\xfb\xdd\x5f\x63\x2f\x84\
+\xa0\xae\x6e\x07\xff\xf9\xd7\xb7\x59\xb6\x62\x03\x52\x68\x7f\xd2\
+\x0f\xc7\x67\x3f\x45\x14\x3a\xca\x61\xf0\xe0\x0e\xdc\x32\x79\x1c\
+\x95\x95\xd1\xd0\x15\xd8\x1f\x01\x20\xc1\xba\xff\xe1\x3a\x9b\x61\
+\xa3\x12\x09\x3f\xda\x87\xd9\x4f\xcf\x3f\xcf\x72\x07\x22\xb0\x7d\
+\x1b\x7c\xf8\xb6\xc5\xf6\xfa\x60\xa6\x7f\xc7\xce\x92\xeb\x6f\xa9\
+\xa6\x7b\x8f\xa8\x29\xb2\xf1\xfa\xf4\x22\xdb\x05\xf0\x5b\xfd\x2d\
+\x4b\xb0\x70\x9e\xe4\x89\xfb\x0b\x2f\x34\xd2\x1a\x6a\x6a\x35\xc7\
+\x9e\xe4\x50\x5e\x91\x32\xe5\x33\xe3\xf9\x7e\x9b\xd7\x2a\x10\x02\
+\x16\xcd\x37\x7d\x05\xed\x3d\x34\x4c\x53\x5a\x92\x9f\x66\x2c\xe7\
+\x8e\x7b\x3f\xa4\xb9\xa5\x15\x44\xee\x3c\x00\x9d\xd3\x25\x70\x70\
+\xb4\xcd\xc9\x27\xf7\xe1\xdc\x73\x07\xe1\xdb\xb3\x2d\x04\x80\x7d\
+\x1f\x00\x4e\x3c\x5d\x73\xd2\x19\x26\xa7\x5e\x7a\x0b\x4d\x32\x98\
+\x7d\xe9\x21\xfe\x32\xdd\x01\x80\xcf\x3e\xb4\x58\x1a\x70\xb0\x84\
+\x94\x70\xd1\xa5\x1d\x38\x64\x52\x99\x6b\xfa\xcb\x0c\xe2\x2f\xd3\
+\x12\x10\x19\x60\x60\x92\x83\x76\x6c\x17\x3c\x76\x2f\xac\x58\x42\
+\xa0\x42\x9f\x49\xc7\x28\x7a\xf7\xd3\xc9\xd1\x58\xb9\x15\x5d\xf8\
+\xba\x01\x00\xf5\x5b\xe1\xad\x17\xad\x40\xe1\xce\x5d\x21\x42\xc0\
+\x0b\xaf\xfc\xc0\x1b\xef\xfc\xe4\x16\x46\x65\x92\x7e\xaa\xed\xa4\
+\x21\xad\x88\xc6\xe0\xba\x6b\x87\x33\x6e\x5c\xa7\x30\x34\xb8\x3f\
+\x01\x80\x61\xdd\x05\x97\x5d\x27\x28\x2d\x95\x20\x64\x56\xa8\x2f\
+\xcd\xd4\xcf\x41\x0a\x46\xa2\x30\xfb\x67\xc9\x37\x9f\x59\x81\xd6\
+\x10\xe5\xc0\xa4\x23\xcb\xb9\xe0\x92\x6a\x64\x06\x99\x97\xed\xeb\
+\xfb\x44\x01\x3c\xee\xc1\x5b\x2f\xc3\xe7\x1f\x11\x28\xdb\x6f\xf8\
+\x68\xc5\xb8\x83\x9d\x54\xb8\x4f\xf9\x0c\xf3\x48\x23\x00\xb3\x53\
+\x7e\x95\x03\x7f\x9b\x62\x31\x77\xd6\x9e\x6f\xaf\x25\x84\xa0\xa1\
+\xb1\x95\xbf\xdc\xfd\x31\x73\x17\xac\x41\x4a\x92\xca\xaf\x33\x5c\
+\x00\xff\xa4\x21\x27\x99\x20\xd4\xab\x77\x19\xb7\xdc\x3a\x92\xda\
+\x8e\x25\xa1\x2b\xb0\x3f\x00\x40\x82\x75\xbf\xea\xe6\x08\xfd\x06\
+\x5a\x68\x15\x41\x60\x21\xa5\x48\x2f\x37\xf5\x4d\xf7\x4d\x9d\x8b\
+\x44\x61\xd3\x7a\xc1\x3b\xaf\x46\x68\x6c\x08\x56\xe8\xd3\xa3\x57\
+\x84\xeb\x6f\xe9\x44\x6d\xc7\x88\x9b\x40\xe3\x65\xfd\xf3\x25\xfe\
+\xa4\xcc\x7f\xcb\x92\xcc\xfc\x49\xf3\xec\xa3\xba\xe0\x6c\x43\xad\
+\xa1\x53\x57\xcd\x11\xc7\x39\xc4\x62\x3e\xa6\x7f\x1b\x29\xbf\xca\
+\x93\xeb\x3f\x67\xa6\xe4\xb3\x0f\x22\xa8\xbd\x94\x5e\x2f\xa5\x60\
+\xc1\xc2\x0d\xfc\xe5\xce\x4f\xd8\xde\xd0\x88\xc0\x9f\xf4\xcb\x95\
+\x17\x80\xcb\x07\xd8\x8e\xcd\x91\x47\x75\xe1\xf7\x97\xf6\x0f\xcb\
+\x85\xf7\x07\x00\x00\x38\xf3\xef\xa2\x1c\x7d\x5c\x14\xe5\x58\xee\
+\x4c\x3f\x2b\x09\x02\xd2\x43\xfc\xe5\x4a\xf7\xb5\x22\x66\x18\xe5\
+\xbb\xaf\x59\xac\x5c\x2a\x02\xf5\xb7\x8b\xc5\x04\x97\x5f\xd3\x89\
+\x03\xc6\x95\xa1\x54\x2e\xd6\x5f\xa6\x5b\x02\x19\xae\x80\x10\x92\
+\xba\xcd\xf0\xd0\x5d\x0e\xeb\xd7\x14\x3e\x50\x33\x1a\x85\x49\xc7\
+\x38\x74\xe9\x9a\x1a\xe7\xe5\xa7\xfc\x99\xd9\x7e\x29\xa0\x30\x1a\
+\xb2\x65\x93\xe0\xdd\xd7\xac\xbd\x3e\x4c\x53\x08\xc1\xdb\xef\xfd\
+\xc2\xf3\x2f\xfd\xe4\x2a\xb9\x7f\x1e\x80\xf6\x44\x09\xfc\x5c\x02\
+\x29\x15\x7f\xb8\xac\x3f\x93\x0e\x0f\x5d\x81\x7d\x1a\x00\x0c\xeb\
+\x1e\xe1\xd2\xab\xca\x88\x46\x13\x63\xbd\x23\xc9\xe9\xbd\x02\x99\
+\x6c\xfc\x61\x59\x79\x48\xc1\x08\x7c\xf7\xa5\xe4\xdb\xcf\xad\x40\
+\x25\xe6\x4a\xc3\xf1\x27\x55\x71\xd6\xb9\x35\x50\x50\x86\x5f\xa6\
+\x25\xe0\x8e\x18\x53\x82\x17\x9f\x72\xf8\xf1\x9b\xc2\x07\x6a\x6a\
+\x0d\xa3\xc6\x29\x86\x8f\xf6\xc6\xfb\x7d\x14\x5e\xe5\x9b\xf2\x6b\
+\x9a\x9a\x7e\xf2\x9e\xc5\xd2\x85\x7b\xbf\xb3\xae\x10\xd0\xda\xea\
+\x70\xcf\xfd\x5f\x33\x6d\xfa\x4a\x37\x34\xe8\x9f\x07\x40\x1e\x97\
+\x40\x69\x87\x4e\x9d\x23\x4c\xbe\x75\x30\xdd\x7b\x94\xee\xd7\xa1\
+\xc1\x7d\x16\x00\x12\xac\xfb\x75\xb7\x54\xd1\xad\x47\x14\xad\x52\
+\x23\xbb\xbd\x23\xbc\xa5\xb0\x32\x38\x80\x74\x52\x30\x12\x85\x95\
+\x4b\x05\x6f\xbc\x10\x09\x5c\xe3\x3f\x70\x50\x09\xd7\xdd\xdc\x8d\
+\x8a\xca\x08\xe8\x44\x4b\x5f\x49\x5e\x17\x20\x83\x18\xb4\x2c\xc1\
+\xf7\x5f\x39\xbc\xf4\x74\xbc\x60\xf3\x5b\x6b\xe8\xd6\x43\x73\xc8\
+\x11\xa6\xbb\x4e\xe6\x10\x4f\x9d\x2f\xce\xef\x39\x26\x80\x99\xd3\
+\x2c\xbe\xfb\xa2\xfd\x0c\xd3\x94\x52\xb0\x6a\xd5\x36\xfe\xfb\xf6\
+\x2f\xd9\xbc\xa5\xc1\x2d\x18\x2a\xac\x52\xd0\x7b\xde\xb1\x1d\xc6\
+\x1f\x54\xc5\x15\x57\xf5\x71\x43\xb2\x21\x00\xec\x5b\x6f\x4c\xc2\
+\x45\x7f\xa8\xe2\x90\x49\x65\x68\xc7\x28\x7c\x42\xf9\xf1\x6c\x89\
+\x91\xde\x7e\xa4\x60\x24\x02\xcd\x4d\xf0\xca\xd3\xc1\x92\x5e\xb4\
+\x86\xf2\x72\xc9\xb5\x37\x76\x63\xc8\xd0\xb2\x64\xc8\x4f\x64\x64\
+\xf5\xe5\x4b\xfc\x11\x08\xa4\x25\x58\xb7\x06\x1e\xbc\xab\x85\xad\
+\x5b\x74\xc1\x21\xbf\x92\x52\x93\xf0\x53\x5d\xab\xd3\xcc\xf9\xdc\
+\xfe\x7e\xb6\x1b\x00\xb0\x7e\xad\xe0\xc3\xb7\x2c\x9a\x9a\xda\x57\
+\x7b\x2d\x69\x09\x3e\xfd\x7c\x29\x8f\x3f\xf5\x93\x5b\x30\xe4\x4f\
+\xfa\xa1\x1d\x8f\xe2\x3b\xbe\x49\x43\xe7\x5d\xd0\x9d\xdf\x1c\xdf\
+\x71\xbf\x75\x05\xf6\x49\x00\x50\x0e\x1c\x7e\x54\x39\x17\xfc\xbe\
+\x06\x29\x22\x64\xae\xfa\xc2\xb3\x0f\xf9\x49\xc1\x8f\xdf\x8d\xf0\
+\xfd\xd7\x56\xc0\x16\x57\x70\xc6\x59\x1d\x39\xf9\xd4\xda\x24\xe9\
+\x97\xa5\xe0\xa2\xed\xc4\x9f\x78\xab\xe0\xa9\x87\x9b\x99\x35\xdd\
+\x29\xd8\xf4\x17\x02\xc6\x8c\x57\x0c\x18\xac\xd3\xb2\xfd\x74\x8e\
+\x6c\x3f\xa5\xfc\xf3\x01\x5a\x9a\xe1\xe3\x77\x2d\xd6\xae\x6e\x9f\
+\x13\x75\x94\x52\x3c\xfa\xf8\xcf\x7c\xf5\xf5\x72\xa4\x3b\xa4\x20\
+\x93\xf4\x4b\x29\xbe\xdb\x42\x2c\x33\x62\xa0\x1d\x2a\xab\x04\x37\
+\x4e\xee\x4d\xbf\x01\x65\xfb\xa5\x2b\xb0\xcf\x01\x80\x52\xd0\xa3\
+\x77\x94\xeb\x27\x77\xa1\xb6\x63\x0c\xb4\x4c\x57\x7a\xb2\x41\x20\
+\x8b\x14\x94\x10\x89\x69\xe6\xcd\x36\x35\xf6\x4e\x90\x1a\x7f\x47\
+\x33\x7a\x4c\x39\x57\x5d\xd7\x83\x92\x12\xcb\x35\xfd\x45\x86\x82\
+\xfb\xe7\xfe\x8b\x0c\xd6\xff\xd3\x0f\xe3\xbc\xf9\x4a\x4b\xe1\xc0\
+\xa3\xa0\x67\x1f\xcd\x81\x07\x3b\xee\x44\x5e\x3f\x45\x17\x79\x7d\
+\xfe\x44\xa5\xdf\x4f\xdf\x4b\x66\x4c\x95\xed\x96\x29\x17\x42\xb0\
+\x69\x63\x23\xff\x7d\xfb\xf7\xac\x5d\x5b\x8f\x90\x05\x56\x0a\x66\
+\xe4\x0d\x38\xca\x61\xf8\xc8\x32\xae\xb9\xa1\x3b\xa5\x65\x72\xbf\
+\x0b\x0d\xee\x53\x00\xa0\x5d\xd6\xfd\xca\x6b\xba\x32\x76\x5c\x25\
+\x5a\x99\xb6\xbe\xb9\x14\x3e\xfb\x98\x4c\xfa\xfd\xf5\x5b\x05\x4f\
+\x3f\x18\x61\xd3\xfa\xc2\x7b\xcb\x6b\x0d\xd5\x35\x11\x6e\xbc\xa5\
+\x37\x7d\xfb\x96\x66\xb0\xfe\x85\x27\xfe\x48\x29\x59\xb6\xd8\xe1\
+\xe1\x7b\x1a\x68\xd8\x51\xb8\xe9\x5f\x5e\x69\xca\x7c\xcb\x2b\xc8\
+\x99\xf0\x93\xaf\xf2\x4f\xb9\x7e\xff\xaa\x15\x82\x4f\x3f\xb0\x02\
+\x35\x37\xd9\x2b\x3f\x5e\x4b\xf0\xe3\x8f\xeb\x78\xf0\xe1\x19\xc4\
+\xe3\x36\xb9\x2b\x05\xfd\x5d\x02\x6f\x17\xa1\x53\xcf\xa8\xe1\xd4\
+\x33\x6a\x43\x00\x28\x6e\x00\xd0\x9c\x70\x72\x2d\x67\x9d\xdb\x85\
+\xa4\x8f\xef\xba\x00\x78\x08\x40\x3c\x20\xe0\x47\x0a\x02\xbc\xfe\
+\x7c\xc4\xe4\xbb\x07\x19\x68\x29\xe0\xfc\x8b\xba\x73\xf4\xb1\xb5\
+\x28\x95\xa3\xaa\x2f\x93\xfd\x17\xe9\x2e\x80\x10\x92\xa6\x46\x78\
+\xe4\xde\x06\x16\xce\xb7\x0b\x36\xbf\xa5\x84\x03\x0e\x72\xe8\xd9\
+\x5b\xa7\xc7\xfb\x7d\x15\x5d\xf8\xfb\xfd\x6e\xa1\xcf\xdf\xde\xb7\
+\xd8\xbc\x51\x14\x4d\x9c\xfc\xf9\xe7\xe7\xf1\xe1\xc7\xcb\x4c\x54\
+\x20\x07\xe9\x87\xce\x76\x09\x12\x60\xa1\xb4\x43\x69\x29\x5c\x7d\
+\x7d\x67\x86\x8f\x2c\xdd\x6b\xb9\x0e\x21\x00\xfc\x0a\x51\x4a\x33\
+\x68\x70\x39\x37\xdc\xdc\x87\xca\xca\x28\x68\xff\x55\xdf\x0b\x02\
+\x7e\xa4\xa0\x65\x49\x7e\xfc\x3a\xc2\xeb\xcf\x05\xab\x1f\x57\x8e\
+\xe6\xe0\x43\xaa\xb9\xec\xca\x5e\x44\x22\x56\x0e\x85\xcf\x50\xf6\
+\x8c\x22\x9f\x44\xcb\xaf\x77\xdf\x6c\xe2\x83\x77\x9b\x02\xd5\x19\
+\xf4\x1d\xa0\x19\x79\x80\x4a\xf6\xeb\x4f\x9a\xfd\x3e\xdd\x7d\x72\
+\x66\xfb\x29\xf8\xe1\x6b\x8b\x79\xbf\x14\xcf\x30\x4d\x21\xa0\xbe\
+\xbe\x95\x3b\xef\x9c\xc1\x92\x25\x5b\x91\x52\xa5\xaf\xfa\x79\x2a\
+\x05\xbd\xfb\x8e\x72\xe8\x37\x20\xc2\x75\x37\x77\x72\xdb\xb3\x85\
+\x00\x50\x34\x62\x58\x77\x8b\xeb\x6f\xec\xc7\xd0\xa1\x55\xc9\x90\
+\x5f\xe1\xa6\xbf\xd9\x2c\xcb\x62\xdd\xea\x08\x8f\xdc\x15\x61\x6b\
+\x80\xee\xb6\x4a\x41\x97\x6e\x25\xdc\x7c\x6b\x7f\xba\x76\x2d\x71\
+\x57\x90\xdc\x8d\x3c\xfc\xcb\x7f\x25\xd2\x92\xcc\x9d\x1d\xe7\xb1\
+\x07\xea\x69\x69\x29\xdc\xf4\xaf\xea\xa0\x19\x7f\x88\x43\x49\x09\
+\xfe\xcd\x3d\x73\xc5\xfa\x3d\x0d\x3e\xc1\x4c\x13\xfa\xf6\x73\x33\
+\xc5\xb8\xa8\x7e\xc4\x96\xe0\x97\x5f\xb6\x70\xef\xbd\xb3\x69\x6a\
+\x8e\xa7\xe6\x08\xe4\xac\x14\x4c\xb9\x04\xde\x16\x63\x8e\xa3\x38\
+\xe6\xf8\x32\xce\x3e\xbf\x6a\xff\xd0\xfe\x7d\x07\x00\x34\x67\x9e\
+\xdd\x93\x53\x4e\xed\x81\xd6\x09\xd3\xbf\x40\x10\xf0\x9c\x8b\xb7\
+\x5a\x3c\xf3\x88\xe0\x97\x19\x22\x90\xe9\x1f\x89\x08\x2e\xbb\xa2\
+\x37\x13\x27\xd6\x98\x71\x5e\x1e\x05\x17\x6d\xe4\xfe\x27\xc1\x41\
+\x0a\xea\xb7\x29\x1e\xb8\x6b\x2b\xab\x96\xdb\x81\x0a\x7d\x0e\x38\
+\x48\xd1\x39\x33\xdb\x2f\x97\xcf\x9f\x95\x05\x68\x50\x66\xfb\x36\
+\xc1\x67\x1f\x58\xd4\x6f\x2b\x1e\xd3\xdf\x2b\x42\x08\xde\x7a\x6b\
+\x05\x6f\xbe\xb9\x0c\x21\xda\xaa\x14\x4c\x77\x09\xf0\xb8\x04\x91\
+\x88\xe6\xd2\x2b\xab\x38\x70\x42\x49\xd1\x01\xe1\x7e\x09\x00\xca\
+\xd1\x8c\x39\xa0\x86\xeb\xae\x1f\x4c\x49\x49\x34\xc9\xfa\xe3\x63\
+\xe6\xa7\xf9\xfc\x49\xc5\x37\xd7\x5b\xc2\xe2\xb3\x0f\xe1\x9d\x57\
+\x74\xe0\xe7\x3f\xe6\xd8\xce\x5c\x78\x51\x6f\xf7\xb1\x32\x4d\xfe\
+\x54\x77\x5f\x91\x2f\x0a\xa0\x25\xaf\x3c\xbf\x9d\x2f\x3e\x6d\x0c\
+\x94\xed\xd7\x7f\xb0\x66\xf0\xb0\xec\x6c\xbf\xc2\xd3\x7d\xcd\x1c\
+\xbe\xef\xbf\x92\x2c\x5b\x5c\x3c\xa6\x7f\x36\x00\x40\x53\x93\xcd\
+\x7d\xf7\xcd\x67\xce\x1c\xe3\x0a\xe4\x22\xfd\xf2\x25\x0d\x29\xe5\
+\xd0\xb5\x87\xe0\xba\xc9\x95\x74\xec\xbc\xef\xbb\x02\x45\x0d\x00\
+\x86\x75\x8f\x71\xcb\x2d\x23\xe8\xdb\xb7\x0a\xad\xa4\x49\xf5\xcd\
+\x50\xf2\x34\xe5\x17\xe9\x3e\x3f\xae\xe9\xbf\x6c\xb1\xe0\xd1\x7b\
+\x6c\x1a\x02\x15\xfa\x68\xfa\xf4\x2b\xe7\xe6\x5b\x06\x51\x53\x13\
+\x4b\x2b\xf4\xc9\x6f\xf2\xa7\x37\x01\xb5\x2c\xc9\xb4\x1f\x9a\x78\
+\xfa\xb1\x3a\x1c\xbb\xf0\xf7\x5e\xd3\x51\x73\xc0\x78\x85\x15\xc9\
+\xce\xf6\xf3\x8d\xf3\xfb\x90\x82\x02\x53\xe3\xff\xd3\x77\xc5\xdf\
+\x33\x4f\x4a\xc1\xb2\x25\x3b\xb8\xfb\xae\xf9\xd4\xd7\xb7\xb8\xbd\
+\x03\xb2\x49\x3f\xdf\x66\x22\x3a\xe5\x32\x38\x8e\xe2\xe0\x49\x11\
+\x2e\xfc\x43\x59\xd1\x02\xe2\x7e\x01\x00\x42\xc0\xc5\xbf\x1f\xc4\
+\xb1\xc7\xf6\x44\x39\xb2\x70\xb3\xdf\x1b\xfb\x17\x11\x9a\x1a\x25\
+\x8f\xde\xd7\xc2\xa2\x05\x2a\x50\xb6\x5f\x49\x89\xc5\xb5\xd7\x0d\
+\x64\xf4\x98\x6a\xd7\xf4\xcf\xd5\xc8\x43\xf8\x0c\xfa\x70\x6f\xa5\
+\x64\xe3\x06\x87\x7b\xef\xdc\xc4\xc6\xf5\x76\xc1\x21\xc7\x68\x14\
+\xc6\x1c\xa8\xe8\x50\x93\x91\xed\x57\x68\xc5\x9f\xeb\xf7\xd7\x6d\
+\x16\x7c\xf5\x89\x45\x53\xe3\xbe\x31\x4c\x53\x5a\x82\x8f\x3f\x5a\
+\xcf\x8b\x2f\xac\x0c\x50\x29\x98\x59\x40\xe4\x20\x84\xe2\xbc\xdf\
+\xc7\x38\xec\xc8\xe8\x3e\xed\x0a\x14\x2d\x00\x28\x47\x73\xe8\xa1\
+\xdd\xb8\xf2\x8a\x91\x44\x22\x79\xb2\xfd\xda\x38\x26\x85\xc5\xbb\
+\xaf\xb7\xf2\xd1\x7b\xad\x01\xdb\x7a\x6b\x4e\x3d\xad\x07\x67\x9d\
+\xdd\x1b\x74\xfe\x46\x1e\xde\x10\x5f\xa6\x65\xe0\xd8\x82\xa7\x1f\
+\xdf\xc2\xd4\xef\x1b\x91\x96\x28\xf0\xb9\x61\xe0\x50\x45\x9f\xfe\
+\x19\xa6\x7f\xae\x06\x9f\xca\xc7\x0d\xc0\x14\xfa\x7c\xf7\xa5\x64\
+\xed\xea\xc2\x73\x1d\x8a\x41\xe2\x71\xc5\x63\x8f\x2c\x67\xda\xb4\
+\x3a\xa4\xa5\x72\x92\x7e\xf9\x92\x86\x94\x56\xd4\xd4\x6a\xae\x99\
+\x1c\xa5\x47\x6f\xb1\xcf\x86\x06\x8b\xf2\x6b\x57\x4a\xd3\xb5\x5b\
+\x39\xb7\xdd\x36\x9e\x6e\xdd\x2a\xd3\x0a\x7d\xbc\x66\xbe\xc8\x30\
+\xfd\x33\x41\xc0\xb2\x22\xcc\x99\x65\xf3\xf8\x83\x3b\x0a\x66\xdd\
+\x13\xcf\x3f\x6c\x58\x07\x6e\xb8\x69\x28\xe5\xe5\xd1\xe4\x10\xcf\
+\x7c\x8d\x3c\xfc\xa6\xfd\x58\x96\xe4\xcb\xcf\xb6\xf3\xd2\xb3\x5b\
+\x0a\x36\xbf\xb5\x86\x4e\x5d\x34\xc3\x47\x2b\x84\xf4\x2f\xe2\x49\
+\xb4\xfa\xce\xaa\xfa\x53\xe9\xd9\x7e\xf3\x7f\x91\xfc\x32\xa3\xfd\
+\x66\xfb\xed\xf4\x8f\x5a\x0a\xd6\xad\x6d\xe6\xee\x3b\x96\xb2\x69\
+\x53\xb3\x29\x18\xca\x41\xfa\xf9\x27\x0d\x19\x97\xc0\x71\x14\xa3\
+\xc6\x0a\x2e\xb9\x3a\x42\x2c\xc6\x3e\xd9\x49\xac\x28\x01\x20\x12\
+\x91\x5c\x7d\xd5\x01\x1c\x3a\xd1\xdf\xf4\xcf\xf4\xf5\x33\x49\x41\
+\xdc\x95\xbf\x7e\x1b\x3c\x70\xd7\x36\x56\xad\xb0\x03\x99\xfe\x95\
+\x95\x51\x6e\x9a\x3c\x9c\xc1\x83\x3b\xb8\x09\x3f\xb9\x1b\x79\xf8\
+\xb3\xfe\x66\x04\xf8\xca\x15\xad\xdc\x77\xe7\x7a\xb6\x6d\xb5\x0b\
+\x53\x42\x0d\x25\x25\x30\x6a\xac\x4a\xcb\xf6\xcb\x9a\xde\xa3\xf2\
+\x47\x02\xd0\x66\x98\xe7\x77\x5f\x4a\xe2\xad\x01\x3e\x78\x8f\xeb\
+\xd0\xee\x7f\xd8\x96\xe0\xdb\xaf\xb7\xf2\xd4\x13\x6b\x70\x9c\x14\
+\x19\x58\x48\xa5\x60\x66\xa7\xa1\xd3\xce\x81\x63\x4f\x12\xec\x8b\
+\xa5\x02\x45\x07\x00\xca\xd1\x1c\x7f\x5c\x7f\x2e\xb9\x68\x0c\x52\
+\x44\x4c\x35\x5f\xa0\xb0\x9f\xb9\x5e\x6b\x8b\x97\x9f\xab\xe7\xcb\
+\xcf\x1a\x02\x85\xfc\x00\xce\x3d\xaf\x1f\x27\x9d\xd4\x2b\x99\xea\
+\x9b\xab\x91\x47\xce\xc4\x1f\x29\x68\x69\xd1\x3c\xf2\xc0\x7a\x66\
+\xcf\x2a\xdc\xf4\x47\x18\xd3\xbf\x5b\x0f\x9d\xbb\xbb\x8f\x1f\x1f\
+\xe0\x3d\x0f\xb4\xb4\x18\xd6\x3f\xf0\x28\xb3\x32\x41\xef\x7e\x56\
+\xd1\xac\x84\x5a\xc3\xf3\x4f\xaf\xe7\xab\x2f\xb7\x22\xac\x8c\xbc\
+\x80\xac\xf6\xe2\x2e\x48\xf8\xf4\x12\x2c\xaf\x50\x5c\x71\xa3\xa6\
+\xff\x20\xf6\x39\x57\xa0\xa8\x00\x40\x29\x4d\xbf\x7e\x35\xfc\xf1\
+\xd6\x49\xd4\xd4\x94\xa3\x75\x06\xeb\x9f\x2f\xce\xef\xb9\x26\x62\
+\x59\x2e\xeb\xbe\xb9\x60\xd6\x3d\x01\x3e\x07\x1e\xd8\x91\x6b\xaf\
+\x1d\x4e\x49\xcc\xf2\xf8\xfe\x9e\x2a\x3e\xd1\x76\xe2\x8f\x14\x92\
+\x0f\xde\xab\xe3\xad\xd7\x37\x07\x52\xc0\x2e\xdd\x34\x83\x86\x99\
+\x5f\x60\x5b\x13\x7c\x94\xcb\x07\x28\x95\xdd\xfc\x63\xee\x4c\xc9\
+\xa2\x79\xc1\x47\x99\x9d\x78\x5a\x94\x7f\xfd\xaf\x72\x7a\xf6\x96\
+\x45\xa1\x08\x42\x40\xdd\x96\x38\xf7\xde\xb9\x86\xd5\xab\x9b\xd3\
+\x0a\x86\xb2\xdb\x8b\xab\x9c\x49\x43\x4a\x39\x0c\x1c\xe2\x70\xf9\
+\x0d\x0e\x65\xe5\xec\x53\xa1\xc1\xa2\x01\x00\xd3\xd6\x3b\xc2\xcd\
+\x37\x1e\xca\xd8\x31\x3d\xdc\x61\x9a\x96\xfb\x16\xf2\xc4\xfa\x33\
+\x40\x41\xca\x08\x1b\x37\x28\xee\xb9\x63\x1d\x1b\x37\xc4\x03\x14\
+\xfa\x68\x6a\x3b\x96\x70\xeb\xad\x63\xe8\xd5\xab\x32\x2d\xd7\x5f\
+\xf8\x84\xf8\x72\x25\xfe\x58\x52\xb2\x70\x41\x13\xf7\xdf\xbb\x86\
+\xc6\x46\x27\xd0\x30\xcf\xe1\xa3\x55\x32\xdb\x4f\xe7\x08\xf7\x29\
+\x9d\x9b\x14\x44\x98\x51\x66\x3f\x7d\xbf\x13\xa3\xcc\x86\x4b\x2e\
+\xbb\x36\xc2\x41\x87\x68\x2e\xbd\x36\x4a\x49\x49\x71\x28\x82\xb4\
+\x04\x33\xa7\x37\xf2\xd8\x43\x1b\x68\x6d\x4d\x5f\xe5\x29\xa8\xbd\
+\xb8\x9b\x1f\xa0\x15\xbf\xf9\x6d\x9c\xdf\x9e\x69\xef\x53\x5c\x40\
+\x11\x01\x80\xe6\x77\xa7\x8d\xe2\xbc\xb3\xc6\xa6\xf2\xfc\x85\x95\
+\xb4\x00\x32\x0b\x7d\xc8\x41\x0a\x3a\xb6\xe4\xc9\xc7\xd6\x33\xf5\
+\x87\xed\x85\x9b\xde\x18\x62\xe9\xd2\x4b\x87\x72\xe4\x91\x3d\xdc\
+\xb0\x50\x9e\x16\x5f\xc2\xbf\xfc\x57\x0a\x49\x43\x83\xe2\xfe\xbb\
+\x57\xb1\x64\x51\x23\x52\x8a\x02\x9f\x1b\x06\x0e\x53\xd4\x76\x4a\
+\x65\xfb\xa9\x42\x52\x7d\x3d\x29\xbf\x00\x4d\x0d\x30\xf5\x9b\xe0\
+\xf3\x0c\x2a\xab\xe0\xca\x9b\x24\x7d\x06\x3a\xd8\x4e\x9c\x53\xce\
+\xd4\x1c\x7f\x4a\x71\x25\xc9\xbc\xf1\xf2\x56\x3e\x9a\xb2\xcd\x24\
+\x08\xe5\x20\xfd\xc8\x08\x05\x7a\xc1\x42\x69\x45\x34\xa6\xb9\xe8\
+\x4a\x9b\x61\xa3\xd5\x3e\xe3\x0a\x14\x05\x00\x28\xa5\x19\x31\xbc\
+\x1b\x7f\x9c\x7c\x0c\x15\x15\x65\xe9\x35\xfe\x42\xb6\xe9\xfb\x27\
+\x40\xc0\xb2\x22\x7c\xfe\xe9\x56\x5e\x7c\x6e\x5d\xe0\x42\x9f\xc3\
+\x0f\xef\xc1\xe5\x97\x8f\xc0\xb2\x2c\xda\x9c\xe0\xe3\xb6\xfe\xf2\
+\xeb\xf7\xf7\xda\xcb\x1b\xf8\x70\xca\x66\x37\x2f\xa0\x30\x05\xec\
+\xd6\x43\xd3\xa7\xbf\x2e\x50\xd9\x7d\x8a\x7f\x5c\x0b\xe1\x97\x19\
+\x92\x95\xcb\x82\xa7\xfa\x9e\x71\x1e\x1c\x75\xbc\x83\xe3\xb4\xe2\
+\xe8\x56\x4a\xcb\xe3\x5c\x76\x83\x62\xd0\xd0\xe2\xf0\x89\x85\x80\
+\x86\x06\xc5\x83\xf7\x6c\x61\xf1\xa2\x94\x2b\x90\x4d\xfa\x79\x66\
+\x0a\xa2\xd2\x23\x04\x5a\x61\xdb\xd0\xbd\x97\xe6\x0f\xd7\xd9\x54\
+\x55\xeb\x7d\xc2\x15\x68\xf7\x00\xa0\xb5\xa6\xaa\xb2\x84\xbf\xbf\
+\xe5\x78\x86\x0c\xee\x8e\x56\x62\xe7\x0a\x7d\x64\x84\x95\x2b\x5a\
+\xb8\xe7\xce\xa5\x6c\xdb\x1a\x0f\x14\xf2\xeb\xd1\xb3\x82\xdb\x6e\
+\x1d\x47\xe7\xce\x65\x6e\xaf\xbc\x7c\x13\x7c\xfc\x46\x7e\x49\x22\
+\x96\x64\xe6\xf4\xed\x3c\xf2\xd0\x4a\x5a\x5b\x55\xc1\xa6\x7f\x45\
+\x25\x0c\x1e\xae\x89\x58\x19\xcd\x3c\x54\x80\xac\x3f\x60\xf5\x0a\
+\xc9\xec\xe9\x56\xe0\x51\x66\x63\xc6\x6b\x2e\xba\x32\x8e\x15\x6d\
+\x45\xe9\x56\xb4\x6e\xc5\x76\x5a\xe9\x37\x30\xce\xe5\x37\xda\x54\
+\x54\x14\x89\x2b\x20\x61\xd1\x82\x56\x1e\xbe\xb7\x8e\xc6\x46\x27\
+\x59\x30\x54\x48\xa5\xa0\x46\x99\xcf\xd9\x01\x3b\x0e\x13\x26\x39\
+\x9c\x76\x8e\xb3\x6f\x24\x4e\x15\xc3\x8b\xbc\xf8\xfc\x43\x38\xed\
+\xe4\x03\x5c\x53\xd6\x02\x11\xc9\xf2\xf5\xc9\x09\x02\x26\x4c\xd8\
+\xd2\x02\x0f\xde\xbf\x8c\xd9\xb3\xea\x03\x99\xfe\xd1\xa8\xe4\x9a\
+\xab\x47\x33\x61\x42\xf7\xe4\x44\x9f\xfc\x13\x7c\x32\x07\x7c\x18\
+\xd3\x7f\xcb\x16\x9b\xbb\xef\x5c\xca\x9a\x55\xcd\x05\x9b\xfe\x96\
+\x05\x03\x86\x28\x2a\x3b\x68\x4f\x95\x9f\x68\x33\xbd\x37\x53\xf9\
+\x1b\x76\xc0\x4f\x3f\xc8\x40\xd9\x7e\x5a\x43\x6d\x27\xcd\x95\x37\
+\xc5\xe9\xdc\xcd\x26\x6e\xdb\x28\x95\xda\x6c\xc7\xe6\xa8\xe3\x6d\
+\x4e\x39\xdb\x6e\x37\xbf\x93\xb6\x44\x08\xf8\xf0\xbd\x26\xde\x7e\
+\x7d\x07\x88\x7c\x95\x82\xe9\x1d\x86\x95\x3b\x50\x45\x29\x70\x94\
+\x29\x3c\x3a\xf3\x02\x87\x31\xe3\x55\xd1\x67\x09\xb6\x6b\x00\x50\
+\x8e\x62\xc2\xf8\x01\xdc\x7c\xdd\x09\x94\xc4\x4a\xd2\x6a\xfc\x33\
+\x7d\xfd\x54\x8d\x7f\x26\x29\x18\xc1\x12\x11\xde\x7b\x67\x2d\x6f\
+\xbc\xbe\xaa\x60\xd3\xdb\x3c\xbf\xe6\xc4\x13\xfb\x73\xe1\x05\xc3\
+\xf3\x36\xf2\xc8\xc5\xfa\x27\xac\x00\xad\xe1\xd9\xa7\x57\xf1\xe5\
+\x17\x9b\x03\x65\xfb\x75\xef\xa9\xe9\xde\xd3\x2f\xe4\x27\xda\x74\
+\x05\x12\xf7\x71\x1c\x98\x3d\x5d\xb2\x61\x6d\x30\xd3\x5f\x4a\x38\
+\xeb\x22\x9b\x71\x07\x3b\xb4\xb4\x80\x6d\x43\xdc\xbb\xc5\x41\x08\
+\xcd\xf9\x97\xd9\x8c\x18\x53\x1c\x8a\x20\x04\xb4\xb4\x68\x1e\x7f\
+\xb0\x81\x39\xb3\x5a\x5d\x3e\xc0\xaf\x52\xd0\xab\xfc\x3a\xa9\xf8\
+\x4a\x81\x76\x04\x8e\x63\x66\x2d\x5e\x74\xa5\x4d\xc7\x2e\xc5\xed\
+\x0a\xb4\x5b\x00\xd0\x5a\xd3\xa9\x53\x15\xff\xfc\xc7\x33\xe8\xdb\
+\xbb\xb3\x1b\xf2\xcb\xdd\xca\x2b\x75\x3c\xdd\x3a\xb0\x2c\x8b\xf9\
+\xf3\xb7\x73\xef\x3d\xf3\x69\x6c\xb4\x03\x99\xfe\x03\x07\xd6\x70\
+\xdb\x2d\x07\xd1\xa1\xaa\xd4\x67\xa2\x4f\x22\xbf\x3f\x7f\xe2\x4f\
+\xc4\x92\x7c\xf3\x4d\x1d\x4f\x3d\xb1\x22\x50\x5b\xef\xaa\x0e\x9a\
+\x7e\x83\x8c\xab\xe0\xaf\xec\x22\xbb\xe9\x47\x06\x39\x08\xa6\xa5\
+\xf9\xc2\x39\xc1\xbe\x66\xe5\xc0\x41\x87\x2a\x4e\x3f\xcf\xc1\x76\
+\x20\xde\x2a\x7c\xb7\x96\x16\x41\xa7\x2e\x9a\x4b\xae\xb5\xa9\xae\
+\x2d\x0e\x45\x90\x12\x56\xaf\x70\x78\xf0\xae\x46\xb6\x6d\x75\x92\
+\x05\x43\xf8\xe4\x01\x68\xad\x93\xa6\xbf\x19\xab\x26\x92\x96\x80\
+\x6d\xc3\xc8\x31\x8a\x33\xce\x73\x92\x33\x23\x43\x00\xd8\xa5\x5f\
+\x94\xe0\x9a\xcb\x8e\xe7\xb8\xa3\xc6\x98\x6c\xbf\xbc\x71\xfe\x88\
+\x2f\x29\x28\x45\x84\x1d\x3b\x14\x77\xdf\xfd\x0b\x8b\x17\xd5\x17\
+\x6c\x7a\x9b\xb0\x5b\x84\x9b\x6f\x1c\xcf\xc8\x11\x5d\x5c\xc5\xcd\
+\xd5\xc8\x23\x57\xe2\x8f\xe9\xed\xb7\x76\x6d\x0b\x77\xdd\xb1\x90\
+\xcd\x9b\x5a\x0a\x06\x9f\x48\x14\xfa\x0d\xd2\x94\x95\x65\xe4\xf1\
+\xe7\x50\xf4\x5c\x85\x3e\xf5\x5b\x05\x33\x7f\x92\xb4\x06\xc8\xf6\
+\xd3\x0a\xba\xf6\xd0\x5c\x74\x95\x4d\x45\x25\xc4\x5b\x04\x76\x9c\
+\x9c\x5b\x4b\x8b\x60\xdc\x04\xc5\x69\xe7\x16\x8f\x4f\x2c\x2d\xf8\
+\xfa\xb3\x38\xaf\x3c\xd7\x82\xf6\x96\x0c\x67\x90\x7e\xde\x95\xdf\
+\xeb\x02\x28\x27\xd5\x78\xe5\xf8\xd3\x6c\xc6\x1f\x52\xbc\x51\x81\
+\x76\x09\x00\xca\x51\x1c\x7b\xe4\x18\xae\xbb\xe2\x24\x2c\x19\x21\
+\x6f\xac\xbf\x0d\x02\xf0\xe5\x97\x96\x30\x65\xca\x4a\x84\x2c\xfc\
+\xd7\xa9\xb5\xe6\xac\x33\x87\x71\xe6\xef\x86\xb9\xab\x5a\xee\x46\
+\x1e\xde\xdc\xfe\xb4\x71\x5e\x48\xec\x38\x3c\xfa\xf0\x52\xa6\x4d\
+\xad\x0b\xc4\x3b\x74\xef\xa9\xe9\xd4\x59\xa3\x72\xa5\xf7\xfa\x75\
+\xf8\xcd\xe0\x00\xec\x38\xfc\x32\x43\x50\xb7\x39\x98\xe9\x1f\x89\
+\xc2\x59\x17\xda\x0c\x1e\xa6\x68\x69\x36\xa6\x7e\xde\xad\xd5\xb8\
+\x19\xa7\x9c\xed\x30\xf6\xa0\xe2\x51\x04\xc7\x86\xe7\x9f\x88\x33\
+\xed\x07\xdb\x14\x0c\x69\x1f\xd2\x2f\x61\x5d\x29\x50\x8e\x48\x03\
+\x02\xa5\xcc\xfb\x2e\x2f\x87\x73\x7e\x6f\x27\xb3\x33\x43\x00\xf8\
+\xb5\xca\xaf\x34\xbd\x7a\x76\xe6\xcf\x7f\xfc\x3b\xba\x76\xae\x4d\
+\xcb\xf6\xcb\x8c\xe9\xe3\xc9\xf1\xcf\x04\x07\xcb\x8a\xf0\xf3\xcf\
+\x9b\x78\xe0\xc1\x99\xb4\xb6\x16\xbe\x3a\x29\x47\x33\x7a\x54\x17\
+\x6e\xbe\xf1\x60\x4a\xcb\xa2\x6e\xb6\x5f\x1b\xed\xbc\x45\x76\xb8\
+\x4f\x5a\xd2\x2d\x4b\x5d\x1e\x00\x78\xa0\xaa\x5a\xd3\xab\x4f\x01\
+\xd9\x7e\x9e\x94\x5f\xa5\x32\xa2\x00\xc0\xf2\x25\x92\xe5\x4b\x82\
+\x65\xfb\x29\x05\x87\x1c\xe9\x70\xcc\x49\x4e\xdb\x8a\xef\xd9\x5a\
+\x5b\xa1\xb2\x52\xf3\x77\x7f\xb0\xe9\x54\x24\x3e\xb1\x90\xb0\x69\
+\x83\xe6\xa1\x3b\x1d\x36\xae\x77\xdc\xd0\x60\x06\xe9\x97\x58\xe9\
+\x3d\xa6\xbf\xce\x38\x67\xdb\xd0\x7f\x90\x71\x97\x8a\xb1\x60\xa8\
+\x5d\x01\x80\x06\x62\xd1\x08\xb7\x5e\x77\x26\x87\x4e\x18\x89\x72\
+\x44\xc1\x39\xfe\x5e\x10\xb0\x84\xc5\x96\x2d\xad\xfc\xf5\x8e\xa9\
+\xac\x5e\xbd\x23\x80\xe9\xaf\xe9\x50\x5d\xc2\x1f\x6f\x3d\x8c\x81\
+\x03\x3a\xba\xa6\x74\xf6\xb8\xae\xdc\x83\x3e\xa4\xdb\x5a\x5c\xb2\
+\x6c\x69\x03\x77\xdf\x35\x8f\xed\xf5\x85\x87\x1c\xa3\x31\xe8\xd3\
+\x4f\x13\x8d\xf9\x87\xf4\x32\x15\x5d\xe9\xec\xa9\x3f\x60\x6a\xfc\
+\xe7\xce\x12\xd8\x41\xd2\x9c\x15\xf4\xea\xa3\x39\xeb\x22\x9b\x48\
+\xd4\xac\xec\xf9\x4c\xff\x6c\x57\x00\x06\x0d\x53\x9c\x76\x4e\xf1\
+\xf8\xc4\xd2\x82\x9f\x7f\xd4\x3c\xf7\xb8\xc6\xb6\x8d\x2b\x90\x49\
+\xfa\x25\x56\x7e\xaf\xe9\x9f\x69\x1d\x38\x8e\x60\xd2\xd1\x0e\x87\
+\x1c\xe1\x14\x5d\xc1\x50\xfb\x02\x00\x47\x71\xfa\xc9\x87\x71\xf9\
+\x85\x27\x07\x8e\xf3\x7b\x37\xad\x24\x4f\x3c\x39\x93\xcf\xbf\x58\
+\x1e\xc8\xf4\x06\xc1\xef\x2f\x3c\x80\x13\x8f\x1f\xec\xb2\xda\x32\
+\x47\x23\x0f\x49\xae\xf2\x5f\x21\x04\xcd\x4d\x8a\xfb\xee\x75\x5b\
+\x53\x05\x34\xfd\x3b\xd4\xe8\xf4\xae\xbe\xb9\xfc\x7d\x9f\xe2\x1f\
+\x80\xd6\x16\x98\x3b\x4b\x06\xce\xf6\x2b\x2d\x85\x33\xce\xb7\xe9\
+\xd9\x1b\x5a\x5b\x04\xf1\x78\xf0\xcd\xb6\x05\x47\x1d\xef\x30\xfe\
+\xd0\xe2\x71\x05\xb4\x86\x37\x5e\x10\x7c\xfd\x19\x20\x72\x93\x7e\
+\xde\x95\xdf\x49\xb3\x02\x4c\x54\x20\x1a\x83\x53\xcf\x71\xe8\xdd\
+\xaf\xb8\x5c\x81\x76\x03\x00\x4a\x29\x86\x0c\xea\xc3\x9f\x6f\xbb\
+\x84\xea\x0e\x1d\x92\xac\x3f\x69\x63\xbc\xda\x00\x01\x61\x11\xb1\
+\xa2\x7c\xf9\xf5\x4a\x1e\x7d\xe2\xe7\x40\xa3\x9e\x94\xa3\x38\xe4\
+\xe0\xde\x5c\x77\xf5\x44\xa2\xd1\x54\x5b\xef\xec\x46\x1e\x39\xfa\
+\xfe\xb9\x21\x3f\x29\xa4\xdb\x9c\x72\x45\xa0\x6c\xbf\xea\x1a\x4d\
+\xd7\xee\xba\x6d\x82\x2f\x57\xbf\x7f\xf7\x47\xb9\x74\xb1\x64\xed\
+\xaa\xe0\xd9\x7e\x87\x1d\xe3\x30\xe1\x50\x45\x6b\x8b\x59\xfd\x83\
+\xb8\x00\x49\x57\xa0\x05\xa2\x25\x70\xc6\x79\x36\xdd\x7b\xea\xa2\
+\x28\x1d\x16\x02\xea\xb7\xc2\xa3\x77\x5b\xac\x5a\x2e\xd0\xe4\x26\
+\xfd\xb2\x78\x81\x0c\x57\xa0\x6b\x0f\xcd\xa9\x67\xdb\x45\x55\x30\
+\xd4\x2e\x00\x40\x6b\x4d\x79\x59\x29\xff\x34\xf9\x12\x0e\x18\x39\
+\xc4\x14\xda\xf8\xf8\xfa\x99\xfd\xfc\x32\xfd\x7e\x29\x23\xac\x59\
+\xbb\x83\xff\x7b\xfb\x97\x6c\xde\xd4\x50\xb0\x02\x2a\xad\xe9\xd2\
+\xa5\x92\x7f\xf8\xe3\x91\xf4\xe8\xd1\xc1\x4d\x38\xf2\x6b\xe4\x91\
+\xaf\xbb\xaf\xc0\xb2\x2c\xe6\xcc\xdd\xca\xbd\xf7\xce\xa1\xb9\xb9\
+\xf0\x90\x63\x49\x09\xf4\xe8\xad\xb1\xac\xf4\x56\xdd\xb9\xab\xfc\
+\x7c\xac\x03\x60\xcb\x46\xc9\xe2\x79\xc1\x2a\xf5\x94\x82\x7e\x03\
+\x35\x27\x9d\x61\xc6\x89\x25\x4d\xff\xd6\x9d\xd8\xe2\xd0\xda\x6c\
+\xde\xcb\x6f\xcf\x74\x88\x95\x50\x14\x3e\xb1\xb4\x60\xde\x6c\xc9\
+\xd3\x0f\x45\x68\x6e\x4a\xe4\x4f\x64\x93\x7e\xb9\xb8\x81\xa4\x2b\
+\x60\xc3\xd8\x09\x8a\xc3\x8e\x2a\x9e\xec\xa0\x76\x03\x00\x17\x9d\
+\x7d\x12\x17\x9c\x79\xa2\x9b\xe7\x2f\x29\xa4\xbc\x37\x05\x0a\x12\
+\x89\x85\x1d\x87\xfb\x1e\xfc\x96\x1f\xa7\xae\x44\x5a\x85\xbf\x35\
+\x4b\x4a\xae\xba\x62\x22\x47\x4c\x1a\x90\x2c\xf4\xf1\x65\xfd\x45\
+\xae\xdc\x7f\xd3\xfe\xbb\xbe\x3e\xce\x9d\x77\xce\x66\xd9\xd2\xed\
+\x05\xf3\x0e\x42\x98\x95\xa3\xbc\x22\x7d\x7e\x9f\xf2\x53\xf8\x3c\
+\xa4\x60\x73\x13\xcc\x9f\x23\x02\x4d\xf2\x4d\xa4\x1a\xff\xf6\x2c\
+\x9b\xda\x8e\xda\xac\xfe\xf1\x5f\xbf\xb5\xb6\xc2\xf8\x43\x1c\x26\
+\x4c\x72\x8a\x86\x13\x13\x02\x3e\x7c\x2b\xc2\xdf\xde\xb7\x92\x89\
+\x56\x29\x57\x20\xc3\xf4\xcf\x70\x0f\x12\x80\xe0\x28\xf3\x13\xf9\
+\xcd\x6f\x1d\xfa\x0f\x2e\x0e\x57\x60\xaf\x03\x80\x52\x8a\x83\xc6\
+\x8e\xe4\xcf\xb7\x5e\x45\x79\x69\x25\x52\x44\xb0\x64\x14\x4b\x26\
+\x6e\x13\x7f\xbb\x9b\x95\xb1\x2f\xa3\x58\x56\x94\x48\x24\xca\xfb\
+\x1f\xcc\xe3\x99\x17\xa6\x05\x7b\x7e\x47\xf1\x9b\x63\x06\x71\xc5\
+\x25\x07\x7b\xc6\x76\xe7\x68\xe4\x91\xb3\xe9\xa7\x39\xff\xc2\xf3\
+\x8b\xf8\xe8\xa3\x95\x81\xfc\xfe\xea\x5a\x4d\x6d\x27\x9d\x6e\xda\
+\x03\xb8\xc4\x5e\x42\x51\x93\xb7\xc9\xf3\xa9\xe3\x4a\xc3\xb2\xc5\
+\x92\x4d\x1b\x82\x99\xfe\x42\xc0\xa4\x63\x1c\x86\x8f\x56\xbb\x4c\
+\xf9\x13\xa1\x41\x21\xe1\xf8\x53\x1c\x7a\xf5\x29\x0e\x45\x30\x6d\
+\xc5\xe1\x99\x87\xa3\x2c\x5e\x90\xee\x0a\x64\x9b\xfe\xc2\x63\x05\
+\x64\xb8\x0c\xb6\xc9\x12\x3c\xe9\x0c\x9b\xca\xaa\xf6\xef\x0a\x44\
+\xf6\xe6\x93\x6b\xa0\xac\xb4\x94\x4b\xce\x3d\x0d\x29\x22\x2c\x59\
+\xbe\xda\x0d\xc5\xd8\x19\x63\x9c\x6d\x4f\x9e\xb6\x3b\x04\x52\x7b\
+\xf6\x85\x62\xfd\x86\x3a\xfe\xfb\xce\x8f\xd9\x5e\xdf\x54\xf0\xea\
+\xaf\x94\xa6\x4f\x9f\x5a\xfe\xe1\xb6\x63\xe9\xd8\xb1\x02\xc7\xb1\
+\x5d\x05\x57\x68\x77\xd5\x37\xe9\xa1\xde\xee\xbe\x86\x70\x13\x08\
+\x34\xd2\xa8\xbf\xa5\xf9\xfe\x87\xf5\x3c\xf4\xf0\x2f\xc4\xe3\xaa\
+\xe0\xd5\x3f\x12\x85\xea\x5a\xa3\x34\xb6\x0d\xd2\xf5\x34\x84\x9b\
+\x5e\x20\xa5\x40\x08\x9d\x3c\x26\xd3\xce\xa5\x6e\xeb\xb7\x09\x56\
+\x2c\x0d\xe6\xf4\x2b\x65\x8a\x8c\x8e\xf8\x8d\x83\x72\x04\xce\x6e\
+\xf8\xa1\xd6\x74\x82\xe3\x4f\x73\x78\xf1\x09\x63\x5a\xb7\xf7\x44\
+\x21\x29\x61\xe5\x32\xc1\xb3\x0f\x47\xb8\xf9\x9f\xe3\xa6\xf7\x82\
+\x0f\xe9\x97\xed\x0a\x64\x5a\x0b\x82\x21\xc3\x35\x93\x8e\x71\xf8\
+\xf8\xdd\xf6\x1d\x12\x11\xb2\xc7\xb8\xbd\x8a\x51\x96\x65\xd1\xad\
+\x73\x47\xa3\xb4\x69\x70\xa9\xdd\xff\xb3\x8f\x65\xdd\x0a\x68\x6e\
+\x8e\xb3\x79\xcb\x8e\xc2\xc1\x47\x43\x2c\x6a\xf1\x6f\xff\xe3\xb7\
+\x5c\xf1\x87\x89\xa8\x04\x93\x96\xd6\x3b\x4e\x7b\xf6\x75\xfa\xf1\
+\x44\xe2\x88\xd0\x6c\xde\xdc\xc0\x8d\x93\x3f\xe1\xcb\x2f\x56\x07\
+\x5a\xfd\x85\x84\xe4\x18\x41\x92\x6f\xc5\x77\x47\xf8\x5e\x60\x76\
+\x6d\x9b\x40\x21\xbf\x44\xaa\xf1\x85\x57\xda\xc9\xa1\x22\xbb\x4b\
+\x94\x82\xf7\x5f\xb7\xf8\xea\x13\x2b\xeb\xb5\xb7\x57\xb1\x2c\xb8\
+\xe2\xa6\x38\xa7\x9c\xed\xe0\xd8\x1e\x22\xd0\x49\x71\x03\x8e\x93\
+\x02\x87\xc4\xdf\xde\xa8\x80\x52\xb0\x7d\x1b\x3c\xff\x78\x84\x05\
+\x73\xda\xef\xc0\x95\xc8\xde\x7e\x01\x8e\xe3\xb0\x6a\xdd\x06\x57\
+\xf9\x77\xfe\x17\x22\x04\x81\x0a\x7d\xb4\xd6\x9c\x7e\xca\x68\x2e\
+\x38\xef\x20\x12\xe6\xbd\x16\x66\x42\x4f\x4a\xb9\x54\x72\x95\xd7\
+\x28\xcf\xaa\xaf\xdc\x4e\xc0\x02\xa5\x34\x8f\x3d\xfe\x0b\x5f\x7f\
+\xbd\x26\x60\xc8\xd1\x60\x48\x7c\x67\x94\x2f\x13\xb2\x03\x7e\x6c\
+\x52\xc2\x61\x47\x2b\xfa\xf6\xd7\xb4\xb4\xb8\x8f\xb7\x3b\x94\x53\
+\x1b\x90\x3b\xec\x68\xc5\x8a\xa5\x92\x65\x8b\x45\x51\x0c\xda\xb0\
+\xe3\xf0\xda\x73\x11\x06\x0e\xd5\x0c\x19\xae\x7c\x13\x82\x7c\x57\
+\x7e\x4f\xfe\x80\xe3\x40\x79\x05\x1c\x7b\xb2\xc3\xfa\xb5\x82\xfa\
+\xad\xed\x73\xe4\x9a\x25\xaa\xba\xff\xeb\xde\x7e\x11\x42\x88\x5d\
+\xb2\x15\x2a\x4a\x69\x86\x0e\xe9\xca\x7f\xfd\xfb\x99\xf4\xec\x51\
+\x8d\x72\x2d\x0f\x53\xbd\xe7\xd5\x85\xec\xbf\x84\x07\x70\x2c\x4b\
+\xf2\xe9\xa7\x2b\xf8\x8f\xff\xfa\xce\x65\xfd\xf7\xd0\x37\x9c\x49\
+\x41\x04\x10\xa5\x60\xd8\x28\xc5\xb1\x27\x39\x48\xe9\x31\x63\x9d\
+\xdd\xb0\xb9\x8f\x1b\x2b\x81\x0e\xd5\xb0\x78\x81\xa9\x4b\x68\xef\
+\xae\x80\x10\xd0\xb0\x43\xb0\x65\xa3\xe0\x80\x09\x8a\x68\x34\x37\
+\xe9\x97\xce\x13\x08\xb4\x93\x9e\x2a\x5c\xd5\xc1\x7c\x61\x4b\x17\
+\xb5\xcf\x0e\x4a\xed\x02\x00\xf6\xa4\x68\xad\xa9\xa8\x88\xf1\x3f\
+\xff\x7c\x1a\x47\x1f\x31\x04\xa5\x74\x9a\x0e\x09\xf7\x3f\x91\x13\
+\x02\x8c\x48\x29\x59\xb5\x7a\x3b\xff\xcf\xbf\x7c\xce\xd2\x25\x5b\
+\x0b\xf6\xfb\xf7\xee\x7b\x87\xda\x8e\x26\xe4\x57\x5d\x6b\x08\xab\
+\x9c\xa1\xae\x5d\xb8\x39\x8e\xc9\x73\x70\x6c\x58\xb9\xac\x38\xba\
+\xd0\x09\x01\xeb\xd7\x0a\x62\x31\x18\x3a\x4a\xfb\x16\x06\xa9\x5c\
+\xdc\x40\x46\xae\x40\xa7\x2e\x9a\x4d\x1b\x04\x1b\xd7\xb5\x3f\x2b\
+\x60\xaf\xbb\x00\x7b\x43\x09\x2e\x38\xf7\x60\xce\x3c\x75\x5c\x16\
+\x99\x67\x7c\x7c\x99\xd2\x77\x6d\xf6\xd3\x5d\x00\x13\xf2\x6b\x6d\
+\xb5\xb9\xef\xfe\x9f\xf8\x79\xfa\xba\xc0\xa6\xff\x5e\xfb\xb2\x23\
+\x30\xf1\x08\x45\xe7\xae\x26\xdb\x6f\x4f\x2b\xd4\x01\x07\x29\x56\
+\x2e\x93\x2c\x59\x50\x1c\x93\x88\x94\x82\x29\x6f\x59\x0c\x1c\xaa\
+\x19\x35\x56\xe5\x26\xfd\x94\x48\x07\x87\x0c\x2b\x20\x1a\x83\xc3\
+\x8f\x55\xac\x5f\x23\xd8\xb2\xb9\x7d\x81\xc0\x7e\x05\x00\xca\x51\
+\x8c\x3f\xb0\x1f\xb7\x5c\x7f\x3c\x25\x25\x51\x1c\xe5\xe0\xc7\xfa\
+\x27\x15\xdd\x2f\x0a\x80\x44\x4a\xcd\x9b\xef\x2f\xe2\xa5\x97\xe7\
+\x50\x2c\xcc\x96\xd6\x30\x64\x84\x62\xd8\x28\x15\x6c\x18\xc8\x2e\
+\x94\x68\xd4\x14\x1b\x6d\xdc\x60\xb1\xbd\x08\xc6\x90\x9b\x2c\x41\
+\xc1\x6b\xcf\x5a\x74\xeb\xa1\xa9\xae\xd5\x59\x51\x01\x9d\x48\x06\
+\x72\xc8\x9b\x38\xd4\xb9\xab\xe6\x90\xa3\x14\x1f\xbf\x63\x05\x22\
+\x6c\x77\xb7\xec\x37\x2e\x80\xd6\x9a\xda\x9a\x0a\xfe\xf3\x7f\x9e\
+\xcb\xc1\xe3\xfb\xe3\x28\xe5\xc6\xf3\xdd\x2f\x3b\xeb\xd6\xcb\x07\
+\xa4\xae\x94\x52\xb0\x60\xd1\x16\xfe\xf9\x5f\x3e\x61\xed\xba\xed\
+\x45\x63\xfa\x77\xea\xac\x39\xea\x04\x45\x59\x39\x49\x96\x7a\x4f\
+\x6f\x8e\x03\x15\x15\x86\x18\x5c\xb5\xbc\x38\xba\x0a\x0b\x01\x9b\
+\x37\x19\x25\x1f\x3a\x4a\xa1\xc9\x24\xfd\x72\x87\x05\x33\x93\x86\
+\x6a\x6a\x35\xdb\xeb\x05\xeb\xd7\xb6\x1f\xf0\xdb\x6f\x2c\x00\x21\
+\x04\x57\x5c\x72\x14\x27\x1c\x3b\xca\x64\x6c\xa5\xad\xf6\x09\x7b\
+\xd4\xc7\xe4\x17\x12\xa1\x8d\x85\x20\x85\xa4\xb1\xb1\x85\x3b\xef\
+\xfa\x96\xf9\x0b\x36\x15\x85\xf2\x83\x31\x41\x0f\x3c\x44\x51\xd5\
+\x41\x07\x6a\x0e\x92\xa9\x08\xf5\x5b\x05\xeb\xd7\x08\x06\x0d\x33\
+\x53\x94\x77\x46\x7f\x05\x30\x64\xb8\x62\xcd\x0a\xc1\xa2\xf9\xc5\
+\x33\x97\xf0\xcb\x4f\x2c\x06\x0c\x51\x1c\x78\xb0\xca\x49\xfa\xe5\
+\xe5\x06\x1c\x13\x5e\x3c\xe8\x50\xc5\xba\x35\x82\x8d\xeb\xdb\x07\
+\x08\xec\x17\x00\xa0\x1c\xc5\xd1\x47\x8c\xe0\xfa\xab\x8e\x23\x12\
+\x89\x18\xd3\xdf\x13\xf2\xcb\x9b\xf8\x03\xee\x39\xf3\x85\xbd\xfc\
+\xea\x2f\xbc\xf5\xee\xfc\x3d\xc7\xf8\xff\x4a\xd1\x1a\x86\x8e\x30\
+\x93\x84\x5b\x5b\x45\xf0\x90\x9f\x7b\xbd\x72\xe0\xe7\x1f\x24\x4b\
+\x16\x4a\x22\x51\x4c\x9b\x72\x45\x70\x0f\xc8\x0d\x0d\x1e\x30\x41\
+\xb1\x69\x83\x60\x6b\x5d\x71\xb8\x02\x4d\x8d\xf0\xee\xab\x11\x7a\
+\xf4\x8c\xd3\xa9\xab\x4e\x5f\xf9\x55\xee\x95\x5f\x67\x58\x40\x55\
+\xd5\x9a\x09\x87\x29\xfe\xf6\xbe\x69\x54\xbb\xb7\xdf\xfb\x3e\xef\
+\x02\x28\xa5\xe9\xde\xbd\x86\xbf\xfc\xfb\x45\x8c\x1c\xde\xcb\x35\
+\xfd\x8d\xda\xfb\x7d\xf8\x69\x2e\x80\xe7\xa0\x65\x49\x7e\x9e\xb1\
+\x86\x3f\xff\x8f\x0f\xd9\xb2\xa5\xb1\x68\x4c\xff\x2e\xdd\xcc\x0f\
+\x2e\x1a\xf5\x98\xfe\x01\x43\x79\x5a\xc1\xe2\x05\x82\x99\xd3\xcc\
+\x8f\xb6\x7e\x9b\xa0\x7b\x4f\x4d\x24\x92\x91\x04\x53\xe0\xe3\x39\
+\x8e\x29\x80\x8a\xc6\x60\xcd\x2a\x59\x44\x55\x83\x82\xe6\x66\x18\
+\x36\xc2\x64\x67\xfa\x2b\x7d\x86\x6b\x90\x91\x27\xa0\x94\x01\x81\
+\x96\x26\xc1\x86\x75\x7b\xff\x37\xb4\xcf\x5b\x00\xd1\x88\xc5\x4d\
+\x57\x9f\xc4\xa4\x89\xc3\x70\x1c\x2f\xc1\xe7\xae\xec\x42\xb8\xa5\
+\xc7\x19\x51\x00\x0f\x19\x28\x85\x64\x4b\x5d\x23\xff\xf7\xaf\x5f\
+\xb0\x62\x79\x1d\x48\x11\xa8\xd4\x78\xa7\x7e\x70\x01\x8e\xfa\x2a\
+\x3f\xa6\xc6\x7f\xd4\x38\x45\x49\x29\xbf\xca\xf4\xdf\xb6\x55\x30\
+\x73\x9a\x24\x1e\x37\x49\x44\x1b\xd7\x0b\x66\xfd\x2c\x39\x70\xa2\
+\x42\x8a\x9d\x74\x05\x04\xf4\xea\xab\x19\x30\x48\xb1\x70\xae\x0c\
+\xfa\xf6\xf6\x9a\x4c\xfb\xd6\xa2\xef\x00\xcd\xc4\xc3\x55\x1e\xd3\
+\x5f\x64\x29\x7d\xd2\x6d\x70\x0b\x05\x47\x8d\x53\xac\x5f\x2b\x58\
+\xb7\x66\xef\x5a\x40\xfb\x34\x00\x28\x47\x71\xea\x89\xe3\xb9\xfc\
+\xe2\x63\x10\x42\xa2\xb5\xce\x50\x70\x69\x2c\x5c\xa1\xdc\x90\x60\
+\x7a\x14\x20\x55\x12\xac\x79\x6f\xca\x3c\xe6\xcc\x5f\x4f\xcf\x5e\
+\xd5\x3e\xaa\x46\x01\xc7\x52\xc7\x75\x80\x6b\x0b\x79\x5c\xed\x73\
+\x5c\x6b\x4d\xf7\x5e\xad\x74\xee\x62\xaa\xfc\x76\x56\x6c\x1b\x66\
+\xfd\x24\xd9\xe6\xc9\x64\x13\x02\x96\x2c\x90\xd4\x76\xd2\xf4\xed\
+\xff\x2b\x5a\x80\x09\x13\x99\x68\x6e\x8a\xd0\xda\x6c\x81\xd0\x79\
+\x3e\x2f\x9d\xe3\x73\xd0\xfe\xd7\x6b\xef\x67\x91\xf9\xd9\xa4\xdf\
+\x45\x93\x63\x5f\x67\x3c\x83\x5b\x7e\x3d\xed\x5b\xc9\x80\xc1\xa6\
+\x88\x2b\x5f\x72\x90\xd7\xf4\xcf\xb4\x0e\x4a\xcb\x4c\xe9\xf0\xb6\
+\x8f\xac\x40\x15\x9c\xbb\x5a\xf6\x7a\x2d\xc0\x6e\x53\x7e\xa5\x18\
+\xd0\xaf\x1b\xcf\x3e\x74\x33\x63\x0f\xe8\xe7\x16\xfa\xe8\x1c\x79\
+\xfe\x89\x5e\xf0\x39\x72\xff\xb5\x62\xdd\x86\x7a\x1a\x9b\x5a\x10\
+\xc9\xe3\xa9\xdb\xf4\xc7\xd3\xee\xe3\xb5\x71\xde\xfb\x38\xba\xb0\
+\xeb\x70\x5b\x55\x67\xdd\xdf\xe7\x3a\xa5\x14\x9f\x7d\xbe\x9c\xb9\
+\xf3\x36\xef\xbc\xbb\x22\x60\xe9\x42\xc9\xec\x9f\xb3\x7b\x0c\x68\
+\x0d\x1d\x6a\xcc\x4a\x58\xd5\x61\xe7\x41\x20\x12\x91\x9c\x78\x62\
+\x5f\xfa\xf6\xad\x40\x29\x27\xd9\x97\x0f\xed\x33\xaa\x2b\x63\x60\
+\x47\xda\xf1\xc4\x74\x5f\xad\xd0\x4a\xfb\x17\xf0\x38\x79\x14\xd3\
+\x11\xfe\x8a\xec\x73\x8d\xe3\x40\x45\xa5\x26\x12\x4d\xd4\x07\xa4\
+\x6e\x9d\x44\xa5\xa0\xc7\xdd\x49\x86\x0e\x13\xd7\x78\x1e\x67\xd6\
+\x4f\x92\x59\x3f\xed\xbd\x88\xc8\x3e\x69\x01\x98\x16\x57\x31\xfe\
+\x74\xd3\x19\x8c\x1d\x33\x10\xe5\x98\x78\x3f\xf8\xb8\x00\xae\x15\
+\xd0\x56\xe2\x4f\xcf\xee\xd5\x6e\x0f\x79\x9d\x51\x34\x94\x1b\x54\
+\xb4\x0b\x04\xb9\x0b\x8c\x3c\xfb\xc9\xae\xb4\x3a\xfd\xfe\x99\xfb\
+\x05\x3e\x9e\x90\x9a\xcd\x75\x9d\x98\x33\x67\x2b\xf1\x9d\x28\xf5\
+\x13\x02\xb6\x6e\x11\x2c\x9c\x6b\x26\x09\x67\xae\x50\x09\x9f\x78\
+\xde\x6c\xc9\x98\x03\x95\x69\x66\x12\xf4\x7b\x52\x9a\xce\x9d\x4b\
+\x19\x3b\xae\x8a\xaa\x0e\xd2\xd4\xe1\x23\xdc\x4a\x4f\x6f\x39\x98\
+\xfb\x4f\x0b\x4f\x19\x58\xe2\x9f\x77\x90\x87\x63\x7a\xfa\xa5\x29\
+\x9c\x71\xd7\xbc\x5c\x85\x57\x19\x13\x3d\xfd\x1c\x47\x67\x9f\x4b\
+\x53\x62\xf7\x1a\x77\xdf\xb1\xd3\xaf\xc9\x45\xfa\xf9\x35\x11\xf1\
+\xf6\x1a\x18\x34\x4c\xb1\x71\x9d\x60\xcd\xaa\xbd\xe3\x0a\xec\xa3\
+\x00\xa0\x38\xf7\x8c\x49\x5c\x70\xf6\x91\xc9\xa5\xcc\x1b\xee\x4b\
+\x29\xb8\xcc\x52\x74\xad\xb3\x13\x7f\x92\x43\x22\xb4\x20\x69\x70\
+\xeb\x84\x9b\x90\xf8\x99\x7a\xce\x25\xf7\x85\x0b\x18\x89\xab\xbc\
+\xd7\x08\xcf\x7d\xdc\x6b\x75\xe2\xf1\x44\xfa\xfd\x33\xf7\x75\xea\
+\xf1\xd3\xee\xef\x3a\xd1\x1a\x81\xd0\x9a\x81\x03\xaa\xa9\xae\x2e\
+\x61\xfd\xfa\xa6\xc0\x56\x40\x3c\x0e\xf3\x7f\x11\x34\x36\xe4\x36\
+\x4f\x85\x80\xb5\xab\x04\xd5\x35\x82\xde\xfd\x82\x83\x8c\x52\x30\
+\x78\x70\x15\x15\x95\x12\xc7\x71\x57\x7f\x6f\x6f\xfe\x1c\xa3\xba\
+\xd2\x56\xff\x8c\x41\x1e\x99\x8a\xed\xa7\xd4\x69\xd5\x7d\xee\x8a\
+\xed\xe4\x04\x07\x57\xf9\xd3\x2a\x02\x0b\x23\xfd\xb4\x0f\x37\x90\
+\xd9\x6e\x2c\x1a\x85\x11\x07\x28\xb6\xd5\x59\x34\x34\xec\x79\x57\
+\x60\x9f\x03\x00\xe5\x28\x46\x8f\xec\xc7\x3f\x4e\x3e\x9b\x8a\xf2\
+\x52\x1c\xe5\x78\x88\x3e\xe5\x51\x9c\x54\x8a\x8f\x4e\x02\x04\x19\
+\x59\x80\x80\x87\x18\x4c\x0b\x17\x0a\x85\xd0\xc2\xf3\x78\x5e\xa0\
+\x49\x0f\x1f\xfa\xa6\x1a\xfb\x54\x17\x9a\xd7\xe9\x4d\x49\xca\xf1\
+\xba\x04\x6e\x6e\x82\x37\x7f\x21\x83\xc3\xd0\x82\x9a\xda\x12\x06\
+\x0d\xaa\x61\xd5\xca\x26\x64\x21\x65\xe9\x3a\x89\x29\x2c\x5f\x52\
+\x58\x83\x11\xc7\x81\x25\x0b\x25\x15\x95\x1e\x57\xa0\xc0\xc1\xa7\
+\x65\xa5\x11\x86\x8f\xa8\x42\x08\x33\x7e\x3b\xab\x37\x7f\xc0\xe9\
+\xbd\x6d\x0d\xf2\xc8\xd7\xd3\x4f\xf9\x54\xf4\x15\x9e\xe9\xe7\x4f\
+\xfa\xe5\x6a\x2d\x9e\x24\x05\x5d\xc0\xa9\xa9\xd5\x0c\x1e\xa1\x7c\
+\x5d\xad\xdd\x2d\xc5\x51\x99\x51\xf0\xca\xaf\xa9\xea\x50\xce\x3f\
+\xdf\x7a\x1e\x43\x07\xf7\x4e\x4e\xf4\x49\xb5\xed\x16\x59\xbd\xfd\
+\xbd\x1d\x7e\x85\x3b\xf3\xaf\xed\x0e\x40\xde\xe9\xbf\xe9\x0d\x43\
+\xd3\xbb\x05\xa7\xcf\x0d\x48\x7f\x5c\xbf\x09\x43\x32\xd9\x95\x48\
+\x64\x3c\x56\x56\x67\x22\x21\xb3\xe7\x15\x66\x74\x29\xb2\xa4\xc5\
+\xe8\xd1\x1d\xb1\x2c\xcb\x34\xfa\x6c\x6b\x73\x5b\x7c\x6f\xda\x20\
+\x58\xb9\xac\xf0\x96\x66\x4d\x8d\xb0\x64\xa1\x69\x47\x16\xb7\x29\
+\xe8\xb9\x5a\x5b\x34\xdd\x7b\x94\xd2\xab\x77\x09\x2a\xa1\x95\x9e\
+\x15\x5e\xfb\x8c\xea\x6a\x73\x7a\x6f\x1b\x83\x3c\x0a\x51\xca\x5c\
+\xe5\xbd\xb9\x32\xfd\x9c\x36\x73\x01\xb2\x2b\x09\x33\xab\x08\x1d\
+\xc7\x44\x44\xba\xf7\xda\xf3\x33\x15\xf6\x29\x00\x00\xf8\xc3\x05\
+\xc7\x73\xfa\xc9\x87\x7a\x7a\xfb\x79\x94\x48\xe4\x19\xe2\xe9\xed\
+\xf0\x9b\x77\xfa\x6f\x06\x70\x08\x91\xa3\x5b\x70\xc6\x1c\x01\xe1\
+\x3f\x59\xc8\x6f\xa4\x58\xe6\xeb\xca\x0d\x18\xc2\x67\x58\x49\xea\
+\x71\xb5\x86\xfe\xfd\xab\xe8\xda\xb5\x9c\xd6\x96\xfc\x7d\xfd\x13\
+\x5d\x89\x1a\x76\x08\x96\x2d\x16\x81\xc2\x86\x89\x74\xd9\xd5\x2b\
+\x64\xb2\x39\x68\xbc\x8d\xe7\x72\x1c\xc1\xc8\x51\x55\x94\x95\x0b\
+\x8f\xa9\x9f\x31\xa7\x2f\xe8\xf4\xde\x36\x06\x79\x14\xd2\xd3\x2f\
+\x5f\x79\xaf\x3f\x58\xe4\x8e\xf7\xe7\x02\x04\x3f\x9e\x40\x4a\x18\
+\x34\x54\x51\x59\xb5\x67\x41\x60\x9f\x01\x00\xe5\x28\x0e\x39\x68\
+\x38\xb7\x5d\x77\x16\xb1\x58\xcc\xfc\x30\xfd\x56\x72\x91\x4b\x91\
+\xd2\xaf\x2d\x78\xfa\x6f\xae\x95\x1c\x9f\x95\x5c\xe4\xef\x31\x28\
+\x32\x3a\x10\xa7\x37\x20\xf5\xde\xb7\x40\x40\xd3\x92\x0e\x55\x31\
+\x46\x8d\xea\xe8\xf6\xeb\xcb\xd3\xd3\x3f\x2e\x68\x6d\x11\xac\x5e\
+\x29\x02\xcd\x14\x48\x99\x5f\x86\x0f\xa8\xdb\x22\x88\xdb\xe6\xf1\
+\x72\x3e\x5f\xab\xa0\xbc\x3c\xca\xc8\x51\x15\x86\xed\xd7\xfe\x2b\
+\xbc\xd6\xc1\xa7\xf7\x16\x32\xc8\x23\x5f\x4f\xbf\x5c\xe5\xbd\xf9\
+\x72\xfc\xf3\xd7\x02\x88\x1c\xae\x45\x3a\xd0\x28\xb7\x81\xc8\x80\
+\xc1\x26\xc1\x2a\x04\x80\x20\xca\xaf\x35\x9d\x3b\x57\xf3\x2f\x7f\
+\xba\x98\x3e\xbd\xba\xa2\x95\x86\x1c\xab\x68\x6e\x17\xc0\x47\x21\
+\x0b\x98\xfe\x9b\xe8\x16\xec\xb7\x92\x67\xbf\x86\xb6\x87\x8b\xa6\
+\x26\x0f\xa7\x2b\x77\xf6\x54\xa2\x02\x01\x4d\x48\x0e\x18\xdb\x91\
+\xd2\xd2\x28\xad\x79\xfa\xfd\xdb\x36\x6c\xd9\x64\x72\xd4\x77\x56\
+\x5a\x5b\x61\xf5\x0a\x49\x53\x63\x6a\xa5\xf7\x9f\x1f\xa0\x19\x30\
+\xa0\x8c\xee\x3d\x23\xc9\xd0\x9f\xdf\x0a\x4f\x06\xe9\x17\x64\x7a\
+\x6f\xbe\x41\x1e\x6d\xf6\xf4\xcb\x53\xde\x5b\x48\xa6\x9f\x2f\xe9\
+\x97\x13\x70\x44\x5a\x6b\xb1\xce\xdd\x34\xdd\x7a\xee\x39\x13\x60\
+\x9f\x00\x00\x4b\x4a\xae\xbf\xfc\x0c\x8e\x3b\x6a\x7c\x6a\xa2\x4f\
+\xc6\x0a\x9a\xb6\x92\x17\xe0\x93\xb7\x3d\xfd\xb7\x6d\x9f\xdc\xd7\
+\x42\x10\x3e\x2b\x79\x2e\x0b\x43\x14\xf0\x78\x49\x00\xf2\x07\x34\
+\xad\x05\x7d\xfb\x56\xd0\xaf\x5f\x25\xad\x2d\xda\xdf\xf4\x8f\x43\
+\xc3\x0e\x58\xb7\x46\xe0\xfc\x8a\x52\x55\x21\x60\xc7\x76\xd8\xb0\
+\xd6\xb8\x10\x7e\xae\x40\x3c\x6e\x9a\xaa\x8e\x1d\x5f\x41\x2c\x46\
+\x5a\x88\x73\x7f\x20\xfd\xd2\x4d\x7f\x91\x75\x0e\xa0\x77\xbf\x3d\
+\xe7\x0a\x14\x3d\x00\x28\x47\x71\xdc\x91\xe3\xb9\xe1\xf2\xdf\x61\
+\x49\xcb\x7f\x35\xc5\x67\x25\x6f\xc3\x27\x4f\x9f\xfe\x2b\x7c\x15\
+\xd4\x9f\x14\xcc\xe5\x93\x7b\x14\x54\x08\x0a\x22\x19\xf3\xbc\x2e\
+\xbf\xa9\x44\x7e\x80\xa6\xb5\xa0\xbc\x2c\xca\xf8\xf1\x9d\x50\x4a\
+\x64\xaf\xfc\x6e\x1f\xff\x8d\xeb\xc4\x2e\xeb\xdc\xbb\x65\xb3\x60\
+\xdb\x56\x91\x7c\xfc\xcc\xe9\x41\xb5\x1d\xa3\x8c\x18\x59\x9a\x96\
+\xf8\x53\xcc\xa4\x9f\x13\x90\xf4\x33\xb7\xfe\x6e\x88\xe3\x40\x2c\
+\x06\xbd\xfb\x69\xa2\xd1\x10\x00\xf2\x2b\xbf\x52\xf4\xee\xd5\x95\
+\xff\xf7\xef\x2f\xa5\x4b\xa7\x5a\x37\x04\x15\x60\x25\x2f\xd0\x27\
+\x4f\xcd\x0b\xc8\xad\xa0\x79\x57\x72\xbf\xd7\x20\xf2\x73\x07\x85\
+\x90\x8c\x6d\x5a\x06\x9e\xfb\x8c\x1b\x57\x4b\x87\x0e\x25\x6e\xff\
+\x7f\xe3\x87\x27\x7c\xf2\xad\x5b\x04\xf5\xdb\x76\x5d\x00\x5a\x39\
+\xb0\x79\x83\xa0\xa9\x51\x64\x3d\x57\xbc\x15\x46\x8c\x2c\xa7\x4b\
+\x57\x0b\xa5\x9d\x74\xf3\xbe\x08\x48\x3f\x55\x50\xbc\xbf\x6d\xd2\
+\x2f\x1f\x50\x39\x0e\x74\xa8\x81\x2e\xdd\x77\xbf\x09\x50\xb4\x00\
+\xa0\x81\x58\x2c\xca\x1f\xaf\x3f\x9f\x43\x0f\x1a\xed\x16\xe7\x64\
+\xfb\xe4\x85\x28\x68\x30\x9f\xbc\x0d\xee\x40\x04\x58\xc9\x45\x61\
+\x51\x00\x7c\xc6\x8f\xfb\x5a\x18\xc2\xcf\xda\x91\x68\x25\xe8\xd9\
+\xab\x9c\x11\x23\xaa\x4d\x34\xc0\x13\xf2\x6b\x6a\x30\x19\x7f\xbb\
+\xda\xdc\x6c\x69\xc1\x10\x82\x09\x57\xc0\x0d\xff\x59\x96\x64\xc2\
+\xc4\x72\xac\x88\xca\x32\xff\xdb\x33\xe9\xe7\x04\xc8\xf4\x2b\x88\
+\xf4\x6b\x83\x1b\xd0\xca\x54\x72\x56\x76\xd8\xbd\xae\x40\xf1\x02\
+\x80\xa3\xf8\xdd\xc9\x47\x72\xf9\x05\xa7\xfa\x2b\x8e\x90\x3e\xca\
+\x9c\xcb\x27\x17\x01\x7d\xf2\x36\xa2\x00\x39\x7c\x72\x72\x0c\x17\
+\x2d\x68\x25\x17\x99\x16\x42\x0e\x92\x31\x47\x7e\x40\x2c\x66\x71\
+\xc8\xa1\x9d\x10\x42\xa6\x4c\xff\x16\xd8\x56\x27\x76\x5b\x8b\xaa\
+\xc6\x1d\x86\x13\xf0\x3e\x5f\x8f\x9e\x51\x86\x8d\x8c\xa2\x54\xfa\
+\x2a\xdf\xde\x49\x3f\x15\x34\xd3\xaf\x0d\xd2\x2f\x17\x0f\xa1\x3d\
+\xaf\xd9\xb2\xa0\x5b\x0f\x33\x2e\x3e\x04\x00\x8f\x28\xa5\x18\x3a\
+\xb8\x2f\xff\x72\xdb\xe5\x54\x57\x55\xba\x79\xb6\x3e\x6c\xbd\xaf\
+\xf9\xec\xe7\x93\xb7\x9d\xf8\x93\xdf\x42\xf0\x59\xc9\x45\x21\xf1\
+\x7c\x99\x05\x40\xd9\xe1\xc3\xb6\x5d\x80\x2c\x30\x10\xd9\xaf\x4b\
+\x2b\xc1\xd8\xb1\x35\x74\xeb\x56\x46\x4b\x8b\x26\x1e\x37\xca\xd9\
+\xdc\xbc\x1b\x41\x5a\xc3\x8e\x7a\x53\x43\x9f\xe0\x00\x0e\x9c\x50\
+\x46\x4d\xad\x30\x99\x7f\xfb\x31\xe9\x97\xaf\x7d\x98\x17\xcc\xca\
+\xca\x4d\x3b\xb7\x10\x00\x92\x3f\x2a\x4d\x79\x79\x19\xff\x3c\xf9\
+\x32\xc6\x8c\x18\xec\x32\xa7\x72\x27\x7d\x72\x49\xa1\x3e\x79\x8a\
+\x14\x94\x81\x56\xf2\xfc\x64\x5e\xc2\xc4\xcf\xf3\xba\xbc\x9b\xc8\
+\x9f\xf8\xe3\x9f\xcc\x24\x93\xd1\x80\xae\x5d\x4b\x39\x70\x7c\x2d\
+\xf1\x56\x68\x69\x86\xa6\xa6\xdd\x9f\x78\xee\x38\xd0\xb8\xc3\x44\
+\x05\x4a\xcb\x24\x13\x0f\x2b\x45\xc8\x90\xf4\xf3\x07\x0b\x9f\x8a\
+\x44\xc7\x54\x5d\x56\x56\xed\x1e\x10\x28\xc2\x5a\x00\xc1\xa5\xe7\
+\x9d\xca\xc5\xe7\x9c\x8c\xc0\xc2\x8c\x01\x94\x19\x15\x74\xde\x7d\
+\x99\xf6\x43\xca\xbe\x56\xa4\x5f\xa3\x33\xaf\x11\x9e\x7d\x4f\x51\
+\x4e\x32\xe9\xdd\xa7\xa8\xc7\x7b\x1f\xed\x77\x7f\x95\x71\xad\xbb\
+\xaf\x53\xfb\xe9\x05\x40\x19\xf7\x49\xb6\xd0\x11\xee\xe3\xe2\x29\
+\x30\xf2\xec\xeb\xf4\x5e\x01\xd2\x12\x1c\x7d\x4c\x67\x5e\x7f\x75\
+\x3d\xdb\xb6\x3a\x7b\xac\x13\x4f\x3c\x6e\x7e\xdc\x07\x1e\x14\x63\
+\xd8\x88\x08\x08\x07\xcb\x52\x9e\xf9\x8e\xd9\xa4\x9f\xd6\x29\x4b\
+\x40\xb9\xf5\x59\xa9\xf1\x68\xa9\x1d\x81\x4f\xe4\x42\x24\xff\x6b\
+\xf3\xb7\x94\x5c\x58\x3c\x56\x8b\xf7\xf3\xc3\xad\xcd\x48\x1b\xcc\
+\x0a\xe9\xc3\x5c\xb3\x06\xbb\x66\x1f\x57\x7e\xb7\x2a\x7b\x3f\xed\
+\x6f\xf7\xbc\x10\x50\xdb\x49\xd3\xd2\x6c\x22\x2b\xfb\x2d\x00\x68\
+\xad\xe9\xde\xb5\x13\x87\x4f\x1c\xcb\xd4\x19\xf3\x92\x35\xfe\xe9\
+\x35\xf1\xde\x7a\x79\xcf\xdf\x3a\xc7\xf1\xb4\xfa\xfb\x44\xa9\xaf\
+\xcf\x71\xbf\xbf\x75\x01\xd7\x64\xfc\x9d\xaa\xd9\x4f\xff\xdb\x5b\
+\xeb\x9f\xba\x9f\x5f\x4f\x01\xef\xb5\xe9\xef\x25\xd7\x6b\x4c\x3c\
+\x86\x10\x9a\xa6\x26\x4d\x87\xaa\x28\x9b\x37\xd9\x7b\xb4\xad\x99\
+\x6d\x43\xe7\x2e\x16\xf3\xe6\xb6\xba\xe1\xbf\x94\xe9\x4f\x56\xfe\
+\x7f\xe2\xbd\x99\x9c\x81\xec\x95\x5c\xf8\x9a\xd9\x39\x57\xe5\x0c\
+\x8e\x20\x17\xe9\xd6\x96\xbf\xae\x0b\x78\x9e\x4c\x77\xa4\xcd\x8c\
+\x41\x95\x27\x91\xc8\xfb\x1e\xb5\x69\x22\xb2\xab\x01\xa0\xe8\x1a\
+\x82\x44\x22\x16\xe5\x65\xa5\xee\x8f\xa4\x60\xe8\xf8\x55\xd7\xea\
+\xdd\xf4\xb8\xbb\xea\x5a\x1d\xf0\x71\x9b\x9b\x14\x8e\xb3\xe7\xbf\
+\xf6\x92\x52\x61\xd2\x5c\xf5\xaf\x79\x0f\xd9\x1d\x7f\xb2\x17\x8a\
+\xfc\x77\xd6\x6d\x7c\xec\xba\x8d\xaf\x44\xef\xe4\xb9\xac\x5d\x9d\
+\xe7\x69\x72\x9c\xdb\xd5\x56\x5b\xd1\xb9\x00\xb6\xed\xb0\xad\x7e\
+\xc7\x5e\x7a\xf6\x22\xe9\x61\xdd\xd6\xbb\xd8\x4b\x6f\xa3\xa5\x59\
+\xd3\xbc\x97\x96\x1b\xb1\x6f\x7f\xa5\xfb\x0f\x00\x98\x1f\xf0\x7e\
+\xfe\xad\x15\xb1\x84\x5f\x5d\xfb\x92\x7d\xae\x1c\x38\x94\x50\x42\
+\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\
+\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x09\x01\
+\x20\x94\x50\x42\x09\x01\x20\x94\x50\x42\x00\x08\x25\x94\x50\x42\
+\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\
+\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\
+\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\
+\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\
+\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\
+\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\
+\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\
+\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\
+\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\
+\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\
+\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\x25\x94\x50\x42\x00\x08\
+\x25\x94\x50\x42\x00\x08\x25\x94\x50\xf2\xc8\xff\x0f\x5c\x85\xe9\
+\x3c\xa4\xec\x7f\x33\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x03\x8b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x03\x3d\x49\x44\x41\x54\x78\x9c\xed\
+\x98\xcb\x6e\x52\x51\x14\x86\xf7\xeb\xec\x07\xf0\x12\x4d\x1c\xac\
+\x31\x20\x1d\xf4\x05\x1a\x35\x5e\x47\x30\x81\xb7\xe8\x03\xb4\x03\
+\x07\xda\x62\x8c\x06\xa4\x29\xa1\xd5\x04\xe6\x4e\xbd\x54\xa3\x03\
+\x29\xfb\x60\x68\xc2\x65\x00\x4c\xb6\x39\x98\xb4\xa9\xc0\xe1\x00\
+\x67\x9d\xd5\x2d\xff\x9f\xac\x29\x2d\xdf\xd7\xfd\xff\x49\x95\x42\
+\x10\x04\x41\x10\x04\x41\x10\x04\xb9\x22\x21\x22\x1b\xe5\x49\x7f\
+\x1f\xe7\x42\x10\x00\x01\x6b\x1d\xc2\x0b\xb8\x9a\x20\x29\xe6\x53\
+\xae\x47\x1a\x20\x41\x80\x3c\x44\xc2\x0b\x90\x07\x49\xa8\x20\x37\
+\x4f\xb9\x1e\x69\x80\x04\x01\xf2\x10\x09\x2f\x40\x1e\x24\xa1\x82\
+\xdc\x3c\xe5\x7a\xa4\x01\x12\x04\xc8\x43\x24\xbc\x00\x79\x90\x84\
+\x0a\x72\xf3\x94\xeb\x91\x06\x48\x10\x10\x2f\xb0\x44\x22\x61\xb7\
+\xb6\xb6\x20\x40\xea\x05\x14\x8b\x45\xbb\xb9\xb9\x09\x01\x12\x02\
+\x32\x99\x8c\x3d\x3d\x3d\x45\x05\x49\x6c\x40\x22\x91\xb0\x8d\x46\
+\xc3\xd6\x6a\x35\x08\x90\x10\x50\x2a\x95\xec\x68\x34\xb2\x3b\x3b\
+\x3b\x10\x10\xb7\x80\x6c\x36\x6b\x87\xc3\xe1\x58\x40\x2e\x97\x83\
+\x80\x38\x05\x24\x93\xc9\x71\xef\xfb\xf0\xfd\x8b\x72\x80\xfd\x53\
+\xae\x87\x5b\x40\xb9\x5c\x3e\x87\x6f\x8c\x89\xfc\xf3\x95\xeb\xe1\
+\x84\x9f\xcb\xe5\xce\xe1\xfb\x17\xf5\x00\x43\x00\x85\xaf\x1e\x8e\
+\x01\x86\x00\x9a\x0d\xe6\xe0\xe0\xe0\x12\x7c\x8e\x01\x86\x00\x0a\
+\x57\x3d\x5c\x03\x0c\x01\x34\x09\x24\x95\x4a\x4d\x54\x0f\xd7\x00\
+\x43\x00\x4d\x02\x39\x3c\x3c\x9c\xfa\xd7\xcf\x31\xc0\x10\x40\xe1\
+\xaa\x87\x6b\x80\x21\x80\x2e\x57\x4f\xb3\xd9\x9c\x29\x80\x63\x80\
+\x21\x80\x2e\x40\x54\x2a\x95\x99\xf0\xb9\x06\x18\x02\xe8\x2f\x84\
+\x7c\x3e\x1f\x08\x9f\x6b\x80\x21\x80\xc8\xa6\xd3\xe9\x31\xe0\x20\
+\x01\xf5\x7a\x1d\x02\xb8\xfe\x15\x51\xad\x56\x03\xe1\xfb\xb7\xbb\
+\xbb\x0b\x01\x1c\x02\xf2\x73\xaa\x87\x7b\x80\xd7\xba\x82\x36\x36\
+\x36\xac\xe7\x79\xa1\x04\x70\x0d\xf0\x7f\x21\x40\x9b\xe7\x76\x99\
+\x7b\xd7\xff\x1e\x0a\xfe\x22\xe7\x7f\xe6\xa2\xbf\x87\x72\x3d\xcb\
+\xc0\x7f\xd4\x3e\x8e\x1c\xbe\x37\xe8\xd9\xdb\xad\x02\x04\xcc\x83\
+\x7f\xab\xb5\x6f\x9b\x83\x6e\xe4\x02\x9e\x9d\x7d\x58\xea\x25\x2a\
+\xd7\xb3\xe8\x17\x2e\x33\x54\x4f\xb1\xff\x6d\x29\xf8\x6b\x29\x40\
+\x87\xbc\x3b\x5e\x21\x14\x7c\x33\xe8\x2e\x55\x3d\x10\x60\x82\xc1\
+\x3c\x6c\x1f\x85\xab\x9e\xf6\xfb\x95\x44\x2b\xd7\xc3\xf5\x02\xb6\
+\x3b\x1f\xe7\xc2\x7f\xdb\x3f\x59\xf9\xe7\x28\xd7\xc3\x25\xe0\xa8\
+\xff\x93\xb5\x7a\x20\xc0\x04\x83\x69\x0c\x3a\x81\x02\x9e\xae\x58\
+\x3d\x10\x60\x96\x1f\xe0\x37\xfd\xaf\x91\xbd\x34\xe5\x7a\xe2\x1e\
+\xe0\xc6\xa0\x63\x6f\xb6\xf6\x21\x80\x53\xc0\x76\xc0\x00\x3f\x89\
+\xa8\x7a\xf0\x02\xcc\x6c\x28\xd5\xfe\x8f\xa9\xf0\x5f\x47\x58\x3d\
+\x10\x60\x16\x1b\xe0\xa8\xab\x07\x02\xcc\x62\x03\xfc\xb8\x7d\x1c\
+\x39\x7c\xff\x94\xeb\x89\x63\x80\x5f\xf5\xbe\xb0\xc0\x87\x00\x33\
+\x7f\x80\x1b\xc3\xae\xbd\xd1\xda\x83\x80\xb8\x5e\x40\xf5\x9f\x01\
+\x7e\x70\x76\xc4\x06\x1f\x2f\xc0\x04\x0f\x70\xa1\xf7\x99\x15\x3e\
+\x04\x98\xd9\x03\xcc\x5d\x3d\x10\x60\x82\x07\xf8\x3e\x73\xf5\x40\
+\x80\x99\x3d\xc0\x7b\x31\x54\x0f\x04\x98\xe9\x03\xfc\x6b\xd8\xb1\
+\xd7\x3d\xfe\xea\x81\x00\x33\x09\xc3\xef\xfd\x7b\xed\x6a\x6c\xf0\
+\xfd\x53\xae\x27\xca\x01\x7e\xd1\xfb\x14\x2b\x7c\x08\x30\x17\x20\
+\xee\xfe\x2e\xda\x6b\xde\x4b\x08\x90\x7a\x01\x5a\xe8\x94\xeb\x91\
+\x06\xa8\x21\x40\x1e\xa2\xc6\x0b\x90\x07\xa9\x51\x41\x6e\x9e\x72\
+\x3d\xd2\x00\x35\x04\xc8\x43\xd4\x78\x01\xf2\x20\x35\x2a\xc8\xcd\
+\x53\xae\x47\x1a\xa0\x86\x00\x79\x88\x1a\x2f\x40\x1e\xa4\x46\x05\
+\xb9\x79\xca\xf5\x48\x03\xd4\xeb\x2e\x00\x41\x10\x04\x41\x10\x04\
+\x41\x10\x75\xd5\xf2\x07\x75\xc3\xa1\xd5\x75\x03\xb7\xaf\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x73\xd3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xec\xdd\x79\x9c\xd4\x75\xfd\x07\xf0\xd7\xfb\x33\
+\x33\x2c\x37\x1e\x5c\xa9\xc8\xc2\x22\xa7\x22\x8a\x56\x26\xac\x9b\
+\x57\xa2\x02\x6a\x8d\x1c\x6a\x9a\xc2\x9a\x99\x25\xc8\x61\xfd\x2a\
+\xa7\x4b\xe5\x50\x52\x33\x13\x41\x2d\x0f\xc0\x4d\x53\x48\x2d\x4b\
+\x5b\x51\x33\x2d\xc8\x83\x53\x51\x01\xf1\x40\x50\x11\x84\x65\x77\
+\x67\xbe\xef\xdf\x1f\xec\xe2\xee\x1c\xb0\xc7\xec\xbc\x3e\x0b\xef\
+\xe7\xe3\xd1\xa3\x4c\x76\xde\xaf\x5d\x66\xe7\xf3\xf9\x7e\x4e\xc0\
+\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
+\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
+\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
+\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
+\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
+\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
+\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
+\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
+\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
+\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
+\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
+\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
+\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
+\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
+\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
+\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
+\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
+\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
+\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\
+\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\
+\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
+\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\
+\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\x63\x8c\
+\x31\xc6\x18\x63\xf6\x1d\x23\xc6\xcc\xbc\x78\xe4\xa8\x99\x3f\x63\
+\xe7\x30\xc6\x18\x93\x5e\xdf\xc2\x71\xd7\xf5\x3f\x69\xdc\x77\xd8\
+\x39\x9a\x8b\x10\x3b\x40\x73\x30\x62\xd4\xf4\x28\x80\x3f\x40\x70\
+\x4a\xdf\x23\x4f\x6f\xb5\x7a\xd9\xdf\xff\xc1\xce\x64\x8c\x31\xe6\
+\x0b\xfd\x0b\x8b\x63\x00\x62\x80\x0c\xef\x7c\xf8\xb1\x6f\x6f\x5a\
+\xbf\xf4\x35\x72\x24\xef\x59\x07\x60\x2f\x86\x8f\x99\xfe\x4d\x81\
+\xcc\x03\x10\xae\xfa\xbf\x86\x58\x27\xc0\x18\x63\xfc\xd1\xbf\xb0\
+\x38\xa6\xd0\xeb\xaa\xfe\x51\x20\x32\xb2\x63\xf7\xe3\xd6\x6c\x5e\
+\xb7\xe4\x75\x6a\x30\xcf\x59\x07\x60\x0f\x46\x8e\x9e\x71\x2e\x20\
+\xf3\x01\x44\x92\xfe\x95\x75\x02\x8c\x31\xc6\x03\x49\x8d\x7f\x35\
+\x27\xc0\x39\x9d\xba\x1f\xbb\x7a\xf3\xba\xa5\xcb\x29\xc1\x9a\x01\
+\xeb\x00\x64\x30\x7c\xd4\xf4\xb3\x21\x52\x02\xa0\x45\x86\x3f\x32\
+\xa4\xcf\x91\xa7\xcb\xea\x65\x7f\x2f\xcd\x61\x2c\x63\x8c\x31\x55\
+\x32\x34\xfe\xd5\x1c\x20\x23\x3a\x76\x1b\xfc\xca\xe6\xf5\x4b\xdf\
+\xc8\x69\xb0\x66\xc2\x3a\x00\x69\x9c\x33\x7a\x46\x11\x44\x1e\x03\
+\x90\xb7\x97\x3f\x5a\x64\x23\x01\xc6\x18\x93\x7b\x7b\x69\xfc\xab\
+\x85\x44\x70\x6e\xc7\xc3\x07\x3f\xbf\x79\xfd\xd2\x75\x39\x09\xd6\
+\x8c\x58\x07\x20\xc9\xd9\xa3\x6e\x3a\x1a\xd0\xbf\x42\xd0\xb6\x8e\
+\x5f\x62\xd3\x01\xc6\x18\x93\x43\x75\x6c\xfc\xab\x45\x44\x70\x5e\
+\xc7\x6e\xc7\xfe\x7d\xf3\xfa\xa5\x1f\x34\x69\xb0\x66\xc6\x3a\x00\
+\x35\x9c\x3d\x76\xfa\x11\x0e\xfa\x0c\x44\x3a\xd6\xf3\x4b\xad\x13\
+\x60\x8c\x31\x39\x50\xcf\xc6\xbf\x5a\x9e\x88\x9c\xd7\xb5\xfb\xb1\
+\x7f\xf9\x68\xdd\xd2\xcd\x4d\x12\xac\x19\xb2\x0e\x40\x95\xf3\x2e\
+\x98\x76\x18\x02\x57\x0a\xc8\xa1\x0d\x7c\x09\xeb\x04\x18\x63\x4c\
+\x13\x6a\x60\xe3\x5f\xad\x75\x00\x19\xd9\xb1\xc7\x97\xff\xbc\x79\
+\xed\x7f\xb7\x64\x35\x58\x33\x65\x1d\x00\x00\xe7\x7e\xfb\xfa\x83\
+\x13\x89\xf0\xb3\x00\x0a\x1a\xf9\x52\xb6\x30\xd0\x18\x63\x9a\x40\
+\x23\x1b\x7f\x00\x80\x00\xed\x9d\xea\x19\x07\xf7\x3a\x61\xfe\xe6\
+\x77\xfe\x53\x96\xad\x6c\xcd\xd5\x7e\xdf\x01\x88\x46\x6f\x6e\x55\
+\xa9\xf2\x04\x80\x63\xb2\xf4\x92\xb6\x30\xd0\x18\x63\xb2\x28\x1b\
+\x8d\x7f\x0d\x1d\x25\x48\x14\x75\xef\x78\xdc\x83\x1f\x7c\xb0\xa4\
+\x32\x4b\xaf\xd9\x2c\xed\xd7\x1d\x80\x58\x2c\xe6\x36\x7c\x12\x9e\
+\x0f\xe0\x1b\x59\x7e\x69\x9b\x0e\x30\xc6\x98\x2c\xc8\x72\xe3\x5f\
+\xed\xd0\x78\x0b\x1d\xb8\xe9\xcb\x05\x0f\x61\xc5\x0a\xcd\xf2\x6b\
+\x37\x1b\xfb\x75\x07\xa0\x43\x97\xb3\x6f\x81\xe0\x92\x26\x7a\x79\
+\xeb\x04\x18\x63\x4c\x23\x34\x51\xe3\x5f\x45\xfa\x74\xdc\xde\xb2\
+\xcb\xe6\x75\x4b\xff\xd2\x34\xaf\xef\xbf\xfd\xb6\x03\x30\x62\xcc\
+\x8c\x1f\x01\xf8\x71\x13\x97\xb1\x4e\x80\x31\xc6\x34\x40\xd3\x36\
+\xfe\xbb\x08\x70\x5c\xa7\xfc\xe3\xca\x36\xaf\x5b\xf2\x42\x53\xd6\
+\xf1\xd5\x7e\xd9\x01\x18\x39\x7a\xfa\x28\x40\x7e\x07\x40\x72\x50\
+\xce\x16\x06\x1a\x63\x4c\x3d\xe4\xa2\xf1\xaf\xe1\xd4\xce\xf9\xc7\
+\xad\xd8\xb4\x6e\xc9\x8a\x1c\xd5\xf3\xc6\x7e\xd7\x01\x38\x67\xec\
+\xcc\xc1\xaa\x78\x14\x99\x8f\xf8\x6d\x0a\xb6\x30\xd0\x18\x63\xea\
+\x20\xc7\x8d\x3f\xb0\xeb\x41\xf0\xec\xce\xdd\x8e\xfb\xc7\xa6\xf5\
+\x4b\xde\xcb\x61\x5d\xba\xfd\xaa\x03\x30\x62\xf4\xb4\x43\x54\xe5\
+\x19\x00\x07\x13\xca\xdb\x74\x80\x31\xc6\xec\x01\xa1\xf1\xaf\x16\
+\x81\xe8\xd9\x5d\xbb\x1f\xfd\xd0\x47\xeb\x5e\xd9\x4a\xa8\x4f\xb1\
+\xdf\x74\x00\xa2\xd1\xdb\xdb\x26\x5c\xfc\x69\x00\x47\x10\x63\x58\
+\x27\xc0\x18\x63\xd2\x20\x36\xfe\x55\xa4\xad\xc2\x7d\xbd\x4b\x8f\
+\xaf\x3e\xb0\x69\xed\x7f\x2a\x78\x39\x72\xc7\xb1\x03\xe4\x42\x2c\
+\x16\x73\xe5\xa1\xed\x0f\x00\x38\x9a\x9d\x45\x81\xa9\x23\x46\xcf\
+\x88\xb1\x73\x18\x63\x8c\x2f\xf8\x8d\xff\x6e\x83\x82\xa0\xf2\x7e\
+\x20\xb6\x5f\xb4\x8d\xfb\xc5\x08\x40\xfb\xae\x67\xfd\x1a\x90\x71\
+\xec\x1c\x35\xd8\x9a\x00\x63\x8c\x81\x57\x8d\x7f\xb5\xbe\x9d\xba\
+\x6f\x0d\x6f\x5e\xb7\xf4\x19\x76\x90\xa6\xb6\xcf\x77\x00\x46\x8e\
+\x9e\x71\x2e\x80\xdb\x90\x9b\x15\xff\xf5\x61\xd3\x01\xc6\x98\xfd\
+\x9a\x87\x8d\x7f\x15\x19\xda\xb9\xfb\xe0\x95\x9b\xd6\x2d\x5d\xce\
+\x4e\xd2\x94\x7c\x6b\x14\xb3\x6a\xe4\x05\x37\x1f\xa5\x89\xc4\xbf\
+\x80\x3a\x5f\xed\x9b\x63\xba\x51\xc5\x1d\xb9\x68\xde\x24\xbb\x9d\
+\xca\x18\xb3\x5f\xe9\x5d\x54\xdc\x31\x14\xe8\x32\x00\x5d\xd8\x59\
+\x32\xf8\x1c\x2e\x38\x61\x65\xe9\xdc\x65\xec\x20\x4d\x65\x9f\x9d\
+\xe7\x38\x6b\xec\x0d\x07\x6a\x22\xf1\x08\x7c\x6d\xfc\x15\x5b\x80\
+\xd0\x30\x6b\xfc\x8d\x31\xfb\xa3\x37\x4a\x67\x6f\x56\xc8\x69\x80\
+\x7e\xcc\xce\x92\x41\x5b\x04\x6e\x51\xdf\x53\xae\x64\xec\x1a\xcb\
+\x89\x7d\xb2\x03\x10\x8d\x3e\x14\x0a\x07\xe1\xf9\x00\x7a\xb1\xb3\
+\x64\xb0\x15\x12\x9c\xb6\x70\xfe\x35\xff\x63\x07\x31\xc6\x18\x96\
+\x55\x8b\x67\xbf\xee\x44\x86\x01\xf0\x75\xeb\x5d\x3e\x2a\xca\xf7\
+\xd9\x45\x81\xfb\xe4\x37\xb5\x33\xbc\xee\xe7\x0a\x9c\xce\xce\x91\
+\xc1\x0e\x15\x1d\xb1\x70\xfe\xd4\xff\xb2\x83\x18\x63\x0c\xdb\xf2\
+\x67\xef\xfa\x8f\x02\xc3\x00\x7c\xce\xce\x92\x8e\x88\x9c\xd1\xbf\
+\xf0\xfd\x9f\xb1\x73\x34\x85\x7d\x6e\x0d\xc0\xd9\xa3\x6f\x3a\xc5\
+\x21\xf8\x1b\xfc\x5c\xe0\x58\xa1\x2a\xe7\x2c\x5a\x30\xe9\x49\x76\
+\x10\x63\x8c\xf1\x49\xbf\xa2\xf1\xa7\x22\xc0\x22\x00\x2d\xd9\x59\
+\xd2\x08\x54\x71\xe6\xaa\xe7\xee\xfa\x1b\x3b\x48\x36\xed\x53\x1d\
+\x80\x91\xa3\x6f\xea\xa6\x08\x96\x02\xe8\xc8\xce\x92\x46\x42\x20\
+\xa3\x1f\x9b\x3f\xe9\x4f\xec\x20\xc6\x18\xe3\xa3\xfe\x43\xc7\x8d\
+\x54\x91\x12\x00\x11\x76\x96\x34\x3e\x41\x38\x38\x76\xe5\x33\x73\
+\xd7\xb1\x83\x64\xcb\x3e\x33\x05\x50\x5c\x7c\x67\x44\x11\xcc\x83\
+\x9f\x8d\x7f\xa0\x22\x17\x59\xe3\x6f\x8c\x31\x99\xad\x78\x6e\xce\
+\x63\x4e\x75\x2c\x80\x04\x3b\x4b\x1a\x07\x21\xee\xe6\x0f\x18\x10\
+\xcd\xe5\x3d\x32\x4d\x6a\x9f\xe9\x00\x7c\xf8\xd9\xd6\xe9\x00\x4e\
+\x64\xe7\x48\x43\x01\x1d\xbf\x68\xde\xa4\x79\xec\x20\xc6\x18\xe3\
+\xbb\xe5\xcf\xcd\xf9\x13\x54\xbe\x0b\x40\xd9\x59\xd2\xf8\xaa\x1e\
+\xdc\xe1\x7a\x76\x88\x6c\xf1\x71\x9e\xbc\xde\x46\x8e\x99\x31\x1c\
+\xc0\x6f\xe0\xe1\x94\x86\x0a\x26\x2e\x9a\x3f\xe5\x0e\x76\x0e\x63\
+\x8c\x69\x2e\x36\xaf\x5f\xb2\xb4\x63\xf7\xe3\x3e\x17\x2f\x17\x73\
+\xcb\x09\x9d\xba\x1f\xfb\x9f\xcd\xeb\x96\xbe\xc9\x4e\xd2\x58\xde\
+\x35\x98\xf5\x75\x76\xf4\xe6\x43\x5d\x28\xf1\x0a\x7c\x1c\xfa\x17\
+\xbd\x65\xe1\xbc\x29\x57\xb3\x63\x18\x63\x4c\x73\xd4\x77\xe8\xf8\
+\x5b\x45\x70\x15\x3b\x47\x1a\x9b\xa0\x72\xf4\xca\xe7\x66\x7f\xc0\
+\x0e\xd2\x18\xcd\x7a\x0a\x20\x16\x8b\xb9\x50\x28\xfe\x07\xf8\xd8\
+\xf8\x03\x8f\xe7\xc5\xf3\xaf\x61\x87\x30\xc6\x98\xe6\x6a\x55\xd7\
+\x2d\x13\x00\x3c\xc6\xce\x91\x46\x27\x40\x1f\x6c\xee\xe7\x03\x34\
+\xeb\xf0\x4b\x56\xb5\xbe\x56\x21\xa7\xb0\x73\xa4\xb1\x74\x67\x04\
+\xa3\x4a\x4a\xce\xf7\x71\x21\x8b\x31\xc6\x34\x0f\x25\x25\x89\xd6\
+\xdb\x65\x2c\x80\x97\xd9\x51\x52\x08\x8a\xfa\x0d\xdd\xd0\xac\x1f\
+\xf2\x9a\xed\x14\xc0\xf0\x51\x33\x8f\x17\xd1\x17\xe0\xdf\x76\x91\
+\xf7\xc2\xa1\xe0\xab\x8f\x3c\x30\x75\x03\x3b\x88\x31\xc6\xec\x0b\
+\xfa\x0d\x2d\xfe\x12\x44\xff\x0d\xe0\x70\x76\x96\x24\x95\x12\xc8\
+\xd0\x15\xcf\xcf\x7e\x89\x1d\xa4\x21\x9a\x65\x07\xe0\xf4\x8b\x66\
+\xb4\x69\x59\x89\xff\x01\x38\x82\x9d\x25\xc9\x56\x08\x86\x2e\x9c\
+\x37\xf9\x35\x76\x10\x63\x8c\xd9\x97\xf4\x3f\x71\xfc\x00\x0d\xe1\
+\x79\x00\x07\xb0\xb3\xd4\xa2\x78\xcb\x85\x22\x83\x96\x97\xfe\xce\
+\xcb\x93\x0c\xf7\xa4\x59\x4e\x01\xb4\xac\xd4\x99\xf0\xaf\xf1\xaf\
+\x84\xc8\xb7\xac\xf1\x37\xc6\x98\xec\x5b\xf1\xc2\x5d\xcb\x55\x31\
+\x1a\x40\x9c\x9d\xa5\x16\x41\x81\x06\x95\x37\xb0\x63\x34\x44\xb3\
+\xdb\x06\x38\x62\xcc\xcc\xd3\xe0\xe5\x96\x3f\xf9\xfe\xc2\xf9\x93\
+\x1e\x62\xa7\x30\xc6\x98\x7d\xd5\xe6\xf5\x4b\xdf\xea\xd4\xfd\xd8\
+\xf7\x01\x19\xc1\xce\x92\xe4\xf8\xce\xf9\x83\x5f\xde\xb4\x6e\xe9\
+\x1a\x76\x90\xfa\x68\x56\x1d\x80\xb3\xc6\xde\x70\xa0\x53\xf7\x37\
+\x00\xed\xd9\x59\x6a\x12\xe8\xf5\x0b\xe7\x4f\x9e\xce\xce\x61\x8c\
+\x31\xfb\xba\xcd\xeb\x96\xfe\xaf\x53\xf7\xc1\xad\x00\x0c\x61\x67\
+\xa9\x41\x14\x38\xe9\xb0\x1e\x03\xef\xf9\x70\xed\x2b\x3b\xd9\x61\
+\xea\xaa\x59\x4d\x01\xb8\x20\xfc\x5b\x00\x87\xb2\x73\xd4\x26\x7f\
+\x39\xa6\xef\x8e\x9f\xb2\x53\x18\x63\xcc\xfe\x62\xe5\xe2\x43\x7f\
+\x0c\xe0\x09\x76\x8e\x9a\x04\x38\xac\x5c\x5b\xdc\xc6\xce\x51\x1f\
+\x9e\x0d\xa3\x67\x36\x72\xf4\x8c\x73\x15\x78\x84\x9d\x23\xc9\x1a\
+\xd7\x32\x7c\xfc\xa3\xf7\x4e\xd8\xc2\x0e\x62\x8c\x31\xfb\x93\xa3\
+\x86\x5c\x71\x60\xc2\x25\xfe\xab\xd0\x9e\xec\x2c\xb5\xa8\x9c\xbb\
+\xf2\xb9\xd9\x8f\xb2\x63\xd4\x45\xb3\xe8\x00\x9c\x73\xc9\xac\x03\
+\x82\x9d\xf1\x65\xf0\xeb\xe9\xbf\x0c\x70\x27\x2e\x9c\x7f\xcd\xff\
+\xd8\x41\x8c\x31\x66\x7f\xd4\x67\xe8\xb8\x81\x4e\xe4\x45\x00\xad\
+\xd9\x59\xbe\xa0\x1f\x86\x83\x48\xff\xd7\x9f\xbf\xe3\x53\x76\x92\
+\xbd\x69\x16\x53\x00\x41\x79\xfc\x16\xf8\xd5\xf8\x03\x22\x57\x58\
+\xe3\x6f\x8c\x31\x3c\xab\x9f\x9b\xf3\x9a\x00\xc5\xec\x1c\xb5\x49\
+\xd7\x4a\x49\xdc\xc4\x4e\x51\x17\xde\x2f\x02\x1c\x79\xfe\x8c\x53\
+\x21\x98\x09\x8f\x46\x2b\x44\xe5\xb6\x85\xf3\x27\xdd\xc8\xce\x61\
+\x8c\x31\xfb\xbb\x4d\xeb\x96\xbe\xde\xe9\xf0\x63\xbb\x40\xe4\x78\
+\x76\x96\x6a\x22\x38\xa6\xe3\xe1\x83\xff\xbd\x79\xfd\xd2\xb7\xd8\
+\x59\xf6\xc4\xeb\x11\x80\x61\x17\xdc\xda\x5e\x1d\xe6\xc2\xa3\xc6\
+\x1f\xd0\x7f\xb7\x08\x3e\x9f\xc4\x4e\x61\x8c\x31\x66\x97\xd6\x3b\
+\xdc\x0f\x05\x78\x81\x9d\xa3\x26\x01\xee\xec\x73\xe2\xa5\xed\xd8\
+\x39\xf6\xc4\xeb\x0e\x40\x24\x51\x71\x3d\xfc\x3a\xfa\xf1\x43\x40\
+\xbf\x59\x52\x12\xab\x60\x07\x31\xc6\x18\xb3\xcb\x92\x25\xb3\x2b\
+\x2b\x9c\x8e\x56\xe0\x23\x76\x96\xdd\x04\xdd\x5d\x28\xf4\x4b\x76\
+\x8c\x3d\xf1\xb6\x03\x30\x62\xf4\xb4\xe3\x00\xfd\x2e\x3b\x47\x0d\
+\x71\x15\x1d\xbd\x70\xfe\xd4\xf7\xd9\x41\xea\xe3\xec\xd1\x37\xf9\
+\x78\x59\x92\x31\xc6\x73\xfd\x87\x5e\xde\xac\x3e\x3b\xd6\x94\xce\
+\xd9\xa0\x22\xbe\x9d\x14\x78\xd5\x80\xa1\x97\x7d\x99\x1d\x22\x13\
+\x2f\xd7\x00\x44\xa3\x0f\x85\x12\x6e\xeb\x22\x00\x87\xb0\xb3\xec\
+\x26\x32\x65\xd1\xbc\xc9\xf3\xd8\x31\xea\x63\xc4\xe8\x19\x3f\x15\
+\xe8\x3d\x7d\x8f\x3c\xbd\xd5\xea\x65\x7f\xff\x07\x3b\x8f\x31\xa6\
+\x79\xe8\x5f\x58\x1c\x53\xd1\xbb\x3b\x1d\x7e\x5c\xb0\x79\xfd\x92\
+\xc5\xec\x3c\x75\xf5\xf1\xba\x25\x6b\x3b\x75\x1f\x5c\x01\xe0\x54\
+\x76\x96\x2a\x12\x88\x0c\xda\xfc\xe5\x82\xbb\xb1\x62\x85\xb2\xc3\
+\x24\xf3\x72\x04\x60\x67\x78\xdd\x55\x00\x8e\x61\xe7\xf8\x82\xfe\
+\x7d\xe1\xbc\x6b\x6e\x66\xa7\xa8\x8f\x91\xa3\x67\xfc\x00\xc0\x2f\
+\x00\x40\x81\xa9\x23\x47\xcf\xb0\x45\x8b\xc6\x98\xbd\xea\x5f\x58\
+\x1c\x53\xe8\x75\x00\x00\xd1\x5f\xf4\x1b\x3a\x6e\x32\x39\x52\xbd\
+\xac\x5c\x7c\xd7\x74\x00\x4f\xb2\x73\x54\x13\xe0\xf8\x7e\x1b\x3b\
+\xf8\x34\x9a\xbd\x9b\x77\x1d\x80\xf3\x2e\x9c\xf5\x25\x51\xc4\xd8\
+\x39\x6a\xd8\x1c\x0e\x47\x2e\xde\x75\xd2\x63\xf3\x30\x72\xd4\x8c\
+\xef\xe8\xae\xfb\x12\x76\xb3\x4e\x80\x31\x66\x6f\x6a\x35\xfe\xd5\
+\x44\xa6\xf5\x1f\x3a\xde\xcb\x06\x2c\x03\x4d\x84\x43\xe3\x01\xfd\
+\x98\x1d\xe4\x0b\x72\x7d\xef\x93\xbf\xeb\xd7\x56\x76\x78\xd8\x01\
+\x88\xc7\xe3\xb7\x02\xe8\xc0\xce\x51\x4d\x45\xc6\x3f\x72\xff\x84\
+\x0f\xd8\x39\xea\x6a\xc4\x98\x19\x17\xaa\x60\x0e\xd2\xec\x9c\xb0\
+\x4e\x80\x31\x26\x93\xb4\x8d\xff\x2e\xa2\x82\xdb\xfb\x17\x8e\xbf\
+\x20\xe7\xa1\x1a\xe8\x8d\x67\x7e\xff\x9e\x53\xf8\xd4\x69\x69\x1f\
+\x4a\x24\x66\xb2\x43\x24\xf3\x6a\x0d\xc0\xf0\x31\x33\x4e\x16\x60\
+\x1a\x3b\x47\x35\x55\x9d\xb3\x68\xfe\xe4\x19\xec\x1c\x75\x35\x7c\
+\xcc\xcc\x73\x44\xf1\x00\xf6\xfc\xf7\x3a\xc4\xd6\x04\x18\x63\x6a\
+\xda\x43\xe3\x5f\x4d\x00\x8c\xec\xdc\x7d\xf0\xaa\x4d\xeb\x96\x2e\
+\xcf\x55\xae\xc6\xd8\xb4\x7e\xe9\x8a\xce\xf9\x83\xf3\x01\x0c\x62\
+\x67\xa9\x72\x64\xc7\x1e\xc7\x3e\xbb\x79\xed\xd2\xb5\xec\x20\xd5\
+\xbc\x19\x01\x28\x2a\x8a\x85\x25\xd0\xdf\xec\xfd\x4f\xe6\xcc\x5b\
+\x52\xa6\x13\xd9\x21\xea\x6a\xc4\x98\x99\xa7\x89\xea\x7c\x00\xe1\
+\xbd\xfd\x59\x1b\x09\x30\xc6\x54\xab\x43\xe3\x5f\x2d\xa4\xc0\x7d\
+\xfd\x0a\xc7\x9d\xd9\xe4\xa1\xb2\x24\x9c\xb7\xf3\xfb\x00\xde\x64\
+\xe7\xa8\x26\x2a\xbf\x2d\x2a\x8a\xed\xf5\x33\x3a\x57\xbc\xe9\x00\
+\xb4\xfb\x52\x9b\xef\x43\xe4\x28\x76\x8e\x2a\x71\x55\x77\xe1\xc2\
+\x85\x53\xb7\xb1\x83\xd4\xc5\xf0\x31\x33\x87\x40\xf5\x31\x00\x79\
+\x75\xfd\x1a\x05\xa6\x8e\x18\x3d\x23\xd6\x74\xa9\x8c\x31\xbe\xab\
+\x47\xe3\x5f\xad\x05\x20\x25\x7d\x0b\xc7\x7f\xad\xc9\x42\x65\xd1\
+\x6b\x4f\xdd\xb7\xdd\x09\x2e\x00\x50\xc9\xce\x02\x00\x50\x0c\xd8\
+\x18\x6c\xb8\x9c\x1d\xa3\x9a\x17\x53\x00\xe7\x5e\x34\xa3\xb3\xc6\
+\xf1\x27\x08\x5a\xb2\xb3\x54\x89\x2d\x5a\x30\xe9\x41\x76\x88\xba\
+\x38\x6b\xec\xac\x9e\x4e\x83\xbf\xa3\x61\xeb\x26\x8a\x6c\x3a\xc0\
+\x98\xfd\x53\x03\x1a\xff\x6a\x11\x81\x9e\xd3\xb1\xdb\xe0\x47\x37\
+\xaf\x5f\xea\xd1\x42\xbb\xf4\x36\xad\x5b\xfa\x7e\xe7\xc3\x07\x87\
+\x21\x38\x89\x9d\x65\x17\x39\xe1\xa0\x1e\xc7\xcd\xfd\x78\xed\x92\
+\x1d\xec\x24\x5e\x8c\x00\xc4\x2b\xf4\xd7\x10\x1c\xc0\xce\x51\xe5\
+\x5f\x79\x89\xee\xd7\xb3\x43\xd4\xc5\xb9\xdf\xbe\xfe\xe0\x50\x10\
+\x7f\x12\x40\xa7\x86\xbe\x86\x4d\x07\x18\xb3\xff\x69\x44\xe3\x5f\
+\x45\x0e\x16\xc1\x13\xbd\x86\x7e\xa7\xc1\x9f\x3d\xb9\xd4\x39\x74\
+\xe8\x2f\x01\xfc\x9b\x9d\xa3\xca\x81\xa1\x44\xf0\x0b\x76\x08\xc0\
+\x83\x33\xf6\xcf\x1e\x75\xd3\xd1\x4e\x82\xa5\xf0\xa1\x33\x22\xd8\
+\x96\x90\xf0\xa0\xc7\x1f\x9c\xf0\x36\x3b\xca\xde\x44\xa3\xb1\x16\
+\xe5\xe1\xb6\x7f\x85\xea\xd7\xb3\xf1\x7a\x02\x4c\x7b\x6c\xfe\xe4\
+\x6b\xb3\xf1\x5a\xc6\x18\x7f\x35\xbe\xf1\xaf\x41\xf1\x7c\x65\xdb\
+\x96\xa7\xae\x79\xf2\xb6\xf2\xac\xbc\x5e\x13\x1a\x50\x74\x59\xaf\
+\x20\x70\xff\x03\xd0\x96\x9d\x05\x40\x02\x2e\x18\xb4\xb2\x74\xee\
+\x32\x66\x08\x7a\xa3\x1b\x92\x60\xba\x0f\x39\x00\x00\x01\x7e\xdc\
+\x1c\x1a\x7f\x40\xa5\x3c\xd4\x66\x6e\xb6\x1a\x7f\xc0\x46\x02\x8c\
+\xd9\x1f\x64\xb5\xf1\x07\x00\xc1\x90\xc8\xf6\x9d\x7f\x84\x07\x0f\
+\x93\x7b\xb3\xbc\x74\xee\x1a\xa8\xfe\x94\x9d\xa3\x4a\x08\x81\xa3\
+\xef\x78\xa3\xae\x01\x18\x79\xfe\xcc\x6f\xa8\x20\x7b\x6f\xc6\x46\
+\x50\xc8\xcb\x2d\x83\xee\x57\xac\x58\x51\xe2\xfd\x81\x3f\x23\x46\
+\xb7\xbd\x1e\xc0\x95\x4d\xf0\xd2\xb6\x45\xd0\x98\x7d\x54\xd6\x1b\
+\xff\x2f\x0c\xe8\xd4\x7d\x70\x68\xf3\xba\xa5\xff\x6c\x82\xd7\xce\
+\xaa\xcd\xeb\x47\xbc\xdc\xa9\xfb\xd6\xd3\x01\xe9\xc6\xce\x02\xe0\
+\x88\x4e\xf9\xc7\xfe\x6b\xf3\xba\xa5\xb4\x87\x4e\xda\x93\x77\x2c\
+\x16\x73\xea\xf4\x06\x56\xfd\x24\xf1\x90\x0b\x2e\x2f\x29\x39\x3f\
+\xc1\x0e\xb2\x37\x23\x46\x4f\xbf\x14\xc0\x8f\x9a\xea\xf5\x6d\x24\
+\xc0\x98\x7d\x4f\x13\x36\xfe\xd5\x7e\xd2\x3c\x4e\x0b\x8c\x05\xc1\
+\xae\x03\x82\xbc\xd8\x15\xa0\x90\x19\x40\x8c\xd6\x0e\xd3\x46\x00\
+\xda\x75\x3d\xf3\x62\x81\x78\xf1\x86\x51\xc1\x0d\x0b\xe7\x4d\xf1\
+\x7e\xd5\xff\xd9\xa3\x6f\x3a\x45\x80\xf9\x68\xfa\xbf\xb7\x21\x7d\
+\x8e\x3c\x5d\x56\x2f\xfb\x7b\x69\x13\xd7\x31\xc6\x34\xb1\x1c\x34\
+\xfe\xbb\x08\xbe\xd1\xa5\xfb\xb1\x2f\x6c\x5a\xb7\xf4\x9d\x26\xaf\
+\xd5\x08\x1f\xaf\x5f\xba\xb1\x53\xf7\xc1\x6d\x00\x0c\x61\x67\x11\
+\xa0\x6b\xa7\xfc\x6d\x6f\x6d\x5e\xb7\xf4\x35\x46\x7d\x4a\xcf\x23\
+\x1a\xbd\xb9\x95\x40\x7c\xb9\x27\xf9\x8d\x6d\x79\xdb\x7f\xc5\x0e\
+\xb1\x37\xc3\xa3\x37\x1e\xee\x10\xcc\x03\x10\xc9\x51\xc9\xeb\x6c\
+\x24\xc0\x98\xe6\x2d\x67\x8d\xff\x2e\x91\x00\x52\xd2\xa7\x70\x5c\
+\x8f\x1c\xd5\x6b\xb0\x6d\x95\x6d\x7f\x0e\xc5\x5b\xec\x1c\x00\x00\
+\xc5\xaf\xf2\x8b\x2e\xa1\x6c\x81\xa7\x74\x00\xca\xc3\xc1\xf7\x00\
+\x1c\xc6\xa8\x9d\x44\x03\xb8\xef\x95\xde\x1b\xdb\xc9\x0e\xb2\x27\
+\xc3\x86\xdd\x9a\x27\xa1\xd0\x9f\xd0\x88\xed\x7e\x0d\x61\xd3\x01\
+\xc6\x34\x5f\x39\x6e\xfc\xab\x1d\xe4\xe0\x1e\x3e\xec\x84\x09\xad\
+\x72\x5c\xb7\x5e\x36\xbc\x38\xab\x4c\x43\x3a\x0e\x80\x0f\x6b\xbe\
+\x0e\x6f\x15\x44\x28\x87\x03\xe5\xbc\x03\x10\x8d\xde\xde\x16\xaa\
+\x53\x72\x5d\x37\x83\xbb\xff\x32\xff\x9a\xa7\xd9\x21\xf6\x26\xdc\
+\x7e\xe7\x6f\x01\x1c\xcf\xa8\x6d\x9d\x00\x63\x9a\x1f\x52\xe3\x5f\
+\x45\x8f\x69\x1f\xd9\xee\xd3\xb1\xee\x69\xad\x2a\x9d\x53\x0a\xe0\
+\x3e\x76\x8e\x2a\xff\xd7\xe7\xc4\x4b\xdb\xe5\xba\x68\xce\x3b\x00\
+\x15\xae\x6c\x22\x80\xce\xb9\xae\x9b\x4a\x37\x26\x5c\xdc\xfb\x7b\
+\xae\x87\x8f\x9e\x79\x91\x88\x8c\x63\x66\xb0\x4e\x80\x31\xcd\x07\
+\xb7\xf1\xdf\x45\xa1\xc5\xfd\x0a\xc7\x5d\xc6\xcc\x50\x17\x1a\x69\
+\x31\x51\x81\x8f\xd8\x39\x00\x74\x12\x17\xfa\x7e\xae\x8b\xe6\x74\
+\xef\xe6\x59\x63\x6f\x38\x30\x14\x84\xdf\x02\x70\x60\x2e\xeb\xa6\
+\xa3\x82\x51\x8b\xe6\x4d\x7e\x88\x9d\x63\x4f\xce\x19\x3b\x7d\x50\
+\x10\xc8\xbf\x00\x78\x31\x9c\x66\x87\x05\x19\xe3\x37\x1f\x1a\xff\
+\x1a\x76\x06\xce\x0d\x5d\x5d\x7a\xe7\x7f\xd9\x41\xf6\xa4\xff\xd0\
+\x71\x17\xaa\x88\x0f\x23\x01\x5b\xc2\x41\xb8\xe7\xeb\xcf\xdf\xf1\
+\x69\xae\x0a\xe6\x74\x04\x20\x94\x88\x5c\x0b\x0f\x1a\x7f\x08\xfe\
+\xe1\x7b\xe3\x1f\x8d\xde\x7c\x50\x10\xc8\x23\xf0\xa4\xf1\x07\x6c\
+\x24\xc0\x18\x9f\x79\xd6\xf8\x03\x40\x4b\x17\x04\x0f\xf7\x2e\x2a\
+\xee\xc8\x0e\xb2\x27\x2b\x9e\x9b\x73\x3f\x14\xa5\xec\x1c\x00\x0e\
+\x88\xbb\xca\x6b\x72\x59\x30\x67\x1d\x80\x73\x2f\x9a\xd1\x19\xa2\
+\x39\x1f\xe2\x48\x23\x21\x2e\xe4\xf5\x35\xbf\xd1\xe8\x43\xa1\x8a\
+\x50\x62\x1e\x00\xef\x56\xd3\x2a\x30\x75\xc4\xa8\xe9\x57\xb0\x73\
+\x18\x63\xbe\xd0\xef\xa4\xe2\x2b\x3c\x6b\xfc\xab\x1d\xee\x12\xc1\
+\x7d\xcc\xbd\xee\x75\x21\x12\x4c\x04\x10\xb0\x73\x00\xf2\x83\xbe\
+\xa7\x5c\x79\x70\xae\xaa\xe5\xec\x2f\x25\xa8\xc4\x44\x00\xad\x73\
+\x55\x2f\x33\xbd\xeb\xb1\x07\x26\xbe\xce\x4e\xb1\x27\x15\x6e\xdd\
+\xb5\x0a\x9c\xce\xce\x91\xc1\xaa\x50\x0b\x79\x98\x1d\xc2\x18\xf3\
+\x85\x48\xa5\x7b\x58\x80\x55\xec\x1c\xe9\x88\xc8\x19\x7d\x87\xbe\
+\x37\x95\x9d\x63\x4f\x56\x2c\x9e\xfb\x3f\x00\xf7\xb2\x73\x00\x68\
+\x27\x95\x15\x57\xe7\xaa\x58\x4e\x3a\x00\xd1\xe8\xcd\x07\xa9\xe0\
+\x7b\xb9\xa8\xb5\x47\x82\x6d\xf1\x04\x7e\xce\x8e\xb1\x27\xe7\x8c\
+\x9d\x39\x58\x05\x3f\x63\xe7\xc8\x60\x7d\xdc\xc9\x19\x7f\xbe\x6f\
+\xb2\x0f\x8b\x66\x8c\x31\x55\x5e\xfb\xd7\xef\x3f\x8a\x87\x43\xa7\
+\x0a\xc4\xcb\xbb\x4c\x44\xf0\x8b\x01\x43\x2f\xfb\x32\x3b\xc7\x9e\
+\x84\x22\xfa\x63\x00\x5b\xd9\x39\x00\xfc\xe0\xa8\x21\x57\xe4\x64\
+\xaa\x3c\x27\x1d\x80\xf2\x50\xe2\x6a\x28\x72\xbe\xc5\x21\x45\x80\
+\x5f\x3e\x51\x32\xe5\x43\x76\x8c\x4c\x86\x0f\x8f\xb5\x0e\x54\x1f\
+\x00\xd0\x82\x9d\x25\x8d\xf7\x34\x81\xa2\x27\x1e\x9c\xb4\x8e\x1d\
+\xc4\x18\x93\xea\x8d\x67\x7e\xff\x9e\x04\xf8\x3a\x14\x3e\xfe\x8e\
+\x86\x03\x71\x0f\x0c\x28\xfa\x9e\x0f\x37\xf1\xa5\xb5\xec\xe9\x39\
+\x1b\x01\x99\xce\xce\x01\xa0\x7d\x5c\x12\x39\x99\x2e\x6f\xf2\x0e\
+\xc0\xb0\x0b\x6e\x6d\x0f\xc0\x87\xb9\xff\x77\x2a\xb7\xe6\xdd\xca\
+\x0e\xb1\x27\xd2\xa6\xf5\x2c\x28\xfa\xb0\x73\xa4\xb1\x29\xa4\xc1\
+\x69\x8b\x4a\x26\x7b\x7d\xc4\xa7\x31\xfb\xbb\xe5\xcf\xcf\x5e\x0f\
+\x71\xa7\x01\xea\xe3\x83\x4e\xaf\x20\x51\xe1\x43\x03\x9b\x51\x99\
+\xab\xb8\x09\xc0\x5a\x76\x0e\x88\x5e\x9d\x8b\x73\x01\x9a\xbc\x03\
+\xd0\x22\x5e\x7e\x15\x3c\x58\xf9\x2f\x90\x29\x4f\x3e\xf9\x03\x6f\
+\xef\xac\x1e\x3e\x6a\xe6\x30\x40\xc6\xb3\x73\xa4\x50\x6c\x51\xd5\
+\x33\xfe\xbc\x60\xea\x4a\x76\x14\x63\xcc\xde\xad\x5c\x7c\xe7\x9b\
+\x81\xe2\x1b\x00\x3e\x61\x67\x49\x21\x72\x45\xdf\x93\x2e\x1b\xce\
+\x8e\x91\xc9\xda\xd2\x7b\x77\x42\x9b\xee\xb2\xb5\x7a\x38\x48\x42\
+\xe1\xa6\xb8\xf1\xb5\x96\x26\x3d\x07\xa0\xe8\x92\x58\xcb\xf6\x3b\
+\xdb\xbc\x03\xa0\x6b\x53\xd6\xa9\x83\x7f\x2d\x9c\x3f\x69\x08\x20\
+\x3e\x1c\xfb\x98\x62\xc4\x98\xdf\x74\x81\x56\xbe\x8e\x1c\x1f\xf5\
+\x5b\x07\x9f\x3b\x17\x9c\xf2\xe8\x83\x53\x5f\x66\x07\x31\xc6\xd4\
+\x4f\xff\x21\xc5\x5f\x51\xa7\x4f\x03\x68\xc3\xce\x52\x93\x02\x1f\
+\x85\x23\x3a\x70\xd7\x90\xbb\x97\xa4\xdf\xd0\xf1\x8b\x21\xdc\xcb\
+\x82\x14\xf8\x68\xa7\xab\xec\xbe\xb6\xf4\xde\x26\x3b\xaa\xbe\x49\
+\x47\x00\xda\x97\xb5\xfe\x0e\xf8\x8d\x7f\x00\x04\x3f\xf4\xb5\xf1\
+\x07\x54\xa0\xf1\x39\xf0\xaf\xf1\x4f\xa8\xe2\x42\x6b\xfc\x8d\x69\
+\x9e\x56\x3c\x3f\xfb\x25\xa8\x8c\x02\xe0\xd5\x35\xe7\x02\x74\x0e\
+\x2a\xe5\x0f\xc8\xf1\x41\x74\xf5\xa0\x80\xfc\x10\xe4\x6d\x81\x02\
+\x74\x6e\xa9\x91\x8b\x9a\xb2\x46\x93\x5d\x2b\x1b\x8b\xc5\xdc\x07\
+\x1f\xb7\x78\x00\x40\xce\xf6\x34\x66\xf0\xc7\x85\xf3\xa7\xfc\x8e\
+\x9c\x21\xa3\xe1\x63\xda\x7d\x4f\xa0\x13\xd8\x39\x52\x28\x7e\xb8\
+\x68\xc1\x64\x1f\x4e\xc7\x32\xc6\x34\xd0\xe6\xf5\x4b\xde\xec\xd4\
+\x7d\xf0\x67\x00\xce\x60\x67\x49\xd2\xab\x53\xfe\x71\x1b\x37\xaf\
+\x5b\xe2\xe5\x29\x81\x9b\xd7\x2f\xf9\xa0\x63\xf7\xc1\xbd\x05\x18\
+\xc8\xcc\x21\x22\xbd\x37\xaf\x1b\xfe\x3b\xa0\xb4\x49\x1e\x60\x9b\
+\x6c\x04\x60\xc9\xea\xd6\xe7\x02\x38\xa2\xa9\x5e\xbf\x8e\x2a\x13\
+\x2e\xfc\x0b\x72\x86\x8c\x86\x47\x6f\x3c\x5c\x54\xa7\xb1\x73\x24\
+\x53\xe8\xac\x85\x0b\x26\xff\x96\x9d\xc3\x18\xd3\x78\x2b\x17\xdf\
+\x75\x8b\x42\xfd\x5b\x00\xad\x3a\xc3\xe7\xab\x83\xc3\x61\xb9\x0e\
+\x40\x9c\x1a\x42\xb5\x4f\xff\xa1\x1b\x9a\x6c\xcd\x44\x93\x75\x00\
+\x9c\x4a\x4e\x8f\x34\xcc\xe0\xde\xc7\x1f\x9c\xe0\xe5\xbe\x58\x00\
+\x90\x90\xbb\x0d\x80\x6f\xdb\x62\x1e\x6f\x99\xc8\xf7\xfe\x92\x24\
+\x63\x4c\xdd\xad\x5a\x7c\xd8\x04\x08\x1e\x65\xe7\x48\xd2\xc6\x41\
+\x6e\x67\x87\xc8\x64\xd9\x33\xb3\xdf\x12\xc1\xfd\xec\x1c\x2a\xd2\
+\x64\x8b\x12\x9b\xa4\x03\x30\x7c\xcc\xcc\x21\x0a\x9c\xd0\x14\xaf\
+\x5d\x0f\x15\x71\x27\xbf\x26\x67\xc8\x68\xc4\xa8\x19\xa3\x01\x19\
+\xc1\xce\x91\x64\xc9\xce\x08\x46\x95\x94\x9c\xef\xd5\x9c\xa1\x31\
+\xa6\xb1\x62\xc1\xb6\x8a\xb6\x63\x01\xbc\xc4\x4e\x92\x64\x58\xff\
+\x93\x8a\xa3\xec\x10\x99\xc4\x13\x89\x5f\x02\xa8\x24\xc7\xf8\x4a\
+\xdf\x93\x2e\x6f\x92\xf6\xb4\x49\x3a\x00\x02\xfc\xa0\x29\x5e\xb7\
+\x7e\xf4\x6e\x5f\x0f\xad\x39\x6b\xec\x0d\x07\x42\xd4\xb7\xfb\xb2\
+\xd7\xc7\x13\x7a\xf6\x53\xf7\x4d\xde\xce\x0e\x62\x8c\xc9\xbe\x0d\
+\x2f\xce\x2a\x83\xca\xb9\x0a\x6c\x60\x67\xa9\x49\x35\xb8\x35\x57\
+\x27\xdf\xd5\xd7\x1b\xcf\xdf\xfd\x36\x80\x3f\xb2\x73\x48\x10\x5c\
+\xd5\x14\xaf\x9b\xf5\x0e\xc0\x88\xd1\xd3\x0e\x81\xea\x39\xd9\x7e\
+\xdd\x7a\xaa\x70\x48\x78\x37\xb7\x5e\x2d\x14\x44\x66\x02\xd2\x85\
+\x9d\xa3\x86\x72\x55\xf9\x96\xcf\xa7\x24\x1a\x63\x1a\x6f\xe5\x73\
+\xb3\x3f\x08\x69\xf0\x4d\x00\x1e\x9d\x89\x22\x5d\x13\x2e\xe1\xef\
+\x2d\xa3\xe1\xe0\x97\x00\x2a\xa8\x19\x04\xdf\xea\x55\x34\xee\xb0\
+\x6c\xbf\x6c\xd6\x3b\x00\x02\xb9\x12\x40\x24\xdb\xaf\x5b\xcf\x14\
+\x77\x3d\x3a\xff\x47\x6b\xb9\x19\xd2\x1b\x3e\x66\xfa\x49\x80\x7e\
+\x87\x9d\xa3\x26\x11\xf9\xfe\xa2\x05\x93\xfe\xc3\xce\x61\x8c\x69\
+\x7a\xcb\x9f\x9b\xfb\x32\x44\xbc\xda\x79\xa4\xd0\xf1\x03\x0a\xc7\
+\x9d\xcc\xce\x91\xce\xca\x67\xe6\xae\x83\xe2\x0f\xe4\x18\x91\x48\
+\x20\x97\x67\xfb\x45\xb3\xda\x01\x18\x36\xec\xd6\x3c\x85\x8c\xcb\
+\xe6\x6b\x36\x40\x79\x38\xe4\x67\x6f\x72\xd8\xb0\x5b\xf3\xa0\x72\
+\x07\x3c\xda\xff\x2a\xc0\x7d\x8f\xcd\x9b\x34\x87\x9d\xc3\x18\x93\
+\x3b\x2b\x9f\x9d\x7d\x87\xaa\xdc\xc3\xce\x51\x83\x04\x90\x3b\xf2\
+\x8b\x2e\x69\xc9\x0e\x92\x8e\x53\xf9\x15\xd8\xa3\x00\xc0\xe5\xd9\
+\xfe\xf9\x64\xb5\x03\xd0\xa2\x7d\xf9\x58\x00\x9d\xb3\xf9\x9a\xf5\
+\x25\x2a\xb3\x1f\x79\x60\xaa\x57\x73\x5c\xd5\x22\x1d\x76\xfe\x44\
+\x80\x7e\xec\x1c\x35\x2c\xf9\xac\xe5\xf6\x62\x76\x08\x63\x4c\xee\
+\x7d\x1e\x6f\x73\x25\x80\x57\xd8\x39\x6a\xe8\xdd\x3a\x68\x71\x2d\
+\x3b\x44\x3a\xcb\x9f\x9f\xbd\x5e\x01\x76\x87\xa9\x53\xcb\x44\x64\
+\x74\x36\x5f\x30\xab\x1d\x00\x15\x5c\x91\xcd\xd7\x6b\x80\x9d\x2a\
+\x7e\x3e\xfd\x0f\x8f\xce\xe8\x01\xc8\x24\x76\x8e\x6a\x0a\x7c\xa2\
+\x09\x44\x4b\xef\x8d\x35\xd9\x31\x93\xc6\x18\x7f\x6d\x78\x71\x56\
+\x19\xc2\xc1\x39\x80\x7e\xcc\xce\x52\x4d\xa1\x53\xfb\x16\x7d\x37\
+\x9f\x9d\x23\x9d\x30\xe2\xbf\x06\x7b\xed\x84\xe0\x7b\xd9\x7c\xb9\
+\xac\x75\x00\x86\x8f\x9a\x7e\x2c\x80\xe3\xb3\xf5\x7a\x0d\x21\x2a\
+\x77\x2d\x9c\x3f\xf5\x7d\x66\x86\x4c\x24\x2c\xd3\x00\xf8\x32\xbc\
+\x15\x40\x75\x8c\xdd\xee\x67\xcc\xfe\x6d\xe5\x33\x73\xd7\x01\xf8\
+\x36\xc8\xc7\xde\xd6\xd0\x52\x34\x71\x03\x3b\x44\x3a\xcb\x16\xdf\
+\xf3\x2e\xc8\xa3\x00\x02\x1c\xdf\xbf\xf0\xb2\x63\xb2\xf5\x7a\x59\
+\xeb\x00\x88\x20\xeb\x0b\x14\xea\x29\x21\x08\x6e\x21\x67\x48\xeb\
+\xec\x31\x33\x4e\x80\xea\xb7\xd8\x39\x6a\x98\xb6\x68\xc1\x94\xa7\
+\xd8\x21\x8c\x31\x7c\x2b\x17\xcf\x79\x42\xa0\xb3\xd8\x39\x76\x53\
+\x8c\x1a\x50\x54\x4c\xbd\x88\x27\x33\x77\x33\xc8\x9d\x25\xd5\xec\
+\xdd\x1a\x9b\x95\x0e\x40\x34\x7a\x7b\x5b\x40\xb2\x3a\x37\x51\x5f\
+\xa2\x78\xf4\xd1\x05\x53\xde\x62\x66\x48\x27\x16\x8b\x39\xa7\xb8\
+\x05\xfe\x2c\xfc\x5b\x9a\x97\xd8\x1e\x63\x87\x30\xc6\xf8\xa3\xa2\
+\x4d\xab\xff\x83\x3f\xeb\x01\x24\x08\x74\x26\xfc\xf9\xcc\xdc\x6d\
+\xe5\xe2\x3b\xdf\x54\xe0\x2f\xd4\x10\x22\x17\xf6\x39\xf1\xd2\x76\
+\xd9\x78\xa9\xac\x74\x00\x2a\xc2\x3b\x2e\x00\xd0\x3e\x1b\xaf\xd5\
+\x50\xaa\x1e\xf5\x60\x6b\x58\xba\xba\xed\x45\x20\x4f\x8d\xd4\xb0\
+\x33\xa1\xb8\xb8\xa4\x24\xc6\x5e\xcd\x6a\x8c\xf1\xc8\x9a\x27\x6f\
+\x2b\x77\xea\x2e\x00\x50\xc6\xce\x52\xe5\x2b\xfd\x0b\xc7\x8f\x65\
+\x87\x48\xcb\xd1\xdb\x9a\x76\xce\x85\x47\x65\xe3\x85\xb2\xd2\x01\
+\x50\x05\x7b\x25\xf9\x7f\x16\x3e\x34\xe5\x05\x72\x86\x14\xd1\xe8\
+\xcd\xad\xa0\xfa\x4b\x76\x8e\xdd\x54\x27\x3e\xbe\x60\xf2\x32\x76\
+\x0c\x63\x8c\x7f\x96\x3f\x77\xe7\x0a\x11\xf1\x66\x15\xbe\x02\xd3\
+\x06\x9e\x7e\x51\x1b\x76\x8e\x64\xab\x4a\xe7\x94\x02\x58\xca\xcc\
+\xa0\xa2\x59\x69\x73\x1b\xdd\x01\x18\x79\xc1\xcd\x47\x01\x38\x36\
+\x0b\x59\x1a\x4e\x71\x33\xb5\x7e\x06\x3b\xc3\xf1\x6b\x01\x74\x63\
+\xe7\x00\x00\x28\xfe\xb6\x70\xc1\xe4\xdf\xb3\x63\x18\x63\xfc\xb5\
+\xe2\xd9\xd9\xb7\x01\x78\x9c\x9d\xa3\xca\xa1\x15\xe5\x2d\x7d\xb8\
+\x54\x2e\x85\x90\x47\x9c\x05\x38\xbe\xcf\xd0\x71\x8d\xbe\xaa\xb8\
+\xd1\x1d\x00\x8d\x27\x2e\x6d\xec\x6b\x34\xd2\x7b\x5d\x3b\xb4\x7f\
+\x98\x9c\x21\xc5\x79\x17\x4c\x3b\x4c\xd4\x9b\x6d\x7f\x1f\xc1\x45\
+\x2e\x06\xa4\x49\xee\x94\xce\xb6\x58\x2c\xd6\x64\xb7\x54\x1a\xc3\
+\xd1\x6c\xde\xd3\xea\x5c\x64\x1c\x80\xcd\xec\x20\x00\x20\x8a\x29\
+\x7d\x4e\xbc\xf4\x10\x76\x8e\x64\xad\x76\xb8\x05\xec\x3b\x15\x44\
+\xe4\xa2\xc6\xbe\x46\xa3\xde\x94\x45\x45\xb1\x30\x04\xd4\xc5\x7f\
+\x50\xdc\x32\x7b\xf6\xe5\xec\xdb\x9a\x52\x54\xc6\xdd\x4f\x00\xb4\
+\x66\xe7\x00\x76\x4d\xd1\x2c\x9c\x77\xf5\x46\x76\x8e\xba\x88\xc5\
+\x62\x6e\xc9\xaa\x36\xf7\x8d\x1c\x3d\xc3\xcb\xf3\x1c\x8c\xa9\xaf\
+\x7e\x85\xe3\xa7\xf6\x2f\x7c\xef\x21\x44\xa3\x21\x76\x96\xba\x58\
+\x5e\xfa\xbb\x0f\x15\xca\xde\xd5\x55\xad\x8d\x0b\x85\xfe\x8f\x1d\
+\x22\xd9\x92\x25\xb3\x2b\xa1\xf8\x1d\x33\x83\x00\x17\x15\x15\xc5\
+\xc2\x8d\x79\x8d\x46\x75\x00\x3a\x7c\xa9\xcd\x30\x00\x5d\x1b\xf3\
+\x1a\x8d\xb4\x3d\x2f\x08\xcd\x25\xd6\x4f\x6b\x78\xf4\xc6\xc3\x45\
+\xe0\xc7\x79\xff\x22\x25\x8b\x16\x4c\x7e\x8c\x1d\xa3\x6e\x54\x96\
+\xae\x6a\x7d\x87\x00\x63\x15\x98\x6a\x9d\x00\xd3\xdc\xf5\x2b\x1c\
+\x3f\x15\xc0\x8d\x0a\x7c\xb3\xdf\xc6\x0e\x73\x9b\xcb\x48\xc0\xaa\
+\xc5\x73\x1e\x01\xf0\x67\x76\x8e\x2a\xe3\x7c\x3c\x1c\x28\xa2\xe1\
+\xdf\x03\xf8\x9c\x18\xa1\xcb\x47\xfa\xde\x69\x8d\x79\x81\xc6\xbd\
+\x19\x03\x5c\xdc\xa8\xaf\x6f\x24\x05\xe6\x96\x94\x4c\xfc\x84\x99\
+\x21\x2d\xe7\x7e\x0a\xa0\x05\x3b\x06\x80\xcf\x82\xb8\xf3\xea\xd2\
+\x8f\x3d\x19\x39\x7a\xe6\x74\x40\x76\x2f\x6e\xb1\x4e\x80\x69\xce\
+\xaa\x1b\xff\x2f\xfe\x1f\xb9\xb8\x7f\xe1\x7b\x5e\x9e\x55\x92\x96\
+\xca\x95\x00\xb6\xb0\x63\x00\x68\x21\x41\x62\x2a\x3b\x44\xb2\xd7\
+\x9f\xbf\xe3\x53\x90\xaf\x0a\x56\x95\x46\xb5\xc1\x0d\xee\x00\x44\
+\xa3\x37\x1f\xa4\x82\xb3\x1b\x53\xbc\x91\x54\x12\xa1\xdb\x88\xf5\
+\xd3\x3a\x73\xec\xcc\xee\x22\xf2\x6d\x76\x8e\x2a\x93\xff\x52\x32\
+\xf1\x3d\x76\x88\xba\x18\x39\x7a\xfa\xaf\x15\x48\x59\x33\x61\x9d\
+\x00\xd3\x1c\xa5\x36\xfe\xbb\x28\xf0\xfd\x7e\x85\xe3\xfd\xd9\x19\
+\xb4\x07\x2b\x9f\x9b\xfd\x01\x04\xbe\x0c\xbf\x5f\xd6\xa7\x70\x5c\
+\x0f\x76\x88\x64\x1a\xe0\x16\x00\xc4\xb5\x55\x3a\x72\x50\xd1\x25\
+\x07\x34\xf4\xab\x1b\xdc\x01\x28\x0f\x05\xdf\x02\x90\xd7\xd0\xaf\
+\xcf\x82\x7f\x2e\x2c\x99\xb8\x86\x58\x3f\xad\x70\x80\x9f\xc1\x87\
+\xa7\x7f\xc1\xe2\x85\xf3\x9b\xc7\x2d\x7f\xc3\x47\xcf\x98\xaa\x90\
+\x1f\x67\xfa\xf7\x0a\x4c\x1d\x31\x7a\x46\x2c\x87\x91\x8c\x69\xb0\
+\xbe\x85\xe3\xae\x43\x9a\xc6\xbf\x86\x9f\xf4\x1b\x3a\x6e\x72\xae\
+\xf2\x34\xc6\xca\x67\x0f\xfd\x3d\x14\xcf\xb3\x73\x00\x88\x84\xe0\
+\xbc\xd9\xa2\x58\x6d\xd5\xf3\x77\xbd\x01\x60\x31\x31\x42\xcb\x8a\
+\x20\x72\x5e\x43\xbf\xb8\x11\x53\x00\x9a\x95\x83\x08\x1a\x4a\x00\
+\xef\xe6\xfe\xcf\x19\x35\xbd\x00\xd0\x46\xaf\xcc\xcc\x82\xf2\x50\
+\x10\x7c\xb7\x39\xac\xfa\x1f\x3e\x66\xc6\xf9\x02\xd4\xe5\xec\xef\
+\xeb\x6c\x24\xc0\xf8\xae\x5f\xe1\xf8\xa9\x02\x89\xed\xf5\x0f\x8a\
+\x4c\xeb\x5f\x38\xfe\x82\xa6\x4f\xd4\x58\xb1\x20\x08\x12\xe3\xc0\
+\xbe\x04\x07\x80\x42\xbf\xe3\xe3\x28\x00\x84\xdb\x16\x29\xd0\xe0\
+\xb6\xb8\x41\x1d\x80\x33\xa3\xd3\xbb\x02\x38\xa9\xa1\x45\x1b\x4d\
+\xb1\x25\xd8\xbe\xfd\x51\x5a\xfd\x0c\x54\xdc\x4f\x00\x44\xd8\x39\
+\x00\xf9\xd5\x9f\x17\x4c\x5d\xc9\x4e\xb1\x37\xc3\xc7\xcc\x1c\x22\
+\x8a\x3f\xa0\x8e\x47\x7e\xda\x74\x80\xf1\x59\xa6\x61\xff\x0c\x44\
+\x81\x39\x7d\x86\x5e\x76\x62\x53\x66\xca\x86\xd5\x2f\xdc\xbd\x1a\
+\xa2\xd3\xd9\x39\x00\x44\x9c\x20\xe3\x48\x21\xcb\xb6\x8a\xb6\x7f\
+\x02\x77\xad\xc4\x29\x47\x9e\x32\xae\x4b\x43\xbe\xb0\x41\x1d\x80\
+\x48\x48\xce\x07\xc0\xdb\xd2\x22\xb8\x7f\xd1\xa2\xd8\x0e\x5a\xfd\
+\x34\xce\x1e\x3b\xfd\x08\x85\x5e\xc8\xce\x01\x60\x4d\x5e\xe2\x73\
+\x1f\x7e\x59\xf7\xe8\xac\xb1\xb3\x7a\x8a\xea\x23\xa8\xe7\x0d\x89\
+\xd6\x09\x30\x3e\xaa\x67\xe3\x5f\xad\xa5\x13\x79\xac\xef\x90\xf1\
+\xbd\x9b\x22\x53\x36\x95\x49\xfc\x7a\x00\xfc\xdb\x43\x55\x2e\xee\
+\x3d\xe4\xd2\x9e\xec\x18\x35\x6d\x78\x71\x56\x19\x80\xf9\xc4\x08\
+\xa1\x44\x5c\xbe\xd9\x90\x2f\x6c\xe8\x14\x00\x77\xef\x3f\xdc\xdd\
+\xdc\xfa\xa9\x24\x81\x29\x00\x1a\xb5\x27\x33\x2b\x39\x80\x29\xbe\
+\x9f\xf5\x7f\xee\xb7\xaf\x3f\x38\x14\xc4\x9f\x04\xd0\xa9\x21\x5f\
+\x6f\x9d\x00\xe3\x93\x06\x36\xfe\x55\xe4\x60\x11\x3c\xd1\x6b\xe8\
+\x77\x1a\xf4\xbb\x90\x2b\x6b\x4b\xef\xdd\x29\x22\x3e\xac\xc4\x8f\
+\x38\x17\x9a\xc2\x0e\x91\xcc\x09\xb8\x6d\x92\x36\x6c\x4a\xbe\xde\
+\xb7\x2d\x0d\x8f\xde\x78\xb8\x84\x42\x6b\x1b\xf2\xb5\x59\xb2\x74\
+\xe1\xfc\xc9\x83\x49\xb5\xd3\x1a\x16\xbd\xbe\x53\x24\x14\x59\x8f\
+\x7a\x3e\xcd\x66\x9b\x02\xa5\x8b\xe6\x4f\xfe\x3a\x33\xc3\xde\x14\
+\x17\xdf\x19\xf9\x70\xeb\xd6\xa7\x01\x0c\xcd\xc2\xcb\xfd\x7c\xe1\
+\xfc\xc9\xb1\x2c\xbc\x8e\x31\x0d\xd2\xb7\x70\xdc\x75\x75\x9a\xf3\
+\xdf\xbb\x67\x5b\x6f\x97\xd3\x96\x2c\x99\xed\xdd\xa1\x66\x35\xf5\
+\x2b\x1c\xbf\x18\xd9\xf9\xdd\x6d\x8c\xb2\x84\x93\xc3\xdf\x28\x9d\
+\xed\xc5\x69\x85\xd5\xfa\x15\x8e\x7f\x15\x40\xa3\x8f\xe7\x6d\xa0\
+\x20\x11\x0e\x1d\xfe\xc6\x33\xbf\xaf\xd7\xae\xaf\xfa\x8f\x00\x84\
+\x43\xe7\x81\x78\x4d\xa3\x8a\x78\xb7\xf8\x2f\x12\x8a\x5c\x09\x72\
+\xe3\x0f\x20\x08\x39\x6f\x8e\x1e\xce\xe8\x83\xad\x5b\x67\x22\x7b\
+\x1f\x20\xb6\x30\xd0\xd0\xd4\x79\xc1\x5f\xdd\x9c\xb4\xa3\xad\x4e\
+\xcb\xd2\x6b\x35\x19\x41\xf0\x43\x00\x01\x39\x46\xab\x50\xa0\xdf\
+\x25\x67\x48\x87\x39\x0a\xe0\x42\xf1\xf8\x39\xf5\xfe\xa2\xfa\x7e\
+\x81\x00\xe7\xd6\xf7\x6b\xb2\x68\x67\x20\x95\xf3\x88\xf5\x53\x0c\
+\x1b\x76\x6b\x1e\x00\x1f\x8e\xcd\xbc\xe7\xd1\x07\x27\x2d\x61\x87\
+\xd8\x93\xe1\x63\x66\x8e\x11\xe0\x07\xd9\x7c\x4d\x9b\x0e\x30\x0c\
+\xfd\x0b\x8b\x63\x68\xf0\xb0\x7f\x06\x8a\x09\xfd\x4e\x1a\xef\xc3\
+\x2e\xa2\x8c\x56\x2c\x9e\xfb\x3f\x00\xf7\xb3\x73\x28\x70\x55\x7e\
+\xd1\x25\xec\x87\xae\x5a\x34\xd2\xe2\x7e\x70\x77\x4b\xd4\xbb\x6d\
+\xae\x57\x07\x60\xf8\x98\x99\x1d\xa1\xf8\x5a\x7d\x8b\x64\x8d\xe8\
+\xc3\x8f\x3f\xf8\xa3\x4f\x69\xf5\xd3\x88\x74\xd8\x79\x01\xb8\xc7\
+\x21\x03\xc0\xe7\xe1\x70\xf8\xa7\xe4\x0c\x7b\x34\xf2\x82\x9b\x8f\
+\x12\xd5\xbb\x9a\xe2\xb5\xad\x13\x60\x72\xa9\x7f\x61\x71\x4c\xa1\
+\xd7\x35\xc9\x8b\x2b\xee\xe8\x7f\xe2\xf8\x01\x4d\xf2\xda\x59\x92\
+\x08\x87\x7e\x0c\x60\x3b\x33\x83\x00\x9d\x5b\x26\x22\xe4\xb5\x68\
+\xb5\xad\x7a\xfa\xf6\x8f\x01\x10\x8f\x5d\x97\x93\x7a\x17\x15\x77\
+\xac\xcf\x57\xd4\xab\x03\x20\x1a\x8c\x00\x71\xa1\x9b\x42\x3c\x5b\
+\xfc\xa7\x02\xc5\xd5\xf4\x14\xd0\x1b\x1e\xb9\x7f\xc2\x07\xec\x1c\
+\x99\x8c\x18\x31\xad\x9d\x26\x12\x0f\x01\x68\xb2\xbb\xbd\xad\x13\
+\x60\x72\xa1\x49\x1b\xff\x5d\xda\x68\x08\x7f\xee\x79\x6a\x71\x87\
+\x26\xac\xd1\x28\x6f\x3c\xf3\xfb\xf7\x14\x3a\x83\x9d\x03\x8e\xff\
+\xd9\x9b\x4c\x95\x3a\x0d\x10\x76\x01\xce\xaa\xcf\x17\xd4\x73\x0a\
+\x40\x1a\x7c\xe2\x50\x16\x7c\x38\xb8\xcf\xf6\x52\x62\xfd\x14\x23\
+\xc6\xdc\x74\x2a\x44\x8e\xe2\xa6\xd0\x8d\xd8\xbe\xe3\x37\xdc\x0c\
+\x7b\x26\xad\xdc\x3d\x00\xfa\x36\x75\x1d\x3b\x31\xd0\x34\xa5\xbe\
+\x85\xe3\xae\x6b\xe2\xc6\xbf\xda\x11\x79\x15\x4d\x33\x5a\x96\x2d\
+\x2d\x5a\x96\xcf\x54\xe0\x23\x66\x06\x51\x1c\xdd\x7f\xe8\xe5\xa7\
+\x30\x33\x24\x5b\xd5\x75\xcb\x3f\x98\x3f\x17\x81\xd6\x6b\x1a\xa0\
+\xce\x1d\x80\xd3\x2f\x9a\xd1\x06\x00\xf1\x87\x2d\x0f\xc7\x62\x31\
+\xf6\xe2\x93\xda\x54\xe9\x17\xed\x08\xdc\x34\xdf\xce\x44\xa8\x69\
+\xc4\xe8\xe9\x97\xaa\xa0\x41\x7b\x54\x1b\xc8\x16\x06\x9a\xac\xeb\
+\x5f\x58\x1c\xcb\xe2\x82\xbf\xba\x88\xf6\x2d\x2c\xa6\x5e\xb6\xb6\
+\x27\xaf\x3d\x75\xdf\x76\x11\xb9\x89\x9d\x43\x25\xa0\x7f\x06\xd7\
+\x52\x52\x92\x70\x10\xe6\x21\x75\xa7\x0f\x1e\x5c\x5c\xe7\x6b\xe8\
+\xeb\xdc\x01\xc8\xab\xc0\xa9\x60\xae\x74\x0f\xf0\x10\xad\x76\x1a\
+\xc3\xc7\xcc\xec\x0b\xe0\x0c\x72\x8c\x0f\x5a\x24\xdc\xef\xc9\x19\
+\x32\x3a\x6b\xec\xac\x9e\x10\xc9\xf9\xe8\x84\x4d\x07\x98\x6c\xca\
+\xc1\xb0\x7f\x5a\x02\xfd\x6d\xbf\xc2\xcb\x8f\xc8\x75\xdd\xba\x8a\
+\xe4\x95\xdd\xce\x1e\x05\x00\x70\x66\x9f\x13\x2f\xed\x43\xce\x50\
+\x8b\x3a\x2d\x21\x96\x6f\xb5\xbd\x95\x9e\x5c\xd7\x3f\x5c\x9f\x29\
+\x80\x61\x0d\x08\x93\x25\xba\x31\x4f\x0f\x7f\x81\x57\x3f\x95\x40\
+\xc7\x83\xb8\x1d\x12\x00\xa0\x32\xad\xa4\x64\x62\x19\x35\x43\x06\
+\x45\x45\xb1\x70\x38\x88\xdf\x0f\x45\x3b\x46\x7d\xeb\x04\x98\x6c\
+\x60\x35\xfe\x55\xda\x02\xc1\xbd\x88\x46\x79\xa7\xae\xee\xc1\x6b\
+\x4f\xdd\xb7\xdd\x01\xec\xb5\x00\xe2\xc2\xe1\xcb\xc8\x19\x6a\x59\
+\xd9\x69\xcb\x3f\xa9\xd3\x00\xae\xee\x6d\x75\x9d\x3b\x00\x4e\x78\
+\x4f\xbb\xa2\xf2\x70\x49\xc9\xf9\x09\x56\xfd\x64\xd1\x68\xac\x05\
+\x14\xec\x28\x69\x1f\x02\x00\x00\x20\x00\x49\x44\x41\x54\x63\x7f\
+\x3f\xc8\x0b\xdc\x6c\x72\x86\x8c\xda\x77\x6d\xf3\x13\x05\x4e\x60\
+\x66\xb0\x4e\x80\x69\x0c\x72\xe3\x5f\xed\x6b\xfd\x3e\x3c\xd0\xbb\
+\xf3\xef\xab\x6d\xad\x6c\x7b\x3b\x80\xf7\xa9\x21\x54\xbf\x3d\x78\
+\x70\xb1\x07\x77\xb0\x54\x29\x29\x49\x88\x32\x77\x03\xe0\xec\xba\
+\xfe\xc1\x3a\x75\x00\x46\x8c\x99\x31\x50\x81\xee\x0d\xcf\xd3\x38\
+\xaa\xc1\x9f\x58\xb5\xd3\xd9\x19\x6e\x3d\x1c\x40\x67\x66\x06\x15\
+\xbd\xc1\xd7\xa7\xff\x11\xa3\xa7\x1d\x07\xf8\x71\x8f\xb8\x2d\x0c\
+\x34\x0d\x91\xc3\x05\x7f\x7b\x27\xfa\xb3\xbe\x43\xc6\x79\x75\xfa\
+\x69\xb5\x0d\x2f\xce\x2a\x53\x01\x7b\x2d\x40\x97\x1d\xad\xeb\xb7\
+\xfa\xbd\xa9\xa9\x08\xb3\xcd\x3a\x7c\xc0\xd0\xcb\xfb\xd7\xe5\x0f\
+\xd6\xa9\x03\x20\x81\x9e\xd9\xb8\x3c\x8d\xb2\x69\xeb\x47\x65\xcf\
+\x11\xeb\xa7\x0a\xe4\x52\x72\x82\xf7\xb6\xe5\xed\xf0\x72\x95\x70\
+\x51\x51\x2c\x0c\xb8\x3b\xe1\xc1\xbd\x08\x35\xd8\xc2\x40\x53\x67\
+\x84\x05\x7f\x7b\x13\x16\x27\x77\x7b\xf5\x94\x5b\xc3\xe7\x15\x6d\
+\xef\x00\xc0\xdd\x86\xec\xd4\xab\x69\x80\xae\xee\x90\x67\x00\x6c\
+\x62\xd5\x57\x09\xea\xd4\x66\xd7\xa9\x03\xa0\x22\xb4\xe1\x7f\x55\
+\x3c\x52\x5a\x1a\x8b\xb3\xea\x27\x3b\x3b\x7a\xf3\xa1\x22\xf8\x06\
+\x35\x84\xc8\xac\xd2\x7b\x63\x3b\xa9\x19\x32\x68\xff\xa5\xd6\x13\
+\x01\x1c\xcb\xce\x91\xc6\x31\xbb\x3a\x27\xc6\x64\x56\x54\x14\x0b\
+\x2b\x94\x3a\x75\x95\xc1\xc0\xb2\x36\xfa\x43\x76\x88\x74\x36\xbc\
+\x38\xab\x4c\x21\xb7\x52\x43\x28\xce\xe8\x73\xe2\xa5\x87\x50\x33\
+\xd4\x50\xd5\x66\x2d\x24\x46\xc8\x4e\x07\xa0\x6a\xfb\xdf\x57\x1b\
+\x1d\xa7\x81\x54\x1c\x73\x45\x65\x0a\x17\x0a\xbe\x03\xee\x55\xc8\
+\xdb\xf2\xe2\xf1\x39\xb4\xfa\x7b\x70\xce\xe8\x1b\xf2\xa1\xf2\x33\
+\x76\x8e\x34\xfe\xd5\x22\xd1\xfa\x9b\x3e\x75\x24\x8d\x9f\x4a\x4b\
+\x63\xf1\x6d\x95\x6d\xcf\x01\xf0\x2c\x3b\x4b\x32\x05\x7e\x7e\xe4\
+\xc9\xc5\x05\xec\x1c\xe9\x44\x82\xd0\x9d\x00\x3e\x27\x46\x08\x4b\
+\x28\xfc\x6d\x62\xfd\x14\xce\x39\xda\x34\x80\x02\x27\x0e\x3c\xfd\
+\xa2\xbd\x1e\xbc\xb6\xd7\x0e\x40\x5e\x85\x14\x02\xc8\xcb\x4a\xaa\
+\xfa\xdb\xfc\xf9\x87\xdb\x3c\xfa\x45\x54\x01\xf4\x12\x6a\x84\x00\
+\x73\x4b\x4a\xae\xfd\x8c\x9a\x21\x83\x00\xa1\xd9\x68\xc2\xd3\xfe\
+\x1a\x42\x21\x2f\x63\x47\x70\x46\x49\xc9\x95\xcc\x0f\x27\xd3\x8c\
+\x6c\x78\x71\x56\x59\x65\x79\xcb\x11\x0a\xfc\x87\x9d\x25\x49\xeb\
+\x20\xae\xb7\xb3\x43\xa4\xf3\xfa\xf3\x77\x7c\x2a\xc0\xbd\xcc\x0c\
+\x0e\xe0\xef\xcc\xaa\xa1\xe5\x36\x7d\x1a\xc0\x27\xa4\xf2\x2d\x2a\
+\xcb\xf3\xf6\x7a\x6c\xff\x5e\x3b\x00\x82\x80\x76\xf8\x8f\x0a\x16\
+\xf9\xf4\xd4\x36\x7c\xcc\xcc\xaf\x03\x60\xf6\xc0\x13\x0e\xfa\x5b\
+\x62\xfd\x8c\x86\x8f\x9e\x79\x11\x20\xa7\xb1\x73\xd4\xa2\xfa\x7a\
+\xe0\x2a\xcf\x58\xb8\x70\xea\x36\x76\x14\xd3\xbc\xac\x79\xe9\xb6\
+\xad\x88\xb4\x18\x06\xc8\x32\x76\x96\x9a\x14\xf8\x46\xdf\xc2\xe2\
+\xb1\xec\x1c\xe9\x24\xa0\x37\x03\xa0\xed\xd6\x52\x68\xcf\x7e\x85\
+\x97\xb3\xaf\x2a\xde\x6d\xc9\x92\xd9\x95\x50\x3c\x4e\x0b\x10\xc8\
+\xa9\x7b\xfb\x23\x7b\x5f\x03\x20\x7b\x7f\x91\xa6\xe2\x54\xff\xc6\
+\xaa\x9d\x8e\x53\x5c\x42\x8e\xf0\xd8\xa3\x0b\xa6\xbc\x45\xce\x90\
+\x22\x1a\xbd\xbd\xad\x40\x7d\x5b\x64\xf7\x81\x06\xc1\xd9\xbe\x5d\
+\x1e\x65\x9a\x8f\x55\x4f\xdf\xfe\x71\x22\xec\xce\x50\x60\x03\x3b\
+\x4b\x4d\x02\x9d\x5e\x97\xe1\xdd\x5c\x5b\xbd\x78\xce\x3b\x00\xfe\
+\xc2\xcc\xa0\x4a\x1e\xa1\x4d\x22\xd0\xa7\x68\xc5\xdd\xde\x4f\xee\
+\xdd\x63\x07\xe0\xdc\x6f\x5f\x7f\x30\x00\xd6\x59\xf7\x41\x45\x22\
+\xfe\x0c\xa9\x76\x8a\x61\xc3\x6e\xcd\x53\x60\x04\x35\x44\xa0\x37\
+\x53\xeb\x67\xb0\x33\xbc\xe3\x5a\x00\xde\x2c\xc0\x01\xb0\xc3\xb9\
+\xe0\x9c\x45\x25\xd7\xae\x67\x07\xf1\x89\x5e\xd5\x2b\x4f\xa7\x1c\
+\x73\x88\x4e\x38\xaa\xa7\x5e\x73\x54\x5f\xbd\xe6\xa8\xc1\xda\xbb\
+\xe7\xf1\x9a\x9f\xdf\x57\x7b\xf7\xee\xa9\x7d\xfa\x1c\xa2\xbd\x7a\
+\xb1\xa6\xfb\xbc\xf4\xc6\x33\xbf\x7f\x4f\x54\x46\x82\x3b\xbf\x9d\
+\xec\xd0\xf8\xce\x56\x93\xd9\x21\xd2\x73\xd4\xcf\x28\x11\x3d\x77\
+\xc0\x80\x68\x0b\x66\x86\x9a\x2a\x90\xf8\x1b\x00\xce\x11\xf6\x8a\
+\x63\xf6\x76\x3b\xe0\x1e\xe7\x4b\x86\x8f\x99\x71\xbe\x28\x16\x64\
+\x37\x55\xdd\x28\xe4\xe5\x45\xf3\x27\x7d\x85\x51\x3b\x9d\x91\x63\
+\x66\x0c\x57\xa5\xae\xea\xfc\xef\xc2\xf9\x93\x8f\x27\xd6\x4f\xeb\
+\xbc\x0b\xa6\x1d\x16\x4f\xb8\xd5\x00\xea\x7c\xfe\x74\x13\x4b\xa8\
+\xe2\x9b\x8b\x16\x4c\x66\x1e\xc4\x41\xa1\x31\x38\x6c\x3f\xb2\x07\
+\x2a\x43\x47\x43\xd0\x1f\x40\x4f\x00\xf9\x50\x39\x1c\xa2\x5d\x00\
+\xb4\x4d\xf9\xa2\x85\x69\xdb\xb5\x6d\x00\x36\x02\x58\x0f\x91\xb5\
+\x50\x7d\x07\xc0\x72\x88\xbc\x86\x35\x6b\xde\x16\x40\x9b\xf0\xdb\
+\xf0\x52\xbf\xc2\x71\x67\x02\xb2\x10\xcc\x05\xc0\xb5\x95\xb9\x40\
+\xfa\x2e\x7f\x7e\xb6\x77\x9d\xdc\x7e\x85\xe3\x5f\x02\xf0\x65\x56\
+\x7d\xe7\xdc\xb0\xe5\xa5\x77\xfe\x95\x55\x3f\x59\xbf\xc2\xf1\x4b\
+\x40\xda\x19\xa5\x8a\x6f\xad\x7a\xee\xae\x87\x33\xfd\xfb\x3d\x6e\
+\x8b\x12\x95\x42\xd6\xef\xba\xc0\xaf\xe1\x7f\xd5\x9c\x5e\x68\x93\
+\x4a\xc4\xcb\xb9\xff\xca\x84\x9b\x26\xfe\x34\xfe\x50\xc1\xa4\x45\
+\xf3\xf7\x8f\xc6\x5f\x8b\x07\xb7\x46\x9b\xca\x42\x88\x7c\x0d\x8a\
+\x13\xf1\x19\xbe\x0c\xa0\x6d\x4a\xb7\x5e\xea\xfd\x3b\xdc\xae\xea\
+\x3f\xbd\xa0\x35\xbe\x56\x15\x28\x28\xd8\xa6\xc0\xcb\x10\x79\x01\
+\xc0\x0b\xd8\xb1\xe3\x79\x79\xff\x7d\x6f\x2f\xa3\xca\x96\x95\x8b\
+\xe7\x3c\xd1\xb7\xb0\x78\xaa\x40\x67\xb2\xb3\x54\x69\x15\x84\xf0\
+\x6b\x00\x17\xb1\x83\x24\x53\xc5\x1d\x22\xbc\x0e\x40\x10\x04\x51\
+\x00\xde\x74\x00\x04\xfa\x94\x42\x28\x1d\x00\x11\x19\x02\x20\x63\
+\x07\x60\x2f\x6b\x00\x74\x48\x96\xf3\xd4\x5d\xe0\x4f\x07\xa0\xb8\
+\xf8\xce\x08\xb8\xc3\xff\x5b\xf5\xf3\xcf\xbd\xda\x0e\x09\x00\x23\
+\x47\xcf\xf8\x8a\x00\x63\xd8\x39\xbe\xa0\xf3\x16\xcd\x9b\xec\xf5\
+\xd5\xc8\x8d\xa5\xd7\x1c\xd3\x5d\x27\x0e\xba\x5a\x27\x1c\xfd\x37\
+\xb4\x89\x7f\x0c\xc8\x93\x50\xfc\x14\xc0\xc9\x48\xf7\x84\x9f\x7d\
+\xed\x00\x9c\x02\xd5\x9f\x41\xf5\x6f\x68\xd5\xea\x63\x2d\x28\xf8\
+\xab\xf6\xec\xf9\x43\x2d\x28\xe8\x96\x83\xfa\x34\xab\x16\xcf\xbe\
+\x09\xf0\xe8\x52\x32\xd5\x0b\x06\x0c\xbd\x8c\xd6\xd0\x66\xd2\xa2\
+\xd5\xce\x12\x00\x5b\x89\x11\xbc\x9a\x06\x08\x1c\x78\x6d\x99\xe8\
+\x1e\x17\x45\x66\xec\x00\x44\xa3\x37\x76\x00\x70\x64\xd6\x03\xd5\
+\xcd\xd6\xae\x07\x74\x78\x99\x54\x3b\xc5\x87\x5b\xb7\x9e\x0e\xe0\
+\x40\x56\x7d\x55\xcc\xf3\xf1\xca\xdf\x00\xb8\x11\xbe\x6c\xbb\x51\
+\x7d\x7d\x67\x44\xc6\xb3\x63\x34\x05\xbd\xea\x98\x4e\x55\x8d\xfe\
+\x8b\x08\x82\x77\xa0\x3a\x0b\xc0\xe9\x60\xde\xce\xf9\x85\x96\x00\
+\xbe\x51\x75\xeb\xe3\x3a\x2d\x28\x78\x41\x0b\x0a\x7e\xa0\xbd\x7b\
+\xef\x71\xee\xb1\xb9\x72\x2e\x72\x19\x04\xcb\xd9\x39\xaa\x48\x42\
+\xdc\x0d\xec\x10\xc9\x5e\x7b\xea\xbe\xed\x20\x4d\x1d\x57\x39\x30\
+\x71\xf0\x81\x45\xc4\xfa\xb5\x84\x36\x7d\xf6\x2f\xec\x9a\x56\xcb\
+\x3d\xc5\xa0\x3e\x27\x5e\x9a\xf1\x42\xb6\x8c\x1d\x80\x8a\x88\x3b\
+\x11\xbc\xf9\xae\x7f\xcc\x9e\x7d\x79\x25\xa9\x76\x0a\x81\x7c\x8b\
+\x9c\x60\x2e\xb7\x7e\xaa\xe1\x63\x66\x9c\x2c\x40\x11\x3b\x07\x00\
+\x40\xb0\x4d\x9d\x3b\xff\xa9\xfb\x26\x6f\x67\x47\xc9\x26\x9d\x78\
+\xf4\xd7\x75\xc2\xd1\x0b\x10\x0e\x36\x54\x35\xfa\x5f\x85\x2f\x1d\
+\xae\xf4\x04\xc0\xd7\x00\xdc\x82\x44\x62\x83\x16\x14\xcc\xd3\x5e\
+\xbd\x8a\xc8\x99\xb2\x6a\x79\xe9\xef\x3e\xd7\x04\xce\x03\xe0\xc5\
+\x59\x1c\x02\x9c\xdc\x77\xe8\xf8\x93\xd8\x39\x52\x84\xf4\x6e\x66\
+\x79\x91\x20\xca\xac\x5f\xd3\xf2\xe5\x25\x15\x02\x2d\x25\x95\x0f\
+\x49\x28\x9c\xf1\x64\xcb\x8c\x1d\x80\x40\x1d\x71\x3f\xa5\x78\x35\
+\xfc\x1f\x40\x79\xc3\xff\xaa\xaf\x2f\x5a\x30\xc9\xb7\x03\x49\x20\
+\x8a\x18\x3b\xc3\x6e\x81\x5e\xb6\x68\xde\xa4\x55\xec\x18\xd9\xa0\
+\x80\xe8\x84\x81\xc3\x75\xc2\xd1\x2f\x42\xf1\x0c\x80\xf3\x01\x78\
+\x33\x9c\x59\x0f\x79\x00\x46\x43\xf5\x9f\x5a\x50\xb0\x54\x7b\xf5\
+\x8a\xaa\xdf\x9d\x97\x3a\x5b\xf5\xfc\x5d\x6f\xa8\xe8\x15\xec\x1c\
+\xd5\x04\x1e\xfd\x2e\x56\x59\x59\x3a\xe7\xdf\x00\x5e\xa3\x05\x50\
+\x9c\xeb\xd3\xd1\xdf\x0a\xde\x34\x80\x48\x90\x71\x2a\x3f\x63\x07\
+\x40\x94\x37\xff\xef\x50\xc9\xdb\x3b\x99\xe4\x83\xcf\xb6\x9d\x2a\
+\xc0\x41\xac\xfa\x22\xe2\xdd\xb1\xbf\x23\xc6\xcc\x3c\x0d\x80\x17\
+\x07\x6e\x08\xe4\xde\x85\x0b\xa6\x78\xb7\x3e\xa2\xbe\x34\x06\xa7\
+\x13\x06\x0e\xc7\x84\x41\xff\xa9\x5a\x6d\x4e\x3b\x7e\xbb\x09\x1c\
+\x03\xd5\x87\x50\x50\xf0\xaa\x16\x14\x7c\x5b\xfd\x59\x49\xdf\x60\
+\xab\x9e\x9d\x33\x4f\x81\x07\xd8\x39\x00\x00\x82\xa2\xbe\x45\xe3\
+\x8a\xd8\x31\x92\xa9\xe0\x0f\xbc\xea\x72\xf0\x46\xbc\x57\xc4\xab\
+\x5f\x9b\x73\xc4\x35\x6d\x81\x64\xfc\xac\x4e\xdb\x01\xa8\xea\x39\
+\xb1\x2e\x74\x79\xe3\xd1\xf9\x3f\x5a\x4b\xaa\x9d\x42\x24\x60\x2e\
+\xfe\x2b\x77\x2d\x2a\xfd\xf8\x90\xa9\x49\xf5\xa7\xec\x08\x55\xde\
+\xa9\x08\xb5\xf0\xf2\x82\x94\xfa\xd0\x89\x83\xa2\xf8\xec\xe8\x95\
+\xbb\x1a\x7e\xf5\xf2\xda\xd7\x2c\x39\x0a\xc0\x1f\x50\x50\xb0\x5c\
+\x7b\xf6\x3c\x8f\x1d\xa6\xb1\x2a\x5a\xc8\x95\x00\xd6\xb2\x73\x00\
+\x80\x0b\xe4\x57\xec\x0c\xc9\xe2\x41\xfc\x3e\x00\x15\xb4\x00\x81\
+\x9c\x43\xab\x9d\x64\x79\xe9\xdc\x35\x02\x79\x9b\x52\x5c\x70\x1c\
+\xa2\xd1\xb4\x9d\xee\xb4\x1d\x80\x76\x5d\x5a\x0f\x04\x6f\x6b\x97\
+\x47\x67\xff\x03\x80\x30\x6f\xfe\x5b\xf4\xe7\x3f\xfe\xf8\x63\x62\
+\xfd\x14\x1e\x3d\xfd\x27\x10\xe8\x45\x4f\x3e\xf0\x03\xe6\x6a\xe3\
+\x46\xd1\xc9\x47\x16\xe8\x84\x41\x4f\x40\xf5\x21\x00\xbd\xd9\x79\
+\x72\xa8\x0f\x44\x1e\xd6\x82\x82\xa7\x35\x3f\xbf\x2f\x3b\x4c\x43\
+\xbd\xfd\x8f\xd9\x9f\x89\xe8\xb7\x41\x3c\xfe\xb6\x9a\x02\x27\xf6\
+\x39\xa9\xf8\xeb\xec\x1c\x35\xad\x79\xee\x9e\x4d\x00\xf1\x28\x5c\
+\x28\xf7\xd6\xd6\x64\xa2\x8b\x49\x95\xdb\xf6\xdd\x78\x60\xff\x74\
+\xff\x22\x6d\x07\x40\xc4\xd1\xb6\x96\x88\xe2\x45\x56\xed\x64\xe7\
+\x8e\xba\xa9\x37\x80\x1e\xac\xfa\x02\x61\xae\xa4\x4d\x4f\x03\x3f\
+\x4e\x20\x53\xfd\xcd\xc2\x87\xa6\xbc\xc0\x8e\xd1\x10\x1a\xcb\x6f\
+\xa9\x13\x07\xc5\x10\x0f\x2d\x03\x74\x18\x3b\x0f\xd1\xc9\x08\x85\
+\x5e\xd5\x5e\xbd\x6e\xd4\xfc\x7c\x1f\x76\x34\xd4\xdb\x8a\x67\xe7\
+\x3c\x07\xc8\x6d\xec\x1c\x00\xe0\x54\x27\xb1\x33\xa4\x50\xea\xb6\
+\xc9\x5e\x3e\xdd\x9e\x18\x40\x69\x6d\x9b\x28\xd2\x1e\xaa\x97\x69\
+\x0d\x00\xed\xc4\xb9\xc0\x89\x37\x1d\x80\xb8\x4b\x30\x7b\x90\x3b\
+\xca\x22\xfa\x24\xb1\x7e\x8a\xe1\x63\x6e\x1c\x00\xf0\xee\x86\xa8\
+\x26\xc0\xba\xbc\xa0\x4d\x8c\x9d\xa3\x21\x74\xc2\x31\xa7\x62\xcb\
+\x01\xcb\xa0\x7a\x1d\xfc\xd8\xc6\xc7\xd6\x02\xaa\x53\x11\x0a\xbd\
+\xae\x05\x05\x5e\x3d\xc1\xd6\x55\xeb\xed\xf8\x3f\x00\xef\xb0\x73\
+\x00\x18\x76\x64\xe1\xb8\x7e\xec\x10\x35\x45\x5a\xed\x5c\x04\x80\
+\xb6\x85\x39\x91\xc0\xe9\xac\xda\xc9\x44\xf4\x5f\xbc\xda\xe9\xdb\
+\xf4\xf4\x23\x00\x50\xd6\x08\xc0\xa7\x8b\xe6\x5d\xb3\x9a\x54\x3b\
+\x85\x28\x71\xf8\x5f\xe4\x71\xdf\xb6\xb5\x89\x86\x26\xc0\x83\x95\
+\xdc\x81\x6a\x71\x73\xbb\xde\x57\xa3\xd1\x90\x4e\x1c\x14\x03\x82\
+\xbf\x41\xd4\x9b\xa7\x12\x8f\xf4\x02\xf0\xb4\xf6\xea\x75\x63\x73\
+\x5b\x24\xb8\x64\xc9\xec\x1d\x22\xb8\x92\x9d\x03\x80\xc4\x21\x5e\
+\xad\x89\x79\xed\xa9\xfb\xb6\x83\xb8\x02\x1e\xea\xcf\x34\xc0\xca\
+\xd2\x6e\x2b\x00\x50\x2e\x27\x0b\x44\xeb\x36\x02\x10\x8d\xde\xde\
+\x56\x01\x4a\x2f\x52\x15\x2f\x36\xe4\xdc\xd2\xa6\x10\x8d\xc6\x5a\
+\x00\xa0\xed\xaf\x55\xe8\x9f\x58\xb5\xd3\x19\x16\xbd\xbe\x13\x00\
+\xfa\x35\xa4\x02\xdc\xb7\x68\xc1\x14\x6f\x76\x89\xd4\x85\x4e\x1a\
+\xd8\x19\x87\xbe\xf1\x64\xd5\x53\xff\xde\x6f\xe0\xdc\x7f\x09\x54\
+\xa7\xa2\xa0\xe0\x69\xed\xd3\xc7\xa7\xcb\xa5\xf6\x6a\xc5\xb3\x77\
+\x3d\x09\xc1\x7c\x76\x0e\x01\x2e\x3e\xf2\x94\x71\x5d\xd8\x39\x6a\
+\x52\x51\xe6\x2e\x9d\x93\x07\x0f\x2e\x8e\x10\xeb\xd7\x10\x0b\x00\
+\x50\xb6\x74\x8b\x62\xc0\xe0\xc1\xc5\x29\xeb\xfa\x52\x3e\x8c\xca\
+\x65\xfb\xd1\x20\xf5\xc0\x45\xfc\x19\xfe\xdf\x19\x6e\x33\x04\xb9\
+\x39\x5a\x35\x9d\x1d\x2d\xe3\xad\x9f\x20\xd5\x4e\x2b\x12\x8a\x7c\
+\x0f\x40\x2b\x6a\x08\xc1\xb6\xca\x84\x4e\xa1\x66\xa8\x27\xbd\x7a\
+\xe0\xc9\x48\xc8\xab\x10\x9c\xc6\xce\xd2\x8c\x9c\x84\x78\xfc\x15\
+\x2d\x28\x38\x83\x1d\xa4\x3e\x42\x61\xbd\x1a\xdc\x23\x70\x01\xa0\
+\x65\xa2\xc2\x15\x93\x33\xd4\x12\x92\x16\x8b\x00\x94\x91\xca\xb7\
+\xdb\xd1\x46\x32\x1e\x84\x93\x6b\x02\x5a\x1b\x17\x2e\x6b\x95\x7a\
+\xb3\x6f\x4a\x07\x40\x1c\x06\xe5\x26\x4f\x2a\x25\xce\x91\x24\x73\
+\xca\x9b\x3b\x12\xc5\x93\x3e\x0d\x71\x57\x6d\x0b\xbd\x9c\x9d\x43\
+\x15\xbf\x7e\xa2\x64\xca\x87\xec\x1c\x75\xa5\x13\x8e\xbe\x16\x22\
+\x7f\x07\xd0\x95\x9d\xa5\x19\xea\x04\xe0\x71\x2d\x28\xf0\x6f\x61\
+\x5b\x06\xcb\x9e\x9e\xb3\x11\x90\xe9\xec\x1c\x10\xbd\xc2\xa7\x43\
+\x70\x96\x97\xfe\xee\x73\x00\xc4\x51\xbb\x84\x37\xeb\x00\x02\x80\
+\xd7\xc6\xa5\x69\xdb\x53\x3a\x00\x0a\x39\x3a\x37\x69\x52\x24\xe2\
+\x2e\xef\xbf\xa4\xda\x29\x54\x41\x9b\x3b\x0a\x9c\x64\xbc\xbd\x89\
+\xa1\x5d\x97\x36\x67\x01\xf8\x12\x39\xc6\x3b\xdb\x5a\x6e\xbf\x85\
+\x9c\xa1\x4e\xaa\x4e\xf3\x9b\x0e\xe0\x06\xd8\x90\x7f\x63\x38\x00\
+\x33\xb4\xa0\xe0\x16\x6d\x26\x3f\xc7\x32\x57\x71\x13\x14\xeb\xc8\
+\x31\xbe\xf4\xa1\xbe\xeb\xd5\xee\x12\x01\x78\xd3\x00\x22\xde\x8c\
+\x24\xc5\xcb\xf3\xfe\x0d\xd2\xb6\x51\xd5\x20\xa5\x6d\x4f\xf7\x4b\
+\xc5\x19\x01\x50\xbc\xee\xcb\x9e\xee\x73\xbf\x7d\xfd\xc1\x10\xb0\
+\x3a\x42\xf1\x50\x5e\xc8\xab\xd5\xff\x00\x2e\x63\x07\x10\xc8\x94\
+\xd2\x7b\x63\x3b\xd9\x39\xf6\x46\x63\x45\x61\x4c\x3c\x7a\x0e\x20\
+\x7e\x6c\x97\xdc\x37\xfc\x00\x3d\x7b\xfe\x41\x07\x0f\xf6\x64\x2e\
+\x37\xb3\xb5\xa5\xf7\xee\x54\xa7\x3f\x62\xe7\x10\xb8\x4b\xd9\x19\
+\x6a\x0a\x05\xe1\x27\xc0\x3a\x2f\x41\x71\xcc\x51\x43\xae\xa0\x5d\
+\xe6\x56\xd3\x9a\x97\x6e\xdb\x0a\x60\x05\xa5\xb8\xa4\x3e\xdc\xd7\
+\xea\x00\x44\xa3\x0f\x85\x00\x0c\xc8\x59\xa0\x9a\xc4\x9f\xfd\xff\
+\xf1\xf2\xf0\x09\xe0\xad\x76\x7f\xe9\xd1\x7b\x27\x6c\x21\xd5\x4e\
+\x31\x62\xf4\xb4\x43\x44\x40\x7d\x9a\x50\xc8\xcb\x8f\xcd\xbf\xc6\
+\xab\x51\x91\x74\x74\xd2\xc0\x36\xf8\x6c\xcb\x42\x28\xbc\xfa\xf0\
+\xdd\x27\x88\x5c\x88\x2d\x5b\x9e\xd0\x3e\x7d\x32\xde\x6c\xe6\x8b\
+\x55\xcf\xce\x99\x0f\xc1\x12\x6a\x08\xc5\x59\x03\x8a\xbe\xe7\xcd\
+\xd4\xd3\xeb\xcf\xdf\xf1\x29\x00\xd6\x08\xaf\x4b\x84\xe2\xde\x1c\
+\xad\x4d\x5c\x07\x70\x34\x10\xab\xd5\xe6\xd7\xfa\x87\xb8\x7b\xa7\
+\x37\x58\x27\x00\x8a\xbc\x44\xa9\x9b\x86\x13\x30\x17\x8d\x78\x73\
+\x11\x12\x00\x40\xdc\xc5\x00\xa8\xf3\x89\x22\xc1\x75\xbe\xec\x0e\
+\xc9\x44\x27\x0d\x6c\x83\x84\x3c\xb5\x9f\x1f\xec\xd3\xd4\x4e\x45\
+\x3c\xfe\xa4\x0e\x1c\xd8\x86\x1d\x64\x2f\x54\x13\xf4\x0b\x7a\x22\
+\x41\xa2\xe2\x22\x72\x86\x5a\x44\x79\x9f\x6d\x0a\xf5\x66\x21\x20\
+\x24\xf8\x37\xa9\x72\x9b\x7e\x85\x1f\xd4\xda\x82\x5c\xab\x03\x90\
+\x80\x1c\x99\xdb\x3c\x5f\x08\x02\x79\x85\x55\x3b\x99\x8a\xa3\xbd\
+\x59\x9c\x0b\x3c\xea\x00\xa8\x40\xf1\x1d\x72\x88\xff\x2e\x9c\x37\
+\xd9\xa3\x9f\x49\x2a\x2d\x1e\x1c\x41\xc2\x95\x60\xd7\x55\xb8\xa6\
+\x69\x9d\x88\xed\xdb\x1f\xd5\x01\x03\xbc\xbe\x21\x71\xd5\xf3\x77\
+\xfd\x05\xc0\xcb\xd4\x10\x22\xe3\xe0\xc1\xb9\x1d\xd5\x02\x21\x3e\
+\xdc\x04\xfe\xec\x04\x08\x12\xcc\x5b\x12\xb5\xd6\x08\x7f\xad\x0e\
+\x80\xc0\xb1\x4e\x91\x8a\x27\xb6\x46\xbc\xb8\xce\x35\x1a\x7d\x28\
+\x04\x55\xd6\x49\x88\x9f\x46\x2a\x7b\x70\x87\x0e\x6b\x38\x7b\xcc\
+\xcc\xaf\x02\x38\x82\x99\x41\x55\xff\xcf\xe7\xa7\x7f\x05\x04\x6d\
+\x2a\xef\xb2\x27\xff\x9c\x3a\x15\xe5\xe5\xf7\xf8\xbf\x30\x50\x7f\
+\x4e\x0e\xd0\xbb\x4f\xd1\xe5\xde\x5c\x2e\xb5\xaa\xcb\x96\x97\x40\
+\x3a\x08\x07\x82\xaf\x64\xba\x10\x27\xd7\x3e\x4f\xb4\x5b\x01\xd6\
+\x42\x40\x68\xad\x36\xbe\xd6\x2f\x90\x3a\xe5\x1c\x00\x04\xbc\xf9\
+\xe4\x93\x3f\x28\x67\xd4\x4e\x56\x1e\x7a\x77\x20\x48\xfb\xff\x15\
+\xf2\x54\x49\xc9\xf9\xf4\x8b\x45\xaa\xb9\x40\xbf\x49\x8e\xf0\x92\
+\xf7\x87\xfe\x5c\x7d\xf4\x4c\x40\x2e\x66\xc7\xd8\xef\xa8\x8e\x45\
+\x41\x81\xd7\xbb\x42\x56\x2e\x9e\xf3\x04\xa0\xd4\x9d\x4d\x2e\x11\
+\x44\x99\xf5\x6b\x29\x29\x49\x00\xf2\x4f\x52\xf5\x76\x03\x3e\x38\
+\x88\x36\xc2\x5d\xd3\x86\x17\x67\x95\x01\x78\x8b\x51\x5b\x92\x0e\
+\xf9\xab\xdd\x83\x56\xa4\xbd\x31\xa8\xa9\x09\xf0\x3a\xa3\x6e\x3a\
+\x82\x04\x6d\x18\xd7\x29\xf1\xce\xe8\x14\x2a\x22\xf2\x2d\x6e\x04\
+\xbd\x89\x5a\x7f\x2f\x76\xed\xf3\xc7\x44\x76\x8e\xfd\xd8\xf7\x7d\
+\x3f\x27\x40\x05\x37\x53\x03\x08\xa2\xf0\x68\x1a\x40\x85\x37\xc5\
+\xa9\x12\x78\x33\x0d\x00\xc8\x32\x4e\xd9\x0c\x23\x00\xb1\x58\xcc\
+\x81\x34\xdc\x2b\x2a\xcb\x19\x75\xd3\x51\x08\x6f\xb5\xa8\xb8\x7f\
+\xd0\x6a\x27\x19\x39\x7a\xe6\x97\x15\xe8\xce\xaa\x2f\xc0\xba\xad\
+\x1b\x77\xfc\x99\x55\x7f\x6f\xf4\xea\x81\x27\x03\xf0\xee\x0e\xf6\
+\xfd\xd0\x34\xed\xd1\xc3\xdb\x53\x16\xbb\xca\x61\x25\x00\xd6\x13\
+\x23\xf4\xe8\x37\xb4\xf8\x18\x62\xfd\x5a\x54\xf1\x77\x5a\x6d\xee\
+\xe2\xee\x5a\x78\x0f\xbd\xd2\x17\x35\x3a\x84\xbb\x3b\x00\xaf\xac\
+\x6c\xdd\x03\xac\xa3\x5e\x45\xbd\x19\x01\x00\x94\x32\x02\x20\xc0\
+\xba\xc7\xe6\x5f\xf3\x2e\xa3\x76\x06\xd4\xa7\x7f\x55\xdc\x5a\x5a\
+\x1a\x8b\x33\x33\x64\xa2\x3f\x3c\xb2\x0b\x44\x1e\x40\x33\xbb\xb4\
+\x66\x1f\xe5\xe0\xdc\xfd\xbe\xde\x1d\x50\x5a\x1a\x8b\x43\xf5\xb7\
+\xcc\x0c\x22\xfe\x4c\x03\xac\x5e\x3c\xe7\x1d\x00\xef\x91\xca\xfb\
+\xb3\x48\x57\xc0\x7a\xe8\x6d\x3b\x60\x48\x71\xb7\xea\x7f\xd8\xdd\
+\x01\x48\xc0\xf5\xe6\xe4\x01\x12\x4e\x39\xc3\x21\x49\x86\x8f\x99\
+\xd9\x11\x90\x9e\x8c\xda\x01\x84\xb5\x35\x24\x2d\x05\x98\xf3\xff\
+\x9f\xe7\x05\x89\xb9\xc4\xfa\x19\x69\x0c\x0e\x2e\xf4\x00\xec\x78\
+\x5f\x9f\x74\x46\x3c\xfe\xa0\xaf\xb7\x08\xe6\x85\xe2\x77\x01\xa0\
+\x1d\xed\xad\x20\x4f\xe5\x25\x51\xde\x99\x2f\x05\x7d\x4f\xb9\xf2\
+\x60\x52\xed\x5a\xe2\xc2\x9b\xf6\x0e\x42\x41\x9f\xea\xff\xbd\xbb\
+\x03\x20\xa0\x5d\x51\x5a\xd6\xaa\x32\xff\x6d\x52\xed\x5a\x24\x91\
+\x48\xb9\x2c\x21\x57\x1c\xfc\xb9\x07\xe1\xac\x51\x33\x8e\x04\xd0\
+\x83\x55\x5f\x55\xe7\x97\x94\x5c\xfb\x19\xab\xfe\x1e\x6d\x19\xf8\
+\x0b\x00\xa7\xb0\x63\x98\x14\x27\xa1\x57\xaf\x9f\xb2\x43\xa4\xf3\
+\x4a\xe9\xbd\x5b\x00\x3c\x44\x8c\xd0\xab\x77\x51\x71\x5f\x62\xfd\
+\x64\xac\x0e\x80\xa0\xa2\xc2\x8b\x85\x80\x87\xe0\x90\x35\x00\x28\
+\x27\x9b\x8a\xba\xdd\x0f\xb9\x35\x17\x01\xb2\x3a\x00\xcb\x7d\x59\
+\xf9\xae\x21\xde\x39\x08\x8a\xc0\x9b\x0e\x40\xc8\x09\xf9\x0e\xed\
+\x90\x9f\x4f\xff\x13\x8e\x39\x15\x22\xf4\x63\x5e\x4d\x06\xaa\x3f\
+\xd5\x82\x82\xaf\xb3\x63\xa4\x13\x68\x70\x37\xb3\x7e\x98\x78\xb9\
+\x59\x32\x21\x5e\xfa\x26\xa2\x5e\x74\x00\xaa\xa6\x37\x29\x5b\xdf\
+\x55\x35\xb5\x03\xa0\xa4\x0e\x80\xb0\x56\x43\xa6\x21\x0a\xd6\x9b\
+\xa3\x2c\x2f\x51\xc6\x3b\x1c\x22\x99\x06\xcc\x0e\xc0\xaa\x45\x0b\
+\xae\xf1\x6a\x3a\x04\x00\xf4\xaa\x5e\x79\x40\x70\x3b\xbc\xdf\x7b\
+\xbe\x5f\x73\x00\xee\xd1\x01\x03\x58\xd7\x78\x67\xb4\xfa\xb9\xb9\
+\x2f\x00\x58\xc9\xaa\xaf\xaa\xe4\x4e\xfd\x17\x2a\x5b\xb5\xfa\x1f\
+\x48\x4f\xbf\x50\xd2\x51\xf7\xe9\x08\xa7\xed\x13\xf9\xa2\xad\xff\
+\x62\x0a\x40\x58\x73\xdf\x81\x37\x3b\x00\xc0\x3a\x09\x51\xf0\x9f\
+\x92\x92\x58\x05\xa5\x76\x92\x68\xf4\xe6\x56\x80\x0c\xa1\x05\x50\
+\xdc\x45\xab\xbd\x27\xe1\x36\x3f\x06\x40\x5b\x27\x63\xea\xac\x3b\
+\x76\xee\x8c\xb1\x43\xa4\xa5\x7a\x0f\xb1\x7a\x51\xaf\x61\x57\xe5\
+\x11\xeb\xef\xb6\xe6\xc9\xdb\xca\x01\x2c\xe5\x54\x17\xda\x34\x6f\
+\x0a\xe5\xac\x7d\xab\xf9\xb0\x5f\xd5\x01\x50\x01\x94\x33\xe7\x2b\
+\x78\x87\x52\x37\x85\x0a\xed\x1c\x04\xf5\xe7\x22\xa4\x0a\x09\x0a\
+\xc1\xda\x0d\x02\x24\xe2\x81\x3e\x48\xaa\x9d\x91\x4e\x38\xb6\x17\
+\x80\x29\xec\x1c\xa6\xce\xae\xd6\x23\x8e\xe0\xdc\x6a\xba\x07\x41\
+\x10\x3c\x00\x20\x20\x95\x6f\x1d\x29\xdb\x39\x94\x54\x3b\x85\x02\
+\x9c\x69\x00\xc1\x51\xf0\xe6\x5c\x04\x5d\x4b\x2a\x5c\xbb\x03\x70\
+\x66\x74\x46\x17\x90\x2e\x01\x12\x55\xf6\xdd\xd9\x00\x80\xe1\xd1\
+\x69\xdd\x20\x38\x80\x53\x5d\xa8\xa7\x85\xd5\x14\x38\xde\xf0\xbf\
+\x02\xcf\x3d\x51\x32\xe5\x43\x56\xfd\xcc\xe2\xb7\x00\x68\xc9\x4e\
+\x61\xea\x2c\x84\x20\xf8\xad\x7a\xf3\x41\xbf\xcb\xea\x17\xee\x7e\
+\x1f\xc0\x0b\xb4\x00\x2a\xde\xac\x03\x70\xc0\x7f\x48\xa5\x3b\x1c\
+\x59\xf8\x9d\xc3\x48\xb5\x6b\x91\xc0\xad\x25\x95\x6e\xd7\xbb\xa8\
+\xb8\x23\x50\xd5\x01\x68\x11\xd1\xc3\x49\x41\xa0\x12\x5a\xcb\xaa\
+\x5d\x93\x84\x42\xb4\xa1\x21\x4d\x24\xbc\x39\x07\x41\x20\x27\xf1\
+\x8a\x4b\x09\xad\x76\x06\x3a\x71\x50\x14\x90\x33\xd9\x39\x4c\xbd\
+\x9d\x88\x5e\xbd\xd8\x47\x59\xa7\x10\x05\xef\x3d\xae\xca\xfb\xdd\
+\x4e\x22\xea\x68\x6b\xbf\xd4\xb5\xf0\x62\x1d\x80\x84\xc3\xb4\x87\
+\xdf\x08\xf4\x30\xa0\xaa\x03\x10\x24\x42\xac\x1e\xd1\xf6\x45\xf3\
+\x26\x6d\x26\xd5\xae\x45\x41\x5b\x00\xb8\x33\x0f\x3d\xd6\x90\x6a\
+\xd7\x72\xfa\x45\x33\xda\x00\x18\x48\x2a\x1f\x88\x26\x1e\x25\xd5\
+\x4e\x4b\xa3\xd1\x10\x54\xed\xb4\xbf\xe6\x4a\xf5\x7a\x2d\x2a\xa2\
+\x5e\x65\x9d\x4c\x42\x91\x12\xf0\xa6\x01\x8e\x19\x3c\xb8\x98\x73\
+\xdd\x7b\x92\x4e\xa1\x2f\xbd\x01\x80\x72\xff\x4b\x40\xdc\xee\x5d\
+\xd3\xf2\xd2\xdf\x6d\x04\x50\xc6\xa8\x9d\xd0\xa0\x1b\x50\xd5\x01\
+\x10\x51\x4e\x07\x40\xe0\xc5\xf0\x3f\x00\x38\xd0\x56\x87\xae\xf0\
+\x65\x1b\x64\x5e\x5c\x8f\x03\xc0\xfa\xc0\x7c\x61\xe1\xfc\xa9\xef\
+\x93\x6a\xa7\x77\xd8\xea\x28\x6c\xe1\x5f\x73\x76\x04\xde\x7d\xf7\
+\x42\x76\x88\x9a\x96\x97\xfe\xee\x43\xe1\xed\x83\x8f\xec\x6c\x87\
+\x63\x49\xb5\x6b\x29\x2d\x8d\xc5\x55\x38\xdb\xe0\x20\xde\xec\x04\
+\x50\x88\x50\x8e\x89\x16\x84\xbe\x18\x01\x50\x95\x43\x19\x21\x34\
+\xc0\x5a\x46\xdd\x74\x14\xa0\xec\x82\x80\xc0\x9b\x6d\x90\x50\x9c\
+\xc8\x2a\x2d\xaa\x4f\xb0\x6a\xa7\xb3\x6b\xfe\xd8\xd9\x9e\xff\xe6\
+\x4e\xf5\x67\x3a\x78\x70\x84\x1d\xa3\x26\x05\xfe\xca\xaa\x1d\xa8\
+\x3f\xc7\xe1\x3a\x55\xd6\x0e\x30\xda\x21\x67\x29\x48\x6b\xe0\x34\
+\x40\x8d\x0e\x00\x69\x04\x40\x3c\x1a\x01\x00\x90\x4f\xa9\x1a\xf8\
+\xd3\x01\x10\x38\xda\x65\x19\x2a\x21\x8f\x6e\x42\x04\x30\x61\xd0\
+\x08\x40\x59\xd3\x21\x26\x5b\x44\x7a\xe0\xd3\x4f\xbd\x39\x0b\x1f\
+\x00\x9c\x80\xf8\x5e\x57\x6f\x2e\xc4\x09\x94\x75\x06\x8c\xe4\x73\
+\xea\xa6\x12\xc8\x5a\x4e\x5d\xad\x31\x05\x00\x70\x46\x00\xe0\x47\
+\x07\x20\x1a\x8d\xb5\x00\xf0\x25\x4a\x71\xe7\xcb\x45\x48\x2a\x80\
+\x7e\x85\x54\x7b\xe3\xc2\xf9\x13\x5f\xe1\xd4\xce\x24\x98\xca\x4e\
+\x60\xb2\xc4\xb9\x29\x3e\xed\x08\x58\xfe\xec\xa1\x4b\x00\x70\xd6\
+\x3e\xa9\x3f\x37\xe2\xc1\x05\xac\x87\x9f\x43\x07\x0f\x2e\xf6\x63\
+\x54\x48\x02\x4a\x1b\x28\x52\x63\x04\x00\xc2\xb9\xd8\x44\xd4\x8f\
+\x0e\x40\xa5\x6b\xdd\x0d\xa4\x13\xde\xc2\xbe\x5c\x84\x14\x9d\xd6\
+\x0d\x40\x27\x4e\x75\xf9\x3b\x20\xca\xa9\x9d\x4a\x27\x1e\xfd\x75\
+\x40\xfc\xf9\xa0\x34\x8d\xa3\x7a\x34\x7a\xf5\xf2\x66\x05\x3c\x10\
+\x0b\x20\x60\x5d\xfd\xdd\xa5\xf7\xc9\xdf\xa5\x3c\xf0\x25\x53\xda\
+\x08\x00\x42\xdb\xdb\x39\x2f\x7e\x06\x50\xe1\x4c\x01\x00\x5d\x80\
+\xea\x46\x4f\xd1\x99\x13\x82\xb6\x0f\xb2\x96\x84\x13\xd6\xbd\xf7\
+\xdb\x1f\x79\x60\xea\x06\x52\xed\x5a\x5c\xc4\xd1\xce\xc8\x16\xc5\
+\x33\xac\xda\x69\x29\xbe\xcb\x8e\x60\xb2\x6e\x3c\x3b\x40\x2d\x81\
+\x3c\xcd\x2a\x1d\x09\xd4\x8b\x55\xf0\xab\x17\xcf\x59\x0b\xd6\x91\
+\xc0\x88\xe7\x73\xea\xd6\x96\xd0\x60\x2d\xa9\x74\x27\x00\x70\xc5\
+\xc5\x77\x46\x00\xce\x01\x38\x1a\xc8\xbb\x8c\xba\xc9\x44\x35\x9f\
+\x53\xd8\x8f\x11\x10\x00\x08\x02\xde\x11\x99\x0e\x8e\x77\x38\x4a\
+\x12\xbd\x66\x70\x47\x00\x23\xd9\x39\x4c\x96\xa9\x7e\x53\x7b\xf7\
+\xee\xc8\x8e\x51\x4d\x02\xa5\x9d\xfe\x99\x08\xd4\x9f\x55\xf0\x00\
+\xa7\x0d\x48\x48\x3e\xa5\x6e\x92\x88\x04\x94\x5d\x00\x00\x0e\x46\
+\x34\x1a\x72\xef\x7f\xba\xbd\x33\x48\xf3\x63\xad\xb0\x75\x13\xa3\
+\x6e\x32\x15\x70\x46\x00\x3c\x99\x02\x01\x00\xe1\x9d\x83\xf0\xf1\
+\x9f\x17\x4c\x7c\x93\x54\x3b\x95\x26\x2e\x04\xe0\xc5\x99\xe9\x26\
+\xab\xf2\x90\x48\x8c\x66\x87\xa8\xb6\xe2\x85\xbb\x56\x00\xf8\x84\
+\x51\xdb\x79\x72\x23\x5e\x95\xb5\x94\xaa\xa2\xac\x51\xdf\x5a\x76\
+\xb6\x69\xfb\x11\xa9\xb4\x3b\xf2\x93\x0e\x1d\x9d\x0b\x29\x65\xf8\
+\x1f\xc0\x56\x5f\x2e\xc0\x11\x65\x4d\x01\xf8\x71\x0c\x72\x15\xd6\
+\x08\xc0\xbf\x7d\x9a\xff\x87\xaa\x37\x8d\x84\xc9\x3a\x9f\xfe\x6e\
+\x55\x55\x5f\x26\x15\xf6\xa7\x03\x20\xa4\xcf\x40\x75\x5e\x74\x00\
+\xaa\x2e\x46\xda\xce\xa8\x9d\x48\x68\x27\xa7\x9a\x60\x2d\xfc\xa2\
+\xf4\x7e\x33\xc8\x67\x14\xf5\x65\x11\x64\x51\x51\x2c\x0c\xa0\x2f\
+\xa7\xba\x78\x73\xf5\xaf\x4e\x3c\xb2\x1b\x80\x2f\xb3\x73\x98\x26\
+\xf3\x35\xed\xd9\x93\x76\xec\x79\x0a\x27\xa4\x69\x00\xe9\x0f\xc4\
+\xfc\xb8\xd6\x9a\xb4\x08\xce\x09\x69\xda\x37\xbd\x8f\x19\x45\x5d\
+\x20\x9d\x1d\x9c\x3b\x98\x51\x1c\x50\xca\x37\x9d\x01\x65\x0b\xa0\
+\x92\xf6\x80\x26\x6b\xdf\xa9\x7d\x3e\x68\xc3\xde\xfa\x3f\x4e\xdd\
+\x74\xc2\xdf\x84\x47\xdb\xc5\x4c\xd6\x09\x44\x3c\x5a\xdf\x11\xb0\
+\xde\xfb\xad\xfb\x16\x7d\xe8\x45\x47\x48\x94\x76\x23\x1e\x67\xdb\
+\x77\x7a\x9c\x87\x61\xc5\x41\x4e\x14\x1d\x18\xb5\x85\xd4\xeb\xc9\
+\x80\xd2\x09\x0a\x9c\x1f\x23\x00\x41\x88\x37\x1f\xe6\xd3\x45\x48\
+\x08\xd4\x2e\xfd\xd9\xf7\x9d\xc1\x0e\x50\x8d\xb8\x0d\x0e\x48\x24\
+\xbc\x18\x02\x97\x10\x67\x27\x98\x92\x3e\xf3\xd3\xe3\x3c\x0c\x07\
+\x70\x07\x38\xd1\x80\xb3\x03\xc0\x93\x11\x80\x58\x2c\xe6\x40\xda\
+\x05\xe1\x94\x73\x08\x44\x32\x41\x90\x4f\x2a\xfd\xd9\xa2\x92\xa9\
+\x5e\xec\x04\xd1\x49\x03\xdb\x40\xe0\xcd\x7d\xe9\xa6\xc9\x7c\x5d\
+\x0f\x3b\xac\x15\x3b\x04\xb0\x7b\x1b\xdc\x56\x4a\x71\x91\x7c\x4a\
+\xdd\x24\xe5\xa0\x6d\x83\x3b\x10\xde\x8c\xf6\x09\xa5\x2d\x14\xd1\
+\x03\x5c\xe0\x1c\x65\x04\x80\xf5\x4d\x27\x5b\xbe\xbc\xfd\x01\x00\
+\x42\x84\xd2\x41\x5e\xa2\xc7\x46\x42\xdd\x14\x02\xd2\x2e\x08\x60\
+\x99\x37\x0b\x00\x2b\x65\x08\x80\x96\xec\x18\xa6\xc9\xb5\x42\x8b\
+\x16\xb4\x3b\x2f\x92\x28\x80\x15\x94\xca\x9e\xac\x82\x3f\x0c\x87\
+\x7d\x88\x5d\x3f\x87\x5c\x0b\x0f\x2a\xba\x84\xd4\xf6\x25\x51\xce\
+\xc3\xb0\x02\x1d\x9c\xa8\xb2\x7e\x08\x5e\x74\x00\xca\x22\x71\xca\
+\x50\x90\x02\x5b\x7c\xb9\x05\x10\xac\x6d\x90\xac\x0f\xbf\x74\x1c\
+\x86\xb0\x23\x98\x9c\xf1\xa5\x03\x00\x00\x9c\x0b\x71\x02\xc9\xa7\
+\xd4\x4d\x52\x5a\x1a\x8b\x83\x34\x0a\x12\x77\x2d\xfc\x98\x06\x10\
+\xd2\x08\x00\x70\x80\x03\x94\x32\xfc\x2d\xac\x85\x0f\x49\x24\x11\
+\xa2\xbc\x09\xbc\x5a\x03\xa1\x9c\x0e\x80\xa8\xbe\xcd\xa8\x9b\x81\
+\x4f\x8d\x82\x69\x4a\xce\x79\xf4\x77\x2d\xef\x70\xca\xfa\x31\x02\
+\x00\x00\x42\x1a\x0d\xd6\x84\x1e\xc4\xa8\x9b\x42\x39\x3b\xe2\x54\
+\xd1\xc1\x01\xae\x1d\xa5\xb8\x78\xd2\x01\x90\xc0\x76\x41\x00\x94\
+\xdb\x20\x03\xe7\xbc\x58\x03\xa1\x31\x38\x00\xc7\xb3\x73\x98\x1c\
+\x51\xfd\x8a\x2f\x97\x03\x09\x38\xab\xe0\x05\xe8\xc6\xa8\x9b\x4e\
+\xc0\xfa\x2c\x14\xd6\x0e\xb8\x24\x12\x70\x3a\x40\x82\x0e\x4e\x10\
+\x50\x16\xc4\x88\xa8\x1f\x1d\x00\x55\xce\x14\x00\xa9\xd7\x97\x01\
+\xe5\x2c\x08\x25\x7d\xf8\xa5\xf8\x64\x50\x01\x80\xb6\xec\x18\x26\
+\x67\xda\xa3\x4f\x9f\x7c\x76\x08\x00\x10\xc7\xd9\x07\x0f\xc0\x9b\
+\x63\x91\x1d\x69\x34\x58\x03\xd6\xc3\x5f\x6d\x1a\x70\xda\x02\x01\
+\x5a\x39\x40\x5a\x53\x8a\x07\xb2\x83\x51\x37\x05\xa9\x17\xe8\xc4\
+\x8f\x29\x80\xaa\xbb\x20\x28\xa3\x40\xbe\xec\x82\x40\x38\x18\xc8\
+\x8e\x60\x72\x2c\x91\xf0\xe2\xef\x9c\xb8\x0a\xbe\x03\xa2\x51\xc6\
+\xe2\xe7\x34\x58\x23\x00\xe2\x45\x07\xc0\x89\x2b\xa3\x14\x56\xb4\
+\x72\x0a\x50\x3a\x00\x0a\xe7\xc5\x31\xc0\x81\x90\xb6\x41\x7a\x32\
+\x02\xb2\xa9\x6c\x2b\x6b\x3b\x4c\xfc\xd8\xbe\x65\x1f\x12\xea\xa6\
+\x0a\xa4\x3f\x3b\x82\xc9\x39\x2f\x2e\xc4\x59\x53\x7a\xd8\xfb\x00\
+\x18\x8b\x81\x5d\xef\x4d\x07\x1e\x48\xa8\x9b\x22\x50\xce\x1a\x80\
+\x40\x03\x2f\xbe\x7f\x09\x69\x39\xa7\x30\x5a\x3b\x00\x94\x29\x00\
+\x45\xdc\x8b\x0e\x80\x53\xe1\x9c\x80\x47\x7a\xd3\xa7\xa8\xa0\x0d\
+\x83\x7d\x12\x8b\xc5\x02\x52\xed\xda\x04\x3d\xd8\x11\x4c\x8e\xb1\
+\x6e\x00\x4d\x11\x0b\x00\x7c\xca\xa8\xec\xe2\x9e\x2c\x82\x13\xce\
+\x08\x80\x13\xd2\x67\x7f\xb2\x44\x82\xd5\x16\xb6\xa2\x75\x00\x24\
+\x14\xe1\xf4\x7a\x92\x04\xd0\x16\x8c\xba\x02\xf9\x9c\x51\x37\x59\
+\xdc\x71\x76\x41\xc0\x93\x5d\x20\x55\xf2\xd9\x01\x4c\xce\xf9\xd4\
+\xe9\xe3\xfc\x2e\x84\xfc\x58\x04\xe7\x20\x94\xcb\x70\xa0\x9c\xcf\
+\xfe\x14\x21\xda\x68\x38\xaf\x03\x10\x04\x41\x25\xa3\x6e\x32\x81\
+\x23\xbd\x09\x02\x3f\x46\x40\xa0\xac\x61\x30\x9f\x3a\x00\xde\x6c\
+\x89\x32\x39\x93\xcf\x0e\xf0\x05\xce\x13\xb0\x04\x9e\x8c\x00\x28\
+\x28\x0f\x83\x81\x8a\x17\x1d\x00\x09\x38\x53\x00\x8a\x5d\x53\x00\
+\x11\x46\x71\xc4\x49\xf3\x1e\x29\x38\xbd\x40\x85\x78\xd1\x01\x80\
+\x2a\x65\x0d\x08\xa0\x9b\x39\x75\xd3\x62\x5d\x89\x6d\x78\x48\xb7\
+\xa0\xa6\x41\x3a\x08\xc6\x91\x76\x80\xa5\x10\xd2\x67\xa1\xc0\x8b\
+\x0e\x00\xc2\x9c\x11\x00\x01\xc2\x0e\x9c\x63\x70\xa1\x08\xf9\xd1\
+\x00\x82\xf4\x26\x60\xbd\xe9\x93\xa8\x08\xa7\x03\x28\xd8\x46\xa9\
+\x9b\x44\xaf\xea\x95\x07\xdb\x02\xb8\x3f\xea\xa0\x03\x06\x78\xd1\
+\x00\x88\x2a\xe5\x24\x3c\xf5\x65\x0e\x5c\x48\xa3\xa1\x9e\x8c\x00\
+\x20\x5e\xc9\x6a\x0b\x42\xb4\x0e\x40\x02\x3b\xbd\x68\x00\x79\x23\
+\x00\xf0\xe2\xfb\x57\x25\x5d\x03\xac\xce\x8f\x11\xa0\x56\xed\xbc\
+\x98\x07\x35\x04\xdb\xb7\xfb\x31\x04\x4e\x7b\x02\xf6\x63\x0e\x3c\
+\x20\x7d\x16\x38\x09\xbc\xe8\x00\xb9\x78\x1e\xeb\xb3\x90\xd7\x01\
+\x68\xeb\xc9\x36\x40\xa1\xf5\x02\xfd\x58\x03\x20\xb4\x85\x30\x7e\
+\x7c\xff\xa8\xe4\x9c\x83\x61\x3c\x90\x97\xe7\xc5\x10\x78\x40\x9a\
+\x03\x87\xb2\xd6\x3f\xd5\x16\x52\xce\x67\x41\x20\x7e\x8c\x00\xb8\
+\x16\xb4\x87\x61\xde\x14\x00\xd0\xc2\x8b\x06\x20\x20\x4d\x01\x38\
+\x5f\xd6\x00\x90\x16\x41\x7a\xb3\x06\xc2\xf9\xf1\x14\x64\x08\xca\
+\xcb\xbd\x78\x02\x84\x92\x46\x03\x85\x34\xfa\x97\x8c\x35\x02\xa2\
+\x7e\xac\x01\x08\x6d\xa3\xb5\x85\x21\x07\xc0\x71\x6a\x1f\xe6\x45\
+\x03\x20\xac\x35\x00\x09\x4f\x1a\x40\xd2\x14\x88\xf3\x64\x0a\x04\
+\x09\xeb\x00\xec\xb7\xbc\x99\x03\x67\x8d\x00\xf8\xf1\xde\x4f\x90\
+\x46\x40\x1c\xfc\xe8\x00\x2d\xe9\xf9\x29\x75\x0a\xc0\x18\x63\x8c\
+\x31\xfb\x19\x07\x80\x74\x1a\xdb\x06\x2f\x7a\x9f\xb4\xc5\x78\x21\
+\x3f\x7a\xdf\x20\x0d\xc5\xb3\xa6\x5e\x52\x84\x7c\x19\x89\x31\x39\
+\xa7\x9e\x6c\x45\x66\x2d\xc4\xf5\x64\x27\x52\x88\x34\x15\x11\x80\
+\x34\xf2\x92\x64\xf0\xdb\x07\xb2\x46\x22\x12\x0e\x9c\x73\xa8\x01\
+\x54\x78\xd1\x00\xb0\x86\xa2\x59\x27\x10\xa6\xe2\x2c\xc0\x11\x5f\
+\xbe\xff\xc0\x8f\x0f\x41\x43\x90\x47\x5b\x7d\x5d\x1b\x6b\x3f\x3a\
+\x6b\xf1\x61\x32\xd6\x54\x84\xf8\x31\x0d\x99\x68\x47\x6b\x0b\x79\
+\x1d\x80\xcf\x11\x78\xd1\x00\xa8\x28\xe9\x4d\xe0\xc7\x0a\x5c\xa5\
+\x3d\x05\xf8\xf1\xfd\x43\x49\xc7\x90\x1a\xbe\xf2\x72\xce\x2d\x6c\
+\x49\x1c\x6b\x31\x1e\x6b\xff\x7d\x12\xd6\x79\x04\x4e\x59\x9f\xfd\
+\xb5\x05\x15\x2d\x59\x9f\x85\x71\x5a\x07\x20\x04\xda\x37\x9d\x84\
+\xd3\x00\xd2\x16\x1f\x26\x11\xd6\x02\x24\x4f\xf6\xe0\xe2\x80\x9d\
+\x1f\x03\x50\x76\x0c\x93\x73\x8a\x83\x0f\xf6\xe3\x42\x2e\xd6\x13\
+\xb0\x7a\x32\xfa\x45\x3a\x8f\x80\x75\xfe\x40\xb2\x20\x4c\xdb\x8d\
+\xc2\x1b\x01\x10\x24\xbc\x68\x00\xc1\x5a\x03\xe0\xc9\x0a\x5c\x51\
+\xe5\xdc\xc9\xa0\xae\x03\xa5\x6e\x12\x89\x2d\xaf\x00\xe0\xc5\xc5\
+\x4c\x26\xa7\x3e\x93\x25\x4b\xbc\xb8\x8f\x44\x21\x94\x2b\xc9\xc5\
+\x9b\x35\x10\xa4\xd1\x40\xda\xe8\x6f\x92\x70\x84\x3a\x05\xc0\xf9\
+\x21\x84\x3d\xd9\x82\x43\x1b\x01\xf0\xa3\x03\x00\x91\x1d\x9c\xc2\
+\x9e\x5c\x44\x02\x00\x2a\x1f\xb1\x23\x98\x9c\xdb\xc4\x0e\xf0\x05\
+\xce\x85\x5c\x01\x9c\x17\x53\x20\xb4\xf3\x08\x58\xe7\x2f\x24\x8b\
+\xd3\xa6\xc3\x2b\x1d\x80\x9d\x8c\xca\xce\x39\xce\x19\xf4\x49\x94\
+\x76\x22\x9d\x1f\x73\xe0\x9a\x50\xce\xad\x7c\x02\x7f\x8e\xe0\x15\
+\x5d\xcf\x8e\x60\x72\x6e\x1d\x3b\xc0\x17\xa4\x23\xa5\x6c\x28\xd8\
+\xaf\xa7\x40\x9c\x27\x23\x00\xea\x68\x0f\xc3\x65\x0e\x00\xa5\x17\
+\xa8\x89\x4a\x2f\x46\x00\x58\x27\xf2\x29\xd4\x8b\x0b\x68\x34\xe4\
+\x38\x1f\x02\xea\x53\x07\x00\xef\xb0\x23\x98\x9c\xf3\xe9\xef\x9c\
+\xf3\xbb\x10\x84\xbc\xe8\x00\x04\xd0\x36\x94\xc2\x9e\x6c\x83\x44\
+\x82\x36\x02\x50\xe6\xa0\xa0\x0c\x01\x0b\xc2\x7e\x3c\x01\x93\x46\
+\x40\x20\xea\x45\x03\x18\x0e\x93\x46\x00\x80\x03\x63\xb1\x98\x1f\
+\x07\x51\xa9\x57\x8d\x81\xc9\x05\x11\x3f\xfe\xce\xa3\xd1\x10\x00\
+\xca\x7a\x98\x84\xd3\x4f\x19\x75\x53\xa8\x50\x3e\x0b\x03\x5f\xd6\
+\x40\x84\x42\xac\x6d\x90\x3b\x9c\x08\x67\x04\x40\xbc\xd9\x06\x88\
+\x2d\xa4\xc2\x5e\x74\x00\x3e\x7d\x77\xfb\x27\xe0\xac\x82\x0f\x2d\
+\x5d\xd5\xaa\x2b\xa1\x6e\x3a\xcb\xd9\x01\x4c\xce\x2d\x63\x07\x00\
+\x80\x23\x37\xb6\x3d\x04\x9c\xfb\x58\x82\x37\x4a\x0f\x61\x75\xfe\
+\x6b\x11\x80\x32\x05\xe2\x54\xbc\xf8\xfe\x35\x41\x9a\x02\x08\x50\
+\xe6\x00\xa5\x8c\x00\xa8\x53\x3f\x6e\x61\x53\x61\x0d\x83\x79\xd1\
+\x01\x28\x2d\x8d\xc5\x01\x50\xee\x23\x17\x84\xf3\x19\x75\x53\x84\
+\x13\xaf\xb1\x23\x98\x1c\x4b\xf8\xf1\x77\xae\x2e\xd2\x9d\x54\x7a\
+\x0b\x10\x23\x9d\x02\x9b\x84\xb4\x1e\x28\x10\xda\x67\x7f\x2d\x81\
+\x06\x9c\x5b\x29\x05\x65\x4e\x49\x2b\x41\x55\xc5\x8b\x55\xe0\xce\
+\x71\x16\xc2\x28\xfc\x18\x01\xa8\xb2\x99\x53\x36\xc8\xe7\xd4\x4d\
+\x32\x63\xd9\xdb\x00\xb6\xb1\x63\x98\x9c\xf9\x0c\xef\xbc\xe3\xc5\
+\xc2\x4f\x0d\x94\xd5\x01\xf0\xa2\xf1\x03\xc0\x5b\x10\xac\xea\xc5\
+\xcf\x40\x1c\x67\x47\x94\x02\x65\x4e\xa1\x94\xa7\x3f\x04\x9e\x34\
+\x80\x01\xa7\x17\x28\xf0\x63\x0d\x40\x95\x0d\x94\xaa\xaa\x87\x53\
+\xea\x26\x91\x5d\x53\x20\x2f\xb3\x73\x98\x1c\x51\x7d\x49\x3c\x39\
+\xfc\x49\x21\xf9\xa4\xca\x5e\x74\x80\x00\xd0\x16\x04\xd3\x16\x40\
+\x27\x51\xe1\xec\x02\x11\x60\x8b\x73\x4a\x9a\x03\xf7\x64\x11\x9c\
+\x26\x68\x2b\x61\xbd\x18\x01\xa9\xb2\x96\x51\x54\x45\x7a\x32\xea\
+\x66\xf0\x02\x3b\x80\xc9\x19\x8f\xfe\xae\xb5\x07\xa5\xaa\x3a\x7f\
+\x3a\x00\xac\xcf\xc2\x20\xe1\x45\x07\x80\xf5\x30\xac\xd0\x2d\x4e\
+\x05\x9f\x31\x8a\x03\x7e\x4c\x01\x24\x22\xe5\xac\x37\xc1\x01\x45\
+\x45\xb1\x30\xa9\x76\x2d\x2a\xca\xda\x13\x3d\x80\x54\x37\x1d\x8f\
+\x1a\x05\xd3\xa4\x44\x9e\x67\x47\xa8\xe1\x48\x4a\x55\xa7\x6b\x29\
+\x75\x93\x0c\x1e\x5c\x1c\x01\xd0\x8e\x51\xbb\xb2\x85\xf3\x62\x11\
+\xa0\x08\x67\x0a\x40\x04\x9f\x39\x05\xa9\x03\xe0\xc9\x08\xc0\xf1\
+\xbd\xcb\x3f\x03\xe7\x38\x64\x69\xdf\xb5\x55\x67\x42\xdd\x14\xa2\
+\xa4\x43\x51\x04\x47\x01\x2a\x94\xda\x29\x5a\x3f\x07\xd2\x99\x18\
+\x26\xa7\xca\x50\x5e\xfe\x22\x3b\x44\x15\x01\xd0\x9f\x52\x58\xfd\
+\xe8\x00\x7c\xd6\x2e\xe8\x82\x5d\x3f\x87\x5c\x8b\xbf\xfd\x8f\xd9\
+\x9c\xe9\xef\x54\x9c\x11\x00\x75\x9f\x39\x47\xdb\x06\xe7\x47\x07\
+\x20\x16\x8b\x05\x00\x28\xfb\x61\x03\x71\xac\x05\x40\xb5\x04\x08\
+\x71\x3a\x00\x8a\x76\x67\x8e\xbd\xc9\x8f\x75\x00\xb3\x5e\x2c\x83\
+\x60\x31\x3b\x87\x69\x72\xcf\xc8\x86\x0d\x5e\x74\xf4\xfa\x14\x8e\
+\xcb\x07\xe9\xe9\x57\x55\xbc\x38\x09\xb1\x85\x82\x33\x05\x02\xb0\
+\xb6\x3f\xa7\x50\x52\x07\x40\x10\x6c\x71\x1a\xd0\xa6\x00\xbc\xe8\
+\x00\x00\x00\x84\xb3\x22\x56\x20\xf9\x8c\xba\xc9\xc2\x9a\x58\xcb\
+\xaa\x1d\x4a\x04\x47\xb1\x6a\xa7\x50\x7d\x92\x1d\xc1\x34\xb9\xbf\
+\xb2\x03\x54\x13\x51\xce\xf0\x3f\x00\x89\x04\x6b\x59\xb5\x6b\x09\
+\x40\x79\x08\x12\xdb\x05\x01\x55\xd9\xe2\xe0\x58\x7b\x21\xfd\x58\
+\x03\x00\x00\xaa\xf8\x80\x51\xd7\x05\x81\x17\x23\x00\x5b\x36\xee\
+\x58\x07\xd2\x89\x88\x22\x72\x0c\xa3\x6e\x5a\x12\x3c\x02\x4f\x9e\
+\x0a\x4c\x93\x08\x10\x0a\xfd\x99\x1d\xe2\x0b\x8e\xf5\xde\xdf\xb1\
+\xf2\x99\x6e\xef\x92\x6a\xd7\xa2\x22\xf9\x94\xba\xe0\x7c\xe6\xa7\
+\x23\x0a\xca\x65\x50\x21\xd1\x4f\x9d\x93\x80\x73\x2b\x96\x27\x6b\
+\x00\x00\x40\x48\x17\x83\xa8\x70\x7a\xbf\xc9\x4a\x4b\x63\x71\x28\
+\x56\x91\xca\x9f\x40\xaa\x9b\x42\x6e\x5e\xf6\x2e\x00\x5f\xe6\x87\
+\x4d\xb6\xa9\x3e\x2f\x6f\xbc\xf1\x1e\x3b\x46\x35\xa7\xf8\x1a\xa3\
+\xae\x02\xcb\xfd\x39\x04\x88\x74\x0e\x82\x27\x53\x20\x55\x28\xdb\
+\x00\x35\x21\x1b\x5d\x10\x28\xe7\x2a\x54\x45\xbb\x68\x34\xe6\xc5\
+\x71\xc0\x20\x6d\x83\x03\xc4\x8b\x0e\x00\x00\x40\x48\x47\xa3\x2a\
+\x4e\xf0\xe6\x4e\x00\x00\x10\x5d\xc0\x8e\x60\x9a\x88\x73\x1e\xfd\
+\xdd\xc6\x9c\x02\x5f\xa6\x94\x56\xf1\xe2\x18\x64\x00\x40\x20\xf9\
+\x94\xba\x12\x78\xd1\x01\xc8\x2f\xba\xa4\x25\x00\xca\xa9\xb8\x15\
+\x2e\xfe\x91\xeb\xda\xfe\x80\x4d\x20\x0d\x7b\x96\xa1\x7d\x27\x46\
+\xdd\x64\xac\x55\xf0\x0a\xe4\x33\xea\xa6\xa3\xac\xb3\xd1\x05\x07\
+\x2c\x59\xdd\xb6\x37\xa5\x76\x3a\xe5\x15\x0f\x00\xf0\xe3\x92\x10\
+\x93\x4d\x3b\xb1\x73\xe7\x7c\x76\x88\x6a\x7d\x0b\xdf\x1f\x00\x70\
+\x86\x7e\x21\x1e\xdd\x7d\x41\x1b\x05\x75\x6b\x39\x75\x6b\x6b\x1b\
+\x08\xab\x0d\x0c\xd6\x74\xfd\xfc\x13\x37\x7b\xf6\xe5\x95\x4a\x5a\
+\x05\x2f\x4e\xbb\x31\xea\x26\x53\xe5\x2c\x88\x11\xa0\xbb\x2f\xdb\
+\xe0\x9c\xd3\xd7\x59\xb5\x45\x03\xca\x50\x68\x3a\x72\xfb\x4b\x96\
+\x20\x89\x00\x00\x20\x00\x49\x44\x41\x54\xaa\x8f\x01\x78\x34\x4f\
+\x6c\xb2\x42\xe4\x61\xd9\xb0\xc1\x8b\x7d\xdf\x00\x00\xd1\xaf\xd2\
+\x6a\xab\x7a\x32\x02\x10\x73\x00\x38\xbb\x80\x9c\x1f\x23\x00\xac\
+\xbb\x20\x14\xd8\x8c\x92\x92\x84\x03\x00\x01\x28\xd3\x00\xe2\xc9\
+\x59\xf0\x89\x70\x0b\xd6\x9b\xa1\xf5\x79\x17\x4c\x3f\x94\x54\xbb\
+\x96\xa0\x32\xe0\x7d\x28\x08\x4e\xa6\xd5\x4e\x47\xe5\x4e\x76\x04\
+\x93\x65\x22\xb3\xd9\x11\x6a\x12\x95\x53\x58\xb5\x83\x48\xc8\x8b\
+\x0e\x40\x9f\xc2\x0d\xdd\x01\x70\x6e\xc2\x43\x78\x2d\xa7\x6e\x6d\
+\xac\xbb\x20\x04\xf2\x11\x00\x54\xcf\xbd\x6e\xe4\x84\xd0\x7c\x46\
+\xdd\x64\x87\xb6\x6d\xfd\x2e\x38\x87\x01\xa1\x32\x1e\xf2\x62\x1b\
+\xdc\xa2\x92\x6b\xd7\x03\x4a\x79\x1f\x40\xe5\x1b\x3e\xad\x03\x90\
+\xdf\xbc\x52\x0a\xe0\x5f\xec\x1c\x26\x6b\x96\xc8\x9b\x6f\x7a\x74\
+\xc6\x43\xcc\x01\xca\xea\xf4\x6e\x7c\xe3\x99\xdf\x7b\xb1\x10\x32\
+\x0c\x61\x7d\xf6\x25\xba\xa2\x2b\xe7\xfe\x93\x64\xa4\x45\x90\x0a\
+\xad\xd1\x01\x10\xa5\xfc\x30\x54\xc4\x8b\x43\x60\x66\xcf\xbe\xbc\
+\x12\xa4\x6d\x21\x02\xde\x5e\xe0\x34\x5e\x22\xd5\xed\xb8\x64\x65\
+\xeb\x41\xa4\xda\x19\xe8\x8d\xec\x04\x26\x6b\x66\xb0\x03\xd4\x34\
+\x60\xe8\xbb\xc7\x01\x20\xcd\xfd\x8a\x37\x47\x5e\x2b\xeb\x1c\x04\
+\xc5\x86\xaa\x6b\xd0\xe9\x94\xb4\x08\x52\xa0\xef\x02\x55\x1d\x00\
+\x51\x61\xf5\x86\xf2\x49\x75\xd3\x59\x4b\xa9\xea\x48\x67\x81\xa7\
+\x21\xca\xdb\x02\x27\x4e\xbe\xc1\xaa\x9d\xd6\xac\xd7\xfe\x02\x60\
+\x29\x3b\x86\x69\xb4\xb7\xd0\xad\xdb\xc3\xec\x10\x35\x05\xe2\x4e\
+\x67\xd5\x16\xa8\x3f\xdb\x5c\x95\x74\x17\x88\xb0\x76\x7d\xa5\xc1\
+\xdb\x0a\xbe\x01\xa8\xea\x00\x04\xa2\x9c\x21\x21\x4f\xf6\xc1\x03\
+\x00\x04\x6f\x53\xea\x2a\xbc\x98\x02\x00\x80\xc0\x11\xf7\xc0\x2b\
+\xce\xa4\xd5\x4e\xa3\xea\xba\xd8\x69\xec\x1c\xa6\xd1\x7e\x21\xa5\
+\xa5\x5e\x3c\xed\xd5\x30\x8c\x55\x58\x9c\xfc\x9b\x55\x3b\x99\x42\
+\x28\x0f\x3f\x22\x78\x87\x51\x37\x83\x7c\x46\xd1\xea\x87\xfe\xaa\
+\x79\x57\xc7\x39\x15\x4a\xfd\x19\x01\x50\xc5\x0a\x52\xe9\x7e\xd1\
+\xe8\x43\x21\x52\xed\x5a\x5a\xc6\xc3\x2f\x03\xa8\x24\x95\xff\xda\
+\x88\xd1\xd3\x0e\x21\xd5\x4e\xaf\xc3\xab\x7f\x02\x68\xef\x0b\xd3\
+\x78\x6f\xa0\x5b\xb7\x07\xd9\x21\x6a\xea\x7d\xf2\x77\x0f\x05\xc0\
+\xda\x01\x50\xbe\x1d\x15\xff\x25\xd5\xae\xa5\xea\x26\xd4\x3e\x94\
+\xe2\xea\xcd\x36\x48\x01\x40\xd9\x09\xa7\x90\x9a\x53\x00\x09\xd6\
+\x14\x40\xeb\x61\xd1\xeb\xbd\x38\x0b\x80\xb8\x0d\xae\x65\x39\xde\
+\xe9\x45\xaa\x5d\x4b\x49\xc9\xc4\x32\x00\xaf\x91\xca\x3b\xa8\x3b\
+\x8f\x54\x3b\x2d\x89\x21\x80\xe2\xa7\xec\x1c\xa6\x81\x44\x26\xfb\
+\xf6\xf4\x1f\x8a\x27\xbe\x85\x2f\x16\x5f\xe7\xda\xff\xd6\x96\xde\
+\x4b\x39\xf2\x3b\xd9\xa6\xc4\x07\xbd\x41\xda\x01\x20\xce\x79\xb1\
+\x0b\x62\x40\xd1\xf7\xba\x00\x68\xc5\xa8\xed\x6a\x8e\x00\xc4\x13\
+\xb4\x35\x00\x88\x84\x42\x7e\x4c\x03\x04\x21\xde\x3e\xf8\x90\x1f\
+\x3b\x01\x00\x00\x82\x67\x89\xb5\xbf\x45\xab\x9d\x81\xfc\xe6\xd5\
+\x47\x00\x3c\xce\xce\x61\xea\xed\x49\x59\xb3\x66\x21\x3b\x44\x0a\
+\x25\xbe\xc7\xd5\x9f\xdb\x2e\x55\x02\xda\xda\xa7\x72\x24\xbc\xe8\
+\x00\x68\x3c\x4e\x6b\xfb\x12\x79\xe1\x2f\x3a\x00\x4f\x94\x4c\xde\
+\x08\x60\x07\x23\x88\x8a\x1f\xc7\xe1\x3e\x36\x7f\xe2\x06\x28\xe7\
+\x6a\x64\x55\x1c\xcf\xa8\x9b\x8e\x06\xfa\x37\x62\xf9\x21\x67\x46\
+\xa7\x77\x25\xd6\x4f\x2f\x9c\xf8\x21\x48\x97\x25\x99\x06\x29\x43\
+\x38\x7c\x25\x3b\x44\xb2\x3e\x27\x5e\x7a\x08\x84\x73\xfe\x3f\x00\
+\x38\xa1\xfe\x6e\x27\x51\xce\x31\xc8\xc0\xa7\x6b\x4a\xe7\x78\xb1\
+\x05\x50\x1d\xed\x1c\x9c\xad\xab\x9e\xbe\xfd\x63\x60\xf7\x50\x94\
+\xa8\x80\xb3\x08\x4e\x02\xe9\xc9\xa8\x9b\x4a\x14\x42\x9a\xef\x15\
+\xf5\xe6\x24\xbc\x6d\xad\x76\x2c\x06\xc0\xba\x2f\x3d\x14\x0e\xbb\
+\x0b\x48\xb5\x33\x92\x19\xcb\xde\x82\xda\xb6\xc0\x66\xe4\xd7\xb2\
+\x7a\xb5\x4f\x0b\xbd\x00\x00\x2e\x14\xba\x08\xbc\xe1\xff\xed\xe5\
+\x6d\x5a\xf9\xb3\x05\x10\xb4\x8e\x90\x17\x4f\xff\x00\xa0\x70\x3d\
+\x38\x95\xe5\xad\xea\xff\xb5\xfb\xcd\xa8\x50\x4e\x07\x40\xa4\x3f\
+\xa3\x6e\x3a\xaa\x60\x4d\x03\x1c\xe7\xcb\xc5\x48\xa5\xf7\xc6\x76\
+\x0a\xf0\x1c\x2f\x81\x8e\xf7\xe5\x78\xe4\x5a\x12\x3b\x6e\x04\xb0\
+\x9a\x1d\xc3\xec\xd5\x9b\x10\x99\xc9\x0e\x91\xc1\xc5\xc4\xda\xa5\
+\x6b\x9e\xbc\xcd\x8b\x3b\x2e\x7a\x0d\xbb\x2a\x0f\x90\x63\x29\xc5\
+\xbd\x39\x06\x19\x10\xe1\x6c\x83\x54\xd1\x74\x1d\x00\xbc\x95\xfe\
+\x8f\x37\x71\x18\xa8\x37\xf3\xdf\xc2\xeb\x1d\xb6\xac\x8c\xb4\xf2\
+\xe6\x20\x1c\x55\xf0\x86\x0a\x15\x7d\xce\x1e\x33\x93\x77\x4e\x7a\
+\x06\x72\xdb\x9a\x72\x08\xae\x00\xe0\xc7\x35\xaa\x26\x9d\x04\x44\
+\xc6\xcb\x9a\x35\x5e\x34\x74\x35\x0d\x28\x2a\x1e\x02\xa0\x1f\xab\
+\xbe\x30\x7f\xa7\x93\x84\xb7\xef\x1c\x0c\xd6\x11\xc0\xce\x9f\x9b\
+\x10\x59\x6d\x9f\x04\x5f\x8c\xf6\xef\xee\x00\x88\x0a\x67\x1f\x3c\
+\xd0\xdf\x97\x6d\x70\x8e\x75\x25\x2e\x80\x20\x11\x3a\x81\x55\x3b\
+\x99\xba\x04\xf5\xc3\xc2\x29\x2e\x63\xd6\xcf\x44\x6e\x7e\xf5\x9f\
+\x00\x7e\xc5\xce\x61\x32\xfa\xb9\xac\x59\xc3\x5b\xc4\xba\x07\x89\
+\x04\x2e\xa5\xd6\x0f\x12\x4f\x31\xeb\xd7\xe4\x78\xc3\xff\x80\xfa\
+\xb1\x03\xa0\xa8\x28\x16\x16\x45\x5f\x46\x6d\x75\x69\x46\x00\xe0\
+\x74\x0d\x23\x0c\x80\x56\x71\xf7\x6e\x01\xa9\x76\x2d\xd2\xa2\x92\
+\xb6\x13\x40\x05\xde\x74\x00\x16\xcd\xbb\x76\x39\x48\x53\x42\x55\
+\x46\x9d\x73\xc9\xac\x03\x88\xf5\x33\xeb\xf0\xea\xcf\x01\xfd\x07\
+\x3b\x86\x49\xf1\x4f\xbc\xf5\xd6\xf5\xec\x10\xe9\x0c\x2a\xba\xe4\
+\x00\x11\x8d\x12\x23\xbc\xb9\xfa\x85\xbb\x7d\x9a\xbe\x62\x8d\xf0\
+\xa9\xab\x8c\x7b\xd1\x01\x78\x1f\xef\xf7\x02\x6b\x1b\xa4\x48\xea\
+\x08\x40\x42\x22\x6f\x30\xc2\x00\x40\xc2\x93\xf3\xf0\xff\xfc\xc7\
+\x1f\x7f\x0c\x80\xd2\x11\x12\xf8\xb3\x10\x10\x00\xa0\xee\x4f\xc4\
+\xea\x6d\x83\xb2\xf8\x78\x62\xfd\x8c\x24\x86\x00\x41\x70\x21\x48\
+\x77\x47\x98\xb4\x36\x22\x1e\xbf\x40\x48\x17\x7a\xed\x4d\x79\x10\
+\xb9\x1c\x40\x5b\x56\x7d\x55\x29\x61\xd5\x4e\x47\x79\x1d\x80\x37\
+\x97\xbf\x38\xd7\x8b\x2b\xa1\xc3\xc4\x13\x60\x43\x41\x7c\x77\x67\
+\x70\x77\x07\xe0\xf8\xde\x9f\xad\x05\x69\x2b\xa0\xc0\xa3\xf3\xf0\
+\x41\x3b\x0e\xb7\xdb\xf0\xe8\x8d\x5e\x5c\x8e\x04\x00\x90\x04\xf7\
+\x43\x43\xf0\xc3\xe2\xe2\x3b\x23\xd4\x0c\x19\xc8\x2d\xcb\x36\x42\
+\x70\x01\x3c\x6d\x70\xf6\x33\x01\x54\x2f\x94\x75\xeb\xbc\xec\x90\
+\x0d\x1e\x5c\x1c\x01\x84\xba\x25\x31\x14\x52\x6f\x3a\x00\x7d\x0a\
+\xc7\xf5\x00\xc0\xba\x02\xdd\x9b\x63\x90\x11\xd0\x1e\x7a\x3f\x5f\
+\xb6\xf8\x9e\xdd\xdb\x20\x77\x77\x00\x62\xb1\x58\x00\xe0\x4d\x46\
+\x22\xf5\xe8\x42\x1c\x55\xde\x65\x19\x12\x72\xa7\xb2\x6a\x27\x5b\
+\x38\x7f\xea\x7f\xc9\xd3\x00\x87\x7e\xf8\xd9\xd6\x6f\x12\xeb\xef\
+\x91\xdc\xfc\xea\x3f\xa1\x7a\x2d\x3b\xc7\x7e\x4f\xf5\x1a\x79\xfb\
+\x6d\x6f\xa7\x64\xca\x5a\x07\xa3\x00\xa5\x1c\xf7\x0a\x00\x02\x79\
+\x7b\x79\xe9\x5d\xaf\xb0\xea\x27\x0b\x81\x77\x11\x92\x8a\xfa\xb3\
+\x0d\x52\x38\xf7\x20\x28\xb0\x72\xd7\x7f\xed\x52\x7b\x4f\xaa\x60\
+\x65\xae\x03\x01\x80\xaa\x1f\x53\x00\x00\xe0\x42\xc4\x0b\x71\xe0\
+\xd7\x8d\x78\x02\x79\x84\x1c\x60\x22\xb5\xfe\x5e\xc8\x6f\x5e\x9b\
+\xe9\xf1\x96\xb3\x7d\x9f\xc8\x8d\xf2\xf6\xdb\xbf\x61\xc7\xd8\x03\
+\x51\x91\x09\xdc\x08\xc1\x43\xdc\xfa\xb5\x29\x94\xf7\x19\xa7\xce\
+\x9f\x9b\x10\x59\x3b\x00\x50\xbb\x8d\xaf\xd5\x01\x90\x40\x28\x1d\
+\x00\x01\x8e\x28\xba\x24\xd6\x92\x51\x3b\x59\xa4\x32\xff\x75\x00\
+\x5b\x49\xe5\x4f\xf3\x65\x47\x44\x15\xe6\x3a\x00\x00\x38\x7e\xf8\
+\xa8\x99\xb4\x9b\xd3\xea\xe4\xe6\x57\xa6\x00\xb8\x87\x1d\x63\xbf\
+\xa3\x7a\x3f\xd6\xac\xf9\x31\x3b\xc6\x9e\xf4\x3d\xe9\xb2\xb3\x01\
+\x70\xf6\xbb\x57\x51\x75\xde\x0c\xff\x57\x5d\x00\x74\x32\xa9\xfc\
+\xd6\x55\x5d\x3e\xf5\xe2\x62\xaf\xc3\x4e\x98\xd0\x0a\x00\xe5\x00\
+\x3c\x85\x64\xee\x00\x28\x02\x4a\x07\x00\x40\xf8\x80\x8a\xd6\x94\
+\x2d\x11\xc9\x4a\x4a\xce\x4f\x00\x60\xdd\x98\x75\x60\x45\x68\xdd\
+\x71\xa4\xda\x29\x1e\x9b\x3f\xf9\x25\x00\xab\x98\x19\x44\xf4\x97\
+\x5e\x1e\x0c\x54\x45\x00\xc5\xf6\xf0\xe5\x80\x3e\xc1\xce\xb2\x1f\
+\x79\x1c\x87\x1f\xfe\x1d\xa9\x31\x94\xe9\x25\x75\xdc\x8b\xa4\x44\
+\x56\xaf\x7c\x6e\xf6\xff\xa8\x19\x6a\xf8\x20\xf1\xee\x57\x00\x74\
+\x20\x95\xff\x37\x4a\x4a\xbc\x58\xb3\xd3\x36\xb4\xad\x3f\x00\xca\
+\x83\x9e\xd3\x20\x73\x07\x20\x04\xde\x29\x49\x81\xba\xa3\x59\xb5\
+\x53\xe9\xbf\x78\xa5\x3d\x9b\x06\x50\xfd\x03\x39\xc2\xe0\x11\xa3\
+\x67\x9e\x49\xce\xb0\x47\x32\x7b\x49\x25\x42\x38\x1f\x80\x37\x73\
+\x8c\xfb\xb0\xe7\x51\x56\x76\xbe\x6f\xb7\xfc\x25\xeb\x3f\x74\xdc\
+\x48\x01\xf7\x8e\x0f\x51\x9d\x03\x8f\x3a\x49\xce\xf1\x3e\xdb\x04\
+\xe2\xcd\xf0\xbf\x0b\x61\x20\xab\xb6\x84\xb4\xd6\x55\xc8\xb5\x3a\
+\x00\xe1\xa0\xc7\x1b\x20\xed\x04\x80\x06\xde\x9c\xfe\x26\x8e\xb7\
+\x0e\x40\x85\x38\x47\x96\x46\x28\x12\xf9\x03\x00\xf6\x87\x6d\xcc\
+\xe7\x51\x00\x00\x90\x99\xaf\x6d\xc7\xf6\xf0\xe9\xb0\x9b\x03\x9b\
+\x8e\xc8\x5f\x50\x56\xf6\x0d\x79\xff\x7d\xce\x67\x54\xdd\x89\x8a\
+\xbb\x8e\x9c\xa1\xd2\x45\xf4\x3e\x72\x86\xda\x54\x68\x0b\x00\x03\
+\xe2\xe2\xee\x64\x1a\x08\xeb\xcc\x97\x6d\xcb\x4b\xe7\xd6\x3a\xf1\
+\xb7\x56\x07\xa0\x6a\xf8\x9b\x74\x18\x8e\x78\xb3\x0f\xbe\x45\x65\
+\xf8\xdf\xe0\xf5\x9c\xbf\x72\xd6\xd8\x1b\x0e\x24\xd5\x4e\xf1\xc8\
+\xfd\x13\x3e\x50\xc5\x93\xe4\x18\xc7\x8d\x18\x35\x73\x14\x39\xc3\
+\x5e\xc9\xec\x25\x3b\xb0\xa1\xf7\x48\x00\x73\xd9\x59\xf6\x41\xf7\
+\xa1\x43\x87\xf3\x9a\x41\xe3\x8f\x7e\x27\x8d\xbf\x10\xd0\x63\xc8\
+\x31\xfe\xb2\xec\xe9\x39\x1b\xc9\x19\x76\x1b\x70\xc2\x65\x07\x01\
+\x60\x4d\x6f\x06\x2d\x43\x95\x2f\x91\x6a\xa7\x72\x9c\x93\x10\x05\
+\x78\x0d\x49\xed\x5a\xca\xcd\x54\xaa\x60\x6d\x19\x39\x32\x1a\xbd\
+\x91\x35\x3f\x54\x4b\x49\xc9\xc4\x4f\x00\xb0\xe6\xce\x42\xe1\x20\
+\xec\xdb\xc2\x37\x7e\x83\x26\x98\x31\x7c\x78\xac\x35\x3b\xc6\xde\
+\x48\x49\x49\x02\xb3\x5e\x1d\x0f\x60\x1a\x3b\xcb\x3e\xe4\x56\xbc\
+\xf5\xd6\xc5\xb2\x64\x49\x25\x3b\xc8\xde\x1c\x76\xc2\x84\x56\x50\
+\xfe\x71\xd1\x1a\xe0\x6e\x76\x86\x9a\x34\x2c\x67\x82\x34\xef\xad\
+\xc0\x92\x57\x4a\xef\xa5\x5c\xf5\x9e\x6c\x50\xd1\x25\x07\x40\x39\
+\x77\x42\x28\x24\xa5\x6d\x4f\xe9\x00\x08\xf4\xd5\xdc\xc4\x49\xe1\
+\x2a\x24\x44\x9d\x33\xab\x49\x45\x68\x67\x67\x2b\xf0\x2d\x56\xed\
+\x74\xb6\x6d\xdc\xfe\x38\x80\x0f\xc9\x31\x0e\x73\xad\xdb\x90\xb7\
+\x54\xd5\x8d\x00\x2a\xb3\x5e\xbd\x16\xaa\x93\x61\x97\x07\x35\x46\
+\x02\xaa\x13\xe4\xad\xb7\x7e\xe8\xfd\x82\xbf\x2a\x6d\x23\xdb\xa6\
+\x00\x60\x1f\xe8\xf5\x7e\xd7\xf0\xa1\x7f\x25\x67\xa8\x4d\x70\x3e\
+\xaf\xb4\x3f\x17\x21\x55\x22\xef\xab\x20\x5d\x09\xad\x92\xda\xb6\
+\xa7\x76\x00\x24\xc4\xea\x00\x40\x9d\x3f\xe7\xe1\x87\x54\x99\x6f\
+\x9a\x61\xc3\x2e\xb8\xb5\x3d\xb1\x7e\x2d\xa5\xa5\xb1\xb8\xa8\xdc\
+\xc1\xce\xa1\x0e\x53\xcf\xbb\x70\xd6\x97\xd8\x39\xea\x6a\xd7\x39\
+\x01\x38\x15\x76\x6c\x70\x43\x7c\x04\x91\x33\x3d\xdf\xe7\x5f\x4b\
+\xef\x93\xbf\x7b\xa8\x40\x26\xb3\x73\x00\xb8\xa3\xb4\x34\xc6\x5e\
+\xb7\xb3\x5b\x9f\x13\x2f\x6d\xa7\x90\xd3\x58\xf5\x9d\x13\x6f\x3a\
+\x00\x9a\x08\x68\x6d\x5c\x28\x08\xf6\xde\x01\x28\x8b\x04\xaf\x82\
+\x77\xc4\xa9\x37\x1d\x80\x48\x62\xfb\xff\xb7\x77\xe7\xe1\x51\x96\
+\xe7\x1a\xc0\xef\xe7\x9b\x84\x1d\xad\x75\x97\x56\x3d\x1e\x4b\x02\
+\x41\x5a\xa5\x9e\x6a\x59\x4c\xb1\xa0\xa8\x80\x4b\x23\x8b\x5a\x2c\
+\x4b\xb0\x5a\x3d\x2e\x04\xac\xad\x75\xec\xa2\x05\x22\xa0\x1e\x44\
+\x12\x54\x5c\x80\x40\x6c\x85\x44\xa4\x82\x4b\x48\x40\x6b\xcf\x41\
+\x45\xc9\x6a\x40\x71\xc7\xa5\x22\x4b\x80\x64\xe6\x7b\xce\x1f\x80\
+\x86\x64\x12\xb2\xcc\xcc\xf3\x06\xee\xdf\x75\xf5\x1f\x4d\xbe\xf7\
+\x6e\x4c\xe6\x7d\xbe\x77\x7d\x05\xc0\x0e\xa3\xe6\x3b\x24\x86\xf6\
+\x38\xb5\xf2\xbd\xda\xaf\x9e\x03\x60\x97\x69\x08\x45\xd7\x50\xa8\
+\xe6\x3e\xd3\x0c\xcd\x24\x33\xd6\xbf\x8c\x80\xfe\x08\x80\x33\xb7\
+\xb1\xb5\x01\x2f\x23\x14\xfa\x91\x54\x56\xb6\xa9\x9f\x99\x17\x0e\
+\xcf\x02\xd0\xd9\x38\x46\x55\xd8\x93\x87\x8d\x33\x1c\x20\x10\x08\
+\x0c\x03\x60\x75\xce\xcb\xf6\x0e\xdb\xe1\xcc\xfc\xbf\x8a\xd9\x3d\
+\x08\xa1\x0e\x55\x81\x7a\xbb\xfc\xea\x15\x00\x2b\x9f\xcc\xd8\x09\
+\xa0\xb8\xee\x3f\x8f\x0b\xc5\xb9\xc1\x60\xd0\x64\x78\xa4\xae\xdc\
+\xdc\x60\x35\x20\x05\x56\xed\x8b\x63\xd3\x00\x2b\x72\xef\xf8\x5c\
+\x55\x17\x58\xe7\x00\x64\xd4\xf0\x51\xd3\x87\x5a\xa7\x68\x0e\xc9\
+\x7c\xeb\x33\xcc\x5c\x7f\x21\x04\xb7\x83\xf7\x07\x34\x26\x0c\x91\
+\xbb\xb1\x71\xe3\x20\x57\xcf\xf6\x6f\x48\x8f\x01\xe3\x2f\x12\x75\
+\xe2\x6f\xf6\x89\x8a\x82\xac\x2f\xac\x43\xd4\xa6\x80\xdd\x4d\x88\
+\x82\x17\xd7\xad\xcb\x72\x64\xed\x48\xd0\x03\xf0\x13\x9b\xb6\xe5\
+\xed\x75\xeb\xb2\xea\x2d\xa0\x8d\xd8\xd9\xaa\xea\xbf\x62\x1f\x28\
+\x02\xc1\x77\xde\x28\xee\xe2\xc4\x81\x40\x00\x00\xc3\x69\x00\x15\
+\x0c\x49\x4b\x9b\x6d\x76\x83\x58\x44\x9e\x3f\x0b\x0e\xcc\xc5\xaa\
+\xe2\x7f\x9c\xfb\xd9\x1c\x84\x00\x2a\x33\xd6\x4f\x85\x60\x10\x80\
+\x77\xad\xf3\x38\xa8\x02\x9e\x37\x50\x2a\x2b\x83\xae\xde\xea\xd7\
+\x90\xde\x83\xaf\xe9\x0c\xc8\x6c\xeb\x1c\x00\x34\x00\x7d\xc0\x3a\
+\x44\x6d\x49\x7d\xc7\x76\x05\x60\xb6\xfd\x4f\x7c\x77\xe6\xff\x93\
+\xfa\x7f\xd8\x0b\x46\x07\x21\x29\x22\xf7\xe9\x11\x0b\x00\x11\xef\
+\x7f\x63\x1b\xa7\x61\x7e\x40\x9d\x99\x06\xf0\x03\xa6\xeb\x00\x3a\
+\xed\x4e\xa8\x72\x6a\x1a\x20\x7f\xd1\xed\xc5\x50\x27\x86\xb2\x4f\
+\xde\x1d\xd8\xf9\x47\xeb\x10\x2d\x21\x33\xd6\xbf\x0c\x74\x4a\xc1\
+\xde\x5d\x02\x6d\xaa\xa3\x8b\x91\x5d\x10\xb9\x1b\x22\xbd\xe5\x9d\
+\x77\x0a\xad\xc3\xb4\x44\xf5\xee\xf6\xf7\x00\x38\xd5\x3a\x07\x04\
+\xcb\x37\x14\xce\xb3\x3a\xcd\x35\x22\x09\x24\x0c\x05\xd0\xd1\xaa\
+\xfd\x90\x86\x5d\xf8\xbc\x02\x00\x04\x0c\xb7\xba\x7b\x40\xd3\x0b\
+\x00\xcf\xf3\x6d\x46\x00\x00\x88\x43\xeb\x00\x9e\x5d\x38\xf9\x1d\
+\xcb\x1b\xf1\x3c\xdf\x6e\xe5\x6c\x83\x3c\x71\x62\x0e\x5e\x20\x37\
+\x0d\x1f\x39\xad\xbf\x75\x8e\x96\x90\x99\xaf\xee\xda\xbb\x4b\x20\
+\x70\x06\xc4\x9d\x37\x94\xb8\x13\x79\x16\x09\x09\x29\x52\x59\x19\
+\x94\xca\xca\x3d\xd6\x71\x5a\x22\xb9\xff\x84\xf3\x04\xf2\x1b\xeb\
+\x1c\x00\xa0\xa2\x4e\xfc\x6d\xd6\x26\xa2\x76\xc3\xff\xc0\x3b\x15\
+\x6b\x1e\xb5\xbc\xd1\xf4\x00\x2a\x86\x7d\x5b\x38\xf2\x3a\x88\x88\
+\x05\xc0\xd6\x8f\xab\x36\xc0\xea\x44\x40\x60\x80\x51\xbb\x0d\xb0\
+\x5b\x41\xaa\x82\x4b\x86\x8e\xca\x3c\xc6\xaa\xfd\x48\xf2\x16\x4d\
+\x5a\x05\xa0\xc8\x3a\x07\x80\x80\x42\x16\xb8\x74\x68\x52\x73\xc9\
+\xac\xd7\x4b\x65\xc6\xfa\x0b\xa1\x9a\x06\xa0\xc2\x3a\x4f\xdc\x88\
+\x94\x41\x64\xb8\x54\x56\x0e\x95\xf2\xf2\x36\x3b\x1d\x72\xda\xcf\
+\xd3\x8f\x14\xe0\x71\x18\x6d\xeb\xaa\x4d\x80\xb5\x65\x05\xf3\x0a\
+\xac\x73\xd4\xd6\xfb\xa7\xd7\x1d\x07\x85\xd9\x28\xa6\x4b\xdb\xff\
+\xf6\xb1\x7a\x61\xd9\x5e\x72\xd2\xd6\x88\x77\xba\x44\xfc\xc5\xdd\
+\xb7\x85\x64\x5d\x4c\x23\x35\xec\x07\x17\x8f\x9e\x69\x72\x53\x52\
+\x24\xaa\xba\xd4\xb0\xf9\xf6\xe2\xe3\x2a\xc3\xf6\x23\x12\x1f\xae\
+\x0c\xbf\x7f\x3f\xc1\x4f\xb8\xdf\x3a\x44\x6b\xc9\xac\xb7\x9e\xc6\
+\x91\x47\xa5\x00\x18\x8b\x43\x7b\x7d\xc0\x46\x00\x63\x50\x59\xd9\
+\x4b\x2a\x2b\xf3\xac\xc3\xb4\x56\xfb\x3d\x3a\x07\x82\x53\xac\x73\
+\x00\x80\xef\xe9\xef\xad\x33\xd4\x55\x9d\xe0\x5f\x03\xa0\x9d\x55\
+\xfb\x02\x7d\xc6\xaa\xed\xba\x92\xfb\x4d\xe8\x0e\xe0\x3f\x2c\xda\
+\x16\xe0\xff\x1a\xba\x08\xa9\xb1\xca\x75\x4d\x8c\xf2\x1c\x54\xc0\
+\x0f\x9b\x2d\x1a\xa9\x6b\xfb\x96\xaa\x97\x00\x98\xad\xaa\x15\xd1\
+\xf1\x56\x6d\x37\x64\xd9\x92\x8c\x17\xe0\xc6\x28\x00\x14\xb8\x66\
+\xd8\x88\xe9\x23\xad\x73\xb4\x96\x04\x0b\x42\x32\x73\xfd\x63\x38\
+\x72\xfd\xe9\x80\x0e\x03\xdc\xd9\xba\xd4\x6a\xaa\x6f\x02\x18\x83\
+\xef\x7f\x3f\x59\x36\x6e\x7c\xa2\xad\x2d\xf2\x8b\xa4\xc7\x79\x13\
+\xae\x81\x60\x94\x75\x0e\x00\x10\xe0\x65\xd7\xde\xfe\x01\x40\xa0\
+\x63\x0d\x9b\xff\xe2\x58\xef\x7b\xce\xac\x29\xf1\x04\x76\x77\xbc\
+\x68\xc3\x9f\xd5\x0d\x16\x00\xaa\x62\xf6\x01\x2f\xea\x3b\x73\x21\
+\xce\xde\xd1\x10\x31\x7b\x5b\x51\xa0\xd7\xd0\x11\x99\xce\x9c\x90\
+\xf8\x0d\xdf\xb7\xbe\xec\xe4\x5b\x1e\xb2\x86\xa7\x65\xf6\xb4\x8e\
+\x11\x0d\x12\x84\x2f\x33\xdf\xca\x97\x99\xeb\xcf\x81\xca\xcf\x20\
+\xb2\x08\x40\x5b\x9c\x1f\xdf\x0d\x91\x05\x10\x49\x95\x4d\x9b\xce\
+\x94\x8d\x1b\x9f\x70\xfd\x06\xbf\xa6\x4a\xea\x3b\x36\x09\x8a\xff\
+\xb1\xce\xb1\x9f\xaf\xb8\xdb\x3a\x43\x5d\x3d\x52\xc7\x9f\x03\xc0\
+\xec\x6f\x52\x81\xbf\xb9\x74\x18\x92\x1a\x16\x00\xea\x69\x83\x2f\
+\xf3\x0d\x16\x00\xa1\x84\x76\x6b\x61\x54\xa9\xab\x27\xe7\xa7\xa7\
+\xcf\x4d\xb4\x68\x3b\x12\x55\x3c\x6d\x9c\x60\x9c\x6d\xfb\xf5\xe5\
+\x2d\x99\xf2\xb2\x02\x05\xd6\x39\x00\x00\x8a\xae\x1a\xc0\x92\xb6\
+\xb6\x35\xf0\x60\x64\xd6\x9b\x05\x32\xe3\xcd\xd1\xa8\xde\xd3\x0d\
+\x8a\x9b\xa0\x58\x03\xb7\x8f\x16\xf6\x01\x14\x41\xe4\x37\xa8\xa9\
+\x39\x49\x2a\x2b\xaf\x96\xca\xca\xd5\xd6\xa1\xa2\x29\xa9\xef\xd8\
+\xae\x81\x40\x60\x29\x00\x47\x4e\xea\xd4\x17\xcb\x8a\xb2\xdd\xfb\
+\x19\x2b\x4c\x3f\xb3\xc4\xb3\xfe\xcc\xfe\x56\x4a\x4a\x5a\x3b\x00\
+\xe7\x19\x35\x1f\xf2\x43\xfe\x3f\x1b\xfa\x97\x0d\x16\x00\x2b\x16\
+\xdc\xb4\x0d\x6a\x74\x33\xa0\xa2\xeb\x27\xdb\xb7\x1b\x1d\x98\x50\
+\xdf\x89\x47\x76\x7d\x41\x81\x7f\x5b\xb5\x2f\x82\x51\x2e\x5e\x84\
+\xe3\x01\xb7\xc3\x81\x73\x01\xf6\xd2\x94\x3d\x81\xaa\x27\x5c\xbf\
+\x36\xb8\x25\x64\x76\xd9\x97\x32\x6b\xfd\x83\x32\x6b\x7d\x7f\x84\
+\xf4\x14\x28\x6e\x02\x64\x05\xac\x4f\x66\xdc\xab\x0a\xc0\x73\x10\
+\xf9\x0d\x02\x81\x93\x65\xe3\xc6\x01\x52\x59\x39\x5b\xde\x7f\xff\
+\x2b\xeb\x60\x31\x20\x5e\x20\xf0\x88\x02\xae\x9c\x55\xe2\x7b\x22\
+\xbf\xb5\x0e\x51\x57\xef\xc1\xd7\x74\x86\x8a\xe5\x0e\xa6\x2f\x8e\
+\x47\xb7\x02\xc3\xf6\x0f\x10\x3a\xe6\xa8\xbe\x00\x8c\x5e\x4e\xf4\
+\xcd\xf2\xb5\x8f\x6e\x6f\xe8\xdf\x36\xbe\x7a\x55\xec\xd6\x01\xb8\
+\x34\x0d\x90\x95\x35\xb1\xc6\x33\x9c\x06\x00\x70\x84\x74\xe9\x62\
+\xb9\x9d\x26\xa2\x65\x39\x19\xaf\x41\x74\xa1\x75\x8e\x5a\x2e\x1b\
+\x36\x22\xb3\x4d\x5c\x18\xd4\x52\xf2\xe0\x5b\x1f\xca\xac\xf5\x0f\
+\xca\xcc\x37\x2f\x02\x3a\x1d\x0d\xd1\x9f\x43\x35\x08\xc5\x2a\x00\
+\xdb\xe2\x10\x61\x1b\x54\x57\x42\xf5\x2e\x00\xe7\x23\x1c\x3e\x5a\
+\x36\x6e\xbc\x58\x2a\x2b\x67\x4b\x45\xc5\x47\x71\x68\xdf\x4c\x8f\
+\xfe\xe3\x27\xc1\xf2\x54\xbb\xfa\x9e\x2a\x5e\x9d\x6d\x76\x66\x4b\
+\x43\xaa\x77\x75\x48\x83\xe5\x08\x89\xe8\x52\x97\x86\xff\x3d\x55\
+\xbb\xbe\x4c\x1a\x9f\xca\x4f\x68\xf4\x9b\x55\x0b\x21\x56\x7b\x5c\
+\xe5\x02\x00\x77\xda\xb4\x5d\x9f\x42\x9f\x06\x70\xad\x5d\x00\xbd\
+\x11\x7b\xb7\x1c\x39\xc5\x0f\x25\x4c\xf1\x02\xe1\x4b\x61\x7f\x06\
+\xfa\x5e\x82\xe9\x43\x47\x65\x6e\xca\x5f\x34\xc9\x72\xf7\x46\x5c\
+\xc8\xcc\x57\x77\x01\x78\x71\xdf\xff\xa0\x80\x60\x52\xef\x53\x11\
+\xf6\x7a\x03\x7e\x0a\xc4\xfb\x0f\xa8\x7f\x2a\x20\x27\x03\x38\x01\
+\x4d\xff\x50\xde\x86\xbd\xb7\x3f\xbe\x0f\xe0\x3d\x88\x6c\x02\x50\
+\x8c\x40\xe0\xed\xb6\xbc\x6d\xaf\x35\x7a\xf4\x4f\xbf\x18\xa2\xf7\
+\x5a\xe7\xa8\xa5\x2a\x80\x90\x73\x2b\xff\x01\x00\x82\xeb\x2d\x9b\
+\x57\xf5\x72\x2d\xdb\xaf\x4f\x06\x5b\x0d\x94\xaa\x36\x3c\xff\x0f\
+\x00\x8d\x0e\x97\x5e\xf6\xcb\x7b\x8e\x0e\x57\x27\x7e\x06\x9b\x7d\
+\xae\x7e\x4d\xb8\xe6\x84\x15\xb9\x77\x7c\x6e\xd0\x76\x3d\xe9\xe9\
+\x73\x13\x3f\xdd\xb6\x6d\x0b\x00\xb3\x7d\xe7\x02\x1d\xb0\x2c\x67\
+\xb2\x13\xab\xef\x6b\x1b\x36\x72\xfa\x1f\xe1\x50\xb1\x06\x60\x97\
+\x00\x3f\x5b\x96\x93\x71\xe8\xac\xa4\x8f\x02\x4d\xef\x93\x88\x23\
+\x77\x1f\x8d\x90\xd7\x09\xe2\x25\x40\xfc\xae\xc8\xdf\xe9\x21\x84\
+\xaf\x91\x90\x10\x42\x75\x75\x15\x8e\x3e\xfa\x4b\x59\xb7\xce\x91\
+\xb3\xd3\xdd\x90\xdc\x6f\x7c\x1f\xf1\x64\x35\x5c\x29\x72\x01\x40\
+\xe5\x0f\xa5\x45\x59\x7f\xb2\x8e\x51\x57\x72\xea\xf8\x54\xf1\xe5\
+\x65\xc3\x08\x5f\x79\x5f\x6e\x3d\xa1\xb8\x38\xb7\xda\x30\xc3\x37\
+\x7a\x9d\x3f\xfe\xf8\x70\x8d\x7c\x82\x83\xf4\xb5\x31\x12\xf6\x6a\
+\xfc\xe3\x8a\x5f\x7d\xa4\xc1\xe9\xeb\x46\x3b\xf6\x67\x9e\xb8\xe3\
+\x4b\x28\xde\x8a\x7e\xae\x26\xf1\x12\xbd\xc4\xf3\x8d\xda\xae\x27\
+\x2b\x6b\x62\x0d\x00\xd3\xbd\xcb\x0a\x71\x72\x78\x5b\x77\xee\xfc\
+\x2b\x80\x0f\xac\x73\xd4\xd2\x51\x81\x67\x2e\x1a\x9d\xe9\xc4\x1e\
+\x6d\x57\x48\xd6\xba\x1a\x99\x5e\xfc\xa9\xcc\x7c\x7b\x93\xcc\x58\
+\x5f\x21\xf7\xbd\xbd\x4e\x2a\x36\xfd\xaf\x6c\xda\x54\x21\x15\x15\
+\x9b\xe4\xbd\xf7\x3e\x65\xe7\x7f\xa0\xe4\xd4\xeb\x4e\x15\x0f\xcf\
+\xc2\xa1\xce\x5f\x81\x0f\x13\x3b\xee\x9a\x61\x9d\x23\x12\xf1\xe5\
+\x66\xe3\x08\x7f\x77\xa5\xf3\x07\x80\x70\x48\x06\xc3\xa6\xf3\x07\
+\xa0\x6f\x34\xd6\xf9\x03\x4d\x78\xb3\x17\xc1\x0b\xd1\x0b\xd4\x3c\
+\x22\xe2\xcc\x3a\x00\x00\x80\xef\x5b\x0f\xc1\x0f\xbf\x74\xc4\xb4\
+\xff\x34\xce\x50\x4f\x7e\x7e\xb0\x0a\x82\x3b\xac\x73\xd4\x71\x62\
+\xa2\xaf\xcf\xa6\xa5\xcd\xf8\xae\x75\x10\x6a\x9b\x92\xcf\xbf\xe1\
+\x68\xf1\xc3\xcb\x01\x39\xc1\x3a\x4b\x6d\xa2\xc8\x78\x6b\xe5\x93\
+\x3b\xad\x73\xd4\xd5\x63\xc0\xc4\x1f\x00\x30\xbd\xa9\xd3\xf3\x64\
+\xbe\x65\xfb\xf5\x89\xe1\x99\x36\xf2\xe2\xc1\xbe\xe2\xa0\x05\x80\
+\x8a\x1e\xf4\x21\xb1\xa2\xd0\xa1\xa9\xa9\xc1\xc6\xd7\x29\xc4\x51\
+\xde\x92\xc9\x05\x00\x2a\x0d\x23\x78\x61\x91\x9b\x0c\xdb\x6f\x50\
+\xde\xa2\x8c\xa7\xc4\xb1\x3b\xef\x15\xe8\xb5\xc7\x0b\xbf\x78\xe9\
+\xb5\x33\xbf\x63\x9d\x85\xda\x96\xd3\x7f\x72\xe3\x11\x52\xb3\xe7\
+\x1f\x30\xdc\xcb\x1e\x89\xaa\xfe\xa3\xb4\x28\x3b\xc7\x3a\x47\x64\
+\xfe\xcd\xb0\x3d\x16\xb9\xa2\xb8\x20\x6b\xad\x61\xfb\x07\xe8\xd3\
+\x27\x3d\x11\xaa\x17\x9b\x05\xf0\x0e\xfe\xf2\x7e\xf0\x02\x60\x47\
+\x55\x21\xec\x0e\x22\x39\xfa\x88\x13\xbb\xfc\xcc\xa8\xed\x08\x44\
+\x45\x31\xdf\x34\x01\x30\xce\xd5\xb7\x5a\x41\x68\x22\x00\xb7\xde\
+\x4c\x04\x3f\xf2\x77\x87\x96\x1f\x6a\x67\x04\x50\xec\xf4\xe9\x93\
+\xde\x29\xb1\xfd\xae\x7c\x40\x7e\x6c\x9d\xa5\x8e\x2a\x5f\xfd\x1b\
+\xac\x43\x44\x72\x46\xbf\x5f\x1f\x05\x60\x8c\x71\x8c\x47\xe1\xcc\
+\xb6\x64\xa0\xaa\xb3\x3f\x08\x76\x6b\xc6\x76\x6f\xdf\xd3\xe5\xa0\
+\xc5\xd0\x41\x0b\x80\xfc\xfc\x60\x95\x02\xaf\x46\x27\x53\x0b\xa8\
+\xff\x0b\xb3\xb6\x23\x08\xfb\x81\xf9\xb0\x3d\xca\xb4\xf3\x1e\x2f\
+\xec\xdc\xc1\x40\x00\xb0\x34\xe7\xb7\xef\xc1\xc1\x53\xc9\x00\xfc\
+\xb4\x3a\x50\xf5\x37\x97\x46\x93\xc8\x4d\xa9\xa9\xc1\x84\xaa\xce\
+\xfa\x0c\x20\x8e\x5d\x4a\x06\xa8\xe0\x4e\x97\x6e\xb7\xab\x2d\x1c\
+\xa8\xf9\x35\x6c\xd7\x49\x84\xfc\x70\xf8\x49\xc3\xf6\xeb\x51\xf5\
+\x0c\xfb\x2e\x5d\xfb\xe1\xab\x33\x0f\x7a\x4e\x48\x53\x87\x6b\xfe\
+\xd1\xca\x34\xad\x20\x97\xbb\xf4\xc1\xfd\x6c\xee\xad\x1f\xa9\x1a\
+\xdf\x32\x25\xb8\x25\x2d\x6d\x86\xd9\x1d\xdb\x8d\xd9\xb6\x65\xe7\
+\x4c\x00\xaf\x5b\xe7\xa8\x4b\x81\x57\x5c\xda\x1b\x4c\x6e\xda\xf7\
+\x3b\xf2\x92\x75\x8e\xba\x54\xb0\xfe\x04\xe9\xf6\x80\x75\x8e\x48\
+\x4e\x4d\xbd\xb6\x83\xaa\x98\x8e\x4c\x28\xf0\x5c\xf9\xda\x47\x3f\
+\xb6\xcc\x50\x5b\x9f\x3e\xe9\x89\x22\x3a\xdc\xaa\x7d\x85\xb7\xa2\
+\x29\x5f\xd7\xa4\x02\xc0\x0b\x04\x9e\x6b\x5d\x9c\x56\x39\xa6\xcb\
+\x09\x5d\xad\x8e\x51\x8c\x48\x20\x8f\x18\x47\x38\xb1\x3a\x10\x9e\
+\x60\x9c\x21\xa2\x82\x82\x60\xc8\xf3\x24\x1d\x80\x4b\x9d\x6d\x30\
+\x2f\x27\xc3\xc5\x91\x09\x72\x50\x69\x61\xf6\x54\x85\x06\xad\x73\
+\xd4\x52\xe3\xa9\xff\x2b\x57\x0b\xd8\x0e\x7e\xbb\x1b\x00\x9c\x64\
+\x99\xc1\x53\x7d\xd4\xb2\xfd\xba\x76\x77\x95\xf3\x01\x98\x4d\xd5\
+\x26\xc0\x6f\x52\x9f\xdd\xa4\x02\x60\xd9\x82\x5b\xdf\x16\x60\x73\
+\xeb\x22\xb5\x9c\x87\xb0\x53\xd3\x00\xdb\xb6\xec\xc8\xc3\xde\x83\
+\x52\xcc\x28\xf0\x5b\x17\x8f\x07\x06\x80\xa5\x0b\x27\xad\x13\x15\
+\x57\xf6\x28\xb3\xf3\xa7\x66\x2b\x2b\x9c\x77\x37\xf6\x1e\x75\xed\
+\x00\xb9\xbb\xa4\xf0\x91\x37\xac\x53\x44\xd2\x7b\xf0\x35\x9d\x05\
+\x9a\x61\x1c\x63\x4b\xc7\x2a\xcf\xf2\x25\xb5\x1e\xdf\xf7\x2d\x4f\
+\x8c\x7c\x77\x43\xe1\xbc\xd2\xa6\x7c\x61\x93\x57\x6c\x2a\xb4\x49\
+\x43\x0a\xb1\x21\x57\xb8\x34\x0d\x50\x50\x10\x0c\x41\x75\x81\x71\
+\x8c\x13\xd0\xa5\x73\xba\x71\x86\x06\x9d\xd9\x63\xc7\x9f\x01\x58\
+\x5f\x52\xc2\xce\x9f\x5a\xac\xb4\x30\x7b\x2a\x8c\x8b\x00\x01\xd6\
+\x96\x1e\xff\xd5\x5f\x2d\x33\x34\xa6\x66\x57\xfb\xeb\x01\x1c\x6f\
+\x1a\x42\xf1\xf8\xba\x75\x59\xce\x9c\x5f\xb1\xaf\xaf\x1a\x66\x97\
+\x40\x9a\x5c\x0c\x35\x63\xcb\x46\xc0\xb0\x00\xc0\xb1\x47\x1c\xd7\
+\xb1\xbf\x61\xfb\xf5\xf9\x9a\x0d\xe3\x15\xa7\xa2\x98\xe2\xea\x28\
+\x40\x30\x18\xf4\x35\x8c\x5f\x21\x3e\xe7\xd3\x47\x8c\xc0\xce\x9f\
+\x5a\xcb\xb8\x08\xf8\xda\xf7\x02\x57\x23\x37\xd7\x72\xd1\x71\x83\
+\x52\x52\xaf\xef\x02\x11\xeb\xb7\x7f\x5f\x15\xd6\x53\xb2\x07\xf8\
+\xd4\xff\x78\x20\x80\x63\xcc\x02\x28\x9a\xdc\x57\x37\xb9\x00\xd8\
+\x9d\xe8\xbf\x08\xc3\xdb\xc7\x44\x2c\x57\x54\xd6\x97\x97\x3b\xa5\
+\x1c\x80\xf5\xb0\xd3\x09\xd2\xa9\xf3\x75\xc6\x19\x1a\x94\x9f\x9b\
+\xf1\xae\x42\xff\xdb\xa0\x69\x76\xfe\x14\x35\x56\x45\x80\x00\x37\
+\x94\x15\x3c\xfc\x5e\xbc\xdb\x6d\x2a\xdf\xaf\xb9\x01\xc0\xb1\x96\
+\x19\x04\xba\xbc\x6c\x4d\x76\x85\x65\x86\xba\x44\xd5\xb2\xaf\xaa\
+\xea\x54\x85\x26\x1f\xc5\xdc\xe4\x02\x60\xe5\x93\x19\x3b\x01\x5d\
+\xd5\xb2\x4c\xad\xa7\xa2\x57\xa4\xa5\x2d\x09\x58\xb5\x1f\x89\x0f\
+\x6f\xa6\x75\x06\x08\x7e\xeb\xf2\x1e\xf7\xfc\x9c\xc9\xf3\x21\x12\
+\xcf\xcb\x39\xd8\xf9\x53\xd4\xc5\x7d\x61\xa0\x62\x51\x49\x61\xb6\
+\xf5\x34\x63\x83\x7a\x0f\xbe\xa6\xb3\x02\xb7\x5a\xe7\x08\x8b\x03\
+\x9f\xc1\xb5\xa5\xa5\x05\x20\xb8\xd4\x30\xc1\xf3\xeb\xd6\x65\x55\
+\x35\xf5\x8b\x9b\x75\x6a\x93\x02\xcf\x34\x3f\x4f\xb4\xc8\xf1\xbb\
+\x02\x1f\xa4\xda\xb5\x5f\xdf\xb3\x39\xb7\xbd\x08\x60\xbd\x71\x8c\
+\x63\xf6\x04\x76\x59\x9f\xbf\xdd\xb8\x9d\xe1\x71\x0a\x34\x69\x51\
+\x4a\x2b\xb1\xf3\xa7\x98\x89\xdb\xc2\x40\x91\xf2\x9a\xea\x0e\xce\
+\x8e\xec\x01\x40\x68\x77\xc7\x0c\x01\x8e\x33\x8e\xf1\x66\xf9\xea\
+\x2c\xcb\x8b\x87\xea\x49\xf9\xfc\xbb\x83\x60\x3a\x2a\xa2\xcd\xba\
+\x05\xb5\x59\x05\x40\x42\xbb\x50\x3e\x0c\xb7\x77\x09\xfc\xb1\x56\
+\x6d\x37\x44\xa1\xb3\xac\x33\x00\x3a\x65\xd8\xc8\xa9\xa6\xdb\x70\
+\x1a\x93\x97\x37\x65\xbb\x84\xfd\xcb\x10\xdb\xf5\x00\xec\xfc\x29\
+\xe6\xe2\x30\x1d\xb0\xc3\xf3\xe5\xf2\xca\xd7\x1e\xb4\x5a\x3b\x73\
+\x50\xdd\x07\x5e\xd7\x4d\xa1\x93\xac\x73\x40\xe0\xdc\x85\x48\x61\
+\xf5\x2d\x0f\x69\xab\x49\xf0\x13\xf3\x9b\xf3\x0d\xcd\x2a\x00\x9e\
+\x79\xe2\x8e\x2f\x21\x62\x76\x1d\xad\x00\x97\x5f\x3c\xfa\x5e\xb3\
+\xeb\x78\x23\xe9\x10\xae\x5a\x08\xe0\x13\xe3\x18\x5d\x54\xbc\x3f\
+\x1b\x67\x68\x54\x5e\xee\x94\x72\x81\xc6\x6a\xd7\x02\x3b\x7f\x8a\
+\x9b\x18\x16\x01\x2a\x22\x63\x8b\x8b\xe6\x96\xc4\xe0\xd9\x51\xe3\
+\x85\xc2\x53\x61\x7f\x3b\xe2\xc7\xde\x17\x5b\x17\x1b\x67\x38\x40\
+\xf2\xf9\x37\x1c\x2d\x6a\x7a\x19\x52\xc1\xdb\x6b\xe6\x7c\xd5\x9c\
+\x6f\x68\xf6\xc5\x0d\x0a\xdf\x70\x1a\x00\x1d\x12\xfc\xc0\x68\xc3\
+\xf6\xeb\xc9\xcd\x0d\x56\x03\x98\x63\x9d\x43\x14\x63\x86\x8d\x9c\
+\xea\xda\xd9\xe5\x07\x58\x96\x33\x79\xb1\x42\xa3\x3d\x67\xc7\xce\
+\x9f\xe2\x2e\x26\x45\x80\x48\x66\xc9\xea\xac\x78\xae\x97\x69\xb6\
+\x9e\xfd\xd2\x7f\x22\x80\xf9\x67\xb0\x2a\xfe\xc7\xa5\x6b\x7f\x01\
+\x40\xaa\x6b\x7e\x09\xa0\xbd\x5d\x00\x69\x76\xdf\xdc\xec\x02\xc0\
+\xd3\xc0\x52\x18\x6e\x7f\x53\x95\xf1\x56\x6d\x37\xa4\x7d\x38\x30\
+\x1b\x40\x93\x17\x5e\xc4\x88\x07\x78\xf7\x03\x6a\x74\xf7\x74\xd3\
+\x9c\x78\xc4\x91\x53\x20\x28\x8c\xd2\xe3\xd8\xf9\x93\x99\xa8\x2e\
+\x0c\x54\x14\x1c\x2f\x27\xb9\x76\xa5\x76\x5d\xa2\xa2\x99\x30\xbb\
+\xdf\xfe\x1b\x55\x68\xd7\x2e\xcb\x38\x43\x7d\xa2\xbf\x32\x6c\xdd\
+\x87\x8f\x66\xcd\xff\x03\x2d\x28\x00\x96\xe5\xdc\xf6\x01\x00\xbb\
+\x2b\x17\x05\x3f\x1a\x36\xf2\xbe\x33\xcd\xda\x8f\x20\x37\xf7\xd6\
+\x7f\x03\xfa\x94\x75\x0e\x00\x3f\x1d\x3a\x6a\xfa\xe5\xd6\x21\x1a\
+\x93\x95\x35\xb1\x26\x90\x58\x73\x39\x80\xd6\x6e\xdd\x61\xe7\x4f\
+\xe6\xa2\xb2\x30\x50\xb1\xb1\x06\xa1\x2b\x5d\x3d\xea\x77\xbf\x1e\
+\x03\xc6\x5f\x09\x41\x3f\xeb\x1c\x50\x7d\xbc\xec\xc5\xd9\x5f\x5a\
+\xc7\xa8\x2d\xa5\xff\xb8\xff\x02\x70\x86\x55\xfb\x02\xac\x2e\x2d\
+\xca\x6a\xf6\x54\x74\xcb\xee\x6e\x56\x18\xcf\xbd\xa8\x73\xb7\xe1\
+\x79\x8a\x69\x00\xcc\x4f\xa3\x12\xc5\xb4\x21\x43\x1e\xb0\x1b\x86\
+\x6a\x82\x67\x9e\xb8\xe3\xcb\xb0\x97\x30\x04\xc0\x67\x2d\x7c\x04\
+\x3b\x7f\x72\x46\xeb\xa6\x03\xf4\x4b\x88\x37\xa4\xb2\xe8\xb1\xcf\
+\xa3\x1a\x2a\xca\xbe\x77\xee\x2d\x1d\xa1\x32\xd5\x3a\x07\x80\x1a\
+\x0d\x24\x4c\xb3\x0e\x51\x57\x58\x3c\xe3\x05\xea\xd2\xa2\x3e\xb9\
+\x45\x05\x40\x8d\x5f\xb3\x18\xa6\x97\xbd\xe8\xd5\xae\x9d\x80\xb7\
+\x74\xf1\xe4\x8d\x80\x38\x70\x1d\xa5\x9c\x96\x78\xe4\x1e\x47\xce\
+\x30\x6f\xd8\xf2\x85\xb7\x6c\xf2\x3c\x7f\x28\x9a\x3f\x75\xc2\xce\
+\x9f\x9c\xd3\xc2\x22\x60\xb7\x42\x86\x95\x16\xce\x7d\x27\x16\x99\
+\xa2\xa9\x6b\xe2\xf6\xdf\x41\x70\x8a\x75\x0e\x81\x3c\xe6\xda\xe1\
+\x48\xdf\x3b\xf7\x96\x8e\x02\x8c\x30\x8c\x10\x4a\x08\x79\x2d\x5a\
+\x9b\xd7\xa2\x02\x60\x45\xee\x1d\x9f\x03\x6a\xb9\xff\xf2\x48\xe9\
+\xd4\xe5\x32\xc3\xf6\x23\x0a\x79\xf8\x23\x00\x17\x16\xa6\xdc\x31\
+\x3c\x2d\xb3\xa7\x75\x88\x83\x59\xba\x70\xca\xbf\xa0\x7a\x2d\x00\
+\xbf\x89\xdf\xc2\xce\x9f\x9c\xd5\xcc\x22\x40\x15\x32\xae\xac\x30\
+\xfb\x95\x58\x66\x8a\x86\x1e\xa9\xe3\x7a\x01\xe6\x47\xfe\x02\x40\
+\x4d\x18\xbe\x73\xf7\x22\x74\x4d\xdc\x9e\x06\xe0\x3b\x86\x11\x56\
+\xbd\xf5\xca\xc3\x2d\x1a\x4d\x6d\xd9\x14\x00\x00\x6d\xe1\x90\x43\
+\xd4\x78\x70\x6e\x1a\xe0\xb9\x85\x93\x36\xab\xea\x13\xd6\x39\x00\
+\xb4\xd3\x80\xff\x48\x30\x18\x6c\xf1\x7f\xdf\x78\xc9\x5b\x3c\x39\
+\x17\xda\xa4\x0f\x4d\x76\xfe\xe4\xbc\xa6\x2e\x0c\x54\xc1\xa4\xb2\
+\xc2\xac\x85\x71\x88\xd4\x4a\x41\x4f\x7c\xef\x61\x00\xed\xac\x93\
+\x00\x78\xa4\xbc\x70\xde\xbb\xd6\x21\x22\x30\xed\x8b\x5a\xd3\x17\
+\xb7\xb8\x83\xf0\xbd\xd0\xdf\x01\xec\x6e\xe9\xf7\xb7\x9a\x6a\xea\
+\x25\xa3\xa7\xfd\xc0\xac\xfd\x86\xf8\xfe\x9f\xe0\xc4\x28\x80\x9c\
+\xf3\x46\x79\xe7\x09\xd6\x29\x9a\x22\x6f\x71\xc6\x74\x15\xfc\xa5\
+\x91\x2f\x61\xe7\x4f\x6d\xc6\xc1\x16\x06\x8a\xe2\x8f\x65\xab\xb3\
+\x9d\x3b\xc4\x26\x92\xe4\xfe\x1f\x5f\xaf\x40\x5f\xeb\x1c\x00\xaa\
+\xd5\x0b\xb8\xb0\x06\xe1\x00\x49\x7d\xc7\x26\x01\x62\x79\x51\xdd\
+\xae\xea\x76\xcd\x5f\xfd\xbf\x5f\x8b\x0b\x80\xe5\x0b\x7f\xfb\x15\
+\x44\x9a\x75\xea\x50\x94\x89\xe7\xcb\x4d\x86\xed\x47\x94\x9f\x7b\
+\xfb\xfb\xaa\x78\xcc\x3a\x07\x00\xa8\x62\xda\x25\x69\x33\xba\x59\
+\xe7\x68\x8a\xfc\x45\x19\xbf\x17\x20\x33\xc2\xbf\x62\xe7\x4f\x6d\
+\x4e\x43\xd3\x01\xaa\x78\xb0\xa4\x28\xfb\x2e\x83\x48\xcd\x96\xd4\
+\x77\xec\x49\x22\xfa\x27\xeb\x1c\x7b\x49\xb6\x6b\x73\xff\x00\xe0\
+\x05\x02\x37\xc3\x72\x5b\xa4\x62\xe9\xa6\x17\xb2\xbe\x6e\xe9\xb7\
+\xb7\x6e\x88\x58\xf5\xf1\x56\x7d\x7f\xeb\x8d\xbd\xec\x97\xf7\x1c\
+\x6d\x9c\xa1\x1e\x4f\xbc\xbf\x00\xd8\x63\x9d\x03\xc0\x11\x01\x2f\
+\x7c\xbf\x75\x88\xa6\x5a\x96\x33\x69\x32\xa0\xb5\xf7\xf7\xb2\xf3\
+\xa7\x36\xab\x6e\x11\x20\x82\xf9\x65\x45\xd9\x16\xb7\x63\xb6\x88\
+\x97\x10\x98\x0d\xdb\xb9\xed\xfd\xf6\xd4\x78\xee\xcd\xfd\xa7\x9c\
+\x3b\xee\xbb\x00\xae\xb1\xcc\xa0\x40\xab\xfa\xe0\x56\x15\x00\xdb\
+\x3e\xdd\xf9\x3c\x80\x4f\x5b\xf3\x8c\x56\xea\x14\xaa\x4e\x74\xee\
+\x60\xa0\x7d\x67\x25\x3c\x6a\x9d\x03\x00\x54\x70\xc5\xf0\x91\xd3\
+\x9d\x5b\x30\x19\x99\xe8\x59\xc9\x55\xbf\x56\x60\x21\xd8\xf9\xd3\
+\x21\x60\x7f\x11\x20\xc0\xdf\x4a\x8e\xdb\x3a\x1e\x86\x87\xa8\x35\
+\x47\x4a\xff\xf1\xbf\x80\x9a\xde\x6a\xf7\x0d\x01\xb2\x2b\x0b\xe6\
+\x7d\x68\x9d\xa3\x2e\x3f\x31\xf0\x6b\xd8\x1e\x89\xfc\x71\xd9\x09\
+\x5b\x5f\x68\xcd\x03\x5a\x3d\x74\x31\x6c\xd4\xf4\xfb\xa0\xa6\xd7\
+\x42\x7e\xd4\x3e\xbc\xf3\xb4\x7d\x47\xf2\x3a\xe3\x92\xb4\x19\xdd\
+\xbc\x40\xb8\x1c\xf6\x67\x66\x03\xc0\xe7\xa1\xb0\xf6\x7e\x2e\x77\
+\xb2\x65\xb1\xd6\x64\xc1\x60\xd0\x0b\x06\x83\x4d\xdd\x19\x40\xd4\
+\x06\x04\x3d\xa0\x6d\xfc\x4e\x27\xf5\x1d\x7b\x92\x17\x08\xac\x07\
+\x70\x8c\x75\x16\x00\x3b\xa0\xd2\xbd\x25\x87\xdc\xc4\x52\x9f\x3e\
+\xe9\x89\x3b\x3b\xeb\x26\x01\xbe\x67\x16\x42\x31\xad\xb4\x28\x7b\
+\x4a\x6b\x1e\xd1\xea\x55\xe2\x61\xdf\x7c\xbe\xbb\x5b\x75\xa0\xf3\
+\x2f\x8c\x33\xd4\xf3\x6c\xee\xad\x1f\x89\x8a\x2b\x07\x56\x1c\x9b\
+\xe0\xc9\x7c\xd7\x8f\x09\xde\x8f\x9d\x3f\x1d\x7a\xda\xcc\xef\xb4\
+\x78\x81\x40\x36\xdc\xe8\xfc\x21\xa2\xf7\xba\xd6\xf9\x03\xc0\xce\
+\xce\x18\x6d\xda\xf9\x03\x50\x91\x56\x9f\x3e\xdb\xea\x02\x60\xf9\
+\xe2\x8c\x0d\x00\xfe\xaf\xb5\xcf\x69\x0d\x05\x6e\xb1\x6c\xbf\x21\
+\xed\x7c\x6f\xba\x00\x9b\xad\x73\x00\x00\x04\x17\x0c\x1f\x39\xfd\
+\x7a\xeb\x18\x44\xe4\xae\x1e\xfd\xc7\xff\x37\x80\x8b\xac\x73\xec\
+\x25\x1f\x74\xdc\xe1\x39\x70\xdd\x7a\x7d\x02\xbd\xd9\x38\xc2\x6b\
+\x65\x85\x59\x6f\xb7\xf6\x21\xd1\xda\x27\x6e\x7d\x31\xc3\x8f\x87\
+\x5d\x99\x39\xc0\x38\x43\x3d\xb9\xb9\xb7\xee\x52\x95\xdf\x59\xe7\
+\xd8\x4f\x21\x99\xc3\xaf\x9a\x61\x76\x5e\x35\x11\xb9\xab\x67\xdf\
+\x09\x29\x10\xb9\xc7\x3a\xc7\xb7\xfc\x8c\x75\xeb\xb2\xac\x2f\x59\
+\xab\xa7\x67\xff\x89\xe7\x03\xf8\x91\x65\x06\x89\x52\x9f\x1b\x95\
+\x02\xa0\x7d\xb8\xd3\x22\x00\xdb\xa2\xf1\xac\x96\x12\xf1\x9d\x1c\
+\x05\xc8\x5b\x7c\xdb\x42\x58\x5e\x9e\x74\xa0\x0e\x1a\x0e\x3f\x9e\
+\x96\x16\x74\xe1\x50\x0f\x22\x72\xc4\xe9\x43\x6e\x6c\xef\x27\x60\
+\x01\x80\x8e\xd6\x59\xf6\xf9\x67\x69\xe1\xbc\x25\xd6\x21\x22\x51\
+\xfb\xbe\xe6\xeb\x84\x0e\xbb\xa3\x72\x10\x5f\x54\x0a\x80\xdc\xdc\
+\x1b\x76\x00\x6a\x7a\xaa\x95\x8a\x0c\x1b\x96\x36\xe3\x74\xcb\x0c\
+\x91\x89\xaa\x7a\x93\xe0\xce\xea\xdf\x33\xf7\x78\x5d\x1c\xd9\xdb\
+\x4b\x44\x2e\x48\xdc\xb9\xe7\xaf\xa2\xf8\xa1\x75\x8e\x7d\xd4\x57\
+\xdf\xa5\xcf\xcc\x6f\x24\xf7\x9b\xd0\x1d\xc0\x10\xe3\x18\x0b\xde\
+\x5a\xf9\xe4\xce\x68\x3c\x28\x8a\x47\xc5\x06\xac\xa7\x01\x3c\x04\
+\x7c\xeb\x79\x99\x88\xf2\x17\xdf\xf6\x4f\x88\xf5\x0d\x8a\xb5\x88\
+\x4e\x1a\x3a\x22\xd3\xfa\x97\x98\x88\x1c\x90\x7c\xde\xb8\xa1\x80\
+\x3a\x73\x3e\x81\x02\x0b\xcb\x8b\x1e\x71\x65\xd4\xf4\x00\x9e\x27\
+\xb7\x21\xaa\xfd\x66\x4b\x32\x20\x3b\x6a\xcf\x8a\xd6\x83\xf2\x72\
+\x6e\x7b\x43\x21\xff\x8a\xd6\xf3\x5a\x46\xc7\x5d\x7e\xd5\x54\xd3\
+\x95\x99\x0d\x49\xf0\xfc\x0c\x34\xff\xe6\xbb\x58\xf1\x44\x74\xc1\
+\xc5\xa3\x67\x9e\x66\x1d\x84\x88\xec\xa4\xa4\x8e\x3b\x5d\xd4\x7b\
+\x02\x96\xa7\xd9\x1d\x68\x57\xc0\x97\x3b\xac\x43\x44\xd2\x63\xe0\
+\xb8\x53\x14\x7a\xad\x71\x8c\x7f\x15\x17\x64\xbf\x19\xad\x87\x45\
+\xb5\x92\x11\xc1\x43\xd1\x7c\x5e\x0b\x74\x08\x85\x03\x4e\x5e\x85\
+\xfb\xf7\x05\x53\x3e\x04\x30\xdd\x3a\x47\x2d\x47\x05\xfc\xd0\xd3\
+\x69\x69\x33\x5c\x99\xf3\x23\xa2\x38\xea\xd3\x27\xbd\x93\xef\x7b\
+\x7f\x83\x1b\xa7\xfd\xed\xa5\x72\x6f\xf1\x9a\xac\xf7\xad\x63\x44\
+\x54\xe3\xfd\x0e\xe6\x97\x22\xe9\xec\x68\x3e\x2d\xaa\x05\x40\xcd\
+\xd6\x76\x39\x80\x6e\x89\xe6\x33\x9b\x4f\x27\x5c\x3a\xf2\xde\x53\
+\x6d\x33\x44\x56\xf3\x75\xfb\x7b\x21\x28\xb1\xce\x51\xcb\x99\x7b\
+\x02\x61\xeb\xa9\x1b\x22\x32\xb0\xab\x8b\xce\x06\xd0\xdb\x3a\xc7\
+\x37\x44\xca\x6b\xba\xb4\x77\xe5\xec\x94\x03\xf4\x18\x38\xee\x14\
+\x08\xc6\x58\x66\x50\xe0\xb3\x5d\x5e\x28\xaa\x0b\x23\xa3\x5a\x00\
+\xac\x58\x71\xd3\x1e\x20\x7a\xf3\x13\x2d\xd4\xce\x47\xa0\x55\xa7\
+\x23\xc5\xca\x8a\x15\x37\xed\x11\xd5\xeb\xe0\xd6\xe2\x96\xab\x87\
+\x8d\xcc\xbc\xce\x3a\x04\x11\xc5\x4f\x72\xff\xf4\xdf\xa8\xe2\x5a\
+\xeb\x1c\xb5\xf8\x9e\x60\x7c\xe5\x8a\x07\x5d\xb8\x43\xa5\xbe\x90\
+\x77\x27\x8c\xdf\xfe\x3d\xc8\x9c\xf7\x0a\xe6\x47\xf5\x06\xde\x18\
+\x2c\x66\xd0\x39\x00\x6a\xa2\xff\xdc\xe6\x90\x71\x43\xd3\xa6\xff\
+\x87\x6d\x86\xc8\x96\xe5\x4c\x2e\x02\x30\xcf\x3a\xc7\x81\xf4\x81\
+\x61\x57\x4e\x73\xe1\xca\x4f\x22\x8a\xb1\x1e\xa9\xe3\xcf\x11\xd1\
+\xfb\xac\x73\xd4\x91\x55\x5c\x90\xb5\xc6\x3a\x44\x24\xc9\xa9\xd7\
+\x9d\x0a\xe3\x4b\x7f\x00\xd4\x84\x12\xbc\xa8\xbf\x5c\x47\xbd\x00\
+\xc8\xcb\x99\xf2\x31\x04\x7f\x8b\xf6\x73\x9b\x29\x51\x02\xea\xe4\
+\x5a\x00\x00\xf0\x3a\x24\x4c\x06\xe0\xd2\xf1\x96\x89\xf0\x64\xd1\
+\xe5\x57\xcf\x3c\xd1\x3a\x08\x11\xc5\x4e\x52\xdf\xb1\x27\xc1\x97\
+\xa7\x61\x3e\x97\x7d\x80\x8f\xf7\xb4\x13\x77\x3f\xaf\x35\x7c\x17\
+\x8c\x7f\x5e\x0a\x2c\xa9\x78\xe9\xe1\x8f\xa2\xfd\xdc\x98\x6c\x67\
+\xf0\x81\x07\x62\xf1\xdc\xe6\x91\x5f\xb9\x3a\x0a\xb0\x74\xfe\x2d\
+\x5b\xa1\xee\x6c\xbb\xd9\xe7\xfb\xa1\x50\xe8\xd9\xb4\xb4\xd9\x5d\
+\xac\x83\x10\x51\xf4\xf5\xe9\x93\xde\xc9\x0b\x04\x9e\x01\xd0\xcd\
+\x3a\x4b\x6d\xaa\xb8\xa9\x35\x77\xda\xc7\x52\x4a\xea\xb8\xd3\x55\
+\x71\xb5\x75\x0e\xcf\x97\x07\x63\xf2\xdc\x58\x3c\xf4\xd9\x45\x19\
+\xaf\x02\x78\x25\x16\xcf\x6e\x86\x44\x09\xc0\x99\x63\x78\xeb\xca\
+\x5b\x3c\x39\x17\xc0\x32\xeb\x1c\x75\x9c\xb5\xdb\xab\x5a\x9c\x96\
+\xb6\x24\x60\x1d\x84\x88\xa2\x28\x2d\x2d\xdd\x94\x3a\x78\x00\x00\
+\x13\x2c\x49\x44\x41\x54\x50\xd5\x59\x17\x02\xf8\x2f\xeb\x28\x75\
+\x3c\x57\x56\x94\x6d\x3d\x62\xdc\x20\xdf\xf7\xee\x04\x90\x60\x9b\
+\x42\x0b\x4b\xd6\x64\xbd\x16\x8b\x27\xc7\xec\x40\x03\x15\x71\x61\
+\xcb\xdb\x2f\x5d\xde\xeb\x2e\xf0\x6e\x84\x60\xbb\x75\x8e\xda\x44\
+\x70\xd1\x6e\x6f\x73\x54\xb7\x9a\x10\x91\xad\x9e\x5b\xbe\x33\x0b\
+\xc0\x70\xeb\x1c\x75\x6c\x0f\x20\xe4\xec\x02\xe4\x94\xd4\x71\xa7\
+\x03\x18\x6d\x9d\x43\xfd\xd8\xf5\xa5\x31\x2b\x00\xfa\x24\xed\xc8\
+\x83\xa0\x3c\x56\xcf\x6f\xa2\xc4\x80\x1f\xba\xdb\x38\x43\x83\x96\
+\xe5\xdc\xf6\x01\x54\x26\x5b\xe7\xa8\x4b\x04\x13\x87\x8d\xc8\x74\
+\x6d\x8a\x82\x88\x5a\x20\xf9\xbc\x09\xb7\x2a\xf0\x1b\xeb\x1c\x75\
+\x09\x24\x63\x43\xe1\x63\x1f\x58\xe7\x68\x88\xaf\xde\x9f\x60\xfe\
+\xf6\x8f\xd2\xb2\x35\xd9\xcb\x63\xf5\xf0\x98\x15\x00\xc1\x60\xd0\
+\x87\xca\x8c\x58\x3d\xbf\x19\xae\xba\x74\xf4\x54\xd7\x86\xbd\xbe\
+\x91\x97\x33\xe9\x61\x55\xe4\x5b\xe7\xa8\x47\x74\xc6\xd0\x51\x99\
+\x97\x5a\xc7\x20\xa2\x96\x4b\xee\x37\xe1\x12\x51\xb8\xb8\xb7\x7e\
+\x45\x49\x61\x96\xb3\x67\x90\xf4\x48\x1d\x7f\x0e\x14\x23\xac\x73\
+\x08\x90\x89\x18\x6e\x1b\x8f\xe9\x99\xc6\x35\x5f\xb7\x7b\x1c\xf6\
+\xab\xdd\x45\x7d\x6f\x16\xa0\xae\x1c\x75\x59\x4f\x42\x3b\x8c\xb7\
+\x3f\x40\xa9\x1e\x4f\x54\x9f\x1a\x3e\x72\xfa\x4f\xac\x83\x10\x51\
+\xf3\x25\x9f\x37\xf1\x5c\xf1\xb0\x18\x80\x6b\x6b\x7a\xb6\x24\x86\
+\x02\xd7\xc2\xad\xf3\x50\x6a\x13\xf1\x25\x13\xf6\xc7\x23\x6f\xa9\
+\xf2\x6a\x62\x7a\xc9\x5e\x4c\x0b\x80\x15\x2b\x6e\xda\x03\x41\x4c\
+\x56\x2f\x36\x87\x02\xe7\x0e\x1d\x95\x99\x66\x9d\xa3\x21\xcf\x3c\
+\x99\xf1\x19\x04\xd7\xc2\xbd\x3f\x88\xce\x0a\x3c\x3f\x74\xc4\xb4\
+\xb3\xac\x83\x10\x51\xd3\x25\xf5\x1f\xdf\x5b\xd4\x7f\x16\x40\x27\
+\xeb\x2c\x75\xa8\xfa\x18\xff\xd6\x2b\x0f\x7f\x66\x1d\xa4\x21\xc9\
+\x03\xd2\x47\x29\x60\x7f\x2e\x8a\xc8\x8c\x68\x1f\xfc\x53\x57\xcc\
+\x6f\x35\xaa\xf1\xda\xcf\x06\xf0\x55\xac\xdb\x39\x18\x51\x64\x0e\
+\x1d\x1a\x74\xed\x8f\xe1\x1b\x79\x8b\x26\xff\x03\xc0\xc3\xd6\x39\
+\x22\x38\x52\x44\xfe\x31\x3c\x2d\xb3\xa7\x75\x10\x22\x3a\xb8\xe4\
+\x7e\x13\xba\x7b\x22\x2b\x01\x7c\xd7\x3a\x4b\x7d\xf2\x50\xd9\x9a\
+\xec\x67\xad\x53\x34\xe4\x7b\xe7\xde\xd2\x51\x54\xef\xb1\xce\x01\
+\xe8\x97\x7e\x28\x34\x27\xd6\xad\xc4\xbc\x00\x58\xb1\xe0\xa6\x6d\
+\x70\xe2\x5c\x00\x7c\x5f\xba\x74\x76\x7a\x61\xdb\xb6\x0e\x3b\x6f\
+\x15\x60\x83\x75\x8e\x08\x8e\xd5\x80\xae\x74\x79\x47\x05\x11\x01\
+\x29\xfd\xd2\x4f\x16\x0f\xab\x00\x1c\x6f\x9d\x25\x82\xd2\x4e\x3b\
+\xe1\xdc\xa2\xe7\xda\xba\xb4\xdb\x91\x01\xc1\x29\xd6\x39\x00\x6f\
+\x66\xf9\xda\x47\x63\xbe\x43\x2c\x2e\xf7\x1a\xb7\x0f\x87\x67\x42\
+\xb1\x35\x1e\x6d\x35\x4a\x71\x87\xcb\xa7\xdd\x15\xcc\x0f\xee\xf6\
+\x55\xc7\x00\xa8\xb6\xce\x12\x41\xb7\x80\x1f\x7a\xf9\xa2\xd1\x99\
+\x0e\xfc\x71\x10\x51\x5d\xdd\x07\x5e\xd7\xcd\xf7\xb4\x00\xc0\xc9\
+\xd6\x59\x22\xa8\xf1\x04\x63\xd6\xad\xcb\x72\xe5\x4a\xf4\x7a\xba\
+\x0f\xbc\xae\x9b\xa8\x13\x05\xca\xd7\xed\xbd\xea\xb8\x6c\xc5\x8e\
+\x4b\x01\x90\x9b\x7b\xfb\xd7\x10\xc4\x7c\x38\xa3\x09\xba\xd4\xd4\
+\xd4\xfc\xd1\x3a\x44\x63\xf2\x17\x4f\x7e\x5d\x54\xef\xb2\xce\xd1\
+\x80\x93\x13\x7c\xfd\xc7\x65\xd7\x4c\x3f\xce\x3a\x08\x11\x7d\xab\
+\xf7\x4f\xaf\x3b\x2e\x21\x14\x7e\x01\x80\x93\xa7\x9f\x42\xe4\xf7\
+\xc5\xab\xb3\xff\xd7\x3a\x46\x63\x02\xa1\xf0\x3d\x00\x3a\x5b\xe7\
+\x10\xc8\xac\x37\x0b\xe6\xc7\xe5\x85\x39\x2e\x05\x00\x00\xa8\xc8\
+\x0c\x00\x3b\xe3\xd5\x5e\x43\x44\xe4\x57\x97\x8c\xb8\xef\x87\xd6\
+\x39\x1a\x73\x66\x8f\xaa\x69\x00\x56\x58\xe7\x68\x40\x72\xb8\x5a\
+\xaf\xb0\x0e\x41\x44\xdf\xaa\x49\xf4\xaf\x50\x20\xd9\x3a\x47\x03\
+\x96\x97\xae\x3e\x29\xd3\x3a\x44\x63\x92\xfb\x8d\xef\x03\xd8\x1f\
+\xf9\x0b\x60\x9b\xd4\x84\xe3\x36\x65\x1e\xb7\x02\x20\x7f\xd1\xa4\
+\x2f\xe0\xc6\x5a\x80\x80\x27\xbe\x0b\xe7\x13\x34\x28\x18\x0c\xfa\
+\x61\x2f\x74\x15\x80\x8d\xd6\x59\x22\x08\xe6\x2d\x9e\xec\xc2\x68\
+\x0e\x11\xed\x53\xba\x3a\x6b\x0e\x00\x17\x2f\xd4\x79\x4f\x13\xdb\
+\x8d\x01\x82\xbe\x75\x90\x46\x88\x78\x32\x13\x71\xec\x0f\x1b\x0c\
+\xa2\x98\x55\xfc\xea\x23\xff\x8e\x57\x7b\x71\xfd\x3f\xec\x75\x48\
+\x98\x06\x07\x76\x04\x00\x18\x38\x74\x54\xe6\x28\xeb\x10\x8d\x59\
+\xbe\xf0\xb7\x5f\x41\x70\x39\x00\x97\xe6\xcc\x82\x79\x39\x19\xce\
+\x9e\xac\x48\x74\x38\x2b\x2d\xcc\x9e\x0a\xb7\x8a\x80\xdd\x50\xb9\
+\xa2\xec\xc5\xd9\x5f\x5a\x07\x69\x4c\xf2\x80\xf4\x5f\x02\xe8\x6f\
+\x9d\x03\xc0\xd6\x80\x26\xcc\x8a\x67\x83\x71\x3d\x20\xa2\xec\xcd\
+\xe7\x77\x27\xf5\xba\x20\x11\xc0\xc0\x78\xb6\x1b\x89\x00\xe7\x9d\
+\xd6\xe3\x67\xf3\x2b\x4b\x5e\x74\xa9\x83\x3d\x40\xf9\x86\x55\x5b\
+\x92\x52\x2e\xd8\xbc\xaf\x10\xb0\xc6\xce\x9f\xc8\x71\x5f\x6c\x7e\
+\x7d\xed\xb1\xa7\xf4\xd9\x0d\xe0\xe7\xd6\x59\x44\x34\xbd\xb4\x30\
+\xdb\xd5\xa9\x4c\x00\x40\xf2\xf9\x37\x1c\x2d\x7e\x78\x19\x1c\x98\
+\xfb\x07\x10\x2c\x2e\x9a\xfb\x42\x3c\x1b\x8c\xfb\x90\x47\xfb\x70\
+\xc7\x59\x8e\x9c\x7a\x77\x4c\x42\x42\xe2\x54\xeb\x10\x07\x93\xb7\
+\x78\xd2\x02\x40\xad\xcf\x07\x60\xe7\x4f\xd4\x46\x38\x32\x12\xf0\
+\x50\xc9\xea\x79\x8f\x19\x67\x38\x28\x09\xd5\xcc\x02\x70\xac\x75\
+\x0e\x00\x9f\x7b\x5e\x62\xdc\x2f\x61\x8b\x7b\x01\x90\x9b\x7b\xc3\
+\x0e\x81\xe7\x44\xc7\x2b\x8a\x6b\x87\x5f\x39\xdd\xbc\x52\x3e\x98\
+\x13\x8e\x38\xf2\x26\x00\x6b\x8d\x9a\x67\xe7\x4f\xd4\xc6\x18\x17\
+\x01\xaf\xd5\x74\xee\x70\xab\x51\xdb\x4d\x96\x32\x60\xfc\x40\xa8\
+\x5e\x65\x9d\x03\x00\x44\xe4\xcf\xc5\x05\x0f\xed\x88\x77\xbb\x26\
+\x8b\x1e\xbe\xee\xb0\x63\x0e\x80\xf7\x2d\xda\xae\x43\xd4\xc3\x9c\
+\xb4\xb4\x19\x1d\xad\x83\x34\x26\x2b\x6b\x62\x8d\xc0\x1b\x05\xe0\
+\xf3\x38\x37\xcd\xce\x9f\xa8\x8d\xb2\x28\x02\x14\xf8\xac\xc6\xd3\
+\x5f\x54\xae\x78\x70\x4f\x3c\xdb\x6d\xae\x3e\x7d\xd2\x3b\x29\xbc\
+\x6c\xd8\x9f\xf7\x0f\x28\x36\x57\x77\x6a\x3f\xd7\xa2\x69\x93\x02\
+\xa0\x60\x7e\x70\xb7\x42\x7e\x6f\xd1\x76\x04\xa7\xef\x09\x84\xef\
+\xb4\x0e\x71\x30\xcb\x72\x6e\xfb\x00\xbe\x3f\x02\x40\x4d\x9c\x9a\
+\x64\xe7\x4f\xd4\xc6\x95\x16\x66\x4f\x55\x68\x30\x4e\xcd\x55\xc3\
+\xd3\x11\x95\x05\xf3\x3e\x8c\x53\x7b\x2d\x56\xd5\x05\x41\x85\x3a\
+\x71\xb2\xa9\x8a\xdc\x61\x55\x30\x99\x6d\x7b\xe8\x93\xbc\x63\x01\
+\x80\x75\x56\xed\xd7\x91\x31\x6c\xe4\x7d\x67\x5a\x87\x38\x98\xbc\
+\x25\x53\x5e\x56\x68\x7a\x1c\x9a\x62\xe7\x4f\x74\x88\x28\x2b\x9c\
+\x77\x37\x62\x3f\x12\xa0\x0a\x49\x2f\x2b\x98\x57\x10\xe3\x76\x5a\
+\x2d\xa9\xff\xf8\xde\x50\xbd\xd9\x3a\xc7\x5e\xf2\x46\x59\xe1\x49\
+\x39\x56\xad\x9b\x15\x00\xc1\x60\xd0\xf7\x80\x49\x56\xed\xd7\x91\
+\x00\xf8\x73\xd3\xd2\x96\xb8\x76\x6d\x66\x3d\xf9\x39\x93\xe7\x03\
+\xfa\xe7\x18\x36\xc1\xce\x9f\xe8\x10\x13\xeb\xe9\x00\x51\xfc\xa9\
+\xac\x30\xeb\xf1\x58\x3d\x3f\x7a\x82\x9e\x27\x32\x17\x40\xa2\x75\
+\x12\x00\x10\x95\x0c\xcb\x33\x12\x4c\x0f\x3e\x58\x9a\x93\x51\x00\
+\x77\x4e\xbc\x3b\xbb\x3a\xb0\xf9\x06\xeb\x10\x4d\x91\x97\x93\xf1\
+\x07\x01\x9e\x8c\xc1\xa3\xd9\xf9\x13\x1d\xa2\x62\x57\x04\xc8\xe2\
+\x92\xa2\xec\x60\xf4\x9f\x1b\x7d\xc9\xe7\x7d\x74\x33\x80\x73\xac\
+\x73\x00\x80\x40\xf3\x4b\x8a\xe6\xbe\x68\x99\xc1\xfe\xe4\xa3\x40\
+\x60\x0a\x80\xb0\x75\x0e\x00\x50\xe0\x2f\x97\x8e\x98\xf6\x9f\xd6\
+\x39\x0e\x4e\xb4\x5d\x78\xe7\x78\x00\x2f\x45\xf1\xa1\xec\xfc\x89\
+\x0e\x71\x31\x28\x02\x8a\x6a\x3a\xb7\x1f\x03\x40\xa3\xf8\xcc\x98\
+\xe8\x31\x60\xe2\x0f\x44\xe1\xca\x5d\x30\x21\xd1\x80\xf5\x56\x4d\
+\xfb\x02\x60\xd9\x82\x5b\xdf\x06\x34\xdb\x3a\xc7\x3e\x5d\x7c\x91\
+\x45\xe9\xe9\x73\x9d\x18\x1e\x6a\x4c\x6e\x6e\xb0\xba\x7d\x38\x90\
+\x06\x41\x79\x14\x1e\xc7\xce\x9f\xe8\x30\x11\xb5\x22\x40\xb1\xb1\
+\x46\x43\x57\xb8\xbe\xe2\x1f\x00\x52\x53\x83\x09\x80\xff\x04\xdc\
+\x38\xf0\x07\xaa\x98\x53\x5c\x34\xb7\xc4\x3a\x87\x79\x01\x00\x00\
+\xed\xc3\x09\xbf\x03\xe0\xca\x71\x91\x67\x7f\xba\x6d\xdb\x1d\xd6\
+\x21\x9a\x22\x37\xf7\xd6\x7f\x6b\x08\x43\x00\x7c\xd6\x8a\xc7\xb0\
+\xf3\x27\x3a\xcc\x44\xa1\x08\xf8\x02\xe2\x0d\xa9\x2c\x7a\x2c\xde\
+\x5b\x93\x5b\x64\x8b\xff\xd1\x5d\x70\x64\xe8\x1f\xc0\xbf\xd1\xae\
+\x9d\x13\x9f\xb9\x4e\x2c\x7a\x2b\x29\x79\x7e\x57\x52\xca\xe0\x2a\
+\x08\x2e\xb2\xce\xb2\x4f\xbf\x1f\x9c\x31\xf8\x85\x8a\x0d\xab\x9c\
+\xdf\xce\x52\x51\xb2\x6a\x6b\x72\xaf\x0b\x5f\x01\x74\x14\x9a\xbf\
+\xb0\x85\x9d\x3f\xd1\x61\xea\x8b\xcd\xaf\xaf\x3d\xe6\x94\xb3\x20\
+\x90\xd4\x66\x7e\x6b\x95\x8a\x37\xa4\xac\x70\xee\xfa\x58\xe4\x8a\
+\xb6\xa4\xfe\xe3\xfa\x8a\xc8\x23\x70\xe4\x85\x57\x20\xb7\x94\x16\
+\x3c\x5c\x64\x9d\x03\x70\xe4\x07\x02\x00\xed\xfd\x53\xe6\x00\x70\
+\xe5\x17\x2a\xc1\x53\x7d\x6a\xd8\xb0\xa9\x5d\xad\x83\x34\xc5\xb2\
+\x9c\xdb\x5e\x11\x1f\xc3\x01\xec\x6e\xc6\xb7\xb1\xf3\x27\x3a\xcc\
+\xb5\x60\x8b\x60\xb5\x08\x7e\x51\xb6\x7a\xee\xab\xb1\xca\x14\x4d\
+\x29\xa9\xd7\x77\xf1\xc4\x9b\x0f\x47\x5e\x76\x01\x79\xa3\xe4\xf8\
+\xaf\xe6\x59\xa7\xd8\xcf\x99\x02\x20\x37\xf7\xca\xb0\x8a\xfc\x06\
+\xce\x2c\x26\x91\xd3\xd0\x29\x10\xd7\x9b\x99\x5a\x63\xd9\x92\x8c\
+\x17\x54\x31\x12\x40\xa8\x09\x5f\xce\xce\x9f\x88\x00\x34\x6b\x3a\
+\x20\x2c\x22\x57\x97\xac\x76\xfb\x82\x9f\xda\x7c\xbf\x66\x36\x80\
+\xd3\xad\x73\x7c\x4b\x6e\x46\x6e\xae\x13\x8b\xde\x01\x67\xaa\xa2\
+\xbd\x2a\x36\xac\x7c\xbf\x7b\xaf\x0b\x7a\x08\xd0\xcb\x3a\xcb\x3e\
+\x67\x76\x3f\x63\xd0\x86\x8a\x0d\xab\x4a\xad\x83\x34\x45\x45\xf1\
+\xaa\xf2\xe4\x5e\x17\x94\x02\xb8\x02\x0d\x17\x77\xec\xfc\x89\xe8\
+\x00\x4d\xb8\x45\xd0\x57\xc8\x2f\x4b\x0b\xb3\x16\xc7\x33\x57\x6b\
+\xf4\x1c\x30\xe1\x4a\x00\xb1\x3c\x33\xa5\x59\x14\x58\x50\x56\x98\
+\x35\xd3\x3a\x47\x6d\xce\x8c\x00\xec\x17\x0e\xfb\x37\x43\xb1\xd5\
+\x3a\xc7\x7e\xa2\x92\x3d\x7c\xe4\x7d\xdf\xb7\xce\xd1\x54\xcb\x72\
+\x26\x3d\xad\xd0\xf1\x88\x3c\x92\xc2\xce\x9f\x88\x22\x6a\x64\x24\
+\x40\x05\x72\x7d\x59\x61\xd6\xc2\x78\x67\x6a\xa9\xee\x03\xaf\xeb\
+\xa6\xc0\x1c\xeb\x1c\xb5\x7c\xbd\xf7\xd0\x1f\xb7\x38\x57\x00\x3c\
+\x97\x3b\xf9\x53\xf5\xf4\x0f\xd6\x39\x6a\x39\x4a\x11\x7e\x04\x50\
+\xfb\x4b\x23\x9a\x28\x3f\x67\xf2\x7c\x15\xfd\xef\x3a\xff\x98\x9d\
+\x3f\x11\x35\x2a\x52\x11\x20\xc0\xe4\x92\xc2\x2c\x93\xcb\x6a\x5a\
+\x26\xe8\x79\xa1\xf0\x13\x00\xbe\x6b\x9d\x64\x3f\x51\xdc\x5e\x5a\
+\x94\xf5\x89\x75\x8e\xba\x9c\x2b\x00\x00\xa0\x43\xe8\xd4\x87\x00\
+\xfc\x9f\x75\x8e\x6f\xc9\xa0\x61\xa3\xa6\x3b\x57\xbd\x35\x26\x7f\
+\xd1\xe4\x07\x01\xec\x2f\xa4\xd8\xf9\x13\x51\x93\xd4\x29\x02\xee\
+\x2c\x29\xcc\xce\xb4\xcc\xd3\x5c\x3d\xcf\xfb\xf0\x76\x01\x06\x5a\
+\xe7\xa8\xe5\xb5\x92\xa2\x6e\x59\xd6\x21\x22\x71\xf6\xad\xf6\xd2\
+\xd1\x99\x7d\x7c\x5f\x5f\x83\x3b\xeb\x14\xc2\xaa\x7a\x51\xfe\xe2\
+\xc9\x2b\xad\x83\x34\xc7\xd0\x51\xd3\x07\xe6\x2f\xca\x88\xe6\x89\
+\x81\x44\x74\x18\x48\x19\x30\x7e\x60\x71\xe1\xbc\x36\xf5\xd9\xd1\
+\xb3\xff\xc4\xf3\x55\xfc\xe7\xe1\x50\xbf\x21\xf0\xcf\x2e\x29\x7c\
+\xe4\x0d\xeb\x20\x91\x38\x5b\x00\x00\xc0\xd0\x91\xd3\xef\x17\xe0\
+\x26\xeb\x1c\xb5\x7c\x96\x10\xf0\xfb\xfc\x7d\xc1\x14\xe7\xcf\x07\
+\x20\x22\x3a\x9c\xa4\xf4\x4b\x3f\xd9\xf7\x74\x1d\x80\x63\xac\xb3\
+\xec\x27\x8a\x19\x25\x45\xd9\xb7\x59\xe7\x68\x88\x93\x53\x00\xfb\
+\xed\x49\xc4\x1d\x80\x6e\xb2\xce\x51\xcb\x71\xa1\xb0\xf7\xf4\x90\
+\x21\x0f\xb4\xb7\x0e\x42\x44\x44\x7b\x9d\x3e\xe4\xc6\xf6\x61\x4f\
+\x9f\x86\x43\x9d\x3f\x80\xf7\x24\x90\x78\x97\x75\x88\xc6\x38\x5d\
+\x00\xac\x7c\x32\x63\xa7\x8a\x4c\x80\x33\x67\x03\x00\x00\x7e\xd2\
+\xee\x88\x3d\x33\xac\x43\x10\x11\xd1\x5e\x89\x3b\x76\x3f\x28\xc0\
+\xd9\xd6\x39\x6a\x51\x88\xa6\x17\x17\x3c\xb4\xc3\x3a\x48\x63\x5c\
+\x99\x27\x69\x50\xc5\x86\x55\xef\x76\x3f\x63\xf0\x29\x02\x9c\x69\
+\x9d\xe5\x1b\x82\xb3\x93\x53\x06\xbf\x5f\x5e\xbc\xea\x4d\xeb\x28\
+\x44\x44\x87\xb3\x1e\xe7\x4d\xb8\x06\x0e\xed\xf7\x07\x00\x28\xe6\
+\x95\x16\xce\xbb\xdf\x3a\xc6\xc1\x38\x3d\x02\xb0\x5f\x87\x50\xf8\
+\x16\x00\x1f\x59\xe7\xa8\x4d\x05\x0f\x5d\x3a\x3a\xb3\x8f\x75\x0e\
+\x22\xa2\xc3\x55\x4a\xbf\x89\x3f\x84\xc2\xb5\x2d\x8a\x9f\x24\x68\
+\xc2\x14\xeb\x10\x4d\xd1\x26\x0a\x80\xdc\xdc\xdb\xbf\xde\x77\x4c\
+\xb0\x4b\x3a\xf8\xbe\xbf\xe4\xe2\xd1\xf7\x1e\x65\x1d\x84\x88\xe8\
+\x70\x93\x72\xee\xb8\xef\xfa\x9e\xbf\x14\x40\x47\xeb\x2c\xb5\x89\
+\xea\xaf\xdf\x5e\x33\xe7\x2b\xeb\x1c\x4d\xd1\x26\x0a\x00\x00\xc8\
+\x5f\x34\x69\x29\x80\xa7\xac\x73\x1c\x48\x4e\x0b\xf8\x81\xc5\x69\
+\x69\x4b\x9c\x9f\x4a\x21\x22\x3a\x74\x04\x3d\x3f\xd1\x7b\x0a\xc0\
+\xa9\xd6\x49\x0e\xa4\x8f\x97\x14\xcd\x5b\x66\x9d\xa2\xa9\xda\x4c\
+\x01\x00\x00\x5e\x87\x84\x1b\x01\x38\xb6\x05\x4f\x06\x55\x07\x36\
+\xff\xc5\x3a\x05\x11\xd1\xe1\x22\x79\xc0\x47\x53\x01\x0c\xb1\xce\
+\x51\xc7\xfb\x7b\xda\x79\x75\x4f\x60\x75\x5a\x9b\x2a\x00\x96\xce\
+\xbf\x65\xab\x0f\xef\x5a\xb8\xb5\x2b\x00\x0a\x4c\x19\x3a\x2a\xf3\
+\x7a\xeb\x1c\x44\x44\x87\xba\x1e\xfd\xd3\xc7\x0b\x30\xc9\x3a\x47\
+\x1d\xaa\x8a\xf4\x4d\x2f\x64\x7d\x6d\x1d\xa4\x39\xda\xdc\xd0\x75\
+\xc5\x86\x95\xef\x26\xf5\x1a\x7c\x0c\x80\xff\xb2\xce\x52\x9b\x00\
+\x17\x76\x4f\x19\xf4\x7a\x45\xf1\xaa\x0a\xeb\x2c\x44\x44\x87\xa2\
+\x94\xd4\x89\x17\x2a\x74\x01\x9c\x7b\x79\x95\xfb\xcb\x8a\xb2\x67\
+\x5b\xa7\x68\x2e\xc7\x7e\x88\x4d\xa3\x3b\x77\x4e\x81\xa0\xdc\x3a\
+\x47\x1d\x01\xf1\x64\xe1\x25\x23\xee\xfb\xa1\x75\x10\x22\xa2\x43\
+\x4d\x8f\xd4\x71\xbd\x7c\xdf\xcf\x01\x90\x60\x9d\xa5\x36\x01\xca\
+\xb6\xd7\x74\xbe\xc3\x3a\x47\x4b\xb4\xc9\x02\x20\x3f\x3f\x58\xe5\
+\x89\x5c\x05\xa0\xda\x3a\xcb\x01\x14\x5d\x3d\xf1\x9f\xbb\xfc\xaa\
+\xa9\xdf\xb3\x8e\x42\x44\x74\xa8\x48\xea\x3b\xf6\x24\xf8\x81\xe7\
+\x00\x1c\x69\x9d\xa5\x8e\x1a\x51\x7f\xcc\x87\xaf\xce\xdc\x65\x1d\
+\xa4\x25\xda\x64\x01\x00\x00\x4b\x17\x4e\x5a\x07\xd1\x3b\xad\x73\
+\x44\x70\x52\x28\xec\xe5\xa5\xa5\xcd\xee\x62\x1d\x84\x88\xa8\xad\
+\x4b\xea\x3b\xb6\xab\x17\x08\x2c\x07\xf4\xfb\xd6\x59\xea\x51\x99\
+\x52\x5c\xf4\xc8\xbf\xac\x63\xb4\x54\x9b\x2d\x00\x00\xe0\xac\xa4\
+\xaa\x4c\x40\x57\x59\xe7\x88\xe0\xcc\x3d\x81\xaa\x25\xa9\xa9\x41\
+\xa7\x86\xaa\x88\x88\xda\x94\xb4\xb4\x80\x04\x02\x4f\x01\xf8\x91\
+\x75\x94\xba\x04\x78\xbe\xb4\x28\x6b\x96\x75\x8e\xd6\x68\xd3\x05\
+\x40\x30\x18\xf4\x21\xed\xae\x01\xf0\xa9\x75\x96\x08\x86\x1c\x71\
+\x42\xa7\x36\xb7\x28\x84\x88\xc8\x15\x3d\xb6\x1c\x75\xbf\x00\xc3\
+\xac\x73\xd4\xa5\xc0\x67\xe2\x25\x5e\x0b\xc7\x76\xa4\x35\x57\x9b\
+\x2e\x00\x00\x20\x6f\xd1\xcd\x5b\x00\x8c\x87\x93\xff\x21\x24\x7d\
+\xd8\xa8\x4c\x67\xaf\x82\x24\x22\x72\x55\x8f\xf3\xd2\x27\x03\x7a\
+\x83\x75\x8e\x08\x34\xe0\x79\x63\x8a\x0b\x1e\x72\xf1\xc5\xb3\x59\
+\xda\xdc\x36\xc0\x48\xca\x37\xac\x7a\x27\x29\x65\x50\x57\x88\xfc\
+\xd4\x3a\x4b\x04\x83\x92\xcf\xb8\xe0\xa3\xf2\x0d\x2b\x5f\xb7\x0e\
+\x42\x44\xd4\x16\xf4\x1c\x90\x3e\x11\xd0\x59\x00\xc4\x3a\x4b\x3d\
+\x8a\xe9\x25\x85\x59\x0f\x5b\xc7\x88\x86\x36\x3f\x02\xb0\xdf\xb6\
+\x2d\x55\xb7\x03\x28\xb2\xce\x11\x81\xa8\xea\xdc\xe1\x23\xa7\x8f\
+\xb6\x0e\x42\x44\xe4\xba\x9e\xfd\xc7\x5f\xad\xd0\x87\xe0\x62\xe7\
+\x0f\x7d\xb5\x53\x95\xfc\xde\x3a\x45\xb4\x38\xf8\x03\x6e\xb9\x8b\
+\xd2\xa6\x9d\x90\x10\x90\x37\x00\x9c\x60\x9d\x25\x82\x30\x54\x47\
+\xe5\x2d\x9e\x9c\x6b\x1d\x84\x88\xc8\x45\x3d\xfb\x8f\x1f\xae\x22\
+\x4f\xc3\xb1\xbd\xfe\xc0\xde\x79\x7f\x3f\x21\x70\x56\xc5\x4b\x0f\
+\x3b\x75\x33\x6d\x6b\x1c\x32\x23\x00\x00\xf0\x5c\xee\xe4\x4f\x55\
+\x70\x15\x80\xb0\x75\x96\x08\x02\x10\x79\x6a\xf8\xe8\x69\x17\x59\
+\x07\x21\x22\x72\x4d\x8f\xd4\x09\x3f\x57\x11\xe7\x0e\xfa\xd9\xc7\
+\x17\xd1\xab\x0f\xa5\xce\x1f\x38\x44\xd6\x00\xd4\x56\xb1\x61\xd5\
+\xbb\x49\xbd\x06\x7b\x00\x52\xad\xb3\x44\x10\x80\xca\xe5\xdd\xcf\
+\x18\xb4\xa6\x62\xc3\xaa\xcd\xd6\x61\x88\x88\x5c\x90\x3c\x60\xc2\
+\x4f\x45\xb1\x1c\x40\x27\xeb\x2c\x0d\xf8\x43\x69\xe1\xbc\xf9\xd6\
+\x21\xa2\xed\x90\x1a\x01\xd8\xef\xac\xe4\x9d\x7f\x04\xb0\xc2\x3a\
+\x47\x03\x3a\x8a\x4a\xde\xd0\x11\x99\x67\x5b\x07\x21\x22\xb2\x96\
+\x72\xde\x84\xb3\x65\xef\xe7\x75\x67\xeb\x2c\x11\x09\x9e\x2d\x2d\
+\xec\x76\x8f\x75\x8c\x58\x38\xa4\xd6\x00\xd4\x36\xe4\xaa\x07\x8e\
+\x48\x08\xef\xf9\xa7\x00\x3d\xac\xb3\x44\xa4\xd8\x0a\xf1\x06\xe6\
+\xe5\xdc\xf6\x86\x75\x14\x22\x22\x0b\xc9\x03\xd2\xcf\x10\xf8\x2f\
+\x03\x72\xb4\x75\x96\x06\x54\xb4\xf7\x6a\x7e\xf2\x66\xc1\xfc\xad\
+\xd6\x41\x62\xe1\x90\x2d\x00\x00\x60\xe8\xa8\xbf\xa6\x08\x02\xaf\
+\x42\xd1\xd5\x3a\x4b\x64\xba\x45\xc5\xeb\x95\xbf\x68\xd2\x17\xd6\
+\x49\x88\x88\xe2\xa9\x7b\x6a\xfa\x31\x01\x5f\x37\x00\x38\xde\x3a\
+\x4b\x03\xb6\x7b\xea\x9d\x53\x5c\x34\xb7\xc4\x3a\x48\xac\x1c\x92\
+\x53\x00\xfb\xe5\x2f\xba\xbd\x58\x7d\x5c\x03\x27\x0f\x09\x02\x00\
+\x99\xc3\xce\x9f\x88\x0e\x47\x15\x05\x59\x5f\x00\x98\x69\x9d\xa3\
+\x01\xea\xa9\x8e\x3d\x94\x3b\x7f\xe0\x10\x5c\x04\x58\x57\x45\xf1\
+\xaa\xf2\xa4\x5e\x83\x12\x00\x19\x60\x9d\xa5\x8e\x60\x5e\x4e\xc6\
+\xdd\xd6\x21\x88\x88\xac\x7c\xb1\xf9\xf5\xb5\xc7\x9e\xd2\x67\x37\
+\x80\x9f\x5b\x67\xa9\x4d\x14\x7f\x2a\x29\x9a\xf7\x90\x75\x8e\x58\
+\x3b\xa4\x47\x00\xf6\x3b\x2b\xb9\xea\x2e\x51\x5d\x6a\x9d\xa3\x96\
+\xbb\xd9\xf9\x13\x11\x01\xa5\x85\xd9\x53\x05\xe2\xd2\xe7\xe1\x33\
+\x25\x45\xdd\x5c\xca\x13\x33\x87\xfc\x08\x00\x00\x14\x14\x14\x68\
+\xef\x9e\x43\xf2\xc2\x9e\x0e\x06\xd0\xcd\x38\x0e\xdf\xfc\x89\x88\
+\x6a\xf9\x7c\xf3\xba\x02\x37\x46\x02\xe4\x8d\xc4\x0e\xbb\x87\x6e\
+\xd9\xf8\x40\xb5\x6d\x8e\xf8\x38\x2c\x0a\x00\x00\x28\x29\x79\x3e\
+\x94\xd4\xeb\xe7\xcb\x01\x19\x01\xe0\x08\xa3\x18\xec\xfc\x89\x88\
+\x22\x70\x60\x3a\xe0\x93\x00\x42\xe7\xbf\xfd\xd2\xe3\x87\xcd\xba\
+\xac\xc3\xa6\x00\x00\x80\xf2\x0d\x2f\x6c\xef\x9e\x32\x68\xb5\x88\
+\x5c\x0d\xa0\x5d\x9c\x9b\x67\xe7\x4f\x44\xd4\x08\xc3\x22\x60\x97\
+\xa7\xfe\x85\xc5\x45\x8f\x96\xc6\xb9\x5d\x53\x87\x55\x01\x00\x00\
+\x15\xc5\xab\x3e\x49\xee\x75\x41\x05\x80\x34\xc4\x6f\x1b\x24\xe7\
+\xfc\x89\x88\x9a\xe0\x8b\xcd\xaf\xaf\x3d\xee\x94\x1f\x0b\xe2\x77\
+\x9a\xab\xaf\xd0\x51\xa5\x45\x8f\xbc\x10\xa7\xf6\x9c\x71\xd8\x15\
+\x00\x00\x50\xbe\x61\x65\x49\x52\xca\xe0\x2a\x08\x06\xc5\xa1\x39\
+\xbe\xf9\x13\x11\x35\x43\x5c\xd7\x04\xa8\xdc\x56\x56\x94\xfd\x58\
+\xcc\xdb\x71\xd0\x61\x59\x00\x00\x40\x79\xf1\xaa\x57\x92\xce\x18\
+\x74\x14\x20\xe7\xc4\xb0\x19\x76\xfe\x44\x44\x2d\x10\xa7\xe9\x80\
+\x87\x4a\x8b\xb2\xef\x8c\xe1\xf3\x9d\x76\x58\x6c\x03\x6c\xc8\x59\
+\x49\x55\xb7\x02\x78\x3a\x46\x8f\x67\xe7\x4f\x44\xd4\x0a\xa5\x85\
+\xd9\x53\x01\xdc\x1e\xa3\xc7\xe7\x96\x16\x76\xbb\x31\x46\xcf\x6e\
+\x13\x0e\xdb\x11\x00\x60\xef\xf6\xc0\x13\x7f\xdc\x37\xbf\x7d\xa8\
+\x5d\x2a\x80\x93\xa3\xf8\x68\x76\xfe\x44\x44\x51\x10\xa3\x91\x80\
+\xa2\x5d\x5e\xcd\xe5\x5b\xdf\x9b\x55\x13\xc5\x67\xb6\x39\x87\x75\
+\x01\x00\x00\xef\xbd\x59\x10\xea\xdd\x63\xc8\xb2\x90\xa7\xc3\x04\
+\x38\x36\x0a\x8f\xe4\x82\x3f\x22\xa2\x28\x8a\xf2\xc2\xc0\x92\x04\
+\x3f\x61\x70\x45\xe1\xbc\x1d\x51\x78\x56\x9b\x76\x48\x5f\x06\xd4\
+\x1c\x97\xa4\xcd\xe8\xe6\x05\xfc\x35\x80\x9e\xda\x8a\xc7\xf0\xcd\
+\x9f\x88\x28\x46\x7a\x0c\x98\x30\x05\xc0\x5f\x5b\xfe\x04\xf9\xc0\
+\xf3\xd1\xaf\x78\x4d\xd6\xfb\x51\x0b\xd5\x86\x1d\xf6\x23\x00\xfb\
+\x55\x94\x3c\xbf\x3d\xa9\xc7\x85\xcb\xe1\xe9\x95\x00\xba\xb4\xe0\
+\x11\xec\xfc\x89\x88\x62\xa8\x95\xd3\x01\x9f\xfb\xe1\xf0\xcf\x4a\
+\xd7\xce\xdb\x14\xed\x5c\x6d\x15\x0b\x80\x5a\xca\x4b\x9e\xff\x77\
+\xd2\x19\x83\x57\x01\x18\x09\xa0\x63\x33\xbe\x95\x9d\x3f\x11\x51\
+\x1c\xb4\xb0\x08\xf8\x1a\x2a\x83\xca\xd6\xcc\xdb\x10\xab\x5c\x6d\
+\x11\x0b\x80\x3a\xca\x37\xac\xda\xf2\x83\x33\x06\x17\xca\xde\x22\
+\xa0\x29\xa7\x05\xb2\xf3\x27\x22\x8a\xa3\x66\x16\x01\xbb\x44\xf4\
+\xa2\xd2\xc2\xec\xd7\x62\x9d\xab\xad\x61\x01\x10\x41\xc5\x86\x55\
+\x1f\x26\xf7\x1e\xf4\x26\x54\xd2\xd0\xf8\xcf\x88\x0b\xfe\x88\x88\
+\x0c\x34\x71\x61\xe0\x1e\xcf\xf3\x2e\x2b\x59\x9d\xfd\x52\x9c\x62\
+\xb5\x29\x2c\x00\x1a\x50\xfe\xf6\xaa\x77\xba\x9f\x71\xc1\x06\x01\
+\xae\x40\xe4\x9f\x13\xdf\xfc\x89\x88\x0c\x1d\xe4\xc4\xc0\x1a\x0f\
+\x48\x2b\x5e\x9d\xb5\x3c\xde\xb9\xda\x0a\x16\x00\x8d\xa8\xd8\xb0\
+\xb2\x2c\x29\xe5\x82\x62\x08\xae\xc0\x81\x87\x26\xb1\xf3\x27\x22\
+\x72\x40\x03\xd3\x01\x61\x28\xae\x29\x29\xca\xfe\x9b\x55\xae\xb6\
+\x80\x05\xc0\x41\x94\x17\xaf\x2c\x4d\x4a\x19\x54\x06\x91\xcb\xb0\
+\xb7\x08\x60\xe7\x4f\x44\xe4\x90\x3a\x45\x40\x58\x80\x31\xa5\x45\
+\xd9\x8b\xac\x73\xd1\x21\x62\xd8\xa8\xcc\x31\xc3\x47\x64\xfe\xc1\
+\x3a\x07\x11\x11\x45\x96\x7c\xde\x84\x3f\x24\x0f\x48\x1f\x63\x9d\
+\x83\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x28\x8a\xfe\x1f\x8f\x09\
+\x98\xc2\xcf\xf7\xc8\xd0\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
 "
 
 qt_resource_name = b"\
@@ -10289,49 +17500,93 @@ qt_resource_name = b"\
 \x00\x6f\xa6\x53\
 \x00\x69\
 \x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0b\
-\x0d\x72\xad\xe7\
-\x00\x73\
-\x00\x69\x00\x67\x00\x5f\x00\x67\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x06\x61\xa6\xc7\
-\x00\x72\
-\x00\x66\x00\x5f\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x05\xc6\x4f\x87\
-\x00\x72\
-\x00\x66\x00\x5f\x00\x6f\x00\x66\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x01\x5e\x4c\xa7\
+\x00\x62\
+\x00\x72\x00\x6f\x00\x61\x00\x64\x00\x63\x00\x61\x00\x73\x00\x74\x00\x2d\x00\x6f\x00\x66\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x11\
+\x03\x01\xe7\x67\
+\x00\x41\
+\x00\x67\x00\x69\x00\x6c\x00\x65\x00\x6e\x00\x74\x00\x4e\x00\x35\x00\x31\x00\x38\x00\x31\x00\x41\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
 \x00\x0b\
 \x03\xa0\xd6\x67\
 \x00\x48\
 \x00\x49\x00\x2d\x00\x36\x00\x30\x00\x30\x00\x36\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x03\xec\xfb\x67\
+\x00\x74\
+\x00\x68\x00\x65\x00\x72\x00\x6d\x00\x6f\x00\x6d\x00\x65\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x17\
+\x06\xa7\xac\xe7\
+\x00\x41\
+\x00\x67\x00\x69\x00\x6c\x00\x65\x00\x6e\x00\x74\x00\x4e\x00\x35\x00\x31\x00\x38\x00\x31\x00\x41\x00\x2d\x00\x77\x00\x68\x00\x69\
+\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x08\xa5\xbc\x67\
+\x00\x6d\
+\x00\x6f\x00\x64\x00\x75\x00\x6c\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2d\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x12\
+\x09\x87\xe4\x47\
+\x00\x6d\
+\x00\x6f\x00\x64\x00\x75\x00\x6c\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2d\x00\x6f\x00\x66\x00\x66\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x0b\
+\x0a\xf1\xa6\x7f\
+\x00\x41\
+\x00\x70\x00\x70\x00\x49\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x0b\
+\x0c\x4d\x40\x07\
+\x00\x62\
+\x00\x61\x00\x74\x00\x74\x00\x65\x00\x72\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x0f\x28\x26\xe7\
+\x00\x62\
+\x00\x72\x00\x6f\x00\x61\x00\x64\x00\x63\x00\x61\x00\x73\x00\x74\x00\x2d\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x06\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x93\x45\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x6e\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x02\
 \x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xdb\xff\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x48\xba\
+\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x01\x09\x1f\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x02\xae\x9f\
+\x00\x00\x00\xa0\x00\x00\x00\x00\x00\x01\x00\x02\xb0\x74\
+\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x02\xcf\xe2\
+\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x03\x23\xb4\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x03\x6a\x2c\
+\x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x03\xcb\xe2\
+\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x03\xcf\x71\
 "
 
 qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x06\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x93\x45\
-\x00\x00\x01\x8b\x5a\xbd\xc7\xe0\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x6e\
-\x00\x00\x01\x8b\x5a\xbd\xd5\x0c\
 \x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8b\x59\x59\x6f\x03\
-\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xdb\xff\
-\x00\x00\x01\x8b\x59\x59\x83\x11\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x00\x38\x00\x00\x00\x00\x00\x01\x00\x00\x48\xba\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x01\x09\x1f\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x02\xae\x9f\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x00\xa0\x00\x00\x00\x00\x00\x01\x00\x02\xb0\x74\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x02\xcf\xe2\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x03\x23\xb4\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x03\x6a\x2c\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x03\xcb\xe2\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
+\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x03\xcf\x71\
+\x00\x00\x01\x95\x8f\x45\xbc\x78\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""
+SCPI Client Module
+==================
+This module implements a shared asyncio SCPI client for raw-socket LAN instruments
+(port 5025, or the telnet-style port 5024 which prefixes replies with a prompt).
+Replies are framed by the newline terminator, or by the IEEE 488.2 definite-length
+header for binary block replies such as traces, and matched to queries in the order
+the queries were sent, so several queries can be in flight on one connection at once.
+Lost connections are re-established automatically with exponential backoff.
+
+A single background event loop (see get_shared_loop) serves every LAN instrument in
+the rack. Drivers that run on their own threads or on the GUI thread use the blocking
+SCPIInstrument facade, which submits work to that loop.
+
+Classes:
+    SCPIError: Base exception for SCPI client failures.
+    SCPIConnectionError: Raised when the instrument cannot be reached.
+    SCPITimeoutError: Raised when a reply does not arrive in time.
+    LatencyStats: Running round-trip latency statistics for one instrument.
+    AsyncSCPIClient: Asyncio client with pipelined queries and reconnect.
+    SCPIInstrument: Blocking facade over AsyncSCPIClient on the shared loop.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import threading
+import time
+
+
+class SCPIError(Exception):
+    """
+    Base exception for SCPI client failures.
+    """
+
+
+class SCPIConnectionError(SCPIError):
+    """
+    Raised when the connection to the instrument cannot be established or is lost.
+    """
+
+
+class SCPITimeoutError(SCPIError):
+    """
+    Raised when the instrument does not reply within the configured timeout.
+    """
+
+
+class LatencyStats:
+    """
+    Running round-trip latency statistics for an instrument link.
+
+    Attributes:
+        count (int): Number of recorded round trips.
+        total (float): Sum of all recorded latencies in seconds.
+        minimum (float): Shortest recorded latency in seconds.
+        maximum (float): Longest recorded latency in seconds.
+        last (float): Most recent latency in seconds.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty LatencyStats instance.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Discard all recorded latencies.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = 0.0
+        self.last = 0.0
+
+    def record(self, seconds: float):
+        """
+        Record one round-trip latency.
+
+        Parameters:
+            seconds (float): The measured latency in seconds.
+        """
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    @property
+    def mean(self) -> float:
+        """
+        Returns:
+            float: The mean latency in seconds, or 0.0 if nothing was recorded.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def __repr__(self):
+        if not self.count:
+            return 'LatencyStats(count=0)'
+        return (f'LatencyStats(count={self.count}, mean={self.mean * 1000:.2f} ms, '
+                f'min={self.minimum * 1000:.2f} ms, max={self.maximum * 1000:.2f} ms)')
+
+
+class _SCPIProtocol(asyncio.BufferedProtocol):
+    """
+    Buffered protocol feeding received bytes into a preallocated buffer.
+
+    The event loop receives straight into the free tail of the buffer, and the owning
+    client frames complete replies out of it in place, so nothing is allocated per read.
+    """
+
+    def __init__(self, client: 'AsyncSCPIClient', size: int):
+        self.client = client
+        self.buffer = bytearray(size)
+        self.start = 0
+        self.end = 0
+        self.transport = None
+        self.banner = asyncio.Event() if client.prompt else None
+        self.writable = asyncio.Event()
+        self.writable.set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint: int):
+        if self.end == len(self.buffer):
+            if self.start:
+                # Move the unread tail to the front to make room
+                remaining = self.end - self.start
+                self.buffer[:remaining] = self.buffer[self.start:self.end]
+                self.start, self.end = 0, remaining
+            else:
+                # A single reply is larger than the buffer; grow it once and keep it
+                self.buffer.extend(bytes(len(self.buffer)))
+        return memoryview(self.buffer)[self.end:]
+
+    def buffer_updated(self, nbytes: int):
+        self.end += nbytes
+        if self.banner is not None and not self.banner.is_set():
+            # Swallow the welcome banner up to the first prompt
+            index = self.buffer.find(self.client.prompt.encode(), self.start, self.end)
+            if index < 0:
+                return
+            self.start = index + len(self.client.prompt)
+            self.banner.set()
+        self.client._process(self)
+        if self.start == self.end:
+            self.start = self.end = 0
+
+    def pause_writing(self):
+        self.writable.clear()
+
+    def resume_writing(self):
+        self.writable.set()
+
+    def connection_lost(self, exc):
+        self.writable.set()
+        self.client._connection_lost(self, exc)
+
+
+class AsyncSCPIClient:
+    """
+    Asyncio SCPI client for a single raw-socket instrument.
+
+    Queries are written immediately and their futures are queued. Received bytes are
+    framed in place in a preallocated buffer: each reply is taken as soon as it is
+    complete, either up to the terminator or, for binary block queries, to the length
+    given in its #<n><len> header. Futures are resolved in the order the queries were
+    sent. A reply that times out leaves the stream in an unknown state, so the
+    connection is dropped and re-opened on the next request.
+    """
+
+    TELNET_PORT = 5024
+    TELNET_PROMPT = 'SCPI> '
+
+    def __init__(self, host: str, port: int = 5025, timeout: float = 2.0, terminator: bytes = b'\n',
+                 reconnect_attempts: int = 5, backoff_initial: float = 0.1, backoff_max: float = 5.0,
+                 prompt: str | None = None, buffer_size: int = 65536):
+        """
+        Initialize the client. No connection is made until the first request or connect().
+
+        Parameters:
+            host (str): IP address or host name of the instrument.
+            port (int): TCP port, 5025 for raw SCPI or 5024 for the telnet-style port.
+            timeout (float): Default connect and reply timeout in seconds.
+            terminator (bytes): Reply terminator.
+            reconnect_attempts (int): Connection attempts before giving up.
+            backoff_initial (float): Delay before the first reconnect attempt in seconds.
+            backoff_max (float): Upper bound for the reconnect delay in seconds.
+            prompt (str or None): Prompt to strip from replies. Defaults to the telnet prompt on port 5024.
+            buffer_size (int): Initial size of the receive buffer in bytes. It grows if a reply does not fit.
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.terminator = terminator
+        self.reconnect_attempts = reconnect_attempts
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        if prompt is None and port == self.TELNET_PORT:
+            prompt = self.TELNET_PROMPT
+        self.prompt = prompt
+        self.buffer_size = buffer_size
+        self.stats = LatencyStats()
+        self._protocol = None
+        self._connecting = None
+        self._pending = collections.deque()
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        Returns:
+            bool: True if the socket is open.
+        """
+        return self._protocol is not None and not self._protocol.transport.is_closing()
+
+    async def connect(self):
+        """
+        Open the connection, retrying with exponential backoff.
+
+        Raises:
+            SCPIConnectionError: If every attempt fails.
+        """
+        if self.is_connected:
+            return
+        if self._connecting is None:
+            self._connecting = asyncio.ensure_future(self._connect_with_backoff())
+        connecting = self._connecting
+        try:
+            await asyncio.shield(connecting)
+        finally:
+            if connecting.done() and self._connecting is connecting:
+                self._connecting = None
+
+    async def _connect_with_backoff(self):
+        loop = asyncio.get_running_loop()
+        delay = self.backoff_initial
+        last_error = None
+        for attempt in range(max(1, self.reconnect_attempts)):
+            if attempt:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2.0, self.backoff_max)
+            try:
+                _, protocol = await asyncio.wait_for(
+                    loop.create_connection(lambda: _SCPIProtocol(self, self.buffer_size), self.host, self.port), self.timeout)
+                if protocol.banner is not None:
+                    try:
+                        await asyncio.wait_for(protocol.banner.wait(), self.timeout)
+                    except asyncio.TimeoutError:
+                        protocol.banner.set()
+                self._protocol = protocol
+                return
+            except (OSError, asyncio.TimeoutError) as e:
+                last_error = e
+        raise SCPIConnectionError(f'Unable to connect to {self.host}:{self.port}: {last_error}')
+
+    async def close(self):
+        """
+        Close the connection and fail any queries still waiting for a reply.
+        """
+        self._drop_connection(SCPIConnectionError('Connection closed'))
+
+    def _drop_connection(self, error: Exception):
+        if self._protocol is not None:
+            self._protocol.transport.close()
+        self._protocol = None
+        while self._pending:
+            future, _, _ = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    def _connection_lost(self, protocol: _SCPIProtocol, exc: Exception | None):
+        if protocol is self._protocol:
+            self._drop_connection(SCPIConnectionError(f'Connection to {self.host}:{self.port} lost: {exc or "closed by peer"}'))
+
+    def _process(self, protocol: _SCPIProtocol):
+        # Resolve every pending query whose reply is complete in the receive buffer
+        while self._pending:
+            error = None
+            try:
+                if self._pending[0][2]:
+                    reply = self._frame_block(protocol)
+                else:
+                    reply = self._frame_line(protocol)
+            except SCPIError as e:
+                # The reply was consumed but is not a block; fail its query now
+                reply, error = None, e
+            if reply is None and error is None:
+                return
+            future, sent, _ = self._pending.popleft()
+            self.stats.record(time.perf_counter() - sent)
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(reply)
+
+    def _frame_line(self, protocol: _SCPIProtocol) -> str | None:
+        index = protocol.buffer.find(self.terminator, protocol.start, protocol.end)
+        if index < 0:
+            return None
+        reply = self._decode(protocol.buffer[protocol.start:index])
+        protocol.start = index + len(self.terminator)
+        return reply
+
+    def _frame_block(self, protocol: _SCPIProtocol) -> bytes | None:
+        # IEEE 488.2 definite-length block: #<n><n-digit length><data><terminator>
+        buffer = protocol.buffer
+        header = buffer.find(b'#', protocol.start, protocol.end)
+        line_end = buffer.find(self.terminator, protocol.start, protocol.end if header < 0 else header)
+        if line_end >= 0:
+            # A complete line came before any block header, e.g. an ASCII value or an error
+            reply = self._decode(buffer[protocol.start:line_end])
+            protocol.start = line_end + len(self.terminator)
+            raise SCPIError(f'Expected a binary block from {self.host}:{self.port}, got {reply!r}')
+        if header < 0 or header + 2 > protocol.end:
+            return None
+        digits = buffer[header + 1] - ord('0')
+        if not 0 <= digits <= 9:
+            if not self._skip_line(protocol, header + 1):
+                return None
+            raise SCPIError(f'Malformed block header from {self.host}:{self.port}: {chr(buffer[header + 1])!r} is not a digit count')
+        if digits == 0:
+            # Indefinite-length block, ended by the terminator
+            index = buffer.find(self.terminator, header + 2, protocol.end)
+            if index < 0:
+                return None
+            data = bytes(buffer[header + 2:index])
+        else:
+            first = header + 2 + digits
+            if first > protocol.end:
+                return None
+            length = bytes(buffer[header + 2:first])
+            if not length.isdigit():
+                if not self._skip_line(protocol, header + 2):
+                    return None
+                raise SCPIError(f'Malformed block header from {self.host}:{self.port}: length {length!r}')
+            last = first + int(length)
+            index = buffer.find(self.terminator, last, protocol.end)
+            if index < 0:
+                return None
+            data = bytes(buffer[first:last])
+        protocol.start = index + len(self.terminator)
+        return data
+
+    def _skip_line(self, protocol: _SCPIProtocol, position: int) -> bool:
+        # Drop a malformed reply once its terminator has arrived, so the next reply stays framed
+        index = protocol.buffer.find(self.terminator, position, protocol.end)
+        if index < 0:
+            return False
+        protocol.start = index + len(self.terminator)
+        return True
+
+    def _decode(self, line: bytes) -> str:
+        reply = line.decode('ascii', errors='replace').strip()
+        if self.prompt:
+            prompt = self.prompt.strip()
+            while reply.startswith(prompt):
+                reply = reply[len(prompt):].lstrip()
+        return reply
+
+    async def _send(self, command: str) -> _SCPIProtocol:
+        await self.connect()
+        protocol = self._protocol
+        protocol.transport.write(command.encode('ascii') + self.terminator)
+        return protocol
+
+    async def _drain(self, protocol: _SCPIProtocol):
+        await protocol.writable.wait()
+        if protocol is not self._protocol:
+            raise SCPIConnectionError(f'Connection to {self.host}:{self.port} lost')
+
+    async def write(self, command: str):
+        """
+        Send a command that produces no reply.
+
+        Parameters:
+            command (str): The SCPI command.
+        """
+        await self._drain(await self._send(command))
+
+    async def query(self, command: str, timeout: float | None = None) -> str:
+        """
+        Send a query and wait for its reply. Several queries may be awaited concurrently;
+        replies are matched to them in the order they were sent.
+
+        Parameters:
+            command (str): The SCPI query.
+            timeout (float or None): Reply timeout in seconds. Defaults to the client timeout.
+
+        Returns:
+            str: The reply with terminator and prompt removed.
+        """
+        return await self._query(command, timeout, False)
+
+    async def query_block(self, command: str, timeout: float | None = None) -> bytes:
+        """
+        Send a query whose reply is an IEEE 488.2 binary block, e.g. TRAC:DATA? with FORM REAL,32.
+
+        Parameters:
+            command (str): The SCPI query.
+            timeout (float or None): Reply timeout in seconds. Defaults to the client timeout.
+
+        Returns:
+            bytes: The block payload without the length header and terminator.
+
+        Raises:
+            SCPIError: If the reply is a plain line or has a malformed block header.
+        """
+        return await self._query(command, timeout, True)
+
+    async def _query(self, command: str, timeout: float | None, block: bool):
+        await self.connect()
+        future = asyncio.get_running_loop().create_future()
+        # Mark the exception as retrieved in case the caller stopped waiting for it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        # Queue the future and write in the same loop iteration so queue order matches wire order
+        self._pending.append((future, time.perf_counter(), block))
+        protocol = await self._send(command)
+        try:
+            await self._drain(protocol)
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            # A late reply would be matched to the wrong query; resynchronize by reconnecting
+            self._drop_connection(SCPITimeoutError(f'Timed out waiting for reply to {command!r}'))
+            raise SCPITimeoutError(f'Timed out waiting for reply to {command!r} from {self.host}:{self.port}')
+
+
+class _SharedLoop:
+    """
+    Background thread running the event loop shared by all LAN instruments.
+    """
+
+    _lock = threading.Lock()
+    _loop = None
+
+    @classmethod
+    def get(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            if cls._loop is None or cls._loop.is_closed():
+                cls._loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=cls._loop.run_forever, name='SCPIEventLoop', daemon=True)
+                thread.start()
+            return cls._loop
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that serves every LAN instrument, starting it on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: The shared loop, running on a daemon thread.
+    """
+    return _SharedLoop.get()
+
+
+class SCPIInstrument:
+    """
+    Blocking facade over AsyncSCPIClient for driver threads and the GUI thread.
+
+    Every call is executed on the shared event loop, so any number of instruments share
+    one I/O thread. Coroutines can also be submitted directly with submit() to overlap
+    work on several instruments.
+    """
+
+    def __init__(self, host: str, port: int = 5025, timeout: float = 2.0, loop: asyncio.AbstractEventLoop | None = None, **kwargs):
+        """
+        Initialize the instrument facade.
+
+        Parameters:
+            host (str): IP address or host name of the instrument.
+            port (int): TCP port of the SCPI socket server.
+            timeout (float): Connect and reply timeout in seconds.
+            loop (asyncio.AbstractEventLoop or None): Loop to run on. Defaults to the shared loop.
+            **kwargs: Additional AsyncSCPIClient options.
+        """
+        self.loop = loop if loop is not None else get_shared_loop()
+        self.client = AsyncSCPIClient(host, port, timeout, **kwargs)
+        self.instId = ''
+
+    @property
+    def stats(self) -> LatencyStats:
+        """
+        Returns:
+            LatencyStats: Round-trip latency statistics for this instrument.
+        """
+        return self.client.stats
+
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the instrument's event loop.
+
+        Parameters:
+            coro (coroutine): The coroutine to run.
+
+        Returns:
+            concurrent.futures.Future: Future resolving to the coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def _run(self, coro, timeout: float | None = None):
+        future = self.submit(coro)
+        # The client enforces its own timeouts; the outer bound only guards against a stalled loop
+        limit = (timeout if timeout is not None else self.client.timeout) * (self.client.reconnect_attempts + 2) + self.client.backoff_max
+        try:
+            return future.result(limit)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise SCPITimeoutError(f'No response from {self.client.host}:{self.client.port}')
+
+    def connect(self, identify: bool = True) -> str:
+        """
+        Open the connection and optionally read the instrument identity.
+
+        Parameters:
+            identify (bool): Query *IDN? after connecting.
+
+        Returns:
+            str: The identity string, or an empty string if identify is False.
+        """
+        self._run(self.client.connect())
+        if identify:
+            self.instId = self.query('*IDN?')
+        return self.instId
+
+    def write(self, command: str):
+        """
+        Send a command that produces no reply.
+
+        Parameters:
+            command (str): The SCPI command.
+        """
+        self._run(self.client.write(command))
+
+    def query(self, command: str, timeout: float | None = None) -> str:
+        """
+        Send a query and return its reply.
+
+        Parameters:
+            command (str): The SCPI query.
+            timeout (float or None): Reply timeout in seconds.
+
+        Returns:
+            str: The reply string.
+        """
+        return self._run(self.client.query(command, timeout), timeout)
+
+    def query_block(self, command: str, timeout: float | None = None) -> bytes:
+        """
+        Send a query and return its binary block reply.
+
+        Parameters:
+            command (str): The SCPI query.
+            timeout (float or None): Reply timeout in seconds.
+
+        Returns:
+            bytes: The block payload.
+        """
+        return self._run(self.client.query_block(command, timeout), timeout)
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        if not self.loop.is_closed():
+            self._run(self.client.close())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Setup Model Module
+==================
+This module models the radiated-immunity transmit chain versus frequency, so the
+FieldController can start every step at the generator power predicted for the target
+field instead of at a fixed base power:
+
+    generator (dBm) - cable loss + amplifier gain -> antenna gain (from the antenna factor)
+    -> field at distance
+
+Antenna factor, amplifier gain and cable loss are loaded as tables versus frequency,
+either as CSV (frequency in MHz, value in dB) or as Touchstone .s2p files (|S21|), and
+interpolated with NumPy on a logarithmic frequency axis. Where no table is loaded the
+scalar values selected in the UI are used.
+
+Classes:
+    FrequencyTable: A value in dB versus frequency.
+    SetupModel: Predicts the generator power for a field.
+Functions:
+    antenna_gain_from_factor: Convert an antenna factor to gain.
+"""
+
+import csv
+import math
+import os
+
+import numpy as np
+
+
+def antenna_gain_from_factor(frequency, antenna_factor):
+    """
+    Convert an antenna factor to far-field gain in a 50 Ω system:
+    G (dBi) = 20 * log10(f / MHz) - AF (dB/m) - 29.77.
+
+    Parameters:
+        frequency (float or np.ndarray): Frequency in MHz.
+        antenna_factor (float or np.ndarray): Antenna factor in dB/m.
+
+    Returns:
+        float or np.ndarray: Gain in dBi.
+    """
+    return 20.0 * np.log10(frequency) - antenna_factor - 29.77
+
+
+class FrequencyTable:
+    """
+    A value in dB versus frequency, interpolated on a logarithmic frequency axis and held
+    constant beyond the first and last points.
+
+    Attributes:
+        frequencies (np.ndarray): Frequencies in MHz, ascending.
+        values (np.ndarray): Values in dB.
+    """
+
+    FREQUENCY_SCALE = {'HZ': 1e-6, 'KHZ': 1e-3, 'MHZ': 1.0, 'GHZ': 1e3}
+
+    def __init__(self, frequencies, values):
+        order = np.argsort(frequencies)
+        self.frequencies = np.asarray(frequencies, dtype=float)[order]
+        self.values = np.asarray(values, dtype=float)[order]
+        self.log_frequencies = np.log(self.frequencies)
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def at(self, frequency):
+        """
+        Interpolate the table.
+
+        Parameters:
+            frequency (float or np.ndarray): Frequency in MHz.
+
+        Returns:
+            float or np.ndarray: The value in dB.
+        """
+        values = np.interp(np.log(frequency), self.log_frequencies, self.values)
+        return float(values) if np.ndim(values) == 0 else values
+
+    @classmethod
+    def load(cls, path: str) -> 'FrequencyTable':
+        """
+        Load a table from a CSV file or, for .s1p/.s2p files, from Touchstone.
+
+        Parameters:
+            path (str): The file.
+
+        Returns:
+            FrequencyTable: The loaded table.
+        """
+        if os.path.splitext(path)[1].lower() in ('.s1p', '.s2p'):
+            return cls.load_touchstone(path)
+        return cls.load_csv(path)
+
+    @classmethod
+    def load_csv(cls, path: str) -> 'FrequencyTable':
+        """
+        Read a two-column CSV: frequency in MHz and value in dB. Header or comment rows
+        that do not start with a number are skipped.
+
+        Parameters:
+            path (str): CSV file.
+
+        Returns:
+            FrequencyTable: The loaded table.
+        """
+        rows = []
+        with open(path, 'r', newline='') as file:
+            for row in csv.reader(file):
+                try:
+                    rows.append((float(row[0]), float(row[1])))
+                except (ValueError, IndexError):
+                    continue
+        if not rows:
+            raise ValueError(f'No frequency/value rows in {path}')
+        rows = np.array(rows)
+        return cls(rows[:, 0], rows[:, 1])
+
+    @classmethod
+    def load_touchstone(cls, path: str) -> 'FrequencyTable':
+        """
+        Read |S21| in dB from a Touchstone file (|S11| for one-port files). The option line
+        selects the frequency unit and the DB, MA or RI data format.
+
+        Parameters:
+            path (str): .s1p or .s2p file.
+
+        Returns:
+            FrequencyTable: Transmission in dB; a gain for amplifiers, a negative loss for cables.
+        """
+        scale, data_format = 1e3, 'MA'      # Touchstone defaults: GHz, magnitude/angle
+        numbers = []
+        with open(path, 'r') as file:
+            for line in file:
+                line = line.split('!', 1)[0].strip()
+                if not line:
+                    continue
+                if line.startswith('#'):
+                    for option in line[1:].upper().split():
+                        if option in cls.FREQUENCY_SCALE:
+                            scale = cls.FREQUENCY_SCALE[option]
+                        elif option in ('DB', 'MA', 'RI'):
+                            data_format = option
+                    continue
+                numbers.extend(float(value) for value in line.split())
+        # One frequency followed by a pair per S-parameter: 3 numbers for one port, 9 for two
+        width = 3 if path.lower().endswith('.s1p') else 9
+        data = np.array(numbers).reshape(-1, width)
+        first, second = (data[:, 1], data[:, 2]) if width == 3 else (data[:, 3], data[:, 4])
+        if data_format == 'DB':
+            values = first
+        elif data_format == 'MA':
+            values = 20.0 * np.log10(np.maximum(first, 1e-12))
+        else:
+            values = 20.0 * np.log10(np.maximum(np.hypot(first, second), 1e-12))
+        return cls(data[:, 0] * scale, values)
+
+
+class SetupModel:
+    """
+    Frequency-dependent model of amplifier, cables and antenna.
+
+    Attributes:
+        antenna_factor (FrequencyTable or None): Antenna factor in dB/m.
+        amplifier_gain (FrequencyTable or None): Amplifier gain in dB.
+        cable_loss (FrequencyTable or None): Total cable loss from generator to antenna in dB.
+        antenna_gain_linear (float): Antenna gain used without an antenna factor table.
+        amplifier_gain_db (float): Amplifier gain used without a gain table, in dB.
+        cable_loss_db (float): Cable loss used without a loss table, in dB.
+        distance (float): Antenna to probe distance in meters.
+    """
+
+    def __init__(self, amplifier_gain_db: float = 40.0, antenna_gain_linear: float = 10.0,
+                 cable_loss_db: float = 0.0, distance: float = 1.0):
+        """
+        Initialize the model with scalar values; tables can be loaded afterwards.
+
+        Parameters:
+            amplifier_gain_db (float): Amplifier gain in dB.
+            antenna_gain_linear (float): Antenna gain as a linear factor.
+            cable_loss_db (float): Cable loss in dB.
+            distance (float): Antenna to probe distance in meters.
+        """
+        self.antenna_factor = None
+        self.amplifier_gain = None
+        self.cable_loss = None
+        self.antenna_gain_linear = antenna_gain_linear
+        self.amplifier_gain_db = amplifier_gain_db
+        self.cable_loss_db = cable_loss_db
+        self.distance = distance
+
+    @staticmethod
+    def tables_directory() -> str:
+        """
+        Returns:
+            str: ~/Documents/ImmuniSweep/Setup, where tables are looked up by equipment name.
+        """
+        return os.path.join(os.path.expanduser("~/Documents"), "ImmuniSweep", "Setup")
+
+    @staticmethod
+    def find_table(name: str) -> str | None:
+        """
+        Find the table of a piece of equipment, e.g. 'ETS 3143B.csv' or 'IFI SMX25.s2p'.
+
+        Parameters:
+            name (str): Equipment name as shown in the UI.
+
+        Returns:
+            str or None: The path, or None if there is no table.
+        """
+        for extension in ('.csv', '.s2p', '.s1p'):
+            path = os.path.join(SetupModel.tables_directory(), name + extension)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def loadTables(self, amplifier: str, antenna: str, cable: str = 'Cables'):
+        """
+        Load whichever tables exist for the selected equipment and fall back to the scalar
+        values for the rest.
+
+        Parameters:
+            amplifier (str): Amplifier name; its table holds the gain.
+            antenna (str): Antenna name; its table holds the antenna factor.
+            cable (str): Name of the cable loss table.
+        """
+        self.amplifier_gain = self._load(self.find_table(amplifier))
+        self.antenna_factor = self._load(self.find_table(antenna))
+        cable_loss = self._load(self.find_table(cable))
+        # Touchstone tables hold transmission, which is the negative loss
+        if cable_loss is not None and np.mean(cable_loss.values) < 0.0:
+            cable_loss = FrequencyTable(cable_loss.frequencies, -cable_loss.values)
+        self.cable_loss = cable_loss
+
+    def _load(self, path: str | None) -> FrequencyTable | None:
+        if path is None:
+            return None
+        try:
+            table = FrequencyTable.load(path)
+        except (OSError, ValueError) as e:
+            print(f'Unable to load {path}: {str(e)}')
+            return None
+        print(f'Loaded {len(table)} points from {path}')
+        return table
+
+    @staticmethod
+    def _constant(frequency, value: float):
+        # A scalar fallback shaped like the frequency argument
+        return value if np.ndim(frequency) == 0 else np.full(np.shape(frequency), value)
+
+    def antennaGain(self, frequency):
+        """
+        Parameters:
+            frequency (float or np.ndarray): Frequency in MHz.
+
+        Returns:
+            float or np.ndarray: Antenna gain in dBi.
+        """
+        if self.antenna_factor is None:
+            return self._constant(frequency, 10.0 * math.log10(self.antenna_gain_linear))
+        return antenna_gain_from_factor(frequency, self.antenna_factor.at(frequency))
+
+    def amplifierGain(self, frequency):
+        """
+        Parameters:
+            frequency (float or np.ndarray): Frequency in MHz.
+
+        Returns:
+            float or np.ndarray: Amplifier gain in dB.
+        """
+        if self.amplifier_gain is None:
+            return self._constant(frequency, self.amplifier_gain_db)
+        return self.amplifier_gain.at(frequency)
+
+    def cableLoss(self, frequency):
+        """
+        Parameters:
+            frequency (float or np.ndarray): Frequency in MHz.
+
+        Returns:
+            float or np.ndarray: Cable loss in dB.
+        """
+        if self.cable_loss is None:
+            return self._constant(frequency, self.cable_loss_db)
+        return self.cable_loss.at(frequency)
+
+    def powerFor(self, frequency, field, distance: float | None = None):
+        """
+        Predict the generator power that produces a field, from the far-field relation
+        E = sqrt(30 * P * G) / d.
+
+        Parameters:
+            frequency (float or np.ndarray): Frequency in MHz.
+            field (float or np.ndarray): Field strength in V/m.
+            distance (float or None): Distance in meters; defaults to the model distance.
+
+        Returns:
+            float or np.ndarray: Generator power in dBm.
+        """
+        distance = self.distance if distance is None else distance
+        antenna_watts = (np.asarray(field) * distance) ** 2 / (30.0 * 10.0 ** (self.antennaGain(frequency) / 10.0))
+        power = 10.0 * np.log10(antenna_watts * 1000.0) - self.amplifierGain(frequency) + self.cableLoss(frequency)
+        return float(power) if np.ndim(power) == 0 else power
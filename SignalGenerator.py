@@ -1,14 +1,15 @@
 import time
-import socketscpi
-import socket
 import threading
 import serial
 from serial import serialutil, SerialException
 import queue
-import ping3
 import math
+import asyncio
+import concurrent.futures
 from PyQt5.QtCore import QObject, pyqtSignal
 from enum import Enum
+from SCPIClient import SCPIInstrument, SCPIError, SCPITimeoutError, LatencyStats, get_shared_loop
+from InstrumentDiscovery import discover_instrument
 
 class Modulation(Enum):
     AM = 1
@@ -59,6 +60,7 @@ class SCPI(Enum):
     AMFreqStep = ':AM:INT:FREQ:STEP'
     AMLinDepth = ':AM:DEPT:LIN'
     AMExpDepth = ':AM:DEPT:EXP'
+    AMDepth = ':AM:DEPT'
     FMState = ':FM:STAT'
     FMSource = ':FM:SOUR'
     FMCoupling = ':FM:EXT:COUP'
@@ -301,16 +303,32 @@ class AgilentN5181A(QObject):
     modDepthSet = pyqtSignal(float)
     rfOutSet = pyqtSignal(bool)
     
-    def __init__(self, ip_address: str = '192.168.100.79',  port: int = 5024):
+    MODEL = 'N5181A'
+    
+    def __init__(self, ip_address: str = '192.168.100.79',  port: int = 5025, timeout: float = 2.0, discovery_hosts: list | None = None):
         super().__init__()
         self.ip_address = ip_address
         self.port = port
+        self.timeout = timeout
+        # Try the configured address first, then the rest of its /24 subnet
+        self.discovery_hosts = discovery_hosts if discovery_hosts is not None else [ip_address, f'{ip_address}/24']
+        self.discovery_timeout = 3.0
+        self.retry_interval = 5.0
+        self.detecting = False
+        self.detect_future = None
         self.instrument = None
         self.is_running = False
         self.power = 0.0
         self.frequency = 300.0
         self.commandQueue = queue.Queue()
         self.write_thread = None
+        # Shadow of the instrument state: last acknowledged command per type, and the
+        # RF/modulation states last reported, so signals fire only on real changes
+        self.shadow = {}
+        self.rf_on = None
+        self.mod_on = None
+        self.status_interval = 0.5
+        self.last_traffic = time.time()
         self.runSweep = False
         self.commandLock = threading.Lock()
         self.sweepType = Sweep.OFF
@@ -326,45 +344,58 @@ class AgilentN5181A(QObject):
     
     def detect(self):
         print('Detecting.')
-        self.ping_started = True
-        self.ping_thread = threading.Thread(target=self.check_static_ip)
-        self.count = 4
-        print('Starting ping thread.')
-        self.ping_thread.start()
+        self.stopDetection()
+        self.detecting = True
+        self.detect_future = asyncio.run_coroutine_threadsafe(self.discover(), get_shared_loop())
         
     def retryDetection(self):
-        self.count = 4
-        self.ping_started = True
+        if self.detect_future is None or self.detect_future.done():
+            self.detect()
     
     def stopDetection(self):
-        self.ping_started = False
-        self.ping_thread.join()
+        self.detecting = False
+        if self.detect_future is not None and not self.detect_future.done():
+            self.detect_future.cancel()
+
+    async def discover(self):
+        alerted = False
+        while self.detecting:
+            instrument = await discover_instrument(self.MODEL, self.discovery_hosts, (self.port,), total_timeout=self.discovery_timeout)
+            if instrument is not None:
+                print(f'Found {instrument.identity} at {instrument.host}:{instrument.port}')
+                self.ip_address = instrument.host
+                self.port = instrument.port
+                self.detected = True
+                self.instrumentDetected.emit(True)
+                return instrument
+            if not alerted:
+                self.instrumentDetected.emit(False)
+                alerted = True
+            await asyncio.sleep(self.retry_interval)
 
     def stop(self):
         self.commandQueue.put((SCPI.Exit, f'{SCPI.RFOut.value} {SCPI.Off.value}'))
         self.is_running = False
-        self.ping_started = False
-        if self.ping_thread is not None and self.ping_thread.is_alive():
-            self.ping_thread.join()
+        self.stopDetection()
         if self.write_thread is not None and self.write_thread.is_alive():
             self.write_thread.join()
+        if self.instrument is not None:
+            self.instrument.close()
         
     def connect(self):
         try:
-            self.instrument = socketscpi.SocketInstrument(self.ip_address)
+            # Connection is served by the event loop shared with every other LAN instrument
+            self.instrument = SCPIInstrument(self.ip_address, self.port, self.timeout)
+            self.instrument.connect()
+            self.shadow = {}
+            self.rf_on = None
+            self.mod_on = None
             self.instrumentConnected.emit(self.instrument.instId)
             self.write_thread = threading.Thread(target=self.writeSCPI)
             self.is_running = True
             self.clearing = False
             self.write_thread.start()
-        except socketscpi.SockInstError as e:
-            self.error.emit(str(e))
-            print(f'Error on connect: {str(e)}')
-            self.is_running = False
-        except socket.timeout as e:
-            self.error.emit(str(e))
-            print(f'Socket Error: {str(e)}')
-        except ConnectionRefusedError as e:
+        except SCPIError as e:
             self.error.emit(str(e))
             print(f'Error on connect: {str(e)}')
             self.is_running = False
@@ -402,6 +433,7 @@ class AgilentN5181A(QObject):
         self.instrument.write(f'{SCPI.Power.value} {str(round(pow, 3))} {SCPI.dBm.value}')
         complete = self.instrument.query(SCPI.OperationComplete.value)
         self.power = float(self.instrument.query(f'{SCPI.Power.value}?'))
+        self.last_traffic = time.time()
         return self.power
     
     def getPower(self) -> float:
@@ -525,110 +557,115 @@ class AgilentN5181A(QObject):
 
     def clearErrors(self):
         try:
-            self.instrument.err_check()
-        except socketscpi.SockInstError as e:
-            self.error.emit(e)
+            # Drain the instrument error queue; '+0,"No error"' marks the end
+            for _ in range(32):
+                error = self.instrument.query(':SYST:ERR?')
+                if error.startswith('+0') or error.startswith('0,'):
+                    break
+                self.error.emit(error)
+        except SCPIError as e:
+            self.error.emit(str(e))
+    
+    def updateRFState(self, on: bool):
+        self.shadow[SCPI.RFOut] = f'{SCPI.RFOut.value} {SCPI.On.value if on else SCPI.Off.value}'
+        if on != self.rf_on:
+            self.rf_on = on
+            self.rfOutSet.emit(on)
+            
+    def updateModulationState(self, on: bool):
+        self.shadow[SCPI.ModulationState] = f'{SCPI.ModulationState.value} {SCPI.On.value if on else SCPI.Off.value}'
+        if on != self.mod_on:
+            self.mod_on = on
+            self.modStateSet.emit(on)
+    
+    def pollStatus(self):
+        # Status byte, RF state and modulation state in a single round trip
+        reply = self.instrument.query(f'*STB?;{SCPI.RFOut.value}?;{SCPI.ModulationState.value}?')
+        status, rf, mod = reply.split(';')
+        self.updateRFState(bool(int(float(rf))))
+        self.updateModulationState(bool(int(float(mod))))
+        if int(float(status)) & 0x04:
+            # Error/event queue not empty
+            self.clearErrors()
+        self.last_traffic = time.time()
     
     def writeSCPI(self):
-        last_state_update = time.time()
         print("Starting SCPI comms loop...")
         while self.is_running:
-            # This will block until a command is availible
             if self.clearing:
                 print("Blocking Loop until command Queue is empty.")
                 self.commandQueue.join()
             else:
-                if time.time() - last_state_update > 0.5:
-                    state = self.instrument.query(f'{SCPI.RFOut.value}?')
-                    self.rfOutSet.emit(bool(int(float(state))))
-                    last_state_update = time.time()
-                print("Command queue size: " + str(self.commandQueue.qsize()))
-                command = self.commandQueue.get()
-                commandType = command[0]
-                commandValue = command[1]
-                if commandType == SCPI.Exit:
-                    print('Exiting write thread')
-                    break
-                self.instrument.write(commandValue)
-                complete = self.instrument.query(SCPI.OperationComplete.value)
-                state = self.instrument.query(f'{commandType.value}?')
-                if commandType == SCPI.Identity: 
-                    self.instrumentConnected.emit(state)
-                elif commandType == SCPI.RFOut:
-                    self.rfOutSet.emit(bool(int(float(state))))
-                elif commandType == SCPI.Power:
-                    print(f'Power: {state}')
-                    self.power = float(state)
-                elif commandType == SCPI.Frequency:
-                    self.frequency = float(state)
-                elif commandType == SCPI.ModulationState:
-                    self.modStateSet.emit(bool(int(state)))
-                elif commandType == SCPI.AMState:
-                    self.modSubStateSet.emit(Modulation.AM.value, bool(int(state)))
-                elif commandType == SCPI.AMType:
-                    self.amTypeSet.emit(SCPI.Linear.value == state)
-                elif commandType == SCPI.AMMode:
-                    self.modModeSet.emit(Modulation.AM.value, SCPI.Normal.value == state)
-                elif commandType == SCPI.AMSource:
-                    self.modSourceSet.emit(Modulation.AM.value, SCPI.Internal.value == state)
-                elif commandType == SCPI.AMLinDepth:
-                    self.modDepthSet.emit(float(state))
-                elif commandType == SCPI.AMExpDepth:
-                    self.modDepthSet.emit(float(state))
-                elif commandType == SCPI.AMCoupling:
-                    self.modCouplingSet.emit(Modulation.AM.value, state == SCPI.AC.value)
-                elif commandType == SCPI.AMFreq:
-                    self.modFreqSet.emit(Modulation.AM.value, float(state))
-                elif commandType == SCPI.FMState:
-                    self.modSubStateSet.emit(Modulation.FM.value, bool(int(state)))
-                elif commandType == SCPI.FMSource:
-                    self.modSourceSet.emit(Modulation.FM.value, SCPI.Internal.value == state)
-                elif commandType == SCPI.FMCoupling:
-                    self.modCouplingSet(Modulation.FM.value, state == SCPI.AC.value)
-                elif commandType == SCPI.FMFreq:
-                    self.modFreqSet.emit(Modulation.FM.value, float(state))
-                elif commandType == SCPI.PMState:
-                    self.modSubStateSet.emit(Modulation.PM.value, bool(int(state)))
-                elif commandType == SCPI.PMBand:
-                    self.modModeSet.emit(Modulation.PM.value, SCPI.Normal.value == state)
-                elif commandType == SCPI.PMSource:
-                    self.modSourceSet.emit(Modulation.PM.value, SCPI.Internal.value == state)
-                elif commandType == SCPI.PMCoupling:
-                    self.modCouplingSet.emit(Modulation.PM.value, SCPI.AC.value == state)
-                elif commandType == SCPI.PMFreq:
-                    self.modFreqSet.emit(Modulation.PM.value, float(state))
-    
-                
-    def check_static_ip(self):
-        responded = False
-        undetected_alert = False
-        while self.ping_started and not responded:
-            print('Ping started.')
-            try:
-                print('Pinging...')
-                response_time = ping3.ping(self.ip_address, timeout = 0.5)
-                print(f'Response: {str(response_time)}')
-                if response_time is not None and response_time:
-                    if response_time:
-                        self.instrumentDetected.emit(True)
-                        self.detected = True
-                        responded = True
-                    else:
-                        print(str(response_time))
-                else:
-                    if (self.count == 0):
-                        if not undetected_alert:
-                            self.instrumentDetected.emit(False)
-                            undetected_alert = True
-                    else:
-                        self.count -= 1
-            except Exception as e:
-                print(f'Network Error {str(e)}')
-                if (self.count == 0):
-                        self.error.emit(f'Network error occurred: {str(e)}')
-                else:
-                    self.count -= 1
-                    
+                try:
+                    try:
+                        command = self.commandQueue.get(timeout=self.status_interval)
+                    except queue.Empty:
+                        # Only poll when the link has been idle; setPower traffic bypasses the queue
+                        if self.is_running and time.time() - self.last_traffic >= self.status_interval:
+                            self.pollStatus()
+                        continue
+                    commandType = command[0]
+                    commandValue = command[1]
+                    if commandType == SCPI.Exit:
+                        print('Exiting write thread')
+                        break
+                    if commandType != SCPI.Identity and self.shadow.get(commandType) == commandValue:
+                        # Instrument already in the requested state
+                        continue
+                    self.instrument.write(commandValue)
+                    complete = self.instrument.query(SCPI.OperationComplete.value)
+                    state = self.instrument.query(f'{commandType.value}?')
+                    self.shadow[commandType] = commandValue
+                    self.last_traffic = time.time()
+                    if commandType == SCPI.Identity: 
+                        self.instrumentConnected.emit(state)
+                    elif commandType == SCPI.RFOut:
+                        self.updateRFState(bool(int(float(state))))
+                    elif commandType == SCPI.Power:
+                        print(f'Power: {state}')
+                        self.power = float(state)
+                    elif commandType == SCPI.Frequency:
+                        self.frequency = float(state)
+                    elif commandType == SCPI.ModulationState:
+                        self.updateModulationState(bool(int(state)))
+                    elif commandType == SCPI.AMState:
+                        self.modSubStateSet.emit(Modulation.AM.value, bool(int(state)))
+                    elif commandType == SCPI.AMType:
+                        self.amTypeSet.emit(SCPI.Linear.value == state)
+                    elif commandType == SCPI.AMMode:
+                        self.modModeSet.emit(Modulation.AM.value, SCPI.Normal.value == state)
+                    elif commandType == SCPI.AMSource:
+                        self.modSourceSet.emit(Modulation.AM.value, SCPI.Internal.value == state)
+                    elif commandType == SCPI.AMLinDepth:
+                        self.modDepthSet.emit(float(state))
+                    elif commandType == SCPI.AMExpDepth:
+                        self.modDepthSet.emit(float(state))
+                    elif commandType == SCPI.AMCoupling:
+                        self.modCouplingSet.emit(Modulation.AM.value, state == SCPI.AC.value)
+                    elif commandType == SCPI.AMFreq:
+                        self.modFreqSet.emit(Modulation.AM.value, float(state))
+                    elif commandType == SCPI.FMState:
+                        self.modSubStateSet.emit(Modulation.FM.value, bool(int(state)))
+                    elif commandType == SCPI.FMSource:
+                        self.modSourceSet.emit(Modulation.FM.value, SCPI.Internal.value == state)
+                    elif commandType == SCPI.FMCoupling:
+                        self.modCouplingSet(Modulation.FM.value, state == SCPI.AC.value)
+                    elif commandType == SCPI.FMFreq:
+                        self.modFreqSet.emit(Modulation.FM.value, float(state))
+                    elif commandType == SCPI.PMState:
+                        self.modSubStateSet.emit(Modulation.PM.value, bool(int(state)))
+                    elif commandType == SCPI.PMBand:
+                        self.modModeSet.emit(Modulation.PM.value, SCPI.Normal.value == state)
+                    elif commandType == SCPI.PMSource:
+                        self.modSourceSet.emit(Modulation.PM.value, SCPI.Internal.value == state)
+                    elif commandType == SCPI.PMCoupling:
+                        self.modCouplingSet.emit(Modulation.PM.value, SCPI.AC.value == state)
+                    elif commandType == SCPI.PMFreq:
+                        self.modFreqSet.emit(Modulation.PM.value, float(state))
+                except SCPIError as e:
+                    self.error.emit(str(e))
+                    print(f'SCPI Error: {str(e)}')
+
 
 class HPE4421B(QObject):
     identityReceived = pyqtSignal(str)
@@ -637,37 +674,41 @@ class HPE4421B(QObject):
     frequencySet = pyqtSignal(float)
     rfOutSet = pyqtSignal(bool)
     
-    def __init__(self, serial_port: str = 'COM3'):
+    MAX_BATCH = 16
+    MAX_MESSAGE_LENGTH = 200
+    MAX_REPLY_BYTES = 4096
+    
+    def __init__(self, serial_port: str = 'COM3', timeout: float = 1.0):
         super().__init__()
         self.serial_port = serial_port
+        self.timeout = timeout
         self.instrument = None
         self.is_running = False
-        self.comms_thread = None
+        self.command_thread = None
         self.power = 0.0
         self.frequency = 150.0
+        self.rf_on = None
         self.command_queue = queue.Queue()
         self.command_lock = threading.Lock()
         self.clearing = False
         self.detected = False
+        # Shadow of acknowledged settings, used to skip redundant writes like the LAN driver
+        self.shadow = {}
+        self.stats = LatencyStats()
         
     def connect_to_instrument(self):
         try:
-            self.instrument = serial.Serial(self.serial_port, baudrate=19200, bytesize=serial.EIGHTBITS, parity=serial.PARITY_NONE, stopbits=serial.STOPBITS_ONE, timeout=1, xonxoff=False, rtscts=False)
+            self.instrument = serial.Serial(self.serial_port, baudrate=19200, bytesize=serial.EIGHTBITS, parity=serial.PARITY_NONE, stopbits=serial.STOPBITS_ONE, timeout=self.timeout, xonxoff=False, rtscts=False)
             self.instrument.setDTR(True)
+            self.instrument.reset_input_buffer()
+            self.shadow = {}
             self.command_thread = threading.Thread(target=self.process_commands)
             self.is_running = True
             self.clearing = False
             self.command_thread.start()
-        except socketscpi.SockInstError as e:
-            self.error.emit(str(e))
-            print(f'Error on connect: {str(e)}')
-            self.is_running = False
-        except socket.timeout as e:
-            self.error.emit(str(e))
-            print(f'Socket Error: {str(e)}')
-        except ConnectionRefusedError as e:
+        except serialutil.SerialException as e:
             self.error.emit(str(e))
-            print(f'Error Connection Refused: {str(e)}')
+            print(f'Serial Error: {str(e)}')
             self.is_running = False
         except Exception as e:
             self.error.emit(f'Unknown Error: {str(e)}')
@@ -679,21 +720,95 @@ class HPE4421B(QObject):
         return identity
     
     def __parse_power(self, power: str):
-        self.power = float(power.strip())
-        self.powerSet.emit(self.power)
+        power = float(power.strip())
+        self.shadow[SCPI.Power] = power
+        if power != self.power:
+            self.power = power
+            self.powerSet.emit(self.power)
         return self.power
     
     def __parse_frequency(self, freq: str):
-        self.frequency = float(freq.strip())
-        self.frequencySet.emit(self.frequency)
+        frequency = float(freq.strip())
+        self.shadow[SCPI.Frequency] = frequency
+        if frequency != self.frequency:
+            self.frequency = frequency
+            self.frequencySet.emit(self.frequency)
         return self.frequency
     
     def __parse_rf_out(self, state: str):
-        #TODO: Implement RF Out state parsing
-        return state
+        on = bool(int(float(state.strip())))
+        self.shadow[SCPI.RFOut] = on
+        if on != self.rf_on:
+            self.rf_on = on
+            self.rfOutSet.emit(on)
+        return on
+    
+    def __submit(self, command: 'SCPICommand') -> concurrent.futures.Future:
+        self.command_queue.put(command)
+        return command.future
+    
+    def __set(self, key: SCPI, value, command: str, applied) -> concurrent.futures.Future:
+        # Write-only set command; skipped when the instrument already holds the value
+        if self.shadow.get(key) == value:
+            future = concurrent.futures.Future()
+            future.set_result(value)
+            return future
+        self.shadow[key] = value
+        future = self.__submit(SCPICommand(command))
+        future.add_done_callback(lambda f: applied(value) if not f.cancelled() and f.exception() is None else self.shadow.pop(key, None))
+        return future
+    
+    def __frequency_applied(self, frequency: float):
+        if frequency != self.frequency:
+            self.frequency = frequency
+            self.frequencySet.emit(frequency)
+    
+    def __power_applied(self, power: float):
+        if power != self.power:
+            self.power = power
+            self.powerSet.emit(power)
+    
+    def __rf_out_applied(self, on: bool):
+        if on != self.rf_on:
+            self.rf_on = on
+            self.rfOutSet.emit(on)
+    
+    def write(self, command: str) -> concurrent.futures.Future:
+        """
+        Queue a write-only command. Consecutive writes are pipelined into one program message.
+
+        Args:
+            command (str): The SCPI command.
+
+        Returns:
+            concurrent.futures.Future: Resolves to None once the command has been sent.
+        """
+        return self.__submit(SCPICommand(command))
+    
+    def query(self, command: str, parser=None) -> concurrent.futures.Future:
+        """
+        Queue a query. Consecutive queries are batched into one program message and one reply.
+
+        Args:
+            command (str): The SCPI query.
+            parser (callable): Optional parser applied to the reply.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the parsed reply.
+        """
+        return self.__submit(SCPICommand(command, parser))
+    
+    def sync(self) -> concurrent.futures.Future:
+        """
+        Queue *OPC? behind every command queued so far.
+
+        Returns:
+            concurrent.futures.Future: Resolves once the instrument has completed all of them.
+        """
+        return self.query(SCPI.OperationComplete.value)
     
     def get_identity(self):
-        self.command_queue.put(SCPICommand(f'{SCPI.Identity}?', self.__parse_identity))
+        return self.query(f'{SCPI.Identity.value}?', self.__parse_identity)
         
     def get_power(self):
         return self.power
@@ -701,38 +816,148 @@ class HPE4421B(QObject):
     def get_frequency(self):
         return self.frequency
         
-    def set_frequency(self, freq: float):
-        self.command_queue.put(SCPICommand(f'{SCPI.Frequency} {str(freq)}', parser=None))
-        self.command_queue.put(SCPICommand(f'{SCPI.Frequency}?', self.__parse_frequency))
-        
-    def set_power(self, power: float):
-        self.command_queue.put(SCPICommand(f'{SCPI.Power} {str(power)}', parser=None))
-        self.command_queue.put(SCPICommand(f'{SCPI.Power}?', self.__parse_power))
+    def set_frequency(self, freq: float, readback: bool = False):
+        future = self.__set(SCPI.Frequency, float(freq), f'{SCPI.Frequency.value} {float(freq)}', self.__frequency_applied)
+        if readback:
+            return self.query(f'{SCPI.Frequency.value}?', self.__parse_frequency)
+        return future
+        
+    def set_power(self, power: float, readback: bool = False):
+        future = self.__set(SCPI.Power, float(power), f'{SCPI.Power.value} {float(power)} {SCPI.dBm.value}', self.__power_applied)
+        if readback:
+            return self.query(f'{SCPI.Power.value}?', self.__parse_power)
+        return future
+
+    def set_am(self, on: bool, depth: float = 80.0, frequency: float = 1000.0) -> concurrent.futures.Future:
+        """
+        Configure internal AM and switch it and the modulation output on or off.
 
-    def set_rf_out(self, on: bool):
-        #TODO; Ensure command
-        self.command_queue.put(SCPICommand(f'{SCPI.RFOut} {SCPI.On.value if on else SCPI.Off.value}', parser=None))
-        self.command_queue.put(SCPICommand(f'{SCPI.RFOut}?', self.__parse_rf_out))
+        Args:
+            on (bool): Enable AM.
+            depth (float): Modulation depth in percent.
+            frequency (float): Internal modulation frequency in Hz.
+
+        Returns:
+            concurrent.futures.Future: Resolves once the last command has been sent.
+        """
+        state = SCPI.On.value if on else SCPI.Off.value
+        self.__set(SCPI.AMSource, SCPI.Internal.value, f'{SCPI.AMSource.value} {SCPI.Internal.value}', lambda value: None)
+        self.__set(SCPI.AMDepth, float(depth), f'{SCPI.AMDepth.value} {float(depth)}', lambda value: None)
+        self.__set(SCPI.AMFreq, float(frequency), f'{SCPI.AMFreq.value} {float(frequency)} {Frequency.Hz.value}', lambda value: None)
+        self.__set(SCPI.AMState, on, f'{SCPI.AMState.value} {state}', lambda value: None)
+        return self.__set(SCPI.ModulationState, on, f'{SCPI.ModulationState.value} {state}', lambda value: None)
+
+    def set_rf_out(self, on: bool, readback: bool = True):
+        future = self.__set(SCPI.RFOut, on, f'{SCPI.RFOut.value} {SCPI.On.value if on else SCPI.Off.value}', self.__rf_out_applied)
+        if readback:
+            return self.query(f'{SCPI.RFOut.value}?', self.__parse_rf_out)
+        return future
+    
+    def clearQueue(self):
+        while True:
+            try:
+                command = self.command_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(command, SCPICommand):
+                command.future.cancel()
 
     def stop_thread(self):
         self.is_running = False
-        self.command_thread.join()
+        self.command_queue.put(None)
+        if self.command_thread is not None and self.command_thread.is_alive():
+            self.command_thread.join()
+        self.clearQueue()
+        if self.instrument is not None and self.instrument.is_open:
+            self.instrument.close()
             
     def process_commands(self):
-        #TODO: Implement command processing for HPE4421B
         while self.is_running:
-            if self.clearing:
-                self.command_queue.join()
-            else:
+            try:
+                command = self.command_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if command is None:
+                break
+            batch = [command]
+            # Gather whatever else is already queued into one batch
+            while len(batch) < self.MAX_BATCH:
                 try:
-                    command: SCPICommand = self.command_queue.get()
-                    self.instrument.write(command.command.encode())
-                    if command.parser:
-                        response = self.instrument.readline().decode()
-                        command.parse_response(response)
-                except serialutil.SerialException as e:
-                    self.error.emit(str(e))
-                    print(f'Serial Error: {str(e)}')
+                    command = self.command_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if command is None:
+                    self.is_running = False
+                    break
+                batch.append(command)
+            for message in self.__split_messages(batch):
+                self.__execute(message)
+    
+    def __split_messages(self, batch: list) -> list:
+        messages = []
+        current = []
+        length = 0
+        for command in batch:
+            if not command.future.set_running_or_notify_cancel():
+                continue
+            if current and length + len(command.command) + 1 > self.MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = []
+                length = 0
+            current.append(command)
+            length += len(command.command) + 1
+        if current:
+            messages.append(current)
+        return messages
+        
+    def __execute(self, message: list):
+        queries = [command for command in message if command.is_query]
+        # A timed out or garbled message is sent again, as often as its least patient command allows
+        attempts = 1 + min(command.retries for command in message)
+        timeout = self.instrument.timeout
+        try:
+            for attempt in range(attempts):
+                try:
+                    responses = self.__transfer(message, queries)
+                    break
+                except SCPIError as e:
+                    if attempt + 1 == attempts:
+                        raise
+                    print(f'Retrying HPE4421B message after error: {str(e)}')
+            for command in message:
+                if not command.is_query:
+                    command.future.set_result(None)
+            for command, response in zip(queries, responses):
+                try:
+                    command.future.set_result(command.parse_response(response))
+                except Exception as e:
+                    command.future.set_exception(e)
+        except (serialutil.SerialException, SCPIError) as e:
+            self.error.emit(str(e))
+            print(f'Serial Error: {str(e)}')
+            for command in message:
+                if not command.future.done():
+                    command.future.set_exception(e)
+        finally:
+            self.instrument.timeout = timeout
+
+    def __transfer(self, message: list, queries: list) -> list:
+        started = time.perf_counter()
+        self.instrument.write((';'.join(command.command for command in message) + '\n').encode())
+        if not queries:
+            return []
+        self.instrument.timeout = max(command.timeout for command in queries)
+        reply = self.instrument.read_until(b'\n', self.MAX_REPLY_BYTES)
+        if not reply.endswith(b'\n'):
+            # Incomplete reply: discard whatever arrived so the next reply starts clean
+            self.instrument.reset_input_buffer()
+            raise SCPITimeoutError(f'Timed out waiting for reply to {[command.command for command in queries]}')
+        self.stats.record(time.perf_counter() - started)
+        responses = reply.decode(errors='replace').strip().split(';')
+        if len(responses) != len(queries):
+            self.instrument.reset_input_buffer()
+            raise SCPIError(f'Expected {len(queries)} replies, received {reply!r}')
+        return responses
     
     
 class SCPICommand:
@@ -744,12 +969,22 @@ class SCPICommand:
             command (str): The SCPI command string to send.
             parser (callable): A function or callable to parse the response. Defaults to None.
             timeout (float): Time in seconds to wait for a response. Defaults to 1.0.
-            retries (int): Number of retries if the command fails. Defaults to 3.
+            retries (int): Number of times the command is sent again after a timed out or
+                malformed reply. Defaults to 3.
         """
         self.command = command
         self.parser = parser
         self.timeout = timeout
         self.retries = retries
+        self.future = concurrent.futures.Future()
+
+    @property
+    def is_query(self):
+        """
+        Returns:
+            bool: True if the command header ends with '?' and a reply is expected.
+        """
+        return self.command.split(' ', 1)[0].endswith('?')
 
     def parse_response(self, response):
         """
@@ -1,23 +1,40 @@
-import time
-import socket
+import math
+
+import numpy as np
+
+from SCPIClient import SCPIInstrument
 
 class HPE4440A:
-    def __init__(self, ip, port=5025, timeout=2):
+    # Resolution bandwidths selectable in zero span, in Hz (1-3-10 sequence)
+    RBW_STEPS = (1, 3, 10, 30, 100, 300, 1e3, 3e3, 10e3, 30e3, 100e3, 300e3, 1e6, 3e6)
+    MIN_SWEEP_TIME = 1e-4
+    
+    def __init__(self, ip, port=5025, timeout=2, buffer_size=65536):
         """
         Initialize the Spectrum Analyzer connection.
         
+        The connection is served by the asyncio event loop shared with the other LAN
+        instruments. Replies are framed by their newline terminator, or by the
+        #<n><len> header for binary blocks, so reading blocks only until the whole
+        reply has arrived and needs no fixed delay.
+        
         :param ip: IP address of the spectrum analyzer.
         :param port: TCP port (default 5025, common for SCPI instruments).
-        :param timeout: Socket timeout in seconds.
+        :param timeout: Reply timeout in seconds.
+        :param buffer_size: Initial size of the preallocated receive buffer in bytes.
         """
         self.ip = ip
         self.port = port
         self.timeout = timeout
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.settimeout(timeout)
-        self.socket.connect((ip, port))
-        # Give the instrument a moment to be ready.
-        time.sleep(0.2)
+        self.instrument = SCPIInstrument(ip, port, timeout, buffer_size=buffer_size)
+        self.identity = self.instrument.connect()
+        # Last value written per setting, so repeated zero-span setups only send what changed
+        self.settings = {}
+        # Accuracy model for zero-span measurements
+        self.frequency_error = 2e-6     # Combined generator and analyzer tuning error, relative
+        self.sample_spread = 0.5        # Standard deviation of one RBW-limited sample in dB
+        self.settling_cycles = 2.5      # RBW filter settling time in units of 1/RBW
+        self.min_rbw = 1e3              # Narrower filters only add settling time for a CW signal well above the noise
     
     def send_command(self, command):
         """
@@ -25,22 +42,17 @@ class HPE4440A:
         
         :param command: A string containing the SCPI command.
         """
-        full_command = command + "\n"
-        self.socket.sendall(full_command.encode('ascii'))
+        self.instrument.write(command)
     
-    def query(self, command, buffer_size=1024):
+    def query(self, command, timeout=None):
         """
         Send a SCPI query and return the response.
         
         :param command: A string containing the SCPI query.
-        :param buffer_size: The maximum number of bytes to read.
-        :return: The response string.
+        :param timeout: Reply timeout in seconds (default: the connection timeout).
+        :return: The response string, complete up to its terminator.
         """
-        self.send_command(command)
-        # A short delay may be necessary for the instrument to respond.
-        time.sleep(0.1)
-        data = self.socket.recv(buffer_size)
-        return data.decode('ascii').strip()
+        return self.instrument.query(command, timeout)
     
     def set_window(self, start_freq, stop_freq):
         """
@@ -55,8 +67,8 @@ class HPE4440A:
         """
         self.send_command(f"FREQ:STAR {start_freq}")
         self.send_command(f"FREQ:STOP {stop_freq}")
-        # Allow time for the instrument to update.
-        time.sleep(0.1)
+        self.settings.pop("FREQ:CENT", None)
+        self.settings.pop("FREQ:SPAN", None)
     
     def set_units(self, units):
         """
@@ -73,7 +85,7 @@ class HPE4440A:
         if unit not in ("V", "DBM", "DBMV", "DBUV", "W"):
             raise ValueError("Unsupported unit. Use 'V', 'DBMV', 'DBUV', 'W' or 'DBM'.")
         self.send_command(f"UNIT:POW {unit}")
-        time.sleep(0.1)
+        self.settings["UNIT:POW"] = unit
 
     def activate_marker(self, marker_number=1):
         """
@@ -84,7 +96,6 @@ class HPE4440A:
         if marker_number not in (1, 2, 3):
             raise ValueError("Invalid marker number. Use 1, 2, or 3.")
         self.send_command(f"CALC:MARK{marker_number}:MODE POS")
-        time.sleep(0.1)
         
     def set_frequency(self, frequency, marker_number=1):
         """
@@ -102,7 +113,6 @@ class HPE4440A:
         if frequency < 3 or frequency > 26.5e9:
             raise ValueError("Frequency out of range. Use 3 Hz - 26.5 GHz.")
         self.send_command(f"CALC:MARK{marker_number}:X {frequency}")
-        time.sleep(0.1)
     
     def read_voltage(self, marker_number=1):
         """
@@ -125,8 +135,174 @@ class HPE4440A:
             print(f"Failed to convert response '{response}' to float.")
             return None
 
+    def set_center_frequency(self, frequency, span=None):
+        """
+        Tune the analyzer to a center frequency, optionally changing the span.
+        
+        Both settings go out as one program message without waiting for a reply:
+            FREQ:CENT <frequency in Hz>
+            FREQ:SPAN <span in Hz>
+        
+        :param frequency: Center frequency in Hz.
+        :param span: Span in Hz, or None to keep the current span.
+        """
+        if frequency < 3 or frequency > 26.5e9:
+            raise ValueError("Frequency out of range. Use 3 Hz - 26.5 GHz.")
+        command = f"FREQ:CENT {frequency}"
+        self.settings["FREQ:CENT"] = frequency
+        if span is not None:
+            command += f";SPAN {span}"
+            self.settings["FREQ:SPAN"] = span
+        self.send_command(command)
+    
+    def single_sweep(self, timeout=None):
+        """
+        Take one sweep and block until it has completed (INIT:IMM synchronized with *OPC?).
+        
+        :param timeout: Reply timeout in seconds; should cover the sweep time.
+        """
+        self.apply_settings({"INIT:CONT": "OFF"})
+        self.query("INIT:IMM;*OPC?", timeout)
+    
+    def read_peak(self, marker_number=1):
+        """
+        Move the marker to the highest signal in the last sweep and return its amplitude.
+        
+        :param marker_number: The marker number to use (1, 2, or 3).
+        :return: The peak amplitude in the current analyzer units (float).
+        """
+        if marker_number not in (1, 2, 3):
+            raise ValueError("Invalid marker number. Use 1, 2, or 3.")
+        return float(self.query(f"CALC:MARK{marker_number}:MAX;:CALC:MARK{marker_number}:Y?"))
+
+    def apply_settings(self, settings):
+        """
+        Send the settings that differ from the last values written, as one program message.
+        
+        :param settings: Dict of SCPI header (without leading colon) to value.
+        """
+        changed = [f":{header} {value}" for header, value in settings.items() if self.settings.get(header) != value]
+        if changed:
+            self.send_command(";".join(changed))
+            self.settings.update(settings)
+    
+    def select_zero_span_settings(self, frequency, accuracy=0.5, am_frequency=None):
+        """
+        Pick the smallest resolution bandwidth and sweep time that meet an accuracy target.
+        
+        The model has three terms:
+            - Tuning error: the CW signal may sit frequency_error * f off center. For a
+              Gaussian RBW filter the level drops by 3.01 dB * (2 * offset / RBW)^2, which
+              must stay below half the accuracy target. The RBW is the smallest step
+              that satisfies this, but not below min_rbw.
+            - Settling: the RBW filter needs settling_cycles / RBW to respond.
+            - Averaging: one RBW-limited sample scatters by sample_spread; averaging
+              N = RBW * sweep time independent samples must bring this below half the target.
+        For an AM signal, the RBW is at least 3 times the AM rate so that the sidebands
+        are mostly inside the filter, and the sweep covers at least 10 AM periods.
+        
+        :param frequency: Measurement frequency in Hz.
+        :param accuracy: Level accuracy target in dB.
+        :param am_frequency: AM rate in Hz of the measured signal, or None for a CW signal.
+        :return: Tuple (rbw in Hz, sweep time in seconds).
+        """
+        offset = max(self.frequency_error * frequency, 1.0)
+        min_rbw = max(self.min_rbw, 2.0 * offset * math.sqrt(3.01 / (accuracy / 2.0)))
+        if am_frequency:
+            min_rbw = max(min_rbw, 3.0 * am_frequency)
+        rbw = next((step for step in self.RBW_STEPS if step >= min_rbw), self.RBW_STEPS[-1])
+        samples = max(1.0, (self.sample_spread / (accuracy / 2.0)) ** 2)
+        sweep_time = max(self.MIN_SWEEP_TIME, (self.settling_cycles + samples) / rbw)
+        if am_frequency:
+            sweep_time = max(sweep_time, 10.0 / am_frequency)
+        return rbw, sweep_time
+    
+    def configure_zero_span(self, frequency, accuracy=0.5, points=101, am_frequency=None):
+        """
+        Tune to a CW frequency in zero span with the average detector.
+        
+        Only settings that changed since the last call are sent, so stepping through
+        calibration frequencies usually costs a single FREQ:CENT write.
+        
+        :param frequency: Measurement frequency in Hz.
+        :param accuracy: Level accuracy target in dB, see select_zero_span_settings.
+        :param points: Trace points per sweep.
+        :param am_frequency: AM rate in Hz of the measured signal, or None for a CW signal.
+        :return: Tuple (rbw in Hz, sweep time in seconds) in use.
+        """
+        if frequency < 3 or frequency > 26.5e9:
+            raise ValueError("Frequency out of range. Use 3 Hz - 26.5 GHz.")
+        rbw, sweep_time = self.select_zero_span_settings(frequency, accuracy, am_frequency)
+        self.apply_settings({
+            "INIT:CONT": "OFF",
+            "FORM:DATA": "REAL,32",
+            "FORM:BORD": "NORM",
+            "FREQ:SPAN": 0,
+            "DET": "AVER",
+            "SWE:POIN": points,
+            "BAND:RES": rbw,
+            "SWE:TIME": f"{sweep_time:.6g}",
+            "FREQ:CENT": frequency,
+        })
+        return rbw, sweep_time
+    
+    def read_average(self, trace=1):
+        """
+        Fetch the last zero-span trace as a binary block and return its average level.
+        
+        Log-scaled points are averaged as powers, so the result is the RMS level of the
+        trace in the current analyzer units.
+        
+        :param trace: Trace number (1, 2 or 3).
+        :return: The average level (float).
+        """
+        if trace not in (1, 2, 3):
+            raise ValueError("Invalid trace number. Use 1, 2, or 3.")
+        levels = np.frombuffer(self.instrument.query_block(f"TRAC:DATA? TRACE{trace}"), dtype='>f4')
+        if self.settings.get("UNIT:POW", "DBM") in ("V", "W"):
+            return float(levels.mean())
+        return float(10.0 * np.log10(np.mean(np.power(10.0, levels / 10.0))))
+    
+    def measure_zero_span(self, frequency, accuracy=0.5, am_frequency=None):
+        """
+        Measure the detector-averaged level of a CW or AM signal at one frequency.
+        
+        :param frequency: Measurement frequency in Hz.
+        :param accuracy: Level accuracy target in dB.
+        :param am_frequency: AM rate in Hz of the measured signal, or None for a CW signal.
+        :return: The average level in the current analyzer units (float).
+        """
+        _, sweep_time = self.configure_zero_span(frequency, accuracy, am_frequency=am_frequency)
+        self.single_sweep(sweep_time + self.timeout)
+        return self.read_average()
+
+    def acquire_trace(self, trace=1):
+        """
+        Take a single sweep and return the whole trace in one binary block transfer.
+        
+        The sweep is triggered with INIT:IMM and synchronized with *OPC?, so the trace
+        is read only once it is complete. The data is transferred with FORM REAL,32 in
+        big-endian order and decoded with np.frombuffer without copying.
+        
+        :param trace: Trace number (1, 2 or 3).
+        :return: Tuple (frequencies, amplitudes) of NumPy arrays; frequencies in Hz,
+                 amplitudes in the current analyzer units.
+        """
+        if trace not in (1, 2, 3):
+            raise ValueError("Invalid trace number. Use 1, 2, or 3.")
+        self.apply_settings({"INIT:CONT": "OFF", "FORM:DATA": "REAL,32", "FORM:BORD": "NORM"})
+        start, stop, points, sweep_time = (float(value) for value in self.query(":FREQ:STAR?;STOP?;:SWE:POIN?;:SWE:TIME?").split(';'))
+        # The sweep must finish before *OPC? replies, so allow for the sweep time on top of the link timeout
+        self.query("INIT:IMM;*OPC?", timeout=sweep_time + self.timeout)
+        block = self.instrument.query_block(f"TRAC:DATA? TRACE{trace}")
+        amplitudes = np.frombuffer(block, dtype='>f4')
+        if len(amplitudes) != int(points):
+            print(f"Trace has {len(amplitudes)} points, expected {int(points)}.")
+        frequencies = np.linspace(start, stop, len(amplitudes))
+        return frequencies, amplitudes
+
     def close(self):
         """
         Close the connection to the spectrum analyzer.
         """
-        self.socket.close()
\ No newline at end of file
+        self.instrument.close()
\ No newline at end of file
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Sweep Recipe Module
+===================
+This module defines the sweep recipe: everything a radiated immunity sweep needs
+(setup, frequency plan, target field, dwell, modulation and leveling mode) in one JSON
+or TOML file, so sweeps can be stored, reviewed and run without re-entering them. A JSON
+file holds one recipe object or a list of them; a TOML file holds one recipe at the top
+level or several as [[recipe]] tables.
+
+    {
+        "name": "80-300 MHz 3 V/m",
+        "amplifier": "AR 25A250AMB", "antenna": "ETS 3143B",
+        "start": 80.0, "stop": 300.0, "term": 0.01,
+        "target": 3.0, "dwell": 1.0,
+        "modulation": {"enabled": true, "depth": 80.0, "frequency": 1.0}
+    }
+
+A recipe is validated once, when it is created, against the equipment tables of
+EquipmentLimits. It is then compiled into a SweepPlan: the list of step frequencies and
+the setup model's generator power per V/m at each of them, computed in one NumPy call.
+Plans are cached, so running the same recipe again, or starting the same settings from
+the UI, neither validates nor interpolates anything per step.
+
+Classes:
+    SweepRecipe: One sweep's settings, validated against the equipment tables.
+    SweepPlan: A recipe compiled into step frequencies and predicted powers.
+Functions:
+    sweep_frequencies: The step frequencies of a logarithmic sweep.
+"""
+
+import json
+import math
+import os
+import tomllib
+
+import numpy as np
+
+from EquipmentLimits import AMPLIFIERS, ANTENNAS, EquipmentLimits
+from SetupModel import SetupModel
+
+
+def sweep_frequencies(start: float, stop: float, term: float) -> np.ndarray:
+    """
+    The frequencies of a sweep that steps by a relative term, as FieldController does,
+    ending exactly at the stop frequency.
+
+    Parameters:
+        start (float): Start frequency in MHz.
+        stop (float): Stop frequency in MHz.
+        term (float): Relative frequency step, e.g. 0.01 for 1 %.
+
+    Returns:
+        np.ndarray: Step frequencies in MHz, ascending.
+    """
+    steps = int(math.ceil(math.log(stop / start) / math.log(1.0 + term)))
+    frequencies = start * (1.0 + term) ** np.arange(steps)
+    # Drop a step that rounding put on or right below the stop frequency
+    frequencies = frequencies[frequencies < stop * (1.0 - term * 1e-6)]
+    return np.append(frequencies, stop)
+
+
+class SweepRecipe:
+    """
+    Settings of one sweep.
+
+    Attributes:
+        name (str): Name used for the result files.
+        amplifier (str): Amplifier name as in the UI and EquipmentLimits.AMPLIFIERS.
+        antenna (str): Antenna name as in the UI and EquipmentLimits.ANTENNAS.
+        start (float): Start frequency in MHz.
+        stop (float): Stop frequency in MHz.
+        term (float): Relative frequency step.
+        target (float): Target field in V/m.
+        dwell (float): Dwell per frequency in seconds.
+        modulation (dict): 'enabled', 'depth' in % and 'frequency' in kHz of the AM.
+        max_power (float): Highest generator power in dBm; defaults to the amplifier's limit.
+        amplifier_gain (float): Amplifier gain in dB where there is no gain table;
+            defaults to the amplifier's specification.
+        antenna_gain (float): Linear antenna gain where there is no antenna factor table;
+            defaults to the antenna's specification.
+        distance (float): Antenna to probe distance in meters.
+        pid (str, list or None): 'tuned' for the stored gain schedule of the setup (stepper
+            if there is none), [Kp, Ki, Kd] for fixed gains, or 'stepper' (or None).
+        use_model (bool): Start each step at the power predicted by the setup model.
+        retry_missed (bool): Sweep once more through frequencies that missed the target.
+    """
+
+    REQUIRED = ('amplifier', 'antenna', 'start', 'stop', 'target')
+    DEFAULTS = {
+        'name': None,
+        'term': 0.01,
+        'dwell': 0.5,
+        'modulation': {'enabled': True, 'depth': 80.0, 'frequency': 1.0},
+        'max_power': None,
+        'amplifier_gain': None,
+        'antenna_gain': None,
+        'distance': 1.0,
+        'pid': 'tuned',
+        'use_model': True,
+        'retry_missed': True,
+    }
+    NUMBERS = ('start', 'stop', 'term', 'target', 'dwell', 'max_power', 'amplifier_gain', 'antenna_gain', 'distance')
+    FROM_EQUIPMENT = ('max_power', 'amplifier_gain', 'antenna_gain')
+
+    def __init__(self, **settings):
+        """
+        Initialize a recipe from keyword settings, see the class attributes, and validate it.
+
+        Raises:
+            ValueError: If a setting is missing, unknown or out of the equipment's range.
+        """
+        missing = [key for key in self.REQUIRED if key not in settings]
+        if missing:
+            raise ValueError(f'Recipe is missing {", ".join(missing)}')
+        unknown = [key for key in settings if key not in self.REQUIRED and key not in self.DEFAULTS]
+        if unknown:
+            raise ValueError(f'Unknown recipe settings: {", ".join(unknown)}')
+        for key, value in self.DEFAULTS.items():
+            setattr(self, key, dict(value) if isinstance(value, dict) else value)
+        for key, value in settings.items():
+            if key == 'modulation':
+                if not isinstance(value, dict):
+                    raise ValueError('modulation must be a table of enabled, depth and frequency')
+                self.modulation.update(value)
+            else:
+                setattr(self, key, value)
+        self.validate()
+        if self.name is None:
+            self.name = f'{self.start:g}-{self.stop:g} MHz {self.target:g} Vm'
+
+    def validate(self):
+        """
+        Check every setting and fill in the equipment defaults. All problems are reported
+        together.
+
+        Raises:
+            ValueError: If any setting is invalid.
+        """
+        problems = []
+        for key in self.NUMBERS:
+            value = getattr(self, key)
+            if value is None and key in self.FROM_EQUIPMENT:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                problems.append(f'{key} must be a number')
+            else:
+                setattr(self, key, float(value))
+        unknown = [key for key in self.modulation if key not in self.DEFAULTS['modulation']]
+        if unknown:
+            problems.append(f'Unknown modulation settings: {", ".join(unknown)}')
+        if problems:
+            raise ValueError('; '.join(problems))
+
+        amplifier = AMPLIFIERS.get(self.amplifier)
+        antenna = ANTENNAS.get(self.antenna)
+        if amplifier is None:
+            problems.append(f'Unknown amplifier {self.amplifier!r} (known: {", ".join(AMPLIFIERS)})')
+        if antenna is None:
+            problems.append(f'Unknown antenna {self.antenna!r} (known: {", ".join(ANTENNAS)})')
+        if not 0.0 < self.start < self.stop:
+            problems.append('start must be above 0 and below stop')
+        elif amplifier is not None and antenna is not None:
+            limits = EquipmentLimits.forSetup(self.amplifier, self.antenna)
+            reason = limits.checkFrequencies(self.start, self.stop)
+            if reason is not None:
+                problems.append(f'{reason}: {self.start:g}-{self.stop:g} MHz is outside '
+                                f'{limits.getMinFrequency():g}-{limits.getMaxFrequency():g} MHz of {self.setupName()}')
+        if self.term <= 0.0:
+            problems.append('term must be above 0')
+        if self.target <= 0.0:
+            problems.append('target must be above 0 V/m')
+        if self.dwell <= 0.0:
+            problems.append('dwell must be above 0 s')
+        if self.distance <= 0.0:
+            problems.append('distance must be above 0 m')
+        if amplifier is not None:
+            if self.max_power is None:
+                self.max_power = amplifier['max_power']
+            elif self.max_power > amplifier['max_power']:
+                problems.append(f'max_power {self.max_power:g} dBm exceeds the {amplifier["max_power"]:g} dBm input limit of {self.amplifier}')
+            if self.amplifier_gain is None:
+                self.amplifier_gain = amplifier['gain']
+        if antenna is not None and self.antenna_gain is None:
+            self.antenna_gain = antenna['gain']
+        if self.antenna_gain is not None and self.antenna_gain <= 0.0:
+            problems.append('antenna_gain must be above 0')
+        depth = self.modulation['depth']
+        frequency = self.modulation['frequency']
+        if not isinstance(self.modulation['enabled'], bool):
+            problems.append('modulation enabled must be true or false')
+        if isinstance(depth, bool) or not isinstance(depth, (int, float)) or not 0.0 <= depth <= 100.0:
+            problems.append('modulation depth must be 0-100 %')
+        # AM rate range of the N5181A: 0.1 Hz to 20 MHz
+        if isinstance(frequency, bool) or not isinstance(frequency, (int, float)) or not 0.0001 <= frequency <= 20000.0:
+            problems.append('modulation frequency must be 0.0001-20000 kHz')
+        pid = self.pid
+        if not (pid in (None, 'tuned', 'stepper') or (isinstance(pid, (list, tuple)) and len(pid) == 3
+                and all(isinstance(gain, (int, float)) and not isinstance(gain, bool) for gain in pid))):
+            problems.append("pid must be 'tuned', 'stepper' or [Kp, Ki, Kd]")
+        if problems:
+            raise ValueError('; '.join(problems))
+
+    def setupName(self) -> str:
+        """
+        Returns:
+            str: The setup key used by PIDGainStore, as RadiatedImmunity.setupName().
+        """
+        return f'{self.amplifier} / {self.antenna}'
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            dict: The settings, as written to a recipe file.
+        """
+        return {key: getattr(self, key) for key in self.REQUIRED + tuple(self.DEFAULTS)}
+
+    def plan(self) -> 'SweepPlan':
+        """
+        Returns:
+            SweepPlan: The compiled plan of this recipe, from the cache where possible.
+        """
+        return SweepPlan.compile(self)
+
+    @classmethod
+    def load(cls, path: str) -> list['SweepRecipe']:
+        """
+        Load and validate the recipes of a JSON or TOML file.
+
+        Parameters:
+            path (str): File holding one recipe or a list of them.
+
+        Returns:
+            list: The recipes, in file order.
+
+        Raises:
+            ValueError: If the file cannot be parsed or a recipe is invalid.
+        """
+        name = os.path.basename(path)
+        if os.path.splitext(path)[1].lower() == '.toml':
+            with open(path, 'rb') as file:
+                try:
+                    data = tomllib.load(file)
+                except tomllib.TOMLDecodeError as e:
+                    raise ValueError(f'{name}: {str(e)}')
+            entries = data['recipe'] if isinstance(data.get('recipe'), list) else [data]
+        else:
+            with open(path, 'r') as file:
+                try:
+                    data = json.load(file)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f'{name}: {str(e)}')
+            entries = data if isinstance(data, list) else [data]
+        recipes = []
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                raise ValueError(f'{name} recipe {index + 1}: not a table of settings')
+            try:
+                recipes.append(cls(**entry))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f'{name} recipe {index + 1}: {str(e)}')
+        return recipes
+
+    @staticmethod
+    def save(path: str, recipes: list['SweepRecipe']):
+        """
+        Write recipes to a JSON file.
+
+        Parameters:
+            path (str): Destination file.
+            recipes (list): The recipes; a single one is written as an object.
+        """
+        data = [recipe.to_dict() for recipe in recipes]
+        with open(path, 'w') as file:
+            json.dump(data[0] if len(data) == 1 else data, file, indent=4)
+
+
+class SweepPlan:
+    """
+    A validated recipe compiled for FieldController.loadPlan.
+
+    Attributes:
+        recipe (SweepRecipe): The recipe.
+        limits (EquipmentLimits): Limits of the recipe's amplifier and antenna.
+        frequencies (list): Step frequencies in MHz.
+        index (dict): Step index of each frequency.
+        setup_model (SetupModel or None): The model of the setup, if the recipe uses one.
+        unit_power (np.ndarray or None): Generator power in dBm for 1 V/m at each step;
+            the power for a field E is unit_power + 20 log10(E).
+        unreachable (list): Frequencies where the model predicts the target needs more
+            than max_power.
+    """
+
+    cache = {}
+
+    def __init__(self, recipe: SweepRecipe):
+        """
+        Compile a recipe; use SweepPlan.compile to go through the cache.
+
+        Parameters:
+            recipe (SweepRecipe): A validated recipe.
+        """
+        self.recipe = recipe
+        self.limits = EquipmentLimits.forSetup(recipe.amplifier, recipe.antenna)
+        self.limits.setMaxPower(recipe.max_power)
+        frequencies = sweep_frequencies(recipe.start, recipe.stop, recipe.term)
+        self.frequencies = frequencies.tolist()
+        self.index = {frequency: index for index, frequency in enumerate(self.frequencies)}
+        self.setup_model = None
+        self.unit_power = None
+        self.unreachable = []
+        if recipe.use_model:
+            self.setup_model = SetupModel(recipe.amplifier_gain, recipe.antenna_gain, 0.0, recipe.distance)
+            self.setup_model.loadTables(recipe.amplifier, recipe.antenna)
+            self.unit_power = self.setup_model.powerFor(frequencies, 1.0)
+            target_power = self.unit_power + 20.0 * math.log10(recipe.target)
+            self.unreachable = frequencies[target_power > recipe.max_power].tolist()
+
+    @classmethod
+    def compile(cls, recipe: SweepRecipe) -> 'SweepPlan':
+        """
+        The plan of a recipe, compiled on first use. A cached plan is reused as long as the
+        recipe's settings and the setup's table files are unchanged.
+
+        Parameters:
+            recipe (SweepRecipe): A validated recipe.
+
+        Returns:
+            SweepPlan: The plan.
+        """
+        key = (json.dumps(recipe.to_dict(), sort_keys=True), cls.table_stamp(recipe))
+        plan = cls.cache.get(key)
+        if plan is None:
+            plan = cls(recipe)
+            cls.cache[key] = plan
+        return plan
+
+    @staticmethod
+    def table_stamp(recipe: SweepRecipe) -> tuple:
+        # Table files found for the setup and their modification times
+        if not recipe.use_model:
+            return ()
+        stamp = []
+        for name in (recipe.amplifier, recipe.antenna, 'Cables'):
+            path = SetupModel.find_table(name)
+            stamp.append((path, os.path.getmtime(path) if path is not None else None))
+        return tuple(stamp)
+
+    @property
+    def step_count(self) -> int:
+        return len(self.frequencies)
+
+    @property
+    def dwell_ms(self) -> int:
+        return int(self.recipe.dwell * 1000)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Sweep Store Module
+==================
+This module stores sweep results as fixed-size binary records appended to one file per
+run or campaign. Every completed step is written as it happens, so the writer's memory
+stays constant over multi-hour, multi-sweep campaigns and nothing is lost if the
+application stops. The file opens later as a NumPy record array through np.memmap,
+with no parsing.
+
+File layout:
+
+    magic b'ISWSTORE' | uint32 header size | uint32 JSON length | JSON header, space padded
+    records of SweepStore.DTYPE, from the header size to the end of the file
+
+The JSON header describes the file: the record dtype, when it was created, free-form
+info, and every sweep with its setup (e.g. SweepRecipe.to_dict()). It has a fixed,
+reserved size, so starting a sweep rewrites it in place and the records are never moved.
+
+Classes:
+    SweepStore: Appends step records and opens stored files as memory maps.
+"""
+
+import json
+import os
+import struct
+from datetime import datetime
+from time import time
+
+import numpy as np
+
+
+class SweepStore:
+    """
+    Writer of a sweep store file, and reader of stored files through SweepStore.read.
+
+    Record fields (one record per completed step):
+        time (float64): Unix time when the step completed.
+        frequency (float64): Frequency in MHz.
+        power (float64): Generator power in dBm.
+        composite, x, y, z (float64): Field readings in V/m.
+        target (float32): Target field in V/m.
+        iterations (uint16): Leveling iterations of the step.
+        sweep (uint16): Index of the sweep in the header's 'sweeps'.
+        status (uint8): ExitReason value of the step's leveling loop.
+    """
+
+    MAGIC = b'ISWSTORE'
+    PREFIX = struct.Struct('<8sII')
+    VERSION = 1
+    DTYPE = np.dtype([('time', '<f8'), ('frequency', '<f8'), ('power', '<f8'), ('composite', '<f8'),
+                      ('x', '<f8'), ('y', '<f8'), ('z', '<f8'), ('target', '<f4'),
+                      ('iterations', '<u2'), ('sweep', '<u2'), ('status', 'u1')])
+    # The same packed layout for writing one record without going through NumPy
+    RECORD = struct.Struct('<7dfHHB')
+
+    def __init__(self, path: str, info: dict | None = None, header_size: int = 65536):
+        """
+        Create a store file with an empty header.
+
+        Parameters:
+            path (str): File to create; an existing file is replaced.
+            info (dict, optional): Free-form description saved in the header, e.g. the campaign.
+            header_size (int): Bytes reserved for the header, which must hold the setups of
+                all sweeps.
+        """
+        self.path = path
+        self.header_size = header_size
+        self.header = {
+            'version': self.VERSION,
+            'dtype': self.DTYPE.descr,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'info': info or {},
+            'sweeps': [],
+        }
+        self.sweep = -1
+        self.count = 0
+        self.file = open(path, 'w+b')
+        self.writeHeader()
+
+    def writeHeader(self):
+        """
+        Write the header in place and return to the end of the records.
+
+        Raises:
+            ValueError: If the header does not fit the reserved size.
+        """
+        text = json.dumps(self.header).encode('utf-8')
+        if self.PREFIX.size + len(text) > self.header_size:
+            raise ValueError(f'Sweep store header exceeds {self.header_size} bytes; create the store with a larger header_size')
+        self.file.seek(0)
+        self.file.write(self.PREFIX.pack(self.MAGIC, self.header_size, len(text)))
+        self.file.write(text.ljust(self.header_size - self.PREFIX.size, b' '))
+        self.file.seek(0, os.SEEK_END)
+        self.file.flush()
+
+    def beginSweep(self, setup: dict | None = None) -> int:
+        """
+        Start a new sweep; the following records belong to it.
+
+        Parameters:
+            setup (dict, optional): Settings of the sweep, e.g. SweepRecipe.to_dict().
+
+        Returns:
+            int: Index of the sweep.
+        """
+        self.sweep = len(self.header['sweeps'])
+        self.header['sweeps'].append({'started': datetime.now().isoformat(timespec='seconds'), 'setup': setup or {}})
+        self.writeHeader()
+        return self.sweep
+
+    def append(self, frequency: float, power: float, composite: float, x: float, y: float, z: float,
+               target: float, iterations: int = 0, status: int = 0):
+        """
+        Append the record of one completed step to the current sweep.
+        """
+        if self.sweep < 0:
+            self.beginSweep()
+        self.file.write(self.RECORD.pack(time(), frequency, power, composite, x, y, z, target,
+                                         min(iterations, 65535), self.sweep, status))
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        self.file.close()
+
+    @classmethod
+    def readHeader(cls, path: str) -> dict:
+        """
+        Parameters:
+            path (str): A store file.
+
+        Returns:
+            dict: The header, with 'header_size' added.
+
+        Raises:
+            ValueError: If the file is not a sweep store.
+        """
+        with open(path, 'rb') as file:
+            prefix = file.read(cls.PREFIX.size)
+            if len(prefix) < cls.PREFIX.size:
+                raise ValueError(f'{os.path.basename(path)} is not a sweep store')
+            magic, header_size, length = cls.PREFIX.unpack(prefix)
+            if magic != cls.MAGIC:
+                raise ValueError(f'{os.path.basename(path)} is not a sweep store')
+            header = json.loads(file.read(length).decode('utf-8'))
+        header['header_size'] = header_size
+        return header
+
+    @classmethod
+    def read(cls, path: str) -> tuple[dict, np.ndarray]:
+        """
+        Open a store file, also while it is being written.
+
+        Parameters:
+            path (str): A store file.
+
+        Returns:
+            tuple: (header dict, read-only np.memmap of the complete records). A record
+            still being written is left out.
+
+        Raises:
+            ValueError: If the file is not a sweep store.
+        """
+        header = cls.readHeader(path)
+        dtype = np.dtype([tuple(field) for field in header['dtype']])
+        count = (os.path.getsize(path) - header['header_size']) // dtype.itemsize
+        if count <= 0:
+            # np.memmap cannot map zero bytes
+            return header, np.zeros(0, dtype=dtype)
+        return header, np.memmap(path, dtype=dtype, mode='r', offset=header['header_size'], shape=(count,))
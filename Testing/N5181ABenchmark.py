@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Agilent N5181A Driver Benchmark
+===============================
+Benchmarks and load-tests the SCPI client and the AgilentN5181A driver against the
+local N5181A emulator, so no generator is needed on the bench.
+
+    python Testing/N5181ABenchmark.py --queries 2000 --latency 0.001 --jitter 0.0005
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from N5181AEmulator import AgilentN5181AEmulator
+from SCPIClient import AsyncSCPIClient, SCPIInstrument
+from SignalGenerator import AgilentN5181A
+
+
+def report(name: str, count: int, elapsed: float, stats=None):
+    print(f'{name:<28} {count:>6} ops {elapsed:8.3f} s {count / elapsed:10.1f} ops/s  {stats if stats is not None else ""}')
+
+
+def bench_sequential(port: int, count: int):
+    instrument = SCPIInstrument('127.0.0.1', port)
+    instrument.connect()
+    instrument.stats.reset()
+    start = time.perf_counter()
+    for i in range(count):
+        instrument.query(':FREQ?')
+    report('Sequential queries', count, time.perf_counter() - start, instrument.stats)
+    instrument.close()
+
+
+def bench_pipelined(port: int, count: int, in_flight: int):
+    async def run():
+        client = AsyncSCPIClient('127.0.0.1', port)
+        await client.connect()
+        semaphore = asyncio.Semaphore(in_flight)
+
+        async def one(i):
+            async with semaphore:
+                return await client.query(':POW?' if i % 2 else ':OUTP:STAT?')
+
+        start = time.perf_counter()
+        replies = await asyncio.gather(*(one(i) for i in range(count)))
+        elapsed = time.perf_counter() - start
+        # Ordered matching: even queries must see the RF state, odd ones the power
+        assert all(('E' in reply) == bool(i % 2) for i, reply in enumerate(replies)), 'Replies out of order'
+        await client.close()
+        return elapsed, client.stats
+
+    elapsed, stats = asyncio.run(run())
+    report(f'Pipelined ({in_flight} in flight)', count, elapsed, stats)
+
+
+def bench_concurrent_instruments(port: int, count: int, instruments: int):
+    async def run():
+        clients = [AsyncSCPIClient('127.0.0.1', port) for _ in range(instruments)]
+        await asyncio.gather(*(client.connect() for client in clients))
+
+        async def drive(client):
+            for _ in range(count // instruments):
+                await client.write(':FREQ 300 MHz')
+                await client.query('*OPC?')
+
+        start = time.perf_counter()
+        await asyncio.gather(*(drive(client) for client in clients))
+        elapsed = time.perf_counter() - start
+        await asyncio.gather(*(client.close() for client in clients))
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    report(f'{instruments} connections, one loop', count, elapsed)
+
+
+def bench_driver(port: int, count: int):
+    generator = AgilentN5181A('127.0.0.1', port)
+    generator.error.connect(lambda message: print(f'Driver error: {message}'))
+    generator.connect()
+    generator.instrument.stats.reset()
+    start = time.perf_counter()
+    for i in range(count):
+        generator.setPower(-30.0 + (i % 20))
+    report('Driver setPower()', count, time.perf_counter() - start, generator.instrument.stats)
+    generator.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the N5181A driver against the emulator')
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--in-flight', type=int, default=32)
+    parser.add_argument('--instruments', type=int, default=8)
+    args = parser.parse_args()
+
+    emulator = AgilentN5181AEmulator(port=0, latency=args.latency, jitter=args.jitter)
+    port = emulator.start_in_thread()
+    print(f'Emulator on port {port}, latency {args.latency * 1000:.2f} ms, jitter {args.jitter * 1000:.2f} ms')
+    try:
+        bench_sequential(port, args.queries)
+        bench_pipelined(port, args.queries, args.in_flight)
+        bench_concurrent_instruments(port, args.queries, args.instruments)
+        bench_driver(port, max(1, args.queries // 10))
+        print(f'Emulator executed {emulator.command_count} commands, error queue: {emulator.state.errors}')
+    finally:
+        emulator.stop_in_thread()
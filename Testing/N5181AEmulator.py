@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Agilent N5181A Emulator
+=======================
+This module implements a local TCP server that emulates the subset of the Agilent
+N5181A SCPI command set used by the AgilentN5181A driver: *IDN?, *OPC?, *RST, *CLS,
+*STB?, :FREQ, :POW, :OUTP:STAT, :OUTP:MOD:STAT, the AM/FM/PM subsystems, :LIST and
+:SYST:ERR?. Each command can be given its own processing latency plus random jitter,
+so the driver can be benchmarked and load-tested without a generator on the bench.
+
+The emulator can run in-process (start_in_thread) or as a subprocess:
+
+    python Testing/N5181AEmulator.py --port 5025 --latency 0.002 --jitter 0.001
+
+Classes:
+    N5181AState: Instrument settings and error queue.
+    AgilentN5181AEmulator: Asyncio SCPI server driving an N5181AState.
+"""
+
+import argparse
+import asyncio
+import random
+import threading
+
+IDENTITY = 'Agilent Technologies,N5181A,MY00000000,A.01.80'
+
+MIN_FREQUENCY = 100e3
+MAX_FREQUENCY = 6e9
+MIN_POWER = -110.0
+MAX_POWER = 20.0
+MAX_ERRORS = 30
+
+# Long-form SCPI mnemonics mapped to the short forms used as handler keys
+SHORT_FORMS = {
+    'FREQUENCY': 'FREQ', 'POWER': 'POW', 'OUTPUT': 'OUTP', 'STATE': 'STAT',
+    'MODULATION': 'MOD', 'DEPTH': 'DEPT', 'INTERNAL': 'INT', 'EXTERNAL': 'EXT',
+    'SOURCE': 'SOUR', 'COUPLING': 'COUP', 'LINEAR': 'LIN', 'EXPONENTIAL': 'EXP',
+    'DWELL': 'DWEL', 'POINTS': 'POIN', 'SYSTEM': 'SYST', 'ERROR': 'ERR',
+    'BANDWIDTH': 'BWID', 'DEVIATION': 'DEV', 'AMPLITUDE': 'AMPL', 'LEVEL': 'LEV',
+    'IMMEDIATE': 'IMM', 'TRIGGER': 'TRIG', 'INITIATE': 'INIT', 'STATUS': 'STAT',
+    'QUESTIONABLE': 'QUES', 'OPERATION': 'OPER', 'CONDITION': 'COND',
+}
+
+# Optional default nodes that may be omitted or spelled out by the client
+ALIASES = {
+    'FREQ:CW': 'FREQ',
+    'FREQ:FIX': 'FREQ',
+    'POW:LEV:IMM:AMPL': 'POW',
+    'POW:LEV:IMM': 'POW',
+    'POW:LEV': 'POW',
+    'POW:AMPL': 'POW',
+    'OUTP': 'OUTP:STAT',
+    'OUTP:MOD': 'OUTP:MOD:STAT',
+    'AM': 'AM:STAT',
+    'FM': 'FM:STAT',
+    'PM': 'PM:STAT',
+    'AM:DEPT': 'AM:DEPT:LIN',
+    'PM:BAND': 'PM:BWID',
+    'SYST:ERR:NEXT': 'SYST:ERR',
+}
+
+FREQUENCY_UNITS = {'HZ': 1.0, 'KHZ': 1e3, 'MHZ': 1e6, 'GHZ': 1e9}
+TIME_UNITS = {'S': 1.0, 'SEC': 1.0, 'MS': 1e-3, 'US': 1e-6, 'μS': 1e-6}
+
+
+class SCPIExecutionError(Exception):
+    """
+    Raised by a command handler; the code and message are pushed onto the error queue.
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def normalize_header(header: str) -> str:
+    """
+    Convert a SCPI header to the short-form key used by the emulator.
+
+    Parameters:
+        header (str): The header as sent, e.g. ':SOURce:FREQuency:CW'.
+
+    Returns:
+        str: The normalized key, e.g. 'FREQ'. Common commands keep their '*' prefix.
+    """
+    header = header.strip().upper()
+    if header.startswith('*'):
+        return header
+    nodes = [node for node in header.strip(':').split(':') if node]
+    nodes = [SHORT_FORMS.get(node, node) for node in nodes]
+    if nodes and nodes[0] == 'SOUR':
+        nodes = nodes[1:]
+    key = ':'.join(nodes)
+    return ALIASES.get(key, key)
+
+
+def parse_number(text: str, units: dict | None = None, default_scale: float = 1.0) -> float:
+    """
+    Parse a numeric SCPI parameter with an optional unit suffix.
+
+    Parameters:
+        text (str): The parameter text, e.g. '300 MHz' or '-30dBm'.
+        units (dict or None): Accepted unit suffixes and their scale factors.
+        default_scale (float): Scale applied when no unit is given.
+
+    Returns:
+        float: The value in base units.
+    """
+    text = text.strip().upper().replace(' ', '')
+    if text.endswith('DBM'):
+        text = text[:-3]
+    scale = default_scale
+    if units:
+        for unit in sorted(units, key=len, reverse=True):
+            if text.endswith(unit.upper()):
+                scale = units[unit]
+                text = text[:-len(unit)]
+                break
+    try:
+        return float(text) * scale
+    except ValueError:
+        raise SCPIExecutionError(-224, 'Illegal parameter value')
+
+
+def parse_bool(text: str) -> bool:
+    """
+    Parse a SCPI boolean parameter (ON/OFF/1/0).
+    """
+    value = text.strip().upper()
+    if value in ('ON', '1'):
+        return True
+    if value in ('OFF', '0'):
+        return False
+    raise SCPIExecutionError(-224, 'Illegal parameter value')
+
+
+def parse_choice(text: str, choices: tuple) -> str:
+    """
+    Parse an enumerated SCPI parameter given in short or long form.
+
+    Parameters:
+        text (str): The parameter text.
+        choices (tuple): Accepted short forms.
+
+    Returns:
+        str: The matching short form.
+    """
+    value = text.strip().upper()
+    for choice in choices:
+        if value.startswith(choice):
+            return choice
+    raise SCPIExecutionError(-224, 'Illegal parameter value')
+
+
+def format_real(value: float) -> str:
+    """
+    Format a real number the way the instrument reports it.
+    """
+    return f'{value:+.8E}'
+
+
+class N5181AState:
+    """
+    Settings and error queue of the emulated generator.
+    """
+
+    def __init__(self):
+        """
+        Initialize the instrument in its preset state.
+        """
+        self.errors = []
+        self.reset()
+
+    def reset(self):
+        """
+        Restore preset settings (*RST).
+        """
+        self.frequency = MAX_FREQUENCY
+        self.power = MIN_POWER
+        self.rf_on = False
+        self.mod_on = True
+        self.frequency_mode = 'CW'
+        self.power_mode = 'FIX'
+        # Subsystem dictionaries are updated in place so command handlers keep valid references
+        self._preset('am', {'STAT': False, 'TYPE': 'LIN', 'MODE': 'NORM', 'DEPT:LIN': 0.1, 'DEPT:EXP': 0.0,
+                            'SOUR': 'INT', 'EXT:COUP': 'DC', 'INT:FREQ': 400.0, 'INT:FREQ:STEP': 1.0})
+        self._preset('fm', {'STAT': False, 'SOUR': 'INT', 'EXT:COUP': 'DC', 'INT:FREQ': 400.0, 'INT:FREQ:STEP': 1.0, 'DEV': 1e3})
+        self._preset('pm', {'STAT': False, 'SOUR': 'INT', 'EXT:COUP': 'DC', 'INT:FREQ': 400.0, 'INT:FREQ:STEP': 1.0,
+                            'BWID': 'NORM', 'DEV': 0.0})
+        self._preset('list', {'TYPE': 'LIST', 'FREQ': [], 'POW': [], 'DWEL': [], 'TRIG:SOUR': 'IMM'})
+
+    def _preset(self, name: str, settings: dict):
+        current = getattr(self, name, None)
+        if current is None:
+            setattr(self, name, settings)
+        else:
+            current.clear()
+            current.update(settings)
+
+    def push_error(self, code: int, message: str):
+        """
+        Append an error to the error queue, marking overflow like the instrument does.
+        """
+        if len(self.errors) >= MAX_ERRORS:
+            self.errors[-1] = (-350, 'Queue overflow')
+            return
+        self.errors.append((code, message))
+
+    def status_byte(self) -> int:
+        """
+        Returns:
+            int: The IEEE 488.2 status byte; bit 2 is set while the error queue is not empty.
+        """
+        return 4 if self.errors else 0
+
+
+class AgilentN5181AEmulator:
+    """
+    Asyncio SCPI server emulating an Agilent N5181A on a raw socket.
+
+    Commands on a connection are executed one at a time, as on the real instrument.
+    Before executing a command the server waits for the configured latency of that
+    command (see command_latency) plus a uniformly distributed jitter.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 5025, latency: float = 0.0, jitter: float = 0.0,
+                 command_latency: dict | None = None, seed: int | None = None):
+        """
+        Initialize the emulator.
+
+        Parameters:
+            host (str): Interface to listen on.
+            port (int): TCP port to listen on; 0 selects a free port.
+            latency (float): Default processing latency per command in seconds.
+            jitter (float): Upper bound of the random extra latency per command in seconds.
+            command_latency (dict or None): Latency overrides keyed by header, e.g. {':FREQ': 0.005, '*OPC': 0.001}.
+            seed (int or None): Seed for the jitter random generator.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.command_latency = {normalize_header(k.rstrip('?')): v for k, v in (command_latency or {}).items()}
+        self.random = random.Random(seed)
+        self.state = N5181AState()
+        self.command_count = 0
+        self._server = None
+        self._sessions = set()
+        self._loop = None
+        self._thread = None
+        self._handlers = self._build_handlers()
+
+    def _build_handlers(self) -> dict:
+        s = self.state
+        handlers = {
+            '*IDN': (None, lambda: IDENTITY),
+            '*OPC': (None, lambda: '1'),
+            '*RST': (lambda arg: s.reset(), None),
+            '*CLS': (lambda arg: s.errors.clear(), None),
+            '*STB': (None, lambda: str(s.status_byte())),
+            'FREQ': (self._set_frequency, lambda: f'{s.frequency:+.16E}'),
+            'FREQ:MODE': (lambda arg: setattr(s, 'frequency_mode', parse_choice(arg, ('CW', 'FIX', 'LIST'))),
+                          lambda: s.frequency_mode),
+            'POW': (self._set_power, lambda: format_real(s.power)),
+            'POW:MODE': (lambda arg: setattr(s, 'power_mode', parse_choice(arg, ('FIX', 'LIST'))),
+                         lambda: s.power_mode),
+            'OUTP:STAT': (lambda arg: setattr(s, 'rf_on', parse_bool(arg)), lambda: str(int(s.rf_on))),
+            'OUTP:MOD:STAT': (lambda arg: setattr(s, 'mod_on', parse_bool(arg)), lambda: str(int(s.mod_on))),
+            'SYST:ERR': (None, self._next_error),
+            'INIT': (lambda arg: None, None),
+            'LIST:TYPE': (lambda arg: s.list.__setitem__('TYPE', parse_choice(arg, ('LIST', 'STEP'))),
+                          lambda: s.list['TYPE']),
+            'LIST:TRIG:SOUR': (lambda arg: s.list.__setitem__('TRIG:SOUR', parse_choice(arg, ('BUS', 'IMM', 'EXT', 'KEY'))),
+                               lambda: s.list['TRIG:SOUR']),
+        }
+        for name, unit_table in (('FREQ', FREQUENCY_UNITS), ('POW', None), ('DWEL', TIME_UNITS)):
+            handlers[f'LIST:{name}'] = (self._list_setter(name, unit_table), self._list_getter(name))
+            handlers[f'LIST:{name}:POIN'] = (None, lambda name=name: str(len(s.list[name])))
+        for prefix, settings in (('AM', s.am), ('FM', s.fm), ('PM', s.pm)):
+            handlers[f'{prefix}:STAT'] = (self._bool_setter(settings, 'STAT'), self._bool_getter(settings, 'STAT'))
+            handlers[f'{prefix}:SOUR'] = (self._choice_setter(settings, 'SOUR', ('INT', 'EXT')), self._choice_getter(settings, 'SOUR'))
+            handlers[f'{prefix}:EXT:COUP'] = (self._choice_setter(settings, 'EXT:COUP', ('AC', 'DC')), self._choice_getter(settings, 'EXT:COUP'))
+            handlers[f'{prefix}:INT:FREQ'] = (self._real_setter(settings, 'INT:FREQ', FREQUENCY_UNITS, 0.1, 20e6), self._real_getter(settings, 'INT:FREQ'))
+            handlers[f'{prefix}:INT:FREQ:STEP'] = (self._real_setter(settings, 'INT:FREQ:STEP', FREQUENCY_UNITS, 0.5, 1e6), self._real_getter(settings, 'INT:FREQ:STEP'))
+        handlers['AM:TYPE'] = (self._choice_setter(s.am, 'TYPE', ('LIN', 'EXP')), self._choice_getter(s.am, 'TYPE'))
+        handlers['AM:MODE'] = (self._choice_setter(s.am, 'MODE', ('NORM', 'DEEP')), self._choice_getter(s.am, 'MODE'))
+        handlers['AM:DEPT:LIN'] = (self._real_setter(s.am, 'DEPT:LIN', None, 0.0, 100.0), self._real_getter(s.am, 'DEPT:LIN'))
+        handlers['AM:DEPT:EXP'] = (self._real_setter(s.am, 'DEPT:EXP', None, -40.0, 0.0), self._real_getter(s.am, 'DEPT:EXP'))
+        handlers['FM:DEV'] = (self._real_setter(s.fm, 'DEV', FREQUENCY_UNITS, 0.0, 10e6), self._real_getter(s.fm, 'DEV'))
+        handlers['PM:DEV'] = (self._real_setter(s.pm, 'DEV', None, 0.0, 10.0), self._real_getter(s.pm, 'DEV'))
+        handlers['PM:BWID'] = (self._choice_setter(s.pm, 'BWID', ('NORM', 'HIGH')), self._choice_getter(s.pm, 'BWID'))
+        return handlers
+
+    def _set_frequency(self, arg: str):
+        frequency = parse_number(arg, FREQUENCY_UNITS)
+        if frequency < MIN_FREQUENCY or frequency > MAX_FREQUENCY:
+            self.state.frequency = min(max(frequency, MIN_FREQUENCY), MAX_FREQUENCY)
+            raise SCPIExecutionError(-222, 'Data out of range')
+        self.state.frequency = frequency
+
+    def _set_power(self, arg: str):
+        power = parse_number(arg)
+        if power < MIN_POWER or power > MAX_POWER:
+            self.state.power = min(max(power, MIN_POWER), MAX_POWER)
+            raise SCPIExecutionError(-222, 'Data out of range')
+        self.state.power = power
+
+    def _next_error(self) -> str:
+        if not self.state.errors:
+            return '+0,"No error"'
+        code, message = self.state.errors.pop(0)
+        return f'{code:+d},"{message}"'
+
+    def _bool_setter(self, settings: dict, key: str):
+        return lambda arg: settings.__setitem__(key, parse_bool(arg))
+
+    def _bool_getter(self, settings: dict, key: str):
+        return lambda: str(int(settings[key]))
+
+    def _choice_setter(self, settings: dict, key: str, choices: tuple):
+        return lambda arg: settings.__setitem__(key, parse_choice(arg, choices))
+
+    def _choice_getter(self, settings: dict, key: str):
+        return lambda: settings[key]
+
+    def _real_setter(self, settings: dict, key: str, units: dict | None, minimum: float, maximum: float):
+        def setter(arg: str):
+            value = parse_number(arg, units)
+            if value < minimum or value > maximum:
+                settings[key] = min(max(value, minimum), maximum)
+                raise SCPIExecutionError(-222, 'Data out of range')
+            settings[key] = value
+        return setter
+
+    def _real_getter(self, settings: dict, key: str):
+        return lambda: format_real(settings[key])
+
+    def _list_setter(self, name: str, units: dict | None):
+        def setter(arg: str):
+            self.state.list[name] = [parse_number(value, units) for value in arg.split(',') if value.strip()]
+        return setter
+
+    def _list_getter(self, name: str):
+        return lambda: ','.join(format_real(value) for value in self.state.list[name])
+
+    def latency_for(self, key: str) -> float:
+        """
+        Return the processing delay for one command, including jitter.
+
+        Parameters:
+            key (str): Normalized header of the command.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        delay = self.command_latency.get(key, self.latency)
+        if self.jitter:
+            delay += self.random.uniform(0.0, self.jitter)
+        return delay
+
+    def split_units(self, line: str) -> list:
+        """
+        Split a program message into its ';'-separated program units.
+        """
+        units = []
+        for unit in line.split(';'):
+            unit = unit.strip()
+            if unit:
+                units.append(unit)
+        return units
+
+    async def execute(self, line: str) -> str | None:
+        """
+        Execute one program message and return the combined reply.
+
+        Parameters:
+            line (str): The program message without terminator.
+
+        Returns:
+            str or None: ';'-joined replies to the queries in the message, or None if it had no queries.
+        """
+        replies = []
+        for unit in self.split_units(line):
+            header, _, arg = unit.partition(' ')
+            is_query = header.endswith('?')
+            key = normalize_header(header.rstrip('?'))
+            delay = self.latency_for(key)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.command_count += 1
+            setter, getter = self._handlers.get(key, (None, None))
+            try:
+                if is_query:
+                    if getter is None:
+                        raise SCPIExecutionError(-113, 'Undefined header')
+                    replies.append(getter())
+                else:
+                    if setter is None:
+                        raise SCPIExecutionError(-113, 'Undefined header')
+                    if not arg.strip() and key not in ('*RST', '*CLS', 'INIT'):
+                        raise SCPIExecutionError(-109, 'Missing parameter')
+                    setter(arg)
+            except SCPIExecutionError as e:
+                self.state.push_error(e.code, e.message)
+        return ';'.join(replies) if replies else None
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._sessions.add(asyncio.current_task())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = await self.execute(line.decode('ascii', errors='replace').strip())
+                if reply is not None:
+                    writer.write(reply.encode('ascii') + b'\n')
+                    await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._sessions.discard(asyncio.current_task())
+            writer.close()
+
+    async def start(self):
+        """
+        Start listening. When port is 0 the chosen port is stored in self.port.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Stop listening and close the server.
+        """
+        if self._server is not None:
+            self._server.close()
+            for session in list(self._sessions):
+                session.cancel()
+            await asyncio.gather(*self._sessions, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def start_in_thread(self) -> int:
+        """
+        Run the emulator on its own event loop in a background thread.
+
+        Returns:
+            int: The port the emulator listens on.
+        """
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name='N5181AEmulator', daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.port
+
+    def stop_in_thread(self):
+        """
+        Stop an emulator started with start_in_thread.
+        """
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Agilent N5181A SCPI emulator')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5025)
+    parser.add_argument('--latency', type=float, default=0.0, help='processing latency per command in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum random extra latency in seconds')
+    args = parser.parse_args()
+
+    async def serve():
+        emulator = AgilentN5181AEmulator(args.host, args.port, args.latency, args.jitter)
+        await emulator.start()
+        print(f'N5181A emulator listening on {emulator.host}:{emulator.port}')
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+=================
+Measures the cold-start time of the application: each run starts a fresh interpreter,
+creates the application as AppView does, shows the test selection dialog and reports
+when the event loop is idle with the dialog on screen. With --window a test window is
+created and shown as well, as after selecting that test.
+
+The first run builds the stylesheet cache if it is missing; --no-cache removes the cache
+before every run to measure that path instead.
+
+    python Testing/StartupBenchmark.py --runs 10
+    python Testing/StartupBenchmark.py --runs 5 --window 'Radiated Immunity'
+    python Testing/StartupBenchmark.py --imports 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Runs in the child interpreter; prints the milestones as they are reached
+CHILD = '''
+import os, sys, time
+sys.path.insert(0, {root!r})
+from PyQt5.QtCore import QTimer
+import AppView
+print('imported', time.perf_counter(), flush=True)
+app = AppView.create_application(sys.argv)
+print('styled', time.perf_counter(), flush=True)
+dialog = AppView.TestSelectionDialog()
+dialog.show()
+window_test = {window!r}
+def ready():
+    print('dialog', time.perf_counter(), flush=True)
+    if window_test:
+        dialog.hide()
+        window = AppView.create_test_window(window_test)
+        window.show()
+        QTimer.singleShot(0, lambda: (print('window', time.perf_counter(), flush=True), os._exit(0)))
+    else:
+        os._exit(0)
+QTimer.singleShot(0, ready)
+app.exec_()
+'''
+
+
+def run_once(window: str | None) -> dict:
+    """
+    Start one application process.
+
+    Parameters:
+        window (str or None): Test window to open after the dialog.
+
+    Returns:
+        dict: Seconds from process start to each milestone.
+    """
+    code = CHILD.format(root=ROOT, window=window)
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, cwd=ROOT)
+    milestones = {}
+    for line in process.stdout:
+        parts = line.split()
+        # perf_counter is system-wide on Linux and Windows, so child times compare directly
+        if len(parts) == 2 and parts[0] in ('imported', 'styled', 'dialog', 'window'):
+            milestones[parts[0]] = float(parts[1]) - start
+    process.wait()
+    return milestones
+
+
+def import_profile(count: int):
+    """
+    Print the modules that take longest to import, from python -X importtime.
+
+    Parameters:
+        count (int): Number of modules to list.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import AppView'],
+                            capture_output=True, text=True, cwd=ROOT)
+    rows = []
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+            if cumulative.isdigit():
+                rows.append((int(cumulative), name))
+    for cumulative, name in sorted(rows, reverse=True)[:count]:
+        print(f'{cumulative / 1000:8.1f} ms  {name}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start benchmark of the application')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--window', default=None, help="Also open a test window, e.g. 'Radiated Immunity'")
+    parser.add_argument('--no-cache', action='store_true', help='Remove the stylesheet cache before every run')
+    parser.add_argument('--imports', type=int, default=0, help='List the slowest imports of AppView instead')
+    args = parser.parse_args()
+
+    if args.imports:
+        import_profile(args.imports)
+        return
+
+    from AppStyle import cache_path
+    from AppView import THEME
+    results = []
+    for run in range(args.runs):
+        if args.no_cache and os.path.exists(cache_path(THEME)):
+            os.remove(cache_path(THEME))
+        milestones = run_once(args.window)
+        results.append(milestones)
+        print(f'run {run + 1}: ' + ', '.join(f'{name} {seconds * 1000:.0f} ms' for name, seconds in milestones.items()))
+    for name in ('imported', 'styled', 'dialog', 'window'):
+        values = [result[name] for result in results if name in result]
+        if values:
+            print(f'{name:<9} median {statistics.median(values) * 1000:7.0f} ms  min {min(values) * 1000:7.0f} ms  max {max(values) * 1000:7.0f} ms')
+
+
+if __name__ == '__main__':
+    main()